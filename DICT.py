@@ -21,22 +21,17 @@
  ***************************************************************************/
 """
 from PyQt5.QtCore import (QSettings, QTranslator, qVersion,
-                          QCoreApplication, QDir, QFileInfo,
-                          QFile, Qt, QUrl)
-from PyQt5.QtWidgets import QAction, QMessageBox, QDialog
+                          QCoreApplication, QUrl)
+from PyQt5.QtWidgets import QAction
 from PyQt5.QtGui import QIcon, QDesktopServices
-# Initialize Qt resources from file resources.py
-from . import resources
-# Import the code for the dialog
-from .DICT_about import DICTAbout
-from .DICT_dialog import DICTDialog
-from .DICT_dialog_config import DICTDialogConfig
-from .DICT_xml import DICT_xml
+from qgis.core import QgsApplication
+# Les dialogues et le traitement sont importés à la première utilisation :
+# leurs .ui ne sont pas compilés au chargement de QGIS. Les icônes sont
+# lues dans le répertoire du plugin, resources.py n'est chargé que par la
+# fenêtre À propos
 
 import os.path
 import sys
-import tempfile
-import subprocess
 
 
 class DICT(object):
@@ -68,12 +63,14 @@ class DICT(object):
             if qVersion() > '4.3.3':
                 QCoreApplication.installTranslator(self.translator)
 
-        # Create the dialog (after translation) and keep reference
-        self.dlg = DICTDialog()
-        self.dlgConfig = DICTDialogConfig()
+        # Dialogs are created on first use (after translation)
+        self.dlg = None
+        self.dlgConfig = None
 
         # Declare instance attributes
         self.actions = []
+        # Traitements en cours en arrière-plan
+        self.taches = []
         self.menu = self.tr('&DICT')
         # TODO: We are going to let the user set this up in a future iteration
         self.toolbar = self.iface.addToolBar('DICT')
@@ -170,14 +167,14 @@ class DICT(object):
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
 
-        icon_configuration_path = ':/plugins/DICT/config.png'
+        icon_configuration_path = os.path.join(self.plugin_dir, 'config.png')
         self.add_action(
             icon_configuration_path,
             text=self.tr('DICT configuration'),
             callback=self.runConfig,
             parent=self.iface.mainWindow())
 
-        icon_path = ':/plugins/DICT/icon.png'
+        icon_path = os.path.join(self.plugin_dir, 'icon.png')
         self.add_action(
             icon_path,
             text=self.tr('DICT'),
@@ -212,67 +209,100 @@ class DICT(object):
             self.iface.removeToolBarIcon(action)
         # remove the toolbar
         del self.toolbar
+        # L'assistant de la session ne survit pas au rechargement
+        wizard = sys.modules.get(__package__ + '.DICT_dialog_wizard')
+        if wizard is not None:
+            wizard.libereAssistant()
 
     def run(self):
         """Run method that performs all the real work"""
+        from .DICT_xml import DICT_xml
+        from .DICT_taches import (TacheDeclaration, TacheRecepisse,
+                                  exportePlans)
+
+        if self.dlg is None:
+            from .DICT_dialog import DICTDialog
+            self.dlg = DICTDialog()
         # show the dialog
         self.dlg.show()
         # Run the dialog event loop
         result = self.dlg.exec_()
         # See if OK was pressed
         if result:
-            msgBox = QMessageBox()
-            msgBox.setTextFormat(Qt.RichText)
             dtdict = DICT_xml(self.dlg.lineEdit.text())
-            # Prépare le formulaire
-            titre, pdf = dtdict.formulaire()
-            if titre is None:
+            # Assistant, puis choix des mises en page
+            dlgWizard = dtdict.preparation()
+            if dlgWizard is None:
                 return
+            titre = dlgWizard.titre()
+            composeurs = dtdict.choixComposeurs()
+            # Les mises en page ne s'exportent que dans le fil de
+            # l'interface, l'une après l'autre
             try:
-                planPDF = dtdict.geometriePDF(titre)
-            except :
-                msgBox.setText("Erreur lors de la création du plan, vérifiez si votre composition est correctement configurée")
-                msgBox.exec_()
-                msgBox = QMessageBox()
-                msgBox.setTextFormat(Qt.RichText)
-            if QFile.exists(pdf) and \
-                    all([QFile.exists(p) for p in planPDF]) and \
-                    pdf and len(planPDF) > 0:
-                out = QSettings().value("/DICT/configRep")
-
-                fusion = QSettings().value("/DICT/fusionPDF")
-
-                if(fusion and
-                   self.__checkPdftk(QSettings().value("/DICT/configPDFTK"))):
-                    # Utilise pdftk pour fusionner les documents
-                    s = os.path.join(out, "envoi_" + titre + ".pdf")
-                    subprocess.call([QSettings().value(
-                                    "/DICT/configPDFTK"), pdf] +
-                                    planPDF + ["cat", "output"] + [s])
-
-                    msgBox.setText("Vous pouvez envoyer le fichier :" +
-                                   "<br><a href='file:///" + s.replace('\\', '/') + "'>" +
-                                   s.replace('\\', '/') + "</a>")
-
-                    os.remove(pdf)
-                    for p in planPDF:
-                        os.remove(p)
-                else:
-                    msgBox.setText("Vous pouvez envoyer les fichiers :" +
-                                   "<br>Récepissé : <a href='file:///" + pdf.replace('\\', '/') + "'>" + pdf.replace('\\', '/')+ "</a><br>" +
-                                   "Plans : " + '<br>'.join(["<a href='file:///" + s.replace('\\', '/') + "'>" + s.replace('\\', '/') + "</a>" for s in planPDF]) + "<br>")
-
-            else:
-                msgBox.setText("Erreur lors de la création des fichiers :\
-                \nRécepissé : " + pdf.replace('\\', '/') + "\n \
-                Plan : "+ str([s.replace('\\', '/') for s in planPDF]) )
-
-            msgBox.exec_()
-
-            # Save xml
+                plans, _ = dtdict.preparePlans(titre, composeurs)
+                if not exportePlans(plans, "Export des plans..."):
+                    return
+                erreurs = [p.erreur for p in plans if p.erreur is not None]
+                if len(erreurs) > 0:
+                    raise RuntimeError(", ".join(erreurs))
+            except Exception as e:
+                self.iface.messageBar().pushCritical(
+                    "DICT " + titre,
+                    "Erreur lors de la création du plan, vérifiez si votre "
+                    "composition est correctement configurée : " + str(e))
+                return
+
+            # Le récépissé QGIS est imprimé une fois les plans exportés :
+            # rien n'est écrit si l'export est annulé ou échoue
+            titre, rendu = dlgWizard.rendu()
+
+            # Récépissé et fusion en arrière-plan : une autre déclaration
+            # peut être traitée sans attendre
+            tache = TacheDeclaration(titre, TacheRecepisse(titre, rendu),
+                                     plans,
+                                     lambda t: self.__termine(t, dtdict))
+            self.taches.append(tache)
+            QgsApplication.taskManager().addTask(tache)
+
+    def __termine(self, tache, dtdict):
+        """Fin du traitement d'une déclaration : liens vers les PDF."""
+        self.taches.remove(tache)
+
+        def lien(s):
+            s = s.replace('\\', '/')
+            return "<a href='file:///" + s + "'>" + s + "</a>"
+
+        if tache.erreur is not None:
+            self.iface.messageBar().pushCritical(
+                "DICT " + tache.titre,
+                "Erreur lors de la création des fichiers : " + tache.erreur)
+            return
+
+        self.__archive(dtdict, tache.sorties)
+        if tache.fusion:
+            texte = "Vous pouvez envoyer le fichier : "
+        else:
+            texte = "Vous pouvez envoyer les fichiers : "
+        self.iface.messageBar().pushSuccess(
+            "DICT " + tache.titre,
+            texte + ", ".join(lien(s) for s in tache.sorties))
+
+    def __archive(self, dtdict, sorties):
+        from .DICT_archive import DICT_archive
+
+        archive = DICT_archive()
+        try:
+            dtdict.archive(archive, sorties)
+            archive.enregistre()
+        except Exception as e:
+            self.iface.messageBar().pushWarning(
+                "DICT", "Archivage impossible : " + str(e))
 
     def runConfig(self):
         """Run method that performs all the real work"""
+        if self.dlgConfig is None:
+            from .DICT_dialog_config import DICTDialogConfig
+            self.dlgConfig = DICTDialogConfig()
         # show the dialog
         self.dlgConfig.show()
         # Run the dialog event loop
@@ -283,36 +313,10 @@ class DICT(object):
 
     def runAbout(self):
         """ Run about dialog """
+        from .DICT_about import DICTAbout
+
         dialog = DICTAbout()
         dialog.exec_()
 
     def runHelp(self):
         QDesktopServices.openUrl(QUrl("https://github.com/Oslandia/DICT"))
-
-    def __checkPdftk(self, chemin):
-        ret = -1
-        try:
-            if sys.platform == 'win32':
-                fd, err = tempfile.mkstemp()
-                proc = subprocess.Popen([chemin, "--version"], shell=True,
-                                        stdout=subprocess.PIPE,
-                                        stderr=subprocess.STDOUT,
-                                        stdin=subprocess.PIPE)
-                proc.stdin.close()
-                proc.wait()
-                result = proc.returncode
-                txt = proc.stdout.read()
-                ret = txt.find(b"pdftk")
-                os.close(fd)
-                os.remove(err)
-            else:
-                txt = subprocess.check_output(["/usr/local/bin/pdftk",
-                                               "--version"])
-                ret = txt.find("pdftk")
-        except Exception as e:
-            msgBox = QMessageBox()
-            msgBox.setWindowTitle('Error with pdftk')
-            msgBox.setText(str(e))
-            msgBox.exec_()
-
-        return ret >= 0
@@ -24,9 +24,13 @@
 
 import os
 
-from PyQt5 import uic, QtCore, QtWidgets
+from PyQt5 import QtCore, QtWidgets
 
-FORM_CLASS, _ = uic.loadUiType(os.path.join(
+from .DICT_ui import loadUiType
+# Logos affichés par la fenêtre (:/plugins/DICT/images)
+from . import resources
+
+FORM_CLASS, _ = loadUiType(os.path.join(
     os.path.dirname(__file__), 'DICT_about.ui'), resource_suffix='')
 
 
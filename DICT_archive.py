@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DICT_archive
+                                 A QGIS plugin
+ DICT
+                             -------------------
+        begin                : 2015-08-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2015 by Loïc BARTOLETTI
+        email                : lbartoletti@tuxfamily.org
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+
+ Archive GeoPackage des déclarations traitées (/DICT/archiveGPKG).
+"""
+
+from PyQt5.QtCore import QSettings, QVariant, QDateTime
+from qgis.core import (QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+                       QgsFeature, QgsField, QgsFields, QgsGeometry,
+                       QgsProject, QgsVectorFileWriter, QgsVectorLayer,
+                       QgsWkbTypes)
+
+import os
+
+# Champs de DICT_xml.__createAttributs, puis ceux propres à l'archive
+CHAMPS = [
+    ('Recepisse_DC', QVariant.Bool),
+    ('Recepisse_DICT', QVariant.Bool),
+    ('Recepisse_DT', QVariant.Bool),
+    ('NoGu', QVariant.String),
+    ('NoAffaireDeclarant', QVariant.String),
+    ('Personne_Contacter', QVariant.String),
+    ('JourReception', QVariant.String),
+    ('MoisReception', QVariant.String),
+    ('AnneeReception', QVariant.String),
+    ('dateRecep', QVariant.DateTime),
+    ('communePrincipale', QVariant.String),
+    ('AdresseTravaux', QVariant.String),
+    ('ReferenceExploitant', QVariant.String),
+    ('dest_Denomination', QVariant.String),
+    ('dest_ComplementAdresse', QVariant.String),
+    ('dest_NoVoie', QVariant.String),
+    ('dest_LieuditBP', QVariant.String),
+    ('dest_CodePostal', QVariant.String),
+    ('dest_Commune', QVariant.String),
+    ('dest_Pays', QVariant.String),
+    ('fichierXML', QVariant.String),
+    ('sorties', QVariant.String),
+    ('traitement', QVariant.DateTime),
+]
+
+# Champs indexés pour les recherches
+INDEX = ('NoGu', 'dateRecep', 'communePrincipale')
+
+
+class DICT_archive(object):
+    COUCHE = 'declarations'
+
+    def __init__(self, chemin=None):
+        """Constructor.
+
+        :param chemin: GeoPackage de l'archive, /DICT/archiveGPKG par
+            défaut. L'archivage est désactivé si le chemin est vide.
+        :type chemin: str
+        """
+        if chemin is None:
+            chemin = QSettings().value("/DICT/archiveGPKG", "")
+        self.chemin = chemin
+        self.__couche = None
+        self.__attente = []
+
+        self.__champs = QgsFields()
+        for nom, typ in CHAMPS:
+            self.__champs.append(QgsField(nom, typ))
+
+    def active(self):
+        return bool(self.chemin)
+
+    def ajoute(self, attributs, geom, epsg, fichierXML, sorties):
+        """Met une déclaration en attente d'enregistrement."""
+        if not self.active():
+            return
+
+        f = QgsFeature(self.__champs)
+        f.setGeometry(QgsGeometry(geom))
+        for nom, typ in CHAMPS:
+            if nom in attributs:
+                f[nom] = attributs[nom]
+        f['fichierXML'] = fichierXML
+        f['sorties'] = ';'.join(sorties)
+        f['traitement'] = QDateTime.currentDateTime()
+
+        self.__attente.append(
+            (f, QgsCoordinateReferenceSystem("EPSG:" + epsg)))
+
+    def enregistre(self):
+        """Écrit les déclarations en attente dans une seule transaction."""
+        if not self.active() or len(self.__attente) == 0:
+            return True
+
+        couche = self.__ouvre(self.__attente[0][1])
+        features = []
+        for f, crs in self.__attente:
+            if crs != couche.crs():
+                geom = f.geometry()
+                geom.transform(QgsCoordinateTransform(crs, couche.crs(),
+                                                      QgsProject.instance()))
+                f.setGeometry(geom)
+            features.append(f)
+
+        # Le fournisseur OGR regroupe l'ajout dans une transaction
+        ok, _ = couche.dataProvider().addFeatures(features)
+        if ok:
+            self.__attente = []
+        return ok
+
+    def __ouvre(self, crs):
+        if self.__couche is not None:
+            return self.__couche
+
+        uri = self.chemin + "|layername=" + self.COUCHE
+        couche = QgsVectorLayer(uri, self.COUCHE, "ogr")
+        if not couche.isValid():
+            # Première utilisation : table avec index R-tree
+            if os.path.exists(self.chemin):
+                action = QgsVectorFileWriter.CreateOrOverwriteLayer
+            else:
+                action = QgsVectorFileWriter.CreateOrOverwriteFile
+            options = QgsVectorFileWriter.SaveVectorOptions()
+            options.driverName = "GPKG"
+            options.fileEncoding = "UTF-8"
+            options.layerName = self.COUCHE
+            options.actionOnExistingFile = action
+            options.layerOptions = ["SPATIAL_INDEX=YES"]
+            writer = QgsVectorFileWriter.create(
+                self.chemin, self.__champs, QgsWkbTypes.MultiPolygon, crs,
+                QgsProject.instance().transformContext(), options)
+            if writer.hasError() != QgsVectorFileWriter.NoError:
+                raise IOError(writer.errorMessage())
+            del writer
+
+            couche = QgsVectorLayer(uri, self.COUCHE, "ogr")
+            if not couche.isValid():
+                raise IOError("Archive illisible : " + self.chemin)
+            for nom in INDEX:
+                couche.dataProvider().createAttributeIndex(
+                    couche.fields().indexFromName(nom))
+
+        self.__couche = couche
+        return couche
@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DICT_batch
+                                 A QGIS plugin
+ DICT
+                             -------------------
+        begin                : 2015-08-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2015 by Loïc BARTOLETTI
+        email                : lbartoletti@tuxfamily.org
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+
+ Traitement par lot des DT/DICT, sans assistant ni boîte de dialogue.
+
+ Depuis la console Python de QGIS :
+
+     from DICT.DICT_batch import traitementLot
+     traitementLot('/chemin/vers/les/xml')
+
+ Depuis un script autonome (projet contenant les mises en page) :
+
+     python -m DICT.DICT_batch --processus=4 projet.qgz /chemin/vers/les/xml
+
+ Avec plusieurs processus, les récépissés sont imprimés en parallèle par
+ des instances QGIS hors écran pendant que les plans sont exportés.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PyQt5.QtCore import QSettings
+from qgis.core import Qgis, QgsApplication, QgsMessageLog, QgsProject
+
+from .DICT_xml import DICT_xml
+from .DICT_archive import DICT_archive
+from .DICT_fusion import fusionPDF
+from .DICT_recepisse import cheminRecepisse, initProcessus, rendProcessus
+
+import multiprocessing
+import os
+import sys
+import time
+
+
+Resultat = namedtuple('Resultat', ['fichier', 'succes', 'message',
+                                   'sorties', 'duree'])
+
+
+def _python():
+    """Interpréteur utilisé pour lancer les processus de rendu.
+
+    Dans QGIS, sys.executable désigne souvent l'exécutable de QGIS
+    lui-même et non l'interpréteur Python.
+    """
+    if os.path.basename(sys.executable).lower().startswith('python'):
+        return sys.executable
+
+    for rep in (os.path.join(sys.exec_prefix, 'bin'), sys.exec_prefix):
+        for nom in ('python3', 'python', 'python3.exe', 'python.exe'):
+            chemin = os.path.join(rep, nom)
+            if os.path.isfile(chemin):
+                return chemin
+    return sys.executable
+
+
+class DICT_batch(object):
+    def __init__(self, composeurs=None, nbProcessus=None, progression=None):
+        """Constructor.
+
+        :param composeurs: Noms des mises en page à exporter pour chaque
+            déclaration. Par défaut, la première mise en page dont le nom
+            contient le format de plan demandé (comme dans l'assistant).
+        :type composeurs: list
+
+        :param nbProcessus: Nombre de processus de rendu des récépissés.
+            Par défaut /DICT/nbProcessus, 1 pour un rendu séquentiel.
+        :type nbProcessus: int
+
+        :param progression: Fonction appelée avec le résultat, le nombre de
+            fichiers terminés et le nombre total de fichiers, au fur et à
+            mesure du traitement.
+        :type progression: function
+        """
+        if nbProcessus is None:
+            nbProcessus = QSettings().value("/DICT/nbProcessus", 1, type=int)
+
+        self.composeurs = composeurs
+        self.nbProcessus = max(1, nbProcessus)
+        self.progression = progression
+        self.resultats = []
+        self.duree = 0.
+        self.__total = 0
+        self.__archive = None
+
+    @staticmethod
+    def fichiers(chemins):
+        """Liste les XML à traiter à partir de répertoires ou de fichiers."""
+        if isinstance(chemins, str):
+            chemins = [chemins]
+
+        xml = []
+        for chemin in chemins:
+            if os.path.isdir(chemin):
+                xml += sorted(os.path.join(chemin, f)
+                              for f in os.listdir(chemin)
+                              if f.lower().endswith('.xml'))
+            else:
+                xml.append(chemin)
+        return xml
+
+    def __composeurs(self, taillePlan):
+        if self.composeurs is not None:
+            return self.composeurs
+
+        manager = QgsProject.instance().layoutManager()
+        for layout in manager.printLayouts():
+            if layout.name().find(taillePlan) != -1:
+                return [layout.name()]
+        return []
+
+    def __plans(self, dtdict, titre):
+        composeurs = self.__composeurs(dtdict._taillePlan)
+        if len(composeurs) == 0:
+            raise RuntimeError("Aucune mise en page pour le format " +
+                               dtdict._taillePlan)
+        planPDF = dtdict.geometriePDF(titre, composeurs)
+        if not all(os.path.exists(p) for p in planPDF):
+            raise RuntimeError("Plans non créés")
+        return planPDF
+
+    def __envoi(self, chemin, dtdict, titre, pdf, planPDF, debut):
+        if not pdf or not os.path.exists(pdf):
+            raise RuntimeError("Récépissé non créé")
+
+        envoi = fusionPDF(titre, pdf, planPDF, interactif=False)
+        sorties = [envoi] if envoi is not None else [pdf] + planPDF
+        dtdict.archive(self.__archive, sorties)
+        return Resultat(chemin, True, "", sorties,
+                        time.perf_counter() - debut)
+
+    def __echec(self, chemin, erreur, debut):
+        return Resultat(chemin, False, str(erreur), [],
+                        time.perf_counter() - debut)
+
+    def traiteFichier(self, chemin):
+        debut = time.perf_counter()
+        try:
+            dtdict = DICT_xml(chemin, interactif=False)
+            titre, pdf = dtdict.formulaire()
+            if not pdf or not os.path.exists(pdf):
+                raise RuntimeError("Récépissé non créé")
+            planPDF = self.__plans(dtdict, titre)
+            resultat = self.__envoi(chemin, dtdict, titre, pdf, planPDF,
+                                    debut)
+        except Exception as e:
+            resultat = self.__echec(chemin, e, debut)
+
+        return self.__termine(resultat)
+
+    def __traitementParallele(self, fichiers):
+        """Rend les récépissés dans un pool de processus.
+
+        La lecture des XML et l'export des plans restent dans le processus
+        de QGIS (ils dépendent du projet ouvert) et se font pendant que les
+        processus impriment les récépissés.
+        """
+        contexte = multiprocessing.get_context('spawn')
+        contexte.set_executable(_python())
+
+        with ProcessPoolExecutor(self.nbProcessus, mp_context=contexte,
+                                 initializer=initProcessus,
+                                 initargs=(QgsApplication.prefixPath(),)
+                                 ) as pool:
+            travaux = {}
+            for chemin in fichiers:
+                debut = time.perf_counter()
+                try:
+                    dtdict = DICT_xml(chemin, interactif=False)
+                    titre, valeurs = dtdict.valeursRecepisse()
+                    futur = pool.submit(rendProcessus, valeurs,
+                                        cheminRecepisse(titre))
+                    planPDF = self.__plans(dtdict, titre)
+                    travaux[futur] = (chemin, dtdict, titre, planPDF, debut)
+                except Exception as e:
+                    self.__termine(self.__echec(chemin, e, debut))
+
+            for futur in as_completed(travaux):
+                chemin, dtdict, titre, planPDF, debut = travaux[futur]
+                try:
+                    resultat = self.__envoi(chemin, dtdict, titre,
+                                            futur.result(), planPDF, debut)
+                except Exception as e:
+                    resultat = self.__echec(chemin, e, debut)
+                self.__termine(resultat)
+
+    def traitement(self, chemins):
+        """Traite tous les XML et renvoie la liste des résultats."""
+        debut = time.perf_counter()
+        fichiers = self.fichiers(chemins)
+        self.resultats = []
+        self.__total = len(fichiers)
+        self.__archive = DICT_archive()
+
+        # Les formulaires Poppler et PDF sont remplis sans rendu, ils
+        # restent séquentiels
+        if self.nbProcessus > 1 and len(fichiers) > 1 and \
+                QSettings().value("/DICT/formPoppler") is not True and \
+                not QSettings().value("/DICT/formPDF", False, type=bool):
+            self.__traitementParallele(fichiers)
+        else:
+            for f in fichiers:
+                self.traiteFichier(f)
+
+        # Toutes les déclarations du lot sont archivées en une transaction
+        try:
+            if not self.__archive.enregistre():
+                raise IOError(self.__archive.chemin)
+        except Exception as e:
+            QgsMessageLog.logMessage("Archivage impossible : " + str(e),
+                                     'DICT', Qgis.Warning)
+        self.duree = time.perf_counter() - debut
+
+        QgsMessageLog.logMessage(self.rapport(), 'DICT', Qgis.Info)
+        return self.resultats
+
+    def rapport(self):
+        nb = len(self.resultats)
+        ok = len([r for r in self.resultats if r.succes])
+        debit = nb / self.duree * 60. if self.duree > 0 else 0.
+        return "{} fichier(s) traité(s) en {:.1f} s : {} réussi(s), " \
+               "{} échec(s) ({:.1f} fichiers/min)".format(
+                   nb, self.duree, ok, nb - ok, debit)
+
+    def __termine(self, resultat):
+        self.resultats.append(resultat)
+        self.__journal(resultat)
+        if self.progression is not None:
+            self.progression(resultat, len(self.resultats), self.__total)
+        return resultat
+
+    def __journal(self, resultat):
+        if resultat.succes:
+            QgsMessageLog.logMessage(
+                "{} : OK en {:.1f} s -> {}".format(
+                    resultat.fichier, resultat.duree,
+                    ", ".join(resultat.sorties)),
+                'DICT', Qgis.Info)
+        else:
+            QgsMessageLog.logMessage(
+                "{} : ERREUR {}".format(resultat.fichier, resultat.message),
+                'DICT', Qgis.Critical)
+
+
+def traitementLot(chemins, composeurs=None, nbProcessus=None,
+                  progression=None):
+    """Traite un répertoire ou une liste de XML avec les réglages /DICT/*.
+
+    Les documents sont écrits dans /DICT/configRep.
+    """
+    lot = DICT_batch(composeurs, nbProcessus, progression)
+    lot.traitement(chemins)
+    return lot
+
+
+def main(argv):
+    nbProcessus = None
+    if len(argv) > 1 and argv[0].startswith('--processus='):
+        nbProcessus = int(argv.pop(0).split('=')[1])
+
+    if len(argv) < 2:
+        print("usage : python -m DICT.DICT_batch [--processus=N] "
+              "projet.qgz xml [xml ...]")
+        return 2
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QgsApplication([], True)
+    app.initQgis()
+    try:
+        if not QgsProject.instance().read(argv[0]):
+            print("Impossible de lire le projet " + argv[0])
+            return 1
+        def progression(r, fait, total):
+            print("[{}/{}] ".format(fait, total) +
+                  ("OK     " if r.succes else "ERREUR ") + r.fichier +
+                  (" : " + r.message if r.message else ""))
+
+        lot = traitementLot(argv[1:], nbProcessus=nbProcessus,
+                            progression=progression)
+        print(lot.rapport())
+        return 0 if all(r.succes for r in lot.resultats) else 1
+    finally:
+        app.exitQgis()
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
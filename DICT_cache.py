@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DICT_cache
+                                 A QGIS plugin
+ DICT
+                             -------------------
+        begin                : 2015-08-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2015 by Loïc BARTOLETTI
+        email                : lbartoletti@tuxfamily.org
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+
+ Cache des rendus des couches fixes du plan (/DICT/cachePlan, en Mo).
+
+ Les couches du plan autres que les emprises (réseaux, fonds de plan) sont
+ rendues par dalles calées sur une grille propre à l'échelle et à la
+ résolution d'export. Deux déclarations voisines partagent donc leurs
+ dalles : seules celles qui manquent sont rendues. Les dalles sont
+ assemblées par un raster virtuel (VRT) géoréférencé qui remplace ces
+ couches dans la copie de la mise en page.
+"""
+
+from collections import OrderedDict
+from math import ceil, floor, log10
+from PyQt5.QtCore import QSettings, QSize, Qt
+from PyQt5.QtGui import QColor, QImage, QPainter
+from qgis.core import (Qgis, QgsMapLayerStyle,
+                       QgsMapRendererCustomPainterJob, QgsMapSettings,
+                       QgsMessageLog, QgsNullSymbolRenderer, QgsProject,
+                       QgsRasterLayer, QgsRectangle, QgsRenderContext,
+                       QgsSymbolLayer, QgsSymbolLayerUtils, QgsUnitTypes,
+                       QgsVectorLayer)
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+
+# Côté d'une dalle, en pixels
+TAILLE_DALLE = 512
+
+# Augmentation maximale de l'échelle du plan : les échelles sont calées
+# sur des paliers réguliers séparés d'au plus 5 %
+TOLERANCE_ECHELLE = 0.05
+PALIERS = int(ceil(1 / log10(1 + TOLERANCE_ECHELLE)))
+
+
+def echelleArrondie(echelle):
+    """Plus petit palier supérieur ou égal à echelle, au plus
+    TOLERANCE_ECHELLE au-dessus : les plans voisins d'échelles proches
+    tombent sur la même grille."""
+    palier = int(ceil(log10(echelle) * PALIERS - 1e-9))
+    return float(ceil(10 ** (palier / PALIERS)))
+
+
+# Propriétés définies par les données qui changent le débord des symboles
+PROPRIETES_TAILLE = (QgsSymbolLayer.PropertySize,
+                     QgsSymbolLayer.PropertyWidth,
+                     QgsSymbolLayer.PropertyHeight,
+                     QgsSymbolLayer.PropertyStrokeWidth,
+                     QgsSymbolLayer.PropertyOffset)
+
+
+def symboles(couches, contexte):
+    """Symboles des couches vecteur, sous-symboles compris."""
+    pile = []
+    for couche in couches:
+        if isinstance(couche, QgsVectorLayer) and \
+                couche.renderer() is not None:
+            pile.extend(couche.renderer().symbols(contexte))
+    while len(pile) > 0:
+        symbole = pile.pop()
+        yield symbole
+        for niveau in symbole.symbolLayers():
+            if niveau.subSymbol() is not None:
+                pile.append(niveau.subSymbol())
+
+
+def symbolesBornes(couches):
+    """Vrai si le débord des symboles des couches est connu avant le
+    rendu : pas de taille définie par les données ni de générateur de
+    géométrie."""
+    for symbole in symboles(couches, QgsRenderContext()):
+        for niveau in symbole.symbolLayers():
+            if niveau.layerType() == "GeometryGenerator":
+                return False
+            proprietes = niveau.dataDefinedProperties()
+            if any(proprietes.isActive(p) for p in PROPRIETES_TAILLE):
+                return False
+    return True
+
+
+def margeDalle(couches, contexte):
+    """Plus grand débord des symboles des couches autour des géométries,
+    en pixels."""
+    marge = 0
+    for symbole in symboles(couches, contexte):
+        marge = max(marge, QgsSymbolLayerUtils.estimateMaxSymbolBleed(
+            symbole, contexte))
+    # Un pixel de plus pour l'anticrénelage
+    return int(ceil(marge)) + 1
+
+
+def cleCouches(couches, versions):
+    """Clé du jeu de couches : sources, filtres, styles et versions des
+    données (CacheRendu.version)."""
+    h = hashlib.md5()
+    for couche, version in zip(couches, versions):
+        style = QgsMapLayerStyle()
+        style.readFromLayer(couche)
+        h.update(couche.id().encode('utf-8'))
+        h.update(str(version).encode('utf-8'))
+        h.update(couche.source().encode('utf-8'))
+        if hasattr(couche, 'subsetString'):
+            h.update(couche.subsetString().encode('utf-8'))
+        h.update(style.xmlData().encode('utf-8'))
+    return h.hexdigest()
+
+
+class CacheRendu(object):
+    def __init__(self, limite):
+        """Dalles rendues, les plus anciennes étant écartées au-delà de la
+        limite.
+
+        :param limite: Taille maximale des images en cache, en octets.
+        :type limite: int
+        """
+        self.limite = limite
+        self.succes = 0
+        self.echecs = 0
+        self.__dalles = OrderedDict()
+        self.__taille = 0
+        self.__versions = {}
+        self.__verrou = threading.Lock()
+
+    def version(self, couche):
+        """Version des données de la couche, incrémentée à chaque
+        modification faite dans QGIS : les dalles des versions
+        précédentes ne sont plus utilisées."""
+        with self.__verrou:
+            if couche.id() in self.__versions:
+                return self.__versions[couche.id()]
+            self.__versions[couche.id()] = 0
+
+        def modifiee(*args):
+            with self.__verrou:
+                self.__versions[couche.id()] += 1
+
+        couche.dataChanged.connect(modifiee)
+        if isinstance(couche, QgsVectorLayer):
+            couche.layerModified.connect(modifiee)
+        return 0
+
+    def dalle(self, cle, rendu):
+        """Image de la dalle, rendue par rendu() si elle n'est pas en
+        cache."""
+        with self.__verrou:
+            image = self.__dalles.get(cle)
+            if image is not None:
+                self.__dalles.move_to_end(cle)
+                self.succes += 1
+                return image
+
+        # Rendu hors du verrou : assemble peut être appelé par plusieurs
+        # tâches à la fois
+        image = rendu()
+        with self.__verrou:
+            self.echecs += 1
+            if cle not in self.__dalles:
+                self.__dalles[cle] = image
+                self.__taille += image.sizeInBytes()
+            while self.__taille > self.limite and len(self.__dalles) > 1:
+                _, ancienne = self.__dalles.popitem(last=False)
+                self.__taille -= ancienne.sizeInBytes()
+        return image
+
+    def statistiques(self):
+        with self.__verrou:
+            return {'succes': self.succes, 'echecs': self.echecs,
+                    'dalles': len(self.__dalles), 'octets': self.__taille}
+
+    def vide(self):
+        with self.__verrou:
+            self.__dalles.clear()
+            self.__taille = 0
+
+
+_cache = None
+
+
+def cachePlan():
+    """Cache de la session, ou None s'il est désactivé."""
+    global _cache
+    limite = int(QSettings().value("/DICT/cachePlan", 0)) * 1024 * 1024
+    if limite <= 0:
+        _cache = None
+    elif _cache is None:
+        _cache = CacheRendu(limite)
+    else:
+        _cache.limite = limite
+    return _cache
+
+
+def couchesCarte(mapItem):
+    """Couches affichées par la carte, de haut en bas."""
+    projet = QgsProject.instance()
+    if mapItem.keepLayerSet():
+        return mapItem.layers()
+    if mapItem.followVisibilityPreset():
+        return projet.mapThemeCollection().mapThemeVisibleLayers(
+            mapItem.followVisibilityPresetName())
+    racine = projet.layerTreeRoot()
+    return [c for c in racine.layerOrder()
+            if racine.findLayer(c.id()) is not None and
+            racine.findLayer(c.id()).isVisible()]
+
+
+class PlanEnCache(object):
+    def __init__(self, cache, layout, mapItem, variables):
+        """Rendu des couches fixes d'une carte par le cache.
+
+        Préparé dans le fil de l'interface (couches, styles, échelle),
+        appliqué à l'export du plan (DICT_taches.ExportPlan).
+
+        :param variables: Couches rendues à chaque export (emprises).
+        :type variables: list
+        """
+        self.cache = cache
+        self.mapItem = mapItem
+        self.chemin = None
+        self.dossier = None
+        self.__raster = None
+
+        couches = couchesCarte(mapItem)
+        self.variables = [c for c in couches if c in variables]
+        self.fixes = [c for c in couches if c not in variables]
+
+        # Échelle calée sur un palier, sans modifier le plan de plus de
+        # TOLERANCE_ECHELLE
+        mapItem.setScale(echelleArrondie(mapItem.scale()))
+        self.echelle = mapItem.scale()
+        self.etendue = QgsRectangle(mapItem.extent())
+        self.crs = mapItem.crs()
+        self.dpi = layout.renderContext().dpi()
+        self.cle = (cleCouches(self.fixes,
+                               [cache.version(c) for c in self.fixes]),
+                    self.crs.authid(), self.echelle, self.dpi)
+
+        # Les étiquettes ne sont pas mises dans les dalles, où elles
+        # seraient coupées ou répétées aux bords : des copies des couches
+        # étiquetées, sans symboles, les placent sur toute la carte
+        self.etiquettes = []
+        for couche in self.fixes:
+            if isinstance(couche, QgsVectorLayer) and couche.labelsEnabled():
+                copie = couche.clone()
+                copie.setRenderer(QgsNullSymbolRenderer())
+                self.etiquettes.append(copie)
+
+        # Taille du pixel, en unités de la carte
+        self.pixel = self.echelle * 0.0254 / self.dpi * \
+            QgsUnitTypes.fromUnitToUnitFactor(
+                QgsUnitTypes.DistanceMeters, self.crs.mapUnits())
+
+        self.reglages = QgsMapSettings()
+        self.reglages.setLayers(self.fixes)
+        self.reglages.setDestinationCrs(self.crs)
+        self.reglages.setTransformContext(
+            QgsProject.instance().transformContext())
+        self.reglages.setOutputDpi(self.dpi)
+        self.reglages.setOutputSize(QSize(TAILLE_DALLE, TAILLE_DALLE))
+        self.reglages.setBackgroundColor(QColor(Qt.transparent))
+        self.reglages.setOutputImageFormat(QImage.Format_ARGB32_Premultiplied)
+        self.reglages.setFlag(QgsMapSettings.DrawLabeling, False)
+
+        # Chaque dalle est rendue avec une marge, puis recadrée : les
+        # symboles des entités voisines y débordent sans être coupés
+        cote = TAILLE_DALLE * self.pixel
+        self.reglages.setExtent(QgsRectangle(0, 0, cote, cote))
+        self.marge = margeDalle(
+            self.fixes, QgsRenderContext.fromMapSettings(self.reglages))
+
+    @staticmethod
+    def possible(mapItem, variables):
+        """Le cache ne sert que pour une carte sans rotation qui affiche
+        des couches fixes, dont le débord des symboles est connu."""
+        fixes = [c for c in couchesCarte(mapItem) if c not in variables]
+        return mapItem.mapRotation() == 0 and len(fixes) > 0 and \
+            symbolesBornes(fixes)
+
+    def __rendDalle(self, i, j):
+        cote = TAILLE_DALLE * self.pixel
+        marge = self.marge * self.pixel
+        taille = TAILLE_DALLE + 2 * self.marge
+        reglages = QgsMapSettings(self.reglages)
+        reglages.setOutputSize(QSize(taille, taille))
+        reglages.setExtent(QgsRectangle(
+            i * cote - marge, j * cote - marge,
+            (i + 1) * cote + marge, (j + 1) * cote + marge))
+
+        image = QImage(taille, taille, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        job = QgsMapRendererCustomPainterJob(reglages, painter)
+        job.renderSynchronously()
+        painter.end()
+        return image.copy(self.marge, self.marge, TAILLE_DALLE, TAILLE_DALLE)
+
+    def applique(self):
+        """Assemble les dalles et les substitue aux couches fixes."""
+        self.assemble()
+        self.substitue()
+
+    def assemble(self):
+        """Écrit les dalles de l'étendue du plan et un raster virtuel (VRT)
+        qui les assemble : l'image de toute la carte n'est jamais créée en
+        mémoire. La mise en page n'est pas touchée : peut être appelé hors
+        du fil de l'interface."""
+        cote = TAILLE_DALLE * self.pixel
+        i0 = int(floor(self.etendue.xMinimum() / cote))
+        i1 = int(floor(self.etendue.xMaximum() / cote))
+        j0 = int(floor(self.etendue.yMinimum() / cote))
+        j1 = int(floor(self.etendue.yMaximum() / cote))
+
+        self.dossier = tempfile.mkdtemp(prefix='DICT_')
+        sources = []
+        for j in range(j0, j1 + 1):
+            for i in range(i0, i1 + 1):
+                dalle = self.cache.dalle(
+                    self.cle + (i, j),
+                    lambda i=i, j=j: self.__rendDalle(i, j))
+                nom = "dalle_{}_{}.png".format(i, j)
+                dalle.save(os.path.join(self.dossier, nom), "PNG")
+                sources.append((nom, (i - i0) * TAILLE_DALLE,
+                                (j1 - j) * TAILLE_DALLE))
+
+        # Bandes rouge, vert, bleu et alpha des PNG
+        bandes = []
+        for bande, couleur in enumerate(("Red", "Green", "Blue", "Alpha"),
+                                        1):
+            bandes.append(
+                '  <VRTRasterBand dataType="Byte" band="{0}">\n'
+                '    <ColorInterp>{1}</ColorInterp>\n'.format(bande, couleur)
+                + "".join(
+                    '    <SimpleSource>\n'
+                    '      <SourceFilename relativeToVRT="1">{0}'
+                    '</SourceFilename>\n'
+                    '      <SourceBand>{3}</SourceBand>\n'
+                    '      <SrcRect xOff="0" yOff="0" xSize="{4}" '
+                    'ySize="{4}"/>\n'
+                    '      <DstRect xOff="{1}" yOff="{2}" xSize="{4}" '
+                    'ySize="{4}"/>\n'
+                    '    </SimpleSource>\n'.format(
+                        nom, x, y, bande, TAILLE_DALLE)
+                    for nom, x, y in sources)
+                + '  </VRTRasterBand>\n')
+
+        self.chemin = os.path.join(self.dossier, "plan.vrt")
+        with open(self.chemin, 'w') as f:
+            f.write(
+                '<VRTDataset rasterXSize="{}" rasterYSize="{}">\n'
+                '  <GeoTransform>{}, {}, 0, {}, 0, {}</GeoTransform>\n'
+                .format((i1 - i0 + 1) * TAILLE_DALLE,
+                        (j1 - j0 + 1) * TAILLE_DALLE,
+                        repr(i0 * cote), repr(self.pixel),
+                        repr((j1 + 1) * cote), repr(-self.pixel))
+                + "".join(bandes) + '</VRTDataset>\n')
+
+        stats = self.cache.statistiques()
+        QgsMessageLog.logMessage(
+            "Cache du plan : {succes} dalles réutilisées, {echecs} rendues, "
+            "{dalles} en cache ({0:.0f} Mo)".format(
+                stats['octets'] / 1024 / 1024, **stats),
+            'DICT', Qgis.Info)
+
+    def substitue(self):
+        """Remplace les couches fixes de la carte par l'image assemblée,
+        dans le fil de l'interface."""
+        self.__raster = QgsRasterLayer(self.chemin, "Couches fixes", "gdal")
+        self.__raster.setCrs(self.crs)
+        self.mapItem.setFollowVisibilityPreset(False)
+        self.mapItem.setKeepLayerSet(True)
+        self.mapItem.setLayers(self.variables + self.etiquettes +
+                               [self.__raster])
+
+    def nettoie(self):
+        if self.dossier is None:
+            return
+        self.__raster = None
+        shutil.rmtree(self.dossier, ignore_errors=True)
+        self.dossier = None
+        self.chemin = None
@@ -23,11 +23,13 @@
 
 import os
 
-from PyQt5 import uic, QtCore, QtWidgets
+from PyQt5 import QtCore, QtWidgets
 from qgis.utils import iface
 from qgis.core import QgsLayoutManager, QgsProject
 
-FORM_CLASS, _ = uic.loadUiType(os.path.join(
+from .DICT_ui import loadUiType
+
+FORM_CLASS, _ = loadUiType(os.path.join(
     os.path.dirname(__file__), 'DICT_dialog_composer.ui'))
 
 
@@ -23,10 +23,13 @@
 
 import os
 
-from PyQt5 import uic, QtCore, QtWidgets
+from PyQt5 import QtCore, QtWidgets
 from sys import platform as _platform
 
-FORM_CLASS, _ = uic.loadUiType(os.path.join(
+from .DICT_fusion import oubliePdftk
+from .DICT_ui import loadUiType
+
+FORM_CLASS, _ = loadUiType(os.path.join(
     os.path.dirname(__file__), 'DICT_dialog_config.ui'))
 
 
@@ -50,6 +53,8 @@ class DICTDialogConfig(QtWidgets.QDialog, FORM_CLASS):
         self.configPDFTK.setText(QtCore.QSettings().value(
                                 "/DICT/configPDFTK",
                                 QtCore.QDir.homePath()))
+        self.archiveGPKG.setText(QtCore.QSettings().value(
+                                "/DICT/archiveGPKG", ""))
         self.configExtension.setText(QtCore.QSettings().value(
                                 "/DICT/configExtension"))
         self.signSignature.setText(QtCore.QSettings().value(
@@ -83,7 +88,14 @@ class DICTDialogConfig(QtWidgets.QDialog, FORM_CLASS):
         else:
             self.casDT.setChecked(False)
 
-        if QtCore.QSettings().value("/DICT/fusionPDF"):
+        self.echelleDecoupage.setValue(int(QtCore.QSettings().value(
+                                "/DICT/echelleDecoupage", 0)))
+        self.cachePlan.setValue(int(QtCore.QSettings().value(
+                                "/DICT/cachePlan", 0)))
+        self.distanceFiltre.setValue(int(float(QtCore.QSettings().value(
+                                "/DICT/distanceFiltre", 0))))
+
+        if QtCore.QSettings().value("/DICT/fusionPDF", False, type=bool):
             self.fusionPDF.setChecked(True)
         else:
             self.fusionPDF.setChecked(False)
@@ -107,12 +119,17 @@ class DICTDialogConfig(QtWidgets.QDialog, FORM_CLASS):
                 QtCore.QSettings().setValue("/DICT/formPoppler",
                                             self.radioPoppler.isChecked())
 
+        if QtCore.QSettings().value("/DICT/formPDF", False, type=bool):
+            self.radioPDF.setChecked(True)
+
         self.toolButton.pressed.connect(
             lambda: self.showDialogConfig(self.configRep))
         self.toolButtonXML.pressed.connect(
             lambda: self.showDialogConfig(self.configRepXML))
         self.toolButtonPDFTK.pressed.connect(
             lambda: self.showDialogConfig(self.configPDFTK, "Executable"))
+        self.toolButtonGPKG.pressed.connect(
+            lambda: self.showDialogConfig(self.archiveGPKG, "GeoPackage"))
 
         self.okButton = self.button_box.button(QtWidgets.QDialogButtonBox.Ok)
         self.okButton.clicked.connect(self.accept)
@@ -128,6 +145,11 @@ class DICTDialogConfig(QtWidgets.QDialog, FORM_CLASS):
         elif flags == "Executable":
             fname, _ = QtWidgets.QFileDialog.getOpenFileName(
                             self, "Choisissez l'exécutable :")
+        elif flags == "GeoPackage":
+            fname, _ = QtWidgets.QFileDialog.getSaveFileName(
+                            self, "Choisissez l'archive :", "",
+                            "GeoPackage (*.gpkg)",
+                            options=QtWidgets.QFileDialog.DontConfirmOverwrite)
         else:
             return
 
@@ -153,7 +175,12 @@ class DICTDialogConfig(QtWidgets.QDialog, FORM_CLASS):
     def accept(self):
         self.rep(self.configRep, "configRep")
         self.rep(self.configRepXML, "configRepXML")
+        pdftk = QtCore.QSettings().value("/DICT/configPDFTK")
         self.rep(self.configPDFTK, "configPDFTK")
+        if QtCore.QSettings().value("/DICT/configPDFTK") != pdftk:
+            oubliePdftk()
+        QtCore.QSettings().setValue("/DICT/archiveGPKG",
+                                    self.archiveGPKG.text())
 
         QtCore.QSettings().setValue("/DICT/configExtension",
                                     self.configExtension.text())
@@ -185,10 +212,22 @@ class DICTDialogConfig(QtWidgets.QDialog, FORM_CLASS):
         QtCore.QSettings().setValue("/DICT/sufPlan", self.sufPlan.text())
         QtCore.QSettings().setValue("/DICT/casDT", self.casDT.isChecked())
 
+        QtCore.QSettings().setValue("/DICT/echelleDecoupage",
+                                    self.echelleDecoupage.value())
+        QtCore.QSettings().setValue("/DICT/cachePlan",
+                                    self.cachePlan.value())
+        QtCore.QSettings().setValue("/DICT/distanceFiltre",
+                                    self.distanceFiltre.value())
+
         QtCore.QSettings().setValue("/DICT/fusionPDF",
                                     self.fusionPDF.isChecked())
 
-        if self.radioPoppler.isChecked():
+        QtCore.QSettings().setValue("/DICT/formPDF",
+                                    self.radioPDF.isChecked())
+        if self.radioPDF.isChecked():
+            QtCore.QSettings().setValue("/DICT/formPoppler", False)
+            QtCore.QSettings().setValue("/DICT/formQGIS", False)
+        elif self.radioPoppler.isChecked():
             try:
                 import popplerqt5
                 QtCore.QSettings().setValue("/DICT/formPoppler", True)
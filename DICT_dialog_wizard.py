@@ -27,17 +27,17 @@ from PyQt5.QtPrintSupport import *
 from PyQt5.QtGui import *
 from PyQt5.QtCore import *
 from PyQt5.QtXml import *
-from PyQt5 import uic
 from qgis.core import *
 from qgis.gui import *
 from qgis.utils import iface
-from xml.sax.saxutils import escape as escape
 
-import tempfile
-import shutil
+from .DICT_recepisse import cheminRecepisse, recepisseQGis
+from .DICT_pdf import remplitFormulaire
+from .DICT_ui import loadUiType
+
+from collections import namedtuple
 import os
 import datetime
-import codecs
 
 try:
     import popplerqt5
@@ -45,11 +45,248 @@ try:
 except:
     POPPLER = False
 
-FORM_CLASS, _ = uic.loadUiType(os.path.join(
+FORM_CLASS, _ = loadUiType(os.path.join(
     os.path.dirname(__file__), 'DICT_dialog_wizard.ui'))
 
+# Formulaire CERFA rempli par Poppler ou DICT_pdf
+CERFA = os.path.join(os.path.dirname(__file__), "formulaire_pdf",
+                     "cerfa_14435-04.pdf")
+
+# Index des champs des formulaires PDF, par chemin du modèle :
+# nom du champ -> rangs dans page.formFields()
+_indexPoppler = {}
+
+# Boutons radio sans nom propre dans le PDF : ce sont les boutons d'un
+# même groupe, désignés par leur rang dans le groupe
+RADIOS_POPPLER = {'Possible': ('MiseHorsTension', 0),
+                  'Impossible': ('MiseHorsTension', 1)}
+
+# Zones de texte et leur valeur initiale : champ de la déclaration
+# (DICT_xml), réglage de la configuration ou valeur fixe
+TEXTES = [
+    ('Denomination', 'declaration', 'dest_Denomination'),
+    ('ComplementAdresse', 'declaration', 'dest_ComplementAdresse'),
+    ('NoVoie', 'declaration', 'dest_NoVoie'),
+    ('LieuditBP', 'declaration', 'dest_LieuditBP'),
+    ('CodePostal', 'declaration', 'dest_CodePostal'),
+    ('Commune', 'declaration', 'dest_Commune'),
+    ('Pays', 'declaration', 'dest_Pays'),
+    ('NoGu', 'declaration', 'NoGu'),
+    ('ReferenceExploitant', 'declaration', 'ReferenceExploitant'),
+    ('NoAffaireDeclarant', 'declaration', 'NoAffaireDeclarant'),
+    ('Personne_Contacter', 'declaration', 'Personne_Contacter'),
+    ('CommuneTravaux', 'declaration', 'communePrincipale'),
+    ('AdresseTravaux', 'declaration', 'AdresseTravaux'),
+    ('RaisonSocialeExploitant', 'reglage', '/DICT/coordDenom'),
+    ('ContactExploitant', 'reglage', '/DICT/coordPersonne'),
+    ('NoVoieExploitant', 'reglage', '/DICT/coordNumVoie'),
+    ('LieuditBPExploitant', 'reglage', '/DICT/coordBP'),
+    ('CodePostalExploitant', 'reglage', '/DICT/coordCP'),
+    ('CommuneExploitant', 'reglage', '/DICT/coordCommune'),
+    ('TelExploitant', 'reglage', '/DICT/coordTel'),
+    ('FaxExploitant', 'reglage', '/DICT/coordFax'),
+    ('InfoPreciser', 'valeur', ''),
+    ('DistanceReseau', 'valeur', ''),
+    ('ModifPrevue', 'valeur', ''),
+    ('RepresentantExploitant', 'valeur', ''),
+    ('TelModification', 'valeur', ''),
+    ('Ref1', 'valeur', ''),
+    ('Ref2', 'valeur', ''),
+    ('Echelle1', 'valeur', ''),
+    ('Echelle2', 'valeur', ''),
+    ('Profondeur1', 'valeur', ''),
+    ('Profondeur2', 'valeur', ''),
+    ('Materiau1', 'valeur', ''),
+    ('Materiau2', 'valeur', ''),
+    ('Recommandations', 'valeur', ''),
+    ('RubriquesGuide', 'valeur', ''),
+    ('MesuresSecurite2', 'valeur', ''),
+    ('MesuresSecurite', 'valeur', ''),
+    ('TelEndommagement', 'reglage', '/DICT/TelEndommagement'),
+    ('Endommagement', 'reglage', '/DICT/Endommagement'),
+    ('NomResponsableDossier', 'reglage', '/DICT/respNom'),
+    ('DesignationService', 'reglage', '/DICT/respService'),
+    ('TelResponsableDossier', 'reglage', '/DICT/respTel'),
+    ('NomSignataire', 'reglage', '/DICT/signNom'),
+    ('NbPJ', 'valeur', '1'),
+    ('signSignataire', 'reglage', '/DICT/signSignature'),
+]
+
+# Noms des champs qui diffèrent du nom du widget : modèle QPT et CERFA PDF
+# (None : absent du PDF)
+NOMS_QGIS = {'Denomination': 'dest_Denomination',
+             'ComplementAdresse': 'dest_ComplementAdresse',
+             'NoVoie': 'dest_NoVoie',
+             'LieuditBP': 'dest_LieuditBP',
+             'CodePostal': 'dest_CodePostal',
+             'Commune': 'dest_Commune',
+             'Pays': 'dest_Pays'}
+NOMS_PDF = {'NoGu': 'NoGU',
+            'DesignationService': 'DésignationService',
+            'signSignataire': None}
+
+# Champs activés seulement si ces cases sont cochées et ces textes saisis
+DEPENDANCES = {
+    'InfoPreciser': ('RepImpossible',),
+    'DistanceReseau': ('PasConcerne',),
+    'CategorieReseau1': ('Concerne',),
+    'CategorieReseau2': ('Concerne',),
+    'CategorieReseau3': ('Concerne',),
+    'RepresentantExploitant': ('ModifEnCours',),
+    'TelModification': ('ModifEnCours',),
+    'Ref1': ('PlansJoints',),
+    'Echelle1': ('PlansJoints',),
+    'EditionPlan1': ('PlansJoints',),
+    'Sensible1': ('PlansJoints',),
+    'Profondeur1': ('PlansJoints',),
+    'Materiau1': ('PlansJoints',),
+    'Ref2': ('PlansJoints', 'Ref1'),
+    'Echelle2': ('PlansJoints', 'Ref1'),
+    'EditionPlan2': ('PlansJoints', 'Ref1'),
+    'Sensible2': ('PlansJoints', 'Ref1'),
+    'Profondeur2': ('PlansJoints', 'Ref1'),
+    'Materiau2': ('PlansJoints', 'Ref1'),
+    'DateRDV': ('ReunionChantierCase',),
+    'RDVparDeclarant': ('ReunionChantierCase',),
+    'Reunion': ('ReunionChantierCase', 'DateRDV'),
+    'AppelNonConcl': ('ReunionChantierCase', 'RDVparDeclarant'),
+}
+
+# Dates des plans reportées seulement si les références sont saisies
+REQUIS = {'EditionPlan1': ('Ref1',),
+          'EditionPlan2': ('Ref1', 'Ref2')}
+
+# Type des champs selon la classe du widget dans le .ui
+TYPES = {'QCheckBox': 'case', 'QRadioButton': 'radio',
+         'QDateEdit': 'date', 'QDateTimeEdit': 'date',
+         'QComboBox': 'liste'}
+
+# Champ du formulaire :
+#   widget : nom de l'objet dans le .ui
+#   type : 'texte', 'case', 'radio', 'date' ou 'liste'
+#   qgis : nom du champ {{Nom}} du modèle QPT
+#   pdf : (nom, rang) du champ dans le CERFA PDF, ou None
+#   defaut : (source, valeur) de la valeur initiale, ou None
+#   depend : cases et textes qui activent le champ
+#   requis : textes à saisir pour reporter le champ
+Champ = namedtuple('Champ', ['widget', 'type', 'qgis', 'pdf', 'defaut',
+                             'depend', 'requis'])
+
+
+def registre(widgets):
+    """Champs du formulaire : les zones de texte de TEXTES, puis les
+    cases, boutons, dates et listes du .ui, dans l'ordre du fichier.
+
+    :param widgets: Nom et classe des widgets du .ui
+        (DICT_ui.loadUiType, attribut WIDGETS de la classe).
+    :type widgets: list
+    """
+    champs = []
+    for widget, source, valeur in TEXTES:
+        pdf = NOMS_PDF.get(widget, widget)
+        champs.append(Champ(widget, 'texte', NOMS_QGIS.get(widget, widget),
+                            (pdf, 0) if pdf else None, (source, valeur),
+                            DEPENDANCES.get(widget, ()),
+                            REQUIS.get(widget, ())))
+
+    for widget, classe in widgets:
+        type = TYPES.get(classe)
+        if type is None:
+            continue
+        if type == 'radio':
+            # Boutons de la déclaration (DT, DICT, DC) ou de la mise hors
+            # tension, décochés par défaut
+            defaut = ('declaration', widget)
+        elif widget == 'dateReceptionDeclaration':
+            defaut = ('declaration', 'dateRecep')
+        else:
+            defaut = None
+        champs.append(Champ(widget, type, widget,
+                            RADIOS_POPPLER.get(widget, (widget, 0)), defaut,
+                            DEPENDANCES.get(widget, ()),
+                            REQUIS.get(widget, ())))
+    return champs
+
+
+def indexPoppler(chemin, fields):
+    """Index nom -> rangs des champs du modèle, construit une seule fois."""
+    index = _indexPoppler.get(chemin)
+    if index is None:
+        index = {}
+        for i, field in enumerate(fields):
+            index.setdefault(field.name(), []).append(i)
+        _indexPoppler[chemin] = index
+    return index
+
+
+def remplitPoppler(champs, out):
+    """Remplit le CERFA avec Poppler et l'écrit dans out.
+
+    :param champs: Champs fournis par DICTDialogWizard.champsPDF.
+    :type champs: list
+    """
+    doc = popplerqt5.Poppler.Document.load(CERFA)
+
+    try:
+        page = doc.page(0)
+    except:
+        return None
+
+    fields = page.formFields()
+    index = indexPoppler(CERFA, fields)
+
+    for nom, rang, valeur in champs:
+        rangs = index.get(nom, ())
+        if rang >= len(rangs):
+            continue
+        field = fields[rangs[rang]]
+        if valeur is True:
+            field.setState(True)
+        elif isinstance(valeur, int):
+            field.setCurrentChoices([valeur])
+        else:
+            field.setText(valeur)
+
+    pdf = doc.pdfConverter()
+    pdf.setOutputFileName(out)
+    pdf.setPDFOptions(popplerqt5.Poppler.PDFConverter.WithChanges)
+    pdf.convert()
+
+    return out
+
+
+# Assistant de la session, réutilisé d'une déclaration à l'autre
+_assistant = None
+
+
+def assistant(champs):
+    """Assistant prêt pour une déclaration.
+
+    Il est construit à la première déclaration, puis remis dans son état
+    initial et rempli à nouveau pour les suivantes.
+
+    :param champs: Attributs de la déclaration (DICT_xml).
+    :type champs: dict
+    """
+    global _assistant
+    if _assistant is None:
+        _assistant = DICTDialogWizard(champs)
+    else:
+        _assistant.reinitialise(champs)
+    return _assistant
+
+
+def libereAssistant():
+    """Détruit l'assistant de la session (déchargement du plugin)."""
+    global _assistant
+    if _assistant is not None:
+        _assistant.deleteLater()
+        _assistant = None
+
 
 class DICTDialogWizard(QDialog, FORM_CLASS):
+    # Registre des champs, construit une fois avec la classe
+    CHAMPS = registre(FORM_CLASS.WIDGETS)
 
     def __init__(self, champs, parent=None):
         """Constructor."""
@@ -63,700 +300,261 @@ class DICTDialogWizard(QDialog, FORM_CLASS):
         self.ref_DICT = champs['ReferenceExploitant']
         self.champs = champs
 
-        self.RepImpossible.clicked.connect(self.chkRepImpossible)
-        self.PasConcerne.clicked.connect(self.chkPasConcerne)
-        self.Concerne.clicked.connect(self.chkConcerne)
-        self.ModifEnCours.clicked.connect(self.chkModifEnCours)
-        self.PlansJoints.clicked.connect(self.chkPlansJoints)
-        self.ReunionChantierCase.clicked.connect(self.chkReunionChantierCase)
-        self.DateRDV.clicked.connect(self.chkDateRDV)
-        self.RDVparDeclarant.clicked.connect(self.chkRDVparDeclarant)
-        self.Ref1.textEdited.connect(self.editRef1)
-
-        self.initWizard()
-
-    def chkRepImpossible(self):
-        if self.RepImpossible.isChecked():
-            self.InfoPreciser.setEnabled(True)
-        else:
-            self.InfoPreciser.setEnabled(False)
+        # Widgets des champs, sans parcourir l'arbre des widgets
+        self.registre = [(champ, getattr(self, champ.widget))
+                         for champ in self.CHAMPS]
+        self.widgets = [w for _, w in self.registre] + [self.tabWidget]
 
-    def chkPasConcerne(self):
-        if self.PasConcerne.isChecked():
-            self.DistanceReseau.setEnabled(True)
-        else:
-            self.DistanceReseau.setEnabled(False)
+        # Activation des champs qui dépendent d'autres
+        for nom in sorted(set(n for c in self.CHAMPS for n in c.depend)):
+            widget = getattr(self, nom)
+            if isinstance(widget, QLineEdit):
+                widget.textEdited.connect(self.actualise)
+            else:
+                widget.clicked.connect(self.actualise)
 
-    def chkConcerne(self):
-        if self.Concerne.isChecked():
-            self.CategorieReseau1.setEnabled(True)
-            self.CategorieReseau2.setEnabled(True)
-            self.CategorieReseau3.setEnabled(True)
-        else:
-            self.CategorieReseau1.setEnabled(False)
-            self.CategorieReseau2.setEnabled(False)
-            self.CategorieReseau3.setEnabled(False)
-
-    def chkModifEnCours(self):
-        if self.ModifEnCours.isChecked():
-            self.RepresentantExploitant.setEnabled(True)
-            self.TelModification.setEnabled(True)
-        else:
-            self.RepresentantExploitant.setEnabled(False)
-            self.TelModification.setEnabled(False)
-
-    def chkPlansJoints(self):
-        if self.PlansJoints.isChecked():
-            self.Ref1.setEnabled(True)
-            self.Echelle1.setEnabled(True)
-            self.EditionPlan1.setEnabled(True)
-            self.Sensible1.setEnabled(True)
-            self.Profondeur1.setEnabled(True)
-            self.Materiau1.setEnabled(True)
-            if len(self.Ref1.text()) > 0:
-                self.Ref2.setEnabled(True)
-                self.Echelle2.setEnabled(True)
-                self.EditionPlan2.setEnabled(True)
-                self.Sensible2.setEnabled(True)
-                self.Profondeur2.setEnabled(True)
-                self.Materiau2.setEnabled(True)
+        # État du formulaire vierge, rétabli par reinitialise
+        self.__defaut = self.__etat()
+        self.initWizard()
 
-        else:
-            self.Ref1.setEnabled(False)
-            self.Echelle1.setEnabled(False)
-            self.EditionPlan1.setEnabled(False)
-            self.Sensible1.setEnabled(False)
-            self.Profondeur1.setEnabled(False)
-            self.Materiau1.setEnabled(False)
-            self.Ref2.setEnabled(False)
-            self.Echelle2.setEnabled(False)
-            self.EditionPlan2.setEnabled(False)
-            self.Sensible2.setEnabled(False)
-            self.Profondeur2.setEnabled(False)
-            self.Materiau2.setEnabled(False)
-
-    def chkReunionChantierCase(self):
-        if self.ReunionChantierCase.isChecked():
-            self.DateRDV.setEnabled(True)
-            self.RDVparDeclarant.setEnabled(True)
-            if self.DateRDV.isChecked():
-                self.Reunion.setEnabled(True)
+    def __etat(self):
+        """Activation et valeur de chaque widget."""
+        etat = []
+        for w in self.widgets:
+            # Désactivation propre au widget, pas héritée du parent
+            actif = not w.testAttribute(Qt.WA_ForceDisabled)
+            if isinstance(w, QAbstractButton) and w.isCheckable():
+                valeur = w.isChecked()
+            elif isinstance(w, QDateTimeEdit):  # QDateEdit compris
+                valeur = w.dateTime()
+            elif isinstance(w, (QComboBox, QTabWidget)):
+                valeur = w.currentIndex()
+            elif isinstance(w, QLineEdit):
+                valeur = w.text()
             else:
-                self.Reunion.setEnabled(False)
-            if self.RDVparDeclarant.isChecked():
-                self.AppelNonConcl.setEnabled(True)
+                valeur = None
+            etat.append((w, actif, valeur))
+        return etat
+
+    def reinitialise(self, champs):
+        """Remet le formulaire vierge, puis le remplit pour une nouvelle
+        déclaration."""
+        for w, actif, valeur in self.__defaut:
+            w.setEnabled(actif)
+            if valeur is None:
+                continue
+            if isinstance(w, QAbstractButton):
+                # Un bouton radio exclusif ne se décoche pas seul
+                exclusif = w.autoExclusive()
+                w.setAutoExclusive(False)
+                w.setChecked(valeur)
+                w.setAutoExclusive(exclusif)
+            elif isinstance(w, QDateTimeEdit):
+                w.setDateTime(valeur)
+            elif isinstance(w, (QComboBox, QTabWidget)):
+                w.setCurrentIndex(valeur)
             else:
-                self.AppelNonConcl.setEnabled(False)
-        else:
-            self.DateRDV.setEnabled(False)
-            self.RDVparDeclarant.setEnabled(False)
-            self.AppelNonConcl.setEnabled(False)
-            self.Reunion.setEnabled(False)
-
-    def chkDateRDV(self):
-        if self.DateRDV.isChecked():
-            self.Reunion.setEnabled(True)
-        else:
-            self.Reunion.setEnabled(False)
+                w.setText(valeur)
 
-    def chkRDVparDeclarant(self):
-        if self.RDVparDeclarant.isChecked():
-            self.AppelNonConcl.setEnabled(True)
-        else:
-            self.AppelNonConcl.setEnabled(False)
-
-    def editRef1(self, nText):
-        if len(nText) > 0:
-            self.Ref2.setEnabled(True)
-            self.Echelle2.setEnabled(True)
-            self.EditionPlan2.setEnabled(True)
-            self.Sensible2.setEnabled(True)
-            self.Profondeur2.setEnabled(True)
-            self.Materiau2.setEnabled(True)
-        else:
-            self.Ref2.setEnabled(False)
-            self.Echelle2.setEnabled(False)
-            self.EditionPlan2.setEnabled(False)
-            self.Sensible2.setEnabled(False)
-            self.Profondeur2.setEnabled(False)
-            self.Materiau2.setEnabled(False)
+        self.ref_DICT = champs['ReferenceExploitant']
+        self.champs = champs
+        self.initWizard()
+
+    def rempli(self, nom):
+        """Case cochée ou texte saisi."""
+        widget = getattr(self, nom)
+        if isinstance(widget, QLineEdit):
+            return len(widget.text()) > 0
+        return widget.isChecked()
+
+    def actualise(self):
+        """Active les champs selon les cases cochées et les textes saisis."""
+        for champ, widget in self.registre:
+            if champ.depend:
+                widget.setEnabled(all(self.rempli(n) for n in champ.depend))
+
+    def reporte(self, champ, widget):
+        """Le champ est-il reporté dans le récépissé ?"""
+        return widget.isEnabled() and \
+            all(self.rempli(n) for n in champ.requis)
+
+    def valeurInitiale(self, champ):
+        if champ.defaut is None:
+            return None
+        source, valeur = champ.defaut
+        if source == 'declaration':
+            return self.champs.get(valeur)
+        if source == 'reglage':
+            return QSettings().value(valeur, '')
+        return valeur
 
     def initWizard(self):
-        self.line = [
-            [
-             self.Denomination,
-             self.champs['dest_Denomination'],
-             "dest_Denomination",
-             "Denomination"
-             ],
-            [
-             self.ComplementAdresse,
-             self.champs['dest_ComplementAdresse'],
-             "dest_ComplementAdresse",
-             "ComplementAdresse"
-            ],
-            [
-             self.NoVoie,
-             self.champs['dest_NoVoie'],
-             "dest_NoVoie",
-             "NoVoie"
-            ],
-            [
-             self.LieuditBP,
-             self.champs['dest_LieuditBP'],
-             "dest_LieuditBP",
-             "LieuditBP"
-            ],
-            [
-             self.CodePostal,
-             self.champs['dest_CodePostal'],
-             "dest_CodePostal",
-             "CodePostal"
-            ],
-            [
-             self.Commune,
-             self.champs['dest_Commune'],
-             "dest_Commune",
-             "Commune"
-            ],
-            [
-             self.Pays,
-             self.champs['dest_Pays'],
-             "dest_Pays",
-             "Pays"
-            ],
-            [
-             self.NoGu,
-             self.champs['NoGu'],
-             "NoGu",
-             "NoGU"
-            ],
-            [
-             self.ReferenceExploitant,
-             self.champs['ReferenceExploitant'],
-             "ReferenceExploitant",
-             "ReferenceExploitant"
-            ],
-            [
-             self.NoAffaireDeclarant,
-             self.champs['NoAffaireDeclarant'],
-             "NoAffaireDeclarant",
-             "NoAffaireDeclarant"
-            ],
-            [
-             self.Personne_Contacter,
-             self.champs['Personne_Contacter'],
-             "Personne_Contacter",
-             "Personne_Contacter"
-            ],
-            [
-             self.CommuneTravaux,
-             self.champs['communePrincipale'],
-             "CommuneTravaux",
-             "CommuneTravaux"
-            ],
-            [
-             self.AdresseTravaux,
-             self.champs['AdresseTravaux'],
-             "AdresseTravaux",
-             "AdresseTravaux"
-            ],
-            [
-             self.RaisonSocialeExploitant,
-             QSettings().value("/DICT/coordDenom"),
-             "RaisonSocialeExploitant",
-             "RaisonSocialeExploitant"
-            ],
-            [
-             self.ContactExploitant,
-             QSettings().value("/DICT/coordPersonne"),
-             "ContactExploitant",
-             "ContactExploitant"
-            ],
-            [
-             self.NoVoieExploitant,
-             QSettings().value("/DICT/coordNumVoie"),
-             "NoVoieExploitant",
-             "NoVoieExploitant"
-            ],
-            [
-             self.LieuditBPExploitant,
-             QSettings().value("/DICT/coordBP"),
-             "LieuditBPExploitant",
-             "LieuditBPExploitant"
-            ],
-            [
-             self.CodePostalExploitant,
-             QSettings().value("/DICT/coordCP"),
-             "CodePostalExploitant",
-             "CodePostalExploitant"
-            ],
-            [
-             self.CommuneExploitant,
-             QSettings().value("/DICT/coordCommune"),
-             "CommuneExploitant",
-             "CommuneExploitant"
-            ],
-            [
-             self.TelExploitant,
-             QSettings().value("/DICT/coordTel"),
-             "TelExploitant",
-             "TelExploitant"
-            ],
-            [
-             self.FaxExploitant,
-             QSettings().value("/DICT/coordFax"),
-             "FaxExploitant",
-             "FaxExploitant"
-            ],
-            [
-             self.InfoPreciser,
-             '',
-             "InfoPreciser",
-             "InfoPreciser"
-            ],
-            [
-             self.DistanceReseau,
-             '',
-             "DistanceReseau",
-             "DistanceReseau"
-            ],
-            [
-             self.ModifPrevue,
-             '',
-             "ModifPrevue",
-             "ModifPrevue"
-            ],
-            [
-             self.RepresentantExploitant,
-             '',
-             "RepresentantExploitant",
-             "RepresentantExploitant"
-            ],
-            [
-             self.TelModification,
-             '',
-             "TelModification",
-             "TelModification"
-            ],
-            [
-             self.Ref1,
-             '',
-             "Ref1",
-             "Ref1"
-            ],
-            [
-             self.Ref2,
-             '',
-             "Ref2",
-             "Ref2"
-            ],
-            [
-             self.Echelle1,
-             '',
-             "Echelle1",
-             "Echelle1"
-            ],
-            [
-             self.Echelle2,
-             '',
-             "Echelle2",
-             "Echelle2"
-            ],
-            [
-             self.Profondeur1,
-             '',
-             "Profondeur1",
-             "Profondeur1"
-            ],
-            [
-             self.Profondeur2,
-             '',
-             "Profondeur2",
-             "Profondeur2"
-            ],
-            [
-             self.Materiau1,
-             '',
-             "Materiau1",
-             "Materiau1"
-            ],
-            [
-             self.Materiau2,
-             '',
-             "Materiau2",
-             "Materiau2"
-            ],
-            [
-             self.Recommandations,
-             '',
-             "Recommandations",
-             "Recommandations"
-            ],
-            [
-             self.RubriquesGuide,
-             '',
-             "RubriquesGuide",
-             "RubriquesGuide"
-            ],
-            [
-             self.MesuresSecurite2,
-             '',
-             "MesuresSecurite2",
-             "MesuresSecurite2"
-            ],
-            [
-             self.MesuresSecurite,
-             '',
-             "MesuresSecurite",
-             "MesuresSecurite"
-            ],
-            [
-             self.TelEndommagement,
-             QSettings().value("/DICT/TelEndommagement", ''),
-             "TelEndommagement",
-             "TelEndommagement"
-            ],
-            [
-             self.Endommagement,
-             QSettings().value("/DICT/Endommagement", ''),
-             "Endommagement",
-             "Endommagement"
-            ],
-            [
-             self.NomResponsableDossier,
-             QSettings().value("/DICT/respNom", ''),
-             "NomResponsableDossier",
-             "NomResponsableDossier"
-            ],
-            [
-             self.DesignationService,
-             QSettings().value("/DICT/respService", ''),
-             "DesignationService",
-             "DesignationService"
-            ],
-            [
-             self.TelResponsableDossier,
-             QSettings().value("/DICT/respTel", ''),
-             "TelResponsableDossier",
-             "TelResponsableDossier"
-            ],
-            [
-             self.NomSignataire,
-             QSettings().value("/DICT/signNom", ''),
-             "NomSignataire",
-             "NomSignataire"
-            ],
-            [
-             self.NbPJ,
-             '1',
-             "NbPJ",
-             "NbPJ"
-            ],
-            [
-             self.signSignataire,
-             QSettings().value("/DICT/signSignature", ''),
-             "signSignataire",
-             # n'est pas un champs dans le cerfa PDF
-            ]
-        ]
-
-        for i in self.line:
-            i[0].setText(i[1])
-
-        for i in self.findChildren(QDateEdit):
-            i.setDate(datetime.date.today())
-
-        for i in self.findChildren(QDateTimeEdit):
-            i.setDate(datetime.date.today())
-
-        # Date réception
-        self.dateReceptionDeclaration.setDate(self.champs['dateRecep'])
-
-        # CheckBox DT/DICT/DC
-        # pour possible/impossible
-        self.champs['Possible'] = False
-        self.champs['Impossible'] = False
-        for i in self.findChildren(QRadioButton):
-            if self.champs[i.objectName()]:
-                i.setChecked(True)
-            else:
-                i.setChecked(False)
+        aujourdhui = datetime.date.today()
+        for champ, widget in self.registre:
+            valeur = self.valeurInitiale(champ)
+            if champ.type == 'texte':
+                widget.setText(valeur or '')
+            elif champ.type == 'date':
+                widget.setDate(valeur or aujourdhui)
+            elif champ.type == 'radio':
+                # CheckBox DT/DICT/DC, possible/impossible
+                widget.setChecked(bool(valeur))
 
         if QSettings().value("/DICT/casDT") == "true" \
            and self.Recepisse_DT.isChecked():
             self.PasClasseACase.setChecked(True)
 
-    def saveChangeQGis(self):
-        def formulaireQGis(titre, path):
-            # Load template from file
-            p = QgsProject()
-            myLayout = QgsLayout(p)
-            myTemplateFile = open(path, 'rt')
-            myTemplateContent = myTemplateFile.read()
-            myTemplateFile.close()
-            myDocument = QDomDocument()
-            myDocument.setContent(myTemplateContent)
-            # adding to existing items
-            items, ok = myLayout.loadFromTemplate(myDocument,QgsReadWriteContext(), False)
-
-            printer = QPrinter()
-            printer.setOutputFormat(QPrinter.PdfFormat)
-
-            # Sortie
-            out_dir = QSettings().value("/DICT/configRep")
-            if QDir(out_dir).exists() is False or out_dir is None:
-                out_dir = str(QDir.homePath())
-
-            out = os.path.join(out_dir,
-                               QSettings().value("/DICT/prefRecep", "") +
-                               titre +
-                               QSettings().value("/DICT/sufRecep", "") +
-                               ".pdf")
-
-            printer.setOutputFileName(out)
-            printer.setPaperSize(QSizeF(210,297), #format du formulaire.pdf actuellement utilisé en template, à changer si nécéssaire
-                                 QPrinter.Millimeter)
-            printer.setFullPage(True)
-            printer.setColorMode(QPrinter.Color)
-            printer.setResolution(300) #idem que ligne 517
-
-            pdfPainter = QPainter(printer)
-            paperRectMM = printer.pageRect(QPrinter.Millimeter)
-            paperRectPixel = printer.pageRect(QPrinter.DevicePixel)
-            myLayout.render(pdfPainter, paperRectPixel, paperRectMM)
-            pdfPainter.end()
-
-            return out
-
-        path = os.path.join(os.path.dirname(__file__), "formulaire_pdf")
-        fdt, form = tempfile.mkstemp()
-        formulaire = os.path.join(path, "Formulaire_DICT.qpt")
-        shutil.copy2(formulaire, form)
-        fdn, newfile = tempfile.mkstemp()
-
-        f = codecs.open(form, encoding="utf-8")
-        n = codecs.open(newfile, "w", encoding="utf-8")
-
-        contenu = f.read()
-
-        # Image du CERFA
-        contenu = contenu.replace("CHEMIN_VERS_IMAGE", path)
-
-        # Change contenu lignes
-        for i in self.line:
-            if i[0].isEnabled():
-                contenu = contenu.replace(i[2], escape(i[0].text()))
-            else:
-                contenu = contenu.replace(i[2], "")
-
-        # Change contenu checkbox
-        for i in self.findChildren(QCheckBox):
-            name = i.objectName()
-            if i.isChecked():
-                contenu = contenu.replace(name, "X")
-            else:
-                contenu = contenu.replace(name, "")
-
-        # Change contenu radio
-        for i in self.findChildren(QRadioButton):
-            name = i.objectName()
-            if i.isChecked():
-                contenu = contenu.replace(name, "X")
-            else:
-                contenu = contenu.replace(name, "")
-
-        # Change dateTime
-        for i in self.findChildren(QDateTimeEdit):
-            name = i.objectName()
-            date_obj = i.date()
-            time_obj = i.time()
-            ok = True  # cas particulier des EditionsPlans
-            if name == 'EditionPlan1' and len(self.Ref1.text()) == 0:
-                ok = False
-            if name == 'EditionPlan2' and (len(self.Ref1.text()) == 0 or
-                                           len(self.Ref2.text()) == 0):
-                ok = False
-
-            if i.isEnabled() and ok:
-                contenu = contenu.replace("Jour" + name,
-                                          str(date_obj.day()).rjust(2, '0'))
-                contenu = contenu.replace("Mois" + name,
-                                          str(date_obj.month()).rjust(2, '0'))
-                contenu = contenu.replace("Annee" + name,
-                                          str(date_obj.year()).rjust(4))
-                contenu = contenu.replace("Heure" + name,
-                                          str(time_obj.hour()).rjust(2, '0'))
-                contenu = contenu.replace("Minute" + name,
-                                          str(time_obj.minute()).rjust(2, '0'))
-            else:
-                contenu = contenu.replace("Jour"+name, "")
-                contenu = contenu.replace("Mois"+name, "")
-                contenu = contenu.replace("Annee"+name, "")
-                contenu = contenu.replace("Heure"+name, "")
-                contenu = contenu.replace("Minute"+name, "")
-
-        # Change Menu
-        for i in self.findChildren(QComboBox):
-            name = i.objectName()
-            if i.isEnabled():
-                contenu = contenu.replace(name, i.currentText())
-            else:
-                contenu = contenu.replace(name, "")
-
-        n.write(contenu)
+    def valeursQGis(self):
+        """Valeurs des champs {{Nom}} du modèle QPT."""
+        valeurs = {}
+
+        for champ, widget in self.registre:
+            name = champ.qgis
+            reporte = self.reporte(champ, widget)
+
+            if champ.type == 'texte':
+                valeurs[name] = widget.text() if reporte else ""
+
+            elif champ.type in ('case', 'radio'):
+                valeurs[name] = "X" if widget.isChecked() else ""
+
+            elif champ.type == 'date':
+                date_obj = widget.date()
+                time_obj = widget.time()
+                if reporte:
+                    valeurs["Jour" + name] = \
+                        str(date_obj.day()).rjust(2, '0')
+                    valeurs["Mois" + name] = \
+                        str(date_obj.month()).rjust(2, '0')
+                    valeurs["Annee" + name] = str(date_obj.year()).rjust(4)
+                    valeurs["Heure" + name] = \
+                        str(time_obj.hour()).rjust(2, '0')
+                    valeurs["Minute" + name] = \
+                        str(time_obj.minute()).rjust(2, '0')
+                else:
+                    for prefixe in ("Jour", "Mois", "Annee", "Heure",
+                                    "Minute"):
+                        valeurs[prefixe + name] = ""
 
-        n.close()
-        f.close()
+            elif champ.type == 'liste':
+                valeurs[name] = widget.currentText() if reporte else ""
 
-        shutil.copy2(newfile, form)
+        return valeurs
 
+    def saveChangeQGis(self):
         # A changer
         titre = self.NoGu.text()
-        pdf = formulaireQGis(titre, form)
-
-        os.close(fdt)
-        os.remove(form)
-        os.close(fdn)
-        os.remove(newfile)
+        pdf = recepisseQGis(self.valeursQGis(), cheminRecepisse(titre))
 
         return titre, pdf
 
-    def saveChangePoppler(self):
-        def findId(l, txt):
-            id_f = -1
-            for i, j in enumerate(l):
-                if txt == j.name():
-                    id_f = i
-                    break
-            return id_f
-        if POPPLER is False:
-            return None, None
-
-        path = os.path.join(os.path.dirname(__file__), "formulaire_pdf")
-        formulaire = os.path.join(path, 'cerfa_14435-04.pdf')
-
-
-        doc = popplerqt5.Poppler.Document.load(formulaire)
-
-        try:
-            page = doc.page(0)
-        except:
-            return None, None
-
-        fields = page.formFields()
-
-        # Change contenu lignes
-        for i in self.line:
-            if i[0].isEnabled() and len(i) == 4: # exception pour la signature
-                id_f = findId(fields, i[3])
-                if id_f != -1:
-                        fields[id_f].setText(i[1])
-        # Change contenu checkbox
-        for i in self.findChildren(QCheckBox):
-            id_f = findId(fields, i.objectName())
-            if id_f != -1:
-                if i.isChecked():
-                    fields[id_f].setState(True)
-
-        # Change contenu radio
-        for i in self.findChildren(QRadioButton):
-            name = i.objectName()
-            id_f = findId(fields, name)
-            if id_f != -1:
-                if i.isChecked():
-                    fields[id_f].setState(True)
-            else:
-                # impossible d'automatiser puisqu'il n'y a pas
-                # de nom dans les champs du pdf
-                if name == "Possible":
-                    if i.isChecked():
-                        fields[72].setState(True)
-                elif name == "Impossible":
-                    if i.isChecked():
-                        fields[73].setState(True)
-
-        # Change dateTime
-        for i in self.findChildren(QDateTimeEdit):
-            name = i.objectName()
-            date_obj = i.date()
-            time_obj = i.time()
-            ok = True  # cas particulier des EditionsPlans
-            if name == 'EditionPlan1' and len(self.Ref1.text()) == 0:
-                ok = False
-            if name == 'EditionPlan2' and (len(self.Ref1.text()) == 0 or
-                                           len(self.Ref2.text()) == 0):
-                ok = False
-
-            if i.isEnabled() and ok:
+    def champsPDF(self):
+        """Champs du formulaire PDF à remplir : (nom, rang, valeur).
+
+        valeur est le texte d'une zone de texte, le rang de l'option
+        d'une liste ou True pour cocher le bouton de rang donné.
+        """
+        champs = []
+
+        for champ, widget in self.registre:
+            if champ.pdf is None:  # exception pour la signature
+                continue
+            nom, rang = champ.pdf
+            reporte = self.reporte(champ, widget)
+
+            if champ.type == 'texte':
+                if reporte:
+                    champs.append((nom, rang, widget.text()))
+
+            elif champ.type in ('case', 'radio'):
+                # certains boutons n'ont pas de nom dans les champs du pdf
+                if widget.isChecked():
+                    champs.append((nom, rang, True))
+
+            elif champ.type == 'date':
+                if not reporte:
+                    continue
+                date_obj = widget.date()
+                time_obj = widget.time()
+                jour = str(date_obj.day()).rjust(2, '0')
+                mois = str(date_obj.month()).rjust(2, '0')
+                annee = str(date_obj.year()).rjust(4)
                 # Cas particulier de AppelNonConcl_ Jour Mois et Annee
                 ext = "AppelNonConcl"
-                if name.find(ext) >= 0:
-                    id_f = findId(fields, ext + "_" + "Jour")
-                    if id_f != -1:
-                        fields[id_f].setText(str(date_obj.day()).rjust(2, '0'))
-                    id_f = findId(fields, ext + "_" + "Mois")
-                    if id_f != -1:
-                        fields[id_f].setText(str(date_obj.month()).rjust(2, '0'))
-                    id_f = findId(fields, ext + "_" + "Annee")
-                    if id_f != -1:
-                        fields[id_f].setText(str(date_obj.year()).rjust(4))
+                if nom.find(ext) >= 0:
+                    champs += [(ext + "_Jour", 0, jour),
+                               (ext + "_Mois", 0, mois),
+                               (ext + "_Annee", 0, annee)]
                 else:
-                    id_f = findId(fields, "Jour" + name)
-                    if id_f != -1:
-                        fields[id_f].setText(str(date_obj.day()).rjust(2, '0'))
-                    id_f = findId(fields, "Mois" + name)
-                    if id_f != -1:
-                        fields[id_f].setText(str(date_obj.month()).rjust(2, '0'))
-
-                    id_f = findId(fields, "Annee" + name)
-                    if id_f != -1:
-                        fields[id_f].setText(str(date_obj.year()).rjust(4))
-
                     # cas particulier des années
                     # Les champs EditionsPlan ne sont pas
                     # identiques pour les années, ils se nomment :
                     # AnneeEditionN au lieu de AnneeEditionPlanN
                     # où N est le numéro...
                     len_p = len('Plan')
-                    id_p = name.find('Plan')
-                    name_alt = name[:id_p]+name[id_p+len_p:]
-                    id_f = findId(fields, "Annee" + name_alt)
-                    if id_f != -1:
-                        fields[id_f].setText(str(date_obj.year()).rjust(4))
-
-                    id_f = findId(fields, "Heure" + name)
-                    if id_f != -1:
-                        fields[id_f].setText(str(time_obj.hour()).rjust(2, '0'))
-                    id_f = findId(fields, "Minute" + name)
-                    if id_f != -1:
-                        fields[id_f].setText(str(time_obj.minute()).rjust(2, '0'))
-
-        # Change Menu
-        for i in self.findChildren(QComboBox):
-            name = i.objectName()
-            id_f = findId(fields, name)
-            if id_f != -1:
-                if i.isEnabled():
-                    fields[id_f].setCurrentChoices([i.currentIndex()])
-                else:
-                    fields[id_f].setCurrentChoices([0])
-
-        # A changer
-        titre = self.ReferenceExploitant.text()
+                    id_p = nom.find('Plan')
+                    name_alt = nom[:id_p]+nom[id_p+len_p:]
+                    champs += [("Jour" + nom, 0, jour),
+                               ("Mois" + nom, 0, mois),
+                               ("Annee" + nom, 0, annee),
+                               ("Annee" + name_alt, 0, annee),
+                               ("Heure" + nom, 0,
+                                str(time_obj.hour()).rjust(2, '0')),
+                               ("Minute" + nom, 0,
+                                str(time_obj.minute()).rjust(2, '0'))]
+
+            elif champ.type == 'liste':
+                champs.append((nom, rang,
+                               widget.currentIndex() if reporte else 0))
+
+        return champs
+
+    def saveChangePDF(self):
+        """Remplit le CERFA par mise à jour incrémentale, sans rendu."""
+        titre = self.NoGu.text()
+        pdf = remplitFormulaire(CERFA, self.champsPDF(),
+                                cheminRecepisse(titre))
 
-        # Sortie
-        out_dir = QSettings().value("/DICT/configRep")
-        if QDir(out_dir).exists() is False or out_dir is None:
-            out_dir = str(QDir.homePath())
+        return titre, pdf
 
-        out = os.path.join(out_dir, QSettings().value("/DICT/prefRecep", "") +
-                           titre + QSettings().value("/DICT/sufRecep", "") +
-                           ".pdf")
+    def saveChangePoppler(self):
+        if POPPLER is False:
+            return None, None
 
-        pdf = doc.pdfConverter()
-        pdf.setOutputFileName(out)
-        pdf.setPDFOptions(popplerqt5.Poppler.PDFConverter.WithChanges)
-        pdf.convert()
+        # A changer
+        titre = self.ReferenceExploitant.text()
+        out = remplitPoppler(self.champsPDF(), cheminRecepisse(titre))
+        if out is None:
+            return None, None
 
         return titre, out
+
+    def titre(self):
+        """Titre de la déclaration, qui nomme le récépissé et les plans."""
+        if not QSettings().value("/DICT/formPDF", False, type=bool) and \
+                QSettings().value("/DICT/formPoppler") is True:
+            return self.ReferenceExploitant.text()
+        return self.NoGu.text()
+
+    def rendu(self):
+        """Titre et fonction d'impression du récépissé.
+
+        Les valeurs sont relevées dans l'assistant ; la fonction, qui
+        renvoie le chemin du PDF, peut ensuite être appelée hors du fil de
+        l'interface (QgsTask). Le récépissé QGIS est une mise en page : il
+        est imprimé ici, dans le fil de l'interface, et la fonction
+        renvoie seulement son chemin.
+        """
+        titre = self.titre()
+        if QSettings().value("/DICT/formPDF", False, type=bool):
+            champs = self.champsPDF()
+            return titre, lambda: remplitFormulaire(
+                CERFA, champs, cheminRecepisse(titre))
+
+        if QSettings().value("/DICT/formPoppler") is True:
+            champs = self.champsPDF()
+            return titre, lambda: remplitPoppler(champs,
+                                                 cheminRecepisse(titre))
+
+        pdf = recepisseQGis(self.valeursQGis(), cheminRecepisse(titre))
+        return titre, lambda: pdf
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DICT_fusion
+                                 A QGIS plugin
+ DICT
+                             -------------------
+        begin                : 2015-08-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2015 by Loïc BARTOLETTI
+        email                : lbartoletti@tuxfamily.org
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from PyQt5.QtCore import QSettings
+from PyQt5.QtWidgets import QMessageBox
+
+from .DICT_pdf import fusionne
+
+import os
+import shutil
+import sys
+import tempfile
+import subprocess
+
+
+# Résultat de la détection de pdftk : (chemin, date de modification) -> bool
+_pdftk = {}
+
+
+def _clePdftk(chemin):
+    executable = shutil.which(chemin) or chemin
+    try:
+        return chemin, os.path.getmtime(executable)
+    except (OSError, TypeError):
+        return chemin, None
+
+
+def oubliePdftk():
+    """Oublie les détections de pdftk (changement de configuration)."""
+    _pdftk.clear()
+
+
+def verifiePdftk(chemin, interactif=True):
+    """Vérifie que l'exécutable pdftk répond.
+
+    Le résultat est gardé pour la session tant que l'exécutable n'est pas
+    modifié. En mode non interactif (traitement par lot), l'erreur n'est
+    pas affichée mais simplement renvoyée comme un échec.
+    """
+    cle = _clePdftk(chemin)
+    if cle not in _pdftk:
+        _pdftk[cle] = _detectePdftk(chemin, interactif)
+    return _pdftk[cle]
+
+
+def _detectePdftk(chemin, interactif):
+    ret = -1
+    try:
+        if sys.platform == 'win32':
+            fd, err = tempfile.mkstemp()
+            proc = subprocess.Popen([chemin, "--version"], shell=True,
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT,
+                                    stdin=subprocess.PIPE)
+            proc.stdin.close()
+            proc.wait()
+            result = proc.returncode
+            txt = proc.stdout.read()
+            ret = txt.find(b"pdftk")
+            os.close(fd)
+            os.remove(err)
+        else:
+            txt = subprocess.check_output([chemin, "--version"])
+            ret = txt.find(b"pdftk")
+    except Exception as e:
+        if interactif:
+            msgBox = QMessageBox()
+            msgBox.setWindowTitle('Error with pdftk')
+            msgBox.setText(str(e))
+            msgBox.exec_()
+
+    return ret >= 0
+
+
+def fusionPDF(titre, pdf, planPDF, interactif=True):
+    """Fusionne le récépissé et les plans dans /DICT/configRep.
+
+    La fusion est faite dans le processus (DICT_pdf.fusionne) ; pdftk,
+    s'il est configuré, ne sert plus que de recours pour les PDF que
+    celle-ci ne sait pas lire (PDF chiffrés).
+
+    Renvoie le chemin du fichier fusionné, ou None si la fusion
+    n'est pas configurée ou a échoué. Les fichiers d'origine ne sont
+    supprimés qu'après une fusion réussie.
+    """
+    fusion = QSettings().value("/DICT/fusionPDF", False, type=bool)
+    if not fusion:
+        return None
+
+    out = QSettings().value("/DICT/configRep")
+    s = os.path.join(out, "envoi_" + titre + ".pdf")
+    try:
+        fusionne([pdf] + planPDF, s)
+    except Exception as e:
+        pdftk = QSettings().value("/DICT/configPDFTK")
+        if not pdftk or not verifiePdftk(pdftk, interactif):
+            if interactif:
+                msgBox = QMessageBox()
+                msgBox.setWindowTitle('Erreur de fusion des PDF')
+                msgBox.setText(str(e))
+                msgBox.exec_()
+            if os.path.exists(s):
+                os.remove(s)
+            return None
+        # Utilise pdftk pour fusionner les documents
+        code = subprocess.call(
+            [pdftk, pdf] + planPDF + ["cat", "output"] + [s])
+        if code != 0 or not os.path.exists(s):
+            # Les fichiers d'origine sont gardés
+            if interactif:
+                msgBox = QMessageBox()
+                msgBox.setWindowTitle('Erreur de fusion des PDF')
+                msgBox.setText("pdftk a échoué (code {}) : {}".format(
+                    code, str(e)))
+                msgBox.exec_()
+            if os.path.exists(s):
+                os.remove(s)
+            return None
+
+    os.remove(pdf)
+    for p in planPDF:
+        os.remove(p)
+
+    return s
@@ -9,151 +9,409 @@ from PyQt5.QtGui import QPainter
 from PyQt5.QtPrintSupport import QPrinter
 from PyQt5.QtWidgets import QMessageBox
 from .DICT_dialog_composer import DICTDialogComposer
+from .DICT_lecture import coordonnees
+from .DICT_taches import ExportPlan, exportePlans
+from .DICT_cache import PlanEnCache, cachePlan, couchesCarte
 from math import ceil, pow
 import os
 
+# Recouvrement des feuilles d'un plan découpé (part de la feuille)
+RECOUVREMENT = 0.05
+
+
+def grilleFeuilles(emprise, largeur, hauteur, recouvrement=RECOUVREMENT):
+    """Feuilles d'une grille centrée sur l'emprise, de haut en bas puis de
+    gauche à droite. Les feuilles qui ne touchent pas l'emprise (travaux
+    linéaires en biais) sont écartées.
+
+    :param emprise: Emprise, dans le système de la carte.
+    :type emprise: QgsGeometry
+
+    :param largeur: Terrain couvert par une feuille, en unités de la carte.
+    :type largeur: float
+
+    :return: Liste de QgsRectangle.
+    """
+    bb = emprise.boundingBox()
+    pasX = largeur * (1 - recouvrement)
+    pasY = hauteur * (1 - recouvrement)
+    nx = 1 + max(0, int(ceil((bb.width() - largeur) / pasX)))
+    ny = 1 + max(0, int(ceil((bb.height() - hauteur) / pasY)))
+
+    x0 = bb.center().x() - (largeur + (nx - 1) * pasX) / 2
+    y0 = bb.center().y() + (hauteur + (ny - 1) * pasY) / 2
+
+    feuilles = []
+    for j in range(ny):
+        for i in range(nx):
+            x = x0 + i * pasX
+            y = y0 - j * pasY
+            feuille = QgsRectangle(x, y - hauteur, x + largeur, y)
+            if emprise.intersects(feuille):
+                feuilles.append(feuille)
+    return feuilles
+
+
+def filtreEmprise(couche, rect):
+    """Filtre SQL des entités de la couche qui touchent rect, ou None si
+    le fournisseur de la couche n'est pas une base de données spatiale.
+
+    :param rect: Emprise élargie, dans le système de la couche.
+    :type rect: QgsRectangle
+    """
+    fournisseur = couche.providerType()
+    if fournisseur not in ('postgres', 'spatialite'):
+        return None
+
+    uri = QgsDataSourceUri(couche.source())
+    colonne = uri.geometryColumn()
+    if not colonne:
+        return None
+    srid = uri.srid() or str(couche.crs().postgisSrid())
+    boite = "{}, {}, {}, {}, {}".format(
+        repr(rect.xMinimum()), repr(rect.yMinimum()),
+        repr(rect.xMaximum()), repr(rect.yMaximum()), srid)
+
+    if fournisseur == 'postgres':
+        # && : utilise l'index GiST de la colonne
+        filtre = '"{}" && ST_MakeEnvelope({})'.format(colonne, boite)
+    else:
+        filtre = 'MbrIntersects("{}", BuildMbr({}))'.format(colonne, boite)
+
+    if couche.subsetString():
+        filtre = "(" + couche.subsetString() + ") AND " + filtre
+    return filtre
+
 
 class DICT_geometrie(object):
-    def __init__(self, xml, epsg_tag, gml_tag, gml_tag_alt):
+    def __init__(self, srsName, polygones, interactif=True):
+        self._interactif = interactif
 
-        msgBox = QMessageBox()
-        msgBox.setTextFormat(Qt.RichText)
         try:
-            self._epsg = self.__findEPSG(xml, epsg_tag)
+            self._epsg = self.__findEPSG(srsName)
         except:
-            msgBox.setText("Erreur d'analyse du code EPSG.")
-            msgBox.exec_()
+            if not interactif:
+                raise
+            self.__erreur("Erreur d'analyse du code EPSG.")
             return
         try:
-            self._geom = self.__getGeom(xml, gml_tag, gml_tag_alt)
+            self._geom = self.__getGeom(polygones)
         except:
-            msgBox.setText("Erreur d'analyse de la géométrie.")
-            msgBox.exec_()
+            if not interactif:
+                raise
+            self.__erreur("Erreur d'analyse de la géométrie.")
             return
 
-    def __dictGeom2qgisGeom(self, geom):
-        geom = geom.replace(' ', '*')
-        geom = geom.replace(',', ' ')
-        geom = geom.replace('*', ',')
-
-        wkt = "POLYGON ((" + geom + "))"
-        return QgsGeometry.fromWkt(wkt)
-
-    def __dictAltGeom2qgisGeom(self, geom):
-        s = ""
-        count = 0
-        for i in geom:
-            if i == ' ':
-                if count % 2 == 0:
-                    s += ','
-                else:
-                    s += ' '
-                count += 1
-            else:
-                s += i
-        return self.__dictGeom2qgisGeom(s)
+    def __erreur(self, texte):
+        # Boîte de message créée en mode interactif seulement
+        msgBox = QMessageBox()
+        msgBox.setTextFormat(Qt.RichText)
+        msgBox.setText(texte)
+        msgBox.exec_()
 
-    def __findEPSG(self, xml, epsg_tag):
-        epsg_xml = xml.getElementsByTagName(epsg_tag)
-        att = epsg_xml[0].attributes['srsName']
-        nValue = att.firstChild.nodeValue
+    def __anneau(self, geom):
+        xs, ys = coordonnees(geom)
+        # Ferme l'anneau si nécessaire
+        if len(xs) > 0 and (xs[0] != xs[-1] or ys[0] != ys[-1]):
+            xs.append(xs[0])
+            ys.append(ys[0])
+        return QgsLineString(xs, ys)
+
+    def __dictGeom2qgisGeom(self, polygones):
+        # Construit directement le multipolygone, sans passer par le WKT
+        multi = QgsMultiPolygon()
+        for anneaux in polygones:
+            polygone = QgsPolygon()
+            polygone.setExteriorRing(self.__anneau(anneaux[0]))
+            for trou in anneaux[1:]:
+                polygone.addInteriorRing(self.__anneau(trou))
+            multi.addGeometry(polygone)
+        return QgsGeometry(multi)
+
+    def __findEPSG(self, nValue):
         posEpsg = nValue.rfind(':') + 1
 
         return nValue[posEpsg:]
 
-    def __getGeom(self, xml, gml_tag, gml_tag_alt):
-        version = -1
-        geom_txt = xml.getElementsByTagName(gml_tag)
-        if(len(geom_txt) > 0):
-            version = 1
-        else:
-            geom_txt = xml.getElementsByTagName(gml_tag_alt)
-            if(len(geom_txt) > 0):
-                version = 2
+    def __getGeom(self, polygones):
+        # Toutes les emprises, trous compris, dans une seule géométrie
+        if len(polygones) == 0:
+            raise ValueError("Aucune emprise dans le XML")
 
-        g = geom_txt[0].firstChild.nodeValue
-        if version == 1:
-            geom = self.__dictGeom2qgisGeom(g)
-        elif version == 2:
-            geom = self.__dictAltGeom2qgisGeom(g)
+        return self.__dictGeom2qgisGeom(polygones)
 
+    def __coucheEmprise(self, cree=True):
+        """Couche des emprises du projet, créée au premier traitement.
 
-        return geom
+        Chaque déclaration y est ajoutée comme une entité : le nombre de
+        couches du projet reste constant et la couche indexée garde
+        l'historique des demandes.
 
-    def addGeometrie(self):
-        vl = "Polygon?crs=epsg:" + self._epsg + "&index=yes"
-        mem_layer = QgsVectorLayer(vl, "Emprise du chantier", "memory")
-        pr = mem_layer.dataProvider()
+        :param cree: Crée la couche si elle n'est pas dans le projet ; sinon
+            renvoie None.
+        :type cree: bool
+        """
+        projet = QgsProject.instance()
+        id_couche, ok = projet.readEntry("DICT", "coucheEmprise")
+        couche = projet.mapLayer(id_couche) if ok else None
+        if couche is not None or not cree:
+            return couche
+
+        vl = "MultiPolygon?crs=epsg:" + self._epsg + \
+             "&field=NoGu:string(30)&field=date:date" + \
+             "&field=type:string(4)&field=commune:string(100)&index=yes"
+        couche = QgsVectorLayer(vl, "Emprise du chantier", "memory")
+        prop = couche.renderer().symbol().symbolLayers()[0].properties()
+        prop['color'] = '255,0,0,20'
+        couche.renderer().setSymbol(QgsFillSymbol.createSimple(prop))
+        projet.addMapLayer(couche)
+        projet.writeEntry("DICT", "coucheEmprise", couche.id())
 
-        f = QgsFeature()
+        return couche
 
-        f.setGeometry(self._geom)
+    def addGeometrie(self, attributs):
+        """Ajoute l'emprise à la couche des emprises.
+
+        :param attributs: Valeurs des champs NoGu, date, type et commune.
+        :type attributs: dict
+        """
+        declarationCrs = QgsCoordinateReferenceSystem("EPSG:" + self._epsg)
+        mem_layer = self.__coucheEmprise()
+        pr = mem_layer.dataProvider()
+
+        f = QgsFeature(mem_layer.fields())
+        geom = QgsGeometry(self._geom)
+        if mem_layer.crs() != declarationCrs:
+            geom.transform(QgsCoordinateTransform(declarationCrs,
+                                                  mem_layer.crs(),
+                                                  QgsProject.instance()))
+        f.setGeometry(geom)
+        for champ in ('NoGu', 'date', 'type', 'commune'):
+            f[champ] = attributs[champ]
 
         pr.addFeatures([f])
-        mem_layer.commitChanges()
         mem_layer.updateExtents()
-        prop = mem_layer.renderer().symbol().symbolLayers()[0].properties()
-        prop['color'] = '255,0,0,20'
-        mem_layer.renderer().setSymbol(QgsFillSymbol.createSimple(prop))
-        QgsProject.instance().addMapLayer(mem_layer)
+        mem_layer.triggerRepaint()
 
-        layerCRSSrsid = mem_layer.crs().authid()
-        mc = iface.mapCanvas()
-        projectCRSSrsid = mc.mapSettings().destinationCrs().authid()
+        if self._interactif:
+            mc = iface.mapCanvas()
+            projectCRSSrsid = mc.mapSettings().destinationCrs().authid()
+        else:
+            # Traitement par lot : le canevas n'est pas déplacé
+            projectCRSSrsid = QgsProject.instance().crs().authid()
 
-        geomBB = self._geom
-        sourceCrs = QgsCoordinateReferenceSystem(layerCRSSrsid)
+        geomBB = QgsGeometry(self._geom)
+        sourceCrs = declarationCrs
         destCrs = QgsCoordinateReferenceSystem(projectCRSSrsid)
         tr = QgsCoordinateTransform(sourceCrs, destCrs, QgsProject.instance())
         geomBB.transform(tr)
         self._geomBB = geomBB.boundingBox()
-        mc.setExtent(self._geomBB)
-        mc.zoomScale(mc.scale() * 2)
+        if self._interactif:
+            mc.setExtent(self._geomBB)
+            mc.zoomScale(mc.scale() * 2)
+
+    def __etenduePlan(self):
+        if self._interactif:
+            return iface.mapCanvas().extent()
+
+        # Même marge que le zoom du canevas en mode interactif
+        etendue = QgsRectangle(self._geomBB)
+        etendue.scale(2)
+        return etendue
+
+    def __decoupage(self, layout, mapItem, echelle):
+        """Découpe l'emprise en feuilles à l'échelle donnée.
+
+        Les feuilles sont les entités d'une couche mémoire qui pilote
+        l'atlas de la mise en page : toutes sont exportées dans un seul
+        PDF, en un seul passage de l'exporteur.
+
+        :return: La couche de couverture de l'atlas, ou None si une
+            feuille suffit (le plan est alors cadré comme d'habitude).
+        """
+        crs = mapItem.crs()
+        emprise = QgsGeometry(self._geom)
+        emprise.transform(QgsCoordinateTransform(
+            QgsCoordinateReferenceSystem("EPSG:" + self._epsg), crs,
+            QgsProject.instance()))
+
+        # Terrain couvert par une feuille, en unités de la carte
+        taille = layout.renderContext().measurementConverter().convert(
+            mapItem.sizeWithUnits(), QgsUnitTypes.LayoutMeters)
+        facteur = echelle * QgsUnitTypes.fromUnitToUnitFactor(
+            QgsUnitTypes.DistanceMeters, crs.mapUnits())
+        feuilles = grilleFeuilles(emprise, taille.width() * facteur,
+                                  taille.height() * facteur)
+        if len(feuilles) <= 1:
+            return None
+
+        couverture = QgsVectorLayer("Polygon?field=feuille:integer",
+                                    "Feuilles", "memory")
+        couverture.setCrs(crs)
+        features = []
+        for i, feuille in enumerate(feuilles):
+            f = QgsFeature(couverture.fields())
+            f.setGeometry(QgsGeometry.fromRect(feuille))
+            f['feuille'] = i + 1
+            features.append(f)
+        couverture.dataProvider().addFeatures(features)
+
+        atlas = layout.atlas()
+        atlas.setCoverageLayer(couverture)
+        atlas.setHideCoverage(True)
+        atlas.setEnabled(True)
+
+        # La carte suit les feuilles sans changer d'échelle
+        mapItem.zoomToExtent(feuilles[0])
+        mapItem.setScale(echelle)
+        mapItem.setAtlasDriven(True)
+        mapItem.setAtlasScalingMode(QgsLayoutItemMap.Fixed)
+
+        return couverture
+
+    def __filtreReseaux(self, mapItem, distance, variables):
+        """Limite les couches de la carte aux entités proches de l'emprise.
+
+        Les couches des bases de données sont remplacées, dans la carte
+        copiée, par des copies filtrées sur l'emprise élargie de distance :
+        seules ces entités sont lues et dessinées à l'export, celles situées
+        plus loin ne figurent pas sur le plan même si elles sont dans son
+        cadre. Les couches du projet ne sont pas modifiées.
+
+        :param distance: Élargissement de l'emprise, en mètres.
+        :type distance: float
+
+        :return: Les couches filtrées, à garder jusqu'à la fin de l'export.
+        """
+        declarationCrs = QgsCoordinateReferenceSystem("EPSG:" + self._epsg)
+        couches = []
+        filtrees = []
+        for couche in couchesCarte(mapItem):
+            if couche in variables or not isinstance(couche, QgsVectorLayer):
+                couches.append(couche)
+                continue
 
+            emprise = QgsGeometry(self._geom)
+            emprise.transform(QgsCoordinateTransform(
+                declarationCrs, couche.crs(), QgsProject.instance()))
+            rect = emprise.boundingBox()
+            rect.grow(distance * QgsUnitTypes.fromUnitToUnitFactor(
+                QgsUnitTypes.DistanceMeters, couche.crs().mapUnits()))
 
-    def geometriePDF(self, titre, taillePlan):
+            filtre = filtreEmprise(couche, rect)
+            copie = couche.clone() if filtre is not None else None
+            if copie is not None and copie.setSubsetString(filtre):
+                couches.append(copie)
+                filtrees.append(copie)
+                QgsMessageLog.logMessage(
+                    "Filtre sur l'emprise : {} entités lues sur {} pour "
+                    "{}".format(copie.featureCount(), couche.featureCount(),
+                                couche.name()),
+                    'DICT', Qgis.Info)
+            else:
+                couches.append(couche)
+
+        if len(filtrees) > 0:
+            mapItem.setFollowVisibilityPreset(False)
+            mapItem.setKeepLayerSet(True)
+            mapItem.setLayers(couches)
+        return filtrees
+
+    def choixComposeurs(self, taillePlan):
+        """Mises en page choisies par l'utilisateur pour les plans."""
         # Display layout list
         dlgConfigComposers = DICTDialogComposer(taillePlan)
         dlgConfigComposers.show()
         result = dlgConfigComposers.exec_()
 
-        idx_plan = []
-
+        composeurs = []
         if result:
             idx_plan = dlgConfigComposers.listComposers.selectedItems()
-        # Sortie du plan en PDF
-            manager = QgsProject.instance().layoutManager()
+            for idx in idx_plan:
+                id_plan = dlgConfigComposers.listComposers.row(idx)
+                composeurs.append(
+                    dlgConfigComposers.layout_listArray[id_plan])
+        return composeurs
+
+    def preparePlans(self, titre, composeurs):
+        """Exports des plans (DICT_taches.ExportPlan) et chemins des PDF.
+
+        Les mises en page sont copiées et cadrées ; les plans sont ensuite
+        exportés par DICT_taches.exportePlans.
+        """
+        manager = QgsProject.instance().layoutManager()
+        # Échelle des feuilles des grandes emprises, 0 sans découpage
+        echelle = int(QSettings().value("/DICT/echelleDecoupage", 0))
+        # Distance du filtre des réseaux autour de l'emprise, 0 sans filtre
+        distance = float(QSettings().value("/DICT/distanceFiltre", 0))
 
+        # Emprises : rendues à chaque export, jamais filtrées. La couche
+        # n'est pas recréée ici : vide, elle donnerait un plan sans emprise
+        emprise = self.__coucheEmprise(cree=False)
+        if emprise is None:
+            raise ValueError("couche des emprises introuvable, "
+                             "supprimée du projet ?")
+
+        # Sortie du plan en PDF
         out = []
-        if len(idx_plan) > 0:
-            for i, idx in enumerate(idx_plan):
-                id_plan = dlgConfigComposers.listComposers.row(idx_plan[i])
-                layout_name = dlgConfigComposers.layout_listArray[id_plan]
-                layout = manager.layoutByName(layout_name)
-
-                # Retrieve the layout's map Item
-                mapItem = layout.referenceMap()
-                mapItem.zoomToExtent(iface.mapCanvas().extent())
-                # Only mean to edit an existing item found so far is getting said item's ID
-                # there's the layoutItems() method to get the list of items from a layout
-                # but as of now is exclusive to C++ plugins
-
-                # Output
-                out_dir = QSettings().value("/DICT/configRep")
-                if QDir(out_dir).exists() is False or out_dir is None:
-                    out_dir = str(QDir.homePath())
+        plans = []
+        for i, layout_name in enumerate(composeurs):
+            # Copie de la mise en page
+            layout = manager.layoutByName(layout_name)
+            if layout is None:
+                raise ValueError("mise en page introuvable : " + layout_name)
+            layout = layout.clone()
+
+            # Retrieve the layout's map Item
+            mapItem = layout.referenceMap()
+            couverture = None
+            if echelle > 0:
+                couverture = self.__decoupage(layout, mapItem, echelle)
+            cache = None
+            variables = [emprise]
+            if couverture is None:
+                mapItem.zoomToExtent(self.__etenduePlan())
+                # Couches fixes rendues par le cache
+                if cachePlan() is not None and \
+                        PlanEnCache.possible(mapItem, variables):
+                    cache = PlanEnCache(cachePlan(), layout, mapItem,
+                                        variables)
+            # Les dalles du cache ne dépendent pas de l'emprise : le filtre
+            # ne s'applique qu'aux plans rendus directement
+            filtrees = []
+            if distance > 0 and cache is None:
+                filtrees = self.__filtreReseaux(mapItem, distance, variables)
+
+            # Output
+            out_dir = QSettings().value("/DICT/configRep")
+            if QDir(out_dir).exists() is False or out_dir is None:
+                out_dir = str(QDir.homePath())
 
+            pdf = os.path.join(out_dir,
+                QSettings().value("/DICT/prefPlan", "") + titre + \
+                QSettings().value("/DICT/sufPlan", "") + "_" + str(i) + ".pdf")
+
+            if QFile.exists(pdf):
                 pdf = os.path.join(out_dir,
-                    QSettings().value("/DICT/prefPlan", "") + titre + \
+                    QSettings().value("/DICT/prefPlan", "") + "plan_" + titre + \
                     QSettings().value("/DICT/sufPlan", "") + "_" + str(i) + ".pdf")
 
-                if QFile.exists(pdf):
-                    pdf = os.path.join(out_dir,
-                        QSettings().value("/DICT/prefPlan", "") + "plan_" + titre + \
-                        QSettings().value("/DICT/sufPlan", "") + "_" + str(i) + ".pdf")
+            plans.append(ExportPlan(layout, pdf, couverture, cache,
+                                    filtrees))
+            out.append(pdf)
+
+        return plans, out
+
+    def geometriePDF(self, titre, taillePlan, composeurs=None):
+        if composeurs is None:
+            composeurs = self.choixComposeurs(taillePlan)
 
-                exported_layout = QgsLayoutExporter(layout)
-                exported_layout.exportToPdf(pdf, QgsLayoutExporter.PdfExportSettings())
-                out.append(pdf)
+        plans, out = self.preparePlans(titre, composeurs)
+        if not exportePlans(plans, "Export des plans..." if self._interactif
+                            else None):
+            raise RuntimeError("Export des plans annulé")
+        erreurs = [p.erreur for p in plans if p.erreur is not None]
+        if len(erreurs) > 0:
+            raise RuntimeError("Plans non créés : " + ", ".join(erreurs))
 
         return out
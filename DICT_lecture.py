@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+ Lecture en un seul passage d'un XML de DT/DICT du téléservice.
+
+ Le fichier est parcouru avec iterparse : seuls les champs décrits dans
+ CHAMPS et les coordonnées de l'emprise sont conservés, les éléments
+ déjà lus sont libérés au fil de la lecture pour que la mémoire reste
+ bornée même avec de grandes emprises ou des pièces jointes.
+"""
+
+from xml.etree.ElementTree import iterparse
+
+try:
+    import numpy
+    NUMPY = True
+except:
+    NUMPY = False
+
+RC_BASE = 'http://www.reseaux-et-canalisations.gouv.fr/schema-teleservice/'
+GML = 'http://www.opengis.net/gml/3.2'
+
+# Type de déclaration : élément du téléservice, par ordre de priorité
+TYPES = (('dtDictConjointes', 'DC'),
+         ('DT', 'DT'),
+         ('DICT', 'DICT'))
+
+# Destinataire du récépissé selon le type, executantDesTravaux sinon
+DESTINATAIRES = {'DT': 'representantDuResponsableDeProjet'}
+DESTINATAIRE = 'executantDesTravaux'
+
+# Champs relevés pour chaque version du schéma : clé -> chemins candidats.
+# Un chemin 'a/b/c' désigne le premier descendant c du premier descendant b
+# du premier élément a (comme getElementsByTagName). {type} et
+# {destinataire} sont remplacés par les éléments de TYPES et DESTINATAIRES.
+# Le premier candidat non vide est retenu.
+_CHAMPS_2 = {
+    'NoGu': ('{type}/noConsultationDuTeleservice',
+             '{type}/noConsultationDuTeleserviceSeize'),
+    'NoAffaireDeclarant': ('{type}/noAffaireDeLexecutantDesTravaux',),
+    'Personne_Contacter': ('{type}/nomDeLaPersonneAContacter',),
+    'dateDeLaDeclaration': ('{type}/dateDeLaDeclaration',),
+    'communePrincipale': ('{type}/communePrincipale',),
+    'AdresseTravaux': ('{type}/adresse',),
+    'dest_Denomination': ('{destinataire}/denomination',),
+    'dest_ComplementAdresse': ('{destinataire}/complementService',),
+    'dest_Numero': ('{destinataire}/numero',),
+    'dest_Voie': ('{destinataire}/voie',),
+    'dest_LieuditBP': ('{destinataire}/lieuDitBP',),
+    'dest_CodePostal': ('{destinataire}/codePostal',),
+    'dest_Commune': ('{destinataire}/commune',),
+    'dest_Pays': ('{destinataire}/pays',),
+    'taillePlan': ('modeReceptionElectronique/tailleDesPlans',),
+}
+
+CHAMPS = {
+    '2.1': _CHAMPS_2,
+    '2.2': _CHAMPS_2,
+    '3.0': _CHAMPS_2,
+}
+
+GEOMETRIES = ('coordinates', 'posList')
+# Éléments GML qui commencent un nouveau polygone
+SURFACES = ('Polygon', 'PolygonPatch')
+
+
+def _nom(tag):
+    """Sépare '{espace}local' en (espace, local)."""
+    if tag[0] == '{':
+        espace, _, local = tag[1:].partition('}')
+        return espace, local
+    return '', tag
+
+
+def coordonnees(texte):
+    """Abscisses et ordonnées d'un gml:coordinates ou d'un gml:posList.
+
+    'x,y x,y' (coordinates) et 'x y x y' (posList) sont découpés en une
+    seule fois, avec NumPy s'il est disponible.
+    """
+    texte = texte.replace(',', ' ')
+    if NUMPY:
+        valeurs = numpy.fromstring(texte, sep=' ')
+        return valeurs[0::2].tolist(), valeurs[1::2].tolist()
+
+    valeurs = list(map(float, texte.split()))
+    return valeurs[0::2], valeurs[1::2]
+
+
+def _chemins(champs):
+    """Développe {type} et {destinataire} : {(type, clé): [chemins]}."""
+    chemins = {}
+    for element, typ in TYPES:
+        destinataire = DESTINATAIRES.get(typ, DESTINATAIRE)
+        for cle, candidats in champs.items():
+            chemins[(typ, cle)] = [
+                tuple(c.format(type=element,
+                               destinataire=destinataire).split('/'))
+                for c in candidats]
+    return chemins
+
+
+class DICT_lecture(object):
+    def __init__(self, xml_file):
+        # Version du schéma du téléservice ('2.2'...)
+        self.version = None
+        # Type de déclaration ('DC', 'DT', 'DICT'), None pour une ATU
+        self.type = None
+        # clé de CHAMPS -> texte, pour le type de déclaration
+        self.champs = {}
+        # srsName de la géométrie
+        self.srsName = None
+        # Polygones de l'emprise : [texte de l'extérieur, textes des trous]
+        self.polygones = []
+
+        self.__lecture(xml_file)
+
+    def valeur(self, cle):
+        return self.champs.get(cle, "")
+
+    def __lecture(self, xml_file):
+        espace = None
+        srsGml = None
+        interieur = 0    # profondeur dans les gml:interior
+        textes = {}      # chemin -> texte de l'élément trouvé
+        trouves = set()  # préfixes de chemins déjà résolus
+        # nom local -> [(préfixe parent, préfixe)] : préfixes à résoudre
+        attente = {}
+        ouverts = {}     # élément -> préfixes dont il est la portée
+        portees = set()  # préfixes dont la portée est ouverte
+        reclames = {}    # élément -> chemins dont il porte le texte
+        pile = []
+
+        for evenement, elem in iterparse(xml_file,
+                                         events=('start-ns', 'start', 'end')):
+            if evenement == 'start-ns':
+                uri = elem[1]
+                if espace is None and uri.startswith(RC_BASE):
+                    self.version = uri[len(RC_BASE):]
+                    if self.version not in CHAMPS:
+                        raise ValueError("Version du téléservice non prise "
+                                         "en charge : " + self.version)
+                    espace = uri
+                    chemins = _chemins(CHAMPS[self.version])
+                    for candidats in chemins.values():
+                        for chemin in candidats:
+                            for i in range(len(chemin)):
+                                prefixe = chemin[:i + 1]
+                                attente.setdefault(chemin[i], set()).add(
+                                    (chemin[:i], prefixe))
+                continue
+
+            ns, local = _nom(elem.tag)
+
+            if evenement == 'start':
+                pile.append(elem)
+                if ns == espace:
+                    for parent, prefixe in attente.get(local, ()):
+                        if prefixe in trouves or \
+                                (parent and parent not in portees):
+                            continue
+                        trouves.add(prefixe)
+                        portees.add(prefixe)
+                        ouverts.setdefault(elem, []).append(prefixe)
+                        reclames.setdefault(elem, []).append(prefixe)
+
+                    if local == 'geometrie' and self.srsName is None:
+                        self.srsName = elem.get('srsName')
+
+                elif ns == GML:
+                    if srsGml is None:
+                        srsGml = elem.get('srsName')
+                    if local in SURFACES:
+                        self.polygones.append([])
+                    elif local == 'interior':
+                        interieur += 1
+                continue
+
+            # evenement == 'end' : le texte de l'élément est complet
+            for prefixe in reclames.pop(elem, ()):
+                textes[prefixe] = elem.text or ""
+            for prefixe in ouverts.pop(elem, ()):
+                portees.discard(prefixe)
+
+            if ns == GML:
+                if local in GEOMETRIES and elem.text and elem.text.strip():
+                    if interieur == 0 and \
+                            (not self.polygones or self.polygones[-1]):
+                        # Anneau extérieur hors d'un gml:Polygon
+                        self.polygones.append([])
+                    if interieur == 0 or self.polygones:
+                        self.polygones[-1].append(elem.text)
+                elif local == 'interior':
+                    interieur -= 1
+
+            # Libère l'élément lu
+            pile.pop()
+            elem.clear()
+            if pile:
+                pile[-1].remove(elem)
+
+        if espace is None:
+            raise ValueError("Espace de noms du téléservice introuvable")
+
+        # À défaut sur rc:geometrie, le srsName porté par la géométrie GML
+        if self.srsName is None:
+            self.srsName = srsGml
+
+        for element, typ in TYPES:
+            if (element,) in trouves:
+                self.type = typ
+                break
+        else:  # ATU
+            return
+
+        for (typ, cle), candidats in chemins.items():
+            if typ != self.type:
+                continue
+            self.champs[cle] = ""
+            for chemin in candidats:
+                if textes.get(chemin):
+                    self.champs[cle] = textes[chemin]
+                    break
@@ -0,0 +1,913 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+ Lecture et écriture de PDF en Python, sans dépendance.
+
+ LecteurPDF lit la table des références (classique ou en flux, avec les
+ flux d'objets) et donne accès aux objets à la demande : le fichier est
+ projeté en mémoire (mmap) et seuls les objets demandés sont analysés.
+
+ Représentation des objets :
+   dictionnaire -> dict (clés sans '/'), tableau -> list,
+   nom -> Nom, chaîne -> bytes, nombre -> int ou float,
+   booléen -> bool, null -> None, référence -> Reference,
+   flux -> Flux.
+"""
+
+from collections import namedtuple
+
+import mmap
+import re
+import shutil
+import zlib
+
+Reference = namedtuple('Reference', ['num', 'gen'])
+
+
+class Nom(str):
+    """Nom PDF (/Nom)."""
+
+
+class Flux(object):
+    def __init__(self, dico, brut):
+        self.dico = dico
+        # Données telles qu'elles sont écrites dans le fichier
+        self.brut = brut
+
+    def donnees(self):
+        """Données décodées (FlateDecode et prédicteur PNG)."""
+        filtres = self.dico.get('Filter', [])
+        parametres = self.dico.get('DecodeParms', [])
+        if not isinstance(filtres, list):
+            filtres, parametres = [filtres], [parametres]
+        donnees = bytes(self.brut)
+        for i, filtre in enumerate(filtres):
+            if filtre != 'FlateDecode':
+                raise ErreurPDF("Filtre non pris en charge : " + filtre)
+            donnees = zlib.decompress(donnees)
+            parms = parametres[i] if i < len(parametres) else None
+            if parms and parms.get('Predictor', 1) >= 10:
+                donnees = _png(donnees, parms.get('Columns', 1))
+        return donnees
+
+
+class ErreurPDF(ValueError):
+    pass
+
+
+BLANCS = b'\x00\t\n\x0c\r '
+DELIMITEURS = b'()<>[]{}/%'
+
+_BLANC = re.compile(rb'(?:[\x00\t\n\x0c\r ]|%[^\r\n]*)*')
+_NOMBRE = re.compile(rb'[+-]?(?:\d+\.?\d*|\.\d+)')
+_REFERENCE = re.compile(rb'(\d+)[\x00\t\n\x0c\r ]+(\d+)[\x00\t\n\x0c\r ]+R'
+                        rb'(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])')
+_NOM = re.compile(rb'/([^\x00\t\n\x0c\r ()<>\[\]{}/%]*)')
+_MOT = re.compile(rb'[A-Za-z]+')
+_HEXA = re.compile(rb'<([0-9A-Fa-f\x00\t\n\x0c\r ]*)>')
+_DIESE = re.compile(rb'#([0-9A-Fa-f]{2})')
+_OBJET = re.compile(rb'[\x00\t\n\x0c\r ]*(\d+)[\x00\t\n\x0c\r ]+(\d+)'
+                    rb'[\x00\t\n\x0c\r ]+obj')
+_ECHAPPEMENTS = {ord('n'): b'\n', ord('r'): b'\r', ord('t'): b'\t',
+                 ord('b'): b'\b', ord('f'): b'\f', ord('('): b'(',
+                 ord(')'): b')', ord('\\'): b'\\'}
+
+
+def _png(donnees, colonnes):
+    """Inverse les filtres PNG d'un flux (prédicteur >= 10)."""
+    lignes = []
+    precedente = bytearray(colonnes)
+    for i in range(0, len(donnees), colonnes + 1):
+        filtre = donnees[i]
+        ligne = bytearray(donnees[i + 1:i + 1 + colonnes])
+        if filtre == 1:
+            for j in range(1, len(ligne)):
+                ligne[j] = (ligne[j] + ligne[j - 1]) & 0xff
+        elif filtre == 2:
+            for j in range(len(ligne)):
+                ligne[j] = (ligne[j] + precedente[j]) & 0xff
+        elif filtre == 3:
+            for j in range(len(ligne)):
+                gauche = ligne[j - 1] if j else 0
+                ligne[j] = (ligne[j] + (gauche + precedente[j]) // 2) & 0xff
+        elif filtre == 4:
+            for j in range(len(ligne)):
+                a = ligne[j - 1] if j else 0
+                b = precedente[j]
+                c = precedente[j - 1] if j else 0
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                if pa <= pb and pa <= pc:
+                    predit = a
+                elif pb <= pc:
+                    predit = b
+                else:
+                    predit = c
+                ligne[j] = (ligne[j] + predit) & 0xff
+        lignes.append(bytes(ligne))
+        precedente = ligne
+    return b''.join(lignes)
+
+
+class Analyseur(object):
+    """Analyse des objets PDF dans un tampon (bytes ou mmap)."""
+
+    def __init__(self, tampon, pos=0):
+        self.tampon = tampon
+        self.pos = pos
+
+    def blancs(self):
+        self.pos = _BLANC.match(self.tampon, self.pos).end()
+
+    def objet(self):
+        self.blancs()
+        t = self.tampon
+        c = t[self.pos:self.pos + 1]
+
+        if c == b'/':
+            m = _NOM.match(t, self.pos)
+            self.pos = m.end()
+            return Nom(_DIESE.sub(lambda d: bytes([int(d.group(1), 16)]),
+                                  m.group(1)).decode('latin-1'))
+        if c == b'<':
+            if t[self.pos + 1:self.pos + 2] == b'<':
+                return self.__dictionnaire()
+            m = _HEXA.match(t, self.pos)
+            self.pos = m.end()
+            hexa = re.sub(rb'[^0-9A-Fa-f]', b'', m.group(1))
+            if len(hexa) % 2:
+                hexa += b'0'
+            return bytes.fromhex(hexa.decode('ascii'))
+        if c == b'[':
+            self.pos += 1
+            tableau = []
+            while True:
+                self.blancs()
+                if t[self.pos:self.pos + 1] == b']':
+                    self.pos += 1
+                    return tableau
+                tableau.append(self.objet())
+        if c == b'(':
+            return self.__chaine()
+
+        m = _REFERENCE.match(t, self.pos)
+        if m:
+            self.pos = m.end()
+            return Reference(int(m.group(1)), int(m.group(2)))
+        m = _NOMBRE.match(t, self.pos)
+        if m:
+            self.pos = m.end()
+            texte = m.group(0)
+            if b'.' in texte:
+                return float(texte)
+            return int(texte)
+        m = _MOT.match(t, self.pos)
+        if m:
+            self.pos = m.end()
+            mot = m.group(0)
+            if mot == b'true':
+                return True
+            if mot == b'false':
+                return False
+            if mot == b'null':
+                return None
+            raise ErreurPDF("Mot-clé inattendu : " + mot.decode('latin-1'))
+        raise ErreurPDF("Objet illisible à la position " + str(self.pos))
+
+    def __dictionnaire(self):
+        self.pos += 2
+        dico = {}
+        t = self.tampon
+        while True:
+            self.blancs()
+            if t[self.pos:self.pos + 2] == b'>>':
+                self.pos += 2
+                return dico
+            cle = self.objet()
+            if not isinstance(cle, Nom):
+                raise ErreurPDF("Clé de dictionnaire attendue à la "
+                                "position " + str(self.pos))
+            dico[str(cle)] = self.objet()
+
+    def __chaine(self):
+        t = self.tampon
+        i = self.pos + 1
+        niveau = 1
+        morceaux = []
+        debut = i
+        while True:
+            c = t[i]
+            if c == 0x5c:  # \
+                morceaux.append(t[debut:i])
+                s = t[i + 1]
+                if s in _ECHAPPEMENTS:
+                    morceaux.append(_ECHAPPEMENTS[s])
+                    i += 2
+                elif 0x30 <= s <= 0x37:
+                    j = i + 1
+                    while j < i + 4 and 0x30 <= t[j] <= 0x37:
+                        j += 1
+                    morceaux.append(bytes([int(t[i + 1:j], 8) & 0xff]))
+                    i = j
+                elif s == 0x0d:
+                    i += 3 if t[i + 2] == 0x0a else 2
+                elif s == 0x0a:
+                    i += 2
+                else:
+                    i += 1
+                debut = i
+                continue
+            if c == 0x28:
+                niveau += 1
+            elif c == 0x29:
+                niveau -= 1
+                if niveau == 0:
+                    morceaux.append(t[debut:i])
+                    self.pos = i + 1
+                    return b''.join(bytes(m) for m in morceaux)
+            i += 1
+
+
+def texte(chaine):
+    """Décode une chaîne PDF (UTF-16BE avec BOM, sinon PDFDocEncoding).
+
+    Le PDFDocEncoding est assimilé au Latin-1, identique pour les
+    caractères des formulaires.
+    """
+    if chaine[:2] == b'\xfe\xff':
+        return chaine[2:].decode('utf-16-be')
+    return chaine.decode('latin-1')
+
+
+def chaine(valeur):
+    """Encode un texte en chaîne PDF."""
+    try:
+        return valeur.encode('latin-1')
+    except UnicodeEncodeError:
+        return b'\xfe\xff' + valeur.encode('utf-16-be')
+
+
+class LecteurPDF(object):
+    def __init__(self, chemin):
+        self.chemin = chemin
+        self.__fichier = open(chemin, 'rb')
+        try:
+            self.tampon = mmap.mmap(self.__fichier.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
+        except ValueError:  # fichier vide
+            self.__fichier.close()
+            raise ErreurPDF("Fichier PDF vide : " + chemin)
+
+        # num -> (1, position, gen) ou (2, num du flux d'objets, rang)
+        self.xref = {}
+        self.trailer = {}
+        self.__objets = {}
+        self.__flux = {}
+
+        self.startxref = self.__startxref()
+        self.__references(self.startxref)
+        if 'Root' not in self.trailer:
+            raise ErreurPDF("Catalogue introuvable : " + chemin)
+        if 'Encrypt' in self.trailer:
+            raise ErreurPDF("PDF chiffré non pris en charge : " + chemin)
+
+    def ferme(self):
+        self.__objets = {}
+        self.__flux = {}
+        try:
+            self.tampon.close()
+        except BufferError:
+            # Des flux lus sont encore référencés : la projection sera
+            # libérée avec eux
+            pass
+        self.__fichier.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.ferme()
+
+    def taille(self):
+        return max(self.trailer.get('Size', 0),
+                   max(self.xref) + 1 if self.xref else 0)
+
+    def __startxref(self):
+        fin = self.tampon[max(0, len(self.tampon) - 1024):]
+        i = fin.rfind(b'startxref')
+        if i == -1:
+            raise ErreurPDF("startxref introuvable : " + self.chemin)
+        a = Analyseur(fin, i + len(b'startxref'))
+        return a.objet()
+
+    def __references(self, position):
+        vues = set()
+        while position is not None and position not in vues:
+            vues.add(position)
+            a = Analyseur(self.tampon, position)
+            a.blancs()
+            if self.tampon[a.pos:a.pos + 4] == b'xref':
+                trailer = self.__table(a)
+                # Fichier hybride : références en flux complémentaires
+                if 'XRefStm' in trailer:
+                    self.__fluxReferences(trailer['XRefStm'])
+            else:
+                trailer = self.__fluxReferences(position)
+            for cle, valeur in trailer.items():
+                self.trailer.setdefault(cle, valeur)
+            position = trailer.get('Prev')
+
+    def __table(self, a):
+        a.pos += 4
+        while True:
+            a.blancs()
+            if self.tampon[a.pos:a.pos + 7] == b'trailer':
+                a.pos += 7
+                return a.objet()
+            premier = a.objet()
+            nombre = a.objet()
+            a.blancs()
+            for i in range(nombre):
+                ligne = self.tampon[a.pos:a.pos + 20]
+                num = premier + i
+                if num not in self.xref and ligne[17:18] == b'n':
+                    self.xref[num] = (1, int(ligne[0:10]), int(ligne[11:16]))
+                a.pos += 20
+                a.blancs()
+
+    def __fluxReferences(self, position):
+        flux = self.__objetA(position)[1]
+        if not isinstance(flux, Flux):
+            raise ErreurPDF("Table des références illisible")
+        d = flux.dico
+        w = d['W']
+        index = d.get('Index', [0, d['Size']])
+        donnees = flux.donnees()
+        pos = 0
+        for k in range(0, len(index), 2):
+            for num in range(index[k], index[k] + index[k + 1]):
+                champs = []
+                for largeur in w:
+                    champs.append(int.from_bytes(donnees[pos:pos + largeur],
+                                                 'big') if largeur else None)
+                    pos += largeur
+                typ = 1 if champs[0] is None else champs[0]
+                if num not in self.xref and typ in (1, 2):
+                    self.xref[num] = (typ, champs[1], champs[2] or 0)
+        return d
+
+    def __objetA(self, position):
+        """(num, objet) de l'objet indirect écrit à position."""
+        m = _OBJET.match(self.tampon, position)
+        if m is None:
+            raise ErreurPDF("Objet introuvable à la position " +
+                            str(position))
+        a = Analyseur(self.tampon, m.end())
+        valeur = a.objet()
+        a.blancs()
+        if self.tampon[a.pos:a.pos + 6] == b'stream':
+            a.pos += 6
+            if self.tampon[a.pos:a.pos + 2] == b'\r\n':
+                a.pos += 2
+            elif self.tampon[a.pos:a.pos + 1] in (b'\n', b'\r'):
+                a.pos += 1
+            longueur = valeur.get('Length')
+            if isinstance(longueur, Reference):
+                longueur = self.objet(longueur.num)
+            fin = a.pos + longueur
+            if self.tampon[fin:fin + 20].lstrip(BLANCS)[:9] != b'endstream':
+                # Longueur erronée : recherche de endstream
+                fin = self.tampon.find(b'endstream', a.pos)
+                while fin > a.pos and self.tampon[fin - 1] in BLANCS:
+                    fin -= 1
+            # memoryview : pas de copie des gros flux (images)
+            valeur = Flux(valeur, memoryview(self.tampon)[a.pos:fin])
+        return int(m.group(1)), valeur
+
+    def objet(self, num):
+        """Objet indirect num (None s'il n'existe pas).
+
+        Les objets sont partagés avec le cache : les copier avant de les
+        modifier.
+        """
+        if num in self.__objets:
+            return self.__objets[num]
+
+        entree = self.xref.get(num)
+        if entree is None:
+            valeur = None
+        elif entree[0] == 1:
+            valeur = self.__objetA(entree[1])[1]
+        else:
+            valeur = self.__fluxObjets(entree[1]).get(num)
+        # Les flux ne sont pas gardés : ils sont relus dans la projection
+        # pour que la mémoire ne dépende pas de la taille des images
+        if not isinstance(valeur, Flux):
+            self.__objets[num] = valeur
+        return valeur
+
+    def __fluxObjets(self, num):
+        objets = self.__flux.get(num)
+        if objets is None:
+            flux = self.objet(num)
+            donnees = flux.donnees()
+            premier = flux.dico['First']
+            a = Analyseur(donnees)
+            entetes = [(a.objet(), a.objet())
+                       for _ in range(flux.dico['N'])]
+            objets = {}
+            for n, position in entetes:
+                objets[n] = Analyseur(donnees, premier + position).objet()
+            self.__flux[num] = objets
+        return objets
+
+    def resout(self, valeur):
+        """Valeur directe d'une référence (les autres objets inchangés)."""
+        while isinstance(valeur, Reference):
+            valeur = self.objet(valeur.num)
+        return valeur
+
+    def catalogue(self):
+        return self.resout(self.trailer['Root'])
+
+    def pages(self):
+        """Références des pages, dans l'ordre du document."""
+        pages = []
+        pile = [self.catalogue()['Pages']]
+        vus = set()
+        while pile:
+            ref = pile.pop()
+            if isinstance(ref, Reference):
+                if ref.num in vus:
+                    continue
+                vus.add(ref.num)
+            noeud = self.resout(ref)
+            if noeud.get('Type') == 'Pages' or 'Kids' in noeud:
+                pile.extend(reversed(noeud.get('Kids', [])))
+            else:
+                pages.append(ref)
+        return pages
+
+
+#
+# Écriture
+#
+def _echappe(donnees):
+    return donnees.replace(b'\\', b'\\\\').replace(b'(', b'\\(') \
+                  .replace(b')', b'\\)').replace(b'\r', b'\\r')
+
+
+def _nom(nom):
+    sortie = bytearray(b'/')
+    for c in nom.encode('utf-8'):
+        if c < 0x21 or c > 0x7e or c in DELIMITEURS or c == 0x23:
+            sortie += b'#%02X' % c
+        else:
+            sortie.append(c)
+    return bytes(sortie)
+
+
+def ecrit(valeur):
+    """Sérialise un objet PDF (hors flux) en bytes."""
+    if isinstance(valeur, bool):
+        return b'true' if valeur else b'false'
+    if valeur is None:
+        return b'null'
+    if isinstance(valeur, Reference):
+        return b'%d %d R' % valeur
+    if isinstance(valeur, Nom):
+        return _nom(valeur)
+    if isinstance(valeur, int):
+        return b'%d' % valeur
+    if isinstance(valeur, float):
+        return ('%.6f' % valeur).rstrip('0').rstrip('.').encode('ascii') \
+            or b'0'
+    if isinstance(valeur, (bytes, bytearray, memoryview)):
+        return b'(' + _echappe(bytes(valeur)) + b')'
+    if isinstance(valeur, str):
+        return b'(' + _echappe(chaine(valeur)) + b')'
+    if isinstance(valeur, list):
+        return b'[' + b' '.join(ecrit(v) for v in valeur) + b']'
+    if isinstance(valeur, dict):
+        return b'<<' + b''.join(_nom(k) + b' ' + ecrit(v)
+                                for k, v in valeur.items()) + b'>>'
+    raise ErreurPDF("Objet non sérialisable : " + repr(valeur))
+
+
+class EcrivainPDF(object):
+    """Écrit des objets indirects en flux et tient la table des positions.
+
+    :param sortie: Fichier ouvert en écriture binaire.
+    :param position: Position de départ dans le fichier (mise à jour
+        incrémentale à la suite d'un PDF existant).
+    """
+
+    def __init__(self, sortie, position=0):
+        self.sortie = sortie
+        self.position = position
+        self.positions = {}
+
+    def brut(self, donnees):
+        self.sortie.write(donnees)
+        self.position += len(donnees)
+
+    def objet(self, num, valeur, gen=0):
+        self.positions[num] = (self.position, gen)
+        if isinstance(valeur, Flux):
+            dico = dict(valeur.dico)
+            dico['Length'] = len(valeur.brut)
+            self.brut(b'%d %d obj\n' % (num, gen) + ecrit(dico) +
+                      b'\nstream\n')
+            self.brut(valeur.brut)
+            self.brut(b'\nendstream\nendobj\n')
+        else:
+            self.brut(b'%d %d obj\n' % (num, gen) + ecrit(valeur) +
+                      b'\nendobj\n')
+
+    def references(self, taille, trailer):
+        """Table des références en flux (avec trailer) et fin de fichier.
+
+        :param taille: Premier numéro libre, réservé au flux lui-même.
+        """
+        num = taille
+        self.positions[num] = (self.position, 0)
+        nums = sorted(self.positions)
+        index = []
+        lignes = []
+        for n in nums:
+            if index and index[-2] + index[-1] == n:
+                index[-1] += 1
+            else:
+                index += [n, 1]
+            position, gen = self.positions[n]
+            lignes.append(b'\x01' + position.to_bytes(5, 'big') +
+                          gen.to_bytes(2, 'big'))
+        dico = dict(trailer)
+        dico.update({'Type': Nom('XRef'), 'Size': taille + 1,
+                     'W': [1, 5, 2], 'Index': index,
+                     'Filter': Nom('FlateDecode')})
+        position = self.position
+        self.objet(num, Flux(dico, zlib.compress(b''.join(lignes))))
+        self.brut(b'startxref\n%d\n%%%%EOF\n' % position)
+
+
+#
+# Remplissage des formulaires (AcroForm)
+#
+RADIO = 1 << 15
+MULTILIGNE = 1 << 12
+PEIGNE = 1 << 24
+
+_DA = re.compile(rb'/([^\x00\t\n\x0c\r ()<>\[\]{}/%]+)[\x00\t\n\x0c\r ]+'
+                 rb'([\d.]+)[\x00\t\n\x0c\r ]+Tf')
+
+
+class FormulairePDF(object):
+    """Champs d'un formulaire PDF, remplis par mise à jour incrémentale.
+
+    Le modèle n'est jamais réécrit : les objets des champs modifiés et
+    leurs apparences sont ajoutés à la suite d'une copie du fichier.
+    """
+
+    def __init__(self, chemin):
+        self.chemin = chemin
+        self.lecteur = LecteurPDF(chemin)
+        catalogue = self.lecteur.catalogue()
+        self.acroform = self.lecteur.resout(catalogue.get('AcroForm', {}))
+        ressources = self.lecteur.resout(self.acroform.get('DR', {}))
+        self.polices = self.lecteur.resout(ressources.get('Font', {}))
+        # nom complet -> (num du champ, [num des widgets])
+        self.champs = {}
+        for ref in self.lecteur.resout(self.acroform.get('Fields', [])):
+            self.__parcourt(ref, '')
+
+    def __parcourt(self, ref, parent):
+        champ = self.lecteur.resout(ref)
+        nom = parent
+        if 'T' in champ:
+            nom = texte(champ['T'])
+            if parent:
+                nom = parent + '.' + nom
+        kids = self.lecteur.resout(champ.get('Kids', []))
+        if any('T' in self.lecteur.resout(k) for k in kids):
+            for k in kids:
+                self.__parcourt(k, nom)
+        else:
+            widgets = [k.num for k in kids] or [ref.num]
+            self.champs[nom] = (ref.num, widgets)
+
+    def __herite(self, num, cle):
+        """Attribut éventuellement hérité des champs parents."""
+        objet = self.lecteur.objet(num)
+        while objet is not None:
+            if cle in objet:
+                return self.lecteur.resout(objet[cle])
+            objet = self.lecteur.resout(objet.get('Parent'))
+        return None
+
+    def remplit(self, valeurs, sortie):
+        """Écrit dans sortie le formulaire rempli.
+
+        :param valeurs: Triplets (nom, rang, valeur) : texte
+            pour une zone de texte, rang de l'option pour une liste, True
+            pour cocher le bouton de rang donné (case ou bouton radio).
+        :type valeurs: list
+        """
+        modifies = {}
+        nouveaux = []
+        taille = self.lecteur.taille()
+
+        def objet(num):
+            if num not in modifies:
+                modifies[num] = dict(self.lecteur.objet(num))
+            return modifies[num]
+
+        for nom, rang, valeur in valeurs:
+            if nom not in self.champs:
+                continue
+            num, widgets = self.champs[nom]
+            typ = self.__herite(num, 'FT')
+            ff = self.__herite(num, 'Ff') or 0
+
+            if typ == 'Btn':
+                if valeur is not True or rang >= len(widgets):
+                    continue
+                etat = self.__etatActif(widgets[rang])
+                if etat is None:
+                    continue
+                objet(num)['V'] = Nom(etat)
+                for i, w in enumerate(widgets):
+                    if i == rang:
+                        objet(w)['AS'] = Nom(etat)
+                    elif ff & RADIO:
+                        objet(w)['AS'] = Nom('Off')
+                continue
+
+            if typ == 'Ch':
+                options = self.lecteur.resout(self.__herite(num, 'Opt')) or []
+                if isinstance(valeur, int):
+                    if valeur >= len(options):
+                        continue
+                    option = self.lecteur.resout(options[valeur])
+                    objet(num)['I'] = [valeur]
+                else:
+                    option = chaine(valeur)
+                    objet(num).pop('I', None)
+                if isinstance(option, list):  # [valeur exportée, affichée]
+                    objet(num)['V'] = option[0]
+                    affiche = texte(option[1])
+                else:
+                    objet(num)['V'] = option
+                    affiche = texte(option)
+            elif typ == 'Tx':
+                objet(num)['V'] = chaine(valeur)
+                affiche = valeur
+            else:
+                continue
+
+            for w in widgets:
+                flux = self.__apparence(w, num, affiche, ff)
+                if flux is not None:
+                    nouveaux.append(flux)
+                    ap = dict(self.lecteur.resout(
+                        objet(w).get('AP', {})))
+                    ap['N'] = Reference(taille + len(nouveaux) - 1, 0)
+                    ap.pop('D', None)
+                    objet(w)['AP'] = ap
+
+        with open(sortie, 'wb') as f:
+            with open(self.chemin, 'rb') as modele:
+                shutil.copyfileobj(modele, f)
+            ecrivain = EcrivainPDF(f, f.tell())
+            ecrivain.brut(b'\n')
+            for num in sorted(modifies):
+                entree = self.lecteur.xref.get(num, (2, 0, 0))
+                ecrivain.objet(num, modifies[num],
+                               entree[2] if entree[0] == 1 else 0)
+            for i, flux in enumerate(nouveaux):
+                ecrivain.objet(taille + i, flux)
+
+            trailer = {'Root': self.lecteur.trailer['Root'],
+                       'Prev': self.lecteur.startxref}
+            for cle in ('Info', 'ID'):
+                if cle in self.lecteur.trailer:
+                    trailer[cle] = self.lecteur.trailer[cle]
+            ecrivain.references(taille + len(nouveaux), trailer)
+        return sortie
+
+    def __etatActif(self, num):
+        widget = self.lecteur.objet(num)
+        ap = self.lecteur.resout(widget.get('AP', {}))
+        etats = self.lecteur.resout(ap.get('N', {}))
+        if not isinstance(etats, dict):
+            return None
+        for etat in etats:
+            if etat != 'Off':
+                return etat
+        return None
+
+    def __apparence(self, widget, num, valeur, ff):
+        """Flux d'apparence d'une zone de texte ou d'une liste."""
+        w = self.lecteur.objet(widget)
+        rect = [float(c) for c in self.lecteur.resout(w.get('Rect'))]
+        largeur, hauteur = abs(rect[2] - rect[0]), abs(rect[3] - rect[1])
+
+        da = w.get('DA') or self.__herite(num, 'DA') or \
+            self.acroform.get('DA', b'/Helv 0 Tf 0 g')
+        m = _DA.search(da)
+        if m is None:
+            return None
+        police = m.group(1).decode('latin-1')
+        taille = float(m.group(2))
+        couleur = da[m.end():].strip() or b'0 g'
+        refPolice = self.polices.get(police)
+        if refPolice is None:
+            return None
+        dicoPolice = self.lecteur.resout(refPolice)
+        codage = 'cp1252' if dicoPolice.get('Encoding') == \
+            'WinAnsiEncoding' else 'latin-1'
+        octets = valeur.encode(codage, 'replace')
+        chasses = self.__chasses(dicoPolice)
+        q = self.__herite(num, 'Q') or 0
+        maxLen = self.__herite(num, 'MaxLen')
+
+        def mesure(o, corps):
+            return sum(chasses.get(c, 556) for c in o) * corps / 1000.
+
+        if ff & MULTILIGNE:
+            corps = taille or 9.
+            lignes = self.__coupe(octets, largeur - 4, corps, mesure)
+        else:
+            corps = taille or min(12., (hauteur - 2.) / 1.15)
+            if taille == 0 and octets:
+                corps = min(corps, corps * (largeur - 4.) /
+                            max(mesure(octets, corps), 1.))
+            lignes = [octets]
+
+        contenu = [b'/Tx BMC', b'q',
+                   b'1 1 %s %s re W n' % (ecrit(largeur - 2.),
+                                          ecrit(hauteur - 2.)),
+                   b'BT', _nom(police) + b' ' + ecrit(corps) + b' Tf',
+                   couleur]
+        if ff & PEIGNE and maxLen and not ff & MULTILIGNE:
+            # Un caractère centré par case
+            case = largeur / maxLen
+            y = (hauteur - corps * 0.7) / 2.
+            x0 = 0.
+            for i, c in enumerate(octets[:maxLen]):
+                x = case * i + (case - mesure(bytes([c]), corps)) / 2.
+                contenu.append(b'%s %s Td (%s) Tj' % (
+                    ecrit(x - x0), ecrit(y), _echappe(bytes([c]))))
+                x0, y = x, 0.
+        else:
+            interligne = corps * 1.15
+            if len(lignes) == 1:
+                y = (hauteur - corps * 0.7) / 2.
+            else:
+                y = hauteur - 2. - corps
+            x0 = 0.
+            for ligne in lignes:
+                libre = largeur - 4. - mesure(ligne, corps)
+                x = 2. + (libre / 2. if q == 1 else libre if q == 2 else 0.)
+                contenu.append(b'%s %s Td (%s) Tj' % (
+                    ecrit(x - x0), ecrit(y), _echappe(ligne)))
+                x0, y = x, -interligne
+        contenu += [b'ET', b'Q', b'EMC']
+
+        return Flux({'Type': Nom('XObject'), 'Subtype': Nom('Form'),
+                     'BBox': [0, 0, largeur, hauteur],
+                     'Resources': {'Font': {police: refPolice}}},
+                    b'\n'.join(contenu))
+
+    def __chasses(self, police):
+        """Chasse (1/1000 de corps) de chaque code de la police."""
+        largeurs = self.lecteur.resout(police.get('Widths'))
+        if not largeurs:
+            return {}
+        premier = police.get('FirstChar', 0)
+        return {premier + i: self.lecteur.resout(l)
+                for i, l in enumerate(largeurs)}
+
+    @staticmethod
+    def __coupe(octets, largeur, corps, mesure):
+        lignes = []
+        for paragraphe in octets.split(b'\n'):
+            ligne = b''
+            for mot in paragraphe.split(b' '):
+                essai = ligne + b' ' + mot if ligne else mot
+                if ligne and mesure(essai, corps) > largeur:
+                    lignes.append(ligne)
+                    ligne = mot
+                else:
+                    ligne = essai
+            lignes.append(ligne)
+        return lignes
+
+
+# Modèles déjà analysés, par chemin
+_formulaires = {}
+
+
+def remplitFormulaire(modele, valeurs, sortie):
+    """Remplit le formulaire PDF modele dans sortie (voir remplit)."""
+    formulaire = _formulaires.get(modele)
+    if formulaire is None:
+        formulaire = FormulairePDF(modele)
+        _formulaires[modele] = formulaire
+    return formulaire.remplit(valeurs, sortie)
+
+
+#
+# Fusion
+#
+# Attributs des pages hérités de l'arborescence
+HERITES = ('Resources', 'MediaBox', 'CropBox', 'Rotate')
+
+
+def fusionne(entrees, sortie):
+    """Concatène les pages des PDF entrees dans sortie.
+
+    Les objets sont recopiés tels quels (les flux ne sont ni décodés ni
+    recompressés) et écrits au fur et à mesure : un seul fichier d'entrée
+    est ouvert à la fois et seuls ses objets non-flux restent en mémoire.
+    """
+    with open(sortie, 'wb') as f:
+        ecrivain = EcrivainPDF(f)
+        ecrivain.brut(b'%PDF-1.6\n%\xe2\xe3\xcf\xd3\n')
+        # 1 : catalogue, 2 : arborescence des pages
+        prochain = [3]
+        kids = []
+        champs = []
+        acroform = None
+
+        for entree in entrees:
+            with LecteurPDF(entree) as lecteur:
+                numeros = {}
+                pile = []
+
+                def numero(ancien):
+                    if ancien not in numeros:
+                        numeros[ancien] = prochain[0]
+                        prochain[0] += 1
+                        pile.append(ancien)
+                    return numeros[ancien]
+
+                def renumerote(valeur):
+                    if isinstance(valeur, Reference):
+                        return Reference(numero(valeur.num), 0)
+                    if isinstance(valeur, dict):
+                        return {k: renumerote(v) for k, v in valeur.items()}
+                    if isinstance(valeur, list):
+                        return [renumerote(v) for v in valeur]
+                    return valeur
+
+                pages = {}
+                for ref in lecteur.pages():
+                    page = dict(lecteur.resout(ref))
+                    for cle in HERITES:
+                        if cle not in page:
+                            valeur = lecteur.resout(page.get('Parent'))
+                            while valeur is not None and cle not in valeur:
+                                valeur = lecteur.resout(valeur.get('Parent'))
+                            if valeur is not None:
+                                page[cle] = valeur[cle]
+                    # Rattachée à l'arborescence de sortie après
+                    # renumérotation : l'ancienne n'est pas recopiée
+                    page.pop('Parent', None)
+                    pages[ref.num] = page
+                    kids.append(Reference(numero(ref.num), 0))
+
+                formulaire = lecteur.resout(
+                    lecteur.catalogue().get('AcroForm'))
+                if formulaire:
+                    champs += renumerote(lecteur.resout(
+                        formulaire.get('Fields', [])))
+                    if acroform is None:
+                        acroform = renumerote(
+                            {k: v for k, v in formulaire.items()
+                             if k != 'Fields'})
+
+                while pile:
+                    ancien = pile.pop()
+                    page = pages.pop(ancien, None)
+                    valeur = page or lecteur.objet(ancien)
+                    if isinstance(valeur, Flux):
+                        dico = dict(valeur.dico)
+                        dico.pop('Length', None)
+                        valeur = Flux(renumerote(dico), valeur.brut)
+                    else:
+                        valeur = renumerote(valeur)
+                    if page is not None:
+                        valeur['Parent'] = Reference(2, 0)
+                    ecrivain.objet(numeros[ancien], valeur)
+                    valeur = None
+
+        ecrivain.objet(2, {'Type': Nom('Pages'), 'Kids': kids,
+                           'Count': len(kids)})
+        catalogue = {'Type': Nom('Catalog'), 'Pages': Reference(2, 0)}
+        if acroform is not None:
+            acroform['Fields'] = champs
+            catalogue['AcroForm'] = acroform
+        ecrivain.objet(1, catalogue)
+        ecrivain.references(prochain[0], {'Root': Reference(1, 0)})
+    return sortie
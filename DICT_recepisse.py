@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DICT_recepisse
+                                 A QGIS plugin
+ DICT
+                             -------------------
+        begin                : 2015-08-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2015 by Loïc BARTOLETTI
+        email                : lbartoletti@tuxfamily.org
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+
+ Rendu du récépissé à partir du modèle QPT, indépendant de l'assistant
+ pour pouvoir être exécuté dans un processus de rendu (traitement par lot).
+"""
+
+from PyQt5.QtCore import QSettings, QDir, QSizeF
+from PyQt5.QtGui import QPainter
+from PyQt5.QtPrintSupport import QPrinter
+from PyQt5.QtXml import QDomDocument
+from qgis.core import (QgsProject, QgsLayout, QgsLayoutItemLabel,
+                       QgsReadWriteContext)
+
+from .DICT_substitution import Gabarit
+
+import os
+
+
+def cheminRecepisse(titre):
+    """Chemin de sortie du récépissé d'après /DICT/configRep."""
+    out_dir = QSettings().value("/DICT/configRep")
+    if QDir(out_dir).exists() is False or out_dir is None:
+        out_dir = str(QDir.homePath())
+
+    return os.path.join(out_dir,
+                        QSettings().value("/DICT/prefRecep", "") +
+                        titre +
+                        QSettings().value("/DICT/sufRecep", "") +
+                        ".pdf")
+
+
+# Mise en page du récépissé et ses labels à remplir, chargées une seule
+# fois par processus puis réutilisées pour chaque récépissé. Comme toute
+# mise en page, elle n'est utilisée que dans le fil de l'interface.
+_projet = None
+_layout = None
+_labels = None
+
+
+def layoutQGis():
+    """Mise en page du modèle QPT et ses labels à remplir.
+
+    :returns: (layout, [(label, Gabarit du texte)])
+    """
+    global _projet, _layout, _labels
+    if _layout is None:
+        path = os.path.join(os.path.dirname(__file__), "formulaire_pdf")
+        with open(os.path.join(path, "Formulaire_DICT.qpt"), 'rb') as f:
+            contenu = f.read()
+
+        # Image du CERFA
+        contenu = contenu.replace(b"CHEMIN_VERS_IMAGE",
+                                  path.replace('\\', '/').encode('utf-8'))
+
+        document = QDomDocument()
+        document.setContent(contenu)
+
+        projet = QgsProject()
+        layout = QgsLayout(projet)
+        # adding to existing items
+        layout.loadFromTemplate(document, QgsReadWriteContext(), False)
+
+        # Labels contenant des champs {{Nom}}
+        labels = []
+        for item in layout.items():
+            if isinstance(item, QgsLayoutItemLabel):
+                gabarit = Gabarit(item.text())
+                if gabarit:
+                    labels.append((item, gabarit))
+
+        _projet, _layout, _labels = projet, layout, labels
+    return _layout, _labels
+
+
+def formulaireQGis(layout, out):
+    """Imprime dans out la mise en page d'un récépissé."""
+    printer = QPrinter()
+    printer.setOutputFormat(QPrinter.PdfFormat)
+
+    printer.setOutputFileName(out)
+    printer.setPaperSize(QSizeF(210,297), #format du formulaire.pdf actuellement utilisé en template, à changer si nécéssaire
+                         QPrinter.Millimeter)
+    printer.setFullPage(True)
+    printer.setColorMode(QPrinter.Color)
+    printer.setResolution(300) #idem que ligne 517
+
+    pdfPainter = QPainter(printer)
+    paperRectMM = printer.pageRect(QPrinter.Millimeter)
+    paperRectPixel = printer.pageRect(QPrinter.DevicePixel)
+    layout.render(pdfPainter, paperRectPixel, paperRectMM)
+    pdfPainter.end()
+
+    return out
+
+
+def recepisseQGis(valeurs, out):
+    """Remplit les labels de la mise en page et l'imprime dans out.
+
+    :param valeurs: Valeur de chaque champ {{Nom}} du modèle, fournies par
+        DICTDialogWizard.valeursQGis.
+    :type valeurs: dict
+    """
+    layout, labels = layoutQGis()
+    for label, gabarit in labels:
+        label.setText(gabarit.rend(valeurs))
+
+    return formulaireQGis(layout, out)
+
+
+# Application QGIS hors écran propre à chaque processus de rendu
+_application = None
+
+
+def initProcessus(prefixe):
+    """Initialise QGIS dans un processus de rendu du traitement par lot."""
+    global _application
+    from qgis.core import QgsApplication
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    QgsApplication.setPrefixPath(prefixe, True)
+    _application = QgsApplication([], True)
+    _application.initQgis()
+
+
+def rendProcessus(valeurs, out):
+    """Point d'entrée d'un processus de rendu : renvoie le PDF créé."""
+    return recepisseQGis(valeurs, out)
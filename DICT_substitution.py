@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+ Substitution des champs {{Nom}} d'un modèle en un seul passage.
+
+ Le modèle est découpé une fois pour toutes en morceaux de texte fixe et
+ en champs ; chaque rendu n'est plus qu'une jointure. Les délimiteurs
+ évitent de remplacer un nom contenu dans un autre (Ref1 et Ref1x,
+ EditionPlan1 et JourEditionPlan1).
+"""
+
+import re
+
+JETON = re.compile(r'\{\{(\w+)\}\}')
+
+
+class Gabarit(object):
+    def __init__(self, texte):
+        # Morceaux fixes aux indices pairs, noms des champs aux impairs
+        self.__morceaux = JETON.split(texte)
+        self.noms = self.__morceaux[1::2]
+
+    def __bool__(self):
+        return len(self.noms) > 0
+
+    def rend(self, valeurs):
+        """Texte du modèle, les champs absents de valeurs étant vidés."""
+        morceaux = self.__morceaux[:]
+        for i in range(1, len(morceaux), 2):
+            morceaux[i] = valeurs.get(morceaux[i], "")
+        return ''.join(morceaux)
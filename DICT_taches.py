@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DICT_taches
+                                 A QGIS plugin
+ DICT
+                             -------------------
+        begin                : 2015-08-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2015 by Loïc BARTOLETTI
+        email                : lbartoletti@tuxfamily.org
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+
+ Tâches QGIS (QgsTask) exécutées en arrière-plan par le plugin, et export
+ des plans qui reste dans le fil de l'interface.
+"""
+
+from PyQt5.QtCore import Qt, QCoreApplication
+from PyQt5.QtWidgets import QProgressDialog
+from qgis.core import QgsLayoutExporter, QgsTask
+
+from .DICT_fusion import fusionPDF
+
+import os
+
+
+class ExportPlan(object):
+    def __init__(self, layout, pdf, couverture=None, cache=None,
+                 couches=None):
+        """Export d'une mise en page en PDF.
+
+        Le rendu d'une mise en page n'est pas sûr hors du fil de
+        l'interface : l'export est fait par exporte(), dans ce fil.
+
+        :param layout: Copie de la mise en page (QgsPrintLayout.clone) :
+            la mise en page du projet n'est pas touchée.
+        :type layout: QgsPrintLayout
+
+        :param pdf: Chemin du PDF à écrire.
+        :type pdf: str
+
+        :param couverture: Feuilles d'un plan découpé, qui pilotent
+            l'atlas de la mise en page. Toutes les feuilles sont écrites
+            dans le même PDF.
+        :type couverture: QgsVectorLayer
+
+        :param cache: Rendu des couches fixes par le cache du plan.
+        :type cache: DICT_cache.PlanEnCache
+
+        :param couches: Copies des couches filtrées sur l'emprise, que la
+            carte de la mise en page affiche à la place des couches du
+            projet.
+        :type couches: list
+        """
+        self.layout = layout
+        self.pdf = pdf
+        self.couverture = couverture
+        self.cache = cache
+        self.couches = couches or []
+        self.erreur = None
+
+    def exporte(self):
+        """Écrit le PDF, renvoie False en cas d'erreur (attribut erreur)."""
+        # Un PDF laissé par une déclaration précédente ne doit pas passer
+        # pour le plan exporté
+        try:
+            if os.path.exists(self.pdf):
+                os.remove(self.pdf)
+        except OSError as e:
+            self.erreur = str(e)
+            return False
+
+        settings = QgsLayoutExporter.PdfExportSettings()
+        if self.couverture is not None:
+            resultat, erreur = QgsLayoutExporter.exportToPdf(
+                self.layout.atlas(), self.pdf, settings)
+            if resultat != QgsLayoutExporter.Success:
+                self.erreur = erreur or str(resultat)
+                return False
+            return True
+
+        exporter = QgsLayoutExporter(self.layout)
+        try:
+            if self.cache is not None:
+                self.cache.applique()
+            resultat = exporter.exportToPdf(self.pdf, settings)
+        except Exception as e:
+            self.erreur = str(e)
+            return False
+        finally:
+            if self.cache is not None:
+                self.cache.nettoie()
+        if resultat != QgsLayoutExporter.Success:
+            self.erreur = exporter.errorFile() or str(resultat)
+            return False
+        return True
+
+
+def exportePlans(plans, titre=None):
+    """Exporte les plans l'un après l'autre, dans le fil de l'interface.
+
+    :param plans: Exports préparés par DICT_geometrie.preparePlans.
+    :type plans: list
+
+    :param titre: Texte de la barre de progression, avec un bouton
+        d'annulation. Sans titre (traitement par lot), aucune fenêtre
+        n'est affichée.
+    :type titre: str
+
+    :return: False si l'export a été annulé.
+    """
+    progression = None
+    if titre is not None and len(plans) > 0:
+        progression = QProgressDialog(titre, "Annuler", 0, len(plans))
+        progression.setWindowModality(Qt.WindowModal)
+        progression.setMinimumDuration(0)
+
+    try:
+        for i, plan in enumerate(plans):
+            if progression is not None:
+                progression.setValue(i)
+                QCoreApplication.processEvents()
+                if progression.wasCanceled():
+                    return False
+            plan.exporte()
+    finally:
+        if progression is not None:
+            progression.close()
+    return True
+
+
+class TacheRecepisse(QgsTask):
+    def __init__(self, titre, rendu):
+        """Impression du récépissé.
+
+        :param rendu: Fonction d'impression relevée dans l'assistant
+            (DICTDialogWizard.rendu), qui renvoie le chemin du PDF.
+        :type rendu: function
+        """
+        super(TacheRecepisse, self).__init__(
+            "Récépissé " + titre, QgsTask.CanCancel)
+        self.rendu = rendu
+        self.pdf = None
+        self.erreur = None
+
+    def run(self):
+        try:
+            self.pdf = self.rendu()
+        except Exception as e:
+            self.erreur = str(e)
+            return False
+        if not self.pdf or not os.path.exists(self.pdf):
+            self.erreur = "Récépissé non créé"
+            return False
+        return not self.isCanceled()
+
+
+class TacheDeclaration(QgsTask):
+    def __init__(self, titre, recepisse, plans, rappel):
+        """Traitement d'une déclaration après l'assistant.
+
+        Le récépissé est une sous-tâche ; la fusion des PDF est faite
+        ensuite par cette tâche.
+
+        :param recepisse: Tâche d'impression du récépissé.
+        :type recepisse: TacheRecepisse
+
+        :param plans: Plans exportés au préalable (exportePlans).
+        :type plans: list
+
+        :param rappel: Fonction appelée dans le fil de l'interface avec la
+            tâche terminée (attributs sorties et erreur).
+        :type rappel: function
+        """
+        super(TacheDeclaration, self).__init__(
+            "Traitement de la déclaration " + titre, QgsTask.CanCancel)
+        self.titre = titre
+        self.recepisse = recepisse
+        self.plans = plans
+        self.rappel = rappel
+        self.sorties = []
+        self.fusion = False
+        self.erreur = None
+
+        self.addSubTask(recepisse, [], QgsTask.ParentDependsOnSubTask)
+
+    def run(self):
+        pdf = self.recepisse.pdf
+        planPDF = [t.pdf for t in self.plans]
+        if len(planPDF) == 0:
+            self.erreur = "Aucun plan sélectionné (récépissé : " + pdf + ")"
+            return False
+        erreurs = [p.erreur for p in self.plans if p.erreur]
+        if erreurs:
+            self.erreur = ", ".join(erreurs)
+            return False
+        if not all(os.path.exists(p) for p in planPDF):
+            self.erreur = "Plans non créés"
+            return False
+        self.setProgress(90)
+
+        try:
+            envoi = fusionPDF(self.titre, pdf, planPDF, interactif=False)
+        except Exception as e:
+            self.erreur = str(e)
+            return False
+
+        self.fusion = envoi is not None
+        self.sorties = [envoi] if self.fusion else [pdf] + planPDF
+        return True
+
+    def finished(self, result):
+        if not result and self.erreur is None:
+            self.erreur = self.recepisse.erreur or "Annulé"
+        self.rappel(self)
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ DICT_ui
+                                 A QGIS plugin
+ DICT
+                             -------------------
+        begin                : 2015-08-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2015 by Loïc BARTOLETTI
+        email                : lbartoletti@tuxfamily.org
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+
+ Classes des fichiers .ui compilées une fois et gardées sur disque.
+
+ uic.loadUiType analyse et compile le .ui à chaque import du module du
+ dialogue. Ici le code Python généré est compilé en bytecode et écrit dans
+ __pycache__/ui sous un nom qui porte l'empreinte du .ui : tant que le .ui
+ ne change pas, la classe est relue directement.
+"""
+
+from PyQt5 import uic, QtWidgets
+from xml.etree import ElementTree
+
+import hashlib
+import io
+import marshal
+import os
+import sys
+import types
+
+CACHE = os.path.join(os.path.dirname(__file__), '__pycache__', 'ui')
+# Version du contenu du cache, dans la clé des fichiers
+FORMAT = 2
+
+
+def _widgets(contenu):
+    """Nom et classe des widgets du .ui, dans l'ordre du fichier."""
+    return [(w.get('name'), w.get('class'))
+            for w in ElementTree.fromstring(contenu).iter('widget')]
+
+
+def _compile(ui, contenu, chemin, options):
+    """Écrit le bytecode du .ui, sans laisser de fichier partiel."""
+    source = io.StringIO()
+    uic.compileUi(ui, source, **options)
+    # Classe Qt du widget principal (QDialog...), comme uic.loadUiType,
+    # et widgets du formulaire, relevés ici une fois pour toutes
+    base = ElementTree.fromstring(contenu).find('widget').get('class')
+    source.write("\n_BASE = {!r}\n".format(base))
+    source.write("_WIDGETS = {!r}\n".format(_widgets(contenu)))
+    code = compile(source.getvalue(), ui, 'exec')
+
+    os.makedirs(CACHE, exist_ok=True)
+    temporaire = chemin + '.' + str(os.getpid())
+    with open(temporaire, 'wb') as f:
+        marshal.dump(code, f)
+    os.replace(temporaire, chemin)
+
+    # Les versions précédentes du même .ui, pour le même interpréteur, ne
+    # servent plus. Les autres interpréteurs (cache_tag) et les fichiers
+    # temporaires d'autres processus sont laissés.
+    suffixe = '.' + sys.implementation.cache_tag + '.bin'
+    module = os.path.basename(chemin)[:-len(suffixe)]
+    nom = module.rsplit('_', 1)[0]
+    for ancien in os.listdir(CACHE):
+        if not ancien.endswith(suffixe):
+            continue
+        autre = ancien[:-len(suffixe)]
+        if autre != module and autre.rsplit('_', 1)[0] == nom:
+            try:
+                os.remove(os.path.join(CACHE, ancien))
+            except OSError:
+                pass
+    return code
+
+
+def loadUiType(ui, **options):
+    """Comme uic.loadUiType, avec la classe compilée gardée sur disque.
+
+    :param ui: Chemin du fichier .ui.
+    :type ui: str
+
+    :param options: Options de uic.compileUi (resource_suffix...).
+
+    :return: Classe du formulaire et classe Qt de base. L'attribut
+        WIDGETS de la classe du formulaire donne le nom et la classe de
+        ses widgets, dans l'ordre du .ui.
+    """
+    with open(ui, 'rb') as f:
+        contenu = f.read()
+    nom = os.path.splitext(os.path.basename(ui))[0]
+    cle = hashlib.sha1(contenu + repr((FORMAT, sorted(options.items())))
+                       .encode())
+    module = nom + '_' + cle.hexdigest()[:16]
+    chemin = os.path.join(
+        CACHE, module + '.' + sys.implementation.cache_tag + '.bin')
+
+    try:
+        try:
+            with open(chemin, 'rb') as f:
+                code = marshal.load(f)
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            code = _compile(ui, contenu, chemin, options)
+    except (IOError, OSError):
+        # Répertoire en lecture seule : compilation en mémoire, comme avant
+        forme, base = uic.loadUiType(ui, **options)
+        forme.WIDGETS = _widgets(contenu)
+        return forme, base
+
+    mod = types.ModuleType(module)
+    exec(code, mod.__dict__)
+    classes = [getattr(mod, n) for n in dir(mod) if n.startswith('Ui_')]
+    classes[0].WIDGETS = mod._WIDGETS
+    return classes[0], getattr(QtWidgets, mod._BASE)
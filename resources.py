@@ -2,9102 +2,13 @@
 
 # Resource object code
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.13.2)
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
 #
 # WARNING! All changes made in this file will be lost!
 
 from PyQt5 import QtCore
 
 qt_resource_data = b"\
-\x00\x01\x1a\xed\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x7c\x00\x00\x01\x7c\x08\x06\x00\x00\x00\xcc\xe7\x00\xca\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x20\x00\x49\x44\x41\x54\x78\x9c\xec\
-\x9d\x07\x78\x14\xd5\xda\xc7\xb3\x09\x1d\xac\xa0\xa8\xd7\x82\x05\
-\x95\x0e\x69\xf4\x5e\xa4\x0a\x84\x1e\x5a\x12\xd2\x93\x6d\xd9\xde\
-\x6b\x7a\x00\x41\x6c\xf7\xda\xf5\xaa\xd7\xcf\xee\xb5\xb7\xeb\xb5\
-\x97\xab\x62\x03\x44\x44\x51\x51\x7a\x87\x14\x92\xf7\x7b\xcf\x99\
-\x99\xcd\xec\xee\xcc\x96\x14\x12\x70\xde\x27\xff\x67\x37\x33\x67\
-\xce\x9c\xfa\x3b\xef\x9c\x39\x33\x1b\x13\x23\x99\x64\x92\x49\x26\
-\x99\x64\x92\x49\x26\x99\x64\x92\x49\x26\x99\x64\x92\x49\x26\x99\
-\x64\x92\x49\x26\x99\x64\x92\x49\x26\x99\x64\x92\x49\x26\x99\x64\
-\x92\x49\x26\x99\x64\x92\x49\x26\x99\x64\x92\x49\x26\x99\x64\x92\
-\x49\x26\x99\x64\x92\x49\x26\x99\x64\x92\x49\x26\x99\x64\x92\x49\
-\x26\x99\x64\x92\x49\x26\x99\x64\x92\x49\x26\x99\x64\x92\x49\x26\
-\x99\x64\x92\x49\x26\x99\x64\x92\x49\x26\x99\x64\x92\x49\x26\x99\
-\x64\x92\x49\x26\x99\x64\x92\x49\x26\x99\x64\x92\xc5\xc8\x64\xf8\
-\x27\x8b\x89\x8d\x8d\x0d\x27\x59\x1b\x29\x64\xba\x30\x00\xcd\x83\
-\x64\x92\x49\x26\x99\x64\x31\x31\xe2\x40\x97\xc9\xce\x09\x54\x62\
-\x1e\x04\x07\x07\x3a\x18\x48\x26\x99\x64\x92\xfd\x55\x4c\x14\xe9\
-\x1c\x0c\xa7\x4c\x8e\x99\xb2\x68\xa1\x2c\x5d\xa5\x94\xad\x54\xa9\
-\xe2\xf2\xb2\xb2\x3a\xae\x29\x28\xe8\x9c\x9a\xaf\xed\xbe\x2a\x57\
-\x7d\x41\x7a\xbe\xbc\xe7\xca\x7c\x75\xef\xf4\x1c\xc5\x15\xab\x73\
-\xe4\x57\xad\xc8\x91\xf7\x59\x9d\xaf\xec\x93\x96\xaf\xbc\x3e\x3d\
-\xbf\xe8\xc6\xb4\xfc\xa2\x9b\x57\xcb\xd5\xfd\xd3\x0a\x35\xfd\xd3\
-\xe4\xea\x01\xe9\xf9\xaa\x41\x19\x79\xea\x41\xab\xf3\x55\x83\xd3\
-\x0a\xd4\x43\xd2\x0a\x94\x43\xd3\x0b\x55\x43\x57\x93\xef\xf9\xca\
-\xc1\x64\x1f\x7e\x0e\xcc\x90\x17\x61\x58\xf5\x80\x55\x05\xca\x7e\
-\xe9\xf9\x9a\x9b\xf1\xb8\xbe\xb8\xfd\xba\xd5\x79\xca\x3e\x78\x8e\
-\x6b\xd2\x72\xe4\x57\xae\xc9\x53\x5e\x8e\xe1\x2f\x4d\xcb\x97\x5f\
-\x9c\x9e\xad\x39\x7f\x4d\x61\x51\xb7\xac\xfc\xdc\x4e\x98\xc6\x0e\
-\xa9\x7a\x7d\x6c\x66\xe6\x1a\xd9\xa0\xd4\x65\xb2\x98\x81\x03\x62\
-\x68\x2e\x63\x83\xf3\x7a\x6e\x0c\x69\x92\x49\x26\x99\x64\x11\x98\
-\x0c\x21\xd8\xfb\xd2\x9e\x31\x57\xf7\xbd\x31\xa6\xef\xcd\x37\xc9\
-\xfa\xdc\xd0\x57\x76\x5d\xff\x81\xb1\x7d\xaf\xbd\x2e\xf6\xaa\xe9\
-\xd3\xe3\x6e\x59\x7f\x5b\x17\x6d\x71\xd9\x05\xf6\xdb\x6e\xef\x65\
-\xab\xdc\x74\xb9\xab\xf2\xb6\x3e\x8e\xaa\x4d\x03\xac\x55\x9b\x46\
-\x3a\x2a\x37\x4d\x77\x54\xde\xbe\xd8\xb6\x76\x53\xa6\xa3\xea\x76\
-\x95\xbd\x6a\x93\xc9\x56\x79\xbb\x1b\xf7\x97\xdb\xd7\x6e\xda\x88\
-\xfa\x87\xad\x6a\xd3\x23\xf6\xb5\x77\x3c\x61\xaf\xba\xe3\x69\xfb\
-\xba\x4d\xcf\x39\xd7\x6e\xfa\xb7\x63\xed\xed\x2f\xa1\x5e\xb3\x57\
-\xdd\xfe\x26\x86\x79\x07\xf5\x36\x1e\xfb\x26\x6e\x7b\xd5\x49\xf7\
-\x6d\x7a\x11\xe3\x78\xce\x51\x79\xc7\x53\xb8\xfd\x71\x8c\xe3\x21\
-\x0c\x73\x0f\x6a\x3d\xfe\x5f\x8a\xe7\x70\xe0\xa7\xc1\x51\x75\x87\
-\x1c\xc3\xa7\x61\xd8\x14\x67\xe5\xa6\x29\x18\x77\x92\xa3\xfc\xb6\
-\x9b\x51\x57\xe3\x31\x97\x59\xd6\xdf\x76\xb1\xa2\xa4\xfc\xbc\xa4\
-\xb2\xf2\x4e\xd7\xc4\xc7\xc7\xdd\xd0\xf7\xc6\xd8\x3e\x37\xf6\x93\
-\x5d\x73\x63\x5f\x59\x9f\x6b\xaf\x95\xf5\xbc\xfe\xfa\x98\x98\xb8\
-\xb8\xb6\xae\x02\xc9\x24\x93\x4c\xb2\xd6\x31\x3a\x95\xc1\xce\xcb\
-\x13\xbb\xf9\xa6\x7e\x31\x2a\x95\x35\xce\xb2\x7e\x6d\x17\xf7\xda\
-\xdb\x2e\xb4\x56\x6c\xfc\x9b\x7d\xc3\x5d\x37\xbb\x37\xdc\x91\xec\
-\xaa\xdc\x30\xc5\xe4\x29\x5f\xa0\x71\x57\x66\x69\x5d\x95\x3a\x83\
-\xa7\xc2\xad\xf3\x54\xae\xd5\xbb\x2b\xee\xd4\x79\x2a\x1e\xc4\xcf\
-\x27\x75\xae\x8a\x97\x74\xee\xf2\x77\xf4\xee\xf2\x0f\x51\x9f\xe3\
-\xf7\xcd\xa8\xef\x50\x3f\xe8\xdc\x15\x3b\xf1\xf3\x37\xd4\x1f\xf8\
-\x7d\x2f\x86\xdf\x87\x61\x0e\x52\x79\xca\x0f\xe3\xf6\x63\xa8\xe3\
-\xac\x8e\x91\x6d\xec\xfe\x03\xf8\xff\x7e\x0c\xbf\x07\x3f\x77\xa3\
-\x76\xe1\xf1\x3f\xe1\xe7\x36\xd4\xb7\xa8\x2f\x31\xcc\x67\xf8\xf9\
-\x01\x1e\xf3\x26\x86\x7b\x1e\xf5\xb8\xd6\x5d\x7e\xbf\xce\x55\xbe\
-\x49\xeb\x2a\xaf\xd2\xbb\x2a\x9c\x3a\x77\xa5\x5a\xeb\xae\x48\xb3\
-\x78\x2b\x6e\x75\xaf\xdb\x34\xc1\x79\xdb\x1d\x09\xe6\xca\x3b\xfa\
-\x1a\x2b\x36\x5e\x66\x28\xad\x38\x2f\xab\xbc\xb4\xe3\xa0\x84\x78\
-\x5a\x0e\x5c\x79\x70\xd3\x3d\x92\x49\x26\x99\x64\xe7\x84\x75\xea\
-\xd0\x21\x66\x4e\xca\xfc\xd8\xd4\x7c\x55\x0f\x8d\xad\xf8\x6a\x73\
-\xf1\xfa\x24\x9d\xab\x64\x96\xce\x59\xba\x52\xef\xa9\x28\xd0\x79\
-\xca\x6d\x06\x4f\xe9\x6d\x06\x77\xc5\x43\x06\x6f\xe5\x8b\x06\x6f\
-\xd5\x87\xf8\xb9\xd5\x58\x5c\xb5\xdb\x58\x5c\x79\xc8\xe8\xad\x3a\
-\x86\xff\x9f\x40\x55\xa3\xea\x50\xf5\xb8\x0f\xfc\x55\xd9\xd0\xa8\
-\xaa\x28\xc5\x1c\x67\xa0\xaa\xa2\x62\xb7\x01\xa3\x2a\xc0\x7d\x8c\
-\xf0\xdc\xa8\x5a\xd4\x29\x4c\xd7\x09\xd4\x51\xfc\x7e\xc8\xe0\xad\
-\xf8\x0d\x3f\xbf\xc5\xb4\xbf\x8b\x9f\xcf\x18\x5c\x15\xf7\xe1\x20\
-\x51\x85\x83\x81\x51\xe7\xac\xcc\xd6\x78\x2a\x16\x99\xbd\xe5\xe3\
-\x8c\xee\xe2\x9b\xd3\x0a\x8b\x2e\x5d\xae\x35\x74\xea\xd6\xbd\x5b\
-\x5b\x57\x8d\x64\x92\x49\x26\x59\xcb\x18\x01\xfd\xd5\xd7\x5d\x17\
-\xb3\x74\x55\x5a\x27\x77\x59\x65\x2f\x4b\xe9\xfa\x31\x08\x4f\x95\
-\xc1\x5b\xfe\x30\x02\xf2\x53\xd4\xcf\x08\xd1\x5f\x11\x90\x7f\xe0\
-\xf6\xbd\xa8\x03\x46\x6f\xe5\x11\x02\x77\x04\x69\x35\x82\xb7\x16\
-\x75\xda\xc8\x40\xb6\x81\x8a\x00\xd9\x5b\x09\x02\xc0\x07\x3e\xa0\
-\xa3\x13\x73\x1c\x03\xf5\x2a\xaa\xc0\xf8\x78\xc0\x07\x3a\x30\x30\
-\x69\xa9\x67\x06\x80\x0a\x22\x3a\x08\xa0\x8e\x63\x7a\x0f\xe3\x31\
-\xfb\xf1\xd8\x3d\xf8\xff\x6e\x7d\x71\xd5\x2f\x7a\x4f\xe5\x16\x1c\
-\xdc\x5e\xc1\xff\x2b\xac\x95\x1b\x96\xda\x36\x6c\xba\x71\x65\x66\
-\x4e\xd7\x3e\xd7\xde\x10\xdb\xbf\xdf\xcd\x92\x97\x2f\x99\x64\x92\
-\x9d\x9d\xc6\xc1\xab\xf7\x15\x57\xc8\x6c\x9b\x36\x75\x37\x57\x6e\
-\x18\x88\x70\x2c\x40\x10\x3e\x84\x22\xa0\xff\x1d\xa1\x59\x43\xe1\
-\xc9\x8a\x0f\x5f\x03\x4f\xdc\x76\x7e\xd8\xc0\x63\xfc\xb6\x17\xf3\
-\xc3\x54\xf9\x44\xc3\x7a\x1b\x65\xf0\x53\x70\xdc\xa2\xe2\x0d\x04\
-\x06\x11\x05\x0e\x40\xcc\x71\x55\x0d\x7a\x6f\xc5\x61\x72\xe5\x82\
-\x61\x5e\xd7\x23\xf8\x8d\x65\x1b\xe7\xb9\xaa\x36\x5e\x6e\x34\x19\
-\x3b\xc4\xc5\x4a\x73\xfb\x92\x49\x26\xd9\x59\x66\x1c\xec\x93\x47\
-\x8e\x88\xcd\x36\x5b\xbb\x1b\xcb\xd6\x25\x6b\x5d\xa5\x16\x04\xdd\
-\x07\xa8\xc3\xcc\xb4\x09\x85\x60\x03\x5f\xbc\x69\x15\x61\x90\x8a\
-\xc0\x57\x74\x5f\xd0\xe0\x10\x05\xd4\xa3\x80\xbf\x58\x1a\x7d\xf9\
-\xf1\x06\x09\xe8\xb4\x14\x7a\xfd\x3a\x4f\xf9\xe3\x5a\x6f\x45\xaa\
-\xdc\xe0\xea\x23\x97\x7b\x3b\x26\xc4\x27\xca\xf8\x65\x28\x99\x64\
-\x92\x49\xd6\x6e\x8d\xbb\x11\x79\xd1\x85\xe7\xc7\x64\x69\xf5\xdd\
-\xac\x6b\x37\x0c\x32\x78\x2a\x4a\x8c\x9e\xca\x6d\x08\xb9\xa3\xfa\
-\xe2\x8a\xd3\x62\x90\x0e\xe7\x35\x9f\x85\xc0\x0f\x75\x4e\x02\xfe\
-\x6a\x43\x71\xc5\x1e\xbd\xa7\xf2\x6d\xad\xb3\x74\xa5\xad\xe2\xef\
-\x97\x27\x8c\x98\x4c\xdd\xfc\x58\x69\x25\x8f\x64\x92\x49\xd6\x9e\
-\x8d\x83\x7d\x8f\x1e\xdd\x64\x85\x85\x86\x18\x7b\xf1\x9d\x57\xeb\
-\xdd\xe5\x45\x06\x6f\xc5\x47\x08\xc3\x5a\x76\xde\xbb\xe9\x50\x6d\
-\x49\x38\xb7\x06\xf0\xa3\x4f\x77\x83\x1e\x3f\x51\xfb\x75\xae\xd2\
-\x47\x1c\x1b\xee\x9a\x9d\x38\x6e\x5c\x57\x52\x86\x08\x7c\x69\xb1\
-\xbe\x64\x92\x49\xd6\x7e\x8d\x03\xfe\x95\xd7\x5c\x2d\x2b\xa9\xbc\
-\xa3\x47\x91\xa3\x7c\x12\x7a\xb0\x2f\xe9\xbd\x15\x87\x10\x7c\xf5\
-\x2d\x0a\xda\xd6\x1c\x18\xc4\xae\x08\xa2\x89\x3f\xba\xc1\xa5\x46\
-\xef\xa9\xd8\x61\xf4\x54\x55\xe4\xbb\x4a\xfa\xa4\xa4\xae\xe8\x20\
-\x8b\x89\x91\x80\x2f\x99\x64\x92\xb5\x5f\xe3\x80\x7f\xe9\xe5\x57\
-\xca\xcc\xe5\x1b\x6f\xd2\xb9\x4b\x35\x08\xb2\xad\x08\x7d\xe0\xcd\
-\xdb\x4b\xc0\x17\xf4\xf4\x2b\xea\x74\xee\x8a\xd7\x8d\xa5\xeb\xe6\
-\xe5\x1a\xbc\xbd\x64\xb2\x58\xe9\x89\x5c\xc9\x24\x93\xac\xfd\x1a\
-\xc5\x53\x87\xb8\x98\xde\xf7\xde\x17\x6b\x2b\x29\x9f\xa8\xf3\x56\
-\x3c\x60\xf0\x56\xec\xe1\xa0\xd6\xaa\xb0\x3f\x4b\x06\x91\x50\xd2\
-\x7b\xcb\xbf\x33\x95\xac\xb5\xaa\x8c\xce\xbe\x12\xec\x25\x93\x4c\
-\xb2\x76\x6b\xdc\xaa\x92\xf9\xf3\xe6\xc9\x2c\xf7\xdf\xdf\x55\xe7\
-\x2a\x5d\x6e\xf0\x54\xfc\x87\x5d\x86\xd8\x0a\x70\xac\xa0\x8a\xea\
-\x38\x4f\xdb\x0f\x20\x5c\xba\x03\xd3\xce\x6e\xfb\x55\xe7\x2e\x7f\
-\xd8\x58\xb2\x76\xe4\x8a\xe5\x2b\xc8\x7b\xd6\x24\xea\x4b\x26\x99\
-\x64\xed\xcf\x38\xe0\xdf\x92\x92\xd2\xc1\xee\x2d\xbf\x54\xe7\x2a\
-\xd7\x22\xf0\xb7\x21\x64\x4f\xb5\x05\xf0\x05\xc1\xea\x69\x1e\xf4\
-\xd9\x1b\xac\xd1\x0d\x30\x01\xe7\x0c\x01\xfc\x06\x9d\xa7\xe2\x08\
-\x7e\xbe\x57\x64\x2f\x99\xef\x2d\xfd\x7b\xf7\xe1\xc9\x63\x69\xa1\
-\xc6\x49\x2b\x76\x24\x93\x4c\xb2\xf6\x64\xb1\xec\x43\x43\x73\x96\
-\x64\x74\x32\x97\x6f\xba\x4e\xe7\x2c\x2b\xd3\x7b\x2a\x0f\xa0\x4e\
-\x23\xf8\x03\x40\xd7\x28\xdf\x76\x0f\x4f\xde\xc0\xf0\xc1\xb0\x14\
-\x85\x39\xca\x2f\x2e\x9e\x0c\x54\x6c\x98\x80\x73\x8a\x0e\x1a\x21\
-\xd2\x15\xc2\x53\x67\xb6\x7b\x1a\x15\x74\x1c\x9b\x16\x5e\xbc\x0d\
-\xf8\xbd\x5e\xef\xae\xd8\x51\xe4\x2c\xc9\xb6\x78\xee\xee\x3d\x64\
-\xf0\xd8\x38\x7e\xd9\x4a\x26\x99\x64\x92\xb5\x0b\xe3\xa0\x34\x7f\
-\xc9\x8a\xae\x96\xf2\xf5\x83\x35\xae\xb2\xbb\x11\x5e\xd5\x28\x02\
-\xb5\x06\x51\x70\x8a\xc0\x39\xa2\x30\x7c\x50\x87\x08\xc3\x07\xbe\
-\x5f\xfc\xa2\xe1\x84\x07\x85\xb0\xe9\x0c\x1c\x44\xf8\xc0\x17\x3a\
-\xc6\x7f\x3b\x2d\x23\x9d\xb7\x7c\x1f\x0e\x96\x06\x77\xe5\xa6\x6b\
-\x87\x24\x25\x75\xa0\x65\x2b\x79\xf8\x92\x49\x26\x59\x7b\x32\x0e\
-\xf8\x0b\x96\x66\xf4\x70\x94\x6d\x18\xa3\x73\x95\x3f\x84\x00\xab\
-\xe5\xc3\x4c\x02\x7e\x04\xc0\xf7\x94\xef\xd7\xba\x4a\x3c\x9e\xaa\
-\x3b\x07\x0e\x4b\x18\xdd\x91\x96\xad\x04\x7c\xc9\x24\x93\xac\x3d\
-\x19\x07\xfc\x79\x4b\xd3\x2e\xb4\x97\x6f\x98\xad\x77\x95\x3d\x8d\
-\x00\xab\x0b\x09\xfc\x08\x20\x1d\x09\xc4\x23\x81\x7d\x93\xce\x2d\
-\x02\xf0\xa8\x07\xa7\xc8\xce\xc7\x94\x91\xbb\xe2\x90\xd6\x5e\xba\
-\xd1\xb9\xf6\xce\x91\x43\x93\x47\x77\xa2\x65\x2b\x01\x5f\x32\xc9\
-\x24\x6b\x4f\x86\xc0\xa7\x2b\x4a\xe6\xaf\x5c\xd3\xcb\x56\x71\xfb\
-\x6a\xbd\xb3\xfc\x0d\x1e\xf0\xa3\x85\x5f\xeb\x01\xbf\xb5\x15\x76\
-\x40\x11\xbd\xc7\xc0\x0e\x8a\xe5\x47\x34\xf6\xd2\x87\x1d\x95\x77\
-\x4c\x8f\x4f\x1e\xd5\x85\x5f\xb6\x92\x49\x26\x99\x64\xed\xc2\xb8\
-\x57\x01\xcc\x4b\x5d\x7d\xb9\xad\x7c\xa3\x46\xef\x2a\xff\x18\x01\
-\x76\xba\xd5\x80\x1f\x78\x53\xb4\xbd\x0c\x0a\xcd\x06\x7e\xc5\x71\
-\x8d\xa3\xe4\xdf\x8e\xb5\x77\x2c\x1b\x3a\x7c\x94\xf4\x9a\x05\xc9\
-\x24\x93\xac\x7d\x19\xbb\x24\x53\x76\xcd\xd5\xd7\xc4\xa8\x2d\xae\
-\x6b\x0d\xde\xaa\x52\xf2\x0b\x54\x82\xc0\x6f\x41\xb0\x46\x0a\xf2\
-\x76\x77\x15\x10\x02\xf8\x3a\x77\xc5\x49\xad\xab\xfc\x43\x43\xc9\
-\xba\xc2\x35\x79\xf2\x0b\xba\x77\xa5\x3f\x90\x72\x8e\xfc\xb4\xbb\
-\x64\x92\x49\x76\x56\x1b\x07\xa2\x0b\xce\xeb\x21\x53\xa9\x8c\xb1\
-\x7a\xd7\xfa\x81\x5a\x77\xd9\xfd\x3a\x4f\xf9\xef\x7a\xb2\xcc\xb0\
-\x05\x60\xa8\xe3\xe4\x2e\x27\x37\x35\xa9\xce\x04\x84\x75\x6d\x00\
-\x7e\xcc\x5b\x35\x9e\x77\x9b\xd6\x55\xe6\x32\xb9\x37\xf4\x5e\xb9\
-\x7c\x15\x29\x60\x89\xf6\x92\x49\x26\x59\xdb\x1b\x07\xfc\x8b\x7b\
-\x5f\x2a\x53\x16\x97\x76\x52\xd9\xbc\xc3\x11\x5a\xff\x66\x7f\x3b\
-\xb6\x9e\x40\x5a\xef\x69\x14\xf3\x3f\x0b\x37\x77\x79\x23\xc4\x79\
-\xdf\xf5\x9e\x46\xb0\x33\xa2\x9e\x6f\x63\x18\x37\x17\x8f\x7f\xbc\
-\xbe\xed\x64\x29\x28\xab\xa0\x63\x78\xfb\x44\xa1\xeb\x77\x0c\x73\
-\x6e\xba\x4f\x20\xce\xd0\xc7\x86\x3f\x6f\x70\xb8\xf2\x3a\xfc\xdc\
-\x87\xba\x43\xed\x2c\xed\x93\xa6\xd3\x91\xa5\x99\x12\xf0\x25\x93\
-\x4c\xb2\xb6\x37\x0e\xf8\xe7\x5d\xd2\x4b\x96\xeb\xa9\xe8\xa6\x75\
-\x94\x4d\xd6\xba\x4a\x3f\xd2\xb9\xca\x1b\x10\x5a\x0d\x7c\x30\x07\
-\x42\x52\x14\x8e\x1c\xe8\x7d\x83\x41\xcb\x01\x3f\x14\xac\xc3\x01\
-\x5f\x28\x1d\x2d\x0d\x7c\x3a\x48\xba\xca\x6a\xb1\x0c\x1f\xd7\xb9\
-\xd7\xf6\x5b\xa4\xd6\x75\x8e\x91\x80\x2f\x99\x64\x92\xb5\x07\xe3\
-\x80\xdf\xeb\xe2\xde\x32\xb3\x7d\xc3\x45\x1a\x67\x49\x8a\xce\x59\
-\xf6\x35\x42\x0b\x38\xe0\x8b\x81\x36\x14\x8c\xcf\x84\x1a\xc1\xdb\
-\xb6\xe9\x08\x50\x03\x2d\x3b\x47\xe9\x8b\x06\x6f\xe5\x88\xfc\x02\
-\x7b\xf7\x36\xae\x62\xc9\x24\x93\x4c\x32\xc6\x38\xe0\xf7\xec\x75\
-\x89\xcc\xe4\xa9\xba\x4a\xe3\x28\xcd\x42\x68\x6d\xf1\xc1\xab\xed\
-\x01\x2a\xe2\x71\xf3\xae\x10\xda\x41\x7a\x82\xe4\x2a\x7b\xcb\xe0\
-\xa9\x9a\x95\xa7\x36\xf4\x6c\xe3\x2a\x96\x4c\x32\xc9\x24\x63\xcc\
-\x07\xfc\x4b\x2e\x95\xe9\x8b\xab\xfa\x17\x39\x4b\xcd\x5a\x57\xd9\
-\x0e\x09\xf8\xcd\x93\xd6\x59\xfa\x91\xc1\x5b\x95\x96\xab\xb5\x5e\
-\xd1\xc6\x55\x2c\x99\x64\x92\x49\xc6\x98\x0f\xf8\x97\xf6\x96\x19\
-\xca\x36\x24\xa9\x9d\x25\xeb\x11\xf8\xbf\xb6\x47\xe0\xb7\xb3\xa9\
-\x9b\x90\xd2\xb8\x4a\x37\x1b\xbd\x55\xfa\x7c\xbd\xfd\xda\x36\xae\
-\x62\xc9\x24\x93\x4c\x32\xc6\x7c\x73\xf8\xe8\xe1\x1b\x4a\xd7\x4d\
-\xd2\x38\x4b\x1f\xd5\xb9\xca\xf6\xb4\x47\xe0\x9f\x55\x72\x96\x6e\
-\x37\x16\x57\x55\x15\x68\xcd\x03\xb8\xa2\x6e\xbb\x5a\x96\x4c\x32\
-\xc9\x24\x8b\xe1\x79\xf8\xd7\x5e\x2f\x33\x96\xad\x9f\xa7\x75\x96\
-\xbd\xa9\x75\x95\x1f\x92\x80\xdf\x3c\x69\x9c\x65\xbb\xd1\xc3\xff\
-\x67\x8e\xd1\x9e\x10\xd3\x8d\xde\xb7\x95\x80\x2f\x99\x64\x92\xb5\
-\xad\x71\x14\x4a\x36\x18\xe2\x0c\xde\xaa\x55\x5a\x57\xd9\x57\xa8\
-\x13\x67\x12\x8e\x78\x3e\x9f\x42\x86\x75\xf1\xd4\xdc\xf3\xf2\xe2\
-\xd2\xf2\x24\x9e\xa6\x32\x9e\x84\xf2\xc0\x57\x59\x03\xea\xb0\xde\
-\x51\xfa\xba\xaa\x62\xc3\xd8\x6b\x96\x2d\xa5\x45\x2d\x93\x5e\xa2\
-\x26\x99\x64\x92\xb5\x95\x91\x1f\xda\x26\x76\xc3\x75\x33\x65\x36\
-\x7d\x55\x57\x8d\xa7\xb8\x10\x81\xb5\x4b\xe7\x2a\xab\xe1\x03\x2f\
-\x50\x62\xb0\x16\x0c\x2b\x02\xe9\x70\xc7\x09\x0e\x00\x7e\x90\x16\
-\x0e\x17\xb8\x4d\x34\x4e\x91\xb8\xa2\x8a\x47\x20\x1d\xac\x10\xf8\
-\xa5\xd5\x45\xae\xb2\xff\x99\xbc\xc5\x33\x94\xd9\xe5\xb1\xe7\x5f\
-\xd0\x5f\xc6\x2f\x73\xc9\x24\x93\x4c\xb2\x33\x6a\xbe\x5f\xb9\x9a\
-\xab\xe8\x60\x2e\xbe\xbb\xb7\xda\xee\xb1\x22\xac\xf6\xa2\x4e\x0b\
-\x83\xac\x94\x4a\x18\xdc\xa5\xac\x9a\x0a\x7c\x91\xe3\xcf\x56\xe0\
-\x3b\x4b\xeb\x34\xae\xb2\xef\x55\x36\x57\xaa\xb5\xf8\xe1\xf3\x07\
-\x0d\x9e\x1c\xcb\x2f\x73\xc9\x24\x93\x4c\xb2\x33\x6a\xdc\x7b\xda\
-\x67\xaf\x58\xda\xc5\x5c\xb5\xb6\xbf\xca\x56\xbc\x16\x41\x75\x84\
-\x9d\x92\x10\x01\x72\x69\xe0\xf4\x85\x08\xb0\x4b\xfd\xc0\x18\x04\
-\x47\x27\x51\x60\xf8\xd0\x03\x86\x56\x1c\xb0\x67\x50\xc2\xe9\x0c\
-\x04\xbe\x86\xe4\xcd\x59\xfa\xb3\xca\xea\x55\x58\x37\xac\xbf\x7a\
-\xd0\xf0\xc4\x38\x7e\x99\x4b\x26\x99\x64\x92\x9d\x51\xe3\xe0\x33\
-\x33\x65\x69\x0f\x53\xe9\xfa\xf1\x6a\x87\xf7\x01\xf4\x4a\x4f\x68\
-\xfc\x80\x1f\x11\xe0\x58\x78\x0b\x29\x00\x96\xce\x00\x89\x9d\xc7\
-\xc9\x48\xe7\x0c\x05\xde\x28\x61\xec\xe4\x0f\x34\x62\x69\x0c\x88\
-\x87\xa6\x33\x20\x9f\x41\x69\x0f\x4a\x53\x83\xd6\x5d\x46\x96\x66\
-\xfe\xa1\xb2\x7b\xdc\x96\xb2\x0d\x83\x07\x0c\x4d\x60\x7e\xfd\x4a\
-\xf2\xf0\x25\x93\x4c\xb2\xb6\x30\xee\x3d\xed\x33\x17\xae\xb8\xd0\
-\x54\xb6\x61\x3e\x02\xff\x59\xf4\x4c\xab\x35\x41\x30\x0b\x03\x7c\
-\x1f\x00\xc3\x80\x34\x2c\x2c\x23\x05\x7e\x28\xb0\x87\x00\xb1\x53\
-\x2c\xad\x65\x02\xfb\x03\x06\xa9\x50\x79\xf0\x1b\x44\x58\xe0\xe3\
-\x77\x8d\xb3\x6c\x3f\x02\xff\x0e\x73\xc5\xa6\xb1\x03\xe2\x93\x99\
-\x5f\xbf\x92\x7e\x0c\x45\x32\xc9\x24\x6b\x0b\xe3\x80\x7f\xeb\xc2\
-\x65\xbd\x2c\xe5\xb7\x65\x17\xd9\xbd\xef\x20\xa8\xea\xfc\x01\x19\
-\x0a\xf8\x81\xde\x7a\x08\xcf\x3e\x28\xac\x10\xc0\x43\x81\x35\x14\
-\xb4\xc5\x06\x84\x00\x09\xa6\x35\xd2\xf4\x89\xa4\x2b\x28\x3d\x8d\
-\xc0\xd7\x3a\x4b\x8e\xa8\x6d\x9e\x27\xed\x95\x1b\xe7\x0e\x1e\x96\
-\x28\xfd\xfa\x95\x64\x92\x49\xd6\x76\xc6\xc1\x67\xf6\xa2\x95\x97\
-\x59\xca\x36\x58\xd4\x8e\xe2\x2f\x38\xe0\x13\x2f\x3f\x9c\x02\xc3\
-\x89\x82\x56\x10\xba\x65\xc4\x03\x16\x3c\x36\xd4\xf9\xf8\x80\xf5\
-\x6d\xf7\x87\xad\xf8\xb1\x22\xf1\x87\x06\x7e\x70\x1e\x34\x81\xe7\
-\x0e\x3e\x5f\x03\xfb\x79\x5c\x6d\xf7\xbe\x65\xad\xd8\x94\x36\x28\
-\x61\x78\x57\x7e\x99\x4b\x26\x99\x64\x92\x9d\x51\x8b\x63\x3d\xfc\
-\x59\x8b\x52\xaf\x32\x97\xdd\xb6\x5e\x6d\x2f\xfe\x09\x81\x76\xfa\
-\xcc\x00\x3f\x72\x20\xfb\x03\xbf\x69\xc7\x37\x0d\xf8\xc2\x79\x88\
-\x18\xf8\xae\xd2\x53\x2a\x9b\xf7\x2b\x6b\xe5\xed\xea\x81\xf1\x49\
-\xf4\xe9\x2b\x09\xf8\x92\x49\x26\xd9\x19\x37\xf6\x09\x5b\x59\xaf\
-\x8b\x2f\x8a\xc9\x56\x68\xaf\xd3\xba\x2b\xee\x2b\x72\x94\xfc\x81\
-\xa0\x3a\x1d\x09\xec\xc3\x0d\x04\x91\xa8\x39\xf1\x8a\xed\x6b\xca\
-\xb1\xe1\x8e\x09\x35\xc8\x85\x94\xab\xb4\x06\xaf\x9a\x7e\x34\x16\
-\xaf\xb5\x2d\x5e\xba\xe2\xfc\x0e\x71\xcc\x4f\x49\xb6\x6d\xcd\x4b\
-\x26\x99\x64\x7f\x2d\xe3\x7e\x5f\xb5\x6b\x57\xd9\x5c\xad\x56\x66\
-\x29\xae\x1c\xa8\xb2\x7a\x9f\xd4\x38\x4a\x0e\x21\xa8\xea\xa3\x03\
-\x71\x09\x4f\x4d\xd9\x1f\x01\x78\x05\x3d\xe9\xc8\xe2\x13\xf4\xc0\
-\x45\xa1\xed\x9f\x56\x31\x8f\x3e\xf4\xb1\x7e\xdb\x6a\x35\xae\x92\
-\xdd\xe8\xe5\x97\x5b\x2b\xd6\xf6\x4e\x5c\xb6\x8c\xfe\xdc\xa1\xf4\
-\xfb\xb6\x92\x49\x26\xd9\x19\x33\x0e\x38\xe7\xf7\xbc\x58\x96\x5b\
-\x51\xd5\x5d\x61\x2b\x19\x8f\xde\xfd\x2b\x1a\x47\xe9\xf1\xb3\x03\
-\xf8\x91\xc7\xd7\xa6\xc0\x77\x94\xd4\xa1\x0e\x68\x1c\xc5\xf7\x28\
-\xdc\x95\xfd\x96\xea\xf5\x9d\xd9\x1a\x68\xc3\xda\x97\x4c\x32\xc9\
-\xfe\x52\xe6\x03\xfe\x85\x17\xc9\xd4\xae\xf2\x4b\xd5\x8e\xd2\x85\
-\x45\xce\xd2\x0f\x8b\x88\x47\xea\x28\x69\x40\x05\xc0\x2f\x50\x42\
-\x80\x8c\x04\xf8\x01\x61\x05\xcf\x13\xe9\xe0\x12\x2a\x1d\xe1\xd2\
-\x2d\x36\x10\x95\x30\x69\x0a\x99\xae\xc8\xcf\x85\x83\x68\x3d\xea\
-\xa4\xda\x51\xf2\xa4\xce\x53\x35\x76\x55\xa1\xe6\x7c\xb6\x02\xda\
-\xb2\xfa\x25\x93\x4c\xb2\xbf\x92\x35\x02\xff\xe2\x98\x22\x47\xe5\
-\xb5\x6a\x9b\x37\x1f\x81\xff\x4d\x11\x03\xe1\x86\x40\xe8\x21\xb4\
-\x7c\x8a\x1e\xa6\x21\xe4\x28\x09\x01\xd8\x56\x10\x7b\x2e\xd1\xfc\
-\xb4\x70\x7a\xb0\x3c\x1b\x50\xa7\xd5\x8e\xe2\xd7\x75\xae\xf2\x05\
-\xab\x0b\xf4\xbd\xd8\x1a\x68\xc3\xda\x97\x4c\x32\xc9\xfe\x52\xc6\
-\x01\xff\x82\x8b\x2e\x8a\xd1\x78\x4a\x06\xa9\xed\x5e\x07\xc2\xef\
-\xc7\xbf\x02\xf0\x8b\xce\x20\xf0\x51\x0d\x1a\x57\x49\x43\x91\xc3\
-\xfb\x91\xce\x5d\x9a\x9b\xae\x50\x5f\xc9\xd6\x40\x1b\xd6\xbe\x64\
-\x92\x49\xf6\x97\x32\x0e\xf8\x17\xf5\xec\x19\x63\x2a\x2e\x1f\xa1\
-\x76\x78\x6e\x2f\x72\x16\xff\xe6\x83\x54\xa0\xa7\x1a\x00\x48\xdf\
-\xf7\x28\xc1\x18\x08\xdb\x22\x1e\x60\x23\x1b\x54\x22\x8f\x37\xe8\
-\x1c\x62\xe7\x0f\x71\x7c\x53\xce\x29\x1c\xb6\xf8\x6b\xbd\xb7\xdc\
-\x9a\xad\xd2\x5e\xc7\x55\x41\xdb\xd5\xbe\x64\x92\x49\xf6\x97\x32\
-\x0e\xf8\x17\x5e\x7c\x71\x8c\xa1\xb8\x74\x92\xda\xe1\x7d\x1c\x81\
-\xbf\x87\x85\x56\x83\x0f\x5c\x22\x40\x0e\x07\x3a\xbf\x7d\x51\x80\
-\x39\x1a\x45\x03\xfc\xa6\x84\x0f\xe9\xfd\x47\x7a\x0c\x2b\x2c\xdf\
-\xed\x3a\x4f\xf9\x6d\x99\x2a\x6d\x3f\xb6\xfc\x25\xe0\x4b\x26\x99\
-\x64\x67\xc6\x38\xde\x0c\x1c\x34\x38\x46\xef\x2e\x9b\xad\xb6\x7b\
-\x5f\x46\x58\x1d\x08\x02\x97\x04\xfc\x16\x01\x3e\x6e\xff\x55\xe3\
-\x2c\x7b\xb0\x40\x67\x1e\x72\xe9\xa5\x97\xb2\x55\x20\x31\x5f\x32\
-\xc9\x24\x6b\x65\x8b\x8d\x65\x7e\x80\x63\xf0\xa0\x41\x32\x8b\xcd\
-\xd6\x41\x65\x2f\x5e\x52\x64\x2f\x7e\x1f\x75\xb4\xe5\x80\x5c\x1c\
-\xa0\xe6\x1c\x1f\x49\xb8\x48\x8f\x6d\x4e\x9a\x58\xa0\xf3\xe3\xb2\
-\xb3\x12\x09\xc7\xaa\xa1\xc8\xee\xdd\xa7\xb2\x78\x9f\xd1\xd9\xbc\
-\x23\x8a\x8a\xd4\x31\x97\x5c\x72\x09\xfb\x63\x28\x12\xf4\x25\x93\
-\x4c\xb2\x56\xb4\x38\xf6\x95\xc8\x73\x66\xcd\x8a\xb3\x58\xcb\xce\
-\x57\x58\x8a\xb3\xd5\xf6\xe2\xaf\xd5\x8e\xe2\x93\x7e\xd0\xb2\x87\
-\x06\x5a\x68\xb0\x87\x07\x3e\x3b\xb7\x1d\x01\xb4\x23\x51\x94\xc7\
-\xda\x05\xfe\xb7\x0b\xc4\x65\x0f\xdc\x17\xea\x38\xd1\xb4\x34\x60\
-\xf9\x1e\x21\xef\xd4\x91\xeb\x5d\xd3\x1c\xb6\xd2\xce\x03\x07\xf4\
-\x67\x7f\x0c\x45\xfa\xf5\x2b\xc9\x24\x93\xac\x15\x8d\x7b\x07\xfe\
-\x94\x19\xd3\x3b\x99\xbc\x55\x57\x29\x2d\x5e\x8b\xda\x56\xbc\x4b\
-\x6d\x2f\xa9\x3d\xa7\x80\x1f\x29\xa8\x83\xa0\x1e\x21\xf0\x45\xe3\
-\x17\x04\x7e\x35\x96\xf1\x97\x2a\xab\x27\xd5\xe4\x2d\xef\x75\xe3\
-\xcd\x37\x31\x3f\x86\x22\x01\x5f\x32\xc9\x24\x6b\x2d\x93\x21\x60\
-\x3a\x74\xa4\xbf\xc3\x11\x33\x6d\x41\x4a\x57\x63\xf9\xfa\x01\x4a\
-\xab\x77\x2d\x82\xeb\x10\x42\xa9\x81\x85\x13\x04\x4a\x14\x76\x22\
-\x40\x0c\x79\xac\x43\x38\x6c\xf4\x90\x0f\x71\xbe\x48\x3d\xf3\x00\
-\x09\xe5\x3d\x9a\xf4\xa9\x79\xe2\x6d\x6f\xa0\x65\x6b\xf7\xee\x54\
-\x5a\xdc\x4a\x53\xc5\xfa\x3e\x37\x0f\x1d\x22\xfd\xfa\x95\x64\x92\
-\x49\xd6\x7a\xc6\xcd\x17\x73\x90\x99\x36\x67\x61\x37\x53\xc9\xfa\
-\x31\x4a\x9b\xfb\x01\x84\xdd\x29\x1e\x9c\x04\x61\xe7\xf7\x7f\x94\
-\xc0\x8f\x24\xce\x48\x25\x74\x8e\x68\x41\xdd\x12\xe9\x08\x8c\xdb\
-\xb7\x5d\x00\xf8\xcc\x7e\xcf\x1e\xa5\xd9\xe9\xb0\x56\xac\xeb\xdf\
-\x6f\xd0\xe0\x0e\xa4\x0e\xe8\xf4\x9a\x34\x8f\x2f\x99\x64\x92\xb5\
-\x94\x71\x38\xe9\xd6\xb9\x73\xcc\xf5\xfd\xfa\xc9\xfa\x0d\x1d\x1a\
-\x77\x7d\xdf\x9b\x3a\x2c\x49\xcb\xee\xad\xf7\x54\xa6\x22\xf0\x5f\
-\x42\x20\xd5\x84\x02\xa9\x04\xfc\xe6\x03\x9f\xde\xb8\xb5\xba\xd7\
-\xeb\x8b\x2b\x47\x8d\x9f\x3a\xab\xeb\xdf\x6e\xba\x49\xd6\xe3\xaa\
-\xab\x98\xea\x91\xa0\x2f\x99\x64\x92\x35\xc5\x88\x27\x4f\xe6\x86\
-\xf9\xf3\xc3\xb1\xb8\x6d\xc2\x94\xa9\x31\x05\xc5\xc5\xdd\x4c\x95\
-\xeb\x6f\xb4\x97\xdf\x36\x5d\xe7\xa9\xd0\x90\x37\x64\xaa\x6c\xde\
-\x1f\x11\x54\xa7\x9b\x04\xbc\x26\x82\xb2\x3d\xa9\xa5\xf3\x20\x3e\
-\x20\x79\x8f\xe3\xe7\x7f\x94\x56\xb7\x55\xeb\x28\x1b\x5d\x54\x56\
-\x7e\xc9\x2c\xb3\x39\xae\x73\x2f\xee\x6d\x0b\x32\xba\x56\x93\xa9\
-\x3b\x72\x15\x26\x0d\x02\x92\x49\x16\x64\x1c\xe0\x24\xf3\xb7\xce\
-\xe8\xd1\xab\x94\xca\x98\xec\x6c\x65\xe7\x2c\xb9\xfa\x52\xb5\xc3\
-\x33\x50\x61\x75\xcd\x52\x59\x3c\x5a\xa5\xc5\xfd\x28\x82\xfe\x4b\
-\xb5\xad\x78\x1f\x7e\xd6\x20\x88\x04\xa7\x72\x5a\x5e\x5e\x9e\xda\
-\x1e\xf6\xcd\x19\x24\x82\x07\x0a\x2f\x84\xce\x9f\xb7\x0e\xcb\x9a\
-\x94\xf7\xfb\xe8\xe9\xaf\x55\x99\x1d\x2b\xb5\x9e\xb2\x91\x39\x3a\
-\x6b\x9f\x35\x6b\xe4\x17\xa4\xa7\xa7\xc7\xf5\x62\xe1\x2f\x2d\xd7\
-\x94\x4c\x32\xc9\xc2\x1a\x01\x45\x9f\x3e\xd7\xc8\xfa\xf7\x1b\x18\
-\x37\x28\x21\xb9\xa3\xd5\x59\x7c\x91\xc1\x56\x3a\x58\xeb\x2c\x49\
-\x55\xd9\x3c\x1b\x11\x3c\x1f\x20\x78\x76\xaa\x6c\xc5\x07\x10\xf6\
-\x27\xd5\x36\x0a\xa1\xfa\x33\x07\xcb\xbf\x34\xf0\x1b\x48\x79\xa3\
-\x8e\x17\xd9\xbd\x7f\xe0\xff\xdf\xaa\xad\xde\xa7\xb4\xf6\x52\xbd\
-\xc6\x5e\x36\xd5\xe2\x2e\xbf\x7a\xdc\xe4\x69\x5d\xfa\xf6\x1b\xd0\
-\xe1\xe6\x9b\x27\xc9\x3a\x75\xea\xc9\xd5\x6a\x9b\xb6\x29\xc9\x24\
-\x3b\xe3\x26\x93\xc5\x05\x79\xf1\xdc\xff\xc3\x86\x0d\x8b\x59\xb8\
-\x60\x41\x88\x63\x99\xcb\x64\xb2\x42\xe5\x9c\xf2\x9c\xd8\x69\x1b\
-\x7e\xb9\x74\xec\xd0\x21\x46\xa9\x51\x77\xb2\x15\xaf\xbd\xca\xe0\
-\x59\x37\x4e\x69\xf7\xc8\x11\xe8\x0f\x22\x64\xfe\xa3\xb2\x7a\x76\
-\xe0\x77\x02\x79\xc0\xcf\x08\xa1\x1c\x4e\x91\x1c\x17\x09\x14\xa3\
-\x39\xae\xa9\x69\x0e\x15\x4f\x4b\xe5\x35\x92\xfc\x15\x63\xf9\xd3\
-\x6d\xa7\x71\xd0\xdd\x8b\xff\x7f\x89\xdf\x5f\x52\x5a\xbc\x65\x3a\
-\xef\xda\x05\xe6\x92\x75\x03\x9d\xee\x27\xcf\xbf\xea\xca\x41\xb4\
-\x4e\xb1\xf5\x92\x3a\x96\x05\xd6\xf5\xb9\x65\x8d\xd3\x90\xd1\xf4\
-\xd1\xc6\x32\x91\x56\x3b\x9d\x33\x46\x1a\x3c\x11\xb1\x09\xe3\xa6\
-\xca\x72\x0b\x5d\x5d\xd3\x54\xba\x4b\xd7\x14\xe9\xaf\xcb\x52\xe9\
-\x07\x14\x59\xbc\xc3\xcc\x65\xeb\xe2\x33\x95\xda\xc1\x19\x0a\xfd\
-\xcd\x99\x1a\x5d\x9f\xf4\x22\xf5\xa5\xab\x32\x34\x5d\x57\xaf\xca\
-\x8d\xe9\xd6\xad\x6b\x1b\xe7\xa0\x75\x8c\xeb\x16\xa4\x7f\x2c\x48\
-\x59\x19\x9b\x25\x77\x9e\x97\xa9\xd0\x5e\xa3\xb4\x3a\xc7\x2b\xac\
-\xee\x42\xa5\xc5\x7d\x37\xc2\xfd\x53\x84\xfb\x09\x95\x95\x81\xbc\
-\xca\x4e\xd5\x80\xdf\x1b\x54\x2c\xf8\x19\xf8\x37\x5d\x42\xf1\xd0\
-\xef\x9c\x42\x42\x57\x3c\x0e\xd1\xf3\x11\x60\xb2\x6a\x5e\x5c\xd1\
-\x01\x9c\x1f\x2f\x5b\x8e\xcd\x29\xa3\x06\x46\x8d\x69\xc0\x7d\xbb\
-\x94\x56\xf7\xb3\x72\xb3\xdb\xad\xb0\xb8\x53\xb2\x35\xc6\xfe\x6b\
-\xe4\x8a\x4b\x16\x59\xad\x9d\x7a\x5c\x71\x05\x5b\xd7\xe7\x90\xc3\
-\x22\x68\x4c\xfe\xe6\xcd\x5d\x10\x53\x28\x57\x75\x5c\x55\xa4\xbe\
-\x30\x4d\x65\xe8\x9d\xa3\x34\x5d\x91\x29\xd7\x5f\x91\x51\x68\xb8\
-\x74\xb5\x52\x79\x41\xa6\xca\xdc\xe9\xfa\x6b\xdf\xc5\x90\xe7\xd3\
-\xf6\x7f\xce\x17\xcb\x5f\xcb\x62\x65\xd7\xdf\x78\x4b\x5c\xbf\xa1\
-\x09\x9d\x32\xf3\x4d\xbd\x34\xee\xaa\x44\x8d\xa3\x64\x45\x91\xab\
-\xd4\xa9\x75\x97\xdd\x81\x5e\xd2\xc3\xd8\x41\xfe\x89\xdf\x1f\xd0\
-\x38\x4b\xd7\x15\x39\xcb\x0c\x45\x8e\xb2\x15\x1a\x93\x37\x49\x67\
-\xaa\xea\x9d\x9e\x9b\x7f\xde\x0d\x03\x86\x76\x19\x98\x98\xd8\xf1\
-\x92\x5e\x3d\xb9\x9f\x98\x63\x1f\x6d\x6f\xe3\xac\x45\x69\xbc\x0e\
-\x2f\xeb\x94\x94\x18\x3b\x30\x71\x78\x87\xf8\xa4\xd1\x5d\x95\xe6\
-\xf2\x2b\xd4\xae\xb2\xf1\x1a\x67\x99\x4e\x69\xf3\x3e\xab\x22\xd3\
-\x36\x64\x6d\xbd\xcd\x7b\x0a\xbd\xc9\x7a\x95\xcd\xe3\x07\x2a\x3f\
-\x78\xb5\x12\xf0\x55\x67\x09\xf0\x99\xb8\xc2\x03\xbc\x85\x81\x1f\
-\x9c\x17\x9b\xa7\x16\xf7\x1f\xc3\xfa\xdb\xaf\xb4\x79\x3e\xc4\xf6\
-\xbd\x56\xed\x2a\x59\xa6\x2d\xab\xe8\x3f\x76\xea\xf4\xf3\x06\x26\
-\x24\x77\x1a\x30\x74\x48\x5c\xe7\x8e\x1d\x69\x23\x88\xd6\x1b\x6e\
-\x4f\xc6\xf6\x3e\xee\x1b\x99\xbe\x92\xf5\xbb\x79\x7c\x87\xfe\x83\
-\x07\x75\x9e\xbb\x64\x69\x77\x93\x6d\x5d\x4f\x95\xde\xdd\x4f\xe3\
-\x2d\x9e\x59\xe4\x2e\x5d\x89\xed\x3a\x4b\xeb\x2c\xcb\x44\x2d\x2f\
-\x72\x96\xdc\xa2\x71\x57\xf4\x57\x9a\xd6\xf7\x1a\x3a\x62\x6c\xd7\
-\xc1\xf1\x63\x3b\x74\xeb\x9a\x83\xf1\x74\x6a\xdb\x4c\x49\xd6\x3c\
-\x8b\x8b\xa3\x4b\x95\x63\x06\x0d\x4c\x95\x69\x0c\x4f\x74\x36\x96\
-\x6d\x1c\x5a\xe4\x28\xce\x57\x58\x3c\xff\xc0\x8e\xf1\xb6\xca\xea\
-\xf9\x0e\x3b\xc6\x4e\xec\x20\xbf\x2b\xad\xde\xdd\x08\xb5\xdf\x94\
-\x64\xc5\x89\xad\xf8\x2b\xfc\xff\x5d\x32\x95\x81\xdb\xcc\x1a\x57\
-\xd9\x72\xbd\x77\x7d\xb2\xa1\x72\x43\xaf\x11\x93\x26\x32\x9d\xc5\
-\xf7\xc0\x8b\xcc\x77\xb9\x2c\x63\xd5\x1e\x2d\xe8\xc6\x34\x59\x75\
-\xe3\x29\x96\x99\x4a\x37\xf5\x34\x97\xdc\x36\x49\x69\x77\xeb\x31\
-\xaf\x8f\x61\x9e\x3f\x47\xed\x65\x20\xcf\x41\x45\x18\xf2\xed\x5d\
-\x7e\xd0\x64\x07\x8f\x33\x72\xde\x28\xce\x25\x04\xf3\x16\x2a\xeb\
-\xe3\x58\x9f\x3f\xe0\xe7\x5b\x0a\xab\x67\x83\xae\x78\xed\x4a\x53\
-\xe5\x1d\xfd\x0d\x55\xeb\xbb\xf5\xea\x7d\xa9\x5f\x9b\x38\x1b\xc0\
-\xcf\x4f\x2b\xe9\x6f\xd8\x03\xe9\x76\xae\x4d\xf7\xb9\x66\x48\x8c\
-\xd1\x76\xcf\x05\xa6\xd2\xca\x21\xba\x92\xaa\x14\x95\xd5\x5d\xa4\
-\xb2\x7b\x36\xa9\xed\x9e\x97\x55\x36\xf7\xfb\x58\x0e\x1f\x63\x79\
-\x7c\x84\xfd\xfa\x3d\xec\xe3\x2f\x60\xbf\xbf\x5d\xe9\xf4\xa8\x0d\
-\xa5\x1b\x26\x5b\xca\xef\xbd\xf8\xd6\x79\xff\xc1\x38\x3b\xd3\xe1\
-\xe3\xdc\x9d\xf6\x3a\x57\x8d\x34\x0e\xf2\x79\xf9\x65\x31\x03\x6d\
-\xb6\x58\xad\xbd\xac\xa7\xda\xee\x1a\x2f\x37\x39\x3d\x58\xe1\xef\
-\xab\xac\xde\xbd\xf8\x79\x3a\x54\x87\xc1\xfd\x0d\x38\x20\x1c\xc6\
-\xef\x5b\x94\x56\xcf\xab\x0a\x93\x6b\x9d\xdc\xe2\xc9\x2c\x30\x39\
-\xc6\x67\x6b\x4d\xfd\x32\x34\xb6\xde\x06\x83\xbe\xd3\xc0\x01\x6f\
-\xe1\x89\x2e\x6e\xf4\xf4\x99\xa5\x71\x6d\x97\x77\x11\xe3\xd2\xd4\
-\xbb\x77\xef\x98\xf4\xcc\xcc\x0e\x05\x45\xa6\xcb\xd4\x16\x77\x92\
-\xc2\xe4\x5e\xad\xb0\xb8\xfe\x81\xf9\xfd\x12\x3b\xc4\x11\xcc\x6f\
-\x3d\x5b\x06\x41\xd3\x36\x2d\x2b\x4f\x94\x3a\xc3\x03\xc5\x19\x1c\
-\x20\x9a\x5f\x7e\x41\xfb\x7d\xf5\x86\xf5\x5a\x8f\x80\xdb\x8d\x57\
-\xb0\xaf\xc9\x4d\x2e\x07\x7e\x9f\x95\xa3\x31\xf7\x2d\x30\x18\xbb\
-\x27\x25\x26\xfa\xda\x46\x7b\x6c\xb3\x9c\xf9\xa7\x8f\x71\xb4\x2e\
-\xb9\xf8\xc9\x98\xf4\x3c\x7d\x87\x4c\x8d\xfe\x92\x1c\x95\xf9\xe6\
-\x42\xa3\x75\xb4\xc2\xe6\x5c\x25\x37\x3b\x4b\x94\x16\xd7\xb3\xd8\
-\x77\xbf\x42\xed\xc1\xf2\x39\x1d\x54\x46\x56\x4f\x1d\x6e\xfb\x03\
-\x39\xf0\x05\xb6\xff\xfb\x14\x66\xd7\x4a\xb5\xdd\x3c\x20\xdf\xe0\
-\x3a\x6f\xc0\xc0\x41\xd2\x3b\x8a\xce\x56\x1b\x3f\x75\x6a\xac\xdc\
-\x5d\xd9\x53\x69\xf6\x4c\x56\x58\xbd\xf7\x62\x65\x6f\xc5\x8a\x3e\
-\x86\x9d\xa0\x8e\x74\x84\x90\x40\x23\xc0\xb7\x91\x86\xe1\x3d\x85\
-\xdf\x8f\xa2\x47\xf0\xbb\xd2\xe6\xde\x8c\x10\xf8\xb7\xda\x51\x52\
-\xa6\x74\x94\x2c\x55\x99\xbc\x03\x14\x45\x15\xbd\x12\x46\x8e\xef\
-\x3e\x38\x21\xb1\xf3\xc0\xb1\x63\x3a\xf4\x1c\x38\x90\xb4\x94\x76\
-\xd3\x83\xb8\x99\xa7\xcb\x2f\xeb\x1d\x3b\x62\xcc\x84\x8e\x2b\x73\
-\xe5\xe7\xa9\x5c\x25\xd7\x17\xd9\x8a\x97\x62\x19\xdc\x85\x79\xfc\
-\x0c\x07\xb4\x3d\xa8\x93\x64\x10\xa4\x03\x5d\xe4\x60\x91\x80\x2f\
-\xd8\x76\x3c\x8d\x6a\x1b\xe0\x73\x61\x1a\x98\x76\xee\xa9\xc1\xcf\
-\xc3\x58\xc7\x3b\x50\xff\x56\xdb\x4b\x8c\x0a\x9b\x7b\x84\xd2\x6c\
-\xbb\x74\xd4\xb8\x29\x5d\x46\x8e\x18\x11\x77\xf9\xe5\x97\xb7\xab\
-\xb7\x6f\xc6\xca\xb8\xe7\xc9\x98\x29\x9b\x6b\xae\xb9\x5a\x36\x7a\
-\xd4\xc8\x0e\xc3\xe2\x47\x75\x1e\x92\x30\xbc\x7b\x46\x9e\xa3\xa7\
-\xd2\x5e\x71\x23\x96\xf1\xfc\x22\x7b\x89\x17\xaf\x48\x9f\xc3\xbc\
-\x7d\x85\x57\x33\xbf\x29\xad\xee\xc3\xb8\xfd\x24\xf6\xdb\x5a\x36\
-\xff\x9c\xf3\xc2\xc8\xea\xa9\xc7\xb0\xb5\xb8\xfd\x24\x69\xfb\x18\
-\xee\x23\x85\xd9\x63\xd3\x16\xaf\x1f\x7e\xeb\xa2\x35\x3d\x86\x0e\
-\x19\x2a\x93\x80\x7f\x96\x18\x57\x51\x93\x26\x4d\x8e\x31\x9a\xd6\
-\x76\xc2\x4b\xbb\xc9\x08\xeb\x7b\xb0\xe2\x7f\xc0\xca\xad\x66\x2a\
-\x3f\x7a\x88\x60\x23\x22\xc7\x55\x63\x1c\x07\x10\xfc\xdb\xf0\x93\
-\x4c\xf9\x3c\x84\x9f\x56\xbd\x77\xdd\x42\x6d\x71\xd5\x20\x4d\x71\
-\x65\xaf\x15\x65\xe5\x9d\x7a\xf6\xef\x4f\xd3\x20\x8b\x8b\xe3\x3d\
-\x08\xc3\x4e\xf7\x9c\xa1\x86\x14\x2b\x8b\x8d\xe9\xd0\x21\x96\x8c\
-\x3c\x31\x1d\x3b\x76\x8c\x59\xb9\x7c\x75\x9c\xbb\xf2\xee\x6b\xe4\
-\xb6\xd2\x79\x2a\xb3\xa7\x12\x1b\xfd\x9b\xd8\xd0\x77\xb2\xa0\x0f\
-\x01\xf9\x50\x60\x09\x17\x26\x9a\x7d\x4d\x05\x7e\x24\xf1\x47\x3a\
-\xd8\x34\x15\xac\x01\xe1\xa3\x06\x7e\x53\x06\xb9\x48\xca\xab\xf1\
-\x7f\x52\xc7\xc4\xd1\xc1\xef\xfb\x71\x1f\xb9\x9a\x7b\x14\xbd\x7e\
-\xb9\xd6\x5b\x95\x6c\x2b\x29\x39\x5f\x21\x97\xc7\x74\xef\xd1\x83\
-\xb6\x9d\x38\xa6\xdd\x9e\x91\x76\xca\x59\xd0\x94\x0d\xe9\x38\xec\
-\xb4\x69\xaf\x4b\x7a\xc5\xe8\x74\xd6\x38\x8b\xb3\xe2\x62\xa3\xab\
-\xa2\x9f\xa5\xf8\xb6\x5b\x55\xb6\x12\x83\xd2\xea\xba\x17\xaf\x58\
-\xde\x54\x32\x57\xe1\xfb\x31\x7f\xa4\x7f\x12\x98\x47\x5c\x8e\x4c\
-\xdb\xf7\x1c\xc3\xef\x5f\x61\x79\x94\x9a\xbc\x6b\x87\x99\xad\xe5\
-\xdd\xc9\x94\x2d\x9d\xa2\x3d\xa3\xa5\x20\x59\xd4\xc6\xcd\xad\xdf\
-\xba\x3c\xb5\xab\xda\x51\x1a\x8f\x97\x6b\x15\xd8\x20\x76\xb0\xb0\
-\x6f\x21\xb0\x90\x0e\x44\x1b\xd6\x31\xec\xd4\xdf\xcb\xcd\xae\x67\
-\xe5\x16\x77\x89\xdc\xe8\xc8\xc2\x46\x33\xb5\xd0\xea\xee\x9b\xa5\
-\xb2\xf7\xca\xcd\x37\x76\xb9\xe9\xc6\x1b\x98\x74\xb1\xa0\x3f\x13\
-\x0d\x88\x3b\xd7\xc0\x01\x83\x62\xe4\x72\x6f\xc7\x35\x4a\x6b\x6f\
-\x95\xc5\x3d\x12\x2f\xe9\x15\x4a\x8b\xe7\x49\x4c\xf7\xcf\xd8\xd0\
-\x6b\x9a\x06\xdd\x96\x08\x23\x56\xe6\xd1\x1e\x17\x4d\x5c\xd1\x9e\
-\x23\x12\x18\xb7\x44\x7a\xa3\x69\x8b\x2d\x53\x66\x74\x3a\xd3\xea\
-\x3d\x44\x6e\xec\x2a\x2c\xae\xca\x3c\xa3\x6d\x81\xd2\xe2\xbe\x29\
-\x4b\x6f\xea\x9e\x30\x3c\xb9\x6d\x6f\xe8\xb2\xe7\xbc\x76\xf0\xe0\
-\x98\x79\x26\x53\xa7\x1c\x8d\xae\x67\xbe\xd9\x75\xbd\xc6\xee\x99\
-\x50\x60\x72\xa6\x63\x7f\x76\x61\x9a\xff\x85\x6d\x78\x33\x7b\xd5\
-\x52\x1f\xaa\x9f\x8a\xf7\x69\xbf\x30\xc4\xeb\xaf\x43\x4e\x7c\x81\
-\x57\x08\x26\xb9\xce\xd6\x6f\x62\xb1\xb7\x83\x2c\x31\x81\x49\x8d\
-\xf4\x82\xba\xf6\x6b\x5d\xbb\x76\x95\x25\x26\x25\xca\x56\x15\x14\
-\x5e\xa7\x71\x95\xba\x14\x56\xf7\x17\x58\x99\xa7\xb0\x61\x34\x44\
-\xd6\x21\x22\x05\xbe\xb7\x9e\xb9\x0f\x80\x71\xd3\x69\x22\xf7\x3e\
-\xd4\xf7\x4a\x8b\xeb\x69\xfc\x34\xa8\x2c\xde\xf9\x46\x57\xd9\xe0\
-\x94\xa5\xcb\x7b\x0e\x4e\x1e\xd5\x2d\x7e\xc4\x98\xce\x03\xc6\x8e\
-\xe9\xd0\x69\xc4\x08\x7a\x89\xda\xca\xc5\x20\xeb\x3f\xe0\xe6\xb8\
-\x99\xf3\x96\x75\x53\x99\xcb\xae\xc3\xf4\xa5\x60\xfe\xef\x46\x7d\
-\x8d\x3a\x8a\x9d\x1d\x2f\xf1\xb9\xb9\x4d\x09\xf8\x4d\x4b\xd3\xd9\
-\x0c\x7c\x3a\xd5\x43\x00\x87\xfd\xc2\xfb\x1b\x6e\x7b\xbd\xc0\xe4\
-\xd2\x17\xb9\xca\x93\x17\x64\xe4\xf6\x4c\x4c\x48\xea\x78\x53\xdf\
-\xbe\xb1\x67\xa0\x9d\xfa\x06\x95\x01\x03\x06\xc8\x46\x8d\x1e\x15\
-\x97\x30\x7a\x6c\xa7\x11\xe3\x26\x74\xd3\x39\x9d\x17\xca\xad\xae\
-\x7e\xe8\xc9\xcf\xc1\xf6\xab\x51\x58\x5d\x8f\x61\x3a\xbf\xc1\xb4\
-\xff\xa9\xa2\xfd\x8d\xf6\xe9\x3a\xa6\x5f\x37\x0f\xf8\x4a\x06\xf8\
-\xc4\x81\x3b\x8a\xbc\xf8\x48\x6e\x76\xae\x96\x17\x97\x5f\x9e\xb2\
-\x72\x75\xc7\xce\x1d\x3b\xb0\xe9\x6c\xed\x92\x90\x2c\x2a\xe3\x7e\
-\x94\xe3\xd2\xcb\x2f\x93\x79\xd6\xdd\x76\x4d\x91\xad\x38\x13\xe1\
-\xfb\x3e\x36\x6a\xbc\x5c\xe3\xc1\xde\xef\x72\x3b\x4a\x85\x3c\xd6\
-\x4d\x3a\x52\x8d\x8a\xce\x87\xbb\x37\xe3\xb6\x77\xd1\xdb\x7f\x48\
-\xeb\xae\xd0\x98\x4b\x6f\x9b\x6f\xf0\x54\x0e\xd3\x96\x6f\xe8\x39\
-\xd1\xe6\x20\xae\x53\x4c\x87\x0e\x1d\x62\xe2\x62\xfd\x1f\x88\x69\
-\xf2\xbc\x21\x7b\x39\x4c\x1e\x9a\x8a\xeb\xc4\x34\xd0\x5c\xb5\xf1\
-\x02\x73\xf9\xfa\x89\x0a\xab\xd3\x8d\x69\x7b\x1d\x1b\xf5\x4f\xd8\
-\xb9\x4f\xf9\xe5\xa1\x39\x65\xd1\x22\x65\x76\x26\xc5\x76\xf4\x48\
-\xd2\x23\x16\x26\xda\xbc\x34\x35\x7c\x44\xe9\x8e\x00\xf8\xe1\xce\
-\x8f\xdb\x95\x16\x7a\xdf\xe6\x00\xc6\xf5\x0d\x5e\xfd\x3d\x82\x57\
-\xc5\xe9\xd6\xe2\xca\x1b\x33\x8a\x8a\x3a\xde\x74\xd3\x4d\x8c\x83\
-\x8b\xed\xaa\x25\xbc\x7d\xee\xe1\x47\x6e\xda\x26\x2e\xb6\x63\x4c\
-\xa7\x4e\x9d\xe9\xbe\x25\x4b\x97\xc6\x7a\xd7\xad\xbb\xc8\x50\xba\
-\x7e\xa0\xb1\x7c\xfd\xec\x42\x9b\xb3\x50\x45\x9c\x14\x8b\xeb\x1d\
-\x6c\xbb\x5f\x29\x6d\xee\xdd\xa4\x7f\x05\x4f\xd7\x34\xa3\x2d\xf8\
-\x6f\x6f\x60\x06\x42\x0f\x96\x85\xe7\x79\xec\xbb\x2b\x6c\xce\xe2\
-\xf3\x57\x2c\x5f\xce\x24\x5d\x22\x7e\xfb\x31\x6c\x39\xf4\x73\xf0\
-\xfc\x79\x71\xd9\x76\xe7\x45\x85\x26\xc7\x12\x85\xd9\xfd\xa2\x8a\
-\xa9\x3c\x5a\x99\x82\x9d\x40\xa8\x43\x84\xea\x24\xa1\x41\xd0\xe0\
-\xdb\xce\x86\xc1\xc6\x73\x58\x61\xf1\x7c\xa1\x30\xb9\x9e\xc1\xcb\
-\xd0\x32\xa5\xc9\x9d\x56\x64\xb4\x4f\x2c\x30\xd8\xfb\x17\x98\x4b\
-\x7a\x2f\x5a\x9e\x4e\xe9\xec\xdf\x98\xa2\x7f\xe9\x15\x77\xfc\xca\
-\xdc\x5c\x59\x8e\xd5\x76\x5e\x81\xde\xdc\xaf\xd0\xe4\x5a\x26\x37\
-\xbb\xee\xc1\x34\x7c\xaf\xb2\xba\x6b\x94\x5c\xfa\x1a\x3f\x5b\x47\
-\x62\xe5\x15\xed\xb1\xd1\x1c\x1f\x0e\x76\xa1\x8e\x6b\x89\x7c\x8a\
-\xb5\x8d\x48\xda\x98\xd5\xdb\xf4\x34\x84\x3b\x5f\xf4\x79\x3e\xa8\
-\xb4\xb8\x5f\xc3\xf6\x6a\x2a\xb4\xba\x26\xaa\x1d\xae\x2b\x52\x6c\
-\xd6\x8e\x1d\xcf\x3b\xaf\x05\x7a\x69\xe3\xb4\x08\xf3\x62\xb7\x98\
-\x98\x89\x93\x57\xc5\xaa\x1d\x15\xbd\xb2\x74\xd6\x9b\x0b\x4c\x36\
-\xf2\xb0\xdf\x2a\xb9\xc5\xed\x29\x34\xbb\x9e\x40\xa7\xe9\x23\x84\
-\xfc\x1e\xbf\xf6\xca\xf5\xe5\xe6\x96\x4b\x88\x76\xc2\x5c\x35\xb8\
-\xf7\xe1\xf7\x47\xd5\xd6\x92\x09\xb9\x05\xa6\x0b\x5a\x20\xf3\x92\
-\xb5\xa4\x9d\x87\x0d\x72\xec\xe8\xd1\x31\x4b\x33\x32\x2f\x28\x72\
-\x95\x8e\x53\x30\xa0\xdb\x8f\x15\x57\x17\x49\x63\x27\x5e\x03\x7a\
-\x11\x54\xcd\x81\x17\x9e\x0f\xe3\x70\x33\x37\x78\x19\x91\xf3\x9f\
-\xc4\xff\x8f\xa2\x7e\x53\x59\xdc\x9f\x61\x87\x7a\x02\xe1\xef\x54\
-\x39\x8b\x17\x66\x69\xec\x7d\x47\x8c\x1d\x7f\xe1\xf0\x09\x53\xce\
-\x1b\x3e\x6e\x4a\xe7\x11\xc9\x49\x71\x3d\xba\x77\xf7\x5b\x2d\x11\
-\xca\xb3\xe0\xd6\xfc\xf7\xb8\xe4\x12\x59\xc2\xa4\x89\x9d\x56\xa9\
-\x34\x97\xa0\xb7\x36\x92\xc4\x8f\x1e\xca\x7f\xf1\x9c\xe4\x6a\xa3\
-\x9a\x4e\xdf\x58\x5a\x19\xf4\xcd\x80\x28\x2d\x37\x56\x82\xfb\x2d\
-\xdc\x7e\xa6\xae\x84\xce\xe9\x57\x7f\x36\x8f\x68\x78\xfe\xb9\x48\
-\x5d\x35\x27\xaf\xbc\xfa\x0e\xde\x66\x13\x49\x6b\x90\x22\x07\xbe\
-\xd2\x4f\x6e\x5f\xb9\x44\x53\xbe\xa2\x65\x8c\xed\x15\x3d\xfc\x3a\
-\xd4\x51\x6c\xa7\x5b\x55\x16\xd7\x23\x72\x8b\x2b\x55\x6e\x75\xf4\
-\x1d\x3f\x7d\x4e\xb7\x2b\xfa\xf6\x8d\xe3\xda\x5c\x24\xee\x48\xe0\
-\x52\xcf\xb8\xb8\x6e\xb2\xf8\xa1\x4b\xe2\xc6\x4c\x9c\xd4\x69\xd4\
-\xf8\x49\x3d\x12\x46\x8e\xb9\x20\x35\x5b\x7e\x8d\xc6\x51\x36\x17\
-\x9d\x33\x1b\x9e\xff\x31\x4c\xc7\xc7\x58\x1e\xbb\x98\x69\x47\xcf\
-\x09\xdc\x56\x4b\xd3\x45\xe5\xdf\x17\x03\xf3\xc4\xd5\x77\xb3\xdb\
-\x2f\xe9\x27\x16\x4f\x2d\x96\xc3\x16\x95\xad\x78\x3d\x5e\x29\xc7\
-\x0f\x9f\x3a\x23\xee\xc2\xbf\x5d\xd1\xae\x56\x31\xfd\xa5\xed\xe2\
-\x8b\x2e\x8a\x75\x7a\xcb\xba\x28\x2d\x25\xc3\x10\xf6\x9b\x94\x56\
-\xd7\x0e\xf4\x16\x4e\x07\x35\x6e\x31\xe0\x5b\x58\x35\xb3\xb1\xd0\
-\x0e\x68\x11\xee\x88\xf8\x7f\x3d\x6e\x3f\x81\x8d\x7b\x0f\x02\x79\
-\x2b\x5e\xaa\xbe\x5b\x64\x73\xdf\x6f\x2e\x5d\x67\x35\x96\xae\x5f\
-\x66\xf0\x6e\x18\x6c\xaf\x74\x5e\x78\xc3\xc0\xa7\xb1\x45\x5d\x19\
-\xd3\xa5\x6b\xac\x0c\x2f\x77\xe9\x13\xbd\x78\x49\x2d\x33\x07\x0f\
-\x0e\x00\x00\x20\x00\x49\x44\x41\x54\x23\x0f\x91\x71\xab\x27\xc8\
-\x27\xb9\x39\xdd\x11\xb7\x63\xf6\x65\x7d\x07\x0d\x8a\xb5\x6f\xdc\
-\x74\xbd\xca\xe4\x5c\x85\x71\x3f\x8c\xe7\xfb\x96\x0c\x32\x38\xe0\
-\xd4\x37\xbb\x03\x9c\x01\x45\x04\x7c\x4b\x58\x60\x05\x83\x57\x00\
-\x02\xbe\xed\x6c\x9c\xcd\x4e\xb7\x45\xec\xbc\x91\xc1\x38\xba\xf3\
-\x79\xfc\xd2\x1e\x69\x1e\x22\x2a\x3f\x5f\x7c\x9e\x06\x6c\x43\x08\
-\x3c\xd7\xef\x4a\x9b\xeb\x9d\x02\xa3\xc3\x65\x5f\x77\xe7\xb8\x5b\
-\x52\xe6\x77\x23\x7d\xad\x53\xf7\xee\xa4\x61\xca\x3a\xb0\x0f\x35\
-\x72\x46\xdb\x25\x99\x52\x64\x44\xdb\x6d\xc7\x0e\x1d\x65\x9d\xba\
-\x74\x95\x91\x69\xf0\x0b\x2e\x7a\x34\xa6\xc0\xfa\xf0\x79\xe6\xb2\
-\xaa\x9b\x8d\x25\x55\xf3\x4d\x65\xeb\x75\x1a\x67\xc9\x5d\xe8\x98\
-\xbc\x85\xe7\xdf\x82\x6d\xf5\x0f\x4c\xdb\x71\x3c\x7f\x7d\x63\x7e\
-\x03\xca\xf2\x4c\x00\x9f\x11\x71\x8e\x4e\x61\x9c\x5f\xe3\xd5\x8e\
-\xd6\xb6\xe1\xde\x9b\x87\x8c\x1a\x47\x7f\xe6\x8d\xfb\xb5\x37\xc9\
-\xda\xc0\xb8\xd1\xb6\xdf\x80\xfe\x32\x85\xc5\x71\x83\xc2\xe8\x56\
-\x60\xa3\xfd\x5a\x61\x75\xd5\xb3\x9e\x81\x68\xe7\xf3\xdb\x67\xf1\
-\x87\xbe\x4f\x01\x00\x0f\xd7\x89\x85\x80\xcf\x1e\xd3\xe0\xdf\x51\
-\x5d\xe8\x49\xb8\x4f\x63\x63\x3f\x28\x37\x3a\xbe\x57\x18\x9d\x2f\
-\x2a\x2c\xce\x52\xfc\x3f\xbd\xd0\xb4\x6e\x92\xdc\xe8\xea\x97\x6d\
-\x34\xf6\x5a\x23\x97\x77\xfc\xdb\xe5\x97\xfb\xe5\x55\xc6\x7b\xf1\
-\xc7\x88\x31\xa3\xb0\x13\xd9\xcf\x57\x18\x1d\xf1\x72\x93\x53\x8d\
-\x1d\xf5\x25\x85\xc5\xb3\x37\x10\xf4\x42\x69\xf7\xf3\x14\x05\x3a\
-\x0e\xdf\x3b\xf6\x2f\xab\xe0\x32\x09\x2a\x03\xc1\x38\x03\xe3\x8f\
-\x24\x9c\xf8\x39\x03\xd3\xe9\xb7\x3f\x28\x6c\x30\xe8\x03\x61\x19\
-\x38\x08\x08\xa5\x43\x70\xbb\x50\x7e\x43\xa6\x85\x3d\x07\xb6\x35\
-\x95\x45\xa0\x6c\xa3\x2d\x8f\x08\xda\x66\xa8\xf2\x13\x0c\xc3\x88\
-\xb4\xd9\x6a\xfc\xdc\x2c\x37\x3a\x6f\x57\x98\x9d\xb3\x8b\x74\xf6\
-\xab\xe6\x97\x55\x75\xea\x7c\xcb\x34\xa6\x03\xf2\x56\xaf\x04\x5e\
-\x91\x76\xef\xd6\x35\x66\x59\xda\xea\xb8\x6c\x93\xe9\x42\xb9\xd1\
-\x76\xbd\xc2\xb4\x7e\x6c\x81\xd9\xb6\xa2\xd0\x6c\x73\x61\x5b\xfd\
-\xbf\x42\x93\xe3\x4b\xbc\x82\xd8\x4b\xaf\x2a\x02\xeb\x47\xa4\x2c\
-\xc3\x03\x5f\x5c\xa2\x7d\xdf\xaf\x1d\xf9\xb6\x71\xec\x38\x81\x7d\
-\xf5\xad\x42\x83\x23\x5b\xee\xf2\xf6\x9e\x97\xba\x2c\x8e\x9f\x47\
-\xc9\xce\xa0\x71\xd3\x19\xd7\x0c\x18\x10\x6b\x72\x97\x9d\x27\x37\
-\xb9\x16\x29\xcd\xce\x97\xb1\x71\xec\x53\x90\xc6\xca\x28\x64\xe7\
-\x10\x6c\xf8\xc2\x8d\x3f\x64\x43\x14\xed\x88\xc2\x62\x2f\x51\xdd\
-\xf5\x38\x30\xd5\x61\x5a\x6b\x94\x66\xd7\x31\xdc\xfe\x07\x1d\xac\
-\x2c\x8e\xa7\xe5\x56\x97\x19\x3f\xe7\x28\x1c\xce\x81\x39\x0a\x55\
-\xef\xe1\x63\x26\xf6\x18\x3d\x66\x5a\x97\x71\x63\xc7\x76\xb8\xe8\
-\xa2\x0b\x65\x43\x86\x0e\x91\xdd\xb2\x68\x49\xa7\x5c\x83\xb5\x67\
-\x9e\xc9\x3e\x16\x3b\x4e\x05\xea\x7f\x78\x3c\x7a\x48\x6e\x72\x39\
-\x5a\x2f\x98\x6e\xbf\x6d\xa1\x07\xb5\x88\x40\xe3\x17\x57\x54\x65\
-\x20\x5e\xbe\xd1\x84\xb5\xf2\x06\xea\x48\xeb\x4b\x2c\xaf\x91\x1e\
-\xd7\x9c\xbc\xf1\x07\x15\x31\xe0\xb7\xe4\xb9\xc2\xd6\x9b\x5b\x14\
-\xf8\xe8\x3c\x90\xfe\x83\x4e\x89\xab\x5a\x69\x76\xef\x42\x27\xe2\
-\x39\xb9\xd9\xb9\x46\xed\x28\xbf\x69\xd1\xaa\xac\xf3\xc6\x8e\x1e\
-\x17\xd7\xb1\x53\xa3\xb7\xdb\xad\x6b\x57\x59\xc2\xd8\xb1\x71\xa3\
-\xa7\xdf\xd2\x79\xc4\x98\xb1\xdd\x97\xa5\xad\xe9\xa9\xb2\xbb\x6f\
-\x92\x9b\xed\x53\xb0\x7e\x94\x2a\xab\xe3\x9f\xf8\x89\x6d\xd4\xb5\
-\x1b\xe3\x3d\x82\x22\x83\x49\x2d\xb6\xff\xd3\xbc\x3e\x11\x61\x9e\
-\xfc\xdb\x1b\x2d\xcb\x40\x98\x37\xb3\x7e\x68\x19\x98\xdd\x75\xd8\
-\x37\x8f\x2a\xcc\xae\x27\x15\x36\xd7\x14\x85\xc3\x7d\xd1\xc0\x01\
-\x03\x68\x7e\xa5\x07\xb3\xce\xb0\x61\x6b\xa3\x9f\xb7\x2e\x4b\xeb\
-\xa1\xf1\xae\x9d\x58\x60\xb4\xdf\x83\x8d\xf3\x4f\x6c\x50\x75\x51\
-\x77\x88\x48\x81\x2f\x04\xa5\xa6\x74\xd8\x80\x63\x30\xdd\xf8\x49\
-\x3a\x98\xab\x1a\x1b\xd9\x3e\x6c\x64\x5b\xe8\x1c\xbc\xc5\xf5\xa8\
-\xda\x56\xac\x37\x7a\xd7\xcd\xd2\x39\x4a\xfb\xa9\x1d\xeb\x2e\xbc\
-\x75\x59\x56\x5c\x8e\xc9\xd0\xc1\x50\x5e\x75\x05\xa6\x77\x19\x1e\
-\xff\x30\xc2\x7e\x0b\x7e\x9e\x88\xa6\x31\x47\x0c\xfc\x88\xf2\x23\
-\x3c\xd5\xd0\xa4\x4e\x17\x55\xd8\x30\xc0\x8f\xb8\xfe\x9b\x99\x96\
-\x26\x00\xc5\x0f\xf8\x2d\x79\x9e\x70\xf5\x1e\xb0\x3f\x84\x87\xcf\
-\xd7\x69\x6c\x93\x7b\xb1\x6d\xbe\x8f\x8e\x55\xb1\xc6\x56\x32\xda\
-\x64\x2b\x3f\xff\xfc\x0b\x2e\x8c\xe9\xd4\xb9\x4b\x4c\x97\xee\xdd\
-\x62\xe6\xcf\x9b\x1f\x6b\x2d\x2e\x3e\xdf\x50\xb6\xfe\x06\x53\x71\
-\xd5\x14\xb5\xbd\xb8\x10\xc3\xfe\x1d\xdb\xf6\x9b\xd8\x96\xc9\x0a\
-\x20\xe2\xd0\x9c\xc2\xff\xeb\x99\xf6\x1e\x7d\x5a\x5b\x0d\xf8\x62\
-\xc7\x98\xb1\x4f\x9a\xa9\xe3\xf8\x23\xe6\x61\xa3\xda\xe4\x1e\xe2\
-\xb0\x3b\x64\x7d\x6f\xe8\xeb\x7b\x56\x41\xb2\xd6\x36\xf6\x72\xaa\
-\xd3\x05\x17\xc8\x96\x7a\x3c\x1d\x55\x26\xe7\xcd\x72\x93\xbb\x04\
-\x2b\xe4\x5b\x25\xe3\x2d\x44\x5e\xa1\xad\xe1\x5d\xb5\x90\xb0\x73\
-\xd5\xab\xcc\xee\x83\xe8\x5d\x7c\x5a\x68\x72\x3e\x26\x37\xda\xdd\
-\x05\x06\xc7\x4a\x85\xd5\x33\xae\xd0\xe2\x1c\x23\x37\x3b\x72\x30\
-\xcf\x4f\xa1\x7e\x67\xe6\x5c\xa3\x6c\xd0\xe1\xf2\xdc\x9c\x72\x69\
-\x6a\xb9\xb6\x60\x3d\x28\x2c\xcc\x40\xea\x2f\x76\xbb\x15\xbf\x5b\
-\xdd\x8c\x82\xf6\xf3\xc2\xb5\x83\x76\xd0\xea\x8a\xb4\x9e\x10\x7c\
-\x58\x1e\x27\xf1\xfb\x37\xd8\x36\x37\x16\x9a\x9d\x33\x0b\x0c\x9e\
-\xab\xf3\x8d\xce\x4b\x94\x4e\x67\x1f\x74\x4c\x46\x2a\x4d\xce\xa5\
-\x72\xa3\xcb\x8a\xed\xf5\x01\x6c\x9f\xef\x62\xdb\xdd\x8d\xaa\x0b\
-\x38\x5f\x68\x4f\xbe\xb5\xf3\x11\xbd\x08\xf4\x4f\x62\xde\xbf\xc8\
-\x37\xd8\xf2\xb5\xce\xaa\x3e\xfd\xfa\xc7\xd3\xa9\x1d\x09\xf8\x67\
-\xc0\xb8\xf9\xb3\x9b\x6f\xb9\x25\x56\x63\xf7\xf6\xc1\xc6\xb7\x06\
-\xbd\x87\x4f\x14\x66\x72\x67\xdd\xed\x9b\xca\x68\xec\xb4\x02\xde\
-\x44\x13\x25\x04\x82\x96\x3e\x87\x92\x9b\x8e\x32\xd3\xbc\xd4\x51\
-\xaf\xdf\xe2\x22\x9e\xd1\x3e\xfc\xfe\xb9\xc2\xec\x7c\x14\x2f\xad\
-\xef\x47\xaf\xfe\x2b\x04\xd6\x21\x05\x73\x59\x5c\x2f\x06\x59\x3e\
-\xd0\xc2\xe7\xcd\xd5\xb2\x90\xb3\x8a\x9c\x3f\xca\x8e\x19\x98\x26\
-\x5f\x7c\x56\x17\x73\x0e\x33\xaf\x6e\xc8\x77\xb3\x8b\x0a\xcb\x08\
-\xe5\x04\x2c\x2f\x9e\x1c\xcc\xa7\xc9\xc1\xca\xc9\x88\x6c\x27\x61\
-\x7d\xe2\xd2\xcc\xa4\xdb\xef\x1c\xfc\x72\x35\xbb\xce\x8a\x41\x22\
-\x5c\xfa\x22\x6a\x27\x66\x3a\xc5\x43\x56\xce\xec\xc7\xb2\x7f\x02\
-\xcb\xa4\x10\xbd\xed\x45\xb8\x4f\x85\x65\x88\xde\xbc\xfb\x43\xdc\
-\x86\x9e\xbc\x8b\xac\x4c\xab\x46\x91\x25\x8e\xf5\x4a\xde\x14\x6b\
-\x54\xfd\x52\xa4\x9d\x44\xda\xa6\xc5\xc2\x47\x52\x57\x81\x61\xf0\
-\xd8\xc3\x58\xd7\xaf\xa8\x9d\xc5\xab\xe7\xad\x58\x79\xe1\xd0\x61\
-\xc3\x7c\x2f\x68\x96\xac\x95\x8c\x7b\xb7\x46\x9f\x09\x13\x62\x73\
-\xaa\xd6\x75\xc7\x46\x36\x8f\xac\xb7\xc7\x0a\xd9\xcf\x56\x54\x83\
-\x7f\x85\x45\xde\x28\xa2\x6b\x38\x02\xf0\x69\xd5\xce\x8a\xe0\x32\
-\xd3\x4b\x61\x72\x13\x69\x37\x7e\xfe\x46\xbe\xcb\x19\xaf\x8b\x49\
-\x8f\x18\xf0\xcd\x8d\x50\x0a\x0f\x04\x97\x2f\x7c\x8b\x00\xc5\x1a\
-\x00\x46\x2e\xde\x28\x80\x2f\xd4\x31\x1b\xe3\x64\x41\xcd\x41\x9b\
-\x93\xc1\x8e\xb2\x41\x21\x4a\xae\xb7\x82\x5c\x47\x64\x81\x42\x2a\
-\x33\x14\x6a\x51\x1a\x13\xc8\x89\xb4\x26\xe6\x7f\xb2\x5d\x6f\xc1\
-\xf0\xac\x0c\x56\x3c\xde\x4a\xe3\x91\x1b\x79\x83\x03\xf9\x8e\x52\
-\x98\x1d\xf4\xfc\x8d\xc0\x77\xf9\x95\xf5\x99\x68\x17\x4d\x6b\xbb\
-\x2e\xd1\xed\x51\xa4\x99\xdc\x7f\xfa\x13\xc3\x7e\x85\xdf\x3f\x40\
-\x6d\xa6\x6d\xd2\xec\x3a\xa6\xe0\x9c\x2e\x51\x07\x24\x8a\x3e\xd3\
-\x0c\xe0\xf3\xdb\x5b\x30\xf0\x83\xfb\xb1\x58\x5b\x6e\x0c\xe3\x22\
-\x83\xdd\x81\x42\xa3\xe3\x21\x63\x69\xd5\xf8\x2c\x75\xd1\x05\x31\
-\x5d\xba\xc4\xc4\x48\xab\x76\x5a\xcf\xb8\xf7\xe4\x8c\x9b\x35\xab\
-\x8b\xce\x53\x9a\x98\x6f\x74\xac\xe5\xcf\xdb\x37\x56\xaa\x40\x27\
-\x34\xbb\x44\x2a\x52\x08\x58\x3c\xcf\x4e\xa0\x43\x30\x5e\x24\xe7\
-\xf5\x45\xd6\x89\x02\xbd\x40\xf1\x30\x82\x6a\x10\xf6\x50\x84\xc3\
-\x8b\x01\x3f\xa2\x74\x46\x08\x7c\x85\x40\xdc\xfe\x1e\xaf\x70\xbc\
-\xfe\x53\x27\xae\x00\xcf\x99\x9f\x4e\xb6\x1e\xc9\x31\x08\x5b\x2a\
-\xa3\x0d\x14\x86\x46\x15\x22\xc8\x0b\x10\xe2\x05\x08\xeb\x02\xad\
-\xc5\xa7\x3c\x04\x7e\x2e\x2a\x1b\x01\x9d\x6d\xf6\x40\xa6\xb5\x18\
-\xd6\xd8\x4b\x61\x8d\xb3\x0c\x32\x9c\xe5\x28\xee\x13\xe5\x2a\x87\
-\x74\x22\xdc\x46\xf6\xaf\x71\x94\x42\x96\xad\x04\xb2\x2d\x1e\x3c\
-\xd6\x05\x39\x18\x4f\x9e\xde\x06\xf9\xe4\x5c\x24\x7e\x0d\x39\x17\
-\x37\x38\xe0\x80\xa0\xf7\x4f\x93\xc2\xc8\xa6\x95\x0c\x06\xd1\xd4\
-\xb1\x50\x59\x8a\xd4\x6b\x64\xdb\x23\x69\x6b\xee\x80\xfe\x21\x0c\
-\x51\x81\xb8\x78\xed\xb1\xf1\x7b\xf8\xf6\x2a\xdc\x66\x22\xe9\x3b\
-\x41\xfb\x84\xca\x8a\xdf\xc7\xb9\x76\x6c\x16\x2a\x97\xc0\x32\x0a\
-\x51\x1f\xc1\xda\x52\x68\x74\x96\x29\x74\x96\xc1\xb7\xac\x5d\xdb\
-\x21\x6e\xc0\x00\xc6\xc9\x97\xa6\x77\x5a\xde\xba\x76\xed\x22\x9b\
-\x35\xe3\x56\xd9\xca\x6c\xe5\xdf\x54\x0e\x8f\x16\xbd\xae\x0f\xb1\
-\xc2\xaa\x83\x1a\x6e\x24\x8a\x0e\xb8\xe2\x8d\x80\x3b\x77\x74\x8d\
-\xa6\x65\xd2\x1a\x2a\x7c\xa4\xf1\xb4\xd4\x39\x23\x2a\xdb\xc6\x0e\
-\x26\x37\x73\xe2\x79\xc9\x26\x22\x27\x0b\x77\xd6\x93\xe6\xbc\x75\
-\x04\x2c\xf1\xc4\x0b\xf0\x33\x1f\x21\x9b\x67\x70\x20\xd0\x5d\x90\
-\x89\x40\x5f\x63\x2f\x86\x0c\x04\x7a\xba\xa3\x1c\x56\xbb\x2a\x61\
-\x45\xe9\x6d\x90\x5a\x79\x27\x2c\x5d\xff\x0f\x58\x7c\xfb\x43\xb0\
-\xf0\xee\x7f\x42\xca\x3f\xfe\x05\xf3\xef\x7f\x1a\xe6\x3d\xf0\x0c\
-\xcc\x7b\x10\xf5\xd0\x0b\x30\xef\xe1\x17\x60\xee\xc3\xcf\xc3\xdc\
-\x87\x9e\x85\xb9\xb8\x7d\xfe\x7d\x4f\x63\xb8\x27\x31\xfc\xa3\x78\
-\xdc\x03\xf4\xf8\xd4\xca\xbb\x60\x65\xc9\x46\x58\xed\xae\xa2\xf1\
-\x67\xd8\x70\xb0\xc0\x01\x24\xd3\xe2\xa5\xe7\xcf\xc5\x34\xe6\xeb\
-\xad\xcc\xa0\xa3\x63\x07\x01\x72\x55\x40\xe1\x6f\xf7\x0d\x56\x8d\
-\x53\x47\x4c\xbe\x9b\xdd\x0e\x22\x09\x1b\x49\x5c\x62\xc7\x89\x0d\
-\x1e\xc1\x71\x34\x44\x97\x0f\xde\xb4\x5b\x53\xda\xb5\xd0\xe0\x18\
-\x55\xd9\x09\xe4\x23\x92\x72\x61\x44\xf2\x7a\x12\xeb\xf1\xb3\x02\
-\xbd\x75\xb5\xa1\xb4\xec\xb2\xeb\xfb\xf7\x93\xde\x9f\xdf\xd2\xc6\
-\xcd\xdb\x5f\x7e\xf9\xdf\x64\xee\xd2\x3b\x2e\x2a\xb2\x97\x4e\x2f\
-\x30\x3a\x5e\x56\xb0\x97\x90\xed\x02\xf8\x42\x71\x36\xb5\x63\x87\
-\xea\xc0\x91\xc4\x1d\x29\x10\x9a\x02\xf0\x66\x95\x6d\x20\xf0\xb9\
-\x69\x18\xf6\x7f\x02\x78\x84\xa6\x42\x63\x04\x85\x5a\x0f\x72\x95\
-\x1e\x0a\x8a\x4c\x90\x87\x9e\x75\x36\x42\x3e\x0b\xc3\x66\xd8\xbc\
-\xb0\xda\x53\x09\xa9\x55\x77\xc1\xa2\x3b\x1f\x46\x88\x3f\x05\xb7\
-\x3e\xf6\x32\xcc\x7c\xea\x6d\x98\xfe\xc2\x07\x30\xf5\xd5\xcf\x60\
-\xf2\x5b\x5f\xc1\xa4\xff\x7c\x03\x13\xde\xdb\x02\x13\x3e\xf8\x01\
-\xc6\x7f\xf4\x23\x8c\xfd\x74\x27\x8c\xfd\xec\x67\xd4\x2f\x30\xf6\
-\xf3\x5d\x30\xf6\x7f\xbf\x36\x8a\xfc\x4f\xb6\x7f\xfa\x33\x8c\xfb\
-\x64\x27\x0d\x3f\xe1\xfd\x6d\x30\xf1\xbf\xdf\x63\x3c\xdf\x62\x7c\
-\x9b\x31\xde\xcf\xe1\x96\x17\x3f\x82\x59\x4f\xbf\x03\x73\xfe\xf9\
-\x32\x0e\x0e\x4f\xc1\xe2\x4d\x0f\x63\x3a\xee\x84\x55\x98\x9e\x0c\
-\xab\x87\xa6\x8f\x5e\x11\x10\xf8\x63\x1e\xe4\x98\x07\x85\xda\x80\
-\xf9\x31\xd1\x29\x25\x3a\xd5\x64\xe6\x0d\x72\xcd\x69\xb3\x91\xb6\
-\x97\xe6\xb6\xb9\xf0\xc0\x8f\x32\xde\x16\x04\x7e\x34\xf9\x6c\x21\
-\xe0\xb3\xf7\x82\xf6\x14\x18\xec\x0f\xe9\x8b\xcb\x6f\x19\x9c\x90\
-\xd0\x31\x4e\xc6\xfd\x0a\x97\x64\xcd\x36\x0e\xf6\x57\x5c\x7e\x59\
-\x4c\x91\x46\x1b\x5b\x60\x72\xc7\x17\x9a\x1c\x15\x08\x8a\x9f\xb9\
-\x4a\x68\x7e\x83\x8e\xb2\xe1\xb5\x24\x1c\x5b\xb2\x93\xb6\xd4\x60\
-\xd3\xd2\x83\x55\x80\x1a\x61\x8f\x1e\x30\x7a\xc4\x0a\x8d\x19\x14\
-\x45\x04\x90\x06\x04\xbc\x01\xf2\x10\x90\x39\x3a\x1b\x7a\xd1\x1e\
-\x58\xed\x5d\x0b\xa9\x6b\x09\xdc\x1f\x81\xf9\xe8\x85\xcf\x79\xfc\
-\x65\x98\xf1\xec\x3b\x30\xed\xe5\x8f\x61\xf2\xdb\x5f\x51\xa0\x8f\
-\xf9\x6c\x17\x8c\xfa\xea\x0f\x18\xf9\xfd\x01\x18\xfe\xc3\x51\x48\
-\xfe\xf1\x04\x24\xff\x74\x0a\x92\x38\xed\x3c\x05\x89\x3b\xab\x21\
-\xe9\xe7\x6a\x48\xfc\x99\x7c\xd6\xb0\xaa\xe5\x7d\x47\x91\x30\x9c\
-\xf0\xb8\xe4\x9f\x4e\x32\x22\xf1\xfd\x70\x0c\x46\x6e\x39\x04\xa3\
-\x37\xef\xa1\x83\x03\x19\x10\x26\xbf\xb9\x19\xa6\xbd\xf4\x31\x4d\
-\x0f\x49\x17\x49\xdf\xe2\xbb\x1e\xa1\xe9\x5d\xe5\xa9\x82\x35\x08\
-\x96\x1c\x72\x35\x42\xae\x4c\x30\x7f\x85\xfc\x01\x80\xdc\x1f\xe0\
-\xdd\x4c\x6e\xb3\xfa\x89\xd4\x81\x10\x02\x6d\x73\xfb\x49\xb4\x79\
-\x6b\x11\xe0\x37\xe1\x1c\x01\xdb\xb1\xbe\xaa\x15\x66\xe7\xb6\x42\
-\xa3\xc3\xa3\xf5\x94\x5e\xbf\x3c\x23\xa3\x13\x9f\x55\x92\x35\xc3\
-\xb8\xb7\x60\x4e\x9e\x3d\x3b\xce\xe0\xf6\xf4\x2c\x30\xd8\x32\x10\
-\x18\x9f\x2a\x88\x77\xdf\x6c\xf0\x08\x77\x38\xff\x55\x1d\x8d\xfb\
-\xe5\x3c\xf9\xc3\x8b\x5b\x11\x42\xb6\x39\x41\xd1\x54\x0f\x2e\x64\
-\x5a\xfd\xa7\x41\x02\xd3\x2d\x94\xb6\xa8\xe2\xb7\x34\xae\x68\x89\
-\xa4\x8c\x22\x3d\xa7\x5f\x39\xa2\x07\x8c\x83\x35\x14\x12\x4f\x17\
-\x41\x48\xbd\x5e\xad\x09\x0a\x08\xe8\xd1\x9b\xcf\xc1\xff\xc9\x74\
-\xc9\xca\xe2\x0d\xb0\x64\xc3\x7d\xe8\x45\x3f\x09\xb3\x9e\x78\x8d\
-\xc2\x7d\xe2\x7b\xdf\xc3\x98\x2f\x7f\x87\x11\xdb\x0e\xc1\xf0\x1d\
-\xc7\x21\x79\x07\x03\xf5\x64\x02\x73\x84\x75\x22\xc2\x3b\xf1\x17\
-\xd4\x2e\xa2\x3a\x9f\x92\x7e\x21\xaa\x0d\xd6\xcf\x3c\x09\xed\xc7\
-\xe3\x12\x7f\xa9\xf3\x8b\x8b\xc6\xcd\x0e\x12\xf4\xdc\x3b\x38\x9d\
-\x84\x11\x5b\x0f\xc3\x68\x4c\xdf\x04\xbc\x2a\x98\xf6\x6f\xbc\x12\
-\x78\xe2\x55\x98\x7f\xef\xbf\x68\x3e\x56\x96\x6c\x80\x74\x5b\x31\
-\x64\xe9\xac\x90\xaf\x32\x50\xf0\x17\x92\x01\x80\xde\x1c\x26\x37\
-\x85\xed\x58\x2e\xf6\x80\x3a\x0e\xbe\x12\x08\xde\x1f\x06\x52\xbc\
-\xfd\x4d\x1e\x5c\xc2\xb6\x99\xe0\xfa\x17\x4a\x67\x50\x1b\x89\x10\
-\xd4\x62\xc7\x8b\x9d\x23\x5c\xf8\x88\xf2\x13\x7e\x70\x23\x4e\xe6\
-\x69\xec\xe7\x6f\x28\x6d\xce\x15\x39\x6a\xe7\xe5\x3d\x2f\x1e\x48\
-\x39\x25\x93\x49\x53\x3b\xcd\xb2\xd8\xb8\x58\x59\xc7\xb8\xd8\x98\
-\x49\xb7\xcc\x3d\x4f\xe3\x29\x9f\x85\x1d\xe3\x21\x6c\xb4\x07\xe5\
-\x26\x57\xbd\x22\xc8\xbb\x77\x42\x34\xc0\x6d\x1a\xf0\x9d\x12\xf0\
-\xf9\xfb\xd8\xb9\xe9\xb0\x65\x4c\x60\x4f\xc0\x46\x56\xca\x20\xdc\
-\xe5\x85\x45\x90\xaf\x28\xa2\x53\x35\xab\xdd\x95\xb0\x6c\xed\x3d\
-\xb0\xe0\x1f\xff\x82\x59\x4f\xbe\x41\xa7\x65\xc6\x7d\xb4\x03\x46\
-\x7d\xb3\x07\x41\x4a\xbc\xf6\x23\x90\xbc\xfd\x38\xe3\xb5\x13\x4f\
-\xdc\x07\x6d\xbe\x77\x5e\xe3\xff\x3f\x7f\x3b\xdf\x73\x8f\x58\x22\
-\x71\xee\x0c\xbc\x32\xa8\xf5\xfd\xcf\x5c\x0d\x1c\x87\xe1\xdb\x8e\
-\xc0\x88\x2d\x07\x60\xd4\xd7\x7f\xc0\xd8\x8f\x77\xc0\x94\xd7\xfe\
-\x47\xf3\x35\x1f\xf3\x47\xf2\xb9\xda\x55\x01\x59\x98\xef\x02\x85\
-\x16\xe4\xf2\x22\x3a\x75\x45\xcb\x05\xa1\x5f\x68\x76\xfa\xd5\x71\
-\x38\xc8\xf9\x01\x49\xac\x7e\xdb\x29\xf0\x23\x73\x18\xa2\x05\x3e\
-\xbf\xdf\x06\xec\x0b\xd1\x4e\xa3\x01\x3e\x1b\x7f\x03\xf6\x97\x3f\
-\x50\x8f\x2b\x4d\xee\x91\x2b\x57\x97\x75\xbc\xe0\xc2\x6b\xd8\x17\
-\xac\x49\xd0\x6f\xb2\x75\xe9\xdc\x59\x96\xb1\x46\xdd\x51\x61\xf2\
-\xde\x24\x37\x3b\xaa\xb0\x43\xfc\x80\x85\x5c\xeb\x83\x8d\x00\x9c\
-\x9b\xa6\xc0\x79\x65\xa1\xfd\x4e\xff\xfd\x26\x81\x63\x45\x06\x0b\
-\x7f\x78\x86\x1a\x54\x78\xe7\x10\x4d\x67\x04\x79\x08\x9b\xd6\x50\
-\xf1\x88\x1d\x2f\xd0\xb9\x82\xca\xaa\xb1\x73\x15\x72\xa0\x47\x8f\
-\x9e\x2c\x83\x2c\x28\xd2\x43\x2e\x7a\xb6\x99\x06\x07\xac\x76\x94\
-\x41\x6a\xc5\x1d\xb0\xe0\xef\x4f\xc0\xcc\xa7\xde\x84\x49\x6f\x7d\
-\x01\x63\x3f\xd9\x8e\x90\xdc\x8d\xc0\x3c\x4c\x3d\xe9\x84\xdf\x1b\
-\x20\x61\x77\x3d\x24\xfe\x76\x9a\xf1\xd6\x59\x18\x27\xb7\x43\xd1\
-\xb4\x91\x2b\x8d\x5f\x30\xad\xbf\xd6\x63\xda\x51\xbf\xd5\xd3\xab\
-\x04\x32\x00\x8c\xc4\x7c\x8d\xfd\x78\x3b\x4c\xc6\x7c\xce\xfa\xbf\
-\x37\x21\xe5\xee\xc7\x21\xb5\xfc\x0e\x48\x73\x94\x43\xa6\xd1\x09\
-\xb9\xb4\x7c\x0c\xb4\x9c\x0a\x71\x30\xa0\x57\x42\xdc\x92\x53\x21\
-\x78\x09\xb6\x91\xf0\x0e\x82\x60\x5b\x12\x6c\xeb\xe1\x20\x2a\x16\
-\x36\x52\x18\x87\x6b\xc3\xe1\xe2\x89\xf0\x1c\x26\xde\xa7\x58\x3e\
-\x79\x03\x57\x14\xe9\x6d\xc0\xf6\x7d\x1a\x59\xb4\xa5\xc0\x68\xd5\
-\x68\x4a\xca\x6f\xbc\xfa\x86\xbe\xd2\x0d\xdc\xe6\x5a\xe7\xce\x5d\
-\x63\x72\x8b\x5c\x97\x61\xe3\x4f\x45\x0f\xf1\x63\xac\xb4\x06\x3a\
-\xba\x9a\xc2\x55\x66\x08\x70\x05\x2a\x24\xe4\x22\x8c\x23\x92\xf0\
-\x51\x03\x56\x60\x7b\x34\xf1\x47\x92\xd7\x68\xcb\x2b\x54\x9a\xe8\
-\x3a\x75\xe2\xc9\x3b\xa0\xc0\x60\xa3\xab\x69\x88\x72\x51\x64\x2e\
-\x7b\x0d\xee\x5f\xe1\x59\x0b\x0b\xee\x7c\x04\x66\xfe\xdf\xeb\x14\
-\x7e\x63\x3f\xff\x05\x86\x6f\x3d\x04\xf1\xbf\xd7\xc0\xb0\x3f\x4f\
-\x43\xfc\x1f\x08\x4a\x04\x26\xf1\xe0\xdb\x1a\xe2\x2d\x32\x10\x90\
-\xa9\xa6\xdf\x98\x7c\xd1\xfc\xfd\x86\x03\xc0\x96\x43\x30\xe6\xd3\
-\x9f\x61\xf2\xeb\x5f\x52\xcf\x7f\xc1\x5d\x8f\x62\xb9\xac\xc3\xf2\
-\x71\xe1\x15\x8f\x05\xf2\xc8\xd4\x8f\x9e\x51\x01\x9d\xee\x41\xf8\
-\x0b\xd5\x41\x53\xea\x37\x54\x3c\x62\xe0\x15\x1c\xf4\xc3\xb4\x8b\
-\x48\xdb\x59\x50\x3c\x21\x1c\x96\xb0\x79\x0c\x01\x7c\xc1\xfe\x12\
-\x02\xea\x62\xe7\x6c\xdc\xd6\xc0\xc6\x71\x44\x6e\x74\xbc\xae\xb4\
-\x78\x56\x2d\xce\xc9\x3d\xef\x86\x69\x53\xb9\xb7\xc8\xb5\x31\x39\
-\xcf\x42\xeb\xd4\xbd\x7b\x4c\xef\x2b\xaf\x89\x29\x30\xda\x46\x61\
-\xa3\x7f\x48\x6e\x72\xfc\x4e\x1a\x7f\x93\x1a\x7b\x7b\x00\xbe\x58\
-\xe3\x8b\xb4\x43\xb6\x57\xe0\x9b\xd8\xb9\x79\x23\x33\x3f\x4f\xd6\
-\xab\xe7\xa3\xa7\x9a\xa7\x36\x40\xb6\xc6\x0c\xab\xed\x65\xb0\x78\
-\xe3\xfd\x30\xe7\xb1\x97\x61\xea\x2b\x1f\xc3\xb8\x8f\x7e\x84\x11\
-\xdf\xed\x43\xaf\xf8\x18\xc2\xbd\x9a\x99\x1f\xff\x95\x9d\x23\xe7\
-\xa6\x6a\xda\x01\xac\x5b\xd4\xf3\xdf\x55\x43\xf3\x97\xf0\x2b\x77\
-\x3f\xa0\x9a\xe6\x7f\xc4\xf7\xfb\x60\xdc\xc7\x3b\x60\xea\xab\x9f\
-\xc2\x9c\x7f\xbe\x04\x8b\x37\xdc\x07\x69\xf6\x52\xc8\xd6\x9a\x69\
-\xf9\x91\x72\xa4\xcf\x1a\x10\xaf\x9f\x5d\xaa\xea\xab\x87\x68\xda\
-\x62\x4b\x03\x3f\x5c\xbb\x6e\x2e\xf0\xa3\xed\x6b\x81\xc0\x0f\xd7\
-\x8f\xb8\x73\x45\xd2\x3f\x43\x6c\xc7\x81\xb8\x4e\x6e\x72\x1d\xc0\
-\xfa\xb9\xcb\x54\xbe\x7e\xc8\x12\xb9\x92\xbe\x46\x5a\xf2\xf2\xa3\
-\x30\xee\x01\xab\xa4\x5b\xa6\x76\xd4\x94\xdc\x76\x75\x81\xce\xaa\
-\xc2\x82\xdd\x5a\x68\x74\x56\x47\x0c\xe1\x68\xa1\x1f\x8d\xa2\x69\
-\x90\xd1\x1e\xdf\x9a\xe9\x8e\xa4\xf3\x44\x18\x8e\xf1\x3a\x59\x11\
-\x2f\x94\xae\x93\x37\x41\x7e\x91\x11\x72\x10\x56\x6b\xcc\x6e\x7a\
-\xb3\x92\x78\xf3\xb3\xfe\xf5\x1a\x4c\x7a\x6b\x33\x8c\xfe\xe2\x37\
-\xea\xcd\x93\x15\x33\x09\x74\xda\xe3\x34\x7a\xbf\x75\xbe\xe9\x9a\
-\xb6\x86\x73\xeb\x8a\x59\x2d\x44\xf2\x49\x6f\x2e\x63\xbe\x13\x76\
-\x9f\xc6\x72\xc0\x32\xd8\x59\x43\xa7\xb1\xc6\xfc\xef\x37\x98\xfc\
-\xe6\x97\xf4\x86\xef\x42\x2c\xb7\x15\x25\xb7\xa1\xd7\xef\xc6\xf2\
-\xc4\x01\xb4\xc8\x40\x97\x7a\xd2\x87\xcd\x7c\x5e\x3f\xa3\x16\xad\
-\xff\xe8\x3d\xdd\xe6\x9f\xa7\x25\xd3\x1d\x2e\x4c\x53\xfa\x71\xa8\
-\x38\x18\x35\x60\x3d\x7c\x52\x68\x72\x29\x73\x15\xba\x2b\xaf\xba\
-\xf2\x6f\x04\x5f\x32\x69\x2e\x3f\x02\x63\x97\x36\xc9\xba\xa3\x77\
-\x9f\x9a\x96\x79\x9e\xc2\xe4\x4a\xc9\x37\xd8\x9f\x44\xef\xfe\x38\
-\x57\xb8\x51\x54\xc4\x99\x01\x65\x88\xfd\x85\x3c\xb5\x9b\x34\x37\
-\x59\xcc\xbc\x32\x95\x0f\xf4\x56\xfa\x40\x14\x01\x7d\x2e\x42\x29\
-\x13\x3d\xfc\x15\x9e\x2a\x58\x78\xfb\x03\x30\xf3\xff\xde\x84\x09\
-\xef\x6d\x83\x11\xdf\x1e\xa0\xcb\x1c\x89\x17\x4f\x21\x8f\x9f\xf4\
-\x46\x67\x9b\x43\xb8\xed\x45\x57\x17\xed\x42\xf0\x73\xf7\x29\x76\
-\x9c\x82\x91\xdf\xee\xa3\xcf\x10\xcc\x7a\xea\x4d\x2c\xc7\x07\x61\
-\x25\x59\xe2\x69\x70\x40\xae\xda\x08\xf9\xc4\xeb\xa7\x4f\xfa\x32\
-\xe0\xe7\xc3\xbf\x35\xdb\x71\x34\x12\x6c\xf3\xad\xdd\x07\x9b\xd2\
-\x0f\x5b\xee\xdc\x64\x3e\x7f\x7f\x81\xc1\xf1\xac\xce\x59\x32\x36\
-\xaf\xd0\xd6\xb9\x47\x8f\x9e\xd2\x2f\x64\x45\x6a\x1d\x3b\xc6\xc9\
-\x16\xaf\xc8\x8d\xcd\x36\x57\xf6\x91\x1b\x6c\x55\xe8\xd9\xef\x90\
-\xd3\x4b\xa7\x10\x95\x2d\x01\xff\x0c\x28\x00\xf8\x04\x3c\x4a\x2d\
-\xe4\x29\x35\xb0\x06\x3d\xfc\x95\x9e\xb5\x90\x72\xcf\xe3\x70\xcb\
-\x8b\xef\xd3\x87\x97\x08\xb8\x86\x6f\x3f\xce\xde\xcc\xe4\x96\x3b\
-\xfa\xaf\x79\x6f\x6b\xe0\xb6\xb5\xb8\x29\x1f\x52\x36\xd4\xf3\x27\
-\x03\x00\xfe\x3f\x7c\xfb\x31\x18\xf5\xdd\x3e\x18\xff\xf1\x8f\x30\
-\xfd\x85\xf7\xb0\x5c\x9f\xa0\xe5\x9b\xa5\x43\x6f\x5f\xa1\xa5\xe5\
-\x4e\x5e\xf1\x40\xa1\x2f\x01\xbf\xed\x81\x6f\x72\xd6\xcb\x2d\xce\
-\x1f\x72\xf4\x56\x8b\xc6\x5d\x32\xe8\xc6\x7e\xc9\xd2\x8f\xa5\x44\
-\x6a\x9d\x3a\x75\x89\x51\x68\xbd\xbd\xe5\x46\xe7\xe2\x42\xa3\xe3\
-\x2d\x6c\xd0\xa7\x48\x81\x16\x72\xd0\x11\x10\x07\x24\xb1\xfd\xdc\
-\x8d\xaf\x46\xb1\x73\xce\x46\xff\xce\x22\x76\x6c\x60\xa3\x11\x94\
-\x91\x1f\x9e\x4b\x4b\x70\x38\x79\xd0\xfe\xc6\x63\xfc\xd3\x1a\x22\
-\xed\x01\xe9\x17\x2e\x8f\xd0\x0d\x9f\xdf\x01\x82\xe2\x60\xe3\xe6\
-\xf6\x71\x50\x29\x30\xda\x10\xf4\x16\xba\x76\x3e\x4f\xa9\xa7\x6b\
-\xcb\x57\x14\xaf\x63\x40\xff\xfc\x7b\x30\xfe\xc3\x1f\x60\x24\x99\
-\x9f\x27\x1e\x3d\x5d\xcb\xce\xce\xcb\xef\xac\x69\x73\xb8\xb6\x77\
-\x71\xcb\x41\x99\x32\x63\x9e\x03\x20\xe5\x48\xca\x93\x94\xeb\x2d\
-\x2f\xbc\x0f\x0b\xee\x79\xcc\x07\xfe\x3c\xa5\x0e\xf2\xc9\xd3\xc8\
-\xa4\x3e\x0c\x2c\xf8\x8d\x42\x75\x1c\x50\xaf\x7e\x6d\x3a\x54\x7f\
-\x11\xef\x3f\xc1\x6d\x4a\xa4\xed\x1a\x85\x8f\x17\x6f\xdf\xfe\x7d\
-\x28\x5c\x9a\x82\xc2\xf0\xfa\xb3\xd8\x79\xf8\xfd\xcf\x97\x07\x5f\
-\x5f\x0a\xd1\xb7\x03\xc2\x04\x96\x01\x96\xff\xd1\x02\x93\xfd\x6d\
-\x85\xcd\xb1\x72\x65\x5a\x49\xf7\xcb\x2e\x4d\x92\x96\x69\x8a\x1a\
-\xf7\xe3\xc8\x43\x87\xc8\x92\xf2\xf2\x62\x15\x5a\xd3\x08\x2c\xc4\
-\xbb\x0b\x4d\xf6\x9f\xd9\x4a\x6c\x10\xac\x74\xa3\x88\xc4\x1a\x49\
-\xb8\xf0\x62\xfb\x03\xe3\x0c\x15\x8e\x1f\xbe\xa5\xd2\xe7\xd7\xd8\
-\xc2\xa4\x2b\x54\x7c\x4d\x38\x2f\x01\x49\x3e\x7a\x92\xf9\x64\x05\
-\x09\xb9\x19\xab\x34\x40\xb6\xca\x08\x69\x26\x37\x2c\xbe\xed\x3e\
-\x98\xf9\xd4\x5b\x14\x48\xc4\x2b\x25\x4b\x12\xe9\xd4\xc4\xcf\x12\
-\xe0\x5b\x44\x3f\x93\xfb\x1d\xcc\xcd\xde\xe4\x1f\x8f\xc1\xf8\x0f\
-\xb6\xc2\xcc\x27\x5f\x83\x45\xeb\xff\x81\xe5\xef\xa1\xf5\x90\x4f\
-\xa6\x7a\x34\x66\xba\x22\xaa\x20\xb0\x2d\x47\xdb\xbe\xc2\xb5\x97\
-\x70\xed\x28\xf0\xbc\x42\xfd\x4b\x28\x2d\x91\xb4\xcb\x48\xdb\x6d\
-\xb4\x69\x15\x80\x79\xf4\xe5\x43\x8e\x71\xd6\xa1\xf6\xe1\xe0\xbb\
-\x5e\x6d\xf1\xdc\x34\x6b\x51\x76\x17\x82\x34\x99\x74\x03\x37\xd8\
-\xb8\x1b\xb5\xfd\x26\x4f\x8d\x53\x94\x6f\xec\x89\x5e\x4b\x06\x16\
-\xe8\x37\xd4\xbb\x37\x22\xec\x23\x69\x34\xcd\x05\x6a\x44\xc0\x8d\
-\xb2\xb3\x44\xd3\x99\xa2\x01\xbe\x58\x67\x08\x57\x36\xd1\xc2\x9e\
-\x88\xcc\x1f\xeb\xad\x90\x53\x84\xa0\x47\xaf\x32\x1d\xff\x5f\x52\
-\x79\x27\xcc\x7c\xe2\x15\x04\xd0\x36\x18\xfe\xc3\x41\x84\xfc\x49\
-\x48\xda\x55\xe3\x9b\x9b\x97\xa6\x6b\x5a\x46\xcc\x94\x0f\x37\xed\
-\x83\xda\x75\x02\x86\x6f\xdb\x4f\x5f\xed\x30\xeb\xf1\x57\x60\x29\
-\xd6\xc3\x1a\xbd\x03\x72\xd4\x7a\x1c\x8c\x8d\xf4\x4d\xa1\xcc\xdc\
-\x3e\xa9\x3f\x7b\xf4\xed\x2b\x54\x7b\x09\xb7\x3d\x1a\x47\xa8\x29\
-\xce\x57\x44\xc0\x0e\x93\xd6\x96\x06\xbe\x2f\x7e\x0a\xfc\x86\x42\
-\x83\xa3\x16\x81\xff\xae\xda\x56\x9c\xbb\x34\x2b\xe7\x8a\xcb\xaf\
-\xbc\x32\xa6\x7b\xd7\xae\x6d\x4c\xd7\x76\x68\xb1\xb1\x71\xd4\xc1\
-\x4f\x48\x1e\xdb\x45\x6d\x2f\x1d\x9f\xab\xb3\xde\x85\x05\x77\x88\
-\x5c\xaa\xfa\x80\x1f\x95\x9c\x8c\x5a\xd2\x2b\x6f\x2d\x45\x9b\xbe\
-\xa6\x76\xde\x08\x55\xc0\x7d\x62\xd9\x93\xd7\x02\xe7\x6b\x4d\x90\
-\xa3\x32\x40\x86\xde\x0e\xa9\xc5\xb7\xc1\xad\xf7\x3f\x0d\x93\x5f\
-\xfb\x0c\x46\x7d\xf5\x1b\x02\xe9\x24\x7d\xc8\x28\xf1\xf7\x5a\x0a\
-\x26\xfa\xca\x01\x4e\xed\x00\x98\x67\xbd\x78\xe5\x49\xef\x85\x90\
-\xd5\x3d\xbf\xd7\xd1\x15\x3f\xa3\x36\xff\x0e\x93\x5f\xff\x0c\xe6\
-\x61\x7d\x2c\x2f\xd9\xc0\x82\x9f\x5d\xca\xa9\xb5\x42\x81\xde\xce\
-\xd4\x63\x6b\xb4\x95\x96\x74\xa2\xce\x74\x5f\x6a\xdd\xfe\x83\xac\
-\x72\xfe\x89\x7d\xe7\x89\x6c\xa3\x75\xa4\xf9\xf6\x8d\x9d\xae\xb9\
-\xf6\x5a\x66\x6a\x47\x7a\xbf\x5a\xa3\xc9\xd0\xa6\x4c\x9e\x14\x93\
-\x59\x20\xef\x5d\x68\x76\x9a\xf2\x0d\xb6\xff\xe5\x1b\x1d\xd5\x05\
-\xbe\x42\x6c\x89\xca\xb0\xfb\x56\x36\xd0\xd5\x0d\x7e\x90\x6b\xf4\
-\x8c\x84\x14\x0c\xc5\xe0\x78\xc4\x8e\x15\x3a\x3e\x10\xb0\x61\xc3\
-\xf1\x1a\xa9\xf8\x79\x84\xf3\x16\xc9\x39\x19\x4f\xde\x4e\xbd\x79\
-\x0a\x7a\xf2\xd0\x14\x99\xbe\x29\x32\x41\x96\xc6\x02\xab\x2d\x5e\
-\x58\xb4\xfe\x5e\x98\xfe\xf4\x3b\xf4\xa1\xa1\xa4\x9f\x8e\x43\xfc\
-\x6e\x84\x0f\x59\x56\xc9\xbd\x5b\x46\x82\xfc\x19\x81\x3f\x01\x7f\
-\x02\x7d\x98\xeb\x34\x82\xff\x04\x8c\xf9\xec\x67\x5a\x2f\xa4\x7e\
-\xd2\xcc\x1e\xc8\x2a\x22\x6b\xf8\xd9\x69\x1e\x1d\x3b\xbf\x6f\x88\
-\xac\x5d\x88\xb6\x0d\x5f\xfb\x0a\xdf\x5e\xc5\xf6\x17\xf8\xf5\x3f\
-\xf1\x63\x84\x8e\x17\x8f\x33\x54\x5f\x10\xca\x43\xc0\xb1\xd8\xde\
-\x0b\x0d\x62\xf9\x60\xd3\x6a\xe0\x29\x7c\xff\x6e\xc0\x70\x0d\x78\
-\xdc\x96\x3c\x9d\x39\x37\xd7\xe2\xb9\xfa\x92\x2b\xae\x8a\x65\x19\
-\xd7\xd6\x98\x6d\x3f\xd6\xa1\x43\xc7\x18\x85\xd6\xd0\x43\x61\x77\
-\x8f\x42\xd8\x3c\x8b\x05\x76\x02\x81\x5f\x1f\x0e\x96\x2d\x0a\xfc\
-\xc8\x2a\xf4\x9c\x06\x7e\xbe\x81\x99\xab\xcf\xd7\x18\x21\x57\xae\
-\x85\x4c\x84\xc7\x72\xef\x7a\x98\xfd\xc8\x8b\xf4\xc5\x60\x23\xb6\
-\x1c\x84\xc4\x5f\xaa\x99\x07\xa5\xf8\x0f\x49\x49\xc0\x3f\x73\xc0\
-\xdf\x59\xed\x7b\x51\x1c\x1d\x70\x77\x55\xc3\x70\xac\x97\x09\xef\
-\x7e\x0f\x73\x1e\x7e\x1e\x96\x7b\xd6\x61\xbd\x99\x68\xfd\x91\x87\
-\xb7\xe8\x93\xbb\xcd\x01\xbe\xc1\x21\x0a\xbc\x36\x07\xbe\x28\x8c\
-\xfd\xcf\x23\x18\x27\x7b\x9c\x78\x39\x34\x19\xf8\xe4\xb8\x7d\xf9\
-\x7a\xeb\xa3\x85\x66\xcf\xb4\xa1\xc3\x12\x3a\x74\xef\xd6\xad\xad\
-\x11\xdb\xbe\x2c\x2e\xae\x43\x4c\xba\xd2\x74\x3d\x16\x94\x06\xc1\
-\xfc\x35\x5b\x68\x0d\x82\x70\x16\xa9\x00\xd1\xc6\xe3\x17\xde\xbf\
-\xd1\x15\x08\xc5\x29\x22\xe1\xf3\xdb\x05\xce\x23\x0c\x60\xa1\xb8\
-\xc2\x0d\x14\x3e\x99\x58\x05\x75\x1c\x31\x85\xeb\x40\xc1\xc7\xe4\
-\x93\xd7\x21\xa0\x57\x48\x56\x7f\xe4\xa8\x74\xe8\x2d\xba\x61\xe1\
-\x86\xfb\x60\xfa\x73\xef\x52\x2f\x32\x79\xfb\x31\xe6\x41\x21\x14\
-\x99\x4f\x6e\x73\x00\xfe\x85\xe5\x7b\xc9\xdb\xae\x1a\x7a\x43\x97\
-\xd4\x0b\x79\x71\xdb\xd8\x4f\x76\xc2\xf4\x67\xd0\xdb\x27\x4f\xec\
-\x92\x57\x35\x28\xf5\xcc\x6a\x1e\xf2\xac\x84\xc1\x16\xd4\xee\xc5\
-\xdb\x43\x98\xbe\x11\xae\xcf\xf1\x8f\x17\x6a\x9f\x42\xfd\x47\xb0\
-\x6f\x8b\xa4\x49\x34\xbc\x50\x1f\xe1\x3b\x74\xec\xff\x21\x06\xb1\
-\xa0\x38\x22\x38\x47\x60\x39\xe5\x1b\xed\xa7\x50\xdb\x72\xf5\x16\
-\x83\xd1\xeb\xbd\x6c\x7e\xca\xfc\x0e\x84\x73\x7f\xe9\x27\x70\xb9\
-\xbb\xd7\x7d\xfa\x5c\x23\x9b\xb3\x6a\x75\x87\x1c\xbd\x6d\x12\xc2\
-\xfe\x59\x2c\xb0\xbd\x82\x8d\x83\x2b\x70\xbf\xc6\x17\x50\x79\xd1\
-\xc8\xd7\x68\x9a\x78\x7c\x60\xa3\x14\x1d\x58\x42\x35\x9c\x10\xc7\
-\x85\xdb\x1e\x18\x86\x2b\x8b\x48\x06\x04\x7e\xe3\xa4\x5e\xbd\x95\
-\x5d\x81\xa3\x83\x2c\xa5\x01\x56\xd9\x4a\x60\xde\x3d\x8f\xc3\xe4\
-\xd7\xbf\x60\xbc\x7a\xf2\xda\x03\x0a\x7a\xe9\x81\xa9\xf6\x26\x0a\
-\xfe\x5f\xd8\xfa\xc1\x2b\xae\x11\xdf\xee\x87\xc9\xaf\x7d\x41\xeb\
-\x6f\x85\xbd\x0c\xb2\x54\x46\xba\x84\x96\xd4\x2f\x7d\x47\x4f\x04\
-\x6d\x42\xd0\x71\x08\xdc\x1f\xd2\x91\xe2\x85\x09\x02\x7c\x84\x6d\
-\x3e\xe4\xf9\xc2\x38\x73\xa1\xe2\x09\xdb\x27\x99\x7e\x54\xc8\x4a\
-\x6c\xe0\x09\xc3\x06\xe2\xe9\xd7\xe6\xe9\x2d\x8f\x29\xec\xc5\xe3\
-\x6e\x5d\xb2\xea\x3c\xc2\xba\xbf\x34\xf0\xb9\x95\x39\x03\x47\x8c\
-\xea\xa0\x2a\x5d\xf7\xb7\x5c\xad\x45\x91\x67\xb0\xff\x82\x9e\x48\
-\x3d\xdf\xbb\x97\x80\x2f\xd2\x59\x9a\x0a\x7c\x3e\xe8\x51\x79\xe8\
-\xf9\xe5\x91\x27\x65\x0b\x35\xb0\x46\x6d\x84\x65\xa5\x1b\x60\xe6\
-\x93\xaf\xd3\x5f\x88\x4a\xfa\xf1\x84\xe0\x8f\x84\xb4\x35\xe4\x24\
-\x05\x00\x7f\x67\xb5\xef\x75\xcd\xe4\xe1\xad\xe4\xed\x27\x68\xfd\
-\xcd\xf8\xd7\xeb\xb0\xb4\x64\x23\x64\xaa\x0c\xcc\x14\x0f\xa9\x67\
-\x52\xe7\x46\xbc\x9a\x33\x12\x8f\xdf\xd6\x38\x00\xb4\x34\xf0\x43\
-\x01\xf7\xdc\x07\x3e\x51\x7d\xbe\xc1\xfa\x85\xc2\xe2\x31\x2f\x5e\
-\x9d\x7f\xe5\xa5\xbd\x2e\x8b\xe9\xd8\xa9\xc3\x5f\x77\x22\x9f\x5b\
-\x99\x13\x9f\x3c\xba\x8b\xc6\x51\x36\x3d\x47\x6b\x79\x38\x5f\x6f\
-\x3f\xca\x82\x48\x18\xf8\xa1\x1a\x81\x80\xf2\x79\x8a\x1c\xe2\x8c\
-\x9a\x74\x6c\x90\x1c\x78\xbc\xc3\x17\x47\x53\xe2\x13\x4b\x47\xe0\
-\x76\xbf\xff\xc3\x34\x7e\x72\x79\x4f\x40\x4f\x96\x5b\xe6\xaa\xf5\
-\x90\xad\xd0\x41\x9a\xde\x09\x0b\x36\x3c\x00\xd3\x5e\x78\x1f\x46\
-\x7f\xf5\x2b\x24\xee\x3c\x49\x1f\xfb\xf7\x7b\x99\xd9\x4f\x51\x8a\
-\x0f\x27\xb1\xfd\xe1\x8e\x15\x8b\x2f\xd2\x38\x23\x49\x77\xb8\xf3\
-\x08\xc5\x21\xb6\x4f\x0c\xce\xd1\x96\x5d\x13\xca\xb8\xf1\x65\x6d\
-\xcc\x43\x5b\xa3\xbf\xfa\x1d\xeb\xf3\x3d\x48\x59\x7f\x1f\x2c\xd7\
-\xd9\x61\x55\xbe\x1a\x56\xe6\xab\x60\x65\x41\x11\xac\x28\x54\xc3\
-\x8a\x02\x54\x7e\x11\x23\xdc\x46\xb6\xaf\xc2\x81\x7f\x35\x0e\x0e\
-\xe9\x78\x55\x40\x1c\x80\x6c\xad\x85\xbe\xf1\x34\x9f\x85\x62\xf3\
-\xfa\x43\x18\x10\x47\xdb\x67\x23\x60\x40\x93\x39\xd0\xc4\x7e\xca\
-\x07\x3e\x0e\xa8\x07\x11\xfa\xcf\x17\xe8\x9d\x63\x54\xba\x92\x2e\
-\x97\xf4\xba\xf4\x2f\xfd\xca\x05\xd9\xd4\xd9\xb3\x64\x19\x1a\xc3\
-\xe5\x38\x92\x3a\xf3\xf4\xb6\x2d\xa8\x1a\x1f\xf0\xa3\x01\x9e\x9f\
-\xe7\x6a\x63\x25\x00\x45\x23\xab\x90\x15\x67\x0b\x8a\x43\x7c\xbf\
-\x98\x82\xd3\x28\x94\x2e\xb1\xfc\x34\x5f\xfe\xe9\x08\x8c\x9f\xdc\
-\xc8\x23\x3f\xbd\x97\x43\xde\x4f\x8f\xde\xdf\x4a\x4b\x31\xcc\xbd\
-\xfb\x71\x98\xf8\xf6\x66\x18\xbe\xed\x10\x5d\xfa\x97\xf8\x6b\x2d\
-\x42\xa3\xda\x7f\xa9\x65\xd4\xe2\xc0\x24\xb4\xad\xa9\x71\x37\xe7\
-\xd8\xd6\x52\x4b\xa5\x29\x54\x3c\x62\x65\xc9\x5b\xba\x49\xb4\x03\
-\x07\xea\x1d\xa7\x60\x18\x82\x7f\xc8\x6f\xb5\x10\xff\xfd\x01\x18\
-\xfb\xea\x97\x30\x77\xd3\xc3\x58\xcf\x5e\xc8\x21\xef\xdc\x47\xcf\
-\x5e\x61\x71\x82\xd2\xe6\x06\x95\xdd\x0b\x6a\x7b\x31\x15\xf9\xae\
-\xb4\x79\xe8\xef\xbe\x92\xb7\x49\x12\xc0\x13\xc7\x80\x40\x9f\xbc\
-\xf9\x94\x28\x4f\x8b\x6d\x87\x4c\x01\xea\x83\xfb\x89\x70\xbb\x17\
-\xee\xc3\xa1\xda\xac\x50\x5c\xd1\x3a\x43\x8d\xff\x47\xd2\x5f\x85\
-\x98\x21\x9e\xbf\x50\xe9\xe0\xa9\x81\x8d\x67\x7b\x9e\xde\xa2\x2a\
-\x34\x7a\x6f\xe8\x75\xc9\xe5\x7f\x5d\xe0\x93\x4c\x67\x9b\x4c\xe7\
-\x2b\xac\x8e\x71\xd8\x78\x9e\x45\x9d\xca\xd7\xdb\xea\x23\x69\x2c\
-\x91\x01\x3f\x18\xda\xe1\x81\xcf\x1e\x43\xdf\x47\x1e\x3c\x68\x04\
-\x37\x04\x9e\xf4\x3c\xf9\xa5\x51\xbc\x51\x9d\x09\xe0\x07\x6d\x27\
-\x5e\x3d\xf9\xdd\x58\x85\x16\x32\x95\x3a\x48\x75\x55\xc2\xac\x87\
-\x5f\x80\x31\x9f\xec\x44\x60\x1c\x83\x84\x5d\xbc\xe9\x9b\x56\x01\
-\x98\x04\xfc\xd6\x00\x3e\x07\xfb\xf8\x1f\x4f\xc0\xb0\x6d\xc7\x61\
-\xd8\x0f\xc7\x60\xe8\xf6\xe3\xf8\xff\x49\x18\xff\xdd\x41\x58\xf1\
-\xc1\xf7\x60\x7b\xfe\x0d\xb8\xe7\xf1\xa7\xe1\x89\x67\x5e\x80\x17\
-\x5f\x7d\x03\x5e\x7b\xe7\xbf\xf0\xf6\xfb\x1f\xc1\x7f\x3e\xfc\x04\
-\x3f\x3f\x86\xd7\xdf\x7d\x1f\xfe\xfd\xc6\x3b\xf0\x7f\x2f\xbe\x0a\
-\x0f\x3e\xf9\x34\x6c\xbc\xf7\x21\x70\x55\xdd\x8e\x83\x80\x97\x42\
-\x9f\xac\xfe\x21\xcb\x3e\x29\xfc\xb5\xdc\xbb\xfb\xa3\x00\x3e\xf9\
-\x8d\x5f\x5e\x1f\xe1\xfa\x0d\x19\x40\xc4\xdb\x6c\xd3\x80\xdf\x98\
-\x96\xc6\xbe\x97\xe7\x77\xfe\x68\x80\x2f\xec\xfc\x45\x06\x7c\xfb\
-\x01\x04\xfe\x33\x2a\x8b\x63\x56\x42\xe2\x98\xb8\x0b\x2f\x3c\x9f\
-\xe5\x5f\x1b\x03\xf8\x4c\x1b\x01\x7e\x56\xa1\xba\x6f\xa1\xc9\x61\
-\xc6\x0a\xff\x86\xad\x88\x86\xfc\xa0\x0a\xf1\x6f\x30\x7e\xfb\xf4\
-\x36\xdf\x8f\x45\xf8\x55\x68\x00\x88\xf3\x02\x1a\x5a\x1e\x6f\x1b\
-\xe3\xad\x34\xfe\xe8\x44\x20\xb8\x03\xcf\x4d\x8f\x11\x6b\x44\xbe\
-\xb8\x6c\xfe\x8d\x2d\x20\xdd\x79\x81\xdf\x7d\x71\x5b\x03\x64\x13\
-\xe8\x28\x36\xe1\xbc\xea\x83\xcf\xc3\x2f\x3f\x12\x5f\xae\xce\x42\
-\x7f\x75\x2a\x5b\xae\x81\x74\xec\xbc\x4b\x4a\x37\xc0\x8c\xff\x7b\
-\x13\xc6\x7c\xbe\x8b\x2e\xb7\x64\x7e\xa5\xa9\x36\x3c\x98\x76\xf0\
-\xd4\x1a\x00\x6d\xed\xf8\xcf\x15\x61\xf9\x24\x21\xd0\x13\x76\x9c\
-\x40\xb8\x9f\x80\x41\x5b\x8f\xc2\x90\x2d\x47\x60\xe4\x96\xc3\x30\
-\x7b\xeb\x21\xc8\xfe\xe9\x08\x38\x77\x9f\x82\xbb\xf6\xd7\xc2\xd3\
-\xfb\x8e\xc1\xfb\xbf\xfd\x09\x5b\x76\xfe\x02\xbf\xec\xfa\x15\x76\
-\xff\xf1\x27\xec\xd9\x7f\x00\x0e\x1c\x3c\x04\x07\x0f\x1d\x81\x03\
-\x87\x0e\xc3\x5e\xfc\xff\x8f\x3d\xfb\x60\xd7\xef\xbb\x61\x3b\x86\
-\xdb\xfc\xdd\x16\x78\xef\x93\xcf\xe9\x20\xf0\xd0\x93\xcf\x42\xd5\
-\xdd\xf7\x81\xb1\xb8\x0a\xf2\xd0\x69\xca\x50\x1b\x20\x43\xa9\x87\
-\x4c\x35\x79\x25\xb6\x55\xb0\xcd\x09\xb5\x7b\x7e\xdb\x6e\xfc\xdf\
-\xd2\xd8\x07\x43\x0e\x16\x01\xe7\x09\xea\xab\xb6\xc6\x7e\x23\xd4\
-\x17\xf8\x7d\xdc\x8f\x0d\x81\x69\x12\xe2\x83\x48\x3f\x0b\x4a\x77\
-\x40\x9c\x06\x5b\x35\x3a\x92\x3b\x72\x75\x66\x93\xc6\x56\x75\xf9\
-\xcc\x99\x8b\xd9\x15\x3b\x71\x6d\x8d\xe0\xd6\x37\xee\x2e\xf5\xd0\
-\xa1\x43\x64\x59\xd9\x59\x71\x99\x72\xfd\x44\x2c\xa4\x17\xf2\x75\
-\xb6\x7d\x5c\x21\xe5\x0b\x14\x7a\xbe\xde\xce\x4a\x08\xd0\x02\x90\
-\x0c\x90\x3f\x94\x03\x2b\xd9\xca\x4c\x71\xe8\x02\x81\x6f\x0f\x8a\
-\xa7\xf1\xfc\x8d\x15\x2e\xda\x38\x02\x20\x2e\x7a\xee\x90\x12\xc8\
-\x83\x60\xe7\x11\x2f\x0b\x9f\x10\xf6\x39\x2a\x3d\x64\x21\xec\x57\
-\x23\xec\x17\x97\x6d\x84\x5b\x9e\x79\x07\x46\x6d\xfe\x93\xae\xf0\
-\xa0\xab\x3c\xc8\x4b\xce\xf8\xb0\x95\xd4\x0e\x75\xd2\xa7\x44\x84\
-\xfd\xb0\x1f\x4e\xc0\xe0\x6d\xc7\x60\xf0\x56\x02\xfa\x43\x30\x77\
-\xdb\x21\x90\x23\xe8\xd7\xfd\x76\x14\x9e\xdf\x77\x1c\xbe\x39\x56\
-\x0d\x7b\x6a\x4e\xc3\xd1\x86\x06\xa8\x01\x80\x06\x88\xdc\x4e\x9f\
-\x3e\x0d\xa7\xaa\xab\xe1\xf0\xd1\xa3\xf0\xf3\xae\xdf\xe0\xa3\xff\
-\x7d\x09\x4f\xbe\xf0\x32\xac\xff\xc7\x03\x60\x29\x5b\x4b\xa7\x7c\
-\x32\x54\x46\x48\x57\x1a\xd0\xf3\x37\x51\x87\x22\xd0\x09\xe1\xb7\
-\xff\xe0\xb6\xc9\x7d\xb7\x40\x70\xbf\x61\x1c\xab\x3c\x43\x70\xdf\
-\x13\xee\xcf\x42\x7d\x2b\xb0\xff\xf2\xfb\x78\x88\x7e\xa7\xb3\x35\
-\x2a\x00\xf8\x81\xfd\xbc\xf1\x3b\xc3\x28\xdf\x7e\x9d\x2f\x8f\x0d\
-\xa8\x53\x58\x36\x8f\x15\x5a\x3c\x93\x67\xcc\x5b\xf1\xd7\x59\xb1\
-\xc3\x65\x72\xe0\x80\x41\x1d\x74\x16\xc7\x65\x39\x45\xe6\x4c\x2c\
-\xd4\xef\xb1\x70\x6a\x50\x0d\xf9\xbe\x42\xb4\x07\xc0\x2c\x18\xf8\
-\xc2\x8d\x28\x18\xb8\x7e\x0d\x42\xd7\x08\xf7\x48\x81\x2f\xee\x81\
-\x07\x03\x3f\xf0\x2a\xc1\x3f\xee\xa6\x01\x3f\x68\xf0\xf3\x01\xdf\
-\xea\x97\x9f\x7c\x56\xfe\xf9\x6b\xcc\x77\x2e\x7a\x64\x04\xf6\x69\
-\xd8\x41\x17\x54\xde\x05\x53\x9f\xff\x2f\x8c\xfc\x66\x2f\xfd\x41\
-\x12\xf2\xb4\x2c\x33\x25\xd0\xd6\x30\x93\x14\x11\xf0\xd1\x9b\x4f\
-\xda\x7e\x1c\x86\x22\xe8\xfb\x7f\x77\x14\x06\x7d\x7b\x08\x26\x7f\
-\x77\x10\x0a\x7f\x3c\x04\xf7\xee\x3e\x0a\x1f\x1f\xae\x86\xdd\xd5\
-\xa7\xe1\x70\x2d\x02\xbb\xbe\x01\xea\x10\xf6\xa7\x51\x0d\x2c\xf0\
-\x23\x85\x7e\x03\x1e\x53\x5f\x5f\x4f\xc1\x5f\x53\x53\x03\xc7\x4f\
-\x9e\x80\xfd\x07\x0e\xc2\x96\xed\x3f\xc2\xab\xef\xfc\x17\x36\xde\
-\xfb\x08\x68\x5c\x65\x90\x4e\xee\x03\x15\x16\xc1\x1a\xb2\x1a\x48\
-\x67\x6d\x02\xf0\x83\xaf\xb2\xc5\x81\x2f\x16\x87\x18\xf4\x1b\xe3\
-\xf6\x4f\x8b\xc5\x37\xd0\x04\x03\xdf\xbf\x1f\xf1\x3d\xfa\x3c\x7d\
-\x70\xdf\xf3\x07\xbe\x00\x63\x74\x96\xba\x1c\x9d\xe5\x7f\x72\x93\
-\xd3\xb8\x78\xd5\x9a\xbf\x75\x1e\x34\x28\x26\xa6\x5b\xb7\x73\x7f\
-\x56\x87\x5b\x99\x33\x78\x68\x72\x67\x8d\xbd\x64\x4c\xb6\xc6\xb8\
-\x11\x47\xbe\x7d\xd4\x33\x40\xe0\x37\x8e\x8a\xc2\x85\x1a\xb2\x72\
-\xfc\xbe\x07\x00\x3e\xe8\xff\x80\x46\xa3\xe3\x0f\x06\xfe\x23\xbb\
-\x78\x3a\x6c\x82\xfb\xf3\xf9\xfb\x68\xbe\x2c\xfe\xc7\x07\xc2\x38\
-\x1a\xf0\x07\xc6\x13\x46\x64\x75\x45\x2e\x5e\x6e\xe7\xe0\x65\x77\
-\x16\x76\xc8\xd5\x1a\x0b\xa4\xac\xfb\x3b\x4c\xfe\xf7\x87\x30\x82\
-\x78\xf6\x2c\xec\xc9\x4d\x3e\x32\xff\x7b\x6e\xe8\x04\xa3\x1f\x85\
-\x74\x92\x0e\x6a\x49\x3f\xf1\xb4\x83\x15\xd9\xbf\x9d\x15\xff\x18\
-\x1a\x5f\x5b\xe7\xe9\x24\x93\x76\x36\x8d\x09\x08\xfa\x01\xdf\x1f\
-\x81\x9b\x10\xf4\x49\xdf\x1e\x80\x55\xdb\x0f\xc1\xc6\xdf\x8f\xc2\
-\x7b\x87\x4f\xc2\x4f\x27\x11\xcc\x75\xf5\x14\xd6\xd1\xf9\xf3\x91\
-\x1b\xf1\xfa\xff\xdc\xbb\x0f\x36\x7f\xbf\x15\x9e\x7d\xe5\x0d\x28\
-\xdb\x74\x0f\xe4\x60\x3b\x25\x2b\x7d\x56\xa3\x53\x41\x7e\xf5\x2c\
-\xa8\x4f\x06\xf5\x01\x11\x07\x4c\xb0\xaf\x44\xc0\x02\xbf\xbe\x2e\
-\x16\x07\xbf\x3f\x8a\xf4\x4d\x9f\xfc\xf7\x05\x0d\x3a\x62\x4c\x10\
-\x8e\xaf\x3e\x8f\x72\xce\xfc\x78\xae\xd1\x3a\x6c\xf6\xc6\x0d\x1d\
-\x3a\x5f\x71\xc5\x39\xfe\xfb\xb7\xec\xaf\x59\xf5\xb8\xee\xda\x98\
-\x14\xbd\xf1\x82\x7c\xad\x29\x37\x47\x6f\x7e\x17\x61\x7f\x82\x2d\
-\x94\x86\xa0\x42\x0c\x0b\x35\x5e\xa5\xe9\x85\x2b\x4a\xb8\xb1\x85\
-\x68\x60\x4d\x96\x05\x82\x1b\x91\xd0\xb2\x90\x5c\xe5\x00\x00\x20\
-\x00\x49\x44\x41\x54\xb6\x50\xc7\x09\x29\x54\x43\x12\x0e\x4f\xe7\
-\xea\xc9\x14\x8e\x86\x4c\xe3\x18\x21\xb3\x50\x03\xab\x34\x56\x0a\
-\xfb\x49\x2f\x7f\x0c\xc3\xbf\xdd\x0f\x09\x64\xcd\x36\x02\x2f\xf1\
-\x47\x0e\x26\x81\xe2\x41\x32\xa4\x22\x09\x23\x16\xf7\x89\x08\xcf\
-\x13\x26\x1c\x01\xe2\x4f\xa7\x7c\xef\x94\xe7\x7e\x54\x24\x69\x17\
-\xf3\x0a\x82\x46\xd5\x05\x29\x89\x2c\x3d\xdd\x55\xe7\x17\x8e\x1c\
-\x97\xe4\x7b\x75\x44\xe3\xf3\x07\x8d\xe0\x8d\x22\x6d\x21\xf3\xcc\
-\x3f\x8e\x37\xb8\x88\x1d\x8f\xb0\x8f\x27\xd3\x37\xdf\x1d\x81\x41\
-\xdf\x1c\x84\x49\xdf\x1d\x00\x39\x7a\xf5\x4f\xec\x3d\x0e\x3b\x4e\
-\xd6\x42\x3d\xf5\xe2\x1b\x9a\x8d\xf9\x06\x11\x05\x86\xa9\x43\xcf\
-\x7f\xf7\xde\xbd\xf0\xee\xc7\x9f\xc1\xa6\x07\x1e\x05\x95\xcd\xc3\
-\x2c\xe9\x54\xe8\x20\x9b\x9b\xe2\x09\xd1\x4e\x23\xef\x47\x22\x7d\
-\x38\x22\x70\x87\x8a\x3b\x92\x34\xf1\xf8\xa2\x17\x3a\x46\xe8\xd8\
-\xa0\x6d\x0d\xb9\x7a\x4b\x1d\x6e\xfb\x2c\xab\xc8\xb4\x5c\x6e\xb5\
-\x5f\xd6\xeb\x92\x4b\xce\xf1\x15\x3b\x2c\xf0\x67\xe9\xb4\x1d\xf3\
-\x4d\xb6\x1b\x72\xb4\xa6\x4d\x79\x3a\xf3\x9f\x79\x5a\x6b\x5d\xf3\
-\xe0\xca\x2a\xa8\x32\x42\x0c\x00\xdc\xe5\x5c\xc4\x8d\x30\xd4\xb9\
-\x9b\x02\xfc\x70\x90\x8f\x34\x6d\xe2\xc0\xcf\xd1\x98\xe9\xdb\x13\
-\x33\xb1\x03\xae\x56\x99\x60\xde\xfa\x7b\x61\xe2\x2b\x9f\x41\xd2\
-\xd6\x43\x90\x40\x7e\x68\x63\x47\x35\x85\x7d\xb3\x80\xef\xf3\x88\
-\x9b\x00\xfc\xed\x27\x02\x3c\xea\x08\xc2\xf3\xc3\xf9\x1d\xcf\x7a\
-\xe9\x3f\xd5\x34\x02\x9f\xfc\x50\xf8\xaf\x38\xa0\xfd\xc6\xea\x17\
-\xcc\xeb\x4f\x24\xbf\x27\x20\xf1\x87\x63\xa8\xe3\x8c\x48\x19\x90\
-\x67\x0e\xc8\x7e\x12\xee\x77\x8c\x67\x17\xea\x97\x6a\xde\x03\x67\
-\x35\x74\x89\xaa\x7f\x9e\x4f\x08\xff\x1f\x4d\x9e\x03\xff\x17\x02\
-\xfe\x76\x46\x89\x3f\xe0\x27\xc2\x7e\xc8\x77\x87\x61\xd8\xd7\x07\
-\xe0\x56\x84\x7d\xd9\x2f\x47\xe0\xa3\x43\xa7\x60\x4f\x75\x1d\xd4\
-\xd4\x73\xb0\x3f\x73\xc0\x27\x17\x11\xb5\xb5\x75\x70\xe4\xd8\x31\
-\xd8\xb6\xe3\x67\x78\xe2\xb9\x97\xc0\x52\xba\x8e\xce\xe9\x93\x1b\
-\xba\x64\x5e\x9f\xfc\x26\x6f\x6e\x93\xdb\x74\x53\x9c\x2c\xb1\x30\
-\xcd\x01\xbe\x58\x9f\x0e\xc7\x02\x1e\xf0\xc9\xaa\x26\xad\xe5\xd7\
-\x3c\x8d\x79\x13\xf2\x6f\xf4\x90\xf8\x61\xb1\x3c\x2e\x9e\xbb\xb6\
-\x22\x4b\x7e\x09\x5e\x1a\xcd\xc7\x02\x78\x1d\x55\x87\x6a\x08\x5f\
-\x79\x4d\x01\x64\x4b\x2a\x5a\xe0\x87\x8b\xab\x35\xd2\xc1\x88\x34\
-\x2c\x0a\x7b\x95\x1e\xb2\x0b\xd4\xb0\xba\xc8\x0c\xf3\xd0\xb3\x1f\
-\xff\xda\x67\x90\x88\xb0\x8f\x47\x6f\x96\x02\x9f\x40\x64\x7b\x00\
-\x74\xda\xa5\x58\xe8\x71\xd3\x31\x3b\x59\x00\x93\x5f\x84\xfa\x85\
-\x3c\x18\x56\xc7\x84\x23\xbf\x9d\xfb\xbf\xdf\x20\xe9\x83\x1f\x21\
-\xe9\xad\x6f\x21\xf9\xa5\x4f\x20\xf9\x99\xff\x40\xf2\x93\x6f\x40\
-\xf2\x63\x2f\x43\xf2\xc3\x2f\x42\xf2\x03\xcf\x41\xf2\x7d\xcf\x40\
-\xf2\x3f\x50\x7f\x7f\x1a\x3f\x51\xf7\x3d\x0b\xc9\x0f\x3e\xcf\xec\
-\x7f\xec\x15\x26\xfc\xb3\xef\x42\xd2\xcb\x9f\xd2\x78\x92\x3e\xd8\
-\x01\x49\x9f\xff\x8e\xf1\x1f\x64\xce\x43\xde\xf9\xcf\x9d\x77\x27\
-\xf3\xac\x42\xe3\xb4\xd0\x49\x3a\xb7\xde\xa2\xf9\xc7\x41\x29\x69\
-\xdb\x71\x88\xdf\x7a\x1c\x06\x7d\x7b\x18\x92\xbe\x39\x00\xcb\xb6\
-\x1c\x80\xfb\x76\x1f\x85\x6f\x8f\x56\xc3\xd1\xda\xd3\x50\x8f\xb0\
-\x27\x04\xae\x3f\xc3\x6a\x68\x68\x1c\x0c\xaa\x6b\x6a\x60\xd7\xef\
-\x7f\xc0\xab\x6f\xbf\x07\xc5\x1b\xee\xa6\x2b\x77\xd2\xe4\xc4\xd3\
-\x37\x63\x9b\x34\x37\xb3\xbd\x9f\xe9\x7e\xde\x3a\x71\x63\xdf\x3c\
-\x96\xa3\x35\x7f\x94\xa3\x31\xa5\xa9\x35\xd6\x1e\x43\x86\x0c\x39\
-\x07\xdf\xa4\xc9\xe5\x25\x56\x16\xd3\x69\xe9\xe2\x98\x55\x7a\x5b\
-\xff\x7c\x8d\xb1\x18\x33\xff\xbd\x5f\x61\xe8\x2c\x3c\x45\x57\xf0\
-\xfc\x63\xcf\x5c\xe3\x68\x5f\x22\xa0\xa7\x62\x61\x4f\xe7\xec\xd1\
-\xc3\x4a\xa9\xb8\x0b\x26\xbe\xf4\x31\x24\x6d\xd9\x0f\x43\xc9\x6b\
-\x75\x7f\x62\x60\x2f\x0c\x17\x56\xcd\x02\x54\x04\xf1\xfc\x20\x20\
-\x0a\x4a\x4e\xac\xa7\x8b\x30\x4d\x24\xda\xc1\x88\x7a\xc1\x5b\x8f\
-\x42\xd2\xd7\x7b\x21\xe9\xb3\x5d\x90\xf4\xfe\x76\x48\x7e\xeb\x1b\
-\x48\x7e\xe1\x23\x48\x7e\xe2\x0d\x06\xde\x1b\x1f\x85\xe1\xa5\x77\
-\xc3\x08\x5b\x25\x8c\x28\x72\xc0\xc8\x7c\x03\x8c\xca\x2e\x82\x51\
-\x19\x0a\x54\x21\x8c\x4a\x2b\x80\x51\xab\x0b\x60\xf4\x6a\xf2\x99\
-\xcf\xfc\x9f\x8e\xdb\xd7\x28\x68\xb8\x91\x05\x46\x3c\xce\x09\x23\
-\xac\x55\x34\x9e\xe4\xdb\x1f\x85\xe4\x7b\x31\xde\xc7\xdf\xc4\xf3\
-\x60\x39\xbe\xf9\x0d\x9e\x17\x07\x81\x4f\x71\x70\xd9\xbc\x8f\x49\
-\x0f\x1d\x8c\xaa\x19\xf8\x73\x22\x57\x1d\xa1\xf2\x1b\xae\x9c\x09\
-\xe8\x29\xec\x8f\xc1\xb0\x2d\x47\x61\xd0\x37\x87\x21\x7e\xf3\x01\
-\x58\x8e\xf5\x78\xff\xef\x47\x60\xe7\x89\x1a\xa8\xab\xaf\xa7\xd3\
-\x38\x9c\x4e\x07\x7c\x6f\x8e\xea\x45\xbe\x0b\x85\xe1\xce\x49\x6c\
-\xef\xfe\x83\xf0\xc6\x7b\x1f\x41\xc9\x86\xbb\x68\x3f\x26\xd3\x3b\
-\x59\xe4\x95\x0e\x01\xd0\xf7\xeb\xef\xda\x46\xb5\x48\x5f\x10\x51\
-\x9b\xf6\x4f\x9a\x4f\x73\x5d\xae\xce\xfc\x67\xb6\xc6\x58\x22\x37\
-\xb9\x6e\x9c\x3a\x7f\x41\x67\x8a\xc6\x73\x69\x89\xa6\x8c\xcd\x4c\
-\xb7\xc1\xc3\x63\xa7\x9b\x4b\x3b\xe7\x28\x8b\xa6\xe0\x28\xf7\xef\
-\x3c\x9d\x79\x1f\x16\x44\x83\x04\xfc\x96\x02\xbe\x99\x07\x7b\x0d\
-\xa4\x29\xf4\x90\x52\x79\x17\x4c\x7a\xf1\x43\x84\xfd\x21\x48\xf8\
-\xa5\x16\x12\xc8\x9c\xfd\xf6\x13\x74\x2a\xa3\xfd\x02\xff\x04\x03\
-\xd0\x9f\xd8\xdf\x78\x25\x53\x2e\x08\xbc\xc4\xaf\x11\xae\x9f\xfe\
-\x82\x5e\xf7\xd7\x90\xf4\xaf\x37\x61\xf8\x1d\x8f\xc1\x70\xcf\x46\
-\x18\xa9\x71\xc2\xc8\x5c\x3d\x02\x5b\x09\xa3\xd3\x0a\x61\xf4\xf2\
-\x6c\x18\xb3\x38\x0d\xc6\xa6\x2c\x87\x71\xb7\x2e\x82\x71\x33\xe7\
-\xc3\x84\xe9\x73\x61\xc2\x2d\x73\x99\xcf\x19\xf3\xa8\x26\xce\x98\
-\xcf\x7c\x9f\xce\x89\xd9\x37\x7e\x66\x0a\x8c\x9b\xb3\x88\x1e\x3f\
-\x76\x71\x3a\x8d\x6f\x74\x5a\x3e\x8d\x7f\x64\x9e\x0e\x46\x68\x5d\
-\x30\xdc\x7b\x3b\x0c\xbf\xf3\x5f\x90\xfc\xaf\xb7\x21\xe9\x75\x4c\
-\xcf\xc7\x98\xae\xaf\xf6\x60\x39\x1f\x66\xaf\x42\x6a\x99\xe9\x25\
-\x0e\xfa\x4d\x04\x7e\xc2\x0f\xc7\x20\x1e\xf3\x3e\xe0\x9b\x43\x30\
-\xf8\xcb\xfd\xb0\xe4\xbb\x7d\xf0\x20\xc2\xfe\xf7\x93\x35\x50\x73\
-\xba\x9e\xc2\xb6\x8e\xa7\xe6\x42\xbe\xa9\xf2\xad\x02\x22\x9f\x98\
-\xae\x03\x87\x0e\x21\xf4\x3f\x44\xe8\xdf\x0d\x6b\xc8\xb2\x4d\xea\
-\xe9\x1b\xb1\x9d\x36\x42\xff\x2f\x08\xfc\x06\x72\x33\x1b\x55\x9d\
-\xad\x31\x3d\x25\x37\x7b\xe6\x4e\x9c\x99\x72\x21\x61\x23\xb7\x98\
-\xe5\x9c\x30\x6e\x29\xe6\xa0\xbe\x89\x71\x1a\x5d\xf9\xa5\x99\x5a\
-\x43\x26\x56\xec\x36\x3a\xda\x69\x2d\x0d\xfc\xca\x16\xab\xa8\x70\
-\x95\x16\x6d\xa3\xf1\x3b\xa7\x56\x7c\xbb\x58\x9c\xa1\xd2\x2c\x16\
-\x26\xdc\xf6\x50\x69\x0c\xb5\x8d\x83\x3d\x79\x64\x3e\x9b\xfc\x0c\
-\x61\x81\x0a\x3b\x98\x16\x16\x7a\x6f\x83\xc9\xcf\xbc\x0b\xc3\xd1\
-\x1b\x26\x5e\x7d\x02\xf1\x94\x39\xd8\xb7\x37\xa1\x17\x4b\xe1\x48\
-\xa6\x4b\xc8\x33\x01\xe4\x47\xbc\xc9\x94\xd3\xd7\xfb\x21\xe9\xbd\
-\x1f\x20\xe9\xb9\xf7\x21\xf9\xef\x4f\xa1\xc7\x7d\x17\x8c\x30\x95\
-\xc0\x08\x85\x99\x7a\xec\xa3\x97\xad\x81\x31\xf3\x53\x11\xd0\x8b\
-\x61\x3c\x42\x7a\xc2\xad\x8b\x61\x02\x7e\x9f\x88\x9f\x93\xe7\x2e\
-\x82\xc9\x08\xfc\x29\xb8\x7d\xea\xad\x0b\x61\xea\xdc\xc5\x54\xd3\
-\x88\xe6\x35\x8a\xdb\x4e\x85\xc7\x4d\xc1\x63\x26\xcf\x61\x8e\x9d\
-\x84\x9a\x88\xf1\x91\x78\xc7\xcd\xc6\x41\x00\xbf\x8f\xc5\xf3\x8d\
-\x4e\x5d\x03\xa3\xb2\x70\x00\xc0\x74\x8c\x30\x96\xc2\xf0\x92\x3b\
-\x21\xf9\xee\xff\x83\xa4\x67\xdf\x47\xef\xff\x47\x3a\xed\x92\x88\
-\xf9\x49\xfc\xb9\x8e\xfe\x76\x00\xcd\x17\xc9\xdf\x36\x92\xdf\x63\
-\x11\x95\x47\x22\x2a\x61\xeb\x11\xe8\xff\xed\x21\x18\xf0\xd5\x3e\
-\x98\x8e\xf5\x78\xf7\xae\x23\xf0\xc3\xb1\x6a\xc6\xb3\x27\xcb\x2d\
-\xdb\xa1\x88\xa3\x7f\x1a\xd3\xf7\xe7\xde\xfd\xf0\xca\x5b\xef\xd2\
-\x39\xfd\x34\xf4\xf2\x57\xe1\x15\x27\x01\x1e\x75\x4c\x02\xfb\x4d\
-\x34\x7d\x31\x92\x7e\x22\xa6\xc0\x3e\xcd\x53\xa8\xf4\x44\x74\x0e\
-\x81\x78\x83\x38\xc1\x7c\x3f\x9d\x5d\x64\xfa\x9f\xd2\xea\x31\x4d\
-\x99\x3d\xff\x32\x96\x91\xe7\x1e\xf0\x6f\x1a\x38\xac\xa3\xda\x5e\
-\x1c\x8f\x50\xaa\xc4\x4a\x3f\xc0\x64\xde\xdc\x90\xeb\x6b\x04\x01\
-\xd2\xb1\xf2\xdb\x2e\x56\x79\xfe\xe1\xc2\x03\x32\x94\x78\xe7\x8a\
-\x56\x61\xe3\x16\x4e\x6f\xf8\x30\xa1\xe3\x21\x1d\x89\x78\x50\xc4\
-\xb3\xcf\x40\xd8\x2f\x75\x54\xc0\xd4\x27\x5e\x87\x11\x9f\xff\xc6\
-\xc0\x9e\x78\xc9\x1c\x58\xa9\x8e\x37\x4a\x14\x3a\x61\xf6\x07\x86\
-\x13\x0a\x2b\xb8\xef\x58\x63\x3a\xc8\x00\x44\x1e\x20\xa2\xcb\x43\
-\x6b\x99\xa9\x9b\xad\x87\x20\x11\x3d\xf9\xc4\x97\x3f\x87\xa4\x07\
-\x5f\x84\xe1\x55\xf7\x22\x54\x4b\x60\x64\x96\x0a\x46\x2f\x41\xcf\
-\x7d\xee\x12\x18\x8b\x00\x1e\x8f\x30\x9e\x40\xc1\x8c\x90\x26\xb0\
-\x9e\xb7\x04\xa6\x2e\x48\x85\x69\x0b\x57\xc0\x2d\x8b\x56\xc2\x8c\
-\xa5\xab\x61\xfa\xd2\x34\x98\xb9\x2c\x1d\x66\x2e\xcf\x80\x99\x2b\
-\xd6\xc0\x2c\x22\xfc\x3e\x6b\x05\x4f\xcb\x19\x91\xfd\x33\xf0\x73\
-\x46\x6a\x06\x3d\x6e\xfa\x12\x3c\x7e\x31\xc6\xb5\x70\x39\x4c\x4d\
-\x49\x85\x29\xf3\x97\xd0\x73\x91\xc1\x60\x22\x9e\x9b\x9c\x7f\x1c\
-\x0e\x24\x24\x3d\xa3\x31\x2c\x49\xdf\x70\x43\x09\x24\xaf\xbd\x1f\
-\x92\x1f\x7e\x09\x12\x5f\xf9\x1f\x93\x0f\xf2\x7a\xe9\x1d\xa7\x98\
-\xfc\xfd\xcc\xae\xf4\x09\xac\x8b\xa0\xf2\x42\xe0\x93\xa7\x66\xbf\
-\x3b\x0c\x37\x7f\xb9\x0f\x26\x6d\xde\x0b\xee\x1f\x0f\xc0\xd7\x87\
-\x4f\x42\x75\xdd\x69\xa8\x65\xe1\x5a\x1b\x00\xdb\xda\x76\x20\x92\
-\x0e\x32\x18\x9d\x46\xfd\xfc\xeb\x6e\x78\xe2\xf9\x97\x41\x6d\xf7\
-\xc0\xf2\x3c\x15\x64\x70\xab\x77\x42\xf6\x85\xc8\xda\x7c\xf8\x3e\
-\x2a\xc6\x8c\x48\x8f\x0f\x77\xce\xa6\xc4\x43\x55\x9f\xa3\x31\xef\
-\xcd\xd3\x9a\xff\x99\xae\xd1\x0d\x5e\x92\xb6\x2a\xae\x47\xb7\x6e\
-\xe7\xd4\x8a\x1d\x59\x1c\x0e\x60\x33\x6e\x9d\xdf\xbd\xd0\xe4\x5c\
-\x86\xc0\x7f\x09\x33\x7d\x8c\x2d\xac\x28\x81\x6f\x6e\x65\xe0\x87\
-\xaa\xc4\x08\x2a\xb8\xc9\xc0\x17\x8a\x37\xfc\xf9\x72\xd8\x17\x5a\
-\x11\x65\x2a\xf5\x90\x51\x50\x04\x4b\xad\x25\x30\xe3\x81\xe7\x60\
-\xe4\xa7\xbb\x98\xd5\x28\xdb\xd9\x55\x29\xdb\x8e\xb5\x2f\xe0\x93\
-\x4f\xb2\x62\x86\x4c\x33\xed\xc4\xcf\xef\x11\x8c\xef\xa1\x77\xfc\
-\xf4\x7f\x21\xf9\xf6\x7f\x22\x3c\x8b\x61\xe4\xaa\x3c\xf4\xe0\xc9\
-\xd4\xcc\x12\x18\x37\x6f\x19\x4c\x48\x59\x06\x93\x10\xea\x93\x09\
-\x84\x11\xea\xd3\x16\xaf\x82\x19\xcb\x56\xa3\x10\xec\xa9\xe9\x30\
-\x2b\x35\x83\x42\x7d\xf6\x8a\x4c\xb8\x75\x65\x16\xa3\x55\xd9\x30\
-\x77\x75\x16\xd5\x3c\xf2\x99\x46\xbe\xe7\x34\x2a\x2d\x07\xe6\xa5\
-\x91\xef\xd9\x70\x6b\x1a\x13\x9e\x1c\x37\x67\x65\x26\xd5\x6c\x8c\
-\x6f\x26\x3b\x10\x90\xf3\x90\x81\xe4\x96\xc5\x2b\xf1\xfc\x2b\x68\
-\x3a\x48\x7a\x26\xe2\x80\x30\x7e\xfe\x32\x06\xfe\x0b\x96\xc3\xa8\
-\xb4\x7c\x3a\x48\x25\x6f\xfa\x27\x24\x3d\xf5\x2e\xe6\x6b\x3b\xe6\
-\xef\x00\xcd\x67\xd2\x4f\xec\xfd\x13\x11\xe0\x27\x92\xff\xb7\x1c\
-\x85\xa1\x08\xfb\x81\x9b\x0f\x40\xd2\x97\x7b\x40\xf5\xc3\x7e\xf8\
-\xe0\xc0\x09\x38\x58\x53\x47\x81\x5a\x83\x1e\x74\x35\xfd\xf4\x87\
-\x7e\x20\x7c\x6b\x78\x61\xce\xa8\xc8\x74\x13\xea\xf8\xc9\x53\xb0\
-\xf5\xc7\x9d\xb0\xe9\xc1\x47\x21\x07\xfb\xc6\x0a\x84\xfe\x1a\x85\
-\xbe\x09\x7d\xa1\x3d\x01\x3f\x9a\xb4\x0a\x8a\x4c\xed\xd4\xe3\x71\
-\x9f\x65\xeb\xcc\x0b\x0b\xf5\xb6\x5e\x17\x5e\x78\xd1\x39\x02\x7c\
-\xf6\xd1\x82\x5b\x66\xcc\x88\x2d\x34\x59\xae\xc8\xd2\x98\x8a\x73\
-\xb4\xa6\x9d\xb9\x1a\x53\x8d\x58\xe1\xe5\xf0\x14\xbe\xa0\x23\x17\
-\x8d\x53\x83\x05\x4e\x15\x78\x8e\x48\x2b\x36\x5c\x45\x37\x31\x5d\
-\x4d\xcc\x37\x07\xfc\x2c\xf4\x9c\x32\x0a\x34\xb0\x5c\x6b\x87\x19\
-\x7f\x7f\x12\x46\xff\x77\x1b\x24\x6c\x3d\x06\x09\xdb\x4f\xf9\x60\
-\x9f\xb8\xb5\x3d\xe8\x28\xa3\xed\x08\x36\xf2\x6b\x4d\xe4\xa1\x2f\
-\xb2\xba\x86\xcc\xcb\x3f\xf2\x12\x24\x97\xdc\x05\x23\xe5\x66\x18\
-\xbd\x2a\x17\xc6\x2e\x5c\x09\xe3\x10\xa0\x64\x3a\x65\x12\x7e\x4e\
-\x21\xde\x3b\x42\xfe\x16\xe2\xb9\x13\xc0\x2f\x67\xe1\xbe\x0a\xe1\
-\x8e\xb0\x9e\x4b\xc0\x9e\x96\x0d\xf3\xd2\x73\x60\x7e\x5a\x2e\xcc\
-\x4f\xcf\x83\x94\x8c\x3c\x58\x80\x4a\x59\x83\x9f\xac\x16\xae\xc9\
-\x17\xd4\x02\x14\x0d\x97\xc1\x1c\x37\x3f\x9d\xc4\xc1\x0d\x06\x39\
-\x38\x10\xe0\x60\x80\x03\xc6\x1c\xfc\x24\xe7\x25\x03\xcc\x8c\xd4\
-\x34\x4c\x4f\x1a\x0e\x3c\x2b\xe9\xd5\xc5\x64\xbc\xca\x20\xd3\x49\
-\xe3\xe7\x2e\xa5\xe9\x1f\xb5\x32\x17\x46\x16\x9a\x60\x78\xe9\x9d\
-\x90\xfc\xe8\x2b\x90\xfc\xf6\xd7\x34\xbf\x09\x64\xaa\x87\x78\xfc\
-\x64\x30\xa6\x65\xc2\x2b\xa3\x2d\xa8\xef\x8f\xc0\xc0\xaf\x0f\xc2\
-\x60\x84\x7d\xea\xb7\x7b\xe1\x91\xdf\x0e\xc3\xde\x53\x75\x74\xde\
-\xbe\xb6\x0e\x61\x8f\x3a\xc5\xaa\x3a\x84\x4e\x05\x7c\x0f\xf5\x7f\
-\x4b\xaa\x86\x7e\x9e\xa6\xe0\x3f\x74\xe4\x28\xbc\xf3\xf1\xa7\x74\
-\xe5\xce\xca\xfc\x22\x58\x85\x4e\x49\x16\x79\xff\x8e\xa6\x65\xfb\
-\x77\x24\xfd\x94\xae\x5e\x63\xd5\x1a\xf1\x73\x0c\x08\x73\x8e\x06\
-\xb6\xdf\xef\xc8\x29\x32\x5b\xf3\x4c\xc5\xfd\xcf\xbf\xe8\x9c\x59\
-\x93\xcf\x64\x20\x35\x5f\xd1\x23\x57\x63\x1f\x91\xad\x31\x3d\x89\
-\xc0\xaf\xcd\xd1\x98\x1a\xf8\x05\x42\x1f\x10\xe2\x41\xd8\xbf\x62\
-\x2c\xbc\x70\x66\x0a\xeb\x26\x81\x55\xc3\x9d\x27\xe0\x5c\x41\xe7\
-\x8b\xb6\xa2\x45\xe0\x1d\x34\xa8\x84\x01\x3e\x2f\x0d\x7e\xf0\x17\
-\x49\x1b\xdd\x46\xde\x5e\xa8\xd2\x43\x26\x79\xaf\x79\x91\x05\xe6\
-\xdc\xf6\x20\x8c\x7d\xf3\x1b\x88\x27\xcb\xf8\xb6\x9f\x84\x04\xb2\
-\xce\x3c\x1a\x20\x6f\x61\x15\x4d\xd8\x70\xf2\x1d\x43\xd6\xbd\x9f\
-\x60\xe6\xb6\xc9\xe7\xd7\x7b\x20\xf1\x3f\xdf\x43\xd2\xa3\xaf\xc1\
-\x08\xcf\x46\x18\x95\xa7\xa3\x37\x5b\xc7\xcf\x9c\x0f\x13\xa7\xcf\
-\x85\xc9\xb3\x17\xc0\x14\xf4\xa0\xa7\x91\xe9\x15\xf4\xae\x09\xe0\
-\x67\x13\xaf\x1b\x81\x3b\x87\x00\x3e\x3d\x9b\xc2\x38\x25\x23\x07\
-\x21\x9d\xeb\x07\xf4\xc5\x99\xf9\xb0\x28\xab\x00\x16\xa3\x96\x64\
-\x17\xfa\xb4\x94\x4a\x81\x92\xb3\xdf\x1b\xb5\xc4\x4f\x05\xcc\xf1\
-\x99\xf8\x89\x71\x2d\x44\x2d\xc8\xcc\xa3\xe7\x49\xc1\x81\x80\x0c\
-\x2a\x64\x70\x21\x03\xcd\x6c\x1c\x68\x66\x61\xba\x66\xae\xc8\xc0\
-\x74\xa6\xd3\x01\x69\x2a\xa6\x7b\xf2\xec\x85\x34\x1f\xe4\xa6\xf1\
-\x98\x45\xab\x68\xfe\xc8\xcd\xde\xa4\x7f\xbe\x0e\x89\x38\x20\x27\
-\x7e\xb3\x8f\x19\xf8\xe8\x1a\xfb\x13\x3c\xd8\xa3\x77\xff\xed\x21\
-\x18\xf4\xe5\x7e\x98\xf4\xe5\x9f\xb0\x7e\xe7\x01\xf8\x86\x4c\xe5\
-\x10\xd8\x9f\x6e\x04\xf5\x49\x9e\x4e\x89\xe8\x64\x5d\x70\x78\xb1\
-\xff\x5b\x5a\x24\x6e\x72\x75\x51\x5d\x5b\x07\xbf\xef\xd9\x0b\x4f\
-\xbf\xfc\x3a\x28\xac\x1e\x04\xbe\xc6\xb7\x5c\x33\xa8\x4d\x87\xeb\
-\x23\x82\x7d\x3a\x4c\xbf\xe5\x31\xa3\x25\x80\xef\xd7\x4f\x43\xf5\
-\x4d\xf1\xfd\x0d\xcc\x36\xd3\xfe\xec\x22\xd3\x73\x39\x06\xeb\xec\
-\xa9\xd3\x8a\x3a\x76\x8a\xbb\x58\xc6\x67\xe6\x59\x68\x5c\xc2\x6f\
-\x8e\x59\x9e\x69\xfc\x5b\x81\xde\x9c\x81\x23\xda\xfb\x42\x85\xc0\
-\x41\x58\xb8\x22\x2d\x41\xdb\xf9\x95\x18\x11\x4c\x03\x81\x2f\xb8\
-\xaf\x15\x80\xaf\x11\x6e\xc4\xfc\xc6\x1b\x15\xf0\x69\xfa\x4c\x54\
-\x74\x2a\x87\xc0\xbe\x50\x0d\xab\xd1\xc3\x4f\x29\xb9\x1d\xc6\xbf\
-\xf2\x39\x7a\x90\x87\x60\xd8\x0e\xf4\x9e\xb7\x9e\x60\x56\xb7\x08\
-\xc2\xf7\x0c\x02\x9f\xd3\x0f\x2c\xdc\xc8\xb1\x9f\xec\x82\xa4\xc7\
-\xdf\x84\xe1\x9e\xdb\x61\x64\xa6\x0a\xc6\xa2\x67\x3c\x9e\xac\x9c\
-\x99\x99\x02\x53\xe6\x2f\xa5\x1e\xf3\x74\x04\xe7\x0c\x32\x4d\x83\
-\xde\x34\x81\x3c\x99\x72\x21\x9e\x7b\x0a\xeb\x81\x2f\x44\x00\x2f\
-\xca\xca\x87\x25\x59\x85\x54\x8b\xf9\x00\xcf\x91\x43\x6a\xae\x82\
-\x95\x12\x52\xf3\x18\x2d\xcf\x53\xd0\xb9\x64\xe6\x93\x48\xe9\x53\
-\x2a\xfe\xcf\x85\xa3\xdf\xf1\xd8\x65\x18\xcf\x52\x56\x4b\x72\xc8\
-\x79\x0a\xa8\xc8\x60\xb0\x70\x0d\x73\xe5\x30\xdf\x37\x00\xe4\xd0\
-\x74\xce\x26\xf7\x03\x30\xdd\x24\xfd\xe4\x8a\x64\x72\xca\x32\x98\
-\x38\x2b\x05\xc6\xcd\x98\x0b\x63\x30\x6f\xa3\xb2\xd5\x30\xbc\xf8\
-\x0e\xba\xc2\x27\xf1\x93\x5f\x98\xf2\x20\xc0\xc7\x41\x3a\x01\xcb\
-\x29\x9e\x3c\x45\xfb\xd5\x01\x18\xf1\xc5\x1e\xc8\xfa\x76\x0f\xfc\
-\x67\xef\x31\x38\x5a\x5d\xc7\x40\xb4\xf6\x34\x9c\x08\x80\x7d\x7b\
-\xd6\xa9\x5a\xe2\xed\x9f\x46\xd5\xc1\x97\xdf\x6d\x85\xb5\x7f\x7f\
-\x10\xdb\xad\x85\x7a\xfa\x59\x2a\x03\x5d\x68\xc0\x41\x39\x94\x73\
-\xd4\x14\xe0\xe7\x04\xf5\x9b\x30\xe1\x45\xce\xd1\x0a\xc0\x67\xae\
-\xcc\x8b\x4c\xb5\xe8\x00\xff\x9c\x5d\x64\x50\x2b\xcc\x65\x17\x27\
-\x4f\x4c\xa5\xcb\x19\xcf\xd2\x25\x9a\xb1\xec\x03\x64\x7d\x64\x03\
-\x06\x95\xc4\x66\x2b\xad\x83\x73\xb5\xc6\x2a\xac\xe0\x6d\xfe\x05\
-\x61\x62\x15\x38\x00\x04\xc0\x8f\x17\x46\xec\xd8\xa8\x14\xa2\xe2\
-\x5a\x45\x2d\x79\x3e\x02\x7b\xad\x11\xb2\xc9\xcb\xd0\xd0\x5b\x4a\
-\x47\xa0\x2d\x74\x54\xc0\x94\x7f\xbd\x01\xc9\x9b\xf7\x40\xfc\x8e\
-\x6a\x48\x20\xde\x3d\x85\x7d\x3b\x10\x81\x19\x99\x5a\x22\x60\xfb\
-\xec\x57\x48\x7c\xf6\x7d\x18\xbe\xf6\x7e\x18\x51\x68\xa2\x37\x61\
-\xc7\xcd\x41\x4f\x18\xbd\xf9\xc9\x64\xf5\xcc\x82\x54\x3a\x47\x4e\
-\x6e\xa2\x92\xf9\x73\xe2\x41\xcf\x43\xa0\x12\xb0\x12\xc0\x2f\xa6\
-\x5e\x7b\x21\xd5\x12\x1f\xd8\xe5\x01\x50\x57\xc2\x0a\x56\xcc\xaf\
-\x3b\xa9\x60\x05\xfd\x54\xfb\xb4\x8a\xd5\xca\x7c\xb5\xdf\x76\x12\
-\x8e\x0b\x4b\x3e\x99\xc1\x01\xe3\xcc\x67\x07\x05\x32\x80\xe4\xe0\
-\x15\x42\x4e\xe3\xd5\x00\x49\xd3\xa2\xcc\x02\x7a\x65\x41\xbd\x7f\
-\x3a\x05\xc4\xdc\x03\x20\x57\x25\x14\xfc\x0b\x53\xe9\xaa\xa1\x89\
-\x73\x16\xd0\xd5\x44\x63\x16\xa7\xc3\x28\xb9\x85\x96\x43\xd2\x33\
-\xef\x43\xe2\xa7\xbf\xd2\xf2\x21\xf5\x46\xd6\xdc\x0f\xf8\x62\x1f\
-\xcc\x46\xef\x7e\xd3\x4f\x07\x60\x07\x59\x95\x83\xd0\x3c\x81\xb0\
-\x3f\x7e\x16\x8a\x0c\x52\x64\xd9\xe6\xef\x7b\xf7\xc3\x0b\x6f\xfe\
-\x17\x74\x9e\x0a\x0a\xfc\x0c\xf4\xf2\xb9\xa9\x1d\x41\xa7\x47\xcc\
-\x01\x0a\x01\xfc\x16\xef\xb3\xd1\x9c\xc3\x97\x3e\x8e\x4b\x01\x7c\
-\xf2\x3f\xb6\x01\x61\xdf\x80\xd0\x3f\x96\xa5\x32\xae\x53\x38\x5c\
-\x03\x26\xa7\xcc\xe9\x42\xc9\x19\x77\x16\x02\x9f\x5b\x99\xd3\xe7\
-\xaa\xeb\x62\x0b\x34\x9a\x4e\x98\xf1\x89\x98\xe1\xe7\xd0\x2b\xdd\
-\x4b\x32\x1b\x0c\x6d\x21\x78\x07\xee\x0b\xa5\xc0\xf0\xe1\xe2\x08\
-\x55\xd9\xe1\xe2\x09\x97\xee\x68\x14\x2a\x8e\xe0\x7d\xd9\x64\xe9\
-\x25\xbb\xfc\x32\x0b\x3d\xfb\x0c\x84\x52\xaa\xd6\x06\xd3\xef\x7b\
-\x06\x86\x7f\xfc\x33\xfd\xb1\x8b\x78\x32\x65\xb2\xe5\x08\x03\xdb\
-\xef\xa3\xd5\x11\x56\x4d\x39\x96\x77\x3c\x39\x37\x99\xc2\x21\xa0\
-\xdf\x86\xc0\xff\xe2\x4f\x48\x7c\xed\x0b\xfa\x64\xeb\x08\x73\x19\
-\x9d\xa3\x27\x6b\xdd\x27\xa2\x57\x4f\x96\x41\x4e\x5b\xbc\x02\xa6\
-\xa7\xa6\x51\x6f\xfe\xd6\x55\x99\x08\xcd\x6c\x3a\x7f\x4e\xe6\xd3\
-\xc9\x94\xca\x12\x76\x6a\x86\xf1\xb6\xd1\xf3\x26\xde\x37\x42\x7e\
-\x79\x2e\x0b\x78\x16\xd4\x2b\xf8\x00\xcf\x67\xc1\x5e\xc8\x42\xbe\
-\xb0\xc8\xa7\xd5\xac\x56\x15\x14\xf9\x6d\xf7\x0d\x08\xdc\xf7\x7c\
-\x6e\x50\xc0\xb8\xd9\x81\x83\xdc\x78\x6c\xbc\x7a\x20\x57\x01\x0a\
-\xe6\x0a\x00\x07\x21\x0e\xfc\x24\xdd\xf3\xd9\x1b\xc1\xdc\x9c\x3f\
-\xb9\x5a\x99\x46\x6e\xf4\x92\x01\x0e\xf3\x4d\x96\x92\x8e\x5e\x99\
-\x0b\x23\x4c\xa5\xb4\x5c\x12\x5f\xfd\x0a\x12\x3e\xdf\x0d\xc3\xd0\
-\xc3\x1f\xfa\xe5\x3e\xc8\xfa\x6e\x0f\xbc\xbd\xe7\x28\x1c\x38\x59\
-\x0b\xb5\x08\xfc\xe3\x35\xa7\xe1\x58\x5b\xaa\xb6\x89\xfb\x50\x27\
-\x31\xfd\x87\x4f\x55\xc3\xd7\x3f\xec\x80\xca\xbb\xef\xa7\x3f\xa4\
-\xb2\xba\x50\x4b\x7f\x6d\x2d\xb2\x3e\x2a\xb6\x2f\x1a\x3e\x44\xd2\
-\xbf\x9b\xc2\x9e\x26\x9d\x9b\x63\x60\x4d\xa6\xca\xf8\x98\xda\xec\
-\x9e\x36\x75\xda\xad\xec\x6b\x93\xcf\xc2\x35\xf9\x1c\xf0\xaf\x1b\
-\xd0\x3f\xb6\xc8\x6e\xef\x9e\xad\xd2\xcd\xc9\x2e\x32\xbf\x8f\xb0\
-\x3a\xce\x64\x36\xb8\x60\xc8\x72\x2d\x4e\xfc\xc2\xc9\xe6\xcb\x2f\
-\x4c\xf3\x14\x2e\x2e\xfe\x79\x9b\x7d\xae\x08\x1a\x93\x58\xfe\x83\
-\xc2\x91\x97\xa1\x29\xb5\xb0\x06\x61\xb3\x42\xa9\x87\x39\xeb\xee\
-\x83\x31\x6f\x90\x79\x7b\x84\x3d\xc2\x95\xdc\xac\xe5\xc0\x9b\xf0\
-\x1d\x4f\x3e\x98\xa3\xbe\x13\x17\xff\x18\xba\xed\xfb\x30\xf2\x85\
-\x3b\xca\x1c\xff\x3d\x7b\x13\x92\x83\xfd\x27\xe8\xbd\x3e\xf1\x36\
-\x24\xbb\x37\xc0\xa8\x0c\x39\x8c\x4d\x49\x85\xf1\xe4\x46\xec\xbc\
-\xa5\x74\x09\x25\x59\xf9\x42\x96\x47\x12\x8f\x98\x01\x3d\x33\x1f\
-\x4f\xe6\xcd\x89\x27\x4f\xe6\xdb\xc9\xd4\x0a\x01\x6b\x2a\x05\xbc\
-\xca\x07\x79\x3f\x40\x53\x48\x6b\x60\x35\x11\x79\x59\x1c\x79\x87\
-\x50\x21\xa3\x34\xfc\x9e\xc6\x7e\xa6\x2b\x50\x18\x36\x9d\xfc\x08\
-\x8c\x82\xdd\x4e\x1e\x54\xc3\x6d\x69\x72\x22\x0d\x7b\x1c\x1b\x17\
-\x15\x3b\x70\x14\x32\xe7\xe2\xc0\x4f\x06\x01\x92\x9e\x54\xd6\xfb\
-\xa7\xe0\xcf\x66\xae\x40\x38\xf0\xa7\x90\x1b\xbf\xab\xc9\x8a\xa1\
-\x4c\x7a\xe5\xc2\x78\xfc\x2b\x68\xfe\x49\x39\x90\x07\xbc\x48\xb9\
-\x90\x87\xc8\x86\x3d\xfe\x26\x0c\x7d\x6f\x27\x4c\xfc\xfc\x0f\xf0\
-\xfe\xb8\x1f\x7e\x38\x7a\x0a\x4e\x90\xe9\x1c\xf2\x3e\xfb\x9a\x3a\
-\x84\x67\x1d\xfd\x3c\x52\xcd\x88\x4c\xf5\x1c\xab\xe6\x6d\x67\xc5\
-\x85\xe5\xfe\xf7\x0b\x1f\x22\x1e\xfa\xbd\xa6\x31\x0c\x77\xfc\xb1\
-\xc0\x6d\x6c\x58\xee\xdc\xc7\x6a\xfd\xf7\x1d\x0b\x48\xd7\xd1\x6a\
-\xbc\x42\x39\x8d\x5e\xfe\xfe\x43\xf0\xf0\x33\x2f\x82\xda\x59\x42\
-\xcb\x91\x59\xa6\x69\x14\xe9\x87\x2d\x0d\xde\xe8\xfa\x6b\x4b\xf5\
-\x7d\x11\x71\x0c\xac\xcd\x52\x1b\x5e\x51\x98\x5d\x2b\x26\x4c\x9b\
-\x75\x31\xc3\xce\xb3\x10\xf8\x32\x16\xf8\x57\xc6\xc7\xc7\x66\x97\
-\x14\xf7\xc8\x52\x6a\x52\xb2\x34\xa6\xff\x61\x01\x56\xff\x55\x81\
-\x9f\xdd\x02\xc0\x27\x8f\xa8\x93\x9f\x25\xcc\xa4\x53\x12\x45\x90\
-\xe2\x5a\x0b\xe3\x9f\xfb\x00\x12\xbf\xdc\x0b\xf1\x3f\x9c\x42\xd8\
-\x1e\xf3\x03\xfb\x19\x05\xfe\xb7\x87\x29\xf4\x13\x10\xf2\xf1\x3f\
-\xd5\x42\x3c\x81\xfe\xdb\x5b\x20\xe9\xf6\xc7\x60\x84\xc2\xca\x4c\
-\xdf\xcc\x5d\x02\x13\xc9\x8a\x1b\x84\x3e\x59\xda\x48\xe6\xba\x89\
-\x07\xcc\xdc\x7c\x65\x6e\xb8\xd2\x79\x79\xd6\x9b\xa7\x90\xa7\x53\
-\x2a\x2a\x66\x7a\x86\xf5\xb8\xa9\x47\xce\x4d\xcd\x10\x6f\x9d\x05\
-\x75\x1a\x01\x38\x2b\x02\x93\x0c\x25\x23\xf2\x78\x3f\x5f\xdc\x76\
-\xba\x8f\x53\xe0\x7e\x05\x33\x38\xf0\xe3\x4c\x93\xb3\x03\x01\x19\
-\x50\x0a\xb9\xab\x89\xc6\x69\xa3\xe5\xf9\xcc\x60\x44\xa7\x7d\xd8\
-\x9b\xbf\x8b\xe9\x7c\x7f\x2e\xbd\xb9\x3c\x8f\x9d\xe7\x9f\x99\x9a\
-\x81\xf9\x5f\xc5\xcc\xef\xcf\x5d\x0c\xe3\xe6\x2d\x81\x31\x4b\xd3\
-\x60\x68\x81\x09\x06\xaf\x7d\x08\x52\x5f\xff\x02\x1e\xfd\xf9\x00\
-\xec\x3b\x55\x43\xa7\x44\x8e\xb1\x20\x3d\xcc\x13\x07\x5d\xbf\x6d\
-\x35\x22\x12\x08\xc3\x8f\xc7\x2f\x4e\x6e\x7f\x40\x1c\x87\x79\xdb\
-\x0e\x57\x07\x8b\x3f\x10\x1c\xe1\xc5\x45\xf6\x1d\x3a\x55\x0b\xc7\
-\xeb\x1a\x60\xff\xf1\x93\xf0\xd6\xc7\x9f\x43\xf1\xed\x77\xd3\x1f\
-\x4b\x27\xe5\x49\xa6\x75\xfe\x82\xc0\xe7\x54\x9b\xa9\x36\xbc\x27\
-\x37\xb9\x0a\x27\x4e\x9f\x73\x09\x61\xe6\x59\x09\x7c\xce\xc3\xbf\
-\x7e\xc0\x80\xd8\x3c\xb7\xbb\x7b\x86\x4a\x37\x1f\x47\xf2\x4f\xb0\
-\x52\x4f\xd2\xb9\x2b\x01\xe0\xf2\xff\x0f\x92\x1f\xf0\xcd\xec\x1d\
-\xfe\xe8\x40\x1e\x58\x89\x82\xf1\x07\x4a\x34\x0d\xe2\xf1\xfb\xfd\
-\x2f\x9a\x1f\x23\x95\x58\xba\xfd\xce\xc1\xfb\x9e\x55\x64\x80\x35\
-\x72\x66\xde\x7e\xb1\xd9\x0b\xd3\xee\x7f\x0e\x92\xd0\x83\x1e\xb6\
-\xf5\x38\xc4\x13\xd8\x22\x74\x13\xbe\x3b\xec\x0f\x7a\x41\x1d\x6e\
-\x0c\xfb\x2d\xf7\x3d\x20\x8c\xd8\x76\xb1\xb8\xc8\xf9\x7f\x38\x09\
-\x09\xdb\xab\x21\x7e\xf3\x5e\x48\xfc\xf7\x27\x90\x5c\xf1\x0f\x18\
-\x99\xa1\x80\x31\xe8\xc9\x92\x1b\x97\x93\xe9\x0d\xd9\x55\x14\xf4\
-\x64\xad\x3c\x99\xf2\x20\xf3\xde\x0b\x11\xf6\x64\x45\xcc\xe2\x2c\
-\x39\x9d\x1f\x5f\xc6\xbb\xa1\x4a\xa6\x69\x56\x14\xf8\x4f\xcb\xac\
-\xa6\x5e\x78\x11\xe3\x99\x13\xef\x5d\xc1\x78\xeb\x8d\x20\xd7\xc3\
-\x1a\x22\x15\x2b\x65\xa3\x32\xf8\xdb\x55\xfe\x61\x32\xf8\xfb\x79\
-\x03\x02\x7f\xe0\xe0\xce\xc7\xa5\x61\x55\x21\x37\x05\xd4\x38\x0d\
-\xb4\x22\x97\xb9\x31\xbc\x2c\x57\x4e\xa7\x9f\xa8\xd7\x8f\xf9\x5b\
-\x40\x6f\xf2\x32\x2b\x7c\x48\xfe\x67\x2c\x4b\xa7\x03\x1f\xb9\x51\
-\x3d\x61\xe6\x7c\x88\x9f\x91\x02\xf1\x2b\xf2\xc1\xf0\xe8\xf3\xf0\
-\xde\xce\xdd\x70\xbc\xba\x16\x81\x5f\xef\x83\xf2\x21\x9e\x28\x68\
-\x4f\x11\x98\xb2\x12\x80\x30\x5f\x7e\xc7\x05\xfc\x1f\xb8\xef\xb0\
-\xc8\xff\x7e\xe1\xc5\xce\x7d\x4a\xf8\xb8\x63\x98\x8f\x43\xd5\x35\
-\xf0\xdd\xce\x5d\x70\xcf\x63\x4f\x61\xb9\xea\xd9\x69\x1d\xa3\x78\
-\x9f\x0a\xc5\x02\x81\x7e\x1a\xa9\x33\x17\x0e\xf2\x91\x02\xbf\x05\
-\xb8\x41\x80\xff\x91\xc2\xe4\x52\x4f\x3a\x9b\x81\xef\xf3\xf0\x07\
-\x0e\x8c\xcd\x76\x3a\xbb\x66\xa9\xb4\xd3\x30\xa3\xaf\xa2\x0e\x22\
-\xf8\x1b\x98\xcb\x38\xa3\x28\xe4\xfc\x65\x04\xff\xf0\xe6\x08\xc2\
-\x0b\x1d\x1f\xc9\xb9\x22\x89\x27\x50\x02\xc7\x85\x04\x7e\xb8\xe3\
-\x05\x80\xaf\x36\x51\x4f\x88\x78\xf7\x19\x64\x4a\x01\x3b\xcb\xac\
-\xdb\x1f\x86\x51\x6f\x7c\x0b\x09\xdf\x1c\x86\x61\x5b\x8e\x35\x02\
-\xda\x0f\xd4\xfc\x01\x80\xf7\xfd\x9b\x43\xac\x0e\x33\x12\x82\x3b\
-\xb7\xdf\x37\x88\x70\xe1\x8e\xb0\x62\xff\x27\x2f\xf5\xfa\xf6\x10\
-\xc4\x93\x15\x26\x44\x9f\xfc\x0e\x89\x8f\xbd\x01\xc3\xcd\xe5\x30\
-\x7a\x71\x1a\x7d\x25\xc1\x64\x32\x7d\x43\x9e\x5c\x5d\x9a\x0e\xb3\
-\x96\x23\xe8\xd1\xcb\x25\x73\xdc\x14\xf4\x74\xe5\x4b\x21\xf5\xe6\
-\x97\xb1\x37\x5f\x97\x17\xa8\xd8\x9b\xab\x2a\x16\xf2\x0c\x60\xd3\
-\x38\xaf\xdb\x07\x62\x2d\x05\x47\x86\x82\x01\x35\x79\xf8\x8c\xcc\
-\x0b\x67\xaa\x39\xe9\xb1\xdc\x88\x0c\xcc\x27\x59\xd5\xa4\x34\x32\
-\x65\x49\x06\xcf\x22\x3d\xbd\x6a\xa2\xfb\xd9\xdf\x67\xe5\x8e\x6b\
-\x8c\x83\x95\x12\xc3\x2b\x0c\x90\x8e\x71\x90\x73\x32\x57\x06\x1a\
-\xdf\x74\xd1\x2a\x45\xa3\xf7\xbf\xb2\x50\xed\xf3\xfa\x89\xc8\x54\
-\x14\xc9\x1f\x5d\xee\x49\xc0\x9f\x91\x4f\x57\x1c\xdd\x4a\x57\xf5\
-\xac\xa1\x4f\xf6\x4e\x59\xb4\x12\x46\xcc\x98\x0f\xe3\xf1\x0a\x68\
-\xc3\xfd\x8f\xc0\x56\x04\xe3\xa9\x9a\x5a\x3a\x77\x7f\xf0\x64\x2d\
-\xc2\x12\x45\x3e\x4f\x31\xdf\xc9\xdc\x3e\xdd\x7e\xd2\x7f\xbb\xa8\
-\x02\xc3\x9c\x62\xb7\xe1\xf7\x83\xa7\x6a\x1b\xcf\x21\xa0\x03\x24\
-\x0c\xef\xff\x83\x81\xe7\x3e\xd9\x98\x26\x4e\x81\xe1\x0f\x63\x3e\
-\x8e\xa0\x7e\x3d\x78\x04\x9e\x7c\xf9\x2d\xc8\x35\x38\x28\xf0\x33\
-\xb0\x4c\x33\x55\x26\xd6\xd3\x0f\xec\x13\x61\xfa\x47\x38\xc7\x2a\
-\xea\xfe\xce\x4a\x63\x8c\x20\xde\xc8\xfb\x70\x88\xf4\x23\xf0\x8d\
-\xff\x95\x5b\xdc\xf9\xe3\x67\xdc\xda\x8b\x30\xf3\xac\x04\x3e\xe7\
-\xe1\xdf\xd8\xbf\xbf\xac\x70\x6d\x55\x5c\xba\xd6\x30\x3c\x4b\x65\
-\xb8\x1f\x3b\xd7\xae\xe8\x0b\x2a\x12\xc8\x86\x02\x7c\x53\x2a\x45\
-\xe8\x98\x70\xc0\x0f\xd7\x60\xc5\x8e\x0f\x9d\x3e\x06\x48\x46\x0a\
-\x32\xf2\x24\xed\x4a\xf4\x32\xe7\x7b\x6f\x83\x09\xcf\xbc\x0f\x09\
-\x5f\xed\x47\xd8\x1e\x41\x05\xc0\x9e\x82\x9c\x07\xf4\xa0\xef\x81\
-\xe2\x8e\x13\xd9\xe7\x27\x76\x3b\x6f\x90\x88\xff\xee\x18\x4d\x47\
-\xc2\x9b\xdf\xd1\xa7\x64\x47\xe4\x1b\x60\x4c\xca\x0a\x98\x30\x7b\
-\x21\xc2\x7e\x19\x7d\x4d\x01\x5d\x5e\xb9\x92\x99\xbe\xa1\x37\x63\
-\xd7\xe4\xc3\x52\x0a\x7a\xc6\x0b\x26\x73\xe1\x9c\x37\x4f\xa6\x6a\
-\xf8\x1e\x7c\x3a\x3b\xf7\xce\x79\xda\x8c\xf7\x6e\xa0\xca\x64\x3f\
-\x99\xef\x1c\xdc\x39\x50\x33\x65\xc7\x87\x09\xf7\x7f\x16\xf7\x3f\
-\x7f\x1b\xab\x46\xf0\xf3\xc4\x3b\x5f\x86\x4a\xef\xbb\x8a\xc8\xf0\
-\x4d\x05\xb1\xf7\x0a\xa8\x34\x8d\x37\x83\xe9\x8a\x1f\x35\x33\xd7\
-\x8f\xe0\x27\xf7\x24\xe8\x0d\xde\x35\x05\x74\x5d\x3f\x19\xf8\x08\
-\xf4\xa7\x2c\x5c\x09\xe3\xb1\xac\xc8\xfc\xff\x63\xcf\xbf\x0c\xbb\
-\xf6\xee\x87\x13\x75\xa7\xe9\xb4\xc8\x3e\x04\xe6\xfe\x56\x54\xb4\
-\xf1\x87\x0a\xbf\x8f\x27\xfe\xf6\x03\xa7\x4e\xc3\x21\x04\xfe\x9f\
-\x47\x4f\xc1\x2b\xef\x7f\x0a\x46\xf6\xbd\xf9\xe4\x1e\x09\x29\x53\
-\x71\xe0\x87\xe8\x1f\x11\x3b\x56\xad\xc9\x99\x26\x01\xbf\x81\x8d\
-\xa3\x06\xf3\xfe\x6f\xb9\xc5\xb5\x74\xc2\xcc\x59\xcc\x8b\xd4\xe2\
-\xce\x42\xe0\x13\x63\xbd\x7c\xd9\x95\x23\x47\xca\xd2\x75\xd6\xbe\
-\xd9\x6a\xa3\x01\x3b\xce\xe6\xa6\x14\x6c\x16\x4f\xe1\xc1\xd9\x3c\
-\x45\x73\xae\xac\xc0\xc6\x29\x00\x98\xc0\x78\x43\x03\x5f\xf8\x38\
-\x02\x9c\x35\xc4\x83\x44\xe0\x2f\x32\xb8\x60\xda\x03\xcf\xc1\xf0\
-\xf7\x7f\x42\xcf\xfe\x38\x03\x7b\x41\x50\x9f\x01\xd1\x7b\x06\xc7\
-\x21\xe1\xcb\xbd\x90\xf0\xf2\x97\x90\xbc\xee\x41\x18\x99\xa9\x80\
-\xb1\xe4\xa5\x63\x33\x53\xe8\x3b\x68\xa6\x2f\x4b\x67\x41\xcf\xdc\
-\x90\x25\xcb\x2b\xc9\xaa\x9b\x65\x59\xcc\x5a\x79\xb2\xd2\x86\xdc\
-\x00\x25\x53\x22\xe4\xbe\x04\x05\x3d\xf1\xe6\xc9\xd4\x95\x9c\x9d\
-\x8b\x67\xe7\xd5\xb9\xe9\x97\x4c\x15\xe7\xc9\xfb\x03\x9a\x83\x7d\
-\x20\xc4\xa3\xae\x7f\xb5\xd8\x20\xc0\x7c\xf7\x1b\x6c\x7c\x53\x45\
-\x3a\x3f\xf8\xd3\x29\x1f\x39\x3b\xdf\xef\x9b\xee\x61\x56\x16\xd1\
-\xd5\x3d\xa8\xc5\xec\x7a\xfe\x79\xab\xb3\x61\xca\x82\x15\xb4\xac\
-\x0a\xed\xc5\xf0\xca\x07\x9f\xc1\x1f\xc7\x4e\xc2\xd1\xba\x7a\xf4\
-\xbe\x11\xf8\x27\x6a\xfc\xb4\x97\xa7\xc0\xed\xa1\xc2\x89\x1d\x13\
-\x49\x98\x70\xe7\x0e\xdc\x17\x18\xe7\xbe\x53\x0c\xf4\xf7\x1e\xaf\
-\x85\xff\x7e\xf5\x1d\x94\xdd\x75\x3f\x5e\x61\x99\xb0\xee\xd5\xb4\
-\x2c\x1b\xe7\xf2\xc5\xfa\xa2\x18\x68\x05\x06\x73\xd1\x3a\x8f\x06\
-\xf6\xd1\x38\x78\x51\x87\x6f\x60\xd3\x59\x83\xed\xf9\x81\x42\xb3\
-\x63\xdc\xc4\x59\x33\xbb\x13\x60\x9e\x95\xcb\x32\x03\x6d\x69\x56\
-\xde\xc5\xd9\x5a\xcb\x2d\xd8\x61\x5e\xc0\x4c\xd6\x22\x18\x1b\x22\
-\x2d\xb0\xac\x10\x0a\xaa\xe8\x80\x46\x20\xd6\x00\x22\xd9\x1e\x08\
-\xe7\xc0\x7d\x62\x60\x88\x48\x22\xf0\x17\xca\x63\x26\x3b\x95\x93\
-\x9e\xaf\x82\x65\x4a\x13\xcc\xae\xb8\x07\x46\xbd\xb1\x19\xe2\xbf\
-\x3e\x40\x1f\xd2\x89\x27\xe0\xfd\xfa\xa0\xa0\xe2\x03\x24\xb6\x5d\
-\x4c\xe2\x61\x0f\x31\xe7\xde\xc2\xc0\x3e\xf1\xc5\xcf\xe8\x43\x54\
-\xa3\x57\xe6\xc0\xf8\x59\x29\x30\x89\xac\xa9\x27\x2f\x30\xa3\xb0\
-\x67\x56\xdf\x70\x4b\x2c\x17\x67\x17\x50\xaf\x9e\x82\x9e\xbd\x11\
-\xbb\x8a\xfd\x2d\xd4\x34\x41\x4f\xbe\x51\x7e\x50\x57\x1b\x22\xae\
-\x8b\xa6\x0e\xf8\x81\x71\x34\xfe\xdf\x98\x06\xff\xab\x00\x26\x9d\
-\x19\x01\x37\x82\xd3\xe4\x8d\x73\xfe\x74\x8e\x9f\xbd\xc1\x4b\x6e\
-\x4c\x13\x8f\x9e\xdc\xc7\x20\x4f\x15\x93\x87\xb7\x1c\xeb\xee\x80\
-\x0f\xbe\xde\x82\x80\x3c\x0d\x07\x6b\xea\xa9\xa7\xbc\xe7\x78\x8d\
-\x9f\xfe\x0c\xf8\xff\xac\x10\x85\x7e\x1d\xcd\xd7\xe7\xdb\x76\xc2\
-\x9d\xff\x7c\x0a\xb2\xb4\x16\xfa\xe4\x73\x86\xd2\xff\x6a\xcc\xaf\
-\x5e\x45\xfa\x0a\x07\x53\xd1\xba\x17\x39\x56\x68\x10\x89\xa6\x9d\
-\x88\xf1\x21\x5c\x3f\x16\x60\x48\x7d\x96\xda\x74\x00\x9d\x04\x57\
-\xbe\xde\x76\xcd\xb8\xc9\x93\x3b\x11\x56\x72\xb3\x23\x67\xb5\x4d\
-\x9b\x33\xbb\x63\x8e\xd5\x79\xf5\xff\xb3\x77\x1e\x70\x52\x14\xd9\
-\x1f\x27\x9a\xbd\x3b\xf5\xce\xf3\x3c\xef\xef\xa9\x04\x41\xb2\x08\
-\x22\xa8\x28\x19\x96\xb0\x6c\x4e\xb3\x93\x76\x27\xec\x6c\x4e\x24\
-\x41\x54\x04\x04\x44\x05\xc9\x39\x23\x39\x4b\x46\x72\xce\x79\x61\
-\x59\x76\x61\x73\x5e\x72\x7a\xff\xf7\xaa\xbb\x67\x7a\x66\xba\x67\
-\x67\x13\xe0\xde\xf6\xe7\xf3\xfb\xcc\x4c\x77\x75\x4d\x77\x85\x6f\
-\xbd\x7a\x5d\x5d\x15\x14\x1e\xff\x6d\x50\x44\xfc\x05\xac\x28\x77\
-\x2b\x25\xf0\x9d\x6d\x08\x4a\x04\xfc\x78\x36\x84\x50\x11\x8c\x60\
-\x18\x3c\x12\xda\x2f\xdc\x04\x2d\x69\xbc\x36\x5a\xd7\x04\xfb\x16\
-\x27\x10\xcc\x27\x64\x80\x7f\x42\x24\xa9\xfd\x72\xdf\x4f\xd8\x00\
-\x5f\x1c\x86\x74\xa6\x10\x5a\x9c\xbf\x09\x2d\x8e\x67\x43\xcb\x65\
-\xbb\xa1\xf5\x57\xa3\xa1\xad\x8f\x1a\x3e\x17\x5e\xa0\xf2\xf4\x67\
-\x2f\x1d\xf5\x12\x7c\xf5\x1a\xce\x57\x4f\x23\x57\x68\x04\x8b\x30\
-\xac\x52\x61\x14\x59\xf4\xc2\x83\xd7\x30\xd1\x43\x57\xe6\x57\xe7\
-\xa4\x89\x14\x03\xbf\x64\x69\xfe\xd8\x80\x1f\x19\x27\x82\x3e\x27\
-\x06\x7d\xb1\xab\x27\xc4\xe2\xe6\xa1\xe7\x15\xe4\xdb\xf7\xc0\xf4\
-\xe9\xe8\xe6\x07\x1e\xd8\xeb\x19\x3d\x6d\x0e\x1c\xbb\x94\x04\xb9\
-\xf7\x1e\x31\x40\x12\x28\xd3\x6f\x3c\x1e\xa5\x55\x70\xf8\x8c\x9b\
-\xf7\x20\xfb\xce\x03\x38\x75\x35\x15\x66\xad\x58\x0f\x41\xb1\x5f\
-\xb1\x06\x8f\xcb\x67\x99\x7c\xad\xa4\xc0\xc7\xdf\x79\x78\xcf\xdb\
-\xb4\x11\xfd\xbc\x3c\x74\x86\xe7\x9a\xf3\xab\x5f\xfd\xb9\x81\xcf\
-\xaf\x63\x5b\xfd\x85\xe7\xab\xb5\x57\x69\x5e\x30\x44\xf5\xeb\xa6\
-\x89\x88\x9d\x85\x15\x23\x8b\x2a\x4b\x30\xff\x00\x57\x32\xb3\xca\
-\x60\x39\x4b\x42\xc0\x41\x9c\x92\x50\x2f\xcb\xff\x97\xe2\xdc\x60\
-\x89\x7d\x64\xf5\xd0\xa8\x1c\x25\xb9\x00\x42\x63\xa1\xeb\xb8\xb9\
-\xf0\xf1\xb6\x73\xd0\xfc\x64\x3e\x34\x23\xbf\x39\x0f\xe3\x0f\x4f\
-\xd8\xc0\xba\x22\x85\x96\x7d\x73\x82\xfd\xd1\x2c\x84\xfd\x1e\x68\
-\x3d\x64\x2c\xb4\xf5\x56\x31\xd8\x77\xec\xed\x01\x5d\xbd\x14\x6c\
-\xaa\x61\x9a\x79\x92\xc6\xa0\x93\xaf\xde\x4b\xcb\xf9\xea\xc9\x95\
-\xe1\x6f\x0c\x37\x5b\xf5\x66\xd7\x0d\xff\x30\x56\x15\x1e\xc3\x5b\
-\xf6\x16\x97\x89\xad\x2f\x5d\x36\xbf\x1d\xe4\x49\x79\xe4\xaf\xdc\
-\xf9\xd6\xd7\x66\xfd\x4c\xc1\xda\xc7\x1f\x6b\x86\xbe\xe0\xe6\x11\
-\x1e\xe8\xd2\x08\x1e\xb2\xf0\xbd\xf5\x11\xcc\xf2\x3d\x93\x92\x0a\
-\xf9\xf7\x81\x01\x92\xa0\x9a\x5a\x74\xe7\x4f\xaf\xb4\x22\x0e\xf8\
-\x39\xd8\x6b\x39\x77\x3d\x13\x16\xac\xdf\xc2\x80\x4f\x43\x71\x29\
-\xcf\x25\x1b\x73\x36\x58\xa1\xbf\x7c\x3e\x94\xa1\xbe\x95\x88\x25\
-\x52\xff\xe5\x88\x35\x8e\x99\xf3\x48\xcb\x1d\xbb\x84\x86\xc1\xd7\
-\xc1\xb1\x83\x9a\xfc\xe5\x95\xca\x32\x5b\x66\x35\xd1\x02\x28\x4d\
-\x9a\xd4\x8c\x1d\xfc\xf5\xeb\xaa\xb0\x38\x1f\xac\x14\xdb\xd1\xd2\
-\xcf\xc6\x9b\xbe\x1f\x64\xd7\x4d\x97\xe8\xb6\x5b\xc9\x99\xf0\x52\
-\xe7\xcb\xc5\x5b\xdc\xff\x39\xfa\x7f\x67\x8f\x39\xf3\xdf\x96\xdf\
-\x5a\xd1\xc3\x48\x35\x42\x32\x00\xd5\x67\xc8\x68\xf8\x6c\xe9\x4e\
-\x68\x8e\x56\x75\xb3\xd3\x85\x0c\xfa\x2d\x8e\xe7\x3c\x3e\x31\x0b\
-\x3f\x9f\x3d\x37\xa0\x6b\xf8\x70\xd5\x21\x68\x3d\x70\x14\x9b\xf0\
-\xac\x7d\x0f\x57\xe8\xe8\x4a\x0f\x67\x95\xec\x01\x24\x4d\x2d\xd0\
-\x57\xad\xe7\xdf\x92\x45\xd8\x07\x5b\xac\x7a\x1a\xc1\x12\x28\x3c\
-\x8c\x15\x8d\x89\xd7\x88\x86\x52\x0a\xf7\xcf\x3d\xcc\x73\x36\xaf\
-\x9c\x29\x03\xce\x94\x9f\xe2\xca\x82\xe3\x38\xc5\xd7\xae\x15\x81\
-\xdf\x32\xec\x93\x83\x3f\x8d\x50\xe1\xa0\x1f\x09\x5e\xc1\xa1\x08\
-\x7c\x7f\xf0\x0b\x89\x86\xe9\x4b\x56\x43\xc2\xf5\x34\x28\xb8\xf7\
-\x10\x52\x0b\xef\xc0\x75\xd4\xb5\x4a\x20\xba\x0f\x6a\xbc\xb2\x11\
-\xf8\x09\xe9\x39\xb0\x64\xd3\x0e\x04\xfe\x20\xe6\xce\xa2\xf4\xb0\
-\xb8\xec\x4a\x0a\xe7\xd2\xe4\x5d\x49\xb8\xe1\x4c\x3d\x76\xee\x3a\
-\x78\x03\xe6\x41\x50\x54\x5c\x4e\x70\x54\xdc\x8a\xe0\xa8\xf8\x2f\
-\xa2\x07\x0c\xfc\xcb\xdf\x5e\xf9\x5b\xa5\x04\x7e\xf5\xd0\xd0\xd0\
-\x5a\x01\x41\xa6\xff\x06\x47\xf6\xf7\xc7\x9b\x5f\x89\x89\x90\x89\
-\x9f\x0f\xaa\x80\x6f\x0f\x7c\x06\x08\x7a\x0b\x94\xde\x36\x0d\x8d\
-\x87\xce\x13\x17\x43\xeb\x3f\x12\xa0\xe9\xd9\x1b\xd0\xec\x64\x1e\
-\x83\x6e\x8b\x63\xa4\x1c\x8b\x6c\x21\x7d\x8c\x0f\x43\x61\xa5\x20\
-\xce\xce\x71\x70\x5c\x88\x83\x3e\xc9\x6f\x4f\x0d\x0d\xf5\x28\x56\
-\x1e\x80\xd6\x83\x7f\x84\x76\xde\x1a\x68\xef\xe2\xc1\x5e\xa4\xa2\
-\xa1\x85\x34\xb6\xbc\x8f\x22\x18\xdc\xb0\x12\x33\xcb\x3e\xc8\xe2\
-\xc2\x09\xe0\x5f\x16\x53\xb0\x97\xa4\x78\xd8\x87\xf1\x0f\x3b\x23\
-\x62\xed\x40\xe9\x1c\xf0\xa5\xf2\xbb\xa2\x80\xef\xdc\x31\xe9\xfb\
-\xb0\x71\xf5\x84\x09\xd0\xe7\x2c\x7d\x1f\x5d\x38\x74\x42\xe0\x07\
-\x60\x2f\x6e\xce\xca\xf5\x70\x39\x3d\x03\xf2\x11\xf8\xd7\x0a\x6f\
-\x43\x0a\xd3\x1d\xe7\x54\xe0\x64\xb8\xc7\x2d\xba\xae\x82\xdb\x70\
-\xed\xc6\x1d\xc8\xba\xfb\x00\x2e\x67\xe5\xc1\x8a\x6d\xbb\x19\xf0\
-\xfb\x04\xea\xd8\xb0\x56\x35\x3f\xf2\xaa\x92\x03\xff\x21\xaa\x28\
-\x28\x22\x6e\x09\xde\xab\xbb\x2a\x38\xec\x9f\x26\x93\xb1\xc6\xab\
-\xaf\xbc\x5a\x79\x80\x6f\xbb\x99\x42\x4d\xb5\x22\x62\x07\xfc\x2b\
-\x28\x34\xde\x4b\x13\x16\x3b\x23\x28\x3c\xfe\x02\xb6\x7a\xb7\x4b\
-\x56\x11\x4b\x53\x69\x2b\x2a\xfe\xf2\x93\x95\x65\x48\x23\x54\x18\
-\x2c\xa3\xa0\xf7\x90\x31\xd0\x76\xd5\x01\x68\x71\x34\x13\x9a\x9d\
-\x2d\x42\xd8\x23\x80\x8f\x66\x5b\x80\x5e\xd1\x62\xc0\xc7\x1e\xc5\
-\x91\x2c\x06\xfb\x56\xdf\x8c\x47\xd8\xab\xd9\x8a\x53\x34\x12\x87\
-\x1e\xce\xba\xb0\x87\xb3\x3a\xf3\x4b\x54\x3e\xc1\xdc\xa4\x66\xcc\
-\x57\x6f\x8a\xe6\xe7\xb0\x21\xf7\x4d\xb4\x9d\x9f\x5e\xfa\x81\x6c\
-\xe5\x92\xe0\xf6\x31\xdf\x33\x3d\xaf\x20\x97\x16\xa6\x89\xaf\x3e\
-\x02\x3a\x7b\x28\x40\x81\x0d\xe0\x9c\x55\x1b\x10\xf8\x99\x0c\xf8\
-\xc9\x08\xfb\xab\x05\x9c\xe8\x3b\x53\x81\x65\x9f\xf9\x58\x81\xf4\
-\x7e\xb9\x63\x72\x61\xe5\x94\xec\xe4\xb9\x8e\xfe\x2b\xa9\x80\x6b\
-\xb8\x32\x11\xf8\x97\xb2\x11\xf8\xdb\xf7\x80\x16\x81\x4f\x6b\x0d\
-\x04\x5a\x01\xbf\x52\xd6\xfb\x47\x41\x11\xf1\xf7\x10\xf4\x49\x41\
-\xe1\xb1\x8b\x35\x21\x51\x5e\x91\xfd\x7f\x78\xbd\x73\x67\xd7\x5a\
-\xc4\xc4\x3f\xb7\xdf\xde\xc1\x46\x43\x35\xdf\x79\xeb\xad\x6a\x4d\
-\x3b\x77\xad\xa9\xfd\x76\xf8\xcb\xc1\x51\xb1\xed\xb1\xf0\x8f\x43\
-\xeb\xe7\x24\xea\x46\x50\x64\xdc\x43\x4b\x66\x3d\xf1\x4c\x7a\xfc\
-\x50\x10\x0d\xf5\x53\x46\x9c\xff\x04\x00\x00\x20\x00\x49\x44\x41\
-\x54\xa3\x45\xac\xa4\x79\xdd\xa3\xbf\x82\x8e\x93\x97\xc0\x87\x7b\
-\x93\x99\x2b\xa7\x05\x0f\xfb\xe6\x47\xb3\x24\xd5\x42\x46\x8e\xc2\
-\xc9\xc5\xc5\x84\xd6\x7f\xf3\x13\x68\xdd\x1f\xc6\xb0\xeb\x4f\x40\
-\xab\x6f\xc7\x43\x5b\xdf\x20\xf6\x66\x28\x83\x3d\x9b\x1e\x41\x0b\
-\xae\xaa\x60\xf6\x70\xd6\x9b\x86\x5b\x8a\xac\x7a\xf6\x50\x36\x2c\
-\x8a\x7f\x69\x2a\x96\xad\x78\xa4\x15\x0d\xad\x7c\xd2\x69\xfe\xd8\
-\xf3\x38\xd2\x32\x9a\x47\x13\xce\x3d\xbb\x20\xb7\x0e\xb9\xc3\x94\
-\xe1\xf1\x30\x0b\x2d\xfc\x8b\x68\xe1\xe7\x22\xf0\x09\x92\x57\xf2\
-\x6f\x31\x25\x15\x70\xba\x82\x4a\xcc\xc3\x4f\x5e\x89\x74\x8c\xd7\
-\x15\x91\x28\x0c\x0b\x27\x9c\x27\x3a\x26\xfc\x4e\xe4\x65\x7b\x8e\
-\xb0\x2f\x51\x14\x5e\x08\x6b\xfe\x2e\x5c\x83\x28\x6c\x92\xf8\xbf\
-\xf2\xec\xff\xeb\x2a\x5a\xfa\xe9\x77\x1e\xc0\xc5\xac\x5c\x58\x8a\
-\x16\xbe\x3a\x66\x10\xf4\x42\xe0\x2b\x4c\x31\x6c\x54\x93\x46\xf4\
-\x1e\xc5\xe3\x51\xc5\x37\x0a\x98\xdf\x0f\x51\x37\xb4\xe1\xf1\x17\
-\x31\xdf\x67\x06\x85\xc5\x75\x0e\x8a\x1f\xf4\x5a\xa3\x66\xad\x6a\
-\xfc\xe5\xe5\x17\x39\x2e\x56\x42\xc3\xde\xbc\x09\xdd\x96\xf7\xfb\
-\xf4\xae\xee\x65\x34\xfe\x55\x17\x15\xf3\xa1\x3a\x34\x66\x50\x50\
-\x78\xdc\x1e\x6d\x64\x1c\x6f\xe9\xd3\x38\xd5\x27\x5f\x39\x1f\x3b\
-\x0c\xcc\xd6\x3d\x5a\xc2\xe4\xf3\xd6\x87\x41\xcf\xef\x7e\x81\xb6\
-\x2b\xf7\x41\x33\xb4\xb4\x9b\x12\xf0\xd1\xca\x26\x55\x38\xf0\x85\
-\xff\xc0\x06\x86\x3d\x2f\xd8\x74\x1a\x3e\x1a\x35\x13\x3e\x09\x34\
-\xc2\xe7\x3d\xdd\xd9\x1a\xaf\x34\x95\x31\x0d\xbb\x74\x55\x06\xb3\
-\x91\x26\xc2\x1b\xb3\x7e\xfc\xd4\xc4\xc2\x08\x1c\x35\x6f\xd5\x6b\
-\xf8\x4a\x5d\x05\x7c\xc1\xc5\xc3\xbd\x2d\x4c\x0f\xb1\x7b\xf8\x28\
-\x21\x10\x81\x3f\x6d\xd9\x1a\x38\x93\x9a\x0e\x19\x08\xfc\x2b\xf9\
-\xb7\xe1\x32\x82\xf3\xb2\x08\xc4\x24\x61\x9f\xf9\x98\x68\xbf\x5d\
-\x98\x7c\x0b\xa0\x6d\xe3\x91\x8a\x4f\x80\xbe\xdc\x7f\x4a\xfd\xbf\
-\x6c\x58\xf1\x7f\xb1\x06\xe0\x0e\xa4\xde\x7e\x00\x67\xd2\xb3\x61\
-\xe1\xc6\x1d\xa0\x8a\x19\xc8\x2c\x7c\xea\x01\xd2\x03\x7b\x4a\x8f\
-\xc7\x9b\x1f\x15\x0a\xfc\x47\x5c\x7e\xc7\xdd\xc0\x72\x7e\x5c\x13\
-\x1e\x3f\x22\x38\x2c\xfe\x73\xcc\xeb\xbf\x77\xf5\xf4\xa8\xf9\xf2\
-\x4b\x2f\x59\xf1\xb0\xd2\x6e\xd4\x7d\x11\x6e\xb2\x26\x7e\xf7\xf0\
-\xf4\xa8\x1d\x33\xf8\xdb\x46\x6a\x53\x74\x08\x76\xeb\xd6\x61\x85\
-\x48\xc7\xca\xf0\x50\x48\xb0\xc7\xa2\x08\x91\x1c\xed\xab\xe0\xff\
-\x65\x20\xa0\xae\x2d\xf9\xbb\x11\xf6\x1e\x91\xfd\xa1\xc3\x14\xb4\
-\xee\x77\x27\x41\xd3\xe3\xb9\xd0\x0c\xd5\xfc\x70\x26\xc2\x38\x93\
-\x03\x72\x45\x8b\xfe\x8f\xb4\x23\x01\x3e\x9a\xb0\x84\x2d\x56\x42\
-\x33\x3c\x76\xe8\xe5\xc1\x66\x7d\xec\xa9\xd0\xb0\xb9\x61\x08\xf6\
-\xc2\x90\x4b\x9a\x87\x5e\xc1\xdc\x38\x91\x3c\xec\x63\x98\x25\xab\
-\xe1\x1f\xcc\x6a\x23\x2c\xd3\x16\xd8\xa5\xf1\xe3\x48\xf3\x8a\x2c\
-\x33\x25\x3a\xdf\x32\x66\x9f\x86\x69\xf6\xf4\x53\x83\x22\x34\x16\
-\xc6\x2f\x58\x0e\x47\xae\x5e\x87\xeb\x68\x09\x27\xa2\x85\x7f\x09\
-\x41\x79\x29\xf7\x16\x24\xf0\x9f\x9c\x6e\x42\x02\x2f\x76\x9c\xe9\
-\x26\xdb\xcf\x3e\xcd\xfb\xf8\xf0\xb8\x2f\x21\xef\xa6\xe5\x53\x2a\
-\x9c\xad\x72\xa5\xe2\x15\x7d\x17\xfe\x9f\xe9\x96\xe5\xb8\xed\x31\
-\x51\x7c\x89\x79\xb7\x21\xe5\xe6\x7d\x38\x9e\x92\x01\xb3\xd6\x6c\
-\x02\x65\xd4\x00\xf6\xee\x01\xb9\xfb\xa8\xa7\x53\xe1\xc0\x2f\x6d\
-\x9e\x15\x77\x9e\xf4\xf1\x47\x08\xfb\x4c\x34\x74\x36\xa3\xe2\x0d\
-\xb1\xb1\x1f\x69\x83\x4d\x2f\xbe\xfb\xdf\x77\x98\xff\xa6\x66\xcd\
-\x9a\x95\x1f\xf6\xe2\x4d\xb8\xd9\xbf\xfe\xf5\x2f\xd5\xde\xa9\x53\
-\xaf\xba\x3a\x6c\xd0\x5b\xba\x98\x41\x7e\x08\x86\x15\x98\x58\xa9\
-\x08\x86\xbb\xa8\x47\x76\x0f\xf0\x22\xec\x25\x7e\x30\xa6\xb5\xed\
-\x16\x4a\x84\x97\x3e\x5f\xfa\x41\x9b\x9d\x25\x6a\x7b\xbe\x68\xbf\
-\xd5\xb5\x4a\xc4\xe1\xf8\x1e\x78\xd8\x93\xeb\x83\x0d\x5f\x8c\x80\
-\xde\x5f\x8f\x86\x76\xcb\x76\x41\xd3\x13\x08\xfb\x63\x39\x1c\xec\
-\x1f\x83\x9a\x91\x8e\x66\x43\xb3\x93\x05\xd0\xfc\x60\x1a\x7c\x38\
-\x7b\x03\x7c\x1c\x31\x18\x61\xef\xc1\xc1\xde\x33\x80\x2d\xee\xcd\
-\x60\xaf\xe5\x66\xb7\x64\x43\x2e\x43\xc2\x2d\xd3\x22\x10\xec\x45\
-\x13\x99\xd9\xa6\x83\xe4\xc3\x59\xc9\x3c\x91\x39\xd7\x41\x5e\x58\
-\x95\x05\xa7\xf2\x5a\x22\x2f\x24\xca\x92\x54\xf8\x12\x97\x3b\x9b\
-\x6b\xa4\x86\x90\xd2\xab\x37\xf6\x94\xfc\x4d\x31\x30\x7a\xc6\x02\
-\xd8\x73\xf1\x2a\x24\xdd\x7c\x00\x97\x0b\xee\x30\xd0\x5f\x44\x70\
-\xda\xea\x02\x2f\xab\x7d\x39\xf8\x99\x63\x1f\x56\x6a\x9f\x39\xac\
-\x54\x78\x89\xff\x92\xfd\x2e\x8a\xe7\x82\xcc\xf7\x8b\xa2\xc6\x29\
-\xa9\xe8\x2e\x1c\xb8\x9c\x02\x93\x96\xae\x01\x45\x44\x3f\xf6\xd0\
-\x96\x1e\x5c\x93\xbb\xcf\xaa\x9e\x14\x93\x7e\x76\xf9\x1c\x29\x5f\
-\x56\x8a\xaf\xf3\xce\xe7\x9f\x5c\xd9\xb1\xfe\xef\xb8\xfb\xd8\xa0\
-\x67\xa1\x55\xbf\x4e\x1f\x3b\xc8\x60\x8c\xff\xfa\x9d\xd6\x6d\x47\
-\xd4\xfa\xdb\x2b\xef\xf3\xd8\xfb\x1f\x02\xbd\xd4\x56\xa3\x46\xad\
-\x6a\xed\x3b\x28\x6a\xf9\x04\x85\xfc\x2b\x28\x32\xb6\x27\x42\x62\
-\x02\x26\x64\x12\x26\xdc\x1d\xfe\xc9\xf6\xff\x04\xf0\xd9\x0c\x8d\
-\x34\x01\x57\x70\x28\x78\x86\xf7\x83\x8e\xbf\x2e\x80\x56\x9b\xce\
-\x70\xd6\xfd\x51\x82\x71\x46\xc5\x03\xff\x50\x06\x07\xfc\x53\x85\
-\xd0\xec\x48\x36\x34\xa7\x11\x39\xf1\x23\xe0\x53\x77\x05\x5b\xbc\
-\xa3\x8b\xbb\x1f\x5b\xc6\x8f\xa6\x03\xa0\x07\xb4\xde\x41\x21\x68\
-\xd9\x87\x72\x6e\x1c\x53\x84\x79\x0e\x1c\x7a\xd9\x48\x3c\x4b\x65\
-\x15\xf0\x6d\xaf\xd1\x92\xe7\xe4\xd2\x70\x45\xf0\xf9\x1a\xa2\x61\
-\xe8\xb8\x69\xb0\xf9\xd8\x39\xb8\x88\xd6\xf0\x25\x04\xfe\x45\x84\
-\xe4\x79\x84\xe6\x79\x1e\xa2\x02\xe8\x2f\xd8\xfe\x16\xef\x93\x0b\
-\xcb\xef\x13\xe2\xb3\x8a\xd7\x36\x2e\x91\xce\xcb\xed\xb7\xf9\x3f\
-\x71\x7c\xe2\xef\xac\x81\x20\xcb\x9f\x5c\x54\xf9\x77\x60\xc7\xa9\
-\x04\x18\x33\x6b\x21\xf8\xd3\xbc\x50\x2a\x3d\x9b\x56\xc3\x3c\x34\
-\xf3\xcf\x0b\xfc\x47\xe4\x99\xe0\x3f\xd3\x30\x5f\xe7\x60\xcf\xd6\
-\xdd\x5b\xad\x7c\xb3\x75\xc7\xe0\xda\xd5\xaa\xb5\x62\xbe\xfa\xea\
-\xd5\x2b\xe9\x03\x5a\x67\x37\x6a\xf2\x6a\xd5\xaa\xcd\xbe\x37\x6c\
-\xf0\x65\x8d\xb0\xe8\x51\xff\xd0\x84\x46\x75\x54\x85\xc5\xfd\xa0\
-\x89\x88\x3f\xa4\x09\x8b\x2b\x10\x43\x5f\xaa\x32\xdb\xb4\xae\xb2\
-\x0d\x81\x24\x80\x1d\x86\x91\x82\x94\xdc\xb1\xe2\xe2\xb0\x5c\x9b\
-\xfd\x3e\x4e\x54\xf9\x95\x6c\x4e\xf5\x48\xe8\x3d\x70\x38\xb4\x5b\
-\xfc\x07\xb4\xd8\x93\x0c\x4d\x0f\x67\x41\x33\x04\x71\xf3\x83\x19\
-\x0c\xc8\xe6\xcf\xf2\xd0\x41\xeb\xf8\x18\xec\xb1\x37\xd1\xec\x44\
-\x3e\x34\xdf\x78\x06\x3e\x1a\x31\x15\xda\xfa\x05\xc3\x17\x3d\xdc\
-\xa0\x8b\x9b\x1f\xf4\xf0\x55\xb1\x69\x8d\xdd\xd5\x7a\x36\x27\x0e\
-\x2d\x31\x28\x2c\x27\x48\xd6\x3d\x37\x07\x0e\x5a\xf7\x22\xe0\x3b\
-\x97\x4e\xce\xa7\xa1\x6d\xba\x95\x2c\x2f\x8a\x6f\xdc\x9d\x2b\x0f\
-\xa5\x0f\x63\xdb\xc8\xd3\xe8\x25\x77\x35\x4d\x3b\x11\x01\x31\xdf\
-\xff\x04\x2b\x76\x1d\x86\xb3\x99\x85\x08\xfc\xbb\x70\x1e\x81\x7f\
-\x2e\xfb\x06\xa7\x1c\x91\xa4\xf6\x89\xf7\x67\xcb\xec\x2b\x4e\x72\
-\x71\x89\x8f\x3b\xf9\x1f\x67\x51\xe7\xf1\xd8\x85\xdc\x1b\xcc\x95\
-\x74\x19\x81\x4f\x96\xfe\xfa\xfd\x27\x60\xc8\x4f\x53\xc0\xc7\x18\
-\x05\x7d\xf1\xbe\xe9\xe1\x3e\x73\xe9\x84\x5b\xa7\x51\x49\xcb\x83\
-\x33\x75\xcf\x21\xf0\xe5\x1a\x72\x59\x03\x4e\xfc\x3b\xf6\x11\xe6\
-\x25\x1a\xa8\xb1\xa7\xf1\x5e\x26\x68\x43\x63\x7b\x19\x87\x0c\x79\
-\xe3\xb5\x7f\xff\x9b\x99\xf3\x34\x09\xe6\xff\x94\x0b\xc7\xf1\xc6\
-\x25\xc4\x33\xcf\xbc\x5a\xfd\x5f\x6f\xd5\xaf\xd1\x37\xb6\xff\x8b\
-\x86\x88\xfe\x4d\xb5\xa1\xd1\x83\x31\x11\x77\x69\xc3\xe3\xb2\x31\
-\x51\xef\x97\x38\x93\xc3\x45\x2a\xe9\x39\xa2\x7d\x1a\x67\xe2\x70\
-\xf6\x3f\x24\xae\x49\x80\x16\x0d\xd3\x0b\xa4\x69\x74\xc3\xfa\x43\
-\xd7\x51\x53\xa1\xd5\xc6\xd3\xd0\xf4\x50\xa6\x08\xcc\xe9\xd0\xcc\
-\xac\x0c\x5e\x8e\xbf\x5b\xce\x93\x0b\xc3\xc9\x1c\x8e\x5c\x39\xc7\
-\xf3\xa0\x19\x36\x34\x1f\x4e\x5d\x05\x6d\xd4\xe1\xd0\xbe\x97\x27\
-\x74\xea\xe3\xc9\xe6\xb1\xef\xa5\x08\x66\x2f\x55\x79\x05\x19\x11\
-\xf6\x26\xce\x67\x4f\xa0\x37\x45\xf3\x6e\x9c\x18\x5e\xb1\xdc\x62\
-\x2d\xe1\xb1\xce\xa7\xbd\x38\xbd\xcb\x9a\x8f\xa5\xcc\x6b\x87\xd7\
-\x51\x5e\xf1\x8b\xee\x87\x03\x7e\x0c\x1b\xdd\xe4\xae\x09\x01\x6d\
-\xdc\x50\x98\xbd\x7e\x07\x1c\xbb\x4e\xeb\xd9\xde\x83\x0b\x68\xe9\
-\x9f\xc9\x2c\x82\x33\x59\xe5\xa0\xcc\x22\xc7\x71\xd9\x1e\xc3\xdf\
-\xa7\x05\x95\xe8\xbf\x6e\x30\x9d\xe5\x1b\x84\x0b\xa8\x4b\x79\x9c\
-\x75\x7f\x3e\xab\x10\x7e\xdb\xba\x07\x42\x87\x8c\x04\x8f\xe0\x70\
-\x76\xcf\x04\x7c\x25\x3f\x87\x92\xa6\x2c\xe9\x5d\x5e\x1c\x28\x61\
-\x78\xcc\xc3\x07\x58\x56\xf2\x35\x11\xb1\x27\xb1\xec\xff\x10\xd2\
-\x7f\x48\x5b\x37\xb5\xf6\xaf\xaf\xbc\xf1\x46\xf5\x67\x5e\x78\x81\
-\xe7\x5b\x15\xec\xed\x36\x96\x24\xcf\x3e\x5b\xed\xaf\x3e\xde\xd5\
-\x3b\x1a\xc2\x5e\x08\x88\x88\x7b\x4f\x6b\x8a\x0e\x54\x87\xc5\xae\
-\x44\x70\xa4\x63\x06\x50\x77\xe9\x91\x64\x66\x48\x65\x52\x29\x81\
-\xaf\x61\xa0\x12\x57\x4a\x11\xf4\x1d\x55\xe0\x32\x14\x26\xfa\x4f\
-\x5a\x7a\xcf\x3f\x38\x8c\x59\xf7\x9f\xcd\x5a\x0b\x2d\xfe\x48\x44\
-\xe0\x67\x31\x10\x33\x1d\x40\x20\x97\x50\xcd\x0f\x38\x77\x1e\x0b\
-\xc7\x80\x9f\xcb\x1a\x80\x16\x0b\x77\x40\xeb\xb8\xef\x99\xdf\xbe\
-\xa3\xab\x27\x74\xf3\x55\xb2\xd5\x9a\xe8\xcd\x48\x4f\x84\xbd\x8f\
-\xce\xc4\x4d\x93\x10\xc2\xbd\x39\xab\xe2\xa7\x31\x56\x9b\x1f\xd0\
-\x96\x0d\xf8\x9a\x72\xc8\x47\x67\xfe\x47\x2e\x9c\xbd\x2b\xaa\x0c\
-\xa0\x91\xd9\xaf\xe1\x67\xd8\xa4\x86\x92\xa6\x4f\xa6\x39\xf2\x3d\
-\x74\xe1\xf0\xf3\x82\x15\xb0\xef\xf2\x75\x48\xbc\x71\x9f\x01\xff\
-\x14\x5a\xfb\xa7\x10\xba\x66\x65\x15\x59\xff\xb6\x3d\xe6\xe8\x78\
-\x69\xe5\x4c\x9c\xfc\x7f\x9f\x16\x80\x9f\xc5\x01\x9f\xac\xfc\x04\
-\x1e\xf8\x27\x53\x73\x60\xca\xf2\x75\xe0\x17\x16\x07\x7d\x35\x21\
-\xec\x2d\x63\x5b\xe0\x97\x3b\xf4\xcb\x02\x7c\xc7\xe7\x30\x37\x0e\
-\xe6\x63\x36\x6a\x1b\x96\x97\x30\x65\x48\x44\xb3\x5e\x0a\xe5\xcb\
-\xf5\x7b\xf4\xa8\xbc\x2f\x53\x95\xdf\x56\x1d\xbb\x3e\xb5\x38\xf0\
-\xbf\xfd\x76\xb5\xb7\xfb\xf5\xab\x1e\xdc\x7f\xf0\xbf\xb5\xe1\xf1\
-\x1e\x6a\x53\xf4\x0c\x4c\xfc\x8b\xa8\x07\x62\x08\xdb\x4a\x9c\x41\
-\xd6\xc7\x62\xed\x33\x92\xdf\xaf\xb1\xfb\x1d\x6b\x15\xde\x36\x1e\
-\xf3\xf1\x08\xa9\xb8\xec\xcf\x13\x80\x6e\x7b\x5c\xb8\x4e\x7a\xd3\
-\x54\x15\x1a\x0b\x0a\x63\x24\xf8\xe8\x23\xa0\xeb\x88\x89\xd0\x6a\
-\xf5\x61\x68\xb6\xf7\x3a\xb3\xf0\x65\x41\xbd\xbf\x18\xd9\x86\x91\
-\x3a\xcf\x1c\x5f\x06\xe7\x3a\x22\x4b\x7f\xc3\x29\x68\xf5\xed\xaf\
-\xd0\xce\x2f\x08\xbe\xec\xe5\x0e\x5d\x3d\xfd\xd9\xe2\xe2\x34\x37\
-\x8e\xa7\xd6\xc8\xcd\x76\xc9\x7c\xf6\xfc\x2c\x97\x61\xc2\x68\x9c\
-\x58\x19\xc9\xe5\x89\x74\xfe\xd8\xa6\xb3\x75\x83\xcb\x35\x22\x52\
-\xf9\x2d\x57\x69\xed\xf2\xcc\xe6\x3a\x6c\x21\x2c\x75\xdd\x56\x8d\
-\x41\x44\x2c\x27\xf1\x94\x10\x76\x65\x2b\x56\xb6\x4c\x89\xef\x8f\
-\x20\x47\x6f\x1e\xd3\x48\x15\x9a\x68\x8e\xc6\xa5\x0f\x19\x37\x0d\
-\xd6\x1f\x3a\x05\x17\xf2\x6f\xc1\x79\x06\xfc\x1b\x70\x32\xa3\x08\
-\x4e\x08\xc2\x06\xe0\x44\x46\x21\x1c\xcf\x28\xb4\xec\xe3\x7f\x9f\
-\xa4\x63\x99\xdc\x77\xee\xb8\x75\x18\xeb\xf3\x2c\xe1\x2c\x61\xb9\
-\x63\xc7\x45\x3a\x91\xc9\x87\x65\xf1\x72\xbf\x4f\x66\x16\xf1\xe1\
-\x44\xe7\x66\x16\xb2\xfd\x27\x79\x4b\x5f\x0c\xfc\x4b\x08\xfb\x8b\
-\xb9\xb7\x60\xe7\xd9\x4b\xf0\xfd\xd4\x39\xd0\x5b\x63\x84\x3e\x68\
-\x3c\x50\x79\xa7\xb5\x88\x95\xc2\x14\xd8\xe2\xb4\x97\x30\xba\xec\
-\xd3\xd9\x1e\xcc\x72\xe5\xcb\xba\x2c\x09\xe5\xc8\xba\x5c\x58\x19\
-\x02\x92\x65\xc2\x12\x1e\x3f\xef\xa2\xae\x68\xc2\x62\x17\xa9\xc2\
-\x62\x54\xaa\x88\x98\xba\x03\xbf\x1a\xf4\xec\x3b\xef\xfc\x97\xd1\
-\xac\x66\xad\x5a\x4f\x0e\xa5\x7f\xaa\x8d\x86\x2c\xd1\xc7\x9b\xff\
-\xae\xfe\xd2\xab\xaf\x54\xfb\xa2\x47\xdf\x97\x43\x07\x7c\xdb\x09\
-\xa1\x32\x1e\x13\x38\x01\x75\x0b\x13\xf9\x91\x5a\x22\x23\x6c\x2b\
-\xa1\x14\xa8\x35\x32\x95\xb1\xe4\x72\xee\x7c\x29\x90\xd8\x55\x7a\
-\x9a\x57\x05\xad\x3c\xb7\x88\xfe\xf0\xc5\x84\xc5\xd0\x7c\xfb\x25\
-\x68\x82\xf0\x6d\x72\x10\x81\xbf\x3f\xad\x6c\xda\x57\x5c\x18\x1e\
-\xf8\x47\x72\xa0\xd9\xf6\xcb\xf0\xe1\xd4\xd5\xf0\x49\x70\x14\xb4\
-\x47\xeb\x9e\x16\xdc\xee\xe9\xab\x66\x30\xa2\xe9\x12\x08\xf6\x82\
-\x1b\x47\x18\x8d\x23\xcc\x72\x29\x75\x6f\xa5\x4b\x6f\xb9\x70\xce\
-\xe7\x97\xb9\x77\xe1\xe0\x9c\xf2\x29\x03\xc5\xdd\x87\x2d\xf0\xad\
-\xc3\xb0\xbc\x37\x71\x0f\x6e\xe9\xc5\x35\x72\x99\x85\x0c\x1e\x0e\
-\x33\xd7\x6d\x85\x13\x69\xf9\x08\xfc\x3b\x70\x26\xfb\xa6\x15\x60\
-\x8f\xa5\x17\xc2\x51\x5e\xc7\x44\x3a\x6a\xf3\xdd\xf6\xb8\x94\x9c\
-\x09\x53\x6c\x7c\x36\xc0\xe7\xac\x7c\xce\xb5\x43\xbe\xfc\xf3\xf8\
-\x9d\x46\x1c\x9d\xcd\x28\x60\xee\x9c\xa8\x61\x63\xa0\x3b\xbd\x99\
-\x6d\x06\x3e\x95\xa3\x58\x51\x19\x92\xaa\xc3\x52\xf9\x56\x91\x79\
-\x27\x57\x77\xcd\xba\x8d\xff\x7f\x41\x1d\x1a\x33\x5d\x1d\x16\xd7\
-\x47\x37\x60\xd0\x6b\x9d\x5d\x7a\xd4\x7a\xf3\x8d\x37\xaa\xbf\xc8\
-\x8f\xb1\xaf\xda\x4a\xb2\x61\x57\x48\x78\xe5\xf8\x3f\x8d\x1b\xd7\
-\xe8\xea\x15\xf0\xb2\xc2\x14\xf1\xb1\x26\x2c\xe6\x2b\x2c\x18\x47\
-\x31\xa1\x6f\x69\xc2\x63\x1e\x60\xc2\x3f\x92\xaf\x68\x4f\x3f\xf0\
-\xcd\x0b\x67\xf0\x8b\x81\xb8\x0c\x1e\x05\x9f\x2c\xd8\x02\x4d\xd1\
-\xba\x6f\x42\x10\x26\x18\xef\x4b\xb3\x57\x71\x80\x97\x0b\x2f\xfb\
-\x3b\x1d\xff\x2b\x0d\x9a\x2f\xd9\x0b\xad\xfb\x8f\x84\x4f\xbd\x54\
-\xd0\xb1\xb7\x27\x7b\x93\xb6\x37\x42\xc8\x5d\x65\x60\x2b\x54\xb1\
-\xb1\xf6\x46\x6e\xe9\x41\x31\xec\xab\x80\x5f\x4a\xe0\x93\x4b\x07\
-\x45\xbd\x25\xcf\xe0\x50\x70\xa5\x74\x36\x46\xa1\x15\x3c\x17\xf6\
-\x24\x5c\x83\xb3\x39\xb7\xe1\x4c\xce\x2d\xb3\x95\x4e\xc0\x27\xf0\
-\x1e\xa9\x60\xc9\xfd\x87\xed\x7e\xd6\x10\x64\xf0\xd0\x97\x05\xfe\
-\x0d\x48\xcc\xbf\x0b\xc7\x52\x32\x61\xec\x9c\xdf\x20\x20\xbc\x1f\
-\x74\xf3\xd3\x80\xab\x1a\x0d\x08\x83\x05\xf8\xaa\x3f\x07\xf0\x89\
-\x39\xf7\x50\x27\x94\xa6\xc8\x11\x86\x98\xfe\x6d\x55\x61\x51\x7f\
-\xfb\xe4\xf3\xcf\x6a\x3c\x53\x65\xd1\x97\x71\xa3\x97\xb4\xf8\x15\
-\x60\x5e\x78\xe1\xf9\x6a\x86\x98\xd8\x97\xd5\x11\x71\x2d\x55\xa6\
-\xa8\x7e\x08\xca\x4d\x68\xf1\x67\x61\x03\xf0\xa0\xac\x40\x7e\x92\
-\x52\xf3\x4b\xe3\x05\xd2\x24\x69\x68\xed\x74\x1a\x3d\x0d\x3e\x5a\
-\x7d\x04\x1a\xa3\x65\xcf\x80\xbf\x2f\x15\x81\x5c\x81\xda\x73\x9d\
-\x35\x2a\x4d\xf1\xbf\x9a\x6d\x3e\x0f\x2d\xc7\x2d\x82\x4f\xd4\xa1\
-\xd0\xbe\xaf\x2f\x74\xf1\xf0\x83\x9e\x01\x1a\x70\x53\xe9\xb8\x55\
-\xaa\x74\x5c\xa3\x24\xf8\xed\x95\x56\x96\x7d\x95\x9c\x03\x88\x7d\
-\xfe\x53\xa3\x49\x0d\xa8\xaf\x2e\x9c\x8d\x5a\xe9\x19\xa8\x83\xc8\
-\x61\x3f\xc2\xca\x3d\x47\xe1\x44\x3a\x5a\xf9\x08\xcb\x93\x08\xcd\
-\xe3\x08\x53\x02\xeb\x91\xf4\x02\xa6\xc3\x69\x9c\x0e\x89\x3e\x85\
-\xef\x87\x25\xf6\x1d\x2a\x46\x8e\xc2\x1c\x96\x88\x5b\x0c\xfd\x63\
-\x99\x62\xe0\xdf\xe0\xfc\xf8\x04\xfb\xec\x1b\x6c\x38\x26\x3d\xb8\
-\xdd\x7a\xe2\x1c\xc4\x8d\xfc\x19\x7a\x29\x0d\xd0\x95\x80\x4f\x3d\
-\x46\x03\x4d\xaa\x67\x3d\x7b\xea\x93\xce\x23\x6b\x89\x18\x42\x5e\
-\x85\xb0\xd8\x42\xcc\xaf\xdd\xca\xd0\xa8\x21\xda\xb8\x7e\x9f\x04\
-\xc6\xc4\xfc\xe5\xbd\x77\xde\xe1\x70\xc5\x1b\xa9\x55\x7e\xfb\xb2\
-\x6e\x98\x80\xb5\x9f\x79\xa6\xda\x4b\x2f\xbf\x58\xad\x6b\x0f\xcf\
-\x67\xc3\x07\x0c\x7f\x57\x6d\x8c\xd2\x62\x66\xac\xc6\x0a\x73\x15\
-\x75\x47\x23\x69\xe9\xc7\x8a\x33\xcb\x5a\x8e\x8e\x09\xcb\xea\x89\
-\x24\x7b\xae\x8c\xac\xcf\x8f\x31\xcb\x36\x0c\x0d\x61\x0c\xa4\x55\
-\x90\x68\x8d\x53\x53\x3c\x7c\x3e\x65\x05\xb4\xd8\x9a\x00\x8d\x0f\
-\x65\x43\x13\x02\xf1\xde\xd4\x32\xa9\x19\x2f\xd9\x30\x7b\xae\x21\
-\xf0\xa9\x61\x49\x87\x16\xf3\xb7\x43\xeb\x7e\x23\xe0\x73\x37\x3f\
-\xe8\xe4\xe6\x03\x3d\x7c\x95\xd0\x27\x30\x88\xbd\x5c\xe5\x13\x6c\
-\x19\x91\x43\x4b\x2d\xaa\xf8\xb7\x68\xd5\x56\xf7\x13\x23\x92\x4d\
-\xda\x99\xc3\xc5\x58\x85\x77\x2e\x4d\xb9\xb7\x75\xc5\xf1\x4a\xe5\
-\x91\x74\x1a\xc7\xd8\xe4\x09\x1f\x8f\xe8\x3a\x9c\xce\x5b\xa9\x72\
-\x12\x2e\x9e\xe2\x59\xa6\x2c\x38\x2c\x27\x3c\xf0\x31\x4d\x7d\xd1\
-\xda\x75\xd7\x86\x60\xaf\x4a\x0d\x01\x11\xfd\xe0\xe7\x05\xcb\x61\
-\xef\xa5\x6b\x70\x11\x81\x4f\x00\x25\xdf\xb9\xc5\xc2\xb7\x40\x9f\
-\x40\x7c\xf0\x31\xc8\xb6\x41\x31\xc3\x3e\xbd\x88\x35\x46\x27\xf9\
-\x87\xb7\xe6\x11\x3a\xd9\x34\x5e\xff\x16\x24\xdf\xbc\x0f\xc7\x92\
-\xd3\x61\xfa\xca\x0d\x10\x18\xd1\x1f\x3a\x79\x05\x82\x4b\x40\x10\
-\xde\xab\x89\x0d\x41\x16\x1e\xfa\xab\x6d\x7a\x8b\x52\xe5\xc7\xb6\
-\xcc\x48\xa6\xbd\x38\x4c\x69\x0c\x12\xe9\x73\xc9\xaa\xcf\xc4\xff\
-\xdf\xae\x0a\x8d\x8a\x88\x18\x32\xf4\x83\xa6\xad\x5b\xd5\x7a\xee\
-\xa5\x97\x18\xe0\xab\x57\xd6\x09\xd0\x9e\xd4\x26\xb4\x9a\x75\xde\
-\x7d\xaf\x5a\x6f\x77\x75\xed\xc0\xf8\xc1\x6f\x22\xf4\xbb\xaa\xc3\
-\xe2\xa6\x61\x26\x24\xf0\x19\xe2\x30\x13\xad\x20\xf4\x54\x00\x9f\
-\xac\xfb\x28\x08\xd4\x87\xb2\x29\x72\x5d\xfa\x7d\x0f\x6d\x16\xee\
-\x80\xa6\xbb\x52\xd0\xc2\x47\xe0\xef\x73\x02\xf8\x7b\xca\x08\x7c\
-\x7a\x30\xbc\x0f\x81\xbf\x2d\x11\x5a\xfe\x30\x13\xda\x2a\x43\xe0\
-\x4b\x57\x2f\xb4\xee\xfd\xd9\xd4\x09\x6e\x6c\x08\xa6\x89\x59\x9f\
-\x34\xe7\x8b\xf0\x62\x95\x05\x9c\x16\x28\x17\x0f\x7c\xf1\x34\x0b\
-\x22\x40\x97\x33\xf0\x85\x74\xb6\x4d\x73\x5b\xe0\x9b\x61\xed\x44\
-\xde\xaa\xc3\xa5\xcb\x82\x18\xf8\xb6\xb2\x3d\x57\x2a\x7e\x0b\xf0\
-\xa3\x19\xfc\x3c\x83\x42\xa1\x87\xbf\x16\x7a\xab\x0c\x10\xfe\xcd\
-\x0f\xb0\x7a\xdf\x11\xee\x01\x68\xce\x2d\x06\xfd\xe3\xbc\xfb\x44\
-\xf0\xa9\x1f\x49\x7b\x7c\xd0\x17\x80\x7f\x44\x0c\xfb\x0c\xcb\x83\
-\xdc\x53\x99\xdc\x08\x1d\xf3\x70\xcc\xdc\x9b\x6c\x64\x4e\xca\xad\
-\x07\xb0\xf9\xc8\x29\x88\x1b\xf1\x33\x74\x0f\x08\x86\x2f\xdd\x03\
-\xa0\x77\xa0\x9e\xdd\xab\x1f\x95\xa9\xd0\x92\x01\x5f\x28\x33\xb2\
-\x8d\x2d\x3b\xee\xc0\x98\x90\xaa\xdf\xf2\xc0\xa7\x67\x85\xf7\x30\
-\x4c\x1a\xfe\xef\x12\x4d\x58\xbc\x4f\x40\x68\xe4\x3b\x5d\x7a\xf6\
-\x7c\xf6\xb5\x57\xb9\x69\x8d\x2b\xed\x6c\x97\x4f\x7a\x63\xdd\x25\
-\xfa\x82\xf0\xff\xc0\xc3\xbd\xba\x7a\xf0\xd0\x57\x75\x61\xb1\x5f\
-\xa8\x42\xa2\xbe\x57\x86\x46\x1f\xc4\x4c\xb9\x61\x0f\x1d\x5b\x10\
-\xd9\x02\x49\x1a\x52\xc5\x1f\x73\x14\xb7\x73\x22\x2b\x59\x49\x05\
-\x9e\x16\x0b\x09\x89\x85\x4e\x23\xa6\x40\xcb\x35\xc7\xa0\xf1\xbe\
-\x34\x0e\xf6\x04\xf3\xdd\xd7\x64\x74\x5d\x24\xb9\x30\xc5\x89\x9e\
-\x13\x64\x42\x93\x9d\xc9\xd0\x7c\xc1\x1f\xf0\x71\xd4\x37\x68\xdd\
-\xfb\x43\x67\x37\x5f\x70\x41\xeb\xde\x95\x8d\xca\x09\x61\x0b\x98\
-\xd0\x03\x65\xc1\xb2\x67\x6f\xd1\xf2\x95\xca\x71\xfa\x96\x24\x3d\
-\xac\xd3\x55\x3e\x7e\xdb\xb4\x2f\x9f\xbc\x70\xee\xfa\x4a\x73\x4e\
-\xf1\x65\x86\x5c\x63\x64\xe5\x06\x18\xa3\xc0\x3b\x38\x1c\xfa\x28\
-\xf5\xcc\xca\xf7\xd0\x47\xc0\x8f\x73\x16\xb3\x91\x2d\x89\x85\x77\
-\xe0\x42\xde\x2d\x36\x44\x93\x3d\xc0\xcd\xe4\x46\xd0\x90\x75\x2d\
-\xf8\xd5\x0f\xa7\xa1\xf0\xf3\x50\xba\xc8\x1d\x93\x5e\x60\xf5\x9b\
-\x85\x61\x12\x1d\x97\x72\xe3\x08\xe7\x09\xf1\xa6\x51\xe3\x82\x62\
-\x0d\x0e\xfe\x37\x6f\xd5\x9b\x87\x61\xf2\x16\xfd\xf9\x1c\xcb\x94\
-\x0b\x57\x69\xf1\x93\x1b\x77\xe0\xf8\xd5\x34\x18\xbf\x60\x05\xb8\
-\x05\x85\xc3\x17\x54\xbe\x3c\x03\xb1\x6c\x19\xc1\x9b\x9e\x07\x99\
-\x5f\xd6\x8b\x31\xaf\x7c\xe6\x7c\x7d\x75\x36\xff\x9d\xa9\xb3\x36\
-\x06\x03\x0f\x7c\xbc\xae\x9b\x58\xe6\x4f\x2b\x8d\x11\xbf\xaa\x43\
-\xa3\x5d\xb5\xfd\xfa\xbf\xd5\xa1\x67\x4f\xf6\xa6\x28\x59\xf5\x55\
-\x96\x7d\x05\x6f\xac\xfb\x84\x9f\x35\x5f\x78\xa1\xda\x8b\x7f\xff\
-\x7b\xf5\x7f\xff\xdf\xff\xd5\x30\x0c\x1c\xdc\x54\x13\x1e\x3f\x40\
-\x65\x8a\xde\xad\x0e\x8d\xc9\xc3\x0c\x7a\xa4\x0e\x75\x54\x00\x2a\
-\xaa\x82\x3b\xa9\x50\x4e\x6c\x8d\x53\x1a\xde\x48\xd3\x0b\x47\x0c\
-\x82\xcf\x26\x2d\x43\x4b\xfb\x12\x34\x3e\x90\x65\x01\xf9\x2e\x07\
-\x12\xc3\xdb\x51\x38\xd9\x73\x11\xf8\x87\x72\xa0\xe9\xc6\xb3\x68\
-\xdd\xcf\x80\x76\x0a\x03\x9b\x2b\xa7\x9b\xb7\x02\x2d\x30\x2d\x37\
-\x2a\x27\x98\x1f\x95\x63\x8c\x34\x4f\x99\x50\xf1\x70\x7d\x1a\x55\
-\x71\xe5\x81\x80\xcf\xad\x77\x1b\xc9\x7a\x7a\xf4\x32\x52\x37\x1f\
-\x35\x74\x41\x05\xf7\x1b\x0a\xb3\x56\x6f\x84\x73\x99\x79\x70\xb9\
-\xf0\x36\x83\x29\x59\xd0\x67\x78\x3f\xf9\xc9\xcc\x1b\x56\xf0\x17\
-\xac\x7f\xce\x0a\x2f\x60\x80\x66\x4a\xe7\x81\x9d\x66\xed\x12\x3a\
-\x22\x84\x4d\x93\xf8\x9e\xc1\x3d\x90\x3d\xca\xe2\x2d\x12\x0d\xc9\
-\xbc\xc1\xfc\xf4\x67\xb2\x2d\xd6\xfc\x79\x36\x85\x02\x37\xc9\xdb\
-\xe5\xfc\x9b\x6c\xa6\xcf\xf4\x5b\xf7\x21\x25\xbf\x10\x96\x6f\xdd\
-\x0d\xc6\xaf\xbe\x87\x76\xbd\xbd\xa1\xbd\xab\x2f\xf6\x60\x82\xc0\
-\x4d\xc3\x3d\x13\xe2\x7a\x8d\xd6\xc0\x97\x87\xbe\x5c\xbe\x94\x47\
-\xde\xd8\x19\x78\x0f\xd5\xa1\xb1\xf9\xa8\x03\x81\x61\xd1\x23\x0c\
-\x51\x03\xdb\x04\xeb\xc3\x5f\xae\xf3\x7e\xdd\x9a\xb5\x6a\xd6\xac\
-\xb2\xea\x1f\xf7\x26\xb4\xac\xcf\xbd\xf4\x62\xf5\x4f\x5d\x7a\x3d\
-\xeb\xa5\xd2\xbf\xa7\x09\x8f\xd3\x22\xec\xd7\xa2\x0a\x51\x0f\x30\
-\xe3\x1e\x3d\x8d\x15\xdc\x0c\x7c\x53\x14\x28\x68\xad\x57\x84\x6b\
-\x8f\x7e\xc3\xa0\xcd\xbc\x6d\xd0\x18\x21\xdc\xe8\x60\x76\xc9\xc0\
-\x5d\x52\xd8\x0b\xe7\xed\xc1\x9e\xc4\xde\x74\x68\xbe\x78\x37\xb4\
-\x8e\x1a\x0a\xed\xdd\xfc\xa0\x0b\x02\x9f\x66\x6e\xa4\x55\xab\x68\
-\x9e\x1c\x3f\x7d\x18\x9b\xfd\x92\xb3\xee\x63\xaa\x80\x5f\x01\x22\
-\xc0\xb1\xb1\xf8\xe4\xc7\xa7\x35\x6e\x83\x4c\x6c\x78\x26\xf9\xba\
-\xbb\xf9\x69\x21\x76\xc4\x4f\xb0\xf1\xe0\x09\xb8\x94\x57\x00\x29\
-\xb7\xee\xb1\xe9\x09\xe8\x21\xe8\x79\x1e\xb8\x04\x5e\x1a\x15\x23\
-\x58\xfe\x34\x9a\xe7\x18\xef\xfa\xb1\x52\x49\x86\x62\x9a\xc7\xe7\
-\xf3\xee\x1a\xe1\xa5\x2a\xfe\x3f\x2d\xd3\x26\x58\x26\x46\x63\xf3\
-\xe7\x17\xdc\x42\xcb\xfe\x36\xa4\xdd\xbe\x87\xc0\xbf\x0b\xc7\x13\
-\x93\x61\xe4\xe4\xd9\xd0\x4b\x6d\x84\x36\x2e\xee\xd0\xc1\x23\x00\
-\x7a\x61\x0f\x86\x9e\x55\xf8\xe8\xc3\xcd\xc0\x57\xf2\x65\xeb\x29\
-\x00\x3e\x63\x06\x5e\x0b\x32\x24\x76\x2b\x36\xc6\x11\x9a\xf0\xe8\
-\xf7\xbb\xb9\xfa\xbc\x58\xe7\xbd\xf7\x18\x74\xaa\x1e\xca\x3e\x89\
-\x8d\x7f\x50\x52\xab\x56\x2d\x96\xfa\x9f\x7d\xf9\x65\x6d\x7d\x5c\
-\xfc\xdb\x0a\x63\x98\x2f\x5a\xa2\xb3\x55\x61\xd1\x89\x08\xfd\x7b\
-\x98\x71\x8f\x04\x50\x49\xa9\x24\x80\x36\x4b\xa8\xa8\x56\x71\x09\
-\x73\xc8\x44\x17\x1b\x97\x4a\x58\xcc\x9a\xe6\xbc\x47\xa8\x7a\x6a\
-\x4d\xd0\xf9\xbb\xf1\xd0\x72\xf9\x01\x68\xb4\x27\x15\x1a\xed\x47\
-\x0b\x7f\x67\x8a\x59\x4d\x9c\x50\x53\x09\xc9\x87\x4f\x46\xd0\xa7\
-\x41\x63\xfa\x9f\x4d\x17\xe0\xc3\x9f\x17\xa1\x75\x6f\x84\x0e\xbd\
-\x3d\xa1\xbb\xbb\x2f\xf4\x56\x68\xd9\x94\xc7\xbe\x3a\x13\x56\xc8\
-\x70\x84\x7d\x24\x6b\x9c\x54\x26\x51\x9a\xd9\xa6\x89\xc3\xb4\x71\
-\x90\x96\xc5\xc4\x53\x5c\x3a\x5a\xfd\x87\xdc\x79\xc5\xfc\x97\x54\
-\x3c\x56\x71\xda\xc4\x2b\x5f\x9e\xa4\xcb\x80\xb0\x5f\x70\x87\xd9\
-\xc5\x6d\x5e\xdc\x9c\x5b\xd8\xdc\x1b\x8d\x80\xbe\x6a\x03\x74\xf7\
-\xd3\xc0\xe7\x7d\x7d\xa1\x6f\x50\x18\x7c\x3f\x69\x26\xec\x3d\x77\
-\x11\xae\xdf\xbc\x0d\xa9\x37\xef\x22\x58\xb9\x79\x69\x2e\x8a\x26\
-\x32\x13\xe0\x4f\xd6\xbf\xf8\x8d\xdb\x93\x7c\x63\x60\x6e\x10\x32\
-\x2d\x2f\x4f\xc9\x49\x18\x5a\x69\x76\xd7\xb0\x39\x73\xb8\x89\xd4\
-\x84\xd9\x32\x2f\xf1\xf3\xed\x93\x35\x2f\xac\x6e\x45\x2e\x9c\x74\
-\x84\x7d\xd6\x9d\xfb\x70\xee\x7a\x06\x2c\xd9\xbc\x13\x22\xbf\x1d\
-\x0d\x2e\x81\x7a\xf8\xc2\x3d\x00\x7b\x2d\x2a\xe8\x4d\x4b\x60\xd2\
-\x0c\xab\xe2\x69\x39\x4c\xce\xb8\x75\x9c\x6c\x40\x65\xea\xb7\x38\
-\x0f\xa4\xcf\x33\xe7\xd3\x75\x2c\xef\x4b\x03\x0d\x11\x4a\xc3\x80\
-\x21\x75\xdb\x76\xec\x50\xdb\x8c\x9d\xaa\x51\x38\x4f\x7e\xa3\x4c\
-\xa8\x5d\xab\x66\xb5\x7f\xbf\xf5\x4e\x75\x63\xe8\xb0\xbf\x6b\xc2\
-\x62\xbb\x04\x86\x46\x4e\x22\xdf\x1b\x82\xbf\x50\x65\x8a\x7e\x28\
-\x0b\xfc\x50\xf9\x0a\x69\x5b\x91\x85\x49\xc1\xa4\xf6\x9b\x8f\x87\
-\x71\x72\xd4\xc8\xa8\xf8\x02\x1e\x48\xd3\x13\x20\x58\xfb\x9a\xe2\
-\xa0\xfd\x4f\xf3\xa0\xd9\x86\x33\x0c\xf8\x8d\x51\x0c\xca\xa4\x3f\
-\x4a\xa6\xa6\x22\x39\x0a\xd7\x78\x5f\x06\x02\x3f\x13\x9a\x2d\xde\
-\x03\xad\x06\x8c\x66\x5d\xed\x2e\xae\x5e\xd0\xd3\x47\x09\x7d\x03\
-\x39\xdf\xbd\x1f\x82\x47\xb0\xee\x59\x85\x34\xd9\xc3\x4a\x2a\x0d\
-\xa4\xd2\x51\x1e\xd4\x8e\xcf\x77\x2e\x7f\x9c\xcb\x53\x79\xe0\x17\
-\x7f\x0f\x8e\xc0\x5d\xfc\xbd\xc8\xcb\x16\xf8\x34\xe4\xd5\x87\xd6\
-\x42\x20\x2b\x5f\xa9\x63\x16\x31\xf9\xbd\xbd\x0d\x31\x30\xf9\xb7\
-\x95\x70\xec\xca\x55\xc8\xbc\x7d\x17\xad\xe7\x7b\x6c\xbd\xdb\x2b\
-\xfc\x82\x23\x97\xf8\x69\x94\x2d\x33\x57\x72\x63\xe0\xcf\x88\x1a\
-\x01\xf1\x7c\x37\xa7\x79\x97\xd0\x69\xab\xfd\xdc\x74\x08\x67\xf9\
-\xc9\xcf\xce\xf3\x6f\xc9\x52\x7c\xe2\xf9\xf7\x85\x45\x55\x68\x95\
-\x2d\x61\xe9\x45\x5a\xa8\x3c\x95\xd6\xac\x45\xd0\x67\xdf\xbd\x0f\
-\x97\x33\x73\x60\xfd\x9e\x43\x30\x62\xf2\x1c\x08\x1d\x32\x02\x7c\
-\xb1\xfc\xb8\x60\xaf\xa5\x3b\x7b\x20\xad\x07\x2f\x7a\x5b\x5b\x98\
-\x70\x8f\x9f\x87\x49\x69\x93\xde\xce\x34\xce\xce\x95\x8d\xe2\xd3\
-\x9f\xdc\xc0\xa8\x3b\x78\x1d\x57\x30\x1f\xe6\x07\xc7\x0c\xf4\xf0\
-\x35\x44\xfd\xf3\xe5\xbf\xbd\x52\xad\xf6\x33\xcf\x72\x9c\xa9\x02\
-\xfd\xd3\xb2\x71\x19\x51\xbb\xf6\x5f\xab\x35\x6b\xda\xa7\xa6\xaf\
-\x52\xf9\x8a\x2a\x3c\xf2\x23\x65\x58\xe4\x10\xcc\xc4\x83\x08\xfd\
-\x7c\x39\x4b\xff\x49\x01\x9f\x2d\x60\xad\x35\x82\x1f\xbd\x4e\x1f\
-\x3d\x04\xda\x4e\x5d\x0d\x8d\x77\x5c\x65\x2e\x1d\xb3\x15\x5e\x91\
-\xc0\xdf\x83\x16\x3e\xfe\x4f\x8b\x89\x2b\xa1\x8d\xbe\x1f\x74\x70\
-\x71\x87\xee\x6e\xbe\x6c\x11\x72\xb2\xee\xd9\x30\x4c\xbd\x65\x18\
-\x66\x15\xf0\x2b\x16\xf8\x74\xbe\xd2\xc4\xf9\xf1\xc9\xf2\xa5\x97\
-\xb0\xc8\xca\x77\x51\x04\x31\xe0\x7f\xd1\xd7\x1f\x54\x51\x03\x61\
-\xfa\xb2\x35\x70\x21\x35\x13\x72\x10\xfa\x39\x08\x57\x02\x2d\x5b\
-\x33\xd6\xbc\xda\xd4\x4d\xb8\x2c\x5a\x20\xe5\x82\xe0\xfe\xe1\x5d\
-\x40\x82\x6c\x67\xbc\x3c\xcf\x4f\x72\x26\x9e\xbf\x5e\x58\xc4\x84\
-\xe2\x13\x2f\x59\x28\xac\xb1\x4b\x8b\xac\xa7\x16\xdd\x66\xa0\x4f\
-\xc7\x5e\x47\x0e\x82\x3e\xef\xfe\x03\x48\xce\x2d\x80\x0d\x7b\x0f\
-\xc3\x8f\x33\x16\x42\xec\xb0\x9f\xa0\xff\xc8\x5f\x20\xf4\xab\xef\
-\xd8\x30\x4c\x5a\xfb\x98\x16\x3d\xf1\x36\x03\x5f\x80\xfd\x13\x03\
-\x3e\x3d\xef\x7b\x88\x75\xf2\x16\x5a\xf5\x17\x95\x21\x51\x63\xd5\
-\x61\xf1\x9d\x7a\xb8\xf9\xbf\xf6\x7e\xbb\x4f\xd9\x4b\x40\x55\xa0\
-\x7f\x4a\x37\xe1\x41\x8a\xaf\xb7\x77\xb5\x98\xfe\x03\x5f\xf4\x37\
-\x44\x34\x55\x1a\x23\x4c\x08\xac\x75\xd8\x6a\xa7\xf3\xad\x38\x88\
-\x3e\x2b\x58\xd2\x05\x8e\x00\x4a\x0f\x41\x03\xd4\x7a\xf0\x56\xe9\
-\xa0\xdb\x80\x91\xd0\x6a\xde\x76\x68\xb8\x27\x1d\x1a\xed\x42\xe0\
-\x23\xf8\x9b\xec\x48\xe6\x75\x55\x24\xdb\xdf\x52\x4a\x96\x11\x7f\
-\xfc\x0f\x6a\x54\xb0\x17\xb1\x0b\x7b\x11\x6b\x4e\x42\xcb\x6f\x26\
-\x40\x3b\xbf\x60\x36\x1b\xa6\x8b\xb7\x82\x4d\x8e\xe6\x25\xf2\xdd\
-\x2b\xd9\x30\x4c\xcb\x1c\xf7\xa5\x83\x9b\x5c\xc5\x7c\x3c\xe9\x5d\
-\xb6\xf8\x1e\xcf\xff\xb2\x97\xef\x4c\xdc\x68\x1d\x1a\x11\xe5\x8d\
-\xe9\x4f\x80\xec\xa3\x32\x40\x57\x5f\x35\x42\xdf\x0f\x3a\x7a\x06\
-\x42\x50\xfc\xd7\x30\x73\xf9\x3a\x38\x7d\xe5\x1a\xe4\x22\xf4\xf3\
-\x11\xb2\x04\xdb\x14\xb6\x48\x38\xbf\x68\x78\x3e\x35\x00\x9c\xc8\
-\xdd\x22\x2c\x59\x78\x99\x1e\xaa\xf2\xba\x24\xfe\x14\x2d\x55\x78\
-\x25\x8f\x3b\x47\x38\x9f\xe2\x4a\x46\x5d\x2b\xb8\xc3\x59\xf1\x45\
-\x9c\xd2\x08\xf2\x37\xb0\xa7\x81\x9f\xd9\xb7\xee\x42\xe1\xbd\xfb\
-\x50\x78\xff\x21\x5c\xc9\xca\x85\x8d\xfb\x8f\x20\xec\x17\x40\xfc\
-\x88\x5f\x18\xec\x47\x4e\x9c\x01\x5f\x8d\xfa\x19\x02\x10\xe2\xbd\
-\x02\x83\x99\x04\x0b\x5f\x78\x89\x2f\x90\x4f\x03\x65\xb1\xe9\xea\
-\x4c\x3a\x97\x28\x2f\x08\xf6\xf9\x58\xbe\x77\x29\x8d\x51\x83\xfd\
-\xf5\x11\x9f\x86\x46\x0c\x7a\xb5\xd1\x07\x8d\xab\x86\x5c\x3e\xfd\
-\x5b\x75\xb6\xc0\xc0\x73\xcf\x3d\x57\xed\x9d\x77\xdf\xad\x16\x15\
-\x1d\x53\x53\x17\xdd\xef\x3f\x41\xd1\x83\xd4\xca\xd0\xa8\xa5\x98\
-\xa9\x29\xa8\x7b\x4e\x17\x06\x13\xaf\x92\x86\x2f\xe6\x1c\x06\x7c\
-\xb4\xe2\xfc\xd4\x3a\xf6\xf0\xaa\xe3\xb7\xe3\xe1\xc3\xa5\xfb\xa1\
-\xe1\xbe\x4c\x68\xb4\xf3\x1a\x34\xde\x9a\x04\x8d\xb7\x5f\x2d\x46\
-\x49\xbc\xac\xbf\x37\x11\xc9\xee\x1c\xea\x41\x90\x75\xbf\x37\x03\
-\xbf\x63\x2f\x60\xee\x76\xf8\x38\x6c\x30\x7c\xe1\xea\x03\xdd\x3c\
-\xfc\xa1\x77\x80\x86\xcd\xe7\x42\x23\x73\x02\x68\x18\xa6\x31\xd2\
-\x0c\x7c\xd9\x7b\x92\xbb\x67\x93\x03\x39\x93\x7e\xe2\xb0\x25\x89\
-\xa3\x34\x2a\xe9\x75\x3a\xba\xff\xe2\xe2\x92\x38\xa6\x14\x89\xde\
-\xb8\xa5\xb5\x05\xe8\xe1\x2d\xcd\x24\xe9\xa6\x31\x32\x8b\xb8\xbb\
-\x9f\x1a\x3e\xc7\x7c\xfa\x12\xa1\xaf\x8e\x1e\x04\x33\x97\xad\x85\
-\x93\x09\x89\x90\x5d\x58\x04\xf9\x77\xee\x21\x74\xef\x33\x00\xa7\
-\xa1\x52\x8b\xee\x32\x28\x5f\xe7\x95\x82\xa0\x4e\xe6\x7d\xec\xac\
-\x41\xa0\x1e\x01\x2f\xc1\x5a\x27\xa5\xf0\xae\x99\x6b\xfc\x79\x66\
-\xb8\x17\x71\x70\xcf\xc0\x86\x25\x8b\x17\x41\x3e\xfb\xd6\x3d\xc8\
-\xc3\x5e\x46\x11\xc1\x1e\x1b\x9f\x2b\xe9\x99\xb0\x71\xef\x21\x18\
-\x3d\x6d\x1e\x5a\xf6\x3f\x42\x0c\xea\xdb\x71\x53\x61\xc2\xbc\xc5\
-\xf0\xc3\xa4\xe9\x60\xe8\x3f\x84\xdd\x0f\x03\x7e\xb0\x49\xb4\xd0\
-\x7d\x34\xff\xe0\xd6\x22\x87\xe5\x47\x2e\xbd\x4b\x5a\x17\x4d\x51\
-\xf7\x30\xcd\xd3\x30\xcc\x46\x2c\xeb\xd1\x6a\xd3\x80\x86\xbe\xfe\
-\x11\xcf\xff\xe5\xe5\xbf\x54\x7b\xe6\xd9\x67\x2a\xf9\xea\xe2\x95\
-\x68\x13\x5a\xe5\xfa\xf5\xea\x55\xfb\xb2\x47\x8f\x5a\x9f\x76\xe9\
-\xf5\x9a\xc6\x14\xe3\xa2\x0c\x8d\x98\x8a\xf0\x4a\xc6\xcc\x7e\xc0\
-\x5a\xf6\x72\x80\x77\x89\xe0\x17\xca\xfb\xee\x69\xcd\x5a\x1a\x9d\
-\xa3\xd1\x43\x1f\x63\x34\x7c\xfe\xe3\x6c\x68\xbe\xea\x18\x7c\xb0\
-\x3b\x1d\x81\x9c\x02\x8d\xb7\x25\x59\x6b\xbb\x48\x8e\xf6\xa1\x9a\
-\x6c\xb7\xc8\xea\xb8\xd0\x38\xec\xe0\x80\xdf\x64\xf3\x45\x68\x31\
-\x7e\x09\x7c\xaa\x34\x41\x67\x97\xbe\x6c\x11\xed\xbe\xd4\xd5\x36\
-\x5b\xf7\x91\xe6\x87\xb5\xb2\xc0\x77\x04\xc8\xca\x0c\x7c\x67\x01\
-\xe4\x24\xf0\x39\xe8\x0b\x3d\xa9\x48\x96\xf6\x34\x5d\x32\x8d\x53\
-\x27\x5f\x3e\x4d\xb7\x40\xa3\x76\x68\x6c\x7e\x7b\x37\x5f\x94\x3f\
-\xf8\x86\xc4\xc0\xd8\x69\x73\x61\xff\xf1\xd3\x90\x95\x9b\x0f\x37\
-\xee\x3d\x80\x3c\xb4\xf6\x73\x6e\xdf\x67\x20\xce\x42\x65\xdf\xe4\
-\x3e\x33\x11\xd0\xe9\x37\xef\x30\x6b\x5c\x5a\x1c\xcc\x33\x30\x0c\
-\x7d\x66\xde\xe2\x94\x2d\x52\xee\x6d\x82\xfb\x3d\x6c\x5c\xee\x43\
-\x3e\xfe\x07\xf5\x2c\x8a\xf0\x3f\x6f\xdd\x7f\x00\x85\x37\x6f\xc1\
-\xc5\xab\xd7\x60\xe9\xc6\xed\xf0\xdd\xf8\xe9\x10\xf1\xcd\x68\x06\
-\xfc\xaf\xc7\x4e\x84\xd1\x53\xe7\xc0\x8c\x25\x2b\x60\xd2\xbc\x45\
-\x30\x60\xe4\x8f\xe0\x87\x65\xca\x55\xe8\x45\x1a\xb8\x01\x01\x4f\
-\x00\xf8\xd4\xc3\x7f\xc0\x19\x80\x51\x4b\x02\x8c\xd1\x1e\x01\x61\
-\x83\xde\xea\xd1\xd3\xf7\xf9\xc6\x8d\x9a\xd7\xa8\xe2\xfc\x9f\x74\
-\x13\x7c\x6f\x7f\x7b\xe3\x8d\x6a\xbe\x91\xf1\xaf\x29\x74\xa6\x0e\
-\x81\xa6\xc8\x91\x58\x08\x0e\x62\x46\xdf\x50\x72\xe0\x2f\x59\xe5\
-\x77\x54\x90\x9c\x28\xa4\x54\xa9\x03\xc9\x77\x49\x73\xd3\x68\x8d\
-\xd0\x33\x72\x10\x7c\x32\x69\x25\x34\x5d\x7f\x16\xad\xfb\xeb\x1c\
-\x94\xb7\x5e\x41\x48\x5f\xe1\x3e\x85\xef\xdb\xa4\xf6\xf1\x30\xa7\
-\x1e\xc1\xd6\x2b\xf6\x12\xc2\xd0\x71\xe1\x3b\x01\x7f\xd7\x75\x68\
-\xba\xfc\x30\xb4\x1c\xfa\x2b\xb4\xf7\xd5\x40\xd7\x5e\xee\xd0\x8b\
-\x59\xf7\x46\xf0\x15\xac\x7b\x33\xe8\x05\x39\x59\x09\x4b\x2b\x67\
-\x2b\xb9\xb3\x8d\x4c\x49\x40\xfd\x84\x65\x6b\xe1\x93\x1f\xdf\x6c\
-\xe5\xeb\x38\xd7\x0e\xcd\x95\xdf\x93\x86\x6a\x7a\x2b\xe1\x53\x57\
-\x6f\x36\xa6\xdd\x0d\xf7\x0f\xfa\xe1\x67\x58\xb9\x71\x2b\x24\x20\
-\x70\x8b\xee\x3e\x80\x3b\x0f\x1e\xc1\xed\x87\x0f\xe1\x06\x81\x18\
-\x7f\x17\xdc\x79\xc0\xac\xf0\x5c\x84\x35\x41\x3b\xf7\x96\x94\xee\
-\x43\xde\x6d\xd2\x3d\xf6\xc9\xa0\x8e\x2a\xe0\x55\x48\x56\x3c\xc6\
-\x75\x93\x00\xff\xe0\x21\xfb\x8f\x7b\x0f\x1f\xe1\xe7\x43\x48\xcb\
-\xcc\x81\xfd\xc7\x4e\xc2\xac\xe5\x6b\x61\xc8\xd8\x49\x0c\xf6\xd1\
-\xc3\xc6\xc0\x90\x1f\x27\xc0\xa8\x49\x33\x61\xc2\xdc\xc5\xb0\x60\
-\xd5\x7a\x98\xbf\x62\x0d\x8c\x9e\x3c\x03\x34\xd1\xfd\xd9\xb3\x09\
-\x0f\x1a\x14\x40\xcf\x88\x4c\xdc\x14\xdb\x81\xbc\x31\x54\xe6\x32\
-\xe4\x84\xf1\xc5\x7a\xf9\x21\x51\x67\xb1\x61\xfd\x55\x19\x12\xd9\
-\x4d\x15\x11\xf3\x7a\x97\x5e\x1e\xd5\x9f\x7f\xee\x19\x2b\x6e\x54\
-\x6d\x7f\xb2\x4d\x98\xe3\xa2\xe6\x33\xb5\xd9\x94\xcb\xee\x1e\x8a\
-\x17\x43\x62\x07\x7f\xa8\x30\x46\x8c\xc0\x4c\x3f\x8f\xc0\xbf\xf5\
-\xb8\x81\xc0\x80\x8f\x40\x55\xa0\x75\xef\x85\x85\xbe\x7b\xfc\x77\
-\xd0\x6a\xce\x56\x68\xbc\xf9\x32\x34\x22\x18\x13\x94\xb7\xf0\xc0\
-\xde\x22\x01\x71\xb9\xfd\x5b\x1c\x84\xe7\x8f\x37\xc2\xb8\x1b\xed\
-\x48\x61\xdf\x9b\xcd\xda\x0c\x1f\x47\x0c\x81\x0e\x9e\x81\xd0\xc3\
-\xdd\x17\x81\x12\x0c\x9e\x64\x75\xe9\xf8\x71\xf7\x62\xcb\xbe\x22\
-\x40\x5d\x25\x31\x80\xcc\x62\x0f\xf3\x19\xf0\xd1\xca\x37\x86\xb3\
-\x97\x93\x68\x0a\x02\x7a\x51\x89\x5c\x3b\x3d\x02\xb4\x6c\x68\x63\
-\xbb\xde\x5e\xd0\xba\xbb\x1b\x74\xf4\x50\x80\xa1\xff\x50\x98\xb6\
-\x68\x39\x1c\x3e\x79\x16\xae\xa5\xa5\xa3\xc5\x7d\x13\xee\x20\xf4\
-\xef\x3d\x02\xb8\xfb\x10\x18\xa4\x49\x04\xec\x9b\x08\x6e\xea\x0d\
-\x90\x08\xe2\x66\xf1\xfb\x58\x98\xfb\x9c\xe5\x7e\x9b\x17\x07\x78\
-\xe0\x85\xf1\xdc\xbe\x03\xd9\x79\x05\x70\x31\x29\x05\x36\xee\xda\
-\x07\xbf\xce\x5e\x04\xb1\xc3\xc7\xb2\xd1\x38\x31\xdf\x8f\x85\x6f\
-\x7e\x99\x04\x3f\x4c\x9e\x09\xe3\x66\x2d\x80\x19\xbf\xad\x84\xa5\
-\xeb\x37\xc1\x0a\x6c\x94\x66\x2c\x5a\x0a\xa6\x81\x5f\x33\xc3\xc2\
-\x43\x13\xc2\xa6\xeb\xa0\x77\x0f\x02\x05\xcb\xbe\x82\xeb\x1d\x7e\
-\xa2\x55\x1f\x55\xa8\x0a\x89\x3c\x11\x68\x0c\x1f\x15\x35\x68\x58\
-\xfb\xd6\x6d\x3b\x3c\x47\x63\x3e\x9e\x7f\xf6\x99\xea\x9c\x4b\xb8\
-\x0a\xf6\x7f\xfa\x4d\xc8\xc4\x86\x0d\x1a\x54\xef\xd8\xb9\xf7\x0b\
-\xda\xd0\x38\xd7\xc0\x90\xa8\xe5\x58\xc0\x72\x44\x5d\xbc\xc7\x52\
-\xc9\x69\xde\x7b\x05\xbd\x70\x82\x80\x75\xc7\xee\x7a\xe7\x41\xa3\
-\xa1\xc5\x92\xfd\xf0\xc1\xf6\x14\x68\x24\x86\xf7\x66\x19\x88\x6f\
-\xb1\x91\xed\x3e\xb9\x06\x82\x01\xff\x2a\x07\xfc\x0d\x17\xa0\xc5\
-\xb8\xa5\xd0\x56\x15\x0a\x9d\xe9\x45\x18\x5f\x25\xb8\xab\x74\x68\
-\xdd\x9b\x20\xc0\x6a\x64\x4e\x15\xf0\x2b\x54\x12\x69\x17\x18\xc2\
-\x3f\xe3\xc1\x3c\xf0\x37\x44\xa2\x95\x1f\x06\xde\xd8\xeb\x62\xae\
-\x1d\x15\xcd\x97\xaf\x03\x17\x7f\x84\xbe\xb7\x8a\xb9\x77\x3e\xe9\
-\xe9\x09\x9f\xa2\xb5\xdf\x47\x65\x84\x98\x6f\x47\xc2\xec\x25\x2b\
-\xe1\xe0\x89\xd3\x68\x79\x67\x43\x11\x81\xff\xee\x5d\xb8\x7b\xef\
-\x3e\xdc\x43\x70\xdf\x7f\xf8\x00\x1e\x20\xb0\xef\xa3\xee\x92\xa5\
-\x7e\x9f\x24\x06\xfb\x43\x66\xb9\xdf\x47\x3d\x20\xe1\xef\xfb\x24\
-\x3c\x76\xf7\xde\x3d\x1e\xf4\xf9\x70\xfe\xd2\x15\xd8\xb4\x6b\x3f\
-\x4c\x5a\xb0\x0c\xbe\x1a\x3b\x91\x8d\xb3\x8f\xfc\x76\x14\x0c\x1c\
-\x35\x0e\xbe\x1b\x37\x15\x46\x4d\x21\xd8\xcf\x87\xa9\x0b\x97\xc1\
-\x42\xb4\xee\x57\x6d\xd9\x86\xe1\xf7\xc0\x72\x04\x7f\xec\xd0\xe1\
-\xcc\xba\x77\xa3\xa9\x91\x1f\x23\xf0\x51\x0f\x95\x21\xd1\x77\xb0\
-\xfe\x1d\xc2\x74\x8f\x55\x98\x42\x9b\xb4\xfd\xbc\xe3\xf3\xaf\xbf\
-\xfe\x36\xff\x32\x55\xd5\xf8\xfa\x4a\xb5\x09\x99\xf9\xc6\xbf\xdf\
-\xaa\xa9\x8b\x1e\xd8\x4d\x61\x88\x58\x82\x99\x9f\xcb\x17\x86\x47\
-\xe5\x5d\xc0\x2c\x3e\xd9\x28\xab\xdf\xe4\xb3\x0c\xa0\x69\x86\x55\
-\x41\xd0\x57\x17\x01\x1d\xbe\x19\x0f\xcd\x56\x1d\x87\x86\x7f\x5c\
-\x47\xc8\x27\xda\x6b\x8b\x8d\xe4\xf6\x3b\x21\x0e\xf8\xd8\x8b\x58\
-\x79\x02\x5a\x8e\x98\x05\x9f\x7b\xa9\xa1\x9b\xbb\x3f\xf4\x09\x08\
-\x02\x4f\xb4\xba\xc8\x77\x4f\xae\x04\x6a\x94\x94\xc5\x00\xdf\xf6\
-\xfe\x2a\x2a\xed\x2a\x22\xfe\x8a\xba\x1f\xfb\x3c\xb7\xc8\xd9\xff\
-\x12\xd2\x5e\x61\xe4\x16\xc4\x21\xb7\x87\x0f\xff\x00\x97\xac\x62\
-\x57\xa5\x00\xfd\x20\x0e\xfa\x7d\xfd\xe0\x13\x17\x2f\x68\xdb\xd3\
-\x0b\x3a\x7b\x29\xc1\xdf\x14\x03\xfd\x87\x8d\x81\xc9\x73\x17\xc1\
-\xc6\x1d\xbb\xe1\xec\xc5\x4b\x90\x99\x9d\x0d\x37\x6e\xdc\x44\x78\
-\x3f\x00\xdb\xed\x91\x8d\xc4\x1b\x41\xff\xf6\x9d\xbb\x90\x5f\x58\
-\x04\x57\xaf\xa5\xc1\xa1\x93\x67\x60\xe5\xa6\xed\x30\x69\xde\x52\
-\x04\xfb\x34\x88\x1b\xfe\x33\x44\x7c\xf3\x03\x44\x7f\x37\x06\x06\
-\x8d\x1e\x0f\xc3\xc6\x4f\x85\x31\xd3\xe6\x30\xcb\x7e\xf2\x82\xa5\
-\x30\x67\xd9\x6a\xb4\xee\x37\xc3\xfa\x1d\x3b\x61\xe7\xa1\x23\xb0\
-\x79\xe7\x1e\x18\x3c\xf2\x47\xd6\x6b\x71\x53\x19\xd8\x1c\x4d\x74\
-\x9f\x52\x69\x54\x01\xf9\xfa\x40\x15\x12\x95\x81\xb0\x9f\xe5\x17\
-\x12\xda\xdc\xd3\xdf\xff\x99\x5a\x55\xf3\xd7\x57\xde\xad\x3a\x4f\
-\xfc\x7f\xfd\xe7\xed\x5a\xc1\x51\xfd\x3d\x14\x86\xc8\x4d\xd8\xe2\
-\xe7\xf3\x15\xec\x11\x7d\xaa\x42\xa2\x9d\x82\x9d\x6d\x61\x92\x03\
-\x95\x94\x04\xe0\xfb\xa2\x85\xdf\xc7\x10\x0b\xed\x47\x4c\x83\xa6\
-\x6b\x5d\x1d\x0a\x4a\x00\x00\x20\x00\x49\x44\x41\x54\x4e\x33\xe0\
-\x37\x42\x90\x17\xa7\xc6\x9b\x38\xe0\x73\xbf\x2f\x8b\x24\x11\xd6\
-\x76\xdf\xd6\x24\xd6\x8b\x68\xb2\x70\x0f\xb4\x1a\xfc\x0b\x9b\xb5\
-\xb0\x3b\x5a\xf8\xf4\xa2\x95\x37\x5a\x5d\xfe\xc2\x50\x4c\x3e\x0d\
-\xa4\x40\x64\x27\xba\x2f\x96\x6e\x18\x2e\xc4\xd6\xe7\xcf\x7f\x0f\
-\xb1\x4d\x07\x01\x84\xc5\xa7\x97\x9d\x44\xff\xed\xa8\x91\x30\xe7\
-\x0d\xbb\x2e\x5e\x4e\x84\xb7\x7e\x6e\x51\x82\x34\x90\xb8\x36\xeb\
-\xdf\x9c\x24\xcf\xb3\x4a\x17\x1b\xe0\x1b\x38\x5f\x3e\x59\xf9\x34\
-\x6b\xa9\xbb\x3a\x04\xfa\x28\xb9\x95\xb1\x7a\x06\x68\xd9\xe8\x1d\
-\x9a\x82\x81\x5e\x9c\x6b\xe7\xe2\x09\x6d\x7a\x78\xb0\x31\xfb\x6e\
-\x98\x9f\xe1\x5f\x7d\x07\x3f\x4c\x9c\x0e\x73\x11\xbc\xeb\xb7\xed\
-\x64\xbe\xf6\xb3\x09\x97\x21\xf1\x6a\x0a\x5c\x4b\xcf\x80\x8c\xec\
-\x5c\xc8\xc9\x2f\x80\xbc\x82\x42\xc8\xc5\xcf\xec\xdc\x3c\x6c\x1c\
-\x72\x20\x35\x23\x0b\x92\xae\xa7\xc2\x59\xb4\xe4\x0f\x9e\x38\x03\
-\x9b\xd1\x9a\x5f\xb4\x66\x13\xfc\x32\x6b\x11\x0c\x1a\x33\x01\xc2\
-\x87\x8e\x02\xd3\x90\x11\xcc\xb2\xef\x37\xf2\x67\xf8\xfa\xa7\x49\
-\x30\x72\xd2\x0c\x18\x3b\x7d\x2e\x8c\x9f\xb3\x88\x59\xf6\x04\xfb\
-\xc5\xeb\x7e\x87\xd5\x5b\x76\xc0\x96\x5d\x7b\xe1\xe0\xf1\x53\xb0\
-\x07\xa1\x3f\x72\xdc\x64\xb4\xe8\x63\xd8\x82\x3a\x66\xe0\x9b\xd3\
-\xc4\x26\x8d\x25\xca\x89\xd3\x79\xc8\xe7\xb9\x28\xbe\xfb\x81\xc6\
-\x88\x14\xac\xfb\x63\x3a\x77\x77\x79\xad\x66\x75\xf6\xc2\x66\xf5\
-\x2a\xab\xbe\x92\x6e\x42\xce\xa2\x85\x5f\x2b\x38\x7a\x80\x32\xd0\
-\x10\xb9\x1f\x0b\x4d\x91\x55\xa5\x7c\x1c\xc0\xa7\xf1\xf7\x58\x79\
-\xbd\xb1\xd2\xba\x84\x0d\x82\xb6\x3f\xce\x87\x26\x6b\xcf\x40\xc3\
-\x1d\xd7\xa0\xd1\x26\x11\x9c\x37\x39\x00\xfe\x46\xe1\x38\x82\x7e\
-\x23\x6a\x13\x0f\x7c\x61\xff\x26\xee\x7b\x63\xd1\x77\xf6\x49\xc0\
-\xff\xfd\x22\x34\x9b\xb2\x1e\xda\x44\x0f\x83\x4e\x1e\x0a\xe8\x89\
-\xb0\x60\xd6\x96\x8e\x7b\x58\x2b\x0b\xd4\xd2\x02\x3f\xa4\x0a\xf8\
-\x25\x03\x3e\xf7\xc6\xad\xf0\xe0\x56\xb0\xf2\xe9\xad\x67\xef\x60\
-\x13\x73\xed\xb8\x21\xf4\x69\xa4\x4b\x1f\x34\x1a\x68\xad\x61\x82\
-\x7e\x57\xb4\xee\x3b\xb9\x2b\xe0\xcb\xbe\xdc\x4b\x5a\x9f\x63\x03\
-\xf0\x69\x1f\x5f\xf8\x1c\xbf\xd3\x7c\x3c\x01\x61\xb1\x10\x3d\x74\
-\x38\x7c\xff\xcb\x24\x18\x3f\x63\x2e\xcc\x43\x20\xaf\xdd\xf2\x07\
-\x6c\xdb\x77\x08\x76\x1e\x3c\x0a\xdb\x0f\x1c\x86\x2d\xbb\x0f\xa0\
-\x35\xbe\x07\x56\x6c\xdc\x06\x73\x57\xae\x87\x09\xf3\x96\xc0\xf0\
-\x5f\xa7\x33\x4b\x3e\x6c\xe8\x0f\x10\xf6\xf5\x48\x88\x44\x6b\x3e\
-\xf6\xfb\x9f\x60\xc0\xa8\x71\x30\x64\xec\x04\x66\xd5\x8f\x9a\x32\
-\x0b\x7e\x9e\x39\x9f\x0d\xbf\xa4\x67\x09\x73\x97\xad\x81\xdf\xd6\
-\x6c\x84\x55\x9b\xb6\xc1\x46\xb4\xea\x77\x62\xdc\xc7\xce\x9c\x83\
-\x43\x27\x4e\xc1\xaf\xb3\xe6\x83\x3e\xee\x2b\x1e\xf8\xa1\xfc\x68\
-\xb0\x28\xce\x85\x58\xb1\xc0\x7f\x80\xe7\x64\x07\xe8\x23\x26\x9b\
-\x06\x0e\x7e\xb3\x4d\xdb\xb6\x0c\x0b\x55\x43\x2f\x2b\xef\xc6\x32\
-\xf7\x43\x57\xb7\xe7\x54\xa1\x71\x06\xb4\xf0\x4f\x05\x1a\xa3\x6e\
-\xc9\x56\xe2\x0a\x10\x37\xfe\x1e\x2b\x70\x50\x28\x78\x62\x81\xef\
-\x16\xfd\x0d\x7c\x3c\x7e\x19\x34\x5e\x77\x16\x1a\x6e\x4d\x46\x30\
-\x5f\xaa\x40\xf1\x8d\xc2\xda\xb3\xd0\x62\xec\x42\x68\x67\x8c\x87\
-\x2e\x08\xfb\xde\xbe\x6a\xf0\xd4\xf0\x0f\x6b\x09\xf8\x34\xf6\xbe\
-\x22\xd3\xc1\x16\x7a\x32\x92\x04\x64\x45\x5c\x4b\x45\xff\x47\x49\
-\xae\x85\xf7\x65\x13\xec\x05\xe0\x53\x23\x4c\xd0\xa7\x07\x9c\xe4\
-\x0a\x61\xae\x1d\xad\x89\x3d\xf8\xec\xab\xd6\x23\xf8\xe9\x45\xa6\
-\x20\x70\x41\xa8\x77\xf7\x56\x63\x9e\x2a\xd9\x0b\x5a\xf4\x76\x2e\
-\x8d\xe4\x69\x43\x56\x3f\xaa\x5d\x1f\x6f\xf6\xf2\x56\x07\x6c\xe4\
-\x3b\x61\x98\xbe\x6a\x13\x68\x63\x07\x23\xcc\x11\xde\xa3\xc7\x43\
-\xff\x1f\x7e\x81\x7e\xa8\x78\xb4\xd8\x69\xb2\xb6\xe8\x61\x3f\x32\
-\x0b\x3e\xfc\x9b\x51\x10\x8a\xa0\x0f\x1f\x4a\xae\x9b\x1f\x79\xd0\
-\x4f\x84\xef\xc6\x4f\x81\x1f\xc8\xaa\x9f\x36\x07\xc6\xcf\x5e\x08\
-\x93\x17\x2c\x81\x19\x4b\x96\xc3\xbc\xe5\x04\xfb\xdf\x61\x15\x36\
-\x1a\x1b\x76\xec\x82\x1d\xfb\x0e\xc2\xbe\xa3\xc7\xe1\xd4\x85\x8b\
-\x70\xec\xec\x79\x98\xf3\xdb\x4a\x88\xfc\x6a\x18\xf6\x54\x8c\x6c\
-\xc9\x4c\xba\x37\x36\xbd\x42\x45\xa7\xaf\x31\xea\x01\xf6\xae\x0b\
-\xb0\xce\xcf\xf7\x0f\x89\x68\xe0\x66\x34\xd4\xae\x55\xbb\x76\x15\
-\xed\x2b\xe3\x26\x74\xdb\xda\x75\xec\x58\x23\xb0\x7f\xff\x57\x03\
-\x0d\xe1\xb1\x68\x69\x5f\x42\xdd\x29\x39\xb4\x23\xcd\x52\x9a\x55\
-\x5c\x38\x61\x5f\x14\x7b\x28\xea\x4b\x15\x16\x0b\x7c\xe7\xb8\xef\
-\xe1\xa3\x29\xeb\xa0\x31\x42\xb8\xe1\x16\xb2\xbe\x2f\x71\x12\x20\
-\xfd\xbb\x8d\xe4\xf6\x3b\x23\xd6\x13\x40\xab\x7f\xd5\x49\xf8\xf0\
-\xbb\x29\xf0\x99\xd2\x04\x5d\xbd\x03\xc1\x35\x40\xcb\x46\x0b\x09\
-\xc0\x0f\x74\x02\xf8\x81\x4e\x55\x50\xc7\xe9\xe3\xf8\x1c\x67\xd2\
-\xdc\xb9\x78\xa5\xf2\xc1\x51\x18\xc7\xe1\x4b\xfe\xbf\x25\xb9\x0e\
-\xa1\x01\x62\xc0\x37\x72\x23\x75\x48\x62\xe0\x93\x6b\x87\x26\xdb\
-\x23\x7f\xbe\x19\xfa\x4a\x1d\x5b\x77\xb8\xa7\xbf\x16\x7a\xf8\x6b\
-\xd8\xa4\x6b\x5d\x7d\x54\xcc\xc7\x4f\xee\x9e\x2f\xdc\xfd\xd9\xa8\
-\x9e\x8f\xba\xbb\x42\xe3\x2f\xbb\x43\xfd\x76\x9d\xa0\xc9\x97\x2e\
-\xd0\xde\x43\x09\xbe\x61\xfd\x21\x30\x66\x30\x04\x44\x7d\xc5\x3e\
-\x55\x71\x5f\x83\xb6\xdf\x37\xa0\x1f\x38\x0c\x42\x87\x8c\x64\xfe\
-\xf9\x01\xa3\x7e\x61\xd6\xfc\xb7\xbf\x4c\x81\xef\x27\x4c\x47\xd0\
-\xcf\x84\x1f\xc9\x57\x3f\x7b\x01\x4c\x62\x56\xfd\x32\x98\xbd\x6c\
-\x35\x2c\x58\xb9\x0e\x96\xac\xe3\x2c\xfb\x0d\xdb\x76\x61\x8f\x61\
-\x3f\xec\x39\x7c\x14\x0e\x9f\x3a\x0d\xe7\x2e\x27\xc2\x99\x84\xcb\
-\xb0\x6c\xfd\x26\x18\xf8\xfd\x68\xf0\xc4\xf2\x4f\xe5\x4e\x58\x45\
-\x4d\x48\x57\xeb\x7c\x2e\x9f\xfc\xe5\xf3\xee\x21\x1a\x33\x37\xb0\
-\x67\xbf\x52\x15\x16\xd5\x4e\xa1\x0b\x7e\xa9\xca\x87\x5f\x49\x37\
-\x61\x2a\xe5\x4f\xbd\xbc\x9e\x09\x8c\x88\x7d\x1b\x2d\xa7\x6f\xb1\
-\xa5\x4f\xc1\x82\x70\xb7\x2c\xc0\x77\x54\xd0\xec\xc2\x18\x39\x77\
-\x0e\xbd\x70\xe5\xc3\x46\x29\x84\x40\x87\x01\xa3\xe1\xc3\x19\x5b\
-\xd0\xc2\x3f\x07\x1f\x6c\xba\x02\x8d\x36\x88\x00\xbd\x41\x06\xdc\
-\x72\xfb\x9d\x01\x3e\xb9\x79\x96\x1e\x81\x56\x03\xc7\xc2\x17\x3e\
-\x1a\xe8\xe1\xad\x04\x37\xa5\x8e\xf9\x86\xb9\xe1\x98\xfc\xf5\x1a\
-\x9d\x03\x64\xf9\x54\x44\xb9\xf0\xd2\x10\x76\x0e\xe0\x62\x3d\x59\
-\xe0\x3b\x5d\x5e\x8c\x9c\xcc\xe5\x44\x04\xfc\x00\xde\xad\x43\x0b\
-\xc8\x93\x1b\x84\x2c\x63\x7a\x71\x49\x18\xed\x42\xd3\x61\xf4\xa5\
-\x67\x42\x81\x3a\xf6\x16\x6b\x4f\x45\x10\x0f\x7e\x35\x82\x5f\xcd\
-\x86\x71\x12\xf8\xbf\xf4\xf0\x87\x4f\xd1\xd2\xff\xd8\xc5\x1d\x3f\
-\x7d\xc0\x55\x63\x82\x48\xb4\xdc\xfb\x8d\xf8\x85\x59\xfa\xf1\x23\
-\x7e\x46\x4b\x7f\x1c\x0c\x1c\x35\x1e\x06\x8d\xfe\x15\x06\xff\x38\
-\x11\x86\xfe\x34\x19\x86\xfd\x3a\x0d\x46\x4c\x9c\x01\xa3\x27\xcf\
-\x82\xb1\xd3\x11\xf4\x33\xe7\xc3\xc4\x39\x8b\x61\xea\x82\xa5\x30\
-\x73\xc9\x0a\x98\xbb\x62\x0d\x2c\x5a\xb3\x1e\x96\x6d\xd8\x0c\xab\
-\x37\x6f\x67\x96\xfd\x96\xdd\xfb\xe0\x8f\xfd\x87\x61\xff\xb1\x13\
-\x68\xd9\x9f\x83\x84\xa4\xab\x4c\x1b\xf1\xd8\x37\x63\xc6\xb1\x5e\
-\x25\x35\x5a\xfe\xfc\xcb\x57\xb6\xc0\x17\xf6\x95\x63\x39\x7b\x88\
-\xe9\x7b\x07\xcb\xc4\x26\x95\x29\xa2\xbb\x8f\x5e\xff\x5a\xcd\xda\
-\xb5\x8b\x21\x47\xd5\xf6\xa7\xdc\x04\xe0\x77\x70\x73\x7b\x4e\x1d\
-\x11\xdf\x30\xc0\x10\xfe\x23\x56\xaa\x4c\xd4\x7d\xeb\x82\x52\x3c\
-\x64\x4a\x2d\x56\x89\xb1\x7b\xae\x33\x81\x0f\xbd\x61\x8b\x56\xda\
-\x17\x43\x7e\x82\x66\xf3\x76\x41\xa3\x75\xe7\xe1\x03\x04\xf2\x07\
-\x1b\x12\x98\x1a\xd9\xe8\x03\x91\xa4\xf6\xd9\x1e\x97\x3c\x46\xf1\
-\xaf\xbb\x08\x4d\x16\xec\x81\x36\xb1\xdf\x63\xb7\x5f\x01\x2e\xbe\
-\x2a\x36\x1c\x53\x3c\x95\x82\x23\x38\x55\x58\xda\x48\xfc\x67\x45\
-\xc5\x5b\x52\x38\xdb\x02\xa8\x62\xca\x88\x00\xfc\x48\xb3\x14\x66\
-\xe8\x47\x70\xbe\x7c\xe6\xc7\x0f\x67\x0f\x3a\xbd\x18\xf0\x4d\x6c\
-\x46\x53\xc1\xd2\x77\xd3\x18\x98\x5f\x9f\xac\x7d\x31\xf8\x69\xed\
-\x58\x9a\xa1\xb2\x1b\xc2\xbf\x8b\xaf\x12\x3a\x78\xfa\xc3\x67\xae\
-\xde\x6c\xdd\x62\xf7\xa0\x50\xe8\x37\x7c\x2c\xb3\xdc\x99\xc6\x4d\
-\x61\x3e\xf9\xe1\x04\x78\xb2\xe4\x11\xf2\xa3\x10\xf2\x64\xcd\xff\
-\x3c\x63\x1e\xfc\x2a\x58\xf4\x0b\x11\xf4\xbf\xad\x60\xcf\x01\x16\
-\xa2\x55\xff\xdb\xda\xdf\x61\xc5\xc6\xcd\xb0\x66\x2b\xc2\xfe\x8f\
-\xdd\x3c\xec\x0f\xc1\xde\x23\xc7\xd0\xba\x3f\x03\xa7\x2f\x24\x40\
-\x62\xca\x75\xb8\x82\xda\x7d\xf0\x08\xfc\xf0\xeb\x14\x0e\xf8\x6a\
-\xa3\x65\xbd\x05\x89\xb2\x27\x95\x77\x25\xcf\x73\xb3\x1e\xe1\x7f\
-\x3c\xc0\x74\xde\x85\xbd\x28\x2f\x5f\x9d\xfe\x8d\x2a\x0b\xbf\x92\
-\x6e\xc2\x54\x0b\x5d\x3c\xdc\x5f\x50\x47\xc6\xb6\x44\xb8\x4d\xc1\
-\xc2\x50\x80\x05\xed\xc1\xe3\x82\x98\x82\xaf\xb8\x7e\xc1\x26\xf0\
-\xc6\x6e\x78\x6f\xac\xac\xed\xbf\xf9\x15\x9a\xfe\x76\x00\x3e\x58\
-\x7f\x01\x3e\x40\x2b\xfc\x83\xf5\x17\x2b\x4e\x14\xff\x9a\xb3\xd0\
-\x74\xe6\x66\xf8\x24\xe2\x6b\x6e\xfc\x3d\x42\xc0\x03\xaf\xc5\xd7\
-\x01\xf0\xff\x17\x55\x71\x60\x2f\x06\x66\x0c\xf6\x11\xdc\x9b\xd8\
-\x4c\xf6\xc0\xf7\xe5\xdd\x3a\x5e\xbc\x95\xcf\xa0\xaf\x35\xf2\xee\
-\x1d\x03\xb3\xf6\xe9\xad\x5c\x5a\x26\xb1\x77\x20\xb9\x7a\x74\x9c\
-\xc5\x4f\x23\x7a\xfc\xd5\xd0\xd9\x1b\x2d\x7d\x84\x3d\xb9\x79\xdc\
-\x31\x9e\x01\x23\x7f\x62\x2e\x9a\x31\x53\xe7\x30\xfd\x38\x6d\x2e\
-\xfc\x34\x7d\x2e\x03\xfc\x2f\x68\xc9\x8f\x9b\xb5\x90\xbd\x2d\x3b\
-\x79\xfe\x12\xe6\xba\x99\x85\x16\xfd\x9c\x65\x6b\x98\xfb\x86\x7c\
-\xf5\xcb\xd6\x6f\x86\x95\x1b\xb7\xc1\xba\x6d\x7f\xb0\x07\xb4\x5b\
-\xf6\xec\x87\x3f\x0e\x1c\x86\xbd\x87\x8f\xc3\xa1\xe3\xa7\xe0\xc4\
-\xd9\x8b\x70\xee\x52\x12\x24\x5d\x4b\x83\xe4\xd4\x0c\x38\x7a\xea\
-\x1c\x8c\x9b\x36\x9b\xbb\x6e\xbc\x5e\x36\x05\x37\x5b\x51\x2d\xa2\
-\xa2\xd3\xf9\x11\x9f\xbe\x87\x54\x21\x51\x5a\xdf\xe0\xf0\xff\xd4\
-\xaa\x55\x65\xe1\x57\xca\x4d\xb0\xf0\x3b\xb9\x7a\xbe\xac\x0a\x8f\
-\xfe\x54\x61\x0c\x9b\x47\xfe\x7b\x56\x08\xca\x58\x90\x14\x21\x11\
-\x66\x39\x0c\xcb\x46\x5c\x60\xa5\x0d\x0e\x61\x33\x64\xf6\xd6\x84\
-\xc2\x67\xdf\x4d\x86\xc6\xcb\x8e\x71\x40\xde\x70\x91\x59\xe0\xd2\
-\xba\x60\xf3\x29\xd2\x7a\x7e\xbf\x18\xee\x42\xd8\xf5\x17\x2c\xbf\
-\xc9\xad\xb3\xe2\x24\x34\x9b\xb0\x0a\xda\x85\x0e\x84\x2e\x5e\x0a\
-\xe8\x83\xdd\x7e\x2f\x8d\xc5\xca\x12\xbb\x74\x14\x3c\x74\xac\xbe\
-\x57\x44\xba\x54\xb0\x2c\xd7\x20\x88\xdf\x2f\xb2\xa2\x9f\x26\xe0\
-\x2b\xcc\xb0\x8f\x30\xc3\x3e\x40\x28\x3b\x6c\x4c\x7e\x18\x36\xd0\
-\x61\x6c\xfa\x6a\x2f\xb3\x6b\x87\x7b\x73\xd5\x9d\xb9\x77\x0c\x6c\
-\xe1\xf9\xbe\x3c\xf4\xfb\x90\x7f\x9f\x66\xa8\x54\x72\xe0\xa7\xf9\
-\x78\x3a\x79\x06\x40\x47\xcc\x7f\x0f\x84\xed\xc0\x1f\x7e\x82\x9f\
-\x11\xf0\xe4\xa2\x99\x30\x7b\x11\xd3\x44\x04\xfc\xa4\x79\x4b\x60\
-\x32\x8a\xdc\x36\xd3\x7e\x5b\x8e\xa0\x5f\xc9\x86\x77\xce\x5f\xb9\
-\x06\x16\xae\xde\x00\x4b\xd6\x6e\x82\xe5\x1b\xb6\x30\x17\xce\xfa\
-\xed\xbb\x60\xe3\x1f\x7b\x61\xeb\xee\x03\xb0\x13\x2d\xfb\x3d\x87\
-\x8f\xc1\x81\x63\xa7\x10\xee\xe7\xe1\x4c\x42\x22\x24\x5c\x49\x81\
-\xe4\xb4\x4c\x48\xcd\xcc\x41\xf8\x5f\x81\xc9\x73\x16\x82\x17\x35\
-\x52\x64\x6c\xb0\xd1\x61\xe1\x5c\x43\x57\xd1\xc0\x0f\x61\xe9\x7a\
-\x12\xf3\x36\xdc\x4f\x6b\x7a\xb7\x0a\xf8\x95\x74\x13\x80\xdf\xb1\
-\xa7\xf7\x5f\x95\xe1\x71\x9d\x03\x8c\xe1\x4b\x99\x75\x6f\x74\x1e\
-\xf8\x72\x00\x2b\x09\xf0\xe9\x81\xad\x1f\x16\x74\x4f\xaa\x7c\xda\
-\x30\x68\xf7\xfd\x74\xf8\x60\xc5\x29\x68\xb8\x2e\x41\x04\x6a\x39\
-\xe0\x5f\xb0\x01\xfe\x05\x6b\xd9\x01\xdf\x26\x0c\x01\x7f\xd9\x51\
-\x68\x3e\x76\x31\x7c\x66\x8c\x87\xee\xf4\xc0\x16\x01\x40\x15\x4f\
-\x98\x2c\x4d\x80\x9f\x18\x3a\x62\x3d\x0d\xc0\x2f\x69\xbc\xe2\xf0\
-\x0a\x27\x81\x6f\x7d\x7e\x24\xff\xe6\x71\x69\xae\xb5\x84\xe7\x1b\
-\xed\xd3\xde\x16\xf8\x94\x57\x7e\xfa\x50\x06\x4a\x1f\x1d\x07\x7c\
-\xc1\xd2\x27\xe0\xbb\xa3\xd5\x4c\x33\x9e\x32\xe8\x93\x54\x7a\x7e\
-\x34\x8f\x8e\x9f\x9a\x41\x03\x9d\x7d\x94\xd0\xc9\x0c\xfc\xb1\xcc\
-\x55\x43\xbe\x78\xb2\xe0\xa7\xa3\x66\x2e\x41\xc0\x2f\x5d\x05\xb3\
-\x97\xad\x82\x39\xcb\x57\xc3\xbc\x15\xeb\x60\xc1\xaa\x75\xb0\x78\
-\xcd\x06\x58\xba\xfe\x77\x58\xf1\xfb\x26\x58\xb5\x69\x2b\xac\xd9\
-\xb2\x03\x36\x20\xec\x37\xed\xdc\x07\x5b\xf7\x1c\x84\x9d\x07\x8e\
-\xc0\x9e\x23\xc7\xe1\x00\x5a\xf6\x47\x4e\x9f\x83\x93\xe7\x13\xe0\
-\x7c\xe2\x55\x48\x4c\x49\x85\xeb\x08\xfb\x8c\xdc\x02\xb8\x72\x2d\
-\x95\x4d\xb1\xe0\x15\x14\x0a\xee\x2a\x4b\xef\xf2\x31\x58\xf8\x42\
-\x1a\x9f\x09\x34\x45\xf5\xf7\x0f\x0a\xab\x57\x05\xfc\x4a\xba\x59\
-\x2c\x7c\xaf\x57\x94\x11\xf1\xbd\xd0\xa2\x58\x85\x05\xec\xa1\x05\
-\x64\x9c\xe4\x40\x57\x1a\x49\x56\x5e\x36\x42\x07\xad\x31\xac\x78\
-\x2e\x41\xe1\xd0\x76\xe4\x4c\xf8\x60\xd5\x19\x0e\xf8\x02\x98\xd7\
-\xda\xab\x21\xd3\x79\x89\x30\xe7\x39\xd9\xc2\x7f\x9d\xcd\x71\x54\
-\x43\x7a\xd8\xfb\xdb\x21\xf8\x70\xe4\x6c\x68\xaf\x8b\x81\x1e\x08\
-\xfc\xbe\x68\xf9\x79\x6b\xf9\xd9\x31\x05\x28\x96\x63\x1a\x94\x26\
-\xcd\xa4\xd2\xad\xb4\xe9\xed\xa8\xd1\x72\x2e\xde\xd2\x5d\x4b\xa9\
-\xaf\x59\x22\xfd\xad\x80\x2f\x88\xac\x7c\x3d\x07\x7c\x6f\x2b\x7f\
-\xbe\xd1\x2c\x0e\xfa\x06\xd6\x00\x90\x7f\x9f\x83\xbe\x9e\x59\xf9\
-\x5d\xfd\x38\xd7\x8e\x3b\xf6\x12\xfa\x8f\x18\x03\x13\xe7\x2d\x86\
-\xf9\x08\xf4\xb9\x2b\x56\xc3\xdc\x95\x68\xc5\xaf\x5a\xcb\x00\xbf\
-\x10\x01\xbf\x08\xb5\x78\xed\xef\xb0\x64\x3d\x5a\xf4\xbf\x6f\x86\
-\x95\x0c\xf4\x64\xd5\xff\x01\xbf\xef\xdc\x0d\x9b\x77\xed\x83\x6d\
-\x04\xfb\x83\x47\x60\xef\xd1\x93\x08\xfb\xd3\x0c\xf6\x27\x10\xf6\
-\x67\x2f\x25\xb2\xf9\x76\xc8\x9d\x93\x96\x9d\x0b\x59\x79\x05\xcc\
-\xad\x33\x17\x1b\x13\x3f\x7d\x04\x03\xbe\x8f\x08\xf8\xb6\xf9\x54\
-\xfe\xf9\xc9\x86\xb9\x5e\xc4\x06\xf8\x5b\x6f\x7d\x58\xc3\x5a\x55\
-\x0f\x6d\x2b\xe7\x26\x00\xff\xcb\x5e\x7d\x5f\x53\x86\xc5\x7a\x04\
-\xe8\xc3\xd6\x2b\x44\xc0\x7f\x5c\x62\x0f\xdd\xe8\x01\x1b\x2d\x7a\
-\xa2\x8f\x82\x36\xa3\xe6\xc0\x07\x2b\xcf\x70\x40\x5f\x87\x50\x5e\
-\x7b\x0e\x1a\xae\x41\xad\x26\x9d\xb7\xd7\x9a\xf3\xa2\xe3\xe7\xf8\
-\xdf\xfc\x3e\x49\x9d\xb7\x68\x1d\x02\x7f\xe1\x01\xf8\xe8\xdb\x29\
-\xf0\xa5\x36\x82\x2d\x65\xe8\xce\xa6\x43\x36\x89\x5c\x3a\x55\x7a\
-\x1a\x45\xeb\x0a\x93\xdb\x83\x44\xe0\xa7\xf9\x75\xc8\x97\xcf\xac\
-\xfc\x60\x0e\xfa\xde\x5a\x13\xeb\xad\x79\x92\xcc\xe0\x37\xf0\xe2\
-\x7c\xfc\xd4\x00\x90\x7b\x87\x46\xf0\x74\xf6\xc2\x1e\x1e\xf6\x08\
-\xe2\x87\x8d\x86\xa9\x0b\x97\xc0\x52\x84\xf9\xe2\x75\x08\xf7\xf5\
-\x1b\x10\xee\x1b\x61\xc9\xba\x4d\xb0\x74\xc3\x66\x36\xf2\x66\xf9\
-\xef\x5b\x10\xf4\xdb\x60\xcd\xd6\x1d\xb0\x76\xdb\x4e\xd8\xb0\x63\
-\x37\x6c\xda\xb5\x17\xb6\xee\x3d\x00\xdb\xf7\x1f\x42\xcb\xfe\x28\
-\xec\x3d\x72\xc2\x0c\xfb\xe3\xe7\x2e\xc2\xe9\x84\xcb\x70\xfe\x0a\
-\x67\xdd\x93\x3b\x27\x23\x27\x0f\x72\x0a\x8a\xe0\x5a\x46\x16\x7b\
-\xd0\x2b\xbc\x6d\xcb\x86\x66\xea\xc3\x1f\x5f\x5a\x1a\xc2\x2f\x07\
-\x84\x44\x8e\xf2\x0d\x36\x36\xa9\x55\xbb\xea\xa1\x6d\xa5\xdc\x6a\
-\xd4\xa8\xc1\x06\xe2\x77\xe9\xe5\xf1\x0f\x4d\x58\xac\xbf\xbf\x3e\
-\x6c\xb3\xe2\x89\x00\x3f\x8c\x3d\xb0\x25\xcb\xba\x8b\x21\x16\x5a\
-\x8f\x9e\x07\x0d\x09\xf8\x6b\x2e\xd8\xc3\x5c\x0a\xf8\x4c\x36\x61\
-\xc4\xc0\x5f\x6d\x23\x11\xf0\x1b\x10\xf0\xe7\xef\x85\x56\x83\xc7\
-\x43\x07\x75\x28\xf4\x22\xe0\xf3\x5d\x6a\xff\x2a\xe0\x3f\xd5\xb2\
-\x05\xbe\x9f\x21\x8c\x87\x7e\x28\xb3\x90\x39\x99\x18\x3c\x49\x9e\
-\x5a\xa3\xc8\xda\x37\x58\xac\x7e\x36\x66\x9f\x9b\x92\x81\x9e\xe1\
-\xb8\xe2\xef\xb8\x61\x3f\xc0\x8c\xdf\x96\x23\xc8\xff\x80\x15\x68\
-\xbd\xd3\xac\x96\x04\xf7\x55\x9b\xb6\xc3\xea\xcd\x3b\x98\xdb\x86\
-\xb4\x0e\x41\xff\xfb\x1f\x04\xfa\x7d\xb0\x65\x0f\x0f\xfa\x83\x9c\
-\x0b\x67\x1f\x5a\xf6\x87\x4e\x9c\x41\xd8\x9f\x67\xb0\x3f\x75\xf1\
-\x32\x9c\xbb\x9c\xc4\xa6\x6c\x4e\x4a\x4d\x47\xc8\x67\x33\xeb\x3e\
-\xa7\xf0\x06\x5c\xcf\xca\x86\x25\x6b\x37\x80\x36\xb2\x1f\x78\x10\
-\xf0\xf1\xba\x02\x0c\x8f\xaf\xfc\x61\x5a\x26\x61\x6f\x7e\x3c\x36\
-\x92\x2d\xaa\x5c\x3a\x95\x74\x13\x80\xdf\xb5\x97\xc7\xeb\x9a\xd0\
-\x38\x15\x02\x6e\x9b\xe2\x89\x00\x3f\x94\x07\xbe\x0e\x3a\x1b\xe3\
-\xa1\xd5\xe8\xf9\xd0\x70\xc5\x69\x7b\x90\xaf\x3a\x67\xff\x5b\x4a\
-\xb6\x80\x5f\x2d\x7f\xac\xc1\xba\x04\x68\x34\x77\x37\xb4\x1e\xf8\
-\x13\x74\x54\x99\xa0\xb7\xaf\x0a\x2b\x9c\x00\x7c\xb2\xb0\x1e\x9f\
-\x95\x55\x25\x67\x14\x6e\x96\x00\x7b\x0e\xf8\x61\x22\xe0\x73\xd0\
-\xb7\x58\xfa\x9c\x3f\xdf\x4b\x13\xc2\xac\x7c\x4f\xde\xe2\xb7\xc0\
-\x9f\x7c\xfa\xf4\xf0\x96\x66\xdb\x54\x40\x1f\xcc\xff\xd8\xef\x46\
-\xc2\xac\xa5\x2b\x61\xe3\xce\xbd\xcc\x7a\x5f\xbb\xf5\x0f\x06\x77\
-\x7a\x10\x4b\x96\xbc\x20\x3a\x4e\x2f\x52\x6d\xdf\x7f\x98\x4d\xc5\
-\xb0\xfb\xf0\x31\xce\xaa\x3f\x76\x9a\x4d\xaa\x76\x8c\xdc\x38\x08\
-\xfb\x93\x17\x12\xe0\xcc\xa5\x44\x38\x9f\x74\x15\x2e\xa5\x5c\x87\
-\xab\x69\x19\xcc\x7f\x4f\xc0\xcf\x45\xe0\xa7\x22\xf0\x97\xae\xfb\
-\x1d\x82\xa3\xfb\x33\xe0\x7b\x62\xaf\x23\xc0\x10\xfa\xd8\xd2\x15\
-\xd3\x30\x19\x2d\xfc\x49\x3e\xba\xb0\x0f\xab\x5c\x3a\x95\x74\x13\
-\x80\xdf\xad\x8f\xe7\x3f\xd5\xa1\x71\x5a\x04\xfe\x0e\x85\x18\xf8\
-\x06\x91\xca\xb3\x80\x19\xac\x65\x06\xbe\x52\x0f\x1d\x43\xfa\xc3\
-\x47\x63\x16\x20\xf0\x4f\x41\x03\x33\xc4\xcf\x72\x5a\xc9\x6b\x95\
-\x8d\x56\x4a\x1c\x93\xfb\x6d\x7b\xfe\xda\x04\x68\x32\x7b\x27\xb4\
-\xe9\x37\x1a\x3a\x2b\x8d\xd0\xc7\x4f\x89\x50\xe0\x86\xc5\x11\x48\
-\x6c\xaf\xd5\x9c\x16\x25\xdd\xef\xe0\xfe\xed\xc2\x94\xe5\xdc\xe2\
-\xd2\xbb\x2c\x79\x5b\x51\xe5\xa1\x44\x71\x5b\x80\xaf\xb0\x01\xbe\
-\x3f\x7b\x70\xcb\x4b\x00\x3e\x3f\xd7\x8e\x77\xb0\xc9\xfc\x62\x96\
-\x57\x90\x00\x7d\xc1\xf2\xe7\x7c\xf9\xbd\x15\x41\xcc\xc2\x27\xf7\
-\x4e\xcc\xb7\xc3\x61\xee\xf2\x55\xb0\x6d\xef\x41\x06\xf5\x8d\x7f\
-\xec\x61\x9f\xcc\x92\x47\xc0\x93\x35\x4f\x43\x2d\xb7\xed\x3b\x08\
-\x3b\x0e\x1c\x46\xd0\x1f\x87\xbd\x47\x4f\xb0\x89\xd8\x0e\x32\xab\
-\xfe\x2c\x1c\x3d\x73\x9e\xc1\xfe\x34\x5a\xf6\x04\xfb\x73\x89\x57\
-\x21\x21\xf9\x1a\x5c\xb9\x96\x06\x29\x34\x3a\x27\x2b\x17\xb2\xf3\
-\x0b\x21\xb7\xe8\x26\x7e\xcf\x61\x43\x39\xf5\xb1\x03\xd8\xb0\x4c\
-\x92\xbf\x50\x06\x2b\x1a\xf8\x6c\x9a\x8a\xf0\x14\x45\x48\xc4\x14\
-\x6c\x20\x3f\xaa\xb2\xf0\x2b\xe9\x56\x9d\x07\x7e\x27\x97\xbe\x6f\
-\xa8\xc3\x62\x74\x7e\xfa\xd0\x9d\x4f\x12\xf8\x34\x4e\xba\x83\x69\
-\x00\x02\x7f\x21\x34\x5c\x7e\x0a\x81\x7c\x5e\x1a\xd8\x62\x70\x4b\
-\xed\x2f\x4e\xa2\x38\x1b\xac\xb9\x08\x8d\x67\xfd\x01\x6d\xe2\x7f\
-\x40\xe0\x1b\xec\x80\x1f\x50\x05\xfc\x3f\x15\xf0\xfd\x45\xc0\x17\
-\xa0\x6f\x0f\x7c\x5e\x5a\x8b\x68\xf4\x4e\x9f\xc0\x20\xe8\x8a\x16\
-\x7e\x6f\x65\x30\xc4\x7e\x3b\x02\x16\xae\x5a\xcb\x2c\xf6\xed\x08\
-\xf5\x6d\xfb\x0e\x30\xb8\x33\xc0\xa3\x35\x4f\x63\xea\xc9\x75\x23\
-\x58\xf4\xfb\xd1\xa2\x27\xd0\x1f\x3e\x75\x96\x77\xe1\x5c\x60\x0f\
-\x68\xc9\x8d\x73\xe6\x72\x12\x83\x3d\x2d\x77\x78\x39\x25\x0d\xae\
-\xa6\x66\x30\x9f\x7d\x1a\x9b\x95\xb3\x08\xf2\x8a\x6e\xb1\xef\x2b\
-\x7f\xdf\x02\xc6\xb8\x41\x3c\xf0\xf5\x78\x4f\x8f\x0f\xf8\xf8\x3f\
-\xd7\xf1\xfb\x4c\x3f\xbd\xb1\x15\x6f\xe1\x57\xcd\xa7\x53\xd9\x36\
-\xb3\x0f\xdf\xd5\x8d\x80\x1f\xe2\xaf\x0f\xdd\x8d\x95\xe8\x21\x7b\
-\xe1\xc3\x4a\x32\xa0\xb1\x53\x49\xcf\x09\x67\x8b\x9e\xd8\x02\xbf\
-\x25\x01\x7f\xd9\x29\x11\xa4\xcf\x88\x74\x56\x66\x3f\xaf\x15\x22\
-\x49\x1d\xb7\x51\x83\xd5\x04\xfc\x1d\xd0\x26\x6e\x24\x74\x09\x34\
-\x80\xab\xbf\x4a\x06\xf8\x65\x48\x0f\xa3\x13\xe9\x29\x07\x73\xd9\
-\xc6\x40\x14\x5f\x71\xe7\x16\x07\x7c\x47\x32\x87\x97\xb9\x7e\x47\
-\xd0\x2e\x49\xc3\x26\xbe\x2f\x33\xd4\xa5\xcf\x0b\x30\x08\x12\xb9\
-\x75\xb0\x1c\xf9\x9b\x15\xc6\xac\x63\xb3\x95\x2f\xf2\xe7\x9b\xe1\
-\xaf\xb5\x88\x8d\x7d\xa7\x37\x72\xc5\xc0\xff\x6e\x04\x7b\x53\xf6\
-\xc0\x89\xd3\xb0\x0b\xa1\x4e\xf3\xd6\x73\x3a\xca\xac\xf9\x3d\x08\
-\xf9\x7d\x47\x4f\xb0\xa1\x96\x04\xfa\x43\x04\x7a\xb4\xe8\x8f\x9d\
-\xe5\x40\x7f\xf2\xc2\x25\x06\xfb\xb3\x08\xfb\xf3\x49\x29\x70\x01\
-\x61\x7f\x29\x25\x15\xad\xfb\x74\xf6\xb0\x96\xdc\x39\xe9\xfc\x03\
-\xdb\xfc\x1b\xb7\xd8\xf7\x55\x1b\xb7\x82\x31\xfe\x2b\x0b\xf0\x69\
-\x1d\x06\x21\xbd\x8b\xcb\x07\xdb\xfd\x25\x6c\xfc\x31\x3d\xaf\x07\
-\x18\x23\xe6\xf8\x04\x85\x7c\xcc\x5b\xf8\x55\xc0\xaf\x6c\x9b\xc5\
-\x87\xef\xfe\x26\x02\x3f\xdc\x5f\x17\xb6\xb7\x78\xe0\xdb\xee\xb7\
-\xb6\xb4\x02\x64\xa1\x26\x15\x1f\x7e\xa7\x45\x4f\x82\xc3\xc0\x5b\
-\x65\x60\xaf\xbe\x77\x08\xe9\x0f\x2d\x47\x2f\x40\xe0\x9f\x84\x06\
-\x64\x81\x23\xb8\x2b\x54\x6b\x2e\x40\xe3\x99\xdb\xa1\x4d\xec\x08\
-\xe8\x82\x0d\x8e\xab\xbf\x1a\xbc\xac\x5c\x3a\x72\x92\xbb\x37\x09\
-\xd9\x00\x5f\x12\x58\x36\xf1\x58\xc2\x58\xff\x8f\x7d\x3a\xdb\xc6\
-\xef\xc4\xf5\x38\xb8\x9f\x00\xbb\xff\x90\xda\x2f\xbe\x36\xe7\xe3\
-\xb6\xbf\x07\x47\x65\x24\x5c\x62\xbf\x19\x4e\x9c\xf4\xe1\x76\x32\
-\x03\x5f\x1f\x6a\x81\x7e\xb0\x20\x13\x83\x3e\x9b\x77\x87\x9f\x7b\
-\x87\xe4\x19\x64\x62\xbe\x7c\x1a\x93\xdf\xd5\x27\x10\x81\x1f\x04\
-\xf1\xdf\x8d\x64\xa3\x70\x8e\x22\xc0\xf7\x1d\x3b\xc5\x00\x4f\x2e\
-\x9b\x7d\xfc\x10\xcb\x03\xc7\xcf\x20\xe8\xcf\xa2\x45\x7f\x1e\x41\
-\x7f\x81\xe9\xd8\xb9\x04\x84\xfd\x25\x38\x7d\x11\x95\x90\x08\x67\
-\x2e\x21\xec\xaf\x24\xc3\xc5\xe4\xeb\x90\x80\xb0\x4f\xbc\x9e\x8e\
-\xd6\x7d\x26\xa4\x64\x64\x43\x6a\x76\x1e\x1b\x7f\x9f\x53\x78\x13\
-\xf2\x6e\xde\x46\xe0\xe7\xb3\x99\x34\x8d\xf1\x83\xb9\x77\x06\x54\
-\x7a\x36\x7a\x2d\x40\xef\x4c\x3d\x2a\x2e\x1f\x1c\x37\xea\x7c\x83\
-\x99\x86\xc0\x9f\xe7\x13\x64\x6c\x53\x05\xfc\x4a\xba\x09\xc0\xef\
-\xdc\xcb\xed\x4d\x65\x58\x2c\x01\x7f\xdf\x63\x07\x3e\x3d\x6c\xa3\
-\xca\xa7\xe2\xde\x7e\x34\x03\x7f\x29\x02\x7f\x05\x02\x7f\xf9\x69\
-\x4e\x2b\x64\x64\x77\x4c\x0c\x74\xb9\xfd\x16\xbd\xbf\x1a\x81\x3f\
-\x63\x07\x7c\x62\xb6\xf0\xd5\x16\x0b\xdf\x6c\x61\x55\x01\xff\xe9\
-\x00\xbe\x28\x6d\xf4\x4e\x00\x5f\x6f\x0f\x7c\xdf\x60\x8b\xc5\x2f\
-\x00\xdf\x9b\x01\xdf\xc0\x01\x9f\x5e\xbc\xc3\xcf\x01\x23\xc6\xb0\
-\x51\x38\xa7\x10\xdc\x07\x4f\x9f\x81\x03\x27\x4f\xc3\xc1\x93\x08\
-\xf8\xd3\xe7\x98\xcb\x86\x13\x42\xfe\xec\x45\x38\x8e\x90\x27\x9d\
-\xbc\x70\x19\x41\x7f\x85\xb9\x6f\xce\x27\x26\xc3\x85\x2b\x29\x0c\
-\xf6\xe4\xc6\x61\xb0\x47\xcb\x3e\x39\x23\x0b\xae\xa1\x75\x9f\x86\
-\x80\xcf\xc8\x2b\x84\x9c\xa2\x9b\x90\x4f\xc0\xcf\xcd\x67\x53\x31\
-\x98\x81\xaf\x34\xb0\x7a\xc1\x96\xd6\x94\x4d\x8b\xf2\x04\x7e\x58\
-\x46\xa0\x31\x62\xb1\x6f\x70\x48\xdb\x2a\xe0\x57\xd2\xcd\xec\xd2\
-\x71\x47\xe0\x47\xc4\x46\xf8\xe9\xc2\xf6\x63\x01\x7b\xc8\x2a\x8f\
-\x41\x5a\xd6\x15\xcf\xa6\xc2\x39\x38\x47\xee\x18\x41\x95\x0a\xb6\
-\x17\x01\x9f\x2c\x7c\x63\x3f\x68\x39\x6a\x3e\x34\x58\x72\x12\xde\
-\x5f\x2e\x02\x7e\x05\xe9\xfd\x55\x02\xf0\x7f\x80\x2e\x2a\x23\xf4\
-\x0d\xd0\x70\xcb\x1a\x0a\xc0\x97\xb9\x3f\xa9\x86\xae\x5c\x25\x01\
-\x33\x49\x95\xf2\x7a\xec\xf2\xf1\x49\xc8\x41\xda\x3a\x3e\x97\x83\
-\xbd\xc2\x21\xf0\xc3\xac\x5c\x3b\x7e\x36\xd6\xbe\xe0\xe2\x61\xa2\
-\x37\x72\xe9\x25\x2c\x7a\x0f\xc4\x5b\x01\x7d\xd5\x3a\x18\x3c\xea\
-\x27\x36\xe1\xd9\xb9\x2b\x57\xe1\xe8\x79\xb4\xe0\xcf\x9e\x47\x0b\
-\x1e\xe1\x7e\xe1\x12\xb3\xe2\x05\x11\xe4\x4f\x5d\x4c\x64\xa0\x3f\
-\x7b\x89\xf3\xd5\x33\xd0\x27\x5d\x83\x84\xab\xd7\x99\x1b\x87\x60\
-\x9f\x94\x9a\x81\xb0\xcf\x66\xb0\xbf\x9e\x9d\x0b\x69\x68\xdd\xdb\
-\x02\x9f\x86\x7e\x1a\xe2\x06\xf1\x16\xbe\x81\xad\x0f\x21\x18\x1d\
-\x15\x5f\xc6\xc2\x32\x30\x3d\x97\xf8\x06\x85\xb4\xab\xf2\xe1\x57\
-\xd2\xcd\x0c\xfc\xde\x6e\x6f\x6a\x98\x4b\x27\x74\x9f\x19\xf8\x62\
-\xd8\x39\x0b\x23\x67\xc3\x58\x0a\x19\x93\x2f\x16\x6c\x2f\x9a\xc6\
-\x36\x20\x08\x3a\xe8\xe3\xa0\xe5\xc8\xb9\x08\xfc\xe3\x08\x7c\x84\
-\xf2\x32\xd2\x29\x4e\x4b\x4f\x59\xbe\x4b\x69\x69\x31\x92\x08\xfb\
-\xfe\x8a\x73\xd0\x68\xe6\x1f\xd0\xa6\xff\x68\xe8\xaa\x36\x81\x6b\
-\x00\x3f\x8f\x0e\x3f\x0e\x5f\x3e\x1d\xc2\x78\xd9\xde\x8f\x13\x69\
-\x23\x6a\xec\x02\x6c\xff\x43\x6f\xbb\xdf\x36\x8c\xdc\x39\x4e\x4a\
-\x36\x7f\x44\xf1\xca\xe4\xa3\xb9\x81\x70\xfa\xff\x1c\xdd\x87\xb3\
-\xe7\x4a\x5c\xaf\x38\x0f\x24\xe2\xe7\x40\x6f\x91\x14\xf0\x05\x8b\
-\x9f\x26\xed\xf3\xa5\x87\xb9\xf4\x02\x16\xf6\x30\xbb\xfb\x04\x32\
-\x7f\xfe\xd0\x31\xe3\x60\xd3\xee\xbd\x68\xa1\xa7\x30\x5f\xfc\x09\
-\xb3\x05\x9f\xc8\x74\x8a\x29\x89\x81\xfe\x0c\x03\x7d\x32\x73\xdf\
-\x5c\x48\x4a\xe1\x40\x9f\x9c\x6a\xb6\xec\x93\xc8\xb2\x4f\x47\xcb\
-\x3e\x2b\x97\xb9\x72\x04\xeb\x3e\x2b\xbf\x08\x72\x8b\x6e\x31\x97\
-\x4e\x6a\x4e\x1e\x7b\x99\x4b\x17\x33\x80\x5d\x87\xbb\x52\xcf\x80\
-\x2f\xf8\xf1\xa5\xd3\xd4\xd9\xb4\x77\x2a\xbd\x33\xb0\xd7\xb4\xd8\
-\x57\x53\x65\xe1\x57\xda\x4d\x18\xa5\xd3\xb9\xa7\xfb\x9b\xaa\xd0\
-\x98\x30\x3f\x9d\x69\x2f\x07\x7c\x9b\x4a\x64\x90\x87\x40\xd9\x81\
-\x1f\xca\x03\x5f\x87\xc0\xd7\x42\x07\x5d\x0c\xb4\x1c\x31\x07\x1a\
-\xfc\x86\xc0\x5f\x7a\xc6\x02\x6a\x07\xd0\x2e\x91\x64\x80\xff\xf1\
-\x80\xb1\xd0\x45\x13\x0a\xae\x34\x71\x1a\x4d\x4f\x4b\xd6\x95\x8e\
-\xbf\x77\x87\xc0\xb7\x05\xf1\x93\x00\x7e\x09\x2a\x76\x15\xf0\xed\
-\x81\x4f\x2f\x67\x69\x42\x10\xb4\x7a\xe8\xe1\xa3\x64\x23\x78\x86\
-\xfd\x32\x89\x2d\x73\x78\xf9\x5a\x1a\x9c\xbe\x74\x15\xe1\xce\x81\
-\xfd\xec\xe5\xab\xec\x41\x2c\x13\x5a\xf3\x1c\xe8\xd1\xa2\xbf\x4a\
-\xba\x0e\x09\xe4\xc2\x41\xd8\x27\x22\xec\xaf\x08\x96\x3d\xc2\x3e\
-\x85\x59\xf6\xf9\xcc\xb2\x4f\x67\xd6\x7d\x11\x64\x16\xdc\x80\xdc\
-\x1b\xb7\xd1\xc2\xbf\xc3\x1a\x01\x5a\x24\x45\x13\x11\x0f\x6e\x81\
-\x1c\xf0\xa9\x21\x72\x0c\x7c\x47\x69\x5a\x5c\x7a\xdb\x95\xab\x34\
-\xec\x39\x2d\xf0\xd1\x86\x54\xf9\xf0\x2b\xeb\x26\x00\xbf\x63\x2f\
-\xf7\x7f\x29\x4d\x31\x21\xfe\x3a\xd3\x6e\xcc\x78\x7b\xe0\xdb\x14\
-\x1a\xab\x2e\xb3\x48\xf2\x60\x92\xa8\x90\xe6\xdf\x62\xe0\xa3\x85\
-\xaf\x8d\x84\x96\xdf\xcf\x44\x0b\xff\x18\x02\xff\x14\xaf\x93\x8e\
-\xb5\xe4\xa4\x08\xea\xb6\xfb\xed\x65\x75\xee\xf2\x33\xf0\x01\x02\
-\xbf\xf5\xa0\x71\xd0\x59\x1b\x2e\x03\xfc\xd2\xc8\x99\x4a\x5a\x32\
-\xd9\xba\x2b\x9e\x96\xeb\x72\x26\x3e\xeb\x6b\x2e\x49\xe3\x20\xf1\
-\x1f\x56\x8d\xad\x75\xfc\x16\x57\x8e\x34\xf0\xad\x64\x03\xfc\xbe\
-\x34\x89\x9a\xaf\x92\x2d\x8e\x3e\x7a\xd2\x0c\xd8\x75\xe8\x18\x5c\
-\x41\x60\x9f\x43\xa0\x13\xdc\xc9\x82\x67\x4a\x4c\xb6\xf8\xe8\xaf\
-\x5e\xe3\x86\x5b\x32\x5f\x7d\x2a\x6b\x20\x48\x02\xec\xaf\xa6\x67\
-\x22\xec\xb3\x39\xeb\x3e\xa7\x80\x03\x3e\x5a\xf7\x0c\xf8\xf9\x3c\
-\xf0\x6f\xdd\x85\x34\xb4\xfc\x17\xaf\xde\x00\xca\xd0\x18\xf6\xc6\
-\x39\x03\x7e\x30\x0f\x7c\x27\x1b\x51\xc9\x72\x61\xb0\x4e\x3b\xd9\
-\xfa\xaa\x0b\x4f\x55\x18\x22\xe6\xa0\x85\xff\x71\xd5\x38\xfc\x4a\
-\xba\x99\x5d\x3a\x3d\xdd\xff\xa9\x0e\x89\xd1\xf9\x05\x99\x76\x62\
-\x41\x78\x28\x55\x70\xe4\x20\x2f\x07\x20\xdb\xfd\xf2\xe1\x43\xb9\
-\x2e\x35\x01\xdf\x4f\x0b\x9d\x54\x61\xd0\xea\xbb\x69\xd0\x60\xf1\
-\x51\x04\xf6\x29\x06\xed\x52\xe9\x37\x91\x1c\x84\xab\xbf\xec\x0c\
-\x34\x9c\xb9\x0b\x3e\xfa\x7a\x22\x74\x0a\x8e\x82\xbe\x08\x7c\x5a\
-\x57\xd7\x52\xd9\x9c\x4f\x03\xb9\x0a\xe5\x4c\x18\x47\xf1\x4b\x1e\
-\x17\x01\xcd\x99\xbc\xb1\x48\xc2\xcf\xed\xcc\xff\x95\xf0\x9e\x4b\
-\x7a\x3f\x52\xe1\x1d\xc6\x63\xe0\x65\x4e\x83\x50\x36\x5b\xa6\x9f\
-\x5d\xfa\xc8\xc0\x9e\x01\x9f\x13\x59\xfb\xcc\xa5\x43\x8b\xa3\xf8\
-\xa9\x40\x61\x8a\x82\xf1\xb3\xe6\xc3\xfe\x13\xa7\xd8\x83\x56\xb2\
-\xdc\x2f\x90\x05\x9f\x7c\xcd\x0c\x78\x66\xcd\xf3\x3e\x7a\x6e\xb8\
-\x25\x07\x79\x6a\x20\x48\xc2\x03\x5a\xce\xb2\xcf\x43\xd8\xe7\xf3\
-\x7e\x7b\xce\x77\x9f\x99\x5f\x04\x59\x68\xe1\x93\x3b\xa7\xe0\xf6\
-\x5d\x48\xcd\xce\x85\x05\x2b\xd6\x81\x9f\x21\x02\xfa\x28\x82\xd8\
-\xdb\xb6\x7e\x64\xe1\xeb\x4a\x62\x10\x94\x2c\xaf\xac\xf6\xeb\xc2\
-\xae\xfb\xeb\xc2\x67\x79\xab\x8d\xad\xaa\x2c\xfc\x4a\xba\x59\x7c\
-\xf8\x08\xfc\xb0\x18\x2d\x5a\x3b\x3b\x9e\x2c\xf0\x35\xd0\x39\x30\
-\x04\x5a\x0d\x9d\x0c\x0d\x16\x1d\xe5\xac\xfb\xdf\x4e\xda\x4b\x0a\
-\xea\xbf\xc9\xec\x93\x82\xbe\x68\x7f\xfd\xa5\x08\xfc\xd9\x7b\xa0\
-\xe5\x77\xd3\xa1\xa3\x3e\x16\x2d\x7c\x2d\x5e\x0b\x75\xa7\x43\xb8\
-\x37\x1d\xcb\x50\xa1\xaa\x80\x5f\x81\xc0\xb7\x4a\x07\x7e\x08\xa6\
-\xde\xa2\x92\x00\xdf\x8f\x07\x7e\x5f\x45\x30\x5b\xfc\x46\x13\x19\
-\xcf\x56\xaf\xa2\x71\xf5\xc9\x99\x59\xcc\x62\x4f\x48\x4e\x65\x7e\
-\x79\x9a\x16\xe1\x92\xf0\x3d\x39\x0d\x12\xaf\x21\xe4\xaf\x67\x70\
-\xd6\x7c\x6a\x26\x82\x3e\x0b\x92\xd3\xb3\xd9\x03\x5a\xb2\xec\xaf\
-\xa3\x65\x4f\xae\x1c\xb2\xee\xd3\x73\x0b\x79\xeb\xbe\x90\xc1\x3e\
-\x8b\x0d\xc9\xbc\x03\xf9\x08\xfc\x6b\xd9\xb9\x30\x67\xe9\x2a\xb6\
-\x2e\x6f\xef\x00\x31\xf0\xad\xcb\x60\xc5\x01\x3f\x34\x05\x81\x3f\
-\xcd\x47\x6b\xfc\xa8\xea\xa1\x6d\x25\xdd\xcc\x6f\xda\xf6\x76\x7b\
-\x5d\x19\x16\xa3\xf4\xd5\x99\xb6\xa1\xa5\xf4\x50\x18\xd2\x66\x91\
-\x34\x60\x4a\x04\x21\xa9\xf3\xc9\x7a\xd1\x71\xbe\x54\x2f\x55\x30\
-\x02\x5f\x05\x9d\x03\x74\xd0\x7a\xf0\xaf\xd0\x60\xfe\x21\x04\xb2\
-\x00\xfc\x13\x9c\x16\xa3\x16\x1d\xb7\xfc\x96\xd3\x62\x09\xc9\x84\
-\xad\xbf\xf4\x34\x34\x9c\xb3\x17\x3e\x1c\x39\x0f\x3a\x86\x0c\x60\
-\xc0\xf7\x54\xd9\x03\xbf\x54\x90\x2d\x35\x94\x1d\xc4\xa1\x93\x50\
-\x79\xc4\x2b\xb5\x5f\x7c\x8c\x87\x2a\x93\xa3\xf0\x25\x89\x93\xc9\
-\xa6\x9c\x39\xba\x4e\xbb\x6b\x72\xe0\xae\x91\x80\x3a\x27\x13\x2f\
-\xeb\x30\xf4\xee\x45\x5f\x04\x6d\x6f\xcc\x7f\x43\xdc\x57\xb0\x60\
-\xd5\x06\xf6\x60\x36\x25\x23\x87\x3d\x78\xe5\x5c\x35\xe9\xbc\xf8\
-\xef\x29\xe9\x78\x8c\x60\x9f\x09\x49\x08\xfa\xab\x69\x39\x3c\xe8\
-\x73\xcc\xe2\x5c\x39\x3c\xf0\xf3\x2c\xc0\xcf\x2c\xe4\x80\x9f\x8b\
-\xc0\xcf\xbb\x75\x07\x92\xd2\xb3\x58\x23\xe3\x4a\xcb\x30\x52\x19\
-\x54\xf3\xbd\x4c\xbe\x0c\x4a\xe6\x83\xae\x98\x74\x92\x2a\x33\xf2\
-\xe5\x21\x39\x40\x1f\x3e\xd1\x5b\xad\xff\xb0\x6a\x89\xc3\x4a\xba\
-\x89\xa6\x56\xf8\x87\x2a\x24\xca\x0f\x21\xb7\x09\x0b\xd2\x43\xeb\
-\x42\x65\x5d\x81\xcc\x05\x4d\x17\xe6\x64\x18\xfb\xb0\x56\xfb\xa8\
-\x4b\x4d\xc3\xe2\x68\x94\x0e\xcd\x47\xee\x1f\x0c\xad\x06\xfe\x0c\
-\x0d\x66\xef\x83\xfa\x66\x60\x1f\xb7\x68\xd1\x71\xeb\xdf\x65\x54\
-\x7d\x6c\x54\x1a\xcc\x3d\x00\xcd\xc6\x2c\x85\x2f\x43\xbf\x62\x0f\
-\x8e\x3d\x69\x3d\x5b\x5a\x00\x45\x67\x02\xdb\xb4\x90\x93\x9f\x93\
-\xe1\x1c\x85\xf7\x93\xd8\xef\x5c\xbc\xf6\xe9\x2c\x15\x57\x71\xd7\
-\xe3\x67\x8e\xab\x64\xf7\x52\xdc\x3d\x38\x2a\x4f\xce\x5f\xa7\xfc\
-\x3d\x96\x16\xf8\xbe\xbc\xff\xde\x37\x38\x04\xbc\x68\x6a\x05\xcc\
-\x7b\xb2\xae\xc3\x07\x7e\x03\xab\xb7\xfc\x01\xe7\x92\x52\x98\x95\
-\x4e\xa3\x6c\x12\xd1\x82\x4f\x4c\x15\x7f\x66\x72\xb0\x47\xd0\x13\
-\xac\xaf\x22\xe8\x93\x19\xe4\x73\x21\x25\x8b\xd3\x35\x72\xe5\x90\
-\x75\x9f\x4b\xbe\x7b\x1e\xf6\xf9\x45\x4c\x04\x7c\x52\xde\x8d\xbb\
-\x0c\xfa\x17\xb1\xc7\x30\x61\xf6\x02\xe8\x15\xa0\x41\xe0\x73\xef\
-\x82\xd0\x75\xd9\xde\xbb\x54\x9a\x39\xba\x7f\xb9\x74\x94\x48\xa7\
-\xa4\x00\x43\xf8\x38\x4f\x8d\xb1\x6a\xb6\xcc\xca\xba\x09\xf3\xe1\
-\x77\xee\xd5\xe7\x35\xa5\x29\xca\x1d\xc1\xbb\x5e\x0c\x7c\xf9\x02\
-\xe4\xb8\xe2\xc9\x35\x0a\x52\xc0\x17\x86\xc5\x79\x32\x97\x0e\x02\
-\xdf\x4f\x0b\xad\xe3\x47\x43\x83\xe9\x3b\xa0\xfe\xa2\x63\xbc\xc5\
-\xce\x83\xde\x56\xb6\x0d\x81\xdc\x31\xb9\xf3\x17\x11\xf0\xb1\x07\
-\x31\xff\x30\x34\x1d\xb7\x0e\xda\x87\x0f\x45\x0b\x4f\x03\x1e\xd8\
-\xf8\xf8\xf0\x15\xae\xa4\x00\x73\x16\x70\xce\x00\xbf\x34\x30\x2c\
-\x1d\x4c\xe5\x81\xef\x08\x30\x25\x4d\x87\xf2\x04\xbe\x53\xb0\xd7\
-\x49\x80\x5e\x27\x01\x7c\x5a\x0e\x91\x56\xbe\xc2\xbc\xef\xa3\x08\
-\x86\xd8\xa1\x23\x60\xfb\x81\xc3\xcc\xb2\x27\x8b\x3d\x39\x2d\x9b\
-\x03\x3b\xea\x0a\xc2\x9f\xb3\xe8\x39\x5d\x4d\xcf\x16\xc1\xde\x02\
-\xfc\x6b\x59\x79\x9c\x2b\x07\x61\xcf\x01\x9f\xf3\xdd\x33\xd8\xf3\
-\xee\x1c\xc1\xa5\x93\x5d\x74\x0b\x4e\x5c\xb8\x04\x63\xa7\xcc\x60\
-\xc0\xef\x49\xc0\xa7\x65\x0e\xb5\xdc\xb5\x3a\x04\x75\x31\x12\xa7\
-\xb9\x63\xe0\x9b\x2e\xf9\xe9\xc3\x46\x79\x68\x8c\x4d\xab\x80\x5f\
-\x49\x37\x01\xf8\x5f\x74\x73\x7b\x35\xc0\x18\xd5\xd3\x27\x28\x64\
-\x25\x66\xfe\xc3\x92\x14\x22\x47\x95\x4c\x36\x9c\xb8\x3b\xad\xa3\
-\x17\x5f\x38\xe0\xbb\xfa\xa9\xa0\x0b\x42\xbf\x4d\xf4\x70\xf8\x60\
-\xc2\x06\xa8\xbf\xe0\x08\x03\x32\x81\x9f\x69\xa1\x48\xd4\x18\xe0\
-\xe7\xfb\x8b\x38\xd5\x5f\x78\x9c\x97\x75\x18\xcb\xb9\xc7\xa5\xf7\
-\x53\x0f\x62\xe1\x11\x68\x34\x65\x0b\x7c\x16\x33\x1c\x2b\x5b\x10\
-\xb8\xb3\x15\xaf\x38\xe0\xfb\x06\x4b\x00\x49\x6c\x31\x96\xb0\x02\
-\x96\x4a\x42\x7a\x06\x4b\x55\xe0\x12\x58\xbb\x65\x54\xb9\xfd\x97\
-\x44\xfa\xf9\xcb\xec\xb7\xbf\x86\x92\x43\xcf\x62\xd5\xf3\xc0\xd7\
-\x09\xa3\x73\xf8\x97\xb0\x78\xe0\xf7\xf4\x55\x81\x9b\x4a\x0f\x83\
-\x7f\xf8\x89\xf9\xef\xc9\x42\x4f\xce\xc8\x81\xe4\xf4\x5c\xee\x53\
-\x10\x59\xf4\xe4\xc2\x49\xcf\xe6\x00\x9f\x21\xb2\xea\x79\xd0\x5f\
-\x17\x3e\x05\xe0\xe7\x71\x43\x31\x19\xf0\xf3\x11\xf8\xf9\x37\x99\
-\xf2\x6e\xde\xc5\xfd\x37\x60\xef\xd1\x53\xf0\xfd\x2f\x13\x19\xec\
-\x7b\xfa\x59\x03\xdf\x3a\xed\x4b\x73\xff\x4e\x94\xd7\xe0\xd0\x0b\
-\x18\xff\x37\x1e\x2a\x7d\xc3\x2a\xe0\x57\xd2\x4d\x00\x7e\x07\x97\
-\xde\x7f\x55\x84\x44\x74\xf6\xd5\x1a\x97\xa2\xc5\xf3\x00\x0b\xd9\
-\x23\xd9\x02\x23\x57\x78\x1c\x1d\x77\x74\xbe\xf0\xa6\x23\x03\xbe\
-\x1a\xba\xfa\xa8\xe0\x13\xb4\xb4\x1b\xfd\xb4\x02\xea\xcf\x3b\x04\
-\xf5\x08\xf8\x02\xa8\x17\xd8\x48\x0c\x77\x47\xfb\xe4\xce\x5b\x60\
-\x69\x28\x68\xa4\x4e\xdb\x7e\x3f\x42\xf7\x40\x3d\xb8\xa1\x95\x47\
-\x5d\x7c\xba\x2e\xa7\xee\xa7\x24\x69\x25\x77\xdc\x61\x1a\x95\x30\
-\xbc\x33\x15\xde\xd1\x7f\x38\x73\x3f\xa5\x6d\xf0\xca\x7a\x2f\xa5\
-\x81\x9a\x18\xf8\x66\x37\x8e\xc9\x1c\x9e\x0c\x0e\x5a\xe5\x8c\x40\
-\xeb\x83\x40\x1d\x39\x6e\x0a\x1b\x6f\x9f\x9e\x5f\x08\x57\xd1\x6a\
-\x4f\x26\xa8\x67\xe6\x71\x70\xcf\x14\xe0\x9f\xcd\x3e\xad\x5c\x38\
-\x08\xf9\x6b\x04\xf9\x9c\x02\xb3\x52\xf3\x48\x85\x08\xfc\x22\x8c\
-\xef\x06\x53\x06\x2a\x13\x61\xcf\x86\x65\xa2\x85\x4f\xfe\xfd\xcd\
-\xbb\x0f\xb2\x86\xc6\x05\xaf\xa1\x17\x03\xbe\x81\xf5\x3c\x7c\x6d\
-\x9f\x37\x94\xa6\x0c\x39\x91\xbe\xbe\x3a\xd3\x19\x5f\x5d\x68\x7f\
-\x4f\x85\xae\x5e\x95\x0f\xbf\x92\x6e\xe6\x25\x0e\x5d\x5c\xfe\x12\
-\x18\x12\xf1\xa9\x6f\x90\x71\x1e\x56\x88\x3b\x8f\x13\xf8\xbe\x02\
-\xf0\x55\x7a\x36\x06\xbe\xab\xb7\x12\xda\x1a\x07\x41\xe3\x1f\x16\
-\x41\xfd\xb9\x07\x11\xf8\xa7\x1c\xc3\xdb\x99\x46\xa0\xd8\x73\x8e\
-\x43\x83\x59\x7b\xe1\xe3\xc1\x13\xa0\xab\x26\x82\x8d\xd6\xa0\xa9\
-\x1e\x08\x04\x7e\x22\x30\x54\x01\xdf\xc9\xff\xfb\xd3\x01\x3f\x84\
-\x01\xbf\xb7\x9f\x06\x34\xe1\x71\x30\x61\xd6\x02\xb8\x90\x7c\x8d\
-\x03\x7e\x16\xc2\x3d\x8b\x07\x7e\x96\x05\xee\xb4\x2f\x99\x6f\x00\
-\xc4\x3e\xfb\xeb\x22\xe0\x73\xee\x9c\x42\x06\x7c\x92\x18\xf8\x82\
-\x72\x6e\xdc\x61\x71\xaf\xd8\xfc\x07\xc4\x7c\x33\x02\xba\x63\x2f\
-\xa3\x17\x0d\x0d\x46\xe0\xd3\xba\xca\xbe\x41\x15\x0e\xfc\x47\x7c\
-\x3d\x3c\x89\xfb\x22\xdc\x02\x82\xde\xad\x59\x05\xfc\xca\xb9\x09\
-\xc0\x6f\xdb\xa3\xc7\x0b\x01\x86\xf0\x96\x68\x51\x4c\xc1\x8c\x2f\
-\xc0\x6e\xee\x03\xdb\xc2\xe1\x2b\x51\x51\x1c\xed\x97\x86\x8b\xc9\
-\x5e\x6c\xdd\x51\x0b\xf0\xbb\x7b\x07\xc2\xa7\xc1\xb1\xd0\xf4\xbb\
-\x59\xf0\xfe\xec\x7d\x1c\xf0\x17\x1c\x95\xd7\x7c\x5e\x8e\x8e\x39\
-\x0a\x43\x22\xe0\xcf\xd9\x0f\x2d\x87\xcd\x82\x0e\xc6\xfe\xcc\x8f\
-\xeb\x89\x96\xbe\xb7\x2d\xf0\xad\xfc\xc0\xf6\xf7\x29\x4e\x0b\xc9\
-\xf4\xb0\x4b\x03\xe9\x8a\x68\x15\x87\x4e\x2e\x4e\xb9\x78\x44\x6e\
-\x0b\x9d\xed\xb5\xca\x9c\xe3\x00\x22\xc5\xfd\xb7\xe5\x98\xad\x9c\
-\x81\x8e\xd4\x79\xd2\xe5\x4b\xee\xba\x6d\xd3\xdc\x61\x1e\xe8\xac\
-\xaf\x59\x90\x77\x30\x02\x3f\x50\x07\x7d\xfc\xb5\x10\x36\xe0\x1b\
-\x98\xb7\x7c\x2d\x24\xa4\xa4\x23\x9c\x8b\x38\xb0\xa3\xe5\x9e\x92\
-\x4d\xc0\xcf\x83\xe4\x6c\xcb\x77\x8b\x08\xf8\xf9\x1c\xf0\xc5\xd6\
-\x3d\xc1\x5e\x10\x59\xf9\xf9\x45\x2c\x4e\x06\xfd\x82\x9b\x66\xe0\
-\x5f\x49\xcf\x86\xf9\xab\x36\x40\xc8\x80\xa1\xd0\xdd\x47\x89\xd7\
-\x21\x02\xbe\x43\x0b\xdf\x41\x19\x28\x56\x7c\xd8\xa0\xd0\x47\xf8\
-\x1f\xa4\x43\x7e\xba\x10\xad\x7b\xa0\xfe\xad\x9a\x55\x2e\x9d\xca\
-\xb9\x99\x5d\x3a\x5d\xbb\x3d\x17\xa0\x0b\x6f\xe8\xad\x0e\x19\x8b\
-\x16\x45\x16\xea\x7e\x71\x15\xc9\x4e\x41\xb6\x15\x4d\x1a\x08\x76\
-\x61\x44\xc0\x77\x0b\xd0\x42\x0f\x4f\x7f\xf8\x5c\x15\x0e\xcd\x07\
-\x4f\x84\x06\x33\xf7\x22\xf0\x4f\x23\xac\x8f\xf0\x92\x80\x78\x59\
-\xc5\x03\xbf\xfe\xbc\x83\xd0\xec\xc7\xdf\xe0\xf3\xc8\x6f\xd9\x1b\
-\xbf\x9e\x81\x41\x0c\xf8\xe6\x6b\x0d\x92\xbb\x87\xe2\xa1\x53\x16\
-\x49\x01\xaa\xa4\xe7\xcb\xa5\x7d\x85\x5c\x73\x90\x54\x59\x28\x7b\
-\x1a\x59\xdd\x43\x50\xd9\xe3\x11\xdf\x3f\x0d\xc9\xa4\x90\xf7\x75\
-\x62\x00\x00\x20\x00\x49\x44\x41\x54\x97\xae\x5c\xb1\xa1\x1f\x38\
-\xfc\x47\x58\xbb\x7d\x37\x24\xa6\x66\x31\x37\x0c\xb9\x68\x98\x72\
-\xf2\x21\x05\x45\xc0\x37\x43\xdf\x2c\x3a\x5e\xc0\xc4\x60\x8f\x80\
-\x17\x8b\x83\x7e\x11\x8b\x4f\x70\xed\x10\xf0\xe9\x33\xe7\xe6\x1d\
-\xb8\x8c\xff\x35\x65\xfe\x52\x50\x47\xc4\x43\x37\xaf\x40\x2c\x7f\
-\x34\x81\x1f\x19\x1c\x46\x87\x79\x28\x57\xaf\x4a\x98\x16\x0f\xd1\
-\xd0\x7b\xe0\xa3\x0d\xd9\x8d\xfb\xbc\x5c\x15\xfa\x37\xaa\x80\x5f\
-\x49\xb7\x1a\xd5\xb9\x77\x2b\xba\x7e\xf6\xd9\x33\xfe\x46\xd3\xdb\
-\x98\xe9\xdf\x62\xe6\x5f\xc3\x0a\x75\xaf\xec\x95\xdc\x59\xe0\x87\
-\xb0\x2e\xb5\x17\x5a\x34\x6e\x0a\x0d\xb8\x78\xf8\xc2\x17\xfe\xc1\
-\xf0\x51\xdc\x18\x68\x30\x63\x0f\xd4\x5b\x72\xc6\x1e\xf8\xf3\x78\
-\x49\xfd\xb6\x3d\x36\x5f\x26\x9c\x15\xf4\x8f\x41\x3d\x8c\xbf\xd1\
-\xaf\xeb\xa1\x6d\xff\x31\x6c\xa4\x84\x87\x42\xcb\x56\x42\x12\xee\
-\xaf\x58\xe0\x4b\xa4\x81\xd3\xe9\xe6\xe0\xbc\x32\x81\xd9\xe1\x75\
-\x17\x73\x5d\xa5\xbc\xde\xc7\x06\x7c\xdb\xff\x71\x74\x5d\xa2\xf0\
-\xe2\x9e\x25\xfd\xf6\xa1\x05\x50\xb0\xec\xf5\xc5\x06\x9e\xa6\x56\
-\x18\x39\x61\x2a\xec\x3f\x79\x86\x59\xee\xb6\xc0\x97\x82\xfe\xb5\
-\xec\x3c\xfe\x78\x81\x05\xfa\x52\xc0\xcf\xb3\x01\x3e\xef\xde\xc9\
-\xb9\x71\x17\x12\x92\xd3\x60\xf4\xa4\xe9\xe0\x89\xf5\xa0\xab\x67\
-\x80\x35\xf0\x25\xae\x59\x7c\xaf\x4e\x03\x5f\xb6\x8e\x86\x3c\xc4\
-\xef\x77\xf0\xd8\x66\xac\xff\xdd\x7b\x29\x14\xaf\x56\xb9\x74\x2a\
-\xe9\x26\x58\xf8\xff\xe7\xe5\x59\xa3\x8f\xc1\xf8\x8a\x9f\xd6\x18\
-\xe3\x13\x64\x4a\xf0\xd5\xb2\x02\x50\x7c\xa5\x2f\xab\x58\x7c\x1c\
-\xf0\xbd\x35\x46\x70\x57\x04\x41\x4f\x77\x1f\xe8\xe0\xad\x82\x56\
-\xe1\xdf\x42\x83\x29\xdb\xa1\xee\xa2\xd3\x50\x6f\x1e\xc2\x7e\x2e\
-\xaf\x79\xbc\x44\xbf\xeb\xf1\x62\x8d\xc2\x3c\x9b\x7d\x7c\x58\xdb\
-\xdf\x62\xd5\x43\xe0\xd7\x45\x2b\xff\xfd\x69\x3b\xa0\xd5\xd7\x93\
-\xa1\x07\x76\xef\xdd\x02\xb8\xb1\xd0\x3e\x9a\x10\xee\xe1\x99\xdd\
-\x75\x3b\xba\x27\x99\xfd\xc5\x01\x54\x2e\xbc\xb3\xf1\x15\x17\xd6\
-\xd9\x6b\x75\x36\xef\x4a\x5b\x26\x8a\x3b\xaf\x24\xe5\x4e\x0e\x68\
-\x4e\x84\x47\xc0\x61\xef\xd2\xc8\x46\xe8\xb8\x62\xd9\xa3\x05\xd0\
-\x27\xcf\xff\x0d\xce\x25\x5d\x33\x43\x5a\x00\xbd\x58\x29\xbc\x38\
-\xc0\x5b\x7c\xf6\xd7\x44\xee\x9c\xeb\x39\x22\xe0\xe7\x09\xe2\xa1\
-\x4f\xb0\x27\x0b\x1f\x95\x59\x78\x0b\x4e\x5d\x4a\x82\xc1\xa3\x7e\
-\x06\x17\x7a\x86\xe5\x11\xc0\xde\x07\xa0\x37\x7f\x7d\x84\x72\x57\
-\x5e\x69\x25\x7d\xfe\x43\x5f\x6d\xc8\x0d\x2c\xe3\x2b\x7c\x83\x8c\
-\x9f\xb8\xfa\x05\xbf\x54\x65\xe1\x57\xd6\x0d\x2d\xfc\xea\xf4\x0a\
-\xf5\x9b\x6f\x56\xfb\x3f\x53\xf8\x33\x4a\x4d\x88\xde\x5b\x1b\x72\
-\xd2\x47\x6b\xbc\x65\x07\x39\xb3\x42\x44\x12\x17\x9c\x10\x9b\x63\
-\x72\xe7\x5b\xcb\x47\x04\x7c\x37\xb4\xb2\x7a\x79\xf8\x41\x47\x0f\
-\x05\xb4\xd6\x0f\x84\x86\xe3\x36\x40\xdd\x05\xc7\x11\xd4\x68\x81\
-\x33\x38\x1f\x36\xab\x5e\x39\xc8\x1c\x17\x5a\xfd\x75\x17\x9c\x80\
-\xfa\xb3\xf6\x41\x8b\xe1\xf3\xa0\x73\x50\x24\x02\x40\xcb\x5e\x06\
-\xf3\x31\x57\x3c\x39\x39\x53\xb1\x9c\x39\xa7\xa4\x71\x3a\x73\x7e\
-\x59\xe3\x94\x83\x4b\x88\x45\x65\xba\xbe\x92\x9c\x57\xc2\x6b\xb4\
-\x2a\x63\x16\x89\xaf\x83\x95\x3b\x04\x3e\x59\xf7\xee\x08\x7d\x7d\
-\xec\x40\x58\xbc\x76\x13\x5c\xcd\xcc\x65\x50\x96\x03\xbe\xd8\x9a\
-\xb7\xa8\x90\x49\xec\xc3\xe7\x80\x5f\x04\xd7\x45\xc0\x4f\x15\x01\
-\x3f\xa3\xe0\x16\x3b\xbe\xef\xf8\x59\x88\x1e\x3a\x9c\x2d\xa0\x4e\
-\xc0\xa7\xc6\x87\x03\x7e\x39\xe4\x59\xb1\xf9\x40\xee\x1c\x63\x01\
-\xd6\xbf\xf9\x0a\x6d\x64\x03\x7f\xdf\xe8\x5a\xb5\x6a\xd5\xae\x9a\
-\x56\xa1\xb2\x6e\xd5\xab\x73\x7e\x9d\xd7\xff\xf5\x66\xad\xc0\x90\
-\x28\xa5\xb7\xc6\xb0\x9f\x6f\xf1\x65\x2a\x5a\x05\x00\x9f\x16\x92\
-\xe6\x27\xaf\xea\x85\x5d\xda\xce\xee\x01\xd0\x46\x13\x03\x1f\x8c\
-\x5a\x02\xf5\xe6\x1c\x80\x7a\xf3\x9d\x05\xfe\xa1\xd2\xc1\x1f\xad\
-\xfe\xba\xf8\x1f\x75\xe7\x1c\x82\x26\x3f\xae\x84\xcf\xc3\x87\x42\
-\x4f\xec\xde\x7b\x2a\x34\x1c\xf0\xb5\x4f\x2b\xf0\x8b\xbb\xa6\xff\
-\x41\xe0\x4b\x96\x31\x19\xe0\xf3\x16\x3e\xbd\x70\x45\xee\x3b\xb2\
-\xb2\x37\xed\x39\xc4\x20\x4c\x50\xbe\xce\x80\x2f\x05\x77\x79\xe0\
-\x5b\x59\xf9\xb9\x05\x3c\xf0\x8b\xcc\xb0\xe7\x74\x03\xd2\x0a\xe8\
-\x4d\xdb\xdb\x90\x98\x9a\x0d\xeb\x76\xec\x05\x43\xfc\x10\xe8\xec\
-\xe1\x0f\xdd\x3d\x15\x8f\x19\xf8\xa6\x07\x58\xc6\x73\xfc\x82\x43\
-\xa6\xf4\x71\x57\xff\xeb\xa5\x17\x3d\x90\x06\xb5\x78\x2a\x54\x6d\
-\x95\x6e\x13\x80\xff\xc6\xbf\xfe\x5d\x5b\x19\x12\xe5\x8e\x2d\xfd\
-\x06\xac\x08\xf9\x7c\xa1\x78\x24\x0f\x95\x92\x48\xbe\xc0\x91\x0f\
-\x95\xa6\x31\xa0\x07\x67\x6c\xa4\x84\x57\x20\x74\x71\xf7\x83\x76\
-\x0a\x13\x34\x19\x3a\x13\xea\x4d\xdb\xc5\x5b\xf9\x47\x10\xfe\x3c\
-\xd0\xe7\x48\xe9\x90\x45\x02\xc8\xe7\x58\x3e\xeb\xcf\xb1\xfe\x6d\
-\x2d\x04\xfe\xdc\xa3\x50\x67\xfe\x71\xf8\x60\xd2\x16\x68\xd3\x1f\
-\xbb\xd7\xaa\x10\xf0\xf0\x0d\x64\xa3\x25\x1c\x03\xdf\xf1\xfd\x39\
-\x06\xb3\xa3\xf8\xca\x23\xdd\x1f\xb7\x9c\x69\x8c\x9c\x0d\xef\x6c\
-\x3c\xce\x9f\x6f\xdb\x53\x13\x80\xef\x42\x53\x22\xeb\xc2\x60\xfc\
-\xac\x05\x70\xe8\xcc\x45\xb4\xbe\x6f\x41\x2a\x01\x3f\xb7\x50\x04\
-\xf2\x42\x19\xc0\xdb\xec\xa7\x73\x44\x12\x80\x2f\x96\x60\xe5\x67\
-\xdf\xb8\x07\x67\xaf\xa4\xc2\x9c\x65\xeb\x41\x19\x16\x07\x9d\xdd\
-\xfc\xc0\xc5\x5b\x09\x6e\x0a\x1d\x9b\xae\xd9\xc7\xe9\xb4\x2a\x83\
-\xb4\x21\xf7\xb1\xee\x25\xab\x42\x63\x46\x37\xf9\xf0\xe3\xd7\x88\
-\x05\xc2\xa4\x8a\x55\x5b\x25\xdc\x6a\xf0\x7e\xfc\xd7\xff\xf5\xef\
-\x9a\x08\xfc\x1e\xde\x1a\xfd\x32\x2c\x54\x39\x7c\x81\x28\x27\xe0\
-\xcb\x8b\x73\xe9\x18\x99\x45\xe3\x41\x2f\x5f\x61\xe5\xeb\xee\xe6\
-\x0b\x9f\x7b\x6b\xa0\x79\xfc\xcf\xf0\xfe\x84\x2d\x50\x67\xe1\x29\
-\x04\xf5\x51\xa8\x37\xfb\x90\xb5\x04\xc0\x4b\xed\x93\x3a\x26\x75\
-\xbe\xf0\x1d\x1b\x82\x3a\x0b\x4f\xc2\xfb\xd3\xf7\x42\xcb\xef\x66\
-\x41\xd7\xa0\x48\x70\xf7\x0e\x60\x2f\x84\x11\x14\x8a\x87\x7e\x79\
-\x02\xf3\x71\x42\xfa\x7f\x53\x0c\xf6\x54\xe6\x54\x7a\x70\xf1\x51\
-\x82\x3a\x3c\x0e\x7e\x5b\xbf\x19\x2e\x5e\x4b\x87\xcc\xa2\x3b\xcc\
-\x0a\xb7\x03\x3e\x83\x78\x31\xc0\xcf\x91\x00\x3e\x4a\x0c\xff\x6b\
-\x6c\x88\xe6\x0d\xc8\xbb\xfd\x00\x8e\x9e\x4f\x84\xb1\x53\xe6\x82\
-\x07\x5e\x4f\xc7\xbe\x3e\xd0\xcb\x57\xcd\x56\xbc\xf2\xd6\x3c\xae\
-\xb4\x30\xde\xf3\x52\xeb\xcf\x28\x43\x63\x06\x37\x69\xf9\xf1\x2b\
-\x3c\x13\xaa\x80\x5f\x19\x37\xa1\xdb\xf6\x8f\xbf\xbf\x56\xbd\xf1\
-\x47\xad\x9e\xf7\xd7\x85\x7b\xfb\x68\x0c\x9b\xb0\x10\x94\xb3\x85\
-\xef\xa0\xe2\xf1\xf2\x12\x1e\x9e\x05\x68\xa0\x87\x9b\x0f\x7c\x89\
-\xd6\x4e\xcb\xd0\xef\xa0\xe1\x4f\xeb\xa1\xee\xc2\x33\xce\x03\xdf\
-\x99\x63\x92\xe1\x11\xf8\xf3\x4f\x42\xbd\x59\x87\xa0\xc9\x98\xe5\
-\xdc\x44\x6a\x7e\x2a\xf0\x0c\xd4\x82\x37\xbd\x75\x5b\x05\xfc\x3f\
-\xa7\xb4\x22\x89\xcb\x9d\x96\x9b\x30\xcd\x35\x40\xcb\x5c\x89\x31\
-\x5f\x0f\x87\x6d\xfb\x8f\x40\x0a\x42\x5b\x00\xbe\x19\xe8\xd9\x85\
-\xd6\x20\xcf\x71\xd2\xf2\xe7\x21\x6f\x07\xff\x1c\x0e\xf8\x05\x77\
-\x1f\xc0\xbe\x13\xa7\x61\xe0\xc8\xb1\xd0\xc3\x47\x0d\x5f\xf6\xf1\
-\x66\x63\xf0\xdd\xb1\x11\x7a\x0c\xc0\x17\xea\xf6\x5d\x6f\xad\xfe\
-\x68\x80\x31\xb2\xdf\xe7\x1d\x7a\xbc\xf6\x9f\xb7\xde\xaa\x56\xb3\
-\x66\xcd\x2a\xe0\x57\xa6\xad\x7a\xf5\x1a\xd5\x04\x27\xdd\x5f\xff\
-\xf2\x97\x6a\x3e\x01\xaa\x57\x55\xe1\x51\x3d\x10\xf6\xd3\xb1\x62\
-\x24\xf9\x68\x8d\x77\x7c\x98\x55\x2b\x28\x84\x17\xf7\xbb\xb8\xc2\
-\x64\x1d\xce\x3a\x1e\x61\x1f\x93\x39\x5e\xce\xda\x22\xf7\x49\x5f\
-\x7e\xa4\x4e\xc7\xde\x9e\xd0\x3a\x28\x1e\x3e\x18\xb9\x14\x41\x4c\
-\x16\xfe\x31\x0e\xcc\xb3\x2c\xaa\x3f\x9b\x93\xed\x7e\x49\xa0\xcf\
-\x2a\x5e\xe4\xd6\xa9\x3b\xe7\x08\x34\x98\xb8\x15\x3e\xe9\x87\x95\
-\x50\x85\x8d\x90\x7f\x20\x78\xd3\x98\xfc\x12\x55\x40\xa3\xcd\x7d\
-\x1b\xcd\x0d\x9b\xd5\xfd\x07\x19\xed\xce\x11\x60\x24\xc8\xf2\xdb\
-\x28\x21\x21\x8c\xe8\x5c\xb1\x84\x78\xe8\x5a\xf8\xeb\x11\xe0\x67\
-\xfd\x1f\x96\xeb\xb1\x3e\x5f\x7c\xfd\x16\xd9\x82\x53\x1c\xae\xf8\
-\x7b\x13\x87\x95\xb9\x37\x9b\x34\xb0\x4d\x0f\x67\x24\x4e\x03\x69\
-\xe0\x1b\x99\x0b\xb1\xbb\x57\x00\x04\x18\x23\x60\xec\xd4\xd9\x70\
-\x3c\xe1\x0a\xa4\x17\xde\x62\x2e\x1d\x02\x74\x4a\x0e\xaf\x6c\x5e\
-\x39\xc5\xcb\x16\xf8\x29\xbc\xc4\xc0\xbf\x9e\x7b\x03\x52\xf3\x6f\
-\x41\xf6\xad\xbb\xb0\x69\xcf\x41\x30\xf4\x1b\x0c\x1d\xb1\x57\xfb\
-\x65\x1f\x2f\xb6\xf8\x89\x27\x33\x30\x8c\x36\x69\x6c\x2b\xa3\x44\
-\xba\x87\x48\xa7\x71\x50\x88\x39\xff\xed\xc3\x1b\xef\x63\x7c\x57\
-\xbc\xd5\xc6\x29\x4a\x43\xe4\x27\x3a\x43\xf4\x4b\xb5\xb9\x61\x99\
-\xd5\x69\x14\x5f\x95\x33\xbf\x92\x6c\xcf\x3f\xff\x6c\xf5\xae\xdd\
-\x5c\x6a\xfb\xf8\x07\xbd\xe5\xa3\xd5\xf7\xf1\xd6\xe8\xe7\x60\x41\
-\xb8\x82\x7a\x24\x0d\x97\x8a\x95\x19\xf8\xf4\xe0\xd6\xc3\x17\xba\
-\xf4\x76\x87\x4f\x14\xa1\xd0\x68\xe8\x4c\xa8\x3b\xeb\x30\x0f\xfc\
-\xc3\xf8\xfd\xa0\x59\xf5\x48\xb3\x79\xcd\x92\xd0\x6c\x8b\xea\xda\
-\x1c\xb3\x8a\xc3\xbc\xef\x10\xd4\x21\xe8\xcf\x3a\x00\x2d\x86\xcd\
-\x86\x8e\xc6\x38\x70\xf3\x55\x80\x97\x42\x83\x56\x7e\x45\xdd\xbb\
-\x23\xa0\x3f\x9d\x92\x6a\xdc\x2b\x5e\xa5\x4d\x27\xe9\xf3\xa8\xbc\
-\xf5\xc5\xde\x64\x57\x77\x5f\x08\x1b\xf0\x35\x2c\xfd\x7d\x2b\x5c\
-\xce\xc8\x81\xcc\x9b\x77\xe0\x3a\x5a\xf7\x29\x39\x45\x66\x88\x27\
-\x67\xf3\xca\xb1\x96\xf9\xb8\xcd\x6f\xd9\xc6\x80\x59\xfb\xe4\xd6\
-\xb9\x09\x69\x05\xb7\xe1\x6a\x56\x01\x2c\x5a\xbb\x19\xfc\x42\x22\
-\xe1\x0b\x84\x3d\xb9\x74\x5c\xc5\xc0\xe7\x65\x7d\x1f\xe5\x9e\xe6\
-\x0f\x51\x45\x18\xef\x11\xef\x20\xc3\x70\xaf\xc0\xa0\x2f\x7b\xfa\
-\x6b\xff\xfe\x56\x83\x86\xcc\xd7\x5b\xa3\x0a\xfa\x7f\xee\xad\x56\
-\xed\x9a\xd5\xfe\xf9\xcf\x37\xab\x77\x77\x71\x7d\x2e\xc0\x60\x7a\
-\xdb\x47\x1d\xa2\x43\xcb\x7e\x03\x16\xac\xeb\xf8\x79\xd7\xe7\x09\
-\x01\x9f\xc4\x5e\xbe\x22\xe0\xa3\xd5\xd5\xa5\xaf\x17\xb4\xf3\xd2\
-\x40\xd3\xd8\xb1\x50\x6f\xe2\x36\x66\x79\x33\xcd\xb4\xc0\x9a\xbe\
-\xd7\x9b\x69\x0f\x7a\x33\xcc\x67\xf3\xb0\x9f\x7d\xd0\xaa\xa1\xb0\
-\x3a\x5f\x38\x87\xe2\x9d\x79\x00\xea\xcc\x3b\x06\xef\xcd\x3b\x01\
-\x8d\x7e\x5a\xc3\x66\xcf\xa4\x97\x60\x3c\xfc\xd5\x6c\x15\x2c\x6f\
-\xcd\xd3\x04\xb2\x27\xa7\x3f\x17\xf0\xed\xc5\x7c\xf7\xca\x60\xe8\
-\xed\xaf\x62\x13\x95\x7d\x33\xf6\x57\xd8\x73\xe2\x0c\xa4\xd2\x1c\
-\xf5\x08\xfc\x94\xdc\x22\x06\x7c\x33\xe8\xa5\x80\x6f\xbb\xcf\xc1\
-\x71\x0b\xf4\xb9\x78\xd3\x0a\x6f\x33\xe0\x1f\xbb\x90\x04\x3f\xcf\
-\x98\x0f\x7d\x94\x3a\xe6\xce\xa1\x21\x99\x34\x44\x94\x03\xbe\x41\
-\x04\x7b\xf1\xfd\x97\x6f\x9a\x7b\xb3\x77\x4d\x8c\x34\x34\xf3\x16\
-\xf6\x04\xae\x7a\xab\xf5\x33\x03\x43\xa2\xfb\xb4\xeb\xd0\xed\x95\
-\x37\xff\xfb\x76\xf5\x7f\xbd\xf9\x06\xe3\x46\x15\xf4\xff\x64\x5b\
-\x8d\x1a\x35\xd9\xe7\xdf\xfe\xfa\x4a\x35\x7f\x65\xf8\xcb\xde\x9a\
-\xd0\x8f\xd0\xaa\xef\x87\x85\x7f\xab\x8f\x26\x24\xdb\x9b\xcb\xf4\
-\x27\x06\x11\xaa\x84\xe4\x53\xa5\xa9\x89\xfb\xf8\x2a\xa1\x1b\x3d\
-\xb8\x75\xf5\x81\x0f\x0d\x83\xe1\xfd\x31\x6b\xa0\x0e\x5a\xf7\x75\
-\xe6\x1d\xe7\xc1\xcc\xc1\xd9\x2c\x11\xc0\x25\x65\x03\x79\x87\xc2\
-\x46\xe5\xbd\xb9\xc7\xa1\xfe\xe4\x9d\xf0\xd1\xd0\xa9\xd0\x55\x13\
-\x06\x6e\xe4\xcb\x57\xf0\xf3\x9b\x70\x15\xc4\xa2\x27\x0c\x5f\x3b\
-\x95\xf5\xba\x9c\xbe\xb7\x3f\x5f\x43\x65\x2e\x67\x98\x87\xbd\x31\
-\x4f\x5d\x7c\x02\x41\x15\x16\x03\x33\x97\xac\x82\x0b\xd7\x32\x21\
-\x9d\x7c\xf7\x85\xb7\xcc\xd0\xbe\x9a\x6d\xaf\x64\xd1\xf7\x24\x89\
-\x63\xb2\x62\x71\x16\xa1\x55\x5f\xc8\x9e\x11\x64\x14\xdd\x84\xad\
-\xfb\x8f\xc1\x80\x11\x63\xa1\x83\x9b\x1f\x03\x3e\x1b\xa1\x83\xe5\
-\x9f\x8d\x0c\xa3\x72\x26\x9b\xee\x15\x94\x36\x5a\xe3\x03\x2c\xdf\
-\x57\xbd\x34\xfa\xc5\x7e\xba\x30\x65\x80\x29\xfa\x1d\x37\x37\x65\
-\xcd\xd7\x5f\xff\x07\xc7\x90\x9a\x35\x9f\x24\xc2\xaa\x36\x67\x37\
-\xe1\x8d\xda\x96\xad\x3e\xaa\xd1\xd7\x4f\xf1\x77\x2c\x50\x5f\x78\
-\xaa\x75\xdf\x61\xc1\x3f\x86\xba\x81\x95\xe0\x51\x71\xd6\xab\xb7\
-\x20\x8d\x45\x52\x95\xc9\x2c\x9b\xf0\xc5\x01\x86\x40\xca\x80\x4f\
-\x0b\xa1\xf8\x6b\xa0\x87\x87\x1f\x74\x70\x71\x85\x56\xca\x48\x68\
-\x38\x6c\x3e\xd4\x41\x18\x93\xe5\x6d\x07\x7b\x5b\xcd\xb0\x11\xbf\
-\xbf\x5e\x31\xc7\xcd\xc7\x30\xfe\x3a\xb3\x8e\xa0\x0e\x41\xe3\x31\
-\x2b\xe1\x8b\xb0\x21\xd0\x3b\x40\x8b\x56\xbe\x12\xbc\x54\xba\xa7\
-\x0a\xf8\xde\x22\xd9\x01\x5b\x22\x4f\x1c\xe6\x97\x10\x46\xe6\xde\
-\xe8\xbe\x05\xc9\xc5\x21\xfe\x6d\x75\x8d\x32\xd7\xe3\x4c\x8f\xc9\
-\x51\x38\x47\x71\x59\xae\xd7\x7e\x3f\xad\x68\xd6\xdd\x33\x80\x8d\
-\xbf\xa7\xb9\x73\x36\xef\x3d\x82\xa0\xbf\x0d\xa9\x68\x75\xa7\xe4\
-\xde\x40\x78\x17\x30\x25\xd1\x27\x81\x5f\x80\x7f\x16\xa7\xa4\x2c\
-\xee\x98\x59\xe2\x30\xfc\xb9\x9c\x24\x1a\x0d\x02\xfe\x8d\xbb\x90\
-\x9a\x5f\x08\x4b\x36\x6c\x85\xe0\xd8\x41\xd0\xb6\xbb\x2b\x74\x70\
-\xf5\xc6\xde\x86\x86\x19\x3c\x9c\x61\x21\x7f\xaf\x72\x65\xa1\x54\
-\xe5\xc5\x5a\x8f\xb8\xba\x68\xcc\x46\x2e\x6c\xf2\x0c\xd4\x19\x3d\
-\x95\x21\x8d\x7d\x02\xd5\x2f\xa9\x02\x15\xd5\x05\xa3\xb1\x6a\x7b\
-\x4a\x37\xa1\x1b\xf6\xdc\xb3\xcf\x56\xff\xef\x7b\xef\xd6\xec\xe4\
-\xea\xf6\x7a\xa0\x3e\xac\x97\xb7\x4a\x37\x1d\x33\xf4\x0a\xea\xa6\
-\xb7\xda\xf8\xf0\x69\x01\x3e\x15\x74\x36\x34\x13\x01\xeb\x82\x15\
-\xb2\x53\xf7\x5e\xf0\x89\x4f\x10\x34\x1e\x30\x01\xea\x4e\xde\x85\
-\x96\x37\x02\x7f\xc6\xc1\xe2\xa1\x2d\x71\xbc\x9e\xd4\xfe\x19\x32\
-\xe7\x21\xf4\xdf\x9d\x7b\x0c\xde\x9f\xb8\x0d\x3e\x1e\x38\x1e\xba\
-\xa3\x95\xef\x8e\xbd\x0e\x4f\x65\x50\x99\x81\xef\x2c\xe8\x9c\x07\
-\xbe\xe1\xa9\x04\xbe\x5c\xfe\x8b\xe3\x29\x0b\xf0\x6d\xcb\xa2\x3c\
-\xf0\xad\xaf\x17\xad\x57\x70\x53\x68\x19\xf0\x69\x31\xf7\xc9\xf3\
-\x96\xc0\xf1\x84\x24\xc8\xba\x7d\x17\x52\xf2\xac\x61\xcf\xc1\xbc\
-\xc0\x0c\x73\x06\x7a\x41\x12\x61\x92\x98\xd5\x5f\xe0\x18\xfa\x18\
-\x2e\xbd\xe8\x2e\x5c\x4a\xcf\x81\x09\x73\x17\xb3\xe1\x98\xad\x3b\
-\xf7\x82\x4e\xe4\xbf\xc7\x72\x2f\x00\xdf\xab\x14\xc0\x2f\x0e\xfa\
-\xc5\x02\xdf\x52\x17\x1f\x78\xa9\x8d\x79\xc8\x87\xfd\x9e\x5a\xfd\
-\x77\x7e\x7a\x63\x2b\x1f\x95\xf2\x95\xb7\xeb\xbc\x57\xeb\x79\x64\
-\xc9\x13\xc6\x5a\xd5\x66\xbb\x11\xe8\x05\xd1\xf6\xca\x2b\xaf\x55\
-\xd3\xc7\x0c\xf8\xaf\x4f\x70\xa8\xda\x5b\x6d\x58\x8e\x19\x7a\x0d\
-\x3f\x1f\x90\x45\x2d\x54\x3c\x6f\x8d\x4d\x65\xd4\xda\x56\x6c\x83\
-\x8c\x24\xce\x75\xb8\xdf\x36\x8c\xe5\x37\x75\xb5\x69\x5c\x34\x8d\
-\xd4\x71\xf1\x0e\x84\x2e\x3d\xfb\x42\x3b\x77\x05\x34\x0b\xfd\x16\
-\xea\xd3\xf0\x4c\xb4\xbc\xe9\x01\x2e\xb3\xf2\xe5\x00\x5e\x56\x4d\
-\xe7\x44\x2e\xa4\xba\xd3\xf7\x40\xd3\xd1\x4b\xa1\x43\xe8\x57\x68\
-\x0d\xaa\xc1\x43\xa1\xe1\xad\x7c\x7b\x70\xd9\x55\x46\xd9\x7b\x77\
-\x0e\x52\x52\x15\xd3\x0e\xd0\x5a\x2e\x9f\x6c\xff\xc3\x3e\x3e\x4b\
-\x5e\xf8\x68\x2c\xee\x02\xeb\xf8\x4a\x90\x77\x12\xff\xe9\xf8\x5c\
-\x47\xff\xe3\x6c\x3c\x72\x71\x38\x7b\xdd\x46\xf3\xbc\x39\x2e\xde\
-\x0a\xec\xb5\x69\x20\xea\xeb\xe1\xb0\x71\xef\x21\xb8\x42\x13\xa5\
-\x15\xdd\x86\xa4\xdc\x42\xb8\xc2\x43\xfc\x8a\x18\xea\x59\xf4\xbb\
-\x90\xed\xbb\x22\x05\x7c\x73\x18\xcb\x79\xe2\x86\x83\x3b\x97\x1a\
-\x83\x22\xd6\x8b\xb8\x96\x7f\x13\x0e\x9c\xb9\x04\x5f\x8d\xfe\x05\
-\xba\x62\x39\x6f\x87\x16\x7e\x17\x77\x7f\xce\x7f\x8f\xd7\xe7\xa5\
-\xe6\xea\x82\xe3\xba\x63\x93\xd7\x0e\x1a\x05\xb9\xf3\x1c\xe5\x0b\
-\x02\x1f\x8d\x40\x43\x11\xea\x24\x72\x62\x82\x87\x5a\xd7\x43\x15\
-\x1e\xf5\xcf\x77\xea\xd7\x63\xee\x82\x9a\x35\x69\x24\x4f\x15\xfb\
-\x9f\x8a\x4d\x00\x7d\xfd\x7a\x75\xab\x79\x7a\x79\x3f\xef\xe6\xab\
-\xaa\xef\xa5\x32\xe8\xbd\x35\xfa\xdf\xbd\xb4\x86\x5c\x3e\x63\x1f\
-\x39\x53\xa0\x8a\x97\x33\x60\xb7\x86\xba\x20\xa9\x63\x9e\x0c\xf8\
-\xc1\xd0\xd3\x47\x05\x5d\xd1\xea\xf9\xac\x8f\x0f\x7c\x18\x18\x01\
-\x0d\x87\x2d\x44\x00\xef\x83\xba\x73\x8e\x72\xc0\x9f\xbe\xbf\x78\
-\xcd\x90\xf8\x6d\xbb\x4f\x66\x7f\x1d\xd6\x93\x38\x08\x0d\xd0\xca\
-\x6f\xd3\xff\x27\xe8\xa6\x0e\x85\xbe\xfe\x2a\x6e\xda\x64\x75\x79\
-\xa4\x5b\xd9\x55\x7c\x63\x5c\xde\x2a\x59\x5e\x3f\x8e\xff\x76\x54\
-\x9e\xa4\x44\xc6\x44\x57\x0f\x7f\x50\x84\x44\xc1\x2f\x33\xe7\xc3\
-\xc9\xc4\x6b\x0c\xc2\x57\x73\x8a\x98\x85\x7e\x25\xbb\xc0\x1a\xec\
-\x59\xd6\x30\xb7\x53\xb6\xfd\x3e\xe9\xf3\xc8\xc2\x2f\x82\xac\x9b\
-\xf7\x20\x31\x33\x0f\x56\x6e\xdb\x03\x9a\xe8\x01\xf0\x59\x2f\x0f\
-\x36\x42\xa7\x87\xb7\x92\x95\x7b\x32\x78\xbc\x9e\x92\xf2\xc5\xeb\
-\x9e\x97\x4a\x9f\x8c\xf5\x72\x96\xb7\x5a\xef\xdd\x27\x20\xf8\xbf\
-\x1d\x3a\xf7\xa8\x2d\xe6\x4c\xd5\xf6\x84\x36\x21\x03\x5e\xff\xc7\
-\x3f\x6a\x34\x6b\xd6\xbc\xb6\x97\x9f\xe2\x65\x8f\x40\x4d\x33\x3f\
-\x5d\xe8\x37\xde\x2a\xfd\x7e\xac\x14\x85\xa8\x87\x4f\x12\x02\x0e\
-\x81\x8f\x3d\x0e\xb2\x70\x68\xd6\x4c\xf2\xaf\x76\xc3\x6e\xf7\x17\
-\x3d\xdd\xa1\xb5\x5b\x20\x7c\x30\x60\x22\xd4\x9d\xb8\x03\x2d\x6f\
-\x1e\xf8\xd3\xf6\x73\x2a\x4f\xe0\x9b\xe3\xdc\xc7\x54\x87\xfd\xcf\
-\x3e\x68\x3e\x7c\x11\xb4\x0f\xa3\x05\xce\xb5\xe0\x41\x33\x19\xd2\
-\x8b\x31\x4f\x41\xa5\xac\x02\x7e\xc9\x80\xef\x11\x48\xab\x5a\xa9\
-\x99\x06\x0e\x1f\x03\xeb\x77\xee\x83\xc4\xac\x7c\xb8\x5e\x78\x1b\
-\x81\x9c\x0f\x89\xd9\xf9\x16\x80\x67\x5a\xe0\x2d\x0b\x7b\x19\xe0\
-\x53\x5c\xf6\xfb\x38\x0b\x3f\xeb\xf6\x3d\x38\x7d\x35\x05\x26\x2d\
-\x58\x06\xbd\x02\x82\xa1\x55\xa7\xde\xd0\x05\x1b\x20\x5a\x6d\x8b\
-\x3d\xb0\x2d\x23\xf0\x9d\x6d\xf8\x9c\x8e\x4f\xad\x7f\x84\x65\x1d\
-\xa1\x6f\xc8\xc3\xeb\xda\xec\x1b\x14\xa2\xeb\xe3\xa7\xad\x5b\xef\
-\xfd\xe6\xcf\xbc\xfc\xd2\xab\x35\xc4\xdc\xa9\xda\x1e\xe3\x46\x89\
-\xce\x75\xb3\xaa\x55\x6b\xd7\xae\x5d\x4d\xad\x31\xf2\x35\xf7\x40\
-\x7d\x37\x4f\xb5\xfe\x17\xcc\xa8\xe3\x58\x10\x8a\x50\x8f\xc4\x15\
-\xa4\xac\x72\x54\xe8\x1c\x4a\x2d\x96\x9e\xc9\x5b\xad\x37\xff\x76\
-\xe7\xfd\xf8\x3d\x7c\x94\xd0\x11\x2d\xa0\xb6\xbd\xbd\xa0\x69\xd8\
-\x30\xa8\xf7\xe3\x6a\x84\xf0\x21\xa8\x33\x9d\x03\x7e\x3d\x91\xea\
-\xda\x6a\xba\xc4\x3e\x84\x77\x1d\x82\xf9\x34\x91\x04\xb8\x4f\xb7\
-\xd9\xc7\x3e\x0f\xb0\xff\x6a\x30\x7e\x0b\xb4\xfa\x6a\x32\x74\xd5\
-\x84\xb2\xb1\xdb\x1e\x4a\x6e\xe8\x1c\xab\x98\x6a\xc7\xf7\xed\x6c\
-\x9a\x38\x0b\x31\x73\x9a\x69\x04\x15\xdf\x6b\x2a\xf1\x7f\x94\xe2\
-\xfa\x39\x49\x5f\x93\x78\x7f\x49\x21\xed\x28\x9c\xa5\x2c\xe9\xad\
-\x24\x01\x2d\x96\x5f\xae\x08\xd5\x3e\x08\x7b\x95\x29\x06\xa6\x2e\
-\x5c\x0e\xa7\xae\x5c\x37\x3f\x70\x4d\xcc\xcc\xe7\x84\x70\x26\x5d\
-\x16\x7e\xa3\xcc\xdf\xb3\x38\x5d\x16\xf6\x65\x59\xc2\xb3\xef\x36\
-\xe7\x58\xe2\xa0\x86\x01\xff\x27\xf7\x06\x5c\x2f\xba\x05\x3b\x8f\
-\x9d\x86\xaf\x46\x8f\x87\x2f\xfb\xfa\x22\xf0\x7b\x41\x77\xb4\xee\
-\x5d\x59\xb9\x0a\xe6\xef\xc1\x3e\x8d\xac\xee\x8f\x95\x3b\xfe\xb7\
-\x39\x1d\xf4\x12\x2a\x5d\xfd\x95\x4d\x63\x8d\x21\x0f\xff\x77\xa7\
-\x8f\xc6\x30\x48\x6d\x8c\x6f\xd9\xc3\xc5\xbd\xf6\x33\xcf\xd4\x32\
-\xf3\xa7\x0a\xfc\x8f\x79\xab\xfd\xe2\x8b\xd5\xbe\x50\xab\x9f\x45\
-\xab\xfe\x5d\x0f\xa5\xde\x13\x0b\xf9\x4c\xb4\x18\x92\x30\xc3\xee\
-\xd8\x15\x0a\xa7\x2b\xb1\x44\x81\xb2\xa9\xc0\x92\x40\xb0\x0b\xef\
-\xa8\x60\x8a\x0a\x28\x7e\x92\x9f\x95\xf9\xf1\x7d\x55\xd0\xd9\xd5\
-\x0b\x3e\xeb\xed\x01\x1f\xaa\x22\xa1\xe1\xd7\x33\xa1\xce\x94\xbd\
-\x08\xe1\x03\x66\x80\x97\x44\x75\x78\x89\x7f\x4b\x7d\xb7\x68\x3f\
-\xee\xe7\xd4\x78\xd4\x0a\xf8\x2c\xfc\x5b\x70\x51\xea\xd9\x5c\xf9\
-\xf4\x70\xd9\x4b\x25\x71\x0f\x92\xa0\x73\x70\xcf\x72\x69\x26\x34\
-\x88\x0e\x2a\xbe\x7c\x3c\xb6\x0d\x43\x31\x90\xb6\xfd\x3f\x67\xae\
-\xcf\xa9\x7b\x94\xb8\x0e\x31\xa0\x45\xe7\x78\xab\x0d\xce\xc5\x69\
-\x75\xac\xb8\xf2\xa4\x37\xf7\x1a\x3d\x68\xea\x6d\x5f\x25\xeb\x25\
-\x7c\x3d\x66\x3c\x1b\x99\x93\x9c\x73\x83\x59\xe8\x97\x44\x70\x16\
-\x40\x7d\x49\xf4\x9d\x53\x9e\x9d\x12\xd9\xa7\x28\x4c\x06\x2f\x89\
-\xf3\x92\x68\x0c\x7e\xfe\x4d\x48\xc8\xc8\x85\xc5\x1b\xb6\x82\x2a\
-\xa2\x1f\x7c\xde\xd3\x13\x3e\xed\xe1\xc6\xe6\xf2\xe9\xab\xd0\x8a\
-\x80\x2f\x71\xcf\xc5\xe5\xbb\xec\x71\x71\x18\x91\x9c\xad\xaf\x96\
-\x63\x8f\xf8\x63\xb7\x3d\xd5\x86\xa3\x78\xad\xc3\x7d\x82\x8c\x9f\
-\x7a\xaa\x35\x7f\xff\xa4\x4d\xdb\xaa\xe1\x3b\x8f\x6b\x13\x86\x4a\
-\xbd\xf6\xea\xff\xd5\x6c\xda\xf2\xd3\xe7\x7d\x82\xf5\x0d\x11\xf2\
-\x06\x4f\x55\xf0\x26\xfc\xcc\xc0\x4c\xba\x83\x7a\x68\x57\x68\xe4\
-\xc0\xf4\x44\x81\xcf\x59\x62\x0c\xf8\x54\x41\xd1\x1a\x23\x7f\x2b\
-\xf9\x38\x3f\x76\x0b\x84\xc6\x51\xa3\xa0\xee\xf8\xcd\x08\xfc\xfd\
-\xdc\x03\x56\x1b\x90\xd7\x91\x80\xba\x14\xf0\xa5\xc2\x49\x9d\xc3\
-\x85\xd9\x0f\xef\xce\x38\x04\xf5\x26\x6c\x87\x16\xdf\xcc\x82\x4e\
-\xfa\x58\xe8\xe3\xaf\xc2\xee\xb7\x86\x5d\x67\xf9\x01\x5f\x06\x96\
-\xb6\xd6\x71\x49\x1b\x0e\xd9\x3c\x95\xb9\xb6\x72\x05\xbe\xc4\x75\
-\xc8\x80\xcc\x02\x7c\x5b\xa8\x97\x0d\xf8\x54\x9e\x58\x8f\xd1\x5f\
-\xcd\x7a\x8d\x86\xb8\xaf\x60\xe1\xda\xcd\x70\x22\xf1\x3a\x7b\x48\
-\x4b\x96\xf9\xa5\x8c\x3c\x48\x10\x81\xfe\x52\x06\x7d\xe6\x71\xdf\
-\xcd\xf0\xe7\xc0\x4d\x61\x2f\xf3\xa2\xef\xe6\xf0\xa8\x04\xfe\x93\
-\xe2\x49\xe0\xc5\xc2\xa5\xe7\x31\xeb\x3e\x19\x81\x7f\xe8\xc2\x15\
-\x18\x3d\x6d\x2e\x74\xf1\x0a\x84\xcf\x7a\xba\x43\x67\x77\x5f\x2c\
-\xe7\x2a\x56\xde\x25\xcb\x93\x2d\xf0\xad\x1a\x68\x47\xf5\xca\x60\
-\x93\x5e\x06\xeb\x63\x92\x8d\xbe\x43\xe0\xf3\xe9\xa9\x23\x96\xdc\
-\xc2\x74\xbd\xe8\xae\xd2\xcd\x76\x53\xea\x7b\xfb\xab\x42\xfe\xdd\
-\xba\xfd\x17\xcf\xfd\xdf\x7f\xdf\x26\x17\x4f\x95\x99\x5f\x11\x1b\
-\x75\x9f\xe8\xb5\x67\x01\xf8\x2d\x3f\xee\xfc\x9c\x2a\x74\x40\x4b\
-\x37\xa5\x76\x00\x66\xc6\x4e\xcc\x98\x6c\x4f\x02\xbd\x4a\xa2\xd0\
-\xd8\x56\x9c\x62\x81\x2f\x73\xae\xc3\xca\xe8\xe4\x39\xe2\xc2\xa4\
-\xe1\xa5\xd6\x61\x25\x0d\x82\x3e\x68\x49\x77\xf7\x56\xb0\x31\xca\
-\x6d\x7b\x7a\x40\x33\xdd\x40\xa8\xff\xc3\x32\xa8\x3b\x65\x0f\xd4\
-\x41\xe0\x5b\xc1\x7b\xaa\x84\x1c\x1d\x93\x09\x5f\x77\x2a\x27\x71\
-\xdc\xef\x61\x8f\xe2\x3d\x04\x7f\x83\x9f\x37\xc0\x27\xb1\x3f\x40\
-\x77\x95\x11\xdc\xfc\x95\x68\x35\x6a\xf9\x87\x6c\x8e\x20\x57\x0c\
-\x08\xa5\x2a\xb5\xa3\x7c\x72\x26\x2e\x67\xff\xaf\xbc\xe3\x2c\xaf\
-\x6b\x2a\xc7\x38\xa9\x2c\xf5\xc5\x7c\xa2\x91\x39\x34\x67\xce\x88\
-\x09\xd3\x60\xd7\xf1\xf3\x70\x89\xdc\x30\xbc\x75\x9f\x40\xc0\x17\
-\xe9\x92\x19\xe6\x12\xfb\x6c\x95\xc9\x37\x18\xc5\x28\x09\x81\x9f\
-\x98\x5d\x08\xeb\xf7\x1e\x86\xd8\x61\xa3\xa0\x6d\x8f\xbe\xf0\x79\
-\x2f\x77\xe8\xee\x13\xc8\xca\xb9\xbb\x30\x42\xa7\x58\x03\x41\x5f\
-\x8c\x11\x26\xec\xb3\x35\x18\x4a\x50\xf6\x9c\xa9\xab\x68\x48\x62\
-\xda\x26\xe2\xe7\x62\x77\x55\xb0\xc6\x27\x38\xf4\xdd\x2e\x1e\x9e\
-\xcf\x30\x36\xd5\xac\x69\x7e\xf7\xa7\x6a\x2b\xa7\x4d\x98\xd6\xf8\
-\xe5\x37\xff\x55\xad\x9b\x77\xc0\xdf\xdc\x02\x34\x6d\x3d\xd5\x41\
-\xc3\x30\x03\x0e\x61\x46\xdc\x45\x3d\x7a\xe2\x15\xb8\x94\x15\xdb\
-\x0c\x7c\x85\x06\x7a\x60\x85\xe8\xd8\xd7\x1b\x3e\xc3\x0a\xd2\xd2\
-\xdf\x04\x0d\xe9\xe1\xed\xaf\xdb\x98\x6f\xbd\xce\xd4\xbd\x25\xd0\
-\x3e\x89\xdf\xfb\xec\xf6\xd7\xe5\x25\xde\xf7\xde\xd4\xfd\xf0\xce\
-\xf4\x43\xf0\xde\x94\xbd\xd0\xf4\xfb\x85\xd0\x3e\x74\x08\xf3\x05\
-\xbb\x13\xf4\x79\x7f\xbe\x67\x79\xa4\xc9\x93\xce\x97\x4a\x24\x21\
-\x4f\xdc\x94\x41\xcc\x82\x76\xf5\xd7\x40\xbf\x61\xa3\x61\xc5\xb6\
-\x3d\x70\xf6\x5a\x16\x5c\xc9\xb9\xc1\x5b\xe5\x79\x70\x31\x3d\x97\
-\x17\xc2\x39\xbd\x78\x78\x17\xa7\x8b\x2c\x4e\x3e\xae\x74\xae\x51\
-\x20\xe0\x9f\x4a\x4e\x87\xc9\x8b\x56\x40\x40\x68\x34\xb4\xe9\xd6\
-\x9b\xf5\x5c\x5d\xe8\xda\xb0\x9c\xbb\x2b\x83\xf9\x21\x99\xe5\x5c\
-\xaf\x9c\x05\x7e\xe9\x1a\xdb\xfb\x98\xc6\x59\xa8\xdf\x3d\x94\xba\
-\x88\x3e\xbe\x81\x2d\x3a\xab\xd5\x2f\xff\xf5\xed\xb7\x99\x95\x5f\
-\x05\xfd\x72\xd8\xcc\x63\xeb\xff\xf6\xb7\xea\x4d\x5b\x34\xaf\xfd\
-\xa5\x42\xf5\x8a\x8f\xc6\xd4\x19\x2d\xf9\x89\x08\xca\x8b\x5e\x6a\
-\xdd\x1d\x2f\x15\x76\xbb\x04\x9f\x5b\x59\xa5\xd2\x4b\xfb\xaa\xcb\
-\xbb\x60\x5a\x55\x56\x1d\xf3\x67\xd2\x32\x83\x3d\xc9\x8f\xef\xe9\
-\x0f\x5f\xf4\x74\x83\x8f\xfb\x2a\xa0\xa9\xe1\x6b\xa8\x3f\x76\x1d\
-\xf3\xe3\x9b\xa1\x3c\xa5\x02\x80\x3f\x45\x14\x2f\x7e\xbe\x3b\xed\
-\x20\x83\x7e\x3d\x6c\x6c\x5a\x0e\x9e\xc2\x4f\xb9\xa0\x04\xcf\x00\
-\x15\xf3\xe7\x97\x19\xfa\x55\xc0\x2f\x37\x09\x79\x41\xbd\x2f\x82\
-\x7d\x4f\x1f\x25\x68\x23\xe2\x61\xca\xc2\xe5\x70\xec\xf2\x35\xb8\
-\x9c\x55\x88\xd6\x76\x11\x5c\x4c\xcb\xb5\x88\x07\xbe\x59\x62\x68\
-\x0b\x10\xcf\x10\x1d\xcb\xc8\xb3\x0e\x2f\xb1\x3f\x21\x8d\x3b\x9f\
-\x1e\xea\x52\xe3\xb2\xeb\xe4\x05\xe8\x3f\xe2\x27\x36\xf6\x9e\xac\
-\x7b\x5a\xf0\x84\x46\x0c\x31\xff\xbd\x2a\x98\x95\xfb\x72\xaf\x57\
-\x15\x0b\x7c\x62\x0c\x42\x5f\x57\x88\x8d\xd5\x71\xd4\x50\x1f\x8d\
-\xb1\xcd\x27\x5f\x76\x78\xe9\xdf\x0d\xd9\xe4\x6b\xdc\xfa\x4a\x55\
-\x0f\x73\x4b\xb7\x09\x89\xf7\xec\x33\xb5\xab\x79\x7a\xf8\xd4\xd2\
-\x1a\xa3\xff\xe3\xad\x0e\x0a\xc4\x84\x5e\x80\xba\xec\xa9\x0a\xbe\
-\xe3\x4c\xa1\xa1\x30\x82\x8a\xcd\x54\x15\xf7\xd0\x4b\x90\x55\x3c\
-\xff\xcf\xde\x79\xc0\x39\x51\x6d\x0d\x7c\xb3\x85\x5e\x15\x15\x10\
-\x94\xb2\xcb\xd2\x76\x97\xed\xcb\xf6\x9a\xde\x7b\x4f\xb6\xd1\x14\
-\xb1\xa0\x22\x76\x7d\x76\xec\x08\x16\xec\x9f\xe5\xe9\xf3\x59\x9f\
-\x5d\x90\x2a\x20\x60\x07\x11\x0b\xa0\x60\x43\x2c\xcf\x67\x85\x3d\
-\xdf\xb9\x77\x66\x92\x49\x36\xc9\x26\xd9\x6c\x01\xe6\xfc\x7e\x87\
-\x2c\xc9\xcc\x9d\x99\x5b\xfe\xf7\xdc\x73\xcf\xbd\xc3\x7d\x1f\x22\
-\x1d\x9a\x7e\x63\x7b\x6d\xd7\x30\x43\x7e\xcf\x00\x9f\xbc\xe3\x96\
-\x2c\x78\x92\x59\x5c\x50\xa7\x35\x43\xb9\xca\x44\xad\xfc\xc9\x57\
-\x3e\x0c\x13\x97\xaf\xa6\x96\x37\x05\xf6\xdd\x41\xd0\x0f\xf7\xff\
-\x60\x0d\xfe\x2d\xe2\xf1\xa4\x63\xd8\x0c\x13\x71\x64\x31\x15\x3b\
-\x9c\xd2\x85\x4b\x40\xe9\x99\x03\x46\xab\x13\x8c\x6c\x84\x05\xff\
-\x79\x22\x59\x6b\xbe\xfc\xe7\xe5\x5f\x34\xe7\xf9\x61\x16\xf9\xf8\
-\x76\x69\x87\x50\x4b\x98\x7b\xed\xb0\xac\xa2\x85\x6e\x63\x98\x7b\
-\x08\x53\x67\xf8\xbf\x47\x6b\x60\xf8\xd3\x6a\x9f\x47\xa4\x13\x26\
-\x9b\xa3\xc9\xcc\x0e\xfa\xfa\xc2\x1b\xef\x7a\x10\xde\xdc\xfa\x21\
-\xc2\xf7\x17\xf8\xec\xbb\x9f\x29\x88\x03\x80\x1f\x00\xfd\x83\x1d\
-\x68\x30\xec\xc3\x1c\x87\x69\xee\xc2\x4f\x72\xcd\x0f\x76\xef\x87\
-\x27\x5e\x59\x05\x9e\x05\xe7\x41\xb9\xd2\x40\xdd\x94\x72\x8b\x9b\
-\x02\xdf\x40\x27\x6c\x43\xe4\x57\x94\x75\x22\xea\xf6\xde\x18\x3a\
-\xff\xc3\x96\x49\x84\xb6\x1b\x74\x5c\x1b\xea\xaf\xe6\xc6\x39\x3b\
-\x8c\xde\xd9\xcb\xbd\xa7\x9f\x23\x57\xb9\x5c\xcc\xcb\x54\xd2\xfa\
-\x50\xa7\x3e\xb5\xf6\x05\xf0\x47\x2f\x9c\x0b\x67\xe2\x84\x09\xc9\
-\x56\xa7\x7d\xb0\xb9\x65\x76\x8e\xc1\xd9\x32\xcf\xd4\x34\xeb\x3f\
-\x58\x50\xdf\x60\x86\x1f\x8a\x08\xe5\x48\x1a\xa6\x42\x84\x83\x76\
-\x5c\xe9\xc5\x72\x1e\x0b\x7c\xe2\xd7\xa4\xfb\xea\x58\xdd\x20\xd6\
-\xdb\xa0\x4a\xa9\x87\x62\xbd\x0b\xa6\x9f\x75\x3d\x64\xdc\xf4\x02\
-\x85\x6f\x00\xf0\xbb\x50\x33\xa8\xbe\x05\x13\xd0\xca\x4f\xbf\x7b\
-\x3d\x64\x5d\xf7\x2f\xa8\x39\xfd\x52\x50\x3b\x5b\xd0\xd2\xf7\x80\
-\xc9\xd3\x1c\xf3\x33\x46\x9b\x2f\x1d\x75\xa2\xc1\xc7\x86\x3c\x2e\
-\xe8\x9a\xd1\x00\x3f\x9e\x7b\x8d\x45\xc3\xc2\x88\x7f\xfd\x38\xd3\
-\x26\x13\xb4\x04\xf6\xc4\x68\x58\xf4\x8f\x25\xf0\xd2\xba\x2d\xb0\
-\x73\xff\x41\xf8\xe2\x87\xff\x52\xd8\xef\xdc\xff\x83\x0f\xf4\x3b\
-\x79\xfa\xc9\xd7\x3f\x86\xf9\x3e\x9c\xfe\xe8\x3b\x36\xdc\x79\x04\
-\xf8\x6b\xde\xdd\x0e\xd7\xdc\xb1\x02\x54\x58\x9f\x4b\x65\x3a\xf6\
-\x75\x86\x1e\x5a\xbf\xc9\x3d\x76\x04\xfc\x78\xdb\x57\x58\x06\x44\
-\x73\x8d\x48\x75\x37\xfc\xb9\x7b\x4c\x9e\xd6\xfb\x71\xd4\x62\x34\
-\x37\x35\x9d\x72\xaa\xd5\x92\x9a\x34\x62\x84\x30\x93\x1b\xab\xa4\
-\xa4\xa4\x24\x4d\x9e\x3a\x25\xa5\x5e\xa1\x1c\x66\x6b\x99\x53\x6c\
-\xf0\x34\x5f\x6c\xf6\xb6\xbe\x8d\x60\x3c\x88\xc3\xc1\xbf\x30\xa3\
-\x0f\x77\x45\xa3\xec\x31\xf5\x32\xd0\xd7\x93\x7d\x75\x70\x48\x4e\
-\xa2\x75\x6a\x55\x06\x28\x53\x1a\x21\xd7\x7d\x06\x4c\xb9\xec\x41\
-\x98\xb8\x82\x00\x7f\x63\x04\x50\xaf\xe7\x69\xe2\xe0\x3f\x71\xc5\
-\x26\xc8\xb8\x73\x0d\xe4\x5d\x76\x1f\xd4\xcd\x59\x44\xa3\x76\x8c\
-\xd4\xb5\xd3\xda\xe3\xf9\x16\x75\x27\x7f\x54\x2a\xe3\x07\x27\x2e\
-\x12\x12\x82\xa9\x40\xa0\x9e\xb1\xf8\x72\x78\xf4\xf9\xd7\xe0\x83\
-\x3d\xdf\xc2\xee\x1f\x7e\x43\xcb\xfb\x27\xf8\x18\x61\xcf\xe8\x41\
-\xbf\x86\x00\x3b\xf7\x1b\xe9\x28\x02\xbe\x0f\xa3\x3b\xb9\xbf\xf1\
-\xf8\x1d\xdc\xb9\xd8\x21\x7c\xbc\xef\x20\x5a\xf7\x6f\xd2\x50\x4c\
-\xe2\xb7\xaf\xc0\x3a\x2c\x35\x3a\xf1\x1e\x1b\x69\xf8\x31\x81\xbd\
-\xa9\xc7\xf3\x2e\x21\x4a\x2c\xfd\xbf\xb1\xdd\x7e\x8d\xcf\xf4\x3c\
-\xf2\xa9\x55\xed\x6e\x1c\x37\xcd\x64\x1a\x38\xac\xb2\x32\x39\xe9\
-\x84\x13\x18\xf0\x0b\x96\x7e\x68\xf1\xed\x89\x83\xb0\x1f\x30\x70\
-\x60\x92\x73\xf6\x9c\xe3\x6d\xb3\x4f\x97\xa2\xe5\xbb\x0c\x2b\xf7\
-\x07\x98\xb1\x38\x8c\x3a\xca\x40\xcf\xaa\x89\x03\x3e\x36\x5e\xb2\
-\x95\x2d\x89\xd6\xa9\xd7\x9a\xa0\x4a\xa1\x85\x62\x9d\x13\xad\xfc\
-\x25\x90\x71\xfb\xeb\x34\x7a\x86\x68\xf7\x01\x7f\x3d\x0d\xd5\x24\
-\xd0\xcf\xbc\xfd\x35\x28\xb8\xf8\x4e\x90\xb4\x9e\x45\xc3\xfe\x48\
-\xe4\x0e\x99\x6c\xee\xc9\xc6\x7b\xac\x02\x9f\xd4\x17\xb2\xf1\x18\
-\x19\x15\xaa\x10\xf4\x4a\x9b\x1b\x9a\xcf\x3a\x9f\xae\x68\xdd\xf6\
-\xe9\x97\xf0\xe9\xf7\xff\xa5\xba\x83\xc2\xd8\x0f\xfc\x1d\x1c\x9c\
-\x59\x58\xef\xe0\xc1\x9a\x1c\xb7\x23\xf8\xb8\xfd\xe1\x81\xbf\x63\
-\x7f\xa0\x7e\xf2\xed\x4f\xb4\x83\x59\xf7\xc1\x2e\xb8\xe1\x9e\x87\
-\xa8\xef\x9e\xec\x8c\x59\xad\x31\x53\x37\x25\xa9\xd7\x86\xa3\x0b\
-\xf8\x9c\x1e\xc2\xb6\xfb\x3d\x1a\xa2\xab\x4c\x8d\xad\x17\xd9\x3d\
-\xad\xf9\xd2\x85\x17\x0c\x1a\x3c\x71\x02\x25\xbd\xb0\xeb\x66\x18\
-\xe1\x66\xb9\xc7\x65\xe7\xa4\x98\xe7\x9c\x39\x1a\xe1\xa7\x37\x7a\
-\x67\xdd\x87\x19\xb9\x1b\x33\x94\x80\xbe\x2d\xee\x42\xf1\xb2\xda\
-\xf3\x95\xc3\xdf\x68\x39\xf5\xce\xa2\x93\x58\x44\x0d\x9e\x16\x6a\
-\x41\x93\xbd\xcb\xc5\xe4\x5d\xb7\x4a\x1d\x94\xc9\xb4\x90\xeb\x5d\
-\x08\x93\xaf\x7c\x94\xba\x74\x26\x92\xd5\xb7\xdd\x09\x7c\x6a\xe5\
-\x6f\x84\x09\x08\xfd\xa9\x37\xfd\x07\x4a\xce\xbf\x09\xa4\x4d\xf3\
-\xe9\x3e\xfe\x06\xb2\xc9\x1a\xbd\x7f\xff\xf3\x30\x96\x27\xa7\xec\
-\xf3\x51\xed\xf9\x3c\x8f\x5f\x03\x9f\x29\x64\x79\x72\xcf\xd9\xee\
-\x98\xc8\xe7\xc5\x5b\x67\x08\x3c\xd5\x38\x1a\x64\x42\x30\x17\xc0\
-\x4d\x2b\x1e\x86\x37\xdf\xd9\x01\x5f\x1c\xfc\x0d\x76\x7d\xff\x0b\
-\x0b\xe5\x1f\x78\x7a\xd0\xd7\x01\x44\xa7\xed\xa1\x1e\x4e\xb7\xef\
-\xfb\x01\x76\x7d\xf7\x0b\xfd\xfb\xb1\x17\x57\xc2\xdc\x0b\x2e\xa3\
-\xa1\x98\xa5\x58\x77\xeb\xb1\x1e\x2b\xa8\x3b\xc7\x1f\x8e\x19\x39\
-\x8f\x7b\xb2\x7c\xe3\xae\x0f\x6d\x58\xee\xbf\xa2\x6e\x43\x66\x5d\
-\x63\x75\x35\xd5\x19\xbc\x8d\x23\xf2\x4a\x4a\x84\xed\x18\x82\x25\
-\x99\xcd\x8c\xf4\x8c\x0c\xd1\xd4\xbc\xfc\x3e\x35\x12\xf5\xc9\x96\
-\xe6\xd3\xdc\x68\x3d\x3e\x85\x19\xf9\x3d\x2a\x75\xe1\xf8\xc1\x11\
-\xa8\xa1\xe1\x32\x2b\xb0\x70\xbc\x8c\xf2\xe1\x4a\xbe\x0f\x97\x66\
-\xa8\xf4\x3b\x3c\xb6\x91\x9f\x76\xc7\x15\x25\xe0\x1a\xac\x12\x8b\
-\x99\x84\xad\x91\xe1\x2f\xd9\x5b\xa7\x5e\x63\x82\x4a\x89\x02\x0a\
-\xf5\x6e\x98\x7e\xe6\xf5\x90\xb1\x74\x25\x02\x7f\x2b\x33\x81\xcb\
-\x03\x72\xe2\xfc\xf6\x7e\x0d\xee\x48\xe8\xc8\xe2\xce\x75\x30\x6d\
-\xc9\x33\x50\x7e\xf6\x35\x20\xf7\xce\x03\x1d\x81\xbe\xab\x99\x36\
-\xe4\x68\xf2\x32\x9a\x3c\x0c\x04\x1c\x9b\xa7\x01\xe5\x1c\x4a\x43\
-\x9c\x13\x63\x99\x25\xe4\xfe\x83\xca\xd3\x1c\xfc\x7d\x14\x1d\x47\
-\x70\x3d\x0e\x56\x63\xe3\x2c\xe6\xc5\x39\x8e\x26\xba\xed\xb1\x63\
-\xce\x19\x70\xe5\x2d\xcb\xe1\xd5\x8d\xef\x52\xe0\x12\xf0\x12\xd8\
-\x6f\xdf\x77\x00\x76\x20\x88\x7d\xca\x83\x73\x47\x1a\x00\x7e\xfe\
-\xff\xf7\xb1\xe7\xb3\xff\x27\x9f\x1f\x7f\xfd\x03\xec\x24\x51\x3a\
-\xdf\xfd\x0c\x5b\x3e\xd9\x0b\x57\x2d\x5d\x01\x0a\x47\x33\x14\x89\
-\x95\x8c\x3b\xc7\xcc\xba\x73\xe8\x76\xc8\xe1\x80\x1f\xa1\x9d\x85\
-\x6c\x57\xbc\xe3\x83\xca\x2f\x5c\xfa\xd1\xb4\x71\x7e\xb9\x04\xd4\
-\x8d\x8e\xeb\x47\x1b\x35\x4a\xbd\x08\x7d\xef\xac\xcf\xd1\xb8\x59\
-\x61\x6d\x9a\xa7\x6c\x30\xd9\x47\x67\xe7\x16\xa4\x0e\x1a\x38\x80\
-\x32\xee\x98\x0f\xdd\xa4\x6f\x95\xe9\xdb\x37\x69\xe2\xa4\x0c\x91\
-\xd5\x6e\xef\x63\x9d\x3d\x7f\xba\xbd\x75\xde\xb9\x26\x6f\xeb\xeb\
-\x98\xf9\x38\x4c\xf2\xbb\x70\x12\x06\x7c\x1f\x58\x12\x0c\xfc\x90\
-\xd7\x8e\x11\xf8\xd8\x20\xf4\x08\x7c\xc6\xad\xe3\x81\x06\x83\x15\
-\x6a\x14\x6a\x28\xc5\xa1\x71\xae\xeb\x0c\xc8\xbc\xea\x71\x84\xfd\
-\x5b\x14\xfa\xcc\x04\x6e\x77\x01\x1f\xad\x7c\x32\x89\x4b\x3a\x9a\
-\x3b\xd7\x42\xf6\x75\x4f\x42\xc5\x59\x57\x83\xd2\x35\x0b\xf4\x76\
-\x37\x18\xe9\x6a\xdc\x56\x1a\x5f\x9d\x70\xe0\x87\x6c\x94\x11\x80\
-\x1f\xc7\x35\x13\x09\xfb\xae\x04\xbe\xd1\xcb\xc0\x5e\x83\x96\xbd\
-\x02\x61\x6f\x6e\x9e\x07\x97\xdf\x74\x07\xfc\x67\xed\x66\x78\x7f\
-\xf7\x37\x3e\x2b\xdb\x07\xee\xce\x02\x3f\xf8\x7b\x1e\xf0\xa9\xb2\
-\xe9\xee\xfe\xf1\x37\xda\xc1\xfc\xeb\xb5\xb5\xd0\x7c\xf6\x62\x98\
-\x89\x96\x3d\x89\xbd\xaf\xd5\x99\xa9\x7b\x92\xae\xae\x75\xc7\x09\
-\xfc\x70\x6d\x3a\xcc\xf1\x09\x03\x7e\x3c\x65\xef\x69\x25\xe0\xff\
-\x0b\x75\x1f\x3e\xeb\x0b\x08\xfe\x16\xcf\x69\xe7\x4e\x18\x3d\xf6\
-\x54\x11\x1b\xb7\x49\xde\x96\xde\xd3\xd8\xed\x41\xc1\x1e\x6f\xd4\
-\xbc\x79\x22\x63\x53\xf3\x30\x83\xb7\xb5\x0c\xad\xc5\x8b\x31\xd3\
-\xd6\x61\x86\xfd\xd4\xe9\x86\xc7\x1b\xfe\x76\xbf\xce\xe6\x69\xf4\
-\xe7\x91\x06\x4d\x1a\x06\x19\xfe\x12\xb7\x8e\x94\xbc\x09\x8b\x5a\
-\xf9\x4a\x28\xd4\xd8\x61\xda\xd9\x37\x42\xfa\xad\xaf\xc0\x84\x07\
-\xb7\xd1\x2d\x17\x12\x39\x39\x1b\xa0\x61\x42\x36\xc9\xc8\x62\x02\
-\xd9\xc0\x6d\xf9\x1a\xba\x28\xab\x6a\xfe\x65\xa0\xc2\xfb\x35\xd8\
-\x9c\x14\xfa\xc6\x44\x40\x3f\x6c\x79\xce\x0a\xd9\x51\x73\xee\xba\
-\x9e\x29\xe7\x44\xd4\x91\xc0\xe7\x8b\x74\x0e\x7d\x07\x32\x19\xfd\
-\x99\x9c\xf4\xef\x0b\xaf\xbd\x19\xfe\xf5\xea\x6a\x78\x6f\xf7\xd7\
-\x68\x65\xff\x04\x3b\xbe\xfe\x31\x10\xde\x5f\x1d\x60\x34\x1c\xdc\
-\xf1\xb7\x8f\xf0\x33\x58\xb7\xf3\x3f\xc3\x9c\xff\xd1\x3e\xe6\xfb\
-\x8f\xf1\xba\x7b\x7e\xfa\x03\xde\xda\xfe\x19\x5c\x7d\xc7\x0a\x90\
-\x61\x67\x94\x5f\x23\x83\x4a\x25\xd9\x4a\xc1\x41\xe7\x17\x48\xb8\
-\x31\x07\x7c\x5f\xb9\xc5\xd1\x36\x03\x5c\x5b\x51\x1c\x1b\x6b\xba\
-\x9d\x32\x1c\xfc\xda\xc6\x3e\xe7\x8f\x26\x6f\xcb\x4b\xc8\xb4\xd3\
-\x5d\xcd\xb3\xa7\x54\x1b\x0c\x7d\x93\x86\x0f\x4b\x62\x7d\x3c\x3d\
-\x4d\xde\xee\x13\xce\x9f\x35\x6c\xc8\x10\x51\x56\x61\x51\x9a\xd6\
-\xe6\x1c\x69\x76\x37\x37\x18\xdd\xad\xcb\x8d\xde\xd6\x1d\xa8\x64\
-\x58\x44\x5c\x38\x6d\x89\x6b\x5c\xad\x41\xda\xfd\x0d\x9c\x81\x21\
-\xa7\xc1\x0d\x9e\xb9\x2f\xf2\x9b\x81\x5a\xf9\x2d\xd4\x2a\x92\x5b\
-\x5c\xf4\xed\x40\xd5\x32\x35\xcc\x94\x6a\x60\x86\x7b\x01\x64\x5e\
-\x4e\x22\x76\xd0\xca\xbf\x6f\x33\xb3\xd9\x59\x57\x41\x3f\x8c\xd2\
-\x11\x06\x89\xdc\x59\xb6\x1a\xb2\xaf\xf9\x27\xd4\x9c\x7e\x11\xa8\
-\xc9\x24\x2e\x36\x6c\x3d\x69\xd8\x1e\x06\x4c\xc4\x12\x8d\x36\x5f\
-\xe2\xca\xcf\xae\x2a\xa3\x78\xee\x27\xce\x51\x82\x31\xe8\x39\xb8\
-\xfa\xd1\xfe\xbe\x58\x37\x8e\xab\x19\x61\xef\xa0\xf9\xbb\xf0\x8a\
-\xeb\xe0\x29\xb4\xa8\xdf\xf9\x6c\x3f\x85\x2e\xb1\xb4\x09\x9c\x3f\
-\x24\x10\x67\xf5\xc3\x10\xfa\x51\x08\x0d\xfe\x2d\xdc\x39\xc1\xff\
-\x27\xae\xa3\x5d\xdf\xff\x17\xad\xfd\x83\xf0\xf8\xcb\xab\xc0\x3d\
-\x7f\x21\x94\x60\x3d\x2d\xac\x53\x40\x9d\xce\x46\x27\x6b\xd5\x0e\
-\x66\x77\x4c\x32\xe7\x90\x30\xd7\x5f\xb7\xb6\xd9\xb8\xea\x5a\x1b\
-\x9e\x73\x08\xf5\x37\x63\x63\xeb\x46\x8b\xbb\xe9\x62\xc5\x82\xb3\
-\x73\xb2\xed\xb6\x81\xa7\x8e\xce\x4b\x49\x4a\x3a\x66\xac\x7c\x51\
-\x52\x72\x4a\x6a\x52\x6a\x4a\x72\x52\x66\xf6\x8c\x54\xd7\xbc\x33\
-\xc6\x23\xe8\xdd\x98\xb1\x4f\xa3\x65\xbf\x07\x2b\xfb\xef\x26\x4f\
-\x22\x41\xcf\xa9\x1f\xf6\xb4\x51\x05\x35\xec\xb8\x1b\x7a\x2c\x15\
-\x27\x00\xf8\x6c\xb4\x42\x08\xe0\x1b\x59\xe0\x93\x45\x2a\x34\x26\
-\x1f\x1b\x78\xad\xc6\x08\xe5\x72\x6c\x48\x0a\x13\x4c\x9f\x77\x05\
-\x64\xdc\xf8\x3c\xe3\x53\x27\xd0\xef\x66\xe0\x73\x96\x3e\x09\x13\
-\xcd\xb8\x73\x2d\xe4\x5c\xfb\x38\x54\x2e\xb8\x02\x94\xf6\x66\xd0\
-\xd9\x5c\x74\x45\x2e\x07\x7d\xb2\x6b\xa3\x4f\x23\xe4\x4b\x37\x37\
-\xc6\x0e\xcb\x29\x3a\xa3\x80\x67\x40\xc4\x00\xfc\x80\x7a\xe7\x8d\
-\x00\x7c\x0f\xa3\xe4\x77\x03\x7d\x49\x8e\x97\x5a\xf6\x3a\x04\xe7\
-\x05\xd7\xdc\x0c\x4f\xaf\xdc\x00\xef\x7c\xbe\x1f\x76\x7e\xfb\x33\
-\x05\x2e\xb1\xc8\x43\x01\x9e\xe8\x07\x5f\x7e\x4f\x35\xd2\xef\x1d\
-\x75\x14\xa1\xce\xf9\xe4\xbb\x5f\x68\x34\xd0\xab\x9b\xdf\x87\x8b\
-\x96\x2c\x85\x0a\x95\x11\x0a\x1b\x94\x50\xa9\x32\xb0\xd6\xbd\x87\
-\x59\x5d\xcb\xfa\xef\xf9\xf5\xdf\xdf\xb1\xf5\x9c\x11\x16\x75\xbb\
-\x8d\xa3\x8e\x32\x65\xdb\xda\x46\x0c\x43\xd6\x61\xc8\x00\x00\x20\
-\x00\x49\x44\x41\x54\x58\x84\xfe\xfb\x66\x57\xf3\x32\x87\xb7\x45\
-\x6e\x76\x9c\x3d\x2c\x23\xb3\x2e\xa5\x6f\xbf\x34\xe4\x60\x6a\x4f\
-\x03\xb9\x7b\x44\xa7\xb5\xf4\xb7\xb8\xe7\x4e\xd6\x3b\x5b\xe7\x11\
-\x5f\x17\xea\x0f\x68\xc1\x1c\xc6\xcf\x36\x7f\x26\xfb\x2d\x9b\xf6\
-\x0d\xdd\x5f\x61\xf8\xc7\xf1\x0b\x28\xa4\x06\x01\xbf\xdd\xff\xb9\
-\xeb\x86\x01\x49\xb8\x74\x3b\xfa\x3d\xd2\x39\xa1\xce\x23\xf1\xca\
-\x9c\x5b\x87\x58\x49\x0d\x06\xb4\xf2\xb1\x11\xcd\x6c\x50\xc0\x0c\
-\xcb\x6c\x98\xb2\x68\x19\xa4\xdf\xb1\xaa\x5b\x17\x63\xb5\x83\x3e\
-\x5a\xf9\xf4\xfa\x77\xad\xa3\xee\x9d\xca\xf9\x97\x83\xc2\x35\x1b\
-\xa1\xef\xa6\x6f\xcb\xa2\x93\xb9\xec\x30\x3e\x5c\x83\x09\x5b\x3e\
-\xc1\x65\x14\x4d\x99\x26\xea\xb8\xa0\xe3\xf9\x60\x36\x86\xa9\x87\
-\xc1\xe9\x46\x55\x1f\xc2\xdd\x0f\xff\x3b\xac\x07\x3a\x67\x0b\xa8\
-\xac\x5e\x3a\x41\x6b\x6a\x9a\x03\x8b\xaf\xbb\x15\x9e\x78\x75\x0d\
-\xbc\xbf\xf7\x3b\x0a\x5c\xe2\xc6\xa1\x00\xe6\x81\x9d\x6a\x88\xef\
-\x3e\xe4\x7d\x1f\x7c\xce\x87\x2c\xf4\xdb\x9d\xc3\x3f\x96\xa7\xdb\
-\xc9\x56\x0a\x08\xfb\x77\x77\x7f\x03\xb7\x3f\xfc\x24\x98\x5a\xe7\
-\x43\x6e\x8d\x14\x4a\x24\x6a\x3a\xf7\x24\x33\x3b\x41\x65\xf7\xd2\
-\x7d\x7d\x38\xeb\xbe\x3d\xf0\x79\x86\x58\xb8\xb6\xd1\x41\x3e\x46\
-\xaa\x4f\xe1\x61\x1c\x63\x5d\x88\x70\x9d\x70\xdf\x05\x9d\xff\xa7\
-\xc1\xdb\xf2\x19\xb6\xeb\x07\x0c\x9e\x46\xab\xb6\xa5\x75\xbc\x79\
-\xce\xec\x3e\x43\x87\x0d\xa3\x3c\x3c\xea\xa2\x78\xb8\x07\x1a\x38\
-\x60\xb4\x28\x2f\x57\x92\xaa\xb7\x79\x32\x31\x13\xce\x30\xb9\x5b\
-\xd7\xa3\xf5\xf7\x3b\xfe\x7d\x28\x16\x58\x76\x46\x39\x8b\xb3\x5d\
-\x23\xeb\xa6\xeb\x77\xa4\x24\x34\x93\x28\x19\x06\x13\xb7\x0e\xd9\
-\x50\x4d\x42\xad\x7c\x33\x94\x4b\x54\xd4\xca\xcf\x6a\x3c\x0f\x26\
-\x5d\xf3\x2f\x66\x42\xf5\xbe\x8d\x31\x41\xbf\xfd\xa4\x6c\x67\x7c\
-\xfd\x64\x3b\xe5\x2d\xf4\xa5\xeb\x59\xd7\x3e\x41\x2d\x7d\xb9\x67\
-\x0e\x68\xed\x1e\xd0\x93\x89\x3a\x32\x94\x67\xa3\x78\x3a\x6a\xb8\
-\xbd\xad\x1c\x3a\xa7\x1d\x19\x20\x1d\xe7\x05\xd9\x82\x80\xc0\x92\
-\x84\x5e\x2a\xb0\xd3\x27\xef\x71\xbd\xe0\xda\x9b\xe1\x99\x37\x37\
-\xc2\xfb\x08\xdc\x5d\x07\x7e\xa5\xd0\xfd\xe0\xcb\x03\xf0\x3e\x82\
-\x39\x36\x3d\x10\x42\x79\xbf\xef\xe5\x69\xd0\xf1\xb4\xb3\xc0\xd1\
-\xc4\x27\x08\x7b\xf2\xf9\xfc\xda\x2d\x30\x6f\xf1\x95\x50\x4a\x36\
-\xfc\xab\x57\x42\x95\xd2\x44\xe7\x9e\x14\x56\x26\xf6\x9e\xba\x73\
-\xe2\xcc\x83\x44\x69\xac\xc6\x58\x7c\x65\x1a\x51\x89\x21\xfb\x37\
-\x96\xe9\x77\xd8\xb6\x5f\xd1\xbb\x9b\x9b\xb5\x4d\xb3\x26\x95\x57\
-\x2b\xfa\x8e\x1e\x39\x52\xc4\x67\xe4\x51\x21\xdc\xc3\xa4\x4f\x2d\
-\x48\xf1\xb4\x2e\x1c\xaf\x77\x35\xce\xc5\x61\xde\x5b\x08\xde\x9f\
-\x8d\x01\x56\x7d\x37\x14\xbe\xe7\xc8\x00\x3e\x81\x25\x09\xbd\x23\
-\x56\x12\xb1\xf2\xeb\xc9\x3b\x6f\x89\x95\x2f\x55\x43\x9e\xce\x0d\
-\x53\xcf\xb9\x19\x32\x6e\x79\x89\xf1\xe5\xf7\x18\xf0\x19\xe8\x53\
-\x9f\xfe\xf2\x35\x90\x75\xdd\x93\x50\xba\xf0\x7a\x90\x34\x9e\x0e\
-\x1a\xbc\x6f\xec\xd8\xc1\xc0\xee\x9f\x62\x10\x80\x1f\xf4\x7b\xa4\
-\x3a\x80\x23\x3c\xd2\xd9\xa3\x95\xac\xb0\x30\x5b\x1d\x5f\x71\xdb\
-\x9d\xf0\xdc\x9a\x4d\xf0\x0e\x5a\xd4\x1f\xa3\x65\xff\x11\x81\xfd\
-\x57\x21\x60\x1d\x41\xdf\xdb\xcb\x68\x47\xc0\xf7\x1d\x17\x06\xf8\
-\xe4\xda\xe4\x1e\x56\xbf\xbf\x0b\xae\xbb\xfb\x21\x50\x3a\x5b\x21\
-\xaf\x56\x0e\x15\x64\xdf\x1c\xac\xa7\x24\xa4\x98\x8c\x4e\xb5\xd4\
-\x9d\x23\x00\xdf\x57\xae\xee\xd6\x43\xa8\x07\xf0\xef\x75\x3a\x67\
-\xd3\xd9\xce\xd9\x67\x4d\x2a\xaf\x50\xf6\xa5\x8c\x4c\x3e\x8a\x80\
-\x4f\xe4\x84\xec\x6c\x91\x6c\xce\xec\xe1\x06\x97\xc7\x69\x70\xb5\
-\xfe\xc7\xe0\x6a\xf9\x95\xcd\x88\x6e\x05\x7e\x6f\x57\x1f\xf0\xdd\
-\x0c\xf0\xe9\xb2\x79\x6c\xf4\xe4\xe5\x11\x64\xa9\x7a\xb9\x54\x03\
-\xc5\x32\x3d\xe4\x38\xcf\x80\xc9\x97\x3c\x00\x13\xef\x5c\x47\x81\
-\xeb\x0f\xd3\x4c\xec\xd6\x0a\xd1\x81\x9f\x99\xc8\x25\xee\x9d\xe9\
-\x37\x3c\x0d\x25\x8b\x6e\x85\xfa\x59\xe7\xd2\xbd\x54\x74\x56\x17\
-\xdd\x7f\xc7\xe8\x66\x1a\x3e\xa7\x3d\x9d\xcf\xbd\x4d\x89\xdb\xc3\
-\x40\x5d\x38\xd8\xc9\x5b\xdd\x20\x27\xfe\x7a\x57\x0b\xcc\x5e\x78\
-\x21\x2c\xb9\xe7\x21\xb4\xa4\xdf\x86\x77\xf7\x7c\x0b\x3b\xbe\xfe\
-\x09\x3e\xda\x7f\x90\x07\xe3\x48\x60\x6f\xff\x5d\xb0\x06\xfe\xfe\
-\x5d\xfb\xdf\xf9\xe9\xec\xf9\x1e\xad\xfa\x83\xb0\xfd\x9b\x9f\x60\
-\xcb\xe7\xfb\xe1\x81\xe7\x5e\x01\xf7\x19\xe7\x41\x19\x82\xbe\x50\
-\xac\x86\x1a\x9d\x05\x24\x66\x07\xdd\x28\x8d\x18\x2a\x64\xef\x1c\
-\xe2\xbf\xf7\xb9\x74\x8e\x30\x0d\x69\x1c\x76\x5a\x5b\x90\x77\x2d\
-\xbf\x61\x9e\xac\x34\xb8\xbd\xf3\xf4\x96\xd3\xc7\x64\x4c\x10\x1f\
-\x3d\xdb\x6c\x72\xd6\x7d\xbd\xd7\xd3\xdf\xdc\xd8\x34\x03\x41\xb6\
-\x02\x2d\xbe\x03\x08\xb5\xbf\x7b\xba\x40\x7b\xa3\x72\x0d\x9f\x0e\
-\xe9\x5d\x4d\xd4\x97\xaf\x22\xbe\x7c\xb4\xf6\xea\x75\x76\xa8\xc4\
-\xc6\x55\x2a\x53\x43\x3e\x0e\x9d\xa7\xcd\xbb\x1c\x26\xdd\xf0\x2c\
-\xfb\x12\x13\x02\xdc\x0d\x8c\x06\x59\xf4\x5d\x0d\xfc\x0c\x3e\xf4\
-\xf1\xef\xc9\xb7\xbe\x0c\x05\x17\xdf\x0d\xb5\xf3\x16\xa3\xf5\x47\
-\x26\x73\x9d\x34\x5e\x5f\xef\x62\x2d\x3e\x62\xf1\x7b\x04\xf8\xfb\
-\xcb\xbc\x85\x2a\x9d\xb7\x21\xb0\x37\x33\x61\x97\x67\x5c\x74\x25\
-\x2c\x7f\xec\xdf\xb0\xea\x9d\x1d\x3e\xcb\x9a\xb8\x73\xc2\xc1\x9b\
-\x00\xfb\xdd\x3d\x8c\x86\x82\x37\xff\x38\xbf\xb6\xff\xce\x97\x46\
-\x88\x74\x3e\x62\x27\x88\x9f\xc5\x0e\xe8\xfc\xeb\x6e\x81\x0a\x8d\
-\x19\x8a\x25\x6a\xfa\x46\xab\x7a\xe2\xbb\xc7\xd1\xa8\xd2\xee\xa1\
-\xa1\x98\xc4\x9d\xa3\x77\x1f\xb9\xc0\xef\x42\x45\x4b\xbf\xe5\x27\
-\x83\xbb\xf9\x79\x93\xbb\xb9\x5e\xeb\x3c\x6d\x68\xff\x41\xc3\x44\
-\x2c\x30\x7b\x12\xd7\x89\x91\x01\xfd\xfb\x27\xe9\xac\xb6\x93\x0d\
-\x4d\xb3\x9a\xf5\x9e\xe6\xb5\x08\x7b\xf2\xc0\x82\x65\x1f\x42\xf9\
-\xc0\x27\x70\xf4\xf9\xf2\xd1\x6a\xa2\xbe\x7c\xad\x19\x2a\xe4\x5a\
-\x28\x11\xab\x20\xd7\xdc\xc2\xb8\x76\xb8\x97\xa4\x84\x83\x71\x77\
-\x00\x9f\x85\x3e\x0d\x15\xbd\x67\x03\x4c\x5a\xfa\x06\xcc\xb8\xea\
-\x11\xa8\x38\xf3\x4a\x90\xb9\x67\x83\xd6\xe2\x00\x83\xd5\xc1\xf8\
-\xf6\x05\xe0\x07\x28\xb7\x01\x9a\xc4\x60\x03\x09\x8e\xe4\xac\xad\
-\xa7\xc1\x25\x4b\x6e\x87\x47\xfe\xf3\x06\xac\xdf\xfe\x39\x85\x2e\
-\xb1\xac\x89\x4b\x85\x0f\xdf\x77\x59\x8d\x04\xfc\x77\x43\x1e\xdf\
-\x1e\xf8\xef\x92\x73\xd9\xef\xde\xd9\xc3\x68\x40\x3a\x7b\xc8\x84\
-\xef\x0f\xf4\x3e\x36\x7c\xbc\x1b\xae\xc5\x51\x87\xae\x69\x1e\x14\
-\x49\x34\x74\x0b\x85\x5a\x62\xdd\x53\xdf\xbd\x87\xae\x15\x60\xac\
-\x7b\xb6\x73\x17\x80\x1f\xac\x6d\x84\x7f\xa8\x3b\xf5\xce\x96\xcb\
-\x8d\x8d\xb3\xb2\x87\x0e\x1f\x7e\x74\xf8\xf2\x53\x52\x44\x22\xa5\
-\x5e\x9b\x62\x6b\x3d\xad\x58\xeb\x40\xeb\xde\xd3\xba\xbb\x17\x64\
-\x78\xaf\x57\x0a\x7c\x62\xe5\x93\x10\x4d\x6c\x3c\x34\x52\xc3\xe2\
-\xf4\x45\xec\x94\x49\xd5\x50\x84\x0d\x2d\xc7\x7e\x1a\x4c\xbe\xec\
-\x01\x1a\x17\x3f\xf1\xde\x70\xfb\xec\x70\x1a\xcd\x7e\x3b\xc1\xbf\
-\xc7\xbe\x47\x0f\xb3\xf7\x0e\x76\x40\x77\xae\x86\xe9\x37\x3c\x05\
-\xc5\xe7\xdf\x0c\xf5\xb3\x16\x82\xca\xd1\x44\x5d\x3c\x7a\x1b\x63\
-\xed\xeb\x58\xcb\x16\x87\xb8\xac\xf6\x7c\xbe\x77\x8f\xb6\xf8\xca\
-\x57\xc3\xfa\xea\x49\x7c\x3d\xe9\xdc\xe7\x9c\x77\x31\x2c\xb9\xe7\
-\x61\x78\x76\xcd\xdb\xf0\xf6\xa7\xfb\xd0\xa2\xfe\x91\x42\x96\x80\
-\x9a\x83\xf0\xbb\x3c\x78\x73\x80\x8f\xa8\xfc\xe3\x23\x9d\xcb\x7e\
-\xcf\x01\xdf\x77\xbd\x3d\x0c\xf0\x3f\xfa\xfa\x27\xd8\xf8\xc9\x97\
-\x70\xdf\xd3\x2f\x83\x6b\xc1\xf9\x30\x53\xae\xa3\x71\xf7\xcc\xfb\
-\x6a\x6d\x74\xdd\x08\x19\x8d\x6a\xd8\x77\xea\xea\x7d\xe5\xdb\xd3\
-\xf9\xdd\x3b\x15\x59\x88\x56\x7e\xcb\x2a\xfc\xdb\x22\x96\x48\xfb\
-\x0d\x1b\x3a\xf4\xc8\x85\x3e\xb7\x84\x78\xec\x98\x49\xc9\x06\xd7\
-\xfc\xc1\x38\x5c\xd5\x19\x5c\x2d\xeb\xf5\x8c\xef\x5e\xb0\xee\xa3\
-\xa9\x10\x6c\x83\xa1\x56\x3e\x5a\x4d\x24\x2e\x9f\x58\x51\x75\x68\
-\x4d\x55\x91\xcd\xa9\xea\xe5\x50\x28\xd7\x43\x56\xcb\x05\x34\x6a\
-\x87\x02\x3f\xe2\x62\xac\xee\x00\x3e\x7b\x2c\x5a\xf9\x64\x3f\xfd\
-\xf1\xf7\x92\x9d\x36\x5f\x85\xfc\xcb\xee\x85\xea\xd3\x2f\x01\x39\
-\x5a\xfb\x1a\x84\x82\xce\xe1\xa1\x1b\xc5\xe9\x69\xd8\x5e\xb3\xef\
-\x59\x8f\x36\xcb\x9f\xff\x3c\xbe\x67\xc4\xe7\x25\xbe\x7a\x02\x7b\
-\xe2\xc2\x21\x4a\x5e\x64\xb2\xf0\x8a\xeb\xe1\xde\x7f\xfd\x07\xd6\
-\x7c\xf4\x39\x7c\x88\x70\xdd\xfe\xcd\x2f\xf0\x1e\x5a\xf5\x7c\x00\
-\x87\xd2\x6d\xac\x76\x74\x5c\xbc\xe7\xbe\xbb\xf7\x00\xbc\x8f\xd6\
-\x3d\xd1\x67\xb0\x23\x3a\xfd\xe2\xab\xa1\x4a\x63\x85\xbc\x5a\x19\
-\x94\x63\x3d\xac\xd3\x5b\x69\x87\x45\x9e\x83\xc4\xdd\x33\xa1\x98\
-\x02\xec\x3b\x50\x62\xe1\x1f\x46\xfd\x1e\xdb\xf7\x85\xde\xd9\xb3\
-\x47\x96\x94\x94\xa4\x11\x66\x26\x1f\x89\x7b\xee\x70\x1b\x05\x8d\
-\x1c\x9f\x9e\xa2\xf7\xce\x1f\xa5\x77\x34\xb7\xe2\xc3\x7d\x8c\x4a\
-\x42\x30\x05\xe0\x47\xa1\x5c\xa3\x21\x43\x63\xd2\x90\xe8\xe2\x1b\
-\xb3\x0b\xc4\x06\x3b\xd4\x68\xcc\x50\x41\x56\xe0\x22\xf4\xf3\x95\
-\x66\x98\xb6\xe0\x5a\xba\xed\xc2\xc4\xfb\xde\x0e\xeb\xde\xe9\x56\
-\xe0\xd3\xbf\xdf\xa2\xbb\x6c\x8e\xc7\xfb\xc9\x58\x8e\xd6\xfe\xf5\
-\xff\x86\xe2\x45\xb7\x41\xed\x9c\xf3\x41\xe1\x6a\x65\x62\xf6\xed\
-\x6e\x30\xb0\x71\xfb\xc7\x02\xf0\x99\xe8\xab\x46\x3a\x31\xab\x44\
-\x8b\xd8\xd8\x38\x07\xe6\x2d\xba\x0c\x96\xac\x78\x18\x9e\x5e\xb3\
-\x09\x36\x7d\xfa\x15\x85\xfd\x07\x68\xd9\xbf\xf3\xe5\xf7\x01\x30\
-\x0e\x07\xe6\x6d\x61\xc0\x1d\x7c\xee\xb6\xdd\xdf\x52\x8d\xe6\xbc\
-\x6d\xbc\x73\xc8\xbd\x6c\xff\xe6\x67\x78\x65\xcb\x87\x70\xc5\xd2\
-\x15\x50\x67\x74\xd2\xa8\x9c\x12\x32\x51\xab\x31\xd1\x80\x02\xe2\
-\xbb\x67\x26\x6a\x9b\xd8\x95\xb5\x02\xf0\x3b\xd0\x36\x76\x94\xf7\
-\x9b\xce\xd1\x7c\x9b\xb9\x69\x6e\x76\x6e\x79\x59\x7f\xc2\xcc\x23\
-\x1a\xf8\xa3\xc7\x65\xa6\x1a\x9a\xce\x9c\xa8\x75\x34\x9d\x83\x0f\
-\xf7\x39\x56\xfc\xa0\x05\x56\x21\xd4\xcd\xb7\x86\x5a\xda\xfd\xe6\
-\xd3\x68\x1a\x5c\xb8\x74\xc2\x1c\x13\xee\xf8\x68\xd2\x09\x79\xac\
-\xbb\x83\xe7\x89\x22\x1d\x1d\xcf\xca\x27\x7b\x93\xd0\x09\x5c\xb2\
-\xe5\x82\xda\x48\x63\xf3\x4b\xea\x64\x90\x63\x99\x05\x93\x17\xdd\
-\x01\xe9\x77\xac\xa4\xd0\xa7\x7b\xe7\x77\xd6\x27\xcf\xfb\x7f\xfc\
-\xe1\x9c\xe4\xcd\x59\x9b\x7d\x6f\xcf\x9a\x72\xcb\x4b\x90\x7b\xc5\
-\x43\x50\xb6\xf0\x7a\xa8\x9f\x7d\x1e\x28\xdd\x73\xe8\x56\xcb\x3a\
-\x1a\xc2\xc9\x6c\xb9\x6c\xe0\x01\x23\xea\x3c\xeb\x44\x3e\xc7\xa3\
-\xe1\xeb\x49\x2b\xaf\xec\xfd\x1d\x36\x81\xbc\xda\xee\xa1\x56\x30\
-\xf1\xd7\x5b\x9a\xe7\xc1\xbc\xf3\x2e\x86\x2b\x6e\xb9\x0b\xee\x7f\
-\xfa\x65\x78\x6d\xeb\x76\x04\xec\xb7\xf0\xe1\x37\x0c\xec\x09\x6c\
-\xb7\x52\x40\x7f\x97\x20\xfd\x96\x49\xef\x0b\xfc\xfc\xe2\x5b\x16\
-\xfe\x1d\x9f\xf7\x1e\x5a\xf5\xe4\x7e\xd6\x7f\xbc\x07\x6e\x7c\xf0\
-\x9f\x60\x9c\x35\x1f\xf2\xea\xd0\xc8\x40\xad\x52\x19\xe9\xd6\x1f\
-\x52\x8b\x93\x8e\x3e\x7d\x71\xf7\x61\xda\x53\xb4\x6d\x30\x9a\x36\
-\xd7\x5d\xe5\x1c\x0f\x77\xa2\x7c\x76\x8e\x81\x7f\xe2\x68\xef\x21\
-\x4b\xd3\x9c\x9a\xfc\xb2\xca\x41\x84\x99\x47\x34\xf0\xc7\x4c\x98\
-\x9c\x6a\x69\x39\x33\x53\xe7\x68\x5c\x84\x0f\xfd\x05\x01\x3e\x36\
-\x8a\x36\x6e\x72\x32\x54\x26\x46\xcc\x2c\x77\x68\x8d\x54\xc9\x42\
-\xa7\x17\xba\x62\x05\xc3\x3a\xf4\x6f\xed\xaf\x1b\x4d\x81\x07\x77\
-\x02\xed\x00\x15\xe1\x39\x48\x43\xa2\x11\x3b\x76\x2f\xf5\x95\x92\
-\xc9\x3d\x32\x94\x26\xaf\x42\x2c\xab\x57\x40\x81\x54\x0b\x59\xae\
-\x05\x30\xe9\x8a\xff\x83\xf4\x3b\xd7\x30\x96\x7e\x0f\xad\xc2\x0d\
-\xe9\xd7\x27\x51\x3c\x04\xfc\x2b\x98\xd5\xb9\x53\x6f\x7e\x01\x0a\
-\x2e\xb9\x07\xaa\xe6\x5f\x0e\x92\xc6\x33\x40\xe9\xc0\x51\x0c\x67\
-\xf1\x93\x18\x7e\xce\xea\x77\x35\xb1\x2e\x9f\xd6\x76\xda\x3e\xbf\
-\xc2\xd7\x9d\x58\xeb\x47\x47\x9d\x76\x24\x25\xa1\x88\x74\xc2\x1d\
-\xcb\x8b\x82\x1e\x3b\x33\x62\xcd\x93\x97\x95\x90\x6d\x12\x1a\x4f\
-\x5f\x08\x8b\xae\xbe\x19\xee\x7c\xfc\x19\x78\x71\xe3\x7b\xf0\xf6\
-\x67\x5f\xc3\x87\xfb\x7e\x84\x0f\xf6\x1d\x44\x0b\xfb\x7b\x0a\x64\
-\xaa\xbb\x13\xa8\x5f\x84\xd0\x08\xc7\x13\xd8\x13\x57\xce\x47\x68\
-\xd9\xbf\xfd\xd9\x7e\x78\xf0\x85\xd7\xc1\x73\xe6\x62\x1a\x7e\x99\
-\x87\x06\x46\xa9\x5c\x0b\xf5\x3a\x2b\xd6\x43\x7f\x18\xa6\xc6\xc5\
-\x9f\xa8\x4d\x7c\xbe\x46\xd3\x4e\xe2\xb9\x16\x37\x87\x14\x50\xb7\
-\x22\x18\x70\x9d\xa9\x4b\x3c\x6d\x63\xef\xe9\x4f\xbd\xab\xe9\x09\
-\x5b\xcb\x69\xca\x82\xb2\xda\x21\x84\x99\x08\xfc\x23\xcf\x89\xcf\
-\xf5\x52\xe3\x4e\x9d\x9c\xea\x68\x5c\x30\x4e\xeb\xf0\x9e\x69\x70\
-\x51\x0b\xbf\xad\x4b\x81\xef\x62\xb5\xa3\x0a\x10\x2b\xf0\x03\xd2\
-\xe5\x5d\x97\xfd\xbe\x5b\x80\xef\x6a\xf2\xf9\xf2\xc9\x3e\xe3\xe4\
-\xe5\x12\xd5\x38\xa4\x2e\x27\x93\x67\xc4\xb5\xa3\x30\xc3\xf4\xd6\
-\x8b\x60\xd2\xd5\x4f\x30\xaf\x43\x5c\xd1\x73\x5b\x2f\x84\x54\x02\
-\xfd\x7b\x36\x31\xdb\x32\xa0\xe5\x9f\x79\xc7\x2a\x98\xbe\xe4\x19\
-\x06\xfc\x67\x5c\x06\xe2\x26\x06\xfc\x5a\x32\xb1\x4b\xa2\x7a\xb8\
-\xbd\x79\x48\x38\x67\xac\xc0\xe7\x95\x97\xaf\x4c\x3a\xaa\x1b\x61\
-\x7e\x8b\x15\x4c\xcc\x0a\x59\x0f\xc8\x4d\x0e\x90\x18\xac\xf4\x93\
-\x94\x9f\x67\xfe\x42\x38\xff\xaa\x9b\x28\xe8\x9f\x5f\xbf\x15\xd6\
-\x6d\xdf\xed\xb3\xa2\xdf\xfd\xf2\x00\x5a\xf5\x08\xfb\xdd\xdf\xf9\
-\x01\xdd\x83\xc0\x7f\x67\xef\xf7\xf0\xe1\xfe\x9f\xe0\xdd\xaf\x0e\
-\xc0\x53\x6f\x6e\x84\xd3\x2f\xbe\x0a\x2a\x35\x16\xc8\xa9\x96\x50\
-\xd8\x93\x37\x59\xd5\xd3\x45\x56\x4e\xdf\xa8\x45\x1b\x2d\xf0\xb9\
-\x36\x73\x24\x03\x3f\x5c\x5d\x8a\x86\x3f\xae\x40\xe0\xa3\x61\xf0\
-\x4f\x4b\xd3\x19\x8a\x82\xb2\xba\xa3\x01\xf8\x13\x92\x1d\xde\xd3\
-\x4f\xd4\x3b\x1a\x1b\xf1\x41\x3f\x44\x25\x4b\x8c\xdb\xfc\x0f\x4e\
-\xa0\xd9\x1a\x9c\x19\x51\x36\xc8\xd6\xd0\x99\x1d\x2e\x0d\xfe\x6f\
-\xc1\x9f\x21\x8f\x8b\xe2\xbe\x82\xd3\x8c\xa2\xb3\xf1\xdf\x7b\x74\
-\x16\x2a\x89\x76\xd0\xb3\x8d\x49\xc3\x5a\xf9\x0a\x1b\x33\x81\x5b\
-\x4f\xac\x7c\x84\x3e\x89\xda\x29\x16\xab\x20\x4f\xe3\x84\x69\xf3\
-\xaf\x81\x49\x37\x3c\x47\xe1\x9a\x7e\xef\xa6\xb0\xdb\x1d\x77\x85\
-\x46\xe3\xf6\x99\xc0\xfa\xf6\xe9\xfd\xa1\xb5\x3f\xf9\xf6\xd7\xe8\
-\x1e\xfb\x05\x97\xdc\x09\xe5\x67\x5f\x4d\x17\x6d\x91\x2d\x1a\x08\
-\x44\x74\x56\x04\xbf\xc5\x0e\x06\xab\x93\x07\x7f\x2e\x4f\xfc\x91\
-\x20\xed\xca\x3f\x52\x83\x8c\x74\x7c\x34\xe5\xdc\xae\x0c\x39\xbf\
-\xbc\x0b\x64\x06\x3b\x48\xd8\x49\x4c\xd2\x39\x5b\x5a\x4e\x83\xd9\
-\x0b\x2f\x82\x8b\x97\x2c\x85\x3b\x1e\xf9\x37\x3c\xf9\xfa\x06\x58\
-\xf5\xfe\x2e\x78\xfb\x8b\x6f\x10\xf2\x3f\x50\x25\xee\x9b\x2d\x08\
-\xe0\xae\xd0\xb7\xe3\x38\x7e\x2b\xde\xcf\xfb\x38\xe2\x78\x7f\xff\
-\x8f\xf0\xfc\x86\x77\xe0\x92\x9b\x97\x43\x83\xd1\x05\xf9\xb5\x72\
-\x28\x6a\x50\x42\xb5\xda\x44\x61\x4f\xac\x7b\xb2\x85\x02\xf5\xdd\
-\xdb\x9b\xa8\x41\xa2\x0f\xce\xa3\x70\xf9\x1a\x0f\xf0\x63\x2d\x9f\
-\x70\xe5\x1b\xea\xb8\xe0\xf6\x17\x6d\x5a\xb1\xf0\x27\xf0\x3e\xdb\
-\xd8\xef\xfe\xd0\x3b\x9b\x1e\xb0\xb4\xcc\xad\x3e\xa2\x5d\x3a\xdc\
-\x4d\x4f\x98\x30\x2e\xd9\xe3\x9d\x3d\x50\x6f\x6b\x52\xe2\x10\x7d\
-\x15\x56\x88\x5f\xf0\x81\xdb\x62\x2a\x8c\x18\x7f\xd7\xb3\x1a\x53\
-\x23\xf7\x9d\xdb\x1c\x7d\xa1\xc5\x03\x8c\x88\xc7\x86\xaf\xfc\x1c\
-\xf0\x69\x74\x07\x82\x84\x84\xbf\x91\xa1\x34\x69\x74\xb5\x38\xb4\
-\xae\x54\x99\xa0\x54\xaa\x81\xa2\x7a\x05\xcc\x30\x36\xc3\xd4\xb3\
-\xc8\xde\xf9\xaf\x32\x51\x3b\x2b\xde\xea\x02\xe0\x27\xe8\x95\x8a\
-\x74\xc1\xd6\x5b\x74\x07\x4e\x12\x5a\x3a\xed\xc6\x67\x21\xff\xf2\
-\xfb\xa0\xf4\xdc\x25\x50\x33\x6f\x31\x48\xbd\x73\x19\xeb\x11\xc1\
-\x42\x54\x67\x67\xdc\x3e\x24\xca\x47\x47\x62\xfa\x9d\x4d\xbe\xbc\
-\x69\xa7\x5c\xc7\x10\x06\x0a\x9c\xeb\xc5\x57\x5f\xf8\xf5\x27\x20\
-\xff\xdb\xa7\x4d\x00\x4f\x5e\x44\x42\x2c\x79\xfa\x5e\x59\xb3\x8b\
-\x86\x57\x12\x6b\x9e\x00\xd0\x3e\xfb\x0c\x98\x7f\xe1\x3f\xe0\xca\
-\xdb\xee\x81\xbb\x9e\x78\x0e\x9e\x43\x8b\x7e\xfd\xce\xbd\x68\x39\
-\x1f\xa0\x4a\x2c\x79\x3e\x64\x63\xd3\x6f\x78\x1a\xe1\xb8\xcf\xbf\
-\xa1\xba\xf9\xf3\x0e\x8e\xe3\x1d\x4b\xfe\x7e\x07\x3b\x21\x72\x8f\
-\x6f\xbc\xfb\x09\x5c\xb5\xfc\x41\xd0\x78\xe7\x40\x41\x9d\x82\xc2\
-\xbe\x4a\x6d\x84\x3a\xe2\xca\x31\xd9\xd9\x30\x4c\x2f\xad\x8f\x3a\
-\xb2\x85\x46\x47\xed\x22\x9a\xb6\x11\x4d\xbb\x89\xf4\x7b\x88\xdf\
-\xf8\xe5\x16\xd5\xbd\xc5\x72\x4e\x9c\xe0\xc7\x3a\xd6\xc6\xd6\xbd\
-\xff\x69\xed\x8d\xb7\xe9\x1b\xe7\x66\xe5\x1c\xd1\x93\xb6\x6c\x2c\
-\xe9\x88\x11\x27\x88\xac\x16\x6b\x8a\xd9\xdd\x9c\xaf\x77\xb4\x2c\
-\xd7\x13\xb7\x4e\xb4\x19\x18\x67\x87\xa0\x77\xf1\x1b\x73\x94\x05\
-\x16\x54\x39\x42\x15\x56\xcc\x15\x87\x3b\xcf\x1d\xe1\x9c\xa8\x81\
-\xef\xf7\x0b\x53\xe0\x13\x2b\xdf\x4a\x26\x70\x1d\xcc\xfb\x6f\xb5\
-\x16\xa8\x50\xea\x61\xa6\x58\x0d\x85\x0d\x2a\xc8\x41\xe8\x67\x9e\
-\xbf\x14\xd2\x6f\x43\xe8\x93\xf7\xe0\xf6\x5a\xe0\x73\x8a\xd0\xbf\
-\x7b\x23\xe3\xeb\xc7\x34\x33\x6f\x7f\x1d\xb2\xae\x7b\x02\x8a\x2e\
-\x5c\x06\x15\x67\x5d\x45\x23\x7b\xa4\x9e\x79\xb4\xa3\xd3\x9a\x6d\
-\xa8\x76\xa6\x13\xc0\xff\xeb\x9d\x5e\x9a\x2f\x3a\x76\xa1\x1a\xa7\
-\xfe\x91\x40\xb3\x0f\xec\xa1\x81\x1f\x58\x3e\x1c\xf0\xb9\x75\x10\
-\x34\x2d\xa7\xbf\xc3\x25\xb0\x57\x62\x67\x2b\x33\xda\x41\xac\xb3\
-\xa0\x5a\x69\xd4\x8d\x7d\xf6\x7c\x98\xb7\xe8\x52\xb8\xe8\x86\xa5\
-\x70\xeb\x43\x4f\xc0\x13\xaf\xaf\x87\x95\xef\x7d\x0a\x9b\x3e\xff\
-\x1a\xb6\x10\xc0\x53\x97\xcd\xf7\xcc\xdf\x21\x60\xbf\x99\x55\xfe\
-\xdf\x9b\x83\x7e\x8f\x15\xf8\x9b\x39\x0d\x71\x8d\x80\x6b\xf3\x3a\
-\x86\x77\xbe\x3a\x08\x6f\xe0\x28\xe4\x86\xfb\x1e\x03\x43\xcb\xe9\
-\x74\xcb\xe3\x12\x89\x86\xee\x95\x43\x16\x58\x91\xb5\x20\x32\x0b\
-\x09\xc3\x74\xd1\xcd\xdd\x48\x7e\xd0\x17\xdb\x47\xd9\xbe\x02\xca\
-\xc0\x1d\xd8\xd9\x76\x27\xf0\xdb\x7d\xd7\xad\xc0\xa7\x75\xea\x90\
-\xce\xd9\xf2\x0d\xe6\xdf\x62\x4d\xeb\xac\x91\x53\x8a\x8b\x69\x58\
-\xe6\x11\xfb\x2a\x44\x0e\xfa\xa3\x47\x8f\x4a\xd2\xdb\x9c\xa7\x60\
-\x06\xcc\xd1\x39\x9b\x37\x06\x66\x26\xa7\x81\x99\x1c\xd8\x00\xc3\
-\x58\x70\x5d\xae\x11\x80\x1f\xe2\xbb\xf6\xbf\x75\xf6\xde\xb9\x8a\
-\xc3\xfb\x8e\x6c\x55\xe0\x68\xa2\x9b\x93\x29\xd1\xca\x25\x43\x6a\
-\x29\x75\xed\x30\xfe\xfc\x0a\x85\x8e\x09\xd5\x14\x6b\x20\xcb\x36\
-\x0f\x26\x2f\xbe\x8b\xdd\x4a\x79\x13\xb3\xfd\x42\x6f\x04\x3e\xef\
-\x6f\xe2\xdf\x27\x11\x3d\x74\x9b\x86\x3b\xd7\x42\xe6\x6d\xaf\xd1\
-\xf7\xe8\xe6\xfe\xe3\x21\x28\xbe\xe0\x36\x28\x3f\xf3\x2a\xa8\x39\
-\x6d\x31\xd4\xb7\x9e\x8d\xd6\xff\xe9\x20\x77\xcd\x62\xa0\x83\xd6\
-\xa6\xce\xea\xa4\x0b\xbb\xb4\x36\x37\x8d\xfa\x21\xef\xdc\xd5\x39\
-\x38\x6d\xa4\xab\x7c\x75\x14\x4e\x8d\x74\x52\x98\xfc\x4d\xf2\x91\
-\xd1\x46\xc6\x6a\xb7\x33\xdf\x91\x51\x05\xb5\xdc\xd9\xad\x0e\x88\
-\x8b\x46\x46\x5c\x18\x26\x27\x3d\xc6\xd4\x38\x07\x9c\x73\xce\x84\
-\x96\xb3\x2e\x40\x4b\xfe\x4a\xb8\xe0\xba\x5b\xe0\x86\x15\x0f\xc1\
-\xfd\xcf\xbe\x02\xcf\xae\xdd\x82\xa0\xdf\x09\x6f\x7d\xba\x1f\xb6\
-\x11\xb7\xcd\xbe\x9f\x60\xdb\xde\x1f\x10\xa6\xdf\xf9\x01\xcc\xb3\
-\xbe\x83\xff\xee\x8c\x76\x26\x1d\xd2\x11\x11\xeb\x7e\xe5\x7b\xbb\
-\x60\xe9\xa3\x4f\x83\xfd\xb4\x73\xe8\xeb\x35\x49\x44\x0e\x89\xb7\
-\xaf\xd1\x58\xe8\xbc\x11\x99\x3f\x52\xd8\x88\x2b\xc7\xe3\xb3\xee\
-\x13\xd9\x76\x83\xdb\x56\x47\x69\x85\xfb\x3d\x7c\x1b\x8d\xa7\x6d\
-\x46\x3a\x87\xdf\xde\x63\x4a\xfb\x67\x04\xfe\x5a\x9d\xa7\xc5\x5e\
-\x23\x93\xf7\x3f\xfe\x68\x58\x6d\xcb\xdd\xbc\xd2\x68\x1c\x64\xf4\
-\x36\xcd\xd4\xba\x9a\x9f\x44\x68\xfd\x89\x7a\xb8\xab\x40\x1d\x6a\
-\x08\x9e\xb8\xc2\xed\x18\xf8\x5d\xad\xd4\xca\x74\x32\x13\xb8\x2a\
-\x12\xa6\x49\xa2\x76\xe8\x82\x2c\x2b\xf5\xaf\x96\xcb\x34\x50\x52\
-\x27\xa5\xc3\xf0\x6c\xd7\x99\x90\x79\xf1\x7d\x90\xbe\x6c\x35\xa4\
-\x77\xb8\x30\x2b\xd0\x17\x1f\x29\x3c\x33\x9e\x10\xcd\x90\xe7\x85\
-\x19\x79\x10\x4b\x7f\xc2\x7d\x9b\x61\xfc\x03\xef\xc0\x38\xfa\xe2\
-\xf6\x0d\x90\xb9\xf4\x0d\x98\x76\xf3\x0b\x90\x7d\xed\x3f\x21\xff\
-\xd2\x15\x50\x72\xee\x4d\x74\x1f\xfe\xba\x59\xe7\xd2\x48\x1f\x19\
-\x8e\x00\x64\x9e\x39\xb4\x13\x50\x3a\x67\x81\xca\x41\xde\x1c\xc6\
-\xe4\x13\xe9\x14\x88\x0b\x86\x8c\x08\x88\x92\xc5\x5f\x6a\xcc\x3b\
-\x62\x99\x33\xea\xa1\xa3\x07\x12\x3a\xc9\x85\x17\xd2\x17\x77\x90\
-\xfd\xce\x9b\xe6\xd0\xf7\xc7\xda\x5a\x4f\x07\xd7\xdc\xb3\x60\xf6\
-\xb9\x17\xc1\x79\x57\xdd\x08\x57\x2f\xbb\x0f\x96\x3f\xfe\x0c\x3c\
-\xfa\xf2\x6a\xea\xeb\x7e\x03\x41\xb9\xf9\xf3\x6f\xe1\x83\xaf\x7f\
-\x81\x8f\xbe\xfd\x2f\x82\xfe\x47\x0a\x51\x02\xd3\x4d\x9f\xf5\xa4\
-\x7e\x1d\x41\xfd\xb0\xdf\x8a\x23\x90\x75\x3b\xf6\xc0\xf2\x7f\x3e\
-\x0f\xee\x05\x8b\xa0\x88\x6c\xdf\x51\x23\x85\x32\x32\x49\xcb\xf3\
-\xdb\x13\x57\xa2\x92\xe6\x15\x3b\xb2\x8a\xe4\x56\x3b\x46\x34\x46\
-\x16\xb0\xee\x9c\xe6\x2f\xb1\x9e\xdd\x8a\xa3\x9c\xe2\xe1\xc7\x1d\
-\x7f\xe4\xc3\x9e\x27\xa2\x49\x12\x71\xb2\x66\xf6\xdc\xd1\x3a\x7b\
-\xd3\x35\x08\xfb\x3d\x14\xfa\x5d\x96\xf9\x9d\x4d\xa3\x17\x03\xdf\
-\xe9\x07\x3e\x89\x5f\x27\x90\x52\xb2\x51\x3b\x0d\x74\x47\x4d\x2b\
-\x5d\xea\x5e\x2a\x55\x43\x49\xad\x94\xb1\xf4\x1d\x0b\x60\xf2\x65\
-\x0f\x42\xfa\xf2\xb5\x90\xfe\xc0\xb6\xa8\x2c\xfd\x9e\x06\x3e\xb5\
-\xf6\xa9\x7f\x7f\x23\xfb\xb2\x95\x4d\xbe\x78\x7e\xf2\x32\xf5\x8c\
-\xe5\x6f\xd2\x4d\xda\xa6\xdd\xf0\x2c\x76\x00\x4f\x40\xee\x95\xff\
-\x47\x3b\x81\xa2\xc5\x4b\x61\xe6\xb9\x4b\xa0\x62\xc1\x95\x50\x3d\
-\xef\x42\xa8\x6d\x5d\x08\x0d\x4d\x0b\x40\xe2\x3d\x0d\xa4\xae\xd9\
-\x20\x77\xb6\x82\x02\x3b\x02\x85\x13\x3b\x03\x92\x9f\xa4\x1c\x3d\
-\xcc\x1b\xc8\x2c\xcd\x73\xa9\x5b\x86\x44\xd3\x10\xa8\x9f\x79\xf1\
-\xd5\x70\xc1\xb5\xb7\xc0\x95\xb7\xdf\x03\x4b\x56\x3c\x02\xcb\xd0\
-\xea\xbd\xef\xe9\x57\x11\xf0\x6b\xe1\x99\xb5\x5b\xe1\x95\xad\x3b\
-\x60\xed\x8e\xbd\xf0\x36\xb1\x8c\xbf\x3a\x48\xad\xe3\xad\x7b\x0e\
-\x50\xd7\x8d\x0f\xf4\x9c\xf6\x20\xf0\x37\x7e\xfa\x35\x55\x02\xf8\
-\xe0\xbf\xc9\xef\xe4\xfe\xdf\xdb\xff\x13\xac\xdb\xf9\x25\xdc\xf3\
-\xd4\x4b\xe0\x3d\x6b\x31\x14\x4b\xb5\x14\xf6\x74\x63\x34\xb5\x91\
-\xee\x84\xd9\x60\xb0\xe3\x68\x92\xd9\xb2\x99\x86\x61\x3a\xfc\xc0\
-\x3f\xd6\xa1\x1f\x0f\xf0\x75\xce\xe6\x8f\xb4\xae\xa6\x66\xad\x63\
-\xee\xd8\x81\x83\x86\x1e\x3d\x9b\xa7\x25\x91\x77\x1b\xa6\x24\x27\
-\x65\xd5\x8a\x07\x99\xbc\x73\x3d\x5a\x67\xe3\x6b\x7a\x67\xd3\xaf\
-\xfc\x87\x17\x34\x3a\xd5\xb1\xc0\x67\x7c\xc9\x4d\xb4\xd1\xd1\x10\
-\x40\x0b\x79\x51\x0a\xb3\x20\xab\x86\x6c\xb0\xa6\xd2\x43\x29\x36\
-\xd6\x62\x84\x7e\x9e\x54\x0f\xd3\xbd\x0b\x21\xf3\xb2\x87\x20\xfd\
-\xce\x75\x90\x7e\xdf\x56\xc6\xc5\x93\x30\xf7\x4e\x14\x3e\xfa\x58\
-\x81\x1f\x12\xfe\x8c\xbb\x87\x2a\x1b\xda\x49\x17\x97\xe1\x33\x91\
-\x95\xbc\x93\x96\xbe\x4e\x17\x76\x4d\x5b\xf2\x2c\x7d\x21\x4b\xce\
-\x3f\x1e\x81\xdc\xcb\xef\xc7\x8e\xe0\x1e\x28\xbc\xf8\x2e\x28\xba\
-\x68\x39\xe4\x5f\xb0\x14\xf2\xcf\xbf\x0d\x6a\x2f\xbe\x0d\x9a\xae\
-\x5b\x06\x57\xa0\x95\x7e\xe3\x3d\x0f\xc3\x2d\xf7\x3d\x0a\xb7\x3c\
-\xf0\x38\xdc\xfa\xf0\xbf\xe0\x8e\xc7\x9e\x81\xbb\xff\xf5\x22\x3c\
-\xf8\xfc\xeb\xf0\xf8\x6b\xeb\xe0\xe9\xb5\x5b\xe0\xc5\xcd\x1f\x50\
-\x0b\x7e\x0d\x02\x7e\xfd\x27\xfb\x28\x2c\x89\x8b\x86\x00\x9e\xb8\
-\x6d\xb6\xb1\xb0\x7f\x1b\x2d\xfc\x8d\x04\xa6\x9f\xed\x67\x3f\x7b\
-\x81\x7e\x1a\xa8\xc4\xd5\x44\x94\xfc\xb6\x05\xef\xf9\xbd\xaf\x7f\
-\x86\xb5\x3b\xf7\xc2\x8a\x67\x5e\x85\xe6\x73\x2f\x81\x72\x95\x09\
-\xb2\x2b\xc5\xd4\xc2\x27\x7e\x7b\x52\x9f\xa8\x2b\xc7\xc4\xc6\xdc\
-\xdb\x18\xd8\x93\xad\x31\x04\xe0\xc7\xa5\x87\x31\xbf\xfe\x8b\xfa\
-\xa2\xc1\xde\x5a\xe9\x76\x9d\x36\x70\xc8\x90\x23\x78\x1f\x9d\x60\
-\xe1\x66\x9d\x4f\x49\xcf\xec\x63\x6e\x3e\xbd\x18\x87\xd7\xb7\xe0\
-\xc3\xfe\xc0\x56\x92\x98\x80\x1f\x4f\x05\x63\x20\xc9\x68\x34\xdf\
-\xc7\x7b\x6d\x7e\x7a\x1c\x98\x43\x1e\xc7\xd7\x78\x9e\x87\x55\xd2\
-\xe0\x34\x74\x05\xa7\x97\x5a\xf9\x74\xdb\x05\xb4\xf2\x49\xa8\x66\
-\x35\x85\xbe\x01\xca\x24\x2a\x06\xfa\x12\x1d\x4c\x6b\x3a\x1f\x32\
-\x2f\xff\x3f\x66\x0f\xfd\xfb\xb6\x40\xfa\xbd\x7c\xf7\x4e\x82\x7c\
-\xf2\x71\x58\xfd\xd1\x1d\x1b\x7c\x7f\x7e\xeb\xdf\xd7\x09\xd0\x85\
-\x5d\xdc\xc4\x2f\x39\x66\x1d\x9d\x07\xc8\xa0\xba\x86\xea\xa9\x4b\
-\xdf\x84\x53\x6f\x5f\x09\x65\xf7\xac\x82\x73\x9f\xdd\x08\xcf\x6c\
-\xfe\x08\xd6\x7e\xf8\x39\xac\xff\x78\x2f\xac\xa5\xfa\x25\xac\x43\
-\xdd\xf0\xc9\x57\x2c\x14\xc9\x84\x27\x33\xe1\xca\x80\xfd\x20\x6c\
-\xdd\x8b\x70\xdf\x7b\x80\x5a\xc6\x64\x02\x94\x80\xf3\xad\x4f\x3b\
-\xd6\x60\x10\x47\x73\x0e\xff\xdc\x58\x8e\x7f\x8b\x07\x76\x46\xdb\
-\xa7\xc7\x3c\xd3\x41\xd8\x80\xbf\xdf\xfb\xec\x6b\x30\x7b\xf1\xe5\
-\x30\x53\xa1\x87\xec\x2a\x31\x9d\xa8\x2d\x47\xd8\x57\x6b\x2d\xac\
-\x2b\xc7\xee\x8b\xb9\xd7\xf0\x81\xef\xab\x8f\xa4\xfe\x76\x5c\x87\
-\x3b\x6e\x43\x4d\x9d\xea\x44\x42\xb5\x2b\x72\x6f\x81\xff\x0f\x71\
-\x4c\x07\x1a\xf5\x75\x83\x34\xcc\xb3\x1d\xc2\x7b\xfa\x04\xdb\xee\
-\x4d\x66\x57\xcb\xc4\xc9\x99\x93\x08\x1e\x45\x47\x05\xec\x89\xf8\
-\x62\xf2\x33\x27\xa5\xd8\x9b\x66\x8f\xd6\xd8\x3c\xa7\x69\x9c\x4d\
-\x7b\xf0\xc1\xdb\xba\x07\xf8\xa1\xcf\x89\x35\xad\xe8\x2b\x6b\x73\
-\xe4\xe3\x12\x06\x7c\x26\x62\x84\x40\x9f\xb8\x76\xc8\x50\x9b\x34\
-\x4a\x31\xbb\x0a\xb7\x5a\x6b\x82\x4a\xb2\xc9\x1a\x89\xdc\xa9\x93\
-\x43\xae\xcc\x00\xd3\x3d\x0b\x21\x83\x42\x7f\x2d\x4c\x7c\x60\x2b\
-\x6f\x61\xd6\x91\x06\xfc\x0d\xfe\xe8\x9e\x28\x94\x09\x4f\xdd\x08\
-\x63\xee\xda\x00\x63\xb0\xc3\x2b\x7b\x60\x3d\x2c\x7a\x71\x1b\xbc\
-\xf8\xde\x67\xb0\x09\x81\x47\x5c\x30\x9b\x3e\x27\xfa\x2d\x75\xc1\
-\x70\xd1\x2c\x8c\x4b\xc6\xff\x37\xe9\x00\x02\x35\x7a\x18\x27\x16\
-\xf8\xe1\x61\xde\xd1\x31\x24\xad\xcd\xc4\x8d\xb3\xef\x27\xd8\xb0\
-\x6b\x1f\x5a\xf6\xaf\x40\xcb\x79\x97\x40\x99\x52\x4f\xdd\x38\x04\
-\xf6\x65\x58\x6f\xaa\x34\x66\x1a\xf2\x4b\xf6\x6e\x22\x2f\x50\x27\
-\x51\x61\x2a\x76\xfe\x83\x4c\x6c\x6b\x1d\x81\xc0\xd7\x09\xc0\x8f\
-\x16\xf8\x7f\x61\x9b\x7d\xdd\xd4\x3c\xb7\x39\xbf\xac\xf6\x04\x96\
-\x91\x47\x09\xed\x93\xfc\xc3\x94\xbe\x7d\xd2\x92\x6b\xaa\xea\xfa\
-\xea\x1d\xad\x0d\x5a\x47\xd3\x8b\x3a\x47\x23\xb1\xf2\xdb\xf8\xa0\
-\xf4\x67\x4e\x38\xab\x3c\x8a\xc2\x71\x86\x3f\x4e\xcf\x6a\xa4\x02\
-\x8d\xa5\x22\xf0\xcf\xed\xe8\x18\xae\x51\xc4\x9a\x7e\x3b\x0d\x01\
-\x7c\x0d\xf5\xe7\x7b\x7d\xab\x70\x89\x3f\x9f\x34\x56\xb2\x22\xb2\
-\x5c\xa9\x83\x99\xe4\x7d\xb8\xf5\x32\xc8\x95\x1b\x61\x9a\xfb\x6c\
-\xc8\xbc\xe4\x7e\xc8\x58\xf6\x26\x7d\x45\xe2\x44\x3a\x91\xdb\x33\
-\xc0\x8f\x5e\xb9\x5d\x38\xa3\xb8\xbf\x7b\x36\xb4\x5b\x6c\xc6\x80\
-\x7f\x23\x8c\xbd\x73\x03\x8c\x5d\xb6\x16\xca\x1f\x58\x07\x17\xbc\
-\xf4\x0e\xfc\xe7\xdd\x4f\x61\x13\x42\x6f\x4b\x10\xd0\xdf\xfa\x94\
-\xf5\x7d\xc7\x08\xe6\x0d\x61\x34\x56\xeb\x3c\xd4\x79\x81\xdf\x75\
-\x0c\xfc\x0d\xbb\xf6\x33\xfa\xe9\xfe\x80\x7b\x21\x23\x96\x6d\x5f\
-\x1d\x84\x55\x1f\x7c\x0e\x77\x3e\xf9\x22\x34\x9e\x73\x11\x54\x62\
-\x3d\xc9\xc5\x91\x60\x91\x18\x2d\x7b\x85\x0e\xaa\xd4\x26\x5a\x7f\
-\xea\x83\xfc\xf6\xe4\xdd\x0c\x5a\x9e\xb6\x03\xab\x2b\xd0\xe0\x89\
-\x1a\xb0\xe1\xda\x46\xa8\xef\xc3\x00\x3c\x2c\xf0\x13\xa1\xb1\xdc\
-\x5f\xc4\x63\x1a\x0f\xa3\xfe\x82\xed\xf5\x4e\x53\xd3\xdc\xa2\xc2\
-\x9a\xfa\x01\x84\x8d\x47\x64\xec\x7d\x14\x22\x4a\x4b\x4b\x4d\x92\
-\xe9\xed\x93\x0c\xae\x96\x4b\x11\xf8\x1f\x62\xa5\x69\xd3\x06\x40\
-\x5f\xd0\x68\x95\x03\x3e\x03\x7d\x26\x94\x50\x49\xfd\xf9\x4c\xa8\
-\x26\x99\x64\x23\x91\x3b\x64\x25\x6e\x39\x8d\xd1\x57\x42\x21\x36\
-\xea\x5c\xb1\x06\xa6\xbb\xcf\x82\xcc\x8b\x56\x40\xfa\xd2\x95\x0c\
-\xf0\x57\xf4\xa2\x2d\x18\x3a\x39\x62\x08\x39\x6a\x60\x3b\x80\xb1\
-\xcb\xd7\xc1\x29\x77\xac\x81\xf2\xfb\xd7\xc1\xf9\x68\xe1\x3f\xff\
-\xce\x2e\x78\x6b\xe7\x97\x68\xe5\xf3\xa0\xca\x81\xb2\xa7\xf5\xd3\
-\x10\xff\x0f\xfe\xae\x03\x5d\xcf\x2a\x07\xfb\x8d\x74\x8e\xe1\x5b\
-\x78\xfd\xfd\xcf\x60\xe9\xe3\xcf\x82\xf7\xac\x0b\x99\x09\xda\x2a\
-\x09\x14\x13\xd8\x2b\xf5\x74\x07\x4c\x1a\x6f\xcf\x46\xe5\xd0\x77\
-\xd4\x5a\x99\xfa\x45\x8c\x0b\x7e\xbd\xeb\xe9\x36\xd0\x3d\x9a\xc8\
-\x0e\xa4\xf1\x77\xe4\xde\x27\x08\xfc\xb3\xec\xad\xb3\x47\xe4\x17\
-\x15\xa6\x12\x30\x1e\xad\xc0\xa7\x22\x56\x99\x8e\x37\x38\x5a\x54\
-\x3a\x87\xf7\x65\x7c\xf8\xbf\xd0\xda\x3f\xdc\xf3\x85\x7a\xe4\x69\
-\x28\xe0\x33\xae\x1d\x17\x8d\x1d\x27\xd0\xa7\x8b\xb2\xc8\xfe\xf9\
-\x6a\x23\x13\xa3\x4f\xa0\x5f\x27\x81\xbc\x06\x15\x64\x59\xe6\x40\
-\xe6\xa2\x65\x74\x71\x16\xd9\xd8\x8c\x7b\x5b\x55\x4f\x43\xbb\xab\
-\x80\x9f\x81\x7a\x0a\x02\x7f\x2c\x07\xfc\xff\x6c\x85\xe7\xb7\x7d\
-\x02\x1b\x58\xe0\x13\x20\x72\x80\xec\x09\x6d\x0f\xe9\x10\xff\x0f\
-\xfa\x2e\xea\xb4\x59\xd8\x13\xb7\xd5\x4b\x5b\x3e\x86\xeb\xef\xfd\
-\x27\x58\xe6\x9c\x4d\x17\xe9\x11\x37\x0e\x59\x45\x4b\xea\x07\x59\
-\xcb\x51\xc7\x2e\xae\xa2\x7e\x7b\x76\x27\x4c\x15\xb7\x5e\x81\x03\
-\xbe\x93\x09\x1a\xd0\x39\x7a\xbe\x1d\x74\xbd\x26\x0e\xf8\x98\x67\
-\xdf\x61\x7b\x7d\xc2\xe4\x9e\x2d\x2b\x29\x99\x49\x60\x7f\xf4\xb8\
-\x72\xc2\x88\xa8\x54\x2c\x4e\x53\x3a\x9a\x26\x22\xf0\x6f\xd5\x39\
-\xbd\xfb\xb0\xd2\xfc\x1d\x98\x29\x11\x86\x8d\x51\xc3\x30\xf4\xf9\
-\xa4\x92\x76\xb5\x75\x12\xee\xde\xa3\xf9\x3e\xd2\xef\x91\xae\x43\
-\x80\x4f\xd5\xe6\x65\xf6\x5a\x27\x0b\x86\x7c\x96\x3e\xb3\x12\xb7\
-\x92\xc4\xe8\x13\xe8\x4b\x14\x50\x58\x23\x86\xbc\x7a\x25\x64\x99\
-\x5a\x61\x32\x79\x4d\xe2\x8d\x2f\x30\xef\xc6\xbd\x6f\x33\x33\x99\
-\x7b\x84\x82\xbf\xa3\x90\x51\xbe\x85\xbf\x08\x81\xff\x1c\x02\x7f\
-\xfd\xc7\x5f\xc2\xc6\x4f\x7b\x0e\xf4\x7e\xdd\x17\xa4\x89\x49\x97\
-\x80\x7e\xf3\x9e\xef\x29\xf4\xff\xbd\x66\x2b\x5c\x79\xc7\x03\xa0\
-\x6f\x9a\x4f\x61\x9f\x55\xd1\x00\x85\xf5\x8c\x1b\xa7\x86\x6e\x9b\
-\xc0\xc2\x9e\x2c\x34\x33\xfb\xfd\xf6\x74\x1d\x03\xf5\xdb\x7b\x19\
-\xd0\x27\xb8\x2d\x31\x69\x35\xf9\xd2\x6e\xd7\x5e\x9d\x3d\x37\x9a\
-\xf0\x1b\x56\x9d\x4a\xa7\x0d\xcf\x47\x6d\xdc\x81\x86\xd9\x79\x7a\
-\x4f\x4b\xe6\x90\x61\xc3\x8e\x9e\xc8\x9c\x70\x22\x12\x25\xd3\xc7\
-\xcb\x9c\x9e\x3d\xd0\xd2\x38\x7b\x96\xda\xe6\x5e\x83\x99\xf0\x1b\
-\x5b\x71\xda\x42\xc1\x2f\x12\xfc\x3b\x3a\x3e\xf8\xdc\x8e\x3a\x92\
-\x58\xd2\x0b\x95\x66\xb8\xfb\x8d\x35\xdd\x78\xd4\xef\xcb\xf7\xf8\
-\xa1\x8f\x8d\x96\x0c\xcb\x49\xa4\x05\x79\x1f\x2e\xb1\xf4\x29\xf4\
-\xc5\x0a\x28\xaa\x6e\x80\xbc\x6a\x09\x64\xe9\x9b\x60\xca\x19\xd7\
-\x33\x2f\x44\x27\x91\x2d\x14\xfa\xbd\x6c\xa7\xcd\xb0\xba\x3e\x84\
-\x46\x07\xfc\xf3\x7d\xc0\xdf\x4b\x7d\xe1\x1c\x20\xd7\x45\xa3\x9f\
-\xf0\x34\xdc\xf7\xc1\xbf\x75\x98\xd6\x3e\xfc\x3f\x5f\xa3\x3c\x3f\
-\x20\xad\x7d\x6c\x3a\x8c\x55\xbf\x69\xf7\xf7\xb0\x19\x75\x0d\x76\
-\x6a\x4f\xbe\xf9\x36\x5c\x72\xeb\xdd\xa0\x74\xcf\xa2\xbb\x5e\x4e\
-\x2f\xaf\x63\x60\x2f\xd7\xd1\x7a\x51\xab\x33\xfb\xdc\x38\xa4\xde\
-\x28\xd8\x2d\x9d\xd5\x36\x6e\x25\x32\x07\xfc\xe8\xdb\x56\xf4\x6d\
-\x97\x0f\xfd\xe8\xda\x5d\x67\x0d\xa9\x68\x8d\xb5\x68\xd3\xe8\xe0\
-\x5e\x0f\xe3\xb3\x91\x7d\x73\x5e\xd7\x38\x1b\x25\xb6\xa6\xc6\x21\
-\x47\xf4\x2b\x0d\xa3\x15\x6e\x36\x7a\xfc\xa4\xa9\x7d\x8d\x8d\x73\
-\x2b\x11\x4e\xcb\x10\x54\x3f\x0a\xc0\x4f\x14\xf0\x99\x55\xa5\xdc\
-\x82\x2c\xce\xb5\x43\x86\xe7\x0d\x7a\x2b\xb5\xf4\x19\xe8\xeb\xe9\
-\x44\x6e\x11\x09\xd9\xac\x91\x41\xb6\xca\x0e\x53\x66\x5f\x0a\x93\
-\xae\x7a\x1c\x32\xee\x5a\xcb\xec\xbf\x93\xd0\xad\x18\x7a\x1e\xf8\
-\xc4\xf2\x0f\x76\xe9\x10\xe0\xaf\xe3\x01\x3f\x7a\xb0\xf6\x5e\xe0\
-\xaf\x45\x5d\xcf\xc2\x7e\xeb\x57\x3f\xc2\xea\x1d\x7b\xe1\x81\x17\
-\xdf\x84\x05\x57\xde\x08\x62\x04\xf8\x0c\x84\x3d\x51\x12\x67\x4f\
-\xea\x01\x85\xbd\xd6\x4c\xeb\x87\x98\x8d\xb7\x27\xb0\xa7\xdb\x1e\
-\xd3\x88\x1c\x8f\x6f\xeb\x89\x58\xdb\x96\x00\x7c\x3f\xf0\x71\x04\
-\xbe\x5b\xef\x6e\xb9\xa3\x41\xa9\xcb\xc8\xcf\xcb\x4d\x1a\x30\x70\
-\xe0\x51\x4c\x7a\x56\xb8\x8d\x81\x4e\x1d\x97\x93\x62\xf4\x9c\x73\
-\x92\xca\xe6\x6e\xd5\xda\xbd\x3b\xb0\x42\xfd\x15\x0d\xf0\xbb\x1b\
-\xa2\xbd\x5d\xf9\x79\x41\x81\xef\x60\x86\xde\x74\x17\x47\x0a\x7d\
-\x17\x75\xed\xc8\xa8\xa5\x6f\x67\x17\x66\x31\xee\x1d\xb2\xd9\x5a\
-\x29\x0f\xfa\x39\x72\x0b\x4c\xf5\x9e\x07\x93\x2e\xbc\x1b\xd2\x6f\
-\x7f\x8d\x79\x73\x16\x89\xd7\xbf\x87\x8d\xd7\xbf\xab\xe7\x23\x78\
-\xda\xbb\x6b\x12\x00\x7c\x04\xe2\x06\x16\x98\x6b\x59\x60\x1e\xa9\
-\xba\x66\xe7\x57\xb0\x81\xac\x9e\xdd\xfb\x03\x6c\xde\x73\x00\x5e\
-\xda\xb6\x13\x6e\x79\xe4\x19\x68\x39\xef\x52\xa8\xd1\x3b\x20\x17\
-\xcb\x79\x06\x8e\xec\x8a\x25\x4c\xe8\x25\xf1\xd9\x13\xd8\x93\xb5\
-\x1b\xa4\x7e\x30\x8b\xab\x18\xd8\xab\x02\x80\x1f\xda\xb2\xef\x4c\
-\x7d\x0d\x50\x27\x4f\xbb\xb9\xed\x74\x13\x4b\x0e\xa9\xed\xde\x37\
-\x8c\x9e\x59\xde\xe2\xea\xfa\xe3\x59\x16\x1e\xfd\xc0\xa7\xc2\x2e\
-\x22\x3e\xb5\xa8\x44\xa4\x72\x34\x57\x68\x6d\x9e\xa7\xb0\x42\x7d\
-\x1b\x57\x46\xda\x59\x8d\xab\x10\xc2\x0f\x51\x13\x7b\x2f\x1d\x5d\
-\x23\xd6\xfb\x08\x75\xbc\xd7\xef\xc7\xb7\xfb\xa1\x4f\x1a\xae\x82\
-\x85\x3e\x67\xe9\x93\xc6\x5d\x43\xdd\x3b\x26\xc6\xd2\x97\x6a\xa0\
-\xb8\x4e\x0e\x79\xd5\x52\xc8\x11\x6b\x61\x9a\x6d\x1e\x64\x9e\x7b\
-\x2b\xa4\x2f\x79\x8e\x81\x25\x9d\xd0\x25\xd6\xfe\x5b\x68\xfd\xaf\
-\x47\x70\xf6\x2c\xf8\xe3\xdd\xde\x21\x18\xf8\xc4\x87\xff\x2c\x02\
-\x9f\x6c\x8f\x40\x7c\xe6\x3d\x0d\xeb\xf8\x00\xcf\x40\x9e\x28\x75\
-\xe3\x7c\xf6\x1d\x5a\xf6\x07\xe8\x6f\xff\x5e\xf7\x0e\x5c\x75\xf7\
-\xff\x81\x75\xde\x39\x50\x22\xd5\x42\x76\xa5\x04\x72\x6b\x65\x30\
-\x53\xa6\x81\x0a\x15\x99\xa0\x65\x2c\xfb\x7a\x36\xd6\x5e\xda\xce\
-\x6f\xcf\xec\x97\xc3\xd5\xa7\xe8\xea\x64\x02\xdb\x53\xc4\x6b\x75\
-\x39\xa0\x13\xa6\x98\x77\x87\x50\x7f\x52\xdb\xdc\xb7\xdb\xbc\xf3\
-\xb3\xf3\xcb\x25\x47\xee\x36\xc8\x9d\x11\xe2\xbb\x92\x19\x2c\xe3\
-\xd1\x32\x5d\x80\xa0\xda\x82\xb0\x3c\xac\x8d\xd2\xca\xef\x18\xb2\
-\x71\x80\x33\xee\x74\x3a\xba\x17\xfe\x75\x42\xc3\x3a\xb6\xc6\xc2\
-\x1e\xeb\xbb\x1e\xf3\xff\x60\xe0\x6b\x78\x7b\xed\x28\xac\x4e\xba\
-\xc9\x9a\xd4\x67\xe9\x5b\x59\x9f\x3e\x03\xfd\x52\x99\x96\xbe\x40\
-\x25\xbf\x4e\x86\x50\x90\x43\x96\xd2\x06\x53\x66\x5d\x02\x19\x57\
-\x3c\x0a\x13\xc9\x2b\x13\xef\x65\x5c\x3c\x47\x32\xf0\x89\x12\x1f\
-\xfe\xd8\x65\x6b\x68\x1c\x3e\x05\xfe\xd6\xa3\x07\xf8\x1b\x3e\xfb\
-\x16\xde\xfa\xfc\x3b\x78\xe3\x83\x2f\x60\xc5\x73\xaf\xc3\x19\x57\
-\xdc\x00\x0d\x66\x0f\x96\xa9\x02\xf2\x10\xf4\x45\x0d\x6a\xba\xfb\
-\x25\xd9\x2e\x81\x6c\x86\x56\xa7\xb5\x50\x37\x0e\x63\xd9\x3b\x41\
-\x4e\xf6\xf4\xe7\x59\xf6\x6a\x36\xf2\xab\xfb\x81\xef\x0d\xa1\x61\
-\xda\x6c\xc0\xf7\xed\x40\x1b\xe6\xbe\xd9\xf6\x12\xfc\x7b\x70\xfb\
-\xb5\x87\xf8\x2e\x3e\xe0\xff\xaa\xb1\x79\xb7\xea\x9c\xde\x96\xfc\
-\xc2\x9a\xfe\xc7\x0d\xcf\x3c\xfa\x7d\xf7\xe1\x44\xa2\x54\xf5\xd7\
-\x7b\x1a\x0b\x54\x76\xcf\xa3\x98\x29\x3f\xa3\x1e\xe2\xc0\x15\xb2\
-\x50\x68\x41\x78\x79\xca\x2f\x10\x5e\x05\xb1\xb7\x57\x4d\xbb\xca\
-\x1b\x04\x4e\x7e\x5a\xf6\xc6\xc0\xe3\xc3\x15\x7e\x50\xba\xc1\x1a\
-\xba\xf2\x06\x57\x32\xf6\x1e\x43\x1e\x13\x22\x3d\xde\xb3\x07\x5c\
-\x2f\x04\xf0\xd5\xd4\xd2\x6f\x1f\xae\x49\x1a\xb9\x18\x1b\x7b\x9d\
-\xde\x4c\x2d\xbd\x4a\xb2\x0d\x03\xc2\x80\x40\xbf\xb0\x46\x0a\x79\
-\x95\x62\xc8\x91\xe8\x61\x9a\x63\x01\x64\x9e\x7f\x07\x64\xdc\xf2\
-\x32\x63\xe5\x13\x17\xcf\x91\x12\xbe\x79\x4f\x7b\x3d\x25\x68\xd2\
-\xf6\x99\x2d\x9f\xc0\x9a\xed\x7b\xa9\xef\x7b\x0d\xea\xea\x9d\x8c\
-\xae\xd9\xe9\xff\xbb\xbb\x35\xea\x6b\x7f\xcc\x1c\xbb\x6e\xd7\xd7\
-\xb0\x69\xcf\x0f\xb0\xfe\xd3\x6f\xe0\xe9\x0d\xef\xc1\xb5\xf7\x3e\
-\x06\xae\x05\x8b\xa1\x4c\x61\x82\xec\x0a\x2c\x47\xb4\xec\x8b\x1a\
-\x54\xb4\x7c\xc9\xc6\x7a\x24\xce\xbe\x5e\xcb\x4d\xd0\x72\x6e\x1c\
-\x27\x75\xff\x91\xdd\x57\xd5\x5c\xbd\xe1\xd7\x29\x5e\x3b\xe9\xb8\
-\xae\x87\x3f\x86\xdf\x96\x03\xdb\x97\xd7\xd7\x16\xf8\xdf\x85\x3c\
-\x9f\xaf\xed\x8c\xa0\xd0\xe7\x05\x74\x00\x11\xd3\x0e\x64\x40\xa8\
-\x67\x8e\xdc\x99\x04\xf0\x89\x1a\xaf\x68\xd0\xee\xc7\xf6\xb7\x54\
-\xeb\x6e\x2a\x1d\x32\x7c\x38\x35\xeb\x8f\x39\xd8\xb3\x0f\x2c\x1a\
-\x36\x64\x48\x92\x52\x6f\x1c\x86\x95\x6b\xa1\xda\xea\xd9\xa6\xb1\
-\x79\xfe\x60\xe1\xd5\x16\xa9\xd2\xf4\x84\x46\xaa\x28\x1d\x9e\xeb\
-\xe8\x9a\x74\xa3\x51\x7e\x7c\x7e\x30\xf4\x1b\x0c\x16\xa8\xd3\x99\
-\xa1\x46\x6b\x82\x2a\x02\x7d\x3a\x99\xab\x86\xe2\x1a\x09\x14\x94\
-\xd7\xc0\x8c\x5a\x29\x4c\x37\x34\xc1\xe4\x33\xae\x85\x49\x57\xfd\
-\x93\x2e\xd4\x22\xae\x1d\x0a\x7d\x1a\xbe\x79\x24\x44\xf2\xf8\xb5\
-\x3d\xf0\x77\xc2\xea\x8f\xf6\xc0\xda\x00\x90\x7e\x15\xa8\x3b\x59\
-\x0d\xf5\x5d\xa4\xdf\x82\xd3\x49\x94\x92\x7b\x24\x16\xfe\xa7\x5f\
-\xc3\x3a\x84\x3c\xf9\xff\xcb\xef\x7e\x0a\x0f\xbc\xb8\x1a\x16\x2d\
-\x59\x06\x2a\xcf\x1c\xc8\xab\x91\xc3\xe4\xe2\x6a\x98\x51\x49\x16\
-\x54\xa9\xa1\x5c\xae\x87\x4a\x25\x81\xbd\x99\x09\xbd\xe4\xf9\xec\
-\x65\x6c\x44\x0e\xf3\xc6\x79\x9b\x2f\x00\x00\x20\x00\x49\x44\x41\
-\x54\x42\x13\x77\x42\xda\x49\x4f\xb7\xd5\xc4\xb4\xf7\xc8\x1d\x5c\
-\xa8\x36\x1c\xf4\xec\x84\x61\x7f\x23\xcb\x36\x2b\xcd\x0e\xab\xbc\
-\xa9\xe5\xc4\xa1\x27\x9e\x70\x6c\x02\x9f\x08\x17\xb1\x33\x29\x73\
-\xda\x00\x93\x6b\x76\xbd\xd2\xe2\xbe\x07\x87\x92\x3f\xd2\xcc\x12\
-\x80\x9f\x50\xe5\x36\x58\x53\x12\xe0\x5b\x09\xf8\xc9\xeb\xf8\x98\
-\x7d\x77\x48\xe3\xaf\x47\xe8\xd7\xa2\xe5\x57\x85\xc3\xfd\x0a\xe2\
-\xe2\x21\x7e\xfd\x06\x05\x14\xd4\x88\xe9\x2a\xcc\x6c\x99\x09\xa6\
-\xba\xce\x46\x6b\x7f\x19\x64\xdc\xf8\x3c\xdd\x94\x8c\xee\x51\x73\
-\xcf\x91\x05\xfd\xb1\x3c\x1f\xfe\x79\x08\xfc\xa7\x83\x81\x1f\x12\
-\xb0\xbd\x08\xf8\xc4\x7d\xf3\xc9\x7e\x0a\xfb\xb5\x9f\xee\x87\x95\
-\x3b\xf6\xc2\x53\xeb\xde\x81\xeb\xee\xfb\x27\x78\xce\xbe\x08\x2a\
-\xc8\x8b\xc6\x11\xf2\xd9\x15\x0d\xd4\x3d\x57\x22\x61\x60\x4f\x3a\
-\x73\x6a\xd9\xb3\xb0\x27\xd1\x38\x1c\xe8\x29\xec\x69\x08\x26\xbb\
-\x57\x4e\x02\xda\x49\x4f\xb7\xd5\xc4\xb4\xf7\x4e\x03\xff\xb0\xc6\
-\xe6\xfd\x0a\xf3\xf6\x7e\xf7\xec\x39\xd9\x0d\x0e\xbb\x28\x29\xad\
-\xcf\x51\xb5\x0d\x72\x4c\xc2\x45\xec\x8c\xcd\xcc\x49\xd5\x7a\x5a\
-\x47\x6b\x2c\xae\xb9\x98\x41\x3b\xd5\x36\xef\x9f\x1a\x7b\xef\x03\
-\x7e\x97\x55\xac\x10\x43\xdc\x44\x2a\x37\x3c\xe7\xc7\xe7\x73\x96\
-\x3e\xd9\x14\x4b\x62\xb4\x21\x00\xac\x14\x06\x04\x0a\xd5\x2a\xb2\
-\x2a\xd7\x00\xa5\x72\x2d\x94\x34\x28\xa1\xb0\x5a\x02\x79\x55\x0d\
-\x90\xd3\xa0\x81\x69\xc6\x66\x98\x3c\xe7\x52\x98\x74\xf1\xbd\x90\
-\x4e\xdc\x3c\xc4\xda\xbf\x7f\x2b\xe3\xea\xb9\x27\xba\x97\xab\xc4\
-\xa7\xfe\x28\x9c\x78\xfd\xf7\x1c\xf0\x4f\xf1\x01\x7f\x0b\xfc\x1b\
-\x81\xff\x26\x05\x3e\x03\xd4\x37\xa3\xd4\x58\x8e\xed\x94\xee\xf8\
-\x12\x75\x2f\xac\xc6\x4f\x02\xfa\xb7\xbe\xf8\x1e\x36\xee\x3e\x40\
-\x3b\xa7\x67\x37\x7e\x00\x4b\x9f\x78\x01\xce\xbc\xea\x46\xd0\x34\
-\xcd\x85\x12\x99\x96\x2e\xa4\xca\xa9\x14\x43\x41\xbd\x82\x96\x1f\
-\x89\xc4\xaa\x56\x73\x93\xb3\x16\xea\xc6\xf3\xb9\x71\x38\xcb\x9e\
-\xbe\x9b\x96\x9d\xa4\xe5\x36\x46\x8b\x01\x76\x82\x86\x55\x02\xfc\
-\xd5\x5a\x67\x4b\xab\x54\x6d\x1a\x39\x74\xc8\x60\x8a\xbd\x63\xd2\
-\xba\x67\x24\x99\x0d\xd8\xc9\x12\x4d\x9a\x7c\x5e\x8a\xda\xe6\xaa\
-\xd1\xd8\xdc\x4f\x60\xa5\xfb\x56\xe3\x0b\x07\x63\x2d\x0e\x1b\x4f\
-\xc3\x65\xb0\xad\x03\x8d\x78\x1e\xb7\x0b\x60\x34\x16\x4e\xd0\xbd\
-\x45\x52\x1b\x2f\xfd\x68\xce\xe3\xee\x23\xae\x67\x08\x7d\x8c\x9a\
-\xd7\x98\x39\xe8\x07\xb8\x77\x10\x00\x04\xfa\x0d\x08\x7d\x32\xdc\
-\xaf\xc5\x61\x7f\x15\x81\xbe\x92\xf1\xeb\x13\x2b\xb1\xa8\x56\x06\
-\xf9\x08\x7d\x12\xbf\x9d\x25\x33\xc0\x54\xfb\x7c\xc8\x5c\xb0\x04\
-\x32\xfe\xf1\x4f\xc8\x58\xba\x0a\xd2\x57\x6c\x66\xb7\x5c\xee\xaa\
-\xf8\x7d\x0e\xf6\x9d\x9b\x30\xe6\x80\x5f\x11\x04\xfc\x35\x3c\xc8\
-\xae\xe2\x69\x34\x50\x8e\xf6\xb8\x68\xd2\xf1\xe9\x0e\x46\x49\xc7\
-\xb2\x76\xd7\x37\xbe\x09\xd9\xb5\xbb\xbe\x86\xff\x6c\xdb\x09\xf7\
-\xbe\xb0\x0a\x2e\xb9\x7d\x05\x38\x16\x2c\x82\x2a\xad\x15\xcb\x45\
-\x0c\x59\xe5\x75\x90\x5b\x2d\x65\xac\x7a\x1c\xa5\x91\xf2\x63\x16\
-\x54\x99\xe8\x24\x3d\x59\x41\x2b\x25\x96\x3d\x0f\xf6\x5c\xbc\x3d\
-\xf7\xb6\x2f\x75\x54\xf5\x3f\x36\x55\xdb\xbc\xbe\x95\xba\x51\x69\
-\xa8\xba\x1c\xa9\x0d\x44\xd3\x3e\xc2\xb4\x87\xb8\xef\xa7\x63\x3d\
-\x84\xc7\xff\xa8\xb2\xb9\x97\x19\xdc\x2d\x79\x95\x55\xd2\xa3\x7a\
-\x93\xb4\x18\x84\x41\x7e\x72\x4a\x41\x92\xdc\xdc\x38\x5e\x6d\x77\
-\x9d\x8e\x05\xb1\x15\xa1\x87\x16\x3e\xd5\xa3\x1b\xf8\xed\x2a\x76\
-\x8c\xc0\x8f\xe2\x98\x60\xe0\xd3\x4f\xf2\xbe\x56\x8b\x9b\xba\x76\
-\x08\x00\xa4\x26\x16\xfa\x7a\x16\xfa\x5a\x66\x32\x97\xb8\x02\xc8\
-\x4a\xcc\x99\x12\x0d\x14\x11\x17\x4f\x9d\x0c\xf2\x10\x2e\x39\x35\
-\x32\xc8\x92\x9b\x61\xaa\x67\x21\xdd\x8f\x87\xb8\x79\xc8\xcb\xc7\
-\x27\xde\xbf\x85\x9d\xd8\xdd\x94\xe0\x89\xdd\xc4\x01\x7f\x2c\x0b\
-\xfc\xf3\x13\x00\xfc\x58\x3a\x86\xd8\x80\xbf\x0f\xbf\x23\x13\xc9\
-\x5f\xa3\x55\x7f\x00\xad\xfa\x1f\x60\xe5\xf6\x2f\xe1\xf1\x55\x6f\
-\xc3\xd5\x2b\x1e\x05\xef\xb9\x97\x40\x8d\xc1\x01\x79\xb5\x72\x0a\
-\xfb\x3c\xb2\xd3\x25\x96\x0f\x09\xb1\x25\x2b\xa9\x2b\x59\x17\x4e\
-\xad\xd6\x44\xe7\x68\x7c\x7b\xe3\xa0\x52\xd8\xfb\xfc\xf6\x81\xaf\
-\x77\x8c\x07\xf8\x1d\xc1\x93\x01\x7e\xfb\x63\xc2\x82\x37\xd1\xc0\
-\x0f\xfa\xbd\xcb\x81\x4f\x8e\xb3\x7a\x7f\x45\xdd\x8a\xc6\xd5\x3c\
-\x8d\xd9\x7c\xdc\x29\xa7\x8c\x4d\xe9\x61\xd0\xf6\x2e\x49\x4e\x49\
-\x49\xaa\xb3\x59\x07\xea\x9d\x9e\x22\xcc\xa4\xc7\xb0\x30\x0e\xa2\
-\x1e\xe2\x17\x8e\xbf\x90\x42\x81\xd3\xe3\xd3\x50\xe7\x84\x4c\x27\
-\x1a\x0d\x28\xc8\xd8\xae\xc1\xaf\x2c\x6a\x5e\x83\x52\x87\x05\x7a\
-\xe8\xf4\xdb\xfd\x3f\x4c\x65\x8c\xf6\xb9\x7d\xf0\x67\x7d\xfa\xd4\
-\xd2\x27\xe0\x37\x73\x96\xbe\x0d\xea\xf4\x16\xba\xd4\x9e\x4e\xe6\
-\x92\x45\x5a\xd4\xaf\xaf\x85\x12\xb1\x0a\x8a\xeb\x65\x50\x50\x23\
-\x61\x16\x6b\x35\xa8\x61\xba\xd6\x03\x93\x9b\x17\xc1\xa4\x0b\x96\
-\xc3\xa4\x1b\x9e\xa3\x6f\xa0\x22\x7b\xed\x4f\x7c\x70\x1b\x5a\xfc\
-\x9b\x78\xc0\x4e\x8c\x4b\xa7\xd3\xc0\x67\xc3\x32\x89\x85\xff\xf4\
-\xdb\x3b\x61\xd5\x87\x7e\xe0\x73\x96\xf5\xaa\x1d\x5f\xf2\xf4\x2b\
-\x58\xc9\xfb\x7e\x25\xef\xfb\xe0\x63\x57\x06\x1c\xfb\x55\xc8\x73\
-\x43\x29\x3d\x1f\x81\xbe\x72\xfb\x5e\xfa\x37\x99\x8c\xdd\xb4\xe7\
-\x20\x6c\xdc\xfb\x03\xbc\x8e\x1d\xd2\x63\x08\xfa\xeb\xef\x7f\x12\
-\x66\x2d\xba\x02\x64\xf6\x26\x28\x92\x69\x60\x46\x8d\xc4\x07\x7b\
-\xb2\xd3\x65\xa9\x4c\xc3\xae\x9c\x35\xd0\x72\x23\x65\xe8\xb3\xec\
-\xd9\xc9\x59\x02\x7b\x9f\xbf\x9e\x1f\x82\x19\x54\x7f\xc2\xb7\x81\
-\x8e\xeb\x5b\x38\xa8\x07\xa7\xdb\x51\xbb\x8c\xae\x0d\x87\x6e\x3f\
-\xb1\x70\x20\x24\x57\xc2\xb4\xcd\x28\xce\x6d\x63\xf3\xe6\x6b\xcc\
-\xe7\xa5\xf8\x77\xf9\xa9\xa7\x8e\xa7\x3b\x62\x1e\x93\x7e\xfb\x50\
-\xc2\xe6\x83\x68\xe0\xa0\x81\x49\xf5\x72\xd5\x08\x95\xdd\x7b\x96\
-\xda\xe2\x7a\x0b\x33\xed\x0f\x36\x43\xdb\x62\x2d\x3c\x41\x3b\x56\
-\x12\x82\xa7\x64\xad\x3c\xb2\x38\x4b\x66\xe6\x2c\x7d\x3b\x75\xef\
-\xd4\xd3\xb0\x4d\x0b\x85\x07\xf1\x03\x57\xaa\xf4\xd4\x7a\x24\xbe\
-\xe1\x62\xb4\xf8\x0b\xeb\xe5\x90\x5f\x59\x0f\xb9\x15\xf5\x90\x53\
-\x8f\xe0\x37\x34\xc3\x94\xd6\x4b\x60\xd2\xe2\xbb\x20\xe3\x86\x67\
-\x21\x7d\xd9\x2a\x06\xb4\xf7\xb2\x7b\xf3\x84\x7a\x81\x7a\x77\x85\
-\x77\xf2\xb6\x47\x1e\xc3\x03\xfe\x53\x6f\x7f\x8c\xc0\xdf\x0d\xab\
-\x03\x00\x1d\x1e\xcc\x5d\xa5\x04\xf2\xc4\x2f\xbf\xf6\x13\x32\x19\
-\xfb\x0d\xfd\xff\x4b\xef\xec\x42\xd0\x6f\x86\x1b\x1e\x7a\x0a\x4e\
-\xbb\xec\x06\x50\x79\xe7\x42\x91\x58\x0d\xd3\x4a\x6b\x61\x5a\x59\
-\x2d\x8d\xad\x27\xef\x9c\x2d\x93\x31\x56\x3d\xf1\xd7\x13\x17\x0e\
-\x85\x3d\xbb\x09\x9a\xd8\xc8\xc2\x9e\xef\xb3\xe7\xc3\xde\x07\xfc\
-\x9e\xd3\x78\xe0\xdc\x8b\x95\xb0\xea\x0f\xa5\xcd\xb3\x09\x47\x4e\
-\x36\xdd\xdc\xd3\x4e\x1a\x7a\xd2\x49\xc7\x6e\x64\x4e\x38\xe1\x7c\
-\x5b\xe9\x53\xa7\xf7\x37\x7a\x5b\x67\x22\x88\x6e\x51\x5b\x3d\x07\
-\x48\x98\x98\xba\xd7\x00\xdf\xcd\x6a\xd7\xa4\xaf\x0a\x6e\x88\x61\
-\x1a\x64\x7b\xeb\x2c\xce\xeb\xd9\x18\xe8\x73\x69\xd1\x6d\x18\xc8\
-\x44\x2e\xab\x64\xf5\x65\x83\x91\x81\x3e\x01\x08\x63\xed\x1b\x28\
-\x58\xca\xc8\x84\xae\x54\x0d\x45\xf4\xc5\x2a\x08\xfe\x2a\x31\xe4\
-\x96\xd7\x41\x76\xad\x12\xa6\x69\xbd\x30\xb5\xe9\x02\x26\x7e\xff\
-\xfa\xa7\xd1\xe2\x5f\x4d\x23\x79\x32\xa8\xf6\x10\xf0\x83\x5c\x3a\
-\xdc\xa4\xed\x53\x9b\x3f\x86\x95\x1f\xec\xa6\x93\xa3\x3e\x00\x6f\
-\xe7\x69\xf0\xff\xa3\x51\x7e\x3a\xd1\x02\xff\xe3\x2f\x7d\xae\x9d\
-\x57\xde\xfb\x0c\x1e\x79\x75\x03\x5c\xb3\xe2\x31\x98\xbd\xf8\x1f\
-\x20\x77\xce\x82\x82\x06\x15\x4c\x9d\x59\x0d\x39\x15\x0d\x50\x50\
-\x2b\xa7\xfb\xe0\x94\x48\x35\xb4\xf3\x2d\x67\x41\x4f\xb7\x49\xc0\
-\x51\x19\x29\xaf\x06\xbd\x1d\xa4\x64\x2f\x7b\xba\x11\x1a\xb3\xa7\
-\xbd\x82\xaa\xbf\xbc\x55\x9d\xa8\x3b\x5d\xa9\xd4\xc5\x64\xed\x3d\
-\xed\x32\xda\x6b\x63\x7e\xb6\x61\xbe\x1e\x52\x59\x3c\x9f\x6b\xec\
-\x4d\xcb\xeb\x94\xba\xec\xb1\x39\xd9\xa2\x3e\x83\x87\x1c\xbb\x91\
-\x39\xe1\x84\x8b\xd8\x19\x99\x93\x93\x22\x6f\x6a\x1e\xa2\x32\xbb\
-\xac\x68\x89\x6c\x40\xe8\xff\xac\xee\x15\xc0\x77\x43\xe7\x2a\x56\
-\xc7\xe7\xf3\x41\x1e\x09\xea\x5d\x01\x7c\x25\x0b\x7c\x6e\x22\x57\
-\x4e\xfd\xfa\x0e\x90\xa0\xc5\x4f\x42\xf8\xc8\x22\x1d\x6e\x75\x2e\
-\x01\x0b\xdd\x5f\x9f\x05\x3f\x79\x59\x7a\x49\x9d\x1c\x0a\xab\xc5\
-\x90\x8f\xd6\x7e\x6e\x65\x03\xe4\xd4\xa9\x20\x4b\xeb\x82\xa9\x9e\
-\x73\x60\xf2\x82\x1b\x60\xd2\x65\x0f\x43\xc6\xcd\x2f\xd2\xf7\xca\
-\xa6\xfb\x5e\x39\xb8\x89\xf5\xf5\x77\x4f\x58\x67\xf0\xd6\x0a\xdd\
-\x02\x7c\x9e\xbe\xf1\x11\xea\x76\x02\xf7\x7d\xf0\xe6\xce\xfd\xb0\
-\xfa\x13\xd4\x5d\x5f\xd3\xcf\xd7\x71\x94\xf1\xaf\xb5\xef\xc0\x1d\
-\x4f\xbe\x04\x8b\x6f\xbe\x0b\xbc\x67\x5f\x04\x52\x5b\x33\x14\xa2\
-\x45\x4f\x22\x6f\x88\x45\x9f\x8d\xa3\xa9\x02\xcc\x67\x32\x9f\x52\
-\x26\x67\x2c\x7a\xe2\xab\xe7\xf6\xc3\xe1\x5b\xf5\xc4\x35\x27\x0b\
-\xb2\xec\x83\xad\xfb\xde\x0d\xfc\x58\xea\x77\x2f\x01\xbe\xd5\xdd\
-\x86\xed\xe9\x77\x95\xd5\xf5\x82\xce\xe1\x35\x97\xd4\x4a\x47\x50\
-\xb6\x09\xa0\x8f\x2c\xa9\xa9\x69\x49\x2a\xa3\x2d\x1b\x33\xf1\x06\
-\xcc\xbc\x5d\x34\x23\x19\x65\x2b\x41\x7b\x0d\x84\x60\x74\x50\xed\
-\x08\xcc\xed\xd3\x0c\x28\xdc\x0e\x35\x38\xdd\x70\xbf\x75\x9c\x4e\
-\xb4\xd7\x08\xf5\x8c\xd1\x5f\x97\x99\xc4\x65\x63\xf4\xa9\x95\xef\
-\xf0\xaf\xca\x25\xd6\x3e\x42\x9f\x40\xa5\x0e\xe1\x42\xc1\x4f\xdc\
-\x3c\x08\x1d\xe2\xdf\x2f\x93\xe9\xa8\xc5\x5f\x58\x27\x83\xc2\xaa\
-\x7a\xc8\x2f\xaf\x81\xdc\x8a\x3a\xc8\xa9\x55\x40\x96\xd2\x0e\x53\
-\x9d\x67\xd2\xc5\x5b\x99\x17\xdf\x03\xe9\xd7\x3c\x09\xe9\x37\xbf\
-\x0c\xe9\xcb\xd7\x32\xa1\x9c\xc4\xcf\xef\x73\xfb\x70\xae\x9f\xb7\
-\xe2\xde\x2f\x27\xdc\x39\x11\x81\xcf\x07\x73\x02\x75\xe5\x76\x62\
-\xb5\x13\xb8\x7f\x03\x6b\x76\x31\xba\x1a\x61\x4f\x5c\x47\xaf\x7e\
-\xf0\x05\x3c\xbd\xf1\x03\x78\xe0\xe5\xb5\x70\xf3\x23\xcf\xc0\xa2\
-\x25\xcb\xc1\x75\xe6\x62\xa8\x37\xb9\xe8\x76\x08\x53\x67\xd6\xc2\
-\xe4\xe2\x4a\xba\x8d\x31\x8d\xa9\xc7\xfc\x25\x1d\x2c\x9d\x94\xa5\
-\xdb\x23\x30\xab\x66\xeb\xd8\x90\x4b\x1a\x5f\x4f\x22\xae\x4c\xe4\
-\x1d\xb4\x76\x5a\x7e\xcc\x04\xad\x2b\x28\x22\xc7\x1d\x30\xb2\x8b\
-\xbe\x1e\xc7\x52\xdf\xa3\x05\x65\xfb\xf6\x1a\x5d\x9a\x91\x19\x10\
-\xe9\xde\xc2\xb5\xeb\x68\xdb\x5c\xf8\x36\xea\xfa\x03\x3f\xbf\x50\
-\x5a\x9c\x57\xea\xbd\xad\x13\x8a\xeb\xea\xfa\x12\x9e\x89\x84\xc8\
-\x9c\xc8\x92\x92\x96\x96\x24\xb3\xdb\x47\xa8\x6c\x2e\x25\x42\xe8\
-\x25\x95\xc5\xf5\x1b\x66\xea\xe1\x58\x0a\x80\x5f\xd0\x91\x0a\x29\
-\x12\xdc\xe3\x01\x70\xb4\xe7\x24\x0a\xf8\xf1\xe4\x47\xe4\xeb\x32\
-\x2b\x2e\xe9\x02\x2d\x2e\x56\x9f\xc4\x6d\xf3\x42\x37\xe9\x42\x2d\
-\x3d\x2f\x92\x47\xed\x0f\xe1\x24\x7b\xf2\x94\xa0\x55\x5a\xdc\xc0\
-\xbc\x4e\x91\xfa\xf8\x89\xc5\x5f\xa3\x80\xe9\x52\x23\x4c\x33\x78\
-\x61\x72\xd3\x79\x30\xe9\x9c\x5b\x60\xd2\x15\x8f\x42\xfa\x92\x17\
-\x20\x7d\xe9\x1b\x08\xe4\x75\x0c\xf0\x69\x68\x27\xd9\x8b\x7f\x13\
-\xed\x0c\x32\xb8\x85\x5d\x54\x23\x43\xbd\xa3\x3d\x76\x28\xf0\x97\
-\xb1\x51\x3a\x0f\xf8\x81\xff\x06\x02\x7f\x15\x0f\xd2\xaf\x6f\xdf\
-\x1b\x56\xdf\xf0\x7d\x86\x01\x3c\x6f\x92\x76\x25\x99\x04\xde\xc9\
-\xc0\x7e\xed\xa7\xdf\x52\xd8\x93\x73\x9f\x7b\xfb\x63\x78\x6c\xe5\
-\xdb\x70\xd7\xd3\xaf\xc1\xe5\xcb\x1e\x84\xd6\xc5\xff\x00\x95\x67\
-\x2e\x5d\x34\x95\x5f\xaf\x84\x6c\x1c\x25\x65\xa1\xce\xa8\x96\x62\
-\x07\xaa\xa0\x7e\x7a\xb2\xe1\x59\x19\xe7\xa7\x67\x23\x70\xea\xb4\
-\xfe\x55\xb3\x62\x03\x63\xd5\x73\xfe\x7a\x19\x2f\xc6\x9e\x74\xe4\
-\x8c\xba\x68\xf9\x76\x15\xf0\x13\xd1\x1e\xc2\xb5\xd1\x44\x5d\x37\
-\xb1\xea\xbb\xdf\x36\x35\xcd\x57\xd7\x01\x6c\x3b\xcf\xa8\x1d\x5e\
-\xc3\x94\x82\xc2\x7e\x23\x8e\x3f\xae\xa7\x51\x7a\x64\x48\x5a\x6a\
-\xaa\xa8\x41\xab\x49\x96\x98\x6d\xe3\x54\x16\xf7\x95\x98\xa1\x1f\
-\xaa\xad\xee\x3f\xb9\xcc\x8d\x15\x70\x91\x2a\x9d\x00\xfc\xf6\xda\
-\xce\xbd\x63\x66\x43\x37\x8d\x8c\x7b\x87\x71\xf1\x30\x0b\xb5\x48\
-\xc8\x1f\x67\xed\x13\x10\x11\x8b\xbf\x1c\xad\xd0\x32\x04\x3f\xdd\
-\x6f\xbf\x8e\x44\xf4\x48\x21\xaf\x8a\x59\xb1\x3b\x03\xff\xce\x26\
-\x3b\x72\x2a\x1d\x30\xcd\x34\x1b\xa6\x34\x2d\x82\xcc\xb3\x6f\x82\
-\xcc\x2b\xfe\x8f\x59\xc1\x4b\xb6\x6e\xb8\x8b\xbc\x84\xe5\x6d\x48\
-\x7f\xf0\x5d\x98\xf8\xd0\x7b\x30\xf1\xc1\x77\x20\x9d\x84\x7b\xde\
-\xcb\x84\x7a\x66\x84\x09\xcf\x8c\x05\xf8\xdc\xa4\xed\xbf\x29\xf0\
-\xbf\xf0\x01\x3f\x12\xec\xf9\xfa\x1a\xd1\x0f\xf7\x30\xfa\xd1\x1e\
-\x7a\xee\x9b\x64\xc2\xf5\xb3\xef\x60\xc3\xee\x1f\x60\xd3\xde\x1f\
-\x61\xe3\x9e\x83\xb0\x06\x41\x4f\x7e\x7f\x61\xeb\x4e\x78\x7c\xf5\
-\x16\x58\xf6\xef\x57\xe0\xe2\xdb\xef\x83\x59\x17\x5c\x09\xfa\xe6\
-\xf9\x68\xcd\x7b\xa0\x54\x61\x80\xbc\x3a\x39\x5d\x30\x45\x56\xc8\
-\xe6\x56\x8b\xa1\x80\x6e\x76\xa6\x64\xc2\x2c\x89\xfb\x46\xc1\x80\
-\x9e\xd9\xe1\x92\x59\x31\x5b\xaf\x67\x26\xd6\xc5\x06\x6e\x4f\x1c\
-\x3b\xcf\x8d\xc3\xc1\x9e\x05\x3e\x5b\xae\xb4\x8c\x05\xe0\x27\x48\
-\xfd\xc0\xc7\xf6\xd2\x86\x79\xfd\xb1\xdc\xec\x38\xc3\xd4\xd4\x3a\
-\xf1\xc4\x51\xa3\x84\x89\xda\x68\x85\xdb\x72\x61\x6a\x6e\xc1\x00\
-\xbd\x77\xb6\x44\x6e\x72\x3c\x88\x99\xfa\x33\xb5\x4e\x62\x04\xbe\
-\xa0\xf1\x2b\x7f\x71\x96\xcc\xc4\x77\xef\xf8\xa1\xcf\x80\x9f\xf1\
-\xed\xd3\x55\xba\x6c\x34\x0f\xb1\x44\xe9\x9b\xb5\xd0\x32\x25\x0b\
-\x81\x0a\xeb\x15\x14\x62\xf9\x35\x12\x04\x3f\x42\x0d\x2d\xff\x19\
-\xd8\x01\x64\x89\x75\x30\x4d\xe7\x85\x69\xce\x33\x61\xca\xec\xcb\
-\x10\xfe\x37\xc3\xa4\x8b\xef\x83\x8c\x6b\x9f\x82\xf4\xdb\x5e\x63\
-\xdc\x3e\x04\xd8\xc4\xcd\x43\x3b\x81\xad\xa8\xdb\x20\xfd\x81\x6d\
-\xcc\x68\x80\x7c\xe7\x7b\x1f\x6f\xe4\x4d\xdd\x42\x01\xff\x29\x16\
-\xf8\x2b\x39\x98\x7f\x14\x46\xf1\x37\xc6\x62\xdf\x87\x60\xdf\x4f\
-\x41\x4e\xe0\xbe\xfe\x8b\x03\x54\xd7\x7d\xfe\x3d\xac\xc6\xef\x56\
-\x7e\xbc\x8f\x76\x02\x2f\xbf\xf7\x19\x3c\xbd\xf1\x43\x78\xf0\x95\
-\xf5\x70\xeb\x63\xcf\xc1\x65\xcb\xee\x87\xf9\x57\x2c\x01\xc7\x82\
-\x0b\x40\xe1\x6c\x41\x6b\xdd\x00\x39\xd8\x09\x66\x95\xd5\x53\x1f\
-\x7d\x36\x42\x9e\xec\x55\x4f\xf2\x89\xe4\x17\xe7\xba\xa9\xa0\x7b\
-\xe0\x18\x7c\x56\x3d\xe3\xab\x27\x1b\x9f\x59\x98\xd1\x16\xe7\xb3\
-\x37\xf9\x57\xcf\xca\x79\xe1\x97\xca\x60\xbf\xbd\xa0\x09\x53\x5e\
-\x07\x45\x80\xff\xad\xc2\xe4\x7c\x02\xff\x2e\x13\x2b\x15\x7d\x07\
-\xb2\x2f\x37\x11\x80\x1f\x85\x70\x3e\xaf\xf1\x19\xe9\xa9\x4a\x87\
-\x6b\x84\xdc\xec\x6e\xc6\x8a\xfb\x3e\x66\xe6\x6f\x4c\x06\xb3\x43\
-\xd3\x80\xbf\x5d\x41\x05\xe2\xea\x40\x83\x0b\x30\xdc\xf7\xb1\x68\
-\xa4\x6b\x44\x73\xed\x70\xe7\x77\xc7\xbd\x07\x2a\x67\x11\xfa\xe3\
-\xf4\xf9\xe0\xb7\xfb\x16\x6a\x49\x58\xf8\xd7\x07\x2c\xd8\x62\x26\
-\x75\xc9\x84\x22\x79\x31\x36\x81\xd7\x4c\xa9\x9a\x82\x8c\xb8\x27\
-\x0a\x89\xbb\xa7\x4e\x01\xf9\xb5\x32\xfa\x8a\xc5\x19\x64\x3b\x80\
-\xf2\x3a\xc8\xaa\x96\xb2\x6e\x9f\x56\x98\xe2\x3d\x17\x26\x9f\x7e\
-\x15\x64\x9e\xb7\x14\x26\x5d\xfa\x20\x64\x5c\x83\x1d\xc0\xad\xaf\
-\x30\xd6\x3f\x02\x9e\x2c\xf0\x9a\xc8\xc1\xfe\x5e\x76\xf2\x97\x4e\
-\x04\xf3\x5d\x40\xc1\xba\x11\xc6\x2e\xdf\x00\x63\x97\xad\x85\x8a\
-\x07\xd7\xc3\xf9\x2f\x6e\x85\x7f\xd3\x38\x7c\x32\x69\xfb\x15\xbc\
-\xb1\x23\x9c\x9b\x86\x75\xd5\x20\xcc\x09\xf0\x89\x9b\x86\x4e\xba\
-\x12\x9f\x3c\x42\x9f\x7c\xbe\xf2\xfe\x17\xf0\xaf\xf5\xef\xc3\xfd\
-\x2f\xae\x85\x5b\x1e\x7b\x1e\xae\xb8\xf3\xff\xe0\x9c\x6b\x6f\x87\
-\xa6\xf3\x2e\x03\x6d\xd3\x7c\xa8\x24\x7b\xdc\xe0\xb3\x4e\x2d\xad\
-\x61\x57\xc4\x4a\x20\x9f\x4c\x74\xd7\x2b\x69\x7e\x90\x68\x27\xe2\
-\xa3\x9f\xc9\x0b\xb1\xa4\x13\xb2\x24\xfa\x46\x6d\x62\x5c\x38\xac\
-\x55\xdf\x10\x64\xd5\xf3\x2d\x7b\x45\xd0\xfe\x38\xc1\x31\xf7\x89\
-\xa9\xd7\x89\xaa\x6b\x89\x4e\x2f\xde\x7b\x88\xf6\x99\xdb\x1f\xab\
-\x64\x60\xff\x97\xd2\xec\x5a\x89\xa3\xa6\x16\x89\x46\x37\x7a\xf0\
-\xc0\x81\x14\x63\x02\xec\x63\x17\xd1\xd4\xe9\x59\x29\x38\x24\x2d\
-\x50\x9a\x9d\x37\x61\xc6\x7e\x1e\x19\xf8\x91\x20\x19\x2f\x8c\x7b\
-\x33\xf0\x63\xe9\xd0\xe2\x01\xbe\x1f\x1a\x14\x22\x3c\xf7\x8e\x0f\
-\xfc\x04\x3a\x7c\x37\x0f\x05\x3f\x5a\xa1\x5a\x13\xdd\x8c\x8d\xec\
-\xcb\x43\xc0\x55\x8e\x56\x6a\x39\x85\xbf\x8e\xba\x29\xc8\x8e\x9c\
-\x25\x62\x04\x5d\xbd\x1c\x0a\x6a\x64\x4c\x58\x67\x25\x5a\xfe\xac\
-\xeb\x27\xa7\x5a\x06\x59\xf5\x2a\x98\x4e\x56\xf3\x1a\x5b\x60\x8a\
-\xeb\x1c\x98\x4c\x46\x00\x67\x2e\x61\x36\x70\xbb\xe4\x7e\xc8\xf8\
-\xc7\xe3\x90\x71\xc3\x33\x90\x7e\xcb\x8b\x90\x7e\xfb\x1b\x74\x43\
-\x37\xba\x83\xe7\x03\x5b\xa9\x3b\x28\xfd\x81\x77\x98\x91\x00\x2a\
-\x5d\x08\x86\x9f\x63\x56\x6c\x81\xb1\x77\x6f\x82\x8a\x47\x36\xc3\
-\xe2\xd7\x3e\x80\x17\xde\xdb\x4d\xb7\x17\xde\x80\x16\x3a\xb1\xd2\
-\xd7\xd2\x4f\xb4\xda\x77\xff\x00\x6f\xed\x3e\x48\x95\x7c\x4f\x22\
-\x6b\x5e\x46\xa8\x3f\xbb\x79\x07\x3c\xb1\xf6\x5d\x78\xf0\xd5\x0d\
-\x70\xe7\xb3\xaf\xc1\xcd\x68\xbd\x5f\x73\xef\xe3\x70\xe1\x2d\xf7\
-\x50\x0b\xde\x7d\xf6\x45\xa0\x69\x9c\x07\xd5\x7a\x3b\x14\x4a\x34\
-\xf4\xdd\x02\x64\x3b\x0a\x12\x61\x93\x55\x5e\xcf\xba\x6c\x24\x50\
-\x80\xcf\x5d\x2c\x61\x42\x2b\x67\x4a\x19\x17\x98\x2f\x96\x9e\x3f\
-\x21\xab\x63\x42\x62\x99\x49\x59\x66\xcf\x23\x09\x07\x7b\x9e\x1b\
-\x87\xb3\xea\xf9\xa0\xef\x5d\xc0\x8f\xa5\x4d\x74\x57\x47\x10\x6d\
-\x7b\x0d\x3e\xc6\xff\x37\xb6\x91\x3f\x55\x16\xe7\x3e\xcc\xfb\x1b\
-\xb4\xce\xa6\xf4\xac\xaa\x2a\x66\xa2\x56\x80\x7d\x7c\x92\xd2\xa7\
-\x4f\x52\xbd\xdb\x3d\x4c\xed\xf0\x88\xb1\x17\x7d\x16\x2b\xf0\xcf\
-\x2a\xab\xf3\x70\x78\xe0\xc7\xa2\xd1\x14\x7c\x3c\x8d\x21\xde\xce\
-\x26\xde\xce\x2b\x11\xcf\x1c\xfe\xbe\x02\xa0\x6f\xe1\x5c\x06\xec\
-\xe4\xa0\x6f\x42\xb7\xbd\x7f\xbf\x9e\x8d\xe8\xa9\x61\xdd\x3d\x24\
-\x86\x9f\xb8\x7b\x2a\x95\x3a\x16\xfe\x5a\x0a\xff\x12\x04\x23\xd9\
-\xc2\x97\x5a\xbb\xb5\x52\x28\x44\x38\xe6\x97\x55\x41\xde\xcc\x0a\
-\xc8\x2d\xad\x82\x9c\x0a\x04\x65\x8d\x1c\xb2\x1a\x74\x30\x4d\x6a\
-\x82\x69\x2a\x27\x76\x02\x38\x0a\x70\x9d\x05\x93\x5b\x2f\x82\xc9\
-\xf3\x71\x24\x70\xf6\x8d\x30\xe9\xfc\x3b\x60\xd2\x45\xf7\xc2\xa4\
-\xcb\x1f\x86\x49\xff\x78\x0c\x32\xae\x7e\x82\x8e\x0c\x26\x5d\xf7\
-\x34\xb3\x10\x6c\xc9\x73\x70\xca\x75\xcf\xc2\xa9\xd7\x3e\x03\xa5\
-\xb7\x3f\x07\xa7\x3f\xf2\x2a\xac\x78\x69\x1d\x3c\xf6\xc6\x46\xba\
-\xc0\xe9\x91\x95\x9b\xe0\xe1\xd7\x37\xc2\x43\xaf\x6c\x80\x07\x5e\
-\x5a\x0b\xf7\xfe\x67\x35\xdc\xfd\xdc\x1b\xb0\xec\xa9\x97\xe1\xa6\
-\x47\x9e\x81\xab\x56\x3c\x0a\x17\xdd\x76\x2f\x9c\x73\xcd\xed\x30\
-\xe7\xe2\xab\xc1\x79\xe6\x62\xd0\x35\xcf\x07\x89\xad\x09\xaa\x74\
-\x36\x98\xa9\xd0\xd3\x4d\xcb\x88\x05\x3f\xa9\xa8\x02\xd2\x0b\xcb\
-\xe8\xe7\xb4\xf2\x5a\xba\xc7\x4d\x01\x3e\x1f\x99\xd0\x26\x3b\x91\
-\xce\x44\xc0\x97\x2a\xfc\x90\xaf\x64\xf7\xbd\xa1\x3e\x7a\xb2\x85\
-\x31\x8d\xbc\x31\xfb\x2c\x7a\xba\x9d\x31\x59\x31\x6b\x64\x35\xc0\
-\x5f\xef\xa4\xe5\xc2\x6d\x71\xac\x8c\x19\x60\xf1\xd4\xeb\xce\xb6\
-\x83\x70\x60\x4f\x44\x3d\xee\xaa\xf6\x11\xa0\x6d\x6c\xdb\xf8\x49\
-\x69\x71\x3c\xa5\x75\x78\xb4\x79\x85\x45\x69\x14\x5a\x02\xed\xe3\
-\x17\x51\x4a\xaa\x68\xd0\xc9\xa3\x93\x4a\xaa\xea\x4e\xd4\xda\x9b\
-\xce\x57\x98\x1c\x6f\x63\x26\xff\xe1\x8b\x38\x08\x01\xa6\x50\xbf\
-\x75\xa7\x46\x73\x1f\xe1\x8e\x51\x5a\x83\x1b\x6d\xe4\xca\x19\x6c\
-\xcd\x75\xf4\xec\xf1\xdc\x1b\xff\x9e\x98\xef\x59\xc0\xf0\xc0\x2f\
-\xe5\x2c\x4e\x36\x9a\x87\x81\xbf\x95\x67\xf5\x5b\xe8\x64\x63\x8d\
-\x86\xb8\x28\x0c\x8c\xbb\x87\x5d\xb9\x4b\x63\xf9\x65\x1c\xfc\xd5\
-\xd4\xf2\x25\x13\x96\x8c\xdf\x5f\x0a\xf9\xd5\x0d\x90\x5f\x51\x0b\
-\x79\xd8\x09\xe4\x96\x54\xc0\x0c\xd4\x9c\xb2\x6a\xc8\xae\x92\x42\
-\x56\x1d\x8e\x02\xa4\x3a\x98\xae\x30\x63\x47\xe0\x80\x69\x1a\x37\
-\x4c\xd5\x37\xc1\x54\xf3\x1c\x98\x62\x9f\x0f\x53\xdc\x38\x32\x68\
-\x5c\x04\x93\x5b\xb0\x63\x20\x6f\xf0\x6a\x45\x9d\x75\x29\x14\xcc\
-\xbf\x12\x74\x17\x5c\x0b\xa7\x5f\x71\x23\x9c\x79\xe5\x8d\x70\x06\
-\xea\x69\x97\xdf\x00\x73\x2f\xb9\x16\x5a\x16\x5d\x49\x2d\x75\xdb\
-\x69\xe7\x81\x61\xd6\x02\x50\x35\xce\x01\x99\xb3\x05\xea\x2d\x1e\
-\x6a\xb9\x97\x2b\x8d\x74\xc5\x6b\x4e\xb5\x18\x26\xcf\xac\x46\xb0\
-\x97\x43\x7a\x7e\x29\x4c\x2a\xae\x80\xa9\xa5\xd5\xd4\x9a\x27\xfe\
-\x78\x62\xc5\x17\x36\x28\xe8\x48\x86\x3c\x17\xb1\xe4\xe9\xf6\x07\
-\xec\x24\x2c\x79\x7e\x92\x0f\x74\x75\xac\xda\xef\x9f\xaf\xd3\x71\
-\x6e\x1b\x46\x25\x6c\x5c\x3d\xc9\x5b\x12\x6e\x29\x37\xdb\x69\xbe\
-\x2b\x82\x2d\xfa\x2e\xae\xa7\xfc\xe3\x3a\xaa\x73\xb1\xb6\xc5\xd0\
-\xc7\xbb\x3b\xbc\x76\xa7\x9e\x2d\xea\x76\x16\x52\xdb\x54\x16\xd7\
-\x21\x6c\x0b\xdb\x91\x49\x73\x75\xde\xa6\x53\x47\x8c\x1e\x45\xf7\
-\xcb\x11\x78\xdf\x09\xe1\x56\xe0\xe6\x4e\xcf\xef\x67\xb4\x7b\x8b\
-\xe4\x26\xfb\xed\x38\x84\xfa\x51\xc9\xf4\xb0\x6d\x02\xf0\x7b\x02\
-\xf8\x7e\x17\x4f\xb0\x9b\x87\x81\xbf\x8d\xf5\xef\x33\xc0\xa2\xdb\
-\x34\x18\x2c\x34\x94\x93\x58\xfd\x64\xf7\xc6\x1a\xd6\xcf\xcf\xf9\
-\xfa\x99\x89\x5e\x62\xf9\x33\xee\x0d\x02\xc6\x99\x32\xe2\xf7\x57\
-\xd1\x7d\xf9\x8b\xea\x65\xf4\x65\xeb\x64\x71\x57\x41\x55\x03\xdd\
-\xb9\x33\xaf\xaa\x9e\x4e\xfe\xd2\x09\xe0\xca\x3a\xaa\x39\x68\x4d\
-\x67\x57\xd4\x21\x74\xc9\x44\xa8\x0c\xb2\xc9\x3a\x00\xb2\x08\x4c\
-\xac\x85\x2c\x89\x1e\xa6\x93\xb7\x78\x49\x0c\x30\x43\x6e\x82\x62\
-\x95\x05\x2a\xd4\x66\x54\x13\x94\xab\x4c\x50\x86\x20\x9f\xa9\x30\
-\x40\x31\x82\xb9\x00\x3b\x9c\x19\xc4\xad\x54\xd1\x00\x53\xcb\xea\
-\xa8\x4e\x43\xcb\x7d\x3a\xa6\x3f\xbd\xac\x16\xad\x78\xfc\xac\x60\
-\x3e\x49\x08\x65\x4e\x25\x13\x5d\x93\x4f\xee\x11\xef\x97\xbc\x39\
-\x8c\x74\x60\xe4\x39\x4a\x59\xbf\x7c\xb9\xd2\xef\x9b\xaf\x62\xfd\
-\xf3\x64\xf5\x32\xdd\xcd\x92\x5a\xf3\x4c\x1e\x89\x83\x60\xcf\x75\
-\xa4\x0c\xec\x1d\x7e\xd8\x0b\xc0\xef\x51\xe0\x63\xda\xbb\xf1\xf3\
-\x1e\xa9\xc1\x56\x50\x26\x95\xa6\x0d\x1b\x36\x4c\x98\xa8\xed\xac\
-\x88\x52\x98\x4d\xe6\x4e\x10\x8b\x53\x24\x67\x9f\x35\x54\x61\xb4\
-\x58\xb1\x57\x7d\x83\x0c\xa5\x3a\xaa\x9c\x91\x34\xd6\xe3\xc3\x02\
-\x3a\x81\xc7\x06\x28\x39\xc7\xe2\xd7\x60\xe0\x76\xf6\x19\x12\xa1\
-\x0a\xd6\xd2\xe7\x80\x2f\x67\x55\x46\x7d\xfb\x8c\xeb\x81\x0f\x7d\
-\x2e\x86\x9f\xb1\x62\xcd\xd4\xe2\x27\x7e\xfe\x1a\x8d\xdf\xf2\xe7\
-\x42\x3b\xc9\x64\x2f\xb5\xfe\xd9\xbd\x7b\x38\x70\x96\x50\xdf\x3f\
-\xd9\xc0\x4d\x49\xb7\x74\x28\xac\x43\xc0\x92\xb7\x73\xd5\x34\x60\
-\x47\x50\x8f\x23\x81\x3a\xc8\x43\x08\xe7\x95\xd7\x40\x1e\x19\x15\
-\x50\xad\xc3\x4e\xa1\xce\xd7\x39\xe4\xd1\x0e\xa2\x81\xf1\xab\xb3\
-\x31\xef\xd3\x29\xcc\xeb\xe8\x8a\x56\x02\xf5\xa9\x38\x82\x20\xd6\
-\x3a\xd9\xce\x60\x4a\x69\x0d\xdd\xbf\x86\x44\xd4\x90\xf3\x66\x90\
-\x0e\xa7\x56\x4a\x2d\xf8\x22\x62\xbd\x4b\x55\x74\x52\x9a\x28\x77\
-\x9f\x65\x74\x2f\x7a\x1d\x7d\x59\x38\xb1\xe4\x29\xe0\x69\x58\xa5\
-\x81\x3e\x6b\x2d\x6f\x27\xcb\x7a\x3d\x3f\xea\x86\xf3\xd1\x07\x5a\
-\xf5\x8c\xeb\x86\x80\x9e\x83\xbd\xab\x9d\xbf\x3e\xda\xfa\xe0\xab\
-\x53\x91\xea\x6c\x07\xc7\x44\x4a\x37\x1c\x70\x63\xbd\x8f\x44\xb5\
-\x63\x55\x90\x06\xb7\x33\x7e\xbb\x8a\xae\xad\x3a\x0f\xa3\xfe\x8e\
-\xfa\xa2\xc6\xd1\x68\xa9\x56\x68\x4f\xa4\xac\x12\x40\x9f\x00\xe1\
-\x32\x71\xcc\x98\xa4\x93\x72\x72\x44\x4a\x8b\x3d\x53\x61\x71\x2c\
-\xc4\xcc\x7e\x0f\x33\x9f\x64\x7c\x5b\x6c\x85\x25\x68\xa2\xd5\x67\
-\x6d\x52\x65\xc0\x24\xf7\x4d\xea\xda\x42\xc3\x9f\xe7\xe7\xf7\xc7\
-\xf3\x9b\x7c\xa1\x9d\x55\xac\x15\x4c\x5d\x3f\x6c\x07\xc0\x45\xfc\
-\x94\xca\x35\x8c\x1f\x9c\x85\x2c\x55\x32\x01\x4a\x46\x03\x62\xc6\
-\x1d\x44\xb6\x0a\x26\x4a\x3b\x05\x32\x31\x4c\x56\x00\xf3\x94\xba\
-\x8a\xc8\xfa\x00\xf2\x49\xc2\x45\x59\x25\x1b\x92\x91\x55\xad\x05\
-\x0d\x72\x3a\xa1\x4c\x23\x68\x88\x8a\x99\xf4\xc9\x64\x33\x55\x1e\
-\xdc\xc9\xfd\x90\xfb\xf2\x85\x52\xd2\x95\xb0\xcc\xae\x95\x55\x1a\
-\xa2\xcc\x04\x2c\x85\xbc\x8e\x85\xbc\x8e\xb1\xe6\x1b\x0c\x3c\x6b\
-\xde\xb7\x78\xca\xc6\x42\xde\xee\xeb\x48\x15\x01\x56\x7d\xfb\x48\
-\x9c\x78\x34\x2c\x04\x05\x8d\xac\x66\xe7\x1f\xa8\x9f\xc8\x4d\xf6\
-\xcb\x94\x0e\xf7\xa9\xf9\x65\xa5\x69\x0c\xaa\x04\xe0\x27\x54\x52\
-\xfa\xf6\x15\x55\x1a\xf4\xfd\x35\x16\x7b\x81\xc2\xe4\x7c\x10\x33\
-\x7d\xbf\x92\xfa\xd1\xd8\x0a\x7c\xec\x00\xbf\xad\x87\xaf\x1f\xdc\
-\x00\x78\x20\x72\xf8\xdc\x0e\xfc\x49\x5d\x9f\x9b\xc7\x48\x96\xff\
-\x5b\xa9\xdb\x82\x4e\x46\x92\xe8\x13\x1f\xf8\xcd\xbe\x85\x5c\x81\
-\x96\xbf\xd1\xbf\xb0\x8b\xeb\x00\x78\xa3\x00\xaa\x2c\x70\x39\x77\
-\x10\x55\xb6\x33\x28\x61\x43\x42\x4b\xd8\x4e\x81\xaa\x98\xd1\x62\
-\xfe\x77\x54\xf1\x38\x99\x9a\xba\x93\xc8\xf9\xa5\x52\xbf\xc5\x4e\
-\x81\x2e\xd7\x31\xca\x4e\xb6\x72\x5a\xc9\xde\x1b\x81\x3c\x13\x61\
-\xe3\xb7\xe2\x39\xdf\x7c\x3d\xab\x0d\xf4\xcd\x53\x96\x20\x3f\xbd\
-\x95\x67\xd1\x3b\x02\x61\x2f\x00\xbf\xb7\x68\x1b\x5b\xdf\xbf\x57\
-\x98\xec\xcb\x54\x56\x6f\x55\x51\x59\x65\xff\xd4\x14\x61\xeb\x84\
-\xc4\x0b\xe3\xcb\x17\xa5\xa5\xa6\x26\x95\xd5\xd4\x1d\xa7\xb2\xbb\
-\x1c\xd8\x08\x9e\xc3\x4a\xff\x3f\x05\x7f\x91\xc9\xd1\xa7\x6d\xca\
-\xde\x06\xf8\x60\x0d\x00\x91\xdf\xaf\xcf\x6d\xc2\x26\xe3\x4d\xe8\
-\x12\xeb\x95\x5a\xb2\x6c\x44\x0f\xf5\x57\x53\xf8\x5b\x7c\xca\x45\
-\xf7\x70\xca\x40\x93\x58\xc8\x0c\x48\x39\xa5\x2e\x20\xd6\x0d\xc4\
-\x75\x06\x95\x34\xe2\x85\x03\x31\xe3\x37\x2f\x57\x04\x6a\x19\x1b\
-\x1e\xca\x81\x3b\x58\xa9\x2b\xc6\xa7\x7a\x5f\x9a\xdc\x02\xa8\x2a\
-\x76\xa2\x95\xeb\x88\xf8\xf7\xe4\x03\x3c\x4f\x99\x90\x4a\xbf\x72\
-\xcf\x2c\x66\xf3\x81\xb3\xea\xfd\xbe\x7a\xbf\x7b\x4c\x1e\x30\x7a\
-\x0a\xe1\xb7\xef\x3d\xda\xbb\xeb\x68\x82\x9e\x11\xf3\xff\x17\xec\
-\x80\x57\xcb\x4d\x4e\x93\xa9\x75\xf6\xf1\x27\x9d\x3c\x5a\x58\x51\
-\xdb\x55\xc2\x4d\xe0\x4e\xcb\xca\x4a\xd3\x38\x9a\x47\x63\x63\x38\
-\x13\x0b\x60\x07\xea\xef\xb1\x43\xaa\x9b\x2b\x8b\x99\xa7\xb1\x1e\
-\x47\x3b\x34\xe7\xdf\xa8\x3f\xe3\xb3\x7e\x83\xfa\x35\xea\xaf\xf8\
-\xfd\xa1\x84\xdc\x4f\xb0\x76\xf2\x99\x14\xdc\x56\xbc\x96\x40\x50\
-\x71\x1b\xb2\xf9\xe3\xf8\x99\x95\xbb\x54\x0d\x8c\xcb\x87\x71\xfb\
-\xf8\x57\xf1\x72\xfb\xf6\x30\x13\xbe\x66\x9f\xff\xdf\x37\x07\xc0\
-\xce\x03\x70\x23\x82\x6a\x1e\x88\xab\xd9\x49\x61\xce\xea\xe6\xb4\
-\x92\x44\x09\x71\x9d\x85\xef\x18\xfe\x79\x86\x76\xe9\x54\x73\x91\
-\x34\x9c\x6b\x86\xdd\x40\xae\x4e\xeb\xbf\x1f\xff\xc4\xab\x35\xe0\
-\xfe\xc5\xbc\x67\x63\x9e\xd3\xee\x7b\xaf\x2c\x7f\x0b\x63\x7f\x2c\
-\x3d\xbf\xf3\xf4\xe7\x67\x2f\x00\x1e\xa9\x87\x6d\x0a\xab\xeb\x6f\
-\xbc\xb7\x5f\xf1\xef\xff\xa1\x1e\xc2\xb2\x6d\x8b\xab\xfe\xf4\x46\
-\x0d\x57\xa7\x19\xd8\xff\x85\xe5\xb3\x55\x69\x75\x5f\x28\xd6\x19\
-\x26\x1e\x7f\xe2\x09\x49\x7d\x52\xd3\x7a\x98\x8a\xc7\x80\x24\x8b\
-\x92\x44\x85\xc5\x33\xd3\xe4\x26\x57\x29\xf6\xb4\x4b\xb1\x20\xf6\
-\xb2\x05\x13\x9d\x95\xd1\x13\x15\x33\x36\xe0\xb7\x51\x65\x9e\xe7\
-\x30\x3e\xdf\xdf\x14\xf4\x26\xc7\x6b\x72\xa3\xfd\x36\xb4\xfc\x6e\
-\x41\x40\x6c\x54\x98\x9c\x07\x95\x74\x1e\x23\x0e\xeb\xaa\x87\x80\
-\xcf\x59\xfd\x72\x5e\x54\x8f\x6f\x04\x60\x60\xd4\x67\xfd\x07\x81\
-\xbf\x81\x75\x83\x04\xfb\xff\xdb\xbb\x83\x78\xca\x76\x0a\x75\x5a\
-\x93\x6f\x97\x4f\x12\x19\xe3\x57\xb3\x4f\x6b\xf9\xa3\x09\xad\x1f\
-\xea\x3e\xe5\xa0\xae\x0d\xbc\x76\xa8\xfb\x6b\x60\x3b\x2e\x4e\xb9\
-\x67\xf3\xbb\x6c\x1c\xed\x2c\x79\x79\xf0\x48\xa9\xf7\x01\xbf\x0d\
-\xc1\xf7\x07\xad\x8b\x16\xe7\xdb\x08\xfb\x2d\xf8\xdd\x01\x34\x3c\
-\xfe\xf2\xd5\x59\xf3\x11\x30\x22\x8d\xab\x4e\x3b\xff\xc2\x32\xf8\
-\x16\x3f\x97\xab\xcd\xee\x19\x33\x2a\xb4\xfd\x29\x8c\x04\xcb\xbe\
-\x7b\x64\xe0\x80\x81\x49\x56\x6b\xd3\xf1\x0a\x93\x4b\x81\xf0\x7b\
-\x1a\x0b\xe3\x00\x0b\xbf\x00\xc8\xb4\xfb\x7f\x80\xc6\x08\xbc\x4e\
-\x40\x92\x69\xb4\xfe\x06\xcd\x4b\x93\x6b\x28\xcc\x71\x4c\x23\x3f\
-\x8c\x30\xff\xaf\xc2\xec\xf8\x02\x21\xb0\x5a\x6e\x74\x3c\xaa\x30\
-\xda\xaf\x52\x5b\xdd\x0e\x9d\xb3\xb9\x54\x69\xf1\x94\xe1\xff\x4f\
-\x43\x50\x3c\x89\xcf\xb1\x1b\xf5\xcf\xe0\xe7\x09\xce\x83\xb8\x9f\
-\x25\x96\xdf\xda\xa9\x3f\xaf\x83\xdd\x12\xc1\xf0\xf7\x75\x00\x46\
-\xc6\xea\x95\xf2\x2c\x7f\x3f\x38\xad\xbc\x8e\xa0\x7d\x67\xc0\x85\
-\x7d\xfa\xe6\x04\xb4\x16\x9f\xdf\xbc\x9e\x9d\x28\xad\xf3\x29\x67\
-\x99\x5b\x02\x56\xb3\x06\x1e\x6f\x0e\x4c\x8f\x73\xcb\xe8\x82\x2c\
-\x78\x9f\x2f\xde\x7f\xaf\xdc\x6a\x58\x09\xcf\x9d\xd5\x0e\xf2\xa6\
-\xa0\x10\x4b\x36\xfa\x26\x1a\x00\x75\x27\xec\x18\x75\xa2\xe1\xe1\
-\xfa\x19\xeb\xe5\x56\xb9\xc9\x7e\x87\xdc\xe0\x38\x4d\xa1\xb7\xcf\
-\x53\x18\x1d\x37\xa0\x3e\x8e\x75\x74\xa3\xdc\xe8\xdc\x8f\xed\xf1\
-\x37\x05\x13\x4c\x11\xd0\x51\x30\xe9\xf3\xda\x1e\x93\x26\x4f\xbb\
-\xe0\x99\xc3\xb5\x87\x48\xe9\xb7\xff\xad\x8d\x75\xa3\xfd\x28\x33\
-\xbb\x9e\x51\x59\xad\x96\xec\x19\xae\x41\x49\x49\x59\xac\x17\x47\
-\x00\x7e\xb7\x48\x5a\x9f\x34\xd1\x88\xe3\x8e\x4b\x2a\xa8\x16\x9f\
-\xa8\x71\x34\xcf\xc7\xc6\xb3\x06\x0b\xe6\x37\x05\x57\x40\x31\x6a\
-\x40\x27\x10\xd8\xb3\x87\xae\x28\xc1\x50\x8b\x05\xf8\x41\x69\xe2\
-\x6f\x6d\xd4\x8a\xc7\x21\xb2\x82\x4c\x08\x99\x9d\x3b\xf1\xbb\x55\
-\x1a\x47\xe3\xdd\x5a\x67\xd3\x5c\xad\xcd\x5b\xa1\x70\x79\xc7\x66\
-\x49\x65\xfd\x87\x0e\x3d\x2e\xa5\xa4\xa2\xaa\xaf\xd8\xed\x1d\xa9\
-\x76\x34\x5a\xb0\x81\x3d\x8c\x8d\xf0\x33\x4c\xe7\x77\x05\x33\x1a\
-\x88\x0e\xf8\x96\xd0\xf7\xe3\x3f\x9e\x6d\x88\x01\xcf\x1d\x29\xff\
-\xda\x37\xac\x68\xd5\x0f\x7f\xb6\x03\x60\xdd\x1c\x8c\xf2\xfc\xff\
-\xac\x2b\x84\xbf\x87\x4f\x7b\x65\xe1\xcb\xef\x0c\x74\xd6\x40\x48\
-\x07\xff\x3f\xac\xf2\x7c\xee\xed\x80\xce\x77\xd1\x30\x2a\x35\xf0\
-\xfc\xf0\x01\x80\xb7\xb3\x80\x67\x9e\xd1\xf7\xdc\x21\x81\x1f\x5d\
-\x79\x45\xf3\x7b\x34\x69\x46\x05\x5a\x33\x75\xdb\x1c\x40\xdd\x20\
-\xb7\xb8\xaf\xd4\x39\x3d\x45\x52\x9b\xe3\xf8\x9a\xe6\x59\x43\xe5\
-\x8d\xcd\xe3\xb4\x4e\x4f\x9d\xc6\xde\xb4\x50\x6d\xf3\x3c\xa6\x34\
-\xd1\x91\xe7\x17\x78\xec\x41\xac\xcf\xbf\x2b\x98\x73\x7d\x6d\x2c\
-\xb6\x36\x19\x5b\x7d\xe2\xdf\x77\x74\x6d\x3d\x7c\x47\xc3\x3b\x9e\
-\xb4\x4d\xf2\x1c\xef\x61\x39\x92\x05\x56\xe3\x4e\x3a\x75\x06\x7d\
-\x47\xad\x48\x98\xab\xed\x3e\xe1\xfc\xf9\x59\x85\x45\xfd\x54\xce\
-\xe6\xa9\x08\x87\x2b\xb1\x82\x91\x8a\xf6\xe7\x11\x00\xfc\x36\x4e\
-\x95\x0c\xec\xc9\x30\xf9\x2b\xd4\xb7\xe4\x26\xdb\x03\x32\xb3\x7d\
-\xbe\x4c\x6f\xab\x2f\x17\x2b\xa6\xce\xac\xae\x3f\xb9\xa4\xbe\x61\
-\x48\x46\x6d\x4d\x1f\x51\x9f\x3e\xf4\xa1\x53\x53\x53\x44\xb9\x25\
-\xc5\x7d\x8a\x1b\x24\xc7\x23\x8c\x2a\x15\x26\xc7\xb5\x78\x0f\x5b\
-\x50\xff\xa7\x20\x51\x4b\xe6\xc0\x4e\xef\x88\x03\x3e\xdf\xdd\xc3\
-\xba\x7c\x02\xc0\xef\x5b\xd8\xd5\x5e\xc5\xbc\x30\xc7\x06\x16\xfc\
-\xa1\x34\x1c\xe4\xf9\xbf\x73\x1d\x87\x38\x08\xec\x62\x3e\xe4\x79\
-\x0b\xa3\xfc\x31\xf3\x61\xac\xf9\x23\x0f\xf8\x6d\x6c\x3a\xdf\x20\
-\xec\xfe\x8d\xf7\xdb\xa8\x32\xd9\x32\x8b\x1a\xea\x87\x64\x95\xce\
-\x4c\x1d\xec\x72\x26\xe7\xaa\x55\x7d\xca\x25\x92\x61\x25\x95\xf5\
-\x63\x6b\x54\xba\x5c\x99\xc9\xa9\xc5\xb2\xba\x10\x9f\xfd\x09\x3c\
-\x6f\x1b\xd6\x19\xe2\x06\x21\x2e\xc9\xc3\x4a\x5e\xbd\x3f\x42\x80\
-\xcf\xdd\xeb\x0e\x2c\xb7\xeb\x1b\xb4\x96\xdc\xe2\xda\xda\xb4\xe3\
-\x8f\x1f\x2e\x2c\xb0\xea\x6e\xe1\x32\x7b\xe8\x90\x21\xc9\x15\x62\
-\x71\x7f\x89\xd9\x55\x8b\x95\xec\x2e\x16\x9c\x5c\x61\xc5\x05\xa0\
-\xb8\x94\xe7\x77\x0d\x6a\x84\xed\x2a\x38\xc2\xed\x10\x36\x9e\x9f\
-\xb0\x12\x7d\x8e\xf7\xbc\x11\x1b\xfd\x3f\x11\xf2\x97\xca\x6d\x6e\
-\x8f\xc6\xee\xad\x95\xd8\x5c\xe3\x75\x0e\x77\xff\x91\x27\x9e\x10\
-\xf0\xac\xec\xdf\x01\x95\xad\xbc\xa6\x66\xa0\xde\xdd\x58\x24\xd3\
-\x3b\xce\xc1\x0a\xfc\x2c\xa6\xbf\x9b\xf5\xb3\x86\xbc\x76\x3c\xca\
-\x1b\xd6\x77\xfc\xfc\x09\xc8\x4b\x66\x21\x97\x33\x00\x9a\xfe\x0e\
-\x80\x03\x6a\x20\x68\x19\x1f\x79\x30\xfc\xf1\x53\xcf\x5a\xe2\xbc\
-\x0e\x82\x0b\x0b\xe5\xaf\x68\xf5\xc7\xc2\x5b\xe9\xa4\xaa\x38\xb8\
-\x63\xe1\xc0\xce\xce\x31\xc8\x02\xe0\x6e\xf7\x8d\x46\xe4\xed\x5c\
-\x36\xce\xd0\x91\x36\x9c\x9a\x82\x34\xe6\x32\x89\x16\x8a\x21\x46\
-\x99\xbc\x6b\x06\xa7\x43\xeb\xa8\xc5\xf1\xb3\xc2\xec\xd8\x22\x33\
-\xd8\x97\x2a\x2d\x76\xbd\xdc\xe5\x1d\x33\x6e\xfc\x04\x7e\x54\x0a\
-\xf3\x0f\x6b\x7c\x4d\x98\x92\x29\xd2\x59\xe7\x0d\x95\x1a\x3d\x53\
-\x71\xf4\x29\x97\x5b\x5d\x2d\x38\x5a\xbb\x06\xf3\xe5\x39\xfc\xdc\
-\xc6\xb4\x4d\xc7\xff\xb0\xde\x1f\x0e\xba\xbf\x84\xb4\xd5\xb8\x0c\
-\x8e\xa0\x7a\xcb\x07\x3e\x96\xdf\xdf\x72\xd2\x61\x19\x9d\x0f\xe2\
-\xff\x6b\x4a\x95\xda\xa1\x6c\x2b\xec\x06\xc2\x09\x12\x42\x98\x8c\
-\x3f\xee\xb8\x13\x92\x35\xa6\xd6\x11\x08\x3c\x35\x56\xe0\x57\x14\
-\x24\x74\xaa\xbb\x81\xdf\x11\xc4\xb0\xf2\xe0\xbd\xfd\x82\x95\x1d\
-\xad\x25\x6a\x31\xbc\x21\x37\xbb\xee\x52\xdb\x1b\x17\xaa\x9d\x8d\
-\x72\x95\xd5\x73\xf2\xb4\xec\x19\x7d\x86\x0e\x3b\x3e\x75\xd8\x89\
-\x27\x26\x1f\x3f\x72\xa4\xa8\x5f\xdf\xbe\xe4\x01\x29\xe3\x83\xad\
-\x09\xf6\x3b\xd1\x80\x7e\xfd\x44\xe3\x27\x4f\x4e\x55\x38\x1b\xc7\
-\x61\xe5\xb4\x62\xa3\x26\x95\xf3\x23\x6c\x58\x24\x0f\x82\x1b\x56\
-\xef\xd3\x30\x90\x0b\xf6\xef\xf3\xe1\xc9\xf7\xf7\x53\xe5\xed\xe5\
-\x23\x33\xf9\xe7\x00\xb8\xd1\x00\xb7\xd9\x18\x7f\x11\x58\x3b\x35\
-\x05\x7f\xc7\x73\xcd\x18\xf9\xdb\x46\xb0\x51\x35\x46\x47\xbb\xd1\
-\x08\x67\xc1\xf3\xef\xd9\xf7\x7c\xe1\x60\x1e\x27\xf0\xe3\xce\x5f\
-\x53\x88\x6b\x07\x9e\xd3\x86\x06\xc8\xef\x38\x6a\xdc\x87\xfa\x26\
-\x3e\xff\x45\xfa\xe6\x39\x33\x0b\x6a\x6a\x07\x0d\x18\x32\x44\x94\
-\x92\x92\xe2\xaf\x8f\x08\x7a\x02\x7b\x0e\xfe\xfd\xfb\xf5\x15\x8d\
-\x38\x7e\xa4\x68\xf8\xf1\x27\x25\x0f\x1d\x7e\x7c\x6a\xbd\x4c\xd6\
-\x57\xe7\xf4\xa6\xab\x6d\x8d\x46\x8d\xbd\xe9\x12\xcc\x9b\xff\xc3\
-\x3c\xc1\x51\xac\xe3\x33\xbc\xce\xf7\xf8\xf9\x3f\x05\x07\xff\x58\
-\x9f\x3f\x96\x3c\x8b\x3d\x7f\xdb\x14\x4c\x7d\xfb\x09\xcb\xf9\x15\
-\xa5\xd5\xd3\x58\x23\x91\x0d\x1f\x76\xe2\x08\xc1\xb2\xef\x0d\x32\
-\x60\x40\x7f\x51\x59\x69\x9d\xa8\x5a\xa6\x1f\xab\x32\x3b\x4f\xc3\
-\xc2\x5a\x25\x8f\xd3\xb5\x93\xa0\x46\xc6\x59\xd6\x64\xf2\xf5\x10\
-\xea\xdf\x58\xb9\xf7\x21\x14\x56\xca\x0c\x8e\xe5\x32\xa3\x75\x81\
-\x58\x6f\x93\xe1\xe7\xd4\xa2\xb2\x9a\x51\xc5\x35\xf5\x43\xb3\x73\
-\x72\x52\x99\xa7\x89\xbe\x32\x71\x15\x6f\xc8\xe0\xc1\x49\x39\x33\
-\x4b\xd2\x94\x66\xc7\x09\x32\xad\xb9\x10\x2b\xe9\xf9\x78\xed\x95\
-\x08\xfd\x9f\xb9\xfb\x90\x77\x47\x07\x18\x6f\xa3\x0d\xf1\x5b\x3b\
-\xe0\x9b\xdb\x4f\xf4\xca\x42\x68\xbb\xce\xa0\x9d\x25\x1e\x46\x43\
-\xfe\xe6\x08\x80\xbd\xef\x1a\x41\xc0\x97\x07\xc0\x3e\x04\xf0\x23\
-\x01\xa7\x3b\x80\x1f\x0e\xf2\x81\xd7\xe5\xea\xec\x1f\x08\xfc\x1d\
-\xd8\xd9\xad\xc0\x51\x8d\x11\xeb\x54\x7a\x99\x5a\x3d\xf0\x84\xe9\
-\xd3\x69\x65\x4b\x8e\xe1\xfd\xac\x7d\xd3\xd2\x92\x8a\x4a\x67\xf6\
-\x29\xac\xaa\x1b\x5e\x5a\x23\x19\xa3\x34\xd8\xf2\x30\xff\x4c\xc4\
-\xe5\x43\x5e\x6a\x84\x65\xb9\x11\x3f\x0f\xb2\x6d\xe4\x10\x85\xbf\
-\x29\xca\x51\x69\xd7\x02\xff\x30\x96\xe3\xef\x58\xc6\xef\x35\x68\
-\xad\x73\x94\xf6\x96\x53\x4e\x99\x38\x81\xf5\xdb\x0b\x8e\xfb\x1e\
-\x17\xae\x12\x16\x94\x94\xf4\x35\xb8\x1b\x27\x23\x48\x2f\xc2\xc2\
-\xdd\x8e\x85\xf6\x1b\xd7\x00\xb9\x95\x8a\xfe\xff\xb3\x60\x09\xb2\
-\x22\x15\xec\x7e\x25\xed\xac\xcb\x60\xdf\x6b\x88\x06\xed\xff\xbf\
-\x83\x58\x08\xbf\xe3\x39\x7b\x10\x18\x6b\x65\x46\xdb\xe3\xd8\x80\
-\xae\xc2\xca\xee\x94\xdb\x1a\x2b\x65\x06\x4f\xba\x52\x67\x1f\x32\
-\x71\xe2\xc4\x60\xba\xfb\xac\xa7\x68\xad\x08\xfe\xb1\x99\x93\x26\
-\x25\x19\x8d\xa6\xbe\x3a\xab\x73\x2a\xde\x8b\x07\xaf\x77\x0f\x7e\
-\xbe\x83\x0d\xec\x17\xfc\xfb\x30\xff\xb9\x23\x69\x60\x7e\x74\x7c\
-\x4c\x3b\xb0\xc5\x78\x8d\x8e\x34\xfc\x79\xce\xc0\x8e\x20\x44\xba\
-\xa1\x7c\xe9\x7c\x90\x87\x3a\x96\x83\xbd\x3c\xf8\x18\x73\x30\xd8\
-\x83\x35\x74\x9d\x68\xf7\x7d\x04\xe0\xf3\xd3\x8b\xb5\x4c\x82\xaf\
-\xc7\xbf\x6e\xa8\xce\x88\xa7\x6d\x72\x93\xfd\x10\x3e\xdf\x7e\xfc\
-\xfb\x3f\xf8\xfc\x8b\xe5\x66\x77\x8d\xc6\xe9\x3a\x31\x2f\x2f\x37\
-\x85\x5f\xd7\x22\xd7\x45\xa2\xc9\xbe\xd1\x67\x12\xdf\x7a\x19\x3c\
-\x24\x69\xfa\xc2\x85\xa9\x6a\xa7\xeb\x04\xb5\xdd\x3d\x4d\x65\x6b\
-\x6c\x90\x99\x5c\x2d\x72\x83\xfd\x26\xb9\xd1\xfe\x14\x5e\x77\x13\
-\xea\xb7\x98\xe7\x87\x82\xf2\xa6\x2d\x64\x07\x15\x13\xf0\xc3\xd7\
-\xa7\xe0\x72\x92\xd1\xbc\xa0\x2e\xd7\x8f\x64\x7a\xdb\x35\x72\x83\
-\x33\xbb\xa8\xac\x36\x85\x8c\x5e\xa2\xc9\x03\x41\xba\x51\x88\x0b\
-\xe4\xe4\x53\xc7\x25\xab\x6d\x4d\x65\x58\x69\x97\x62\x05\xfe\x54\
-\x6e\xb6\xff\xcd\x54\xe8\xe8\x01\x13\xb3\x52\x30\xd8\x09\x50\x7f\
-\xa5\x95\xd6\xe4\xfc\x18\x3f\xd7\x60\x23\xba\x07\x87\x83\xf3\xd4\
-\x0e\x6f\x9d\xd4\xe6\x98\x50\x2b\x93\x0f\x38\x71\xe4\xa8\x94\xc1\
-\x43\xf4\x12\x28\x26\x00\x00\x1a\x3f\x49\x44\x41\x54\x8e\x4b\x1e\
-\x3e\x6c\x38\x1a\x0b\x6c\xcb\x88\x01\xf0\xe1\x84\x9c\x4f\x3a\xbe\
-\x11\x23\x8e\x17\x0d\x19\x3a\x44\x24\x55\xd8\x86\xa9\xed\x4d\xa5\
-\x52\x83\xfd\x52\xac\xc4\x6f\x48\x8d\x8e\xbd\x72\xda\x09\xf9\x2b\
-\x7d\xac\xc0\x8d\x07\xd0\xe1\x80\xd5\x15\xe5\x10\x2a\xdd\xd0\x93\
-\xa7\x1d\x7f\xef\xdf\xd6\x20\xbe\x4e\x2a\x9e\xbc\xea\xcc\x73\x76\
-\x42\x49\xfb\x38\x88\xba\x1d\xc1\xfb\x88\xc2\x6c\x77\x28\x5c\xde\
-\x71\x27\x8e\x3e\x39\x79\xe8\xf0\x61\xa2\x3e\x69\x9d\xdb\xe2\x9d\
-\xd6\x6d\xf2\x47\x5a\x9a\x28\x75\xcc\x18\xd1\x30\xac\x9f\x83\x86\
-\x0d\x4d\x1e\x3f\x3e\x3d\x45\x6a\x30\x0d\x56\x3a\xdd\x53\xd4\x8e\
-\x46\x85\xca\xea\x59\x88\xed\xe8\x9f\x78\x1f\x5b\x10\xd0\x9f\xe3\
-\xe7\x01\xfc\x3f\x31\xd8\x0e\xfb\x9e\x3b\x44\x27\xda\x51\xbd\x8b\
-\x39\xaf\x8c\xf6\xbf\xb1\x2d\x7f\x2d\x33\xd8\xee\x55\xd8\x9c\xa5\
-\x75\x06\xe3\x10\x84\x7d\xa7\xda\xa6\x20\x5d\x22\x4c\x85\x4c\x4b\
-\xeb\x2f\x12\x4b\x8c\x03\x34\x76\x4f\xb9\x04\x2b\x30\x36\x5c\x62\
-\xb5\x90\x1e\x3b\x91\xd0\x6f\x63\x95\x54\xc6\x43\x78\x8d\x3f\xb0\
-\x92\x90\x0a\xba\x55\x66\xb0\xdf\x2f\xd1\x5b\x4f\x93\xea\x1d\x52\
-\xa9\xd9\x9b\x55\x2d\x56\x9c\x94\x53\x5a\x37\x28\xa7\xac\xb4\xcf\
-\x90\x21\x83\x99\x3b\x65\x1b\x4f\xa2\xad\x05\x7e\x7a\x99\x93\xa6\
-\x24\x4b\x14\xe6\x41\x6a\x93\x75\x42\xbd\xd6\xa2\x45\x8b\xf5\x76\
-\xbc\xc7\x0f\xb0\x42\xff\x46\x1a\x39\x19\x36\x47\x9b\x27\x47\x32\
-\xf0\xe3\x51\x7e\x47\x70\x94\x02\x9f\x94\x3b\x5a\xf4\xce\xbf\xf0\
-\xf9\xbe\xc6\xd1\xe7\x8b\x52\x83\xf5\x2c\x99\xd5\x51\x54\x6d\x30\
-\x9c\x38\xa9\xa2\x22\x2d\xa5\x5f\xbf\x84\xd7\x51\x2e\x25\x2e\xcd\
-\x91\x23\x47\x8a\x0a\xea\xea\xfb\xe4\x96\xd6\x0e\xa9\x93\x6a\xc7\
-\xc8\x2d\xee\x02\x99\xde\x6e\x90\x1b\x6c\x8b\xe5\x46\xdb\x13\x08\
-\xfe\x0f\xb1\x4d\xfd\x84\xe5\xf1\x27\x69\x6b\x9c\xcb\x27\x5c\xbd\
-\xed\x24\xf0\xb9\x34\x7f\x96\x1a\x6c\xff\xc2\xeb\x9a\x4b\x15\x8a\
-\x61\x99\xd3\xa6\x72\x8d\x35\x61\xf9\x20\x48\x82\x84\x75\xed\x88\
-\x86\x0c\x1a\x94\x54\xa7\x52\x1c\x8f\x16\xbe\x83\x44\x08\x50\x97\
-\x86\xd1\x7e\x38\xc6\x46\x11\xaa\x32\x70\x6e\x83\xc3\x08\xd0\xff\
-\x61\x9a\xfb\xd0\x12\x78\x1b\xf5\x09\x89\xc1\x7a\x95\xcc\x6c\x6d\
-\x56\x58\x3d\xb5\x32\xb3\x63\x42\x83\xdd\x3d\xb4\xa4\x52\x9c\x3a\
-\x80\xb5\x0e\xfc\xc1\x35\x89\xb1\xe8\xc3\x09\x67\xe9\x13\x19\x38\
-\x70\x40\x92\x58\xdc\x90\x2c\xb5\x3b\x4f\x90\x98\x1c\x15\x52\xbd\
-\x6d\x21\x56\xe6\x27\xf1\x7e\x77\x22\xfc\xff\xd7\x15\x00\xeb\x49\
-\xed\x2a\x28\x1f\x6d\x8a\x65\xff\xb7\xcc\x68\xfb\x06\xeb\xc1\x5a\
-\xa9\xd1\x76\x8b\xdc\xe0\x30\x4b\xcd\x8e\x49\xc5\x66\x73\xff\x01\
-\x08\x61\x5a\x8f\xc8\xf0\x33\xd1\x75\x34\xd9\xe7\xee\x69\xf7\xc2\
-\xd7\xc1\x83\x07\x8b\x2a\x1b\xea\xfb\xea\x8d\xce\x13\x14\x06\xf7\
-\x34\x85\xd5\x2d\x53\x98\x5c\x73\xd1\x68\x5b\x82\x6d\xeb\x39\xbc\
-\xcf\x0f\xf1\xde\xc9\x44\xef\x1f\x21\xa2\xa1\x12\x62\xcc\x29\x4c\
-\xf6\x1f\x15\x66\xc7\x6a\x89\xc1\xd2\xac\x77\x79\xc7\x8e\x9b\x30\
-\x3e\x85\xb9\x6d\xc1\x6f\xdf\x6b\x85\x9b\x54\x99\x9e\x25\xef\xa3\
-\xb6\xce\x39\x45\x6a\xb0\x2c\xc0\xde\x9a\xf8\x07\x7f\x0a\x19\x36\
-\x17\xbd\x92\xa1\x2f\x71\xd9\x7c\x87\x16\xc7\x27\xd8\x58\x56\x2b\
-\x2d\xae\x07\x34\xce\xc6\x45\x6a\x6b\xa3\x52\x67\x72\x4e\xa8\xaa\
-\x69\x1e\x30\x64\xf8\x09\xc9\x83\x87\x0e\x15\x0d\x1c\x3e\x54\xd4\
-\xbf\x5f\x1f\x9f\xdf\xaf\xbb\x7d\x7f\x22\x76\x55\x08\x69\x48\xfd\
-\x06\x0d\x10\x65\x4c\x9e\x91\x6a\xb0\xcd\x19\xab\xb4\xb9\xd4\x4a\
-\xab\xf3\x66\x1c\x89\xac\x93\x31\x13\xc9\xe4\x99\x0e\x85\x7f\xee\
-\x4e\xe5\x59\x2f\x57\x7b\x17\x3c\x5f\x2f\xcd\x2f\x66\x44\x47\x2c\
-\xe5\x83\x58\xf6\x1f\x29\xcd\xce\xc7\x35\x36\xcf\x7c\xbd\xbb\xa9\
-\xa0\xb0\xaa\x66\x60\xdf\x7e\xfd\x93\xfa\x60\xbd\x4d\xea\xc6\x97\
-\x6f\x07\xcf\x57\xf5\xeb\xdb\x47\x34\x74\xe8\x30\xd1\x80\x41\x43\
-\x44\x23\x47\x8d\x4e\x91\x19\x8c\x83\x54\xae\x96\x4c\x6c\x5f\x16\
-\x8d\xa3\xe9\x2a\x85\xd9\xf5\x24\x76\x54\x9b\xb0\xc3\xfa\x02\xdb\
-\xf2\x0f\xf8\x37\x19\xad\x76\xc6\x90\xe3\x94\x18\x70\xbf\x62\xba\
-\x1b\xd1\x58\xbb\xa0\xc1\x64\x9e\x34\x6c\xf8\xb0\x24\xce\x9d\x25\
-\x48\xaf\x96\x64\x76\xf4\x55\x2d\xca\xce\xd5\xa4\x49\xcd\xb6\xa9\
-\x52\x83\xe3\x4c\x1c\x1e\x6e\xc6\x4a\xc2\xc1\x2d\x5a\x8b\xe0\x30\
-\xab\x7f\x51\x6b\xde\x68\x27\x1d\xc7\xa3\xf8\x79\x01\x56\x3e\x79\
-\x85\x42\x95\x3e\xa3\xb4\xf4\x84\xbc\xe2\xda\xc1\xc5\x85\xc5\x69\
-\x83\x06\x29\xf1\xba\x7d\x02\x46\x7f\x3d\x3d\xc9\xc3\x59\x27\xa3\
-\x46\x9d\x94\x54\x3a\x53\x9c\x3a\x35\xaf\x6c\x70\x85\x54\x32\x4e\
-\x69\x71\x1a\xf1\x39\x6e\x25\x0d\x08\x21\x75\x90\x7d\xce\x10\xf9\
-\xd2\x59\x28\xda\x13\x90\x46\x57\x81\x3c\xdc\x71\xb1\xde\xaf\x3d\
-\x84\xf6\x02\xc8\xfb\x95\x94\x2b\xc2\x91\x82\xf2\x59\xb9\xd9\x75\
-\x56\x8d\x52\x97\x9b\x5b\x52\x3a\x22\xaf\xbc\xa2\xff\xc8\x91\x27\
-\xf5\x98\x61\xc2\x49\xd0\x5a\x13\xfa\x39\x68\xec\xc9\xa2\xfc\x4a\
-\x69\x5a\xfe\xcc\xea\xa1\x33\x4a\x2b\x4f\xaa\x56\xea\xa7\x23\x94\
-\x2d\x72\xa3\xed\x6a\xac\xb7\xcf\xa2\xbe\x27\x27\xbe\x7e\xa6\x4d\
-\x87\xa9\xbf\x1d\x2b\x1a\x3d\xff\x93\x1b\xed\x5b\x24\x06\xdb\x25\
-\x7a\x97\x67\x72\x5e\x75\x55\xbf\x1e\xc9\x04\x41\xe2\x13\xae\xc2\
-\x0c\x1e\x32\x58\x24\xb1\xda\x06\xca\x4c\xd6\x6c\xac\x1c\x67\x4a\
-\x0d\xb6\x7f\x4b\x8d\xf6\xcf\xb0\xd2\xfc\x15\xbe\xa1\xfa\xf6\x23\
-\x3f\x84\x8d\xe3\x2b\xa9\xc1\xba\x91\x9e\xa7\xb7\x5e\x2d\x31\xda\
-\x9a\x94\x36\xa7\x44\x6e\xf1\x4c\x57\xba\x9a\x8e\x4b\x9f\x3a\x25\
-\x38\x54\x2d\xc0\x65\xd3\xd3\xb0\x67\x6f\xc8\xaf\xec\x7d\x9e\x94\
-\x99\x99\xac\x68\x6a\x19\xa5\x32\x3a\xca\xb0\xa2\xb7\xe0\xf3\xdd\
-\x2d\x35\xd8\x37\xe3\x33\x7f\x87\xcf\x7c\x28\x32\xc4\x42\xe7\x59\
-\x7b\xd0\x75\x04\xc1\x8e\xd2\x09\x95\x56\xb4\xe7\x45\xba\x97\x70\
-\xd7\x8f\xf5\x9e\xe2\x7d\x96\x58\x3a\x8b\xa0\x7a\xc9\x0b\x19\x8d\
-\x0a\x64\xe4\x38\xa3\xfd\x0f\x3c\xf7\x33\x99\xc1\xfa\x02\x96\xf3\
-\xe5\x52\x93\xc3\xa0\x75\x79\xa6\x14\x94\x94\xf5\x65\xea\x47\x72\
-\x40\x3d\xe9\x49\x09\xa8\xab\xbc\x28\x1f\xee\xbe\xf2\x66\xce\x4c\
-\x95\x58\x9c\xa3\xe4\x16\x67\xbe\xc2\xe2\x54\x63\x7d\x9d\x87\xed\
-\xfa\x36\xa9\xd1\xf6\x12\x3e\xdb\x7b\xf8\xbc\x3f\xfa\xf3\x27\x20\
-\xbf\xda\x38\x0d\x91\xb7\xbf\xe0\xf9\x6b\x25\x3a\xeb\x79\x7a\x7b\
-\x63\x7e\x79\x39\xd9\xdf\x3e\x25\x89\x7f\x5d\x41\x8e\x08\x11\x25\
-\xa5\xa6\xa4\x26\xf5\xe9\x9b\x92\x94\x95\xab\xef\xa3\x71\x9c\x76\
-\xb2\xc6\xe9\xd5\x28\xcc\xce\x9b\xb1\xe0\xd7\xa1\xee\xc2\xca\xb2\
-\x17\x3f\xbf\xc5\x42\x3f\x20\xa3\x6a\xfb\x16\x3f\xf7\xe0\xff\xb7\
-\xe3\x6f\xeb\xb0\x22\xdc\xad\xb2\x37\xce\x57\x39\x9a\x95\x52\xb3\
-\x27\xc3\x60\x36\x0f\xc8\xc9\xcb\x13\xa5\xf6\xed\x97\x34\x68\xe8\
-\x10\x32\xe4\x0b\x5a\x18\xd5\xbb\x7d\x7d\x5c\xc4\x44\x72\xdf\xbe\
-\xa2\x7e\x83\x07\x88\x86\x0f\x1f\x93\x54\x51\xeb\x1d\xac\xb2\xba\
-\x4a\xa5\x46\xe7\xd9\x32\xbd\xfd\x31\xcc\x8f\x6d\xa8\xdf\xc8\x0d\
-\x76\x32\x11\xdd\x16\x09\x8a\xa1\xe2\xd9\x39\xd0\x84\xfe\x2d\xf2\
-\xb9\xc1\xc7\xc4\x06\xd4\x10\x1d\x77\x88\x74\xc3\x5f\xab\xe3\x7b\
-\xea\xcc\x73\xc5\x72\x4e\xb8\x7b\x0d\x9f\x56\x3b\xc8\x1f\xc2\xba\
-\xfc\x33\x96\xdf\x2e\xd4\x55\x08\xc3\x5b\x14\x36\x97\x55\xe1\xf0\
-\x4c\xa8\x10\x8b\xfb\x0d\x1f\x3e\x3c\xa9\x6f\xdf\x3e\x9c\x79\xd2\
-\xab\xc1\xc6\x85\x79\x26\xb1\x0b\xbb\x06\x0c\x1e\x9c\xd4\xb7\xff\
-\x80\xa4\xdc\xc2\xc2\x14\xa5\xdd\x35\x54\x65\x75\xcf\x50\xd9\xbd\
-\x56\x95\xc5\x7d\x21\x1a\x2d\x4f\xca\x98\x30\xe4\x4f\x49\x1d\x96\
-\x19\x6c\xff\x95\x19\xc8\x7c\x05\xb7\x35\x87\x0d\xf0\xff\x87\xc9\
-\xfc\x15\xe6\xcf\x37\x2c\x03\x9e\x57\x5a\xdd\x67\x88\x8d\x8e\xf4\
-\xa1\x43\x89\x1b\x27\xb5\xa7\x1f\x59\x90\xf8\x85\x9d\x60\x4f\xaa\
-\x14\x4d\x9e\x56\x97\x96\x53\x54\x38\xb8\x5a\x63\xc8\x90\x18\x9d\
-\x1a\xac\x1c\x67\x63\x85\xb8\x09\x0b\xff\x61\x6c\x20\x4f\xe3\xe7\
-\x33\xe4\x6f\xac\x04\xd7\x4b\xf5\xf6\xd3\xb1\x72\xa8\xc5\x66\xdb\
-\xb4\xdc\xb2\xea\x11\x59\xf9\xe5\x43\x26\xcf\x2c\xef\x93\x95\x93\
-\x7d\xd4\xcc\xd8\x73\x8d\x7c\xd8\xb0\xd1\xc9\xd9\x05\x65\x03\xeb\
-\xd5\xba\x93\x71\xa8\x5f\x82\xcf\x3f\x07\x1b\xc1\x43\x08\x89\x1d\
-\x38\x74\xfe\x49\x4e\x47\x43\x64\xc2\x9b\xb3\x8e\x04\xe0\xf7\x52\
-\xe0\x33\x91\x37\x46\xfb\xef\xf8\x1d\x19\xa9\xad\x94\x9a\x88\x45\
-\x6f\xd3\xa8\x2c\x8e\xc9\xf9\x55\x55\xc3\x27\xcd\x98\xd1\x67\x18\
-\xe3\xa7\xef\xd5\x90\x8f\x46\x92\x93\xd1\x90\x9b\x3e\x2d\x39\x3b\
-\xbf\xa4\xff\xb4\xdc\xe2\x61\x25\x95\x75\xa3\x14\x46\x67\x11\xb6\
-\x5d\x07\xd6\xdf\x8b\x11\xe8\x0f\xcb\x4d\xb6\x0d\x68\xb8\xec\xa6\
-\x91\x3e\x46\xfb\x6f\xd8\xe6\xff\x27\x33\x3a\xbe\xc6\xbf\xb7\x60\
-\xfb\x7e\x18\x8f\x3d\x4f\x66\x70\x37\x94\x34\xc8\x46\x4d\xc8\xcf\
-\x4b\x13\x16\x55\x1d\x45\xc2\x55\xf0\xdc\x99\x33\x93\xc5\x36\xd7\
-\x71\x0d\x1a\x47\xba\xcc\x62\xcb\x57\x58\x1d\x55\x32\x8b\x4b\x2a\
-\xb3\x39\x64\x0a\x8b\xad\x5a\x6e\x74\xe6\xca\xcc\x8e\x71\x52\xab\
-\xf5\xb8\x89\x0e\x7b\x6a\xd2\x80\x01\x3d\x7c\xe7\xdd\x23\xa3\x46\
-\x8d\x4c\xaa\xd1\xe9\x06\x88\xcd\xce\x71\x32\x83\xa3\x56\xaa\xb3\
-\xce\x97\xea\x2d\x4b\x11\xfc\xab\x88\xb5\x84\x0d\xe4\x2f\xb2\x57\
-\x4d\x87\xf0\x8b\x04\xb9\x0e\x7e\x6f\xaf\xfe\xd5\xb2\xd1\x42\x35\
-\x2c\x44\x63\xbe\x76\x62\xce\x8d\xeb\x7a\x31\x76\x1e\x08\x32\xe2\
-\xae\x20\x7e\xe8\xed\x58\x46\x4f\xc8\xf4\xd6\x2b\x64\x26\x8b\x49\
-\x6c\xb4\x65\x29\xed\xce\xe3\x0b\x8b\x8a\x52\x92\x8f\x70\xc0\x87\
-\x15\xf6\xb9\x52\x4e\x19\x9b\x34\xc3\xed\xe9\x2b\xd1\xb9\x4e\x52\
-\x5a\x1c\x64\xe1\x61\xad\x44\x6b\x75\x60\x5e\x9c\x89\x75\xf7\x12\
-\xd4\x7f\x48\x0c\xd6\xcb\x09\xe4\xa5\x7a\xa7\x57\x6a\xb2\x57\xa3\
-\xe1\x97\x81\x79\x34\xf4\xd4\x09\xe3\x99\xa4\x04\xe0\x1f\x2d\xe2\
-\xf7\x0b\x12\x37\x4c\xdf\x81\x03\x92\xfa\x0e\x18\x94\xd4\x3f\x25\
-\x25\x29\x75\xda\xb4\xa4\x0c\xab\x4d\x54\x32\x63\x46\x72\xbf\x81\
-\x03\x93\xfa\x0f\x40\xc5\xdf\xfb\xa1\x26\x0f\x1c\x48\x62\x1c\x7b\
-\x95\x4f\x3e\xd1\xe2\x7b\x36\xfc\xbb\x0f\x0e\xf3\x07\x0c\x1c\x94\
-\x54\x5c\x5e\x9b\x2a\x35\xb8\x47\xa8\x6d\xee\x42\x95\xc3\x35\x1b\
-\x2d\xa6\xfb\x70\x34\xb4\x1e\x61\xb2\x1b\xff\xfe\x59\xc6\xc0\xbf\
-\xad\xeb\xe1\xc7\xdb\x1e\x41\xd0\x20\xc8\xdb\x0e\x63\x99\xa0\xd5\
-\x6a\xfb\x16\xf5\x03\x1c\x9d\xbe\xa8\x34\xda\xaf\x52\x58\x5c\x2a\
-\xb9\xdd\x33\xa1\xcc\x66\xeb\x3f\x78\xd4\x68\xb2\x18\x31\x29\xad\
-\x93\x8b\xa7\x7a\xab\xf0\xeb\x6e\x52\x6a\xaa\x28\x75\xd0\x20\x6c\
-\xb7\x83\xa9\x1b\x77\xc2\xf8\x8a\x64\xa5\xae\xa5\xbf\xcc\xee\x39\
-\x4e\x61\x6d\x1e\x29\xb1\x79\x4e\x96\xd8\x5c\xa3\x64\x36\xcf\x09\
-\x62\xad\x61\xe0\xc9\x63\xc6\x50\xd7\x2c\x69\xe7\xe4\xb5\xa9\x82\
-\x08\x72\x4c\xed\x89\xc7\x87\x41\x7f\x1c\xd5\xcc\xc8\xc9\x4e\xc9\
-\xcc\x2e\x1c\x90\x57\x56\x36\x42\x6e\x30\x4f\x95\xe8\x6d\x26\xb4\
-\x90\x6e\x44\x4b\x69\x35\xea\xe7\xa8\x64\x98\x4c\xa2\x97\xba\x10\
-\xfc\x02\xf0\x83\x94\xe4\xf5\x21\x06\xf4\xf6\xef\x50\xdf\x97\x19\
-\xec\x8f\x61\xd9\x9c\x25\xd5\x99\xab\xca\xec\xae\x53\x26\x55\xd7\
-\x0e\xcd\x28\xc8\xef\x3b\x78\xec\x58\x6e\x36\xf6\xa8\x03\x7d\xb4\
-\x32\x2d\x37\x3b\xf9\xd4\x19\xa5\x29\x19\x39\xc5\x69\xe3\xf2\x66\
-\xa4\x4d\x28\x2c\x4a\x9b\x96\x3b\x23\x75\xf4\xa8\x51\x82\x29\x2f\
-\x88\x20\xe1\x24\xbf\xb0\x20\x45\x6a\xf4\x9e\x28\x33\x39\xf2\xc5\
-\x46\xab\xb1\x5e\x67\x59\x24\xd5\x5b\xff\x4f\xaa\xb7\xbd\x8b\xd6\
-\x25\x59\x99\xc8\xc1\x28\x04\xa4\x6c\x61\x34\x1c\xd4\x3a\x3a\x2e\
-\xda\xb4\xc2\xfd\x1e\xcd\x3d\x44\x9b\x56\xbc\xc7\x86\xbf\x37\xfe\
-\x8e\x9d\xfc\xdf\x88\x45\x8f\xdf\xfd\x8e\xfa\x85\x44\x6f\x7d\x45\
-\xac\xc3\xce\xd7\xe0\x68\x96\xe9\x9d\x35\x0a\xa3\x25\xa3\xd0\x6c\
-\x1d\xd8\xb7\xba\x8a\x58\xba\x3d\x5d\x5d\x04\x11\x44\x90\x23\x4d\
-\xf8\x2e\x2c\x1c\xf2\x8a\xfa\x0f\x18\x94\x24\x4a\x4e\x49\xca\x2f\
-\x28\x4c\xd5\xdb\xdd\xa7\xc8\xcd\x26\x99\xd4\x60\xbd\x06\xe1\xb3\
-\x43\x62\xb0\x1d\x42\x58\xb5\x05\x03\x8c\x82\xcb\xc0\x53\x1f\xc8\
-\x02\x95\x7f\x8c\xef\x3b\x63\xe8\xe3\x43\x1d\x1b\x1a\xa0\xd1\x9e\
-\x13\x4d\x47\x13\x94\x0e\xff\x1e\x0d\xe1\x35\x2c\xf0\xc9\x6f\x9c\
-\x1a\xfd\xef\xf2\x0d\x7d\x3e\xbd\x56\x1b\xfe\xff\x6f\xec\x60\xf7\
-\xe2\x35\xef\xd5\x38\x1a\x3d\x2a\x47\xe3\x8c\x52\xa9\x7c\x60\x5a\
-\x5a\x9f\xa4\x7e\xfd\xfb\x27\xa5\xa2\x26\xf5\xe9\x23\x12\x25\xf5\
-\x8e\x10\xcb\xde\x20\x41\x61\x9e\xed\x16\x7a\x09\x22\x88\x20\x21\
-\x84\xdf\x48\xc6\x8f\x3b\x25\x29\x3b\xa7\xa8\x4f\x4e\x81\x73\xb0\
-\x54\x63\x29\x41\x00\x3d\x23\x25\xe1\x6f\x46\xdb\xe1\x0e\x81\x6f\
-\x10\x80\xdf\x09\xe0\xff\x82\x9f\xab\xea\xd5\x06\xc9\xd4\xbc\xc2\
-\xc1\x93\xf3\xf3\xfa\x8f\x1b\x3f\x3e\x39\xb8\x9c\x04\x11\x44\x10\
-\x41\x12\x26\xdc\xbe\x6f\x23\x4f\xca\x4a\x52\x1b\xec\xe3\xc5\x06\
-\xeb\x9d\x12\xbd\x6d\x1f\x02\xe9\x50\x24\xf8\x85\x85\x62\x1c\xe7\
-\xf4\x0a\xed\x00\xf6\x5c\xe7\x92\xa0\xeb\x21\xf0\xad\xdf\xca\x4d\
-\x8e\x27\x2a\xa5\xca\x19\x5c\x51\xf4\x5c\x2d\x10\x44\x10\x41\x8e\
-\x09\xe1\x16\xc1\x0c\x19\x32\x30\xa9\x56\x2a\x3f\x05\x2d\xd3\xab\
-\x25\x3a\xcb\x8e\x78\x81\x2f\x68\x74\x2a\xa6\xee\x1c\xc7\x8a\x2a\
-\x99\x3a\x9b\x2d\x87\x6e\xdb\xf3\x46\x10\x41\x04\x39\x86\x25\x39\
-\x39\x99\x92\x26\x2b\xbf\xf0\x04\xa5\xd5\xb5\x50\xac\xb3\xbc\x2d\
-\x25\x3e\xe6\x5e\x00\xc6\xa3\x55\xc5\x7a\xeb\x27\x08\xfc\x25\x95\
-\x62\xd5\x64\xb6\x18\x04\xda\x0b\x22\x88\x20\x5d\x2f\x22\x16\xf8\
-\xd3\xf2\x8a\x8e\x57\x58\x5d\xad\x0d\x3a\xcb\x4a\x84\xd2\x5f\x5d\
-\x09\x3c\xfa\x32\x72\x56\xbb\xe2\xf8\xf0\x6a\x8d\xa0\xa1\xaf\x17\
-\xfe\xda\xcc\x79\x81\xbf\xb7\x4f\x2b\xd4\x35\x24\x7a\xba\x57\xcc\
-\x85\x55\x62\xe5\x04\xae\x18\x7a\xb0\x0a\x08\x22\x88\x20\xc7\x8a\
-\xf8\x2d\xfc\xe2\x61\x0a\xab\xdb\xd4\xa0\xb3\x3e\x8f\xf0\xfa\x93\
-\x05\x58\x5b\x68\xb0\x05\x82\x4c\xc2\x69\x58\x40\x5a\x43\x02\x32\
-\x3a\x48\x86\x86\x2f\x77\x6e\xe8\xb4\x22\xa7\x17\x6d\xfa\xb1\x3e\
-\x4f\x14\xd7\x69\x63\x75\x83\xcc\xe8\x9c\x5d\x26\x55\x8e\xe9\xe9\
-\xf2\x17\x44\x10\x41\x8e\x21\xf1\x01\x3f\xb7\x60\xb0\xd2\xe4\x6a\
-\x68\xd0\x9a\x1f\x41\x20\xfd\x1e\x33\xf0\xe3\x00\xe4\x31\x09\x7c\
-\x9d\xe5\x90\x54\x6f\x7e\x55\x6a\xb4\xeb\x2b\x24\xaa\x11\x3d\x5d\
-\xfe\x82\x08\x22\xc8\x31\x24\xdc\x76\xd0\x39\xd9\x33\x07\xa8\x4d\
-\xae\xa2\x7a\xad\xf9\x2e\x04\xd3\xff\x24\x7a\x0b\x05\x7e\xb4\x30\
-\x8c\x47\x63\x81\x6d\x67\xaf\x93\x08\xe0\x47\x7b\xdf\x61\xd3\xd5\
-\x59\x0e\x8b\xf5\x96\xdf\xc4\x3a\xcb\x13\x62\x83\xad\x2a\xbf\xae\
-\x7e\x48\x0f\x17\xbf\x20\x82\x08\x72\x2c\x09\xb7\xc9\xd4\xc4\x19\
-\xd9\x7d\xc5\x46\x5b\x66\x83\xd6\x72\xad\x58\x6f\xfd\x1e\x01\x75\
-\xa8\xf3\xb0\xb5\xf0\xb4\x2b\x60\x9e\xa8\x74\xbb\xea\xfe\x02\x15\
-\x61\xff\x37\xc2\xfe\x00\x7e\xde\x59\xa7\xb4\x66\x16\x15\xcb\xfb\
-\xf4\x70\xf1\x0b\x22\x88\x20\xc7\x92\x70\x2f\xcd\x38\x75\x72\x49\
-\xaa\x44\xed\x1e\x29\xd6\x98\xce\x11\xeb\xac\xbb\x10\x82\x7f\x74\
-\x3d\xf0\x3b\xdb\x21\x24\xa2\x33\xb1\x40\xd7\x77\x4c\xac\xea\xac\
-\x7f\xa1\x7e\x55\xaf\x31\x5f\xa3\xd6\xbb\x8e\x4f\x9f\x38\x91\x16\
-\x81\x30\x67\x2b\x88\x20\x82\x74\xab\xa4\x24\x0f\x10\x55\x56\xd5\
-\xf7\x93\x1a\x2c\x6e\xb1\xce\xfc\x36\x5a\xa2\xff\xed\x1a\x90\x06\
-\x7f\xdf\x11\x68\xe3\xe9\x30\x22\x5d\x23\xdc\x6f\x1d\xa5\xd3\x99\
-\x8e\x8a\x39\x16\xf3\xf4\x8f\x06\x8d\xf9\x13\x99\xd1\xb9\x78\x4a\
-\x56\xf6\x20\x26\xe7\x85\x00\x7c\x41\x04\x11\xa4\x5b\x85\x61\x0e\
-\xd9\x4e\x59\x6a\xb0\x6b\x1b\x74\xe6\x95\x08\xa7\x1f\xa3\x07\x67\
-\x67\x40\x1b\x4b\xa7\xd1\xd1\xf5\x3a\x3a\x2f\xde\xce\xa6\xd3\xda\
-\x46\x3f\x75\xd6\xdf\x10\xf8\x5b\xe4\x66\xef\xfc\xd1\xa7\x4c\xa4\
-\x2f\x67\xc0\x11\x96\x00\x7c\x41\x04\x11\xa4\xfb\x85\x02\xdf\x64\
-\x95\x22\xf0\x9f\x21\xbe\xe6\x00\x58\x75\xb9\x26\x02\xb0\x09\x07\
-\x75\x82\x81\x6f\xf9\xaf\x58\x63\x7a\x5d\x61\x73\x79\x4e\x1e\x3f\
-\xbe\x3f\xc9\x73\x6e\x1d\x84\x20\x82\x08\x22\x48\x37\x09\x6b\xe1\
-\x0f\x18\x94\x24\xd3\x5b\x2b\x1b\x74\xa6\xfb\xc5\x7a\xf3\x7e\x01\
-\xf8\x89\x05\xbe\x58\x67\xfe\xb9\x5e\x63\x7c\x42\x65\x71\x6b\xc6\
-\x9c\x3a\xa1\x1f\xcd\x79\x01\xf8\x82\x08\x22\x48\xb7\x0a\xeb\x46\
-\xee\x3f\x70\x60\x92\xd4\x68\x2f\x10\xeb\x4c\x37\x22\xf0\xf7\xc4\
-\x03\x7c\x1c\x19\xf8\x34\xd4\x77\xa1\x7e\x0f\x75\x4c\x57\x80\x37\
-\x9a\xf4\x83\x8f\x89\xe5\x9e\xc2\x3d\x27\x6a\x1b\xc2\x9e\x00\xff\
-\x07\xb4\xf0\x97\xcb\x0c\x8e\xaa\x51\x63\x4f\xed\xc3\x64\xbd\x00\
-\x7c\x41\x04\x11\xa4\x3b\x85\x05\x7e\xbf\x81\x03\x45\xf5\x06\xfb\
-\x14\xb1\xd6\x7c\x81\x44\x67\xde\xc5\x42\xae\xad\x23\x20\x47\x00\
-\x5d\x44\x4d\x44\x1a\x1d\xa5\x95\x88\xb4\x43\x5d\x2b\xc6\x73\x28\
-\xf0\x25\x5a\xcb\xfe\x06\x8d\xe9\x72\x8d\xd9\x9d\x3d\xf6\x94\x09\
-\x69\x4c\xd6\x0b\x2f\x6c\x12\x44\x10\x41\xba\x55\x58\x0b\x7f\xc0\
-\x40\x91\x44\x6d\x1b\xd3\xa0\xb1\x34\x21\xa0\xde\x69\xd0\x99\x0f\
-\x0b\xc0\x4f\x0c\xf0\x1b\xb4\xe6\x36\xcc\xcf\xcf\xeb\xd5\x86\xd3\
-\x65\x16\xd7\x98\xd1\xe3\xc6\xa7\xd0\x9c\x17\x5e\xb6\x2d\x88\x20\
-\x82\x74\xaf\x30\xc0\xef\x3b\x60\x90\xa8\x4e\xe5\x18\x2e\x56\x9b\
-\x15\xf5\x3a\xf3\x9b\x08\xa9\x3f\xc4\x64\x75\x68\x82\x81\xd9\x9d\
-\xda\x15\xc0\x8f\x43\x09\xf0\xff\x46\xdd\x5e\xa3\x36\x5b\x25\x06\
-\xeb\xe0\x31\x27\x8f\xa6\xa4\x17\xb6\x45\x16\x44\x10\x41\xba\x59\
-\xd8\x49\xdb\x7e\x03\x44\xb5\x52\x5b\x9f\x2a\xb5\xb5\xa8\x41\x63\
-\x7a\x06\x01\xf5\xf3\x91\x0e\xfc\x5e\xa2\x08\x7c\xcb\xef\x0d\x1a\
-\xf3\x66\x89\xd1\x26\x29\xae\xac\x10\xf5\x49\x4b\x13\x48\x2f\x88\
-\x20\x82\xf4\x8c\x70\x2f\x43\x19\x35\x6a\x64\x52\x9d\x52\x9f\x51\
-\xaf\xb5\x3c\x2c\xd6\x9a\xbf\x17\x80\x9f\x28\xe0\x9b\x7f\x94\xe8\
-\x6d\x2f\x55\x4b\xb5\x65\x69\x29\x8c\x37\xa7\x67\x4b\x5c\x10\x41\
-\x04\x39\xa6\x45\xe4\xdb\x2a\x79\xe6\x58\xb9\xc9\xb9\xac\x5e\x63\
-\xfa\x12\x61\x75\xa8\x17\x00\xf3\x88\x57\xb4\xf0\xf7\x49\x0c\xb6\
-\x87\x2b\x24\xaa\x3c\x2e\xbb\x7b\xb0\xa8\x05\x11\x44\x90\x63\x5d\
-\x7c\xc0\x2f\x9c\x39\x5a\x66\x76\x5e\xd3\xa0\x31\x7d\x8c\x96\xe9\
-\x21\x54\x20\xea\x83\x97\xce\x1c\x5a\xb5\x7e\x65\xc2\x10\x39\xd8\
-\x85\xfe\x3e\x36\x35\xf3\x34\x9e\xdf\x43\xdd\x47\x67\xee\x27\x56\
-\xe0\x9b\x3f\x95\x18\xac\x37\x56\x49\xd4\xd3\xb8\xec\xee\xc1\xa2\
-\x16\x44\x10\x41\x8e\x75\xe1\x80\x9f\x53\x5c\x72\x92\xdc\xe2\x38\
-\x07\x2d\xfc\x8d\xec\x64\xa3\x00\xfc\xce\x5b\xf8\xef\xa1\x85\x7f\
-\x7e\x85\xdc\xf7\x96\x2b\x41\x04\x11\x44\x90\x9e\x13\x1f\xf0\x0b\
-\xca\x8e\x93\x1b\x9d\xee\x7a\xb5\xe9\x65\x84\xe3\x5f\xc1\x90\xa4\
-\xff\x0f\x01\xf9\x68\x54\x1c\xa6\x83\xf0\x29\xfb\x5b\x30\xa0\x3b\
-\xea\x48\x12\xa5\x01\x1d\x1a\xff\x7b\x6d\x74\xd7\x0d\xe8\x14\x03\
-\x9f\x6b\x83\x58\x67\xf5\x96\xd6\x6b\x46\xf7\x74\x39\x0b\x22\x88\
-\x20\x82\xf8\x62\xc2\xb3\x0b\x8b\x87\xc8\x8c\x4e\x59\x9d\xca\xf8\
-\x38\x5a\xf9\xbf\x37\x68\x4d\x5d\x02\xd7\xde\xa8\xe2\x38\x3a\xb1\
-\x90\x9d\x56\xd0\x77\xf5\x1a\xf3\x6b\x12\xad\x55\x36\x53\xac\x38\
-\xae\x87\x8b\x59\x10\x41\x04\x11\xc4\x0f\xfc\xa9\x45\x15\x03\x24\
-\x7a\x57\x51\xbd\xca\xb8\xbc\x41\x63\xfe\x2f\x02\xbf\xad\xa7\x41\
-\x7c\x44\x01\x3f\x84\x62\xc7\xf9\x5c\xad\xde\x5a\x58\x59\xa5\x1c\
-\xd0\xc3\xc5\x2c\x88\x20\x82\x08\xc2\x03\x7e\x41\x7e\x1f\xb1\xd9\
-\x3e\xae\x4e\x6d\xbc\x0a\x81\x7f\x10\xad\xd3\xc3\x3d\x0d\xe2\x1e\
-\xd1\xc4\xc0\x1f\xf3\xce\xf4\x67\x83\xc6\xf4\x7f\xf5\x7a\x53\x66\
-\x6e\x5d\x1d\xd9\x43\x47\x98\xb0\x15\x44\x10\x41\x7a\x56\xb8\x55\
-\x9f\x53\xa7\x4c\x49\xa9\x31\x1a\x87\xd7\x6a\x4c\xe7\xa2\x65\xfa\
-\x0d\x02\xff\x50\x02\xc0\x77\x4c\x2a\xe6\xdd\xdf\xf5\x1a\xe3\xf7\
-\xf5\x6a\xd3\x1d\x55\x6a\xcd\xa9\x79\xe2\x7a\x12\x84\x2f\x00\x5f\
-\x10\x41\x04\xe9\x1d\x42\x36\x70\xcc\xa8\xaa\xea\x23\xd6\x9b\x67\
-\xd5\x69\x4d\xbb\x10\x5a\x7f\xf4\x34\x38\x8f\x54\xc5\x0e\xf3\xcf\
-\x7a\x12\xde\xaa\x32\x5d\x56\xa1\xb4\x9e\x34\xa8\xac\x92\xc0\x5e\
-\x00\xbe\x20\x82\x08\xd2\xf3\xc2\x59\xf9\x03\x07\x0d\x16\x89\x75\
-\x16\x6b\xad\xda\xb8\xa9\x5e\x6b\xfa\x6f\x08\x90\xb5\x57\xad\x5f\
-\xdb\xc3\xcf\xc4\xd3\xa8\x40\xe9\x4b\x33\xec\xf5\x82\x34\xf0\x1a\
-\x71\x5c\x4b\x13\xe2\x5a\x51\x3d\x4f\xfb\x6b\xe1\x39\x6d\xec\xb9\
-\xbf\xd5\xa9\x4d\x1b\xc4\x7a\xeb\xe9\x53\xb2\x6a\x86\x26\x25\xa5\
-\xd2\x6c\xee\xd1\x42\x16\x44\x10\x41\x04\x21\xc2\x01\x7f\xd0\xe0\
-\x21\x22\x89\xd6\xa2\xa8\x53\x1b\x9f\x47\xf0\xfd\xc0\x02\xb0\x2d\
-\x1a\xf0\x86\x04\x67\xb8\xe3\x58\xc5\x51\x44\x54\xc7\x47\x97\x56\
-\x60\x27\x10\x5b\x1a\x1d\xdf\x07\x1f\xf2\x61\x3b\x3d\x36\xaf\xea\
-\x34\xc6\x5f\x6b\x94\xc6\x17\x64\x66\x87\x7d\xcc\x84\x09\xc2\x5b\
-\xae\x04\x11\x44\x90\xde\x23\x3e\x0b\x1f\x81\xdf\xa0\xb3\x55\x20\
-\xf0\x57\x20\xb8\xf6\x0b\xc0\x8f\x12\xf8\x7e\x65\xf2\x4a\x6d\xfa\
-\xb9\x56\x69\x78\x48\x66\x76\x4a\xc7\x4c\x48\xef\x4b\xf3\x58\x00\
-\xbe\x20\x82\x08\xd2\x2b\x84\x05\xfe\x80\x41\x83\x45\xb5\x3a\x73\
-\x6e\xad\xc6\x74\x0d\x5a\xa9\x7b\x62\x05\xfe\xd1\xac\x31\x01\x5f\
-\x63\xfa\xb1\x4e\x69\xb8\x45\x62\xf6\x14\x8f\x1e\x9f\xce\xbc\xe5\
-\x4a\xd8\x03\x5f\x10\x41\x04\xe9\x15\xc2\xbd\xee\x70\xd0\x10\x51\
-\xb5\xd6\x9a\x5e\xab\x32\x9c\x85\x56\xfe\x2e\x01\xf8\x31\x2b\xeb\
-\xd2\x31\x1d\xa8\x55\x1a\x2f\x13\xeb\x1d\x53\x46\x8d\x1b\xcf\xbc\
-\xe5\x4a\x00\xbe\x20\x82\x08\xd2\x1b\x44\xc4\xb3\xf0\xeb\xb4\xa6\
-\x93\x6a\x95\x7a\x57\x9d\xda\xf4\x91\x00\xfc\xd8\x81\x8f\x1d\x25\
-\xa0\x7e\x53\xab\x30\x9e\x53\xa3\xb5\x9e\x32\xe2\x94\xb1\xa9\xfc\
-\x3c\x16\x44\x10\x41\x04\xe9\x51\x11\xb1\x01\x24\x03\xfb\x0f\x13\
-\x35\x48\x3d\x43\x6a\x54\x06\x65\x9d\xca\xb4\x8d\xc0\xab\xe7\x80\
-\x6f\xe4\x69\x34\xdf\x77\xf4\x5b\x34\xbf\x87\x3b\x3e\xea\xf4\x09\
-\xf0\x0f\xd7\xaa\x8d\x9f\x62\x1e\xce\xaa\xd6\xe8\x4f\x3c\x69\xd4\
-\x28\x66\x23\x7c\x01\xf8\x82\x08\x22\x48\xaf\x10\x16\x46\x69\x83\
-\x86\x88\x8a\x75\x96\xbe\xf5\x2a\x7d\x25\x82\x6b\x75\x9d\xe6\xff\
-\xdb\x3b\xb7\xd8\x38\xae\x32\x8e\xef\xc5\xeb\xb4\x4e\x1c\x77\xeb\
-\xd4\xc1\x64\x13\x4c\x6e\x76\xbd\x36\x09\x76\x62\xd9\xc6\xd9\x9d\
-\x39\x33\x7b\x9d\xcb\xce\x39\x33\x63\xd7\x21\x55\x9f\x5a\x44\x40\
-\xbc\xf0\x00\xad\x84\xf2\x02\x08\x29\xbc\xf0\x90\x48\x41\x22\x5c\
-\x24\x24\x04\xad\x7a\x7b\x08\x8a\x40\x6a\x23\x55\x69\xaa\x02\x6a\
-\x45\x5a\x35\x2d\x22\x6d\x5d\x89\xd2\x34\x14\x9a\xb6\x89\x6f\xe1\
-\x9b\xbd\x18\xb3\xd9\xb5\x77\x1d\xcb\xd9\x44\xff\x9f\xf4\xd7\x99\
-\xfd\xe6\x9c\x33\x33\x67\xa5\xff\xf9\xe6\xec\xec\xae\xe3\x7d\x81\
-\x68\xee\xff\x8d\xae\x82\x4c\xb7\xa8\xf2\xf8\x22\x95\x4c\xd1\x2c\
-\xd3\x72\x7d\x2f\x29\xb7\xf2\xb1\x16\x1f\xaf\xaa\xe1\x97\x9f\x67\
-\xbd\xe7\x53\xd5\xf0\xaf\xa8\x86\x7b\x4e\xd6\x6d\x67\xf8\xd0\xa1\
-\xd6\x7b\x77\xed\x2a\xfc\xad\x21\x96\x74\x00\x00\x8d\xc0\xc2\x53\
-\x3a\xeb\x5b\xfc\x1a\xcf\x85\x54\xe1\xee\x63\x86\xf3\x04\x19\xfe\
-\x87\x30\xfc\x5a\x0d\xbf\x10\x57\x4c\xf7\x12\x8d\xdd\xb3\x09\xcd\
-\x61\x51\xce\x9b\x7c\x9d\x9d\xc5\xff\x15\x43\x86\x0f\x00\x68\x20\
-\x9a\x42\x21\xff\xfe\xc1\x41\x5f\x42\xb7\xba\x59\xce\x3d\xce\x4c\
-\xfb\x22\x65\xac\xb3\x37\x98\xa9\x59\x6e\x96\xf5\xc4\xdd\xca\xf1\
-\x4a\x6d\x56\x45\x6e\xe5\xf8\x52\xc7\x5d\x76\x82\xab\x7e\xcd\x34\
-\x66\xef\x92\xe9\xff\x5c\x4d\xdb\xfb\xef\x6b\x6f\xcf\x8f\x2b\x96\
-\x73\x00\x00\x0d\x87\xbf\xe8\x4c\x5f\x1e\x1a\xdd\x9a\xe4\x13\x47\
-\x98\x21\x5e\xf1\x0c\x5f\xb9\x49\xd3\x55\x16\xa9\x5a\xbc\x92\xaa\
-\xb5\xaf\xd6\x5f\xbd\xe7\x52\xcb\x79\x2d\x67\xf8\x37\xf4\x65\x38\
-\x17\x92\xb9\xf1\xa3\x07\xd2\xb9\x68\x31\xab\x87\xdb\x03\x00\x1a\
-\x8f\x40\xe9\xef\x0e\x07\x86\x37\x27\xf8\xc4\x61\x59\xe7\x67\x60\
-\xf8\x75\x1b\xfe\xab\x6a\x6e\xfc\xbb\x07\x92\xe6\x4e\x64\xf6\x00\
-\x80\x86\xa5\x94\xe1\xf7\x0e\x8c\x84\x55\xeb\x81\x1c\xd3\xc5\x93\
-\x64\x62\x33\x45\x33\x9b\xaf\x66\x72\xf5\x18\x6b\x3d\xba\x19\xc3\
-\x5f\x8d\xe3\xaf\x44\xcc\xb0\x5f\xa2\x49\xe1\x61\x29\x6b\x44\x60\
-\xf8\x00\x80\x86\xc5\xef\x2f\x3c\x49\x12\xdd\x33\xb2\x5e\x31\xdc\
-\x7d\xb2\x6e\x9f\x20\x03\xfb\x94\x34\xbf\x76\xa6\x69\x17\x55\x1e\
-\xab\xb5\xdd\x52\x75\x6b\xa9\xb3\x42\x19\xce\x3c\x8d\xd3\xac\x62\
-\x88\xd3\xaa\x31\x9e\x1d\x49\x67\xda\xb1\x98\x03\x00\x68\x58\x4a\
-\x19\x69\xf7\xbe\xc1\x50\xcc\x1d\xdf\x22\xeb\xe2\x08\x99\xd8\x94\
-\x62\xd8\xd3\x6b\x6f\xf8\x76\xd9\xeb\x5a\xdb\x94\x6b\x6d\x0c\x9f\
-\x19\x0e\x99\xbd\x7d\x49\xd1\xc5\x49\x35\x37\xde\xbf\x5f\x4d\xae\
-\xbb\xc5\x6f\x27\x00\x00\x2c\x4f\xeb\x86\x0d\xfe\x21\xa6\xb4\x90\
-\x31\xba\xcc\x10\xa7\x48\x97\x8b\x26\x39\xbf\xb4\xc9\x56\x33\xd5\
-\x7a\xeb\x2c\x67\xdc\xb5\x9a\x7d\xa5\xe3\xd5\xdb\x7f\x6d\x13\x13\
-\x19\xfe\x67\x34\x4e\xe7\x68\x92\xfc\x76\x2c\x9d\xed\xe8\xfc\xdc\
-\x66\xfc\x06\x3e\x00\xa0\xb1\x29\x65\xf9\xed\x9b\x3a\x02\x49\xe7\
-\xc1\x28\xd3\xf8\xa3\x94\xb9\xbe\x96\x5f\xae\x30\xbd\xa5\x1d\x32\
-\x38\x63\x91\x6a\x32\xd3\xb5\x52\x2d\x13\xcc\x4a\xfb\xa9\x2a\x6f\
-\x4c\xe6\x98\x69\xbf\x2f\x6b\xfc\x78\x72\xf2\xab\xf1\xae\xde\xde\
-\xbb\xf2\x63\x89\x5f\xc8\x04\x00\xdc\x0e\x04\xd7\x35\xfb\x07\xe3\
-\x72\x4b\xd2\x74\x47\x29\x6b\xfd\xb5\xa2\xdb\x53\x64\x6c\xd3\x9e\
-\xc1\x91\xf9\x7b\x1f\x4e\xc2\xf0\xff\x67\xf6\x97\x99\x6e\x3f\xa7\
-\xe4\xec\xf1\x91\x64\x32\xdc\x12\x0e\xe3\xe7\x14\x00\x00\xb7\x17\
-\xcd\xa1\x26\xdf\xa8\xa2\xb6\x93\xf9\xe9\x64\xfa\x3f\x23\x93\x7f\
-\x9b\x8c\xed\x5a\xc9\xf0\x59\x05\xc3\x5f\xbc\x6f\xa9\x7a\xb5\xa8\
-\x5a\x5f\xd5\xfa\xad\x14\xaf\xa7\x6e\x1d\x19\x7d\x61\xdb\x10\x73\
-\xd4\xfe\x12\xd3\xc4\x29\xd9\x10\x8f\xc4\x74\xa7\xab\x6d\xe3\x46\
-\xef\x93\x6f\x38\x3d\x00\xe0\xf6\xa1\x94\x9d\xf6\xf4\xf4\x04\x52\
-\x86\xde\xca\x2c\x5b\x53\x34\x7e\x42\x36\xec\x3f\x91\xb9\x5d\xa2\
-\x09\x60\x9a\x19\xe2\x7a\x41\xb5\x99\xf3\x52\x06\x5b\x6f\x1f\xab\
-\xa9\x15\x4c\x3e\x74\x97\x23\xae\x50\x79\x81\xc6\xe1\x71\xa6\x3b\
-\x8f\xa4\x9c\x89\xc8\x97\x06\x06\x9a\x8a\x83\x77\x2b\xdf\x3a\x00\
-\x00\x58\x19\x81\x40\xc0\xb7\x6d\xdb\xb6\x60\xef\x58\x6c\xa3\x94\
-\x73\xf6\xca\x59\xeb\x5b\x64\xf8\x4f\x90\xde\x20\xd3\xfb\x27\xd3\
-\xc5\xc7\x64\x7a\xde\xa3\x9b\x57\x49\xd3\x45\xcd\x78\x6b\xfe\x45\
-\xcd\x15\x35\x5f\x52\x31\x4b\x9e\x5f\x9c\x2d\xaf\xa1\xc1\xcf\x97\
-\xab\xb4\x34\x53\xd4\x6c\x41\x62\xa6\xb0\x84\x25\xae\x51\x79\x8d\
-\x26\xba\xcf\xe8\x3a\xaf\x90\xfe\x45\x77\x39\x53\x74\xdd\x67\x24\
-\x8d\x7f\x5f\xb5\x04\x3b\x90\x48\x75\x7c\x61\xc7\xf6\x50\x73\x28\
-\x74\xab\xdf\x2e\x00\x00\xb8\x79\xfc\xcd\xcd\xbe\x3e\x26\xdf\xa5\
-\x58\xee\x0e\x66\x3a\x09\xc9\xe0\x5f\x97\xb2\xfc\xc7\x92\x26\x7e\
-\x27\xe9\xfc\x0c\xe9\xaf\x71\x8d\xbf\x43\x86\xf8\x01\xe9\x23\x39\
-\x9f\x01\x8b\x69\x79\x85\x77\x01\x75\x18\xf6\x2a\xf5\x5b\x3a\x4f\
-\x31\x4b\xe7\xfc\xa9\xac\xdb\xff\xa6\xeb\xa0\x3b\x19\x3e\x45\x7a\
-\x5d\xd6\xf8\x59\x32\xf8\x67\xe9\x7a\x7f\x2a\x6b\xb9\x47\x65\xc3\
-\x72\x14\xd3\xd9\x33\xac\x99\x6d\x6d\xf7\xb4\xdd\xea\xb7\x07\x00\
-\x00\x56\x87\xc2\xf2\x8e\xdf\x17\xf4\x12\xd8\xc0\xbd\xbe\xce\xce\
-\x89\x80\xa2\x4d\x84\x55\x77\x72\x8f\x6a\x1d\x34\x13\x7c\xf2\x6b\
-\x29\xe7\xe0\x63\x69\x7b\xf2\x47\x92\xe1\x1c\x23\xb3\xfc\x05\x99\
-\xe4\xe3\x64\x9c\xa7\x65\x53\xbc\x40\x86\xfa\x67\xca\x88\xcf\x93\
-\x81\x5e\xa0\xd8\xdf\xc9\x54\xa7\x28\xf6\x0f\xda\xfe\xc0\x7b\xe4\
-\x93\xb6\x3f\xa2\xf2\x63\x6f\x99\xa4\x60\xb6\xe2\x2a\xd5\xf7\xb2\
-\xea\x19\xda\x9e\xf3\xc4\x3c\x19\x62\x9e\xb6\xaf\x2f\x96\x17\x63\
-\xc5\x3a\xa4\xd9\xbc\xf2\x77\x19\xe2\x6a\xb1\xaf\x4f\xa8\xfc\x8f\
-\x37\x09\xd1\x71\x2e\x7b\x26\x4e\xf5\xdf\xa7\xed\xf7\x28\x7e\x91\
-\xea\xbe\xc9\xf2\x4f\x21\x89\xbf\xd0\xbe\x17\x29\xf6\x47\x59\x13\
-\x4f\x49\xba\xf8\x55\x22\xcb\x8f\xa7\xf8\x03\x47\xd3\xce\xe4\xf7\
-\x92\xce\xe4\x37\x52\x7c\x72\x3c\x29\x0e\x8e\x49\xb6\xbb\x35\x91\
-\x4e\xad\x8b\x44\x22\xf9\x71\xf1\x7e\xfa\x18\x1f\xd0\x02\x00\xee\
-\x18\x4a\xa6\x5f\xa0\xd3\x1f\x89\xdc\xdf\xb4\xb3\x2f\x7a\xf7\xf6\
-\xee\xfe\xd6\x2f\xf6\xf4\x85\x77\xf6\xf6\x6f\xda\xd1\x13\xbd\x2f\
-\x96\x48\x45\x98\xa6\xf7\x90\x71\x7e\x25\xae\x0b\x9d\x99\xfc\x10\
-\x6d\x1f\x66\x9a\xf8\x0e\xd3\xf8\x0f\xc8\x54\x7f\x42\x3a\xa9\x18\
-\xf6\x6f\x28\xfe\x34\xe9\x14\xbd\xfe\x03\x95\x67\x14\x43\x9c\x65\
-\x06\x7f\x99\x0c\xf9\x15\xa6\xdb\xe7\xc9\x84\xbd\x35\xf2\xb7\xf2\
-\xd2\xec\xbf\x51\x79\x91\xcc\xf8\x9d\xbc\x8c\xa2\xbc\x98\x9e\xdf\
-\xf7\x96\x62\xf0\x37\xbd\xa5\x26\x7a\xfd\x1a\xf5\xf1\x2a\x99\xf9\
-\xcb\x14\x3f\x4b\xe5\xf3\x2c\x7f\x0c\xfb\xf7\xd4\xe7\x33\x64\xf0\
-\xbf\x25\x43\xff\x25\xed\x3b\x46\xc7\xf9\x21\x95\x8f\xc9\x06\xff\
-\xa6\x64\xf2\x87\x28\x8b\xb7\xe2\x3a\x8f\xb1\x54\xae\x2f\x2a\x9c\
-\xad\xdb\xf7\x0e\x74\xec\xea\xe9\xdd\xb4\xa3\xb7\x2f\xbc\xbd\x3b\
-\xba\xb1\x6b\x77\x7f\xcb\xd6\xde\xfe\xe6\x2d\x91\x2d\x81\xd2\xb8\
-\xc0\xec\x01\x00\x77\x2c\x4b\x19\x5c\x7b\x38\xec\x53\x54\x25\x98\
-\x48\xa5\xd7\x0f\xa9\xbc\x7d\x24\x25\x3a\xc7\x92\x56\x57\x3c\x6d\
-\xed\x8e\x65\x78\xdf\x58\x96\x0f\x48\xba\x31\x24\x65\x72\x63\x64\
-\xba\x92\x94\xb5\x58\x4c\xb3\xd4\xb8\x96\x4b\x49\x19\x33\xcb\x34\
-\x4b\x97\x32\x96\x29\xe9\x96\x25\x67\xb9\x90\x32\xdc\x8e\x67\xb8\
-\x13\x4f\x93\xb2\x39\x97\x34\x9e\x97\xb6\x20\xd7\xdb\xe7\xd5\x93\
-\xb3\x82\xea\x0b\x11\xa3\xb6\x52\x96\x9b\xd4\xb7\x4e\xfb\xb3\xb2\
-\x66\xa5\x28\x96\xa0\x76\x0a\x19\xbe\x74\x20\x63\x8d\xc5\x34\x63\
-\x98\x26\xa4\x81\xb1\xac\xd3\x17\xcb\xda\xdd\xf1\x8c\xdd\x35\x9a\
-\x71\x3e\x3f\x94\xd0\x36\x0d\xaa\x6a\xeb\xb6\x9c\x08\xf9\xfb\xa2\
-\x2b\x1e\x07\x00\x00\xb8\x43\xf0\x2f\x64\xb6\xfe\x32\xbc\x9d\xc1\
-\x60\xd0\x93\x2f\x10\x6c\xca\x2b\x58\x52\x53\x49\x41\x9f\xb7\x3f\
-\xbf\x5d\x8a\xe7\xeb\x54\x8a\x55\x6a\x5f\x16\xab\x54\xaf\x5a\x9b\
-\x85\x32\xb8\x10\x5f\x7c\x8e\x01\x3a\x07\x3a\x79\x9f\x8f\xe2\xde\
-\x17\xa7\xfc\xbe\x1b\x2f\x11\x59\x3d\x00\x00\xf8\x6a\xca\x7a\xfd\
-\x0d\xa8\x6a\x17\x53\xf3\x75\x03\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x80\xe5\xf9\x2f\x66\x8b\x1d\x48\x2a\xf3\xf0\x97\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x01\x1c\xd4\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x35\x00\x00\x02\x9f\x08\x06\x00\x00\x00\x96\x92\x39\x10\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x2e\x22\x00\x00\x2e\x22\x01\xaa\xe2\
-\xdd\x92\x00\x00\xff\xa5\x49\x44\x41\x54\x78\x5e\xec\xbd\x09\x7c\
-\x25\xcb\x59\x9f\xdd\x92\x46\xeb\x48\xa3\x75\x24\xcd\xbe\xde\xc5\
-\xd7\xbe\xb6\xc1\x86\x98\x10\xf0\x6e\xb0\xcd\x9e\x80\x43\x12\xb0\
-\x59\x6d\x6c\xee\xc5\xce\x06\xc9\xc7\x47\xe2\x84\x24\x18\x4c\x42\
-\x92\x0f\x63\x43\x82\x21\xc4\x04\xb2\xe1\x0d\x12\x02\x09\x06\xc7\
-\xeb\xdd\xef\xdc\x3b\xfb\xbe\x4b\xa3\xd9\x17\x8d\x34\x33\x9a\xaf\
-\x9e\xea\xaa\x73\xaa\x5b\xdd\xe7\x54\x1f\x75\xeb\x6c\xef\xa3\x5f\
-\xab\xab\xab\xab\xab\xbb\xab\xaa\xfb\xfd\x9f\xaa\xea\xaa\x8e\xfb\
-\xf7\xef\x07\x82\x20\x08\x82\x20\x08\xcd\x4e\xa7\x59\x0b\x82\x20\
-\x08\x82\x20\x34\x35\x2d\x51\x53\xd3\xa1\x30\x4e\x41\x10\x84\x9a\
-\x50\xef\x42\xa9\xb6\x16\x84\x26\xa7\x69\x44\x4d\x46\xe1\x22\x22\
-\x47\x10\x04\x1f\x2a\xbe\x00\x45\xe8\x08\x42\x73\xd1\x90\xa2\xe6\
-\xf1\x9f\xfa\xdb\xdb\xd5\xea\x95\x66\xc1\xcd\x02\xaf\x35\x6b\x41\
-\x10\x84\x1a\xb9\xff\x9b\xff\xf6\xdf\xfc\xca\x8f\x9b\x0d\x4b\xfc\
-\x45\xb8\xec\xc5\x28\x02\x47\x10\x1a\x9f\x86\x10\x35\x46\xc4\x7c\
-\x97\x5a\x5e\x67\x96\x61\xb5\x08\x82\x20\x14\xc4\xfd\x8f\x2b\x61\
-\xf3\x6e\xb3\x61\xb1\x2f\xc3\xb4\xb5\x08\x1b\x41\x68\x70\xea\x26\
-\x6a\x94\x90\x19\x51\xab\x77\x99\xe5\x15\xf8\x09\x82\x20\xac\x1e\
-\xf7\x3f\xaf\x84\xcd\x5b\xec\x46\xc2\xda\x5d\xc0\xae\x45\xdc\x08\
-\x42\x83\xb2\xea\xa2\x46\x89\x19\x6a\x62\x10\x32\xef\xd4\x1e\x82\
-\x20\x08\x75\xe3\xfe\x51\x25\x6c\xf8\x51\x65\xc5\x4b\xb5\x05\xf4\
-\x5a\x84\x8d\x20\x34\x1e\xab\x26\x6a\x8c\x98\xf9\xc7\x6a\x91\x7e\
-\x31\x82\x20\x34\x10\xf7\x8f\x5d\x9c\x9b\xfb\xce\xdf\xfd\xdd\xff\
-\x78\x92\x0d\xb3\x2c\x99\xc5\xba\xad\xbf\xbb\x88\xb0\x11\x84\x06\
-\xa3\x70\x51\x63\xfa\xcb\xfc\x96\x5a\x44\xcc\x08\x82\xd0\xa8\xdc\
-\x3e\x7f\xfe\xdc\x37\xfe\x97\xff\xfc\x7b\x27\x94\x3b\x2e\x68\xee\
-\x39\xee\xb8\xc0\xd1\x88\xb8\x11\x84\xc6\xa0\x50\x51\xa3\x04\x0d\
-\x35\x33\xff\x28\xdc\xaa\x9d\x1d\x3b\x76\xe8\xf5\xc8\xe8\x68\x30\
-\x36\x36\xa6\xdd\x79\x52\x54\x1a\xe4\x1d\x6f\x71\x79\x55\x5c\x19\
-\x28\xea\x92\x9b\x25\x6d\x8b\xcb\xb3\xfc\x69\xc6\x34\xf0\x8d\xfb\
-\xc8\xe1\xc3\xc1\xec\xec\xac\xd9\x4a\xe5\xf6\xd9\xb3\x67\xbe\xf9\
-\xbf\xfd\xd7\xff\x4c\x8d\x8d\x15\x33\x49\x6b\x4e\xea\x8a\x1b\x8d\
-\xba\x96\xe2\x6e\x54\x10\x04\x2f\x0a\x11\x35\x4a\xcc\xf0\x29\x36\
-\xb5\x33\x99\x3b\x00\x6f\xd8\xb0\x21\xd8\xb9\x6b\x57\xf0\xc0\xae\
-\x9d\xc1\xa6\xcd\x9b\x82\xf5\x13\xe3\xda\x3f\xeb\x75\xfa\x86\xf7\
-\x8d\xf6\x7e\x0d\x86\xdf\xff\x1a\x7c\x2f\x22\xdb\x35\xe4\x7d\x7e\
-\xef\xeb\x34\xf8\xdf\x56\xb6\x78\x21\xf7\x7b\xcb\x98\xbf\xb9\x9f\
-\xbf\xa6\x34\x30\x8e\x0a\x14\x7b\xfe\x9c\xe3\xce\x78\x0d\xde\xe7\
-\x57\x7f\xb7\x6f\x2f\x04\xbf\xfb\xbb\xbf\xe7\x23\x6c\xee\xdd\xbc\
-\x79\xe3\xf1\xdf\xfc\xf7\xbf\xf1\x29\xdc\x29\x0b\x82\xc6\x15\x37\
-\xa0\x2f\x46\x5d\x53\xb6\x9b\x10\x04\x21\x57\x72\x17\x35\x4a\xd0\
-\xd0\x09\xf8\xe3\xe1\x96\x1f\x08\x99\x57\x7f\xdd\xab\x83\x97\x3f\
-\xfa\xb2\x92\x88\x89\x93\xf5\x3a\xbd\x5f\x78\x9e\xd1\xd6\xdb\xe8\
-\x79\x5f\xa8\x43\xde\xd7\xe0\x7d\xad\x06\xff\x5b\x2b\xe6\xde\xbc\
-\xef\x2b\x63\xde\x42\xde\x69\x96\x35\x0d\x7c\x83\x17\x75\x7e\xc8\
-\x3d\xee\x8c\xd7\xe0\x7d\x7e\x27\x7f\x7f\xf3\x37\x7f\xdb\x47\xd8\
-\xdc\xbf\x71\xfd\xda\xfb\x3f\xfe\xf1\x7f\xff\x49\xe5\x46\xc4\xdc\
-\x35\x4b\x5c\xdc\x10\xb1\x5b\x63\xa3\x4f\xa4\xae\xab\x7c\x42\x41\
-\x10\x56\x95\x5c\x45\x8d\x12\x34\xd4\xce\x78\x7f\xd5\xf4\xb5\xaf\
-\x7a\x55\xf0\xda\x6f\xfe\xa6\x60\xdb\xd6\xcd\xc6\x27\x99\x5a\xae\
-\xd1\xfb\x85\xe7\x19\x75\xab\x8a\x9a\xdc\xaf\xd3\xc1\xff\xd6\xb2\
-\xc5\x9d\xf7\x35\x8b\xa8\xa9\xe5\xfc\x39\xc7\x9b\xf1\xfc\xe0\x7d\
-\x0d\x4e\xfe\xfe\xf9\x5f\x7c\x21\xf8\xd2\x17\xbf\x68\xb6\x2a\x72\
-\x7f\x61\xe1\xf6\xaf\xff\xfa\xc7\x7e\xed\x43\xca\x8d\xa0\xb9\xa3\
-\x96\xb8\xc0\xb1\x35\x36\x22\x6c\x04\xa1\x41\xc8\x45\xd4\x28\x31\
-\xc3\x98\x33\x9f\x53\x8b\x57\x73\x13\x62\xe6\x6d\x6f\xfd\x96\x60\
-\x62\xdc\xaf\x7f\x4c\x2d\xd7\xe8\x73\x8c\x6f\xb4\x8d\x60\xf4\xbc\
-\x2f\xd6\x90\xf7\xf9\xbd\xaf\xd3\xc1\xff\xd6\xea\x7c\x6f\x19\xf3\
-\x37\xf7\xf3\x67\xbc\x7f\xf0\x3d\xa4\xa8\x6b\xc8\x3d\xde\xa2\xce\
-\x1f\xcb\xdb\x24\x51\x33\xb1\x7e\x7d\x30\x77\xe1\x82\xd9\x8a\x72\
-\xe7\xce\xe2\x7f\xfd\xe8\xaf\xfd\xea\xcf\xe0\x54\x8b\x15\x34\x56\
-\xe0\xd8\xc5\x8a\x1a\x57\xdc\x70\x8d\x7e\x17\x29\x08\x42\x6e\xac\
-\x78\x96\xee\x2c\x82\x66\xc7\xce\x9d\xc1\xcf\xfe\xec\x3f\x0c\xde\
-\xf9\x03\x7f\x23\xb5\x99\x29\x0f\xe4\x5d\x52\x7f\xfc\x6d\x99\xe4\
-\x55\x56\xf2\x4e\xdb\x76\xcf\x83\xc1\xa1\x21\x2d\x6c\x3a\x3b\x97\
-\x4f\x19\xd7\xdd\xdd\xf3\xd7\xde\xf3\x13\xef\xa3\xb6\xa6\x57\x2d\
-\x3d\x78\x99\x65\x8d\x59\xba\xcc\xc2\xc1\xbc\x4f\x59\xeb\x88\x64\
-\xa2\x5d\x41\x58\x7d\x56\x24\x6a\x7c\x05\x4d\x5f\x5f\x5f\xf0\xed\
-\xdf\xf1\xed\xc1\xfb\x1f\x7f\x5f\xa1\x62\xa6\x51\xc8\xdd\x98\xb4\
-\xb9\xd1\x71\xc9\x3b\x6d\x6b\xa9\x85\x13\xfc\x68\x9e\xf2\xdd\xa1\
-\x85\xcd\xf4\x86\x8d\x69\xc2\xe6\xaf\xfe\xe4\x63\x3f\xf5\xbf\x95\
-\x13\x51\x63\x97\x24\x61\xc3\xfb\x54\x84\x8d\x20\xd4\x91\x9a\x45\
-\x8d\xaf\xa0\xd9\xb0\x71\x63\xf0\x77\xff\xee\xdf\x0e\xde\xf4\x06\
-\xc6\xde\x2b\x93\xbb\xe1\x17\x4a\xe4\x6e\xf8\x25\x0f\x0a\xa3\x19\
-\xd3\xb6\xd5\xca\x43\x28\x64\x3a\x82\x9e\xde\xde\x54\x61\xd3\xd1\
-\xd1\xb9\x45\x09\x9b\x3f\x55\xce\x24\x61\x13\x17\x35\x22\x6c\x04\
-\xa1\x4e\xd4\x2c\x6a\x14\x55\x05\x0d\x7d\x67\x7e\xe6\xef\xff\x9d\
-\x55\xad\x9d\xf1\x37\xd4\xc6\x51\x05\xf9\x25\x5f\x1c\xad\x6c\xd0\
-\x5b\xcd\xf0\x37\x12\xde\x79\xe0\xf9\xec\x12\xca\x15\x36\x1b\x36\
-\x6d\x56\x6b\x34\x4b\x14\x84\xcd\x63\x8f\xbf\xff\x89\xb7\xbf\xfd\
-\xdb\x19\x50\xd4\x36\x43\xd9\xc5\x8a\x9b\x54\x61\x03\xb8\x05\x41\
-\x28\x8e\x9a\x44\x8d\xf9\xca\xa9\xa2\xa0\xf9\xbe\x77\x7c\x9f\xee\
-\x3b\x23\xac\x90\xa6\x34\xfc\xc6\x21\xe4\x8e\x6f\xda\x8a\xf8\xf2\
-\x47\x89\x95\x88\xb0\xe9\xee\xee\x0e\xa6\xa6\x37\x24\x0a\x1b\xb5\
-\x7f\x68\xe7\xae\xdd\x7f\x64\x84\x8d\xad\xb1\xb1\xcd\x50\x95\x84\
-\x4d\x49\xdc\xb0\x16\x04\xa1\x18\x32\x8b\x1a\x25\x68\xaa\x4e\x46\
-\x89\xa0\xf9\xc6\x6f\xf8\x4b\x66\xab\x76\x9a\xf1\x85\x2b\xc6\xa4\
-\x38\xf2\x4e\x5b\xa9\x85\xcb\x4e\xee\xe5\xbb\x01\x9e\x03\x64\x46\
-\x5c\xd8\x74\x75\x75\x69\x61\x33\x30\x30\xa0\xc3\xc4\xe8\x45\xd8\
-\xbc\xe3\x1d\xdf\xff\x1a\xe5\xb6\xc2\xc6\xd6\xd6\xa4\x89\x1b\x10\
-\x61\x23\x08\x05\x93\x49\xd4\x28\x41\xc3\x48\xc1\x15\x07\xd6\xf3\
-\x11\x34\x62\xd0\x8b\x23\x77\xc3\x2f\x79\x55\x42\xd2\xb6\x35\x41\
-\x63\xa4\x09\x9b\xf5\x53\x53\xba\x13\x71\x02\xbd\x93\x53\xd3\xbf\
-\xf3\x83\xef\xfc\xa1\xef\x54\x6e\x2b\x6a\xe2\x4d\x51\x76\xb1\xc2\
-\x26\x8c\x98\x7f\x22\x6c\x04\xa1\x10\x32\x89\x1a\x05\xcd\x4e\xa9\
-\xe4\x55\x43\x53\x2b\xfe\xc6\xc4\x38\xaa\x20\xbf\xe4\xb3\xe3\x9d\
-\xb6\x62\xd0\xeb\x4e\x33\xe6\x81\xf7\x33\x9e\xe1\xd9\x55\x92\x26\
-\x55\xd8\xe0\x3f\x3e\x31\x91\x26\x6c\x3a\x86\x87\x47\x7e\xc9\x11\
-\x36\x49\x35\x36\x56\xd0\xb8\xa2\x46\x0b\x1a\x11\x36\x82\x90\x3f\
-\xde\xa2\xe6\xf1\x70\x72\xca\xd4\x7e\x34\x74\x0a\xae\xa7\xa0\x69\
-\x04\xfc\x45\x95\xe7\x0b\x57\x0c\xbf\xe0\xe0\x5f\x6c\xa4\xdc\x64\
-\x02\x41\x63\x04\x4c\x25\x61\xc3\x92\x00\xc2\xe6\xc3\xef\x7e\xcf\
-\x7b\x19\xcb\xc6\x0a\x9b\xb8\xb8\x49\xeb\x67\x43\xdc\x22\x6c\x04\
-\x21\x47\xbc\x44\x8d\x12\x34\x74\x8a\x4b\x9d\x6d\x9b\xcf\xb6\x7d\
-\x3b\x05\xe7\x6e\xf8\x85\xc2\x68\xa4\x3c\xc8\xbb\xdc\x48\x2d\x5c\
-\x76\x72\x7f\x76\x1b\xa4\x7c\x69\x5d\x81\xa0\xa9\x22\x6c\xa8\xad\
-\x49\x11\x36\x41\x4f\x4f\xef\xf7\x28\x61\xf3\x0b\x38\xd5\x12\x6f\
-\x8a\xb2\xc2\x86\x85\x08\x45\xd8\x08\x42\x41\x78\x89\x1a\x45\x6a\
-\xb3\x13\x03\xeb\xfd\xe8\x8f\xfc\x90\xd9\x12\xea\x49\xee\x46\x47\
-\x28\x91\x77\xda\x4a\x1e\x64\xc7\x3b\x6d\x33\x0a\xd6\x50\xc4\xe8\
-\x7f\xc8\x17\xed\x0e\x37\x93\x85\xcd\xd4\xf4\xb4\xf1\x8b\x82\xb0\
-\x79\xef\xfb\x1e\xff\x04\x4e\xb3\xa4\x09\x1b\xa9\xb1\x11\x84\x82\
-\xa8\x2a\x6a\x1e\xff\xa9\xbf\xcd\xa8\x79\xaf\x0d\xb7\x96\xf3\x96\
-\xb7\xbc\xa5\x21\x46\x09\xf6\x37\x26\xc6\x51\x05\xf9\x25\x9f\x1d\
-\xef\xb4\x15\x83\x5e\x18\x22\xaa\x6a\xc1\x8a\x18\xfd\x8f\x2d\xed\
-\x0e\x37\x97\x0b\x9b\xbe\xfe\x7e\x25\x6c\x92\x07\xe9\xeb\xea\xea\
-\x7a\xb5\x0c\xd2\x27\x08\xf5\xa3\xaa\xa8\x51\xd0\x97\x26\x11\xe6\
-\x72\x7a\xd3\x1b\xa3\x23\x05\xb7\x2b\xb9\x1b\x13\x31\x3a\x99\xf1\
-\xce\x83\x26\x14\xac\x52\x1c\x8a\x23\xd4\x12\x56\xc4\xe8\x7f\x6c\
-\x69\x77\xb8\xb9\x5c\xd8\x30\x86\x0d\xc2\x66\xcd\x1a\xb4\x4a\x14\
-\x15\x9e\xd1\x87\xff\x24\x65\x90\x3e\x11\x36\x82\x50\x20\x15\x45\
-\x4d\xb5\x5a\x9a\xbf\xf5\x37\xbf\x5f\xaf\xf3\x36\xe8\xde\x86\x5f\
-\x28\xd1\xca\x79\x20\xe5\xa1\xfe\xe4\x5e\x6e\x1a\x28\x4f\x43\xf1\
-\x62\x05\x4b\xb8\x8d\x43\xff\xe9\x7d\x6c\x26\x0b\x9b\xe9\x8d\x1b\
-\x53\x47\x1f\x8e\x0d\xd2\x67\x6b\x6b\xec\xba\xa2\xb0\x01\xdc\x82\
-\x20\x64\xa3\xa2\xa8\x51\x30\xd0\x5e\x22\x7c\xed\xd4\x6c\x93\x53\
-\x7a\xbf\x6f\x9b\xf0\x97\xbc\x50\x1c\x79\x1b\x74\x11\x69\xd9\xf1\
-\x4e\xdb\x1a\x9e\x5d\xf4\x83\x5d\xd0\x15\xac\xb4\x1b\x3f\x23\x60\
-\xc2\xcd\xe5\xc2\x86\xb1\x6c\x26\xa7\xa6\x53\x46\x1f\x0e\x07\xe9\
-\x8b\x8d\x3e\x6c\x45\x8d\x5d\x92\x84\x0d\x0b\xf1\xeb\xb5\x20\x08\
-\xfe\xa4\x8a\x9a\xc7\xc3\x09\x2b\x53\x47\x0e\x7e\xfb\xdb\xbe\xd5\
-\xb8\xea\x8f\x18\x89\xfa\xe3\x9b\x05\x92\x57\xd9\xc9\x3b\x6d\x25\
-\x0f\x96\x13\x0a\x97\x70\x41\x53\xb0\xd2\x6e\xfc\xf4\xb6\xf5\x4b\
-\x16\x36\xd3\x1b\x36\x05\x83\x83\x83\x44\x15\x07\x61\xf3\xc7\xef\
-\x7c\xd7\x0f\x27\x0d\xd2\x47\x6d\x4d\x52\xad\x0d\x70\x02\xe2\xd7\
-\x6b\x41\x10\xfc\x48\x15\x35\x8a\x96\xaa\xa5\x29\x92\xdc\x8d\x89\
-\x18\x9d\x12\x79\xa7\xad\xd4\xc2\x15\x47\xb3\x97\xef\x50\xb8\x84\
-\x4b\x28\x58\x42\x3f\x1c\xfa\x4f\xef\x63\x73\xb9\xb0\xc1\x7f\x6c\
-\x62\x7d\x9a\xb0\xe9\x5a\xb7\x6e\xf8\xc3\xb1\x41\xfa\x10\x33\x6e\
-\x53\x94\x5d\xac\xb0\x09\x23\xe7\x5f\x78\x41\x82\x20\x78\x50\x93\
-\xa8\x79\xdd\x6b\xbf\xc9\xb8\x0a\x30\x3a\x0d\xfa\xc2\x6b\x64\x24\
-\x0f\xea\x4f\x2b\xa7\x6d\xab\x97\x07\x57\x33\x84\x02\x25\x5c\xd0\
-\x14\xac\xb4\x1b\x3f\x47\xc0\x54\x12\x36\xc3\x23\x54\x72\x2f\x43\
-\x8f\x3e\xfc\xe3\xef\xfe\x89\x9f\x56\x6e\x69\x8a\x12\x84\x82\x48\
-\x14\x35\x66\xb0\xbd\xc4\xd1\x83\x19\x68\x6f\xfb\xb6\xad\x66\xab\
-\xfe\xf8\x1b\x13\xe3\xa8\x82\xfc\x92\x2f\x0e\x31\xe8\x42\x2d\x78\
-\x3f\xe3\x35\x3e\xbb\xa1\x20\x29\x6b\x06\xbb\x1d\xfa\x85\x62\x45\
-\xbb\xf1\xd3\xdb\xd6\x2f\x59\xd8\x0c\x8f\x8c\xa6\x8e\x3e\xdc\xdb\
-\xdb\xf7\xa3\xce\x20\x7d\x49\xe2\x26\xde\x14\x15\x46\xce\xbf\xf0\
-\x82\x04\x41\xa8\x40\xa2\xa8\x51\x7c\x97\x59\x2f\xe3\xeb\x5e\xfd\
-\x6a\xe3\x12\xb2\xe0\x6d\x1c\x9b\xd2\xf0\x1b\x87\x90\x3b\xfe\xc5\
-\xc6\x2f\xa0\x88\xb4\xe5\x84\x62\x24\x5c\x2c\x51\xbf\x50\xac\x68\
-\x37\x7e\x8e\x80\x49\x13\x36\x6b\x07\xc3\xd1\x87\x43\xff\x28\x32\
-\xfa\xb0\x20\x14\x47\x9a\xa8\x49\x1d\x7c\xe6\x15\xaf\x78\xd4\xb8\
-\xf2\xa7\x19\x5f\xb8\x62\x24\x8a\x23\x6f\x43\x2d\xb5\x70\xd9\xc9\
-\x3b\x0f\x54\x40\xe3\x68\x2c\x42\x31\x12\x2e\x96\xa8\x5f\x28\x56\
-\xb4\x1b\x3f\xbd\x6d\xfd\xd2\x85\xcd\xe4\xd4\x86\x54\x61\x13\x1b\
-\xa4\x2f\x4d\xd8\x48\x8d\x8d\x20\x64\x20\x93\xa8\xa1\xe9\xc9\xed\
-\x20\x9c\xfb\x0b\x4f\xc8\x4c\xde\x79\x20\x79\x55\x46\xd2\xb6\x79\
-\xf0\x15\xac\x49\x79\x60\x35\x42\x28\x46\xc2\xc5\x12\xf5\x0b\xc5\
-\x8a\x76\xe3\xe7\x08\x98\x34\x61\xd3\xd3\xdb\x9b\x2a\x6c\xd4\x31\
-\x0c\xd2\x27\xa3\x0f\x0b\x42\x8e\x2c\x13\x35\xa6\x3f\xcd\x70\xb8\
-\x15\x65\xe7\xce\x9d\xc6\xd5\x18\xf8\x1b\x13\xe3\xa8\x82\xfc\x92\
-\xcf\x8e\x77\xda\x8a\x41\xaf\x3b\xcd\x98\x07\xab\x72\xcd\x5a\x80\
-\x84\x1a\x21\x14\x23\xe5\x6d\x88\xfa\xb1\x0e\xfd\x70\xe8\x3f\xbd\
-\x8f\xcd\x74\x61\x33\xbd\x71\x53\xd0\xdd\x83\x66\x89\x82\xb0\x79\
-\xec\xf1\xf7\x3f\x11\x1b\xa4\xcf\xad\xb5\xa9\x28\x6c\x00\xb7\x20\
-\x08\x21\xcb\x44\x8d\xe2\x95\x66\xbd\x8c\x07\x76\xef\x32\x2e\x01\
-\xfc\x45\x95\xe7\x8b\x59\x0c\x7f\x61\x34\xa3\x60\xf5\x2f\x36\x52\
-\x6e\x56\x82\xd6\x05\x5a\x80\x84\xfa\x80\xb5\x5d\x2c\x51\x3f\xd6\
-\xce\x71\x8e\x80\x49\x13\x36\x6b\xd6\x74\x07\x93\x53\x53\x89\xc2\
-\x46\x85\x1b\x32\x83\xf4\x6d\x53\x1b\xb6\xc6\xc6\x36\x43\x55\x12\
-\x36\x2c\x9c\x43\xaf\x05\x41\xc8\x28\x6a\xb6\x6c\xd9\x6c\x5c\xfe\
-\x2f\xd2\xdc\x0d\xbf\x50\x18\x8d\x94\x07\x52\x6e\xea\x4f\xee\x79\
-\xd0\xc0\x79\x55\x12\x28\x46\x1f\x84\x62\xa4\xbc\x0d\x51\x3f\xd6\
-\xce\x71\x7a\xdb\xfa\x25\x0b\x9b\xae\xae\x35\x5a\xd8\xf4\x0f\x0c\
-\x10\x5d\x1c\x3d\xfa\xf0\x3b\xde\xf1\xfd\xaf\x51\x6e\x2b\x6c\xdc\
-\x3e\x36\x49\xe2\x06\x38\x09\xe7\xd0\x6b\x41\x68\x77\x92\x44\x0d\
-\xd5\xa0\x89\xb4\xf2\x80\x7b\xcd\xf9\x4b\x3e\x67\xa3\x23\x94\xc8\
-\x3b\x6d\x25\x0f\xb2\xe3\x9d\xb6\x9e\xcf\x6e\x5a\x74\x08\x12\xbd\
-\x0e\x15\x49\xb8\x36\xdb\x76\xb1\x44\xfd\x58\x3b\xc7\xe9\x6d\xeb\
-\x97\x2e\x6c\x26\xd6\x4f\xa6\x8e\x3e\x3c\x39\x35\xfd\x3b\xce\x20\
-\x7d\x49\x4d\x51\x76\xb1\xc2\x26\x3c\x01\xff\xc2\x8b\x12\x84\xb6\
-\xc6\x5b\xd4\x30\x23\x77\x23\xe1\x6f\x4c\x8c\x43\xc8\x1d\xdf\xb4\
-\x15\x83\x9e\x9d\xbc\xd3\x56\xf2\x20\x1d\x2d\x42\x42\x5d\xa0\xc5\
-\x07\x1e\x56\x1f\x84\x62\xa4\xbc\x0d\x51\x3f\xd6\xce\x71\x7a\xdb\
-\xfa\x25\x0b\x1b\xd6\xa3\xe3\x13\x69\xc2\x46\x0f\xd2\x17\x1b\x7d\
-\x38\x5e\x63\x63\x05\x8d\x2b\x6a\x58\x88\x5b\xaf\x05\xa1\x5d\x89\
-\x88\x1a\x79\x20\xfc\xc9\xdd\x98\x88\xd1\xc9\x8c\x77\x1e\x78\xfe\
-\x92\x17\x0a\xa4\x81\xcb\x37\xaf\x3d\x2d\x36\x42\x5d\xa0\xb7\xf1\
-\xb0\xaf\xc3\x70\x7f\x79\x1b\xa2\x7e\xac\x9d\xe3\xf4\xb6\xf5\xab\
-\x2c\x6c\xc6\xc6\x13\x6b\xbf\x11\x36\x1f\x7e\xf7\x7b\xde\xfb\x21\
-\xe5\xb6\xc2\x26\x2e\x6e\xd2\xfa\xd9\x10\xb7\x5e\x0b\x42\x3b\x12\
-\x11\x35\x86\xd7\x9a\x75\x84\xd1\xd1\x51\xe3\xca\x60\x4c\x72\x0e\
-\x27\x94\x69\xe5\x3c\x90\xf2\x50\x7f\x9a\xb1\xdc\xac\x84\x92\xd8\
-\x08\x75\x81\xde\xc6\xc3\xea\x83\x70\x7f\x79\x1b\xa2\x7e\xac\x9d\
-\xe3\xf4\xb6\xf5\x4b\x17\x36\x8c\x65\x93\x22\x6c\x64\x90\x3e\x41\
-\xa8\x81\x24\x51\x93\xc8\xf8\xd8\x98\x71\xd5\x1f\xff\x17\xae\x71\
-\x54\x41\x7e\xc9\x0b\x2e\x79\x1b\xf4\x56\x31\xfc\xab\x89\x77\xda\
-\x7a\x3e\xbb\x15\xa3\x33\xf6\xbf\x24\x36\x42\x5d\xa0\xb7\xf1\xb0\
-\xfa\x20\xdc\x5f\xde\x86\xa8\x1f\x6b\xe7\x38\xbd\x6d\xfd\x2a\x0b\
-\x9b\xf5\x93\x53\x66\x5f\x14\x84\xcd\x7b\xdf\xf7\xf8\x27\x70\x9a\
-\x25\x4d\xd8\x48\x8d\x8d\x20\x28\xbc\x45\x8d\x50\x20\x4d\x68\xf4\
-\x7c\x2f\x59\x0c\x7a\x76\xf2\x4e\x5b\xc9\x83\xca\x68\xdb\x6f\xec\
-\x7f\x49\x6c\x84\xba\xa0\xb4\xcf\xea\x83\x70\x7f\x79\x1b\xa2\x7e\
-\xac\x9d\xe3\xf4\xb6\xf5\x4b\x17\x36\x7d\xfd\xfd\xc1\xe4\xd4\x74\
-\xa2\xb0\xe9\xea\xea\x7a\xb5\x0c\xd2\x27\x08\x7e\x88\xa8\xa9\x01\
-\x31\x26\xc5\x91\x77\xda\x4a\x2d\x5c\x71\x78\x97\xef\x26\x78\x0e\
-\xb4\xed\x37\xf6\xbf\x24\x36\x42\x5d\x50\xda\x67\xf5\x41\xb8\xbf\
-\xbc\x0d\x51\x3f\xd6\xce\x71\x7a\xdb\xfa\xa5\x0b\x9b\xee\x1e\x46\
-\x1f\x9e\x0e\xd6\xac\x41\xab\x44\x51\xc7\x31\xfa\xf0\x9f\x98\x41\
-\xfa\x6c\x6d\x8d\x5d\x44\xd8\x08\x82\x21\xb3\xa8\xc9\xdd\xe8\x34\
-\xc1\x0b\xaf\xd1\x90\x3c\xa8\x3f\xad\x9c\xb6\xed\x5a\x1e\xb4\xed\
-\x37\xf6\xbf\x24\x36\x42\x5d\x50\xda\x67\xf5\x41\xb8\xbf\xbc\x0d\
-\x51\x3f\xd6\xce\x71\x7a\xdb\xfa\x55\x16\x36\x53\xd3\x1b\x82\x9e\
-\x94\xd1\x87\xcd\x20\x7d\xee\xe8\xc3\x28\x20\xbb\xae\x28\x6c\x00\
-\xb7\x20\xb4\x32\x99\x45\x4d\xbd\xf1\x37\x26\xc6\x51\x05\xf9\x25\
-\x9f\x1d\xef\xb4\x15\x83\x2e\xd4\x80\xf7\x33\xee\xf9\xec\x66\xc9\
-\x52\x6d\xf7\x8d\xed\xc7\xad\x37\x43\x5d\x50\xda\x67\xb5\x41\xb8\
-\xbf\xbc\x0d\x51\x3f\xd6\xce\x71\x7a\xdb\xfa\xa5\x0b\x9b\xce\xae\
-\x2e\xdd\xc7\x26\x49\xd8\x28\xf4\x20\x7d\x8e\xb0\x71\xc5\x8d\x5d\
-\x92\x84\x0d\x0b\xf1\xeb\xb5\x20\xb4\x2a\x25\x51\x23\x85\x3d\x5f\
-\xbc\x8d\xa3\x18\x51\xc1\xc1\xbf\xd8\xf8\x05\x14\x91\x56\x9d\xf8\
-\xab\x4f\x6f\x1b\x3f\xdc\x7a\x33\xd4\x04\xa5\x7d\xf6\x98\x70\x7f\
-\x79\x1b\xa2\x7e\xac\x9d\xe3\xf4\xb6\xf5\xab\x2c\x6c\x26\xa7\xa7\
-\x83\xb5\x6b\xd7\x12\x65\x1c\x84\xcd\x1f\xbf\xf3\x5d\x3f\x9c\x34\
-\x48\x1f\xb5\x35\x49\xb5\x36\xc0\x89\x88\x5f\xaf\x05\xa1\x15\x29\
-\x89\x9a\x3c\x69\xe5\x17\xae\x18\x89\xe2\xc8\xbb\xdc\x48\x2d\x5c\
-\x76\x72\x7f\x76\x9b\xe0\x79\x09\xc5\x44\xd4\xce\xeb\x6d\xe3\x17\
-\xee\x57\xeb\x50\x13\x94\xf6\xd9\x63\xc2\xfd\xd1\x38\xa2\x7e\xac\
-\x9d\xe3\xf4\xb6\xf5\x4b\x17\x36\xec\x1b\x1d\x1f\x4f\x13\x36\x5d\
-\xeb\xd6\x0d\x7f\x38\x36\x48\x1f\x62\xc6\x6d\x8a\xb2\x8b\x15\x36\
-\xe1\x49\xf8\xa7\x2f\x46\x10\x5a\x8f\x4c\xa2\x46\x0c\x7a\xfd\xc9\
-\xdd\xf0\x4b\x9e\x96\x90\xb4\x6d\x1e\xf2\x6c\x7a\x52\xf2\xc1\x88\
-\x88\xa8\x9d\xd7\xdb\xc6\x2f\xdc\x1f\x86\xb5\xdb\x78\xd8\x63\xc2\
-\xfd\xd1\x38\xa2\x7e\xac\x9d\xe3\x4a\xe7\x64\xb3\xba\xb0\x19\x1e\
-\x1e\x26\xca\x38\x7a\xf4\xe1\x1f\x7f\xf7\x4f\xfc\xb4\x72\x4b\x53\
-\x94\x20\x28\x32\x89\x9a\x7a\xe3\x6f\x4c\x8c\xa3\x0a\xf2\x4b\x3e\
-\x3b\xde\x69\x2b\x06\xbd\x30\x5a\x59\x54\xd5\xeb\x9a\x95\x7c\x30\
-\x22\x22\x6a\xe7\xf5\xb6\xf1\x0b\xf7\x87\x61\xed\x36\x1e\xf6\x98\
-\x70\x7f\x34\x8e\xa8\x1f\x6b\xe7\xb8\xd2\x39\xd9\xac\x2c\x6c\x86\
-\x94\xa8\x49\x1b\x7d\xb8\xb7\xb7\xef\x47\x9d\x41\xfa\x92\xc4\x4d\
-\xbc\x29\x2a\x3c\x09\xff\xf4\xc5\x08\x42\xeb\x10\x17\x35\x52\xc0\
-\x2b\x90\xbb\x31\x69\x42\xa3\xd3\x2c\x34\xa3\x60\x95\xe2\x50\x27\
-\x8c\x5d\x57\xf2\xc1\x88\x88\xe8\x6b\x50\x6f\xdb\x30\x7a\x7f\x18\
-\xd6\x6e\xe3\x61\x8f\x09\xf7\x47\xe3\x88\xfa\xb1\x76\x8e\x2b\x9d\
-\x93\xcd\xca\xc2\x66\x60\xed\x5a\x2d\x6c\xc2\xfd\x51\x64\xf4\x61\
-\x41\x08\x89\x8b\x9a\x54\xfc\xab\x7b\xf3\x0d\x27\x64\xa7\x19\xf3\
-\x40\xca\x4d\xfd\xc9\x3d\x0f\x9a\x29\xaf\x8c\x5d\x57\xf2\xc1\x88\
-\x88\xa8\x9d\xd7\xdb\x36\x8c\xde\x1f\x86\xb5\xdb\x78\xd8\x63\xc2\
-\xfd\xd1\x38\xa2\x7e\xac\x9d\xe3\x4a\xe7\x64\xb3\xba\xb0\xa9\x34\
-\xfa\x70\x6c\x90\xbe\x34\x61\x23\x35\x36\x42\xcb\xe2\x2d\x6a\x5a\
-\x8d\xe6\xfc\x25\xdf\x7c\xd7\xdc\x2c\xe4\x6d\xd0\x5b\x25\xaf\x8e\
-\x1f\x3f\x11\xbc\xf0\xc2\x5e\xb3\x15\xf2\xe2\x8b\xfb\x82\x13\x27\
-\x4e\x9a\xad\xe5\xb0\xef\xd0\xa1\xc3\x66\xcb\x9f\x17\xf7\xee\x0f\
-\x4e\x9c\x3c\x65\xb6\x54\x3c\xca\xbd\x77\xdf\x01\xb3\x55\x66\x66\
-\xf6\x42\x70\xe0\xe0\xe1\x60\xdf\xbe\x83\xc1\xb5\x6b\xd7\xf5\xfa\
-\xe4\xc9\xd3\x66\x6f\x19\x9b\x05\xa7\x4e\x9d\x0e\x8e\x1c\x39\x1a\
-\x6e\x24\x50\x32\xe7\xc6\xa1\xe4\x83\x11\x11\x51\x3b\xaf\xb7\x6d\
-\x18\xbd\x3f\x0c\x6b\xb7\xf1\xb0\xc7\x84\xfb\xa3\x71\x44\xfd\x58\
-\x3b\xc7\x95\xce\xc9\x66\x65\x61\xd3\xdd\xd3\x93\x2a\x6c\xd4\x7e\
-\x06\xe9\x93\xd1\x87\x85\xb6\xa5\x69\x44\x8d\xbf\x31\x31\x0e\x21\
-\x77\x7c\xd3\x56\xc4\x57\x76\xf2\x4e\xdb\x7a\xe6\xc1\xdd\xbb\x77\
-\x8d\x2b\x7f\xe6\x2e\x5e\x0a\x2e\xaa\x65\x78\x68\x28\x98\x9e\x9e\
-\x0c\x7a\x7b\xfb\xcc\x9e\x74\xee\xdd\xbb\x67\x5c\xe9\x94\xcc\xb9\
-\x71\x28\xf9\x80\x91\xd7\x8b\x8b\xde\xb6\x61\xf4\xfe\x30\xac\xdd\
-\xc6\xc3\x1e\x13\xee\x8f\xc6\x11\xf5\x63\xed\x1c\x57\x3a\x27\x9b\
-\xd5\x85\xcd\xe4\x54\xfa\x20\x7d\x8f\x3d\xfe\xfe\x27\x62\x83\xf4\
-\xb9\xb5\x36\x15\x85\x0d\xe0\x16\x84\x66\xa4\x69\x44\x4d\xbd\xc9\
-\xdd\x98\xd4\xd1\xe8\x34\x1a\x79\xa7\xad\x74\x00\xaf\x2f\xbb\x76\
-\xed\x0c\x1e\xd8\xbd\xcb\x6c\xe5\xcb\x95\x2b\x57\x94\x21\xef\x0e\
-\xa6\x37\x4c\x05\xa3\xa3\x23\x4a\xd4\x60\xa7\x2b\xb3\x7d\xfb\x36\
-\x7d\x4d\x69\x58\x1b\x5e\x32\xe5\x76\xbb\x24\x26\xa2\x36\x5e\x6f\
-\xdb\x30\x7a\x7f\x18\xd6\x6e\xe3\x61\x8f\x09\xf7\x47\xe3\x88\xfa\
-\xb1\x76\x8e\x2b\x9d\x93\xcd\xca\xc2\x66\x4d\xf7\x9a\x60\x62\x72\
-\x32\x65\x90\xbe\x8e\x21\x33\x48\xdf\x36\xb5\x61\x6b\x6c\x6c\x33\
-\x54\x25\x61\xc3\xc2\x39\xf4\x5a\x10\x9a\x8d\x0e\x6b\x28\x4c\x21\
-\xee\x78\xec\xf1\x0f\x24\xfe\xac\x79\xd3\x9b\xdf\x14\x7c\xfb\xdb\
-\xdf\x6a\xb6\x92\xc9\xdd\xf0\x3b\xf8\xc7\x1d\xae\x9f\x7b\x7e\x4f\
-\xe8\xc8\x89\x5a\xae\xb9\x1e\x34\xcb\x75\xba\x34\xe3\x35\x17\xc9\
-\x86\x0d\xd3\xc1\xc0\xc0\x80\xd9\x8a\xe2\xff\x1c\x64\x4b\xd3\xb4\
-\xf0\x34\x3f\xdd\xb8\x71\x33\x78\xd9\xcb\x1e\xd1\xdb\x84\xa3\xf9\
-\x69\x70\x70\x6d\xb0\x6d\xdb\x56\xed\x97\x48\x0d\x79\x4a\xf3\xd3\
-\xda\xb5\x03\xc1\xb6\xad\x5b\xf4\x36\xcd\x4f\x37\x6f\xde\x0a\x1e\
-\x79\xc9\x43\x7a\x1b\x68\x8e\x22\xcc\xd6\xad\x9b\x8d\x4f\xa0\x9b\
-\x9f\xe2\x7e\x90\x74\x09\x7f\xfe\x17\xff\x37\xf8\xf2\x97\xbe\x64\
-\xb6\x42\x5e\xf3\x57\xbe\x49\xaf\x6d\x1a\x94\x8e\xb3\xdb\xfc\x29\
-\x77\x3c\x8d\xf4\xb6\x0d\xa3\xf7\x87\x61\xed\x36\x1e\xf6\x98\x70\
-\x7f\x34\x8e\xa8\x1f\x6b\xe7\xb8\xd2\x39\xd9\x5c\xd2\x4a\x63\x69\
-\xc9\x86\xb3\xfe\xac\x97\x94\xff\x52\x70\xf9\xe2\xc5\x60\x7e\x7e\
-\x9e\x68\xe3\x2c\xcc\xce\x9c\xff\x91\xdf\xff\xfd\xff\xf4\x15\xe5\
-\x5e\x54\xcb\x1d\xb3\x50\x9d\xc6\xbb\xde\x2e\x4b\x6a\xe1\x04\xac\
-\x01\x37\xe7\xd0\x6b\x41\x68\x16\x9a\x42\xd4\xf8\xc7\x6b\x1c\x8a\
-\xbf\xf8\xfc\x17\x8c\x4b\x10\x9a\x8b\x9d\x3b\x77\x04\x43\x43\x83\
-\x66\x2b\x4a\x2d\xcf\xd8\xf9\xf3\xe7\x83\xab\x57\xaf\x05\x8b\x8b\
-\x77\x98\xf1\x39\x18\x1e\x5e\x17\x4c\x4f\x4d\x06\x5d\x66\xe2\xc4\
-\x7b\x77\xef\x06\x27\x4f\x9d\xd6\xe2\x85\xfd\x53\x6a\xdf\xd8\xd8\
-\xa8\xde\xe7\x23\x6a\xe8\x43\x43\x98\x6d\xdb\xb6\x28\xff\xc1\xd2\
-\xf6\x4b\x1f\x79\x58\xef\x4f\x62\xfe\xf6\xed\x60\x76\xf6\x82\x0e\
-\xd7\xd9\xd5\x19\x4c\x8c\x8f\xeb\xed\x34\x51\xb3\xb0\xb8\x18\x1c\
-\x39\x72\x4c\xfb\x5b\x46\x47\x86\x75\x8d\x4d\x5c\xd4\xd0\xbf\x86\
-\xe3\xb6\x6c\xd9\xa4\xfc\xd7\xea\x3e\x35\x6c\x3f\xfc\xf0\x83\x29\
-\xa2\xe6\x9b\xd5\xff\x30\xbd\x6c\xba\x95\x92\xcf\x6e\x97\xc4\x44\
-\x39\x5d\x41\x6f\xdb\x30\x7a\x7f\x18\xd6\x6e\xe3\x61\x8f\x09\xf7\
-\x47\xe3\x88\xfa\xb1\x76\x8e\x2b\x9d\x93\xcd\xca\xc2\x86\x53\x5e\
-\xba\x38\x17\xdc\xba\x75\x8b\x68\xe3\xdc\xbf\x7a\xf5\xca\xdf\xfb\
-\x0f\xbf\xfd\xf1\x4f\x29\xb7\x15\x36\x88\x1a\xbb\x58\x51\x63\x97\
-\xf0\x24\xe1\xc2\x39\xf4\x5a\x10\x9a\x01\x69\x7e\x12\x84\x26\xc1\
-\xd7\xb6\xc4\xc3\x21\x66\x10\x29\x1b\x37\x6e\x50\xeb\x91\xe0\xd2\
-\xa5\xcb\xc1\xf9\x99\x59\xb3\x57\x89\x00\x65\xf4\x17\x95\x68\x60\
-\xff\xc4\xc4\xb8\x12\x36\xfe\xaf\x85\xb3\x67\xcf\x69\x61\x82\x80\
-\x40\xd0\xf8\x80\xa0\x39\xae\x84\x0f\xe7\xa4\x56\x0a\x41\x43\xb3\
-\x52\x25\x7a\x7b\x7a\x54\xd8\x29\xed\xd6\xcd\x4f\xd3\x93\xc1\xb0\
-\x12\x35\x71\xce\x9f\x9b\xd1\x02\x86\x7b\x49\x19\x89\x37\x85\xb0\
-\xb5\xc5\xb6\xba\x94\x1a\x5f\xec\x36\x7f\xca\x6d\xf7\x5b\xf4\xb6\
-\x0d\xa3\xf7\x87\x61\xed\x36\x1e\xf6\x98\x70\x7f\x34\x8e\xa8\x1f\
-\x6b\xe7\xb8\xd2\x39\xd9\xac\xdc\x14\xc5\x29\xc7\xc6\x27\xd2\x6a\
-\xf8\xf4\x20\x7d\xb1\xd1\x87\x6d\xff\x1a\xbb\xd8\x66\x28\x96\xf0\
-\x24\xe1\xc2\x39\xf4\x5a\x10\x9a\x01\xff\xb7\x57\x4e\x88\xe8\x17\
-\x84\xd5\x65\xeb\xd6\x2d\xc1\xfa\xf5\xeb\x83\x91\xe1\x75\xc1\xba\
-\x75\xeb\x74\x2d\x0b\x35\x37\x16\x44\x09\xfd\x32\x10\x3e\xeb\xd7\
-\x4f\xa4\x8d\x5e\xbb\xec\xd9\x9d\x99\x99\x09\x2e\x5f\xbe\xa2\x05\
-\x0d\xf1\xfa\x42\x8d\xcc\xd2\xbd\x25\x7d\x5d\x63\xa3\x23\xc1\x7a\
-\x25\xa4\xb6\x6c\x89\x36\x1d\x25\x31\x3a\x32\xa2\xd7\xdd\xdd\xdd\
-\xba\x3f\x4d\x7f\x7f\xb4\x93\xf0\xec\xec\x5c\x70\xf9\xca\xd5\x60\
-\xd3\xa6\x0d\xea\x7a\x86\x8c\x6f\x75\xca\x36\x3b\x5c\xdb\xed\xb2\
-\xb7\xd9\xe6\x4f\xb9\xe3\x36\x5e\x6f\xdb\x30\x7a\x7f\x18\xd6\x6e\
-\xe3\x61\x8f\x09\xf7\x47\xe3\x88\xfa\xb1\x76\x8e\x2b\x9d\x93\x4d\
-\x3f\x61\x33\x3a\x3a\x46\xb4\x71\x10\x36\x1f\x7e\xf7\x7b\xde\xfb\
-\x21\xe5\xb6\xc2\x26\x2e\x6e\xe4\xcb\x28\xa1\xe9\xc9\x4d\xd4\x88\
-\x58\x11\x84\xc6\x84\xaf\x85\x0e\x1c\x38\xa8\xfb\xa3\xd0\x84\x83\
-\x88\x71\xbf\x08\xa2\xb9\x09\x3f\x3e\x7b\xa6\x16\xc7\x87\x5b\xf3\
-\xf3\xc1\xdc\xdc\x25\x2d\x90\xb2\x08\x1a\xe0\xd8\xbe\xbe\x5e\x5d\
-\xfb\x62\x71\xdd\xb5\x40\xed\x0f\xf7\x49\x33\xd4\xd0\x90\xbf\xa0\
-\x01\xde\x5c\x65\x9b\x1d\xae\xed\x76\xd9\xdb\x6c\xf3\xa7\xdc\x71\
-\x1b\xaf\xb7\x6d\x18\xbd\x3f\x0c\x6b\xb7\xf1\xb0\xc7\x84\xfb\xa3\
-\x71\x44\xfd\x58\x3b\xc7\x95\xce\xc9\x66\x75\x61\xb3\x76\x70\x30\
-\x4d\xd8\x28\xf1\x2a\x83\xf4\x09\xad\x4d\x6e\xa2\xa6\x28\xfc\xab\
-\xdc\x8d\x43\x10\x84\x12\x18\x7a\x9a\x88\x68\x1a\xda\xb5\x6b\x47\
-\xf0\xe8\xa3\x2f\x2d\xf5\x97\xb1\x50\x3b\xb3\x7d\xfb\x56\x5d\x5b\
-\x43\xd8\x33\x67\xce\x9a\x3d\x95\xa1\x36\x04\x31\xe4\x2b\x84\x2c\
-\xd4\xd2\xb8\x78\x3f\xe3\xda\x9c\xa7\x43\x3f\x24\x9a\x9e\xaa\x35\
-\x65\xc5\xc1\x54\x13\x73\xd9\x66\x87\x6b\xbb\x5d\xf6\x36\xdb\xfc\
-\x29\x77\xdc\xc6\xeb\x6d\x1b\x46\xef\x0f\xc3\xda\x6d\x3c\xec\x31\
-\xe1\xfe\x68\x1c\x51\x3f\xd6\xce\x71\xa5\x73\xb2\xe9\x27\x6c\x26\
-\xd6\xaf\x37\x61\xa2\x20\x6c\xde\xfb\xbe\xc7\x3f\x81\xd3\x2c\x69\
-\xc2\x06\xfb\x20\xc2\x46\x68\x2a\x1a\x5e\xd4\x08\x82\x90\x45\xdc\
-\x47\xc3\x5d\xbb\x16\x36\x33\x6d\xda\xb4\xb1\xd4\xdf\x82\xbe\x2c\
-\x71\x10\x3d\x34\x01\xd1\x89\x98\x26\xa5\x6a\x0c\xf4\xf7\xeb\xf0\
-\xd4\xd4\x9c\x3b\x77\x3e\x98\x9f\xbf\x6d\xf6\x54\x87\x63\x6e\xdf\
-\x5e\xd0\x9d\x7f\x2d\xae\xbb\x16\xfa\xfb\xfa\x82\xcd\x9b\x37\xea\
-\x9a\x9a\xf3\xe7\x67\xd3\xbe\x04\x4a\x05\x53\xdd\x6a\xc2\xa6\xaf\
-\xaf\x3f\x18\x9f\x98\x4c\x14\x36\x5d\x5d\x5d\xaf\x96\x41\xfa\x84\
-\x56\x24\x17\x51\x53\xeb\x0b\x57\x10\x84\x62\xb1\xfd\x4e\xa8\x7d\
-\xa1\xd6\xe6\xe4\xc9\x53\xba\x76\xc5\xc2\x33\xc9\xd7\x41\x17\x2e\
-\xcc\xe9\x1a\x17\xf6\x21\x3a\xe2\xa4\x3d\xbb\x74\xf4\xe5\xeb\xa5\
-\xd3\xa7\x4f\x07\x4b\x4b\xf7\x08\x68\xf6\xa4\x33\x36\x16\x36\x8d\
-\x70\x2d\x97\x94\x80\x62\x40\x3d\xae\x21\x0f\xa6\xa6\xa6\xf4\xf5\
-\x50\xe3\xe4\x33\xe8\x1e\x28\x19\x10\xae\xd5\x8a\xab\x2f\xdb\x6c\
-\xeb\x5f\xde\xef\x3a\x38\x2e\x14\x11\x76\x47\x88\xde\xb6\x61\xf4\
-\xfe\x30\xac\xdd\xc6\xc3\x1e\x13\xee\x8f\xc6\x11\xf5\x63\xed\x1c\
-\x57\x3a\x27\x9b\xd5\x85\x4d\x6f\x6f\xaf\x16\x36\x6b\xd6\xa0\x51\
-\xa2\xa8\x30\x8c\x3e\xfc\x27\x66\x90\x3e\x5b\x5b\x63\x17\x11\x36\
-\x42\x53\x92\x8b\xa8\x11\x04\xa1\x31\x99\x9e\x9e\xd6\xcd\x4d\x08\
-\x96\x99\x99\x59\xfd\xc9\x36\x5f\x0e\x01\x9f\x72\xdf\xbb\x17\x8e\
-\xfe\x3b\x37\x77\xd1\x34\x53\xad\xd5\x1d\x7f\x7d\xa1\xc9\x6a\xcb\
-\xe6\x4d\xfa\x0b\xab\x53\xa7\xce\x18\xdf\xca\x0c\xa9\x73\xd0\x49\
-\xb8\xb3\xb3\x53\xd7\xf2\xd0\x5c\x44\x13\x18\xb5\x2c\x69\x54\x6b\
-\x7a\xb2\xf0\x65\xd4\xa6\x8d\x1b\x82\x3b\x77\xee\xea\xfb\xf1\x45\
-\xc9\x80\x70\xad\x56\xad\x28\x6c\xd6\x4f\x4e\xeb\xbc\x8a\x83\xb0\
-\x31\x83\xf4\xb9\xa3\x0f\x53\x5b\x63\xd7\x15\x85\x0d\xe0\x16\x84\
-\x46\x21\x97\x71\x6a\x8a\xaa\xa9\xf1\x8f\xd7\x38\x1c\x64\x9c\x1a\
-\xa1\x59\x89\x8f\x53\x53\xd4\xf3\x05\xb9\xc7\xad\xc2\x1d\x3a\x7c\
-\x44\x3b\x7d\x46\x15\xf6\x3e\xbf\xa7\xa8\x49\x8a\xce\xce\xfb\xc4\
-\xa8\xc2\x49\xe3\xd4\x7c\xe3\x6b\x5f\x5f\xba\x0e\x7b\x1e\x36\x79\
-\x21\x96\xaf\xcf\xfa\x97\xf7\xbb\x0e\x8e\x63\x5f\xfc\x7e\xf4\xb6\
-\x0d\xa3\xf7\x87\x61\xed\x36\x1e\xf6\x98\x70\x7f\x34\x8e\xa8\x1f\
-\x6b\xe7\xb8\xd2\x39\xd9\xac\x3e\x8e\x0d\x35\x57\x17\xe7\x2e\x24\
-\x36\x3f\x2a\x16\x8e\x1e\x39\xfc\xf6\x3f\xfc\xc3\xcf\x1c\x57\x6e\
-\x3b\x40\x9f\x3b\x48\x1f\xeb\xf8\x58\x36\xa0\xd7\xea\x3c\x76\x5b\
-\x10\xea\x8a\xd4\xd4\x08\x82\x90\x1b\x34\x27\x51\x6b\xb3\x36\x65\
-\x44\xe4\xd5\x86\x5a\x20\x6a\x6d\xaa\x8d\x59\x63\x2b\x1c\x3a\xc2\
-\x4a\x08\xb5\x1d\x5a\xeb\x72\x45\x84\xf5\x2f\xef\x77\x1d\x1c\xc7\
-\xbe\x72\xf8\x10\xbd\x6d\xc3\xe8\xfd\x61\x58\xbb\x8d\x87\x3d\x26\
-\xdc\x1f\x8d\x23\xea\xc7\xda\x39\xae\x74\x4e\x36\xab\xd7\xd8\x50\
-\x4b\xc7\xb4\x0a\x29\x63\xd9\xf4\xee\xdc\xb5\xfb\x8f\xdf\xf9\xae\
-\x1f\xb6\x63\xd9\xc4\x9b\xa2\x92\x6a\x6d\x80\x13\x72\x1e\xbd\x16\
-\x84\x7a\xb3\x62\x51\xe3\x2b\xd0\x45\xc8\x0b\x42\x63\x91\xf7\xb3\
-\x4b\x8d\x08\xcd\x49\x34\x61\x4d\x4d\x87\x03\xe5\xd5\x13\x46\x43\
-\xa6\xd3\x30\xcd\x5a\x34\x6f\x55\xc3\xda\x65\x25\x03\xc2\xb5\x5a\
-\x71\xe7\x65\x7b\x6d\xfd\xcb\xfb\x5d\x07\xc7\xb1\x2f\x6e\xdf\xf5\
-\xb6\x0d\xa3\xf7\x87\x61\xed\x36\x1e\xf6\x98\x70\x7f\x34\x8e\xa8\
-\x1f\x6b\xe7\xb8\xd2\x39\xd9\xac\x2e\x6c\x3a\xd5\x7a\x64\x6c\x2c\
-\x4d\xd8\x74\xad\x5b\x37\xfc\xe1\xd8\x20\x7d\xf1\xa6\x28\xbb\x58\
-\x61\x13\x9e\x8c\x7f\xfa\xa2\x04\xa1\xbe\xac\x58\xd4\xd4\x1b\xd1\
-\x4a\x82\xd0\x18\x4c\x4e\x4e\x06\x3b\x77\x6e\xd7\xd3\x1c\x74\x75\
-\x56\x7f\xb5\x78\x8b\x2a\x6d\xaa\xab\x13\x8f\x0e\x21\xc3\xd4\x0d\
-\x7c\xa5\x45\x2d\x45\x2a\x8e\x2d\xb6\x76\x59\xc9\x80\x70\xad\x56\
-\x44\x5b\xb6\xd7\xd6\xbf\xbc\xdf\x75\x70\x1c\xfb\xe2\xf6\x5d\x6f\
-\xdb\x30\x7a\x7f\x18\xd6\x6e\xe3\x61\x8f\x09\xf7\x47\xe3\x88\xfa\
-\xb1\x76\x8e\x2b\x9d\x93\x4d\x7f\x61\x93\x32\xbe\x90\x1e\x7d\xf8\
-\xc7\xdf\xfd\x13\x3f\xad\xdc\x56\xd8\x58\x51\x63\x17\x2b\x68\x58\
-\xc2\x13\x85\x0b\xe7\xd1\x6b\x41\xa8\x17\xd5\xdf\x3c\x75\x42\x6a\
-\x76\x04\x21\x83\xe1\x6f\x80\xe7\x85\x0e\xc0\x7c\x5a\xdd\x28\xd0\
-\xe4\xd4\xdf\xdf\x6f\xb6\xaa\xe0\xd8\x62\x6b\x97\x95\x0c\x08\xd7\
-\x6a\xd5\x8a\xc2\x66\x50\x89\x9a\xb4\xd1\x87\x7b\x7b\xfb\x7e\xd4\
-\x19\xa4\x2f\x49\xdc\xc4\x9b\xa2\xc2\x93\xf1\x4f\x5f\x94\x20\xd4\
-\x87\x86\x15\x35\x82\x20\xd4\x1f\x6f\xb1\xd4\xc4\x3f\x42\x4a\x36\
-\xd8\xb1\xc5\xd6\x4f\xc9\x80\x70\xad\x56\xad\x28\x6c\xfa\xd7\x0e\
-\x68\x61\x13\x86\x8b\x22\xa3\x0f\x0b\xcd\xc8\x8a\x44\x4d\x33\xfd\
-\x8a\x14\x04\xa1\x8c\x3c\x93\x51\x4a\x36\xd8\xb1\xc5\xd6\x4f\xc9\
-\x80\x70\xad\x56\xad\x2a\x6c\xd2\x06\xe9\x43\xd8\xc4\x06\xe9\x4b\
-\x13\x36\xd8\x12\x11\x36\x42\xdd\x59\x91\xa8\x29\x0a\x7f\xb1\x64\
-\x1c\x82\x20\x34\x15\xde\xcf\xb8\x36\xcb\xd5\xc9\xe3\x5d\x50\xb2\
-\xc1\x8e\x2d\xb6\x7e\x4a\x06\x84\x6b\xb5\xe2\x54\x65\x7b\x6d\xfd\
-\xcb\xfb\x5d\x07\xc7\xb1\xaf\x1c\x3e\x44\x6f\xdb\x30\x7a\x7f\x18\
-\xd6\x6e\xe3\x61\x8f\x09\xf7\x47\xe3\x88\xfa\xb1\x76\x8e\x2b\x9d\
-\x93\x4d\x3f\x61\xd3\xdd\xd3\x9d\x2a\x6c\x54\x38\x06\xe9\x93\xd1\
-\x87\x85\xa6\xa0\x21\x45\x8d\x20\x08\x19\x0c\x7f\x95\x70\x7b\xf6\
-\xbc\x18\x1c\x3b\xc6\xf0\x23\x21\xb8\x5f\x78\x61\xaf\xd9\xf2\x83\
-\x2f\x9b\x4e\x9c\x38\x69\xb6\x92\x39\x71\xf2\x54\xf0\xe2\xde\xfd\
-\x66\xab\xcc\xd5\x6b\xd7\x82\x23\x47\x8f\xe9\x7d\xfb\x0e\x1c\xd4\
-\xe1\x5c\x98\x68\x33\xee\x57\x89\x7d\xfb\x0e\x06\x27\x4f\x96\x47\
-\x20\xc6\xbd\x7f\xff\x41\xb3\x95\x0c\x5f\x42\xf9\x8c\x5a\x5c\xb2\
-\xc1\x8e\x2d\xb6\x7e\x4a\x06\x84\x6b\xb5\x6a\x55\x61\xb3\x7e\x72\
-\x4a\xcf\x82\x1e\x07\x61\xf3\xd8\xe3\xef\x7f\x22\x36\x48\x9f\x5b\
-\x6b\x53\x51\xd8\x00\x6e\x41\x28\x9a\xc2\x45\x8d\x54\x73\x0b\x42\
-\x73\xe2\x3e\xbb\x4b\x4b\x4b\xc1\xdd\xbb\xe1\xe8\xc3\xcb\xa8\xf0\
-\x8c\x33\x6e\xcd\xe9\xd3\x67\x83\x35\x6b\xd6\xe8\x29\x15\x26\xc6\
-\xc7\x83\x6e\xe5\x5e\x6d\x18\x78\x2e\x6d\xda\x84\xb8\xb9\x2d\xd9\
-\x5f\x67\x87\xf5\x53\x32\x20\x5c\xab\x55\x2b\x0a\x9b\x2e\x95\x37\
-\x13\xeb\x27\x13\x85\x8d\x0a\x34\x64\x46\x1f\xde\xa6\x36\x6c\x8d\
-\x8d\x6d\x86\xaa\x24\x6c\x58\x38\x97\x5e\x0b\x42\x91\xd4\x2c\x6a\
-\x44\xac\x08\x42\xfb\xf0\xc0\x03\xbb\xf5\x88\xbc\x59\xb9\x7c\xf9\
-\xb2\x9e\x8b\x89\xcf\xbc\xc7\x46\x47\x82\xf5\x13\xe3\xc1\xc6\x8d\
-\x1b\xcc\xde\xd5\x83\x6b\xdf\xbe\x1d\x5b\x9c\x4c\xdc\xdc\x96\xec\
-\xaf\xb3\xc3\xfa\x29\x19\x10\xae\xd5\xaa\x15\x85\x4d\x87\xda\x8f\
-\xb0\x49\xf9\x72\x8c\x41\xfa\xfe\xe8\x1d\xef\xf8\xfe\xd7\x28\x77\
-\xbc\x29\x2a\x4d\xdc\x00\x27\xe5\x5c\x7a\x2d\x08\x45\x51\xb3\xa8\
-\x29\x0a\xff\x2a\x77\xe3\x10\x84\x36\xa6\xd1\x7f\x5c\x30\x1b\x37\
-\x33\x7a\xbb\x78\x3f\xe3\xda\x04\xaf\x1e\x71\x73\x5b\xb2\xbf\xce\
-\x0e\xeb\xa7\x64\x40\xb8\x56\x2b\xae\xb2\x6c\xab\xad\x7f\x79\xbf\
-\xeb\xe0\x38\xf6\x95\xc3\x87\xe8\x6d\x1b\x46\xef\x0f\xc3\xda\x6d\
-\x3c\xec\x31\xe1\xfe\x68\x1c\x51\x3f\xd6\xce\x71\xa5\x73\xb2\xe9\
-\x2f\x6c\x46\xc7\xc7\x53\x47\x1f\x9e\x9c\x9a\xfe\x1d\x67\x90\xbe\
-\xa4\xa6\x28\xbb\x58\x61\x13\x9e\x90\x7f\xfa\xc2\x04\xa1\x18\x1a\
-\x4e\xd4\x08\x82\xb0\xba\x62\x85\x19\xba\xe9\x63\xc3\x3a\x8d\x17\
-\x5f\xdc\x17\xe9\x53\xc3\x8c\xdc\xf4\x51\xd9\xb7\xff\x80\xee\x27\
-\xc3\xe4\x91\x6e\xf3\xd4\xc2\xe2\x62\xa9\x7f\x0d\x33\x7f\xe3\xb6\
-\x4b\xb5\x3e\x34\xec\x23\xcc\xcd\x9b\xb7\x8c\x4f\x36\x98\x8d\x9c\
-\x3e\x36\xac\x2d\x6c\xa7\xf5\xa9\x71\x6d\x6c\xdc\xdc\x96\xf6\x45\
-\xc2\x84\x6e\x25\x03\xc2\xb5\x5a\xb5\xa2\xb0\x81\x0a\xa3\x0f\xeb\
-\x41\xfa\x62\xa3\x0f\xc7\x6b\x6c\xac\xa0\x61\x09\x4f\x16\x2e\x9c\
-\x4b\xaf\x05\x21\x6f\xc2\x92\x9b\x11\xff\xda\x94\xd5\x7b\x31\x0b\
-\x82\x50\x9d\xf8\x33\x69\x67\xef\x5e\xbf\x7e\x3c\x32\x95\x40\xa5\
-\x67\x17\x41\x73\xe4\xc8\xb1\xe0\xc6\xcd\x9b\xba\x8f\xcc\xd4\xe4\
-\x64\x70\x47\x09\x1a\x6a\x65\x2c\xbd\x3d\x3d\xba\x0f\x0d\x30\x73\
-\x36\x6e\xbb\x54\x82\x69\x16\x10\x33\x9b\x36\x6d\xa8\x38\x6b\x77\
-\x1a\xcc\xf5\x84\x38\x63\x66\xf2\xf1\xf1\xc4\x81\xe5\x12\x71\x6d\
-\x6c\xdc\xdc\x96\xf6\x45\xc2\x84\x6e\x25\x03\xc2\xb5\x5a\x91\x62\
-\xe5\x78\xac\x7f\x79\xbf\xeb\xe0\x38\xf6\x95\xc3\x87\xe8\x6d\x1b\
-\x46\xef\x0f\xc3\xda\x6d\x3c\xec\x31\xe1\xfe\x68\x1c\x51\x3f\xd6\
-\xce\x71\xa5\x73\xb2\x99\x4d\xd8\x8c\x8c\x8e\x6a\x77\x0c\x84\xcd\
-\x87\xdf\xfd\x9e\xf7\x7e\x48\xb9\xad\xb0\x89\x8b\x9b\xb4\x7e\x36\
-\x9c\x4b\xaf\x05\x21\x4f\xc2\x52\x2b\x08\x42\xdb\x71\xe3\xc6\x0d\
-\x5d\xc3\x82\xa0\x99\x9a\xf2\x9f\xab\xe9\xd2\xa5\x70\xd2\xca\x4d\
-\x1b\x37\xe8\x3e\x32\xf4\x95\xa1\xcf\x0c\xe2\xc5\x05\x7f\xe8\x51\
-\x02\x07\x37\xcb\xe8\xc8\xb0\xf6\x4b\x62\x66\xf6\x42\x70\xf9\xca\
-\x55\x2d\x68\xd6\xad\x1b\x32\xbe\x95\x71\xb5\xd7\x4d\x25\xb2\x98\
-\xeb\x09\x41\x33\x39\xb9\xde\xf8\xfa\xe3\xda\xd8\xb8\xb9\x2d\xed\
-\x8b\x84\x09\xdd\x4a\x06\x84\x6b\xb5\x6a\x55\x61\x33\xb0\x76\x6d\
-\x9a\xb0\x91\x41\xfa\x84\x86\xa2\xa1\x44\x8d\x7f\x0d\x90\x71\x08\
-\x42\x4b\xe2\xfb\x1c\xac\xec\x41\x38\x75\xea\x4c\x38\x73\xb3\x12\
-\x26\x59\x40\x3c\x00\x13\x57\xba\x20\x5e\x6a\x65\xfe\xf6\x6d\xdd\
-\x5c\x44\xed\xcc\x70\xf2\x9c\x44\x55\x39\xa3\x04\x1a\x9d\x92\xb3\
-\xd4\xd0\x80\x32\xe1\xc6\xa5\x8d\xac\x71\xe1\x36\x0e\x43\x69\x5f\
-\x24\x4c\xe8\xb6\x71\xb0\x49\xae\x94\xe3\xb1\xfe\xe5\xfd\xae\x83\
-\xe3\xd8\x57\x0e\x1f\xa2\xb7\x6d\x18\xbd\x3f\x0c\x6b\xb7\xf1\xb0\
-\xc7\x84\xfb\xa3\x71\x44\xfd\x58\x3b\xc7\x95\xce\xc9\x66\x36\x61\
-\x33\x3e\x31\x61\xc2\x46\x41\xd8\xbc\xf7\x7d\x8f\x7f\x02\xa7\x59\
-\xd2\x84\x0d\x91\x89\xb0\x11\x0a\xa3\xa1\x44\x8d\x20\x08\xab\x07\
-\xb5\x21\x7c\xe6\x7c\xf6\xec\x79\xe3\x93\x8d\xce\x4e\x6c\x54\x7e\
-\x70\x3d\x34\x3d\x5d\xbe\x72\xc5\xf8\x64\x63\xdd\xd0\x50\xb0\x74\
-\x6f\x29\x38\x7f\x7e\xc6\xf8\xf8\xa3\x4c\xb8\x71\x69\x23\x6b\x5c\
-\xb8\x8d\xc3\x50\xda\x17\x09\x13\xba\x6d\x1c\x6c\xb6\xaa\xb0\xe9\
-\xed\xeb\x53\xc2\x66\x7d\xa2\xb0\x51\x02\xf9\xd5\x32\x48\x9f\x50\
-\x6f\xc2\x92\x9a\x01\xff\xda\x14\xbf\x70\x82\x20\xac\x0e\xf1\x67\
-\x72\xd3\xa6\x8d\xba\xe9\xe9\xea\xd5\x6b\x91\x4e\xc2\xd5\x9e\xdd\
-\xbe\xbe\x5e\xbd\xbe\x7a\xf5\xaa\x5e\x5b\x16\x17\x17\x8d\x2b\x3b\
-\x4c\x84\xb9\x59\x5d\x0f\x35\x35\xe7\xce\xcd\x04\xf3\xf3\xb7\xcd\
-\x1e\x7f\xa6\xa7\xa7\x74\xd3\xd3\xf5\xeb\x37\x22\x9d\x84\x7d\x51\
-\x26\xdc\xb8\xb4\x91\x35\x2e\xdc\xc6\x61\x28\xed\x8b\x84\x09\xdd\
-\x36\x0e\x36\x49\xc5\x72\x3c\xd6\xbf\xbc\xdf\x75\x70\x1c\xfb\xca\
-\xe1\x43\xf4\xb6\x0d\xa3\xf7\x87\x61\xed\x36\x1e\xf6\x98\x70\x7f\
-\x34\x8e\xa8\x1f\x6b\xe7\xb8\xd2\x39\xd9\xf4\x17\x36\xdd\x3d\x3d\
-\x5a\xd8\xac\x59\xb3\x5c\xd4\xaa\xb0\x8c\x3e\xfc\x27\x66\x90\x3e\
-\x5b\x5b\x63\x17\x11\x36\x42\xe1\x84\xa5\xb4\x89\x10\xad\x24\x08\
-\xf9\x41\x5f\x1a\x9a\x91\xe8\x2c\x4c\x1f\x1b\x1f\xe8\x50\x4c\x33\
-\xcf\xd9\x73\xe7\x83\x0b\x73\x17\xf5\x00\x7b\x7c\xb1\x44\x3f\x9b\
-\x4a\xf8\xfc\xd0\x41\x98\xe8\xb8\xcf\x9e\x0b\xee\xdd\x5b\x32\xbe\
-\xc9\x24\x45\x47\x5f\x1a\x84\x11\x22\xcd\x36\x93\x65\x41\x99\x70\
-\xe3\xd2\x46\xd6\xb8\x70\x1b\x87\xa1\xb4\x2f\x12\x26\x74\xdb\x38\
-\xd8\x6c\x65\x61\x93\x36\x48\x1f\xc2\xc6\x0c\xd2\xe7\x8e\x3e\x4c\
-\x6d\x8d\x5d\x57\x14\x36\x80\x5b\x10\x6a\x21\x2c\xa1\x0d\x80\xd4\
-\xec\x08\x82\x3f\x79\x3e\x2f\x0c\x86\x47\xdf\x1a\xfa\xd8\xdc\xbb\
-\x97\x32\x6a\xb0\x03\xcd\x4e\xbb\x76\xee\xd0\xe3\xcf\xcc\xce\x5e\
-\x08\x66\x66\x67\x75\xed\x4d\x2d\x9d\x73\xe3\xf0\xd5\x14\x35\x36\
-\x08\xa4\x33\x67\xce\x1a\xdf\x6c\x20\xd4\x10\x46\xf4\xb1\x49\x1b\
-\x45\x38\x42\xcc\x86\x2a\x13\x6e\x5c\xda\xc8\x1a\xd7\xb2\x60\xe5\
-\x7d\x91\x30\xa1\xdb\xc6\xc1\x66\xab\x0a\x9b\x4e\x55\x66\xe8\x63\
-\x93\x3c\xfa\x70\x38\x48\x9f\x23\x6c\x5c\x71\x63\x17\x2b\x6a\x58\
-\xc2\x13\x86\x0b\xe7\xd3\x6b\x41\xc8\x4a\x87\x7d\x39\x9a\x42\xd4\
-\xf1\xd8\xe3\x1f\x48\x7c\x0b\xbc\xe9\xcd\x6f\x0a\xbe\xfd\xed\x6f\
-\xf5\x7e\x99\x66\x7d\xe9\xfa\xc7\x6b\x1c\x55\xf8\x8b\xcf\x7f\xc1\
-\xb8\x04\xa1\xb9\xd8\xb9\x73\x7b\x30\x38\x38\x68\xb6\x92\xa9\x45\
-\xd4\xf8\x1c\x93\x14\x86\x66\xa5\x43\x87\x8e\x04\xa3\xa3\x23\xe5\
-\xd1\x80\x6b\x3c\x3f\xe3\xd7\xf0\x39\x38\x5f\x41\xa5\x7d\xde\x9d\
-\xf7\x24\x96\x08\xa4\xa3\x47\x8f\x05\x23\xea\x9c\x07\x0e\x1e\x0a\
-\xbe\xfc\xa5\x2f\x99\x3d\x21\xaf\x7d\xd3\x5b\x42\x47\x2c\x42\xf7\
-\x3a\xdc\x74\x89\x9f\xb7\xb4\x2f\x12\x26\x74\xdb\x38\xd8\xe4\x05\
-\x5b\x8e\xc7\xfa\x97\xf7\xbb\x0e\x8e\x63\x5f\x39\x7c\x88\xde\xb6\
-\x61\xf4\xfe\x30\xac\xdd\xc6\xc3\x1e\x13\xee\x8f\xc6\x11\xf5\x63\
-\xed\x1c\x57\x3a\x27\x9b\x4b\xfa\x7a\x97\x96\x6c\x38\xeb\xcf\x7a\
-\x09\xaf\x60\x89\x35\x7b\x55\x98\x2b\x57\x2e\x07\xf3\xb7\x12\xc7\
-\x15\xba\x77\xed\xda\xd5\xbf\xff\xdb\xbf\xf5\x9b\x9f\x56\x6e\xda\
-\x27\xa9\xce\x43\x39\xb3\xc6\xd6\xd8\x85\xc8\x38\x99\xad\x9e\xc3\
-\xcd\xf9\xf4\x5a\x10\x7c\x09\x25\xb7\x27\xbe\xe5\x4b\xca\xa1\x20\
-\x34\x16\xb5\x3e\x93\x8c\x49\x33\x37\x77\x51\xbb\xe3\x5f\x3b\x65\
-\xe5\xde\xd2\x52\x70\xc9\xf4\x75\x19\xa8\x61\x0c\x9a\x5a\xa0\xa6\
-\xe6\xd2\xa5\xf0\x9c\x29\xc3\xfe\x97\x89\x55\x0e\x74\x84\x95\x06\
-\x1a\xb7\xe2\x20\x5e\x87\x50\xda\x17\x09\x13\xba\x6d\x1c\x6c\x92\
-\x03\xe5\x78\xac\x7f\x79\xbf\xeb\xe0\x38\xf6\x95\xc3\x87\xe8\x6d\
-\x1b\x46\xef\x0f\xc3\xda\x6d\x3c\xec\x31\xe1\xfe\x68\x1c\x51\x3f\
-\xd6\xce\x71\xa5\x73\xb2\xe9\x5f\x63\xc3\xe8\xc3\x23\x23\xa3\x41\
-\x7f\xf2\x20\x7d\x5d\xeb\xd6\x0d\x7f\x38\x36\x48\x5f\xbc\x29\x2a\
-\xde\xd7\x26\x3c\x29\xff\xf4\xc5\x09\x82\x3f\x99\x44\x4d\x51\xf8\
-\x8b\x25\xe3\xa8\x82\xfa\x2d\x61\x5c\x82\x20\xd4\x0a\x82\x86\x19\
-\xb1\x2f\x5f\xbe\x12\x4c\x4c\x8c\x05\xeb\x6a\xfc\xd4\x1a\xae\xdf\
-\xb8\x19\x1c\x38\x70\x48\x8f\x43\xc3\x27\xd7\x69\x9f\x6d\xfb\x3e\
-\xbb\x3e\xef\x02\x04\x0d\x35\x4c\x57\xd4\x39\xe9\x40\xec\x35\xf6\
-\x4d\xcc\x86\x2a\x13\x6e\x5c\xda\xc0\x1a\xd7\xb2\x60\xe5\x7d\x91\
-\x30\xa1\xdb\xc6\xc1\x26\x97\x5d\x8e\xc7\xfa\x97\xf7\xbb\x0e\x8e\
-\x63\x5f\x39\x7c\x88\xde\xb6\x61\xf4\xfe\x30\xac\xdd\xc6\xc3\x1e\
-\x13\xee\x8f\xc6\x11\xf5\x63\xed\x1c\x57\x3a\x27\x9b\xd9\x85\xcd\
-\xe0\x50\x62\x1a\xeb\xd1\x87\x7f\xfc\xdd\x3f\xf1\xd3\xca\x2d\x4d\
-\x51\x42\xa1\x84\x25\x52\x10\x84\xa6\x61\xb5\x6a\x42\xe9\x3b\xb3\
-\x65\xcb\xa6\xe0\x81\x07\x76\x65\x1a\x9c\x2f\x89\xfe\xfe\x3e\x3d\
-\xa8\xde\xae\x5d\x3b\x82\xa9\x1c\xfa\xde\xf8\x40\x3f\x21\x9a\xcb\
-\x76\xee\xdc\x11\x19\x2d\xb9\x2a\x31\x1b\xaa\x4c\xb8\x71\x69\x03\
-\x6b\x5c\xcb\x82\x95\xf7\x45\xc2\x84\x6e\x1b\x07\x9b\xad\x2c\x6c\
-\x86\x86\xd6\xa5\x8e\x3e\xdc\xdb\xdb\xf7\xa3\xce\x20\x7d\x49\xe2\
-\x46\xbe\x8c\x12\x56\x4c\x58\x1a\x73\x44\x9a\x9e\x04\xa1\xb1\xf0\
-\xaf\x09\x5d\x1e\x8e\xda\x99\x65\x83\xea\xd5\xf0\x8c\x77\x75\x76\
-\xea\xda\x19\x3a\x02\xaf\x26\xd4\xce\xc4\x47\x3a\x8e\x93\x68\x2e\
-\x63\x9e\xca\x84\x1b\x97\x36\xb0\xc6\xb5\xfc\xd8\xd2\xbe\x48\x98\
-\xd0\x6d\xe3\x60\x93\x14\x2c\xc7\x63\xfd\xcb\xfb\x5d\x07\xc7\xb1\
-\xaf\x1c\x3e\x44\x6f\xdb\x30\x7a\x7f\x18\xd6\x6e\xe3\x61\x8f\x09\
-\xf7\x47\xe3\x88\xfa\xb1\x76\x8e\x2b\x9d\x93\xcd\x6c\xc2\xa6\xbf\
-\x7f\x40\x0b\x9b\x30\x7c\x14\x19\x7d\x58\x28\x9a\xdc\x45\x8d\x20\
-\x08\x42\x2d\xe4\xd9\xf4\x94\x95\x44\x73\x19\xf3\x54\x26\xdc\xb8\
-\xb4\x81\x35\xae\xe5\xc7\x96\xf6\x45\xc2\x84\x6e\x1b\x07\x9b\xad\
-\x2e\x6c\xc6\xc6\xd3\x47\x1f\x8e\x0d\xd2\x97\x26\x6c\x88\x50\x84\
-\x8d\x90\x89\xba\x8b\x1a\xe9\x4f\x23\x08\xfe\x34\x63\x4d\x68\xb3\
-\x5c\x73\xa2\xb9\x8c\x79\x2a\x13\x6e\x5c\xda\xc0\x1a\xd7\xf2\x63\
-\x4b\xfb\x22\x61\x42\xb7\x8d\x83\x4d\x52\xa6\x1c\x8f\xf5\x2f\xef\
-\x77\x1d\x1c\xc7\xbe\x72\xf8\x10\xbd\x6d\xc3\xe8\xfd\x61\x58\xbb\
-\x8d\x87\x3d\x26\xdc\x1f\x8d\x23\xea\xc7\xda\x39\xae\x74\x4e\x36\
-\xb3\x09\x9b\xee\xee\x9e\x54\x61\xa3\xc2\x33\x48\x9f\x8c\x3e\x2c\
-\xe4\x4e\x58\x02\x05\x41\x10\x5a\x94\x2c\xa2\x2a\xd1\x5c\xc6\x3c\
-\x95\x09\x37\x2e\x6d\x60\x8d\x6b\xf9\xb1\xa5\x7d\x91\x30\xa1\xdb\
-\xc6\xc1\x66\xab\x0b\x9b\xf1\x89\xf4\x41\xfa\x1e\x7b\xfc\xfd\x4f\
-\xc4\x06\xe9\x73\x6b\x6d\x2a\x0a\x1b\xc0\x2d\x08\x2e\x61\xe9\xcb\
-\x89\x66\xfc\x15\x29\x08\xad\x4c\xb5\x67\xf2\x85\x17\xf6\x06\xc7\
-\x8f\x9f\xa8\x1a\xee\xc5\x17\xf7\x05\x27\x4e\x9c\x24\xc2\x70\x7b\
-\xef\x7e\x3d\x8a\xf0\x6a\x73\xf2\xe4\xe9\x60\xff\xfe\x83\x66\x8b\
-\x49\x39\xa3\xdb\xc0\x36\xfe\xb5\x92\x68\x2a\x63\x9e\xca\x84\x1b\
-\x97\x36\xb0\xc6\xb5\xfc\xd8\xd2\xbe\x48\x98\xd0\x6d\xe3\x60\x93\
-\x54\x2d\xc7\x63\xfd\xcb\xfb\x5d\x07\xc7\xb1\xaf\x1c\x3e\x44\x6f\
-\xdb\x30\x7a\x7f\x18\xd6\x6e\xe3\x61\x8f\x09\xf7\x47\xe3\x88\xfa\
-\xb1\x76\x8e\x2b\x9d\x93\xcd\x6c\xc2\x66\xcd\x9a\x35\xc1\xd8\xf8\
-\x78\xca\x20\x7d\x1d\x43\x66\x90\xbe\x6d\x6a\xc3\xd6\xd8\xd8\x66\
-\xa8\x4a\xc2\x86\x85\x73\xea\xb5\x20\x58\xc2\x92\xd7\x22\x48\xd3\
-\x93\x20\x34\x16\xbe\x3f\x74\x1a\xed\xd9\x4d\x34\x95\x31\x4f\x65\
-\xc2\x8d\x4b\x1b\x57\xe3\x5a\x7e\x6c\x69\x5f\x24\x4c\xe8\xb6\x71\
-\xb0\xd9\xca\xc2\x86\x2f\xe9\x10\x36\x7d\x7d\x7d\xda\x2f\x86\x1e\
-\x7d\xf8\x1d\xef\xf8\xfe\xd7\x28\x77\xbc\x29\x2a\x4d\xdc\x00\x27\
-\xe7\x9c\x7a\x2d\x08\x60\x0b\x47\x5d\xf0\x7e\xe1\x35\xd6\xfb\x4e\
-\x10\xea\x82\xd4\x84\x16\x43\x9a\x4d\x4c\xf4\x8e\x79\x2a\x13\x6e\
-\x5c\xd1\x78\xe2\xc7\x96\xf6\x45\xc2\x84\x6e\x1b\x07\x9b\xad\x2e\
-\x6c\x46\x46\xc7\xd2\x06\xe9\xeb\x9d\x9c\x9a\xfe\x1d\x67\x90\xbe\
-\xa4\xa6\x28\xbb\x58\x61\x13\x9e\x98\x7f\xfa\x02\x05\xa1\xce\xa2\
-\x46\x10\x04\xa1\x48\x7c\x85\x60\x9a\x4d\x4c\xf4\x8e\x79\x2a\x13\
-\x6e\x5c\xd1\x78\xe2\xc7\x96\xf6\x45\xc2\x84\x6e\x1b\x07\x9b\xad\
-\x2c\x6c\xf0\x1f\x1e\x1e\x49\x13\x36\x7a\x90\xbe\xd8\xe8\xc3\xf1\
-\x1a\x1b\x2b\x68\x58\xc2\x93\x86\x0b\x71\xeb\xb5\xd0\xde\x84\xa5\
-\x2d\x07\xe4\x57\xa4\x20\x34\x16\xf6\x99\x64\x92\x4a\xfa\xcd\xd0\
-\x7f\x66\xdf\xbe\x03\xc1\xa5\x4b\x97\xb5\x7f\x1a\xf3\xf3\xb7\x75\
-\xff\x19\xfa\xd1\xec\xdb\x7f\xa0\x34\x4d\x42\x25\xe8\x5f\x43\x3f\
-\x1b\x46\x0e\x4e\x82\x39\x9f\x4e\x9f\x39\x1b\xec\x3f\x78\x28\xd8\
-\xab\xae\x01\x37\xd3\x26\x54\x82\x59\xba\x4f\x9f\x3e\x1b\x1c\x38\
-\x78\x58\x2f\xe7\xcf\xcd\xf8\x4d\x50\x19\xe3\xf4\xe9\x33\x7a\x34\
-\xe3\x6a\xb3\x76\xa7\xd9\xc4\x44\xef\x98\xa7\x32\xd7\xc6\x15\x8d\
-\x27\x7e\x6c\x69\x5f\x24\x4c\xe8\xb6\x71\xb0\xd9\x0e\xc2\x66\x78\
-\x78\x58\xfb\xc5\x40\xd8\x7c\xf8\xdd\xef\x79\xef\x87\x94\xdb\x0a\
-\x9b\xb8\xb8\x49\xeb\x67\x43\xdc\x7a\x2d\xb4\x2f\x61\x49\xab\x03\
-\x79\x37\x3d\x49\x7f\x1a\x41\x48\x86\xd9\xb7\x99\x94\x92\xd1\x75\
-\x27\x26\xc6\x83\xae\xae\xf4\xc7\x1e\x41\x73\xfc\xc4\x09\x1d\x9e\
-\x09\x27\xd7\x4f\x4c\x04\x97\x2f\x57\x16\x41\x67\xcf\x9e\x0b\x6e\
-\x28\x31\xb3\x79\xf3\xc6\x60\xc8\x99\x1f\xca\x7d\xc6\x97\x8c\x80\
-\x61\x34\x61\x66\xf3\xbe\x76\xed\x7a\x70\xee\xdc\x79\xed\x97\xf4\
-\xec\x22\x68\x10\x62\x37\x6f\xdd\x0a\xc6\xc7\xc6\x82\xc9\xf5\x13\
-\xc1\xe2\x9d\x3b\xc1\xed\xdb\x0b\x26\x84\x1f\x33\x33\xb3\x4a\xcc\
-\xdc\xd2\xf7\xb2\x76\x6d\xf5\xb9\xab\xd2\x6c\x62\xa2\x77\xcc\x53\
-\x99\x6b\xe3\x8a\xc6\x13\x3f\xb6\xb4\x2f\x12\x26\x74\xdb\x38\xd8\
-\x24\x55\xca\xf1\x58\xff\xf2\x7e\xd7\xc1\x71\xec\x2b\x87\x0f\xd1\
-\xdb\x36\x8c\xde\x1f\x86\xb5\xdb\x78\xd8\x63\xc2\xfd\xd1\x38\xa2\
-\x7e\xac\x9d\xe3\x4a\xe7\x64\x33\xbb\xb0\xe9\x1f\x58\x9b\x26\x6c\
-\x64\x90\x3e\xa1\x66\xea\x26\x6a\x04\x41\xf0\x67\x25\x35\xa1\x08\
-\x0e\x46\x05\x66\xfe\x23\xa6\x0b\x48\x33\x24\x30\x3b\x3b\x1b\x2c\
-\x29\x41\xb1\x6d\xdb\x56\x1d\x1e\x11\x84\x3b\x8d\x19\x15\x9e\xf9\
-\x9c\x10\x34\x69\xf3\x39\x41\x7f\x5f\x5f\xb0\x79\xd3\xc6\x60\x74\
-\x64\x44\x89\x8b\x01\xbd\xdc\xa8\x50\x73\xc2\x7c\x53\xcc\xae\xbd\
-\x61\x7a\x4a\xcf\x3b\xc5\x0c\xe1\x5b\xb6\x6c\x0e\xba\xbb\xb1\x67\
-\x7e\xcc\xce\x5e\xd0\xf3\x3e\x21\x68\xbc\xe6\x7d\x32\xa4\xd9\xc4\
-\x44\xef\x98\xa7\x32\xd7\xc6\x15\x8d\x27\x7e\x6c\x69\x5f\x24\x4c\
-\xe8\xb6\x71\xb0\xd9\x0e\xc2\x66\x4c\x89\xd6\xf0\x98\x28\x08\x9b\
-\xf7\xbe\xef\xf1\x4f\xe0\x34\x4b\x9a\xb0\x21\x52\x11\x36\x82\x46\
-\x44\x8d\x20\xb4\x20\xae\x08\x9a\x9a\x9a\xd4\xc2\xe6\xc8\x91\xa3\
-\x55\x9b\x9e\x6e\xcd\xcf\x07\x7d\x7d\xbd\x5a\x04\x59\x96\x4d\x93\
-\x60\x20\xec\xdc\xdc\x25\x3d\x7b\x77\x25\x41\x03\x34\x35\x51\x33\
-\x43\xd3\xd3\xb1\x63\x27\x74\xed\x09\xe2\x29\x8d\x5b\xb7\x6e\xe9\
-\x75\xbc\x76\x25\xed\x5a\xe2\xcc\xdf\xbe\xad\xef\x15\xf1\x94\x45\
-\xd0\x58\xd2\x6c\x62\xa2\x77\xcc\x53\x99\x6b\xe3\x8a\xc6\x13\x3f\
-\xb6\xb4\x2f\x12\x26\x74\xdb\x38\xd8\x6c\x75\x61\xd3\xd3\xdb\x17\
-\x8c\x8c\x8e\x27\x0a\x9b\xae\xae\xae\x57\xcb\x20\x7d\x42\x16\xc2\
-\xd2\xb5\x42\x56\xf2\x2b\x52\x10\x84\x62\xa1\x76\x66\xfb\xf6\xad\
-\x5a\x10\xd0\x54\x74\xe6\xcc\x59\xb3\x67\x39\x95\x84\x46\x12\x08\
-\x06\x04\xd3\xa5\xcb\x57\x8c\x4f\x32\x08\x1a\x6a\x74\x98\xd4\xf2\
-\xa1\x87\x1e\x08\x46\x47\xd2\x6b\x8b\x5c\x2a\x35\x95\x55\x63\x68\
-\x68\x50\x8b\x27\x6a\x6b\x6a\x21\xcd\x26\x26\x7a\xc7\x3c\x95\xb9\
-\x36\xae\x68\x3c\xf1\x63\x4b\xfb\x22\x61\x42\xb7\x8d\x83\xcd\x96\
-\x17\x36\xaa\x6c\x22\x6c\xd6\xac\x41\xa3\x44\x51\xc7\x30\xfa\xf0\
-\x9f\x98\x41\xfa\x6c\x6d\x8d\x5d\x44\xd8\x08\x11\xc2\x92\xb5\xca\
-\x48\x7f\x1a\x41\x58\x5d\x06\x07\x07\x75\xf3\xcd\xf0\xf0\x3a\xdd\
-\xb4\x93\x06\xb5\x2e\xf4\x5b\xa1\x4f\x8d\xc5\x75\xbb\x0c\xf4\xf7\
-\x07\x5b\x36\x6f\xd2\xc7\x20\x5a\xa8\x1d\xb1\xc4\x9f\x71\xfa\xd0\
-\x50\x6b\x42\x8d\x0e\x93\x5b\xda\x4e\xc2\x69\xcf\xae\x1d\xcf\x84\
-\xe3\xc0\x46\x97\x76\x2d\x71\x68\xee\xa2\x0f\x11\xe7\xa4\x5f\xcd\
-\x6d\xe7\xda\xe2\x28\xb3\x6a\x5c\xcb\x49\xb3\x89\x89\xde\x31\x4f\
-\x37\x5e\x37\x9e\xf8\xb1\xa5\x7d\x91\x30\xa1\xdb\xc6\xc1\x26\x49\
-\x50\x8e\xc7\xfa\x97\xf7\xbb\x0e\x8e\x63\x5f\x39\x7c\x88\xde\xb6\
-\x61\xf4\xfe\x30\xac\xdd\xc6\xc3\x1e\x13\xee\x8f\xc6\x11\xf5\x63\
-\xed\x1c\x57\x3a\x27\x9b\xb5\x09\x9b\xd1\xb1\x89\xd4\xd1\x87\xcd\
-\x20\x7d\xee\xe8\xc3\xd4\xd6\xd8\x75\x45\x61\x03\xb8\x85\xd6\x27\
-\x2c\x55\x82\x20\x34\x2c\x2b\xad\x09\x65\x74\xdd\x0b\x17\xe6\x74\
-\x73\x0c\xb5\x2a\x88\x90\x34\xc6\xc7\xc7\xf4\x9a\xaf\x9f\x08\xcf\
-\x97\x4f\x7a\x24\xe1\x0a\x4c\x4f\x4f\x05\x9d\x5d\x9d\xfa\x2b\xa3\
-\xb4\x2f\x9a\x68\xd2\xa2\xd6\x64\xee\xe2\xa5\x60\x66\xf6\x42\x49\
-\xac\xa4\xc1\x75\x10\xe7\xb9\xf3\x33\xba\x89\xeb\xca\x95\x2b\xfa\
-\x3e\xee\xdc\xb9\x6b\x42\xf8\x41\xd3\x1b\xf1\x50\x43\x55\xe9\xcb\
-\x29\x65\x56\x8d\x6b\x39\x69\xf6\x30\xd1\x3b\xe6\xe9\xc6\xeb\xc6\
-\x13\x3f\xb6\xb4\x2f\x12\x26\x74\xdb\x38\xd8\x6c\x75\x61\xd3\xd5\
-\x15\x8e\x65\x93\x3c\xfa\x70\x38\x48\x9f\x23\x6c\x5c\x71\x63\x17\
-\x2b\x6a\x58\xc2\x13\x87\x0b\xf1\xeb\xb5\xd0\xda\x84\x25\x6a\x05\
-\x48\xd3\x93\x20\x34\x16\xee\x33\xc9\xe7\xdc\x80\x38\xc1\xb0\x23\
-\x68\xb6\x6c\xd9\xa4\xfd\x92\x9e\x5d\x6a\x74\xb6\x6d\xdb\xa2\x0c\
-\x91\x12\x14\x34\x19\x5d\xbe\xac\xbf\x56\xaa\x24\x84\x7a\xd5\x2f\
-\xec\xcd\x9b\x36\xe9\x8e\xbd\x08\x9b\x24\x36\x6d\xda\xa8\x85\x0d\
-\x9d\x77\xa9\x35\xb1\xe2\x89\xaf\x9c\x92\xa0\xd9\x69\xfb\xb6\x6d\
-\xba\xc6\x05\x41\x36\xab\x96\xde\xde\x5e\xdd\x94\x96\x05\x8c\xe3\
-\xc6\x0d\xd3\x5a\x0c\xd9\xaf\xad\xd2\x50\x66\xd5\xb8\x96\x93\x66\
-\x0f\x13\xbd\x63\x9e\x6e\xbc\x6e\x3c\xf1\x63\x4b\xfb\x22\x61\x42\
-\xb7\x8d\x83\xcd\x76\x10\x36\x8c\x3e\xdc\xdf\xdf\xaf\xfd\x63\x20\
-\x6c\xfe\xf8\x9d\xef\xfa\xe1\xa4\x41\xfa\xa8\xad\x49\xaa\xb5\x01\
-\x2e\x80\xf8\xf5\x5a\x68\x5d\x3a\xec\x8b\xcd\x64\x76\xc7\x63\x8f\
-\x7f\x20\xf1\xe7\xcc\x9b\xde\xfc\xa6\xe0\xdb\xde\xf6\xad\x66\xab\
-\x4c\x2d\xa2\xc6\xf7\x18\xdf\xa8\x93\xaa\xb0\x3f\xff\xf9\x2f\x1a\
-\x97\x20\x34\x17\x3b\x77\x6e\xd7\xe2\xc2\x92\xf5\x19\xf3\x7f\xbe\
-\x7c\x1f\xb0\x6c\xe7\x07\x9f\xb8\x7d\x9b\x8d\x6b\x38\x7d\xea\xf9\
-\xff\xe2\xf3\x5f\x08\xbe\xfc\xa5\x2f\x99\xad\x90\x37\xbc\x25\xfa\
-\x5e\xab\x74\x5d\x69\xf1\x26\x7a\xc7\x3c\xdd\x78\xdd\x78\xe2\xc7\
-\x96\xf6\x45\xc2\x84\x6e\x1b\x07\x9b\xbc\xb0\xcb\xf1\x58\xff\xf2\
-\x7e\xd7\xc1\x71\xec\x2b\x87\x0f\xd1\xdb\x36\x8c\xde\x1f\x86\xb5\
-\xdb\x78\xd8\x63\xc2\xfd\xd1\x38\xa2\x7e\xac\x9d\xe3\x4a\xe7\x64\
-\x73\x49\x5f\xef\xd2\x92\x0d\x67\xfd\x59\x2b\x61\xab\xdc\x4b\xac\
-\xd9\xab\xc2\x58\xff\x6b\x57\xaf\x06\xf3\xf3\xf3\xda\x3f\xc6\xfd\
-\xab\x57\xaf\xfc\xbd\xff\xf0\xdb\x1f\xff\x94\x72\xdf\x51\x0b\xed\
-\x92\x28\x78\xbb\x60\xc7\x88\xd0\x2e\xe1\x89\xc3\x85\xf8\xf5\x5a\
-\x68\x3d\xac\x8a\x5d\x35\x7c\xcb\x92\x6f\x91\x53\x45\xdf\xb8\x04\
-\xa1\xf5\x68\xc6\x77\x6f\xb3\xdb\x8b\x8e\xf0\x47\x7d\x22\x69\x3f\
-\xf4\x13\xbd\x63\x9e\x6e\xbc\x6e\x3c\xf1\x63\x4b\xfb\x22\x61\x42\
-\xb7\x8d\x83\x4d\x52\xb9\x1c\x8f\xf5\x2f\xef\x77\x1d\x1c\xc7\xbe\
-\x72\xf8\x10\xbd\x6d\xc3\xe8\xfd\x61\x58\xbb\x8d\x87\x3d\x26\xdc\
-\x1f\x8d\x23\xea\xc7\xda\x39\xae\x74\x4e\x36\xb3\xd7\xd8\xe0\xbf\
-\x6e\x78\x38\x22\xf0\x1d\xf4\xe8\xc3\x3f\xfe\xee\x9f\xf8\x69\xe5\
-\x96\xa6\x28\xa1\x44\x58\x8a\x04\x41\x10\x5a\x84\x3c\x44\x95\x32\
-\xa9\xc6\xb5\x9c\x34\x7b\x98\xe8\x1d\xf3\x74\xe3\x75\xe3\x89\x1f\
-\x5b\xda\x17\x09\x13\xba\x6d\x1c\x6c\xb6\x83\xb0\x59\xab\x44\x4d\
-\xda\xe8\xc3\xbd\xbd\x7d\x3f\xea\x0c\xd2\x97\x24\x6e\xe4\xcb\xa8\
-\x36\x23\x2c\x41\x35\x22\x35\x78\x82\xd0\x58\xf8\xd7\x84\x7a\x3e\
-\xbb\x6d\xfc\x8c\x2b\x93\x6a\x5c\xcb\x49\xb3\x87\x89\xde\x31\x4f\
-\x37\x5e\x37\x9e\xf8\xb1\xa5\x7d\x91\x30\xa1\xdb\xc6\xc1\x26\x39\
-\x54\x8e\xc7\xfa\x97\xf7\xbb\x0e\x8e\x63\x5f\x39\x7c\x88\xde\xb6\
-\x61\xf4\xfe\x30\xac\xdd\xc6\xc3\x1e\x13\xee\x8f\xc6\x11\xf5\x63\
-\xed\x1c\x57\x3a\x27\x9b\xb5\x09\x9b\xbe\xfe\x7e\x2d\x6c\xc2\xe3\
-\xa2\xc8\xe8\xc3\x82\xcb\x8a\x44\x4d\xbd\x91\xa6\x27\x41\x68\x2c\
-\xbc\x45\x95\xe7\xb3\x5b\x6f\x4d\xa5\x4c\xaa\x71\x2d\x27\xcd\x1e\
-\x26\x7a\xc7\x3c\xdd\x78\xdd\x78\xe2\xc7\x96\xf6\x45\xc2\x84\x6e\
-\x1b\x07\x9b\x24\x53\x39\x1e\xeb\x5f\xde\xef\x3a\x38\x8e\x7d\xe5\
-\xf0\x21\x7a\xdb\x86\xd1\xfb\xc3\xb0\x76\x1b\x0f\x7b\x4c\xb8\x3f\
-\x1a\x47\xd4\x8f\xb5\x73\x5c\xe9\x9c\x6c\xd6\x2e\x6c\xf8\x32\x2a\
-\x4d\xd8\xc4\x06\xe9\x4b\x13\x36\x44\x2c\xc2\xa6\x85\x59\x55\x51\
-\xe3\xff\x2b\xd2\x38\x04\xa1\x8d\x91\x9a\xd0\xc6\x40\x99\x54\xe3\
-\x5a\x4e\x9a\x3d\x4c\xf4\x8e\x79\xba\xf1\xba\xf1\xc4\x8f\x2d\xed\
-\x8b\x84\x09\xdd\x36\x0e\x36\xdb\x41\xd8\xf0\x35\x5b\x9a\xb0\x51\
-\xfb\x19\xa4\x4f\x46\x1f\x6e\x73\xc2\x52\x23\x08\x82\x10\xa7\x09\
-\x45\x55\x51\x42\x50\x99\x54\xe3\x5a\x4e\x9a\x3d\x4c\xf4\x8e\x79\
-\xba\xf1\xba\xf1\xc4\x8f\x2d\xed\x8b\x84\x09\xdd\x36\x0e\x36\xdb\
-\x45\xd8\x8c\x8e\x31\xfa\x30\x5a\x25\x0a\xc2\xe6\xb1\xc7\xdf\xff\
-\x44\x6c\x90\x3e\xb7\xd6\xa6\xa2\xb0\x01\xdc\x42\xf3\x12\x96\x98\
-\x1a\x90\x5f\x91\x82\xd0\x58\xf8\xd7\x84\xca\xb3\x5b\x0b\xca\xa4\
-\x1a\xd7\x72\xd2\x6c\x61\xa2\x77\xcc\xd3\x8d\xd7\x8d\x27\x7e\x6c\
-\x69\x5f\x24\x4c\xe8\xb6\x71\xb0\xd9\x0e\xc2\x06\x41\x33\x3a\x36\
-\x96\x28\x6c\x54\xc8\x21\x33\x48\xdf\x36\xb5\x61\x6b\x6c\x08\x68\
-\x97\x34\x61\xc3\xc2\x39\xf4\x5a\x68\x4e\xc2\xd2\xb2\x0a\xf8\xbf\
-\x70\x8d\xa3\x0a\xd2\x9f\x46\x10\xfc\x78\xe1\x85\xbd\xc1\xf1\xe3\
-\x27\xcc\x56\x3a\x2f\xbe\xb8\x2f\x32\x7a\xf0\x8b\x7b\xf7\x07\x27\
-\x4e\x9e\x32\x5b\xd5\xb1\xcf\x38\x93\x56\x56\x3a\x2e\xe9\xd9\x3d\
-\x79\xf2\x74\xb0\x6f\xdf\x41\xb3\x15\xc2\x36\xa3\x08\xa7\xc1\xbe\
-\xfd\xfb\xa3\xc7\x14\x8d\x32\xa9\xc6\xb5\x9c\x34\x5b\x98\xe8\x1d\
-\xf3\x74\xe3\x75\xe3\x89\x1f\x5b\xda\x17\x09\x13\xba\x6d\x1c\x6c\
-\x92\xc2\xe5\x78\xac\x7f\x79\xbf\xeb\xe0\x38\xf6\x95\xc3\x87\xe8\
-\x6d\x1b\x46\xef\x0f\xc3\xda\x6d\x3c\xec\x31\xe1\xfe\x68\x1c\x51\
-\x3f\xd6\xce\x71\xa5\x73\xb2\x59\x9b\xb0\x61\x80\x48\x84\x0d\x83\
-\x32\x26\xa0\x47\x1f\x7e\xc7\x3b\xbe\xff\x35\xca\x1d\x6f\x8a\x4a\
-\x13\x37\xc0\x45\x70\x0e\xbd\x16\x9a\x0f\x9b\x91\x82\x20\x34\x10\
-\x52\x9b\x92\x9d\xd5\x4a\x33\x65\x52\x8d\x6b\x39\x69\xb6\x30\xd1\
-\x3b\xe6\xe9\xc6\xeb\xc6\x13\x3f\xb6\xb4\x2f\x12\x26\x74\xdb\x38\
-\xd8\x6c\x17\x61\x33\x3c\x32\x92\x3a\xfa\xf0\xe4\xd4\xf4\xef\xfc\
-\xe0\x3b\x7f\x28\x69\xf4\x61\x2b\x6a\xec\x62\x85\x4d\x78\x01\xfc\
-\xe3\x24\x42\xd3\x51\x93\xa8\x91\x17\xae\x20\x34\x16\xfe\x35\xa1\
-\x9e\xcf\xae\x3c\xe3\x15\x51\x26\xd5\xb8\x96\x93\x66\x0b\x13\xbd\
-\x63\x9e\x6e\xbc\x6e\x3c\xf1\x63\x4b\xfb\x22\x61\x42\xb7\x8d\x83\
-\x4d\x72\xb1\x1c\x8f\xf5\x2f\xef\x77\x1d\x1c\xc7\xbe\x72\xf8\x10\
-\xbd\x6d\xc3\xe8\xfd\x61\x58\xbb\x8d\x87\x3d\x26\xdc\x1f\x8d\x23\
-\xea\xc7\xda\x39\xae\x74\x4e\x36\x6b\x13\x36\xac\x87\xd6\xad\x4b\
-\x13\x36\x7a\x90\x3e\x47\xd8\x24\xd5\xd8\x58\x41\xc3\x12\x9e\x3c\
-\x5c\x88\x5b\xaf\x85\xe6\x21\x2c\x21\x82\x20\x08\x0d\xc4\xaa\x6a\
-\xaa\x1a\xed\x96\x32\xa9\xc6\xb5\x9c\x34\x5b\x98\xe8\x1d\xf3\x74\
-\xe3\x75\xe3\x89\x1f\x5b\xda\x17\x09\x13\xba\x6d\x1c\x6c\xb6\x93\
-\xb0\x59\xa7\x96\x04\x10\x36\x1f\x7e\xf7\x7b\xde\xfb\x21\xe5\xb6\
-\xc2\x26\x2e\x6e\xd2\xfa\xd9\x10\xb7\x5e\x0b\xcd\x41\x58\x3a\x0a\
-\xc6\xff\x57\xa4\x71\x54\x41\xfa\xd3\x08\xad\xcc\x6a\xd4\x84\xce\
-\xcf\xdf\xd6\xfd\x67\xe8\x47\xb3\x6f\xff\x01\x3d\xe1\x65\x35\xe8\
-\x27\x43\x3f\x9b\xeb\x37\x6e\x1a\x1f\x15\xcf\x6d\x15\x8f\xf1\xdf\
-\x7f\xf0\x90\x9e\x85\xbb\x12\x3c\xbb\x4c\x62\x79\xfa\xf4\xd9\xe0\
-\xc0\xc1\xc3\x7a\x39\x7f\x6e\xa6\xe2\x0c\xda\x16\xdb\x87\xe6\xe6\
-\xcd\xf2\xf9\x5d\x2e\x5d\xba\x14\x1c\x38\x70\x48\xaf\x33\x53\xa3\
-\xdd\x52\x26\xd5\xb8\x96\x93\x66\x0b\x13\xbd\x63\x9e\x6e\xbc\x6e\
-\x3c\xf1\x63\x4b\xfb\x22\x61\x42\xb7\x8d\x83\x4d\x4a\x54\x39\x1e\
-\xeb\x5f\xde\xef\x3a\x38\x8e\x7d\xe5\xf0\x21\x7a\xdb\x86\xd1\xfb\
-\xc3\xb0\x76\x1b\x0f\x7b\x4c\xb8\x3f\x1a\x47\xd4\x8f\xb5\x73\x5c\
-\xe9\x9c\x6c\xd6\x2e\x6c\x18\xcb\x26\x45\xd8\xc8\x20\x7d\x6d\xc2\
-\xaa\x88\x1a\x41\x10\x1a\x07\x04\xcd\xf1\x13\x27\x82\xc5\xc5\xc5\
-\x60\xc3\x86\xe9\x60\xfd\xc4\x84\x9e\x8d\xbb\x12\xcc\xf0\x7d\x43\
-\x89\x99\xcd\x9b\x37\x06\x43\x66\xc6\x6e\x04\xcd\x71\x25\x8c\xc2\
-\x78\xa6\x82\x89\xf1\xf1\xe0\xca\x95\x2b\x7a\x5f\x1a\x08\x1a\x3a\
-\x2d\xdf\xbc\x75\x2b\x18\x1f\x1b\x0b\x26\xd7\x4f\x04\x8b\x77\xee\
-\x04\xb7\x6f\x2f\x98\x10\xc9\x9c\x3f\x3f\xa3\xc4\xcc\xad\x60\xe3\
-\xc6\x0d\xc1\xda\xb5\xcb\x67\x0c\xbf\x7c\xf9\x4a\x70\xe1\xc2\xc5\
-\x60\x6c\x6c\x54\x2d\xe1\x0c\xe0\x99\xa9\xd1\x6e\x29\x93\x6a\x5c\
-\xcb\x49\xb3\x85\x89\xde\x31\x4f\x37\x5e\x37\x9e\xf8\xb1\xa5\x7d\
-\x91\x30\xa1\xdb\xc6\xc1\x66\x3b\x09\x9b\xd1\x0a\x83\xf4\xbd\xf7\
-\x7d\x8f\x7f\x02\xa7\x59\xd2\x84\x0d\x91\x8b\xb0\x69\x42\x32\x8b\
-\x1a\xe9\x4f\x23\x08\x8d\x45\xd6\xfe\x34\xb3\xb3\xb3\xc1\x92\x12\
-\x17\xdb\xb6\x6d\xd5\x22\x60\x62\x62\x5c\xbb\x4b\xc4\xe2\x9b\x51\
-\xe1\x2f\x5f\xb9\xaa\x05\xcd\xb0\xf3\x2b\x78\x76\xf6\x82\x8e\x67\
-\xeb\xd6\x2d\xc1\xe8\xc8\x88\x12\x35\x63\xc1\x96\x2d\x9b\xcd\xde\
-\x64\x10\x1f\x8b\x8b\x77\x82\x0d\xd3\x4a\x04\x4d\x8c\x29\xe3\x33\
-\xa2\x8e\xdf\xac\x8c\x0d\x76\x25\x19\xce\x73\x45\x9d\x1f\x41\xb3\
-\x6e\xdd\x90\xf1\x2d\x43\xcd\xcd\xcc\xcc\xac\xbe\x97\xf5\x4a\x24\
-\xad\x88\x1a\xed\x96\x32\xa9\xc6\xb5\x9c\x34\x5b\x98\xe8\x1d\xf3\
-\x74\xe3\x75\xe3\x89\x1f\x5b\xda\x17\x09\x13\xba\x6d\x1c\x6c\x92\
-\xb3\xe5\x78\xac\x7f\x79\xbf\xeb\xe0\x38\xf6\x95\xc3\x87\xe8\x6d\
-\x1b\x46\xef\x0f\xc3\xda\x6d\x3c\xec\x31\xe1\xfe\x68\x1c\x51\x3f\
-\xd6\xce\x71\xa5\x73\xb2\x59\xbb\xb0\xe9\x56\xe5\x29\x6d\x90\xbe\
-\xae\xae\xae\x57\xcb\x20\x7d\xad\x4b\x58\x22\x04\x41\x68\x1b\x6e\
-\xcd\xcf\x07\x7d\x7d\xbd\x4a\x48\xf0\x2e\x0f\x71\xdd\x2e\x84\x9d\
-\x9b\xbb\x14\x0c\x0e\xae\x8d\x08\x1a\x28\xc5\xd3\x5d\x16\x24\xbd\
-\x29\xf1\x00\x4d\x4f\xb7\x6e\xdd\xd2\xee\x78\x6d\x0b\x03\xaa\x59\
-\x5c\x4d\x45\x6d\xd0\xa5\x4b\x97\x55\xf8\x81\x44\x41\x03\x67\xce\
-\x9e\x0b\x3a\xbb\x3a\xb5\xa8\xc9\x85\x1a\xed\x96\x32\xa9\xc6\xb5\
-\x9c\x34\x5b\x98\xe8\x1d\xf3\x74\xe3\x75\xe3\x89\x1f\x5b\xda\x17\
-\x09\x13\xba\x6d\x1c\x6c\xb6\x8b\xb0\x61\x0c\x1b\x84\x4d\x97\x2a\
-\x1b\x71\x54\x18\x46\x1f\xfe\x13\x33\x48\x1f\x85\xcf\x5d\x44\xd8\
-\x34\x31\xcb\x73\x3b\x67\xa4\x3f\x8d\x20\x34\x16\xd4\xae\x64\x01\
-\x31\x41\xd3\xd3\xa5\xcb\xd1\xa6\xa5\xac\xf1\xb8\x24\x19\x9a\x34\
-\x86\x86\x06\x75\xd3\x53\x5a\xd3\xd6\xba\xa1\x21\x7d\x2d\xd4\xd6\
-\x54\x23\x65\x4c\x93\xe5\xd4\x68\xb7\x94\x49\x35\xae\xe5\xa4\xd9\
-\xc2\x44\xef\x98\xa7\x1b\xaf\x1b\x4f\xfc\xd8\xd2\xbe\x48\x98\xd0\
-\x6d\xe3\x60\xb3\x9d\x84\x4d\xa5\xd1\x87\xcd\x20\x7d\xee\xe8\xc3\
-\x04\xb4\xeb\x8a\xc2\x06\x70\x0b\x8d\x45\x58\x12\x04\x41\x68\x1b\
-\xa8\x75\xa1\x0f\x0b\x7d\x61\x2c\xae\xdb\x65\xa0\xbf\x3f\xd8\xb2\
-\x79\x93\x3e\xe6\xdc\xb9\xf3\xba\xe6\xc4\x62\xe3\x59\x70\x8e\x75\
-\xdd\x49\xf4\xf5\xf5\xe9\xf5\xb5\x6b\xd7\xf5\xda\x72\xe7\xce\x1d\
-\xe3\x8a\xd2\xaf\xc2\x6f\xda\xb4\x51\xd7\xd4\x9c\x3f\x3f\x1b\xcc\
-\xcf\xcf\x9b\x3d\x65\xa6\xa6\x26\x75\x2d\xcd\xf5\xeb\x37\x2a\x76\
-\x12\xe6\x07\x16\x61\xe3\xdc\xb8\x76\xcd\xb8\x62\xd4\x68\xb3\x94\
-\x49\x35\xae\xe5\xa4\xd9\xc1\x44\xef\x98\xa7\x1b\xaf\x1b\x4f\xfc\
-\xd8\xd2\xbe\x48\x98\xd0\x6d\xe3\x60\xb3\x5d\x84\x0d\x63\xd9\x8c\
-\x8c\x8e\xa6\x8c\x3e\x1c\x0e\xd2\xe7\x08\x1b\x57\xdc\xd8\xc5\x8a\
-\x1a\x96\xf0\x02\xc2\x85\xf8\xf5\x5a\x68\x1c\xc2\x52\xe0\x89\xf4\
-\xa7\x11\x84\xc6\xa2\x96\x67\x72\x7c\x3c\xec\x48\xcb\xd7\x4f\x34\
-\xed\xf0\xe5\x93\x3b\x92\x70\x12\xd3\xd3\x53\xba\x89\xe7\xf4\xe9\
-\x33\xc1\xbd\xa5\xb0\x86\xc6\x76\xc8\xe5\xab\xa4\xcb\x57\xae\xe8\
-\x2f\x9f\x2a\x8d\x00\x0c\x9c\x9b\x78\xce\x9d\x9f\xd1\xcd\x5a\xf4\
-\xb1\x61\x34\x61\xfa\xd9\x54\x62\x6a\x2a\x3c\x3f\x1d\x96\x93\xbe\
-\x94\xa2\x2f\x0d\xc2\x87\xce\xc2\x69\x5f\x47\xa5\x71\xe7\x6e\x85\
-\x73\xd7\x68\xb3\x94\x49\x35\xae\xe5\xa4\xd9\xc1\x44\xef\x98\xa7\
-\x1b\xaf\x1b\x4f\xfc\xd8\xd2\xbe\x48\x98\xd0\x6d\xe3\x60\xb3\x9d\
-\x84\xcd\xd8\xf8\x78\x49\x54\xc7\x40\xd8\xfc\xf1\x3b\xdf\xf5\xc3\
-\x49\x83\xf4\x51\x5b\x93\x54\x6b\x03\x5c\x08\xf1\xeb\xb5\xd0\x18\
-\xd8\xcc\xa9\x2b\xd2\xf4\x24\x08\xab\xc7\xe0\xe0\x60\xb0\x6d\xdb\
-\x16\xfd\xa2\xa7\xf6\x85\x2f\x9f\xa8\xc1\xa0\xe6\x25\x0d\xfa\xca\
-\x6c\xde\xb4\x49\x8b\x0f\x84\x0d\xf0\x15\x14\x9d\x84\xc3\x78\x66\
-\x74\xf3\x90\x15\x17\x71\xec\xb3\x4b\xb3\xd3\xf6\x6d\xdb\x74\x0d\
-\xcc\x85\x0b\x73\xc1\xac\x5a\x30\x34\xb6\x83\x6f\xda\xbb\x80\x8e\
-\xc4\x9b\x36\x6e\x08\xee\xdc\xb9\xab\x85\x4d\x12\xdc\x83\x16\x3e\
-\xea\x9e\xd2\x3e\x11\x9f\x9a\x4c\xa8\xa9\xb9\x1e\xad\x35\x5a\x46\
-\x8d\x36\x4b\x99\x54\xe3\x5a\x4e\x9a\x1d\x4c\xf4\x8e\x79\xba\xf1\
-\xba\xf1\xc4\x8f\x2d\xed\x8b\x84\x09\xdd\x36\x0e\x36\x49\xf2\x72\
-\x3c\xd6\xbf\xbc\xdf\x75\x70\x1c\xfb\xca\xe1\x43\xf4\xb6\x0d\xa3\
-\xf7\x87\x61\xed\x36\x1e\xf6\x98\x70\x7f\x34\x8e\xa8\x1f\x6b\xe7\
-\xb8\xd2\x39\xd9\xac\x5d\xd8\xc0\xba\xe1\xe1\x34\x61\xd3\xb5\x6e\
-\xdd\xf0\x87\x63\x83\xf4\x21\x66\xdc\xa6\x28\xbb\x58\x61\x13\x5e\
-\x04\xff\xec\x09\x84\xba\xd3\x61\x7f\xe9\x99\x4c\xe9\x78\xec\xf1\
-\x0f\x24\xbe\x0d\xde\xf4\xe6\x37\x05\x6f\x7f\xeb\xb7\x98\x2d\x3f\
-\xea\xd9\x9f\xe6\xf3\x9f\xff\xa2\x71\x09\x42\x73\xb1\x63\xc7\x36\
-\x2d\x3c\x7c\xf0\x7f\xc6\x7c\x1f\x32\xff\x67\x0c\xbc\xcf\xef\xf9\
-\xec\x66\x3c\xbd\xc6\xe7\x1a\xdc\x30\xbf\xf4\x4b\xbf\x6c\x5c\x21\
-\x5b\xb6\x6d\x0f\x1e\x78\xf8\x25\x66\xab\x02\xb5\x5c\x9c\xa2\xd2\
-\xbd\xa7\x5d\x7b\xa2\x77\xcc\xd3\x8d\xd7\x8d\x27\x7e\x6c\x69\x5f\
-\x24\x4c\xe8\xb6\x71\xb0\x89\x01\x28\xc7\x63\xfd\xcb\xfb\x5d\x07\
-\xc7\xb1\xaf\x1c\x3e\x44\x6f\xdb\x30\x7a\x7f\x18\xd6\x6e\xe3\x61\
-\x8f\x09\xf7\x47\xe3\x88\xfa\xb1\x76\x8e\x2b\x9d\x93\xcd\x25\x7d\
-\xbd\x4b\x4b\x36\x9c\xf5\x67\xbd\x84\x57\xb0\xc4\x9a\xbd\x2a\x8c\
-\xf5\xd7\x71\x29\x6e\xde\xb8\xae\xfb\x69\x25\x70\x7f\x61\xe1\xf6\
-\xbf\xff\xf5\x8f\xfd\xda\x2f\x2a\x37\x6d\xa9\x54\xe3\xb1\xdc\x55\
-\x0b\xb6\x91\x35\x11\xdb\x25\xbc\x80\x70\x21\xfe\xf0\x04\x42\xdd\
-\x68\x88\x9a\x1a\x41\x10\x8a\xc3\xfb\x3d\xdb\x84\xef\xe3\x5a\x6c\
-\xc8\xe6\xcd\xd1\xcf\xce\x6f\x5c\x4f\xe9\x53\x13\xa7\xc6\x1f\xe3\
-\x1d\xe1\x8f\xf9\x44\xd2\x7e\xe0\x27\x7a\xc7\x3c\xdd\x78\xdd\x78\
-\xe2\xc7\x96\xf6\x45\xc2\x84\x6e\x1b\x07\x9b\xa4\x64\x39\x1e\xeb\
-\x5f\xde\xef\x3a\x38\x8e\x7d\xe5\xf0\x21\x7a\xdb\x86\xd1\xfb\xc3\
-\xb0\x76\x1b\x0f\x7b\x4c\xb8\x3f\x1a\x47\xd4\x8f\xb5\x73\x5c\xe9\
-\x9c\x6c\xae\xac\xc6\x66\xed\xe0\x90\x1e\x81\x38\x81\x8e\xde\xde\
-\xbe\x1f\x75\x06\xe9\xb3\x8b\xdb\xcf\x26\xde\x14\x15\x5e\x04\xff\
-\xec\x09\x84\xba\x11\xe6\xba\x07\xa2\x3f\x05\xa1\xb1\x90\x1f\x85\
-\xb5\xb1\x3e\xd6\x04\x75\x39\xcb\x08\xc4\x35\xda\x2c\x65\x52\x8d\
-\x6b\x39\x69\x76\x30\xd1\x3b\xe6\xe9\xc6\xeb\xc6\x13\x3f\xb6\xb4\
-\x2f\x12\x26\x74\xdb\x38\xd8\x6c\x27\x61\xc3\x5c\x51\x08\x9b\xf0\
-\xf8\x28\x32\xfa\x70\xf3\xe2\x2d\x6a\xb2\xe2\xfb\xc2\xf5\x7d\x2f\
-\xdf\xd7\xc5\x57\x10\x84\x46\xc1\xfb\x19\xf7\x7c\x76\x57\x4b\xa3\
-\x4d\x26\xf4\xab\xb9\x7c\xa9\xfa\x34\x11\x25\x6a\xb4\x59\xca\xa4\
-\x1a\xd7\x72\xd2\xec\x60\xa2\x77\xcc\xd3\x8d\xd7\x8d\x27\x7e\x6c\
-\x69\x5f\x24\x4c\xe8\xb6\x71\xb0\x49\x36\x94\xe3\xb1\xfe\xe5\xfd\
-\xae\x83\xe3\xd8\x57\x0e\x1f\xa2\xb7\x6d\x18\xbd\x3f\x0c\x6b\xb7\
-\xf1\xb0\xc7\x84\xfb\xa3\x71\x44\xfd\x58\x3b\xc7\x95\xce\xc9\xe6\
-\xca\x85\xcd\xf0\xf0\x68\xaa\xb0\x89\x0d\xd2\x97\x26\x6c\x38\x81\
-\x08\x9b\x06\xa1\x30\x51\x23\x08\x82\x50\x24\xfe\x3f\x9c\xa2\xe1\
-\xb6\x6d\xdd\x62\x5c\x65\xe6\x66\xab\x8f\x71\x13\xa1\x46\x9b\xa5\
-\x4c\xaa\x71\x2d\x27\xcd\x0e\x26\x7a\xc7\x3c\xdd\x78\xdd\x78\xe2\
-\xc7\x96\xf6\x45\xc2\x84\x6e\x1b\x07\x9b\xed\x24\x6c\x18\x7d\x38\
-\x4d\xd8\xa8\x70\x0c\xd2\x27\xa3\x0f\x37\x11\x61\x4e\x0b\x82\xd0\
-\x54\xd4\x6a\xd0\x53\x59\xad\x6a\x92\x06\x60\x78\x78\x5d\xb0\x7e\
-\xfd\x7a\xb3\x15\x32\x37\x3b\x63\x5c\x19\xa8\xd1\x66\x29\x93\x6a\
-\x5c\xcb\x49\xb3\x83\x89\xde\x31\x4f\x37\x5e\x37\x9e\xf8\xb1\xa5\
-\x7d\x91\x30\xa1\xdb\xc6\xc1\x66\xbb\x09\x1b\x46\x1f\x4e\x1b\xa4\
-\xef\xb1\xc7\xdf\xff\x44\x6c\x90\x3e\xb7\xd6\xa6\xa2\xb0\x01\xdc\
-\xc2\xea\x10\xe6\xb2\x20\x08\x42\x1d\x59\x6d\x4d\xb5\x79\x4b\xb4\
-\xb6\x86\x41\xfd\x52\x07\xe1\xab\x44\x8d\xf6\x4a\x99\x54\xe3\x5a\
-\x4e\x9a\x0d\x4c\xf4\x8e\x79\xba\xf1\xba\xf1\xc4\x8f\x2d\xed\x8b\
-\x84\x09\xdd\x36\x0e\x36\xdb\x49\xd8\x20\x68\x86\x47\x46\x52\x06\
-\xe9\xeb\x18\x32\x83\xf4\x6d\x53\x1b\xb6\xc6\x86\x80\x76\x49\x13\
-\x36\x3a\x72\x75\x8e\xf0\x24\x42\xe1\x84\x39\x9c\x33\xfe\xbf\x22\
-\x8d\xa3\x0a\xd2\x9f\x46\x10\x1a\x0b\xef\x67\xbc\x41\x9f\xdd\x47\
-\x5f\xf6\x52\xe3\x2a\x73\xea\xe4\x71\xe3\xca\x48\x8d\xf6\x4a\x99\
-\x54\xe3\x5a\x4e\x9a\x0d\x4c\xf4\x8e\x79\xba\xf1\xba\xf1\xc4\x8f\
-\x2d\xed\x8b\x84\x09\xdd\x36\x0e\x36\xc9\xc1\x72\x3c\xd6\xbf\xbc\
-\xdf\x75\x70\x1c\xfb\xca\xe1\x43\xf4\xb6\x0d\xa3\xf7\x87\x61\xed\
-\x36\x1e\xf6\x98\x70\x7f\x34\x8e\xa8\x1f\x6b\xe7\xb8\xd2\x39\xd9\
-\x5c\x99\xb0\xe9\xea\xea\xd2\xc2\xa6\xb7\x17\xcd\xb2\x0c\x3d\xfa\
-\xf0\x3b\xde\xf1\xfd\xaf\x51\x6e\x2b\x6c\xdc\x3e\x36\x49\xe2\x06\
-\x74\xe4\xea\x1c\xe1\x49\x84\x42\xb1\x89\xde\x52\x78\x57\xb9\x0b\
-\x82\xa0\x47\x13\x7e\x71\xef\x7e\xb3\x15\xc2\xf6\x89\x93\xa7\xcc\
-\x56\x36\xf6\xee\x3b\x50\xd3\xb1\xfb\xf7\x1f\xac\x38\x22\xb1\xbb\
-\x3f\x4b\xf3\xdb\xc1\x83\x87\x4b\x03\x06\x02\xdb\x4c\xcb\xb0\xbc\
-\x09\x6a\x36\xb8\x5b\x69\x74\xe1\x4a\xd4\x68\xaf\x94\x49\x35\xae\
-\xe5\xa4\xd9\xc0\x44\xef\x98\xa7\x1b\xaf\x1b\x4f\xfc\xd8\xd2\xbe\
-\x48\x98\xd0\x6d\xe3\x60\xb3\xdd\x84\xcd\xd0\xba\xd4\x41\xfa\x7a\
-\x27\xa7\xa6\x7f\xc7\x19\xa4\x2f\xa9\x29\xca\x2e\x56\xd8\x84\x17\
-\xc2\x3f\x7b\x12\xa1\x30\x5a\x52\xd4\x08\x42\x2b\x93\xc5\xa0\x0b\
-\xe9\x3c\xf2\xd2\x68\x6d\x0d\x42\xe7\xdc\x99\xb2\xf8\xc9\x4c\x8d\
-\xf6\x4a\x99\x54\xe3\x5a\x4e\x9a\x0d\x4c\xf4\x8e\x79\xba\xf1\xba\
-\xf1\xc4\x8f\x2d\xed\x8b\x84\x09\xdd\x36\x0e\x36\xdb\x49\xd8\x30\
-\x4a\xf6\xe0\xd0\x50\x9a\xb0\xe9\x18\x1e\x1e\xf9\xa5\xd8\xe8\xc3\
-\xf1\x1a\x1b\x2b\x68\x58\xc2\x8b\x08\x17\xce\x11\x9e\x44\x28\x84\
-\x30\x57\x1b\x18\x69\x7a\x12\x84\xc6\xc2\x5b\x54\x79\x3e\xbb\xf5\
-\xd2\x5e\x2f\x7f\xf4\x65\xcb\x66\xed\x3e\x7d\xa2\xc6\x26\x28\x4b\
-\x8d\xf6\x4a\x99\x54\xe3\x5a\x4e\x9a\x0d\x4c\xf4\x8e\x79\xba\xf1\
-\xba\xf1\xc4\x8f\x2d\xed\x8b\x84\x09\xdd\x36\x0e\x36\xc9\xaa\x72\
-\x3c\xd6\xbf\xbc\xdf\x75\x70\x1c\xfb\xca\xe1\x43\xf4\xb6\x0d\xa3\
-\xf7\x87\x61\xed\x36\x1e\xf6\x98\x70\x7f\x34\x8e\xa8\x1f\x6b\xe7\
-\xb8\xd2\x39\xd9\xcc\x47\xd8\xb0\x24\x80\xb0\xf9\xf0\xbb\xdf\xf3\
-\xde\x0f\x29\xb7\x15\x36\x71\x71\x93\xd6\xcf\x86\x73\x84\x27\x11\
-\x72\x27\xcc\xd1\x1c\xf1\xff\x15\x69\x1c\x82\x20\x08\x75\xa0\xaf\
-\xaf\x77\x59\x6d\x0d\x1d\x86\x8f\x1d\x39\x64\xb6\x6a\xa4\x46\x7b\
-\xa5\x4c\xaa\x71\x2d\x27\xcd\x06\x26\x7a\xc7\x3c\xdd\x78\xdd\x78\
-\xe2\xc7\x96\xf6\x45\xc2\x84\x6e\x1b\x07\x9b\xed\x26\x6c\xa8\xad\
-\x49\x11\x36\x32\x48\x5f\x03\x92\xbb\xa8\xa9\x37\x52\xe5\x2e\x08\
-\x51\x66\x66\x66\x82\x43\x87\x0e\x07\x2f\xbe\xb8\x2f\xd8\xb7\xff\
-\x80\x9e\x10\x72\x69\xc9\x4c\xf1\xe6\xf9\xbc\xd0\x47\x86\x7e\x36\
-\xd7\x6f\x84\x33\x60\x33\x53\x37\x7e\xf4\x9f\xd9\x7f\xf0\x90\x9e\
-\xa5\x3b\x0d\x66\xe1\xde\xb7\xef\x60\x64\xae\x9d\xf9\xf9\xdb\x25\
-\xff\x83\xea\xda\x2e\x5e\xf4\x1f\xd5\xd7\x3e\xe3\xf4\x93\x39\x70\
-\xe0\x50\x64\x56\xee\xdb\xb7\x6f\x97\xfc\x0f\x1d\x3e\xa2\x27\xeb\
-\xac\xc4\xd7\xbd\xfa\x55\xc6\x55\xe6\xf4\x89\x13\xb5\xf7\xad\xb1\
-\xd4\x68\xaf\x94\x49\x35\xae\xe5\xa4\xd9\xc0\x44\xef\x98\xa7\x1b\
-\xaf\x1b\x4f\xfc\xd8\xd2\xbe\x48\x98\xd0\x6d\xe3\x60\xb3\x1d\x85\
-\xcd\xf0\xf0\x70\xc9\xcf\x05\x61\xf3\xde\xf7\x3d\xfe\x09\x9c\x66\
-\x49\x13\x36\x9c\x44\x84\x4d\xc1\xb4\x9c\xa8\x11\x84\x56\xc6\xbf\
-\x26\xb4\x1c\x8e\x99\xb5\x47\x47\x47\x83\x0d\x1b\xa6\x83\xb1\xd1\
-\x11\x65\xe8\xaf\x04\xe7\xcf\xfb\x0f\x36\x87\x08\xba\xa1\xc4\xcc\
-\xe6\xcd\x1b\xf5\xcc\xdc\x80\x70\xa0\x0f\xca\x86\x0d\x53\xc1\xc4\
-\xf8\xb8\x7e\xf1\x27\x71\xfe\xdc\x8c\x16\x33\x9b\x36\x6d\x28\xcd\
-\xde\xad\x05\xcd\xa9\xd3\xfa\xf8\xe9\xe9\xc9\x60\x7c\x6c\x4c\xcf\
-\xf0\x9d\x85\x99\x99\x59\x1d\x2f\xf7\xb4\x76\x6d\x78\x4d\x08\x9a\
-\x53\xea\xba\x16\x17\x17\xf5\x8c\xdd\xe3\x63\xa3\x2a\xde\xab\x7a\
-\x5f\x1a\x1c\xb3\x63\xe7\x4e\xb3\x15\xc2\x75\x1d\xda\xbf\xcf\x6c\
-\xad\x80\x1a\xed\x95\x32\xa9\xc6\xb5\x9c\x34\x1b\x98\xe8\x1d\xf3\
-\x74\xe3\x75\xe3\x89\x1f\x5b\xda\x17\x09\x13\xba\x6d\x1c\x6c\xb6\
-\x9b\xb0\xe9\xee\xe9\xd1\x5f\x46\x59\x3f\x97\xae\xae\xae\x57\xcb\
-\x20\x7d\x8d\x41\x98\x8b\xab\x8c\x6f\x65\x8a\xf4\xa7\x11\x84\x95\
-\xb3\x65\xcb\xe6\x60\x62\x62\x3c\x18\x19\x59\x17\xac\x5b\x37\x1c\
-\x0c\x2a\x61\x72\xd5\x73\x4c\x96\x99\xd9\xd9\xe0\xb2\x12\x06\x08\
-\x9a\xe1\x75\xeb\x4a\x62\x09\x41\xd1\xdd\xdd\x1d\x8c\xaa\x97\xfc\
-\xc4\xf8\x98\xde\x17\x67\x76\x76\x4e\x1f\x8b\xa0\x59\xb7\xae\x5c\
-\x7d\x7f\xe1\xc2\x5c\xb0\x74\x6f\x49\x4f\x2c\x39\xa2\x8e\x1f\x57\
-\xc7\x6f\x89\x8d\x1b\x53\x09\x8e\x47\xac\x20\x68\xdc\x78\xe7\xe6\
-\x2e\xea\x78\xb9\xdf\x91\x91\x61\x2d\xe4\x36\x6f\xde\x64\xf6\x2e\
-\x87\x78\xae\x5e\xbd\x16\xbc\xee\xb5\xdf\xbc\xac\x6f\x0d\x1d\x86\
-\x33\x4d\x9d\x90\x46\x8d\xf6\x4a\x99\x54\xe3\x5a\x4e\x9a\x0d\x4c\
-\xf4\x8e\x79\xba\xf1\xba\xf1\xc4\x8f\x2d\xed\x8b\x84\x09\xdd\x36\
-\x0e\x36\xdb\x4d\xd8\xd8\xb1\x6c\xba\xba\x96\x9b\x4e\x15\x96\xd1\
-\x87\xff\xc4\x0c\xd2\x67\x6b\x6b\xec\x22\xc2\x66\x95\x58\x9e\x33\
-\x2b\x40\x9a\x7e\x04\xa1\xf1\xb8\x74\xe9\xb2\x6e\x7e\xa2\xa9\xe7\
-\xe8\xd1\x63\xba\xd6\x05\xe3\x5f\x8d\x5b\xf3\xf3\x4a\x28\x5c\xd2\
-\x22\x28\x2e\x5a\x26\x27\xd7\x6b\x61\x73\xf4\xd8\xf1\xc4\xa6\xa7\
-\xf9\xdb\xb7\x75\x93\x12\xb5\x33\xae\xf0\x00\xf6\xd1\x9f\xa5\xb7\
-\x97\x77\x7d\x48\x4f\x4f\xd9\x5d\x09\x8e\xe5\x7e\xd2\xe2\xed\x55\
-\xf1\x22\xb6\xec\xbb\x08\x77\x12\xb7\x17\x16\x74\x8d\xd5\xc0\x40\
-\xbf\x16\x55\xaf\xf9\x86\x6f\x30\x7b\xca\xec\x7f\x61\xcf\xca\x9b\
-\xa1\xa0\x46\x7b\xa5\x4c\xaa\x71\x2d\x27\xcd\x06\x26\x7a\xc7\x3c\
-\xdd\x78\xdd\x78\xe2\xc7\x96\xf6\x45\xc2\x84\x6e\x1b\x07\x9b\xed\
-\x29\x6c\x46\x53\x47\x1f\x36\x83\xf4\xb9\xa3\x0f\x13\xd0\xae\x2b\
-\x0a\x1b\xc0\x2d\xd4\x4e\x98\x7b\x2d\x82\x88\x2a\x41\x88\x3e\x07\
-\x08\x80\x73\xe7\xce\xeb\x26\x9a\x9d\x3b\x77\x04\x2f\x7d\xe9\x4b\
-\x82\xd1\xd1\x91\x70\xa7\xc7\xf3\x82\x70\x40\x04\x5d\x52\x02\xc0\
-\x85\xda\x99\xad\x5b\xb7\x28\x31\xd2\xa3\xe2\x9f\xd1\xe7\x88\x33\
-\x34\x34\xa8\x85\x0f\xe2\xc1\xc5\x47\x50\x55\xc2\xc6\x1b\x6f\x5a\
-\xca\x1a\x2f\x62\xed\xd6\xad\x79\x5d\x5b\xf3\x75\xaf\xfe\x5a\x5d\
-\x73\xe4\x42\xa7\xe1\x7d\x7b\xf6\x98\xad\x15\x52\xa3\xad\x52\x26\
-\xd5\xb8\x96\x93\x66\xff\x12\xbd\x63\x9e\x6e\xbc\x6e\x3c\xf1\x63\
-\x4b\xfb\x22\x61\x42\xb7\x8d\x83\xcd\x76\x13\x36\x2c\xeb\x86\x87\
-\x53\x46\x1f\x0e\x07\xe9\x73\x84\x8d\x2b\x6e\xec\x62\x45\x0d\x4b\
-\x78\x21\xe1\xc2\x79\xc2\x13\x09\x35\x11\xe6\x9c\x20\x08\x0d\x4f\
-\x2d\xa2\xfd\xfa\xf5\xeb\x7a\xbd\x71\xe3\x86\xa0\xbf\x3f\x1c\x73\
-\x83\x3e\x23\x3e\x0c\xf4\xf7\x07\x5b\x36\x6f\xd2\xc6\x1f\xd1\x42\
-\x4d\x88\xcb\xe0\xda\x81\x60\xf3\xa6\x8d\x5a\xf8\xd0\xcc\xe4\xd2\
-\xdf\xd7\xa7\x9b\xac\xa8\x51\xa1\xff\x0e\xfd\x68\x2c\xf8\xdd\xbe\
-\xbd\x10\x2c\x2c\x94\xaf\x83\x7e\x3f\x3e\x10\x2f\xf7\x42\x1c\xf4\
-\xab\xa1\x4f\x8c\x05\xbf\x05\x15\xaf\x7b\x7f\x69\xf7\xda\xd7\xdb\
-\xab\xe3\xa1\xa6\x66\x76\xf6\x82\xba\x96\x85\xe0\x0d\x6f\x78\xfd\
-\xb2\x66\xa8\x0b\xb3\x33\x2b\xff\x1a\xca\x52\xa3\xad\x52\x26\xd5\
-\xb8\x96\x93\x66\xff\x12\xbd\x63\x9e\x6e\xbc\x6e\x3c\xf1\x63\x4b\
-\xfb\x22\x61\x42\xb7\x8d\x83\xcd\x76\x14\x36\x23\x23\xa3\xcb\xca\
-\x8c\x01\x61\xf3\xc7\xef\x7c\xd7\x0f\x27\x0d\xd2\x47\x6d\x4d\x52\
-\xad\x0d\xe8\x13\xa8\xf3\x84\x27\x12\x32\x63\x13\x72\xc5\xf8\xbe\
-\x70\x7d\xdf\xcb\xd2\x9f\x46\x10\x56\x0e\xcd\x3c\x40\x67\x5f\x6a\
-\x6d\x18\x91\x97\x9a\x97\x2c\x4c\x4f\x4f\x05\x9d\x5d\x9d\xba\x73\
-\x30\x5f\x3d\xc1\xe9\x33\x67\x83\xb9\x8b\x97\x74\xd3\xd3\x8d\x9b\
-\x37\xb5\xa0\x48\x62\x6a\x2a\x3c\x96\xf3\xdf\x33\x35\x29\x34\xf7\
-\xc0\xa9\x53\xa7\x74\x07\x61\x9a\xa9\x70\x67\x81\x8e\xc0\xe5\x78\
-\xc3\x2f\xb9\x6c\x0d\x14\xf7\x48\xed\x0b\x5f\x3e\xb9\x23\x09\x27\
-\x41\x33\x1a\xf1\x20\xda\xc6\xc7\xc7\x13\x9b\xa1\x8e\x1d\x3e\x1c\
-\x9c\x3b\x93\x3e\xd2\x71\x26\x6a\xb4\x55\xca\xa4\x1a\xd7\x72\xd2\
-\xec\x5f\xa2\x77\xcc\xd3\x8d\xd7\x8d\x27\x7e\x6c\x69\x5f\x24\x4c\
-\xe8\xb6\x71\xb0\xd9\x6e\xc2\x86\x30\x43\x43\xeb\xd2\x84\x4d\xd7\
-\xba\x75\xc3\x1f\x8e\x0d\xd2\x87\x98\x71\x9b\xa2\xec\xc2\x89\x58\
-\xc2\x8b\xe1\x9f\x3d\x91\x90\x89\x30\xc7\x04\x41\x68\x49\x10\x15\
-\x18\x7b\x9a\x80\xe8\xf4\xcb\x10\xf0\x08\x02\xb0\x02\xa5\x1a\xbd\
-\x3d\x3d\xc1\xe6\x4d\x9b\x74\x6d\x8a\x2b\x6c\xe6\x2e\x5e\xd4\x4d\
-\x4f\x83\x6b\xd7\xa6\x76\xc8\xa5\xdf\x0c\xb5\x39\x1c\x7b\x46\x09\
-\x21\x40\x00\x6d\xdd\xba\x59\x5f\x0b\xb5\x38\x08\x1b\xa6\x2c\x48\
-\x13\x46\x49\xd0\x57\x66\xe3\x86\xe9\xe0\xce\x9d\xbb\xa5\xa6\x2f\
-\x9a\xd8\xa8\x1d\xea\x54\xf1\x52\x8b\x43\xf3\xd4\xc4\xc4\x84\xae\
-\x8d\x49\x82\x1f\x62\xc4\xb3\x41\x89\x36\xe2\x39\x7f\xfe\xbc\x6e\
-\x86\x7a\xc9\x23\x8f\x98\x10\x65\xf6\xbd\xb0\xa7\xb6\x99\xbc\x93\
-\xa8\xd1\x56\x29\x93\x6a\x5c\xcb\x49\xb3\x7f\x89\xde\x31\x4f\x37\
-\x5e\x37\x9e\xf8\xb1\xa5\x7d\x91\x30\xa1\xdb\xc6\xc1\x66\xbb\x0a\
-\x9b\x81\x81\xc4\xf2\xab\x47\x1f\xfe\xf1\x77\xff\xc4\x4f\x2b\xb7\
-\x34\x45\xad\x02\x1d\xb6\x86\xc5\x24\x5e\xc7\x63\x8f\x7f\xc0\x0c\
-\x60\x11\xe5\x8d\x6f\x7a\x53\xf0\x6d\x6f\xfb\x16\xb3\xb5\x9c\x7a\
-\xd7\xd4\xc4\xcf\xff\x7f\xff\xef\x97\x8c\x4b\x10\x9a\x8b\x1d\x3b\
-\xb6\x05\x83\x83\x83\x66\x2b\xc4\xff\xf9\xf2\x7d\xc0\xb2\x3d\x5f\
-\xe0\x7d\x0d\x9e\xcf\x6e\xd6\x4b\xc8\x3b\x0d\xd2\xc2\xd1\x14\xf5\
-\x7b\xbf\xf7\x9f\x83\x0b\x17\x2e\x18\x9f\x10\x04\xd0\xcb\x5e\xf9\
-\x35\xc1\xe8\xd8\xb8\xf1\x59\x21\x59\x13\xc0\x50\x29\x7d\xd3\xee\
-\x29\xd1\x3b\xe6\xe9\xc6\xeb\xc6\x13\x3f\xb6\xb4\x2f\x12\x26\x74\
-\xdb\x38\xd8\xc4\xa0\x94\xe3\xb1\xfe\xe5\xfd\xae\x83\xe3\xd8\x57\
-\x0e\x1f\xa2\xb7\x6d\x18\xbd\x3f\x0c\x6b\xb7\xf1\xb0\xc7\x84\xfb\
-\xa3\x71\x44\xfd\x58\x3b\xc7\x95\xce\xc9\xe6\x92\xbe\xde\xa5\x25\
-\x1b\xce\xfa\xb3\x56\x22\x5e\xb9\x97\x58\xb3\x57\x85\xb1\xfe\x3a\
-\x2e\xc5\x12\x42\x5f\x39\x6f\x2f\xdc\x0e\x6e\x98\x26\xdf\x38\x8b\
-\x8b\x0b\xff\xfd\x63\x1f\xfd\xc8\xcf\x28\x27\x6d\xa2\x76\xb9\x6b\
-\x16\xec\x2e\x0b\x27\x21\x52\xbb\xd6\x27\x50\xe7\x09\x4f\x24\x54\
-\x25\x94\xa0\x82\x20\x08\x39\xa0\x5e\xf5\xc6\x55\x99\x46\x7e\x45\
-\xd3\x94\xf0\xd7\xff\xfa\xf7\x2d\x6b\x52\xa0\x7f\xce\x33\x4f\x7c\
-\x55\x9a\xa2\xac\x47\x24\x4c\xe8\xb6\x71\xb0\x49\x16\x97\xe3\xb1\
-\xfe\xe5\xfd\xae\x83\xe3\xd8\x57\x0e\x1f\xa2\xb7\x6d\x18\xbd\x3f\
-\x0c\x6b\xb7\xf1\xb0\xc7\x84\xfb\xa3\x71\x44\xfd\x58\x3b\xc7\x95\
-\xce\xc9\x66\x3e\x35\x36\x7d\xbd\xe1\xe8\xc3\xd6\xdf\x45\x46\x1f\
-\x5e\x1d\x72\x11\x35\xbe\x22\xd2\xf7\x45\xe6\xfb\x62\x14\x04\x61\
-\x75\x68\xb7\x1f\x8a\x08\x9a\x77\xbc\x63\xb9\xb0\x01\x9a\xa2\x4e\
-\xad\x74\x8e\x28\x4b\x8d\xb6\x4a\x99\x54\xe3\x5a\x4e\x9a\xfd\x4b\
-\xf4\x8e\x79\xba\xf1\xba\xf1\xc4\x8f\x2d\xed\x8b\x84\x09\xdd\x36\
-\x0e\x36\x29\x35\xe5\x78\xac\x7f\x79\xbf\xeb\xe0\x38\xf6\x95\xc3\
-\x87\xe8\x6d\x1b\x46\xef\x0f\xc3\xda\x6d\x3c\xec\x31\xe1\xfe\x68\
-\x1c\x51\x3f\xd6\xce\x71\xa5\x73\xb2\x99\x9f\xb0\xe1\xcb\x28\xeb\
-\xef\x82\xb0\x89\x0d\xd2\x97\x26\x6c\x38\x11\x0b\x91\xe8\x88\x54\
-\x7c\xcb\x23\x14\x96\x11\xe6\x50\x93\x23\x35\x73\x82\xd0\xda\xf8\
-\xff\x70\xca\x2f\x1c\x9d\x88\xd3\x84\x0d\x23\x0e\xef\x7b\xe1\x79\
-\x19\xc7\x26\x74\x84\x6b\x85\xf5\xb3\x71\xb0\x49\x4a\x97\xe3\xb1\
-\xfe\xe5\xfd\xae\x83\xe3\xd8\x57\x0e\x1f\xa2\xb7\x6d\x18\xbd\x3f\
-\x0c\x6b\xb7\xf1\xb0\xc7\x84\xfb\xa3\x71\x44\xfd\x58\x3b\xc7\x95\
-\xce\xc9\x66\x3e\xc2\xa6\x7b\x4d\x77\xaa\xb0\x51\xe1\x19\xa4\x4f\
-\x46\x1f\x2e\x88\x30\x77\x04\x41\x68\x58\xf2\x36\xe8\x2a\xa0\x71\
-\x08\xd5\xa8\x24\x6c\x18\x75\xf8\x89\x2f\x7e\x21\xb8\xe1\x39\x3a\
-\x73\x45\x6a\xb4\x55\xca\xa4\x1a\xd7\x72\xd2\xec\x5f\xa2\x77\xcc\
-\xd3\x8d\xd7\x8d\x27\x7e\x6c\x69\x5f\x24\x4c\xe8\xb6\x71\xb0\xd9\
-\xae\xc2\x86\x4f\xbe\xd7\xac\x41\xa3\x44\x41\xd8\x3c\xf6\xf8\xfb\
-\x9f\x88\x0d\xd2\xe7\xd6\xda\x54\x14\x36\x80\x5b\x58\x4e\x98\x33\
-\x0d\x84\x34\x3d\x09\x42\x63\xe1\x2d\xaa\x3c\x9f\xdd\x66\xd3\x54\
-\x08\x9b\x1f\xfb\xb1\x1f\xd1\x5f\x68\xc5\x61\x80\xbe\xaf\x7e\xe9\
-\x0b\xba\xe6\x46\x26\xc1\x5c\x1e\xde\xc6\xc1\x26\xd9\x5e\x8e\xc7\
-\xfa\x97\xf7\xbb\x0e\x8e\x63\x5f\x39\x7c\x88\xde\xb6\x61\xf4\xfe\
-\x30\xac\xdd\xc6\xc3\x1e\x13\xee\x8f\xc6\x11\xf5\x63\xed\x1c\x57\
-\x3a\x27\x9b\xf9\x08\x1b\xbe\xf0\x63\x6a\x92\x24\x61\xa3\x02\x0c\
-\x99\x41\xfa\xb6\xa9\x0d\x5b\x63\x63\x9b\xa1\x2a\x09\x1b\x7d\x12\
-\x75\xae\xf0\x64\x42\x84\x30\x57\x56\x80\xff\xaf\x48\xe3\x10\x04\
-\x41\xa8\x23\xde\x35\x5a\x0e\x61\x1f\x9b\xef\x0d\x76\xee\xda\x65\
-\x7c\xa2\xd0\xc7\x86\x5a\x9b\x15\x77\x22\xae\xd1\x4e\x29\x93\x6a\
-\x5c\xcb\x49\xb3\x7d\x89\xde\x31\x4f\x37\x5e\x37\x9e\xf8\xb1\xa5\
-\x7d\x91\x30\xa1\xdb\xc6\xc1\x66\x3b\x0a\x9b\xce\xce\x50\xd8\x30\
-\xfa\x76\x02\x7a\xf4\xe1\x77\xbc\xe3\xfb\x5f\xa3\xdc\x56\xd8\xb8\
-\x7d\x6c\x92\xc4\x0d\xe8\x93\xa8\x73\x85\x27\x13\x4a\xd8\x04\x6a\
-\x5a\x6a\x79\x41\x09\x42\xdb\xd2\x84\xcf\x8b\xff\x0f\xa7\x62\xef\
-\x0d\x61\xf3\xdd\xdf\xf5\x1d\xc1\x37\xbf\xf6\xb5\xc6\x27\x8a\x9e\
-\x56\xe1\x85\x3d\xc1\x97\xfe\xe2\x73\x2b\x13\x37\x35\xda\x29\x65\
-\x52\x8d\x6b\x39\x69\xb6\x2f\xd1\x3b\xe6\xe9\xc6\xeb\xc6\x13\x3f\
-\xb6\xb4\x2f\x12\x26\x74\xdb\x38\xd8\x24\x97\xca\xf1\x58\xff\xf2\
-\x7e\xd7\xc1\x71\xec\x2b\x87\x0f\xd1\xdb\x36\x8c\xde\x1f\x86\xb5\
-\xdb\x78\xd8\x63\xc2\xfd\xd1\x38\xa2\x7e\xac\x9d\xe3\x4a\xe7\x64\
-\x33\x3f\x61\x33\xb4\x2e\x75\x90\xbe\xde\xc9\xa9\xe9\xdf\x71\x06\
-\xe9\x4b\x6a\x8a\xb2\x0b\x27\x63\x09\x2f\x88\x7f\xf6\x64\x82\x26\
-\xcc\x0d\x41\x10\x1a\x92\xa2\x0c\xfa\x89\x93\xa7\x82\x17\xf7\xee\
-\x37\x5b\x21\x6c\xe3\xbf\x12\x8e\x1d\x3b\x11\x9c\x3c\x99\x6e\xd0\
-\xd9\xb7\x7f\xff\x41\xb3\x55\x3b\x07\x0e\x1c\x8a\x8c\x16\x8c\xfb\
-\xe0\xc1\xc3\x66\xcb\x9f\x43\x87\x8e\x94\x06\x05\x4c\x23\x9e\xb6\
-\x0c\xd0\xf7\x03\x3f\xf0\xb7\x12\x9b\xa3\xc0\x15\x37\x4c\xb1\x30\
-\x3f\x7f\xcb\xec\xc9\x40\x8d\x76\x4a\x99\x54\xe3\x5a\x4e\x9a\xed\
-\x4b\xf4\x8e\x79\xba\xf1\xba\xf1\xc4\x8f\x2d\xed\x8b\x84\x09\xdd\
-\x36\x0e\x36\xdb\x51\xd8\x28\x5f\xfd\xb9\x77\x8a\xb0\xd1\x83\xf4\
-\xc5\x46\x1f\x8e\xd7\xd8\x70\x12\xbb\x84\x17\x13\x2e\x9c\x2b\x3c\
-\x99\xb0\x32\x51\xe3\xff\xc2\x35\x8e\x2a\x48\x7f\x1a\x41\x68\x2c\
-\xbc\x9f\x71\xf3\xec\x32\x08\x99\x9d\xb6\xa0\x95\xa1\x9f\xcd\x0f\
-\xfe\xe0\xdf\x0a\xfe\xd2\x6b\x5e\x93\x66\xa4\xb4\xb8\x61\x8a\x85\
-\x2f\xfd\xc5\x9f\x07\x7b\x9e\x79\x5a\x37\x51\x65\x12\x38\x35\xda\
-\x29\x8c\x67\x1a\x69\xb6\x2f\xd1\x3b\xe6\xe9\xc6\xeb\xc6\x13\x3f\
-\xb6\xb4\x2f\x12\x26\x74\xdb\x38\xd8\xa4\xc4\x94\xe3\xb1\xfe\xe5\
-\xfd\xae\x83\xe3\xd8\x57\x0e\x1f\xa2\xb7\x6d\x18\xbd\x3f\x0c\x6b\
-\xb7\xf1\xb0\xc7\x84\xfb\xa3\x71\x44\xfd\x58\x3b\xc7\x95\xce\xc9\
-\x66\xbe\xc2\x86\xd1\xaf\x13\x40\xd8\x7c\xf8\xdd\xef\x79\xef\x87\
-\x94\xdb\x0a\x9b\xb8\xb8\x49\xeb\x67\xc3\xb9\xc2\x93\xb5\x39\x61\
-\x2e\x08\x82\x20\xe4\xc0\xae\x5d\x3b\xf4\x88\xc8\x79\x91\x77\x4d\
-\x95\x6f\x38\x5f\xfe\xca\x37\x7e\x83\xae\xb5\x49\x9a\x5a\xc1\x85\
-\x89\x31\xe9\x4c\x8c\xc0\xa1\x06\x87\xcf\xc1\x11\x39\x97\x2f\x5d\
-\xac\x2c\x74\x6a\xb4\x53\x18\xcf\x34\xd2\x6c\x5f\xa2\x77\xcc\xd3\
-\x8d\xd7\x8d\x27\x7e\x6c\x69\x5f\x24\x4c\xe8\xb6\x71\xb0\xd9\xae\
-\xc2\xa6\xaf\xbf\x3f\x4d\xd8\xc8\x20\x7d\x2b\x64\x45\xd3\x24\xf8\
-\xbf\x48\x8c\xa3\x0a\x59\x6b\x6a\x2a\x9d\x5f\xa6\x49\x10\x9a\x15\
-\x3b\x4d\x42\xee\x86\xda\x09\x47\x33\x13\x13\x5b\xbe\xf4\x91\x87\
-\x8d\x4f\xd8\xfc\xc4\x8c\xdc\xdb\xb6\x6e\x31\x3e\xfe\x71\xfb\x3e\
-\xbb\x34\x3f\xdd\xbc\x79\x2b\x78\xf8\xe1\x07\x8d\x4f\x65\xd2\xce\
-\x4f\xf3\x13\x73\x45\xd9\x39\xa7\x98\xc4\xf2\xd6\xad\xf9\xe0\xc1\
-\x07\x77\xeb\xed\x34\xe2\xf1\xd1\xfc\xc4\xdc\x50\x9b\x36\x6d\x34\
-\x3e\xcb\xf1\x4d\x83\xab\x57\xaf\x06\x5f\xf8\xe2\x97\x83\x7d\x7b\
-\xf7\x1a\x9f\xec\x8c\x8e\x85\x93\x7d\xae\x06\xde\xe5\xa6\x1a\x35\
-\x46\x53\xad\xcc\x54\xba\x3e\x77\x9f\x6b\xc5\xd3\x8e\x58\x16\x57\
-\x42\xdc\xf1\x30\xcb\xb6\xcd\xba\x84\xb3\xdf\x0d\x1b\x3d\xce\xf5\
-\x37\x0e\x85\x0d\x73\xf7\xee\xdd\x58\xf8\x32\xf7\xee\xdd\x7b\xf2\
-\x23\xbf\xfa\x6f\xfe\xa6\x72\x56\x9b\x56\xc1\x2e\x44\xa4\x23\x53\
-\x71\x26\x47\xda\x06\x88\xa8\x11\x84\x06\x23\x6f\x51\xb3\xb4\x74\
-\x2f\x38\x73\xe6\x9c\x9e\x4d\x1b\x86\x87\x86\x82\xf9\xdb\xb7\x83\
-\xdb\xb7\x17\x2a\x8a\x1a\x2b\x7c\xb6\xaa\xed\x41\x25\x20\x98\xc8\
-\x72\x6e\xee\x62\x70\xfd\xfa\x75\x3d\x41\x25\x33\x80\x33\x59\xe6\
-\xe8\xc8\x48\xe9\xd9\xdd\xb7\xef\xa0\x16\x1b\x4c\x58\x19\x87\xcb\
-\x44\x7c\xb8\xa2\x86\x19\xba\x2f\x5c\x98\x0b\xd6\xaf\x9f\x28\xcd\
-\xde\xed\xc2\xbd\xdd\x56\xd7\xca\x79\x39\x8e\x19\xb5\xc7\xc7\x46\
-\xd5\x31\x17\x2b\x8a\x1a\x66\xe8\x26\xcc\xfa\xf5\xe3\xea\x1a\x47\
-\xb5\x1f\xf7\x3b\x37\x37\xa7\xc3\x11\xcf\x98\xba\xf6\xb9\xb9\x4b\
-\x15\x45\x0d\xe7\x67\x2e\x28\xae\x93\xe3\xba\xbb\xd7\x04\xeb\xd6\
-\xad\x2b\xcd\x08\x6e\xb1\x79\x70\xe4\xc8\xb1\xe0\xe6\xad\x9b\x6a\
-\x7d\x34\x38\x7d\xea\x94\x9e\x5a\x41\x10\x6a\xe5\xfe\xfd\xa5\x53\
-\xff\xdf\xbf\xfd\xd7\x6f\x56\x4e\x57\xd8\x58\x71\x23\xc2\x26\x81\
-\x9a\x9b\x9f\x7c\xd3\xcb\x37\x59\xb3\x0a\x1a\x41\x10\xaa\x83\xa0\
-\xc1\xd0\x22\x68\x26\xc6\xc7\x83\xa9\xc9\xc9\xe0\x8e\xfa\x75\x88\
-\x81\xaf\xc4\xd9\xb3\x4a\x04\x29\x41\xb3\x69\xd3\x06\x2d\x68\x80\
-\xce\xb8\x97\xaf\x5c\xd1\xe2\x03\xa1\x43\xf5\x39\xb3\x74\x5f\x52\
-\x02\xa2\x16\x98\x9d\x1b\x41\x33\xa6\x44\x4a\x92\xa0\x01\x04\xcd\
-\x29\x75\xde\xc5\xc5\x45\x3d\xbb\x38\x82\x86\xd9\xb7\x2b\x71\xf5\
-\xea\x35\x2d\x68\xb4\xe0\x72\x04\xcd\xe9\x33\x67\xb4\xc8\xa0\x3f\
-\x0c\x82\x86\x70\xd5\x40\xd0\x9c\x51\x69\xa1\x67\x05\xdf\xb8\x41\
-\x0b\x1a\x04\x4e\xda\xb1\xd3\xd3\x93\xc1\xc8\xf0\x70\xf0\xf2\x47\
-\x1f\x0d\xde\xf9\xce\x1f\xd4\x3f\x06\x69\x9a\xea\xed\xa5\x25\x41\
-\x10\xb2\xd1\x11\x8e\x3e\xfc\x27\x66\x90\x3e\xb7\x29\x8a\x25\xfe\
-\x45\x94\x34\x45\x29\x6a\x16\x35\x82\x20\x34\x3e\x97\x2e\x5d\xd1\
-\xb5\x2a\x9b\x94\x41\x5e\x3f\x31\xae\x8d\x39\x35\x31\x3d\x3d\xbc\
-\x13\x93\x99\x99\x9d\x55\xe2\xe5\xaa\x16\x34\xc3\xca\x88\xc3\xd5\
-\x6b\xd7\x74\x4d\x09\xc7\x52\x33\x83\xd0\x99\x52\xe2\x80\xda\x92\
-\x4b\x97\xb2\x8b\x9a\x9b\x4a\x64\x9d\x3f\x3f\xab\x05\x0d\x22\x23\
-\x09\x7e\x38\x51\x43\xb3\x74\x6f\x29\xd8\xb2\x65\x73\x30\x32\x32\
-\xac\xc2\x8f\x69\xb7\x8b\xfb\x03\xeb\xd6\xad\x5b\xc1\xcc\xcc\xac\
-\x16\x34\xd4\xfe\x58\xa8\xa1\x21\x1e\x6a\x64\x86\x87\xa9\x69\x19\
-\xad\xd8\xe4\x64\x41\xc0\x20\x68\x88\x8b\x1a\x1d\xe2\x65\x8d\x20\
-\x4b\x02\xa1\xb7\x66\x0d\xdd\x1e\x02\x25\x80\x86\x82\x57\xbc\xfc\
-\x65\xc1\x5b\xbf\xf5\x2d\xc1\xfb\xde\xf7\xde\xe0\xb5\xaf\x7b\x5d\
-\xf0\xc8\x4b\x5f\x1a\x6c\xde\xb2\x45\xc7\x29\x08\x3e\x20\x6c\xcc\
-\x20\x7d\xee\xe8\xc3\x14\x32\xbb\x16\x61\xe3\x50\x73\xf3\x53\xbd\
-\x6b\x6a\xaa\x9d\x5f\x9a\x9f\x84\x66\x85\xe6\xa7\xb4\x4e\x84\x71\
-\xaa\x3d\x07\x27\x4e\x9c\xd4\x35\x2e\x34\xf7\x74\xd1\x51\xd1\x90\
-\xd6\xa7\x86\x66\x19\x8c\x3f\xcd\x50\x5b\x1d\xf1\x70\xee\xdc\x79\
-\x2d\x74\xd2\x78\xc9\x4b\xc2\xe6\x24\xdf\xe6\x27\xce\x03\xbb\x76\
-\xee\xd0\xa3\xae\x26\xc1\xbd\x1d\x3a\x7c\x44\x0b\x80\xed\xdb\xb6\
-\x1a\xdf\x10\xb7\x4f\x0d\xe1\xa8\x45\xb2\xcd\x4a\xb0\x63\xfb\xb6\
-\x48\xbc\x87\x8f\x1c\xd5\xf1\xb8\xf7\x04\x95\xfa\xd4\x10\xef\xd1\
-\x63\xc7\x75\x7a\x24\xb1\x7b\xf7\x4e\xbd\x8e\xe7\x01\xb5\x5c\xf3\
-\xf3\xb7\x75\xa7\x69\x17\x6a\xcc\x6c\xfa\xf6\xf7\xf7\x69\x41\x37\
-\x3b\x7b\x21\xb8\xbd\xb0\xa0\xd7\xc4\x43\xcd\x14\xb5\x43\x2e\x23\
-\x4a\x44\x5a\x10\x53\x88\x26\x9a\x27\x2d\x37\x6e\xdc\xd0\x7d\x33\
-\x86\x87\x87\x8d\x4f\x14\x04\x24\xfb\xad\x7d\xa3\xb6\x29\x8e\x0d\
-\x93\x16\x07\xa4\x85\xa1\x2f\x11\xd7\x64\xcb\x2c\xdb\x69\xd8\x63\
-\xdd\x30\x1c\x3b\x30\x10\xd6\x06\xae\x84\x78\x3e\xe4\x45\xd1\xf1\
-\xf2\xb5\xe0\xe1\x43\x87\xb4\x20\xaf\x84\x0a\xb7\xe7\x23\xbf\xfa\
-\x6f\xde\xa1\x9c\x8b\x6a\x89\x37\x45\xd9\xe6\xa8\xb6\x6f\x8a\x12\
-\x51\x23\x08\x0d\x46\x11\xa2\xc6\x15\x2f\x50\x49\xd4\x0c\xaa\x73\
-\x5f\xbb\x76\x3d\xd8\xb0\x61\x4a\xd7\xca\x80\x15\x35\x34\x3b\x45\
-\x09\xcf\x8f\xc0\x80\x34\x51\x63\x2f\xd3\x8a\x1a\x6a\x5d\x68\x46\
-\x1a\x1a\x1a\x4c\xad\x31\xe1\xde\x10\x2f\xbd\x7d\xbd\xde\xa2\x86\
-\x5a\x18\x9a\x86\x10\x65\x34\x17\x59\x18\xc3\x86\x78\x6a\x11\x35\
-\x7d\xbd\xbd\x11\x61\x61\xe1\x38\x88\xe7\x41\x35\x51\x33\xd0\xdf\
-\xaf\xd3\x9e\xfe\x3e\x43\x43\x65\x81\x31\x3b\x3b\xab\xfd\x69\x66\
-\x43\xf4\x50\x03\x46\x3e\xec\xdc\xc9\x0f\xf4\x90\xa3\x47\x8f\xeb\
-\x7d\x1b\x36\x4c\x1b\x9f\x30\x6f\x38\x5f\xda\x57\x67\xe7\xcf\xcf\
-\xe8\xfd\xa4\xf5\xf5\xeb\x37\x74\xba\xb9\xb5\x58\x40\x18\x9a\xe8\
-\xb6\x6f\x8f\xa6\xb3\x7b\x6f\xd4\x80\x11\x66\xdb\xb6\x68\x19\x38\
-\x71\xe2\x94\xee\x5f\x35\x39\x39\xa9\xb7\x4f\x9d\x3e\x1d\xf4\xf6\
-\xf4\x24\x8a\xa7\xbe\xbe\x3e\xbd\x3e\xa9\xca\x1f\x5f\x08\xf5\xab\
-\x6d\xf2\x0d\x81\x47\x9e\xc5\x89\xa7\x6d\x1a\xbe\xe1\x5c\xfc\xe3\
-\x36\x8e\x2a\x64\xbf\x86\x72\xf8\x85\x85\xc5\xe0\xd3\x9f\xfe\x4c\
-\x70\xf1\xe2\x45\xe3\xb3\x1c\x25\x28\x9f\xfe\xb5\x8f\xfc\xdb\x1f\
-\x56\x4e\x44\x4d\x25\x61\x63\xc5\x0d\x27\xb0\x0b\xd7\x97\xf5\x02\
-\x9b\x92\xf2\x4f\xb7\x0c\xe4\x5e\x18\x9c\xcc\x15\x04\x21\x3f\x30\
-\x36\x40\xf3\x91\x0b\x7d\x54\x92\xc0\xe0\x6e\x51\x42\x01\xc3\x47\
-\x7f\x19\x3a\x14\x6b\x7f\x23\x5a\xee\xdc\x59\xd4\x4d\x4f\x76\x21\
-\x1c\x4b\x56\xa6\xa7\xa7\xb4\x21\xc3\xc8\xd2\xc4\x93\x06\x71\x2f\
-\x28\x43\xea\x76\xb8\xad\xd4\xf9\x16\x41\x40\x13\x11\xe2\x80\xce\
-\xc2\x16\x04\x48\x96\x78\x2c\x08\x1a\x6a\x52\x48\x47\xe2\x70\x97\
-\x5a\xc0\xd8\x63\xfc\x11\x26\xf4\xfb\x59\x5c\x2c\xd7\xca\x70\xcd\
-\xf8\x23\x68\x19\x81\x96\x31\x7f\xf2\x64\x62\x62\x5c\x8b\x49\x44\
-\xa5\x4f\x7f\xa2\x5a\xe1\x1e\x17\x54\xf9\xa2\x1f\x11\x22\xc6\x5d\
-\x5c\x08\xc7\x35\x91\xb6\x08\xb8\xb4\x32\x59\x04\xf5\x17\x34\x51\
-\x48\xab\xef\xfd\xde\xbf\x1a\x3c\xf0\x60\xc5\xaf\x02\xa9\x78\xb0\
-\x63\xd7\xb8\x9f\x7b\xc7\x3f\xf5\xc6\xae\xb3\xb4\x5d\xd3\x13\xd4\
-\x24\x6a\xea\x4d\x9b\x08\x4e\x41\x58\x31\xfc\x22\xa7\x76\xe0\xac\
-\xfa\x35\x7f\x61\xee\x62\x70\xe9\xf2\x15\x5d\x4b\x43\x3f\x9b\x4a\
-\x20\x3a\x38\x8e\xd1\x76\xf9\xea\x89\xbe\x35\x56\xe8\x84\xb5\x36\
-\x57\xf4\x32\x3b\x3b\xa7\x8d\x64\x2d\xd0\x97\x86\x38\xe9\x2c\x4c\
-\xd3\x86\x8b\x7d\xc6\xed\x57\x46\xd4\xf0\x50\xb3\x73\xe9\xd2\x25\
-\xed\xb6\x24\xbd\x0b\x6c\xff\x17\x44\x83\xad\xd2\xb7\xf1\x70\x3f\
-\x18\x74\x04\x4f\xb5\x91\x84\x81\x0e\xcc\x34\x17\xd1\x59\x98\xe3\
-\x58\xec\x97\x50\x69\x20\x84\x80\xfb\x4a\xeb\xd4\x6c\xf3\x85\xda\
-\x0f\x3a\x73\x03\x86\x8d\x1a\x15\x9a\x98\x2e\xab\xfb\x44\xe4\xe4\
-\x0d\xe9\x80\x88\xb8\xac\xca\x01\x4d\x5d\x16\x3b\x80\xa0\xdb\x09\
-\xba\xd6\xf7\x2c\xe7\xb8\xbf\x74\x5f\xdf\x1b\x4d\x63\x2c\xdc\x93\
-\x7b\x3e\x17\xfa\x37\x51\x6b\xc3\x97\x68\x79\x0b\xb9\x66\xe3\x8d\
-\x6f\x78\x9d\x2a\x73\xe3\x66\x2b\xce\x7d\xec\xb5\x2b\x6a\x92\x84\
-\x0d\x61\xac\xb0\xd1\xad\x2f\x66\xb1\xad\x31\x2d\x4f\x53\x8a\x1a\
-\x41\x10\xfc\x8c\x0e\xbf\xf8\x77\xee\xd8\xae\x6b\x60\xe8\xb7\x41\
-\x27\xe0\xb0\xa9\x20\xb9\x73\xae\x85\x5f\xd1\x9b\x37\x6d\xd2\xe2\
-\xc7\x4e\x47\x40\x53\x0f\x46\xfe\xa6\x12\x0a\xa1\xb8\x99\x59\x26\
-\x46\xb2\x32\x35\x65\xc4\x93\x12\x0d\x49\x23\x11\x53\x6b\xb1\x79\
-\xf3\x46\x15\xa6\x4b\x1b\x49\x44\xc2\xc4\xc4\x84\x16\x43\x95\xa0\
-\xc6\xc6\x8a\x39\xe2\xa5\xcf\x06\x1d\x9f\x89\x87\x74\xc0\x70\x53\
-\x4b\x90\x56\xe3\x62\xd3\x16\x63\x4f\x33\x16\xfd\x91\x10\x29\x2c\
-\xb7\xe6\xcb\x82\x26\x29\x0f\x46\x94\x51\xa7\xc6\x85\xa6\x23\x84\
-\x5f\x12\x6b\xd6\x74\x87\x5f\xa2\xdd\xb9\xab\xef\x0b\xb8\x66\x84\
-\x0d\xb5\x16\xd4\x0e\x51\xab\x02\x49\xe9\xb2\x12\xb8\x6f\xd2\x66\
-\x56\xdd\x8b\x15\x11\x34\xdb\x51\x2e\xa8\x39\x8b\xd7\xea\x65\xa5\
-\xbb\x9b\xda\xa8\xf5\x7a\xb0\x39\xee\x45\xdf\x4f\x8a\xa0\x01\x3e\
-\x93\xe7\xcb\x3c\xfa\xeb\xd0\x31\xdc\xe2\x2b\xaa\x6a\x15\x5f\xf5\
-\x25\xfd\x9a\x53\x26\xbe\x04\x44\x89\x15\x31\xae\xa0\x71\x45\x8d\
-\x15\x36\xee\x52\x12\x36\xed\x40\x4d\x7d\x6a\x7c\x0a\x91\x6f\x39\
-\xab\xa5\xe9\xc9\xe7\xfc\xd2\xa7\x46\x68\x56\x7c\xfb\xd4\x78\xbf\
-\xcc\x7d\xc3\x19\x7c\xe3\x8d\x3f\xbb\x0b\x0b\x77\x82\xa3\x47\x8f\
-\x05\xa3\xca\x18\x4f\x6f\x98\x32\xbe\x99\x4f\xaf\xf1\xbe\x86\x9c\
-\xc3\x59\x8a\x8a\x17\xfc\x0f\xa9\x1e\xb0\xb6\xf3\xe7\x7b\x6f\xd9\
-\x2f\x21\xef\xf3\x67\xbe\x80\xdc\xef\x2d\xfb\x35\xa4\x87\xff\xd4\
-\xa7\x3e\xa3\x7e\x30\x9c\x33\x5b\x65\xee\xdc\x59\xdc\xf3\xd1\x5f\
-\xfb\xd5\xbf\xad\x9c\xf4\x9d\xb1\xfd\x6a\x58\x68\xc3\x74\xb7\xa9\
-\x86\xb5\x7d\x6c\x50\xad\xd8\x74\x4e\xa8\x2e\xb3\x86\xc4\x6a\x32\
-\x32\xd7\xd4\xb4\x41\x9a\x08\x82\x90\x91\x7b\xf7\x96\x74\x93\x09\
-\xd8\xfe\x37\x45\xe3\xfb\x2e\x6a\xa4\x77\x96\xff\xa5\xc8\x7b\xb6\
-\x28\xfc\xcb\x8d\x71\x54\x61\x15\xcb\x97\xad\xa9\xa1\x36\xc6\xad\
-\xa5\x71\x6b\x6a\x92\xfa\xd5\x94\x6a\x69\xda\xa1\x09\x2a\xb3\xa8\
-\xa9\x37\x22\xaa\x04\x21\x03\xab\xf0\xbc\x20\x68\xf8\xba\x88\xaf\
-\xa3\x68\x9e\x62\x7c\x96\x95\x20\xcf\x78\x71\xf8\x1b\x74\xdf\x70\
-\xc6\x21\x64\xa0\xe6\x44\x43\x90\x20\x58\xac\x80\x89\x2f\x76\x9f\
-\x15\x34\xae\xa8\xb1\x4b\xcb\xd3\x74\xa2\x46\x10\x84\xc6\x32\xfc\
-\x5d\x5d\x9d\xba\xbf\xca\xce\x9d\x3b\x82\xc9\xc9\xe8\xa7\xc2\xcd\
-\x48\xde\x86\x5f\x70\xc9\x37\x6d\xdb\x30\x0f\x6c\x4d\x4c\x5c\xd0\
-\xd8\x05\x9b\x6e\x6b\x6a\xda\x4a\xcc\x58\x32\x89\x1a\xff\x82\x66\
-\x1c\x55\x90\x4f\xb9\x05\xa1\xb1\xf0\x7e\xc6\x63\xcf\x2e\xb5\x33\
-\xbd\xbd\xd4\x82\x47\x69\x3f\x9b\x93\x8e\x7f\x5a\x78\xe6\x81\x24\
-\x6e\xdd\x59\xcd\x3c\x50\xe7\x42\x9c\x60\xb3\xed\x62\x05\x8e\x5d\
-\xac\x9f\xdd\xef\x8a\x9a\xb6\x11\x36\xdc\xb8\x20\x08\x42\x43\xe0\
-\xff\xc3\x49\x0c\x7f\xbd\x69\xc6\xa4\xf5\x2f\x37\xc6\xd1\x78\x24\
-\x89\x19\x77\x49\x12\x34\x50\x12\x35\xad\xde\xaf\xa6\xa9\x44\x8d\
-\xbc\xc8\x04\x21\x43\xf9\x96\xe7\x40\x70\x90\xf7\x67\x23\xb0\xe2\
-\xb4\x75\xc5\x8a\x15\x30\xf1\xc5\x0d\x63\x17\xb0\xeb\x96\x86\x04\
-\x10\x04\x41\xc8\x9d\x66\xb4\x8d\x62\xf8\x8b\x24\xdf\xb4\x6d\xe3\
-\x3c\x40\x9c\xb8\xe2\x25\x4d\xc8\xb0\xb4\x1d\xb9\x8b\x1a\xdf\x72\
-\x26\xfd\x69\x04\x61\x75\x60\x4e\x27\x46\x11\xb6\xe0\xc6\x2f\x8e\
-\xb7\x31\x51\x7f\x27\x4f\x9e\xd6\x73\x19\xb9\x30\xef\x13\xfe\x96\
-\xfd\xfb\x0f\x46\x46\xff\x2d\x0a\x06\x07\xe4\xeb\x2b\x17\xb6\xed\
-\xa0\x81\xc0\xe8\xc1\xcc\xf3\x94\x27\xcc\xf1\x14\x4f\x83\x34\xdc\
-\xa4\x65\x2c\x9f\xa4\x71\x48\x42\xc2\x80\xd7\xaf\x5f\xd7\x69\xc9\
-\x5c\x4f\x0c\x5e\x17\x67\x25\x06\xfd\xf8\xf1\x93\x7a\xae\x27\x0b\
-\x6e\xfc\xea\x01\xe7\x66\x30\xc4\xd5\xc0\x5f\x2c\x19\x47\x15\xea\
-\x24\xaa\x5c\xb1\xe2\x8a\x97\xa4\xa5\x2d\x69\x9a\x9a\x1a\xff\x02\
-\x59\x97\x82\x26\x08\x6d\x45\xde\xa3\xdc\x82\x3c\xe3\x21\xf3\xf3\
-\xf3\x7a\x8a\x07\x46\xda\x65\xd2\x4b\x46\x27\x5e\x2d\xfc\xf3\xc0\
-\x38\x56\xc8\xd2\xd2\xfd\xb6\x9f\x1a\x21\x23\x56\xac\xb8\x6b\x77\
-\x71\x89\x6f\x43\x92\x5f\x4b\x21\xcd\x4f\x82\xd0\x44\x78\x1b\xf4\
-\x82\x0d\x3f\xa3\x1e\xc7\x67\xa1\x6e\x76\x1a\x45\x54\xd9\x39\x9f\
-\x98\x1f\x6a\x68\x68\x48\x89\x9a\xda\x26\xcf\xa4\xb6\x87\xda\x24\
-\x68\x54\x21\xb8\x71\xe3\xb4\x9e\x67\xac\x3d\xc8\x3d\x0f\xd2\x44\
-\x8b\xeb\xdf\xf2\x22\x26\x8e\x88\x1a\x41\x10\xfc\x0d\xba\xe7\x8b\
-\xb9\x41\x6d\x68\x53\xc0\x1c\x48\xb0\x66\x0d\xc3\x8e\xd4\x0e\x13\
-\x8d\x2e\x2c\x30\x6a\x7e\x23\xe0\x5b\x6e\xf2\x0d\xd7\x06\x58\xd1\
-\x12\x17\x33\x6d\x4b\xae\xa2\xc6\xb7\x9c\x49\x7f\x1a\x41\x68\x1c\
-\x98\xbd\x7b\xef\xbe\x03\xc1\xdc\xc5\x70\x9a\x03\x98\xbf\x7d\x3b\
-\x38\x7d\xe6\x6c\xb0\xff\xe0\x21\xbd\xd0\x0f\x67\x61\xb1\x6c\x20\
-\xe9\xef\x41\x1f\x9a\x2c\xd0\xbf\x86\x7e\x36\xee\x24\x98\x34\xb5\
-\x58\x7f\xfa\x9a\x30\x0b\x77\x25\x68\xf6\xa2\xf6\xe1\xf0\x91\xa3\
-\x7a\x61\x32\x48\x66\x11\xcf\x0a\xb3\x74\xd3\xc7\x86\xb5\x65\x61\
-\x61\x41\xf7\xf1\x38\x7a\xec\xb8\x5e\x38\xcf\x9d\x3b\x95\x67\x33\
-\x77\x61\xb2\x4d\xfa\xd8\xb8\x33\x73\x13\x27\xf1\x70\x6f\xc7\x4f\
-\x9c\xd0\xb3\x55\xa7\x13\xf6\x55\x62\xa6\x6e\xa0\x3f\x8d\xdb\x47\
-\x89\xb8\x98\x21\x1d\xff\x53\xa7\xce\x44\xce\x13\xe7\xd8\xb1\x13\
-\xa5\x78\x70\xd3\x67\xc6\x8a\xa5\x6a\x5c\xbb\x7a\x2d\x38\x71\xe2\
-\x94\x5e\x5b\x16\x55\xde\x33\xd9\xe4\xa9\xd3\x67\xf4\x32\x3b\x3b\
-\x5b\x35\xbe\x70\x82\xca\x39\x15\xfe\xb4\xbe\x0f\xfa\xce\x10\x8f\
-\x8b\xf5\xb7\xd0\x14\xc5\x7d\x31\x59\x2a\xf7\x18\xce\xf4\xbd\xf2\
-\xd9\xca\xfd\xc5\x92\x71\x54\xa1\xce\xa2\xca\x47\xbc\xb4\xad\xc0\
-\x69\x8a\x9a\x1a\x51\xef\x82\x50\x0c\x97\x2e\x5f\xd1\x46\x85\xe9\
-\x0d\x26\xd4\x02\x08\x1a\x44\x0c\x02\x62\xc3\xf4\x94\x5e\x70\x1f\
-\x3b\x7e\x42\x4f\x89\x50\x0b\x88\x05\x6a\x0e\x98\xf1\xda\x4e\xd6\
-\xa9\x05\x8d\x32\x90\xdd\xdd\xdd\x7a\x26\x6e\x66\xa5\xa6\x2f\x49\
-\x9a\xb1\xe6\x1a\x4e\x9c\x38\xa9\x67\xc9\x1e\x1f\x1b\x0d\xd6\x4f\
-\x4c\x68\xd1\xb1\x70\x9b\xf9\xfc\xfc\x61\x86\xee\xb9\xb9\x4b\xc1\
-\xe8\xe8\x88\x5a\x46\xb5\x1f\x82\x81\x99\xc2\x31\xaa\x93\xeb\x27\
-\xf4\x82\x58\xe2\xfa\x7c\xfa\x7c\x30\x23\xf7\x45\x25\x0a\x99\xcc\
-\xd3\xce\xae\xad\x05\x8d\x12\x21\x18\x77\xfa\xc6\x8c\x0c\x0f\xeb\
-\x26\xa1\x4a\x8c\xa9\xfb\xb2\x35\x34\x1c\xc3\x36\x68\x41\xa3\xd2\
-\x90\x7d\xd3\xd3\x93\xc1\xd0\xd0\xa0\x12\x64\x57\x52\xe3\x63\x96\
-\x6c\x1b\x0f\x79\xcb\x52\xad\xe6\x87\xf7\x27\x02\x82\xe9\x2e\x98\
-\xb5\x7b\x9d\x5a\x00\x21\x32\xa3\xca\x08\xe9\x4f\xba\xb3\x90\x26\
-\xe7\xce\x9f\x57\xc7\x24\xa7\x0d\xf7\xcc\x7e\x66\x79\x1f\x1d\x19\
-\xd1\xf7\x71\xf7\xee\x3d\x1d\x4f\x5c\xd8\xb8\x20\xac\x6f\x28\xd1\
-\xcb\xfd\xd1\xfc\xc6\x2c\xe9\xdc\x67\x1e\xc2\xa6\xbe\xe4\x6e\xc3\
-\xa4\x56\x26\x05\x69\x7e\x12\x84\x26\xc1\xfb\x85\xe7\x19\xee\xba\
-\x32\x14\xfc\xf2\x9f\x98\x18\x0b\xa6\x94\x11\xb4\x20\x72\x7a\x94\
-\xd0\xd8\xb6\x75\x4b\x30\xbc\x6e\x9d\x5e\x36\x6d\xda\x18\x2c\x31\
-\x69\xa5\x32\x30\x59\x21\x3e\x84\x0a\x82\xc6\x9d\x17\x8a\x5f\xfe\
-\x9c\x87\x3e\x15\x08\x9d\xb1\xb1\x31\xb5\x1e\x48\xad\xad\xb9\x7a\
-\xf5\xaa\x12\x31\x77\xd5\xb5\x4e\x6a\x31\x82\xe1\xdd\xbc\x79\x93\
-\xee\x50\xeb\xcb\xad\x5b\xb7\xf4\xf5\x20\x68\x26\x26\xc6\x8d\x6f\
-\x78\x2d\x88\x2b\xae\x71\x70\x70\x50\x2f\xd3\x53\x93\xfa\x9e\x11\
-\x41\x96\xa4\x3c\xa0\x46\xe4\xc2\x85\x39\x2d\x68\xc6\x8c\x30\x04\
-\x44\x0e\xc7\x6f\xd8\x30\xad\x8c\xf4\x3a\x25\x76\x46\xb4\xbb\x12\
-\x83\x83\x6b\x4b\xf7\x43\x7f\x1a\xb6\x81\x2f\xa0\xba\x95\x28\xc1\
-\xd0\xd3\xc7\x06\xe1\x44\x07\xe2\x2b\x57\xca\xd7\xe6\x42\x3a\x96\
-\xe3\x19\xd4\x4b\x35\x6e\x2b\x71\xc8\x35\x93\xae\x56\x98\x01\x79\
-\xce\xb9\xa7\x54\x7a\x0c\x0c\x0c\xa8\xf3\x0e\xa8\xb4\x9b\x08\xee\
-\x2f\x29\x11\x74\xfd\x86\x09\x15\x85\x1a\x29\xf6\x23\xae\xc2\xf4\
-\x5c\xab\xaf\x1d\xbf\x34\xd1\xaa\x9b\xcb\xd4\x35\x4c\xae\xe7\x98\
-\xb5\x41\x5f\x5f\xaf\xbe\x8e\x5e\xb5\xbe\xee\x9c\x47\x7e\xbc\x0a\
-\x95\xc8\x4d\xd4\x78\xbf\x6f\xa5\xe9\x49\x10\x1a\x82\xd3\x67\xce\
-\x04\x9d\x5d\x9d\xea\x57\x7c\xd9\xb8\x03\x35\x35\x18\x38\x9a\xa4\
-\xec\x62\x3f\x5d\xbe\xeb\xd1\x1c\xe3\xbe\x0b\x88\x0b\x83\x8c\x91\
-\x8d\x4f\x74\x69\xcf\x43\xd3\xd3\x81\x03\x87\xf4\x82\x61\x43\xb8\
-\x24\x71\xeb\xd6\xbc\x5e\x0f\x0c\x44\x3b\xce\x22\x46\x7c\xa1\xb6\
-\x83\x7b\xb6\x35\x34\x96\xdb\x0b\x0b\xda\xa0\x1e\x3e\x7c\xb4\xb4\
-\xd0\x04\x03\xd5\x9a\x59\xce\xcf\x84\x71\x8e\x28\xa1\xe4\x42\x73\
-\x1d\x06\x79\xcd\x9a\xf2\xf5\xb9\xee\x28\x95\xdf\x8b\xc4\x45\xff\
-\x18\x9a\x9e\x68\x4e\xb2\xcd\x4b\xd5\xae\x2d\x0b\x17\xe6\xe6\xf4\
-\x7d\xc4\xf3\x69\x91\xda\x30\x75\x6e\xd2\x83\xe5\xe4\xc9\x53\xa5\
-\x0e\xc8\x77\x52\xce\x4f\xde\xf6\xf4\x74\x9b\xda\xa1\xf0\xde\x10\
-\x59\xf8\xb9\xcd\x98\x2e\xd4\x46\x01\x4d\x4e\x34\x3d\xd9\x85\x7c\
-\xc9\xf3\x3e\x85\xd6\x46\x6a\x6a\x04\xa1\x4d\x19\x1e\x1a\xd2\x35\
-\x09\xd4\xd6\xc4\x41\x84\x6c\xdd\xba\x25\xb6\x6c\x0e\x46\xc7\xca\
-\x35\x11\xbe\x50\x4b\x80\x58\x49\xea\x4f\xc2\x79\xb6\x6c\xd9\xa4\
-\x9b\x9f\xdc\x25\x09\xfb\x0b\xbd\xab\x8b\xd1\xe0\xd3\xa9\xf4\x4b\
-\x7e\x68\x70\x50\xdf\x33\x7d\x42\xe2\x20\x96\xa8\xa9\x89\x2f\x6e\
-\xad\x45\x12\x83\x6b\xd7\xea\x38\xa9\xad\x71\xc1\xcf\xfb\xd7\x9e\
-\x07\xd4\xcc\xd0\xf4\x14\x5f\xf2\x62\xa0\xbf\x5f\x5f\x73\xd2\xb8\
-\x38\xd4\x9a\x50\x53\xc3\x42\xed\x8b\x5d\xd6\xad\x0b\x9b\xa8\xf2\
-\x84\x1a\x9d\xa4\xa5\x56\x7c\x6b\x76\x7c\xb3\x4a\x6a\x8a\x1a\x9b\
-\x86\x17\x35\xfe\x05\x52\x0a\x9a\xd0\xba\x78\x97\xef\x0c\xcf\x01\
-\x06\x9b\xa6\x27\xfa\x83\xb8\x9d\x84\xfb\xfb\xfa\xf4\x2f\x6d\x8c\
-\xe8\xa0\x12\x1d\x76\x41\x80\x24\x4d\x5a\x59\x09\xe2\xa2\xe9\x8a\
-\x63\xcf\x9f\x9f\xd5\xfd\x68\x2c\xf6\x3c\xf4\x9b\xa0\xf9\xc9\x5d\
-\x92\x20\x1c\xb8\x4d\x11\x90\xa5\x33\x2f\x86\x98\xa6\x27\xdd\x77\
-\xc4\xe9\x24\xdc\xa7\xe2\xa6\xb6\x06\xe3\x8d\xb8\x71\x97\x6a\x35\
-\x41\x18\x5c\x9a\x9e\x88\xd3\x6d\x5a\x21\xfd\xa8\xe1\xb8\x7b\xb7\
-\x7c\x7d\xae\x3b\x0b\xbd\x3d\x3d\xba\x86\xa3\xa7\xa7\x57\xc5\xdb\
-\x1f\x59\xf2\x82\x7e\x37\x34\x3d\x21\x40\xdd\x4e\xc2\x34\x11\x52\
-\x5b\x43\x2d\x0b\x79\xd0\xa7\xf2\xcd\x2e\x69\xfd\x74\xb8\x5e\xfa\
-\xd3\xb8\x35\x2c\xd4\xc0\xe1\x47\xbe\x27\x61\xf3\x97\x63\xc8\x87\
-\xf8\xd2\xbc\x88\x0d\x5b\x4d\xa4\xa6\x46\x10\xda\x18\xfa\xa7\x20\
-\x38\xe8\x67\x72\x43\x19\x33\xc0\xf0\xc3\xb1\x63\xc7\xb5\xd8\xb9\
-\x7c\xe5\x8a\x5e\xce\x9f\x2b\x8f\x42\x9b\x95\xa9\xa9\x29\xdd\xb4\
-\x41\xb3\x05\x1d\x4e\x81\x3e\x2d\xd4\x0c\xd0\x19\x17\x31\xc0\x42\
-\x6d\x87\xfb\x75\x94\x0b\x9d\x4d\x89\x63\x66\x76\x56\x0b\x12\xfa\
-\xba\x30\x6a\x70\x5a\x73\x55\x1a\x9c\x17\xb1\x42\x67\x61\xfa\xd8\
-\x60\x4c\x30\xe8\xc0\x97\x58\xf4\x21\x21\x6e\x16\xb7\xf6\xa5\x92\
-\xd1\xa1\x2f\x0d\x22\x86\x3e\x29\xf6\xab\x23\xdb\xc4\x45\x4d\xd8\
-\xf5\xeb\xd7\x74\x4d\x55\x52\xad\x98\x0f\xdc\x3b\x69\x35\x33\x33\
-\xa3\x3b\x07\xb3\x70\x9d\xae\x48\x8c\x63\x45\x02\xd7\xe4\xf6\x0b\
-\xaa\x04\xb5\x52\x08\x08\x3a\x0b\xd3\x34\x08\x88\x40\xe0\x8b\xa4\
-\xeb\xd7\xae\x29\xf1\x76\x43\x2f\x95\xbe\x54\xe3\x98\x8e\xce\x8e\
-\xb0\x5c\x29\xb1\x87\x70\x26\x2d\xf1\x1b\x1e\x5e\x5e\xf3\x45\xda\
-\x92\x27\x34\xd7\x71\x5f\x2c\x1c\x67\x85\xa2\xbd\x16\x31\xfc\x42\
-\x35\x72\x11\x35\xbe\xe5\x4c\xfa\xd3\x08\x42\x63\x81\x91\xa0\xa3\
-\x2e\x62\x81\x3e\x36\x7c\xf1\xc3\x2f\x69\x3a\x09\x53\x43\x31\x77\
-\xf1\xa2\x36\x66\x7c\xb5\x72\x57\x89\x91\x5a\xbf\x7e\xe2\x57\xfe\
-\xa6\x8d\x1b\xb4\x00\xb1\xfd\x31\xa8\x65\xa0\xe9\x69\x4d\x57\x97\
-\xee\x47\xc1\x72\x53\x89\x8c\x34\x68\x76\xe2\xba\xa8\x55\xe1\x2b\
-\x29\xfa\x80\x60\xb8\xf9\x4a\x28\x2b\x08\x37\xee\x99\x3e\x36\x7c\
-\xc9\x43\x3c\x5c\x1f\xf7\x8c\x80\xc3\x00\x5f\x54\x46\x1b\x01\xe6\
-\xf3\xf5\x13\xac\x5f\x1f\xc6\x49\x1f\x1b\x8e\xa1\x26\x83\x8e\xc1\
-\x9d\x9d\x9d\xfa\x7a\x11\x22\x74\x86\x46\xfc\x44\xa9\xfe\x5e\xe4\
-\xfa\x68\x6a\x22\x2e\xc4\x18\x4b\x25\x41\x03\x34\x0d\x21\x50\xa8\
-\xd9\xba\xaa\xc4\x88\x2f\x08\x3c\xee\x83\xf4\xe5\x3e\x7a\x7a\x7a\
-\x74\x47\xf2\x35\x6b\xba\x82\x2b\x2a\x1e\x9a\xa7\x48\x23\xf6\xa5\
-\x7d\xfd\xd4\xdd\xdd\xa3\x3b\x5a\x73\x0c\x61\x39\x3f\x65\x60\x5a\
-\x89\xdb\x4a\x1d\xbb\xf9\x02\x8f\xe6\x4a\x44\x8c\x15\x37\xb6\xaf\
-\x4d\x91\x78\xdb\x30\x11\x55\x0d\x4f\x87\xcd\x24\x33\x1d\x79\xc7\
-\x63\x8f\x7f\x20\x71\xfc\xf3\x37\xbe\xe9\x4d\xc1\xdb\xdf\xfa\x16\
-\xb3\x15\xa5\x48\x51\xe3\x53\x88\x92\xc2\x7c\xe1\x0b\x5f\x36\x2e\
-\x41\x68\x2e\x18\xad\x37\xde\x04\xe3\xfd\x32\xf5\x0d\x67\xf0\x8d\
-\x37\xfe\xec\xda\x8e\xc3\xf1\x51\x85\x33\x9e\xde\xff\xfc\x39\x87\
-\x73\x29\x2a\x6e\xff\xe0\xcd\x71\x6f\x35\x9c\x5e\x91\xef\xbd\x65\
-\xcf\x03\xdf\x78\x8d\xa3\x0a\x59\xcf\x1f\x92\xed\xde\x3e\xfd\xe9\
-\xcf\xaa\x1f\x12\xcb\xe7\x06\x5b\x5c\x5c\xd8\xfb\xb1\x8f\x7e\xe4\
-\x83\xca\x89\x92\xc4\x4e\xd3\x96\xc9\x82\xea\x63\xa1\x8a\x10\xa5\
-\xcb\xda\xfa\xd9\x30\x84\xe7\x38\x4e\xa2\x4e\x55\xd3\x8d\x34\x05\
-\x0d\xdd\xfc\xd4\xc2\xe9\x2e\x08\xde\x78\x3f\x07\xab\xf4\xbc\xf0\
-\xeb\x99\xbe\x11\x6b\x07\x06\x8c\x4f\xeb\xd3\x8c\xef\x22\xdf\x6b\
-\x96\xf7\x6c\x91\x48\x1e\xac\x36\xd2\xa7\x46\x10\x04\x6f\xf8\x94\
-\x98\x0e\xbf\xf4\xc3\x59\x6f\xfa\xde\x58\x9a\xf1\xbd\x2c\xc6\xa4\
-\x48\xf2\x35\xe8\x92\x57\x82\x0f\x2b\x16\x35\xbe\xe5\x4c\xfa\xd3\
-\x08\x42\x63\xe1\x6d\x4c\x9c\x67\x97\xbe\x28\xdb\xb7\x6f\xd5\x9f\
-\x77\x77\x75\xc9\x6f\xa2\x34\xfc\xed\xaf\x67\x1e\x88\x41\xcf\x8c\
-\xbf\x58\x32\x8e\x2a\x48\x1e\x34\x07\x0d\xfb\x56\xf2\x2f\x90\x52\
-\xd0\x04\x61\xb5\xa0\x86\x66\x79\x47\xd7\xda\xc8\xfb\x19\x97\x77\
-\x41\x99\xfc\xd3\xd6\x38\x04\xa1\xc1\x91\x9f\x5a\x82\xd0\xc0\x78\
-\x1b\x6a\xb1\x3a\x99\x11\xb1\xd4\x3c\x34\x67\x1e\x48\xf9\xaa\x07\
-\xab\x22\x6a\xa4\xe9\x49\x10\x1a\x0b\x6f\x83\xee\xfd\x62\x36\x0e\
-\x41\xd0\xf8\x96\x1b\x29\x38\x42\xbe\xac\x48\xd4\x48\x79\x14\x04\
-\xa1\x11\x68\x24\xe3\xe8\x7f\x29\x62\xf8\x8b\xc2\x5b\xb4\x7b\x26\
-\xad\xe4\x41\xf3\xd0\x90\xcd\x4f\xfe\x05\x52\x0a\x9a\x20\x54\x7b\
-\x33\xbf\xb8\x77\x7f\x70\xe2\x64\x38\x39\x63\x3d\x60\x94\xde\x23\
-\x47\x8e\x9a\xad\x90\x7a\x3d\xe3\x67\xce\x9c\x0d\x8e\x1f\x3f\x61\
-\xb6\x5a\x8b\xf0\xcb\xb4\x99\xdc\xd3\x96\x51\x90\x93\xe6\xca\xca\
-\x9b\xd9\x0b\x73\x7a\xa0\xc7\xd6\xa0\x3e\xe5\x5b\x90\x3e\x35\x82\
-\xd0\xb0\xb4\xca\x0b\xcf\x4e\x8b\xd0\x08\x30\x62\x32\xe4\x6d\xf8\
-\x5b\x99\xa5\xa5\xfb\xde\xa3\x2a\x87\xd4\x96\xb6\xf7\x53\xce\x21\
-\x79\x20\x64\xa1\x66\x51\xe3\x5b\xce\xa4\x3f\x8d\x20\x34\x16\xde\
-\x06\xdd\xdb\x38\x19\x47\x0a\xdb\xb7\x6f\x0b\x76\xed\xda\x69\xb6\
-\xea\xcb\xd6\x2d\x9b\xf5\xf5\xd4\x1f\xdf\xb4\xad\xff\xfb\x93\x89\
-\x4f\xa7\xa7\xa7\xcd\x56\x71\x30\x03\xf8\x86\x0d\x53\x66\xab\x71\
-\x10\x51\xd5\x5c\x48\x4d\x8d\x20\x08\xab\x8a\xb7\xa8\xca\x39\xdc\
-\x6a\x20\xf6\xaf\xfe\xf8\x97\x1b\xe3\x10\x5a\x8a\x86\x13\x35\xcd\
-\xf8\x22\x13\x84\xbc\xf1\x2e\xdf\x35\x3c\x07\xf4\xaf\xd9\xbb\xef\
-\x40\x69\x56\x6e\x98\xbf\x7d\xbb\xe4\x7f\xf8\xc8\x51\x3d\x3b\xb7\
-\xcb\xbe\x7d\x07\xf5\x24\x8a\xcc\xd4\x8d\xfb\xa6\x39\x76\x61\xe1\
-\x8e\xee\xa7\x72\xf0\xd0\xe1\x60\xff\xfe\x83\xba\xff\x4c\x7c\xa2\
-\x45\xfc\xd8\x67\x39\x7a\xf4\x98\x5e\x5c\x92\xfc\xb8\x1e\x66\x0a\
-\x07\x9a\xb0\x98\x64\x92\xed\x83\x07\x0f\xeb\x7d\xf1\x99\xa7\x99\
-\x6c\x73\x6e\xee\xa2\xee\x33\x73\xe8\xd0\x11\xbd\x66\xdb\x9d\x84\
-\x93\x6b\x65\x9f\xcb\xe1\xc3\x47\x4b\x93\x6c\x5a\x92\xfc\x98\x58\
-\x11\x3f\xe6\xbd\x3a\xa9\xce\xcf\xec\xd1\x2e\x34\xd1\x5c\xbe\x74\
-\x49\xdd\xef\x29\x7d\x2f\xac\xd9\x5e\x5a\x2a\x37\xbf\x31\xa7\x0f\
-\x0b\x93\x5b\x1e\x3f\x71\x72\x59\x1c\x96\x93\x27\x4f\xeb\xc5\xe5\
-\xd4\xa9\x33\x7a\x71\xe1\x7a\x5c\xbf\x78\xb9\x59\x58\x58\xd4\xe9\
-\x76\x52\xe5\x01\x0b\x7d\x6e\xee\xde\xbd\x1b\x09\xb7\xb8\xb8\xa8\
-\x27\x13\x3d\x71\xe2\x94\x4a\x9f\x73\xc1\x35\x27\x5d\x09\xc6\xbd\
-\xba\x7d\x6a\x70\xe3\xe7\x92\xe4\x47\x7a\x70\x7f\x67\xcf\x9e\xd7\
-\xf7\xc2\xb9\x99\x75\x3b\x0d\xfa\xd4\xc4\xef\x8f\x38\xc8\x67\x46\
-\xb1\x3e\x7d\xfa\xac\x9e\xf5\xfb\x66\x85\x38\x1a\x03\xbf\x67\x52\
-\x6c\x58\x31\x48\x4d\x8d\x20\xb4\x11\x18\x41\x04\xc9\xa6\x4d\x1b\
-\x82\xc1\xb5\xe1\xdc\x4d\x56\xd0\xf4\x74\x77\x07\x5b\xb7\x6e\x09\
-\x46\x46\x46\xb4\xf1\x60\x8e\x27\x17\x66\xad\xbe\xaa\x8c\x31\xb3\
-\x28\xaf\x59\xd3\xad\x05\xcd\xf1\x13\x27\x82\xdb\xea\xf8\xc9\xf5\
-\x13\x7a\x16\x69\x0c\xe4\xa9\xd3\x67\x2a\xce\x20\x3d\x34\x34\xa4\
-\x67\xeb\xbe\x73\x87\x79\xf6\x02\x7d\x7c\xb8\x7d\x57\xbb\x81\x7d\
-\x0b\xb7\x17\x82\xc1\xc1\x41\xbd\x4d\x67\x55\x66\x7a\x66\x96\xeb\
-\xcd\x9b\x37\x06\x03\xfd\xfd\xda\x10\xbb\xc2\xe6\xfc\xf9\xf3\xfa\
-\x9a\x39\x86\x91\x8f\x59\xb3\x8d\xb8\xa8\x65\x76\x71\xd7\xe8\x68\
-\x41\xa3\xae\x81\x59\xbc\x69\x8e\x61\x06\xec\x8b\x4a\xf8\x5d\xbb\
-\x76\xdd\x84\xe0\xfc\x33\xc1\x65\x65\xc4\x07\xd7\xae\xd5\x33\x87\
-\xb3\x66\x1b\x21\xe5\x0a\x9b\x05\x95\x46\xcc\xda\xcd\x3d\xf4\xf6\
-\xf6\x18\xdf\x28\x83\x83\x6b\xb5\xf8\x60\x01\xc4\x89\xdd\xc6\x0d\
-\xd6\x4d\xd8\x24\xd8\x37\xa3\xc4\x06\x82\x70\x5c\xa5\x1b\x0b\xf7\
-\xc4\x7d\xd8\x3e\x32\x5a\xd0\xa8\xbc\x5e\xb3\x66\x8d\x6e\xfe\x19\
-\x52\x71\x71\xcd\x95\xc4\x47\x65\xca\x69\x86\xa0\xbc\x7e\xe3\x86\
-\x4a\xab\x21\x95\x1e\x13\x7a\xd6\x72\x66\xf8\x26\x6e\x5f\x83\x8e\
-\xb8\xbe\x71\xf3\xa6\xbe\x2e\xd2\x94\xd9\xca\xb9\xbe\xc6\x17\x36\
-\x42\xbd\xa8\x49\xd4\xf8\x0a\x4c\xe9\x4f\x23\x08\x8d\x03\x06\x0e\
-\x83\x80\xa0\x19\x56\x46\xd9\x82\x80\x41\xd0\x6c\xd8\x30\xad\x85\
-\xce\xc4\xf8\x98\x1e\x39\x18\x03\xe4\xb2\xa4\x84\xc1\xf6\x6d\xdb\
-\xb4\xa8\xe8\xed\xed\x56\x86\xf9\x82\xf6\xdb\xb2\x25\x14\x42\x2c\
-\xb8\xf1\xc3\xa0\xa5\x31\x30\xd0\xaf\xd7\xb6\xb6\xe7\xfa\xf5\x1b\
-\x4a\x2c\xac\x09\x3a\xbb\x3a\xb5\x1b\xec\x3e\x04\x10\x7e\xb7\x6e\
-\xcd\x07\x9b\x37\x6d\x0a\x86\x87\xd7\xa9\xe3\x07\xb4\x91\x24\x9e\
-\x4b\x4a\x68\x01\xe2\x86\x30\x88\x99\x89\x89\x71\x1d\x8e\x35\xdb\
-\x88\xa5\x6b\xd7\x92\x6b\x44\x7c\x41\xc0\x20\x68\x38\x2f\x23\x2a\
-\x8f\x8c\x0c\xeb\xf5\x95\x2b\xa1\xf0\x43\xdc\xcc\xcf\xdf\xd6\x86\
-\x77\x54\x89\x87\xa1\xa1\x75\x7a\xcd\x76\x78\xfe\xb2\xf8\x21\x7d\
-\xb8\x2e\x96\x7e\x25\x6c\x92\xb0\xa3\x36\x5b\x71\x78\xeb\xd6\x2d\
-\x2d\x3c\x48\x23\xdc\x60\xf7\x91\x1e\x49\x5c\xbe\x7c\x39\xe8\x56\
-\xc7\x4c\x4f\x4f\xe9\xfc\xd4\xf3\x75\xa9\xeb\xe7\xfc\x37\x4c\x3a\
-\x23\xfa\x08\x33\xae\xf2\xbc\xaf\xaf\x37\x58\xa7\xd2\x8d\x75\xbc\
-\x16\x2c\x2b\x5c\xe3\x6d\x25\x4a\xa7\xb4\xb8\x5c\x5b\x4a\x33\xe2\
-\x76\xd3\xa2\x12\xe4\x27\xc2\x76\xfd\xc4\x44\xb0\x56\xc5\x81\xa0\
-\x21\x5f\x7b\x55\x1c\xd7\x57\x28\x6a\xbc\x6d\x98\x6f\x40\xa1\x61\
-\x68\xca\x9a\x1a\x29\x68\x82\x90\x8d\x5b\xca\x00\xd2\x7c\x84\x61\
-\x73\x05\x0d\x50\x53\x83\x01\xa2\xe9\xc9\x2e\x88\x0a\x66\xe2\x76\
-\xe1\x58\xc4\x8c\xe5\xa6\x32\x5c\x18\xa9\x9e\x9e\xb2\x1f\x6e\xfc\
-\x88\x33\x09\x9e\xdd\xb5\x6b\xd7\x46\x8c\x33\x4d\x31\x88\x17\x66\
-\xfd\xc6\x6d\xfd\x10\x3a\xc4\x65\xc3\xd1\xbc\x41\xd3\x93\x5d\x30\
-\x7a\x08\x06\xb8\x71\x23\x34\xd2\xb6\x66\xc7\x62\xb7\x09\xbb\x12\
-\xa8\x5d\xc1\xc0\xd2\xf4\x64\x17\x44\x4c\xfc\xfc\xdc\x9b\x8b\xdd\
-\x8e\xd7\x5c\xa5\xd5\xae\x58\x10\x3b\xa4\x11\xe7\x00\x6a\x37\xb4\
-\x38\xe8\xeb\x2b\xd5\xa2\x90\x47\x08\x9d\xb4\xda\x9e\x45\x6a\xbb\
-\x16\x16\x83\xe3\xc7\x4f\x96\x16\x9a\x70\xe0\x8e\xa9\x01\xb2\x61\
-\x68\x7a\xb2\x0b\x65\x81\x5a\xa0\x95\xbc\x66\x89\x03\x68\x36\xb2\
-\x4d\x69\x2c\x36\x6e\x1f\xa8\x1d\x03\x44\x37\xd7\x6d\x17\xf2\x21\
-\x2d\x0e\xb1\x0d\x42\x43\x89\x1a\x29\x90\x82\x90\xe1\x39\xc8\xf8\
-\xbc\xd0\x0c\x80\x21\xbc\x6c\x6a\x17\x5c\x10\x2c\x34\x3d\x95\x97\
-\xcd\x7a\x29\x8a\x75\x4a\xc4\x20\x8a\x6c\xd3\x13\xb5\x2e\x08\x10\
-\xdc\xf8\x21\x42\xe2\x02\x85\x1a\xa2\xf8\x42\xad\x93\x4b\xda\x24\
-\x9b\x9d\x9d\x2b\x7f\xd5\x51\xdb\x40\xd3\x53\x7c\x71\xe9\xec\xec\
-\x32\xae\x28\x5d\x5d\xc9\xfe\x95\x40\xe4\x21\x0e\x11\x1d\x18\x71\
-\x04\x1e\x22\xc9\x36\x3b\x21\x78\xaa\x89\x23\x8e\xa1\x59\xd0\x5d\
-\x68\x66\xa2\xc6\xc3\x42\x18\xfc\xe2\x4b\x1e\x50\x33\x94\xb4\x64\
-\x81\xda\xae\xa4\xa5\x31\xf1\x7b\x26\xc5\xd6\x15\x47\x53\xd6\xd4\
-\x08\x82\x90\x0d\xfa\x6f\x6c\xd9\xbc\x49\x8b\x17\x06\x38\x73\x6b\
-\x52\xf8\xf5\xcf\x36\x46\x9b\xe6\xa7\xb5\x6b\xfb\x75\x38\x96\x4a\
-\x70\x1c\xbf\xbc\xdd\x1a\x1d\xdc\xf8\x61\x90\x2b\x81\x31\xb6\xcd\
-\x54\xd4\xc8\x60\xac\x11\x5d\xd4\x4e\xd8\xa6\x2b\x6a\x6f\xc0\x36\
-\xaf\x84\xe2\x67\x60\xd9\x02\xb6\x49\x2b\xde\x6c\x62\x6b\x50\x6c\
-\xb8\x24\x38\xff\x6d\x53\x2b\x00\xb6\x86\xc0\xa5\xb7\xa7\x47\xd7\
-\xd6\x50\x2b\x42\x3a\xb9\x0b\xd8\xf8\xaf\x5f\x8f\x9e\xff\xe6\xcd\
-\xb0\x56\xc5\x86\xcb\x02\xe9\x4f\x1a\xd1\x8c\x44\x8d\x0c\xb5\x37\
-\xf8\x91\x46\xf8\x41\xa5\xfb\xa2\x49\x91\x9a\x98\x1e\x75\xed\xf4\
-\x67\x29\x2f\xbd\x3a\xbe\x68\x98\xb0\x86\xcd\x5d\xd2\xb0\x02\xf1\
-\xce\x9d\xb0\x6f\x0f\x90\x36\x2e\xf6\x78\xfa\xf3\xc4\xd3\xab\x52\
-\xdc\x2e\x34\x37\xc1\x5d\x95\xef\xb8\xe3\x8b\x20\x24\x91\x59\xd4\
-\x78\xff\x88\x94\xfe\x34\x82\xd0\x50\xf0\xeb\x90\xfe\x15\x18\x45\
-\x3a\xaf\xda\x81\xe8\xe8\xdb\x81\xf1\x3c\x71\xe2\xa4\xae\xc5\xa1\
-\x9f\xc5\xec\xec\x5c\xa9\x5f\x4b\x1a\xf4\x59\x21\x2e\x3a\xe2\xd2\
-\xb7\x84\x7e\x27\xb8\xf1\x5b\xbf\x7e\xbd\x09\x95\x8c\x6d\x82\xe2\
-\x1c\x56\xbc\x00\x62\x08\x3f\xdb\xf4\x04\x74\x4c\x46\xb4\xd0\x31\
-\xd8\x76\x0e\x66\xe1\xab\x1e\xdb\x34\x35\x3a\x3a\xaa\xfb\x5a\xd0\
-\x54\xc1\xc2\x7e\xeb\xe6\x58\xb7\x66\x22\x0e\x35\x42\xdc\x3f\x1d\
-\x7d\xb9\x07\xd6\x5c\x9b\x0b\x7d\x4e\x08\x43\x27\x5b\xfa\x84\xb0\
-\x5c\x52\x61\x6d\xf3\xd0\xf0\xf0\xb0\x32\xb4\x3d\xba\x03\xf0\xdc\
-\xdc\x9c\x16\x37\xac\xd9\xc6\x90\xd3\xc7\x26\x0b\xe4\x95\xdb\x04\
-\xe5\xd6\xc8\x68\x11\xaa\xfc\x2a\x35\x3d\x01\x69\x02\x7c\x7d\x44\
-\x7a\xd0\x37\x89\x85\x7b\xb4\x8c\x8e\x8e\xe8\xfb\x22\x9d\x68\xd6\
-\x62\xe1\x8b\x25\xdb\x7c\x94\x84\xad\x41\x23\x9e\xeb\xd7\xf8\x32\
-\xe9\xbc\xde\x76\x41\x6c\x91\x7f\xf4\xcb\xb2\x9d\x83\x7d\xe2\x76\
-\x21\xdd\xc8\x53\xfa\x81\x71\x1c\x9d\x83\x59\xb8\x97\x24\xe1\xe9\
-\x5b\xfb\xe1\x6d\xc3\x7c\x03\x0a\x0d\x45\xc3\xd4\xd4\xf8\x17\x48\
-\x29\x68\x82\x50\x2b\xd4\x38\xd0\xe1\x96\x1a\x95\xd3\xa7\xc3\xcf\
-\x67\x31\x92\x34\x39\xd1\x44\x42\x2d\x0e\xfd\x20\x6c\x0d\x43\x25\
-\x30\xba\xd4\xfe\x50\x13\xc0\xe7\xb8\x7c\x1d\x45\x4d\x00\x9d\x89\
-\xdd\x7e\x36\x96\xf8\xb3\x6b\x6b\x73\xe8\x40\x6a\xb1\x06\xd3\xf5\
-\x03\x3a\x31\x63\x80\x11\x31\x56\xdc\xd0\x4f\xc8\x65\xd3\xc6\x8d\
-\xa5\x30\x18\x69\xd6\x13\x13\x63\xc1\xa6\x4d\x1b\x4d\x88\x64\x10\
-\x2c\x88\x9e\xd0\xf0\xde\xd0\x1d\x9e\x49\x27\x17\x6a\x06\x68\x6a\
-\xea\xec\xe8\xd0\x62\x4a\x0b\x2a\xa7\xb6\x0b\xf4\x35\xaa\xeb\xa6\
-\xff\x0c\x62\x86\xf5\xd8\xd8\xa8\xf2\x8f\x36\x51\x65\x81\xbc\x01\
-\x84\x9d\xc5\xf6\xd3\x71\xfd\x92\xde\x8b\x08\x9e\xa9\xc9\x49\x25\
-\x7e\xba\xf4\x97\x63\x88\x10\x44\x2b\x61\xed\xd7\x4f\xe4\x1d\x4d\
-\x4d\x1d\xea\xbe\xd8\xcf\x42\xf3\x5f\xa5\xf7\x2c\x79\xcc\x7d\xd2\
-\x2f\xe7\x8a\x8a\x97\xed\x91\x58\x3f\x2d\x40\xf4\x52\xfb\x86\x88\
-\xb1\xe2\xc6\x7e\xdd\xe6\x0b\x5f\x6c\x71\x9f\xc4\x81\xb8\x61\x49\
-\x12\x34\xcd\x84\xd8\xb0\x62\xe9\xb0\x09\xac\x0a\x75\x07\xab\xc7\
-\x1e\xff\x40\xe2\x98\xe6\x6f\x7c\xd3\x9b\x82\xb7\xbf\xf5\x2d\x2a\
-\x43\x8c\x47\x15\xb2\xd6\xd4\xf8\x66\xb4\x6f\xb8\x2f\x7c\xe1\xcb\
-\xc6\x25\x08\xcd\xc5\xf6\xed\x5b\x4b\x86\x2b\x95\x1a\x5e\x8c\xde\
-\xcf\x98\xe7\xb3\x9b\xf5\x12\xf2\x7e\xc6\x7d\xc3\x59\x8a\x8a\x17\
-\xfc\x0f\x69\x8e\x7b\xab\x21\x09\x14\xf9\x5d\x43\x6d\x79\x90\xef\
-\xbd\x65\xbf\x06\xdf\xf3\x57\x0e\xf7\xe9\x4f\x7f\x56\x8f\x65\x14\
-\x67\x71\x71\x61\xef\xc7\x3e\xfa\x91\x0f\x2a\x27\x8a\x14\x3b\x4d\
-\xbb\x2f\x0b\x2a\x8f\x05\xc5\x88\xd2\x67\x6d\xfd\x6c\x18\xc2\x73\
-\x1c\x27\x57\x97\x50\x43\x02\x37\x09\x85\xd4\xd4\x48\xd3\x93\x20\
-\x34\x16\xbe\xef\xb0\xa2\x04\x8d\xe0\x4f\x73\xda\x1b\xdf\x72\x23\
-\x05\x47\x28\x96\x4c\xa2\x46\xca\xa3\x20\x08\x45\xe2\x2d\xbe\x1a\
-\xe8\x65\xe4\x7f\x29\xf2\x02\x2d\x0a\xff\x72\x63\x1c\x55\x10\xf1\
-\xd5\xbc\x34\x44\x9f\x9a\xdc\x5f\x64\x52\x20\x85\x56\xa6\x09\xcb\
-\xb7\x18\x89\xe2\xc8\xfb\xfd\x29\x59\x55\x0b\xf9\xe6\x81\x50\x3b\
-\x0d\xd3\x51\x58\x10\x04\xa1\x28\xf2\x36\xfc\x82\x4b\xbe\x69\x2b\
-\x79\x20\xac\x04\x6f\x51\xe3\x5d\x20\xa5\x8a\x55\x10\x1a\x8a\xbc\
-\x9f\x5d\xb1\x39\x65\xfc\xd3\xc2\x37\x6d\x25\x71\xeb\x8d\xe4\x41\
-\x73\xd3\x7a\x35\x35\x52\x20\x05\xa1\xa1\xf0\x16\x55\x39\x87\x13\
-\xb2\xd3\x8c\x49\xeb\x5f\x6e\x8c\x43\x68\x69\xea\x2e\x6a\xe4\x45\
-\x26\x08\x19\x90\xe7\x40\x70\x90\xf7\x67\x23\x20\x79\xd0\x48\x48\
-\x9f\x1a\x41\x68\x43\x4e\x9c\x3c\xa5\x27\xae\xf4\x65\xdf\xbe\x83\
-\x7a\x42\x42\xfb\x5e\xde\xbf\xff\x60\x70\xea\xd4\xe9\x70\xa3\x46\
-\x0e\x1c\x38\x54\x1a\x00\x10\x70\x33\x51\xe5\x4a\x60\xa4\xe4\x43\
-\x87\x8e\x98\xad\x90\x24\x63\x72\xf6\xec\xb9\xe0\xf0\xe1\xa3\x66\
-\x2b\x84\x70\x8c\x12\x7c\xec\xf8\x09\x3d\x61\xa5\xcf\x00\x84\xb5\
-\x72\xee\xdc\x79\x9d\x9e\x8d\xca\xec\x2c\x13\x51\x9e\x32\x5b\xcb\
-\xb7\xcb\xa4\x1b\x6a\xee\x8f\x41\x10\xc1\xc7\xa0\x33\x80\xe3\xa9\
-\x53\xe5\xf2\x20\x08\xb5\x90\xab\xa8\x91\xfe\x34\x82\xd0\x58\xf8\
-\xfe\x3a\x94\x67\x37\xd0\x43\xf1\x33\x62\xed\xe0\xda\xb5\x01\x93\
-\x2e\xf6\xf4\x54\x9e\x5f\xc8\x33\x69\x15\xcb\x03\xda\x11\x7d\x5d\
-\xe4\x97\x7c\x76\xbc\xcb\xb7\x67\xd2\x4a\x1e\x34\x3f\x75\xad\xa9\
-\xf1\x2f\x90\xde\x25\xd2\x38\x04\x41\x68\x04\xf2\x7e\xc6\x8b\x34\
-\x3a\xd7\xae\x5d\xd3\x73\x4e\x21\x68\x18\xde\x1f\x77\x51\x30\x75\
-\x43\x91\xb3\xa0\xbb\xf8\xa7\xad\x71\x08\x75\x43\xf2\x60\xe5\x48\
-\xf3\x93\x20\x34\x0b\xf2\xc6\xcb\x4c\x16\xb1\xc4\x2c\xe0\x76\xf6\
-\xea\x66\xa0\x48\x81\x27\xf8\xe2\x5f\xbe\x84\xd5\x41\x44\x8d\x20\
-\xb4\x38\xcc\xc6\x7d\xfa\xcc\xd9\x60\xff\xc1\x43\x7a\xa1\x3f\xc7\
-\xbd\x7b\xe5\x29\xde\x6c\xd3\xd3\xdc\xdc\xa5\xe0\xc0\xc1\xc3\xba\
-\xff\xcc\xb1\x63\x27\x82\x85\x05\xa6\x8c\xf1\x83\xfe\x35\xf4\xb3\
-\x71\xfb\xa1\x30\xa1\x23\xfd\x64\xe8\x3b\x73\xf4\xe8\xb1\xe0\xd2\
-\xa5\xf2\xec\xd0\x3e\x5c\xbe\x7c\x59\xf7\xb1\x61\x6d\xb9\x77\x6f\
-\x49\x5d\xe7\xc5\xe0\xf8\xf1\x13\xba\xef\x0c\x7d\x68\xaa\x4d\x70\
-\x48\x53\x0f\x33\x6f\x1f\x3d\x76\x5c\x2f\x4c\x46\x69\x67\x28\x87\
-\x3b\x77\xee\xe8\x3e\x34\xc0\xec\xd7\xb8\x09\x93\x04\x71\xd1\xef\
-\x86\xfe\x25\xdc\x13\x73\xf4\x2c\x2e\x46\xcf\x7f\xf7\xee\x1d\xdd\
-\x07\xe5\xf8\x89\x13\x26\xcc\xf9\x65\xd7\x88\xdf\xd1\xa3\xc7\xcd\
-\x56\xb8\x4d\x9a\xc7\xc1\x8f\x6b\xb7\xb0\x4d\x33\x19\x69\x70\x52\
-\xa5\x39\x0b\xb3\x56\x73\x5d\x4c\x46\x69\xfd\x70\xc7\xb1\x61\x4e\
-\xa9\x3c\x39\x71\xe2\x94\x4a\xbb\x73\x7a\x12\xcf\x5a\x60\x76\x6e\
-\xd2\x80\xd9\xca\xab\x61\x0d\xfa\xdd\xbb\x77\xf5\xf9\x29\x8b\xf4\
-\x9d\xc1\x9d\xd4\x0c\x67\x61\x46\xf1\xd3\xa7\xcf\xea\xb5\x20\xf8\
-\x92\x9b\xa8\x91\x36\x79\x41\x68\x2c\x30\x26\x18\xef\x63\xca\x90\
-\xdf\x50\x62\x63\x62\x7c\x3c\x98\x9a\x5c\x1f\x2c\x2a\x23\xce\xac\
-\xc7\x2e\x97\x2f\x5f\xd1\x86\x7c\x74\x64\x24\x98\x9e\x9e\xd4\xb3\
-\x43\x33\xbb\xb3\x0f\x18\xdd\x9b\x37\x6f\xe9\x59\xac\xed\x44\x9c\
-\x08\x1a\x8c\x67\x77\x77\x77\xb0\x79\xf3\x46\x3d\xeb\x36\x33\x57\
-\x63\x90\x7d\xc0\x50\x13\x9e\x59\xb7\x47\x47\x47\x8d\x2f\xe7\x3a\
-\xaf\x67\xd2\x66\x06\xe8\x4d\x9b\xc2\xd9\xaf\x31\x92\x88\x9d\x24\
-\x30\x9a\x08\x2e\x66\xf4\xe6\xde\x98\xf5\x19\x11\xb3\xe0\xdc\x3f\
-\xd7\x48\x93\x53\xe8\x2e\x37\x3f\x25\xc1\xbd\x92\x96\x63\x2a\x1e\
-\x66\xe5\x86\xb3\x4a\x90\x2c\x2d\x85\x22\x11\x41\xc3\xf5\x20\x62\
-\xc6\xc7\x46\x55\x5c\xe3\xba\x06\xe8\x9c\x3a\x2e\xaf\xd9\xa5\xc9\
-\x2b\x04\x02\xf7\xd3\xa3\xae\x9d\xed\xb3\x67\xcf\xeb\xfb\xc2\x8f\
-\xbc\x43\x08\xe0\x6f\x21\xfc\x99\xb3\xe7\x74\x3a\x0c\x0d\x0e\xea\
-\x99\xc9\x87\x06\xd7\xd6\x54\x33\x45\xfa\xd3\xf7\x88\x34\x4a\x4b\
-\xa7\x24\x96\x96\x42\x1b\x31\x32\x3c\xac\xcb\xc3\xad\x5b\xf3\x91\
-\x6b\x74\xb9\xa9\xc4\x16\x65\x80\x19\xba\xdd\xd9\xc8\x5d\x7c\x6b\
-\x3f\x7c\x2b\x49\xa4\x36\xa5\x35\xa8\x5b\x4d\x8d\x7f\x81\xf4\x2e\
-\x91\xc6\x21\x08\x82\x05\xa3\xb1\xb8\x78\x27\xd8\x30\x3d\xa5\x44\
-\xcd\x98\x36\x7a\xdb\xb6\x6e\x09\x7a\x7a\xba\x4d\x88\x10\x6b\xe4\
-\x87\x95\xc1\x41\x48\x4c\x6f\x98\x0a\xba\xba\xaa\xbf\x1e\xf8\xba\
-\x05\xa1\x82\xa0\x71\x0d\x1c\x35\x09\x88\x85\xa9\xa9\x49\x2d\x74\
-\x10\x01\x6b\xd7\x0e\x24\xd6\xd6\xc4\x9f\xf1\x5b\xb7\x6e\x05\x33\
-\x33\xb3\xfa\x3a\xac\xd8\x80\xeb\xd7\xaf\x6b\x43\x88\x98\x18\x54\
-\x86\x79\x60\x60\x40\x09\xb0\xe9\x60\x49\x09\x9a\x6b\xd7\x92\xc5\
-\x12\x86\x11\x51\x31\xa9\xe2\x21\xbe\xe1\xe1\x75\xfa\x5a\xe3\xfd\
-\x65\xec\xb5\x63\xe4\x71\xf7\xf6\x2e\xef\x24\x4c\x2d\x14\x35\x39\
-\xf6\x9e\xfa\xfb\xfb\xb5\x3b\x3c\x7f\x58\x63\x71\xe9\xd2\x65\xbd\
-\xcd\x35\x0e\x0d\xad\x53\xcb\x90\x3a\x5f\x78\x8d\xec\xcb\x03\xae\
-\x91\xf3\x62\xec\x11\x77\x96\x69\x95\xc7\xf8\x91\x66\x84\x41\x68\
-\xda\xb4\x25\x8f\xb8\x06\x44\x2d\x82\x62\x50\x09\x9a\x75\x2a\x2d\
-\xfa\xfa\xc2\xfb\xf4\x7d\x7d\xde\xbe\x7d\x5b\xdf\x07\x69\x44\x3c\
-\x59\xa0\xcc\x21\xa6\x38\x37\xe9\xdb\xab\xce\x3d\xaf\xe2\x8b\x83\
-\xf8\x43\x34\x71\x2f\xe4\x57\xb3\xe3\x6f\xeb\x8c\x43\x58\x11\xd2\
-\xfc\x24\x08\xcd\x40\x8d\x6f\x3c\xdb\x1c\x84\x08\x70\x41\x70\xb8\
-\x0c\x2b\x03\xd5\xa9\x44\x0c\xcd\x25\x54\xf9\x63\xbc\xab\x81\x41\
-\xc2\xc0\x21\x56\xe2\xbf\xd8\xd9\x87\x50\xa2\xe9\xc9\x2e\x18\x59\
-\x04\x46\x35\xa8\xf9\xe0\x5a\xc6\xc6\xca\x35\x34\x80\xa0\x01\x3e\
-\x15\xa6\xe9\x89\x85\xeb\x85\xa4\x78\x31\x26\xd4\x18\x01\x02\xc8\
-\xc5\xbd\x7f\x5f\xa3\x63\xcf\x4f\xfa\x70\x5e\x96\xe3\xc7\x4f\x6a\
-\x3f\x6a\x42\x80\x9a\x90\xde\xde\x1e\x25\x2a\xca\xf1\x23\x30\xf0\
-\x5b\x58\x5c\x34\x3e\x2b\xc3\x15\x64\xb6\xa6\x25\x5e\xab\xc6\xb6\
-\xbd\x26\x20\x3f\xb8\x86\x9e\x9e\x1e\xe3\x53\x1b\x17\xe6\xe6\x82\
-\x8e\xce\x0e\x6f\xb1\xe1\xa6\x2c\xb5\x66\x88\x6c\x9a\x9e\x10\xad\
-\x94\x8f\xfb\xa6\xf6\xc6\xcd\x83\xb9\x8b\x97\xf4\x39\x10\x84\x8d\
-\x4d\x6d\xcf\xa4\x50\x2c\xb9\x88\x1a\x69\x7a\x12\x84\xc6\x22\x6e\
-\xa8\xbb\x3a\x93\x1f\x75\xfb\xec\xf6\xf7\xf7\x05\xbb\x77\xed\xd4\
-\xbf\xf2\xf9\xa5\x8c\xb1\x46\x84\x54\x83\x5f\xd3\x84\xbb\x72\x65\
-\x79\x33\x02\x62\x87\xa6\xa7\xf8\x52\x0d\x9a\x47\xa8\x55\xc0\xf0\
-\x25\x41\xb3\x53\x7c\xa1\x16\xa6\x12\x9d\x29\xf7\x5f\x0b\xd4\xf4\
-\x50\x13\xe3\x2e\x59\x6b\x2d\x5c\x7c\x45\xd5\x4a\x20\x3d\xf3\x60\
-\xad\x12\x87\x08\x91\xa4\x3e\x3b\xd5\x40\xd0\xd0\x87\x87\xda\x1a\
-\xf2\x8c\x1a\x9b\x24\xec\x39\xdc\xbe\x54\x82\xe0\x8b\xd4\xd4\x08\
-\x42\x0b\xd3\xd7\xd7\xa7\xd7\x57\xaf\x5d\xd3\x6b\x0b\xfd\x2f\xe2\
-\xd0\xdc\x34\x31\x31\x16\x6c\xdf\xbe\x4d\x6f\x5f\xaf\xd2\x09\x94\
-\xbe\x1b\x7c\x9a\x8c\x78\x39\x7f\x7e\xb6\x54\x2b\x02\xec\xa3\x76\
-\x80\xf3\xd3\x54\xe3\x2e\x2e\x49\x06\x9d\xa6\x15\x44\x0a\x06\xd0\
-\x1a\x36\xc2\x0d\x0c\xf4\x6b\x37\xbf\xf8\xa9\x79\x71\x97\x78\xcd\
-\x93\xc5\x36\x23\xd1\x0f\xc4\x25\xe9\xfe\xab\x61\xcf\x4f\x27\x6b\
-\x9a\x9e\xdc\xc5\xd6\xcc\xf4\xf6\xf4\x28\x51\xb8\xa8\xfb\xd6\x20\
-\x19\x81\x1a\x13\xfc\x06\x54\xb8\x34\xac\xe8\x22\x9c\xc5\x75\xaf\
-\x14\x9a\x99\x88\x6f\x71\x85\xb5\x45\x34\x23\x52\x2b\x47\xad\x95\
-\x4f\x27\x61\x17\x8e\xa1\xc9\x89\x74\xe4\x7e\xd3\x3a\x09\x23\x10\
-\x11\xcb\xd4\x16\xa6\x75\x12\xf6\x15\x82\xbe\x7a\x71\x35\x84\xa5\
-\xb0\x3a\xd4\x45\xd4\xf8\x17\x48\xef\x12\x69\x1c\x82\xd0\x82\xac\
-\xa0\x7c\xd3\xe7\x82\xa6\x1c\x3a\xaa\x52\xad\x7f\xf9\xca\x15\x3d\
-\x9a\x30\xfd\x6c\x5c\xf8\xf2\x69\x76\x76\x4e\xff\x9a\xbe\x60\x46\
-\x81\xc5\x00\xf9\x30\x35\x35\xa5\xcf\xc1\x28\xbd\xf6\xab\x2a\xce\
-\x4b\xed\x00\x9d\x85\xe9\xcf\xc1\x42\x47\x64\xdf\x51\x7a\xa9\x31\
-\xc2\xf8\xd1\x59\x98\x3e\x36\x40\x13\x1a\xd7\x74\xee\x9c\xba\x97\
-\xb9\x8b\xba\xbf\x0c\x8b\x1d\xb5\x36\x09\xc4\x11\xd7\xc6\x68\xb5\
-\xdc\x1b\xe1\xb9\x4e\x9f\x66\xb0\x38\x08\x32\xce\x4f\x0d\xd2\xe5\
-\x4b\x97\x94\xc1\xbd\xa6\x97\xb9\xb9\xf2\x97\x52\xd4\x42\xe8\xf4\
-\x3e\x77\x5e\xf7\x01\xe2\xbe\xe9\xc4\x9b\xd4\x9c\xe6\x82\x11\x07\
-\xee\x85\xeb\xe4\xfe\xce\xcf\xcc\xe8\xe3\xe2\xd4\x62\x80\x6d\x3a\
-\xcc\xa8\xf8\xaf\xa9\x34\x40\x30\xb2\xa6\xc3\x78\xd6\xe8\x46\x46\
-\x46\xb4\x48\xe2\xde\x7c\x9a\x29\x2d\xf4\xa9\xa1\xc9\x09\xa1\xc2\
-\xb1\xb6\x39\x2f\x09\x9a\xb7\x48\x6b\xf2\x2b\xaf\x0e\xd6\xf9\xe2\
-\x97\x68\x79\x8b\x2f\xa1\x3a\x52\x53\x23\x08\x2d\x0c\xcd\x4e\x3b\
-\xb6\x6f\xd3\x35\x27\x18\x4c\x8c\x1a\xb5\x27\x93\x93\xeb\x4d\x88\
-\x32\x18\x61\x6a\x5c\x6e\x2a\x11\x81\xa8\xa8\xd6\xa4\x63\xc1\x58\
-\x6d\xda\xb8\x41\x0b\x05\x04\x03\x70\x0e\x9a\x9a\xd6\x74\x75\x69\
-\x11\xc0\x42\xbc\x59\xa0\xc6\x06\x43\x4c\x1f\x1b\xfb\x75\xd3\xa6\
-\x8d\x1b\x4d\x2d\xce\x0d\x7d\x3f\x73\x17\x2f\x6a\x21\x15\xff\xfa\
-\xc9\x1a\x13\x6a\x04\xb6\x6c\xde\x14\xf4\xf5\xf6\xea\x26\x93\x8b\
-\x4a\x8c\x50\x7b\x83\xf8\x80\xac\x02\x61\xe3\x86\xe9\x60\x74\x64\
-\x58\x7f\x01\x85\xe0\xba\x48\xc7\xe0\xa5\x25\xb5\x84\x62\x8e\x51\
-\x88\x09\x43\x5f\x17\xf6\x5d\xb9\x7a\x55\x0b\x80\xcd\x9b\x54\x5a\
-\x98\xfe\x2f\x49\x50\xdb\x43\x2d\xd9\xd2\xfd\x25\x6d\xf0\xa9\x51\
-\xa1\x73\x33\x35\x3f\x79\x40\x5f\x1a\x3a\x09\xf3\xb5\xd4\x55\x95\
-\xcf\xa4\x05\xfd\x7f\xec\x75\x67\xe3\xbe\xca\x83\x51\xdd\xef\x85\
-\xf4\x4f\xab\x71\x89\x43\x9a\x53\x56\xf4\xfd\xdd\xb9\x53\x12\x72\
-\x69\x5f\xae\x91\xce\xe1\x39\xf8\xf4\x5b\xac\xbe\xe0\x47\x87\x7d\
-\xa8\x3b\x14\xac\x1e\x7b\xfc\x03\x89\xa5\xfc\x0d\x6f\x7c\x63\xf0\
-\xf6\xb7\x7e\x8b\xd9\x2a\x53\x4b\x7f\x1a\x7f\xf5\xea\x19\x77\x42\
-\xb8\x3d\x2f\xec\x35\xae\xda\xc9\xfa\xc2\x6b\x04\x9a\xf1\x9a\x1b\
-\x9d\xd5\x4e\x53\x6a\x3e\xe8\xe3\x52\x22\xe3\xf9\xbd\x9f\x2f\xef\
-\x5f\x9b\xc6\x91\x01\xef\x6b\xc8\x39\x9c\xa5\xb8\x78\x8d\xa3\x2a\
-\xc5\x9c\x1f\xf2\xbe\xb7\xec\x97\x90\xf7\xf9\x33\x5f\x40\xae\xf7\
-\x56\xcb\xf9\xd5\x51\x66\x5d\x99\x5a\xae\xf3\x33\x9f\xf9\x6c\xc0\
-\xf8\x47\x71\x16\x17\x17\xf6\x7e\xec\xa3\x1f\xf9\xa0\x72\xa2\x02\
-\xb1\xd3\x54\xb7\xb2\x50\x95\xc5\x42\xb5\x19\xd5\x5f\xac\xad\x9f\
-\x0d\x43\x78\x8e\xe3\x4c\xea\xb2\x6a\xba\xe9\xa6\xa0\xf9\x45\x4d\
-\x0d\x79\x93\xeb\xf9\x15\xbe\xe1\x2c\xbe\xc1\xb3\xc6\x0b\xb9\xdf\
-\x5b\xc6\xfc\xcd\xfd\xfc\x19\xd3\xc0\x37\x78\x51\xe7\x87\xdc\xe3\
-\xce\x78\x0d\xde\xe7\xf7\xcc\xdb\xac\x49\x90\xf7\xfd\x7b\xa7\x93\
-\x43\x51\x71\xfb\x07\x6f\x8e\x7b\xab\xe1\xf4\x8a\x7c\xef\x2d\x7b\
-\x1e\xf8\xc6\x6b\x1c\x55\xc8\x7a\xfe\x90\x7c\xef\xcd\x0d\x26\xa2\
-\x66\x65\xac\x7a\xf3\x93\x7f\x26\xb7\x6c\x9a\x17\x46\xde\x69\x5b\
-\x8b\x60\x6d\x77\x72\x2f\xdf\xf2\x1c\x14\x46\x33\xbe\x63\x72\x2f\
-\x5f\x42\x0d\xe4\x9b\x07\x92\x55\xf9\xd2\x76\x7d\x6a\xf2\x7e\x29\
-\xc8\xcb\xa3\x8c\xa4\x6d\xeb\xd1\x8c\x59\x20\xe5\xa6\x48\xe4\x19\
-\x17\x1a\x9b\x15\x89\x1a\xf9\x25\x9f\x1d\xdf\x67\x58\x1e\xf6\xfa\
-\xd3\x8c\x79\xe0\x6d\x4c\xe4\xd9\xcd\x8c\x7f\x71\xf0\xcc\x03\x79\
-\xc6\x33\xe3\x5d\xbe\x3d\x93\x56\xf2\xa0\xf5\x58\xd5\x9a\x1a\xff\
-\x02\xe9\x5d\x22\x8d\x43\x10\xe4\x45\xd6\x08\xe4\xfd\x8c\x4b\x5e\
-\x95\xc9\x3f\x6d\x8d\x43\xa8\x1b\x92\x07\xf9\x23\x9f\x74\xaf\x80\
-\x46\x7a\xe1\xe6\xfe\xc2\x93\x5f\xf2\x99\xc9\x3b\x0f\x54\x40\xe3\
-\x10\x7c\xc9\x3d\x0f\x84\xc2\x68\xce\x3c\x90\xf2\xd5\xe8\xd4\x2c\
-\x6a\x9a\xd1\xe8\xc9\x0b\xaf\x38\xf2\x4e\x5b\xc9\x83\xec\x78\xa7\
-\xad\xf7\x8b\xd9\x38\x04\x41\x23\xcf\xae\xd0\xf8\x48\x4d\xcd\x2a\
-\xe2\xfb\xac\xcb\x4b\xa1\x38\x44\x54\x35\x0f\x8d\x94\x07\xfe\x97\
-\x22\xe5\xab\x28\xfc\x9f\x5d\xe3\xa8\x82\xe4\x41\x6b\xb2\x6a\xa2\
-\xc6\xbf\x40\x7a\x97\x48\xe3\x10\x7c\xf1\xce\x03\xcf\x17\x73\x23\
-\x21\xc5\xa1\xfe\xe4\xfe\x8c\x0b\x25\xf2\x4e\x5b\xc9\x82\x5a\x90\
-\x3c\x68\x06\xda\xa6\xa6\x26\xff\x97\x42\xe3\x94\xc8\x46\xba\x96\
-\x76\x25\xf7\x72\x23\x79\x9a\x99\x66\x7c\x76\x5b\x0d\xc9\x03\xa1\
-\xde\xd4\x24\x6a\xda\xa5\x13\xe9\x97\xbe\xfc\x44\xb0\x77\xdf\x01\
-\xb3\xb5\x7c\x3b\x0e\xfb\x9e\x79\x6e\x8f\xd9\xf2\x67\xdf\xfe\x03\
-\xc1\x57\xbe\xfa\xa4\xd9\x0a\x82\xfd\x07\x0e\x06\x5f\x7d\xe2\x29\
-\xb3\x55\xe6\xe4\xa9\x53\xc1\x53\x4f\x3f\xab\xf7\x31\x1f\x0a\x6b\
-\xc2\xa6\x71\xe0\xe0\xa1\xe0\xf9\x3d\x2f\x98\xad\x74\x08\xf7\xe4\
-\x53\xcf\x98\xad\xec\x54\x7b\x41\x3d\xfd\xf4\x73\xc1\xa1\x43\x47\
-\x52\xc3\xb1\x6f\xef\xde\xfd\x66\x2b\x8c\xef\xd9\x67\xf7\x04\x87\
-\x0f\x1f\x35\x3e\xf9\xf1\xfc\xf3\x2f\x04\x47\x8f\x1e\x33\x5b\x81\
-\x76\xe3\x57\x89\xc3\x87\x8f\x04\xc7\x8e\x1d\x37\x5b\x2b\xe7\xc4\
-\x89\x93\xc1\x8b\x2f\xee\x33\x5b\xc9\x1c\x51\xd7\xc5\xc4\x93\xbe\
-\x78\x1b\x13\xef\x5f\x9b\xc6\x91\xc2\xa9\x53\xa7\x83\xfd\xfb\xd3\
-\xcb\x1e\x1c\x57\xf7\x79\xfa\xf4\x19\xb3\xa5\xca\xd9\x81\x43\x91\
-\xed\x5a\x38\x73\xe6\xac\x2e\x2f\x2e\x6c\xe3\x9f\x06\xf3\x51\x91\
-\xe6\x3e\x10\xf6\xc8\x91\x72\xf9\xf0\x85\x11\x60\xdd\x72\x95\x04\
-\xd7\xc8\x44\x97\x3e\x79\x75\xec\xd8\x89\xe0\xfc\xf9\x19\xb3\x95\
-\x0d\xe6\xd9\x3a\x71\xc2\xbf\xec\xf8\xe1\x57\x6e\x4e\x9d\x3a\xa3\
-\x27\x0f\x15\x84\x7a\x21\x7d\x6a\x72\xc4\xce\x50\x9c\x84\xa7\xcd\
-\x49\x7d\xe1\x9d\x55\x2f\x4d\x26\x1b\x1c\x1b\x1b\x09\xb6\x6d\xdb\
-\x12\x0c\x0e\xae\x35\x7b\xd2\xb9\x7b\x37\xfb\x4c\xc4\xf5\xc0\x77\
-\x42\xbc\x34\x56\x9a\xb6\x71\xe2\xe1\xc2\x09\x13\xd3\xf3\xb6\x08\
-\x48\x93\x2c\xf9\x87\xc8\x3d\xaa\x84\x17\xc2\xfa\xf0\x91\xa3\x7a\
-\xe2\xca\x7b\x4e\xba\x2e\x2c\x2e\x6a\x83\x7a\xe0\xe0\xe1\x60\xdf\
-\xbe\x83\xda\x68\xde\xbc\x99\x6d\x82\xc9\xac\x2c\xa9\x34\xbb\x1b\
-\x4b\xb7\x5a\xf3\x60\x25\xb8\xe9\x50\x0b\x79\x5d\x0a\x13\x37\xae\
-\xb4\xac\xb7\x2b\xfe\xe5\xc6\x38\xaa\x90\x67\xf9\x12\x1a\x8b\x55\
-\x11\x35\xb9\xbf\xc8\x1a\xb4\x40\x3e\xfa\xb2\x47\x82\xaf\x79\xc5\
-\xa3\x66\x2b\x5f\x2e\xa8\x5f\x3f\xbd\xbd\x3d\xc1\x8e\xed\xdb\x83\
-\xa9\xc9\x49\x3d\xeb\x70\x35\x5e\xfa\xc8\x4b\x82\x97\x3f\xfa\x32\
-\xed\xf6\xce\x83\x3a\xd4\xc2\x3d\xf4\xd0\x03\xc1\x23\x8f\x3c\x6c\
-\xb6\x1a\x8f\x87\x1e\x7a\x30\xd8\xbd\x7b\x97\xd9\xaa\x9d\x2c\xe5\
-\xfb\x01\x75\xbe\x5d\x3b\x77\x18\x8f\xca\xcc\xcc\xce\xea\x19\xab\
-\xd7\xad\x5b\x17\x6c\xdd\xba\x25\x18\x1a\x1a\xd2\xb3\x30\x23\x62\
-\x2c\xfc\xea\x67\x96\xec\xd1\x91\x11\x3d\x5b\x32\xc6\xf5\xe4\xc9\
-\xd3\xb9\x09\x9b\xa4\x7b\xdb\xa9\xae\x7f\xfb\xb6\xad\x66\xab\x7e\
-\x30\x4b\xf7\xb6\x06\xb8\x8e\xad\x5b\x37\x07\x9b\x36\x6d\x34\x5b\
-\xfe\xe4\xfd\xfe\xf4\x2d\x86\x82\x8b\xe4\x41\xb3\xd0\x16\x35\x35\
-\xf9\xbf\x14\x56\xbf\x44\x2e\x2c\x2c\x2a\x51\x53\x5d\xc8\x34\x2a\
-\x8d\x9c\xb6\x2b\xa5\xde\xd7\x7c\xe9\xf2\x15\x25\x68\x86\x82\x09\
-\x25\x56\x06\xd7\x0e\x28\xd1\xbb\x5e\x6f\x5f\xbb\x76\xdd\x84\x08\
-\x82\xe9\xe9\xa9\x60\xf7\xae\x9d\xc1\xe4\xe4\x84\x5e\x36\x6f\xde\
-\xac\xfd\x2f\xab\x63\xdb\x89\x66\x2c\x5f\xf5\x27\xdf\x67\x57\xf2\
-\x40\x28\x92\xcc\xa2\xa6\x99\xfa\xd3\xcc\xdf\xbe\x1d\xec\x3f\x70\
-\x28\xf8\xca\x57\x9f\x0a\xbe\xf8\xa5\xaf\x6a\xf7\xdd\xbb\xd1\xea\
-\xf0\xd3\x67\xce\x96\xf6\x3f\xbf\xe7\x45\x7d\x8c\x2f\x54\xf5\x7f\
-\xf9\x2b\x4f\x06\x57\xae\x5e\x8b\x6c\x57\xe2\xee\xbd\xbb\xc1\xc1\
-\x43\x87\x75\x1f\x16\x16\x9a\x0c\x6c\xd3\x46\xd2\xc3\x7e\x7b\x61\
-\xa1\xd4\xbf\x06\x23\x85\xfb\xd8\xf1\xe4\xfe\x1d\xf4\x8d\x79\xe2\
-\xc9\xa7\xd5\xf5\x5c\x8d\x6c\xbb\x70\xfe\x23\x47\x8e\x06\xcf\x3c\
-\xfb\xbc\x5e\x8e\x9f\x38\x51\xb5\x69\xe5\xf6\xed\x85\xe0\xe8\x91\
-\x63\xba\x9f\xcb\x53\x4f\x3d\x1b\xbc\xf0\xc2\x5e\x5d\x73\x04\xf6\
-\x9a\x49\x57\xfa\x36\xd0\x7f\xe6\xb9\xe7\x5e\x28\xed\x4f\x82\x70\
-\xcf\x3c\xf3\x7c\xc9\xe8\xda\xed\x24\xe8\x1f\xb0\x67\xcf\x5e\xbd\
-\x9c\x3d\x5b\xae\x79\xb0\xb0\x9f\xeb\x79\xee\xb9\x3d\xc1\x41\x75\
-\xbf\x8b\x8b\x4c\x4c\x1b\x72\xeb\xd6\x2d\x7d\xaf\xec\x23\xcc\xec\
-\xec\xac\xd9\x93\x0e\x61\xf6\xa8\x72\x70\xe1\xc2\x05\xe3\x13\xe8\
-\xed\xb4\x3e\x35\x07\x0e\x1c\xd4\xe7\x75\x61\x3b\xee\xc7\x75\x1c\
-\x52\xf9\x9e\xc4\xdc\xdc\x45\xdd\xc7\x86\xb5\xe5\xc5\xbd\xfb\x23\
-\x7d\x6a\x68\x42\x61\x1b\xff\x7d\xea\x9c\x08\x19\xcb\x9a\xae\x2e\
-\x75\xdf\x8b\x66\x2b\x84\xed\xbe\xbe\xb2\x08\xee\xed\xe9\x89\x3c\
-\xbb\xbd\xbd\xdd\x7a\x9d\xd4\x1c\x62\x8b\x21\xe5\xc2\xf6\x9d\xa1\
-\xcc\x5e\xb9\x92\x2e\x80\x2e\x5d\xba\xa4\xfb\xcc\xb0\xb6\x54\xeb\
-\x43\xc3\xbe\x83\x07\x0f\xeb\x7c\x4a\x82\xe6\x1a\x6a\x9b\xe8\x5f\
-\xc4\x42\x6d\x94\x4f\x53\x12\xfd\x62\xe8\x8f\x75\xeb\x16\x13\x16\
-\x97\xb7\x5d\xae\x5c\xb9\xaa\x9e\xa3\x13\xba\xff\x0c\xef\x80\x3b\
-\x77\xa2\x4d\x7d\xf3\xf3\xb7\xb5\x3f\xfb\x4f\x9d\x3a\x15\xdc\xbc\
-\x79\xd3\xec\xf1\x83\xf8\x8f\x1e\x3d\xae\xd7\x16\xb6\xdd\xda\x33\
-\xee\x8f\x1a\x34\x9a\x02\xc9\xdb\xeb\xd7\xcb\x22\x34\x0e\xe1\x8e\
-\x1f\x3f\xa9\x9e\xc5\xf0\xfd\x44\xbe\x59\xbf\x93\x2a\x8f\xae\x5f\
-\xbf\xa1\xfd\x93\xb8\xa6\xde\x4f\xf4\xb1\x61\x0d\xa4\x07\x8b\x4b\
-\x92\xdf\xf9\xf3\xe7\x23\x7e\xa4\x11\x65\xf4\x94\xca\x37\x6a\xf9\
-\xc8\x8f\x78\xb9\xab\x27\xbe\x5a\x49\x44\x55\x6b\xd3\x30\x35\x35\
-\xde\x05\x2d\x43\x81\xb4\x2f\x2a\xaa\x7d\x59\x2e\x5d\xba\xac\xfb\
-\x1b\x58\xce\xa9\x97\x02\x0f\xe7\xa4\xfa\x65\xbb\x63\xc7\xb6\x60\
-\x60\x60\x20\xe8\x5e\x13\xbe\xec\xab\x71\x44\xbd\xa0\x30\xca\xbb\
-\x76\xed\x08\x46\x86\xd7\x19\xdf\x64\xec\x25\x23\x28\x5e\x50\xc6\
-\x8b\xe3\x36\x6c\x98\x52\xbf\x96\x37\x06\x0b\x4a\xb4\x54\x6a\x02\
-\xa0\x99\x89\x3e\x34\x40\xf3\x13\xee\xf5\x13\x13\x7a\xdb\x05\x71\
-\x42\xbc\x3b\x77\x6e\x57\xd7\x33\x6c\x7c\xa3\x70\xfe\x7d\x4a\x78\
-\x5d\x53\x2f\xc0\xe9\xe9\x49\x5d\x15\x4e\x0d\x90\x7d\xf9\xa7\x61\
-\x45\xcf\xa6\x4d\x1b\x74\x3a\xf6\x28\x03\x49\xba\x5d\x35\x2f\x49\
-\xc0\xe8\xf3\x82\xdb\xb2\x65\x93\x4e\xcf\x2e\x65\x68\x93\xe0\xb8\
-\x1b\x37\x6e\x06\xdb\xb7\x6f\xd5\xb5\x09\x95\x20\x1c\x46\x81\x9a\
-\x85\xfe\xfe\x3e\xfd\x12\x75\x85\x0d\x2f\xd8\x73\xe7\x66\x82\xb1\
-\xb1\x51\x9d\x96\xfd\xfd\xfd\x41\x67\x67\x78\x5e\x0c\x25\x46\x84\
-\x6b\x62\xdf\xfa\xf5\xe3\x3a\xff\x2b\x71\xf1\xe2\x45\xf5\x22\x9f\
-\xd5\x61\xd7\xaf\x5f\x6f\x7c\x2b\x33\xac\xf2\x7e\x71\xf1\x4e\xe9\
-\xe5\x4e\x5a\x86\xdb\x77\x4a\xe9\xca\x3e\x8c\x64\xd2\xfd\x72\x4d\
-\x08\xb3\x89\x89\x31\xb5\x8c\x1b\xdf\xe5\x20\x00\x88\x67\xc3\x86\
-\xe9\x60\x62\x7c\x5c\xa5\x6f\xf9\xd1\x5d\xbf\x7e\x42\x0b\x4f\xdb\
-\x97\x06\xa1\x8c\xd1\xab\xd4\xd4\xc1\xf5\x00\x65\x3e\x0d\x0c\x1a\
-\xe7\xa4\xac\x8c\x8f\x8d\x95\xd2\x36\x0e\xb5\x3d\x17\x2e\x5c\xd4\
-\xf9\x30\xa6\xc2\xf9\xc0\x3d\x93\x3e\xdc\x4f\xfc\x1a\x78\x17\x60\
-\xf0\x11\x13\xb7\xe6\xe7\x83\xb1\xd1\x11\x7d\xcf\x77\xee\xdc\x09\
-\x16\xd4\x7d\x56\x02\x31\x4d\xbc\x5c\xf3\xc0\x40\xbf\xf1\x8d\xc2\
-\x73\x42\xf3\xdc\xf0\xd0\x90\x4e\x3b\x04\x9f\x9b\x9e\x70\x7e\x66\
-\x26\x18\xe8\xeb\x0b\x46\x47\xc2\x67\x89\xeb\x9d\x57\xd7\xe2\x03\
-\xe2\x84\x7c\x1d\x51\xc7\xb2\xa4\x81\x70\xe6\x1d\x45\xde\x0f\xaf\
-\x5b\x97\x9a\xbe\x5c\x2b\xf9\xcb\xb5\xf6\xa9\x6b\x02\x9e\x05\x7e\
-\x48\xd0\x94\x18\x1e\x9b\xfc\x2a\xe7\x19\xba\xac\x9e\x21\xca\xe9\
-\x3a\xb5\xf0\x2e\x22\x5d\xe8\xaf\x65\xfb\x6c\xdd\xb9\xb3\x58\xda\
-\xc6\x0d\xb8\x29\xc3\x36\x0d\xb9\x4e\xd2\x04\x3f\x9a\x30\xc9\x6b\
-\xce\x4f\x79\xb3\x65\xbf\x28\x44\x84\x08\x59\x28\x5c\xd4\xd4\xb3\
-\x40\xae\x1b\x1a\x0c\x1e\x7e\xe8\x81\x60\xc3\xf4\x94\x7a\xa8\x87\
-\xf5\x83\xed\x1a\x62\x2b\x26\x78\x01\x12\x66\xb7\x12\x28\x6b\xd6\
-\x24\xbf\x58\x5c\xf8\x55\xc5\xcb\x13\x41\xb3\xbe\x82\x21\x8a\xc3\
-\x8b\x91\x97\x32\x06\x7d\xd3\xc6\x8d\xc1\xf4\xd4\x54\xf0\x92\x87\
-\x1f\x0a\x7a\x9d\x5f\xd4\x49\xd0\x87\x06\x68\x7e\xc2\x3d\x38\x38\
-\xa8\xb7\x2d\xa7\x4e\x9f\xd6\x46\x05\x41\x83\xf1\x89\x63\xf3\x80\
-\x6b\x46\xc4\x20\x8c\x36\x4c\x4f\x07\x93\xea\x25\xf9\xd0\x83\x0f\
-\x68\xb1\x04\x69\xb5\x70\x6b\xd7\x0e\x04\x3b\xb9\x57\x15\x9e\xfe\
-\x1a\x53\x53\xe1\xf5\xb8\xbf\xdc\xf9\xa5\x88\xd8\x21\x0c\x82\x8d\
-\x97\x5e\x9c\x33\x67\xce\xe9\x17\x34\xf7\x3f\xaa\x0c\x55\x35\x10\
-\x46\xbb\x76\xed\xd4\xe7\xdb\xbd\x7b\xa7\xbe\xce\xab\xa6\x16\x0a\
-\xac\x61\xc6\x28\x8c\x2b\xa3\xb7\x65\xcb\x66\x95\x7f\x6b\xb4\x1f\
-\xbf\x88\x11\x63\xe4\x11\xfb\x26\x55\xba\xd1\xc7\x23\x0d\x0c\x11\
-\xd7\x87\xa0\x99\x56\x69\xe3\xcb\xda\xb5\x61\x87\x6d\x8c\x07\x5c\
-\xbf\x7e\x4d\xa5\x43\xb7\xbe\x76\xdc\x60\xf7\xad\x5b\x17\x35\x70\
-\x37\x6e\xdc\xd0\xd7\xc9\xf5\x4f\xa9\xb2\xa0\x49\x79\x5e\x88\x83\
-\xf4\xc5\xc0\x53\xe6\x30\x64\x16\xdc\xe4\x11\x06\xe7\xb2\xca\x13\
-\x0c\xe0\x5a\x25\x14\x30\xd6\x69\x50\x16\x3a\x95\x21\xaf\x94\x0f\
-\x3c\x1f\x9c\x73\xc4\xf4\xc3\x49\x12\x65\xd4\x60\x50\xae\xc9\x6f\
-\xf2\xde\x07\xce\xcd\x73\x88\xa0\x19\x52\xcf\x68\x12\xd7\xae\x5d\
-\xd5\x86\x94\xa6\xb4\xd1\xd1\x51\xfd\xec\x22\xd2\xba\xbb\xc3\xfc\
-\x4d\x82\xb2\x45\xbc\x3c\xcf\xf1\x67\x04\xec\x73\xc0\x0f\x09\x18\
-\x52\xe9\xc6\x3d\x71\xdd\x71\x51\xb0\x51\x5d\xdb\x98\xba\xe7\x51\
-\xf5\x3c\xd9\xf2\x5e\xa9\x26\xc5\x82\xf0\xe1\x59\x44\xcc\x24\x3d\
-\x03\x2e\x94\x5f\xee\x87\x67\x8a\xf0\xe4\x61\x1c\xc4\x11\xcf\x16\
-\xd7\xe8\xee\x27\x8f\x79\x57\x91\x7e\xa4\x4d\x92\x80\x23\x8c\x16\
-\x6f\x6a\xbf\x2b\xae\xac\x30\xb2\xb5\x3e\xe4\x33\xcf\x4d\x47\x67\
-\x47\xe9\x9d\x68\xf7\xd9\x73\xf2\xdc\xdd\x5f\xba\xaf\xaf\x83\x8f\
-\x14\x58\x70\xe3\xe7\xd6\x46\xb5\x26\x7e\x36\xcc\xd7\xd6\xd5\xd1\
-\x24\xb6\x05\x85\x8b\x9a\x7a\xc2\x4b\xf1\xd0\xe1\xa3\xba\x69\x89\
-\x26\x04\x5e\x78\x6e\x53\x0b\x2f\x2b\x8c\x0f\x4d\x1f\x34\x4d\x5d\
-\x37\xc6\xa7\x12\x18\x17\x6a\x07\xf4\xcb\x30\x83\xa0\x01\xdb\xdc\
-\x12\xff\xf5\x56\xc9\xf8\x54\x83\x97\x10\xb5\x0b\x5c\x4f\x92\xa0\
-\x71\xb1\xe7\x8f\x1b\x27\x0c\x57\x35\x4e\x9f\x3e\xab\x9b\x9f\x68\
-\x26\x49\xfa\xd4\x1a\x03\xc5\xcb\x97\xa6\x0a\x8c\x56\x1c\x5e\xe0\
-\xfc\xba\xe4\x65\x98\x66\x48\xe3\x2f\x05\x6a\x67\x5c\x91\xd9\xdd\
-\xdd\xad\x45\x99\x05\x43\x4b\xfe\xf1\x35\x0f\x9f\xec\xba\xcd\x18\
-\x9c\x8f\xe3\x7b\x7a\xca\x82\xb1\xd2\x7d\x52\x83\x44\x5c\x49\xb5\
-\x60\x95\xc0\x78\x72\x9c\x6d\x9e\xa0\x8c\x61\x44\xb8\x4f\x2b\xa0\
-\xaf\x5d\x0b\x85\x0e\xd7\xe3\x42\x35\x3e\xc2\xc2\x47\x0c\x50\xfb\
-\x45\xd9\xa3\x19\xc6\x6d\x7a\x02\x7e\x2d\x53\x0e\xe8\x24\xfc\xb0\
-\x12\xa9\x88\x4a\x7e\x9d\xbb\x4d\x1d\xae\x60\x3d\xaf\xca\x2f\xe1\
-\x37\x2b\x91\x10\xaf\xa1\x70\xb3\x80\xeb\x22\xdc\xf1\xe3\x27\x22\
-\x02\xd6\xe5\xcc\xd9\x73\xfa\x1e\xaa\x19\x70\x0b\xcd\xa9\xd4\xec\
-\x60\x84\xd3\x04\x0d\xd8\x5a\xae\xfe\xfe\xa8\xa1\xa7\x0c\x24\xe1\
-\xc6\x9b\x24\x68\x5c\x28\xff\x5c\xf3\x49\xf5\xe3\x44\xff\xd0\x30\
-\x22\xc7\xc5\xed\xbf\x66\xcb\x50\xb5\x66\x5a\x20\x2f\x88\x9b\x32\
-\x50\x0d\x9e\x03\xca\x29\x35\x62\x49\x82\x89\x2f\xd6\x28\x43\x34\
-\x23\xc6\x05\x0f\xc7\x22\x5a\xc8\xe3\xb4\xa6\xa7\x0b\x73\xa1\x70\
-\x8d\x3f\xef\x88\x1a\x04\x8c\x15\x2e\xa4\x35\xe9\xd6\xaf\xfc\x6d\
-\xba\xf3\x2c\x21\x74\x6c\x7a\xd3\x2c\x4f\x19\x76\x45\x25\x6e\xfc\
-\xb8\x4e\x7f\x83\x2e\x16\x5d\x28\x96\x4c\xa2\xa6\x99\xfa\xd3\x80\
-\x6d\x87\x7f\xe0\x81\x5d\xc1\xd7\x7f\xdd\xab\xb4\x61\x70\x19\x52\
-\x86\xe7\x55\x5f\xfb\x4a\xdd\xa4\xc2\x97\x21\xf4\xbb\xc0\x18\x54\
-\x83\x17\x38\x02\xe1\xbc\x7a\x21\x56\x23\xe9\x19\x5e\xd3\x95\xfe\
-\x6b\xb3\x16\x78\xc1\x71\x3d\xbc\x50\x7d\xc8\x7a\x7e\xfa\xd3\xf0\
-\xf2\xa7\xf9\xe9\x15\xaf\x78\x34\x78\xd5\xab\x5e\x69\xf6\x94\xc1\
-\x90\x52\x2b\x82\x40\x63\xac\x0a\x0c\x46\x1c\xc4\x1c\x86\xd9\xed\
-\x3b\xb2\x12\x78\x11\x3f\xfc\xf0\x83\xfa\xdc\xbc\x84\xe9\x9b\x63\
-\x8d\x83\x8f\x01\x72\xc1\x08\x71\x0c\x46\x3a\x2b\x18\x0d\xee\x0b\
-\x83\x40\x6d\x09\xb5\x37\xf8\xd9\x26\x28\xf6\xc5\x0d\x0b\x50\xc3\
-\xb2\x74\x6f\x49\xd7\x10\x55\x03\x01\x8d\x68\x41\x98\x61\xc8\x6c\
-\x5f\x07\x8c\x04\xb5\x33\x18\x3e\x3a\x09\x03\xcd\x03\x6c\x27\x95\
-\xe5\xd9\xd9\x39\xed\x4f\x6d\x46\x52\xcd\x80\x0b\xa2\x91\xe6\x44\
-\x0c\x1b\xc2\x39\x69\xdc\x94\x75\x43\x43\xfa\x1e\x28\x1f\xbe\x20\
-\xf8\x48\x17\x2b\xfa\x2a\x11\x17\x5d\x95\xf0\x8d\x17\xc1\xb2\x4d\
-\xa5\x25\xf7\x87\xa0\x41\xb0\xdb\x5a\x3f\x17\x7f\xfb\x5b\x0e\x48\
-\x0d\x19\xe9\x41\x0d\x49\x35\x78\x1e\xc8\x07\xc4\xc3\xdc\xdc\xa5\
-\xc4\xe7\x82\x3c\x42\xbc\xc4\x85\x0b\xe5\xd5\x1e\xcb\xb9\x92\xce\
-\x37\xd0\xdf\xaf\xaf\x25\xa9\xd9\x95\xeb\x44\xa8\xd8\xa6\x27\x84\
-\x0e\xe7\xb2\x4d\x50\x9c\x33\xa9\xf6\x67\xb5\xc9\xbb\xf6\x43\x44\
-\x55\xeb\x53\x68\x4d\x4d\xee\xea\x3d\x63\x81\xb4\x55\xaf\x18\x04\
-\x7e\xf1\xf3\xc0\xc6\xc1\x9f\x5f\xac\x2f\x7f\xd9\x4b\xf5\x76\xb5\
-\x97\x11\x0f\xfe\x83\x4a\x24\x61\xa4\xe8\xa4\xe7\x53\xbb\x63\xb1\
-\x46\x64\xee\x62\xf4\xe5\xc5\x2f\x9d\x5a\x21\x4e\xbe\x6a\xe1\x7a\
-\x10\x12\x95\x3a\x34\xda\xbe\x0b\x97\x2e\x47\x5f\x72\xd5\xda\xc4\
-\x31\x82\xfc\xaa\xe6\x97\x7b\x98\x8e\xc9\x82\x81\xb4\xde\xb1\x73\
-\xbb\xee\x87\xc0\x4b\xda\x85\x5a\x0a\xfa\x2d\x61\x78\x10\x3d\xb6\
-\x9a\x7b\x25\x50\x1c\x78\xa9\xd3\xb4\xf4\xc0\x03\xbb\xb5\x9f\xad\
-\x0a\xe7\x3c\x18\x2a\x3a\x0e\xdb\xf2\x55\xe9\x3e\x37\x6f\xde\xa4\
-\xee\x6f\x5c\x1b\x44\xb7\x93\xb0\x0f\x56\x10\xd1\xc9\x98\x5f\xae\
-\xd4\x14\xd0\xdc\x49\x0d\x8e\xed\x9c\x1c\x6f\x7a\x82\x8d\x1b\x37\
-\xe8\xa6\x27\x04\xa9\x8f\xd0\x43\x84\xf3\x79\x32\x79\x5d\x4d\x7c\
-\xd3\xa7\x86\x6b\x71\xa1\x86\x86\xf2\x8d\x31\xac\xd4\xec\xe4\x82\
-\x40\xa3\xd9\x87\xfc\x4f\x6a\x66\xa0\xb6\x13\x91\x8f\xd1\x75\x3b\
-\x09\xc7\xb1\x79\x40\x1f\x31\xee\x1b\x83\x89\x10\xc2\x78\xba\xd8\
-\x70\xb6\xa6\x84\x26\x3a\x17\xfa\xd5\x24\x41\xbc\x7c\xe1\x45\xbc\
-\x61\x33\x6b\xe5\xbe\x37\x34\x37\x21\x2a\xc8\x77\x88\x9f\xa7\x56\
-\x78\x46\xac\x78\xf7\x69\x96\xa1\x1f\x18\x3f\xb6\x78\x8e\xe3\xc2\
-\xa5\x47\x89\x49\xe2\x43\xa0\x92\x6f\x6e\x2d\x25\x20\x44\xd8\xcf\
-\xb1\x9c\x2f\x8e\xee\x6f\xa3\xca\x26\xcf\x1a\x9d\x84\xdd\xd7\x27\
-\xef\x02\x9a\x8e\xa8\xdd\xe2\x19\x22\x2e\x6a\xc5\xa8\xc1\xb1\x5f\
-\xc4\xd9\xf7\x15\xf0\x63\x05\x91\x4e\xed\xb7\x05\x37\x7e\xd4\xf0\
-\x08\x7e\xb8\x79\x20\x14\x43\x4b\x37\x3f\xd9\x26\x00\xbe\x62\x38\
-\xa6\x04\x48\xfc\x17\x8b\xf5\xa7\xc3\x30\xa3\x9f\x02\xc7\xf8\xb0\
-\x63\xc7\x76\x6d\xb4\xe8\x9c\x99\x66\xe4\xe3\xf0\x32\xe7\x18\xc4\
-\xd0\x99\xb3\x67\x75\xc7\x3b\x46\x13\xae\xd6\xf9\x31\x89\xb8\x10\
-\x64\x1c\x0e\xe2\xa6\x76\x8a\x0e\xc1\x49\x50\xa3\x41\x18\xbe\x84\
-\x38\x77\xfe\xbc\x1e\xf9\x93\x2f\xa4\xe2\x2f\xcb\x38\x18\x0a\x5e\
-\xb8\x34\xbb\x61\x30\x92\xbe\xe2\x39\xa6\xbf\xec\x08\xf7\xd3\x11\
-\x39\xad\x69\x61\xeb\x96\xcd\xe6\x1a\x4e\x7a\xa7\x5b\x1a\x08\x06\
-\x6a\x2c\xe8\xe0\x6b\x9b\x5a\xec\xaf\x4b\x5b\x2b\xc7\xd7\x2b\xec\
-\x27\x6c\xb5\x11\x5f\xe9\x4b\x43\xfe\x53\x2b\xe1\x63\xe4\x6c\x1e\
-\xd8\x26\x28\x0c\x0b\x46\xc4\x42\x5c\xf8\x25\x35\x3d\x59\xe8\x4b\
-\x43\x38\x0c\x7c\x5a\x33\x02\xd0\x54\x75\x41\x09\x1f\x9a\x9e\x6e\
-\x28\xe1\xea\x96\x53\x3a\xd1\xda\xa6\x08\x6a\x6d\x28\xd7\x18\x1b\
-\x8c\x9a\x85\xda\x08\x84\x10\x06\x92\x4e\xb8\x61\xcd\x40\xb8\xa4\
-\xc1\x08\xb8\x18\x53\x9a\x9e\xa8\xc9\x74\x8d\x9c\x8b\x35\xac\xf4\
-\x25\xf1\xfd\x4a\x08\x31\x44\xd3\x08\x23\xf1\x26\xd5\xaa\xd1\x8f\
-\x86\xfd\xd4\x3e\x5e\x56\x22\x9c\xe7\x98\xeb\x71\x8d\x2a\xc4\x9f\
-\x03\xae\x85\xe3\xa8\x55\x4a\xfa\xb2\x0b\x10\x1b\x97\xd4\x7d\x21\
-\x26\xed\x8f\x98\x3c\x87\x4b\x40\xe4\x91\xdf\xbc\x6f\x2a\x75\x2e\
-\xa6\x16\x99\x6b\xa1\x76\x91\x5a\x93\xb4\x32\x42\x07\x72\xee\x89\
-\x67\xcb\xde\x13\x6e\xd2\x84\x32\xc3\xb1\xe4\x6b\x12\x08\x2c\x5b\
-\x6b\x67\x9b\x9b\xa0\xdc\x04\x15\xad\x91\x41\xa0\xe0\x17\x36\x3d\
-\x95\x9b\x6b\x89\x87\xf0\x9c\x97\x32\x4d\xda\xe1\xc6\x0f\x01\xef\
-\x43\x3c\xaf\x9a\x03\xbf\x6b\x6e\xce\x7b\x6b\x4d\x5a\x5a\xd4\xd0\
-\xec\xc4\xcb\x96\xfe\x12\x34\x4f\xd0\xef\x03\x5c\x63\x4a\xad\x05\
-\x9f\x54\x5e\x53\x2f\x16\xaa\xda\xa7\x4d\xa7\xc0\x6a\xf4\xab\x17\
-\x05\xf1\x23\x48\xf8\xdc\xd5\x07\x9a\x7d\x5e\xfa\xd2\x97\xe8\x6b\
-\xc2\xc8\xb0\xe0\xe6\xeb\x9c\x95\xc2\x2f\x55\x3a\x0a\x23\x50\xd2\
-\x86\x79\xe7\xfc\x2f\x79\xc9\x43\xfa\x25\x46\x93\x07\x46\x82\x5f\
-\x6c\x34\x2b\x55\x02\x01\x87\x48\x41\x40\x60\x7c\x79\xc9\x12\xc7\
-\x3d\x93\x8e\x36\x3d\x79\x49\x53\x0b\x43\x07\x6d\x8e\x81\xf8\xc3\
-\x4e\xa7\x68\x3a\x0a\x73\x9d\x79\x4c\x3d\x40\x07\x46\xd2\x11\x11\
-\x82\x68\xa3\x53\x30\xd0\xf9\x92\xf4\x40\x6c\x70\xaf\x18\x18\x2b\
-\x5a\x2a\x41\xad\x04\xc7\x50\x66\xee\x25\xd4\xec\xa5\x61\xe3\xc5\
-\x18\x5b\x6c\x93\x93\xeb\x97\x04\xe5\x12\xa3\x75\xfa\xcc\x99\xc4\
-\x4f\x96\xad\x1f\x35\x7c\x08\x97\xc1\xb5\x6b\x75\x0d\x83\x4d\x5b\
-\xc6\xa7\x41\xc4\x21\x3c\x10\x96\x18\x2f\xd2\x82\x66\x28\xb8\xad\
-\xd2\xda\x0a\x26\x0c\x16\xc6\xc8\x5d\x2c\x6e\x56\x59\xa1\x71\xf1\
-\xd2\x25\x2d\xf2\x68\xae\x40\x94\xa7\x61\x45\xca\x59\x75\x7d\x3e\
-\x4d\x7f\x34\x69\xd1\x19\x17\x91\x62\x05\xa9\x0b\xcd\x4e\x08\x60\
-\xca\xb5\x16\x5f\xea\xde\x11\x1e\xd4\x6c\x55\x82\x78\xe9\x80\x4f\
-\xbc\x49\xcd\x65\x16\x84\x21\xf7\x8e\xe8\x40\xfc\x25\x35\x0f\xae\
-\x04\x2b\xae\x10\x65\xa4\x47\xfc\x39\x40\x58\xc2\xd5\x6b\xd7\xf4\
-\xfd\x21\x26\xd2\xbe\xb8\xd3\xb5\x91\x2a\x3e\x6a\x9a\x79\xc6\xac\
-\xb0\xe1\x58\x44\x59\x78\x6c\x7a\xbf\x2c\xee\x4f\x8b\xa2\xb9\x39\
-\x75\x1d\xe5\xf2\x65\x6b\x58\xdc\x3e\x48\x56\xb8\x52\x2b\xe8\x1a\
-\x74\x9a\x3d\xe9\xb4\x4d\x4d\x2d\xc2\x99\x73\x23\xd6\x49\x6b\xb7\
-\xdf\x9b\x20\xd4\x9b\x0e\xfb\xb0\x75\x28\x58\x3d\xf6\xf8\x07\x12\
-\xdf\x48\x6f\x78\xe3\x1b\x83\xb7\xbd\xf5\x2d\x66\xcb\x0f\x5f\xf5\
-\xea\x1b\x2e\xf2\xd6\xf5\x20\xef\xf3\x57\x0b\x67\xe7\x7d\xb2\xa3\
-\x0a\xfb\xdf\x56\xb6\xfb\x02\x9f\x63\xec\xbc\x4f\x8f\x9a\xa6\xb5\
-\x4a\x64\xed\x2f\x95\x67\xda\xda\x79\x9f\x10\x5c\xbe\xe4\x9d\xb6\
-\x69\xe1\x68\xb2\x62\xbc\x15\x7e\x7d\xc7\x3f\x91\xce\x33\x0d\x34\
-\x26\x1c\xcd\x91\x74\xc6\xa6\x19\xaf\x92\x90\xf0\x3e\xbf\xf7\xaf\
-\x4d\xe3\xc8\x40\xda\x35\xd0\x4c\xc4\x27\xf5\xfc\xc2\x47\xf0\xf8\
-\x5c\xab\x77\x3a\x39\xf8\x1c\x63\xe7\x7d\xa2\x4f\x92\x2f\xfe\x97\
-\xe2\x17\x90\xf4\x40\xf0\xf3\xe3\xa0\xd2\xa7\xfb\x2e\xde\xf9\xeb\
-\x1d\xce\x38\xbc\xc9\xfb\xfc\xd9\x2e\x20\xef\xfb\xca\x7a\xfe\x90\
-\x7c\xef\xcd\x27\xd8\x67\x3e\xf3\x59\x5d\x83\x19\x67\x71\x71\x61\
-\xef\xc7\x3e\xfa\x91\x0f\x2a\x27\xca\x14\x3b\x4d\x5b\x2c\x0b\x55\
-\xfd\x2c\x54\xc5\x51\x35\xc8\xda\xfa\xd9\x30\x84\xe7\x38\xae\x40\
-\x5d\x6e\x4d\x89\xd1\x14\x14\x56\x53\xe3\x9f\xc9\x9e\x69\xdb\xe0\
-\x79\x40\xa7\x61\x6a\x6d\xe8\x38\xd9\x08\xf0\x0b\x91\xda\x90\xb4\
-\x66\x20\x97\x7a\x76\x00\xa7\x2f\x09\xd7\x59\xed\x8b\x95\x7a\x40\
-\x4d\x8d\xad\xc9\xa8\x56\xc3\xb3\x62\x4c\xf9\xa6\x56\xe6\xa2\xe9\
-\x5f\xb3\xb6\xe8\x73\xae\x90\xb4\x67\x97\x9a\x09\xdb\xd4\x4b\x9f\
-\x91\x7a\xbe\x3f\x69\xa2\xa1\xd6\x86\xeb\xa8\x17\xa4\x87\xed\x5f\
-\xe3\x7b\x1d\x79\xbf\x3f\xeb\x98\x05\x4d\x8c\xe4\x41\x33\xd2\xb2\
-\xcd\x4f\xf9\xbf\x14\xd2\xc3\xed\x79\x61\xaf\xee\x27\x43\x15\x36\
-\x5f\x55\x14\x4d\xb5\x6b\x7e\x71\xef\x3e\xdd\x69\x18\x41\x63\x3b\
-\x42\x36\x22\xd4\x80\xf0\xeb\x15\xc1\x60\x9b\x06\x1b\x05\x04\x0d\
-\x23\x44\x63\x9c\xe9\x40\x1c\xef\x37\x90\x77\xf9\x02\x04\x0d\x9f\
-\xc4\xd3\xff\xc1\x0e\xc8\xd6\x6c\x60\xc0\xa9\x65\xc2\x88\x53\xbb\
-\x95\x77\xb3\x8e\x4b\xb5\xb4\xd5\xfd\x90\x94\x28\xa5\xaf\x8a\xdb\
-\xbf\x68\x35\x21\x3d\xe8\xc3\x46\xf3\x1f\xb5\x56\xb6\x79\xa7\xf1\
-\xc9\xb7\x7c\x67\x79\x0e\x04\x61\x25\xb4\x74\x9f\x9a\xd5\x82\x41\
-\xdf\xe8\x2b\xf3\xc8\x4b\x1e\x6a\x88\xf6\x65\x9a\x49\xb8\x16\x06\
-\xd6\xcb\xfb\xf3\x71\xc8\xeb\x45\x86\x90\x79\xf0\xc1\xdd\x7a\x60\
-\xbd\x46\x6b\x97\xef\x5a\xb3\x46\x7f\xea\xcf\x64\x9b\x59\x06\xe3\
-\x5b\x09\x5d\x9d\x9d\xba\x7f\x15\xe9\x61\x07\x5c\x4c\xc3\x3b\x0f\
-\xbc\x8d\x93\x71\xac\x10\xfa\x23\x91\xaf\xf4\x67\xaa\xd4\xcf\x63\
-\x35\x60\xdc\x26\xfa\xc9\xd1\x84\x97\x36\xe2\xee\xca\xa8\x9e\x68\
-\xa4\x07\xfd\x9d\xb8\x0e\xdf\x2f\xce\x84\xfc\x11\x51\xd5\x3e\x34\
-\x87\xa8\x69\xf0\x02\xc9\x34\x09\x61\xc7\xba\x32\xbe\x97\x5c\xc4\
-\xc3\xc6\x34\x09\x76\xa4\xdb\x46\x86\x5f\xf1\xb5\xfc\x72\xcd\x3b\
-\x6d\xd3\xc2\x51\x3b\xe3\x33\x30\x61\x9e\x50\x3b\xb3\x92\xc1\x18\
-\x57\x8b\x4a\x69\x4b\xbe\xda\x41\xdb\x56\x9a\x07\x2b\x81\xce\xec\
-\xb5\x7c\xd5\x94\xf7\xa5\x50\xc6\xe9\xec\x2b\xf8\xe3\x5f\x6e\x8c\
-\x43\x10\x0c\x85\x88\x9a\x7a\xbe\xc8\x5a\x9d\xbc\xd3\xb6\xd9\x06\
-\x54\x6c\x26\xbc\xcb\xb7\x3c\x07\x82\x43\xee\xcf\xb8\x14\xaf\x1a\
-\x90\x3c\x68\x56\x5a\xb2\xf9\x29\xff\x97\x82\x94\xc8\xac\xb4\x72\
-\xda\x4a\x79\xa8\x3f\xf2\xec\x16\x49\xbe\x69\x2b\x79\x20\xac\x26\
-\xd2\xa7\xa6\x00\x7c\x9f\xe1\x66\x7c\xd8\xe5\x05\x55\x7f\xbc\x8d\
-\x89\xb7\x71\x32\x0e\x21\x43\x5a\xf8\xa6\xad\x24\x6e\x51\xf8\x26\
-\xad\xe4\x41\x7b\x51\x37\x51\xe3\x5d\xd0\x56\x50\x20\x5f\xdc\xbb\
-\x5f\x4f\x66\x69\x89\x6f\xfb\xf0\xfc\x9e\x17\xf5\x57\x30\xd5\xf8\
-\xf2\x57\x9e\x5c\x16\x8e\x01\xe1\x18\x31\xf8\x2b\x5f\x7d\x32\x78\
-\xf2\xa9\x67\xb4\xdb\xe5\xab\x4f\x3c\x15\xec\x3f\x70\xd0\x6c\x55\
-\x87\xb0\x4f\x3c\xf9\xb4\xd9\x0a\x61\x9b\x51\x81\xd3\xd8\xbb\x6f\
-\x7f\xc5\xfd\x59\x38\x78\xf0\x70\xf0\xf4\xd3\xcf\x99\xad\x64\xf8\
-\x7a\x87\x39\x98\x2a\xc1\x7e\x26\x11\xad\x05\x5b\x1c\x8e\x1c\x39\
-\x1a\x3c\x67\xc6\x05\x4a\x22\xad\x7c\x31\xaa\xf0\xf3\xcf\x87\xe3\
-\xf7\x40\x52\xb8\xc3\x87\x8f\xe4\x32\x30\xa0\x2f\x94\x4b\x66\x7e\
-\x4f\x83\x7d\x87\xd4\x35\x55\x83\x70\x3e\x65\x75\xa5\xf8\x3e\xbb\
-\x2b\x0d\x47\x39\x61\x80\xc8\xbc\x60\xa4\x65\x3b\x67\x56\x23\xc1\
-\x20\x81\x0c\x00\x9a\x05\xd2\x8c\x81\x30\xf9\xb2\xca\x85\xb8\xdc\
-\x79\xb8\xaa\x65\x01\x23\x6d\x27\xcd\xd3\x96\x05\x46\x26\xe7\x2b\
-\xc6\x6a\x30\x22\x36\x03\x65\x56\xc3\xb7\xdc\x08\x42\x12\xb9\x8b\
-\x9a\x56\x2b\x90\x77\xef\xdd\xd3\x9f\x65\x66\x05\x41\xc3\xcc\xdf\
-\x1c\xbb\x6d\xdb\x16\xfd\x55\x4b\x9e\x43\xb1\x57\xc2\xcd\x03\xce\
-\x9f\x76\xfd\x45\xf4\xa7\xa9\x74\xbe\x66\xa1\x62\x9a\x79\x96\x6f\
-\xef\xe7\xc0\x23\x5c\xd2\x9c\x65\x42\x75\xe2\x79\xb0\xa4\xf2\x74\
-\xc9\x37\x5f\xea\xc4\x4a\xdf\x9f\x8c\x54\xbc\xd2\x38\x04\xbf\xf4\
-\xf3\x7f\x17\x18\x87\xb0\x2a\xb4\x5c\xf3\x93\x7f\x41\xf3\x0b\xc7\
-\xe8\xc0\x8f\xbe\xec\x11\xb3\xe5\x0f\xbf\x5e\x30\x8c\xdb\xb7\x6d\
-\xd5\x43\x89\xb3\xec\x34\x53\x07\xac\x26\x8c\x26\xfc\xc8\x4b\x1e\
-\x36\x5b\xc5\xc3\xa7\xed\x7c\x06\xed\x43\xa3\xbe\x7c\x1f\x7a\xe8\
-\xc1\x60\xf7\xee\x5d\x66\xab\xfe\xec\xda\xb9\x23\x78\x20\xe3\xf5\
-\xb4\x72\xd3\x53\xad\xe5\x86\x11\x85\x99\xbc\xb6\x95\x61\xca\x13\
-\x26\xf6\xac\x1d\xdf\x72\x93\x6f\x38\x41\xc8\x0b\xe9\x53\x93\x33\
-\xf6\x19\xb6\xb3\x04\xa7\x8d\x94\x2b\x0f\x7b\x71\xb4\xf2\x0b\x57\
-\xca\x4d\x71\xf8\x27\x6d\xeb\x96\xaf\x7a\xe3\xff\xec\x1a\x47\x15\
-\x24\x0f\xda\x8f\x5c\x45\x8d\x7f\x81\xf4\x2e\x91\xc6\x51\x0c\xb4\
-\xb1\x7f\xe9\xcb\x4f\xe8\x75\x1a\x49\x7d\x65\xae\xdf\xb8\xa9\xfd\
-\xd8\xf7\xc4\x93\xcf\x04\x67\x62\xed\xf4\xcf\x3e\xbf\x47\xcf\x62\
-\x0b\xf4\xa7\x71\x97\x78\xbf\x1a\x17\xfa\xcc\xd0\xcf\xe6\xca\xd5\
-\x70\x48\xf5\x5a\xa0\xff\x0c\xfd\x77\x98\x70\x0e\x70\x27\xf5\xa9\
-\xb1\xbf\xe4\x99\x8c\x92\xbe\x32\x4f\x3d\xf5\x6c\xf0\xec\xb3\x7b\
-\x22\x13\x1c\x56\x83\xc9\x13\xe9\x63\xc3\xda\xc2\xb6\xdb\xa7\x86\
-\xf8\xe9\x2f\xf0\xfc\xf3\x2f\xea\x85\x89\x22\x93\x66\x4f\xa6\x1f\
-\xc0\x9e\x3d\x7b\xf5\x35\x30\xd2\xb0\x15\x85\x40\x1c\x8c\xd8\xcc\
-\xfe\x17\x5e\xd8\x1b\x9c\x3a\x75\xba\x6a\x13\x17\x7d\x67\x58\x98\
-\xa1\xfb\xc5\x17\xf7\xe9\xbe\x03\x49\x5c\xb8\x70\x41\xc5\xfb\xa2\
-\x5e\x5b\xd8\xb6\x7d\x6a\x0e\xa8\x3c\x61\x71\x39\xa8\xd2\x93\xc5\
-\x85\x3e\x3e\x71\x3f\x17\xa6\x83\x20\xef\xb9\x16\xc2\x32\xa7\x54\
-\x1a\xf4\x8d\xa1\x9f\x0d\xe5\xcc\xdd\xb6\xb0\xcd\xc2\xc4\x82\xfb\
-\xd5\x39\xe7\xcc\x4c\xd3\x96\x1b\x37\x6f\xe9\x34\xdf\xb7\xef\xa0\
-\x9e\xdc\xd4\x96\xc5\x34\xe8\x07\x45\x9a\xba\xb0\x8d\xbf\x0b\x93\
-\x27\x32\x79\x2b\xf9\xc3\xac\xf6\xcc\x67\x04\xe4\x1d\x7e\xee\x0c\
-\xdd\x4c\xbc\x48\xb9\x62\x22\x59\xd2\x32\xde\x47\xc9\xfa\xb9\xef\
-\x82\x93\xea\x9c\xc7\x8f\xa7\xf7\x2d\xa1\x7f\x0d\x65\xeb\xd6\xad\
-\xe5\x33\x5f\x53\x6e\x19\xc9\xd8\xdd\xc7\x4c\xdc\xdc\xff\xfc\x7c\
-\x38\x3b\x35\x6e\xb7\x4f\x0d\xee\xa4\xc9\x5f\x29\x37\xee\xdc\x3b\
-\x4b\x4b\xf7\x54\xfe\xcd\xa9\x7b\x3e\xa1\x17\xce\xc5\xfd\x31\xb7\
-\x55\x16\x18\x65\x99\x7c\x23\x6f\x38\x77\xbc\x59\xd1\xa6\x05\x53\
-\x3b\x50\xde\x59\x5b\x78\x66\x38\x2f\x69\xc4\x42\x5e\x24\xbd\x47\
-\xe9\x63\x63\xfb\xd4\xb0\x9b\x19\xd6\x39\x17\xfd\x66\x4e\x9d\x3e\
-\x1d\x5c\xba\xc4\x71\xcb\x9f\x3f\x0b\x65\x85\x67\xd4\x2d\x33\x9c\
-\x9b\x6b\x3f\x7b\xf6\xbc\xde\xc7\xbd\x33\x0b\x7c\x25\x38\x86\x6b\
-\xe4\xdd\xc8\xc2\xf1\xf7\x13\x9e\xfb\x66\xc5\xdf\xd6\x19\x87\xb0\
-\x6a\xb4\x65\x4d\x0d\x05\x92\xb9\x9a\xe8\xdc\xc6\xe8\xa7\x69\x55\
-\xd2\x49\x05\x17\x43\xc3\xcb\x9e\x49\x07\x99\x6d\x7a\xe3\xc6\x69\
-\xdd\xd4\xe4\x42\x7c\xcc\x46\x0d\xf4\xa7\xb1\x4b\x25\x8e\x1d\x3f\
-\xae\x5f\x24\x3b\x77\xee\xd0\x83\xe7\xc5\xf1\x79\x88\x78\xe1\x86\
-\x71\x6c\xf7\x1e\x62\x9f\x17\x38\x06\x96\xd1\x73\x99\x78\x90\x11\
-\x50\x7d\xe0\x05\xcb\xec\xca\x1c\xc3\x8c\xd0\x49\x84\x82\xe9\x90\
-\x1e\x22\x9e\x51\x55\x49\x2b\xc4\x4a\xdc\x28\x61\xf0\x11\x46\x0c\
-\x65\x4f\xdf\x23\x66\x0e\xef\x32\x23\x21\x13\xc7\x21\x65\x48\xc3\
-\x38\x26\xf4\xb9\xb8\x5e\x6b\xa8\x2a\x41\x18\x66\xe8\x66\x1a\x86\
-\xa4\x39\x77\x78\xe9\x32\x03\x35\xd3\x20\xa4\xcd\x90\x3c\x3c\xbc\
-\x4e\xbf\xc0\x39\x27\x79\xc0\xb5\x87\xdb\x77\x4a\xf7\x61\xaf\x87\
-\xb0\x10\xcf\x2b\xa6\x5a\xc0\xd0\x8c\x8d\x8e\xe8\xf2\xc6\xb5\xe8\
-\x11\x94\x13\xf2\x14\x03\x74\x43\x95\x31\xd2\x21\x3e\xa0\xa3\xcb\
-\xfc\xed\xdb\x3a\xcd\x98\xb1\xbb\xcf\xcc\xb6\x6c\x61\xb6\x6f\x06\
-\x5f\xb4\x53\x03\x90\x06\x37\x95\xd0\x59\x09\x18\x47\xf2\x9c\xb2\
-\x49\x9e\x33\xc3\xb3\x1d\xa5\x97\x09\x1a\xbb\xbb\xd7\xe8\x7b\x44\
-\x6c\x32\x4b\xf8\xe5\xcb\x57\x74\x7a\x90\x97\xd4\x56\x32\xff\x92\
-\x15\x41\xcc\x14\x1e\x6e\xdf\x2d\x89\x57\xf6\x31\x77\x5a\x5a\xcd\
-\x26\x86\x94\xf4\x9e\x9e\x9e\xd4\x83\xea\xc5\xe1\x5e\xb9\x06\xc4\
-\x29\x06\x55\x5f\x83\x32\xa4\x0c\x04\xc8\x34\x09\xb5\x82\xa0\x41\
-\x4c\x31\xab\x37\xf7\x3e\x3e\x36\xaa\xc5\x08\x79\x94\x85\xeb\xd7\
-\xaf\xeb\x34\x61\x6e\x38\xa6\xc0\x60\x50\xc7\x8e\x8e\xe5\xaf\x5f\
-\xca\xb9\x4d\x3b\x5b\x9e\xb8\x1f\x04\x05\x79\xce\x73\xcd\xec\xeb\
-\x5c\x03\x73\xa6\x55\x83\x70\x94\x23\xa6\xac\x18\x52\x69\xcb\x75\
-\x13\x7f\x12\xf4\x03\x44\x7c\x90\x66\xee\xf4\x16\x3c\x9f\xa4\xfd\
-\xc8\xc8\xba\xd2\x28\xd1\xb3\x26\x9d\x93\xc0\x7f\x66\xe6\x82\xbe\
-\x5e\xee\x77\x44\x5d\xf3\x1d\x75\x1d\xd5\x84\x50\x63\x20\x2a\xa4\
-\xd9\x69\x29\x51\xe3\x63\xf8\x81\x97\x1d\xbf\x96\x30\x30\xdb\xab\
-\x88\x8d\x38\xb6\x96\xe0\xe1\x87\x1e\x0c\xa6\xd5\xcb\x7d\xd3\xc6\
-\x0d\xda\xed\x32\x31\x3e\x5e\x1a\x15\xd6\xf6\xa7\x61\x49\xe3\xe4\
-\xa9\x53\xea\x65\x7c\x51\x0b\x9a\x89\x1a\xe7\xa8\xe1\x57\x58\x18\
-\xc7\x76\x65\x3c\x47\x8d\x6f\x75\x78\x89\xf2\x82\xe5\x65\x85\x60\
-\xe0\xe5\x97\x84\x9b\xb6\xfc\x82\x44\x10\x62\xdc\x68\xc3\x4f\xc3\
-\x4e\x56\xc9\x10\xf1\x18\x23\x8c\xdf\x03\x0f\xec\x0a\x7a\x7b\xa3\
-\x23\xe6\x5a\x81\x32\x3e\x3e\xaa\xc3\x10\xde\x4e\x9b\x40\x4d\x0b\
-\x71\x60\xe4\x27\x27\x27\x55\x98\xf1\x60\xd7\xae\x9d\xea\x9a\xc3\
-\x11\x6b\x2b\x41\x3e\xd1\x8f\x62\xdb\xb6\xad\xc1\x50\x6c\xa2\x51\
-\x8c\x0c\x02\x02\x41\x53\x69\x1a\x04\x6b\x64\x49\xa7\x70\x7d\x4d\
-\x9f\x1b\xf1\x87\x1b\xac\x81\x1b\x1a\x4a\x16\x92\x18\x58\x18\x55\
-\xf9\x42\xfa\x86\xc3\xf6\x2f\x17\x8f\x33\xb3\xb3\xba\x6c\x72\xaf\
-\x49\xa2\xd4\xcd\x83\xa5\x7b\x4b\x3a\xed\x11\xd0\x83\xb1\x51\x99\
-\xb7\x6e\xd9\xac\x05\x20\x8b\x9d\xe5\x3b\xc9\x90\x79\x3e\x2e\x1a\
-\x84\x08\x30\x7f\x91\x9d\x79\xdb\x0a\x60\xd6\x6c\x23\x52\xc8\x73\
-\x7e\x30\x20\x30\xec\x6c\xd4\x76\xd4\x68\x2b\x02\x49\x7b\xf6\x77\
-\x76\x75\x96\xd2\xd5\xee\x4b\x9a\x80\x95\x38\x29\x73\x94\xcf\x34\
-\xd1\x83\xc0\x42\x98\x72\x0d\x88\x55\xbe\xb4\xe1\x1c\x2b\x9d\xf3\
-\x89\x1f\x09\xc4\xb9\x7e\x62\x42\xdd\xf7\x88\xce\x63\xde\x1b\xd5\
-\x46\x08\x8e\xbf\x8b\xac\x00\xe1\xfe\x28\x8b\xa4\x4d\x97\xba\x7f\
-\x17\xca\x09\xd7\x8e\x98\x71\xa7\x54\x20\x8d\x10\x27\x4c\xfb\xc0\
-\x3e\x44\x3a\xe9\xed\x33\x4a\xf1\x84\xba\xee\x21\x55\x96\xc8\x03\
-\x96\x3e\xf5\x63\xeb\xe6\xad\xe5\x02\x97\x73\x23\xbe\x11\x33\xe4\
-\xaf\x85\x9a\x36\xf2\x1e\x21\x86\x40\xb5\xf3\x68\xdd\x5f\xba\x9f\
-\x2a\x94\xf1\xe7\x7a\x79\x0f\x71\xbf\x4c\xcc\xba\x5e\xdd\xaf\x8c\
-\xaa\x5c\x1d\x5f\x1b\x26\xa4\xd3\x96\x35\x35\x54\x61\xf3\x22\xae\
-\xa5\xd3\x20\x0f\x2c\x2f\x87\x7e\x53\x13\x03\xae\xdb\x07\xb7\xe0\
-\x12\x1f\xb5\x05\xbc\x4c\x6a\x15\x34\x6e\x1c\x59\x04\x0d\x60\xf4\
-\x78\x69\xee\xdb\x77\x40\xff\x12\xf7\x81\xaa\x71\x6b\xc8\x2a\x81\
-\xf1\x82\xb8\xa0\xb0\x43\xe8\x5b\x78\x49\x12\x1f\xcd\x25\xc4\x6d\
-\x0d\x1c\x58\xa3\x17\x37\x66\x69\xd3\x17\xc4\x5f\x0a\xee\x0b\xda\
-\x85\x6a\x74\xce\x89\xb1\xaa\x04\xe7\x25\x9c\x6d\x5a\xc1\xb8\x5a\
-\xc3\x62\x9b\x07\xae\x5d\x0b\x85\x4e\x52\x0d\x02\x20\x66\x30\xe0\
-\x94\x3b\x44\x71\x52\x2d\xd3\xad\xf9\x79\x65\xbc\x2f\xe9\x78\x7d\
-\x6b\xd9\xd2\xc2\xb9\x35\x13\xd6\x9d\xf6\xab\xda\x17\xee\x99\x7b\
-\xa0\xc9\x05\x31\x68\x85\x9a\x85\x9a\x21\xd2\x9a\x5f\xfa\xd4\xb8\
-\x6c\xd8\xb0\x41\xa7\x1b\x60\x0c\x39\xd6\xa6\x21\x35\x02\xa4\xeb\
-\x40\x7f\xbf\x76\x5b\x3f\x44\x48\xfc\x0b\xc1\xdb\x0b\x0b\x5a\x90\
-\x91\xb6\x69\x82\xc6\x42\x18\xae\x93\x7c\xe1\x1a\x28\x9f\xbe\x73\
-\x3e\xa5\xd9\x92\x79\x95\x2f\x50\x4e\xd3\x30\x20\xd7\x9a\x05\x9e\
-\x01\xd2\x80\x1f\x03\xd4\x3a\x25\xd5\xb2\x50\xe3\x4b\x18\xee\xc1\
-\x65\xf9\x35\x84\xf8\xcc\x97\x46\xba\x92\x5f\x9c\x97\x9a\x3d\x04\
-\x0a\x82\x24\xce\x85\xb9\xb9\xa0\xa3\xb3\x23\x52\x43\x03\x56\xcc\
-\xf2\x7e\xe1\x99\x61\xa1\xe6\x0f\x10\x2e\x49\x50\x43\x03\xf1\xbc\
-\xec\xaa\x72\xbd\xbe\x06\xdd\xd7\xee\x8b\x40\x68\x4f\x72\x13\x35\
-\xfe\x05\xd2\xbb\x44\x1a\x47\xfe\xf0\x6b\x99\x5f\xf1\x47\x8e\x2e\
-\x6f\x4f\xaf\x46\xb5\xbe\x1c\xb5\xc0\xaf\x32\x7e\x11\xf2\x4b\x3d\
-\x09\x9f\x34\xb3\x71\xc4\x9b\xc2\x92\x70\xbf\x8c\xe1\xd7\x2f\x13\
-\x28\x52\xb3\xc4\x0b\xeb\xc4\x89\x93\x66\x4f\x3a\xa3\xa3\xc3\x3a\
-\x1d\x4e\x9d\xf4\x1b\xdf\xa2\xda\xcb\x17\x63\xf4\x92\x97\x3c\xa4\
-\xaf\x85\x17\x38\x7d\x31\xae\x5d\x0b\x8d\x9d\x25\xef\x5f\x79\x18\
-\x0e\xee\x21\xde\x1f\x2a\x09\xc2\x52\x1b\x83\xd8\xa2\x0a\x1d\x03\
-\xce\xcb\xdf\x36\x41\xb1\x2f\x6e\x88\x5c\x30\x46\x0f\x3d\xb8\x5b\
-\x1b\x59\xc4\x00\x4d\x7e\x56\xac\xb9\x10\x27\x71\x5d\x4a\x69\x1e\
-\xa8\x27\x34\x99\xf1\xf5\x1e\x35\x5b\xdc\x03\x7d\x37\xdc\x3e\x34\
-\x50\x69\xc8\x02\x9a\x3e\x10\x6e\xb6\xe9\x89\x1f\x06\xfc\x8a\xb7\
-\x4d\x50\xa4\x63\x9a\x68\x41\xe8\xb1\xdf\x8a\xc8\x4a\x14\x35\x57\
-\x57\x52\xcd\x5a\x16\xa8\x9d\xdc\xbc\x29\x9c\xd4\x12\x41\x83\xd0\
-\xb0\x62\xc5\xb2\x56\x89\x3f\x6a\xe0\xa8\xad\x49\x02\x81\x96\xc5\
-\xf0\x23\x68\xa8\x7d\xa1\x76\x86\x67\x8b\x5a\x4b\xd2\x32\x09\xce\
-\x8d\xd8\x21\x7c\x12\xd4\xe4\xc6\x97\xa4\x5a\x35\x97\x4e\x25\x92\
-\x9a\x0b\xdf\xb4\xf5\xcf\x03\x61\xf5\x69\x99\x9a\x1a\x6f\xb1\xa4\
-\xd8\xbd\x6b\x87\xae\x42\xe6\x01\x4e\xeb\x24\x9c\x16\x1f\x86\x87\
-\x9a\x91\x79\xf3\x0b\x06\x5c\x77\x56\x78\xb9\xf3\xb9\x2e\xf1\x62\
-\x28\xec\x2f\xd7\x2c\x10\xc7\xee\x5d\x3b\xf5\x4b\x86\x0e\x81\x37\
-\x6f\x65\x6b\xef\xc7\x20\xef\x54\x69\x32\xaa\x7e\x69\x53\x5b\x50\
-\x0d\x5e\x8e\x18\x68\x9a\x4a\xdc\x4e\xc2\x71\xf8\x85\x0e\xf1\xa6\
-\x0f\xdb\xb7\xc2\x05\xe1\x43\x9c\x0f\x3c\xb0\x5b\x6f\x5f\x35\x9d\
-\xa5\xd3\xe2\xa8\xd4\xd1\xd6\x07\x66\x32\xc7\x40\x63\x28\xdd\x4e\
-\xc2\x49\x58\x01\x44\x67\x63\x6a\x64\x30\xbe\x4c\x76\x49\x4d\x84\
-\xed\x80\x6c\x9b\x9e\xd2\xca\x0d\x46\x91\x26\x87\x5d\x2a\x9d\xe1\
-\xba\xe9\xc8\x6d\xa1\xd6\x62\xcb\xe6\x4d\xda\xe8\xd0\x57\xc9\xfe\
-\xda\x5d\x0d\xa8\x75\x70\xcf\xc7\xbd\x26\x9d\x9f\xfb\x1d\x1b\x1b\
-\xd3\xcd\x79\x60\x9b\xdd\x00\xa1\x43\x9f\x1a\x6a\x6b\x88\x2f\x2e\
-\xd0\x29\x9b\x18\x6c\x3a\xdc\xb2\xdf\xf6\xb5\xa1\x66\x82\xe6\x25\
-\x1b\x26\x4e\x9f\x12\x4a\x3c\xab\x08\xdf\xb0\x86\x23\xfd\x59\x63\
-\x1f\xb5\x8d\x3c\x4b\x9c\x83\x26\xa8\x4a\xd8\x9a\x24\x37\xce\xc5\
-\xc5\x68\xfc\x9c\x1f\xe2\x02\x8e\x3e\x75\x71\xc2\x7e\x2e\xe9\xd7\
-\x47\x73\x13\xe9\x63\x9b\x04\x79\x8f\xb8\x50\x63\x49\x59\xc3\xdf\
-\x15\x70\x56\x2c\xc6\xc3\xd3\xdf\xac\x12\x34\x1d\x01\x79\xd6\xdd\
-\x1d\x8a\xbd\xb4\xda\x15\x7e\xe8\x91\x6e\x88\x47\x7e\x1c\x59\x10\
-\x44\x40\xe7\x62\xc4\x39\xdb\x76\x49\xfb\xa1\xd1\x63\x6a\x62\xe3\
-\x35\x92\xf7\xaa\x5c\xaf\x20\xe4\x41\x5b\x36\x3f\x01\x7d\x69\x78\
-\x81\x50\x2d\x8b\x71\xf6\xc5\xbe\x90\xf8\x52\x89\xbe\x03\xfc\xd2\
-\xcf\x32\x2a\x70\x1a\xdb\xb7\x6f\xd3\x2f\x59\x6a\x8f\xee\xde\xab\
-\x6d\xb0\x35\x8c\x0d\x71\xd0\x44\xe0\x1b\xc7\xd1\x23\x7c\xe9\x31\
-\xa3\x8d\xc1\xb5\xeb\x37\x12\x0d\x4b\x92\xa1\xa6\x3f\x07\x61\x31\
-\xc0\xf6\x05\x1c\x0f\x87\x48\xe1\x7a\x48\x63\xaa\xaf\x31\x5e\x34\
-\xc1\xc4\xab\xde\x31\x86\x74\x84\x64\x3f\xf1\x81\xad\x6a\xa7\x83\
-\x31\x71\xd0\x59\x13\x01\x41\x1f\x9b\xf0\xeb\xa1\x95\x77\x3a\xa4\
-\x2f\x0d\x22\x82\x6b\xab\x24\x26\x31\xbe\x5c\x43\xbc\x46\x86\x63\
-\xf1\xab\xd4\xf4\x04\xdc\xd7\xcc\xcc\x8c\x16\xd1\x9c\x0b\xfa\x12\
-\x3a\x2e\x03\x63\x8c\x60\xe8\x4f\x9f\x3e\x13\xdc\x5b\x61\x93\x51\
-\x25\xdc\xac\xa2\x69\x04\xc1\x41\xd3\x18\xb5\x04\xf1\x2f\xa1\x40\
-\xf7\x53\x51\x65\x84\xe6\x25\x2b\x42\xac\xb1\x45\x04\x51\xf3\x40\
-\xe7\x78\xf2\x9c\x85\xe6\x1f\xfb\x15\x0e\xd8\x26\xa8\x78\x8d\x0c\
-\x62\x0e\x3f\x44\x48\xa5\x9a\x1e\xca\x01\xc7\x33\x62\x6e\x52\x53\
-\x1a\x7e\xec\xe3\x1a\xc2\x9a\x84\xf5\xfa\x1a\x2a\x35\xa9\xae\x33\
-\xcd\x77\x5c\xe7\xe5\x4b\x97\xd4\x7d\xcd\x05\x67\x55\xf9\xe3\x3c\
-\x96\x61\x25\x42\xd8\xa6\x79\x86\xce\xd2\x34\xa9\x52\x16\x49\x2f\
-\x17\xd2\x80\x9a\x4e\x9e\x85\xa4\xe7\x85\x74\x43\x98\x87\x1d\x86\
-\xc3\xda\x90\x78\xdf\x32\xa0\x26\x07\xc1\x40\x58\xdb\xc4\x47\x99\
-\xe3\x1a\x2e\xaa\x6b\xbc\xa6\xe2\xa7\xcc\x71\xcd\x69\x02\xc5\x62\
-\x6b\xad\xf8\xe2\x89\xf2\xcd\xfd\xd9\xe6\xa4\x24\x10\x5c\x9c\x9b\
-\x6b\xb5\x82\x84\x7c\xa3\x7c\xf3\x63\x07\x7f\xce\xcd\x12\xff\x91\
-\xe1\x82\x38\xa2\x29\xeb\x92\xba\x4f\x6a\x24\x6f\xaa\xf0\x08\xcc\
-\x6a\xd7\x9b\x27\x69\x3f\x2e\x1a\x99\x66\xbc\xe6\x46\xa4\x31\x45\
-\xcd\x2a\x65\xee\x8e\x1d\xa1\x90\xc0\xd0\x56\xfb\xd5\x63\x19\x51\
-\x2f\x98\x87\x1f\x7e\x30\x58\xa3\x8e\xa3\xff\x07\xcd\x3d\xf4\xcd\
-\xe1\x41\x5e\x09\xfc\x22\xe4\x57\x3c\x06\x9f\x4f\x53\x6b\x81\x38\
-\xe8\x28\x4c\x1c\x49\x9f\xaa\xc6\xb1\xf7\xcc\x0b\x92\x17\xf2\x3a\
-\x25\x52\xe8\xac\xec\x0b\x1d\x52\x49\x3f\xd2\x21\x29\xfd\xa8\x7d\
-\xa1\xd9\x05\x81\x82\x58\x41\xb8\xf0\x92\xa4\x2a\x3c\x0e\x35\x33\
-\x0c\xa1\xce\xcb\x97\xfd\xb6\x93\x29\x71\x3c\xf8\xe0\x2e\x13\xc7\
-\x8c\x5e\x68\x0a\x49\x8a\xa3\x96\x97\x02\x35\x36\xdc\x03\xf7\x7f\
-\xaf\xc2\x4b\xd7\x56\xdb\xd3\x3f\xc6\x62\xf3\xdc\xf5\x4b\x83\x5f\
-\xbf\xa4\x01\xbf\xf8\x31\xfa\x7c\x09\x95\x04\xcd\x80\x34\x53\x20\
-\xda\x10\x36\xab\x01\x82\x01\x83\x46\x4d\x00\x86\x93\x3c\xa2\x53\
-\x6a\x94\xfb\xda\x20\x53\x56\xb8\x07\x6a\xb9\x38\x06\xb8\x2f\x04\
-\x18\x9d\xe6\xc9\x03\x8e\xc7\x38\x63\xe0\xdd\x66\x36\x04\x0c\x70\
-\x9c\xcd\x2b\x2b\xa2\x5d\xb1\x98\x04\xfd\xb0\xe8\x6c\x4f\x73\x15\
-\xe2\x25\x0e\x7e\x5c\x03\x9d\xf7\x81\xf2\x42\xcd\x23\xe9\x1e\xaf\
-\x65\xb1\x10\x06\x01\xc4\x71\xfc\xb0\xa1\x96\x65\x6a\x72\xb2\xd4\
-\xc9\x1f\xa8\x61\xe3\xf9\xc6\x0f\x51\x7a\x51\x2d\x34\x3f\x5a\xd1\
-\x6d\x71\x45\x40\x1a\x88\x01\xc4\x01\x61\x49\x9f\x78\x5f\x33\x0b\
-\x65\x1f\x11\xc3\xbb\x05\xb1\x46\xb3\xd3\xc6\x0d\xd3\xba\x06\x84\
-\xeb\xe4\x53\x7e\x04\x20\xf7\x57\x09\x3a\x36\x5b\xe1\xcd\x31\xc4\
-\x63\x8f\x49\xfb\xac\x9b\xb2\x8c\x20\x99\x53\x3f\x1e\xac\x78\xa4\
-\x7c\xd8\x5a\x1c\xc4\x0c\x43\x4e\xb0\x2f\x49\x5c\x02\xe7\x99\x52\
-\xc7\x20\xaa\x28\x03\x57\xe8\x73\xa6\xae\xbd\x52\x1e\xfb\x3e\xbb\
-\xab\x64\x1a\x84\x26\xa6\xc3\x16\xa6\x0e\x05\xab\xc7\x1e\xff\x40\
-\xa2\x75\x7f\xc3\x1b\xdf\x18\xbc\xed\xad\x6f\x31\x5b\x51\xfc\x0b\
-\xa4\x67\x89\xac\xa1\xe4\xe6\x7d\x0d\x84\xa3\x59\x89\xf9\x85\x78\
-\xf1\xed\x52\x62\xa1\x12\xd5\xa2\xa5\x3a\x9f\x39\x87\x30\x06\x3b\
-\xb6\xfb\x8f\x2c\xbc\x92\xfb\xa2\x93\x25\xe3\xba\xf0\xe5\xc2\xf6\
-\x6d\xdb\xb4\x5f\x2d\x53\x23\xf8\x5e\xc3\x6d\xf5\xb2\x66\xfc\x1e\
-\xaa\xd1\xf9\x44\x3c\x0d\xdf\xf8\x2c\xbe\xc1\x57\x92\x56\x16\x9a\
-\xb5\x18\x73\x85\xea\x78\x04\x0f\xe4\x11\x6f\x04\xdf\x70\x06\x3b\
-\xef\x13\x4d\x8c\xd5\x28\x6a\x24\xe1\xbc\xd3\xc0\x3b\xad\x1c\x8a\
-\x8a\xdb\x3f\x78\x39\x20\x42\x0e\x71\xc2\x8f\x08\x40\xf0\x5c\x53\
-\xa2\x8f\x11\xc4\xb3\x9f\x3f\x9f\xfb\xa2\x26\xc4\x0e\x61\x40\x93\
-\x53\x36\xf2\xb9\x06\x4b\x71\x69\x60\x1c\x55\xc8\x7a\x7e\x75\x84\
-\x59\x57\x26\xef\xeb\x74\xb1\x71\x7f\xf6\xb3\x7f\xa8\xca\xd7\xf2\
-\xbe\x7e\x8b\x8b\x0b\x7b\x3f\xf6\xd1\x8f\x7c\x50\x39\x51\x93\xd8\
-\x69\xaa\xab\x59\xa8\x7e\x63\x41\x59\xd3\x51\x8b\xb5\xf5\xb3\x61\
-\x08\xcf\x71\x9c\x44\x9d\xaa\x96\x2b\x6c\x0e\x5a\xa2\xf9\xc9\xbf\
-\xa0\xf9\x87\xa3\xe6\x81\x2a\x75\x58\x69\x2d\x0c\x4d\x41\xb6\x59\
-\x25\xed\xb3\xdf\xbc\xe1\x9c\xe7\xcf\x87\xe7\xb4\xd5\xec\x45\xc2\
-\x2f\xe8\x99\xd9\xb0\x6f\x4a\x52\x13\x96\xa5\x91\x9f\x25\x6a\x6a\
-\x6c\x73\x85\xad\x99\xa9\x37\x74\x1a\xd6\x9d\x93\x2b\xd4\x00\x64\
-\xa5\x19\x5f\x67\x79\x3f\xe3\x79\x43\xa7\xdf\xa4\xf1\xa5\x56\x0b\
-\x6a\x4d\x6c\x33\x70\xbc\x16\xa9\x3a\xf9\xa6\x6d\x23\x3f\xe3\x8d\
-\x8a\xa4\x59\x7e\xb4\x6d\x9f\x9a\x4a\x20\x68\x18\x89\x17\x03\x47\
-\x33\x07\x63\x2c\x54\xa2\x52\x79\xa4\x86\x86\xd1\x7a\x89\x4b\x8f\
-\xd5\x52\xe3\x67\xdb\x59\x40\xd0\x30\x32\x2f\x55\xdd\x61\x53\x47\
-\xb6\xcf\xbc\x5d\x7c\x1e\x36\xd2\x8b\x51\x78\xe9\x77\x41\x55\x35\
-\x55\xeb\xcd\x06\x82\x86\x5a\x26\x7e\x71\x53\x9b\x46\x47\xe0\x7a\
-\x43\xff\x2a\xc4\x30\x1d\xc1\x27\x4d\xb3\x4a\x25\x6a\xa9\x85\x6b\
-\x77\xfc\x6d\x49\xe5\x80\xf4\x85\x72\x9b\xd5\x56\x13\x04\x0d\xfd\
-\xd6\x68\x66\xa2\x89\xa7\xbf\x3f\x3f\x01\xbc\x1a\xf8\x8b\x25\xe3\
-\xa8\x82\x08\x84\xf6\x66\xc5\xa2\xc6\xbf\x40\x7a\x97\x48\xe3\xa8\
-\x1f\xf4\xe3\xa0\x7f\xcb\x2b\x5e\xf1\x68\xb0\x6d\x6b\xb6\xc1\xf9\
-\xe2\x30\xf2\x2a\x71\xbd\xfc\xe5\x2f\x0b\xb6\x6e\x59\x59\x5c\xbe\
-\xac\xe9\x5a\xa3\xab\xc5\x5f\xf6\xb2\x47\xf4\x17\x35\x45\x43\x7a\
-\x31\xba\xf2\x23\x2f\x79\x48\x77\x20\xce\x93\xbc\x5f\x64\x69\xe1\
-\xba\xd6\xac\xd1\x4d\x66\x4c\xc6\x59\x69\x30\xbe\xd5\x84\xc1\x06\
-\xc9\x47\xca\x60\x97\xe7\x78\x2b\x45\x90\xf7\x33\xee\xfd\x2e\x68\
-\x60\xf8\x22\xcb\x36\x3d\x01\xfd\xb2\x8a\xa4\x52\x9a\xd1\x87\x05\
-\x21\xce\xb3\xd7\x08\x62\xbc\xdd\x69\x81\xe2\xdd\xd4\x48\x4d\x4d\
-\x0c\xfb\xf2\xa0\x76\x26\xeb\xa0\x7a\x69\x30\xc2\x30\xe2\x26\x2b\
-\x2b\x31\x12\xd4\xce\xd8\xcf\x51\x2d\x45\xfe\x92\xa7\x76\xc6\x4e\
-\x0d\xd1\xac\x60\x10\xe2\xe3\x9c\xac\x24\x0f\x12\xf1\x0d\xa7\x60\
-\x78\xfb\x5a\xca\x4d\xab\x91\x7b\x1e\x34\x10\x79\x5d\x33\x1d\x94\
-\x65\xc4\xde\x5a\x69\xdd\xf2\xd5\x8e\x34\xbd\xa8\x69\xe5\x17\x5e\
-\xbd\xc9\x3b\x6d\x25\x0f\x8a\xa3\xa8\x0e\xc2\x42\xab\x23\xcf\x78\
-\xbd\x91\x34\xcb\x17\xa9\xa9\x59\x21\xbe\xe5\x51\x0a\x6e\x71\xb4\
-\xf2\x0b\x57\xca\x4d\x71\xf8\x27\x6d\xeb\x96\xaf\x7a\xe3\xff\xec\
-\x1a\x47\x15\x24\x0f\x84\x15\x89\x1a\xff\x02\xe9\x5d\x22\x8d\x43\
-\xf0\xc5\x3b\x0f\x3c\x5f\xcc\x8d\x84\x14\x87\xfa\x93\xf7\x33\xee\
-\xfd\x2e\x68\x03\xf2\x4f\x5b\xe3\x10\x72\x47\xf2\xa0\x79\x68\x8b\
-\x9a\x9a\xa4\x02\xc9\x97\x2e\x5f\xfa\xf2\x13\x66\x2b\x24\x29\xdc\
-\x97\xbf\xf2\xa4\x0e\x6b\xc1\x8d\x5f\xd1\xc4\xaf\xe5\xc0\xc1\x43\
-\xc1\x13\x4f\x3e\x6d\xb6\x42\xd8\xc6\xdf\xc2\x17\x5b\xee\x76\x1c\
-\xe6\x54\xe2\x4b\xac\x6a\x24\x85\x7b\xfa\xe9\xe7\xf4\x20\x85\x59\
-\x20\xfc\x33\xcf\x3c\x6f\xb6\xfc\x61\xf0\x41\xbe\xde\xb2\x30\x82\
-\x30\xe3\x05\x55\x82\x31\x80\x98\x53\x69\x25\xf0\x05\xd7\xb1\x63\
-\xc7\xcd\x56\xa0\xdd\x8c\xf3\x53\x8d\xb4\x17\xde\x8b\x2f\xee\x8b\
-\xce\xa5\xe5\xf1\xc6\x3b\x71\xf2\x54\xf0\xe2\xde\xfd\x66\x2b\x19\
-\xca\x20\xe1\xb2\xc0\xe0\x82\x4c\x18\xea\xb2\x7f\xff\xc1\xc4\xd1\
-\x83\x2b\xc1\x80\x80\x8c\xe3\x93\x15\x8e\xa3\x5c\x59\x18\x95\xd7\
-\xa7\x3c\x55\x33\x26\xa7\x54\xbc\x0c\xbd\x90\x16\x8e\x41\x28\xed\
-\xd0\x0c\x2b\x81\x51\xba\xed\xb0\x0c\x10\xdf\xf6\xe5\xd8\xb1\x13\
-\x89\x83\x07\x16\x01\x53\xa6\xd8\x69\x3c\x6a\x81\x69\x29\x28\x37\
-\xd5\xf2\xc0\xe2\x1b\xae\xb1\x68\xc6\x6b\x16\x2a\xd1\xd4\xa2\xa6\
-\x39\x1f\xa2\xd6\xa2\xb5\x5f\x78\xf5\xc5\x3b\x6d\xdb\xf8\xc5\xbc\
-\x74\xef\x5e\xa1\xd3\x49\xf8\x22\x06\x5d\xa8\x05\x79\x2f\xe6\x8f\
-\xf4\xa9\x59\x01\xbe\xe5\x51\x0a\x6e\x71\x78\x1b\x7e\xc9\x83\xc2\
-\xa8\x67\xda\x32\xdf\x59\x2d\xc3\x16\xf8\x5f\x72\xe3\x97\x1b\xc6\
-\xa7\x59\xad\xda\x9f\x3c\xf1\x7f\x76\x8d\xa3\x0a\xf2\x8c\x0b\x50\
-\xb3\xa8\xc9\xdd\x98\x48\x81\x2c\x91\xf7\xc3\x29\x83\xb2\x15\x47\
-\x2b\x97\x6f\x31\x12\xc5\x91\xe7\xfb\x93\xb9\xad\xe2\x93\xc4\x0a\
-\x3e\xe4\x97\x07\x20\x8f\x4b\x63\xd0\xb4\x35\x35\x3e\x05\x8d\x91\
-\x6e\xe9\x9f\x40\xdf\x99\xaf\x3e\xf1\xb4\x9e\x55\x3b\x0d\xe2\xbb\
-\xae\x7e\xf1\xd8\x3e\x33\x4f\x3c\xf9\x8c\x9e\x81\xbb\x1a\x67\xce\
-\x9e\x0d\xbe\xf2\xd5\x27\xf5\x3a\x09\x46\x14\x66\xee\x9e\xa7\x9e\
-\x7e\x56\x5d\xc3\x53\xc1\x73\xcf\xef\x09\x66\xaa\xb4\x73\x33\x22\
-\xf0\xe1\x23\x47\x83\xa7\x9f\x79\x4e\x2f\xc7\x4f\x9c\xd0\xf3\xba\
-\x64\x85\xfe\x35\xf4\xb3\xb1\xc3\xa7\x27\x41\x1a\x31\x53\x37\x7d\
-\x58\x58\xe8\x03\xc2\x8c\xc3\xd5\xa0\x3f\x04\xfd\x6c\x98\x30\x10\
-\x88\x87\xfe\x02\xcf\x3f\xff\xa2\x5e\x68\x8b\xb7\x13\xde\x55\xca\
-\x2b\x8e\x63\x42\xcc\x3d\x7b\xf6\xea\x85\x91\x51\xab\x9d\x9f\x7e\
-\x02\xf4\xb1\xa9\xd4\x5f\x80\xfe\x35\xf4\xb3\x61\x12\x46\x0b\xd3\
-\x46\x1c\x38\x70\x50\xf7\x9d\x61\xcd\x08\xc8\x69\x24\x5d\x33\xa3\
-\x42\xd3\xc7\xc6\x9d\xf9\x99\x19\xab\xf7\xed\x3f\xa0\xfb\xcf\x84\
-\xb3\x87\xa7\x1b\x17\xdb\x5f\x86\x72\x06\x34\x9b\xd0\x27\x64\x9f\
-\xba\x16\x16\xfa\x7e\xd4\x92\xcf\xb6\xbf\x0c\x13\x52\xc2\xbd\x7b\
-\x4b\x7a\x72\xd0\x03\x07\x0f\xeb\xe5\xfc\xb9\x19\xaf\x3c\xa5\x7f\
-\x0d\xfd\x6c\xec\x04\x90\x76\xf6\x6d\xca\x2f\x8b\x9e\x19\xda\x23\
-\x1e\x7b\x1c\x65\x98\x85\xe3\xaa\x35\x11\x31\x73\x35\x65\xca\xce\
-\x60\x0d\xc4\x43\x1e\x51\x26\xe9\x67\x45\x9c\x4c\x3a\xe9\x82\x3f\
-\xfd\x73\x7c\x21\x0e\xfa\xd9\x30\xad\x41\x1a\x8b\x8b\x0b\x7a\xee\
-\x1d\xca\xd0\x71\x75\x6e\x66\xa7\xae\x06\x35\x25\x94\x7f\x37\x5e\
-\x84\x86\xf5\x27\xef\x7d\xe2\xe1\x99\x61\xd2\x48\xf2\x8f\xe7\x82\
-\xe3\xa9\x89\x49\xe3\xc4\x89\x53\xa5\x99\xb7\xe9\x43\xc3\x92\x56\
-\x86\x78\x5e\xd8\x1f\xce\xfe\x7d\x5f\x4f\x6d\x42\xf9\xa5\x0c\x52\
-\x86\x70\x27\x4d\x52\x49\xfc\xe4\x21\xcf\x26\x13\xca\x32\xb1\x65\
-\x1c\x5f\xc3\x2f\x08\x45\xd3\xd2\xcd\x4f\x18\x75\x26\x75\x64\x36\
-\xee\x8d\x1b\xa7\x2b\x8e\xfa\x89\xa1\xe1\x85\xbe\xa0\x8c\x12\xa3\
-\xe3\x12\x9e\x59\x72\x2b\x71\x7e\x66\x46\xbf\x7c\x98\x4a\x61\xd3\
-\xc6\x70\xf2\xc3\x38\x77\xef\x30\x97\x58\x10\x6c\xde\xbc\x31\xd8\
-\xb6\x6d\x8b\x9e\x5d\x97\x17\x11\x33\xdd\x26\x81\xa0\xd9\xab\x0c\
-\x1f\x62\x81\x69\x15\x98\x54\x91\x97\x63\xd2\x8b\xa4\x12\x08\x21\
-\x66\x48\x66\xd4\xd3\xb4\xd9\x71\x11\x14\xfb\x95\x41\xbe\xa6\xc2\
-\x31\x9d\x02\x23\x92\xfa\x9c\x8b\x17\x23\x71\x93\x4e\xcc\x8b\x45\
-\x3c\x07\x55\x5a\xe3\xc7\x34\x09\xa4\x1d\xc6\xa7\x5a\x3c\x1c\x77\
-\xe8\xd0\x61\x73\xdc\x84\x4e\x47\x8e\xb3\x33\x1e\x27\x71\xf1\xe2\
-\x45\xfd\x62\x65\x92\x51\x46\xdc\x4d\x82\x4e\xa9\x18\x82\xad\x5b\
-\xb7\x44\x66\x42\x66\x0e\x25\x26\xaa\xdc\xb8\x71\x43\xc0\x4c\xdf\
-\x18\x38\x66\x05\xf7\x81\xe9\x13\x78\xb1\x33\x72\x2b\xe7\x76\xfd\
-\x98\x71\x9b\x11\x66\x89\x93\xd1\x95\x93\x08\xcf\x75\x53\x97\x03\
-\x06\xd5\xc3\xc8\x63\x34\x6f\x28\x01\xc1\xe0\x8c\xcc\x0e\x7d\x47\
-\x19\x23\x6b\xa0\x7c\x8d\x04\x9d\x55\x11\x33\xe4\x1d\xd3\x29\x20\
-\x68\x8e\x1f\x3f\x11\xdc\xbc\x75\x4b\xcf\xb4\x3d\xa9\xae\x75\x51\
-\x95\x41\x1b\x6f\x1a\x18\x4f\xe2\x21\x6d\x98\x85\x1a\x41\x81\x98\
-\x08\xe3\x19\x0d\xd6\x4f\x4c\x28\x23\x78\x27\x58\xa8\x12\x0f\xc7\
-\x51\x3e\x6e\x29\xe3\xee\x7b\x1c\xa2\x9b\x29\x3d\x18\xc0\xd1\x9d\
-\xf1\x3c\x34\xe8\x37\xf4\x04\xa9\x5c\x17\xf0\x43\x23\xc9\xf0\xfa\
-\x80\x18\xa5\x6c\x51\xd6\xc9\xab\x24\x10\x34\x67\x55\x9a\x22\x0c\
-\xf4\x4c\xe4\xc3\xe1\x4c\xdf\x95\xb0\xf1\x52\xf6\x6d\xbc\x5a\xd0\
-\xa8\xf7\x03\xc2\x81\x09\x65\x87\xd7\xad\xd3\xe5\xbc\x1a\x74\xce\
-\xbd\xae\xee\x99\x67\x96\xe7\xbf\xaf\xaf\x4f\x0b\xbb\x34\x61\xc3\
-\x35\xda\x41\xf7\x28\xdb\x2c\x49\x83\xf0\x5d\xba\x74\x49\x97\x01\
-\xc2\x13\x27\xd8\x99\xba\x47\x47\x46\xf4\x14\x0f\x3c\xaf\x94\xe9\
-\x38\xcc\xd8\xcd\x7b\xcb\xce\xe9\xc6\xf5\x54\x2b\x4f\xab\x4d\x33\
-\x8a\x2a\x11\x82\xc5\xd0\x18\xa2\xa6\xa0\xcc\xe5\x65\xc9\xa8\xba\
-\xd3\xea\x25\xb6\x59\x89\x83\x4a\x73\x38\xf1\x2b\x95\x17\xf2\xc3\
-\x0f\x3d\xa8\xc3\x6f\x52\x2f\x51\xdc\x69\x5c\x56\xbf\xba\x10\x27\
-\x18\xe2\x4a\xd3\x1f\x0c\x0e\x0e\x06\x0f\xec\xde\xa5\x8d\x16\x23\
-\xd6\x32\x47\x0c\xb8\xbf\x48\x5d\x78\xa9\xf1\x42\x44\x00\x6d\xdc\
-\xb0\x41\x4f\xe1\xff\xd0\x83\x0f\xa8\x97\x4a\x74\xa4\xdb\x4a\xf0\
-\xcb\x0b\x23\x81\xa0\xa9\x34\xef\x13\x2f\x63\xce\xc5\xf4\x00\x7a\
-\x8e\x2b\x65\x00\x1f\x7c\x70\x77\xc5\x73\x31\x0b\x30\x71\x23\x68\
-\xec\x1c\x4f\xfc\xc2\x23\x9e\x2d\x5b\x36\xe9\x17\xf1\x84\x4a\xe7\
-\x07\x1e\xd8\x55\xf5\x9a\x11\x28\x1c\x87\xa1\xc7\xd0\x70\xdc\xee\
-\xdd\x3b\x83\x9e\x9e\x6e\x13\x22\x0a\xb5\x2e\x88\x48\xae\x13\x23\
-\x97\xf4\x52\xc0\xc8\xf3\x62\x46\xd0\xf0\xa2\x06\x1b\x0e\xbf\xf5\
-\xeb\xd7\xeb\x97\x33\x2f\x7f\xa8\x54\x8b\x65\xc1\xb0\x22\x4a\x30\
-\x08\x53\x53\x61\xfe\x81\xfd\x55\x8e\x21\xb6\x62\xa9\xb3\x73\xb9\
-\xa8\x99\x51\xc6\x8d\xf2\xc2\x7d\x62\xdc\x80\x6b\x44\x64\x6d\x54\
-\x62\x88\x72\x89\x30\x62\x3a\x84\xb4\x7b\x4f\x82\x09\x44\x89\x17\
-\x41\x63\x27\x5d\xe5\x57\x3e\xf1\x6e\x50\xe5\x0c\x63\x4a\x1e\x91\
-\xbf\xdd\xdd\xe9\xa3\xcd\x52\xe6\xa8\x45\xe0\xfa\x6d\x3c\x57\xae\
-\x5c\xd1\x06\x99\x72\xcb\x8c\xcf\xa4\xe5\xe6\xcd\x9b\x96\xc5\x13\
-\xcf\x83\x6b\xd7\xae\x95\x8e\x23\x5d\x30\xce\x49\xc7\x59\x6e\x29\
-\xd1\xc4\xf9\xb9\x4e\xf2\xdf\x42\x9a\x63\x64\x79\x5e\x78\x86\x06\
-\x06\xfa\xb5\x7b\x49\x89\x36\x9f\x3c\x8b\x73\x49\x19\x62\xfb\x43\
-\x01\xd1\x96\x06\x06\x9b\x73\x20\x52\x11\xc4\xdc\x37\x22\x3d\x0d\
-\xf2\xd1\x8a\x79\x44\xa5\x85\xe7\x3b\x8c\x67\xaa\x14\x0f\xee\x4a\
-\x20\x2a\x11\x0b\xa4\x1d\x65\x14\xf1\xc1\x71\x7d\x7d\xbd\xa9\xf7\
-\x1c\x8e\x24\x1c\x96\x39\xd2\x89\x25\x0e\x79\x89\x28\xa2\xfc\xba\
-\xf3\x42\x31\x7a\x36\x69\xce\xe4\xad\x9c\x83\x85\x9a\xe5\x38\x93\
-\xea\x99\xe1\x3a\x58\x10\x98\x60\x6b\xf3\x6a\xc5\xd7\xa0\x17\x64\
-\x1a\x84\x16\xa6\x26\x51\xe3\x5f\x20\xeb\x5b\x22\x79\x99\xf3\x32\
-\x78\x7e\xcf\x8b\x15\x9b\x9e\x80\x17\x0a\x2f\x25\x77\x6a\x84\x4a\
-\xd3\x24\x50\xed\x4d\xcd\x8f\xfd\x05\x59\x89\x93\xa7\x4e\xe9\xe6\
-\x27\x9a\x43\xdc\xcf\x5a\x93\xb0\xbf\x0a\xe3\xb5\x2b\xfc\x52\x72\
-\x49\x4b\x5b\x0c\x01\xb5\x07\xda\x70\x2b\xa3\x52\xa9\x3f\x8d\x6d\
-\x9a\x89\xcf\xe2\x1d\x9f\x2a\xc0\x12\x89\xdb\x88\x02\xb0\xf1\xb8\
-\xb5\x22\xd0\xdd\x5d\xd9\x40\xdb\x5f\xae\xf1\xe3\xd2\xce\x8f\x88\
-\x24\xcd\x31\x20\x49\xf0\x6b\x19\xa1\xc6\x4b\x9a\x17\x70\x1c\x0c\
-\x16\xcd\x4e\x7c\x92\x4c\x93\x40\x1a\xf1\xb4\xa5\xda\x9d\xf3\xba\
-\x46\x17\x30\xda\x9d\x5d\x9d\xba\xd9\x04\x51\x9c\x54\xc3\x44\x8d\
-\x05\x22\x90\x6b\xb2\x82\x06\x30\xe6\x10\x37\x42\x69\xf7\x1e\x07\
-\xe3\xc3\xfd\x50\x66\xdd\x59\xe4\x6d\xbc\x71\xc3\x9d\x16\x2f\xf1\
-\x60\x98\x97\xc7\x13\x0a\x36\xd7\x50\x43\xb5\xeb\xb3\x4d\x60\x88\
-\x10\x97\xb4\xb2\x70\xee\xfc\x8c\x4e\x43\xb7\x86\x06\xec\xf9\x49\
-\x7b\x9e\x35\x16\x3e\xa3\x86\xac\x4d\x74\xd4\xbe\x22\xfe\x98\xbd\
-\xba\x92\xa0\x01\xc2\x22\xc6\xd7\xac\x29\x5f\x6f\xda\xf4\x03\x84\
-\x45\x0c\x86\xf1\x46\xd3\xa9\x1c\x4f\xf9\x58\xeb\x4e\x7b\x76\xc3\
-\x66\xa1\x50\x98\xd3\xf4\xc4\x62\x9b\x97\x6a\x69\x96\x04\xae\x83\
-\x77\x0a\x82\x25\x3e\xd1\x25\x35\x5e\xe4\x3d\x4d\x4f\xe7\xcf\xcf\
-\xea\xf3\xdc\x5f\x5a\x7e\x6d\xae\xd0\xb6\xee\x46\xf8\xe2\x6c\x65\
-\xa4\xbf\x17\x5d\xfc\x6d\x9d\x71\x08\x75\xa7\x29\x9b\x9f\x7c\x0b\
-\x9a\xae\x6d\x79\xf8\x41\x2d\x08\x30\x62\x87\x8f\x24\x8f\x63\x42\
-\x7c\xd4\xd2\x64\x01\xa3\xce\x31\xf6\x45\x9b\x06\x7d\x11\x78\x61\
-\xf0\x2b\xfd\x6b\xbf\xf6\x15\xc1\xd7\x7f\xdd\xab\xcc\x9e\xca\x30\
-\x29\x65\xad\x8c\x2a\x83\x8e\x60\xa8\xd6\x7c\x66\x71\x9b\x4c\xaa\
-\xa5\xad\x8d\xdb\xed\x57\x62\x49\x6b\x7a\xa9\x86\xef\x71\x08\x3d\
-\xd2\xbc\x52\x1f\x0a\xc2\xf0\xab\x94\x5a\x20\x17\x04\x00\xb5\x2d\
-\xec\x67\xd2\xca\x47\x1f\x7d\xa9\xd9\x53\x1d\x8c\x3d\xe7\x3d\x7b\
-\x36\x3a\x2e\x09\xc6\xec\xa1\x07\x77\xeb\x5a\x26\x0c\x92\x6e\x4e\
-\x4a\x68\xce\xe2\x78\xae\xe9\xd2\xe5\x2b\xc6\xa7\xcc\x4a\x26\xaa\
-\x24\x5e\x44\x04\xb5\x33\x71\xba\x94\x50\xb0\x54\x7b\x5c\x10\xa9\
-\xc4\xc3\x2f\xfa\x38\xb5\x4e\xd4\xe8\x7b\xdc\x90\x12\x75\xd4\x68\
-\xa4\xf5\x8f\xe2\x47\x43\x7c\x49\x12\xac\xd5\x40\x54\x22\x3a\xab\
-\x35\x25\x71\x2d\x59\xb0\xf1\xba\x7d\xb7\x20\x6b\x3c\x2e\xd4\x26\
-\xb1\x50\xae\xdc\xa5\x56\x10\x98\x08\x96\x72\xd9\x0c\x0b\x04\x82\
-\x86\x72\x49\x8d\x1e\xef\x27\xee\xc5\xc5\xd7\x4e\xfb\xbe\x8f\x85\
-\x32\x92\x66\xc5\xd1\x94\xa2\x26\x0b\x18\x61\x0c\x0f\x22\x24\xc9\
-\x10\x5b\xac\x81\x98\x77\xda\x8a\x5d\x77\x9c\x9d\x3b\xb6\xeb\xea\
-\x64\x0c\x4a\x5a\x27\x61\x0a\x2e\xfb\x89\x9b\x2a\x65\x84\x0a\x7d\
-\x66\x2a\x61\x7f\xe1\x5e\xbc\x14\xed\xc4\x1a\xef\x20\x99\x06\xc7\
-\xef\xda\xb5\x53\x1b\x2a\xfa\x36\xd8\x5f\xce\x49\x50\x75\x0d\xbc\
-\xdc\x5c\xd2\x3a\xbb\x12\xf7\x8e\x9d\xdb\x75\xdc\xfc\x82\x2e\xff\
-\x2a\x0f\xe3\x89\x1b\x57\xfa\x52\x54\x22\xed\xb8\xb4\xf3\x6f\xd9\
-\xb2\x59\x37\x3d\xf1\xeb\x38\xc9\x08\x22\x32\xf8\xc4\x97\x97\x33\
-\xcd\x64\xd4\x5a\xd8\x97\x07\xcd\x22\xc0\x0c\xdc\xd4\x36\xdc\xcb\
-\xf0\xcb\x97\x7e\x4d\x54\xdd\x53\xeb\x17\x2f\x43\x34\x37\x51\x83\
-\xc3\x4c\xec\x10\x37\x9a\x03\xfd\xfd\xfa\x93\x63\xae\x89\x5f\xe0\
-\xb6\x7a\x9f\x5f\xce\x70\xd5\x5c\x97\xa5\x52\x47\x63\x17\x26\xba\
-\xb4\xfd\x68\x10\xcd\xb6\x96\xc8\xf6\x97\x88\x5f\x47\x5a\xbc\x61\
-\x3c\x1b\x9d\x78\xc2\x1a\x12\x5b\x33\xe8\x1b\x8f\xc5\x1e\x67\x6b\
-\xe1\x2c\x69\x65\x81\x5a\x37\x9a\x9e\x30\xae\x6e\x93\x2c\x79\x09\
-\x4b\x4b\xf7\x74\xb9\x73\x97\x6a\x35\x80\x71\x7a\x55\x7e\x23\x0a\
-\x88\x93\xfc\xa3\xdf\x4c\x1a\x84\xa1\x49\xf4\xee\xdd\xf2\xf5\xa6\
-\xd5\x92\x10\x2f\xe5\x91\x63\xa8\x8d\xe3\x38\x4b\x39\x9e\xf2\xb1\
-\xd5\x6a\x5b\x6c\xde\xd1\x7c\x87\xdb\x36\x09\xd9\xa5\x16\xb8\xc6\
-\x89\x89\x09\x7d\x3c\xcf\xf9\x9d\x3b\xe5\x6b\xa4\x36\x0c\x7f\x9e\
-\x43\x66\xfa\xae\xb5\xaf\x52\x56\x7c\x0d\xba\xaf\xdd\x17\x81\x20\
-\xb8\x64\x16\x35\xfe\x05\xd2\xbb\x44\x1a\x47\xfe\xf0\xe5\xc7\x69\
-\xf5\xab\x9e\xa6\x27\x0c\x52\xbc\x49\xc7\x85\x5f\x80\xb0\xff\xc0\
-\x41\x1d\x9e\x0e\x89\xb8\x2b\x41\x5f\x1a\x04\x0b\xfd\x3c\xd2\x3a\
-\xfe\x62\x2c\x30\x0c\x67\xcf\x9d\xd3\x5f\x3d\x55\x1b\x8d\x95\xb6\
-\x7c\x7e\xe5\x52\xed\x1c\x1e\x73\x41\x77\x78\x76\x5f\x98\x3e\x60\
-\xdc\x89\x87\x51\x71\xe9\x90\x9b\x04\x7d\x14\x08\x43\xf5\x33\x9d\
-\x6f\x79\xe1\xd3\x94\x52\xed\x5c\x5b\x95\xb8\x08\xaf\xf1\xa4\x8e\
-\x1b\x83\xc1\x36\x42\x07\xc3\x48\x1f\x1b\x9f\x78\x30\x68\x1c\x47\
-\xfa\xd1\xac\xc5\x71\x34\x33\xd0\x27\x24\x0d\xf2\x29\x14\x08\x33\
-\xcb\x7e\x1d\x5b\xe8\xc3\x11\xde\xd7\xa9\x92\x78\xb1\x46\x92\x2f\
-\xa0\xa8\xb5\x39\x76\x3c\xbd\xf9\x29\x09\xfa\xd2\x70\x5e\xae\xd3\
-\xfe\xe2\xe5\x7a\xe9\x2f\x83\xb1\xe0\xbe\xc1\x1a\xa6\x38\xa4\x35\
-\xcd\x2c\x74\x62\xa6\xea\x1e\x43\xc3\x36\x9d\x52\x2f\xa8\x78\xa8\
-\xc5\xe1\x0b\x99\x4a\xf7\x9e\x04\xd7\xa5\xe3\x51\xe5\x95\x4e\xc2\
-\xf4\x79\x60\x9b\x66\x1d\x0c\x2d\x82\x91\xa6\x31\x0c\x65\x25\xdc\
-\x78\x30\xbe\xfc\x08\x60\x9b\x32\x4b\x27\x53\x84\x24\xd7\xee\xc6\
-\x93\xf4\x8c\xbb\xc7\x21\x52\x78\xee\xe2\xc7\xc5\x41\x14\x22\x56\
-\xb8\x5e\xb7\x59\x8e\x59\xdf\x49\x57\xf2\x8b\x78\x92\x44\x65\x16\
-\xe8\x4f\xa5\xaf\x4d\xe5\x21\x62\x29\x89\x91\x91\xb0\x9f\x18\xb5\
-\x72\x94\x2f\xee\x3b\x5e\x43\x17\x87\xeb\x27\x5e\xfa\x06\x91\x07\
-\x60\xdf\x35\xb6\x9c\x12\x0f\xee\x4a\xf0\xae\x40\x64\x70\xbf\x94\
-\x2d\x84\x1e\x0b\xc7\xa6\x75\xcc\x25\x0b\x6c\x93\x20\xf9\x74\x3d\
-\x26\x92\x2d\xf4\x8b\xea\xe8\xec\x50\xe9\x57\xfe\xc2\x89\xa6\x24\
-\xe2\xe5\xfd\xc4\x39\x6c\x93\x9f\x90\x8d\x02\x4d\x98\x50\x03\x2d\
-\x5b\x53\x63\x0d\x39\x2f\x24\x9a\x9e\x78\xc9\x3c\xf8\xc0\x6e\xed\
-\xe7\x62\x5f\xcc\x23\x6a\x3f\x4d\x55\x6b\x94\x31\xa4\x2d\x9b\xa6\
-\x1b\x3a\x17\x23\x5a\x2a\xb1\x7d\xfb\x36\x6d\x40\x31\xc6\x49\xb5\
-\x30\xd4\x9a\x58\xe1\xc3\xd7\x1c\xbc\x00\x79\x79\x25\x09\x0d\xae\
-\x85\xda\x9c\x47\x1e\x79\x58\x87\xa1\xb6\x81\xa6\x16\x5e\xf8\xfc\
-\x2a\xb7\xf8\x08\x46\x3a\x48\xf3\xd5\x17\xc2\x22\x6d\xfa\x00\x9a\
-\x7d\xb8\x67\xe2\xc7\x98\x71\x3e\x7e\xb5\x21\xac\x2a\x81\xb1\xa1\
-\xa3\x30\x71\x23\x9a\x88\x87\xda\x30\x84\x03\xb5\x11\xa4\xb9\x4f\
-\x3c\x1c\xf7\xe0\x83\xbb\xcc\x71\x33\x7a\xe1\xeb\x91\x6a\x1d\x2a\
-\xe9\x90\x1c\x8a\x96\xd3\x89\x35\x2e\xbc\xe4\xe9\x4f\x85\x40\x38\
-\x69\xa6\x01\xe0\x2b\x9c\xb0\xb6\x0e\x21\x32\xab\xcb\x03\xe7\xcd\
-\xd2\xec\x88\xa0\xb2\xe2\xed\x9e\xc9\x6b\x0c\x42\xf8\x05\xd2\x4d\
-\x2d\xee\x38\x47\x12\xfc\x62\xde\xbc\x69\x93\xbe\x26\x8c\x3c\xcd\
-\x4e\xd4\xf6\x51\x93\x83\x31\x44\x04\x60\xd0\xd2\xfa\x0b\xa5\xd1\
-\xdb\xdb\xad\xcb\x29\xf1\x52\x56\x68\x76\xda\xbe\x6d\x9b\xae\x81\
-\x41\x00\x50\x8e\xa9\x3d\xb1\x5f\x6c\xa5\x81\x81\xa3\xb9\x16\xf1\
-\xc1\xfd\x70\x9f\xdb\x95\x30\x0e\xe3\xb9\xa8\x84\x97\x8d\x27\xbd\
-\xb3\x3d\x70\x1c\x1d\x9e\x29\x7f\xee\x71\x34\x71\x54\x82\xfb\x46\
-\x18\x20\xc6\x6c\x9e\x70\x3d\x61\x2d\x4e\xd8\xdc\x49\xed\x25\xfb\
-\xac\x51\xf6\xfe\xe1\x64\xa0\xb3\x32\x35\xa6\xdc\x23\x65\x20\x89\
-\xb0\xfc\xf1\xc3\xa2\x53\x5f\x3f\xf9\x4b\x9e\x5a\x51\x9c\x04\x7d\
-\x65\xf8\xca\x0c\x31\x78\xe1\xc2\x05\xed\x47\x3c\x34\x21\x11\x0f\
-\x62\x8d\x9a\x2b\xe2\xa9\x56\xe3\x42\x3a\x50\x36\x11\x1b\x88\x1b\
-\x16\xdb\xd7\x26\x0d\xc2\x13\xaf\x16\x40\x29\xa2\x86\x6b\xe4\x19\
-\xe0\x1a\x11\x4c\x30\x3e\x3e\xae\xf3\x1d\x41\x43\x0d\x9c\x7d\xd7\
-\x65\xa9\xb1\xc9\x9a\x07\x8d\x81\xdf\x35\x37\xe7\xbd\x09\x1d\x36\
-\xe3\x3a\x14\xac\x1e\x7b\xfc\x03\x89\x6f\xf9\x37\xbc\xf1\x8d\xc1\
-\xdb\xde\xfa\x16\xef\x8c\xf6\x2e\x10\x19\x0b\x4e\xde\xe7\xf7\xbe\
-\x4e\x07\xff\x5b\xab\xf3\xbd\x79\xb7\x8a\x87\xe4\x7e\xfe\x8c\xf7\
-\x0f\xbe\x87\x14\x75\x0d\xb9\xc7\x5b\xd4\xf9\xbd\x5f\xcc\xc6\x91\
-\x81\xbc\xd3\xc0\x3b\xad\x0c\xbe\xe1\xb5\x68\x3d\x79\x4a\x1b\xe3\
-\x6a\xa2\xcd\xe2\x7f\x29\xf5\xbd\x37\xff\x70\xc6\xe1\x4d\xde\xe7\
-\xcf\x7c\x01\xb9\xdf\x5b\xf6\x6b\xc8\xf7\xde\xb2\x9e\xbe\x5a\xbc\
-\x9f\xfd\xec\x1f\xaa\x1f\x16\xcb\xc7\x48\x5b\x5c\x5c\xd8\xfb\xb1\
-\x8f\x7e\xe4\x83\xca\x89\xea\xc4\x4e\x53\xad\xcb\x42\x35\x1e\x0b\
-\xea\x97\xea\x36\xd6\xd6\xcf\x86\x21\x3c\xc7\x71\x72\x75\x09\x99\
-\x13\xad\x69\x68\xf9\x3e\x35\x79\xe3\x5b\x14\x5a\xb8\xcc\x14\x46\
-\xde\x69\x2b\x79\x50\x7f\x8a\xca\x03\x6a\x13\x6c\xc7\x66\x6a\x1a\
-\x7d\xf0\xbf\x14\x29\x5f\x45\xe1\xff\xec\x1a\x47\x15\x24\x0f\x84\
-\x38\x99\x44\x8d\x7f\x81\xf4\x2e\x91\xc6\x21\xf8\xe2\x9d\x07\x9e\
-\x2f\x66\x41\x70\xc9\xfd\x19\x2f\x00\x04\x0d\x5f\x1d\xd2\x34\xc4\
-\x87\x00\xd5\x3e\xd3\x6e\x14\xf2\x4e\xdb\x3a\x66\x41\x13\x23\x79\
-\xd0\xea\x34\x55\x4d\x4d\xfe\x2f\x85\xc6\x29\x91\x8d\x74\x2d\xed\
-\x4a\xee\xe5\x46\xf2\x34\x33\x3e\x69\xcb\x97\x3a\xf4\x57\x61\x30\
-\xc5\x31\x33\x18\x9c\x90\x1f\xb9\x3f\x07\x82\xb0\x8a\x48\xf3\x93\
-\xa0\xc9\xfb\x45\x26\x2f\xbc\xec\x78\xa7\xad\xf7\xaf\x4d\xe3\x68\
-\x41\xa8\x9d\xa9\x34\x4a\x72\xed\xb4\x72\xf9\x6e\xe1\x02\xd1\x24\
-\xc8\x7b\xb1\x78\x44\xd4\x64\xc0\xb7\x3c\x4a\xc1\xcd\x4e\xde\x69\
-\x2b\x79\x90\x9d\xbc\xd3\xb6\x91\xf2\x40\x8a\x43\xfd\xf1\x2f\x37\
-\xc6\x51\x05\x79\xc6\x85\x24\xbc\x45\x4d\xee\x2f\x32\x29\x90\x25\
-\xf2\x4e\x5b\xe9\x4f\x53\x1c\x52\xbe\x85\x5a\xc8\xfd\x19\x97\xe2\
-\x55\x03\x92\x07\xed\x40\xd3\xd4\xd4\xe4\xff\x52\x90\x12\x99\x95\
-\x56\x4e\x5b\x29\x0f\xf5\x47\x9e\xdd\x22\xc9\x37\x6d\x25\x0f\x8a\
-\x43\xd2\x76\x65\xb4\x74\xf3\xd3\xde\x7d\x07\x82\x2f\x7d\xf9\x09\
-\xb3\xb5\x7c\xbb\x56\x5e\x78\x71\x6f\xb0\x6f\xff\x01\xb3\x15\x04\
-\x5f\xf9\xea\x93\xa5\x6d\x0a\x24\x23\x11\x7f\xf5\x89\xa7\xf4\x76\
-\xd1\x3c\xf9\xd4\x33\x7a\xc4\x61\x0b\xdb\xee\xa4\x99\xb8\x9f\x7a\
-\xea\x59\xb3\x95\x4c\xd6\x87\x88\xd1\x82\x9f\x79\xe6\x79\xb3\xe5\
-\x0f\x03\x14\x3e\xfb\xec\x1e\xb3\x95\x0e\x03\x01\xbe\xf0\xc2\xde\
-\xe0\xb9\xe7\xf6\x2c\x9b\x42\x61\x25\xec\xd9\xf3\xa2\x1e\x2c\xd0\
-\x82\x1b\xbf\x7a\x70\xe4\xe8\x31\x3d\x82\xb0\xc5\xdb\x98\x38\xc6\
-\x69\xdf\xbe\x83\x7a\x00\xc2\x24\xea\xf1\x5e\x64\x50\x41\x37\x7d\
-\xeb\x09\x65\x88\x31\x6c\xc0\x3f\x2d\x3c\xf3\xa0\x1e\x89\xeb\xc0\
-\xc0\x81\xf6\xde\xf2\x84\xc1\x41\x7d\xe7\x8b\x5b\x29\x0c\xa6\x38\
-\x77\x31\x3a\x15\x0c\xf8\x26\x6d\x33\x1a\xfe\x66\xbc\xe6\x66\x24\
-\x57\x51\xe3\x9d\x69\x4d\x59\x20\x8d\x43\x71\xf7\xde\xbd\x4c\x23\
-\xd1\x0a\x95\x71\xd3\x96\x39\x9d\x78\xe1\x31\x4a\x2a\x93\xec\xad\
-\x5d\x5b\x1e\x83\xc4\xdb\xf0\x37\x41\xf9\xe2\xb3\xe4\x6a\x73\x01\
-\xad\x26\x79\xa4\xad\x3b\x73\x73\xbd\xf3\x60\xa9\x09\xca\x40\x9c\
-\xba\xa7\xd9\x92\x92\xcc\x19\x46\x13\xce\x42\xfc\xde\x98\x4e\xa2\
-\xa8\x73\x09\xed\x8d\x74\x14\xae\x81\x57\xbe\xfc\xd1\xe0\x65\x2f\
-\x7d\xc4\x6c\xad\x8c\x3c\x8c\x49\x2b\xc1\xb0\xf0\x0c\xdd\xce\xe4\
-\x95\xe1\x30\xee\xb5\x4d\xe4\xc7\x94\x01\x95\x66\xf3\x76\xc9\x3d\
-\x0f\x3c\xc2\x3d\xb0\x7b\x57\xb0\x6b\x67\x38\x09\x66\xab\xc0\xf4\
-\x08\x3b\x76\x6c\x37\x5b\xc5\xe0\x9b\x07\x4c\x1d\xc1\x27\xdf\x8d\
-\x40\xb3\x3c\xbb\x1b\x37\x4e\xeb\xa9\x3e\x56\x03\x3e\xc9\xf7\x1d\
-\x05\x3a\x1f\xf2\x7d\xc6\x9b\x24\x4b\xdb\x92\xa6\x10\x35\x79\x1b\
-\x9d\x66\x79\xc9\xac\x06\x8d\x96\xb6\x0c\x7d\x6f\x27\xe8\x5b\x09\
-\x4c\x32\xe9\x3b\xe3\x75\xb3\xd0\xca\x9f\x72\xcb\x33\x59\x24\xf9\
-\x3e\xbb\x92\x57\xd9\x91\xb4\x5d\x3d\xda\xba\xa6\x86\x99\xb8\xbf\
-\xfc\x95\x27\xf5\xda\xc2\x44\x93\xf4\x75\x78\xe6\xb9\x3d\x7a\x1f\
-\xfd\x70\x98\x8c\xce\xc5\xed\x43\xe3\x92\x56\x20\x99\x6d\x9b\x3e\
-\x36\xac\x2d\x4c\xd2\x77\xe8\xf0\x91\xe0\xe9\x67\x9e\xd3\x0b\xfd\
-\x62\x6e\x2f\x24\xcf\xc4\x6b\xb9\x79\xeb\xa6\x0e\x47\xbf\x99\x67\
-\x9e\x7d\x3e\x38\x77\xbe\xf2\xec\xc1\x49\x30\x69\x24\x7d\x6c\xdc\
-\x19\x83\xb9\x67\x26\xb3\x7c\xf1\xc5\x7d\xc1\xd3\x4f\x3f\xa7\xfb\
-\xcc\xdc\xbc\x19\xce\x96\xec\x03\x33\x29\xd3\xc7\xc6\xce\x54\x0d\
-\xc4\xc9\xc4\xa0\x7b\xf6\xec\xd5\x4b\x38\x09\x64\x7a\x93\xdd\xe2\
-\xe2\x82\xee\x43\x03\x4c\xcc\x87\x9b\xd9\xa5\x81\x99\x9b\x99\x11\
-\x9c\xeb\x63\x61\x82\xce\x34\xc1\xc2\x8c\xc8\xb6\x9f\x0c\xf1\xe0\
-\x3e\x50\x65\xb6\x75\x0b\xcd\x5e\xf4\xe5\x61\x6d\x61\xe2\x4a\x66\
-\xe2\x3e\xa8\xd2\x9d\x73\x73\x1d\xf3\xf3\x95\x27\x18\x5c\x50\xd7\
-\x76\xea\xf4\x99\x60\x9f\x3a\xef\x8b\x7b\xf7\xeb\xf2\x34\x1f\x9b\
-\x94\xd0\xfa\x83\x2d\x37\x84\xc1\x8f\x32\x77\xf8\xc8\xd1\xc4\x3e\
-\x07\x95\xa0\x7f\x0d\xfd\x6c\x98\x5c\xd3\x32\x3f\x3f\xaf\xd3\x71\
-\xff\xfe\x83\xc1\x11\x15\x27\x35\x61\x2e\xf8\xe3\x47\x3f\x0d\x66\
-\x90\xb7\xc7\x92\x57\xa4\x03\x69\x8d\x3f\x6b\xb6\x2b\xe5\x21\x7d\
-\x6a\xdc\xfe\x5c\xc7\x8f\x9f\xd0\x8b\x4b\x92\x1f\x93\x8e\x92\xae\
-\x40\xb3\x1c\xd7\xc3\x36\x7d\xb0\x48\x47\x66\xe7\x76\x21\xcc\x25\
-\x15\x86\x7e\x25\x47\x8e\x1c\xd3\x6b\xb6\xf1\xb7\xd0\xa7\x86\x7d\
-\xee\x23\xc9\x3d\xc4\xe7\xd4\x29\xfb\x95\x03\x2e\xa8\xe7\x90\x49\
-\x3d\x19\xb5\x98\x34\x65\xc2\x47\x0b\x79\x45\xd3\x49\x38\xfb\x39\
-\x7d\x88\x4e\xe8\x35\xdb\x76\x86\x6e\x0b\xfb\x38\x96\xfb\xe1\x59\
-\x48\x9a\x98\x92\x89\x6e\x59\x5c\xc2\x89\x6c\xa3\xd7\x49\x7f\x97\
-\xb8\x9f\xcb\x9d\x3b\x8b\xc1\xdc\xdc\x9c\x4a\xaf\xd3\x7a\xa1\x19\
-\x37\xde\xbc\xc9\x33\xc3\xe4\xa9\xdc\x13\x93\xce\x32\x22\xb3\x0b\
-\xf7\xe1\xf6\xa9\xc1\x8d\x9f\x0b\x7e\xf1\xeb\xa5\xd9\x8a\x3c\xe2\
-\xf9\x67\x1f\xe7\xb8\xa9\x9e\x3d\x4b\xd2\x7b\x91\x7b\x71\xcb\xb7\
-\x8d\x83\x72\x48\xde\x31\x31\xa8\x9d\xb1\x3d\x8e\x18\x7e\xa1\x12\
-\xb9\x89\x1a\xef\x82\xd6\x20\x05\xf2\xbc\x7a\x78\x78\x60\x99\x11\
-\x9a\xd9\x80\x2d\x07\x0f\x1d\x0e\x2e\xa9\x17\x14\xd5\xd7\xcc\x60\
-\x0d\xfb\xd5\x4b\x3d\x69\x06\x6e\x1f\x98\x7d\x99\x07\x9d\xea\xd6\
-\x8d\x1b\xc2\xf3\x20\x68\x0e\xa8\x97\x3f\x06\x62\xdb\xb6\x2d\x7a\
-\xe1\x05\xb4\x57\x19\xba\xb4\xf3\x20\x68\x0e\x1e\x3c\xa2\x5f\x4c\
-\x54\xab\x13\x9f\x9d\x6d\xd7\x52\xed\x97\x3c\x46\x89\x17\x06\x55\
-\xcc\xee\x4c\xd8\x74\xee\x64\x1e\x1d\x66\x27\xde\xb5\x2b\x6c\x12\
-\xd1\xb3\x8e\x27\xcc\x24\x1e\x87\x6b\xc0\x00\x30\xbb\x30\xd7\x04\
-\x1c\x77\x48\xa5\x23\x62\x70\x72\x72\x42\x9f\x0b\x43\x91\x24\x06\
-\x6c\x71\xa0\x99\x89\x3e\x34\xa1\xbb\x5b\xbb\xc7\xc7\xc7\xf4\x8b\
-\x0d\xe3\x42\xfa\x6c\x52\x79\xc2\x42\xba\x21\xbc\x92\x66\xe8\x66\
-\x56\x69\x66\xd3\x06\xe2\xc1\x3d\x3d\x5d\x79\xd6\x6f\xa0\x66\x87\
-\x17\x2a\xb3\x50\xbb\xd5\xe2\x94\x11\x5e\xb6\xa4\x19\xf9\x04\xc7\
-\x4f\x9c\x50\x2f\xe1\xe4\xb4\x21\x7f\x8e\xaa\xf4\xc4\x80\x31\x23\
-\x34\x69\x8a\xdf\x71\xc4\x50\x85\xd9\x96\xad\xa0\xe9\xe9\xee\xd6\
-\xf9\x3b\x32\x32\xa2\x8d\xc3\x65\x33\xbf\x51\x35\xce\x2b\x91\x8a\
-\x10\x65\x36\x77\x3b\x6d\x80\x16\x34\x4a\x14\x74\xab\x38\x99\xd9\
-\x9c\x38\x29\x03\x76\xce\x24\x0b\xb3\x5f\x5f\x53\x62\x70\x68\x68\
-\xb0\x54\x4b\x46\x9e\x92\x26\x43\x43\x43\xfa\xde\x59\xb3\x8d\x80\
-\xa8\x24\x6c\xc0\xbe\x0b\x06\x07\x07\xf5\x8c\xd8\x77\xee\x30\x9f\
-\x5e\x28\x16\xc2\xed\xbb\xda\x0d\xec\x5b\xb8\xbd\xa0\xc3\x02\xc6\
-\xfb\xea\xb5\x6b\xfa\x5a\xc9\x3b\x66\x31\xe7\x9a\x5d\x61\x43\x98\
-\xcb\x4a\x2c\x0c\xaa\xfb\x24\xaf\x58\xb3\x8d\xa8\x72\x85\x4d\x2d\
-\x68\x41\xa3\xe2\x67\x56\x6b\xca\x2d\x93\x65\x72\xdf\x88\x65\x0b\
-\x06\x17\xb1\x32\x38\xb8\x56\xcf\x3e\xce\x9a\x6d\x9e\xad\xb8\xb0\
-\xe1\x5e\x6e\xaa\x32\xcc\xac\xfb\xc4\x19\x27\x9c\xb1\xbf\x9c\x46\
-\x94\x15\xb6\x59\x70\x03\x6e\x66\xc4\x27\x6c\xd2\xeb\x13\x41\xc3\
-\xfb\x8c\x7b\x9f\x50\xcf\x0c\x0b\x6e\x7e\xf4\xdc\xbf\x1f\x5e\x0f\
-\x71\xcd\xa8\xf2\xa4\x67\xeb\x26\xcd\xcc\x35\x23\xfc\x57\x0a\xe5\
-\xe7\x86\x12\xc3\x43\x2a\x4e\x9e\x1f\x66\x65\x27\x3f\x5c\x61\x53\
-\x8d\x4b\x97\x2f\xeb\x74\xa2\x0c\xf2\xdc\x13\x07\xd7\x97\x26\x6c\
-\x8a\xc0\xd7\x86\x35\x88\x09\x13\x52\x68\xcb\x9a\x9a\x2b\xea\x05\
-\xc9\x2f\x27\x5e\x5a\xf4\x03\xb0\x5c\x50\x06\x9a\x5f\x2f\xbb\x77\
-\xed\x0c\xd6\x4f\x8c\x07\x23\xc3\xeb\x82\x07\x1f\xd8\xad\x5f\xe2\
-\x18\xbc\xac\x5c\xb9\x7a\x55\xfd\xe2\x3c\xa5\x8d\xfd\xd6\x2d\xe5\
-\xf3\x9c\x3e\x73\x36\xe8\xeb\xeb\x0d\x1e\x7a\xf0\x81\x60\x7c\x6c\
-\x4c\x2f\xbb\xd4\x39\x39\x0f\x86\x2c\x0e\x0f\x1b\xc2\x88\xfd\x0f\
-\xa8\xeb\x99\x54\x2f\xa5\x0d\xd3\xd3\xda\xed\x0b\x46\x81\x5f\x68\
-\x18\x28\x2b\x1e\x20\x7c\x61\xdf\x08\xb6\x6f\xdf\x16\x8c\x8d\x8d\
-\xea\x0e\xba\xf4\x8b\xe0\x5c\x18\x93\x4a\x90\x56\x18\x7d\x04\x0d\
-\xc6\xd4\x72\xf1\xe2\x45\xfd\x12\xe6\x3c\x9c\x6f\x42\xa5\xe5\xee\
-\xdd\x3b\xd5\x8b\xaa\x72\xb3\x12\x7d\x68\x00\xc3\x8a\x7b\x60\x60\
-\x40\x1b\x57\xc4\xc9\xce\x9d\x3b\x94\xa1\x1b\xd6\xcb\xb6\x6d\x5b\
-\xf5\xf5\xf1\x32\x8d\xd3\xa5\x5e\xda\xbc\x14\x21\x8c\x67\x4c\xdd\
-\xd3\xb0\xde\x4e\x03\x91\x89\x41\xe2\x85\x3c\x35\x55\x16\x40\x57\
-\x55\xfe\xf1\xd2\xdf\xbc\x79\xb3\x32\x6e\xeb\xb4\xe1\x45\x1c\x2c\
-\x29\xc3\x75\xe9\x52\xb2\xd8\xa0\x9c\xb0\x5f\x0f\xe1\x3f\x3a\xa2\
-\x17\xdc\xf8\x25\xe5\xad\x85\x7d\x08\x1a\x44\xd0\xa0\x32\x5e\x18\
-\x26\x8c\x58\xbc\x66\x25\x89\xd9\xd9\x39\x6d\x44\xc8\x03\x8c\xb0\
-\x05\xc1\x49\x9c\x88\x3a\x84\x0e\x69\x91\x14\x27\xd7\xb6\x5d\xa5\
-\x29\x22\x02\x01\x84\x31\x41\x20\x91\x77\x18\x40\xd2\x9c\x35\xdb\
-\x08\x92\x6b\xca\x50\xfb\x60\x27\x9a\xbc\x75\x8b\x89\x83\xa9\x45\
-\xbb\xa1\x47\x01\xee\xec\xea\xd4\x6e\xb0\xfb\x30\xb2\xe4\x03\xdb\
-\xfc\xc8\xa0\x1c\x72\x3c\xd7\xcc\x1a\x21\xc6\x73\x40\x99\x43\x1c\
-\x73\x3d\x4c\x91\xc0\xfd\xb2\x66\x3b\xbc\xb6\x68\xed\x43\x56\x78\
-\x1e\xba\x8d\xe1\xef\x57\x82\x8a\x7b\xef\xef\xef\x0b\x2e\x5f\x0e\
-\x6b\x6b\x10\x37\x9c\x1f\x31\x33\xaa\xf2\x16\xb1\xc7\x9a\x6d\xc4\
-\x87\x2b\x7e\x80\xb4\xdd\xa8\xf2\x94\xf8\x92\x44\x0d\x71\xc3\x6d\
-\x25\xec\x80\xfb\x27\x1c\x69\x64\xd3\xc6\xee\x4b\x9b\xb8\x93\x5a\
-\x22\xae\x79\x52\x89\xe8\xfe\xfe\x01\xbd\x4c\x4c\x4c\x04\xf7\x97\
-\xee\x07\x37\x4c\x3a\x93\xa7\x84\xe1\x19\xe7\x9c\xa4\x1b\xef\xa0\
-\x95\xa6\x17\x69\x81\x28\x5d\xaf\xce\xb7\x56\xe5\x21\x62\x84\xbc\
-\xeb\x55\x71\x5f\xf7\x14\x35\x36\x8e\x09\xf3\xcc\x13\x07\xcf\x9b\
-\x8e\xc3\x5c\xff\xca\x10\x15\xd2\x4e\x34\xbc\xa8\xf1\x57\xcf\xfe\
-\x05\x97\x5f\xf9\x5d\x5d\x5d\xea\xe5\x59\x36\xee\x60\x1f\x70\x9a\
-\x19\x68\x7a\x62\xa1\xa9\x07\x30\xd2\x59\xa1\xfa\x9b\xf3\xd8\x9a\
-\x03\x0b\x06\x83\xe5\x89\x27\x9f\x2e\x2d\xb6\xc9\xc4\xfe\x3a\x8b\
-\xc3\x0b\x8e\x97\x5a\x9f\x7a\xe0\x2d\xae\xbb\x1a\x54\x85\x73\x2d\
-\x6e\xad\x05\x69\x86\x21\x01\x9a\x18\x68\x7a\x62\x79\xfe\xf9\x17\
-\xb4\x1f\xbf\x00\x21\x2d\x6d\x11\x86\xc4\x89\xb1\x03\x1b\xce\xbe\
-\x88\x78\xe1\xbb\x60\x30\xb3\xc2\x0b\x8f\x85\x6b\xb2\x0b\x4d\x26\
-\x40\xff\x9b\x3c\x40\x98\x71\x1f\x88\x2f\x17\xfb\x2b\x96\x26\x0a\
-\xdb\xf4\x45\xf3\x0e\xa4\xe5\x13\xbf\x58\x31\x16\xbd\x4e\xbf\x20\
-\xdc\xf8\xdd\x9a\x0f\x8d\x94\x8b\x4d\x33\x6a\x6a\x30\x5e\x34\x3d\
-\xd9\x85\x32\x62\xef\x31\xad\x16\x8e\xe3\x10\x29\x88\x15\x0c\x95\
-\x9b\x55\x36\x4e\xd2\xcb\x2e\xc4\x89\xf1\x77\xe1\x58\x37\x6f\x6c\
-\x99\xe0\x57\xb3\x0b\xc2\x03\x88\xc3\x07\x0c\x54\x68\x9c\xc3\xf0\
-\xc4\x8b\x30\xa4\xf6\xc5\x9e\x83\x35\x42\x07\x43\x46\x3e\x03\xf9\
-\x41\x4d\xa1\x5d\x28\xfb\xf6\x9a\xed\x71\xf6\x5a\x2c\x76\x7b\xa5\
-\xbf\xec\x69\x3a\xe4\x59\xa7\x76\xd0\x2e\x5c\x17\x82\x85\xbc\xb2\
-\xf7\x3e\x30\x10\x3d\xbf\xdd\x8e\x37\x31\x91\xef\x49\x62\xc6\xd2\
-\xd7\xd7\xa7\xd3\xc8\x1e\x47\xfc\xe4\x07\x35\x8e\xf6\x5c\x34\x09\
-\x12\x47\x5a\x5f\x33\xae\x99\x72\x42\x2d\x9a\x5d\x10\xe9\x70\x47\
-\x5d\x37\x94\xc3\x9c\x2e\x2d\x94\x0d\xee\x0b\xd2\x9e\xf1\x6a\xd8\
-\x1a\x37\x44\x39\x3f\xbc\xec\x82\x48\xb1\x71\x57\xc3\xc6\x61\x6b\
-\x92\xed\x42\x1c\xfc\x78\x69\x76\x7c\xd3\xb6\xd6\x3c\x10\xa2\xb4\
-\x65\x4d\x0d\xbf\x56\x78\x58\x68\x26\x48\x82\x66\x27\xbb\x3c\xf4\
-\xd0\x03\x7a\xe1\x17\x74\x56\xc6\xc6\x46\xf4\x79\x10\x14\x71\x30\
-\x40\x0f\x3c\xb0\x6b\xd9\x32\x3d\x9d\x7c\x9e\x95\x3e\xdc\xa3\xa3\
-\xc3\x3a\x8e\x93\xa6\xef\x42\x1c\x9a\x9d\xe2\x0b\xcd\x27\x95\xe0\
-\x57\x2c\x71\xda\xbe\x2f\x71\xd6\xac\xe9\x32\xae\x64\x7c\x9f\x61\
-\x0c\xd6\x8e\x1d\xdb\x96\x2d\xd4\x10\xb9\xd4\xfa\x52\x20\x2f\xb8\
-\x0f\xfa\x19\x24\xb1\x7d\xfb\xd6\x52\x33\xa1\x5d\xe2\x02\x28\x0f\
-\x30\x66\xd4\xea\xc4\x97\x6a\x20\x3e\x30\x80\x49\x63\xfa\x10\x27\
-\xb5\x4b\xf1\xc5\x07\x84\x5e\x12\x4c\x28\xe9\xcb\x90\x12\x31\x88\
-\x39\xdb\xf4\x84\x30\xe7\x7a\x71\xe3\x87\x60\xb1\x4d\x4f\x16\x7e\
-\x04\x24\x2d\x2e\x69\xd7\x90\x76\xcd\x59\xa0\x26\x83\x5a\xdc\xf8\
-\xe2\xd2\xa5\x84\x48\x12\x59\xd2\xc6\xb2\x56\x89\x3f\x04\xa8\x6d\
-\x7a\x42\xe8\x90\x4e\xb8\xf1\x43\x7c\x90\x8f\x95\x40\x3c\xf1\x3c\
-\xc4\x17\xf7\x87\x05\x61\xa8\x31\x8a\x2f\x79\x10\x36\xdb\x2e\x5f\
-\xb2\x3c\x93\xd4\xca\x25\x2d\x2e\x62\xf8\x85\x6a\xe4\x22\x6a\xbc\
-\x0b\x5a\x83\x14\xc8\x5d\x3b\xb7\xeb\x97\x14\x55\xcd\x6e\x27\x61\
-\x8c\x1b\xd0\xbe\x4d\xd3\x53\xb8\x0c\xeb\x85\x5f\x4e\x59\xd9\xb1\
-\x7d\xbb\x6e\x7a\xc2\xd8\xb8\x9d\x84\x79\x41\x61\x84\x30\xd6\x36\
-\x7e\xbb\xc4\x6b\x5f\x6c\xda\x62\x08\x30\x00\x6e\x67\x62\xd7\x5d\
-\xad\x3f\x0d\x4d\x36\xd4\xa8\xd0\x4c\xe1\x76\x12\xb6\x06\x05\xa3\
-\x4e\xb5\xb1\xbb\x50\xfd\x5b\x89\xad\x5b\x37\xeb\x17\x27\x55\xdb\
-\x6e\x27\x61\x7e\xa1\x43\xdc\xc8\xda\x7e\x03\x59\xc0\xc0\xf0\x4b\
-\x99\x5f\xf7\xbc\xa0\xdd\x25\x8f\xaf\xa4\x80\x7e\x3a\xbc\x80\x69\
-\xa2\x73\x9b\xdc\xec\xaf\x7f\xd2\x86\x74\x72\x97\xc4\x73\xab\xbc\
-\xe2\x3a\x31\x42\xfc\x32\xb6\xe0\xc6\x8f\xbe\x1f\x69\x50\xbe\x30\
-\x6c\xdc\x2f\xcd\x4f\xee\x52\x09\x8e\x0b\xc7\xf3\x19\xd0\x79\x40\
-\x3f\x1a\x8b\x8d\x13\x23\x49\xf3\x93\xbb\x54\xc2\x36\x73\x90\xaf\
-\x16\xca\xa1\xad\xb9\xaa\x76\xbc\x0b\x69\x48\x13\x0c\x4d\x61\xd4\
-\xc8\x50\x36\x48\x3f\x6a\x27\x6c\x9f\x30\x9b\xce\xb6\x29\x86\x72\
-\xc2\x35\xc4\x17\xb0\x65\x2b\xde\x6c\x62\xaf\x8d\x26\xa3\x34\x38\
-\xbf\x9b\x2f\x74\x4e\x8f\x43\xad\x1a\x61\xc8\x5f\xe2\x72\x17\x20\
-\x2d\x21\xde\xcc\x74\xeb\x96\x3d\x7f\xf6\xf7\x04\xf7\x44\x1a\xf1\
-\xbc\x50\x23\x83\xf8\xb0\xb5\x5c\xf6\x19\xe2\xfe\xd3\x5e\x9f\xf6\
-\x9a\x69\xde\xe5\xfa\xdc\xc5\x4e\xfa\xe9\x86\xe1\x1a\xdd\x25\x8d\
-\x2e\x23\xd0\xdc\x1a\xd1\x78\x0d\x25\x35\x6c\x70\x57\x89\x54\xdc\
-\xf1\xc5\x07\x1b\x8e\xe7\x2c\x7e\xbc\xdd\x57\x3b\x7e\x36\xc7\xd7\
-\x86\x79\x06\x13\xea\x48\x2e\xa2\xa6\x28\xfc\x0b\x5a\xf6\x70\xf4\
-\xa5\x41\xc4\x50\xd5\x4d\x1f\x1b\xa0\x1f\x0d\xc6\x81\x66\x23\x3a\
-\x6d\xd2\xf9\xee\xfc\xcc\x4c\x6a\x8d\x8e\x0f\xf4\xa5\xe1\x3c\x54\
-\xc9\xd2\xc7\x06\xe8\x84\x0c\x74\x0c\x46\xec\xd0\x81\x8f\x85\x0e\
-\xa8\x69\xd8\x66\x23\x3a\xe0\xf2\x05\x02\x9d\x00\x71\x67\x01\xe3\
-\x87\x38\xa2\x6a\xd7\x76\xbc\xa4\xd6\x8a\x17\x26\x4d\x49\x7c\x91\
-\x80\x51\x67\xa1\x0a\xdb\x07\xfa\x71\x60\x94\xe8\xfb\x72\xed\x5a\
-\xd8\x34\x80\xd0\xe1\x17\x33\xf7\x4c\x1f\x13\x8c\x17\xcd\x08\xb5\
-\x34\xe1\xd9\x1a\x32\xbe\x14\xe3\x8b\x0e\xfa\xeb\xb0\xd0\x29\xb4\
-\x12\xbc\xac\x31\x74\xe7\x55\x3a\xd1\x37\xa6\x1a\xf4\xa5\xe1\x3e\
-\xb8\x5e\xdb\xc4\x41\x5f\x1c\xe2\xa1\x8c\xf0\x05\x14\x22\x98\xc5\
-\x56\xed\x27\xc1\xbd\x63\x8c\x48\x3f\x3a\x9c\xd3\x4f\x0b\x37\x7e\
-\xec\x4b\x83\x7d\x18\x36\xbe\xfa\xa1\x73\x30\x0b\x65\xe2\x86\x69\
-\x82\xa8\x06\xd7\xcf\x39\xb8\x36\x8c\x03\x50\x9b\x44\x9c\xd4\xa4\
-\xd1\x27\x85\x85\x66\x02\xf7\xeb\xa8\x24\xc6\xc6\xc6\xb4\xa0\x25\
-\x2d\x58\x10\x37\xd6\x4d\x59\x41\xf0\xfa\x62\x8d\x73\xbc\x46\x06\
-\xf1\x87\x9f\x6d\x7a\x02\xf6\x13\xbf\x2d\x83\x94\x51\x16\x9a\xd7\
-\x08\x0b\xd4\x0e\x72\x6d\x36\x0c\xe2\xc6\xba\xc9\x2b\xfb\xc3\x24\
-\x09\x44\x25\xe9\x41\x39\xba\x7c\x29\xfc\xe2\x8b\x6b\x73\xe1\x79\
-\x20\x0c\x9d\x91\x11\x2e\x2c\xe4\xb9\x15\x8b\xfa\xfc\x4a\x18\xcc\
-\xcd\x5d\xd2\xe5\x9a\xfd\xac\xd9\xe6\xfc\x6e\xcd\x88\x2f\x88\x18\
-\xae\x23\x5e\x23\x83\x28\xc5\xaf\x52\xd3\x13\xd0\xa7\x07\xf8\xb1\
-\x72\xfd\xda\x35\x5d\x7e\x59\x2e\x39\x7d\xce\xb8\x6e\xfa\xd8\x90\
-\xff\x3c\x17\x2c\xe4\x2b\x3f\x18\xd2\xde\x9f\x56\xbc\x5e\xbe\x7c\
-\x59\x37\x29\x93\x5e\x71\xb8\x67\xf2\x83\x1f\x4b\xc4\x47\xe7\x60\
-\x16\xf2\xcd\x36\x2b\x55\xc3\xc6\xc1\xf1\x3c\xab\x34\x21\xb2\xd0\
-\x77\xcb\x37\x0e\x41\xb0\x34\xb4\xa8\x29\x1a\x3a\xc4\x62\x7c\x0f\
-\x1d\x3a\x12\xd8\x2f\x7d\x5e\xf2\xf0\x43\x61\x2d\x8e\x32\x48\x18\
-\x7a\x0c\x33\xd5\xc0\xb5\x7e\xfd\x04\x74\xc2\xe5\x3c\x88\x25\xe2\
-\xe1\xe5\xfd\xd0\x83\xbb\xf5\xcb\x9c\x5f\xd7\x18\x3d\x06\x8a\xe3\
-\x1a\xd2\xce\x33\xbc\x6e\x9d\x6e\x9e\x22\x1e\xc2\xf3\x22\xa5\x86\
-\x21\xde\xef\xa1\x1a\x34\x67\x10\x07\x4d\x62\xf6\x9e\x77\xef\xde\
-\xa5\x6b\x71\x30\x7a\x18\x70\x9a\x61\xee\x71\x2d\x6a\xf1\x11\x8c\
-\x5b\xb7\x6c\xd6\x71\x62\x90\x39\x86\x66\xa7\x07\x1f\xdc\xa5\x5f\
-\x56\xbc\x68\x59\x30\x6e\xf1\x2a\x7c\x1f\x38\x8e\xa6\x26\x5e\xea\
-\x17\x2e\x5c\xd4\xc2\x8b\x34\xc3\x70\x27\x7d\xfd\x64\xa1\xb9\x82\
-\x0e\xc6\x1c\x63\x05\x5c\x35\x38\x86\xfb\x20\x0d\xf8\x94\x1b\x68\
-\x7a\xa2\x13\x28\xc6\x13\xe1\xc6\xd7\x6c\x9c\x3b\xed\xeb\x27\x0c\
-\x11\x9d\x6e\xb9\x5e\xc2\xce\x29\x01\xc6\x2f\xe6\x9d\xaa\xac\xb9\
-\xfd\x6c\xc0\x4d\x5b\x8e\xb3\x79\x63\xd3\xcc\x8a\x0f\x9f\xf1\x69\
-\x7a\x7b\xbb\x75\x07\x5b\x9a\x75\xac\xe8\xa2\x76\x81\xa6\x26\xe2\
-\x24\xcd\x58\x7c\xfb\x9c\x6c\xd9\xbc\x49\x1b\x78\xae\x01\x63\xc6\
-\x71\xd4\x66\x6d\x56\xfe\x59\x41\xc0\x80\x2b\x86\x6c\xb9\xa5\x43\
-\xa8\x0b\xe2\x1d\x23\xcd\xf9\xac\x58\x89\xf7\x45\xa2\xe3\xed\xa8\
-\x32\xd2\x08\x0d\xf6\xb3\xa6\x99\x22\xde\x44\x15\x67\x54\x89\x35\
-\x44\x8f\x36\xea\xea\xbe\xb4\x40\x89\xe5\x09\xcf\x24\xe5\x94\x66\
-\x24\xca\x0e\x0b\xf1\xbb\x79\x85\x80\xe4\x58\x04\x01\x62\x86\x35\
-\xd7\xec\xf3\x95\x5d\x1a\xe4\x3f\xd8\x5a\x2b\xb0\xb5\x53\x7c\x55\
-\x54\x89\xee\xee\x9e\x60\x5a\x3d\xbf\x3c\x77\x57\x94\x10\x40\x84\
-\x21\x8a\xf9\x02\xca\x7e\x0d\x46\x79\xa4\xa9\x89\xfb\xb2\xe2\x3c\
-\xe9\x13\x73\x17\xc4\x16\xf7\x49\xbf\x1c\xbe\xe2\x22\x6d\xd6\x25\
-\x88\x36\x3e\x74\x20\x3f\x11\x60\x88\x1b\x96\xac\x62\x84\x0e\xf5\
-\xdc\x3b\x71\x20\x6e\x58\xe2\x71\xf8\xbc\x8b\x1a\x0d\xdf\x6b\x6e\
-\xc6\x7b\x6b\x54\x3a\x6c\x62\x76\x28\x58\x3d\xf6\xf8\x07\x12\xdf\
-\xd6\xaf\x7f\xc3\x1b\x82\xb7\xbd\xf5\x2d\x66\x2b\x8a\x57\x86\xd4\
-\x90\x69\x79\x17\x88\xac\x05\x27\x29\x38\xd5\xf9\x74\x56\xe5\x05\
-\x81\xa1\x82\xac\xf1\x42\xee\xf7\xe6\x59\xcd\x6a\xc9\xfd\xfc\x19\
-\xd3\xc0\x37\x78\x51\xe7\x87\xdc\xe3\xce\x78\x0d\xde\xe7\xf7\xcc\
-\xdb\xac\x49\x90\xf7\xfd\x7b\xa7\x93\x43\x51\x71\xfb\x07\x6f\x9e\
-\x7b\xcb\x7e\x09\x79\x9f\x3f\xdb\x05\xe4\x7d\x5f\x59\xcf\x1f\x92\
-\xef\xbd\x65\xbd\x84\x5a\xd2\xf6\xb3\x9f\xfd\x43\xf5\x03\x64\x79\
-\xff\xbe\xc5\xc5\x85\xbd\x1f\xfb\xe8\x47\x3e\xa8\x9c\x28\x55\xec\
-\x34\xed\x82\x2c\xa8\x3f\x16\x54\x2a\xbf\x00\x58\x5b\x3f\x1b\x86\
-\xf0\x1c\xc7\x89\xd4\xe9\x6a\x4a\xcc\xa6\x60\xc5\x35\x35\x2d\x9c\
-\x36\xcb\xa0\x16\x85\x5f\xeb\x50\xa9\x9a\xbb\x1a\xbe\x69\xe6\x1d\
-\xce\xf3\xc1\x15\xca\xe4\x9d\x07\x2a\xa0\x71\x08\x42\xfe\xe5\x4b\
-\x8a\x57\x2d\x48\x1e\xb4\x23\x0d\xdb\xfc\x94\xff\x4b\x61\x65\x25\
-\x12\x41\xc3\x48\xbc\x54\x77\x53\x3d\xcd\x98\x0a\xad\xce\x6a\xa5\
-\xad\xb0\x72\x9a\x31\x0b\xa4\x7c\x15\x49\xbe\x69\x2b\x79\x90\x1d\
-\x49\xdb\xfa\xd0\xd6\x7d\x6a\x2a\x11\x2f\x67\x6b\xba\xd6\xe8\xcf\
-\x9c\x5f\xfe\xf2\x97\x45\x06\xd2\x6b\xc6\x02\x29\x0f\x51\xfd\xf1\
-\x7e\xe1\x49\x2d\x5c\x66\xfc\x8b\xb7\x67\x1e\xc8\xf3\x52\x18\xbe\
-\x49\x2b\x79\x20\xf8\xb2\x22\x51\xe3\x5d\xd0\x5a\xa4\x40\x52\x3b\
-\x63\x3b\xf4\x09\xb5\x93\xf7\x8b\x4c\x5e\x78\xd9\xc9\x3b\x6d\x25\
-\x0f\xb2\xe3\x9f\xb6\xc6\xd1\x44\x48\x79\x10\xea\x85\xd4\xd4\xac\
-\x32\xb9\x1b\x13\xf9\x25\x9f\x99\xbc\xf3\x40\x05\x34\x0e\xc1\x97\
-\xdc\xf3\xa0\x81\x68\xc6\x6b\x6e\x3d\xf2\x2d\x5f\x92\xa5\xcd\x43\
-\x43\x8a\x9a\xbc\x5f\x78\xf2\x92\x29\x23\x69\xdb\x3c\x14\xf5\xd5\
-\x93\xd0\xea\xc8\x33\x5e\x6f\x24\x6d\xeb\x87\xd4\xd4\x24\xe0\x5b\
-\xce\xa4\x40\x16\x47\x2b\xbf\x14\xa4\xdc\x14\x87\x7f\xd2\xb6\x6e\
-\xf9\xaa\x37\xfe\xcf\xae\x71\x54\x41\xf2\x40\xc8\x42\xcd\xa2\xc6\
-\xbb\xa0\x35\x60\x81\x64\xa2\x4a\x26\x0c\xf4\xe1\x2b\x5f\x7d\x32\
-\xd8\xb7\xbf\x1c\x16\x37\x7e\x2b\xe1\xc0\xc1\x43\x7a\x12\x4b\x17\
-\xb6\xf1\xcf\x42\xfc\x97\x3c\x5f\x67\x1d\x3c\x58\x79\x94\x61\x06\
-\x1a\x64\xd2\xca\x38\x0c\x6a\xf7\xdc\x73\x2f\xe8\x7d\x0c\xcc\x55\
-\x14\x8c\x2c\xbc\x6f\xdf\x7e\xb3\xd5\x78\x1c\x3f\x7e\x22\x78\xe1\
-\x85\xbd\x66\x2b\x84\x89\x2c\x19\x58\xd0\x97\x17\xf7\xee\xd7\x23\
-\x52\x67\x81\xf2\x98\xf5\x98\x5a\xf1\x37\x3a\xf9\x86\x6b\x07\xf2\
-\x4f\x5b\xe3\x10\x72\x47\xf2\xa0\x35\x69\xda\x9a\x9a\x66\x7c\xe1\
-\x36\xea\x35\x33\x7a\x2d\xa3\xc6\x32\xe9\x25\x23\xd0\x32\xc1\x5e\
-\x51\xd8\x21\xfc\xeb\x45\xee\x79\xd0\x40\xe5\xab\x59\x68\xd4\xe7\
-\xa0\x9d\x68\xed\x3c\x90\x72\xd3\xce\x34\x9c\xa8\x91\x17\x59\x71\
-\xa4\xa5\x2d\x73\xc4\x30\x9f\x0d\xc3\xf4\x33\x52\x72\x8f\x72\xfb\
-\x50\x4b\x5e\x3d\xf8\xe0\x03\xc1\x4b\x5e\xf2\xb0\xd9\x6a\x3f\xbc\
-\x8d\x89\x77\xf3\x88\x71\x08\xb9\x23\x06\x5d\xa8\x05\xef\x67\x5c\
-\x1e\xde\x42\x90\x3e\x35\x31\x7c\xcb\x59\x2b\x15\x48\x26\x9a\xac\
-\x34\x61\x5e\x5e\xe4\x9d\xb6\xf2\x52\x28\x8e\x66\xcc\x03\xff\x4b\
-\x91\x72\x53\x14\xfe\xe5\xc6\x38\xaa\x20\xcf\xb8\x90\x95\x9a\x44\
-\x8d\x77\x41\x6b\x80\x02\x79\xfd\xc6\x4d\xdd\x5f\x81\x7e\x34\x4f\
-\x3c\xf9\x4c\x70\x26\x61\x86\x65\x26\x61\xb4\x61\x9e\x7c\xea\x19\
-\x3d\x33\xb7\x2f\xcc\xb2\xfd\xd5\x27\x9e\xd2\x6b\x0b\x33\xe4\x32\
-\xab\xf4\x53\x4f\x3f\xab\x97\xfd\x07\x0e\xea\x39\xa3\x7c\xb0\x69\
-\x4b\xff\x1a\xae\x85\x89\xe4\x80\x11\x8d\x4f\x9d\x3e\x13\xec\x79\
-\xe1\x45\xed\xbf\x77\xdf\x7e\x3d\xba\x71\x25\xb8\xaf\xa3\x47\x8e\
-\x05\xcf\x3e\xbb\x47\x2f\x4c\x84\xe9\x36\xff\x2c\xdc\x5e\x28\xf5\
-\xaf\x61\x16\x5e\xdc\x84\x49\x82\xb8\xe8\x77\xc3\xcc\xe2\xcf\x3c\
-\xf3\x7c\x70\xe0\xc0\x21\x3d\xa9\xa6\x0b\x61\x98\x0c\x73\x9f\x4a\
-\x4b\xce\xc7\x9a\x6d\xfc\x2d\x47\x8e\x1c\x0d\x9e\x7b\x6e\x8f\xd9\
-\x0a\x61\x1b\x7f\x17\xe6\xd7\x3a\x7a\xf4\x98\xd9\x0a\xb4\x9b\x85\
-\x19\xba\xe9\xe3\xc2\x7e\x7d\x3f\x77\xef\xaa\x74\xb8\xa0\xaf\x6b\
-\xcf\x9e\x17\xf5\xc4\xa0\x49\x10\xe6\x80\xca\x07\xfa\xcb\x70\x5d\
-\x69\xe1\x7c\xa0\x7f\x0d\xd7\x40\x9a\xf9\xb0\xb0\xb8\xa8\xf3\x6e\
-\x9f\x3a\x3f\xe5\xec\xb0\xba\x57\x26\x1c\xac\xc4\xc9\x93\xa7\xd5\
-\x75\x1e\x0c\x6e\x7a\xce\xd2\xed\x8b\x18\x89\xe2\xf0\x37\xe8\xbe\
-\xe1\x8c\x43\xc8\x80\xe4\x41\xbb\xd3\x50\x35\x35\x79\xbf\x14\xae\
-\x29\xa3\xb3\x7f\xff\x41\x6d\x54\x98\x6d\x79\xe3\xc6\xe9\x60\x36\
-\x41\x08\x1c\x3c\x74\xb8\x14\x86\x29\x10\x98\xea\xdf\x07\x66\x61\
-\x66\x16\xef\xe9\xe9\xc9\x60\xe3\x86\x70\x86\x60\x04\xcd\x81\x83\
-\x87\xb5\x78\xd8\xb6\x6d\xab\x5e\x70\x63\x74\xd3\x66\xe0\x8e\x73\
-\xfc\xc4\x09\x6d\x30\x77\xee\xdc\xae\x67\xe7\x06\x66\xf8\x46\x44\
-\x30\x43\x30\xb3\x75\x0f\x0d\x0d\x69\xc3\x97\x26\x6c\x10\x12\xfb\
-\xf7\x1f\xd0\x69\xc0\x0c\xdc\x9b\x36\x6d\xd0\x35\x32\xb7\x6e\x95\
-\x67\x3c\x66\xba\x7f\xfa\xd0\x68\x77\x6f\x8f\x76\x8f\xa7\x4c\xff\
-\x70\xec\xd8\x71\x25\x28\x2e\x05\x93\x93\xeb\xf5\xc8\xca\xcc\x34\
-\xce\xbd\xbb\xc2\x86\x4e\xb6\xb3\xb3\x17\x82\xe1\xe1\xe1\x60\xf3\
-\xe6\x8d\x7a\xcd\xf6\x21\x95\xbe\xae\xb0\xa9\x15\x66\x57\xe6\x7e\
-\x49\x6f\x66\x90\x66\xf6\x6d\x04\x02\x6b\xee\x91\x59\xa0\xe9\xe4\
-\x1c\x9f\x0c\x8e\x6b\x67\x86\xea\xb5\x6b\xd7\xea\x99\x9c\x27\x26\
-\xc6\xf5\x0c\xd6\xb5\xc0\x0c\xd8\x5c\x07\x69\x55\x6d\xf6\x64\x8b\
-\x9d\x29\x79\x6a\x72\x52\x97\xaf\xee\xee\x6e\xdd\x8f\xe9\x46\x8a\
-\x60\x61\x7e\x31\xc4\x0c\x79\xb6\x76\x6d\x71\xfd\x9b\xea\x41\xde\
-\xcf\xb8\xe0\x92\x6f\xda\x4a\x1e\x14\x87\xa4\x6d\x71\xb4\x74\xf3\
-\xd3\xa9\x53\xa7\xb5\xa0\x78\xf8\xa1\x07\xf5\xd4\xfc\x9b\x94\x41\
-\xc3\x1d\xe7\xda\xb5\xeb\x41\x6f\x4f\x38\x7d\xff\xa6\x8d\x1b\xbd\
-\xe6\x75\xba\x72\xf5\xaa\xfa\xc5\x7e\x4a\x1b\x58\x77\xda\x84\xd3\
-\x67\xce\xea\x29\xfb\x39\xcf\xc4\xf8\x98\x5e\x76\xed\xda\xa9\xaf\
-\x03\x03\x5f\x0d\x7e\xd1\xcf\xcd\x5d\xd2\x82\x66\x6c\x74\x54\xfb\
-\x5d\xba\x7c\x59\x8b\x9c\x07\x1f\xdc\x15\x4c\xae\x9f\xd0\x42\x07\
-\xd1\xc0\x74\xff\x74\xf0\x4d\x02\xe3\x8f\x88\xd9\xba\x75\x73\x38\
-\x57\x95\x32\xe4\x88\x21\xc4\x8b\x0b\x7d\x68\x80\xe6\x27\xdc\x03\
-\x03\xcb\x8d\xfd\xe5\xcb\x57\xb4\x21\x47\xcc\x10\x0f\x93\x79\x22\
-\x10\x07\x95\x51\xb7\xa2\x0a\x71\x43\x18\xae\x8b\x7d\x84\x63\xcd\
-\x36\xd7\x41\x0d\x4b\x1e\xec\xdc\xb9\x43\x0b\xaf\xcd\x9b\x37\xa9\
-\x6b\xee\x0e\x16\x17\xef\xe8\xbe\x40\xe3\x2a\x9d\x59\xe3\x87\xc8\
-\xb1\x20\xc4\xb8\x2e\xc4\xcc\xa6\x4d\x1b\xb5\x18\xe2\x3e\x59\x67\
-\x65\x66\x66\x46\xa7\x05\x82\x66\x9d\x11\x9b\x3e\x30\x0a\xf5\x16\
-\x75\xbd\xa3\x23\xc3\x2a\x7d\x07\x4a\xc2\xf1\xba\xa9\x85\x73\x99\
-\x51\x65\xe4\xf2\x95\xab\x5a\xd0\x54\x9b\x34\x55\xde\x8b\x65\xfc\
-\xd3\x42\x0c\x7a\xb3\xd0\x8c\x79\x20\xe5\xa6\xfe\x14\x27\x6a\x1a\
-\x20\x73\xf9\xb5\xcb\x2f\xdd\x7e\x25\x32\x2c\xae\xdb\x82\x91\x42\
-\xd8\xec\x79\x61\xaf\x77\xd3\x13\x35\x27\x5d\x5d\x5d\xda\x58\xba\
-\x70\x4e\x16\x9a\xa4\xec\x42\x53\x09\x2c\x2e\x2e\xea\x75\x1a\x1c\
-\x87\x48\x41\xac\x58\x41\x03\xd7\x8c\xf1\xa3\x39\x82\xa6\x27\x16\
-\x3e\xdf\x46\xe8\x20\x18\x92\xb8\x7e\xfd\xba\x5e\xc7\x8d\x6f\x2d\
-\x7d\x67\x6c\x33\x0b\x9f\x8b\xd3\xf4\xc4\x42\xf3\x12\x62\xc1\x9e\
-\xff\x8a\x32\xc4\x30\x32\x32\xa2\xd7\x16\xbb\xed\xdb\x54\x53\xed\
-\xa5\x60\xaf\x9f\x70\xd6\xed\xde\x13\x6e\x84\x8e\xc5\xa6\xdd\xc8\
-\xb0\xbf\x08\x49\xe2\xd6\xfc\xbc\x16\x9b\x08\xb9\x2c\x82\xc6\x42\
-\xad\xde\xfe\x83\x87\x74\xb9\x49\x6b\xe2\xa3\x89\x12\x11\x46\x99\
-\x5d\xc9\x2c\xf0\x69\xf8\xbe\x70\xf3\x0e\x27\x64\xa7\x19\x93\xd6\
-\xbf\xdc\x18\x87\x20\x14\x40\x66\x51\xd3\x4c\x2f\x32\xb7\xff\x48\
-\x25\x74\x0d\xce\xc3\x0f\x6a\x83\x48\xed\xcb\xd1\x63\xc7\xcd\x9e\
-\x74\xc6\xc6\x46\x74\xfc\xc7\x8e\x9d\x30\x3e\x65\x30\x48\x0f\x3e\
-\xb8\xbb\xb4\x50\x43\xc2\x32\x3d\x3d\x6d\x42\xa4\xc3\xaf\x79\x04\
-\x40\x52\x33\x99\x8d\x67\xf7\xee\x9d\x91\xa5\x12\x6b\xd6\x74\x19\
-\xd7\xca\xa1\xa6\xc6\x2e\xd4\x98\xd8\xc5\x25\xed\x7c\xbe\x4d\x7a\
-\x45\x91\xc7\x74\x12\xe4\x2b\x42\x4e\x8f\xe3\x93\xe1\x39\xb0\xb5\
-\x6f\x53\x93\xeb\x83\x87\x1e\x7a\x20\x78\xe4\x25\x0f\x99\x3d\xcb\
-\xe1\x1c\x88\x5b\x6a\x84\x84\xe6\x41\x84\x60\x23\x90\x6f\x1e\x48\
-\x56\x35\x27\x0d\xd3\xfc\x94\xf7\x4b\x81\x70\xd6\x40\xcc\xdf\x5e\
-\x30\xbe\xfc\x1a\x2e\xbb\x5d\xf8\x25\xff\xe0\x03\xbb\x83\xd1\xd1\
-\x91\xd4\x7e\x2a\x2e\x3b\xb6\x6f\xd7\x4d\x4f\x18\x1f\xb7\x93\x30\
-\xbf\xb2\x39\x27\xbf\xe8\x47\x86\x87\x23\x4b\x5f\xef\xf2\x5a\x22\
-\x17\x9a\x7e\x68\xaa\xa2\xa6\x86\x5f\xf3\x37\x6f\xdd\xd4\xfe\xb6\
-\x66\x80\x5a\x11\x9a\x9e\xe8\x3b\xe2\x2e\x49\xd0\xcc\x01\x18\x60\
-\x37\xcd\x2a\xd5\x16\xa5\xa5\x2d\xd7\x03\x1c\x4b\x9a\xb2\xbd\x6e\
-\x5d\x79\x01\x1b\x26\xde\x79\xf8\x8a\xe9\x10\x4b\x7a\xa4\x41\x93\
-\xd1\xfc\x7c\xb9\x23\xf5\xad\x5b\xf9\x75\x8e\xb5\xe7\xbd\x7a\x35\
-\xac\xb9\xaa\x95\x81\xfe\xfe\x60\xcb\x96\xcd\x3a\x3e\xfa\xbc\xf8\
-\x76\xfc\x06\x6a\x01\x39\x6e\x74\x64\x24\xe8\xea\xec\x0c\xee\x99\
-\x3e\x36\x71\x68\xa6\xda\xbc\x69\xa3\x2e\x43\xf4\x01\x72\xd3\x24\
-\x8e\xe7\x63\xd0\x50\xe4\xfd\x8c\x0b\x2e\xf9\xa6\xad\xe4\x41\x76\
-\x24\x6d\x1b\x83\x96\xee\x53\x63\x9b\x86\xf8\xfa\xe8\xfc\xcc\xac\
-\xfe\xf2\x09\x77\x9c\x83\x87\x8e\xe8\xbe\x30\x34\x3d\x61\x80\x30\
-\xdc\x3e\xd0\x97\x86\xb0\x74\x98\xa5\x8f\x0d\x60\x94\x80\xaf\x63\
-\x10\x3b\x34\x3b\xd0\x4f\x82\xce\xbf\xbe\xd0\xb9\x98\xa6\xad\xa3\
-\x47\x8f\xeb\xce\xc5\x34\x45\x59\xa1\x43\x3c\x88\x2e\x16\xce\xeb\
-\xf6\x1f\x71\x99\x9e\x9e\xd2\x71\xd0\x99\x98\x4e\xa9\x84\x3f\xa4\
-\xee\x33\xad\xb9\xaa\x12\x08\x3d\x8c\xf2\xa9\x53\x67\x74\x7c\x08\
-\x17\x16\xbe\x6c\xba\x76\x2d\x6c\x56\xa2\xa3\x6e\x7f\x7f\x9f\xbe\
-\x26\xc2\xb1\x9f\x35\xdb\x1c\x9b\xd6\x01\x19\xe8\x50\x4c\xad\x17\
-\x5f\x15\x21\x18\xb8\x4f\xae\x3d\x8d\x2c\x2f\x05\xd2\x0e\xd1\x44\
-\x07\x5f\xbe\x78\x42\xe4\xd9\xf4\xab\x85\x0d\x1b\xa6\x83\xce\xae\
-\x4e\x75\x5f\x67\x52\xc5\x49\x1c\xfa\x58\x51\xc3\x33\x77\xf1\x92\
-\xfe\xea\xa9\xd2\xe8\xc4\xd4\x28\xd1\x19\x9c\x73\x70\xcd\xf7\xee\
-\xf9\x9d\xa3\x9d\xf1\x2f\x0e\x62\x74\x8a\xc2\xdf\xa0\x1b\x47\x15\
-\x24\x0f\x84\x5a\xc9\x24\x6a\xbc\x0b\x5a\x83\x14\x48\x6a\x5f\x68\
-\x56\x5a\xa3\x0c\xe4\xf1\xe3\x27\x75\x93\x0e\xa2\xc3\x15\x2d\xf6\
-\xab\x1c\x0c\x3f\x4d\x4f\xec\xa3\x89\xc7\x97\xed\xdb\xb7\x69\x03\
-\x4c\x5f\x09\x04\x08\x5f\x05\x3d\xf4\xe0\xee\xa0\xb7\xb7\xb7\x14\
-\x27\xc6\x94\xf3\xf8\x7e\xfd\x44\x8d\x0e\x1d\x85\x11\x20\xc4\x0b\
-\x34\xf9\x20\x1c\x68\x9a\x42\x58\xb0\xd8\x7e\x33\x49\xd0\x0c\xc4\
-\xbd\x53\xfb\x83\x50\x40\x80\x50\x7b\x83\x51\xae\x85\x1d\x3b\xb6\
-\xeb\x2f\x9f\xf8\xba\x0b\xa1\xc2\x12\x3f\x3f\xb5\x4c\x6e\x18\xd6\
-\x74\x52\xc6\xbf\x12\x88\x4f\x3a\xee\xd2\x2f\xe7\xaa\x12\x87\x74\
-\xe4\x45\x20\xe5\x41\xd7\x9a\x35\xc1\x6e\x75\x7e\x84\x19\x82\x15\
-\xa1\x70\xf9\xf2\xe5\x60\x69\xa9\xb6\xaf\xb1\x68\xa2\xa4\xd3\x2f\
-\xfd\x76\x10\x36\x3e\xd0\xa9\x99\xda\x17\x3a\x8a\xd3\x67\x86\x6b\
-\x41\xe8\xa4\x89\xa2\xde\xde\x6e\x5d\x4e\x39\xc7\x4a\x3e\x3d\x77\
-\xf1\x37\x3a\xf9\x86\x13\xca\xf8\xa7\xad\x71\x08\x75\x43\xf2\xa0\
-\x79\xe9\xb0\x0f\x5a\x87\x82\xd5\x63\x8f\x7f\x20\xf1\x6d\xff\xfa\
-\x37\xbc\x21\x78\xeb\xb7\xbe\xd9\x6c\x55\xa1\x86\x12\x91\xe7\xcb\
-\xb4\x96\x17\xae\xef\x21\x59\xe3\xce\xf3\xbe\xa0\x96\xbe\x21\xb9\
-\x5f\x43\xe6\x34\x30\x8e\x2a\x14\x77\xfe\x9c\xe3\xcd\x78\x7e\xf0\
-\xbe\x06\xef\xda\x04\xe3\xf0\x24\xef\x34\xf0\x4e\x2b\x43\x51\xf1\
-\x82\xff\x21\xcd\x71\x6f\x35\x24\x81\x22\xef\x6b\xc8\x76\x11\x79\
-\xdf\x5b\xd6\xf3\xab\x23\xcc\xba\x32\x45\xe6\x41\x5e\x69\xfb\xd9\
-\xcf\xfe\xe1\xb2\x61\x29\x60\x71\x71\x61\xef\xc7\x3e\xfa\x91\x0f\
-\x2a\x27\xbf\x86\xb0\xd3\x7c\x11\xc1\x42\x9f\x0a\x16\xda\xab\x19\
-\xb3\x83\xb5\xf5\xb3\x61\x08\xcf\x71\x9c\x5c\x5d\x42\x2d\x77\xd8\
-\x1c\x34\x44\xf3\x53\x5e\x85\x41\x58\x4e\xde\x69\x2b\x79\x90\x1d\
-\xef\xb4\xf5\x7e\x31\x1b\x87\x20\x68\xf2\x7d\x76\xe5\x19\xcf\x8e\
-\xa4\x6d\xe3\xd0\xd2\x7d\x6a\x7c\xf1\x2d\x67\x52\x20\x8b\x43\x5e\
-\x0a\xcd\x43\x23\xe5\x81\xff\xa5\x48\xf9\x2a\x0a\xff\x67\xd7\x38\
-\xaa\x20\x79\x20\xac\x84\xfc\x45\x8d\x14\xc8\xcc\x78\xbf\x14\x3c\
-\x5f\xcc\x8d\x84\x14\x87\xfa\xe3\x6f\x74\x24\xb3\xb2\x92\x77\xda\
-\x4a\x16\x14\x87\xe4\x41\x7b\xd0\x34\x35\x35\xcd\xf8\x62\x6e\xa4\
-\x6b\x69\x57\x72\x2f\x37\x92\xa7\x99\x69\xc6\x67\xb7\xd5\x68\xed\
-\x3c\x90\x72\x23\x94\xa9\xbb\xa8\x91\x17\x59\x71\xe4\xfd\x22\x93\
-\xbc\xca\x8e\x77\xda\x7a\x37\x8f\x18\x87\x90\x81\x56\x2e\xdf\x52\
-\x20\xea\x8d\xbc\x3f\x1b\x8b\xb6\xef\x53\xe3\x5b\xce\xa4\x40\x66\
-\x27\xef\xb4\x95\x3c\x28\x8e\x66\xcc\x03\x29\x0e\xf5\xc7\xbf\xdc\
-\x18\x47\x15\xe4\x19\x17\x56\x4a\xbe\xa2\x46\x0a\x64\x89\xbc\x8d\
-\x44\x33\xf6\xa7\x69\x16\xbc\x5f\xa4\x4d\x58\xbe\xc5\x48\x14\x47\
-\xee\xcf\xb8\x64\x55\x0d\x48\x1e\x08\x51\xea\x5a\x53\x93\xff\x4b\
-\x41\x4a\x64\x51\x34\x63\xda\x4a\x79\xa8\x3f\xf2\xec\x16\x49\xbe\
-\x69\x2b\x79\x50\x1c\xfe\x69\x2b\x79\xb0\x52\xda\xbe\xf9\xc9\x87\
-\x66\x7c\xd8\xe5\x45\x56\x7f\xbc\xf3\xc0\xdb\x38\x19\x87\x90\x21\
-\x2d\x7c\xd3\x56\x12\xb7\x28\x7c\x93\xb6\x95\xdf\xb3\xc2\xea\x91\
-\x9f\xa8\x69\xca\x02\x69\x1c\x42\xee\xe4\xfd\x22\x93\x97\x47\x76\
-\xf2\x4e\x5b\xc9\x83\xe2\x68\xc6\xa4\x95\xf2\x20\x34\x22\x52\x53\
-\x53\x00\xb9\x1b\x13\xa9\x92\xcc\x4c\xee\x86\x5a\x5e\xe0\x85\xd1\
-\x8c\xc6\x31\xf7\xf2\x25\xd4\x40\xbe\x79\x20\x59\xd5\x1a\xd4\x4d\
-\xd4\xe4\xfd\x52\x90\x97\x47\x19\x49\xdb\xd6\xa3\x19\xb3\x40\xca\
-\x4d\x91\xc8\x33\x5e\x6f\xf2\x4f\x5b\xc9\x83\x3c\x68\xdb\x9a\x1a\
-\xdf\x72\x26\x0f\x7b\xfd\x69\xc6\x3c\xf0\x7e\xe1\xc9\x8b\x2c\x33\
-\xfe\xc5\xc1\x33\x0f\xe4\x19\xcf\x8c\x77\xf9\xf6\x4c\x5a\xc9\x03\
-\x21\x2f\xf2\x11\x35\x52\x20\x0b\xa3\x19\x8d\x9e\xbc\xc8\xea\x8f\
-\xbf\xd1\xc9\x37\x5c\x3b\x90\x7f\xda\x1a\x87\x50\x37\x24\x0f\x5a\
-\x87\x96\xa8\xa9\x69\xa4\x17\xae\x18\x89\xfa\x93\x7b\x1e\x48\x5e\
-\x65\x46\x9e\x83\xe6\xa1\x39\xf3\x40\xca\x97\x90\x4c\x5d\x44\x8d\
-\xbc\xf0\x8a\x23\xef\xb4\x95\x3c\xc8\x8e\x77\xda\x7a\xbf\x98\x8d\
-\x43\x10\x34\xf2\xec\xd6\x9b\xfc\xdf\x9f\x92\x57\x79\xd1\x96\x7d\
-\x6a\x7c\xcb\x99\xbc\x14\xb2\x93\x77\xda\x4a\x1e\xd4\x9f\x46\xca\
-\x03\xff\x4b\x91\xf2\x55\x14\xfe\xcf\xae\x71\x54\x41\xf2\x40\xc8\
-\x93\x95\x8b\x1a\x29\x90\x99\xf1\x7e\x29\x88\x7a\xaf\x3f\x4d\x58\
-\xbe\xfd\x8d\x8e\x94\xaf\xac\xe4\x9d\xb6\x92\x05\xb5\x20\x79\x20\
-\xa4\xb3\xea\x35\x35\xf9\xbf\x14\x1a\xa7\x44\x36\xd2\xb5\xb4\x2b\
-\xcd\x58\x6e\x5a\x0d\xc9\x83\xfa\x23\x79\xd0\x4c\x48\x1e\xe4\x49\
-\x5b\x36\x3f\xb5\x2a\x79\xbf\xc8\xe4\x85\x97\x1d\xef\xb4\xf5\xfe\
-\xb5\x69\x1c\x42\x06\x5a\xb9\x7c\x4b\x81\xa8\x37\xf2\xfe\x6c\x6c\
-\xda\x4e\xd4\xf8\x96\x33\x29\x90\xd9\xc9\x3b\x6d\x25\x0f\xb2\x93\
-\x77\xda\x36\x52\x1e\x48\x71\xa8\x3f\xfe\xe5\xc6\x38\xaa\x20\xcf\
-\xb8\x90\x37\x2b\x13\x35\x52\x20\x4b\xe4\x6e\x4c\xe4\x17\x59\x61\
-\x78\xbf\x48\xa5\x7c\x0b\x0e\xb9\x3f\xe3\x52\xbc\x6a\x40\xf2\x40\
-\xa8\xcc\xaa\xd6\xd4\xe4\xff\x52\x90\x12\x99\x95\x56\x4e\x5b\x29\
-\x0f\xf5\x47\x9e\xdd\x22\xc9\x37\x6d\x25\x0f\x8a\xc3\x3f\x6d\x25\
-\x0f\xf2\x46\xfa\xd4\x24\xd0\x8c\x0f\xbb\xbc\xa0\xea\x8f\xb7\x31\
-\xf1\x36\x4e\xc6\x21\x64\x48\x0b\xdf\xb4\x95\xc4\x2d\x0a\xdf\xa4\
-\x95\xf7\xac\x50\x04\xb5\x8b\x9a\xa6\x2c\x90\xc6\x21\xe4\x4e\xde\
-\x2f\x32\x79\x79\x64\x27\xef\xb4\x95\x3c\xc8\x8e\x7f\xda\x1a\x47\
-\x13\x21\xe5\x41\x68\x06\xa4\xa6\x26\x07\x72\x37\x26\x52\x25\x99\
-\x99\xbc\xf3\x40\x05\x34\x0e\x21\x6f\x9a\xd1\x38\x36\xe3\x35\xb7\
-\x1e\xf9\x3e\xe3\x92\xa5\xad\xc9\xaa\x89\x9a\xbc\x8d\x8e\xbc\x64\
-\xca\x48\xda\x36\x0f\xad\xdc\xf4\x24\xe5\xa6\x48\xf2\x7d\x76\x25\
-\xaf\xb2\x93\x7f\xda\x4a\x1e\x14\x41\xdb\xd4\xd4\xf8\x96\x33\x79\
-\xd8\xeb\x4f\x33\xe6\x81\x94\x9b\xe2\xf0\x4f\x5a\xbf\x80\x92\x57\
-\xd9\xf1\x4d\x33\xdf\xa4\x95\x3c\x10\x8a\xa2\x36\x51\x23\x05\xb2\
-\x30\x9a\xb1\xe9\x49\x5e\x64\xf5\xc7\xdf\xe8\xe4\x1b\xae\x1d\xc8\
-\x3f\x6d\x8d\x43\xc8\x1d\xc9\x03\xa1\xa1\x6a\x6a\x9a\xf1\x85\xdb\
-\x8c\xd7\xdc\x6a\xe4\x9e\x07\x92\x57\x99\x91\xe7\xa0\x79\x68\xce\
-\x3c\x90\x72\x23\xf8\xb1\x2a\xa2\x46\x5e\x64\xc5\x91\xb7\x31\x91\
-\xbc\xca\x8e\x77\xda\x7a\x37\x8f\x18\x87\x90\x3b\xcd\x59\xbe\x7d\
-\xcb\x8d\x14\x9c\xa2\xc8\xff\xfd\x29\x79\x55\x14\x6d\xd1\xa7\xc6\
-\xb7\x9c\xc9\x4b\x21\x3b\x79\xa7\xad\xe4\x41\xfd\x69\xa4\x3c\xf0\
-\xbf\x14\x29\x37\x45\xe1\xff\xec\x1a\x47\x15\xe4\x19\x17\x8a\x24\
-\xbb\xa8\x91\x02\x59\x22\x6f\x43\x2d\x9f\x72\x37\x00\x4d\x58\xbe\
-\xf3\x2e\x87\x42\x99\xdc\x9f\x71\xc9\x82\x1a\x90\x3c\x10\xfc\x29\
-\xbc\xa6\x26\xff\x97\x82\x94\xc8\xa2\x68\xc6\xb4\x95\x72\x53\x7f\
-\x24\x0f\x8a\x24\xdf\xb4\x95\x3c\x68\x04\x24\x0f\x8a\xa4\x2d\x9a\
-\x9f\x5a\x15\x79\x91\xd5\x1f\xef\x3c\xf0\x36\x4e\xc6\x21\x64\x40\
-\x9e\x83\x66\xa1\x19\xf3\x40\xde\xb3\xcd\x45\x36\x51\xd3\x94\x05\
-\xd2\x38\xaa\x20\x05\x32\x3b\x79\xa7\xad\xe4\x41\x76\xf2\x4e\xdb\
-\x46\xca\x03\x29\x0e\xf5\xc7\xbf\xdc\x18\x87\x20\xd4\x19\xa9\xa9\
-\xa9\x91\xdc\x8d\x89\x54\x49\x66\x26\x77\x43\x2d\x6f\x66\xc1\x21\
-\xf7\x67\x5c\x8a\x57\x0d\x48\x1e\x08\xd9\x28\x54\xd4\xe4\xff\x52\
-\x90\x12\x99\x15\x49\xdb\xe6\xa1\x19\xb3\x40\xca\x57\x91\xe4\x9b\
-\xb6\x92\x07\xd9\xc9\x3f\x6d\x25\x0f\x8a\xa6\xa5\x6b\x6a\x7c\xcb\
-\x59\x33\x3e\xec\xf2\x82\xaa\x3f\xde\x2f\x3c\x79\x91\x65\xc6\xbf\
-\x78\x7b\xe6\x81\x3c\x2f\x85\xe1\x9b\xb4\x92\x07\xc2\x6a\xe0\x2d\
-\x6a\xa4\x40\x0a\x2e\x79\xbf\xc8\xa4\x7c\x65\x27\xef\xb4\x95\x3c\
-\xc8\x8e\x7f\xda\x1a\x47\x13\x21\xe5\x41\x68\x46\xa4\x4f\x4d\x0d\
-\xe4\x6e\x4c\xe4\x97\x7c\x66\xf2\xce\x03\x15\xd0\x38\x04\x5f\x72\
-\xcf\x83\x06\xa2\x19\xaf\xb9\xf5\xc8\xb7\x7c\x49\x96\xb6\x07\x85\
-\x89\x9a\xbc\x5f\x78\xf2\x92\x29\x23\x69\xdb\x3c\xc8\xa7\xdc\x42\
-\x6d\xc8\x33\x5e\x6f\xf2\x4f\x5b\xc9\x83\xd5\xa0\x65\x6b\x6a\x7c\
-\xcb\x99\x3c\xec\xc5\xd1\xca\x2f\x5c\x29\x37\xc5\xe1\x9f\xb4\xad\
-\x5b\xbe\xea\x8d\xff\xb3\x6b\x1c\x55\x90\x3c\x10\x56\x0b\x69\x7e\
-\xaa\x33\xcd\xd8\xf4\x24\xef\xa7\xfa\xe3\x6f\x74\xf2\x0d\xd7\x0e\
-\xe4\x9f\xb6\xc6\x21\xe4\x8e\xe4\x81\x10\xa7\xae\xa2\xa6\x19\x5f\
-\xb8\xcd\x78\xcd\xad\x46\xee\x79\x20\x79\x95\x19\x79\x0e\xea\x4f\
-\x6b\xe7\x81\x94\x1b\xa1\x36\x0a\x11\x35\xf2\x22\x2b\x8e\xbc\x5f\
-\x64\x92\x57\xd9\xf1\x4e\x5b\xef\xe6\x11\xe3\x10\x72\xa7\x39\xcb\
-\xb7\x14\x88\x7a\x93\xff\xfb\x53\xf2\x74\xb5\x68\xc9\xe6\x27\xdf\
-\x72\x26\x06\x3d\x3b\x79\xa7\xad\xe4\x41\x71\x34\x63\x1e\xf8\x5f\
-\x8a\x94\x9b\xa2\xf0\x2f\x37\xc6\x51\x05\x79\xc6\x85\xd5\x44\xfa\
-\xd4\x64\x20\x6f\x23\x21\x9f\x72\x37\x00\x4d\xf8\xc2\x15\x23\x51\
-\x1c\xb9\x3f\xe3\x92\x55\x35\x20\x79\x20\xd4\x4e\xee\xa2\x26\xff\
-\x97\x82\x94\xc8\xa2\x68\xc6\xb4\x95\x72\x53\x7f\x24\x0f\x8a\x24\
-\xdf\xb4\x95\x3c\x28\x0e\xff\xb4\x95\x3c\x58\x4d\xda\xb6\xa6\xa6\
-\x19\x1f\x76\x79\x91\xd5\x1f\xef\x3c\xf0\x36\x4e\xc6\x21\x64\x48\
-\x0b\xdf\xb4\x95\xc4\xad\x37\xad\xfc\x9e\x15\x1a\x93\x96\x13\x35\
-\x52\x1e\x8b\xc3\x37\x6d\xbd\x0d\xbf\x64\x56\x66\xf2\x4e\x5b\xc9\
-\x83\xe2\x68\xc6\xa4\xf5\x2f\x37\xc6\x21\x08\x0d\x86\xf4\xa9\xf1\
-\x24\x77\x63\x22\x55\x92\x99\xc9\xdd\x50\xcb\x9b\x59\x70\xc8\xbd\
-\x7c\x09\x35\x90\x6f\x1e\x48\x56\xb5\x1f\xb9\x8a\x9a\xbc\x5f\x0a\
-\xf2\xf2\x28\x23\x69\xdb\x7a\x34\x63\x16\x48\xf9\x2a\x92\x7c\xd3\
-\x56\xf2\x20\x3b\xf9\xa7\xad\xe4\xc1\x6a\xd3\x52\x35\x35\xbe\xe5\
-\x4c\x1e\xf6\xfa\xd3\x8c\x79\xe0\xfd\xc2\x93\x17\x59\x66\xfc\x8b\
-\x83\x67\x1e\xc8\x33\x9e\x19\xef\xf2\xed\x99\xb4\x92\x07\x42\x3d\
-\x90\xe6\x27\xc1\x0b\x79\x91\xd5\x1f\x7f\xa3\x93\x6f\xb8\x76\x20\
-\xff\xb4\x35\x0e\xa1\x6e\x34\x63\x1e\xc8\x33\xb9\x72\x1a\x56\xd4\
-\x34\x52\xe6\xe6\xfe\xc2\x93\x5f\xf2\x99\xc9\x3b\x0f\x54\x40\xe3\
-\x10\x7c\xc9\x3d\x0f\x04\x21\x82\x94\x2f\x61\xe5\xe4\x26\x6a\xe4\
-\x85\x57\x1c\x79\xa7\xad\xe4\x41\x76\xbc\xd3\xd6\xfb\xc5\x6c\x1c\
-\x82\xa0\xc9\xf7\xd9\x95\x67\x3c\x3b\xf9\xa7\xad\xe4\x41\x3d\x68\
-\x99\xe6\x27\xdf\x72\x26\x0f\x7b\x71\xc8\x0b\xb7\x79\x68\xa4\x3c\
-\xf0\xbf\x14\x29\x5f\x45\xe1\xff\xec\x1a\x47\x15\x24\x0f\xb2\x23\
-\x69\x96\x0f\xd2\xa7\x26\x27\xbc\x5f\x0a\x4d\xa8\xde\xe5\x59\xab\
-\x3f\xfe\x46\x47\x32\x2b\x2b\x79\xa7\xad\x64\x41\x2d\x48\x1e\x08\
-\xf9\xb0\xaa\xa2\xa6\x19\x5f\xcc\x8d\x74\x2d\xed\x4a\xee\xe5\x46\
-\xf2\x34\x33\xcd\xf8\xec\xb6\x1a\x92\x07\xcd\x84\xe4\x41\xbd\xe8\
-\xb0\x0f\x40\x87\x82\xd5\x63\x8f\x7f\xe0\x9e\xf6\x88\xf1\xba\xd7\
-\xbf\x3e\x78\xdb\xb7\xbe\xd9\x6c\x45\xc9\xfb\x61\xab\xe5\xa1\xf4\
-\x3d\x24\x6b\xdc\xb9\xdf\x5b\xc6\xc2\x9e\xfb\xf9\x33\xde\x3f\xf8\
-\x1e\x52\xd4\x35\xe4\x1e\x6f\x51\xe7\xf7\xfe\xb5\x69\x1c\x19\xa8\
-\x78\x0d\x37\x2f\x07\x5d\xc7\xf7\x68\xa7\x0e\x77\xe1\x4c\x10\xcc\
-\x9e\xd7\xdb\x69\xac\xa4\xc6\xb0\x96\xeb\xaf\xc4\x8a\x6b\x2f\x57\
-\xe9\xf0\xa4\x3c\xd0\x6f\xcd\x0a\xac\x24\xad\xb2\xbf\x2b\x8c\xc3\
-\x83\x95\xdc\x73\x9c\x6a\x21\xbc\xe2\xc8\x70\xed\xd5\xa8\x74\x3e\
-\x77\x8f\x9b\x75\x45\x3d\xbb\xb5\xa4\xdf\xa1\x99\x8b\xc1\xb9\xa5\
-\x35\xc1\xf5\xee\x7e\xe3\x13\x04\x73\x1d\x6b\x83\x6b\xb7\xef\xec\
-\xfd\xd8\x47\x3f\xf2\x41\xb5\xb9\xa4\x16\xec\xf4\x1d\xb3\x2c\x98\
-\xe5\xb6\x5a\xe6\xcd\xda\xfa\xd9\x30\x84\xe7\x38\x4e\xa7\x2e\x2b\
-\xcf\x14\x6f\x2c\x5a\x42\xd4\xf8\x06\xaf\x25\x1f\x73\xbf\x37\xcf\
-\x87\xc7\x92\xfb\xf9\x33\xa6\x81\x6f\xf0\xa2\xce\x0f\xb9\xc7\x9d\
-\xf1\x1a\xbc\xcf\xef\x99\xb7\x35\x24\x41\x10\x9c\x3f\x12\x74\x9c\
-\xd8\x1b\x04\xc7\x0e\x06\x1d\x73\xb3\x41\xc7\xcc\x6c\x10\x3c\xab\
-\xc4\xcb\x1c\xef\xad\xd5\xa3\x96\x4b\x2f\x9a\x9a\xd2\xd3\x03\x9f\
-\x68\xab\x68\x1a\xef\x32\x11\xa7\xe8\x74\xf6\x49\x33\xef\xf2\x6c\
-\xd6\x90\x94\x1e\xd5\x62\xa9\xb4\xbf\xe2\xb1\x29\x3b\xd3\x8e\x71\
-\xfd\x3b\x62\xa1\x7c\x8e\xb1\xc4\xfd\xd2\x8e\x85\x78\x3a\xdb\xcd\
-\xa8\xa0\x5a\x4e\x5a\xda\xdf\x1e\xec\xba\x30\xbf\x4e\x2d\x03\xdd\
-\x33\x37\xfb\xba\xcf\x1f\x1a\x18\x7a\xe6\xf4\x52\xf7\xa9\x5f\xf9\
-\xf4\xff\x3e\xc1\x6e\xb5\x88\xa8\xb1\xf7\x26\xa2\x66\x39\xb9\xdf\
-\x57\x4a\x41\xad\x44\xee\xd7\x90\x39\x0d\x8c\xa3\x0a\x45\x9d\x1f\
-\x7c\x8e\xf1\x8e\xb7\xa0\xf3\x43\x6e\xa2\xe6\xe6\xe5\xa0\xf3\x85\
-\x2f\x04\xc1\xf1\x03\x41\xc7\x0b\x2f\xd4\x45\xbc\xa4\x91\x3d\xf5\
-\x8a\xa5\x86\xec\xf4\xc2\x37\xda\x76\x17\x35\xf1\x10\xf1\xf4\xa8\
-\x16\x43\xcd\xfb\x2b\x1c\x98\xb6\xcb\xf5\x77\x45\x4d\x85\xa8\x96\
-\xed\x4b\x0a\x9b\x76\x7c\x52\x1a\x5b\xaf\x5a\x45\x0d\x24\xed\xb9\
-\xdb\xd5\x71\x63\x71\xa8\xeb\xc0\x8d\x91\x35\x5f\xbe\xb1\xb6\xf7\
-\xf9\x2f\x0c\x8c\xfd\xf9\x2f\x7c\xea\xff\x5c\x50\xbb\x44\xd4\x64\
-\x15\x35\xde\x2f\xfc\x9c\xc3\xb9\xf8\x1e\x92\x35\xee\xdc\xef\xad\
-\x42\x41\x4d\x23\xcf\x6b\xc8\x7a\xff\xe0\x7b\x48\xde\x69\x65\xc9\
-\x3d\xde\x8c\xe7\x07\xef\x6b\xf0\xcc\xdf\xa4\xe8\x3a\x5f\xf8\xf3\
-\x20\x78\xe2\xcf\x83\x8e\xe7\x5e\x0c\x82\xaf\x54\x6e\x3a\xaa\x27\
-\xd9\x53\xaf\x58\x6a\xc8\x4e\x2f\x7c\xa3\x6d\x46\x51\xe3\xfd\xa8\
-\x78\x5c\x85\x1b\x22\x29\x2d\xaa\xc5\x50\xf3\xfe\x94\x1d\x95\xe2\
-\x73\xf7\xf9\x88\x9a\x24\x7f\x5f\x3f\x48\x4a\x67\xbc\xaa\x09\xbf\
-\x6a\xe9\x9e\xb4\x37\xc9\xef\xee\x9a\x8e\x17\xee\xf5\x74\x7e\x7e\
-\x61\xa8\xf3\x93\x7f\xf9\x99\x83\x7f\xa6\xbc\x44\xd4\xb8\x34\xbb\
-\xa8\xa9\x2d\xde\x9c\xef\xad\x4a\x61\x8d\x93\xfb\xf9\x6b\x4a\x03\
-\xe3\xa8\x42\x51\xd7\x90\x7b\xbc\x45\x9d\xdf\x33\x6f\xdd\xe8\x3a\
-\xbf\xf2\x59\x25\x64\x3e\x1f\x74\xfc\xf1\x33\x0d\x53\x13\x53\x8d\
-\x6c\xa9\x57\x3c\x19\xb3\xd3\x1b\x9f\x68\x9b\x51\xd0\x80\xf7\xa3\
-\xe2\x71\x25\x6e\x88\x46\x16\x35\x71\xff\x46\x11\x35\xc9\xf1\xa5\
-\xc5\x18\x92\x7c\x4c\x0c\xc7\xc3\x38\xaf\x2e\x75\x05\x9f\xba\xdf\
-\xd1\xf1\xc9\x57\x9e\x3a\xfa\x49\xf5\x5e\xab\x7c\x92\x26\xa6\xe9\
-\x45\x8d\x6f\xf0\x5a\xf2\x30\xf7\x7b\x4b\x2c\x8e\xe9\xe4\x7e\xfe\
-\x8c\x69\xe0\x1b\xbc\xa8\xf3\x43\xee\x71\x67\xbc\x06\xef\xf3\x7b\
-\xe6\x6d\xc7\x9e\x3f\x0f\x82\xcf\xfd\x51\x53\x09\x19\x4b\xb6\x94\
-\x5b\x1d\x6a\x28\x52\x5e\xf8\x44\xdb\xca\xa2\xc6\xf7\xda\xdd\x50\
-\x59\x45\x4d\xb5\x33\x54\xdc\x9f\xb2\x33\xed\x18\xd7\xbf\x59\xfb\
-\xd3\x58\xe2\x7b\x13\x43\x3b\x9e\x09\xfb\xaf\x2a\xbf\x4f\xaa\xf5\
-\x6f\x3d\x7a\xf6\xe8\xe7\x42\xaf\xd6\x41\xc6\xa9\x49\x21\x6f\x63\
-\x5a\xeb\x0b\xae\x9d\xa9\xb7\xa0\xc9\x8d\x1b\x57\x82\x8e\xcf\xfc\
-\x7a\xd0\xf9\xae\x6f\x0f\x3a\x7e\xec\xe7\x82\x8e\x4f\x7c\xb9\xe9\
-\x04\x4d\x23\x52\x54\x76\xca\x93\xea\x47\xb5\x74\x2a\x2c\x1d\x73\
-\x8c\x38\x4b\x54\x99\xc2\xd6\x78\x8d\x59\x05\x4d\x8d\x0c\xab\xe5\
-\x9d\x6a\xf9\xb3\x3d\x1b\x77\x1e\x7f\x7e\xe3\x8e\xf7\xab\x65\x44\
-\xef\x69\x01\x56\x24\x6a\x72\x37\xfc\xf5\x32\x3a\x0d\x88\xa4\x6d\
-\xf3\x90\xf6\x22\xea\x98\x39\x1a\x74\xfe\xdb\x9f\x0e\x3a\xdf\xf4\
-\x9d\x41\xc7\x3f\xfb\x44\x10\xec\xbf\x66\xf6\x08\xad\x4e\xa3\xfe\
-\x88\x29\xea\x35\x50\xad\xd6\x6a\x35\xc8\xf3\xd6\x8a\xca\xbd\x6a\
-\xb5\x34\xab\x41\xec\xbc\xdb\xd4\xf2\xaf\xd4\x82\xb8\xf9\x2d\xb5\
-\x6c\xd7\xbe\x4d\x4c\x53\xd7\xd4\xf8\x3e\xa0\x62\xd0\xeb\x4f\x33\
-\xe6\x41\xad\xd7\xdc\xb9\xe7\xcf\x83\xce\x9f\xfd\xa1\xa0\xe3\x3b\
-\x7f\x28\x08\xa8\x95\x11\x5a\x8e\xa2\x8c\x78\x23\x3c\x25\xad\x56\
-\xab\x5c\xd4\xdd\x64\x89\x77\x55\x53\xd4\x39\x59\xb5\xf3\x3a\x79\
-\x6d\x6b\x6f\x8e\x3d\xb7\x71\xc7\x27\xd5\xf2\x3a\xed\xdb\x84\x48\
-\xf3\xd3\x2a\xd0\x8c\x2f\x09\x11\x8c\xd9\xb1\x62\x26\xf8\xb1\x9f\
-\x0b\x82\x3f\x3d\x6a\x7c\x5b\x03\xc9\x65\x21\x0b\xd5\xca\xcb\x4a\
-\xf7\xd7\x8a\xef\xa7\xdc\x71\x32\x85\x2d\xea\xe2\x13\x28\xe8\x54\
-\xdf\xa9\x96\x3f\x53\xc2\xe6\x73\xcf\x6e\xdc\xf1\xca\xd0\xab\x79\
-\x68\x18\x51\xd3\x48\xc6\xd1\xf7\x5a\xc4\xa0\x17\x47\xee\x79\x50\
-\x60\x5e\xe9\x66\xa6\x5f\x78\xac\x25\xc5\x4c\xa3\x52\x54\x76\xb6\
-\xf2\x13\x9d\x67\x9a\xb9\x51\xad\x6a\xd3\xd3\x2a\x64\x50\xbd\xca\
-\x40\xb5\x1f\xbf\xab\x71\x5d\xb1\x73\xbc\x56\x2d\xcf\x28\x61\xf3\
-\x5b\x6a\x69\x9a\x66\xa9\x9a\x45\x8d\x18\xfe\xe2\xc8\x3b\x6d\x25\
-\x0f\xb2\xe3\x95\x66\x37\xaf\x04\x1d\xbf\xf9\x4f\xc2\x66\xa6\x4f\
-\x3e\x6f\x3c\x85\x76\xa7\xd5\x9a\x6f\x9a\x81\x66\x48\xf1\x55\xe9\
-\x4f\x53\x25\x62\x77\x77\x06\x11\xf5\x4e\xb5\x71\xec\xd9\x0d\x3b\
-\xfe\xb1\x5a\x1a\xbe\x43\x71\xd3\x36\x3f\xf9\xda\x69\x31\xe8\xd9\
-\xc9\x3b\x6d\x5b\x32\x0f\xbe\xf2\x99\xa0\xe3\x1d\xdf\x1b\x04\xbf\
-\xfe\xa7\xc6\x43\x68\x17\xa4\x3f\x4d\xb1\xe4\x79\x05\x6e\x5c\xf1\
-\x4f\xb9\x57\x42\x96\x98\x8a\x4a\xd1\x6a\xf1\x16\x70\xde\x7f\xa4\
-\x96\x67\x95\xb0\xf9\xae\x70\xb3\x31\x91\x3e\x35\x35\xe2\x6d\xd0\
-\x0b\x2b\xd2\x82\x37\x79\x8a\xaa\x99\x23\x41\xc7\xcf\xbe\x2b\xe8\
-\xf8\xa9\x5f\x6a\x9b\xcf\xb2\x1b\xad\x04\xb7\xa2\x46\x6e\x25\xaa\
-\x65\x4f\xcd\xd9\x97\x63\xbe\x67\x89\x2a\x53\xd8\x1c\xaf\xd1\xa5\
-\xa0\x68\x6b\x81\xaf\xa5\xfe\x40\x09\x9b\x4f\xaa\xa5\x21\x9b\xa4\
-\x6a\x12\x35\x79\xff\x42\x6f\xa4\x5f\xf2\x2d\x59\xab\xd0\x64\x34\
-\x6a\xb9\xe9\xf8\xec\xaf\x07\x1d\x3f\xf2\x1e\xe9\x37\xd3\xa2\xb4\
-\xf2\x93\x9f\xe7\xa3\xe2\x46\xb5\xaa\xfd\x69\x52\xc8\x33\xdf\x8a\
-\x2a\x03\xd5\xd2\xa9\x09\x6b\xc8\xe8\x4c\x4c\xad\xcd\xbb\xc2\xcd\
-\xc6\x41\x6a\x6a\x1a\x8c\xbc\x0d\xba\x88\xb4\xec\x2c\x4b\x33\xfa\
-\xce\xfc\xac\x7a\x76\x7f\xfe\x3f\xca\xa0\x79\x6d\x4e\x51\xc6\x49\
-\x9e\xd2\xf6\xa1\xb0\xbc\xae\x12\xb1\xbb\x3b\x43\x7f\x9a\x4a\xf1\
-\xf2\x19\xf8\xc7\x9f\xd9\xb0\xe3\x93\x6a\x69\x98\xbe\x36\x4d\x29\
-\x6a\x7c\xed\xb4\x18\xf4\xec\xe4\x9d\xb6\xcd\x9e\x07\x4c\x34\xa9\
-\xfb\xce\xb4\x69\xed\x8c\x3c\x41\xed\xc3\x6a\xd4\x16\x54\x3b\x43\
-\x9e\x57\xe0\xc6\x25\xfd\x69\x0a\x85\x5a\x9b\xe3\x4a\xd8\x34\xc4\
-\xd8\x36\x52\x53\xe3\x90\xb7\xa1\x96\xfe\x34\xc5\xe1\x2d\x96\x56\
-\x20\xaa\x3a\x7e\xef\x97\x83\xfb\x3f\xfa\xff\x4a\xed\x4c\x03\x51\
-\x94\x46\x96\x27\xd5\x8f\x6a\xe9\x54\x58\x3a\xe6\x18\x71\x96\xa8\
-\x32\x85\x2d\xe8\xe6\x0b\x4b\xd3\x7c\xa1\xd6\xe6\xcf\x9e\xde\xb0\
-\xfd\xfd\xe1\x66\xfd\xc8\x2c\x6a\x72\x37\xfc\x45\x95\x84\x16\xa6\
-\x95\xd3\xb6\x21\xae\xf9\xe6\x95\xa0\xf3\x43\x3f\x19\x04\xbf\xf2\
-\x29\xe3\x21\x08\xcd\x4b\x51\x8f\x94\xf4\xa7\xf1\xa3\x11\xfa\xd3\
-\x54\x3b\x83\xbb\x3f\xcb\xd5\x24\x84\xfd\x57\x4a\xd8\x7c\x52\x2d\
-\x75\x6b\x8e\x6a\xba\x9a\x1a\xdf\x07\x54\x0c\xba\x50\x13\x47\x9f\
-\x09\x3a\xfe\xe1\x8f\x07\xf7\xff\x40\xc6\x9d\x11\xa2\xb4\x72\x7f\
-\x9a\x56\xab\x55\x6e\xd4\xbb\x29\xec\xba\x9c\x88\xab\x9d\x23\x53\
-\x5e\x67\x0a\x5a\x0a\x4c\x73\xd4\xe7\x94\xb0\xa9\xcb\xd7\x51\xd2\
-\xfc\x24\x94\xc8\x5b\x30\x36\x9b\x48\xeb\x38\xf6\x4c\x10\x3c\xf6\
-\xf7\x82\xe0\x2b\xe7\x8d\x4f\x7b\xd3\x5c\xb9\x27\x34\x3a\xd5\xca\
-\x53\x51\xe5\xad\xd6\xa9\x11\x92\xc8\x72\x7c\x51\xf7\x53\x54\xbc\
-\x39\xf3\x0a\xb5\x3c\xab\x84\xcd\xaa\x4f\xb3\x20\xa2\xc6\x90\xb7\
-\xa1\x6e\xb5\x5f\x3e\xab\x41\xee\x62\x29\x83\xa8\xea\xf8\x3f\x9f\
-\x08\xee\xff\xa4\x12\x34\xd2\x7f\xa6\x61\xc9\x90\x9d\x99\x68\xe5\
-\x27\x35\xcf\x34\xab\x16\x55\x61\xe9\x58\xa7\x0c\xca\x72\xda\x5a\
-\xd3\xb9\x9a\x9d\xa8\xd3\xad\xe7\x05\xfd\x6c\x3e\xf7\xd4\x86\xed\
-\xab\x3a\x58\x5f\x26\x51\x93\xbb\xe1\x2f\xea\x2d\xd5\x84\x48\xda\
-\xd6\x0f\x2d\x68\xfe\xc1\x47\x45\xd0\x08\x35\xd3\x6e\x3f\x62\xa4\
-\x3f\x8d\x1f\x6e\x3a\x25\x9d\x83\xfd\x2b\x4e\xcb\x2a\x17\x5f\xed\
-\xde\xdc\xfd\x59\xd2\xc1\x33\x2c\xc2\xe6\x0f\x94\xb0\x59\xb5\xf1\
-\x6c\x9a\xaa\xa6\xc6\xd7\x4e\x8b\x41\x2f\x8e\x56\x13\x55\x25\x41\
-\x23\x08\x15\x28\xca\x88\x37\xc2\x53\xd2\x08\x82\x2c\xcf\x2b\x28\
-\xea\x6e\xb2\xc4\x9b\x16\xd6\x8a\x98\xf2\x12\x96\xac\xf0\xff\xca\
-\xe0\x9d\xbb\x64\xde\xbb\xb8\xed\x3b\xd8\x7d\x17\x67\xca\xeb\x4c\
-\x41\xab\x06\xfe\xf8\x6a\x09\x1b\x69\x7e\x2a\x80\x66\xfc\xd5\xe6\
-\x94\xfb\xb6\x41\x04\x4d\x3a\x6d\x58\x1c\x84\x15\x50\xad\xbc\xd4\
-\xab\x3c\xd5\xda\x9f\x26\x53\x58\xcf\xc0\x69\xc2\x05\x61\x13\xfe\
-\x55\xc7\x9e\xca\x8a\x96\xc8\x82\xbf\x5a\x10\x36\xae\x1b\xca\xe1\
-\xf4\xe6\xaa\x11\x39\xdd\x7d\x25\x6c\xa6\x8b\x17\x36\xb9\x8b\x1a\
-\x12\xce\x07\xdf\x70\xab\x41\x33\x5e\x73\xab\x91\x7b\x1e\x54\x09\
-\x27\x82\xa6\xb9\x28\xea\xd1\x6b\xe5\x27\x3a\xcf\x34\x73\xa3\xca\
-\xa3\x56\xc1\x9b\x55\xc8\xa0\x5a\x4f\x41\xfa\x56\x4a\xe3\x5a\xd2\
-\xc9\x3d\x26\x1e\x35\xef\xbe\xd2\xa2\xb6\x97\xd4\x72\x4f\x39\xee\
-\xa9\xf5\x5d\xdc\xc6\x2f\x6d\xb1\xf1\xb9\xd7\x6d\xfd\x56\x91\xc2\
-\x85\x8d\xd4\xd4\x34\x00\x79\x1b\x74\xdf\x70\xed\x8a\x08\x1a\x21\
-\x0b\xd5\x8c\x53\x68\x62\x84\xd5\x24\xcf\x14\xb7\x46\x3e\xeb\x92\
-\x37\x49\x75\x35\x25\x11\xa3\x16\x84\x09\x22\xe6\xae\x5a\x58\x2f\
-\x71\x1d\x84\xd1\x21\xab\x13\x0f\x1b\xbf\x87\xc8\x66\x95\x48\x23\
-\xf1\x54\x0b\xbc\x9c\x8f\x3f\x59\xa0\xb0\x69\x1a\x51\xe3\x5b\x88\
-\xc4\xa0\x67\x27\xef\xb4\x6d\xe4\x3c\xe8\x7c\xe1\x73\x22\x68\xaa\
-\x20\x4f\xd0\xea\xd0\x08\xe9\xdc\x08\x82\x2c\xcf\x2b\x70\xe3\x4a\
-\x9a\x1a\x81\x57\x53\x7c\xd1\xfe\x1e\x8b\x2f\x59\xc2\x56\xc2\xbe\
-\x47\x11\x33\x56\xc8\xe4\x11\x77\x5e\xd7\xb7\x42\x10\x36\x85\x7c\
-\xee\xdd\xf6\x35\x35\x79\x1b\x6a\xf9\xd5\xd6\x00\xa4\xe4\x15\xe3\
-\xd0\x2c\xfd\xf4\xcf\x9b\x2d\xa1\x59\xf0\x7c\xf4\x9a\x8a\x56\xba\
-\xa5\x6a\xf7\x52\xf3\xbd\xe6\x90\x48\x94\x1d\x16\x5d\xab\xc1\x82\
-\x9f\x5a\x74\xad\x87\x59\x6c\xd3\x8c\xbb\xac\x94\x95\x34\xd1\x71\
-\xac\xed\x17\xa3\x9b\x97\xd4\x92\xc7\x35\xb9\xd8\xf8\x8a\x7c\xb6\
-\x22\x51\x27\x9f\xe7\x73\x45\x08\x9b\x5c\x45\x4d\x2b\xfc\x92\x6f\
-\x76\x9a\x31\x6d\x57\xa5\xdc\xdc\xbc\x22\xe3\xd0\x08\x11\xea\xf5\
-\xa4\xac\xc6\x79\xf3\x7c\x0d\xb8\x51\xad\xc4\x58\xe7\x45\xb5\x5b\
-\xe3\x3d\x11\x2e\x61\x58\x44\x8b\x15\x31\xd6\x9d\x63\xf2\x2c\x63\
-\x45\x69\xc4\x85\x99\xeb\xd6\x4d\x4c\xda\xb3\x18\x8a\x4c\x83\x4a\
-\x38\xe7\x1d\x56\xb9\xf4\xc9\x27\xa6\xb7\xe5\x3a\xa5\x82\xf4\xa9\
-\xa9\x33\xab\x62\xd0\xdb\x1d\x25\x68\x82\x7f\xf0\x63\x22\x68\x84\
-\xcc\x54\x33\x50\x59\x6b\x66\xe5\x29\x2e\x16\xfb\x9e\xe4\xbf\xdb\
-\x79\xb6\x59\xd2\xbd\xa3\x23\x2c\x71\x45\xd4\xce\x54\x22\x72\xae\
-\x2a\x27\x76\x77\x67\x2d\xff\x09\x6c\x53\xcb\xe7\x42\x67\x3e\x34\
-\x85\xa8\xf1\xb5\xe7\x62\xf8\xb3\x93\x77\xda\x36\x64\x1e\xfc\xfb\
-\x7f\x26\x53\x1f\x78\x22\x4f\x50\xfb\x90\x83\x41\xaa\x4a\xb5\x33\
-\xe4\x79\x05\xf6\xf3\x65\x5b\x1b\xd3\xcc\xac\xa6\x61\x2e\xe2\x95\
-\x9d\x31\xca\x57\x3c\x31\xbd\xed\xb7\x8c\x7b\xc5\xb4\x75\x4d\x4d\
-\xde\x86\x7a\x35\x5e\x12\xad\x46\xee\x62\x29\x16\x8e\x2f\x9d\x82\
-\x4f\x7c\xd9\x6c\x09\xcd\x86\x6f\xb6\x67\x65\xb5\x9e\x54\xce\xe3\
-\x2e\xcd\x46\xb5\x6b\x2e\xec\x9e\x6a\x8c\xb8\x59\xd3\x39\x4e\xa7\
-\xa9\xb1\x69\x09\x9c\x0c\xa9\x90\x37\xef\xfc\xea\xf4\xb6\x5c\xbe\
-\x88\xca\x4d\xd4\xe4\x6e\x9c\x84\x12\x92\xb6\xb5\x41\xc7\x60\xf9\
-\xd2\x49\x28\x8a\x6a\x3f\x62\xea\xf5\x34\x16\xf5\x1a\x68\x86\xfe\
-\x34\xcd\x5e\x43\x03\x34\x41\x75\xa9\x75\xb7\x5a\x37\x5a\xad\x43\
-\x9e\x45\x2b\xe1\xf9\xf9\x15\x25\x6c\x56\xdc\x71\xb8\xe1\x6b\x6a\
-\x7c\x1f\xd0\x66\x34\xe8\x22\x42\x0a\x84\x8e\xc1\xff\xea\x9f\x9b\
-\x0d\x41\xc8\xce\x4a\x8c\x78\xa3\x3f\xd9\xad\x56\xab\x7c\x4f\xbd\
-\x4b\x1b\x3f\xcd\xb3\x95\x0b\x84\xcd\x9a\xd5\x10\x36\x6e\x41\xcf\
-\x70\x81\x79\xa6\xb8\x89\x89\x79\xa2\x56\xdc\x0c\xd5\xd6\xcd\x4f\
-\xed\x4e\xde\x82\xb1\x91\x44\x5a\xc7\xef\xff\x6b\xe9\x47\x93\x91\
-\xc6\xc9\xbd\x90\x66\xd5\xfc\x4d\x7a\xd9\xb9\x53\x2d\x1d\xf2\x4a\
-\x27\xfb\xde\x69\xe4\x5a\x1a\xf7\x5e\x7d\xc4\x00\xb5\x35\x2c\x18\
-\xe8\x2e\xb5\x2e\x94\xbc\x32\xc2\xb0\xc2\xe8\x5e\xf1\xd5\xe9\x6d\
-\xbf\x62\xdc\x35\xb1\xaa\xa2\xa6\x91\x8c\x5e\xde\x86\xba\xd5\x7e\
-\xf9\xac\x06\x79\xe7\x81\x0a\xa8\x57\x7a\x80\xbd\x8f\xfd\xa9\x76\
-\x0b\x42\x9c\x56\x7e\x52\x7d\x1f\x95\x34\x38\xdc\x2e\xf6\xab\xa1\
-\xf8\x62\x71\xdd\xb9\x92\x31\x62\x82\x37\x7a\xb3\x13\xb2\x24\x94\
-\x26\xd9\x53\x0d\x23\x9d\x66\xa8\x73\x93\x3b\x45\x65\xa6\x13\x6f\
-\x86\x53\xfc\x94\x12\x36\xaf\x33\xee\xcc\xe4\x22\x6a\x1a\x49\xac\
-\x34\x0b\xb9\x8b\x2a\xc9\x83\x90\x9b\x57\x82\xa5\x5f\xfa\x25\xb3\
-\x21\x34\x1b\x14\x63\xbb\x34\x32\x69\x3f\x62\x9a\xed\x29\xe4\x7a\
-\xdd\xc5\x52\xe9\x3e\xe2\x61\x57\x8b\xa4\x73\xf2\xc5\x53\x33\xf5\
-\xa3\xf1\x9f\xba\x32\x44\xd7\xd8\xb0\x0e\x37\x97\xb1\x9a\xf9\x90\
-\xe7\xb9\xdc\xe7\x27\x25\xde\xdf\x52\xc2\xa6\xa6\xf1\x6b\x56\xb5\
-\xa6\x26\x2b\xbe\x2f\x36\x31\xe8\xc5\xd1\x6c\xa2\x4a\x37\x3b\xed\
-\xbf\x66\xb6\x84\x46\x86\x22\x13\x5f\x1a\x85\xdc\x7e\x01\x37\x20\
-\x18\x14\x92\x3a\x29\xb9\xd3\xfc\xc1\xee\x4b\x5a\xb2\x52\xcb\x31\
-\x2e\xbc\x6f\xac\xa0\x59\x69\x5c\xcd\xc0\xaa\x94\xc7\x0c\x09\xb9\
-\x0a\x2d\x13\xdb\xd4\x19\xde\x6f\xdc\x99\x68\x68\x51\x53\x6f\xbc\
-\x0d\x7a\x13\x3e\x56\x8d\x64\x40\xf2\x42\x7f\xed\x24\xcd\x4e\x35\
-\xb1\x9a\xc5\x81\xb2\xd7\x8a\xe5\xaf\x11\xf0\x31\x7e\x36\xe9\x59\
-\xc7\x97\x5a\x89\x1f\x5b\x73\x5c\x1e\x07\xda\xf7\x72\xbb\x08\x9a\
-\x66\x22\x92\x1f\x2b\xcf\x9c\x7f\xf4\x95\x1a\xbe\x86\x5a\xb1\xa8\
-\x69\xb6\x5f\xf2\xd0\x48\xd7\xd2\xae\xe4\x5e\x6e\x54\x38\xf9\xda\
-\x29\x3f\x48\xf6\xa2\x96\x7a\x52\xe7\xd3\x17\x8b\xb9\xb9\x34\x61\
-\x13\xfa\x87\x81\x8a\x48\x87\xd5\x48\x5b\xde\x07\x9c\x87\x91\x82\
-\x57\xe3\x7c\x42\x3e\xb8\x79\x95\xb1\x12\x20\x73\xa7\x61\xa9\xa9\
-\xa9\x03\x79\x1b\x74\x6f\xc3\xdf\xc2\xe8\x41\xf6\xe4\x6b\x27\x21\
-\x07\xaa\xd5\x76\x34\x7e\xcd\xec\x7d\x75\x0f\xd1\x25\xbc\xea\xf0\
-\xca\x8b\xbc\xfa\xa2\xe2\xd6\x13\x3c\xaa\x85\xda\x19\x11\x34\xab\
-\x8f\x9b\xde\x79\x96\x7f\x8f\x98\x5e\xfb\x95\xe9\x6d\xdf\x65\xdc\
-\x5e\x34\xac\xa8\xf1\xb5\xd3\x62\xd0\xb3\x93\x77\xda\xd6\x3b\x0f\
-\x3a\x18\x93\xe6\x97\x3f\x6e\xb6\x84\xac\xe4\x9e\x7b\xfd\x6b\xf4\
-\xd2\xb1\xb6\x37\xe8\x18\xe8\x55\x6f\x99\x02\x5e\x33\x5d\x9d\x3a\
-\xfe\xa0\xbf\x3b\x08\xba\x1b\xec\x35\x56\xa7\xe7\xc1\xca\x16\x0c\
-\x7f\x7c\xe1\x8a\xec\xba\x68\xaa\x9d\x23\xeb\x35\xd8\xf7\x8b\x9d\
-\xc7\x49\x68\x7d\x62\x65\x24\x53\x6d\x4d\xdb\xd5\xd4\xe4\x6d\xa8\
-\xf3\x54\xad\x42\x14\xef\x3c\xf8\xd4\x6f\xc8\x64\x95\x75\xa2\x63\
-\xdd\x80\x71\x39\xcc\xdf\xd5\xcb\xfd\x9b\x0b\xc1\xfd\x5b\x2a\x5f\
-\x96\x0a\x30\x45\xf7\x96\x74\xfc\xc1\xfc\x9d\x20\xb8\xe3\xc4\xdf\
-\xd9\x91\x2a\x72\x56\xeb\x49\xe5\x3c\xf5\x10\xfa\x76\x32\xc4\x4a\
-\x34\xf4\xdb\x2a\xe1\xe2\x48\x47\xbc\xa5\x76\xa6\xf1\x89\xe4\x4f\
-\x9e\x99\x75\x3f\xd8\xf6\x95\xa9\x6d\xff\xd8\x6c\x55\x65\x45\xa2\
-\x26\x6f\x81\x20\x64\xa7\x19\xd3\x36\xcf\x6b\xa6\x96\x26\xf8\x8f\
-\xff\xd3\x6c\x09\x79\x81\x7d\xac\xb6\xc0\xfd\x6b\xb7\x42\x47\xa3\
-\xb0\xa4\xca\x96\x15\x39\x3d\x6b\x82\x60\x50\x2d\x42\x53\x22\x82\
-\xa6\x35\x70\xf3\x6e\x05\x95\x00\xef\x57\xc2\xc6\xeb\x13\xef\xa6\
-\xae\xa9\x69\x65\x83\xde\x8c\xf7\x56\x17\x3e\x2d\xb5\x34\x42\x0a\
-\x8b\x77\x83\xe0\x86\x5a\x80\x26\x31\x0f\x8c\x56\x4b\xc5\xe7\xa5\
-\x5c\x2d\x0e\xc1\x9f\xd5\x6a\x32\x6b\x74\xea\x99\x06\xee\xb9\xf3\
-\x6c\x99\xc8\x18\x13\x53\x28\x78\x7d\xe2\xdd\x90\xa2\x46\xec\x79\
-\x71\xf8\xa6\x6d\x33\x88\x2f\xdd\x97\xe6\x77\xa4\x96\x66\x25\xb4\
-\xcd\xa3\x36\x7f\x57\x8b\x8d\x8e\xae\x62\x25\xc7\xc0\xf7\xfe\xd5\
-\x60\xfc\xdf\xfd\x5a\x30\xf9\xa9\xff\x12\x4c\x7e\xe6\xbf\x05\xe3\
-\xbf\xfd\xef\x82\xc1\x1f\xc9\x65\xf2\xe1\x96\x20\x6b\x79\x6b\x9b\
-\xf2\xd9\xe4\xe4\x99\x4f\x91\xb8\xa2\x11\xbf\xff\xcb\x53\x5b\xab\
-\xd6\xd6\xb4\x55\x9f\x9a\xbc\x0d\x75\x9e\xaa\xb5\x5d\xc8\x35\x0f\
-\xa4\x96\x46\xc8\xca\xbd\xfb\x41\x07\xcd\x52\x05\xd0\xfd\xc8\x4b\
-\x82\xb1\x5f\xfe\x85\xa0\xff\x5b\xde\x1c\xf4\x7e\xed\xd7\x04\x3d\
-\xaf\x78\x79\xd0\xff\xfa\xd7\x06\x23\xff\xe8\xff\x09\x06\xfe\xda\
-\x77\x9b\x50\xc5\xc2\xf8\xb3\x9d\x66\xe9\x5a\xb6\xd4\xbf\x16\x29\
-\xf5\xfc\xb1\xc7\x9d\xe7\x5f\x6a\x69\xca\x14\x96\x0e\x45\x14\x08\
-\xe7\x62\xf3\xbc\x6e\x65\x6f\xa9\xad\xa9\xfa\x0b\xa1\x66\x51\x93\
-\xb7\x40\x68\x07\xf2\x4e\xb3\x76\x4f\x5b\xa9\xa5\x11\x6a\x62\xd1\
-\xd4\xda\x64\x7c\xa1\x57\xfb\x11\xd3\xff\x3d\xdf\x69\x5c\xcb\x59\
-\xdc\xf3\xa2\x71\x09\xf5\x16\x56\xcd\x06\xa5\xae\x90\x37\xbd\x47\
-\x46\xe4\x79\xde\x9c\x2a\x01\xaa\x36\x41\x35\x5c\x4d\x8d\xaf\x9d\
-\x16\xb1\x54\x7f\xea\x99\x07\x1d\xff\xfb\x3f\x4a\x2d\x8d\xb0\x32\
-\x54\xf1\x75\x9b\xa3\x56\x6a\x6c\x07\xbe\xe3\xed\xc6\x15\x65\xe1\
-\xc9\xa7\x83\xbb\x07\x0e\x9a\xad\x62\xc1\x70\xf0\xb7\xa4\x96\x7b\
-\xcb\x16\x7d\xcb\x0d\x81\x4f\x5a\xcb\x1b\x3e\x84\x74\x28\x2c\x2d\
-\x32\x44\x9c\x93\x28\xd1\xd4\x1a\x93\x3a\x6e\xdb\x97\xa6\xb6\x56\
-\xac\xad\x69\xab\xe6\xa7\x76\xa7\x95\x04\xe3\xfd\x4f\x7e\xd2\xb8\
-\x84\x5a\x69\xfc\x5c\x5e\x05\x68\x8e\x32\xce\x95\xd0\xfb\x86\xd7\
-\x05\x5d\xd3\xd3\x66\x2b\xca\xfc\x67\xfe\xd0\xb8\x04\x17\xd2\x3d\
-\x69\xb1\xb8\x6e\x21\x67\x72\x4c\xdc\x3c\xdf\x23\x91\xb8\xd2\x23\
-\xae\x9f\xa8\x69\x24\xe3\xe8\x7b\x2d\xde\xe1\xc4\x24\x64\x26\xaf\
-\x3c\xe8\xdc\xf3\x67\x32\x7a\x70\x2b\xa1\xbf\x11\x67\x1d\x6e\xd6\
-\x83\x95\x9e\x3a\xad\x96\x06\x6e\x7d\xfa\xb3\xc6\x55\x3c\x3e\x63\
-\xd5\xf8\xb2\x5a\xd9\x61\xcf\xc3\x9a\x05\xa3\xc4\x42\x1f\xa0\x76\
-\x87\x77\x61\xee\x96\xa6\xc8\x8c\x75\x2e\x36\xcf\xeb\x8e\xa5\xc2\
-\x6b\xbf\x34\xb5\x35\x75\x4e\xa8\x9a\x44\x8d\xaf\x71\x12\xca\xe4\
-\x65\xd0\x2d\xed\x9c\x07\xf7\xff\xec\x8f\x8c\x4b\x68\x3a\x92\xde\
-\x38\x94\x65\x8a\x73\x03\x17\xe9\x4a\xa6\xa5\xa3\xaf\x2f\xe8\xff\
-\xf6\x64\x51\x33\xff\x3f\xff\x57\xb0\x74\xf1\x92\xd9\x6a\x3e\x56\
-\x43\xd8\x90\xb2\x5a\x8b\xa9\x45\xeb\x5b\xb5\x74\x76\x76\xe8\x71\
-\x14\x1b\x52\xd8\xa8\x0b\xec\xde\xb9\x3d\xe8\x7b\xe5\xcb\x83\x81\
-\x6f\xfa\xc6\x60\xed\xeb\x5f\x1b\xf4\xbd\xea\x6b\x82\x9e\xdd\xbb\
-\x82\x8e\xde\x1e\x13\x28\x3f\xea\xf5\x58\xe4\x79\x5e\xf7\xf9\xc9\
-\x29\xde\xd4\xda\x9a\x0e\x6b\x1c\x95\xc2\xd7\xc5\xea\xb1\xc7\x3f\
-\x40\xd3\xeb\x32\x5e\xf7\xfa\xd7\x07\x6f\xfd\x96\x37\x69\x77\x51\
-\x86\xd7\x37\x78\x2d\x06\x3d\xef\x6b\xce\xaa\x9f\x73\x3f\x7f\x4d\
-\x69\x60\x1c\x15\x28\xf6\xfc\x2b\x8f\x5b\x7f\xc6\xfd\xbd\x7f\xb5\
-\xa1\xfb\xd3\x0c\xfc\xd0\x0f\x06\xdd\x8f\xbe\x34\x08\xd6\x64\xfb\
-\xca\xe6\xfe\xfc\xed\xe0\xfe\xad\x5b\x6a\x3d\x1f\x2c\x5d\xba\x1c\
-\x2c\xcd\xcd\xa9\xe5\x62\x70\xf7\xf0\x91\x60\xe9\xfc\x8c\x09\x95\
-\x1f\xa4\x72\xdf\x77\x7e\x5b\xd0\xf7\xa6\x37\x84\x1e\x45\xc3\x2b\
-\xc6\xb3\x0c\xdc\x3d\x75\x26\xb8\xfe\xa1\x5f\x36\x5b\x55\x58\xa3\
-\x94\xd2\xdd\x1c\x46\x2d\xe6\x0d\x98\x72\x79\x95\x9e\xf7\x81\xef\
-\xfb\x6b\xc1\xe8\x87\xff\x85\xd9\x8a\x72\xf1\x7d\x3f\x15\xcc\x7f\
-\x66\x75\x45\xf8\x7d\x55\xee\xd6\xbd\xff\x27\x83\x35\x5b\xb7\x1a\
-\x9f\x32\x15\x53\x7f\x69\x29\xb8\x7f\x5b\x95\xbd\x5b\xf3\xba\x1c\
-\x52\xf6\x74\xf9\xbb\x30\x17\x2c\xee\x3f\x10\x2c\x5d\xb9\x62\x02\
-\x16\x03\xc9\xef\xae\x79\x0f\xf4\x7f\xdb\xdb\x82\x81\xef\xfd\x9e\
-\xa0\x67\xfb\xf6\xa0\x73\xed\x40\xb0\xa4\x9e\x0d\xae\xe7\xc6\x1f\
-\xfd\xcf\xe0\xf2\x6f\xac\xce\xd4\x28\x6b\x36\x6f\xd2\xc2\x65\xe0\
-\xeb\x5f\xad\x85\x4c\xcf\xce\x1d\x66\x4f\x32\x77\xd5\xb3\x7a\xf3\
-\xf3\x5f\x08\x6e\xa9\x85\xf5\xbd\xd9\x0b\x66\x4f\x75\x26\xff\xe9\
-\xcf\x05\x5d\x63\x63\x66\x2b\xa4\xde\x5f\x81\x91\x0f\xb3\xbf\xf1\
-\x9b\xc1\xad\x67\x9e\x35\x3e\x51\x22\xd7\xe6\x6c\xb8\xfe\x3e\xa2\
-\x66\x99\x7f\x24\xae\x65\x4f\xe0\xd5\x6f\x98\x39\x99\xf8\x79\xb7\
-\x88\x1a\x07\xef\xfb\x8a\x27\xaf\x07\x79\xa7\x59\xd6\x34\xf0\x0d\
-\x5e\xd4\xf9\x21\x8f\xb8\xe9\x20\x7c\xff\x1f\x7c\xd4\x6c\x35\x1e\
-\x83\x3f\xf3\x77\x83\xc1\x9f\xf8\x71\xb3\x95\x1f\xf7\xce\x9f\x0f\
-\xee\xbc\xb0\x37\x58\xf8\xb3\x3f\xd7\xcb\xd2\x99\xb3\x66\x4f\x6d\
-\xd8\x14\x9e\xf8\x93\x3f\x0c\xba\x1f\x7c\xc0\x6c\x35\x16\x33\xaf\
-\x79\x6d\x70\xef\xec\x39\xb3\xe5\x41\x9f\xfa\x5d\x7f\x3b\xf1\xf5\
-\xe5\x4f\x8a\xb0\xa9\xf4\xcc\x8f\xff\xce\x6f\x06\x7d\xaf\xfd\x26\
-\xb3\x55\x66\xe9\xea\xb5\xe0\xec\xa3\xaf\x32\x5b\xab\x07\xe3\xe4\
-\xf4\xbf\x25\x7c\x57\xe7\xc9\x9d\x63\xc7\x83\x85\x67\x9f\x0f\xe6\
-\xff\xec\x73\xc1\xfc\xff\xfe\xb3\x60\xe9\xda\x75\xb3\x27\x3f\xe2\
-\xc2\x66\xd3\x9e\xa7\x82\xae\x11\xbe\xe4\x5d\xce\xe1\x57\x7c\x7d\
-\x70\x4f\x89\xae\xa2\x18\xfc\x96\x37\x07\xc3\x7f\xfd\x7b\x83\xc1\
-\xb7\xbc\xd1\xf8\xd4\xc6\xed\xe7\x9e\x0f\xae\xfc\xce\x7f\x0a\xae\
-\xfe\xa7\xff\x6c\x7c\x92\xa1\xd6\x67\xcb\xef\xfd\x07\xb3\xd5\x58\
-\x5c\xfe\xc3\xff\x11\x1c\xfb\xd1\x9f\x30\x5b\x65\x22\x4f\x45\xec\
-\x11\x71\x37\x33\x8b\x1a\x67\xc3\x1e\x9b\x70\xdc\x77\x2b\x61\xb3\
-\xac\x73\x65\xe6\xe6\xa7\x22\x8d\x5e\x51\x34\xd2\xb5\xb4\x2b\xb9\
-\x95\x9b\xaf\x7e\xd1\x38\x1a\x93\xfe\xef\xfe\x0e\xe3\xca\x17\x3a\
-\xa1\x52\xa3\x32\xfc\xcf\x3e\x18\x4c\x7e\xf1\x73\xc1\x88\x32\x5c\
-\xdd\xaf\xfe\x5a\xb3\xb7\x46\x3a\x3b\x1b\x56\xd0\xc0\x9a\xdd\xbb\
-\x8c\xcb\x13\x2b\x68\xfa\xba\xc3\x75\x2d\xe8\xdf\x76\xfe\x74\x6d\
-\xd9\x9c\x28\x68\xe0\x56\x1d\x3a\x08\x77\x4e\x8c\x17\x22\x68\xa0\
-\x7b\xc7\xf6\x60\x50\x95\xef\xf5\xff\xe6\x5f\x06\x5b\x5f\x7c\x26\
-\x18\xff\xd0\xcf\x07\x6b\xb6\x6f\x33\x7b\xf3\x81\xc7\x9f\x85\xd9\
-\x2e\xea\xf5\xda\x5e\xfb\xe6\x37\x04\x5b\xfe\xe0\xf7\x83\x4d\xbf\
-\xf9\xd1\x15\x0b\x1a\xe8\x7b\xc5\xcb\x83\xe9\x0f\xff\x8b\x60\xd7\
-\x53\x5f\x0c\xc6\xdf\xff\x93\xc6\x77\x39\x3d\x0d\xfc\x2c\xf6\xbf\
-\xe4\x61\xe3\xf2\xc3\xcd\xba\x5a\x2a\x01\x3c\x49\x6c\x82\xaa\xa9\
-\x4f\x8d\x90\x8d\xbc\x85\x60\xbb\x8a\x34\xdd\xf4\xf4\x07\xcf\x9b\
-\xad\xc6\x24\xed\x0b\x98\xbc\xe9\x7b\xf3\x1b\x83\xf1\xff\xf6\x7b\
-\xc1\xf0\xaf\xfe\x4a\xb0\xe6\xd1\x97\x19\xdf\x6c\xd0\x17\xa4\x91\
-\xe9\xe8\xeb\x35\xae\x8c\xdc\xbe\x13\x04\xbd\x35\xf6\xc6\xc0\x9a\
-\xc6\x46\x1d\xae\xf4\x52\x4e\xeb\x4b\x03\xf3\xab\xd8\x41\xd8\xd2\
-\x35\x3d\x65\x5c\xc5\x33\xf4\x37\xfe\x7a\xb0\xf9\xf3\xff\x3b\x18\
-\xfb\x27\x3f\x17\x74\x6d\xdc\x60\x7c\x57\x88\x4a\x7a\x52\x9b\x26\
-\x97\x15\xd6\xb9\x65\xa7\xbb\x3b\x98\xfc\xf9\x7f\x1c\x6c\xfe\xad\
-\xdf\xd0\x4d\x4d\x79\xb3\x46\xe5\xcd\xc4\xdf\xfb\x40\xb0\xed\x8f\
-\x3f\xa3\x9b\xb1\xe2\x74\x36\xf0\xf3\x98\xd7\xb5\xe5\x6c\xb9\x12\
-\x07\x86\x6a\x18\x51\xe3\x6b\xa7\xdb\xd5\xa0\xaf\x84\xbc\xd3\xb6\
-\x6e\x79\xf0\xe5\xd5\x37\x12\x8d\x0e\x7d\x0e\x26\x3e\xfb\xdf\x83\
-\x75\xff\xe2\x9f\x18\x9f\xea\xd8\xdc\xa3\xdf\x44\x23\xb3\x74\x73\
-\x05\xd7\xb7\xa0\x4c\x22\x7d\x6d\x6a\x21\x43\xf1\x4e\xfb\xea\xe9\
-\xce\xd1\x63\xc1\xc2\x97\xbf\x6a\xb6\x5a\x9b\x75\x3f\xf4\x83\xc1\
-\x96\xaf\x7c\x3e\x18\xfe\xc9\xe5\xcd\x13\xb5\x92\xad\xbe\x6c\xe5\
-\x50\x0b\xb5\xf5\x0f\x7e\x3f\x18\xfd\xa1\x1f\x30\x3e\xc5\xd1\xf7\
-\xb2\x47\x82\xad\x9f\xfc\xcf\xcb\x84\xcd\xd2\xcd\x1b\xc6\xd5\x78\
-\x2c\xdd\xbc\x69\x5c\x65\xf2\xb4\x02\xd5\xe2\x4a\xdb\xff\xa5\xa9\
-\xad\xdf\x65\x9c\x25\x5a\xbe\xa6\x26\x6f\x43\x5d\x60\x55\x5a\xdb\
-\x53\x35\x0f\x1a\xbc\xe9\xa9\x9e\x0c\xa8\x5f\xcd\xa3\xbf\xf7\x3b\
-\x41\xe7\xa6\x8d\xc6\xc7\x8f\x85\x2f\x7c\xc9\xb8\x1a\x0b\x5e\xa2\
-\x8b\x4f\x3e\x65\xb6\x6a\xe3\x3e\x9d\x87\xd7\xd4\x50\x63\x43\x6d\
-\x8d\x07\xdd\xaf\x7c\x85\x9e\x1a\x21\x89\x7a\xd4\xd2\xd4\x9b\xd1\
-\x9f\xfe\x3b\xc1\xc4\xbf\xfc\x45\xb3\x55\x3b\x19\x5b\x00\x57\x4c\
-\xdf\x2b\x1e\xd5\x82\xa6\xff\x6b\x5e\x61\x7c\xfc\x59\x3c\x71\x32\
-\x58\x38\x74\x38\xb8\x9b\xa1\x33\x30\x74\x74\x77\x07\x13\x3f\xfd\
-\x77\xcd\x56\xc8\xfc\x57\x9f\x34\xae\xc6\xe3\xfa\x17\xbf\x6c\x5c\
-\x29\xe4\x69\x16\x9d\xb8\xaa\xd9\x5b\xb5\x77\x99\xa8\xc9\xd4\x51\
-\xf8\x5b\x3d\xdb\x17\x6b\xf9\x25\xef\x7b\x48\xd6\xb8\xbd\xc5\x8a\
-\x6f\xb8\x2a\x89\x9c\x84\x4f\xdc\x79\x5f\xa7\x8b\xef\x21\x45\x5d\
-\x43\x6e\xf1\xbe\x4d\x95\xbf\x06\x1f\x45\x78\xfa\x44\xfa\xc8\xb1\
-\x17\xbf\xfb\xfb\x82\xe0\xde\xf2\xaf\x74\xee\xdf\xbd\xa3\xd7\x1d\
-\xdd\x3d\x41\xd0\xd3\x13\x74\x4d\xae\x0f\xba\x94\x38\xe9\xda\xbd\
-\x2b\xe8\x79\xd5\xd7\x04\x6b\x76\xed\xd4\xfb\x7d\xb8\x37\x33\x1b\
-\x5c\xfd\xdb\x7f\x3f\x58\xfc\xbf\xe9\x02\xd0\x4d\xe5\x8e\xfe\xfe\
-\xa0\x37\xa5\x4f\x48\x22\x5d\xea\x77\x50\xa7\x12\x0a\xac\x3b\x3a\
-\x83\xd1\x5f\xf9\x25\xb3\x63\x39\xd7\x3e\xf4\xcb\xfa\x7a\x2c\x1d\
-\xbd\xdd\xc1\xfd\x85\xf0\x5e\x23\x2c\xa9\x34\xb9\x77\x2f\xb8\x8f\
-\x98\x58\x52\xaf\x1f\xb5\x7d\x67\xff\xc1\xe0\xde\xb1\xe3\x26\x40\
-\x6d\xd8\xfb\x5c\xa9\x8d\x4c\x7b\xe6\x87\x7f\xee\x1f\x06\x83\x3f\
-\xfa\x43\x66\x2b\xca\xcc\x1b\xbe\x35\xb8\x73\xf8\x88\xd9\x5a\x3d\
-\xba\x5f\xf6\x48\x30\xf5\x47\x9f\x32\x5b\x51\xf8\x72\xe8\xfc\xf7\
-\xfd\x4d\xb3\xe5\xc0\x73\x77\xe7\xae\xca\xd7\xce\xa0\x43\x95\xbf\
-\xa0\xa7\x3b\x58\xb3\x71\xa3\x5a\x36\x04\x3d\x8f\x3c\x1c\xf4\xbe\
-\xfa\x6b\x83\x35\x1b\xfc\x9b\x97\x6e\x3f\xf5\x74\x30\xf7\x81\xbf\
-\x1f\xdc\x5d\x41\xfe\xd9\x57\xc1\xd6\x17\x8a\xed\x28\xdc\xfb\x92\
-\x87\x82\xcd\xff\xf1\xe3\xba\x69\xa8\x1a\x77\x4e\x9d\x0e\xae\xff\
-\xd1\x1f\xeb\x65\xf1\xc8\x91\x60\xe9\x72\xf9\x6b\x30\x5b\x42\xd6\
-\xa8\xe7\xb6\xff\x6b\x5f\xa9\x97\x75\xdf\xf5\x1d\xc1\x1a\xf5\x2c\
-\xa7\x71\x4f\x1d\x7f\xf8\x65\xd1\x8e\xe4\xbd\x8f\xbe\x2c\xe8\xde\
-\xbc\x49\xbb\x79\x1f\x86\xcd\x70\xc9\xe5\x0f\xf5\xd7\x61\x9e\xc5\
-\x8e\xae\xae\x60\xed\xab\x5f\x15\x4c\xbc\xeb\x6f\x99\x9d\x51\x6e\
-\x2b\xe1\x35\xf3\xff\x95\x3f\xb0\x48\x7b\x26\xf4\x3b\x98\xaf\xe0\
-\x9c\xe7\x71\x49\xb9\xaf\xfe\x8f\x3f\x36\x21\xca\x44\xae\xca\xd9\
-\x70\xfd\xe3\xcf\x4e\x74\xab\x4c\x7a\x5c\xe1\x46\x85\xe3\xae\xfe\
-\xe5\xd8\x57\x50\x4d\x25\x6a\x6a\x8b\xd7\xef\x18\xef\x70\xa9\xc9\
-\x9b\x4c\xee\xe7\xaf\x29\x0d\x8c\xa3\x0a\x45\x5d\x43\x1e\xf1\x32\
-\xe0\xde\xd2\x8f\xfc\xbf\x66\xab\x71\xa9\x24\x6a\xce\xef\x54\xbf\
-\xea\xd5\x0b\x22\x2b\x5d\xdb\xb6\x06\x7d\xdf\xfa\x96\xa0\xff\x1d\
-\x7f\xcd\x5b\xe0\x5c\x7a\xd7\x8f\x05\x8b\x7f\xf6\xe7\x66\x2b\x4a\
-\xb6\xdc\x4b\x87\xec\xda\x78\x32\xfd\x7e\x67\x5f\xff\xad\xc1\xdd\
-\x23\x47\xcd\x96\x7a\xb9\x0c\xf6\x05\xf7\x6f\xdc\x36\x5b\xc5\x63\
-\xef\x53\x4f\x85\x70\x2f\xe3\x5d\xf3\x36\x54\x87\x54\x7a\xde\xa7\
-\x9f\xfc\xa2\x16\xa0\x71\x16\xbe\xf2\x44\x70\xe1\x7b\xff\x86\xd9\
-\x5a\x5d\xaa\x89\x9a\x93\x0f\x3e\x6a\xb6\xaa\xa3\x0d\x42\xe8\x0c\
-\x7a\x94\xb1\xed\xff\xd6\x37\x07\x43\xef\xfa\xc1\xa0\x73\xdd\x90\
-\xf1\x4d\x07\x83\x7d\xee\xdb\xbe\x3b\xb8\x7b\xf2\x94\xf1\xc9\x0e\
-\xe5\xab\x92\xa8\x39\xa2\x44\xcd\xdd\x15\x8a\x9a\x6d\xff\xf3\xd3\
-\x41\x1f\xc3\x2f\x54\x60\xf1\xf8\x89\xe0\xc2\x07\xff\x79\x70\xe3\
-\x7f\xfd\xa9\xf1\x89\x92\x5c\x42\x18\xa9\xba\x23\x18\xfa\xb6\xb7\
-\x06\xa3\xef\xf9\xb1\xc4\x5a\x20\x84\xc3\xc1\xad\x0f\x9a\xad\xe5\
-\xf0\x3e\xbc\xa3\x16\xdf\x37\xc6\xc8\x77\x7e\x5b\xb0\xfd\xa3\xff\
-\xd6\x6c\x45\xb9\x7d\xf0\x50\xb0\xff\x75\x6f\x09\x37\xaa\x3c\x0a\
-\xee\xee\x4a\xe5\x3f\xb2\xc7\xd9\x48\x3b\x3e\x3d\xa6\x4a\x71\x55\
-\xb6\xb8\x66\xdf\xd7\x28\x61\x53\xfa\xde\xbc\x21\x9a\x9f\x2a\xd8\
-\x32\x61\x85\xf8\xa6\x6d\x51\x82\x26\x2f\xee\xbf\xd0\xb8\x55\xb3\
-\x45\x73\xef\xc4\xc9\xe0\xe6\xc7\xfe\x5d\x30\xa7\x7e\xfd\x5f\xff\
-\xc5\x7f\x19\xdc\xbf\x93\x50\xdb\x11\x63\xf8\x17\xfe\x69\xd0\xb9\
-\x7e\xc2\x6c\x95\x59\xcd\xdc\x5b\x56\x56\xea\x53\x74\x94\xf1\x50\
-\x27\xce\xda\xa6\x51\xe5\x5a\xfb\xde\xfc\x86\x44\x41\x03\xf3\x9f\
-\x6e\xbd\x69\x11\x16\xf7\xbc\x10\x5c\xfd\xa5\x7f\x15\x9c\xfd\xc6\
-\xd7\x07\xd7\x3f\x5e\xfd\xb3\xe3\xae\xd1\x91\x60\xfc\x17\xff\xb9\
-\xd9\x2a\x86\x8c\x39\xba\x8c\xf5\x3f\xfb\x33\x55\x05\xcd\x65\x75\
-\xaf\xc7\x5e\xf7\x2d\xa9\x82\x26\x0d\x8a\x0f\xe6\xf8\xfa\x67\xff\
-\x47\x70\xf2\xdb\xbe\x27\x38\xf7\x77\x7e\x5a\x09\xb0\xb9\x70\xa7\
-\xe1\xfe\xdd\xbb\xc6\x95\x4e\x5e\x8f\x4c\xde\xef\xed\x3c\x63\x8b\
-\xc4\x95\x21\x62\x27\xe8\xeb\xcc\x5a\xd3\xd2\x7d\x6a\xf2\x36\xd4\
-\x95\x35\xa3\x90\x44\x6e\x79\xf0\xc2\x0b\xc6\xd1\xde\xdc\xfc\xd5\
-\x8f\x06\x17\xbe\xe9\x8d\xc1\xed\xff\xf9\xbf\x8c\x4f\x32\x7c\x85\
-\xb5\xee\x17\x7e\xde\x6c\xd5\x89\x58\x9e\xde\xa7\x89\x63\x95\x58\
-\x56\x9a\xd6\xac\xd4\x04\x46\xe9\xff\x8e\x6f\x33\xae\xe5\xb4\xd2\
-\x5c\x4f\xa4\xa3\xbb\xdc\xbb\x72\x25\xb8\xf4\x73\xff\x24\x38\xf7\
-\xed\xdf\x13\x2c\xee\xdd\xa7\x7c\xd2\xe9\xff\xc6\x6f\x08\x46\xff\
-\x9f\x9f\x36\x5b\xf9\xb3\x92\x1c\x65\x30\xbd\xb1\x9f\xf8\x31\xb3\
-\x95\xcc\xec\xcf\xff\x42\x30\xfb\xb3\x1f\x0c\x02\x8f\x1f\x11\x2e\
-\xd1\xda\x89\xd0\x7d\xed\xf7\xfe\x6b\x70\xec\xaf\xbc\x29\xb8\xfa\
-\x7b\xff\x45\x6f\x03\x83\xf4\x55\xc2\xa6\x79\x2e\x78\xbe\x87\x6b\
-\xc2\x89\x3a\xcf\xb3\x64\xb0\xb7\xb5\x8a\x1a\xbf\x13\xe4\xad\x08\
-\x9b\x99\xdc\x45\x55\x1b\xa7\xed\xfd\x3f\x59\xfd\xfe\x09\x8d\xca\
-\xd2\xb9\xf3\xc1\x95\x77\xff\x64\x30\xff\x07\x9f\x36\x3e\xc9\x30\
-\xae\xcd\xe0\xfb\x1f\x33\x5b\x75\x20\x5e\x5e\xef\x66\x6f\x7a\xcb\
-\x8b\xfb\x77\x96\xf7\x65\xaa\x0a\xe3\xf4\x27\xd0\xb1\x76\x6d\xaa\
-\xa8\x99\xff\xc3\xff\x51\xf8\xc8\xbb\x8d\xc0\xe2\xb3\xcf\x07\x33\
-\x7f\xe3\x9d\xc1\xc2\x53\x4f\x1b\x9f\x64\x86\xdf\xf3\x63\xc1\xda\
-\xef\x4c\x17\x80\x2b\x81\xdc\xa9\x45\xd8\xd0\x6f\x68\xf2\x83\x95\
-\x9b\xb2\xe7\x7e\xf9\x5f\x07\x97\x7f\xed\x37\xcc\x56\x3a\x95\xde\
-\xc8\xf1\x7d\x4b\xd7\xaf\x07\xe7\xff\xce\xcf\x04\x67\xdf\xfb\x7e\
-\x33\x20\xdf\xef\x9a\x3d\xc9\x70\x7c\x6e\x6f\x7c\x5f\x1b\x63\xd6\
-\x79\x10\x15\x77\x85\xd2\x58\x35\x35\xbe\x76\x5a\xc4\x52\xfd\xa9\
-\x57\x1e\xe8\x09\x2c\x85\x65\x5c\x7d\xff\xdf\x0d\x6e\xfd\xee\xef\
-\x9b\xad\x64\x06\x3f\xf0\x58\xe6\x2f\xa2\x72\x23\x5e\x5e\x56\xfb\
-\xb3\x96\x38\x59\x4f\x9f\x52\xdc\xfb\xbf\xe3\xed\xf4\x41\x34\x5b\
-\x51\x6e\x7d\xfa\x0f\x8b\x7e\x81\xd7\x0d\x2b\x22\xec\x72\xff\xe2\
-\xa5\x60\xf6\x6f\xbc\x2b\xb8\x5d\xa1\x53\x3a\x8c\xfc\x9d\xf7\x1b\
-\x57\x36\x7c\x8a\x8b\x47\x90\x65\x8c\xbe\xfb\x47\x82\x9e\x5d\xe9\
-\x53\x1d\x5c\xfe\xed\x4f\x04\x17\xff\xe5\xbf\x31\x5b\xf9\x73\xfd\
-\x53\x9f\x09\x4e\xbc\xed\xbb\xbd\x44\x53\x6e\xd8\x67\x31\x43\xe1\
-\x6c\x84\x96\x09\xcf\x2b\x18\xfe\x82\x33\xc1\x65\x4b\x37\x3f\xe5\
-\x49\x23\x64\x70\x56\x5a\x45\x30\xde\x3f\x76\xc0\xb8\x84\x38\xd7\
-\xfe\xc1\xff\x1b\x2c\x3e\x9d\x3c\x27\x8b\x65\xed\xbb\xc2\xb1\x37\
-\x56\x3f\x97\x63\x67\xec\xc9\x36\x17\x56\xee\xf0\xc5\x56\x16\x52\
-\x2c\xe6\x40\x4a\x2d\xcd\xbd\xcb\x97\x83\xdb\x09\x5f\x89\x34\x33\
-\x56\xc0\xa4\x89\x07\xc6\x3a\xba\xf8\x81\xbf\x57\x71\xca\x04\xc6\
-\x80\x59\xfb\xd7\xbe\xdb\x6c\xe5\x47\xad\x1a\x79\xe4\x07\xd2\x3b\
-\x71\xd3\xc1\x79\xee\x17\x3d\xe7\x1c\x6b\x26\x72\x7c\xc7\x47\x62\
-\x5a\x61\xb4\xb5\xc6\x95\x10\xb4\x18\x51\xd3\x48\xc6\xd1\xf7\x5a\
-\xa4\x06\xa8\x38\x72\xcb\x83\xe3\xd2\xf4\x54\x89\xeb\xff\xb4\x72\
-\x87\xcc\x81\x77\xfe\x40\xd0\xe1\xf1\xc5\x4a\xd1\x74\x64\x15\x15\
-\x35\x92\x5a\x9a\xb2\x3e\xeb\x9d\xcb\xaf\x97\x2f\xd1\x7a\xbf\xf1\
-\x1b\xcc\x56\x94\x56\xec\x20\xec\xc3\xbd\xf3\x33\xc1\xe5\x2a\x65\
-\x70\xdd\xbb\x7e\xd0\xb8\xf2\xa3\x96\x57\xf7\xba\xef\xfd\x9e\xa0\
-\xbb\x42\xcd\xe5\xdc\x2f\xfe\xcb\x60\xe9\xca\x55\xb3\x55\x0b\x35\
-\x5c\x54\x0a\xf9\xc5\x54\x5b\x5a\x65\x25\xd7\xeb\xcd\x10\x9b\x09\
-\x29\x35\x35\x45\x93\xb7\xa8\x6a\x6b\xf1\xe5\x8c\x75\x22\x2c\xe7\
-\xce\xd3\xcf\x06\x37\xfe\x55\xf2\xa7\x9c\xd0\xd1\xdb\x13\x0c\x98\
-\xda\x9a\xbc\x69\xaa\x72\x99\xc3\xa5\xa6\xd5\xd2\x40\x2b\x75\x10\
-\x86\x2c\xc9\x75\xf3\xf7\xfe\x4b\x70\xeb\xb3\xe9\xb3\x91\xf7\xbe\
-\xe2\xd1\x60\xe0\x5b\xde\x6c\xb6\xf2\x23\x6b\x96\x8e\xfc\xad\xef\
-\x37\xae\xe5\xdc\xde\xf3\x62\x70\xe5\x3f\x7c\xc2\x6c\xd5\x4e\xa5\
-\x9a\x2d\x5f\x0a\x79\xae\xaa\x44\x99\xe7\x19\x57\xb1\x3f\x8d\xa5\
-\x31\x44\x8d\x6f\xbe\xb5\xb5\x41\xaf\x91\xbc\xd3\xb6\x9e\x79\x20\
-\x9d\x84\xab\x73\xf3\xdf\xfd\xa6\x1e\xf7\x22\x8d\x81\xbf\xfe\x7d\
-\xc6\xd5\xc6\x78\x8e\x14\x5c\x22\xa1\xcc\xd3\x9f\x26\x89\x3b\x07\
-\x0f\x05\x8b\x5f\x7d\x72\xb5\x5e\xe0\xab\x06\xf7\x93\xb4\x24\x51\
-\xed\x53\xef\xc1\xef\xfd\x1e\xe3\xaa\x0f\x03\x7f\xe5\x2f\x07\xfd\
-\x15\x26\x81\xbd\xfe\xa9\xda\x47\x81\xb6\x42\x86\xb1\x69\xf8\xb3\
-\x7e\x0d\x43\xc6\xf7\xf7\x6a\x74\xb7\xa8\x76\x86\x8c\x57\x2c\x35\
-\x35\xe0\x6d\xd0\x57\x21\x83\x85\x64\x3a\xce\x8b\xa0\xf1\xe1\xfe\
-\x8d\x9b\xc1\xfc\x7f\xfd\x03\xb3\xb5\x1c\x3d\x42\xf1\x8e\xed\x66\
-\x2b\x47\xea\x28\x76\xb3\x92\xf9\x4a\x63\x9d\x36\x7a\x94\x41\xec\
-\x7e\x28\x79\xb0\xb4\xf9\xcf\xa4\xd7\x52\xb4\x12\xd6\x78\x27\xb1\
-\xa0\x44\xdd\xc2\x73\x7b\xcc\xd6\x72\x7a\xff\xd2\xd7\x1b\x57\x3e\
-\x64\xcd\xcf\x81\x6f\xfe\x46\xe3\x4a\xe6\x5a\x0d\x53\x5b\xa4\xa5\
-\x87\x15\x36\x2b\x21\xd7\x1f\x92\x39\xc5\x15\x89\x25\xc7\xcb\x73\
-\xe3\xaa\x66\x6f\xdd\xbd\x8e\x7b\xf8\x0b\x53\x5b\xf4\xc8\xc2\xb9\
-\x89\x9a\x46\xaa\x4d\x69\xa4\x6b\x69\x57\xbc\x05\x63\x95\x70\x1d\
-\x17\x4e\x1a\x97\x50\x8d\x4a\xa2\x06\x7a\x0a\x98\x79\x38\xaf\x97\
-\x65\x5e\x54\xba\x9a\xcc\x66\x26\xf6\x49\x77\xa3\xcd\xc8\xdd\x88\
-\xdc\xfc\xaf\xff\xdd\xb8\x96\xc3\xc8\xc0\x8c\x4c\x5c\x2f\x06\xfe\
-\x72\x72\x5f\x28\xb8\xf1\x7f\x3e\x17\xdc\x3d\x73\xd6\x6c\x35\x06\
-\xf9\x3e\x59\xc5\x3e\xa7\x6e\xec\x75\xac\x04\xd0\xb5\x35\xd2\xa7\
-\xa6\x00\xf2\x32\xe8\x96\x76\x16\x69\xf2\xe5\x93\x3f\x77\xbe\xfa\
-\x44\x70\xf7\x44\xba\x08\x6c\x07\x51\x93\x2b\xb1\xe6\xaa\xb4\xa6\
-\xa7\x85\x2f\x7d\x45\xcf\x73\xd4\x0e\x4f\x69\xb5\x7b\xbc\xf5\xc9\
-\xcf\x18\x57\x32\x7d\x45\x94\x41\x0f\x3a\x07\x07\x2b\x4e\x58\x79\
-\xab\x80\x89\x5d\x57\x5a\x5b\x93\x6b\x79\xaa\xd2\xf4\xea\xee\xcd\
-\x53\x94\xe4\x7a\x0f\xd5\xd1\x55\xd1\x75\x13\x35\xbe\xef\xc2\x76\
-\x36\xe8\xb5\x92\x77\xda\xd6\x35\x0f\x6e\xa6\x7f\x2a\x2a\x2c\xe7\
-\xee\x0b\x2f\x1a\xd7\x72\xea\x2e\x6a\x9a\xed\x51\x76\x26\x1f\xed\
-\xfb\x96\x37\x07\x5d\xe3\xe3\x66\x2b\xca\xad\x36\xab\xa5\x21\x1b\
-\xed\x12\x87\x81\x07\xef\x54\x98\xc8\xb2\xf7\x2f\x7d\x9d\x71\xad\
-\x2e\xbd\x2f\x7b\xc4\xb8\x92\x59\x78\x61\xaf\x71\x35\x06\x69\xe9\
-\x5b\x33\x39\xbc\xc3\xf3\xbc\x9e\x6a\x71\x65\x3b\x57\x29\x74\x7d\
-\x45\x4d\x51\xe4\x6d\xa8\xa5\x3f\x4d\x71\x78\xe5\xc1\xf1\x63\xc6\
-\x21\xf8\x70\x67\x4f\xba\xa8\x59\xb3\x75\x6b\xd0\x39\x3e\x66\xb6\
-\x56\x9f\xa2\xa7\x49\xc8\xfd\x49\x75\xca\x67\xc5\x69\x11\xda\x50\
-\xd4\x24\x81\x3f\xcb\x62\x05\x61\xdd\xfb\xca\xf4\xda\x92\x22\xe9\
-\x7b\x59\xe5\x39\x9e\x6e\x57\xb8\xe6\xd5\x86\xf7\xa2\x4d\xcb\xbc\
-\xc8\xdd\x8e\xe5\x7b\x71\x25\xaa\x5d\xa7\xbb\x37\x21\x64\x7e\x7d\
-\x6a\xea\xfa\x4b\xbe\x49\xc9\x5b\x7c\x35\x12\xb9\x5e\xf3\x8d\x9b\
-\xc6\x21\xf8\x70\xa7\xca\xcb\xb9\x73\x74\xd4\xb8\x72\x22\x4b\x5e\
-\xd7\x71\x9a\x84\x95\xc0\x18\x3f\x03\xdf\xfe\x36\xb3\x15\x45\x8f\
-\x20\x7c\xfd\x86\xd9\x6a\x0f\x6c\xa3\x8a\xdb\xb8\xe2\x96\x02\x26\
-\xbf\x4c\x23\xf7\xf2\xe7\x49\xcf\xee\xf4\xd9\xed\x17\x8f\x1d\xaf\
-\x69\x6c\x9a\x22\xdf\xcc\xb9\xc7\x5d\xe1\x39\x5d\xe9\xb9\xdc\xe3\
-\xeb\x5c\x09\x50\xbf\x3e\x35\xbe\xef\xc1\xb6\x37\xe8\x82\x90\x91\
-\x7b\x15\xaa\xfe\xa1\x63\x44\xff\x98\xc9\x8f\x16\x2e\xee\xf6\x05\
-\x5d\x71\x6c\x1a\x53\x4b\xd3\x6e\x4f\xbd\x15\x34\xdc\xb7\xbd\x77\
-\xfc\x58\xee\x1e\x3b\xa1\xb7\x93\xe8\xec\xeb\x0d\x3a\xfa\xfb\xcd\
-\xd6\xea\xd1\x95\x30\x63\xbd\x65\xf1\x68\xf6\xda\x60\xdf\xfc\xb6\
-\xfd\x6a\xb2\xda\x85\xdc\xed\x88\x67\x74\x79\x8a\x92\x5a\x63\xca\
-\x98\x52\x66\x5d\x46\x3a\x0a\xb7\x18\x79\x0b\xc6\x7a\x8b\xb4\xfb\
-\xcf\x9c\x36\x2e\xc1\x87\xa5\xab\x95\x7f\x71\x76\x8e\x0c\x1b\x57\
-\x4e\x64\x29\x1f\x75\x2c\x4b\x1d\xbd\xb5\x4f\xd1\x90\xd6\x41\xf8\
-\xde\xdc\xc5\xe0\xf6\xff\xfa\x53\xb3\xd5\x3e\xb8\x35\x34\x56\xc8\
-\xb8\x7e\x4b\x57\xaf\x19\x57\x32\x9d\x79\x0b\x6b\x0f\xd6\x4c\xa4\
-\x8b\x1a\x26\x9a\x6c\x34\x72\x7f\x52\x56\xf8\xec\xe5\x79\x3d\x91\
-\xb8\x32\x44\x5c\x2d\xa8\xbd\xc5\x96\x12\x35\x79\x1b\xea\x3a\x57\
-\xa5\x35\x25\xb9\x8b\xa5\xb9\x05\xe3\x10\x7c\xa0\x29\xa4\xd2\x20\
-\x7c\x9d\xa3\x79\x1b\x94\x0c\xcf\x48\x81\x8f\x53\xd5\xa8\x17\x6a\
-\xeb\xcf\xb3\x66\xe7\x8e\xa0\xf7\x35\x7f\xc9\x6c\x45\x91\xcf\xb8\
-\x93\xa9\x36\x4b\x79\x57\xee\x65\xb0\x3a\x5d\x63\xe9\xcd\x5e\x95\
-\xe6\xad\xaa\x86\x4f\x91\xae\xf7\x0f\x43\x4d\x9e\xd7\xe0\x44\x95\
-\xe7\x9d\x65\xb1\xb7\x29\x21\x5f\xcb\xbf\x15\x8b\x9a\x86\xc8\xb0\
-\x06\x21\x6f\x83\x2e\x69\x2b\xd4\xc2\xfd\x0a\xb5\x35\xf5\xea\xd3\
-\xa0\xa9\xd3\x2c\xdd\x1d\x6b\xb2\xbf\xe6\x3a\xc6\x06\xf4\x5a\x3a\
-\x08\x2f\x87\xb7\x52\xa5\x37\x53\xd5\xda\xc2\x3a\x88\x9a\xce\x81\
-\x30\x3f\x93\xb8\x77\xa3\xf8\x3e\x51\x69\xb3\xba\xa7\x91\xf7\x9b\
-\x3f\xcd\x96\xe4\x79\x1e\x57\x94\xe4\x7d\xfd\x59\x58\xf5\x9a\x1a\
-\x5f\x3b\x2d\x06\xbd\x38\x44\x54\xb5\x36\xf7\x17\x17\x8d\x2b\x81\
-\x9c\x85\x45\xb6\x32\x52\xa7\xf2\x74\xb7\xfc\x69\xb6\x2f\x4b\x97\
-\xc2\x0e\xea\xa9\xd3\x22\xec\x3f\x50\x9a\x1d\xbd\x9d\x9e\x12\xee\
-\xd5\xde\xaf\xeb\x76\xa9\x58\xfe\xa0\x0e\xe2\xb6\x63\x6d\xba\xa8\
-\xc9\x5a\x53\xc3\x3d\x73\x07\x76\xc9\x9b\xb4\x74\x2d\x9a\xd5\x68\
-\x99\xa8\x76\x86\x6c\x57\x90\x1c\x5a\xfa\xd4\xa4\xd0\x8c\x4d\x4f\
-\xa2\x41\x04\xe8\x18\x1c\x34\xae\xe5\xdc\x9f\x9f\x37\xae\x9c\x68\
-\xf0\x42\xd7\xd1\xdd\x65\x5c\x19\x30\xc7\xf4\x7c\xfd\xd7\x05\xdd\
-\xbb\x77\x69\x77\x9c\x76\x1b\x9b\x06\xdc\x9c\xc6\x9d\xb6\x30\xd0\
-\x5d\x25\xee\xdf\xca\x50\x06\x73\x2a\x5f\x1d\xdd\x3d\xc6\x95\x40\
-\x46\x91\xb5\x1a\x92\x2c\x9f\xbb\x76\x58\x41\x3a\x46\x8e\xcc\xf3\
-\xc2\x32\xc4\x55\x2d\xa8\x7b\x7b\x2b\x12\x35\x8d\xf4\x4b\x5e\x6a\
-\x1f\xea\x4f\xee\x79\x20\x79\x55\x13\x95\x8c\x4a\x26\x83\xe2\x43\
-\x03\xe4\x51\xda\x15\x74\xf4\xa8\xd7\xdb\x9d\x1a\x3e\x23\x37\xf7\
-\x94\x56\x4b\x03\xed\x32\xd7\x93\x0f\x6e\xfa\x63\xf0\x3b\x87\x86\
-\xc2\x8d\x14\x96\xf2\x16\xd6\xff\x7f\x7b\x67\x02\xa7\x49\x51\xde\
-\xff\x9a\x6b\x67\xf6\x64\xef\x65\x01\xe5\x54\x17\xe5\x32\xca\xa1\
-\x88\xc1\x03\xf1\x24\x12\x11\x71\xc1\x78\xfc\xff\xea\x5f\x12\x15\
-\x4c\xd4\x44\x63\x04\x4c\x4c\x3e\x49\x8c\xe2\x85\xa2\x26\x2a\x4a\
-\x14\x11\x41\xa3\x08\x18\x61\x39\x75\x39\x76\x57\xe4\x86\x65\xef\
-\x7b\x76\x66\xe7\x7e\xdf\x99\x79\xe7\xdf\x4f\xbf\x55\x33\xf5\xf6\
-\xdb\xc7\x53\xfd\x3e\xf5\x76\x57\xbf\xcf\x77\x29\xba\xba\xbb\xde\
-\xea\xaa\x7a\xea\xf8\x4d\x75\x75\x37\x82\xb8\x75\x3e\x1d\x09\xe9\
-\x6d\x26\xd0\x37\x9a\xcf\x2b\x22\xb0\xd0\x4e\x29\x63\x24\x58\x4f\
-\x33\x0d\xcf\xd4\x10\x41\x3d\xa0\xa3\x07\x7e\x86\xd1\x68\x9b\x9f\
-\xf0\x57\x32\xf5\xfa\x01\x93\x7a\xda\xc4\x2a\xdd\x36\xa7\x53\x88\
-\x72\xba\xe1\x61\x4a\xbe\x4f\x67\x4e\x84\xa8\x19\xbb\xeb\x1e\x31\
-\x19\xf3\x39\x8a\x56\x43\xcd\x5c\x4c\x6f\x93\x66\x6a\x86\xe9\xde\
-\x3d\x85\x9d\x35\x99\x8c\x5b\x67\xb6\xc0\xae\xa8\xc9\x7a\x3d\x8d\
-\x4f\x48\x3b\xd5\x8f\x34\x7a\x67\x22\x2f\xeb\x69\x80\xa6\x8a\x1a\
-\x6c\xff\xc7\x03\xba\x39\xd4\x65\xcb\x36\x70\x93\xb6\x84\xbf\x3a\
-\x27\xf7\xed\x93\xbe\x0c\x30\xeb\xdb\x53\xd3\xbe\xb0\x47\x88\x91\
-\x94\x6f\x2f\x96\x1f\xb1\x9c\xfd\xa6\x37\x44\x3e\x7a\x3c\xfa\x8b\
-\x5f\x4a\x9f\xd7\x4e\xe4\x96\x84\x9c\x35\xb9\x38\x73\xc1\xb9\xa0\
-\x53\xb4\x27\x08\xeb\xc9\x3d\x7b\xa5\xaf\x79\x4c\xc6\xbc\x5c\x0f\
-\x66\x96\xf4\xf4\x67\x8d\x95\xbe\x37\x07\xfd\x79\x52\x0a\xcc\x52\
-\x38\x13\x3a\x98\xb5\x42\xcc\xd4\x50\x0f\xd4\x2e\xae\xa7\x29\x1c\
-\x39\x68\x84\x2e\xd2\xb1\xf2\x60\xe9\x0b\xa7\xb2\x97\x58\xd4\x18\
-\x99\x89\x7e\xe8\x08\x5e\xbe\xfd\xa0\x39\x62\xaa\x7f\x4c\xee\x99\
-\x33\x55\xa9\xce\xee\xcc\x8e\x78\x83\x30\x3c\x2e\x3f\xfa\xf3\x19\
-\x51\x43\x4a\x9e\x46\xd6\x00\x7a\x39\x2b\x11\xa3\x5c\x90\x8e\x83\
-\x57\x48\x5f\x3d\xf0\x4e\x98\xa9\xb1\xf4\xf6\x49\x4b\xdc\x1b\x83\
-\x6d\xcf\xd4\xe4\x81\xb4\xbd\x69\xcd\xef\xd2\x46\x12\x86\x16\x57\
-\xd2\x78\xab\x9f\x4d\x4a\xc2\xb5\x0b\x96\x1c\x91\x5a\xd4\xf0\x5f\
-\xf2\xf6\x70\xb1\x6c\xa9\x85\x25\x93\x8e\xae\x13\x8e\x97\xbe\x70\
-\x26\x77\xed\x96\x3e\x22\x4c\xec\x29\x67\x41\x6c\xd0\x3e\x6f\x96\
-\x3f\xc0\x4e\x1d\x18\xa9\x1e\x48\x83\xec\x0d\xe1\xb1\xf7\xd9\x6f\
-\x7c\x7d\x75\x27\x00\x3c\xc6\x3d\x35\xd2\xc0\x35\xe2\x28\x48\xd3\
-\x98\x75\xe2\x09\xd2\x57\xcf\xc4\xf6\x9d\xd2\xd7\x38\x26\x77\x75\
-\x26\x63\xd6\xd4\x74\x3f\xef\x18\xe9\xcb\x07\x56\xaa\x01\x71\xbf\
-\xab\xc7\x96\xb3\x49\x80\xf4\xa2\x86\x99\x81\x07\x74\x26\x2f\xc4\
-\x89\x9a\xf1\x27\x9f\x12\xa2\x44\xfc\x32\x43\x93\x3a\xdd\x41\xdf\
-\xdd\xc0\xd3\x4d\xbe\x98\x19\x4a\x78\x8c\x38\x81\xb6\x05\x3d\x62\
-\xaa\x52\xcd\x4b\xd4\x2c\x0d\xa0\x2f\x10\xe6\xd6\x1c\xce\xac\x98\
-\x3a\x58\x7e\xf4\x31\xe9\x6b\x1c\xa8\x7a\x58\x5d\x33\xd1\xdb\x2b\
-\x7d\xf5\x74\x1d\x76\xa8\x68\xcb\xe0\xdd\x39\x4d\x25\xd0\x4e\xf5\
-\x3d\x4a\x51\x92\x36\x26\x8a\x14\xc8\x38\x16\x36\x4d\xd4\x60\xfb\
-\x3e\x1e\xf8\xcd\xa1\x2e\xdb\x5c\xd9\x60\xd5\x02\xe9\x61\x30\x74\
-\x9d\x70\x9c\xf4\xd5\x33\xf1\xe8\xe3\xd2\x97\x11\x69\x9e\x44\x0a\
-\xd2\xe9\x0d\x63\xf0\x32\x3d\x35\x9a\x11\xc4\xd9\xb6\x78\xae\xa8\
-\x0c\xcc\x3c\x91\x13\xf5\xc2\x3d\x98\xe5\x1a\xfb\xcd\x6f\xe5\x5e\
-\xeb\x10\xd6\x1b\x44\xf5\x10\x6d\x73\xe7\x8a\x59\xab\x9e\x2f\xf7\
-\xea\xa1\x14\x35\x26\x33\x35\x63\x0f\x56\xdf\x29\x14\x45\xf7\xb1\
-\xab\xa4\xcf\x61\xe2\xca\x23\x45\x9f\x4e\x39\x0a\xd4\xc4\xd5\x70\
-\xc4\x33\x11\xe8\xd9\x2a\x4f\xf9\xb7\x8e\x4f\x72\x7e\xa6\x86\x7a\
-\xa0\xe6\xf5\x34\xe6\x90\x8b\x25\x3d\xdc\xca\xc5\xd2\xc3\x24\xd1\
-\xbe\x6c\xa9\xe8\x8c\x78\xaf\x0a\x50\x5e\xbf\x41\xfa\x08\xc1\xda\
-\x14\x88\x0b\x0b\x1d\x72\x57\xa7\x37\xba\x74\xcd\xb8\x1e\xcf\x05\
-\x67\x77\x26\xbc\x38\xe0\x65\x7a\x06\x97\x8d\x65\x56\xa7\xa8\xec\
-\x9f\x79\x22\xac\xf3\x79\xc7\x88\xee\x53\x5e\x2a\xf7\x6a\xd1\x17\
-\x08\xb7\x22\x60\x22\x35\x6e\x46\x8d\x9f\xdd\x2f\x79\xb1\xf4\x85\
-\x53\xda\xf0\x07\xe9\x6b\x2e\xa3\x0f\xad\x93\xbe\x70\x0a\x21\x6a\
-\xe2\x30\x69\xa7\x61\x68\x3f\xa7\x6a\x7a\x00\xe5\x7a\x1a\x45\x2a\
-\x51\x93\xab\xbf\xe4\x1d\x81\x7c\xe0\x6f\x11\xc6\x87\x9a\xff\x4e\
-\x0b\x57\x99\x7d\xde\x9f\x4b\x5f\x38\xa5\x35\x77\x49\x1f\x25\x44\
-\xf5\x15\xa2\x19\x9f\xf0\x12\x39\x3e\xe3\xc6\x3c\x37\x69\xe5\xad\
-\x1d\x55\xda\xdb\xc4\x54\xd9\xbb\x86\x46\xdc\xbb\x69\x46\x6c\x2d\
-\x10\xce\x39\x41\x31\xa3\x0b\x1a\x30\x9b\x72\xc0\xdc\xb7\xbf\x4d\
-\xfa\xea\x99\xec\xeb\x13\xa5\xdf\xad\x95\x7b\x33\x44\x09\x24\x0c\
-\xd8\xda\x07\x4f\x5c\x95\x63\xbe\x60\x3f\xef\xb5\xaf\x96\x3e\x47\
-\x49\x2a\x44\x6d\x5c\xc1\x96\x19\x86\x3c\x4e\x02\x34\x65\xa6\x06\
-\x3b\x4e\xbb\x38\xa0\xb3\x08\xb1\x4b\x65\x31\xf1\x57\xa5\x0b\xcc\
-\xec\xf3\xce\x95\xbe\x7a\xc6\x9f\x7c\x5a\x4c\x6e\x7c\x56\xee\x11\
-\xe2\x6a\xfd\x87\xb7\x06\xcb\x35\x34\x3a\x73\x22\x6e\x3d\x95\x1f\
-\x79\x54\x8c\x6b\xb3\x0c\x56\x72\xdd\xc8\xe8\x6e\x99\x28\x31\xa3\
-\x80\x73\x30\x53\x38\xf7\xad\x6f\xa9\x1e\x08\x61\x74\xcd\xdd\xd2\
-\x47\x0b\xb6\xd8\x46\xe5\x67\x2d\xc2\x98\xfb\xca\xd3\x45\xd7\x91\
-\x47\xc8\x3d\x47\x49\x51\x29\xdd\x5b\x4f\x13\x1d\xba\x54\x7d\x72\
-\xd1\xfd\xdb\x4f\xad\x0e\xb5\x60\xcc\x9b\x48\xab\x2c\x64\x51\x83\
-\x61\xd6\xab\xfe\x34\xf6\xd6\xd3\x98\xa5\xd7\xfa\x3b\x29\xea\xe1\
-\xc5\x7c\x21\x6b\x71\x66\xbd\xec\x54\xd1\x19\x31\xb0\x59\x7b\x8c\
-\xdb\x01\x92\xc4\x8c\x3a\x3f\x2f\x66\x96\x06\x18\xce\xf8\xf6\xdd\
-\x58\xc2\x2d\xa8\x05\xe7\x9e\x23\x7d\x6e\x81\x59\x5b\x64\xda\x4e\
-\x29\x5b\x75\x4d\x5c\x06\x11\x27\x05\x8d\xc8\x92\xf9\x42\xe1\x3c\
-\x75\x62\xd4\x03\x35\xaf\xa7\x31\x87\xda\x06\x5e\x40\xe9\xa9\x32\
-\xd5\xdd\x2d\x7d\x4c\x1c\x73\xdf\xff\x3e\xe9\x0b\x67\xe4\xa7\x3f\
-\x93\xbe\xd6\xa5\x6d\x8e\xac\x4b\x11\x2f\xe6\x8b\x9a\xa5\x01\x5a\
-\x75\x3d\x4d\x50\xd0\xe8\xe8\xe7\xe0\x31\xf8\x79\xef\x7b\xb7\xdc\
-\xab\x67\x7c\xf3\x16\x31\x7a\xeb\x6f\xe4\x1e\x0d\x2a\x3d\x88\x31\
-\xdd\x67\xe0\x67\x3f\x9f\x7e\x0f\x51\x18\x4b\x3e\xfc\x21\xe9\x73\
-\x87\x1a\x41\x13\xd7\xc7\x62\xfb\xdf\x30\xb4\x9f\x36\x10\x4b\x1d\
-\x26\xe3\x2d\x26\x64\xa9\x52\xfd\x43\x85\x67\x6a\x1a\x80\x5c\x54\
-\x35\x52\xf1\x0a\xca\xc4\xd2\xe8\x17\x79\x31\x55\xe6\x7e\xf8\x62\
-\xd1\x7d\xfa\xcb\xe4\x5e\x3d\x23\x37\xdc\x24\x2a\x3b\xe8\xde\x0f\
-\x52\x83\x0b\x55\x76\x56\x97\x57\x48\x1d\x62\x6a\xa4\xf6\x71\xf6\
-\x60\xa7\x3a\xfb\x2d\x11\x9f\x45\x58\x73\x97\x98\xdc\xb6\x5d\xee\
-\x59\x22\x87\xe5\x18\x25\x68\xe0\x78\xf0\xdc\xc2\xcb\x3f\x23\x3a\
-\x57\x2c\xaf\x1e\x08\x61\xf0\x87\x3f\x92\xbe\x5a\xb0\x82\x24\x0a\
-\x93\x27\xa0\x2a\x07\x06\xc4\x81\x1f\xfd\x44\xee\xd5\xd3\x36\x6b\
-\x96\x58\xfa\xc9\xbf\x96\x7b\xee\x30\x6d\x1b\xc4\xf8\x41\x59\xcd\
-\xf4\xf6\x43\x19\x6f\x5a\x54\xf6\xad\x8b\x1a\xec\x38\xcd\x03\xba\
-\x3d\x5c\x16\x55\x95\x05\x8b\xa4\x8f\x09\xa3\xeb\xa5\x7f\x22\xe6\
-\xff\xcd\x25\x72\x2f\x9c\xe1\xab\xae\x96\x3e\x0b\xe4\xb9\xdd\x76\
-\x76\x78\x82\xc6\xeb\xe2\x60\x31\xf0\x70\xfc\xa3\xdf\x20\x68\xa2\
-\xde\x2c\x0b\x2f\xdc\xd3\x69\xb5\x9e\x4a\xe5\x37\x4c\xcc\x80\x9b\
-\xfb\xce\xf3\xc5\xbc\x98\x5b\x37\x13\xdb\x77\x88\x01\x9b\x75\xd0\
-\x80\x38\x51\x03\x2c\xf9\x88\xf7\x07\xc2\x71\x2f\x92\x7b\xcd\x07\
-\x53\xb7\x94\x0d\x82\x82\xce\xb4\xff\x6e\xc6\x9d\x89\xa4\x2b\x98\
-\xa6\x38\x8e\xb1\x56\x99\xa9\x41\x0f\xe8\x4d\x30\x30\x35\x79\x1e\
-\x4f\xa8\x98\x5a\xc0\x8f\x74\x47\xd1\x75\xd2\x89\x62\xe1\x57\xbe\
-\x28\xf7\xc2\x19\xfe\xde\x0f\xc4\x04\xbc\x74\xcf\x16\x79\xac\x84\
-\xf0\xe6\x62\xe8\xf0\xe1\xc3\x94\xc8\x8f\x5a\x46\x3d\xf5\x34\x55\
-\x2e\x37\xe7\xa9\xa7\xc0\x00\x95\x27\x20\x69\xc1\xe4\x29\xab\x43\
-\xb9\x2d\xfd\xd7\xcf\xcb\xbd\x70\x0e\x7c\xfd\x9b\xd2\x97\x3d\x63\
-\x0f\xae\x13\x23\x6b\x1f\x90\x7b\xe1\x2c\xff\xec\xa7\x44\xdb\xec\
-\xd9\x72\x6f\x06\xc8\x73\xd5\xd5\xfe\x4b\xc3\xfc\xb7\x9e\x23\x16\
-\x7d\x20\xfc\x96\x71\x5c\x8c\xca\x0e\x26\x33\x54\xa6\xd4\x5c\x3f\
-\x5d\xf6\xc2\x31\x88\x2b\x29\x68\xb0\xdb\xd1\x5b\xb9\x91\xa8\xc9\
-\xd3\x5f\xf2\x79\x9c\x55\x68\x35\xd0\x82\x11\x6b\xab\x88\x70\xfb\
-\xe5\x57\x93\x99\x19\xba\x5f\x73\xa6\x58\xfc\xe3\x1f\x88\x8e\x43\
-\x56\xca\x23\xf5\xc0\x13\x4f\x03\x97\xfd\xa3\xdc\xb3\x44\x5e\xda\
-\x21\xbc\x90\xcf\xfb\x0f\x52\x03\x6f\x06\x36\x49\x56\xfb\xd2\x25\
-\x62\xf6\xd9\x67\xc9\xbd\x5a\xfc\x05\xc2\xd4\x6f\x61\x2e\x08\xf3\
-\xde\xfb\x17\x62\xf9\xd7\xae\x94\x7b\xe1\x0c\xdf\x7c\x8b\x18\xfc\
-\xfe\x0f\xe5\x5e\x2d\x6a\x5c\xa6\xa8\x41\x26\x63\x7c\xdf\xd5\xff\
-\x29\x7d\xe1\xcc\x79\xf9\x69\xe2\xb0\xef\x7f\x3b\x42\xd8\x54\x65\
-\x8c\x72\xa6\xcc\x3a\xe6\x68\x71\xe8\x35\xdf\x11\x87\x7c\xed\x8b\
-\x9e\x78\xfa\xb4\xe8\x58\x54\x3f\x13\x1d\x15\xef\x74\x1e\xa3\x32\
-\x6b\xb9\x2d\xea\xb1\xa7\x15\x73\x0a\x93\xdf\x63\x42\x8e\x57\x5f\
-\xbc\xe7\x53\xf8\x99\x1a\x5b\x50\x0f\xe8\x2c\xd2\xa2\x19\x9a\x64\
-\x51\xa3\x68\x9b\x33\x47\xcc\xfd\xe8\x5f\x8a\x45\xff\x79\xb5\x68\
-\xeb\x89\x5f\x44\x3d\x70\xb9\x27\x68\x62\x16\x46\x3a\x0b\xfc\x99\
-\x2a\x3b\x76\x68\x35\xbe\x9b\xa8\x78\x62\xc6\x3f\xe4\x93\x34\xc8\
-\xe9\x9d\x6a\xd4\x1b\x84\x81\x91\x16\x7e\xe1\xde\x74\xd9\x4a\xa7\
-\xe8\x7c\xee\x73\xc4\xa2\x7f\xbc\x4c\x2c\xb9\xe2\x1f\xe4\x91\x70\
-\x26\x76\xee\x12\xfb\xff\xe1\x0a\xb9\x97\x1f\x86\x3c\xa1\xd5\xf7\
-\x5f\xd7\xc8\xbd\x70\x94\xb0\x99\xf5\xfc\xe7\xc9\x23\x8d\xb3\xf8\
-\xe2\x0f\x8a\x23\xee\xb8\x45\xcc\x7b\xf5\x99\xf2\x88\x10\x1d\xcb\
-\x96\x4a\x9f\x57\xc6\xde\x18\x10\xd5\x5a\x55\x7d\xae\xbb\xe5\x24\
-\xb7\x3e\x09\x63\x88\x7e\xb6\x51\x51\xa2\x43\x17\x53\x7a\xd4\xad\
-\x27\xc0\xaa\xa8\xc1\x8e\xd3\x3c\xa0\x9b\x43\x5d\xb6\x79\xb6\xc1\
-\x70\x25\xfc\x69\x95\x56\xa2\x6d\xc1\x7c\x5f\xcc\x2c\x5b\x7b\xb7\
-\x98\xff\xb1\x8f\xca\xa3\xd1\xf4\xff\xf5\xdf\x8a\xf2\xdd\xf7\xca\
-\x3d\x8b\x98\xd4\x1b\xa2\x0f\x5a\x42\x5d\x85\xcb\x52\xd5\xd8\xa8\
-\x05\xc2\x13\x3b\x76\x8a\xd2\xed\x6b\xe4\x5e\x95\xfc\xb6\x12\x7a\
-\x20\xaf\x2a\xbf\x60\x39\x25\x66\x0e\xb9\xe7\x76\xb1\xe0\xdd\x17\
-\x55\x4f\x44\x30\x35\x3e\x2e\xf6\x5e\xfc\x11\x91\xf4\x01\xd5\xac\
-\xca\x73\x8f\x27\xb6\x4a\x4f\x3f\x23\xf7\xc2\x01\x61\x73\xe4\xed\
-\xbf\x16\x4b\x3f\x7e\xa9\x3c\x92\x8e\x85\x7f\x71\xa1\x38\x72\xcd\
-\x6d\x62\xd9\xa7\x3f\xe1\x89\x92\xda\x36\xd0\x3e\xa7\x76\x36\xa8\
-\x12\xd2\x9e\xa2\x04\x4d\x1d\x39\xeb\xc3\x93\x52\x63\x96\xda\x99\
-\xd0\x61\xd9\x2c\x6b\x7f\xbc\x39\x39\x53\x43\x3d\x50\x53\xaa\x56\
-\xa6\x16\xb4\x58\x8a\x09\x37\x38\xd1\x42\xa2\xa6\xab\x4b\xb4\x2f\
-\x5f\xe6\xbf\xae\xbf\xe7\xdc\x73\xc4\x82\xcf\x7d\x56\x2c\xf9\xd5\
-\x8d\x62\xc5\xc3\x0f\xfa\x62\xa6\x7d\xfe\x3c\x19\x30\x9a\x03\x97\
-\xff\x93\x18\xbd\xfe\x06\xb9\x67\x19\xac\x7d\x89\xa0\xbe\x5a\xe7\
-\xaa\x17\x44\xbe\xda\xbf\x65\x1f\xe3\xee\xe9\x11\x1d\x07\x1f\x2c\
-\xba\x8e\x5d\x25\xe6\x5f\x78\x81\x58\xf2\xc5\x7f\x15\x2b\xef\xfc\
-\x8d\x2f\x66\xe6\x27\x88\x19\xa0\x32\x56\x12\x7b\xfe\xdf\x87\x45\
-\xe9\x81\x87\xe4\x91\x70\x32\xed\x75\xbd\x41\x70\xcf\x67\x70\xb3\
-\x48\x4b\x2e\xf9\x2b\x71\xe4\xbd\xb7\x8b\xe5\x57\x7c\x46\xcc\x3d\
-\xe3\x15\xf2\x68\x34\xf0\x14\xd5\xec\x53\x5e\xea\x87\x3f\xe6\x8f\
-\x0f\x8a\x15\xff\x7c\x85\x98\x75\xcc\x51\xf2\x6c\x80\x80\x52\x51\
-\x65\x02\x47\x95\x03\x12\x05\x0d\x40\xd0\x16\x6b\x62\xa0\x34\x90\
-\x16\x57\xd2\x78\xab\x9f\xc5\x26\x61\x7c\x46\xd4\x6c\x6a\x53\x83\
-\x8e\xa7\x20\xfd\x32\xfc\xf0\x47\x2e\x0d\x9d\xeb\x3f\xf3\x55\x67\
-\x8a\xb3\xcf\x7a\x8d\xdc\xc3\x81\x1f\xcf\xb0\x49\xaf\x92\x07\x51\
-\x43\x99\x06\xd3\xfc\x03\xd8\x9f\x50\x97\x95\x82\x3c\xde\x88\x70\
-\x83\x0f\xdf\x23\xee\x7f\xdb\xfb\xc5\x2b\x17\x2e\x16\x9d\xa8\x96\
-\x9d\x2d\x07\x6f\x7e\x52\xfa\xea\x99\x2a\x95\xbd\xbf\x60\xcb\x42\
-\x78\x22\xcd\x7f\x3d\xbf\xf7\xd7\xec\x14\x08\x36\x70\x20\x66\x16\
-\x2d\x42\x89\x96\x38\xfa\x3e\xfc\x31\x6b\x2f\xda\x0b\x02\x26\x5b\
-\xb1\xf6\x4e\x7f\x00\x0c\x63\xf7\x19\xaf\x11\x93\x9b\xb7\xca\x3d\
-\x0f\x30\x9f\x59\x35\xab\x03\xfb\xf3\xa4\x9a\xa2\xda\xfc\x82\x8f\
-\x7f\x4c\xcc\x8f\x78\x3f\xc9\x9e\x37\xbd\x55\x8c\x3f\xfc\x88\xdc\
-\xab\xd2\x60\xf2\xad\xd3\x75\xdc\x0b\xc5\x8a\x5f\xdd\x24\xf7\x6a\
-\x99\x9a\x9c\xf4\xea\x9f\x57\xd7\xbc\x3a\x08\x33\x29\x55\x3f\x6c\
-\xbd\xba\xe8\x0d\x0a\x6d\xb3\x7b\xaa\x75\x30\x64\x2d\x09\x96\x89\
-\x6d\xdb\xc5\xde\x8b\x3f\x2a\x4a\xeb\xe2\x3f\x20\x89\xe5\x39\x7f\
-\x78\x40\x74\x44\x7c\x41\xfb\xd9\x93\x4e\x11\x93\xfb\xaa\x5f\xdf\
-\x86\x97\x43\xa7\xb1\xcd\x82\xf3\xce\x15\x2b\xaf\xfc\x77\xb9\x87\
-\x63\xb2\xaf\x5f\x94\xb7\x6e\x15\x13\xbb\xf7\xf8\x9f\x5f\x80\x47\
-\xc5\xdb\xbd\x34\x76\x2c\x3c\x48\x74\xae\x5c\x29\x66\x9f\x74\x82\
-\x0c\x99\xcc\xd3\x27\x78\x79\xe8\xed\xf5\xfb\x49\x48\xff\x78\xa0\
-\x1f\x84\x3d\xbd\xdb\xd3\xcf\x06\xf3\x7b\xd0\xd9\x67\x89\x23\xff\
-\x2b\xfc\x29\xb3\x81\xdb\xd7\x88\x67\x56\xbf\x47\xee\xc1\x6f\x83\
-\xbf\xae\x52\x73\x54\xdb\xa9\xbd\x6e\xed\x6f\xc3\x63\x8a\x8b\xab\
-\xba\x83\xf9\xdd\x8c\x5f\xf3\x05\x7e\x08\x72\x66\xdb\xd8\x48\x75\
-\x47\x88\xcb\x33\x9f\xa9\x31\x1d\x4c\xf3\x00\xf9\x80\xce\x44\x32\
-\xff\xf8\xd3\xfd\x6d\x11\x16\x0b\xb7\x75\xcf\x12\xed\xf3\xe6\x89\
-\xf6\x85\x5e\x07\xb8\x7c\x99\xe8\x38\xf4\x10\xd1\x79\xf8\x73\x45\
-\xe7\xd1\x47\xf9\x53\xfb\x8d\x08\x9a\xd2\x3d\xf7\x89\xbd\x67\xbd\
-\xa9\x69\x82\x26\xcf\x60\x05\x0d\x10\xf5\xd4\x53\x79\xc3\xc3\xce\
-\x09\x9a\x24\xda\x3a\x3a\x44\x7b\x4f\xb7\x57\xcf\xe6\x8b\x8e\xc5\
-\xde\x1f\x09\x2b\x96\x8b\xce\xc3\x0e\xf5\x3f\x0f\xd0\x05\x75\xf0\
-\x90\x43\x1a\x12\x34\x43\xd7\xdf\x20\x76\x9c\xfd\x66\x32\x41\xd3\
-\x0c\x06\xae\xff\x99\xd8\xf6\x9e\xf7\x57\x85\x1d\x12\x10\x59\xb3\
-\x4f\x38\x5e\xcc\xf7\xfe\xc8\x5f\x78\xe1\x05\x62\xf1\xc5\x1f\x10\
-\x0b\xdf\x79\xbe\x98\xff\x86\xb3\x8d\x04\x4d\xef\x57\xae\xf2\x05\
-\x8d\x42\xaf\x5f\xfe\x1c\x03\xfc\x97\x54\x99\x15\xde\x8f\xb1\xc3\
-\x4d\x94\xa0\x49\x43\xda\x98\xcc\x7e\x17\x1f\x5a\x5f\x4f\x03\x58\
-\x13\x35\x3c\x9e\xdb\x03\x5d\x79\x0b\x24\xbe\xfa\x27\xf1\x9d\x4e\
-\x2b\x51\xe9\xeb\x13\x03\x57\x7c\x5e\xec\x5f\xfd\x6e\xbb\x8f\x6e\
-\x47\xe1\x70\x3b\xef\x7e\xc5\xcb\x7d\x51\x19\x46\xab\x7f\x91\xdb\
-\x84\xf2\x13\x4f\x8a\xbd\x7f\x75\x89\xd8\x77\xe9\x27\x44\x65\x60\
-\x50\x1e\x75\x87\xe1\xdb\x7e\x2b\xb6\x9e\x7f\x91\x98\xd8\xb7\x4f\
-\x1e\xb1\xcf\x9e\x7f\xfc\x17\xb1\xef\x5f\x6a\x67\x88\xa0\x29\x81\
-\x98\x09\xae\xbb\x41\xd3\x60\x3f\x4e\xd9\x94\x6b\xe2\x22\x8c\x38\
-\x2c\x8b\xf2\x9b\x4f\x8a\x7e\xe7\xd6\xd4\x50\x0f\xd4\x94\xaa\xb5\
-\x55\x20\x17\x4b\x09\xe1\x3a\x16\x75\x8b\x7e\x83\xbf\xa4\xb2\xa4\
-\x32\x34\x24\x7d\x76\x99\xd8\xb2\x45\x0c\x7e\xf1\xcb\x62\xef\xcb\
-\x5f\x25\x86\xbf\xf3\x5d\x79\x34\x03\xb0\x36\x06\x1a\x6c\x6a\x0d\
-\xfe\xbc\x8e\x22\x7e\x91\x7b\x6a\x68\x58\xfa\xec\x53\xda\xf0\xb0\
-\xe8\xfd\x87\x2b\xc4\x8e\xd7\xbe\x51\x0c\xdf\x94\xdd\x0c\x21\x45\
-\xbd\x18\x5d\xfb\x80\xd8\x78\xca\x19\xa2\xf7\x4b\x5f\x8d\xfd\x94\
-\x42\xa3\x0c\x78\xf5\xea\xd9\x33\xcf\x16\x7d\x57\x7d\x4b\x1e\x99\
-\xa1\xe1\x7c\x98\xb4\xc5\x24\xb4\xa8\x28\xdb\x5d\xd2\x78\xab\x9f\
-\xc5\x5e\x77\x74\x72\x42\xfa\x7c\xd6\x3b\xb9\x50\x38\x4b\xc8\x45\
-\x15\x65\x45\x2c\x28\xf3\x8e\x3b\x54\x0c\x4d\x8c\x8b\x09\x07\xca\
-\x6a\xe2\xb1\xc7\xa5\x8f\x9e\x89\xad\xdb\xc4\xc8\x35\xd7\x8a\xbe\
-\xf7\x7d\x50\xec\x3b\xe3\xb5\x62\x18\x3a\xe0\x91\xe9\x7b\xc9\x99\
-\xe0\x5a\xfd\x9d\xee\x54\xdb\xdb\x23\x1f\xe5\x1e\xfb\xed\x1d\xa2\
-\xb2\x6b\x97\xdc\x73\x8b\x89\x4d\x9b\x6b\x6e\x69\x50\x53\xf6\xea\
-\x37\xbc\x4c\x6f\xe7\xb9\xe7\x8b\x9d\x6f\x3e\x57\x0c\xfe\xd7\xf7\
-\xe5\x19\xf7\x81\x35\x6f\xfb\xfe\xed\x8b\x62\xe3\xa9\xaf\x14\xfd\
-\x11\xef\xd6\x49\xcb\xc0\x0d\x37\x89\xcd\x7f\xf6\x76\xb1\xf3\x43\
-\x1f\x11\xe5\xa7\x9e\x96\x47\xab\x40\x1b\x02\x19\x95\xd4\x92\xf4\
-\xf3\x59\xb5\x3a\x5d\x94\x64\x95\x06\x9d\x09\x2f\x15\xc1\x71\xc1\
-\xca\x42\x61\x6c\x3f\x97\xa6\x43\xc4\xfe\x06\x1d\xce\xd0\x34\xe4\
-\xd7\x4f\x55\x06\xd2\x93\x00\x26\xee\x74\xd7\x27\xce\x5b\x42\xb8\
-\x0d\x1f\x7d\x87\xe8\xbd\xf9\x61\xb1\x6a\xde\x02\x71\x48\x57\x97\
-\x3c\x9a\x4f\x3a\x8e\x3a\x52\x2c\xb8\xfc\x33\x62\xd6\x29\x2f\xf5\
-\x17\xff\xd6\x11\x95\xd7\x89\x49\x31\xe5\x09\x37\x58\x34\x5c\xe9\
-\x3f\x20\x26\x77\xec\x14\x95\x9d\x3b\xc5\xc4\xe6\x2d\x62\xe2\x89\
-\xa7\x3c\xf7\xa4\x98\x7c\x76\x93\x0c\x5c\x8b\xb9\x05\x69\x80\xac\
-\x1c\xf4\xaf\xff\x24\xe6\x5e\xf0\x76\x79\x64\x86\xf2\xfa\x0d\x62\
-\xdf\xb9\x17\x08\x41\xf8\x8e\x21\x4c\x3e\x93\x26\xee\x55\x7b\x9f\
-\xfd\xd6\x73\xc4\xe2\x2f\x7f\xc1\xf7\x07\xd9\x7f\xc9\xdf\x88\x51\
-\x6f\x10\xd2\xc9\xaa\x8c\xd3\xd0\xf3\x9a\x57\x89\x05\x9f\xf8\x98\
-\xe8\x8a\x7a\xc7\x4a\x44\x1d\xf4\x17\x0e\x7b\x75\x10\x16\xaf\x57\
-\xf6\xf5\xfa\x8f\xb4\x83\x1b\xdf\xb8\x51\x8c\x3f\xfe\xa4\x28\x7b\
-\xf5\x70\xd2\xab\x93\xcd\x64\xf9\x7f\x7e\x53\xcc\x09\x19\x77\x46\
-\xee\xbe\x57\xec\xb8\xe0\x5d\xbe\x1f\x72\x03\x59\xa2\xb6\x11\xbc\
-\x43\x66\xfe\x9b\xdf\x28\xe6\xbf\xe1\x75\x62\xf6\xa9\x27\x8b\xb6\
-\xce\x4e\x79\x26\x99\x89\x5d\xbb\xc5\xc8\xbd\xbf\x13\xc3\x6b\xee\
-\x12\x83\x37\xdf\x2a\xa6\x86\xa3\x67\xd0\xa0\x9f\x84\x56\xa2\xcf\
-\x0f\x85\x8d\x4b\xfa\x91\x9a\xb3\x72\xa7\xeb\x90\x95\xe2\x98\x1b\
-\x7e\x24\xba\x43\x6e\xa9\xee\xbe\xea\x5b\x62\xc7\x15\x9f\x0f\x8d\
-\x57\x11\x16\x27\xa0\x1f\xc7\x8a\x9a\xe8\xb8\xe2\x52\x50\xfb\xbb\
-\xaa\xbf\x36\x74\xb0\xea\x0e\x4c\x4e\x88\x7e\x78\xf8\x42\xb2\x7a\
-\xa0\xb7\x8d\x45\x4d\x6c\x11\xd7\x43\x7e\x7d\xc3\x32\xc0\x06\xb7\
-\x75\x7d\x80\x3c\xee\x84\x70\x1b\xbf\xfc\x77\x62\xd3\x57\x6f\x12\
-\xcb\xba\x7b\xc4\xf1\x73\xe6\xca\xa3\x0c\x60\x6e\x3d\x3a\x94\xd9\
-\xfc\x47\x80\x9f\x7b\x98\x68\x5f\xbc\x58\x4c\x0d\x0d\x55\x9f\x08\
-\xf1\x1c\x35\x98\xbc\x62\x45\xcd\x62\x6f\xb0\x9c\xfd\xda\x57\xfb\
-\x7e\x9d\xca\xe8\xa8\xd8\x79\xdc\x4b\xfc\xa7\x82\x74\xb2\x2c\xe7\
-\x46\x80\x36\x08\x69\x37\xb9\xa1\xe2\x0f\x04\x9e\x53\x79\xce\x3a\
-\xef\x6d\x07\x2d\x10\xed\xde\x80\xdd\xd6\x33\x5b\x54\xc6\xc6\x44\
-\xa5\xaf\x5f\x4c\x48\x71\x35\x9d\x46\xe9\xb1\x96\xd6\x8e\x0e\x31\
-\xfb\xe4\x97\x88\x4e\x2f\x1d\x9d\x2b\x0f\x16\x1d\x8b\x17\x89\x8e\
-\xf9\xf3\x45\xfb\xdc\x39\xa2\x32\x34\x2c\x2a\xc3\x23\x62\xb2\x77\
-\xbf\x28\x3f\xfd\x8c\x28\x3d\xfd\xb4\x18\x7f\xe6\x59\xf9\xc3\x64\
-\xc0\x46\x70\x03\x45\x4f\x7b\xd8\xb8\x54\x7b\x5e\x23\x10\xb4\x0b\
-\x1e\x40\x58\xba\xc4\x5f\xf4\x3d\xd1\xdb\x2b\xc6\x36\x7a\x7f\x0c\
-\xc9\x3f\x2e\xa2\xc6\xbb\xba\xa3\xda\x01\xfd\x9c\xfe\xfb\xf0\x98\
-\x02\xc7\x03\x81\xe0\xf7\xa8\xdf\x79\x54\xf7\x67\x8e\x86\x0d\x13\
-\x7b\xc7\x4b\x62\x74\xe6\x0f\xa7\x03\x9e\xa8\x59\xe8\x94\xa8\xc1\
-\x86\x47\x87\x8b\x2c\xde\x68\xc8\xd3\x60\x5c\x06\xd2\x93\x80\xbd\
-\xeb\x13\xc7\x8b\x08\xb7\xe3\xba\xaf\x8a\xc7\xff\xfe\xeb\xbe\xdf\
-\x95\x47\xbb\x9b\x85\x99\xf5\x68\x31\xac\x3a\x0d\x81\xbd\x14\x46\
-\xd4\xb4\xaf\x58\x2e\x56\xde\x7f\x8f\x3c\x52\xcb\xf0\x75\xd7\x8b\
-\xfe\xbf\xf9\x3b\xb9\x37\x43\x96\xe5\xdc\x08\xd0\x0e\x21\xed\x69\
-\x45\x4d\x1e\xf2\x0d\x79\x88\xba\x3d\xa3\x8e\xa9\xba\x68\x3b\xbd\
-\x6a\x50\x56\xf5\xac\x2d\xb1\xc6\xc5\xa3\xec\x03\x83\xae\x9e\xf6\
-\xea\xd1\x19\x82\xf9\xaa\xd9\x0f\x9e\x0c\x10\x17\xaf\x22\x2a\xbe\
-\x60\x68\xfd\xf7\xe1\x31\xc5\xc5\x55\xdd\xc1\xfc\x6e\xc6\xaf\xf9\
-\x02\x3f\x84\x3a\xa1\x3d\xca\x0d\xac\xf1\x44\xcd\x99\xbc\xa6\xc6\
-\x00\xea\x01\x1d\x1b\xae\xd5\x99\x7d\xe8\xe1\xd2\x27\xc4\x1e\x78\
-\xa7\x0b\xc3\xa4\x40\x75\xaa\x73\x62\x16\x08\xfb\xdf\x7a\x2a\x18\
-\x26\xbd\x8c\x2e\x68\xf2\x80\x1a\xf4\xf3\x40\x30\x25\x8d\x0a\x1a\
-\x45\x50\xb0\x25\xe5\xd8\xa4\x3c\x28\xcb\x4e\x4f\x17\x65\xbc\x69\
-\x19\x0d\x3c\xca\xed\xe1\xdf\x9f\x27\x17\x35\xd8\x71\x9a\x07\x74\
-\x73\xa8\xcb\xd6\x15\x1b\x2c\x3a\xfd\x2d\xd2\x27\x44\xaf\x76\xff\
-\x94\x61\x74\xb0\x43\x4c\xe4\x67\x11\xb6\x6e\x13\xa5\x3b\xef\x96\
-\x7b\x33\xb4\x5a\x4f\x05\xf9\x55\x2e\x0f\xe4\x25\x1d\x54\x22\x26\
-\x48\x43\xf9\x33\xf8\x71\x33\xe4\x61\xd2\x15\xcc\x52\x10\x1f\x7a\
-\xb8\xfe\x0f\x5c\xff\x05\x49\x85\x9b\xa9\x41\x0f\xe8\x4d\x30\x30\
-\x93\x80\x81\xa8\x9a\xfb\xe2\xea\x5b\x6b\xf7\x96\xc6\x9c\x78\x0a\
-\xaa\x19\x38\x57\x0a\x76\xc6\x04\x23\xba\x5e\xf4\x42\x31\xeb\xa4\
-\x13\xe5\x5e\x2d\xa3\x39\x7d\x71\x61\xa3\xd5\xdd\xe4\xe7\x10\x36\
-\x2f\xf5\x2a\x69\x96\x26\x2f\xe9\x4c\x4b\x52\xfe\x9a\x45\x4d\x1a\
-\x28\x13\xa4\xc5\x95\x94\xd3\xa4\xcb\x06\xdb\x00\x3c\xf5\x14\x7c\
-\xe9\x9e\x87\x5b\xa2\xc6\x95\x59\x85\x22\x83\x16\x8c\x16\x6c\x35\
-\xef\x98\x23\xa4\x4f\x88\x1d\xf0\x89\x01\xa6\x65\xa0\xac\x4d\xb3\
-\xdf\xf2\x46\xe9\xab\x67\xf4\x17\xbf\x92\xbe\xfc\xd0\xea\xdd\x9e\
-\xca\x7e\x1e\x8a\xc1\x86\x04\xc1\xac\x75\xca\x2a\xef\xfa\x75\x9b\
-\x29\xbf\x30\x57\x1a\x09\x7f\xaa\xb2\x98\x33\x35\xb6\xa0\x1e\xd0\
-\x59\xa4\x99\x31\xff\xe8\x99\xc7\x53\xb7\x97\xb2\x7d\x37\x0b\x93\
-\x12\x8b\x55\x3e\x69\x12\x48\x75\xca\x51\xef\xa6\x29\xaf\x5b\x2f\
-\xc6\x1f\x7d\x4c\xee\xcd\xe0\x72\x2b\x85\x3e\xc6\xd5\xf4\xe7\x31\
-\xed\x36\x6e\x3f\x41\x1e\xf5\x7c\x26\xe5\xba\xe6\x6c\x42\x01\x99\
-\xc4\x6b\x02\x5d\x4c\xe9\x81\xf7\x96\x05\xd8\xb0\x7a\xa0\xb7\x1f\
-\x3c\xa4\xa2\x06\x3b\x4e\xf3\x80\x6e\x0e\x75\xd9\xba\x66\x83\x45\
-\x27\xbf\x52\xfa\xe0\x0d\x92\x93\x85\xf8\x16\x54\x23\x70\x0b\x32\
-\xa7\xfb\x95\xaf\xf0\xbf\x75\x14\xc6\x48\x0e\x67\x69\x66\x68\x4d\
-\x6b\x9b\xe6\xda\xa5\x52\x82\xfe\xd7\xe4\x89\x34\x5b\x50\x96\x59\
-\x52\x5c\x66\xd7\x9a\x09\x1d\x1c\xaa\x46\xa7\x2a\x61\x4b\x10\xa6\
-\x3f\x38\xe6\xc4\x4c\x0d\xf5\x40\xed\xee\xdf\x2f\xf9\x07\x2d\x96\
-\xb0\xe1\x24\xf0\x61\x4b\xf8\x5c\x82\x62\x7b\x79\x4c\xfa\x98\x22\
-\x43\xd9\x52\xa3\x66\x69\x80\x3c\xae\xa7\xa9\xb6\xa5\xc6\x4a\x80\
-\xb2\xfc\x9a\x05\xe4\x3b\x29\xdd\x79\xc8\x57\xa3\xe3\x48\x1e\x44\
-\x4d\x0d\x94\x85\xaa\xc5\x65\x32\xfb\x84\x49\xc2\x60\xf8\x27\x73\
-\xee\x90\x5b\xbe\xfd\x44\x09\xb5\xf8\xca\x13\x79\x48\xf3\xc2\xd3\
-\x9e\x2f\x7d\xd5\x05\xc3\x63\x16\xbf\xd1\xc2\x14\x8f\xa8\xf5\x34\
-\xa3\xb7\xfe\xaf\x95\x97\x05\x52\xe2\x62\x9f\x91\x06\x95\x4f\x3d\
-\xb7\x79\xcc\x79\x23\x69\x82\x3c\xaa\x9e\x2b\x29\x9e\xb4\xe5\xd0\
-\x68\x99\xd5\x5e\xb7\xd1\xd8\xe8\x88\x58\x20\x0c\x64\x27\x6a\x78\
-\x40\x67\xd2\x00\x36\x58\x78\xe2\x49\x72\xaf\xca\xb3\x9e\xb0\x61\
-\x18\xec\x7a\x9a\xca\xde\xf0\xaf\x30\x0f\xff\xe0\x5a\xe9\xab\x25\
-\x0f\xad\xbe\x15\x7b\x9e\xbc\xe7\x19\xea\x5b\xda\xd5\x35\xd0\x8f\
-\x41\xfe\xc2\xfe\x1c\x33\x12\x0f\x46\x41\xe9\x4a\x34\x6d\x4c\x66\
-\xbf\x8b\x0e\x3d\x50\xbf\x96\x06\xd8\xbc\x7a\xa0\x77\xfa\x1b\x32\
-\x64\xa2\x86\xc7\x7d\x7b\x60\xcb\x16\x2b\xbe\x5c\x15\x69\xcb\x5e\
-\x7d\x8e\xf4\x55\xd9\x39\x36\xda\x92\xb3\x35\xdc\xd4\xd2\xb1\xfb\
-\x15\xaf\x16\xbd\xff\xe7\x83\xa2\xef\x13\x9f\x12\xfd\x9f\xbe\x4c\
-\xec\xbf\xf4\xe3\x62\xd7\xa9\x67\x88\xd2\x1d\x77\xca\x10\xf9\xa4\
-\x55\xec\xad\x06\x7c\xd3\xfc\x42\x77\xd6\xec\x32\x82\x45\xc3\x69\
-\x17\x0e\xe7\xa5\xc7\xa2\x2c\xb3\x9a\xb8\x0c\x22\x4e\x0a\xaa\x0f\
-\x55\x93\x5e\xe8\xa1\xf0\x97\xaf\xde\x28\xb7\x3e\xb9\xbf\xfd\x44\
-\x3d\x50\x53\xaa\xd6\x56\x81\x5c\x2c\x61\xc3\x05\x98\x7d\xf8\x0b\
-\x45\xf7\xd1\x0b\xe4\x5e\x15\x9e\xad\x71\x08\xc3\xcf\x5b\xd8\x68\
-\xa9\x63\xb7\xfd\x56\x8c\xfc\xe8\x27\x62\xf8\x9a\x1f\x8a\xd1\x9f\
-\xde\x28\x26\x77\xe6\xf3\x6b\xdc\xe8\xb6\x54\x10\x54\x7e\x31\xb9\
-\xce\xb2\x64\x1a\x11\x33\x90\x47\x10\x34\xb9\xb4\xac\x96\x28\xca\
-\xf4\x99\x8c\xb7\x49\x21\x0f\x84\xcf\xd2\x00\xd3\xb7\x9e\x00\x5e\
-\x53\x93\x00\xf5\x80\xde\x6a\x9d\x15\x35\x4b\xcf\x38\x45\xfa\xaa\
-\xb4\xea\x6c\x8d\x93\xa4\x9d\xb3\x6f\x00\x97\xff\x88\x69\x95\x9e\
-\x42\xf5\x89\xe1\xb7\x64\x8a\x81\x12\x34\x7a\x1e\x93\xf2\xa6\x9f\
-\x37\x29\x07\xca\x32\xd3\xdb\x0f\x65\xbc\xa6\xc4\xcc\xd2\xc0\x47\
-\x2c\xe9\x67\x6a\xb0\xe3\x34\x0f\xe8\xd9\xe3\xa2\x0d\xf4\x34\x1f\
-\xf2\xe6\xf3\xa5\x6f\x06\x9e\xad\x69\x5d\x6c\xe9\xa4\xa2\xf4\x54\
-\xae\xe4\x23\x6d\x3a\xa1\x6b\xc8\x73\x1e\xa1\xef\x0a\x13\x34\x41\
-\x8c\xc4\xb7\x51\xd0\xec\x4b\xc7\x2c\x05\xe1\xa1\x63\x66\x69\x6a\
-\x04\x0d\xd0\x52\x33\x35\x2e\xfe\xd5\x86\xd5\x20\xad\x22\x18\xe7\
-\x1d\x7f\x7a\xdd\x2d\xa8\x56\x9a\xad\x71\xda\xca\xfc\x75\x75\x23\
-\xa0\xb4\x94\x2b\x2a\xfe\xa0\x0f\xdb\xea\x6e\x22\x2e\xd5\x7f\x95\
-\xb7\x24\x41\x93\x05\x35\xe5\xd8\x60\xa1\xa6\x8d\x2b\x29\xa8\x1a\
-\xd2\xc6\xbd\x90\x11\xb3\x34\x80\x5b\xa2\x06\x3b\x50\xb7\xca\x80\
-\x9e\x05\xe4\x36\x20\xb0\x55\xf0\x16\x14\xf0\xd8\x28\xbf\x65\x38\
-\xf7\x18\x8c\xce\xad\xde\xa2\x55\x51\xb5\x79\x42\x50\xb9\xa2\xa1\
-\xfa\x8c\x28\x5b\xbb\x5a\x07\x40\xca\x54\xff\x55\xc5\x4c\x9a\x7c\
-\x64\x95\x77\xca\xeb\x56\x4b\x00\x47\x5c\xc8\xbe\x72\xe4\x47\x8c\
-\xeb\x6e\x3d\x01\xbc\xa6\x26\x06\xea\x01\x1d\x3d\xf0\x33\xd3\x84\
-\x95\xd9\x73\x56\x7f\x50\xfa\x66\xe8\x2b\x97\xc4\x9e\xf1\x48\x35\
-\xcf\xe4\x02\xda\x81\x39\x29\x36\x93\x4e\x35\x77\x14\x54\xc8\x28\
-\x92\x04\x8d\xab\xa8\x3a\x57\xf1\x36\xf1\xb7\x9b\x66\x48\xaa\xa7\
-\x35\x67\xe3\x83\x26\x9d\x36\x42\x4f\x17\x65\xbc\x26\x8c\x4d\x55\
-\xa2\xde\x4b\x03\xd4\x09\x1a\xa0\x61\x51\x83\x1d\xa7\x79\x40\x37\
-\x87\xba\x6c\x8b\x62\x03\x78\x0a\x4a\x7d\xb5\x5b\xe7\x99\xd1\x21\
-\xfe\x82\x77\xae\x71\xc3\x36\x5c\x83\x9a\x43\xa3\xe5\x0c\x4d\x3d\
-\x2f\xb6\x02\x01\x50\xfd\x07\x8b\x5a\x6b\xd3\x95\x55\x1a\x75\x51\
-\x62\x8b\xa4\x2b\x98\xa5\x60\x26\xb4\xb2\xed\x7e\xef\x8f\xd5\x18\
-\xbe\x24\xb7\x35\xe4\x76\xa6\x86\x7a\xa0\x6e\x86\x81\x99\x04\x08\
-\x05\xc7\x73\xde\xf6\xe7\xd2\x37\x03\x7c\x13\x6a\x4b\xf4\x54\xa5\
-\xf3\x38\x5f\x83\xb9\x09\x32\x1e\xd0\x67\xab\xaa\x60\x52\x25\xf2\
-\x58\x7d\xaa\x42\xa6\x9a\x1f\x10\x33\x2e\xac\xec\xab\x29\x47\xca\
-\x42\xd5\xe2\x9a\xb1\x70\x38\xfa\xd9\xa8\x90\xb0\x38\x38\xe6\x8f\
-\x54\xf8\x80\xe5\xf4\xf7\x9e\x74\xf8\xf6\x53\x93\x70\x71\x96\x84\
-\x5a\x58\x52\xb2\xf4\xac\xf3\x6b\xbe\x05\xa5\xd8\x34\x32\x24\x06\
-\xc3\x3f\x4b\xcf\x64\x0d\xb6\x3e\xc9\x2d\x53\x3c\xa0\x0a\x60\xec\
-\xeb\x42\x1d\x50\x03\x37\xf5\x42\xe0\xac\xf2\xae\x5f\x37\x49\x94\
-\xd8\xa6\x34\x55\x89\x7a\x7b\xb0\x22\x74\x96\x06\x60\x51\x13\x41\
-\x9e\x07\xf4\x56\x21\xae\x6c\xbb\x16\x2e\x13\x07\xff\xd9\x19\x72\
-\xaf\x96\xc7\x46\x86\xa5\x8f\xc9\x15\x84\x4d\xc5\xd6\x7a\x1a\x6e\
-\xcd\xf6\x28\x4a\x57\x09\x75\xab\xfa\xaf\x2a\x66\xea\xb2\x95\x90\
-\x4f\xfd\x74\x52\x3d\xad\x39\x4b\x18\xaf\x09\x74\x31\xe1\x80\x7a\
-\xd2\x1b\x7f\xdb\x09\x16\x08\x7f\x57\xfa\xeb\x68\x48\xd4\x60\x2b\
-\x29\x0f\xfc\xe6\x50\x97\x6d\x11\x6d\x10\xb6\x60\x18\x18\xf2\x14\
-\xfe\xc6\x52\x6c\xa3\x70\x8e\x62\x58\xaf\x38\x75\x10\x44\x55\x98\
-\xcb\x13\x79\x2c\x6d\xa7\x07\x5b\xf9\x0f\x50\x62\x26\x29\x0d\xcd\
-\x4e\x63\x12\x94\xe9\xa1\xcd\xfb\x4c\xe8\xfe\xf8\xdb\x4e\x40\xe4\
-\x2c\x0d\x90\xcb\x99\x1a\xea\x81\x9a\xb2\x21\xb5\x0a\xe4\x62\x09\
-\x1b\xce\x00\x58\x30\xbc\xe2\xed\xa7\xc9\xbd\x5a\xe0\x36\xd4\xfe\
-\x09\xbe\x0d\x65\x8b\x54\xe6\x44\xfc\x86\xbe\x96\xd0\x13\x27\x5e\
-\xf2\x24\x6e\xf2\x24\xb2\xc2\xea\x8b\x89\xad\xf3\x52\x2f\x20\x1d\
-\x2e\xac\x9b\x41\xa1\x15\x6a\xc3\xe5\x5b\x13\x57\x7c\x6c\xfa\xd9\
-\x60\xc8\x52\x65\x2a\xe9\xb6\xd3\x01\xcf\xb9\x27\x6a\x5c\x81\x7c\
-\xe0\x67\x8c\x39\xf2\xfd\x7f\x2d\x7d\xf5\xfc\x71\x78\x80\x9f\x86\
-\xca\x13\x4d\x7a\x44\xd9\xf6\x1f\x31\x49\xb1\x73\x8d\x0b\x07\x5b\
-\x2e\x79\x2c\x3f\x55\xa7\x1a\x4d\x5b\xd2\xef\xf5\xf3\x26\xd7\x6a\
-\x34\x5d\x3a\x59\x4d\x02\x40\x57\xbd\xa7\x9c\xf8\x76\xf8\x1b\x57\
-\x0f\xf4\xf6\x4b\x7f\x28\xa9\x45\x0d\x76\xac\x70\x71\x40\x67\x11\
-\x92\x3d\x58\x1b\xf4\x1c\x7e\x6c\xe4\x6c\xcd\x44\xa5\x22\x1e\xe6\
-\xf5\x35\xf9\x81\x48\xd3\xd8\x92\x46\x26\xad\x1e\xc2\x46\x39\xa6\
-\x16\xd5\x94\x29\xcb\x26\x8b\x72\x46\x5d\x53\x0b\x94\x14\xde\x48\
-\x3c\x18\x05\x35\x08\x9c\x40\xda\x98\xcc\x7e\x57\x0d\xbd\xa7\x5c\
-\x12\x95\xe4\x7e\xff\x32\xb9\x8d\x84\x67\x6a\x72\x08\x56\x53\xf1\
-\x4c\x51\x95\x23\xff\xef\xc7\xa4\xaf\x1e\x78\x29\x9f\xeb\xeb\x6b\
-\x0a\x63\xbd\x76\xee\x6e\x9a\x05\xb4\xf9\x66\xd4\x1b\xe8\x5a\xe2\
-\xba\x17\x75\x0e\x6e\xd9\xb4\x69\x29\x32\x49\x9b\x49\x58\x9b\x04\
-\xd3\x91\x97\x74\x61\xa1\x4c\x6f\x4d\x5c\x06\x11\x47\x05\xed\x1b\
-\x1f\x8f\x7b\xc9\x9e\xe2\xf2\xd5\x03\xbd\x9b\xa4\x3f\x92\xdc\xf5\
-\x32\xd4\x03\x75\x56\x53\x69\x2e\x43\x2e\x96\xb0\xe1\x52\xd2\x73\
-\x44\xf4\xda\x1a\x00\xd6\xd7\xf0\xdb\x86\xe9\x48\x6d\xce\x84\x35\
-\x4e\x45\x68\xa9\x30\x8b\x44\x31\x93\xa4\xe2\x99\x8e\xcb\x2b\x1c\
-\x74\x7b\xf3\x80\x90\x36\xcb\x13\x92\xa2\x27\x27\xb8\x0f\xa8\xfd\
-\xc0\x61\x32\x9a\xf5\xc2\x65\x18\x43\x6c\xe5\x21\x33\xb4\x0c\x51\
-\xe6\xcd\xa4\xa4\x54\xc8\x61\x4f\xcc\x24\xac\xa3\x01\x12\xd7\xd2\
-\x28\xf8\x4f\xa7\x00\xe4\xa2\x0a\x19\x8e\x31\x47\x6f\x40\x30\x5b\
-\x13\xf6\xde\x1a\xc5\xe3\x23\x83\xfc\xfe\x9a\x16\xc0\xd9\xe1\x07\
-\x92\xed\x3b\xef\x7f\x9e\x83\x69\x78\xe5\xa0\x0f\xa9\xfe\x83\x53\
-\xd5\xfd\x38\x6c\xf5\x39\x10\xad\x72\x3a\xb0\xab\x0e\x05\xc3\xe8\
-\xe7\x30\x98\x84\xcd\x1d\x09\x89\x4f\xca\x9b\x7e\x3e\xab\x32\xab\
-\xd6\xb2\x2a\x94\xf1\x46\x31\x3e\x55\x11\xfb\x71\x2f\x4c\xfd\x52\
-\xd2\x5a\x1a\x45\x2a\x51\x13\xac\xd4\x51\xf0\x80\x6e\x0f\x6c\xd9\
-\xba\x68\x83\x34\x69\x86\xd9\x9a\xc3\x56\xbf\x5e\xee\xd5\x03\xeb\
-\x6b\xd6\x0d\xf1\xc2\x61\xd7\xb1\xf5\xc7\x79\x96\xb5\x02\xaa\x24\
-\x5c\xbf\xe2\xfd\x1f\x6e\xd3\xe8\x8f\x0b\xeb\x0e\x98\xde\x46\xd4\
-\x63\x75\x5c\xff\x4d\x23\xa8\x78\x30\x71\xe9\x61\xc1\xa9\x7c\x50\
-\xa3\xc7\x69\x7b\xb6\x46\x0d\xf2\xc1\x7c\x24\xe5\x2b\xf9\x7c\x52\
-\x08\x0d\xa3\xa0\x06\x81\x53\xd2\x68\xde\x15\x20\x68\x76\x95\xc6\
-\x30\xeb\x68\x36\x7b\x82\x26\x71\x2d\x8d\xa2\xd0\x33\x35\xcd\x30\
-\x30\x35\x3c\xe6\xa6\xe7\xb0\x77\x5d\x22\xba\x8f\x5e\x20\xf7\xea\
-\x01\x61\xf3\xd0\xd0\xa0\x53\xc2\x86\xab\x83\x9b\x04\xc7\xda\xb0\
-\x2a\x07\xc7\xd2\x54\x45\xf5\x13\x10\x30\x41\xe7\x1f\x97\xae\x51\
-\x28\xe2\x50\xd8\x5c\x4f\x13\x27\x6c\xe0\xf7\x8d\xe6\xa3\xd1\xdf\
-\xe7\x81\x9a\x3c\x50\x66\xc8\x20\x2e\x3d\x28\x08\xf8\x7d\xb8\x85\
-\xc1\xc0\x25\x72\x8b\x22\x57\xa2\x46\x35\xca\x24\xb0\xe1\x18\x73\
-\xc8\x6d\xd0\x44\x5b\x75\x2d\x5a\x26\x9e\xf7\x91\xbf\x92\x7b\xe1\
-\xc0\x8b\xf9\x5c\x13\x36\x79\xc2\x56\xb1\x15\xc5\x1a\x90\x0f\xe5\
-\x14\xaa\xcc\x60\xab\xbb\x34\xc0\xcf\x94\x0b\x23\xee\x9c\x09\x75\
-\x71\x50\x44\x9a\x40\x23\x97\x88\x13\x36\x75\x02\x53\x6e\x93\x50\
-\x7f\x14\x37\x21\xeb\x4d\xb9\x46\x18\x94\xd7\x55\xe5\x95\x04\x08\
-\x1a\x98\xa1\x29\x7b\x7f\x64\x22\x58\xb3\x7a\xa0\x37\xf4\x6b\xdc\
-\x51\xf0\x9a\x1a\x0d\xea\x01\x9d\xc5\x97\x39\xe8\xb2\x8d\x68\x40\
-\x4b\x5f\xbf\x5a\x2c\x79\xc3\xf1\x72\x2f\x1c\x16\x36\x6e\x92\x74\
-\xa7\x01\xdb\xa9\x16\x01\xc8\x69\x94\x6b\x26\xcd\xbe\x5e\xa3\xa8\
-\xf4\x26\xa5\xdb\x58\xd0\x24\x04\xd4\x4f\x27\xd5\xd3\x9a\xb3\x84\
-\xf1\x26\xa1\xff\xbe\xb1\x98\xa2\x31\x14\x34\xb0\x38\xf8\x3d\x55\
-\x2f\x1e\x63\x51\x83\x1d\x07\x78\x40\x37\x87\xba\x6c\x5b\xd5\x06\
-\xab\x3e\xfb\xe5\xd8\x45\xc3\x00\x08\x9b\xc7\x46\x47\x72\x2d\x6c\
-\xb8\x05\x35\x87\x3c\x94\x33\xa5\x20\x6b\x34\x26\x8a\x94\xe8\x71\
-\xe8\xb7\x9e\x1a\xc5\x24\xa6\xa4\xb0\x70\xbe\xea\x66\x42\x82\x5f\
-\xed\x47\xfd\x3e\xea\xb8\x22\xe9\xbc\xcb\x34\x92\x77\x43\x41\x03\
-\x5c\x86\x79\x84\x3b\x48\x6e\x66\x6a\xa8\x07\x6a\xca\x4e\x82\x49\
-\x49\x46\x82\x01\x6e\x43\x1d\x7b\x59\xf4\x9b\x86\x15\x7b\xbd\x06\
-\xc6\x33\x36\x78\x6c\x15\x13\x97\x3e\x0d\xd6\xca\x91\x30\x62\x93\
-\xa8\x8c\xc2\x36\x98\xc6\xa0\x98\x51\xd1\x35\x18\x6d\x2e\xa8\xc9\
-\x03\x65\x86\xb4\xb8\x92\xc6\xdb\x49\xef\xbc\xa1\xa0\x81\xdb\x4e\
-\xa8\x47\xb8\x83\xf0\xed\x27\x4b\xb8\x38\x4b\x52\xa4\x19\x20\xcc\
-\x6d\x28\x80\x6f\x45\x31\x36\xa1\xac\x56\x7a\x54\x49\xb7\xe2\xd2\
-\x62\x92\x5c\xca\x16\x63\xab\xf5\x61\x6e\x59\xc2\xb5\x75\x47\x4d\
-\x52\x9c\x36\xae\x89\x41\xbf\x6e\x92\x28\x69\x84\x14\x33\x34\xa9\
-\x6e\x3b\x29\xac\x88\x1a\x1e\xd0\x99\x34\xa0\x6d\x80\x6c\x80\xab\
-\x3e\x7b\x65\xec\xd3\x50\x0a\x16\x36\xf9\xc7\xd6\x7a\x1a\xb6\xf8\
-\x0c\x54\x65\x91\xd7\x32\xb5\x96\x2e\x2d\xe2\xa4\x6b\x24\xd5\xd3\
-\x9a\xb3\x09\x91\xe9\xa7\x29\x45\x49\xda\x98\xc2\x7e\x07\x82\x66\
-\xa7\x99\xa0\x01\x2e\x49\x73\xdb\x49\x61\x24\x6a\xb8\xcf\xb7\x07\
-\xb6\x6c\x59\x7c\xe1\xe9\x5c\xb8\x5c\xac\xfa\xf4\xa7\xe4\x5e\x3c\
-\x20\x6c\xee\x1f\x3c\x90\x9b\x17\xf4\xb1\xf5\x5a\x07\x9b\x7f\x25\
-\x63\xb1\x95\x82\xbc\xae\xa7\x49\x4b\xf6\x96\x32\x83\x32\xbd\x35\
-\x71\x21\x22\x2e\x7b\x63\xd0\xd6\xb1\x51\x53\x41\xf3\x3d\x4f\xd0\
-\x7c\x57\xfa\x53\x91\x8b\xdb\x4f\xd4\x03\x75\x1e\x3a\x09\xd7\x20\
-\x17\x4b\xd8\x70\x96\x59\xf8\xf2\x37\x8b\xa3\x3e\x79\x91\xdc\x8b\
-\x67\xd4\x13\x34\xf0\x82\x3e\xfe\xa4\x42\x3d\xb6\xcc\xc9\x2d\x15\
-\x47\x52\x39\x59\x2b\x47\xc2\x88\x4d\xa2\x32\x0a\x9b\x32\x8d\x46\
-\xb3\x26\x45\x40\xcb\x10\x65\xde\xc2\xca\x71\xa4\x32\x29\x76\x96\
-\x46\xb1\xef\xa1\x51\x6c\xf0\x9c\xd1\x3b\x69\xc2\xe0\x35\x35\x1e\
-\xe4\xa2\xca\xd6\x08\xc0\xa0\xd1\x4d\xf0\x9c\xf7\xfe\x2d\x6a\x7d\
-\x0d\x00\x2f\xe8\xfb\xe3\xd0\x01\xb1\xa5\x84\x7a\x75\x37\x93\x03\
-\xf2\xfa\x47\x8c\xad\x6e\xc0\xd6\x7a\x1a\x13\x28\xb3\x66\xcb\x7a\
-\x7a\x39\x65\x55\x43\x92\xae\xab\x9f\x37\x49\x23\x65\x7e\xa8\xdb\
-\x4f\xff\xe4\x84\xd8\x5d\x42\xbd\x29\x58\xc7\x5f\x47\xb3\x1a\xf9\
-\x29\x84\x38\xd0\xa2\x06\x9b\x3e\x1e\xd0\xb3\xc7\x45\x1b\xa0\x05\
-\x63\xca\x06\x08\xeb\x6b\xe6\xbe\xf8\x60\xb9\x97\xcc\xd3\x23\x83\
-\xe2\xe1\x91\x61\x5e\x67\x93\x03\xf2\xb0\x28\xd6\x16\x36\x04\x59\
-\x96\xa2\xc7\x56\x99\x9a\xc4\xdb\x54\xbb\x6a\x17\x4b\xba\xae\x91\
-\xad\x8d\x82\xd2\xe5\x38\x6d\x4c\xf0\x3b\xb8\xc9\xb4\xa7\x5c\x12\
-\x7d\x9e\x4b\x01\x08\x9a\xf5\xd2\xdf\x10\x3c\x53\x93\x03\x58\x30\
-\xda\x07\xd6\xd7\x1c\xf7\xcf\xc9\xef\xaf\xd1\x81\x47\xbe\xb3\x58\
-\x67\xc3\x56\x66\x9a\x89\xad\xfa\x66\xf3\xd3\x08\x59\xe0\x5a\xbb\
-\xa4\x4c\x6f\x4d\x5c\x21\x11\x8f\x7b\x63\xd3\x8e\xb1\x51\x31\x3c\
-\x99\xea\xd6\xfd\xa5\x9e\xa0\x31\x7a\x6b\x70\x1c\x99\x8b\x1a\xf4\
-\x5f\xe8\xd8\x70\xce\x55\xbd\xec\xa1\xb6\x81\x17\x50\x7a\xf2\x05\
-\x7c\xf4\xf2\xa4\xab\xcd\x84\x0d\xac\xb3\xb9\x7f\xa0\xbf\xa5\x6f\
-\x47\xd9\x32\x67\x91\x5b\x2a\x65\x99\x25\x45\x15\x76\x9e\x64\xb6\
-\xa6\x09\x06\x6a\xf4\x12\x69\xcb\x39\x69\x9c\x68\x42\xd6\x9b\x72\
-\x8d\x69\xb4\x8b\x51\x5e\x17\xca\xb1\xcf\x13\x32\xdb\xc6\x46\xfc\
-\x0f\x54\xa6\x00\x16\x06\xa7\x7a\x1f\x4d\x14\x2d\x3f\x53\x43\x2e\
-\xaa\x6c\x8d\x00\x05\x06\x5d\xb6\xc8\xe6\x18\x17\xdd\xbc\xe3\x4f\
-\x17\xab\x2e\xfb\x98\xdc\xc3\x03\xb7\xa3\xd6\x0d\x0f\x89\x31\xb3\
-\x95\xfc\x8c\x65\x5a\xed\x8f\x18\x13\xb1\x52\xe4\xdb\x76\x49\xe8\
-\x79\xb7\x96\xde\x84\x88\xf5\xd3\x94\x22\x8a\x32\x3f\x7a\xba\x4c\
-\xe3\x9d\x10\x15\xb1\xbd\x34\x96\xf6\x76\x13\x00\x82\x26\xf5\xfb\
-\x68\xa2\x20\x15\x35\x3c\xa0\xdb\x83\x45\x15\x1d\x4b\xcf\xbe\x50\
-\x3c\xff\x73\x1f\x92\x7b\x78\xa0\xf1\xae\x1d\xe4\x45\xc4\xcd\xa4\
-\xc8\x03\x73\x33\x04\x59\x52\xf9\x51\xa6\xc0\x56\x6e\x4c\xe2\xcd\
-\x2a\x0d\xa4\xd7\x35\x88\xac\x19\x75\x28\xec\x0a\x7d\x93\xe3\x62\
-\xf3\xe8\x88\x28\x55\x52\xdf\x9a\xdf\x60\x43\xd0\x00\x4e\xcc\xd4\
-\x50\xff\x25\x9f\x27\x58\x83\x64\xc3\xca\xb7\xff\x65\x2a\x61\x03\
-\x4f\x47\xc1\xac\xcd\xda\xc1\x01\xb1\x7f\x82\x7e\xad\x4d\xde\xaa\
-\x03\xd7\xcf\x7c\x93\x64\x9e\xd4\xe6\x6b\xd0\xee\xcd\x58\x4f\x63\
-\xab\x6e\x5a\x8a\xb6\xa9\xd4\xe4\x81\x30\x43\xa3\x9e\x88\xd9\x56\
-\x1a\x15\xfb\xd3\xcf\xce\x00\xf0\xe8\xf6\x99\x55\x2f\x3d\x99\x8a\
-\x1a\x9e\x55\xc8\x1e\xf2\x19\x20\x87\x6c\x9a\x56\xd8\x00\xf0\xb2\
-\xbe\xf5\x83\xfd\xb9\xff\x28\x66\x5e\x29\x72\x89\x51\x56\x07\x3d\
-\x2a\x5b\xb3\x56\x59\x61\xab\x0e\x24\xcf\x4e\x65\x5f\xfb\xb2\x4a\
-\x81\x7e\x5d\x93\x72\x80\x3e\x6e\xcf\x78\xc9\x5f\x0c\xdc\xc0\xec\
-\x0c\xe0\x0b\x9a\xd5\x04\x8f\x6e\x47\xd1\xd2\x6b\x6a\xa8\x07\x74\
-\x16\x69\xe6\xa0\xcb\x16\xd9\x00\x4d\x4d\xd0\x88\xb0\x01\x76\x7a\
-\x8d\xfc\xde\x81\x7e\xb1\xb1\x54\x62\x71\x43\x8c\x0b\x83\x53\xab\
-\xe1\x5a\x89\x5b\x4b\x6f\x42\xc4\xfa\xe9\xa4\x7a\x5a\x73\x96\x30\
-\x5e\x13\xa2\x62\x82\x77\xcd\xf4\x79\x7f\xc0\x6d\x1d\x1b\x11\x83\
-\xe3\xe3\xf2\x68\x6a\xac\x0b\x1a\x80\x4c\xd4\xf0\x80\x6e\x0e\xb6\
-\xc8\x58\x54\xd9\xe5\xe0\xf3\x2e\x6e\x48\xd8\xc0\x2d\xa9\x4d\x23\
-\x43\x0d\x8b\x1b\xb6\x5e\x73\xc8\x43\x39\xe7\x41\x90\x51\xa6\x40\
-\x8f\xab\xd5\x3e\x8d\x60\xeb\xba\x69\xa1\x48\x8f\x12\x33\x9b\x3c\
-\x31\x03\xb7\x9a\x0c\x5f\xa4\x17\xc6\x4d\x9e\xb3\x2e\x68\x80\xcc\
-\x66\x6a\xa8\x07\x6a\xfe\xab\xcd\x1e\x68\xb1\xd4\x78\xc5\x6f\x3a\
-\x2a\x6f\x20\x6c\x5e\x74\xe5\xdf\x19\x3d\xee\x1d\x84\x4a\xdc\xe4\
-\x05\x5b\xc9\x77\xbb\x54\x9a\x47\x52\x39\x35\x7a\x3e\x12\x42\x03\
-\x99\x44\x65\x14\x96\x30\x8d\x3a\x96\xa2\xcd\x0e\xc3\x0c\xc1\xb3\
-\x9d\x4a\xcc\xf4\xd2\x88\x19\x00\x9e\x72\x7a\x6b\x33\x04\x0d\xd0\
-\xd2\xb7\x9f\x28\x71\x71\x96\xc4\xc5\x34\xdb\x64\xc9\xeb\x56\x8b\
-\x13\xaf\xbe\xb2\x21\x61\x03\xe8\xe2\xe6\xc9\xb1\x51\x7e\x0c\xbc\
-\x85\xb0\xd5\xa4\xf2\xb0\x9e\x86\x32\x6b\xb6\x7a\x9e\x3c\xdc\xb2\
-\x4c\xba\x82\x7e\xde\x7e\x6a\x66\xa8\xbd\x6e\xed\x95\xd5\x9a\x99\
-\x4d\xa3\xc3\x94\x62\x06\xb8\xdc\x13\x33\x56\x9e\x72\x8a\x82\x44\
-\xd4\x14\x79\x40\xe7\x81\xdf\x1e\x68\x1b\x20\x9b\x3e\x85\xa9\xe6\
-\x1d\x77\xba\x38\xf5\x57\x37\x8b\x39\x27\xe1\x3f\xa9\x10\x05\x88\
-\x9b\x6d\xa3\x23\xe2\xde\x03\x7d\xfe\x27\x17\xf8\x43\x99\x78\x6c\
-\x0d\x4e\xdc\x9a\xe9\xc9\x6b\x99\x5a\x4b\x97\x16\x71\xd2\x35\x8c\
-\xea\x69\x42\x50\xfd\x34\x95\x38\x1b\xae\x4c\xfa\xef\x9a\x01\x31\
-\x33\x30\x3e\x4e\x29\x66\xe0\x5b\x4e\xef\xf5\x04\xcd\x65\xd5\x7a\
-\xa1\xf8\xfc\x00\x00\x1c\xb8\x49\x44\x41\x54\xdd\xe6\xc1\x33\x35\
-\x19\x81\xad\x3b\x2c\xbe\xec\x11\x55\x66\x9d\x0b\x97\x89\x93\xae\
-\xba\x56\x2c\x3f\xef\x34\x79\xa4\x71\xe0\x93\x0b\xf0\xa1\xcc\x3b\
-\x3d\x81\x03\xb3\x37\xc1\x4f\x2f\xb0\xf5\x5a\x07\xaa\x01\x29\x8e\
-\xa4\x2b\xd8\x4a\x41\xab\xad\xa7\xc9\x1b\x98\xf4\x96\xa6\x2a\x62\
-\xdf\x44\x59\x3c\xe3\x09\x19\x78\x9a\x69\x24\xdd\xa7\x0d\xe2\x00\
-\x41\x03\xeb\x67\xbe\x5b\xdd\x6d\x2e\x99\x88\x1a\xea\x81\xba\x19\
-\x9d\x44\xd1\x20\x17\x4b\xd8\x70\x8e\x00\xc2\x66\xd5\xe7\xbe\x25\
-\x8e\xfa\xe4\x45\xf2\x08\x0d\x6a\xf6\x06\x3e\xbd\x70\x9f\xbc\x3d\
-\xd5\xec\x6f\x4b\x61\xb0\x65\x4e\x6e\xa9\x38\x92\xca\xc9\x5a\x39\
-\x12\x46\x6c\x12\x95\x51\xd8\x94\x69\x4c\x1a\x27\x08\xb3\x9e\x0f\
-\xb4\x0c\x8d\x79\x42\x66\xaf\x27\x64\x9e\x1d\x1b\x16\x9b\x3d\x31\
-\xd3\x57\x2e\x53\xce\xca\xe8\xac\xf1\xdc\x11\x9e\xa0\x21\xf9\x38\
-\x65\x1a\x5a\x72\xa6\x86\x5c\x54\xd9\x1a\x01\x18\x34\xb6\x4c\x70\
-\xd8\x7b\x3e\x29\xfe\xe4\x27\xdf\x10\xb3\x8e\x5e\x20\x8f\xd0\x01\
-\xdf\x95\x52\x02\xe7\xae\x03\x7d\xfe\x3b\x6f\x76\x94\xc7\x79\x0d\
-\x4e\x02\x79\xfd\x23\xc6\x56\x1d\xe4\xf5\x34\x38\xf4\x72\xca\xaa\
-\x86\x24\x5d\x57\x3f\x6f\x92\x46\xd3\xfc\xc0\x07\x26\x07\x2a\x13\
-\x62\xd7\x78\x49\x3c\x35\x3a\x24\x85\x4c\x49\x8c\xdb\xed\x5b\x60\
-\xfd\x4c\x53\x9e\x70\x8a\xa3\x61\x51\xc3\x03\x7a\xf6\xb8\x68\x03\
-\xb4\x60\x34\x6e\xce\xf4\xcc\x7d\xd1\xcb\xc5\x4b\xae\xf9\x19\xe9\
-\xed\xa8\x20\x30\x83\xb3\x6b\x6c\x54\x3c\x31\x3c\x20\xee\xf3\x04\
-\x0e\xcc\xe2\x80\xc8\x81\x4f\x32\xf4\x59\x78\x73\x71\x9e\xb1\x35\
-\x88\xe7\xa1\x95\x14\x6d\x56\xd9\x56\x6e\x4c\xe2\x6d\x6a\x89\x6a\
-\x17\x4b\xba\xae\x91\xad\x8d\x82\xd6\x07\x1e\xf1\xfa\x0f\xf8\xb0\
-\xe4\x8e\xd2\x98\xd8\xe8\x09\x98\x8d\x23\x43\xfe\x3b\xb4\x0e\x8c\
-\x5b\x9b\x91\xd1\xd9\xec\xb9\x17\x67\xb1\x7e\x26\x8c\x36\x35\xb8\
-\xb4\x79\xc0\xe6\xc3\x1f\xb9\x34\xb4\x07\xfd\xd3\x33\xcf\x14\x67\
-\x9f\xf5\x1a\xb9\x37\x43\x9a\x01\x15\x3d\xa0\x21\xc2\xa5\xe9\x24\
-\x28\xaf\x0f\x98\x96\x01\x36\xb8\xad\xeb\x03\xe4\x71\x1b\xa6\x01\
-\x7d\x7d\xa4\x7d\x4d\x8b\x20\x6d\xfe\x7b\x6f\xfd\x6f\xf1\xc4\xe5\
-\xff\x21\x26\xfb\x1a\x7a\x4d\x78\x2a\x7a\x3a\x3a\xc4\xec\x8e\x4e\
-\x71\x50\x67\x97\xe8\xf0\x86\xfe\xf9\xde\x3e\xb0\xa8\xb3\xba\xa5\
-\xc4\xb4\x3c\xb1\x60\xa2\x75\x75\x91\x30\xa6\xcc\xd0\xf5\x59\x6e\
-\x81\x60\x79\x24\xc5\xd0\xd0\xf9\x88\x93\x51\xbf\xd1\x8f\x63\x3f\
-\x8d\x10\x3c\x17\x16\x36\xea\xf7\x61\x65\xac\x0e\x25\xcd\xd4\x24\
-\x95\x7d\xf0\x6c\x68\x68\xed\x60\xf8\x35\x66\x08\xbb\x5e\xed\x79\
-\x8d\xb0\xc8\x34\xe0\xf4\x88\x7c\x93\x2f\xac\x89\x99\xf4\x0a\x62\
-\xd8\x13\x31\x30\xf3\x62\x79\xf6\x25\x89\x2b\x3d\x77\x59\xd6\xb3\
-\x33\x3a\x4d\x17\x35\x69\x07\x93\x28\xd2\x74\x70\xe4\x69\x30\x2e\
-\x03\xe9\x49\xc0\xde\xf5\x89\xe3\x35\xbc\x3e\x80\x4e\x03\xd2\xbe\
-\xa6\x49\x68\xa4\x0c\x26\xfa\xf7\x8a\x67\xfe\xe3\xd3\x62\xcf\xf5\
-\xbf\x93\x47\xf2\xc3\xa2\x59\x8d\x3d\x8e\x6e\x93\x34\x6d\xd5\x15\
-\x52\x34\x81\x42\x60\x2b\xdb\xe4\x75\x85\x28\xba\x46\xa2\x49\x93\
-\xa7\xe1\x89\xdc\x3e\x31\x09\xb3\x33\xef\xf1\xc4\xcc\x1d\xd5\xdd\
-\xfc\xd0\x72\xa2\x86\xfc\xfa\x86\xf9\x07\xb0\x3f\xb1\x95\x06\xf2\
-\x78\x6d\x5d\x1f\x69\x5b\xc3\xcb\xfb\x50\x94\xc1\x81\xfb\x7e\x29\
-\x9e\xfe\xca\x95\x62\x64\xfd\x2e\x79\x84\x61\x18\xa6\xd0\xc0\x93\
-\x4d\x5f\xca\xcb\xad\xa6\x30\x1a\x5a\x53\x83\x1e\xf4\x98\x69\xb0\
-\x45\x46\x31\xe8\x32\x76\x39\xe8\x65\x6f\x12\x2f\xb9\xf6\x56\x71\
-\xe4\x27\x2e\x6a\xf8\x85\x7d\x0c\xc3\x30\x39\xe7\x7b\x9e\x3b\x29\
-\xcf\x82\x06\xc8\xe5\xd3\x4f\xe8\x01\xdd\x70\x96\x86\xb1\x80\x83\
-\xa2\x8a\x5a\x30\x1e\xfa\xee\x8f\x8b\x93\x7f\xf9\x4b\xf1\x9c\xbf\
-\x3c\x87\xc5\x0d\xc3\x30\x45\x03\x1e\xd3\x7e\x95\x27\x66\xe0\x76\
-\xd3\xa6\xea\xa1\xfc\xd2\x54\x51\xc3\xb3\x0a\xd9\x43\x3d\xa0\x33\
-\x55\x3a\x0f\x5a\x26\x0e\xbf\xf8\x73\xe2\xc5\x3f\xfc\x9e\x58\x76\
-\xde\xa9\xf2\x28\xc3\x30\x8c\xb3\x28\x31\x03\x8f\x69\xe7\x6e\xed\
-\x4c\x14\x2d\xf5\x9e\x1a\xea\x01\x9d\x07\x7e\x73\xd0\x65\x6b\x71\
-\x3d\x8d\x4d\x7a\x0e\x3f\x56\xbc\xe0\xf2\xab\xc5\x4b\x7f\xf5\x23\
-\x9e\xb9\x61\x18\xc6\x45\x9c\x14\x33\x8a\xd4\xa2\x86\x07\x74\x73\
-\xb0\x45\xc6\xa2\xca\x1e\xd4\x65\x1b\x15\x0e\xc4\x0d\xcc\xdc\xc0\
-\x6d\x29\x58\x73\x63\xe3\xe5\x7d\x0c\xc3\x30\x84\xc0\x9a\x19\x78\
-\xdf\x8c\x93\x62\x46\xd1\xb4\x99\x1a\xf2\xc1\x84\xd7\xd3\x58\x03\
-\x6b\x03\x2f\xa0\xf4\x30\x51\xc0\x6d\x29\x58\x73\x73\xca\xcf\xef\
-\x12\xc7\x7e\xf1\x6f\xc5\xe2\x37\x1c\x2f\xcf\x30\x0c\xc3\x64\x0e\
-\x3c\x9a\x7d\xa9\xe7\x16\x79\x42\x06\xd6\xcc\x64\xf6\x79\x03\x2a\
-\x5a\xea\xf6\x13\x06\x6a\xf1\x95\x27\x5c\x4c\x73\x91\x58\xf2\xba\
-\x77\x8a\x63\xff\xed\x1a\x71\xea\x3d\xbf\x11\x47\x7e\xe2\x42\x92\
-\x2f\x81\x33\x0c\xc3\x18\x02\x8f\x65\xab\x59\x19\xf8\x4e\x13\x3c\
-\xa2\x9d\x9b\x97\xe7\x35\x4a\xaa\xf7\xd4\xa4\x19\x1c\xa9\xc5\x02\
-\xbf\x9f\xc6\x3c\x0d\xe4\xf1\xda\xba\x3e\xd2\xb6\x86\x97\xf7\xa1\
-\x2e\x03\x74\x59\x49\x82\xe1\x4b\x5b\x1e\x17\xbd\x77\xfc\x42\xec\
-\xbf\xef\x5e\x71\xe0\xae\x67\xe5\x51\x86\x61\x18\x3a\xa6\xda\xc4\
-\x16\xd1\x26\x6e\x9c\x6a\x6b\xbb\xe3\x5d\xfd\xbd\x37\x7a\xfd\x50\
-\x8a\xde\xd3\x0d\x58\xd4\x04\xa0\x0e\xa7\xc0\x06\xb7\x75\x7d\x80\
-\x3c\x6e\xc3\x34\xa0\xaf\x6f\x49\xd4\x50\xe7\x1f\x5d\x4e\x1a\x71\
-\xbf\x99\x38\xb0\x4f\x0c\xac\xfd\x8d\xe8\x5f\x7f\xbf\x38\xb0\xe1\
-\x11\x7e\xa9\x1f\xc3\x30\xa9\xf0\x44\xcc\xc0\xe4\xac\xb6\x7b\x3c\
-\xb7\x66\x7c\x6e\xfb\xed\x1f\x7c\x6a\xcf\x3a\xef\x30\x7c\x4f\x01\
-\x3a\x20\xaf\x1b\x4a\xd1\x79\x39\x42\x53\x44\x0d\x36\x3c\x3a\x9c\
-\xa1\xa0\x01\xc8\xd3\x60\x5c\x06\xd2\x93\x80\xbd\xeb\x13\xc7\x6b\
-\x78\x7d\x00\x9d\x86\x16\x15\x35\x0a\x15\x06\x44\xce\xe0\xfd\xff\
-\x2b\x86\x9e\x7a\x54\x1c\xf8\xc3\xc3\x62\xf8\x91\x1d\x99\x7c\x73\
-\x8a\x61\x98\x7c\x33\x76\x50\xfb\xba\x89\x9e\xf6\x6d\xc3\x0b\x7a\
-\xee\xeb\x9f\x33\x77\xc3\x15\x77\x3f\x06\x22\x06\x3a\x8b\x71\xe9\
-\x60\x5c\x67\x51\xa3\xe3\xb2\xa8\x21\xbf\xbe\x61\xfe\x01\xec\x4f\
-\x6c\xa5\x81\x3c\x5e\xc3\xeb\x03\x98\xb8\x6d\x09\x1a\x80\xba\x0c\
-\xd0\x65\x25\xa1\x88\x17\x84\xce\xc8\x63\xf7\x8b\xb1\x1d\x5b\x44\
-\x69\xf7\x0e\x31\xb6\x67\xb7\x28\xed\xda\x23\x26\x86\x46\x79\x66\
-\x87\x61\x0a\x4a\xe9\xb9\x3d\xa2\x3c\x7f\xce\x48\xfb\xde\x81\x4d\
-\xfd\x4b\xe6\x3d\xe2\x75\x12\x95\x9d\x73\x16\x6c\xd8\x2d\x66\x6d\
-\xbf\x76\xcd\xfd\x5b\x20\x88\xe7\xc6\x3c\x37\x2a\xb7\xb0\xcf\xa2\
-\x06\x36\x49\xa2\x26\x4d\x59\x60\x7f\x83\x0e\xd7\xe2\xa2\x26\xdd\
-\xf5\x89\xf3\x66\x98\x06\xf4\xf5\x59\xd4\xa4\x88\x57\x7a\x02\x0c\
-\xfe\xfe\x66\xe9\xab\x82\xbe\xbe\xdc\x1a\x61\x98\xe6\x24\x4c\x63\
-\xb3\x55\xb6\x58\xb0\xb1\xa2\xaf\x6f\x27\x99\x3e\xd6\x66\x42\x89\
-\x13\x9d\xca\x54\x88\x1f\xd1\xa6\xb2\x16\x7c\x3d\x94\x9e\x10\xd6\
-\x3e\xf2\xb8\xd8\x35\x5a\x11\x63\x5d\xf3\xe4\x91\x2a\xe5\x72\xe9\
-\xd1\x6f\x7e\xe3\xeb\x97\x7b\x5e\x10\x27\x30\x4e\x2b\xc1\xa2\x04\
-\x0c\x8b\x1a\x0f\xe7\x44\x4d\x9a\x86\x43\x79\x7d\xc0\xb4\x0c\xb0\
-\xc1\x6d\x5d\x1f\x20\x8f\xdb\x30\x0d\xe8\xeb\x23\xed\x6b\x5a\x04\
-\xd4\xf9\x47\x97\x93\x86\xad\xb8\xf1\xc1\x6d\x5d\x9f\x36\x5e\xc3\
-\xcb\x4b\xa8\xd3\x60\x96\x08\xea\xbc\x99\x5e\xbf\x4a\xf2\x6f\x6c\
-\xda\x80\xbe\x6c\xcd\x12\x91\x07\x1b\xa0\x7f\x13\x13\xee\xe6\x5b\
-\x6e\x15\xbb\x77\xd5\xcf\xba\xb2\xa8\xc1\x61\xfd\x91\x6e\x6c\xd9\
-\x15\xb8\x8c\x33\x87\xdc\x06\x6c\x2b\x63\xb8\x1d\xb8\x83\x9b\x36\
-\xe0\x7a\x93\x35\xdc\x7f\xe6\x83\xc2\xbf\xa7\x86\x7a\x30\xe1\x41\
-\xc7\x1c\x74\xd9\x22\x3b\x66\x36\x81\x3d\xdc\xac\xdf\xd8\x7a\xc3\
-\x15\xc7\x16\xf4\xfd\x27\xdb\x8a\x49\x87\x91\xa8\xe1\x4e\xc1\x1c\
-\x6c\x91\xd1\x77\x0a\x8c\x2d\xf2\x64\x03\x7c\x52\xb8\xde\xd8\x02\
-\xdf\x76\xa5\x27\x01\x6e\xe3\xe6\xb0\x0d\x18\x85\xd5\x99\x1a\x7c\
-\x45\x43\x86\xe3\x8e\x39\x7b\x1c\x6c\xec\xd4\xf5\x90\x99\x81\xbc\
-\x8d\xb3\x09\x52\xc0\x36\x70\x06\x2e\x5c\xeb\x14\xfe\xf6\x13\x25\
-\x2e\x0e\x7a\xd4\x83\x0e\x63\x0e\xdb\xc0\x26\xb4\x65\xcb\x36\xc8\
-\x03\xee\xd9\x80\xeb\x4d\x7e\x28\xb4\xa8\xe1\x8e\x2c\x7b\xd0\x36\
-\x40\x0f\x4e\xd2\xc3\x18\x94\x05\xb6\x6c\xb9\x70\xb3\xc6\x45\x1b\
-\x70\x3f\xcb\xe4\x09\x9e\xa9\xb1\x08\xb6\x0d\x73\xa7\x60\x0f\xea\
-\xb2\x65\x1b\x30\x3a\xf8\x7a\x23\x3d\x0c\x39\xd4\x36\xe0\x36\xee\
-\x36\xd6\x44\x0d\xf5\x20\xc1\xeb\x69\xcc\xa1\xb6\x81\x17\x50\x7a\
-\x18\x86\xbe\x7e\x71\xf5\x4a\x03\xdb\x20\x6b\xb8\xff\xcc\x17\x2d\
-\x3f\x53\x43\xdd\x31\x33\xf6\x70\xd1\x04\x5c\xbf\x6c\x42\x5b\xb6\
-\x6c\x03\x73\xe8\xcb\x96\x6d\xc0\x34\x46\x61\x45\x0d\x77\x50\xd9\
-\x83\xee\xf0\xb8\x23\x33\x06\x5f\xbd\x91\x36\xe0\xf6\x62\x0c\x7e\
-\x40\x97\x9e\x04\xd8\x06\xd9\xc3\x36\x70\x1f\x5e\x53\x63\x09\xea\
-\x8e\x8c\x1b\x9b\x39\xd4\x65\xcb\x36\x30\x07\x5f\xb6\xd2\xc3\x30\
-\x06\x70\xfd\x62\x82\x58\x11\x35\xe4\x83\x09\xff\x25\x6f\x0c\xb5\
-\x0d\xb8\x57\x30\x87\xdc\x06\x39\xc2\xc5\x34\x17\x0f\xda\xfa\xc5\
-\x26\x35\x87\xba\xff\x64\x13\x34\x4e\x21\x67\x6a\xa8\x07\x13\xee\
-\xc0\xed\xc1\x8f\x72\x33\xe9\xe0\x36\x9e\x35\xf4\x65\xcb\x36\x60\
-\x1a\x87\x6f\x3f\x65\x48\x91\x3b\x5c\x1e\x24\xec\x81\x2f\xda\xe2\
-\xd6\xaf\xac\xc1\xb7\x5d\xe9\x49\x80\x6d\x60\x0e\xdb\x80\x09\x23\
-\xf7\xa2\xc6\xc5\x5b\x4f\xdc\x36\xb2\x07\xdf\xe1\xd1\x86\x6b\x05\
-\xe8\xcb\x56\x7a\x18\x72\xd8\x06\xee\xc0\x26\xa0\x81\x5c\xd4\xf0\
-\x20\x91\x3d\xe4\x36\x60\x5b\x19\xc3\xed\x20\x7b\x8a\x6d\x03\xae\
-\x37\x59\xc3\xfd\x67\x3e\x29\xdc\xed\x27\xea\x8e\xcc\xcd\x0e\x2f\
-\x5b\xd0\x65\x8b\xec\x98\xd9\x04\xf6\x70\xb3\x7e\x73\x85\xc8\x1a\
-\xfa\xfe\x93\x6d\xca\xd0\xc0\x6b\x6a\x88\xc1\xb6\x61\xfa\x4e\x81\
-\x31\xc5\x45\x1b\xe0\x93\xc2\xf5\xc6\x16\xf8\x7a\x23\x3d\x09\x70\
-\x1b\x37\x87\x6d\xc0\x44\x41\x2a\x6a\xf0\x15\x0d\x19\x8e\x3b\xe6\
-\xec\x71\xb0\xb1\x73\x07\x65\x0f\xf2\x36\xce\xa6\x4a\x01\xdb\xc0\
-\x19\xb0\x36\x90\x5b\xa6\x71\x78\xa6\x26\x06\x17\x07\x47\xea\x41\
-\x87\x31\x87\x6d\x60\x13\xda\xb2\x65\x1b\xd8\x03\x5f\xb6\xee\xd9\
-\x80\xeb\x4d\x7e\x29\x94\xa8\xe1\x8e\x2c\x7b\xd0\x36\x40\x0f\x4e\
-\xd2\xc3\x18\x94\x05\xb6\x6c\xb9\x70\xb3\xc6\x45\x1b\x70\xbd\x61\
-\xf2\x0c\xcf\xd4\x10\x82\x6d\xeb\xe8\x81\x9f\x3b\x0f\x63\xa8\xcb\
-\x96\x6d\x60\x0f\x17\x8b\x16\x5f\x6f\xa4\x87\x21\x87\xda\x06\xdc\
-\xc6\x8b\x05\x99\xa8\xa1\x1e\x24\x78\x3d\x8d\x39\xd4\x36\xf0\x02\
-\x4a\x0f\x43\x8d\x8b\x1d\x29\x79\xfd\x62\x52\x40\x6b\x03\x36\x95\
-\x39\xd4\xfd\x27\x9b\x80\x96\xc2\xcc\xd4\x50\x77\xb8\xdc\x31\x67\
-\x8f\x8b\x26\xe0\x7a\x63\x13\x6e\xe3\x59\x43\x5f\xb6\x6c\x03\x86\
-\x16\xbe\xfd\x94\x53\x5c\xec\x70\xd1\x1d\x1e\x77\x64\xc6\xe0\xab\
-\x03\xd2\x06\x0e\xd6\xaf\xac\xc1\x0f\xe8\xd2\x93\x00\xdb\x20\x7b\
-\xd8\x06\xc5\x83\x45\x0d\x11\xdc\x91\x65\x0f\x7e\xd0\xa1\x0d\xd7\
-\x0a\xd0\x97\xad\xf4\x30\x99\xe1\xa2\x0d\xb8\x7e\x31\x49\x90\x88\
-\x1a\xf2\x0e\x8f\xff\x92\x37\x86\xda\x06\xdc\x2b\x98\x43\x6e\x03\
-\xc6\x1a\x6e\xda\x80\xeb\x57\xd6\x50\xf7\x9f\x6c\x29\x7a\x0a\x31\
-\x53\x43\x3d\x98\x70\xa7\x60\x0e\xba\x6c\xd1\x1d\xb3\xf4\x30\x8c\
-\x0f\xb7\xdd\xac\xa1\xef\x3f\xd9\x56\x0c\x3d\x7c\xfb\xa9\x89\xd0\
-\x77\x0a\x8c\x2d\xf2\x64\x03\x7c\x52\xb8\x7e\xd9\x02\xdf\x76\xa5\
-\x27\x01\xb6\x81\x39\x6c\x03\x06\x43\xd3\x44\x0d\xba\x42\x3a\xa8\
-\xde\xb9\x6d\x64\x0f\xbe\xc3\x63\x63\x99\x42\x5d\xb6\x6c\x82\x34\
-\xb0\x0d\x8a\x06\x9b\xc0\x0e\x0d\x8b\x1a\x1e\x24\xb2\x87\x7a\xd0\
-\xe1\x1e\xcf\x1c\x72\x1b\x30\xc6\xb0\x0d\x5c\xc2\x3d\x1b\x70\xff\
-\xe9\x06\xce\xdf\x7e\xa2\xee\xc8\xb8\xc3\x33\x07\x5d\xb6\xe8\xbf\
-\x36\xa5\x87\x31\xa0\xc8\xf5\x9b\x2b\x44\xd6\x70\xff\xc9\xb8\x02\
-\xaf\xa9\x69\x10\x6c\x1b\xe6\x4e\x21\x7b\x5c\xb4\x01\x57\x87\xec\
-\xc1\xd7\x1b\xe9\x49\x80\xdb\xb8\x39\x6c\x03\x06\x4b\x43\xa2\x06\
-\x5f\xd1\x90\xe1\xf8\x2f\x32\x6b\xa0\x1b\xb1\x83\x8d\x9d\x3b\x28\
-\x7b\x90\xb7\x71\x36\x55\x0a\xd8\x06\x59\x43\xdd\x7f\xb2\x09\xec\
-\xd1\x12\x33\x35\xd4\x1d\x73\x9e\x70\x31\xcd\x45\xa3\xc8\xf5\x2b\
-\x7b\x68\xcb\x96\x6d\x60\x0f\x7c\xd9\xb2\x0d\x18\x7b\x38\x2d\x6a\
-\xb8\x83\xca\x1e\xf4\x60\x82\x1e\x9c\xa4\x87\x31\x28\x0b\x6c\xd9\
-\x72\xe1\xda\x02\x5b\xb4\x2e\xda\x80\xeb\x0d\xe3\x12\xbc\xa6\xa6\
-\x01\xa8\x3b\x32\xee\x3c\xcc\xa1\x2e\x5b\xb6\x81\x3d\x5c\x2c\x5a\
-\xae\x0f\xd9\x83\x6f\xbb\xd2\x93\x00\xdb\xb4\xd8\xa4\x16\x35\xd4\
-\x83\x04\xaf\xa7\x31\x87\xda\x06\x5e\x40\xe9\x61\xa8\x71\xb1\x23\
-\x25\xaf\x5f\x4c\x0a\x68\x6d\xc0\xa6\x32\x87\xba\xff\x64\x13\xd8\
-\xc5\xd9\x99\x1a\xea\x0e\x97\x3b\x66\x7b\x14\xf9\xd6\x13\xd7\x1b\
-\x9b\xd0\xb6\x5d\xb6\x95\x39\xf4\x65\xcb\x36\x60\xec\xc2\xb7\x9f\
-\x72\x82\x8b\x1d\x2e\x0f\x12\xf6\xc0\x17\x2d\x2e\x20\xdb\xca\x1c\
-\xfc\x80\x2e\x3d\x09\xb0\x0d\xec\xc1\x36\x60\x14\xb9\x10\x35\x2e\
-\xde\x7a\xe2\x46\x94\x3d\xf8\x41\x87\x36\x5c\x2b\x40\x5f\xb6\xd2\
-\xc3\x64\x86\x8b\x36\xe0\x36\xc9\x98\x82\x16\x35\xa3\xa3\xa3\xd2\
-\x47\xdf\xe1\x31\xe6\x90\xdb\x80\x6d\x65\x0c\xb7\x03\x77\x70\xd3\
-\x06\x5c\xbf\xb2\x86\xba\xff\x64\x4b\xd9\x27\x4c\xd4\xdc\x29\xb7\
-\x35\xec\xde\xbd\x5b\xfa\xb2\x87\x7a\x30\xe1\x4e\xc1\x1c\x74\xd9\
-\xa2\x3b\x66\xe9\x61\xc8\x71\xb3\x7e\x63\xeb\x0d\x57\x1c\x5b\xd0\
-\xf7\x9f\x6c\x2b\x0c\xc3\x43\x43\xd2\xc7\xa4\x81\xd7\xd4\xa4\x00\
-\xdb\x86\xe9\x3b\x05\xc6\x16\x79\xb2\x01\x3e\x29\x5c\x6f\x6c\x81\
-\x6f\xbb\xd2\x93\x00\xb7\x71\x73\x5a\xd5\x06\x43\x11\xa2\xa6\x5c\
-\x2a\x6d\x96\x5e\x26\x86\x30\x51\xd3\x2f\xb7\x35\x6c\xde\xb4\x49\
-\xfa\x70\xa0\x2b\x24\x77\xcc\xd9\xe3\x60\x87\x8b\xef\xf0\xb8\x7e\
-\x99\x42\x5d\xb6\x6c\x82\x34\xb0\x0d\x8a\x06\xc6\x04\x83\x83\xd1\
-\xb3\x34\x93\x95\xca\xb0\xf4\x32\x31\x84\x88\x9a\xa9\xf5\xd2\x53\
-\xc7\xc8\xe8\x28\xba\x11\x31\xf6\xa0\x1e\x74\x18\x73\xd8\x06\x36\
-\xa1\x2d\x5b\xb6\x41\x1e\x70\xcf\x06\xe8\x7a\x43\x58\xbf\x06\x63\
-\x6e\x3d\x0d\x0d\x0e\xf2\x4c\x0d\x82\x3a\x51\xe3\x19\x32\xb2\xe0\
-\x36\x6e\x7c\x56\xfa\xb2\x83\xba\x23\xe3\x0e\xcf\x1c\x74\xd9\xa2\
-\x07\x27\xe9\x61\x0c\xe0\xfa\xed\x0a\x2e\xda\x80\xfb\xcf\x6c\xd8\
-\xb5\x6b\x97\xf4\xd5\x33\x38\x38\xb8\x57\x7a\x99\x18\xc2\x44\x4d\
-\xe4\x4c\xcd\x8e\x9d\xd1\x05\xde\x2a\x60\xdb\x30\x77\x0a\xf6\xa0\
-\x2e\xdb\x3c\xd9\x80\xab\x43\xf6\xe0\xeb\x8d\xf4\x30\xe4\x50\xdb\
-\x20\x4f\x6d\x3c\x8e\xbe\xbe\x3e\xe9\xab\xe7\xb6\xdb\x6e\xd1\xd7\
-\x80\x70\xed\x8b\xa0\x4e\xd4\x7c\xed\xab\x5f\xde\x20\xbd\x75\x3c\
-\xfe\xf8\xe3\xd2\x17\x0f\xba\x42\xb2\x5d\xac\x81\x6e\xc4\x8e\x34\
-\x76\xa6\x39\xe0\x07\x13\x6c\x38\xe9\x61\x0c\x60\x1b\x64\x0d\x75\
-\xff\x89\x35\xc1\x9e\x88\xa7\x8c\xcb\xe5\xd2\x63\xd2\x0b\x44\x45\
-\xc7\x96\xf6\x08\x8a\x1a\x55\x28\xe1\x8f\x75\xef\xda\xe5\xaf\xab\
-\xc9\x3b\xd4\x1d\x73\x9e\x70\x31\xcd\x45\xa3\xc8\xf5\x2b\x7b\x68\
-\xcb\x96\x6d\x60\x0e\x7d\xd9\xb2\x0d\x30\xc0\x9d\x90\x72\xb9\x2c\
-\xf7\x6a\x29\x97\x4a\x49\x4f\xea\x04\x0b\xb9\x65\x0b\x3d\x64\xa1\
-\x30\x54\xd6\xca\xcf\xa5\xb7\x8e\x47\x1f\xd5\x05\x63\x73\xe1\x0e\
-\x2a\x7b\xd0\x1d\x1e\x7a\x70\x92\x1e\xc6\xa0\x2c\xb0\x65\xcb\x85\
-\x6b\x0b\x6c\xd1\xb2\x0d\xb2\xc7\x15\x1b\x6c\xd9\xb2\x45\xfa\xea\
-\x39\x70\xe0\xc0\xa3\xd2\x1b\x84\x2b\x58\x80\x50\x51\x33\x39\x39\
-\xb9\x46\x7a\xeb\x78\x68\x5d\xe4\x92\x9b\xc2\x43\xdd\x91\x71\x87\
-\x67\x0e\x75\xd9\xb2\x0d\xcc\xc1\x97\xad\xf4\x38\x04\xd7\x87\xec\
-\x29\x72\xfd\x8a\x63\xfb\xb6\x6d\xd2\x57\xcf\x0d\x37\x5c\xff\x80\
-\xf4\xea\xa8\x12\x80\x6d\xd0\x29\x74\x3f\x10\xdc\x2f\x1c\x61\xa2\
-\x66\xea\xaa\xaf\x7f\x15\xd6\xd5\x84\xca\xc6\x2d\x9b\x37\x8b\xde\
-\xfd\xd1\x8b\x99\xd0\x15\xb2\xf8\x65\x4b\x0e\xbe\xb1\x23\xcb\xb6\
-\x68\xbd\x42\x8e\x70\x71\x70\x74\x31\xcd\xc5\x83\xb6\x8d\xb3\x49\
-\xcd\xa1\xee\x3f\x31\xa1\x36\x6d\xde\x12\xf9\xd2\xbd\xb1\xb1\xd1\
-\x07\xa5\x37\x8c\xb8\xe8\x5b\xd2\xfa\xd3\xa2\xc6\x33\xa4\x5e\x00\
-\xde\x5e\xe5\xfb\xd2\x5f\xc7\x3d\xf7\xde\x27\x7d\xcd\x03\xdf\x88\
-\x69\xc3\x31\xe6\x14\xf9\xd6\x13\xd7\x1b\x9b\xd0\xb6\x5d\xb6\x95\
-\x39\xf4\x65\xcb\x36\xc0\x10\xf7\x10\xce\x81\x03\x07\xee\x97\x5e\
-\x40\x15\xa8\x5e\xb0\xe0\x0f\x73\x2d\x49\xe8\xed\x27\x60\x6c\x6c\
-\xec\x1a\xe9\xad\xe3\x0f\x1b\x36\x38\xb1\x60\x38\x0b\x8a\xdc\xe1\
-\xf2\x20\x61\x0f\x7c\xd1\x16\xb7\x7e\x65\x0d\xbe\xed\x4a\x4f\x02\
-\x6c\x03\x7b\x14\xc9\x06\xfb\x7a\x7b\xfd\x87\x70\xc2\x98\x9a\xaa\
-\x8c\x5c\xf7\xe3\xff\x0e\x2e\x07\x51\x99\x82\xad\x72\x8a\xa0\x5f\
-\x3f\xaf\x9f\x2b\x2c\x91\xa2\xe6\xdb\xdf\xfa\xe6\x26\xaf\x0c\xee\
-\x92\xbb\x35\x78\x82\x47\xdc\x7d\x4f\xfa\xd9\x1a\x17\x6f\x3d\x71\
-\xff\x94\x3d\xf8\x41\x87\x36\x5c\x2b\x40\x5f\xb6\xd2\xc3\x90\x53\
-\x64\x1b\xb4\x62\x9b\xdc\xb0\xe1\x0f\xd2\x57\xcf\xf0\xd0\x90\xfe\
-\x24\x32\x14\x8e\x2a\x20\xe5\x8f\x73\x3a\xd3\xfb\x5e\x19\x07\xcf\
-\x15\x8a\x28\x51\xe3\x67\xba\x5c\x2e\xff\x93\xbf\x17\xc2\xda\xdf\
-\xff\xbe\x6e\x6d\x4d\x2b\x56\xc8\x66\x81\xef\xc8\x90\x36\x60\x5b\
-\x19\x43\x6e\x03\xc6\x1a\x6e\xda\x80\xeb\x4d\xd6\x50\xf7\x9f\x49\
-\xa1\xe0\x31\xee\x6d\x5b\xb7\xca\xbd\x7a\xd6\xaf\x5f\x77\xb3\xf4\
-\xea\x51\x81\x3f\xe8\x2a\xd2\x85\x9d\x6b\x29\x22\x67\x6a\x3c\xa6\
-\xbe\xf9\x8d\xaf\xc3\xb4\x57\xe8\x82\x61\x98\xad\xf9\xdf\xdf\xde\
-\x2e\xf7\xec\x42\x3d\x98\xf0\xa0\x63\x0e\xba\x6c\x91\x6d\x88\x4d\
-\x60\x0f\x37\xeb\x37\xb6\xde\x70\xc5\xb1\x05\x7d\xff\xc9\xb6\x4a\
-\xe2\x81\x07\xc2\x1e\x6a\xaa\x32\x32\x32\x7c\xe7\xba\x75\x0f\x05\
-\x3f\x8d\x00\x85\x9a\xc6\xb5\x0c\x61\xa2\x46\x2f\x84\xa9\xf1\xf1\
-\xf2\x27\xa5\xbf\x0e\x58\x5b\xf3\xf4\x33\x1b\xe5\x5e\x71\xc1\xb6\
-\x61\xfa\x4e\x81\x31\xc5\x45\x1b\xe0\x93\xc2\xf5\xc6\x16\xf8\x7a\
-\x23\x3d\x09\x70\x1b\x37\xa7\xd5\x6c\xf0\xc7\x47\x1e\x15\x7d\xfb\
-\xf7\xcb\xbd\x7a\x1e\x7a\xf0\x81\x9f\x7a\x1b\x3d\x13\x41\x3f\x38\
-\x35\x43\x13\xe6\xa2\x7e\x5b\x68\x6a\x44\x8d\x57\x09\xea\x0a\xe1\
-\x1b\x57\x7d\xed\xe7\x53\x53\x95\x7b\xfc\x23\x21\xdc\x78\xe3\x4d\
-\x46\x5f\xef\xe6\x47\xb9\x73\x40\xce\x1b\x7b\x18\x79\xef\xa0\x5c\
-\x06\xdd\x76\xd1\xe1\xa4\x87\x31\x80\x6d\xe0\x0c\x58\x1b\xc8\x6d\
-\x18\xb0\x38\xf8\xe1\x3f\x44\xaf\xa5\x09\x99\xa5\x81\xe8\x82\x2e\
-\x4c\xc8\x28\x17\x0c\xdb\x32\xc4\xde\x7e\x52\xae\x5c\x2e\x7f\xde\
-\x3f\x12\x42\x7f\x7f\xbf\xb8\xfe\xa7\x3f\x93\x7b\xf9\xc7\xc5\xc1\
-\x91\x7a\xd0\x61\xcc\x61\x1b\xd8\x84\xb6\x6c\xd9\x06\x79\xc0\x3d\
-\x1b\x34\xab\xde\x94\x4a\x25\x71\xef\xbd\xf7\x45\x7e\x12\x01\x9e\
-\x78\xfa\xf5\xcd\xbf\x84\x57\xaa\xa8\x04\xe9\x09\x03\x7f\x98\x88\
-\xd1\x1d\x84\xd1\x1d\xa0\xfb\x0b\x4d\x9c\xa8\x01\xfc\x82\xb8\xfa\
-\x9b\x57\xdd\x39\x39\x39\xf9\x8d\xea\xa1\x7a\x9e\x7c\xe2\x09\x71\
-\x57\x03\x4f\x43\xc5\xc1\x1d\x59\xf6\xa0\x6d\x80\x6c\x33\x6c\xaa\
-\x19\xf0\x65\x81\x2d\x5b\x2e\xdc\xac\x71\xd1\x06\xdc\xcf\x36\x8f\
-\xb5\xf7\x3f\x10\x7b\xdb\x69\x7f\x6f\xef\x4f\xb7\x6f\xdf\x3e\x22\
-\x77\x15\x50\xf0\xca\x05\x45\xcc\x64\xc8\x31\x70\xfa\x6f\x7c\x3c\
-\xfb\x4d\xfb\x8b\x4a\x94\xa8\xd1\x0b\x03\x5c\x65\xfb\xb6\xad\xff\
-\xec\x79\x23\xdf\xe3\x7c\xeb\x2d\xb7\x88\x07\x1e\x5c\x27\xf7\x8a\
-\x03\xb6\x0a\x70\xa7\x60\x0f\xea\xb2\x65\x1b\xd8\xc3\xc5\xa2\xc5\
-\xd7\x1b\xe9\x61\xc8\xa1\xb6\x41\x5e\xdb\x38\xac\xa3\xd9\xf8\xcc\
-\x33\x72\xaf\x1e\xf8\x1a\xf7\xb5\xd7\xfe\x00\x9e\x78\x52\x19\x80\
-\xad\xee\x74\xd1\x02\x62\x26\xe8\x82\x82\x06\x50\xdb\x96\xa0\x4e\
-\xd4\x78\x95\x41\x2f\x00\x55\x30\x53\x37\xdd\xf4\xb3\xbe\x91\x91\
-\x91\x8b\xfd\xa3\x11\xdc\xe2\x09\x9b\xed\x3b\x76\xca\xbd\x7a\x78\
-\x3d\x8d\x39\xf8\xc6\x8e\x2c\xdb\x9c\x36\x76\x26\x1b\xc8\xeb\x17\
-\x93\x02\x5a\x1b\xb0\xa9\xcc\xa1\xee\x3f\xc3\x42\x3d\xf9\xd4\xd3\
-\xe2\xc1\x98\xa7\x9d\xe0\xb6\xd3\xda\xdf\xff\x2e\xec\x8e\x08\x44\
-\x07\x2e\x28\x68\xc2\xb6\xca\xa9\xdf\xa8\xa4\xa8\x6d\xe1\x49\xba\
-\xfd\x04\x4c\x17\xce\x77\xbe\x7d\xf5\x5d\x13\x13\x13\xdf\xf2\x8f\
-\x86\x00\x8f\x79\x7f\xf7\xbb\xdf\x8b\x15\x36\x36\xe0\x8e\xd9\x1d\
-\x5c\x34\x01\xd7\x2f\x9b\xd0\x96\x2d\xdb\xc0\x1c\xfa\xb2\x65\x1b\
-\x04\x01\x41\x73\xdf\xbd\xf7\xca\xbd\x70\xf6\xec\xd9\xf3\x7d\xb9\
-\x38\x58\x15\x20\x6c\x75\xa7\x04\x8b\x9a\x95\x99\x08\x6c\x93\x84\
-\x4d\x4b\x80\x5a\x28\x2c\x9d\x5f\x50\x57\x7d\xfd\x2b\x9f\xf2\x14\
-\x65\xe4\x02\x1a\x25\x6c\x60\x9a\xad\x51\xb8\x83\xca\x1e\x74\x87\
-\xe7\x57\x11\xc6\x04\x7c\xf5\x46\xda\x80\xdb\x8b\x31\xf8\x01\x5d\
-\x7a\x12\x60\x1b\x64\x4f\xde\x6c\x80\x11\x34\xf0\xb4\xd3\x75\x3f\
-\xfe\xef\xb0\xb7\x07\x2b\xa7\x8b\x15\x70\x4a\xc4\x84\x39\x15\x5e\
-\xfd\xd6\xc7\x2b\x97\x69\x7f\x91\x09\x15\x35\x81\xcc\xab\x82\x51\
-\x85\x34\xf9\xd4\x93\x4f\xbe\xc7\x13\x36\x8f\x79\xfe\x50\x40\xd8\
-\xfc\xf8\xc7\xd7\x59\x5b\x3c\xdc\x2c\xa8\x3b\xb2\x16\xa9\x53\xa4\
-\x50\x97\x2d\xdb\xc0\x1c\x7c\xd9\x4a\x0f\x93\x19\x2e\xda\xa0\xc8\
-\xf5\xeb\xae\xbb\xef\x49\x14\x34\xb0\x8e\xe6\x3b\xdf\xbe\x5a\xdd\
-\x76\x0a\xe6\x12\xf6\x75\x31\x03\xb3\x32\xfa\xcc\x4c\xd2\x2c\x0d\
-\xe0\x60\xc9\xa5\x27\xe9\xf6\x93\x5e\x28\xe0\xfc\x82\xbb\xe5\x96\
-\x9b\xf7\xef\xef\xed\xfd\xa8\x77\x68\x10\x4e\x46\x01\x8b\x87\xaf\
-\xbb\xfe\x06\x31\x0a\xef\xb1\x69\xad\x72\x25\x81\x7c\xa0\x76\xb1\
-\x57\xc8\x18\x72\x1b\xe4\x08\x17\xd3\x5c\x3c\x8a\x5b\xbf\x5c\x81\
-\xba\xff\x84\x50\xf0\xd8\xf6\xaf\x6f\xb9\x35\x76\x51\x30\x30\x31\
-\x31\xb1\xf9\x7f\x7e\x71\xd3\x17\xe4\xae\xba\x00\x6c\xc1\xe9\x22\
-\x45\x09\x17\xe5\x94\xb8\x09\x8a\x9c\xa0\xa8\xf1\xe3\xf4\xf2\xe8\
-\x6f\x5b\x81\xb6\xb8\xbc\xb6\x79\xc0\xc6\x73\x20\x7e\xc0\x75\x78\
-\xae\x53\xba\x59\x17\x5c\xb0\xfa\xc5\xcb\x96\x2f\xbf\xce\x0b\x32\
-\xdf\xdb\x8f\x64\xe1\xc2\x85\xe2\xad\x7f\x76\x8e\x38\xea\xe8\x23\
-\xe5\x91\x64\xb0\x36\xa0\x0e\xa7\x83\xfd\x89\xad\x34\x90\xc7\x6b\
-\x78\x7d\x00\x13\xb7\xcd\x47\xb9\xa9\xcb\x00\x5d\x56\x12\x5b\xf1\
-\x02\xf8\x9f\xb8\x91\x37\xf3\x22\xa0\xbe\xbe\x71\x02\xc8\xf3\x66\
-\x9e\x06\xda\xbc\x99\x5e\x9e\xbe\x6c\x0d\x13\xe0\x91\xb5\x0d\xd0\
-\xe1\x91\xe1\x9e\xdd\xbc\xc5\x9f\x9d\x89\x7a\x0f\x8d\x02\x04\xcd\
-\xcf\x6f\xba\xe1\x73\xf2\xf1\x6d\x15\x39\x6c\x95\xd3\xc5\x0c\x08\
-\x17\x88\x50\xb9\x52\xc0\xa9\xe3\x4a\xe4\xd4\x88\x1b\xc0\xdb\xb6\
-\x04\x58\x51\x13\x14\x36\x5d\xd2\xcd\x7a\xc7\x3b\xde\x79\xd2\xf2\
-\x15\x2b\x7e\x94\x24\x6c\x80\x93\x4f\x39\x45\xbc\xf6\xd5\x67\x8a\
-\xd9\x73\x66\xcb\x23\xd1\x60\x6d\x40\x1d\x4e\x07\xf3\x13\xbb\xd7\
-\x27\x8e\xdb\x30\x0d\xe8\xeb\xfb\xed\x26\x99\x14\x45\x40\x5e\x06\
-\xe8\xb2\x92\xd8\x8b\x57\x7a\x12\xb1\x73\x7d\x80\x3a\x6f\xe6\x49\
-\xa0\xbe\xbe\x59\x02\xa8\xf3\x65\x7a\xfd\x2a\xb4\x79\x33\x4d\x02\
-\x7d\xd9\x9a\x25\x20\x0f\x36\x40\xff\x26\x21\xdc\xe0\xd0\xb0\xf8\
-\xfd\xda\xb5\xb1\x1f\xa8\x54\xc4\x08\x1a\x40\x09\x12\x25\x6a\x40\
-\xa4\x8c\x4b\x17\x26\x68\xc0\xa9\xf3\x6a\xd6\x46\x17\x35\x90\x47\
-\x64\x26\xdd\x07\x23\x6a\x7c\xaf\xe7\x42\x67\x6b\xc0\x9d\xff\x8e\
-\x77\x9e\xb8\x6c\xd9\xb2\x7f\x6f\x6f\xef\x78\x81\xb7\x1f\x4b\x77\
-\x77\xb7\x38\xe5\xd4\x53\xc5\x59\xaf\x7d\x95\x3c\x12\x0e\xd6\x06\
-\xd4\xe1\x14\xd8\xe0\xb6\xae\x0f\x90\xc7\x6d\x98\x06\xf4\xf5\x91\
-\x1d\x99\x69\x11\x50\xe7\x1f\x5d\x4e\x1a\xb6\xe2\xc6\x07\xb7\x75\
-\x7d\xda\x78\x0d\x2f\x2f\xa1\x4e\x83\x59\x22\xa8\xf3\x66\x7a\xfd\
-\x2a\xc9\xbf\xb1\x69\x03\xfa\xb2\x35\x4b\x44\x1e\x6c\x80\xfe\x4d\
-\x44\xb8\x52\xb9\xec\x3f\x18\xf3\xc4\xe3\x8f\x27\xce\xce\x00\x11\
-\x82\x06\x00\xbf\x12\x22\x4a\x98\xa8\x99\x17\x88\x18\x44\x4b\x50\
-\xcc\xa8\x19\x1a\x25\x68\xc0\xe9\x82\xc6\xcb\x5e\x8a\x42\x71\x98\
-\x58\x51\x03\xc4\xcc\xd6\x80\xa8\xf1\x67\x6b\xc0\x9d\x7c\xf2\xa9\
-\xcb\x3c\xb1\xf2\x03\x8c\xb0\x01\xe0\x96\xd4\xf1\x27\x9c\x20\x5e\
-\xf1\xf2\xd3\x42\x67\x6e\xb0\x76\xa0\x0e\xa7\xc0\x06\xb7\x77\x7d\
-\xe2\x78\x0d\xaf\x0f\xa0\xd3\x50\xd3\x2e\xa3\x31\x4d\x02\x75\x19\
-\xa0\xcb\x4a\x62\x2b\x5e\x00\xff\x13\x37\xf2\x96\xa2\x08\x3c\x92\
-\x7f\x64\xd7\x06\xb4\x79\x33\x4f\x03\x6d\xde\x52\x14\x81\x41\xdc\
-\xd8\xc8\xcd\x12\x91\xb5\x0d\xd0\xe1\x43\xc2\xc1\xcc\xcc\x23\x8f\
-\x56\x5f\xa6\x87\x11\x33\x00\x3c\xe5\x14\xb1\x28\x18\xfc\xe0\x94\
-\x20\xd1\x6f\x3b\xa9\x19\x1a\x70\x4a\xc8\xe8\xa2\x46\x17\x34\x2d\
-\x3d\x4b\x03\x60\x45\x8d\xef\x95\x0e\x04\x0d\x08\x1b\x35\x5b\x33\
-\x2d\x6c\x3c\xd7\xfd\x81\x0f\x7e\xe8\xef\xbb\xbb\x7b\x2e\xf4\xfc\
-\x68\x40\xdc\x1c\x7b\xec\x2a\x71\xdc\x8b\x8e\xf5\xf7\xb1\x36\xa0\
-\x0e\xa7\x83\xfd\x89\xad\x34\x90\xc7\x6b\xeb\xfa\x35\xed\x32\x1a\
-\xc3\xcb\xfb\x50\x97\x01\xba\xac\x24\xb6\xe2\x05\xf0\x3f\x49\x0e\
-\x98\xee\xfa\xb4\x79\x33\x4f\x02\xf5\xf5\x8d\x13\x40\x9e\x37\xf3\
-\x34\xd0\xe6\xcd\xf4\xf2\xf4\x65\x6b\x98\x00\x8f\xac\x6d\x80\x0e\
-\x2f\xc3\xc1\xac\xcc\xa6\xcd\x5b\xc4\xd6\xad\x5b\x51\xb7\x99\x74\
-\x7a\xf7\xed\xbd\x46\xbe\x2d\x18\x50\x17\xd6\xb7\x51\x82\x26\x4a\
-\xd4\x28\x41\xa3\x44\x4d\x50\xd0\x78\xd9\x33\x2c\x90\x02\x90\x28\
-\x6a\x80\xc0\x6c\x4d\x50\xd8\x4c\xaf\xaf\x91\xae\x7b\xf5\x85\xef\
-\x7a\xfd\x92\x25\x4b\x2e\xf7\x82\xce\xf3\xf6\xd1\xc0\xad\xa9\xc3\
-\x8f\x38\x42\xac\x7a\xc1\x0b\xc4\xca\x95\x2b\xc4\x21\x87\xac\x94\
-\x67\xc2\xc1\xda\xcb\xd4\xae\xd8\xe0\xb6\xae\x0f\x90\xc7\x6d\x98\
-\x06\xf4\xf5\xa7\xdb\x64\x3c\x29\x8a\x00\x95\x06\xf2\x72\xd2\xb0\
-\x15\x37\x3e\xb8\x3b\x79\x33\x4f\x02\xf5\xf5\xcd\x12\x40\x9d\x2f\
-\xd3\xeb\x57\xa1\xcd\x9b\x69\x12\xe8\xcb\xd6\x2c\x01\x79\xb0\x01\
-\xe6\x37\x3b\x76\xee\x12\xfb\xf7\xef\x17\xbb\x76\xed\x32\x16\x32\
-\xc0\xe4\xe4\xe4\xbe\xa7\x9e\x7c\xe2\x0b\xb7\xdd\x76\xcb\x66\x79\
-\x48\x5d\x54\x6d\x95\x08\x51\x82\x44\x09\x94\xa0\xa0\xd1\xc5\x8c\
-\x72\x6a\x86\x46\x17\x35\x10\x97\x1f\xb7\x97\x3f\x75\x8d\x96\xc1\
-\x44\xd4\xf8\x5e\xe9\xd4\x6d\x28\x35\x5b\xa3\xc4\x4d\xb7\xe7\x7c\
-\x61\x73\xfc\xf1\x27\x2c\x39\xfd\x15\x67\x5c\xd1\xd5\x35\xeb\x95\
-\xde\x7e\x6a\x9e\x7b\xf8\xe1\xa2\xa7\xa7\x47\xac\x58\xb1\x42\x1e\
-\x99\xc1\x15\x7b\xd9\x4a\xa7\xcd\xfc\x53\xc7\xed\x8a\xad\x74\x5c\
-\xb1\x1b\x97\xad\x3b\xb6\x52\xb8\x64\x33\x57\xca\x80\x32\xbe\xdd\
-\xbb\x77\xfb\xb7\x94\xe2\x3e\x3c\x89\x61\x68\x70\xe0\xd7\xb7\xde\
-\xfa\xeb\xeb\x23\xd6\xcf\xe8\x0e\xc4\x88\x9a\xa1\x51\x82\x06\x84\
-\x8a\x2e\x60\x74\x41\xa3\xcf\xd0\xe8\x82\x46\x89\x1a\x28\x0f\x7f\
-\xdb\x6a\xa0\x44\x0d\x10\x10\x36\x4a\xd4\xe8\xc2\xa6\x6e\xc6\x06\
-\xb6\x6f\x3b\xef\xfc\xd3\x0e\x3e\xf8\xe0\xcf\xb4\xb7\x77\xd4\xab\
-\x12\x86\x61\x18\x86\x29\x18\xf0\x42\xbd\x8d\xcf\x3c\xf3\x7d\x39\
-\x3b\x13\x1c\x64\x61\x5f\x39\x25\x44\x74\x51\x13\x26\x68\x74\x97\
-\x24\x68\xfc\xeb\xb1\xa8\x41\x20\x85\x8d\xee\xc2\xd6\xd7\xe8\xc2\
-\x66\xda\x5d\x78\xd1\x5f\x9c\xb3\x70\xe1\xc2\xf7\xb2\xb8\x61\x18\
-\x86\x61\x8a\x08\xdc\x6a\xda\xb2\x65\xf3\x37\xfe\xe7\x17\x37\xc1\
-\x77\x82\x82\x83\xab\xda\x87\xad\x12\x20\xba\xa0\x51\x22\x45\x09\
-\x1a\x10\x2e\xb0\x85\x19\x1a\xe5\x57\xc7\x55\x38\xf5\x5b\x16\x34\
-\x92\x34\xa2\xc6\xf7\x4a\xa7\x66\x6b\xf4\xc7\xbc\xc3\x84\x8d\xda\
-\xef\x5a\xbd\xfa\xa2\x37\x1f\xb4\x70\xd1\xdb\x3a\x3b\x3b\x8f\xf2\
-\xf6\x19\x86\x61\x18\xc6\x69\x60\x66\x66\xef\x9e\x3d\x37\xdf\x70\
-\xc3\xf5\xf0\x19\xee\xe0\xa0\xaa\xf6\x61\xab\x9c\x12\x33\x4a\x94\
-\xe8\x33\x34\x4a\xc0\xe8\x42\x46\xed\xeb\x82\x46\x9f\xa1\x01\xe7\
-\x5f\xa7\x95\x05\x0d\x60\x24\x6a\x80\x08\x61\x93\x34\x63\x33\x2d\
-\x6a\x94\x3b\xf7\xdc\xb7\xfd\xc9\xd2\x65\xcb\xce\xee\xe9\xe9\x79\
-\x99\x17\xcd\x5c\xef\x18\xc3\x30\x0c\xc3\x38\x01\xcc\xca\x8c\x8e\
-\x0c\x3f\xb0\x7e\xfd\xba\x9b\xd7\xad\x7b\x68\x8f\x3c\xac\xa3\x06\
-\x57\xd8\xea\x4e\x17\x22\x4a\xd0\x28\x31\xa3\x9c\x2e\x64\xd4\x56\
-\x85\x51\xe1\x75\x31\xe3\xbb\x56\x17\x34\x80\xb1\xa8\x01\x02\xc2\
-\x46\xcd\xd6\x04\x67\x6c\x94\xb8\x09\x15\x35\x9e\x9b\x0e\x77\xde\
-\xdb\xdf\x71\xfa\xfc\xf9\xf3\x4f\x9c\x33\x67\xce\x69\xed\xed\x1d\
-\xcb\xbc\x63\x0c\xc3\x30\x0c\x93\x2b\xe0\xc5\x79\x63\xa3\x23\x8f\
-\x6d\xdb\xb6\xed\x0e\xed\x69\x26\x1d\x7d\x40\x9d\x16\x1b\x9a\xd3\
-\xc5\x0c\x6c\xd5\xac\x4b\x98\xa8\xd1\xb7\xba\xa0\x51\xae\x46\xd0\
-\x78\xae\xe5\x67\x69\x80\x54\xa2\x06\x90\xc2\x46\x77\x71\xc2\x46\
-\x39\x25\x6c\xd4\x71\x3d\x9c\x3f\xdb\x73\xf8\xe1\x47\x2c\x78\xe9\
-\xc9\xa7\x9c\x30\x6f\xde\xbc\x23\xbb\xbb\xbb\x8f\xf2\x2e\x33\xb7\
-\xab\xab\xeb\x88\xb6\xb6\xf6\x39\xde\x79\x86\x61\x18\x86\xb1\xca\
-\xd4\x54\x65\x64\x7c\x7c\x7c\xb3\x27\x62\xf6\x96\xcb\xe5\xbd\x7d\
-\x7d\x7d\x8f\x6e\x58\xbf\x6e\xd3\xd6\xad\x5b\xe0\x29\x26\x9d\xe0\
-\x00\xaa\xf6\x61\xab\x3b\x25\x40\x94\x18\x81\x2d\x08\x15\xb5\x55\
-\x62\x46\x17\x32\xca\x85\x09\x1a\x3d\x4e\x70\x2c\x68\x24\x8d\x8a\
-\x1a\xdf\xab\xb9\xa0\xb0\x81\xad\x2e\x62\x82\x4e\x17\x35\x2a\xbc\
-\x2f\x6e\x34\xa7\xc7\x0f\x0e\xd0\xfd\x80\xee\x67\x18\x86\x61\x18\
-\xdb\xe8\x83\xa7\xf2\xc3\x36\xcc\x81\x10\x01\x11\x92\x24\x68\x82\
-\x0e\xce\xab\xb0\x7a\x1c\x2c\x68\x22\x48\x2d\x6a\x00\x84\xb0\x51\
-\xe2\x46\x39\x25\x64\x74\x51\xa3\x8b\x1b\xf5\x9b\xa0\xb0\x01\xa7\
-\x5f\x03\x1c\x10\xdc\x02\xba\x9f\x61\x18\x86\x61\xa8\xd0\x07\x4c\
-\xe5\xd7\xb7\xba\x53\xc2\x43\x89\x10\x25\x4c\x94\x98\x51\x4e\x89\
-\x97\xa0\x98\x81\xad\xfe\x1b\x70\x7a\xbc\xe0\x58\xd0\x04\x68\x48\
-\xd4\x00\x09\xc2\x06\x9c\x12\x2b\x6a\x1b\x14\x33\xba\xa8\x51\x61\
-\xb0\xc2\x46\x39\x40\x6d\xc3\x88\x3b\xc7\x30\x0c\xc3\x30\x41\xe2\
-\x06\x47\x75\x0e\xb6\xba\x5f\x17\x1c\xba\x98\xd1\x45\x8d\x2e\x68\
-\x94\x78\xd1\xb7\xba\x53\xbf\x51\xf1\xea\xf1\xb3\xa0\x09\xa1\x61\
-\x51\x03\x20\x84\x8d\x2e\x54\x74\x01\xa3\x5c\xd4\x6c\x8d\x72\xba\
-\xa8\x51\xdb\xa0\x03\xd4\x36\x8c\xb8\x73\x0c\xc3\x30\x0c\xa3\x88\
-\x1b\x18\xd5\x39\xd8\x86\x39\x25\x66\x94\x53\xc2\x44\x09\x1a\xb5\
-\x55\x2e\x28\x66\xf4\xb0\x7a\x3c\xfa\x35\x58\xd0\x44\x40\x22\x6a\
-\x80\x08\x61\x03\x2e\x4c\xd8\x80\xd3\x45\x0c\x88\x9a\xe0\x31\xdd\
-\xa9\x38\x94\x53\xf1\xea\xd7\x01\xd4\x16\xd0\xfd\x0c\xc3\x30\x0c\
-\x93\x16\x7d\xa0\x54\x7e\xd8\xea\x4e\x09\x0f\x25\x42\x40\x98\xa8\
-\xad\x2e\x54\xd4\x36\xe8\xf4\x70\xe0\x54\x3c\xe0\xf4\xeb\xb0\xa0\
-\x89\x81\x4c\xd4\x00\x01\x61\xa3\xb6\xba\x10\x51\x02\x45\x89\x15\
-\x25\x60\xa2\xb6\xe0\x54\x78\x15\x8f\x72\x2a\x6e\xd8\xea\xd7\x0b\
-\xdb\x32\x0c\xc3\x30\x4c\x1a\xd4\x20\x19\xb6\x55\x4e\x17\x1f\xb0\
-\xd5\x45\x49\x50\xb0\xa8\xfd\x30\x31\x13\xfc\xad\x7e\x0d\x70\x2c\
-\x68\x12\x20\x15\x35\x80\x26\x6c\x00\xf0\x2b\xa7\x0b\x11\x5d\xac\
-\xe8\x2e\x6c\x96\x06\x9c\xfe\x1b\x15\x87\xee\x57\xd7\x00\x82\x5b\
-\x86\x61\x18\x86\x69\x04\x35\x50\xea\x5b\xe5\x74\x01\xa2\xfc\xe0\
-\x74\x91\xa2\xbb\xa8\x59\x19\xb5\x05\xa7\xe2\x82\x2d\xe0\x6f\x59\
-\xd0\x24\x43\x2e\x6a\x14\x81\x59\x1b\xdd\xe9\x62\x44\x09\x15\xe5\
-\xd7\x9d\x7e\x2c\x18\x56\xfd\x5e\xf9\x75\x07\xa8\x2d\xa0\xfb\x19\
-\x86\x61\x18\x06\x8b\x3e\x40\xea\x02\x43\x77\xba\x08\xd1\x5d\x50\
-\xac\x28\x01\xa3\x9c\x7e\x4e\x77\xc1\xf8\x7d\x58\xd0\xe0\xb0\x26\
-\x6a\x80\x80\xb0\x51\x5b\x70\xba\x30\x81\xad\x2e\x58\xc2\x44\x4c\
-\x70\x5f\xfd\x56\xf9\x75\x07\xa8\xad\x22\xb8\xcf\x30\x0c\xc3\x30\
-\x71\x04\x07\x47\xb5\x0f\x5b\xdd\x29\x21\x12\x14\x27\xca\xe9\xc2\
-\x25\x4c\xcc\x04\xe3\x80\x2d\xe0\x6f\x59\xcc\x98\x61\x55\xd4\x00\
-\x9a\xb0\x01\x74\xe1\xa1\x0b\x12\xe5\x07\xe1\xa2\xf6\xc1\x05\xf7\
-\x95\xd3\x8f\x81\x5f\x39\x20\xb8\x65\x18\x86\x61\x98\x46\xa8\x11\
-\x1a\x72\xab\x5c\x98\x30\xc1\x38\xfd\x37\x41\xe7\xc3\x82\xc6\x1c\
-\xeb\xa2\x46\x11\x33\x6b\x13\x74\x41\xe1\x12\x75\x2c\xe8\x07\x07\
-\x04\xb7\x0c\xc3\x30\x0c\xd3\x08\x6a\xa0\xd4\xb7\xba\xd3\xc5\x49\
-\x98\x68\xd1\x8f\xe9\xc7\x75\x07\xa8\x2d\x0b\x9a\x94\x34\x4d\xd4\
-\x00\x21\xb3\x36\x6a\x1b\xe7\xe2\x44\x4c\xd0\x01\x6a\xab\x08\xee\
-\x33\x0c\xc3\x30\x0c\x86\xe0\x00\xa9\x8b\x8f\x28\x17\x14\x2c\x61\
-\x02\x46\x77\x80\xda\xb2\x98\x69\x90\xa6\x8a\x1a\x45\x8c\xb8\x51\
-\x5b\xac\x03\x82\x7e\x7d\xcb\x30\x0c\xc3\x30\x14\x04\x05\x08\x6c\
-\x83\x7e\x8c\x03\x82\x5b\x16\x33\x44\x64\x22\x6a\x14\x01\x71\x03\
-\x84\x89\x13\xe5\x00\x8c\x5f\x11\xdc\x67\x18\x86\x61\x98\x34\x04\
-\x07\x4a\xd8\x57\xc7\xf4\x6d\x9c\x5f\xed\x03\xd3\x7e\x16\x33\xb4\
-\x64\x2a\x6a\x74\x22\x66\x6f\x00\xe5\x4f\xda\x02\xba\x9f\x61\x18\
-\x86\x61\xa8\x09\x13\x27\xc1\x63\x51\xc7\xa7\x61\x31\x63\x87\xdc\
-\x88\x1a\x45\xc8\xec\x0d\x10\x25\x5c\x58\xd0\x30\x0c\xc3\x30\xcd\
-\x26\x4a\xac\x44\xf9\x7d\x58\xc8\xd8\x27\x77\xa2\x46\x27\x42\xe0\
-\x00\xa6\xc7\x19\x86\x61\x18\x86\x82\xa8\x41\x33\xf4\x38\x0b\x99\
-\xe6\x92\x6b\x51\x13\x24\x46\xe4\x84\xc1\x02\x87\x61\x18\x86\xa1\
-\x00\x3d\x50\xb2\x88\xc9\x16\xa7\x44\x4d\x1c\x86\x82\x87\x61\x18\
-\x86\x61\x52\xc1\xc2\x25\xbf\x14\x46\xd4\x30\x0c\xc3\x30\x0c\xd3\
-\xda\xc0\xcb\xec\x18\x86\x61\x18\x86\x61\x1c\x47\x88\xff\x0f\x0b\
-\xe4\x3c\x2e\xcb\x22\xf0\x7e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
 \x00\x00\x41\xda\
 \xff\
 \xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x48\x00\
@@ -10154,735 +1065,6 @@ qt_resource_data = b"\
 \x07\x9a\xbf\xd1\x2c\xce\xb6\x6b\x5d\x7d\x84\x31\x2b\x8b\xdf\x67\
 \x84\x31\x32\x18\x99\x1c\x4d\x6b\x23\x60\x0d\x6b\x5a\x30\x1a\x07\
 \x20\x02\x2f\x34\x58\xcd\x27\xff\xd9\
-\x00\x00\x2d\x69\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x48\x00\
-\x48\x00\x00\xff\xe2\x02\x5c\x49\x43\x43\x5f\x50\x52\x4f\x46\x49\
-\x4c\x45\x00\x01\x01\x00\x00\x02\x4c\x6c\x63\x6d\x73\x04\x30\x00\
-\x00\x6d\x6e\x74\x72\x52\x47\x42\x20\x58\x59\x5a\x20\x07\xe4\x00\
-\x02\x00\x1c\x00\x07\x00\x32\x00\x30\x61\x63\x73\x70\x41\x50\x50\
-\x4c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf6\xd6\x00\x01\x00\
-\x00\x00\x00\xd3\x2d\x6c\x63\x6d\x73\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x64\x65\x73\x63\x00\x00\x01\
-\x08\x00\x00\x00\x36\x63\x70\x72\x74\x00\x00\x01\x40\x00\x00\x00\
-\x4c\x77\x74\x70\x74\x00\x00\x01\x8c\x00\x00\x00\x14\x63\x68\x61\
-\x64\x00\x00\x01\xa0\x00\x00\x00\x2c\x72\x58\x59\x5a\x00\x00\x01\
-\xcc\x00\x00\x00\x14\x62\x58\x59\x5a\x00\x00\x01\xe0\x00\x00\x00\
-\x14\x67\x58\x59\x5a\x00\x00\x01\xf4\x00\x00\x00\x14\x72\x54\x52\
-\x43\x00\x00\x02\x08\x00\x00\x00\x20\x67\x54\x52\x43\x00\x00\x02\
-\x08\x00\x00\x00\x20\x62\x54\x52\x43\x00\x00\x02\x08\x00\x00\x00\
-\x20\x63\x68\x72\x6d\x00\x00\x02\x28\x00\x00\x00\x24\x6d\x6c\x75\
-\x63\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x0c\x65\x6e\x55\
-\x53\x00\x00\x00\x1a\x00\x00\x00\x1c\x00\x73\x00\x52\x00\x47\x00\
-\x42\x00\x20\x00\x62\x00\x75\x00\x69\x00\x6c\x00\x74\x00\x2d\x00\
-\x69\x00\x6e\x00\x00\x6d\x6c\x75\x63\x00\x00\x00\x00\x00\x00\x00\
-\x01\x00\x00\x00\x0c\x65\x6e\x55\x53\x00\x00\x00\x30\x00\x00\x00\
-\x1c\x00\x4e\x00\x6f\x00\x20\x00\x63\x00\x6f\x00\x70\x00\x79\x00\
-\x72\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2c\x00\x20\x00\x75\x00\
-\x73\x00\x65\x00\x20\x00\x66\x00\x72\x00\x65\x00\x65\x00\x6c\x00\
-\x79\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\xf6\xd6\x00\x01\x00\
-\x00\x00\x00\xd3\x2d\x73\x66\x33\x32\x00\x00\x00\x00\x00\x01\x0c\
-\x42\x00\x00\x05\xde\xff\xff\xf3\x25\x00\x00\x07\x93\x00\x00\xfd\
-\x90\xff\xff\xfb\xa1\xff\xff\xfd\xa2\x00\x00\x03\xdc\x00\x00\xc0\
-\x6e\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\x6f\xa0\x00\x00\x38\
-\xf5\x00\x00\x03\x90\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\x24\
-\x9f\x00\x00\x0f\x84\x00\x00\xb6\xc3\x58\x59\x5a\x20\x00\x00\x00\
-\x00\x00\x00\x62\x97\x00\x00\xb7\x87\x00\x00\x18\xd9\x70\x61\x72\
-\x61\x00\x00\x00\x00\x00\x03\x00\x00\x00\x02\x66\x66\x00\x00\xf2\
-\xa7\x00\x00\x0d\x59\x00\x00\x13\xd0\x00\x00\x0a\x5b\x63\x68\x72\
-\x6d\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\xa3\xd7\x00\x00\x54\
-\x7b\x00\x00\x4c\xcd\x00\x00\x99\x9a\x00\x00\x26\x66\x00\x00\x0f\
-\x5c\xff\xdb\x00\x43\x00\x06\x04\x05\x06\x05\x04\x06\x06\x05\x06\
-\x07\x07\x06\x08\x0a\x10\x0a\x0a\x09\x09\x0a\x14\x0e\x0f\x0c\x10\
-\x17\x14\x18\x18\x17\x14\x16\x16\x1a\x1d\x25\x1f\x1a\x1b\x23\x1c\
-\x16\x16\x20\x2c\x20\x23\x26\x27\x29\x2a\x29\x19\x1f\x2d\x30\x2d\
-\x28\x30\x25\x28\x29\x28\xff\xdb\x00\x43\x01\x07\x07\x07\x0a\x08\
-\x0a\x13\x0a\x0a\x13\x28\x1a\x16\x1a\x28\x28\x28\x28\x28\x28\x28\
-\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\
-\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\
-\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\xff\xc0\x00\x11\x08\
-\x00\xc8\x00\xc8\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\xff\xc4\
-\x00\x1c\x00\x00\x02\x02\x03\x01\x01\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x04\x05\x03\x06\x00\x02\x07\x01\x08\xff\xc4\x00\x51\
-\x10\x00\x02\x01\x03\x02\x04\x02\x07\x03\x07\x05\x0d\x06\x07\x00\
-\x00\x01\x02\x03\x00\x04\x11\x05\x21\x06\x12\x31\x41\x13\x51\x07\
-\x22\x32\x61\x71\x81\x91\x14\xa1\xb1\x15\x23\x42\x52\x92\xc1\xd1\
-\x16\x33\x62\x73\x93\x25\x36\x43\x44\x45\x53\x72\x82\x94\xa2\xd2\
-\xe1\xf0\x08\x35\x54\x55\x63\xb2\x24\x26\x34\x74\x83\xe2\xf1\xff\
-\xc4\x00\x1b\x01\x00\x03\x00\x03\x01\x01\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x02\x03\x04\x01\x05\x06\x00\x07\xff\xc4\x00\x2c\
-\x11\x00\x03\x00\x02\x01\x04\x01\x04\x01\x02\x07\x00\x00\x00\x00\
-\x00\x00\x01\x02\x03\x11\x21\x12\x31\x41\x51\x13\x04\x22\x32\x61\
-\x81\x23\xf0\x33\x42\x52\x71\x91\xb1\xd1\xff\xda\x00\x0c\x03\x01\
-\x00\x02\x11\x03\x11\x00\x3f\x00\xeb\x32\x25\x41\x22\xd1\xae\xb4\
-\x3c\x82\xb8\xe9\x3a\x86\xc0\x9d\x68\x59\x17\xad\x1d\x22\xe6\x85\
-\x91\x6a\x89\x16\xc0\xa4\x5a\x16\x41\x46\xca\xb4\x2c\xab\xd6\xaa\
-\x82\x7b\x02\x94\x7b\xa8\x59\x47\x95\x1b\x20\xad\x2d\xac\xa5\xbb\
-\x93\x92\x10\x31\xdd\x8e\xc0\x7c\x4d\x57\x08\x96\xc5\xb2\x0a\xd1\
-\x6c\xee\x25\x20\x47\x04\xad\xcc\x32\x30\x87\x71\xe7\x56\x7b\x2d\
-\x2b\xc7\x9f\xec\xfa\x65\xb0\xbc\xba\x1b\x78\xb7\x1b\x46\x0f\xb9\
-\x06\x4e\x07\x9b\x75\xa7\x57\x5a\x65\xa6\x9b\x10\x7e\x2d\xd5\x9e\
-\xf2\x58\x93\xf3\x76\xf0\xa8\xca\x01\x8f\x54\x0e\xc3\x7e\xff\x00\
-\x75\x5b\x08\x92\xd9\x47\x83\x86\xb5\x5b\xa7\x09\x0d\xa9\x2e\x7a\
-\x2f\x30\x24\xfc\x85\x49\x71\xc1\x1a\xaa\x16\x12\xcf\x63\x09\x51\
-\x92\xa1\xda\x57\x1f\x24\x53\x8f\x99\xa7\x53\x6b\x8b\x38\x2b\xa5\
-\xd8\x47\x67\x66\xa7\x3e\x24\xee\xcd\xf3\xe5\x18\xc9\xf8\xf3\x54\
-\x17\x1c\x45\x77\x61\x6e\xcb\x1c\xff\x00\x65\x77\xdc\x11\x12\x89\
-\x58\x7e\xb7\x2a\x80\x14\x79\x67\x7f\xc2\xa8\x94\xc9\xe8\x02\x2f\
-\x46\x9a\x95\xc2\x87\x6b\x9b\x50\x48\xe6\x02\xe3\x9d\x76\xf3\x03\
-\x97\x15\x14\xde\x8d\xb5\xd1\x19\x78\x8d\x94\xa3\x38\xf5\x27\x1d\
-\x7e\x62\x82\x1a\xcd\xec\xf2\x37\xad\x2d\xc0\xea\xf2\x5d\xcc\xce\
-\x57\xdf\x9f\xd1\xff\x00\xae\xb5\xe4\xba\xcd\xe4\x07\xed\x1a\x75\
-\xfd\xd4\xcd\x1e\xe4\xb3\x95\x11\x7c\x10\x60\x11\xef\x3f\x30\x29\
-\xf2\x9f\x81\x14\xd3\xee\x79\x73\xe8\xfb\x89\xa1\x72\xbf\x93\x4c\
-\x8c\x3b\x47\x22\xb7\xef\xaa\xfe\xa5\xa3\x6a\x5a\x76\xf7\xf6\x17\
-\x56\xeb\xfa\xd2\x46\x40\xfa\xf4\xab\x54\xdc\x79\x7e\x6d\xed\xd9\
-\x79\x9a\xf3\x9b\x37\x0d\x21\xe6\x8e\x4c\x63\x94\xaa\x9f\x60\xed\
-\xbe\x3e\x94\xe1\xb8\xb3\x56\x1a\x54\xaf\xa7\xcd\x1c\xd1\x33\x24\
-\xd2\x78\xc5\x8b\xdb\xa3\x03\x90\x70\x46\x53\x3d\x0f\xca\x9a\x9d\
-\x2e\xe2\x9a\x97\xd8\xe5\x2c\x33\x5a\x1a\xe8\xf1\xea\x9c\x3d\xc4\
-\x79\x4d\x4b\x46\x10\x4a\xbb\x1b\x9b\x77\x11\x3c\xa7\x1b\x63\x1e\
-\xaf\x31\xf2\x20\xfc\x68\x6d\x6b\xd1\xf3\x9b\x08\xf5\x4e\x1c\xba\
-\xfb\x66\x9d\x36\x7c\x38\xe7\x1e\x1c\xab\xfd\x1c\xfb\x24\xfc\xc6\
-\x69\xaa\xd6\xf5\x5c\x0a\x70\xfb\xae\x4e\x7c\x45\x6a\x45\x19\xa8\
-\xd8\x5d\xe9\xd7\x26\xdf\x50\xb6\x9a\xda\x7e\x50\xde\x1c\xaa\x54\
-\xe0\xf4\x38\x34\x21\xef\x54\x4a\x11\x46\x87\xbd\x6b\xf0\xad\xcd\
-\x79\x46\x90\x06\xa4\xd7\x95\xb1\xad\x49\xa2\x48\x16\x65\x65\x79\
-\xd6\xb2\x8b\x46\x36\x7d\x35\x20\xa1\xa4\x14\x64\x82\x86\x90\x57\
-\xcb\xe5\x1f\x45\xd8\x1b\x8a\x19\xc7\x5a\x26\x67\x55\x38\x27\x2d\
-\xe4\x37\x34\x2c\x9e\x23\xfb\x2a\x10\x79\xb6\xe7\xe9\x4f\x80\x58\
-\x2c\xa3\xae\x68\x4c\xb4\xf2\x78\x76\xd1\xbc\xce\x7a\x04\x19\xfb\
-\xfa\x53\x2b\x7b\x01\x75\x2f\xe7\x09\x28\xbe\xb3\xbb\xf4\x51\xf0\
-\xe9\x9a\x27\x6b\x97\x30\x69\x90\xf2\x5b\xb1\xf5\x81\xdd\xf1\xfd\
-\x23\x9d\xff\x00\x0a\xb3\x1c\xb6\x4b\x76\x97\x02\xa8\xb4\xd0\x5b\
-\x37\x93\x28\x5c\xe0\xc7\x09\xe6\x27\xdd\xcd\xf8\xfe\x34\xfa\x0d\
-\x32\xd9\x2c\xd1\xb5\x09\x0d\xa5\x86\xff\x00\x9b\x0d\x89\x1c\x67\
-\x24\x79\xf9\x67\x24\xf9\x51\xe6\x2b\x1d\x1e\xd6\x1b\x89\xe3\x57\
-\xb8\x31\xe5\x61\x56\xeb\xb9\x23\x1e\x4b\xb7\x5e\xa6\xab\xda\x83\
-\xcb\x3b\xbd\xf4\xd2\x99\x90\x0e\x72\x31\x8e\x42\x37\x58\xf9\x7b\
-\x00\x70\x4f\x9e\xd5\x7c\x4a\x82\x1a\xa7\x41\x3a\x9e\xaf\xf6\x3b\
-\x61\x69\xa2\xa2\xd8\xda\xa8\xcc\x81\x37\x72\x08\xcf\x33\x9e\xa7\
-\xa1\x00\x55\x62\x38\x9a\xe9\x2e\x6e\x6e\x07\xe6\xf0\xbe\xd9\x3e\
-\xaa\xe7\x3c\xcc\x7a\x9c\x91\xf1\x24\xd3\x18\xe1\xf1\x5a\x77\xb8\
-\xc9\x59\x8e\x0f\x9c\x8c\x3d\x95\x1e\x79\x20\x9f\xa5\x2c\xd5\x6e\
-\x4c\x96\x66\x14\xc0\x41\x28\xcf\x2f\x76\x00\xe7\xe3\x8c\xe2\xa8\
-\x9e\x44\xd0\x2d\xc5\xea\xc8\xc5\x6d\xc3\x47\x6d\x10\xe6\x67\x38\
-\x0e\xfe\x5d\x3d\x9c\xf4\xc0\xe8\x29\x3f\x23\x5c\xc9\x24\xd3\x37\
-\x2c\x60\xe5\xdb\x1d\x3c\x80\x1e\x7e\x42\x8f\x78\x49\x48\xe0\x04\
-\x2e\x47\x8b\x2b\x1f\xd1\x1d\xb3\xf0\x1f\x8d\x01\x79\x20\x72\x12\
-\x30\x56\x14\xf6\x57\xbf\xc4\xfb\xcd\x55\x08\x9e\xc1\x6e\xe7\x32\
-\x28\x8d\x17\x92\x05\x39\x08\x0f\x7f\x32\x7b\x9a\x11\x64\x78\xa4\
-\x12\x44\xc5\x58\x74\x35\x2b\xf7\xa8\x1c\x55\x32\x89\x69\x9b\x5c\
-\xc6\x93\x46\x6e\x2d\xd4\x28\x1b\x49\x18\xfd\x03\xe6\x3f\xa2\x7e\
-\xee\x9e\x55\x24\x57\x37\x96\xc9\x08\xb1\x95\xe3\x6b\xab\x76\xb6\
-\x70\xa7\xdb\x42\xe4\x15\x3e\xee\x94\x3c\x32\xb4\x12\x87\x50\x0e\
-\x36\x2a\x7a\x30\xee\x0f\xba\x9b\xdd\xd9\x0b\x4d\x22\xce\xf2\x47\
-\x31\xdb\xdc\x2c\x8b\x6e\x48\xcb\x15\xe6\xf5\xb0\x3c\xc7\xb3\x9e\
-\x9d\x4f\x95\x30\x56\xc4\x57\x0c\x5a\x58\xe0\xb5\xe6\x65\x8c\xe1\
-\x39\x3a\xb3\x77\x6f\x99\xfb\x80\xab\x5e\x8d\x2c\x90\xdb\x4c\x67\
-\xba\x30\xdb\x5c\x8c\xcb\x0c\x6e\x49\x8e\x61\x9c\xb0\xc7\xb3\xb9\
-\x56\xc6\x7b\x91\x8a\xaa\x4b\x72\x42\x98\xed\xd7\xc1\x88\xec\x40\
-\x3e\xb3\x7c\x4f\x7f\x87\x4f\x75\x3b\xe0\xa8\x8d\xca\x6a\x70\xb4\
-\x65\xe1\x8a\x24\xba\x6d\xf6\x1c\xae\x01\x1f\x30\xc4\x51\xd4\xf1\
-\xb6\x02\x7c\x8f\x05\xcd\x9e\xad\x03\x2e\xb1\x0c\xf7\x70\xa0\x21\
-\x81\x2a\x97\x10\x80\x70\x5d\x3b\x72\x8e\xfb\x85\xfd\xd5\xce\x26\
-\xe1\x46\xd2\xec\x20\xd4\xb4\xeb\xc4\xd4\x74\xc9\xb3\x89\x63\x42\
-\xad\x10\xed\xe2\x2f\xe8\x9f\xfa\xef\x50\xcf\xa8\xdc\x58\xc9\x65\
-\xa8\xc0\xdc\x97\xb3\x85\x94\xb1\x50\x40\x08\x79\x42\xe3\xc8\xf2\
-\xe4\x8f\x2c\x53\x8d\x0f\x8a\x92\xde\x6f\xee\xb8\x8e\x25\xb9\x12\
-\x4e\xf3\x5b\xdb\x8c\x87\x6d\x97\x28\x30\x0a\x9c\x1c\x83\xd4\x11\
-\x5e\x4a\xa7\x99\xec\x79\xb9\xae\x19\x44\x3e\xea\xf0\xd5\xfb\x88\
-\xb8\x5a\xd2\xf3\x4e\xfc\xa9\xc3\x64\xcb\x29\x3c\xd3\x59\xc2\xa4\
-\xa8\x5d\xfd\x78\xbb\x95\xdb\x75\xdc\xae\xfe\x55\x41\x61\x54\x45\
-\x2a\x5c\x08\xb9\x73\xdc\xd4\x9d\xab\xcc\x79\xd7\xa6\xbc\xef\x4e\
-\x48\x59\xe1\xe9\x59\x5e\xe2\xb2\xb3\xa0\x36\x7d\x34\xee\xcd\xec\
-\x21\x23\xcd\xb6\x14\x3b\xc6\x5b\xdb\x72\x7d\xcb\xb0\xa3\xa4\xa1\
-\xa4\xaf\x97\x4c\x9f\x47\xd8\x1b\x28\x41\x85\x00\x0f\x21\x51\xac\
-\x32\x4e\xe5\x62\x42\xc7\xa9\xc0\xe8\x3c\xcf\xba\x88\xe4\x69\x1c\
-\x22\x0d\xc9\xa2\xda\x6f\xb2\xc2\x22\xb6\x72\xaa\xf8\xcb\x8e\xad\
-\xe6\x7e\x1e\x43\xf8\xd5\x78\xa1\x79\xec\x27\x25\xb5\xc2\xee\x2f\
-\xba\x60\x91\xfd\x96\xdf\x70\x17\x99\x88\xea\xec\x76\xfd\xf4\xcf\
-\x4c\x8a\x3d\x16\xd1\xa6\xba\x4e\x67\x71\x92\xbb\x7a\xf8\xed\xf0\
-\x1f\xf5\xda\xbc\xd1\xad\x63\x9d\xe5\xbb\x94\x14\x8c\x2f\x33\x01\
-\xd8\x7b\xbe\x38\xa5\xda\xb5\xe3\x5e\x5c\x3c\x92\xfa\xd2\x15\xca\
-\xa0\x3e\xaa\x83\xb2\x8f\x7e\xc7\xef\xab\xf1\xae\x95\xd5\xff\x00\
-\x04\x56\xfa\x9f\x4a\xfe\x48\xde\x65\xbd\xd4\xcb\xcb\x0e\x64\x6c\
-\xca\xcf\xcc\x58\x6e\x30\xa0\xe4\xf4\xc1\x1f\x7d\x07\x12\xc4\x24\
-\x63\xe2\x73\xc2\x58\x46\xde\x11\xe7\xd8\x9c\xb1\x20\xff\x00\x1a\
-\x96\x69\x49\x8e\x37\xce\x33\x27\x86\xaa\x3a\x01\xd0\x6d\xf0\xe6\
-\xfb\xa9\x4c\x21\xd2\x20\xd1\xe4\x38\x2d\xca\x41\xc7\xac\x70\xa3\
-\xf1\x34\xf9\x15\x4b\x83\x7d\x5e\xed\x1a\x63\x7b\x69\x91\x6c\xad\
-\xe1\xdb\xa1\x18\x28\x3b\x93\xef\x23\xbf\xbf\xdd\x49\xe4\x85\x79\
-\x84\x67\x3e\x18\x95\xd8\xff\x00\xa2\x00\x3f\x85\x1f\x2c\xd1\x4d\
-\x39\x8c\xe1\x40\x1e\x1e\xdb\x2b\x8f\x3f\x71\xce\xe3\xb5\x6f\x7b\
-\x09\xb2\xb1\x59\xe5\xfe\x70\xfa\x89\x91\xd5\xb6\xdf\xe5\xca\x0d\
-\x53\x28\x9e\x84\x3a\x83\x95\xe6\x8b\xfc\x23\x1e\x79\x71\xe7\xd9\
-\x7e\x03\xf1\xf8\x52\x99\x06\x33\x46\x4b\xdf\x3b\x93\x42\xcb\xb5\
-\x55\x08\x9a\xd8\x2b\xd0\xf2\x0a\x25\xf6\x35\x03\x8a\xaa\x51\x35\
-\x03\xc8\x2a\x29\x19\x8a\x85\x2c\xc5\x57\xa0\x27\x61\xf0\xa9\xdb\
-\xa5\x40\xd4\xd4\x84\x36\x42\xc2\x8e\xe1\xa8\x5a\x7e\x20\xb0\x81\
-\x03\x93\x34\xa2\x33\xca\x09\x38\x3b\x74\x14\x13\x56\x41\x3c\xd6\
-\xb3\xa4\xf6\xd2\xbc\x33\xc6\x79\x92\x48\xd8\xab\x29\xf3\x04\x53\
-\x74\xf5\xa1\x7b\xe4\x2e\xe5\x4d\xe7\x32\x03\xca\x23\xb8\xe4\x00\
-\x8c\x72\xa7\x2e\x33\xf2\x09\x43\xcf\x1a\xc9\x31\x9e\xe3\x99\x11\
-\xb1\xe1\x42\xa3\xd7\x65\x1b\x2f\xc0\x60\x75\xfa\x66\x8b\xd2\xb5\
-\x3b\x6b\x1b\x4d\x43\xc7\xb4\x37\x37\x93\xf2\xf8\x32\x3b\xfa\x89\
-\xb9\xe6\x2c\xbf\xa4\x48\x3e\x74\xbe\x7d\x42\xe6\x46\x63\xe2\x14\
-\xe6\x39\x3e\x18\xe5\xcf\xc7\x1b\x9f\x9d\x66\x53\xd8\x2d\xa2\xc3\
-\xc2\xbc\x43\xaa\xe8\x1a\x94\x52\x5b\xdb\xb4\x76\x9c\xd9\x30\x98\
-\xcf\x2a\x92\x31\xcf\xbf\x56\x19\xea\x7a\xd3\x6f\x48\xfc\x2d\x6a\
-\xd6\xf2\x71\x17\x0e\x29\x36\x25\xf9\x6f\x20\x0b\x8f\x05\xcf\xe9\
-\xa8\xfd\x43\xf7\x7e\x1c\xf1\xfd\x62\x79\x89\x24\xf7\x35\xd0\x7d\
-\x16\xeb\xcb\x61\xab\x41\x0d\xf7\x2c\x9a\x6d\xdc\x6f\x69\x76\x8e\
-\x09\x1b\x29\x2a\xd8\xf8\x0e\x5f\x95\x62\xe1\xcf\xf5\x27\xbf\xfd\
-\x99\x8a\x55\xf6\x51\xce\x88\xde\xbc\xe9\x57\x5f\x4a\x7c\x26\xbc\
-\x31\xae\x2b\xd8\xe1\xb4\xab\xc1\xe2\x5b\x15\x25\x82\x0d\xb2\xa4\
-\x9e\xa7\xb8\xdf\xa1\xaa\x56\xff\x00\x2a\x7e\x3a\x57\x2a\xa4\x45\
-\xcb\x8a\xe9\x67\x95\x95\x87\x15\x94\xdd\x01\xb3\xea\x29\x68\x59\
-\x28\xd9\x31\xbd\x43\x14\x06\xe6\xe6\x38\x93\xab\x9c\x57\xcc\xa2\
-\x1b\x7a\x47\xd1\x1d\x69\x6d\x91\x22\x72\x42\x4e\x70\xf2\x8c\x0f\
-\x72\xff\x00\xd6\x7e\x95\xa9\x88\xcd\x24\x67\x18\x4f\x0f\x60\x3a\
-\x9e\xd8\x1e\xfc\x60\x53\x9b\xf1\x0b\x99\x12\x14\x25\xd3\x96\x3c\
-\x63\xd5\xe9\xd3\xe3\xd7\x26\xb5\x8e\x34\xb7\xb3\xb8\xbc\x8b\x2f\
-\x34\x44\xf2\x02\x36\x1d\x31\x8f\x76\x6b\x61\x18\x74\xf4\x45\x59\
-\x76\xb7\xe4\x0b\x51\xb9\x10\x72\xe9\xb6\xa4\x26\x70\x93\x11\xbe\
-\x58\xf6\xf8\x0c\x01\x55\xe4\x2b\x71\x3c\x8c\x8b\xc9\x26\x72\x17\
-\xb1\x00\xe7\x6f\x23\xb5\x48\x19\xb9\x4c\x84\x92\xd9\x76\xc9\xf3\
-\xc0\x19\xfa\x9a\x8a\xdd\x39\xee\xd8\x01\xb3\x80\x40\xf8\xd3\x13\
-\xea\x60\xb5\xd2\x81\xee\xc9\x49\x3e\xcf\xdd\x10\x36\x07\xeb\x0d\
-\xff\x00\x0a\x86\x73\xe1\x5b\x33\x8d\xb9\x4b\x63\xe3\x92\x07\xe3\
-\x9f\x95\x6f\x71\x2f\x8f\x76\xef\x8f\xce\xab\x92\x31\xfa\x4a\x3b\
-\x7c\x71\x5e\x71\x18\xf0\x62\xb5\x88\x0c\x17\x53\x29\xf9\x93\x8f\
-\xdf\x54\xc2\x11\x4c\xaf\xc9\xbd\x6f\xa8\xea\x33\x5e\x5a\xda\x5b\
-\xcf\xca\x56\xd5\x0a\x21\x03\x72\x09\xce\xfe\x75\x1b\x9a\x12\x53\
-\xbd\x53\x8e\x49\xed\x83\xca\x68\x69\x37\xa9\xe4\x34\x34\x86\xac\
-\x89\x25\xba\x20\x93\xbd\x0e\xe2\xa6\x7f\x7d\x43\x27\x5a\xa2\x51\
-\x35\x32\x16\x35\x0b\xf4\xa9\x1a\xa2\x6f\xba\x9b\x28\x4d\x32\x36\
-\x35\x13\x56\xed\x5a\x35\x35\x21\x4d\x91\x9a\xd0\xd6\xed\xd2\xb4\
-\x22\x98\x90\xb6\xcd\x1a\x9b\xf0\xa8\x79\x75\x1f\x02\x1c\x99\x18\
-\x78\x91\x81\xdd\x94\x13\xf8\x16\xa5\x0d\x4e\x78\x33\x50\x8f\x4b\
-\xe2\x5b\x2b\xb9\xaf\x65\xb2\x85\x18\xf8\x93\x47\x1f\x88\xc1\x48\
-\x39\x18\xf7\xf4\xcf\x6c\xd6\x6f\xf1\x7a\x3d\x3f\x92\x3b\x35\x85\
-\xa4\x3c\x65\xc1\x97\xdc\x37\x3d\xc1\x8a\xf6\xd1\x94\x46\xec\x73\
-\xca\xa0\x9f\x08\xb0\x1f\x02\xb8\xeb\xd2\xbe\x7f\xb8\x89\xa0\xb8\
-\x96\x17\xc8\x78\xdc\xa1\xc8\xc6\xe0\xe2\xbb\x17\x07\xea\xf2\x69\
-\x1c\x5d\xe3\x6b\x39\x95\x75\x32\x22\x87\x94\x80\xa0\x33\x02\xac\
-\xcb\xd9\x76\xc0\xce\xf9\x3f\x1a\x45\xe9\xef\x46\xb5\xd1\xb5\xfb\
-\x7d\x4a\x05\x68\xe2\xd4\x83\x3c\x84\xf4\x32\x82\x32\x00\xeb\x92\
-\x08\x38\xf8\xd4\x98\x2b\xe3\xc9\xd0\xfb\x3e\x7f\xf4\xa7\x34\xfc\
-\x90\xad\x77\x47\x35\x3b\x56\x50\xc6\x59\xa4\x3f\x99\x87\x91\x7f\
-\x5e\x5d\xbf\xdd\xeb\xf5\xc5\x65\x6c\x36\x47\xaf\x67\xd5\xd2\x0a\
-\x9f\x4e\x46\x54\x9e\x65\xd9\xb1\xe1\xa1\xc7\x42\x7a\x9f\xa5\x45\
-\x28\xda\x99\x46\x82\xda\xd6\x0d\xc7\x31\xdd\x88\x3d\x33\xe5\xef\
-\xc7\xe1\x5f\x3b\xc1\x1b\xad\xfa\x3b\xac\xf7\xa9\xd7\xb2\x3b\xe8\
-\x64\xbb\x65\x86\xdb\xd4\x42\xd8\x72\x76\x19\x18\xdf\xde\x0e\xff\
-\x00\x4a\x55\xaf\xb2\xc5\x2c\x76\x10\x9f\x52\x24\xf5\x88\xee\xe4\
-\x67\xf8\x7d\x69\xc5\xb0\xf0\xa6\x67\x72\x04\x6a\x99\x72\x4e\xdb\
-\x9c\x12\x4f\xd7\xe9\x55\xbd\x46\x44\xfb\x74\xb2\xa0\x32\x06\x72\
-\xca\xe5\xb6\x23\x3b\x55\x77\xdb\xf6\xc9\xf1\xf7\xd7\x84\x07\xce\
-\x24\xb3\x70\xe7\x0c\x72\x03\xfc\xd7\xaf\xf1\xac\xd2\x54\xf8\xed\
-\xce\x30\xd1\x23\x1c\x7b\x80\xe6\x1f\x81\xa9\xfc\x11\x25\xa5\xc9\
-\x58\x94\x47\x1f\xaf\x92\xfc\xb9\x1b\x74\xcf\x53\x50\x69\x72\xc1\
-\xe2\xc8\xad\x28\x8f\x30\xc8\xaa\x65\xe8\x32\xa7\x6c\xd1\xc4\xf6\
-\x3d\x75\xc3\x2b\xce\x48\x20\x83\xbf\x50\x6b\x7d\x6e\xf5\x6f\xa7\
-\x8a\x44\x46\x4e\x48\x52\x32\x09\xce\x4a\x8c\x64\x51\x9a\x46\x97\
-\x36\xb1\x7b\xf6\x5b\x77\x44\x93\x94\xb6\x5f\x38\xc0\xa7\x0f\xe8\
-\xf7\x53\x6f\xf1\x9b\x4f\xab\x7f\x0a\xa2\x17\x04\xf7\x48\xa2\x48\
-\x45\x09\x26\x33\x5d\x01\xfd\x1c\x6a\x8d\xd2\xe6\xcf\xf6\x9b\xf8\
-\x55\x39\x34\xa9\xa7\xd7\x06\x94\xaf\x18\xb8\x33\x18\x39\x89\x3c\
-\xbc\xc0\xe3\x3f\x0a\xaf\x1e\x89\xa9\x89\xa4\xea\x68\x69\x2b\xa3\
-\x3f\xa2\xfd\x60\xf4\xbb\xb1\xfd\xa6\xff\x00\x86\x83\xbc\xf4\x5f\
-\xaf\x46\x85\xa2\x7b\x39\xc8\xfd\x15\x90\x82\x7e\xa3\x15\x44\x5c\
-\xfb\x27\xa9\xaf\x47\x3c\x71\x50\x49\xb9\xa6\x5a\xc6\x99\x7b\xa5\
-\x5c\x9b\x7d\x46\xda\x5b\x79\x7a\xf2\xb8\xea\x3c\xc1\xe8\x47\xc2\
-\x82\xb5\xb7\x7b\xbb\xd8\x2d\xa3\x20\x3c\xd2\x2c\x6a\x4f\x40\x49\
-\xc6\xff\x00\x5a\xa6\x75\xdc\x96\xbd\x01\xbd\x42\xfd\xeb\xa7\xb7\
-\xa1\xdd\x70\xff\x00\x8e\xe9\xdf\xb4\xff\x00\xf0\xd6\x8d\xe8\x6f\
-\x5e\x3f\xe3\xba\x77\xed\x3f\xfc\x35\x95\x9f\x1f\xb3\x0f\x0e\x4f\
-\x47\x2f\x6a\x22\xdd\xb4\xf1\x63\x70\xb7\x71\x5c\xb5\xd9\x65\xf0\
-\x9e\x37\x01\x55\x77\xe6\x04\x11\xb9\xe9\x8a\x79\xc6\xbc\x1f\x7d\
-\xc2\x4f\x68\xb7\xf3\x5b\xca\x6e\x43\x14\xf0\x49\x38\xe5\xc6\x73\
-\x90\x3c\xea\xac\xd5\x44\xea\xd6\xe5\x93\xd2\x70\xf4\xc6\x76\xb0\
-\x68\x73\x10\x2e\x2f\xef\xed\x73\xd4\x9b\x55\x90\x0f\xa3\x83\xf7\
-\x55\x8a\xdb\x83\x74\x39\xec\xa2\xba\xfe\x53\x32\xc7\x33\x94\x89\
-\x9a\xc9\x90\x3e\x3a\xe3\x98\x8c\x90\x7c\xb3\x51\xf0\x8f\xa3\x8d\
-\x63\x8a\x74\xb3\xa8\x59\x4b\x6b\x05\xbf\x88\x63\x5f\x1c\xb0\x2d\
-\x8e\xa4\x60\x1d\xbb\x7c\xaa\xbf\x7f\x77\xc4\x7c\x2d\xac\xdc\x69\
-\x51\xdc\x49\x03\xd9\x48\x50\x87\x7e\x68\x8e\x77\xc8\x8c\xec\xc0\
-\xec\x77\xc5\x03\xae\xa7\xd3\x15\xca\xfe\xfd\x04\xa7\xa5\x6e\xe7\
-\x8f\xef\xf6\x5a\xbf\x91\x1a\x4a\x86\x36\xfa\xa9\xbe\x60\x71\xc8\
-\x3f\x32\x7e\x9c\xa4\xd2\xbb\x8b\x43\x64\x48\xd2\xe3\x0b\x20\x38\
-\xe7\xb4\xb7\x13\x4b\xfb\x6e\xe3\x1f\x15\x02\xbd\x87\x8b\x23\xbe\
-\x11\xae\xaf\x6b\x6c\xb3\x29\xcf\x89\x14\x21\x62\x63\xe6\x63\xe8\
-\x3e\x23\xee\xa6\x03\x55\x1c\xc5\xa4\x7e\x66\x71\xcc\x59\x99\xca\
-\xb0\xf3\x0c\xa4\xb0\xdb\x6c\xfa\xcb\xe6\x2b\x1a\xca\xbf\x20\xb7\
-\x8f\xfc\xa2\x7b\x58\x3e\xc7\x20\xfc\xaa\xfa\x9d\xbd\x9c\x8d\xce\
-\x27\x99\x04\x72\x24\x99\xf6\x97\xda\x24\x1e\x8d\xd8\x8e\xf9\x02\
-\xba\xa7\xa4\x1b\x64\xe2\x4e\x01\xb8\xbe\x92\x32\x2e\xd6\xdd\x2f\
-\x23\x88\x37\x30\x47\x8c\x95\x93\x94\xf7\x1c\xa7\xe7\xb1\xae\x6e\
-\xc8\x23\x80\x5d\x59\x99\xed\x91\xd4\x1f\x11\x67\x67\x8b\xe2\xc1\
-\x0f\x4c\xed\x9e\xdd\xf1\x5d\x4b\xd1\x6d\xdd\xce\xb7\xc3\xb7\x7a\
-\x7e\xb6\x23\x12\x5a\xab\x45\x14\x91\x81\xca\xf0\xc8\xa4\x02\x08\
-\xd9\xbb\x8f\xa5\x2b\x3a\xe9\xd6\x45\xe1\x8c\xc3\xce\xf1\xbf\x27\
-\xce\x55\x94\x46\xa5\x68\xf6\x1a\x8d\xd5\x9c\x80\x87\xb7\x95\xe2\
-\x39\xfe\x89\x23\xf7\x56\x56\xd9\x72\xb6\x8d\x73\xe1\xf2\x7d\x43\
-\x2e\xf4\x75\xea\xe2\xd7\x0b\x9f\x51\xb0\x3e\x3c\xbf\xff\x00\x68\
-\x17\xea\x29\xb2\x28\x8a\x49\xc4\xa7\x31\xaf\xac\x72\x3f\x4b\x3b\
-\x57\xcf\xb0\xce\xf6\x77\x19\xab\xb3\x17\xea\x4c\x53\x4d\x82\xdb\
-\x9b\xf3\x8c\x70\xc0\x6e\x70\x3a\x03\xf5\xcd\x24\x91\x16\x25\xc3\
-\x62\x55\x3d\xc6\xea\xa7\xce\x8a\xbb\x90\xbb\xbb\x16\xe6\x77\x39\
-\x66\xf3\xff\x00\x95\x2f\x62\x51\x89\x53\x83\x4c\xde\xd9\x84\xb4\
-\x8c\x60\xf2\x41\x3a\xb1\xcb\x04\xf9\x10\x37\x04\x7c\xb3\xf4\xa4\
-\xb2\x0f\x21\x56\x0b\x17\x8e\x4b\x85\x8d\xb0\x85\xbd\x4c\x76\x20\
-\xf9\x52\x69\x2d\xe4\x13\xb4\x38\x3c\xe1\x8a\x9c\xf6\xed\xbd\x3a\
-\x64\x55\x50\xd7\xd1\xf7\xf7\xc8\x3f\xa9\x7f\xdd\x52\xf1\xce\xb7\
-\xa9\xd8\x71\x04\xb0\x59\xde\xcb\x0c\x21\x10\x85\x5c\x60\x6d\x5e\
-\xf0\x4c\x26\xdf\x8a\xde\x26\x64\x62\x91\x38\x2c\x87\x2a\x7a\x74\
-\x35\x62\xd7\x64\xe1\x95\xd4\x18\x6b\x0b\x6e\x6e\xf9\x46\x79\xd5\
-\x89\xc7\x6e\x95\x54\xa2\x5a\x7c\x9c\xd6\x4e\x2b\xd7\x47\x4d\x4e\
-\xe0\x7d\x3f\x85\x0d\xc2\xb2\xbc\xdc\x65\xa6\xcb\x2b\x16\x91\xee\
-\x83\x33\x1e\xa4\x9e\xf5\x79\xd4\x66\xe0\xaf\xb0\xdc\x78\x0b\x69\
-\xe3\x78\x6d\xc9\x84\x6c\xf3\x63\x6f\xbe\xa8\x7c\x1f\xb7\x15\xe9\
-\x3f\xfd\xc2\xd5\x10\xb8\x62\x29\x97\x3f\x4b\x1a\xde\xa7\xa4\xde\
-\xe9\xe9\xa6\xde\x4b\x6c\xb2\x46\xe5\x82\x63\x72\x08\xc5\x51\xed\
-\x38\xff\x00\x88\xec\xe5\x0e\x6f\xcc\xeb\x9d\xd2\x64\x56\x07\xee\
-\xcf\xdf\x56\x6f\x4d\xff\x00\xf7\x8e\x97\xfd\x4b\xff\x00\xee\x15\
-\xcb\xa4\x34\xfc\x31\x35\x0b\x68\x46\x5b\x6a\xb8\x3b\xa4\x2f\x63\
-\xe9\x23\x83\xa4\x12\x44\xb1\x5d\x2e\x57\xcc\xc3\x28\x1b\x10\x7c\
-\x8e\xdf\x2a\xe1\xfa\x34\x6d\x0f\x13\x69\xf1\x4a\x39\x64\x4b\xc8\
-\xd5\x87\x91\x0e\x01\xae\xa7\xe8\x21\x5f\xc0\xd6\x5b\x7f\x0c\xbc\
-\x60\x79\x73\x60\xe7\xf7\x57\x38\xbf\xb8\x81\x3d\x24\x13\xe2\x22\
-\xab\xea\xbe\xa0\x27\xda\xfc\xef\x61\x45\x89\x74\x55\xc7\x80\x32\
-\xbe\xa5\x35\xe4\xea\x7e\x9a\xb5\xdd\x4f\x44\xb5\xd2\x9b\x49\xbc\
-\x92\xd5\xa5\x92\x40\xe5\x31\xeb\x00\x06\x3a\x8a\xe5\x0d\xc7\xfc\
-\x53\xff\x00\x9d\xdd\x7d\x17\xf8\x57\x77\xe3\xcb\xfe\x1b\xb1\x86\
-\xd0\xf1\x54\x11\xcd\x1b\xb3\x08\x43\xc2\x64\xc1\xc0\xcf\x4e\x9d\
-\xaa\x95\x36\xb7\xe8\xb2\x65\x0b\x2e\x9b\x6c\xeb\x9c\xe0\xd8\xb1\
-\x1f\x85\x0e\x0a\x4a\x3f\x0d\x99\xcd\x2d\xd7\xe7\xa3\x8e\x6b\xbc\
-\x57\xa8\xeb\xcd\x17\xdb\xef\x27\xd4\x9e\x1c\x84\xc0\x18\x4c\xf5\
-\xf5\xb6\x1d\xa9\x7d\x8d\x8d\xf6\xab\x7d\x6f\x69\x13\x08\xe5\xb8\
-\x91\x63\x48\xe2\xdd\x89\x27\x1b\xb1\xfd\xc3\xe7\x56\x5e\x3b\xb8\
-\xd1\xee\xb8\x8a\x69\x38\x6e\x24\x87\x4d\xf0\xd0\x22\x24\x7e\x18\
-\x07\x1b\xfa\xbf\x1a\xb7\xfa\x06\xd0\x3e\xdd\xae\xcf\xab\xce\x99\
-\x86\xc4\x72\x45\x9e\xf2\xb0\xfd\xcb\x9f\xa8\xab\x9d\x2c\x78\xba\
-\xdf\x1f\xa2\x35\x2e\xf2\x74\xae\x7f\x67\x46\xd4\x75\x4d\x3b\xd1\
-\xc7\x0f\xe8\x1a\x6f\xb5\x11\x91\x2d\x77\x62\x4f\x2f\xe9\xc8\x73\
-\xb9\xdc\xe7\xe7\x54\x6f\xfb\x41\xe8\x00\x49\x65\xaf\xdb\xae\x55\
-\xc0\xb7\xb8\x23\xcf\xaa\x37\xe2\x3e\x94\xb7\xd2\xed\xa7\x10\x71\
-\x17\x15\xca\x6d\x74\x7d\x4a\x4b\x1b\x45\xf0\x21\x65\xb7\x72\xad\
-\xdd\x98\x6d\xdc\xfd\xc0\x57\x41\xe1\xcb\x3b\xbe\x29\xf4\x60\xfa\
-\x46\xbd\x69\x71\x6b\x78\xb1\x1b\x63\xf6\x88\xca\x92\x57\xf9\xb7\
-\x19\xff\x00\x57\xe8\x6a\x38\x5f\x0f\x4e\x5d\xf3\xe7\xf9\x2b\xa7\
-\xf2\xf5\x62\xd7\x1e\x3f\x83\xe6\x8a\x9e\xda\xed\xe0\xf5\x08\xf1\
-\x21\xce\x4a\x13\x8c\x1f\x30\x7b\x1f\x78\xad\x6e\xed\xe5\xb4\xb9\
-\x9a\xde\xe1\x0a\x4d\x0b\x98\xdd\x4f\x50\xc0\xe0\x8a\x84\xe0\x56\
-\xe5\x24\xd1\xaa\xec\x3c\x82\xf9\xad\x98\x5c\x23\xb3\xc2\xcc\x33\
-\x2a\x8c\x3a\xb7\x93\x81\xd4\xf9\x30\xc1\x3e\x7d\x45\x76\x7f\x46\
-\x01\x6d\xf4\x0b\x8b\x8f\xb4\x31\x4b\xf7\xcc\x6a\x00\x21\x37\xe5\
-\xe6\x07\x1d\x79\xbc\xfc\x8f\xc2\xb8\x3e\x8f\x2c\x11\xea\x50\x0b\
-\xd9\x5e\x2b\x27\x60\x97\x05\x13\x9c\x94\x3d\x7d\x5e\xff\x00\xf4\
-\x6b\xb0\xda\xeb\xf6\x62\xe9\x1a\x37\x5b\x3e\x18\x4b\x29\x22\x05\
-\x49\x5f\x0d\x00\xcf\x30\x00\x6e\xdd\xf6\xdf\x35\x17\xd6\x4f\xdb\
-\xa4\x57\xf4\xb5\xce\xce\x6d\xe9\x3e\xcc\xd8\x71\xde\xad\x11\x6e\
-\x6e\x69\x04\x9c\xde\x7c\xca\x0e\x7e\xf3\x59\x44\x7a\x6e\x92\xe1\
-\xbd\x23\x6a\x02\x18\xc3\x29\x8e\x12\x25\x90\xe1\x48\xf0\xc6\xe0\
-\x0d\xcf\xdd\x59\x55\x60\xbd\xe3\x97\xfa\x44\xd9\x63\x57\x5c\xf9\
-\x3b\xd4\x64\x78\xc9\x91\x91\xcc\x36\xf3\xde\x98\xeb\xf2\x14\x54\
-\x55\xff\x00\x09\xb9\xf8\x0e\xd4\xb0\x90\xae\xa7\xc8\xe6\x8b\xd7\
-\xdb\xc4\x90\x11\x83\xcb\x90\x3e\x15\xc4\xe3\x5a\x86\x76\x37\xcd\
-\xa1\x2c\xb8\xa1\x64\x1e\x74\x4b\x64\xe0\x00\x4e\x7c\xab\x47\x2b\
-\x17\x91\x93\xea\x17\xfe\x75\x99\x93\xd5\x40\x6f\x10\x5f\x5a\x52\
-\x40\xec\x07\x53\xfc\x2a\x0d\x46\xee\x6b\xa9\x5a\x49\x5b\xae\x33\
-\x8e\xf8\xf3\xf3\xa9\x66\x24\x92\x58\xe4\x9e\xe6\x83\x97\xbd\x51\
-\x08\x45\x31\xd7\x01\x7f\x7c\x63\xfa\x97\xfd\xd4\xbf\xd2\x2f\xf7\
-\xcd\x3f\xf5\x69\xf8\x50\xb6\x57\xf7\x1a\x6d\xcf\xda\x2d\x1c\x24\
-\xbc\xa5\x72\x54\x1d\x8f\xc6\xa3\xb9\x37\x5a\xf5\xf3\xcb\x75\x2c\
-\x4a\xdc\xbe\xbc\xcf\xea\x22\x80\x36\xce\x3e\x95\x4c\x2d\x13\xd3\
-\x2b\xd2\x75\xe9\x46\x70\x89\xff\x00\xe6\xdd\x27\x1f\xf8\x85\xa5\
-\xb7\xf7\x56\xf6\xa0\x1b\x89\x15\x09\xd9\x57\xab\x37\xc0\x75\x3f\
-\x2a\x5d\x6f\xa9\xdf\xc1\x7d\x0d\xd6\x9b\x08\xb7\x92\x26\x0e\x92\
-\xdc\x0e\x87\xcc\x27\x53\xf3\xc5\x56\x96\xd6\x89\xa9\xf3\xb3\xaf\
-\xfa\x4d\xe1\x7d\x53\x88\x2f\x2c\x64\xd3\x63\x89\x96\x28\xd9\x5f\
-\x9e\x40\xbb\x92\x2a\xa1\x67\xe8\xb3\x5b\x9e\x60\x2e\xa5\xb4\xb6\
-\x8f\x3b\xb7\x39\x73\xf2\x00\x7e\xfa\x0a\x3f\x48\x1c\x4f\x12\x11\
-\x26\xa2\x92\xb9\xdc\x93\x6e\x83\xe8\x00\xa1\xaf\x78\xff\x00\x89\
-\x67\x42\xa7\x52\x68\xc7\xfe\x94\x6a\xa7\xea\x05\x16\x38\xcc\x96\
-\x96\x85\xdd\xe3\x6f\x6c\xe9\x1a\xb5\xee\x99\xe8\xe7\x84\xcd\x95\
-\x9b\x87\xbe\x90\x1f\x0d\x49\x1c\xf2\x48\x7a\xbb\x79\x01\xfb\xb1\
-\x5c\x33\x86\xe0\x8e\x3e\x23\xd3\xa4\x55\x1e\x2b\xdd\xc6\x5a\x43\
-\xbb\x31\xe7\x1d\x49\xdc\xd7\x97\x73\xcd\x73\x3b\xcd\x71\x2c\x92\
-\xca\xde\xd3\xbb\x16\x27\xe6\x6a\x08\x67\x92\xd6\xe6\x19\xe1\x20\
-\x4b\x13\x89\x10\x91\x9c\x10\x72\x2a\x8c\x58\x7a\x13\xf2\xd9\x3e\
-\x4c\xbd\x4d\x7a\x47\x78\xf4\xb9\xc2\xfa\x9f\x13\x5b\x69\xa9\xa4\
-\xa4\x4e\xd0\x3b\xb3\xf8\x92\x05\xc0\x20\x63\xf0\xae\x68\xde\x8a\
-\x38\xa4\xff\x00\x8b\xda\x7f\xb4\x0a\xd5\xbd\x27\xf1\x5f\xfe\x3a\
-\x2f\xf6\x74\xfe\x15\x1b\x7a\x52\xe2\xb1\xd2\xfe\x2f\xf6\x74\xfe\
-\x14\x38\xb1\x67\xc7\x3d\x33\xa3\x39\x32\x61\xb7\xb7\xb1\x37\x14\
-\xf0\x6e\xb1\xc3\x51\xdb\x3e\xa9\x14\x4a\x2e\x18\xa4\x62\x29\x03\
-\x92\x47\x6a\xec\xf0\xcb\x17\xa3\x4f\x46\x50\xc9\x24\x6b\x25\xe0\
-\x00\x98\xc9\xc7\x89\x3b\xee\x47\xcb\xf0\x5a\xe3\x7a\xcf\x1b\xeb\
-\x9a\xc4\xf6\x33\x6a\x17\x11\x4c\xf6\x52\xf8\xd0\xe6\x15\x00\x37\
-\x99\x18\xdf\xa7\x7a\x17\x89\xf8\xbb\x5a\xe2\x58\xa0\x8b\x57\xba\
-\x13\x47\x0b\x16\x45\x58\xc2\x00\x48\xc6\x4e\x3a\xd3\x6b\x0e\x4c\
-\xaa\x56\x4d\x6b\xc8\xa9\xcb\x8f\x13\xa7\x1f\xc1\x7b\x3e\x9b\xf5\
-\x11\xfe\x46\xb4\xfe\xd9\xbf\x85\x36\xe1\x1f\x4b\xf2\xeb\x1c\x45\
-\x67\xa7\xea\x1a\x75\xbd\xac\x37\x2f\xe1\x89\x52\x42\x79\x58\xfb\
-\x3d\x47\x42\x76\xf9\xd7\x08\xb9\x9e\x28\x14\x34\xd2\x2a\x03\xd3\
-\x27\xaf\xc0\x77\xa1\xd6\xea\xe1\x9d\x5e\xd2\x23\x19\x52\x19\x65\
-\x97\x2b\x82\x3b\x85\xeb\xf5\xc5\x1d\x7d\x1e\x16\x9a\x4b\x93\x13\
-\xf5\x59\x93\x4d\xbe\x0e\xab\xe9\xe7\x87\xff\x00\x26\xf1\x34\x7a\
-\xa4\x09\x8b\x7d\x45\x72\xf8\xe8\x25\x5e\xbf\x51\x83\xf5\xaa\x2c\
-\x3a\x14\xf3\x69\xf6\xf7\xc2\xe2\xd3\xec\xd3\x29\x65\xe4\x98\x3b\
-\x80\x09\x07\x2a\x37\x1b\x8e\xf8\xa2\x78\x8b\x8c\x35\xde\x26\xd2\
-\xc5\x87\x10\xde\x45\x7b\x6e\x24\x12\x81\xf6\x74\x4c\x30\xd8\x63\
-\x1b\xf7\x3d\x49\xa4\x11\x0f\x04\xa9\x8b\xf3\x65\x7a\x72\x6d\x8f\
-\xa5\x3b\x04\x65\x9c\x6a\x69\xf6\x15\x96\xf1\xbb\x75\x3e\x43\x04\
-\x56\xea\x76\x9e\x01\xe6\xcc\x1a\x43\xf2\x50\x31\xf5\x26\xae\xfe\
-\x8a\x93\x4f\xbe\xd4\x6f\xac\x2f\xa6\x9a\xe5\x4d\xbb\x3a\x07\x1c\
-\x85\xb7\x1c\xca\xad\x93\x80\x47\x6d\x86\xd5\x48\x4b\x97\xb8\x75\
-\x8e\xe2\x11\x72\xcc\x70\x08\xda\x4f\x93\x0e\xbf\x3c\xd5\xb7\x40\
-\x89\x34\x4b\x45\xd4\xad\x39\xe4\x66\xb8\x45\x8c\x95\xc3\x3b\x29\
-\xcb\x05\x3d\x19\x57\x23\x24\x75\x26\xbd\x9a\x37\x3a\x7d\xcc\x62\
-\xbf\xbb\x6b\xb0\x0f\xa5\x0b\x99\x6f\xb5\xfb\x3b\xa9\xe3\x31\x4b\
-\x35\x84\x0c\xc8\x4e\x79\x4e\x0e\xd5\x95\xaf\xa4\xf7\x8d\xf8\xa9\
-\xc4\x0c\x19\x16\xde\x2d\xc7\x9b\x2f\x39\xfb\xda\xb2\x9d\x81\x6b\
-\x1c\x89\xcd\xfe\x23\x3b\xcb\xf7\xc7\xdf\x47\x6a\xe6\x33\x14\x13\
-\xc5\x92\xae\xa0\xb2\xe3\xb7\x43\x40\x48\xdf\x5a\x61\x63\xff\x00\
-\xc4\xd8\x14\x00\x19\x61\xe6\xe5\x07\xb8\x3b\xe3\xf7\xfc\xab\x89\
-\xc6\xbc\x1d\x96\x47\xad\x31\x35\xc0\xf0\x3d\x5c\xfa\xc7\xbf\x90\
-\xf2\xa5\xf2\x1d\xce\x28\xf6\xe5\x70\x54\x9c\x0f\x7f\x50\x7f\x7d\
-\x2a\xd4\xe7\x8f\x4f\x55\x6b\xb6\xf0\x83\x1c\x26\xc4\x97\x3e\x4a\
-\x06\xe4\xfc\x29\xb2\x80\x74\x69\x21\xed\x43\x48\x46\x09\x3d\xb7\
-\xa1\xde\xe2\xf6\xeb\x6b\x4b\x5f\x05\x0f\xf8\x5b\x9e\xbf\x28\xc6\
-\xff\x00\x52\xb5\x1c\xba\x5c\x4a\x73\xa8\xc8\xf7\xd3\xf5\xe4\x97\
-\x1e\x12\x7f\xa8\x36\x27\xe3\x9f\x8d\x3e\x64\x55\x3f\x64\x6f\x70\
-\x84\xa7\x83\x14\xb7\x6e\xfe\xc2\x41\x8c\x37\xc5\xcf\xaa\xa3\xe7\
-\x9f\x21\x43\x6a\x3f\x6c\xb9\x51\x0b\x5c\xad\xb5\xba\xe0\x98\xed\
-\x86\xe5\xbb\xfa\xe7\xb7\xc0\x03\xef\xa6\x72\xb1\x82\x3d\x8f\xe7\
-\x24\x1f\xb2\xbf\xf3\xfc\x3e\x34\x0b\x82\xc8\xe5\x15\x99\x50\x65\
-\x88\x1b\x01\xef\xf2\xaa\x62\x7d\x93\xd5\x0a\x05\xa5\xbd\xa6\x4c\
-\x31\x85\x66\x1e\xb3\x92\x59\xdb\xe2\xc7\x73\x41\xcd\xd6\x98\x5d\
-\x11\x8c\xfd\x28\x38\x6d\xde\xee\xe5\x62\x88\x6e\xc7\x73\xd9\x47\
-\x72\x7d\xc2\xaa\x85\xa4\x49\x6f\x60\x32\x56\xf7\x70\x5b\xc5\xa7\
-\xc4\xe6\x59\x3e\xdc\xee\x4b\x43\xcb\xea\xac\x78\xd8\xe7\xcc\xf9\
-\x79\x51\x77\x56\xf0\x5a\xdc\xcc\xf1\xcc\xb7\x56\xf1\xbf\x2c\x4e\
-\x14\xa8\x94\xf9\xe0\xef\x81\xdf\xfe\x74\xa6\x77\x69\x1d\x9e\x46\
-\x2c\xcc\x72\x49\xee\x69\xf2\xb7\xd8\x45\x70\x0c\xfd\xea\x06\xef\
-\x53\xbd\x09\x75\x73\x0d\xba\x83\x34\x8a\x99\xe8\x09\xdc\xfc\x07\
-\x53\x4f\x5a\x42\x1f\x27\x8f\x50\x39\xa8\x5e\x7b\x89\xbf\xfa\x68\
-\x39\x17\xfc\xe4\xfb\x7d\x14\x6f\xf5\xc5\x44\xd6\x42\x4d\xef\x25\
-\x7b\x83\xfa\xad\xea\xa7\xec\x8d\x8f\xcf\x34\x69\xfa\x01\xaf\x66\
-\x92\x5f\x44\x58\xad\xb8\x7b\x87\x1b\x11\x10\xc8\x1f\x16\xe8\x3e\
-\xb5\x19\x4b\xa9\xbf\x9c\x91\x6d\xd3\xf5\x62\xf5\x9b\xf6\x8e\xdf\
-\x41\xf3\xa7\x36\x36\x51\x5c\x41\x73\x9b\xbb\x6b\x5f\x02\x30\xc8\
-\x92\x64\x78\x87\x38\xe5\x5c\x0c\x67\xbd\x6d\x67\xa6\x19\x6f\x21\
-\x4b\xa9\x3c\x2b\x46\x60\x24\xb9\x8d\x7c\x61\x1a\xfe\xb6\x16\x89\
-\x7e\xd8\x3f\xec\x84\xd0\xda\xc5\x0b\x16\x44\x1c\xe7\xab\xb1\xe6\
-\x63\xf3\x3b\xd4\x87\xad\x1b\x35\x83\x78\xb2\x0b\x59\x12\xe9\x15\
-\x88\x0d\x1f\xb4\x47\x9f\x29\xf5\x87\xd2\x82\x20\x82\x41\xd8\x8d\
-\x88\xa6\xca\x5a\xe0\x5d\x37\xe4\xd7\x14\x5d\x96\x97\x7b\x7a\x39\
-\xa0\x81\xcc\x3b\x93\x33\x0e\x58\xd4\x0e\xa4\xb1\xda\x85\x34\xc6\
-\xdb\x50\xbd\x97\x4e\xfc\x9e\x2e\xa7\x11\x42\x4c\xd0\x46\xae\x40\
-\x53\xd5\x80\x1e\xf1\xbf\xc4\x7b\xe8\xab\x7e\x0c\x4e\xb7\xc9\x21\
-\x58\x2c\x11\xa3\xb4\x47\xbb\xb8\x61\x86\x94\x21\x09\xef\x03\xbe\
-\x3e\x1d\x7c\xfb\x51\xfa\x42\x6a\xda\x83\x5b\x59\x48\x64\x2b\xf6\
-\x88\xda\x08\xe7\x3c\xa8\xbc\xc7\x94\xf2\x0d\xb9\x7f\x47\xd9\xf2\
-\xaa\xe3\xdc\x4e\xe3\xd6\x9a\x56\xf8\xb9\x35\x6c\xe0\x08\x3e\xcd\
-\x1e\xab\xae\xdc\x67\xc3\xb1\xb6\x67\x8c\x91\xed\x49\x90\x17\xfd\
-\xe2\x3e\xff\x00\x2a\x0c\x8b\xa6\x76\xc3\xc6\xfa\xab\x5e\x04\xfc\
-\x6f\x75\x6f\x7b\xc5\x9a\xa4\xd6\x48\xc9\x6e\x66\x28\x81\x88\x3b\
-\x28\x0b\xdb\xb6\xdb\x56\x52\x42\x49\x24\xb1\xc9\x3d\x7d\xf5\x94\
-\xe8\x8e\x99\x4b\xd0\x9b\x7d\x4d\xb2\xfa\xdc\x73\xaf\xe3\x26\xee\
-\x31\xff\x00\xe1\x5f\xe1\x4d\x78\x27\xd2\x06\xa5\x79\xac\xfe\x4e\
-\x7b\x88\x9d\xef\x07\x87\x0c\xfe\x10\xe5\x8a\x51\x92\x99\x23\x62\
-\x09\xf5\x4f\x5e\xb5\xce\xcd\xaa\xb1\xcd\xc3\x34\xcd\xe4\xfe\xcf\
-\xec\x8d\xaa\x45\x76\x8d\xd5\xa3\x25\x19\x08\x2a\x57\x6c\x11\xd3\
-\x15\xc5\x24\x76\x14\xce\xb7\xc6\x93\x71\x04\x36\xf1\x6a\x51\x5d\
-\x0b\x68\x65\x52\xad\x69\x12\xa7\x31\x94\x7b\x43\x9f\x19\x00\x7c\
-\x89\xed\x8a\xa1\xff\x00\x2d\x38\x8c\xa2\x59\xad\xd1\x21\x5b\x0b\
-\x11\x88\x12\x1b\xa7\x7d\xf3\xf1\xae\x86\x9a\xcc\x1a\xbe\x9d\xa7\
-\x6b\x32\xca\xf0\x41\x28\x10\xdd\xac\x44\x60\xdc\x8e\xab\xca\x76\
-\xf5\x87\xad\x9f\x2c\xef\x90\x29\x57\x14\xd9\x6a\x5a\xa5\x91\xba\
-\x09\xa7\x2d\x9c\x28\x79\x07\x86\x60\xe5\x0d\x80\x63\x89\x97\xdb\
-\x3b\x6f\xdf\xb7\x9d\x35\x21\x7d\x4c\xac\x5f\x71\x95\xed\xb5\x8d\
-\xbc\x76\x97\x6c\xfa\x8f\xad\xf6\x99\x0c\x49\xe1\xaf\x90\x8c\x8e\
-\xbb\x75\x3e\xed\xa9\x7d\xb7\x16\x6a\xee\xcf\x24\xf7\x08\x60\x84\
-\x73\x38\xf0\x97\xd6\xf2\x5e\x9d\xcf\xdd\x9a\x30\xe8\x5a\x2c\x1a\
-\x06\xa1\x35\xfd\xd4\xab\xa8\x84\xcd\xac\x50\x1e\x71\x91\x93\xeb\
-\x02\x06\xc4\x03\xbf\x6c\x55\x56\xf8\xf8\x36\xf0\xdb\x0f\x6b\x02\
-\x59\x7f\xd2\x23\x61\xf2\x1f\x79\x34\x72\x2d\xb0\xfb\x8e\x31\xd6\
-\xdd\xd9\xda\xe5\x09\x27\x3f\xcd\x2f\xf0\xad\xb4\xde\x35\xd6\x22\
-\xb8\x78\x24\xbd\x11\xdb\x5d\x2f\x83\x31\x11\xae\x30\x7a\x1e\x9d\
-\x8e\x0f\xca\xab\x52\x1a\xf2\x38\x03\xc6\x66\xb8\x63\x1d\xb0\x38\
-\xe6\xc6\xee\x7f\x55\x47\x73\xf7\x0a\x72\x14\xc6\xed\xad\x6b\x9f\
-\x69\x9e\x19\xe7\x48\x84\x0c\x56\x67\x68\xc7\x2a\x60\xe3\xcb\x7f\
-\x70\x1d\x68\xbf\xe5\x1e\xa1\xe0\x2c\x10\x4e\x21\x59\x57\x9d\xe4\
-\x78\xc7\x32\xc4\x3a\xbb\x7b\xdb\xb0\xf2\xc7\x5e\x6c\xd0\x1a\x9c\
-\xf1\x6a\x3a\x7d\xbe\xa5\x29\xf0\xed\xad\x71\x0d\xd4\x20\xe5\x8b\
-\x01\xf9\xb3\xe6\xcc\xe0\x05\xcf\x9a\x9a\x47\xab\x5d\x5c\x65\xed\
-\xd1\x15\x65\x90\x87\xb8\x77\xd8\x06\xed\x18\x03\xb2\x8f\x86\xff\
-\x00\x01\x4c\x54\xfb\x00\xd2\x18\xde\xf1\x56\xa3\x34\xa4\xc7\x22\
-\xa4\x2a\x39\x63\x42\x80\xf2\x8f\x7f\xbf\xb9\xf7\xd2\xe7\xe2\xad\
-\x41\x89\x11\x4a\x25\x6f\xe8\x46\xb8\xfa\xf4\xa5\x26\xdc\x36\xf3\
-\x33\x4b\xee\x6d\x97\xe9\xd3\xeb\x4e\xf4\xc8\x12\xda\x58\x9e\x61\
-\x89\x4a\xf8\x81\x40\xfe\x6a\x30\x32\x5c\xfb\xc8\xf6\x47\xcf\xca\
-\x98\xaa\x97\x91\x6e\x64\x27\x5e\xba\xd4\x6c\xa1\xb1\x56\xd5\x14\
-\xdd\xcd\x0f\x89\x73\x6f\x1c\x00\x35\xb3\x13\xea\xa9\x73\xb1\x25\
-\x70\x76\x03\x19\xc5\x27\x83\x54\xba\xb7\x25\xa2\x64\x0e\x7a\xbb\
-\x28\x66\x3f\x16\x3b\x9a\x63\xa3\xe9\x53\x71\x36\xa5\x79\x8b\xdb\
-\x0b\x36\x58\xda\xe1\x9e\xf2\x71\x12\x10\x3a\x2a\x93\xd4\xee\x00\
-\x14\x1d\xce\x83\xaa\xdb\xa7\x88\xf6\x13\x34\x67\xa4\x91\x0f\x11\
-\x7e\xab\x91\x44\xa9\xf9\x7c\x82\xe5\x6b\x84\x68\xfa\xf6\xa0\x47\
-\xf3\xab\xfb\x02\x9a\x6a\x3a\xdd\x94\x93\xaf\xe4\xfb\x9b\xf8\x22\
-\xf0\x93\x9b\xed\x10\xc7\x21\xf1\x31\xeb\x7b\x24\x7a\xb9\xce\x2a\
-\xb2\xfe\xa9\x20\xec\x7c\x8d\x5b\x38\x5e\xcf\x87\xff\x00\x92\xfa\
-\xc6\xa1\xad\x5b\x5e\xcd\x77\x6e\x0c\x70\x85\x70\xb1\x16\x70\x15\
-\x08\x03\x04\xb2\x92\x58\xef\x8c\x01\xe7\x47\xf2\x52\xe7\x6c\x05\
-\x8e\x5f\x81\x61\xd4\x2e\xdd\x73\x16\xa5\x68\xc7\xf5\x59\x7c\x33\
-\xfe\xf0\xc7\xdf\x56\x2d\x15\xf5\xdd\x12\x4b\x5d\x59\x6d\xac\xf5\
-\x63\x24\x0e\xf1\x47\x6b\x72\xac\xf6\xce\x0e\x15\xd8\x26\xf9\x04\
-\x67\x1b\x83\xde\xa9\x4d\x6f\x6a\xc4\x78\x57\xca\x33\xd7\xc5\x89\
-\x97\x1f\x4e\x6a\xf0\x59\x48\xb2\x03\x05\xcd\xab\x37\x62\x93\x85\
-\x3f\x7e\x0d\x13\xba\x6b\x5b\x30\xa2\x57\x3a\x2d\x97\x9c\x5f\x77\
-\x25\xcb\xb6\xb7\x07\x34\xac\x79\xcf\xda\xed\x80\x62\x49\xea\x1d\
-\x02\xb0\xfa\x1a\x6b\xab\x98\x0d\xda\x41\x69\xab\x47\x74\x4c\x51\
-\xc9\x89\x63\x32\x2a\x97\x40\xdc\xa1\xd4\x09\x06\x33\xdd\x08\xad\
-\xf8\x52\x0d\x46\xcf\x40\xfb\x79\x6b\x9b\xeb\xaf\x06\xe5\x7e\xcb\
-\x74\x8b\x71\x6c\x14\xf2\x47\x1b\x2e\xe7\x2d\xcf\x27\xc3\xd5\x34\
-\xaf\x8e\xda\xde\x0e\x2e\xd4\xad\xa3\xd0\xfe\xd9\x6d\x6f\x2f\x84\
-\x27\xf0\x5e\x09\x09\x50\x15\xb0\x50\xe0\x8c\x82\x01\xc7\x4c\x52\
-\xd6\x4a\xde\x93\x09\xc4\xeb\x6d\x0b\xf5\x1b\x4d\x5a\x08\xfc\x7b\
-\x77\x56\x84\x9c\x03\xea\x3a\x93\xe4\x24\x5f\x54\x9f\x71\xe5\x6f\
-\x75\x24\x4d\x6f\x51\xb5\xba\x0c\xcd\xcb\x2c\x4c\x09\x56\x8c\x02\
-\x08\xec\x45\x3e\xd3\x35\x34\x82\x5c\xdb\x7e\x5c\xb4\x62\x39\x48\
-\x78\x85\xd2\xe3\xcb\xf4\x1b\x1e\xea\xb5\xe9\x5c\x37\x69\xc6\x8f\
-\xf6\x79\xad\xa5\xb7\x93\x94\x94\xbd\x8a\xd6\x58\xc0\xf7\x72\x32\
-\xe0\xff\x00\xa2\xac\x69\x8f\x3d\xcf\x76\x02\xc3\x0f\xb2\x28\xf6\
-\x87\x52\xd4\x35\xa7\xb3\xb4\x72\xd1\xf3\xe7\x98\x46\x32\x14\xfb\
-\x3f\x33\x91\x81\x57\xaf\x49\x7a\x83\x70\xbf\x09\xe9\xdc\x3f\x6b\
-\x22\x9b\xeb\xc7\x17\x37\x4c\x06\x40\x8d\x32\x11\x07\xbb\x98\xb6\
-\xfd\xf9\x73\xde\x9a\x1d\x2e\x0e\x0e\xd5\x92\xc8\x4b\x0c\xd2\xc7\
-\x00\x73\x72\x87\x99\x22\x45\xca\x34\xae\x7f\xce\x7a\x85\x55\x07\
-\xb3\x82\x49\x27\x15\xc7\x78\xc3\x5f\x6d\x73\x5f\xba\xd4\x2e\x1c\
-\xa8\x90\x84\x85\x0f\x55\x8d\x46\x14\x63\xe1\xf7\x93\x58\x59\x6a\
-\xda\x6d\xf0\x82\xf8\xe6\x16\x92\xe5\x91\x7e\x58\xbd\xff\x00\x38\
-\xbf\xb2\x2b\x29\x4f\x3c\xaf\xfc\xdc\x7c\xa3\xf5\x9f\xf8\x56\x53\
-\xbe\x6b\xf6\xc5\x7c\x53\xe9\x1d\x65\x81\x6f\x8d\x40\xc2\x88\x2c\
-\x39\x48\xef\x50\x48\xa4\x75\xad\x02\x46\xe9\xb2\xcd\xe8\xf3\x5e\
-\x4d\x23\x5b\x8a\xde\xf6\x15\xb9\xd3\xae\xe4\x45\x96\x17\x19\x01\
-\xc1\xf5\x1c\x7b\xc1\x3f\x7d\x35\xf4\x94\x6f\xb4\xdd\x55\xad\xaf\
-\x09\x4b\x38\x79\x8d\xbc\x0a\xc7\x95\xcb\x13\x81\x9e\xb8\x00\x0c\
-\x8f\x80\xef\x5c\xfd\xb6\x35\x72\xd2\x35\xbb\x3d\x7f\x43\xb7\xe1\
-\xad\x7e\xf6\x08\x27\x8a\x4c\xd8\x4f\x39\x00\xb7\x36\xde\x19\x6e\
-\xa3\xdc\x7a\x76\x3d\xa9\x88\x02\xb1\x61\x2b\x3c\xf1\xcf\x3b\x17\
-\x02\x6f\x12\x5c\xfe\x92\x2a\x12\xc3\xe9\x91\x40\xdd\xc2\xd3\xea\
-\x53\x07\x93\x11\x9c\xcc\xd2\x9e\x81\x0e\xfc\xdf\x42\x3e\x7b\x53\
-\xbd\x57\x86\xb5\xed\x26\x3b\xdb\x39\x34\xe9\x11\xcb\xac\x70\xcc\
-\xc3\x99\x64\x0c\x7a\xae\x0f\x92\x9e\xa4\x52\xbb\x85\xb7\xb7\xd2\
-\x8d\xa8\x90\x5e\xea\x16\xe7\x9e\x69\x1c\x03\x18\x19\x3b\x28\x1b\
-\x37\x21\x3d\x4e\x46\xe4\xef\x80\x69\x8b\xf4\x03\x34\xd4\x6f\xb4\
-\x79\xae\xee\x6e\x6e\x2c\x25\xb7\x06\xdc\x0b\x4b\x3b\x3e\x8c\xe0\
-\x00\x1a\x56\x63\xea\xab\x6e\x4e\x0e\x4e\x76\x1d\xea\xb1\x77\x2d\
-\xdd\xe4\x9c\xf7\x32\x88\xc0\x18\x54\x84\x60\x28\xf2\x07\xb0\xf8\
-\x0a\x2a\x67\x67\x66\x66\x25\x98\xee\x49\x39\xcd\x4f\xa3\x41\xe3\
-\x5d\xf8\xa7\x1c\x90\xfa\xde\xb7\xb3\xcd\xdb\x3e\xe1\x82\xc7\xdc\
-\xa6\x98\x90\xb6\xcb\x0f\x0d\x5a\x59\xe8\xba\x73\xc9\x7f\x72\x96\
-\xb0\x5c\x48\xb6\xf2\xac\x91\xb3\x34\x8e\x48\xfc\xe8\x6c\x1c\xf8\
-\x3b\x1c\x79\xe4\x77\xaa\xa6\xbb\x60\xfa\x5e\xad\x77\x65\x24\x82\
-\x53\x0c\x85\x44\xaa\x08\x12\x8e\xa1\xc6\x7b\x11\x82\x3d\xc6\x9f\
-\xe9\xfc\x41\x23\x4f\x14\x52\x43\x1d\xed\xad\x97\x88\xf6\xb6\xb7\
-\x4b\xce\x84\x30\x22\x4d\xbf\x5d\xbd\xbc\xfe\xb0\xa9\xe7\xb0\x59\
-\xf4\xe5\x8e\x70\xb7\x1a\x9d\x8c\x3e\x2d\x9a\x1f\xf1\xab\x4e\xa0\
-\xb0\xf3\x41\x92\x17\xa9\x19\x1d\x17\x72\x5c\x30\x1f\x28\x41\xa7\
-\x69\x57\x2d\x63\x75\xa8\x2d\xab\x4e\xb6\xb1\x89\x99\x31\xb2\x21\
-\x38\x12\x38\xfd\x5c\xf4\x1d\xfe\x14\x13\xc8\xcb\x61\x2c\xd2\x31\
-\x69\xee\xdf\x97\x98\x9d\xf9\x41\xcb\x1f\x99\xe5\xfa\x1a\xf2\x2b\
-\xcb\x91\x76\x66\x8e\x56\x69\xa4\x38\x60\x77\x12\x67\xf4\x48\xe8\
-\x47\x6c\x74\xa6\xf7\x3a\x3b\xea\x92\x5c\xc9\xa5\xc9\x6e\xb6\xd6\
-\x16\xec\x5e\x39\x25\x0a\x54\xaf\xb4\xab\x9f\x68\x92\x58\xaf\x72\
-\x33\xe5\x4d\x5c\x77\x00\xac\xb0\xad\xed\xae\x2e\x2d\xe4\x0d\x69\
-\x2c\xd1\x3f\x5c\xc4\xc5\x4f\xdd\x51\x93\xf3\xa3\x34\x7d\x4a\xfb\
-\x49\xd4\x63\xbb\xd2\xa6\x68\x6f\x14\x32\x23\xa2\x86\x3e\xb0\x2a\
-\x46\x08\x3d\x41\x22\x8c\x01\xbe\x83\x7d\xae\xeb\xda\xa5\xbe\x99\
-\x6f\x24\x17\xb3\xdc\x12\xaa\xb7\xa8\x8e\xbd\x32\x49\x66\x1b\x60\
-\x03\xbe\x6a\xd9\xc7\x49\x67\xa6\x69\xb6\x5a\x6d\xb7\x0f\x09\x00\
-\x86\x13\x70\xf1\xb3\xa8\x79\x48\x66\x25\x79\x76\xc7\xb3\xf5\xa4\
-\xba\x54\x89\xa7\x33\xc3\x75\x05\xb4\xb7\x0b\x19\x9a\xf5\xc4\x61\
-\x7c\x28\xc6\x31\x10\x2b\x8f\x59\x8f\x28\x3f\x1a\x1b\x8e\xf5\x2b\
-\x7b\x8d\x4a\x23\x35\xb3\x34\x8d\x18\x76\x31\xcc\x57\x1e\xaa\xaf\
-\x7c\xfe\xa5\x06\xb7\x41\x6f\x48\x4d\x2f\xe4\x72\x3f\x3b\xa5\xea\
-\x96\xcf\xfd\x09\xc3\x0f\xa3\x20\x3f\x7d\x31\x75\xe0\xa9\xf4\xeb\
-\x14\x8e\x1e\x22\x8b\x50\x01\x96\x72\x8b\x1c\x8b\x21\xcf\xaa\x40\
-\x24\x63\x6d\xb0\x29\x28\xd4\x51\x46\x15\xb5\x05\x5e\xc0\x5e\x7f\
-\xfa\xd3\xde\x0a\xc6\xa7\xaf\x5a\xc2\x0d\xe0\x1e\x22\xaf\x34\x97\
-\x64\xa8\x24\xf9\x05\xec\x01\x6f\xf5\x68\xda\xe3\x60\x27\xb3\xb0\
-\xe8\x3a\x16\x93\x61\x65\xa7\x45\x1a\x6a\x2d\x0d\xac\x50\x4b\x21\
-\x78\x13\xd9\x8d\xde\xe0\xf3\x10\x7b\xb6\x33\x8c\xf6\xae\x47\x2a\
-\xe8\xd7\x17\xd2\xdc\x34\x3c\x44\xf3\xdc\xc8\xd2\x95\x7b\xb8\x6d\
-\xf2\x58\x92\x76\x01\x9b\xbf\x95\x75\xce\x29\x37\xd6\xbc\x1d\xac\
-\xc3\xa7\x5a\x89\xaf\x6f\x15\xc4\x51\xb3\x73\x37\x82\x01\xe6\x62\
-\x18\xf6\x8a\x32\x71\xfd\x21\xe7\x5f\x3b\x45\x3e\xa7\x79\x07\x32\
-\x38\xb3\xb2\xe8\x64\x70\x22\x43\xf0\x55\xc7\x31\xf7\x75\xa5\x63\
-\xe7\x6c\x65\xf8\x45\xbd\xae\xf4\x7b\x2e\x5e\x7b\x30\xaf\xd0\x47\
-\x2d\xd4\xd7\x32\x37\x90\xe5\xca\x0f\xaa\xe2\x8e\x8f\x8c\xf5\x6d\
-\x44\xc3\xc3\xda\x3d\xf4\x1a\x6a\x04\x93\x90\x49\x32\xc5\x15\xba\
-\xe0\xb3\x73\x38\xc2\x86\x38\x3e\xaa\xf7\xeb\x93\xd3\x9e\xf3\xc5\
-\x6c\x0a\xda\x17\x79\x0e\xcd\x71\x20\xc3\x7f\xaa\xa3\x65\x1f\x53\
-\xef\xed\x4c\x6c\xb4\xb7\xb3\xd2\xe1\xd6\xef\xe1\x02\xc1\x9d\x92\
-\xd5\x4e\x08\xb8\x95\x7a\xae\x3b\x2a\xec\x49\x3f\x01\xd7\x66\xf4\
-\x7b\x01\x57\xa2\xdb\xe9\x4c\x8d\x13\x49\xd0\xb8\x7a\xce\x79\x49\
-\x3a\x74\x53\x5c\x39\x50\x1c\xf3\x92\xe4\x13\x93\xd4\x9e\xdd\x87\
-\x5d\xeb\x99\xc5\x0a\x47\x92\x8a\x01\x3d\x4f\x52\x7e\x74\x4d\xd5\
-\xc4\xd7\x77\x32\xdc\x5c\xc8\xd2\xcd\x23\x16\x77\x63\x92\x49\xa8\
-\xa9\x91\x0a\x50\xba\xbd\x9e\x1a\xca\xf6\xb2\x8c\x03\xa8\xcc\xc0\
-\x02\x4e\x06\x37\x24\xd2\xf7\xbe\x49\x32\x2d\x51\xee\x18\x75\x31\
-\xfb\x23\xfd\x63\xb7\xd3\x35\xe8\xb3\x47\xc3\x5d\xb3\x5c\x38\xec\
-\xe7\xd5\x07\xdc\xa3\x6f\xba\xa7\x3b\x0c\x6d\x5a\x44\x8d\xc3\x60\
-\x0d\x15\xcc\xa3\xf3\xf3\x08\x97\xf5\x21\xeb\xf3\x63\xfb\x80\xaf\
-\x12\xde\x18\x01\xf0\xa3\x0a\x4f\x56\xea\x4f\xc4\x9d\xcd\x18\xe6\
-\x86\x91\x87\x6a\x62\x40\x36\x74\xcf\x46\xbc\x5d\x6d\x71\x6e\xdc\
-\x31\xc4\x49\x25\xcd\xbd\xe3\x2c\x50\x4a\xce\x7d\x53\xd1\x53\xcc\
-\x75\xd8\xe6\xb4\xd7\x78\x4f\x51\x02\xdb\x4c\xe1\xcb\x5b\x57\xb7\
-\x8e\xf9\x8c\x8e\xf1\x04\x96\x26\x2a\x17\x12\x13\xbf\x87\x8e\x60\
-\x71\xb5\x72\xd6\x62\x0e\x41\xc1\x1b\x82\x3b\x55\xd7\x85\xb8\xca\
-\x41\x6d\x0e\x9d\xaa\x4e\xc7\xc1\x20\xdb\x4e\xee\x41\x5d\xfd\x82\
-\xd9\xdb\xdc\x4e\xdd\x8e\x36\x21\x9d\x2d\x72\x80\xdf\xb2\x91\xab\
-\xda\x8b\x5b\x87\xf0\x88\x68\x4b\x32\xa9\x56\xe6\x00\x83\x82\xb9\
-\xef\x8f\xbc\x60\xf7\xa7\x3a\xd9\xf0\x34\x0d\x16\xc2\xda\xce\x38\
-\xaf\x2e\x2d\xcb\xcc\x61\x53\xcf\x20\x2c\x70\x5b\xcd\x88\xe5\xf8\
-\x0f\x8d\x74\x3b\x8d\x33\x40\xd4\xe5\x12\xea\x71\x2c\xb6\xf3\x30\
-\x69\x1e\xc8\x32\x4f\xcd\xd7\xd6\x8c\x8c\x36\x06\x7d\x61\xbe\xf8\
-\xdf\xad\x22\xe3\x3e\x1c\x63\xa7\xbe\xa3\x67\xa8\x3c\xda\x6c\xb3\
-\x3b\x35\xcc\x16\xc5\xc6\x18\x02\x03\x95\x24\xa8\x18\xc6\x08\x03\
-\xa6\xdd\xe8\xd3\x40\x34\x73\xb4\x74\xd3\x9c\x3a\x32\xcb\x7a\xa7\
-\x20\x8d\xd2\x23\xe7\xe4\xcd\xf7\x0f\x7d\x3a\xb0\xb8\x6d\x46\x28\
-\xda\x09\x8c\x3a\x84\x52\xf8\xd6\xb3\x73\x60\xc5\x31\x39\x31\x92\
-\x7f\x41\xce\xea\x7a\x06\xc8\xef\x4a\x05\x85\x89\x3f\xf7\x92\xb0\
-\xfe\x8a\x01\xff\x00\xb9\x85\x49\x6d\x1d\xbd\x9c\xc6\x44\x75\x94\
-\x60\xa9\x56\xb9\x8d\x55\xc7\x91\x03\x3b\x53\x34\x2f\x63\x98\x34\
-\x45\xd5\x85\xfe\xb9\xa7\x78\x16\xb2\xd8\x44\xd2\xdd\x69\xef\xea\
-\xba\x4f\xd0\x08\xd7\x1b\xa9\x3e\xb0\x1d\xb0\x57\xcb\x28\x38\x53\
-\x50\xd4\x74\x7d\x5e\x0d\x4f\x4d\x8d\x5c\xc2\x7d\x63\x2a\x83\x19\
-\x07\xa8\x62\xdb\x7c\x0f\x63\xbd\x5e\xf4\xbb\xd7\x64\xb6\xbd\xd1\
-\xa4\xb3\x8b\x56\x38\x79\x16\x52\x64\x33\xc4\x3d\x50\xaf\xd7\x3f\
-\xa5\xeb\x01\xe4\x4e\xe3\x34\xcb\x8e\xb8\x06\x2d\x6a\xde\x2e\x22\
-\xe1\x79\x9a\xea\xcd\x94\x1b\xbb\x05\x6c\x18\x1f\xf4\x8a\x73\x60\
-\x04\xce\x72\x7a\x0e\xa3\x23\xa6\x3a\xb5\xc3\x3c\xd6\xf9\x40\x9a\
-\x8e\x93\x63\xaf\xae\x9b\xad\x0e\x5b\xd8\x20\x55\x8a\x28\x21\x45\
-\x45\x91\x53\x73\x0b\x72\x8d\xd8\x6e\x76\x1e\xb0\xce\xf9\xc0\x35\
-\x0e\x26\x5b\x5e\x1c\xd7\xb5\x27\x82\x28\x57\x50\x92\x66\x6b\x78\
-\x63\x1f\x9b\xb2\x8d\xb7\x5d\x8f\xe9\xe0\x8c\x0e\xd4\xe7\x84\x78\
-\x9e\xcf\x86\xe6\xb8\x8b\xc6\x6b\x8b\x79\x42\xc5\x34\xd0\x92\xb1\
-\x5b\x92\x48\x1e\x08\x3b\x92\x07\x31\x2e\x77\x38\xd8\x77\x24\x7a\
-\x46\xe1\xe8\xf4\x9d\x54\x6b\xba\x91\x13\x43\x1c\x28\xf2\x44\xa3\
-\x3f\x69\x93\x03\x93\x18\xce\x41\xca\x96\x23\x60\x01\xf3\xac\xae\
-\x1e\x99\xe7\xca\xda\x29\xd8\x36\x51\xd9\x59\x3f\xad\x75\x70\xeb\
-\x7b\x79\xcd\xb9\x0a\x07\x32\x21\xf9\x65\x8f\xfa\x43\xca\x96\xf1\
-\x53\xc9\xf9\x62\x54\xb8\xe5\x0f\x04\x71\xc4\xd8\x3b\x02\xa8\xa0\
-\xfd\xf9\x35\xee\x91\x35\xc5\xfe\xa5\x7b\x7f\x76\xa4\x10\x8d\x24\
-\x8f\x2f\x56\x24\xef\xb0\xf3\x1c\xdb\x66\x82\xd7\xe3\x5b\x8d\x72\
-\xf6\x69\x89\x95\xcc\xcd\x9e\x63\xb0\x23\x6d\x87\x4a\x6a\xef\xc0\
-\xb7\xdb\x91\x70\x9b\xc5\x60\x96\xd1\xbc\xce\x4e\x07\x20\xd8\x9f\
-\x8d\x76\xbe\x02\xe1\x59\x34\xbb\x7b\x3b\xff\x00\xb6\x5a\x4d\x30\
-\x44\xb8\x3f\x67\x0d\x20\x81\x8e\x76\x7c\x81\xb8\x20\x13\xee\x8c\
-\xfe\xb5\x54\x78\x33\x85\xe5\x9e\x3f\xb7\xdd\x94\x81\x79\x39\xa0\
-\x12\x02\x4b\x03\xb0\x65\x51\xbb\x67\xa0\xfc\x47\x51\xf4\x26\x83\
-\xa5\x1b\x4d\x1e\x3b\x44\x44\xb3\x9b\xc3\x1e\x33\xb3\x73\x08\xce\
-\x37\x2d\x9e\xa4\x7b\x47\xa0\xc8\xed\xbe\x15\x96\xfc\x6c\x66\x39\
-\xf2\x50\xbd\x31\xeb\x76\xfa\x27\x0a\xfe\x4d\xb4\x8d\x5a\xf2\xfe\
-\x6e\x52\xf3\x0e\x76\x11\x2f\x29\x6e\xbe\xf1\x1a\xef\xd4\xab\x57\
-\x02\xb8\x9a\x5b\x87\xe7\x9e\x46\x76\xe8\x0b\x1e\x83\xc8\x79\x0a\
-\xb8\xfa\x49\xd5\xed\xf8\xa7\x8b\x55\x34\x1b\x79\xe5\x86\x08\xc5\
-\xa4\x44\x31\x76\xb8\xe5\x63\xf9\xc0\xbd\xb3\x9e\x9f\x33\xbd\x68\
-\xfa\x2e\x9b\xc2\xb1\x78\xbc\x4c\x52\xf7\x58\x23\x31\xe8\xf1\x3e\
-\x56\x23\xd8\xdc\x38\xe9\xfd\x5a\xee\x7b\x91\x4d\xc6\x94\x4a\xf6\
-\x2e\xdb\xaa\xfd\x08\xf4\xfd\x1e\x32\xb3\x4b\xad\x4f\x2e\x99\x6e\
-\x20\x67\x85\xde\x02\xc6\x69\x39\x72\x88\xab\xb1\xc1\xdb\xd6\xe8\
-\x07\xc6\x94\x64\xf2\x80\x49\xc0\xed\xe5\x4c\x75\xbd\x5e\xfb\x5c\
-\xbe\x37\x7a\x9d\xc3\x4d\x37\x28\x45\xce\xcb\x1a\x0e\x88\xa3\xa0\
-\x51\xd8\x0a\x5c\x45\x39\x27\xe4\x53\x6b\xc1\xe1\xaf\x0d\x7b\xd0\
-\x57\x87\xdd\x44\x09\xa9\xac\xaf\x0f\x5a\xca\xc9\xe3\xed\x3f\xe4\
-\xce\x8c\x3f\xc9\x76\x78\xfe\xa8\x54\x52\x70\xc6\x8f\x83\xfd\xca\
-\xb3\xfe\xc8\x55\x9b\xc3\xad\x5e\x3d\xba\x57\x31\xd6\xcd\xee\xd1\
-\x53\x6e\x18\xd1\xfb\xe9\x76\x7f\xd9\x0a\x1a\x6e\x19\xd1\x87\xf9\
-\x2a\xcf\xfb\x21\x56\xc9\x53\x1d\x05\x03\x3c\x79\xcf\x35\x65\x65\
-\x7b\xee\x12\x49\xf8\x2a\x17\x1c\x3b\xa3\xee\x17\x4b\xb3\xfe\xc8\
-\x50\x12\xf0\xde\x95\xcc\x3f\xb9\xb6\x80\x67\x7f\xcd\x0a\xb6\xdc\
-\x00\xa0\xf2\x8a\x53\x71\x9e\x71\xf1\xaa\xf0\xdb\x6d\x03\x92\x27\
-\xa5\xf0\x6f\xa5\x18\xb4\xc8\x8c\x16\xf6\xd0\xfd\x98\x82\xa6\x22\
-\xbb\x60\xf5\x03\xca\x9f\xe9\x6d\x60\xce\xe6\xdb\x91\x64\x9f\x67\
-\x8a\x40\x01\x38\xe8\x0b\x0f\x6b\xe3\xd6\xab\xe0\x56\x56\xea\xf0\
-\xcd\x1a\x89\xc8\xd0\xde\xef\x81\x74\x2b\xa6\x92\x49\xf4\x1b\x66\
-\x97\x3e\xb1\x8e\x35\x0e\x0f\xe0\x7e\x7f\x5a\x54\x7d\x1c\xe9\x4e\
-\x01\x8f\x4d\xb1\x40\x4e\x31\x3c\x22\x32\x3f\x75\x19\x6b\xaa\x5d\
-\x41\x1f\x20\x75\x75\xe6\x0d\xf9\xc1\xcc\x47\xce\x98\x43\xac\xc3\
-\x33\x20\xbf\x8e\x47\x40\xd9\x20\x10\xcb\xf4\x23\x6f\xad\x23\xa3\
-\x24\x76\x0f\x71\x5d\xc4\xf3\xf0\xb6\x8d\xa4\xdd\x09\x06\x9b\x6c\
-\x2e\x14\x05\x47\x58\xc2\x00\x00\xc0\x01\xbc\xbe\x14\xdb\x48\xbc\
-\x82\xd9\xcb\xa4\x56\xb0\x63\xda\x58\xd7\x01\xc1\xf3\xc7\x96\x7e\
-\x1b\xf6\xa6\x56\x97\xfa\x66\x19\x16\xed\xa2\x89\x86\x39\x24\x88\
-\x95\xfd\xf5\x28\xb1\xd2\x2e\x0f\x3c\x52\xda\x96\xf7\x4b\xe1\xe7\
-\xdd\x8f\xf9\x50\x3a\x5a\xd5\xa0\x92\xff\x00\x4b\x11\xdf\xfa\x3e\
-\xe1\xad\x4d\x04\xb6\xfa\x75\x82\x09\x5f\x9e\x65\x11\x0c\x12\x7f\
-\x4b\xf1\xa3\x53\x86\x74\xd9\x34\xe8\x34\x49\xb4\xab\x6e\x4b\x2e\
-\x63\x62\x24\x4e\x65\xe5\xc6\x08\xc9\xec\x41\x3b\x7f\x0a\xb0\x5a\
-\xda\x5a\xc4\x8a\xd6\xf3\x25\xbb\xf4\xe5\xf1\x43\x28\xfb\xf7\xa3\
-\x92\x48\xa2\x0c\x6e\x6e\x62\x1c\x98\xc9\xe6\x00\x0f\x2f\x85\x4f\
-\x59\x1f\x65\xe0\x6a\x84\x73\xee\x20\xe1\x9d\x2a\xee\xee\x4b\x89\
-\x34\xcb\x70\xf7\xcc\xab\x27\x8b\x10\xe6\xf5\x00\x5c\x10\x06\xfd\
-\x3e\x86\x84\xb5\xe0\x5e\x1f\xfb\x4f\x8b\x3e\x87\x64\xd2\xbb\x96\
-\x55\x92\x10\x58\x9c\xe7\x25\x7b\x0f\x8d\x5f\xee\xb5\x3d\x1c\x9f\
-\x5a\xea\x12\xe0\xe5\x5b\x05\xb9\x4f\x9d\x57\x35\x6e\x34\xd3\xf4\
-\x99\xfe\xc9\xa5\xda\x3e\xa5\xa9\xc8\xb9\x0a\xa4\x20\x61\xfa\xcc\
-\x71\xea\xaf\xbf\xe9\x9a\x6c\xe4\xbe\x9d\x29\x01\xc4\xef\x7b\x1a\
-\x69\x7c\x33\x65\x04\xe2\xed\x2d\x20\x37\x20\xe1\x64\x29\xd0\x01\
-\x8c\x0f\x21\x8d\xa8\x2e\x28\xb0\xb6\xb8\xb7\x68\xb5\x19\xa2\x8e\
-\x16\x1c\x8f\x00\x19\x69\x17\xbe\x71\xe7\xe5\xe5\xde\x80\xbc\xe2\
-\x5d\x4a\xe9\x4a\xf3\xad\xba\x9e\xa9\x0f\x6f\x77\x37\x5f\xc2\x94\
-\x12\x59\x8b\x31\x25\x8f\x52\x4e\x49\xa6\x63\xfa\x7a\x6f\xaa\xd8\
-\x35\x96\x52\xd4\x90\xda\xe9\xda\x3e\x99\xcc\xba\x2e\x93\x6b\x66\
-\x58\x61\xa6\x48\xc0\x91\x87\xc7\xb7\xca\x94\x37\x09\xf0\xfb\x31\
-\x2d\xa3\xd8\x92\x4e\x49\x31\x0c\x9a\x79\x8a\xce\xd5\x5a\x94\x89\
-\xdb\xd8\x88\xf0\x97\x0f\x7f\xe4\xd6\x3f\xd9\x0a\xd5\xf8\x4b\x87\
-\xf9\x0e\x34\x5b\x1c\xff\x00\x54\x29\xfe\x37\xae\x67\x7f\xe9\x3e\
-\xda\x2e\x28\x9f\x4b\x84\xc0\x62\x59\x85\xb4\x72\x67\xd6\x69\x33\
-\x86\xcf\x60\xb9\xdb\x27\xe5\x9e\xc1\x97\x24\xe3\x5b\xa3\x31\x8d\
-\xdf\x62\xe7\x63\xc1\xfc\x31\x24\xcf\x2c\xfa\x25\xa8\x85\x21\x3f\
-\xe0\x89\x05\xf0\x77\xc0\x15\x4b\xe0\xdd\x03\x43\xbe\xd4\xb5\x4f\
-\x1b\x4f\x86\x71\x0c\xc4\x05\x68\xfd\x5e\x4e\xc4\x02\x06\x37\xab\
-\x2c\x9c\x67\xf9\x16\xcb\xf2\x82\xc0\xd7\xb3\x67\xc1\x44\x47\x11\
-\xa0\x90\xf4\x1c\xc4\x6f\x8f\x20\x09\x27\xb5\x50\x61\xe3\x4d\x5c\
-\x6a\x97\x56\x7a\x3d\x94\xad\xab\x4e\xe5\xa4\x67\x88\xb3\x29\x3d\
-\x95\x7c\x87\x9b\x7d\x05\x6b\xab\x33\x55\xb1\xf3\x89\xb9\xd1\xd0\
-\x35\x4e\x1f\xe1\x1d\x32\xdb\xed\x3a\x96\x9b\xa5\xda\x41\x8f\x6a\
-\x48\xc0\xc9\xf2\x51\xd4\xfc\x05\x65\x55\xb4\xce\x00\xd4\x35\x9b\
-\x91\x7f\xc5\xd7\xf3\x3c\x8d\xfe\x09\x5f\x99\xc8\xf2\x2d\xd0\x0f\
-\x70\xac\xaa\x55\x7d\x45\x2d\xca\x49\x7e\xc1\xe9\xc3\x3c\x37\xb3\
-\xe8\xc1\xea\xf4\x35\xbf\x38\x03\x71\x59\x59\x5c\x92\xcb\x50\xf8\
-\x66\xde\xe5\x03\x4a\x41\xce\x31\x40\xcf\x59\x59\x54\xe3\xae\xae\
-\x59\x99\x42\xab\xc3\xb1\xeb\x49\x2e\x0f\xe7\x17\xaf\x51\x59\x59\
-\x57\xfd\x3f\x74\x7b\x22\xfb\x59\x2d\x65\x65\x65\x74\x66\x80\xf7\
-\x15\xbc\x31\x49\x34\x81\x22\x46\x77\x3d\x15\x46\x49\xac\xac\xa1\
-\xb7\xa4\xd9\x95\xcb\xd0\xda\xdf\x86\xb5\x39\x97\x3e\x00\x8c\x7f\
-\xea\x30\x06\xbd\xb8\xe1\xbd\x4a\x15\xc9\x85\x1c\x7f\x45\xc1\x35\
-\x95\x95\xac\x7f\x59\x93\x7e\x0a\xfe\x09\xd0\xa2\x58\x9a\x27\x29\
-\x2a\x14\x71\xd5\x58\x60\xd6\xbb\xd6\x56\x56\xca\x5e\xd2\x64\x8f\
-\xbe\x85\x17\x37\xf3\xde\x4f\x25\x9e\x8e\x54\xba\x1e\x59\xae\xd8\
-\x66\x38\x4f\x70\x07\xe9\x3f\xbb\xa0\xef\xe4\x4c\xd3\x74\xf8\x34\
-\xf8\x99\x61\x0c\xd2\x48\x79\xa5\x96\x43\xcc\xf2\xb7\x9b\x1e\xff\
-\x00\x80\xed\x59\x59\x58\x8e\x7e\xe6\x15\x71\xc2\x0c\xac\xac\xac\
-\xa3\x00\xca\xca\xca\xca\xf1\xe0\x5d\x42\xfa\x0d\x3e\xdf\xc6\xb9\
-\x7e\x55\xc8\x55\x50\x32\xce\xc7\xa2\xa8\x1b\x92\x7c\x85\x52\x6f\
-\x7d\x1d\xe9\x5c\x43\xa9\xa6\xa9\xab\xd8\x47\x64\x43\x73\x2d\xad\
-\xb6\x10\xb8\xce\x49\x99\x87\x56\x3e\xee\x9e\x66\xb2\xb2\x95\x52\
-\xad\xea\x86\x26\xe5\x6d\x17\x0b\xad\x2a\xd2\xe3\x4f\x7b\x26\x89\
-\x52\xd9\x97\x97\x91\x40\xc0\xf7\x8f\x23\xef\xeb\x4b\x38\x33\x85\
-\x2c\xf8\x56\xda\xee\x3b\x57\x69\xa5\xb9\x93\x9e\x49\x64\x1b\xe3\
-\xb2\xfc\x3f\x1c\xd6\x56\x51\x3c\x73\xbd\xe8\x1e\xa6\x96\xb6\x58\
-\x80\xac\xac\xac\xa3\x04\xff\xd9\
 \x00\x00\x1d\xf8\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -11365,6 +1547,735 @@ qt_resource_data = b"\
 \xa2\xfc\x03\xd1\xc7\x34\xa6\xbf\x4b\x27\xc1\x62\x86\x0c\x19\x3e\
 \xbe\xfc\x3f\x2f\x58\x73\x50\xc3\x98\x7a\x4e\x00\x00\x00\x00\x49\
 \x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x2d\x69\
+\xff\
+\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x48\x00\
+\x48\x00\x00\xff\xe2\x02\x5c\x49\x43\x43\x5f\x50\x52\x4f\x46\x49\
+\x4c\x45\x00\x01\x01\x00\x00\x02\x4c\x6c\x63\x6d\x73\x04\x30\x00\
+\x00\x6d\x6e\x74\x72\x52\x47\x42\x20\x58\x59\x5a\x20\x07\xe4\x00\
+\x02\x00\x1c\x00\x07\x00\x32\x00\x30\x61\x63\x73\x70\x41\x50\x50\
+\x4c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf6\xd6\x00\x01\x00\
+\x00\x00\x00\xd3\x2d\x6c\x63\x6d\x73\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x64\x65\x73\x63\x00\x00\x01\
+\x08\x00\x00\x00\x36\x63\x70\x72\x74\x00\x00\x01\x40\x00\x00\x00\
+\x4c\x77\x74\x70\x74\x00\x00\x01\x8c\x00\x00\x00\x14\x63\x68\x61\
+\x64\x00\x00\x01\xa0\x00\x00\x00\x2c\x72\x58\x59\x5a\x00\x00\x01\
+\xcc\x00\x00\x00\x14\x62\x58\x59\x5a\x00\x00\x01\xe0\x00\x00\x00\
+\x14\x67\x58\x59\x5a\x00\x00\x01\xf4\x00\x00\x00\x14\x72\x54\x52\
+\x43\x00\x00\x02\x08\x00\x00\x00\x20\x67\x54\x52\x43\x00\x00\x02\
+\x08\x00\x00\x00\x20\x62\x54\x52\x43\x00\x00\x02\x08\x00\x00\x00\
+\x20\x63\x68\x72\x6d\x00\x00\x02\x28\x00\x00\x00\x24\x6d\x6c\x75\
+\x63\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x0c\x65\x6e\x55\
+\x53\x00\x00\x00\x1a\x00\x00\x00\x1c\x00\x73\x00\x52\x00\x47\x00\
+\x42\x00\x20\x00\x62\x00\x75\x00\x69\x00\x6c\x00\x74\x00\x2d\x00\
+\x69\x00\x6e\x00\x00\x6d\x6c\x75\x63\x00\x00\x00\x00\x00\x00\x00\
+\x01\x00\x00\x00\x0c\x65\x6e\x55\x53\x00\x00\x00\x30\x00\x00\x00\
+\x1c\x00\x4e\x00\x6f\x00\x20\x00\x63\x00\x6f\x00\x70\x00\x79\x00\
+\x72\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2c\x00\x20\x00\x75\x00\
+\x73\x00\x65\x00\x20\x00\x66\x00\x72\x00\x65\x00\x65\x00\x6c\x00\
+\x79\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\xf6\xd6\x00\x01\x00\
+\x00\x00\x00\xd3\x2d\x73\x66\x33\x32\x00\x00\x00\x00\x00\x01\x0c\
+\x42\x00\x00\x05\xde\xff\xff\xf3\x25\x00\x00\x07\x93\x00\x00\xfd\
+\x90\xff\xff\xfb\xa1\xff\xff\xfd\xa2\x00\x00\x03\xdc\x00\x00\xc0\
+\x6e\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\x6f\xa0\x00\x00\x38\
+\xf5\x00\x00\x03\x90\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\x24\
+\x9f\x00\x00\x0f\x84\x00\x00\xb6\xc3\x58\x59\x5a\x20\x00\x00\x00\
+\x00\x00\x00\x62\x97\x00\x00\xb7\x87\x00\x00\x18\xd9\x70\x61\x72\
+\x61\x00\x00\x00\x00\x00\x03\x00\x00\x00\x02\x66\x66\x00\x00\xf2\
+\xa7\x00\x00\x0d\x59\x00\x00\x13\xd0\x00\x00\x0a\x5b\x63\x68\x72\
+\x6d\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\xa3\xd7\x00\x00\x54\
+\x7b\x00\x00\x4c\xcd\x00\x00\x99\x9a\x00\x00\x26\x66\x00\x00\x0f\
+\x5c\xff\xdb\x00\x43\x00\x06\x04\x05\x06\x05\x04\x06\x06\x05\x06\
+\x07\x07\x06\x08\x0a\x10\x0a\x0a\x09\x09\x0a\x14\x0e\x0f\x0c\x10\
+\x17\x14\x18\x18\x17\x14\x16\x16\x1a\x1d\x25\x1f\x1a\x1b\x23\x1c\
+\x16\x16\x20\x2c\x20\x23\x26\x27\x29\x2a\x29\x19\x1f\x2d\x30\x2d\
+\x28\x30\x25\x28\x29\x28\xff\xdb\x00\x43\x01\x07\x07\x07\x0a\x08\
+\x0a\x13\x0a\x0a\x13\x28\x1a\x16\x1a\x28\x28\x28\x28\x28\x28\x28\
+\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\
+\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\
+\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\x28\xff\xc0\x00\x11\x08\
+\x00\xc8\x00\xc8\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\xff\xc4\
+\x00\x1c\x00\x00\x02\x02\x03\x01\x01\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x04\x05\x03\x06\x00\x02\x07\x01\x08\xff\xc4\x00\x51\
+\x10\x00\x02\x01\x03\x02\x04\x02\x07\x03\x07\x05\x0d\x06\x07\x00\
+\x00\x01\x02\x03\x00\x04\x11\x05\x21\x06\x12\x31\x41\x13\x51\x07\
+\x22\x32\x61\x71\x81\x91\x14\xa1\xb1\x15\x23\x42\x52\x92\xc1\xd1\
+\x16\x33\x62\x73\x93\x25\x36\x43\x44\x45\x53\x72\x82\x94\xa2\xd2\
+\xe1\xf0\x08\x35\x54\x55\x63\xb2\x24\x26\x34\x74\x83\xe2\xf1\xff\
+\xc4\x00\x1b\x01\x00\x03\x00\x03\x01\x01\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x02\x03\x04\x01\x05\x06\x00\x07\xff\xc4\x00\x2c\
+\x11\x00\x03\x00\x02\x01\x04\x01\x04\x01\x02\x07\x00\x00\x00\x00\
+\x00\x00\x01\x02\x03\x11\x21\x12\x31\x41\x51\x13\x04\x22\x32\x61\
+\x81\x23\xf0\x33\x42\x52\x71\x91\xb1\xd1\xff\xda\x00\x0c\x03\x01\
+\x00\x02\x11\x03\x11\x00\x3f\x00\xeb\x32\x25\x41\x22\xd1\xae\xb4\
+\x3c\x82\xb8\xe9\x3a\x86\xc0\x9d\x68\x59\x17\xad\x1d\x22\xe6\x85\
+\x91\x6a\x89\x16\xc0\xa4\x5a\x16\x41\x46\xca\xb4\x2c\xab\xd6\xaa\
+\x82\x7b\x02\x94\x7b\xa8\x59\x47\x95\x1b\x20\xad\x2d\xac\xa5\xbb\
+\x93\x92\x10\x31\xdd\x8e\xc0\x7c\x4d\x57\x08\x96\xc5\xb2\x0a\xd1\
+\x6c\xee\x25\x20\x47\x04\xad\xcc\x32\x30\x87\x71\xe7\x56\x7b\x2d\
+\x2b\xc7\x9f\xec\xfa\x65\xb0\xbc\xba\x1b\x78\xb7\x1b\x46\x0f\xb9\
+\x06\x4e\x07\x9b\x75\xa7\x57\x5a\x65\xa6\x9b\x10\x7e\x2d\xd5\x9e\
+\xf2\x58\x93\xf3\x76\xf0\xa8\xca\x01\x8f\x54\x0e\xc3\x7e\xff\x00\
+\x75\x5b\x08\x92\xd9\x47\x83\x86\xb5\x5b\xa7\x09\x0d\xa9\x2e\x7a\
+\x2f\x30\x24\xfc\x85\x49\x71\xc1\x1a\xaa\x16\x12\xcf\x63\x09\x51\
+\x92\xa1\xda\x57\x1f\x24\x53\x8f\x99\xa7\x53\x6b\x8b\x38\x2b\xa5\
+\xd8\x47\x67\x66\xa7\x3e\x24\xee\xcd\xf3\xe5\x18\xc9\xf8\xf3\x54\
+\x17\x1c\x45\x77\x61\x6e\xcb\x1c\xff\x00\x65\x77\xdc\x11\x12\x89\
+\x58\x7e\xb7\x2a\x80\x14\x79\x67\x7f\xc2\xa8\x94\xc9\xe8\x02\x2f\
+\x46\x9a\x95\xc2\x87\x6b\x9b\x50\x48\xe6\x02\xe3\x9d\x76\xf3\x03\
+\x97\x15\x14\xde\x8d\xb5\xd1\x19\x78\x8d\x94\xa3\x38\xf5\x27\x1d\
+\x7e\x62\x82\x1a\xcd\xec\xf2\x37\xad\x2d\xc0\xea\xf2\x5d\xcc\xce\
+\x57\xdf\x9f\xd1\xff\x00\xae\xb5\xe4\xba\xcd\xe4\x07\xed\x1a\x75\
+\xfd\xd4\xcd\x1e\xe4\xb3\x95\x11\x7c\x10\x60\x11\xef\x3f\x30\x29\
+\xf2\x9f\x81\x14\xd3\xee\x79\x73\xe8\xfb\x89\xa1\x72\xbf\x93\x4c\
+\x8c\x3b\x47\x22\xb7\xef\xaa\xfe\xa5\xa3\x6a\x5a\x76\xf7\xf6\x17\
+\x56\xeb\xfa\xd2\x46\x40\xfa\xf4\xab\x54\xdc\x79\x7e\x6d\xed\xd9\
+\x79\x9a\xf3\x9b\x37\x0d\x21\xe6\x8e\x4c\x63\x94\xaa\x9f\x60\xed\
+\xbe\x3e\x94\xe1\xb8\xb3\x56\x1a\x54\xaf\xa7\xcd\x1c\xd1\x33\x24\
+\xd2\x78\xc5\x8b\xdb\xa3\x03\x90\x70\x46\x53\x3d\x0f\xca\x9a\x9d\
+\x2e\xe2\x9a\x97\xd8\xe5\x2c\x33\x5a\x1a\xe8\xf1\xea\x9c\x3d\xc4\
+\x79\x4d\x4b\x46\x10\x4a\xbb\x1b\x9b\x77\x11\x3c\xa7\x1b\x63\x1e\
+\xaf\x31\xf2\x20\xfc\x68\x6d\x6b\xd1\xf3\x9b\x08\xf5\x4e\x1c\xba\
+\xfb\x66\x9d\x36\x7c\x38\xe7\x1e\x1c\xab\xfd\x1c\xfb\x24\xfc\xc6\
+\x69\xaa\xd6\xf5\x5c\x0a\x70\xfb\xae\x4e\x7c\x45\x6a\x45\x19\xa8\
+\xd8\x5d\xe9\xd7\x26\xdf\x50\xb6\x9a\xda\x7e\x50\xde\x1c\xaa\x54\
+\xe0\xf4\x38\x34\x21\xef\x54\x4a\x11\x46\x87\xbd\x6b\xf0\xad\xcd\
+\x79\x46\x90\x06\xa4\xd7\x95\xb1\xad\x49\xa2\x48\x16\x65\x65\x79\
+\xd6\xb2\x8b\x46\x36\x7d\x35\x20\xa1\xa4\x14\x64\x82\x86\x90\x57\
+\xcb\xe5\x1f\x45\xd8\x1b\x8a\x19\xc7\x5a\x26\x67\x55\x38\x27\x2d\
+\xe4\x37\x34\x2c\x9e\x23\xfb\x2a\x10\x79\xb6\xe7\xe9\x4f\x80\x58\
+\x2c\xa3\xae\x68\x4c\xb4\xf2\x78\x76\xd1\xbc\xce\x7a\x04\x19\xfb\
+\xfa\x53\x2b\x7b\x01\x75\x2f\xe7\x09\x28\xbe\xb3\xbb\xf4\x51\xf0\
+\xe9\x9a\x27\x6b\x97\x30\x69\x90\xf2\x5b\xb1\xf5\x81\xdd\xf1\xfd\
+\x23\x9d\xff\x00\x0a\xb3\x1c\xb6\x4b\x76\x97\x02\xa8\xb4\xd0\x5b\
+\x37\x93\x28\x5c\xe0\xc7\x09\xe6\x27\xdd\xcd\xf8\xfe\x34\xfa\x0d\
+\x32\xd9\x2c\xd1\xb5\x09\x0d\xa5\x86\xff\x00\x9b\x0d\x89\x1c\x67\
+\x24\x79\xf9\x67\x24\xf9\x51\xe6\x2b\x1d\x1e\xd6\x1b\x89\xe3\x57\
+\xb8\x31\xe5\x61\x56\xeb\xb9\x23\x1e\x4b\xb7\x5e\xa6\xab\xda\x83\
+\xcb\x3b\xbd\xf4\xd2\x99\x90\x0e\x72\x31\x8e\x42\x37\x58\xf9\x7b\
+\x00\x70\x4f\x9e\xd5\x7c\x4a\x82\x1a\xa7\x41\x3a\x9e\xaf\xf6\x3b\
+\x61\x69\xa2\xa2\xd8\xda\xa8\xcc\x81\x37\x72\x08\xcf\x33\x9e\xa7\
+\xa1\x00\x55\x62\x38\x9a\xe9\x2e\x6e\x6e\x07\xe6\xf0\xbe\xd9\x3e\
+\xaa\xe7\x3c\xcc\x7a\x9c\x91\xf1\x24\xd3\x18\xe1\xf1\x5a\x77\xb8\
+\xc9\x59\x8e\x0f\x9c\x8c\x3d\x95\x1e\x79\x20\x9f\xa5\x2c\xd5\x6e\
+\x4c\x96\x66\x14\xc0\x41\x28\xcf\x2f\x76\x00\xe7\xe3\x8c\xe2\xa8\
+\x9e\x44\xd0\x2d\xc5\xea\xc8\xc5\x6d\xc3\x47\x6d\x10\xe6\x67\x38\
+\x0e\xfe\x5d\x3d\x9c\xf4\xc0\xe8\x29\x3f\x23\x5c\xc9\x24\xd3\x37\
+\x2c\x60\xe5\xdb\x1d\x3c\x80\x1e\x7e\x42\x8f\x78\x49\x48\xe0\x04\
+\x2e\x47\x8b\x2b\x1f\xd1\x1d\xb3\xf0\x1f\x8d\x01\x79\x20\x72\x12\
+\x30\x56\x14\xf6\x57\xbf\xc4\xfb\xcd\x55\x08\x9e\xc1\x6e\xe7\x32\
+\x28\x8d\x17\x92\x05\x39\x08\x0f\x7f\x32\x7b\x9a\x11\x64\x78\xa4\
+\x12\x44\xc5\x58\x74\x35\x2b\xf7\xa8\x1c\x55\x32\x89\x69\x9b\x5c\
+\xc6\x93\x46\x6e\x2d\xd4\x28\x1b\x49\x18\xfd\x03\xe6\x3f\xa2\x7e\
+\xee\x9e\x55\x24\x57\x37\x96\xc9\x08\xb1\x95\xe3\x6b\xab\x76\xb6\
+\x70\xa7\xdb\x42\xe4\x15\x3e\xee\x94\x3c\x32\xb4\x12\x87\x50\x0e\
+\x36\x2a\x7a\x30\xee\x0f\xba\x9b\xdd\xd9\x0b\x4d\x22\xce\xf2\x47\
+\x31\xdb\xdc\x2c\x8b\x6e\x48\xcb\x15\xe6\xf5\xb0\x3c\xc7\xb3\x9e\
+\x9d\x4f\x95\x30\x56\xc4\x57\x0c\x5a\x58\xe0\xb5\xe6\x65\x8c\xe1\
+\x39\x3a\xb3\x77\x6f\x99\xfb\x80\xab\x5e\x8d\x2c\x90\xdb\x4c\x67\
+\xba\x30\xdb\x5c\x8c\xcb\x0c\x6e\x49\x8e\x61\x9c\xb0\xc7\xb3\xb9\
+\x56\xc6\x7b\x91\x8a\xaa\x4b\x72\x42\x98\xed\xd7\xc1\x88\xec\x40\
+\x3e\xb3\x7c\x4f\x7f\x87\x4f\x75\x3b\xe0\xa8\x8d\xca\x6a\x70\xb4\
+\x65\xe1\x8a\x24\xba\x6d\xf6\x1c\xae\x01\x1f\x30\xc4\x51\xd4\xf1\
+\xb6\x02\x7c\x8f\x05\xcd\x9e\xad\x03\x2e\xb1\x0c\xf7\x70\xa0\x21\
+\x81\x2a\x97\x10\x80\x70\x5d\x3b\x72\x8e\xfb\x85\xfd\xd5\xce\x26\
+\xe1\x46\xd2\xec\x20\xd4\xb4\xeb\xc4\xd4\x74\xc9\xb3\x89\x63\x42\
+\xad\x10\xed\xe2\x2f\xe8\x9f\xfa\xef\x50\xcf\xa8\xdc\x58\xc9\x65\
+\xa8\xc0\xdc\x97\xb3\x85\x94\xb1\x50\x40\x08\x79\x42\xe3\xc8\xf2\
+\xe4\x8f\x2c\x53\x8d\x0f\x8a\x92\xde\x6f\xee\xb8\x8e\x25\xb9\x12\
+\x4e\xf3\x5b\xdb\x8c\x87\x6d\x97\x28\x30\x0a\x9c\x1c\x83\xd4\x11\
+\x5e\x4a\xa7\x99\xec\x79\xb9\xae\x19\x44\x3e\xea\xf0\xd5\xfb\x88\
+\xb8\x5a\xd2\xf3\x4e\xfc\xa9\xc3\x64\xcb\x29\x3c\xd3\x59\xc2\xa4\
+\xa8\x5d\xfd\x78\xbb\x95\xdb\x75\xdc\xae\xfe\x55\x41\x61\x54\x45\
+\x2a\x5c\x08\xb9\x73\xdc\xd4\x9d\xab\xcc\x79\xd7\xa6\xbc\xef\x4e\
+\x48\x59\xe1\xe9\x59\x5e\xe2\xb2\xb3\xa0\x36\x7d\x34\xee\xcd\xec\
+\x21\x23\xcd\xb6\x14\x3b\xc6\x5b\xdb\x72\x7d\xcb\xb0\xa3\xa4\xa1\
+\xa4\xaf\x97\x4c\x9f\x47\xd8\x1b\x28\x41\x85\x00\x0f\x21\x51\xac\
+\x32\x4e\xe5\x62\x42\xc7\xa9\xc0\xe8\x3c\xcf\xba\x88\xe4\x69\x1c\
+\x22\x0d\xc9\xa2\xda\x6f\xb2\xc2\x22\xb6\x72\xaa\xf8\xcb\x8e\xad\
+\xe6\x7e\x1e\x43\xf8\xd5\x78\xa1\x79\xec\x27\x25\xb5\xc2\xee\x2f\
+\xba\x60\x91\xfd\x96\xdf\x70\x17\x99\x88\xea\xec\x76\xfd\xf4\xcf\
+\x4c\x8a\x3d\x16\xd1\xa6\xba\x4e\x67\x71\x92\xbb\x7a\xf8\xed\xf0\
+\x1f\xf5\xda\xbc\xd1\xad\x63\x9d\xe5\xbb\x94\x14\x8c\x2f\x33\x01\
+\xd8\x7b\xbe\x38\xa5\xda\xb5\xe3\x5e\x5c\x3c\x92\xfa\xd2\x15\xca\
+\xa0\x3e\xaa\x83\xb2\x8f\x7e\xc7\xef\xab\xf1\xae\x95\xd5\xff\x00\
+\x04\x56\xfa\x9f\x4a\xfe\x48\xde\x65\xbd\xd4\xcb\xcb\x0e\x64\x6c\
+\xca\xcf\xcc\x58\x6e\x30\xa0\xe4\xf4\xc1\x1f\x7d\x07\x12\xc4\x24\
+\x63\xe2\x73\xc2\x58\x46\xde\x11\xe7\xd8\x9c\xb1\x20\xff\x00\x1a\
+\x96\x69\x49\x8e\x37\xce\x33\x27\x86\xaa\x3a\x01\xd0\x6d\xf0\xe6\
+\xfb\xa9\x4c\x21\xd2\x20\xd1\xe4\x38\x2d\xca\x41\xc7\xac\x70\xa3\
+\xf1\x34\xf9\x15\x4b\x83\x7d\x5e\xed\x1a\x63\x7b\x69\x91\x6c\xad\
+\xe1\xdb\xa1\x18\x28\x3b\x93\xef\x23\xbf\xbf\xdd\x49\xe4\x85\x79\
+\x84\x67\x3e\x18\x95\xd8\xff\x00\xa2\x00\x3f\x85\x1f\x2c\xd1\x4d\
+\x39\x8c\xe1\x40\x1e\x1e\xdb\x2b\x8f\x3f\x71\xce\xe3\xb5\x6f\x7b\
+\x09\xb2\xb1\x59\xe5\xfe\x70\xfa\x89\x91\xd5\xb6\xdf\xe5\xca\x0d\
+\x53\x28\x9e\x84\x3a\x83\x95\xe6\x8b\xfc\x23\x1e\x79\x71\xe7\xd9\
+\x7e\x03\xf1\xf8\x52\x99\x06\x33\x46\x4b\xdf\x3b\x93\x42\xcb\xb5\
+\x55\x08\x9a\xd8\x2b\xd0\xf2\x0a\x25\xf6\x35\x03\x8a\xaa\x51\x35\
+\x03\xc8\x2a\x29\x19\x8a\x85\x2c\xc5\x57\xa0\x27\x61\xf0\xa9\xdb\
+\xa5\x40\xd4\xd4\x84\x36\x42\xc2\x8e\xe1\xa8\x5a\x7e\x20\xb0\x81\
+\x03\x93\x34\xa2\x33\xca\x09\x38\x3b\x74\x14\x13\x56\x41\x3c\xd6\
+\xb3\xa4\xf6\xd2\xbc\x33\xc6\x79\x92\x48\xd8\xab\x29\xf3\x04\x53\
+\x74\xf5\xa1\x7b\xe4\x2e\xe5\x4d\xe7\x32\x03\xca\x23\xb8\xe4\x00\
+\x8c\x72\xa7\x2e\x33\xf2\x09\x43\xcf\x1a\xc9\x31\x9e\xe3\x99\x11\
+\xb1\xe1\x42\xa3\xd7\x65\x1b\x2f\xc0\x60\x75\xfa\x66\x8b\xd2\xb5\
+\x3b\x6b\x1b\x4d\x43\xc7\xb4\x37\x37\x93\xf2\xf8\x32\x3b\xfa\x89\
+\xb9\xe6\x2c\xbf\xa4\x48\x3e\x74\xbe\x7d\x42\xe6\x46\x63\xe2\x14\
+\xe6\x39\x3e\x18\xe5\xcf\xc7\x1b\x9f\x9d\x66\x53\xd8\x2d\xa2\xc3\
+\xc2\xbc\x43\xaa\xe8\x1a\x94\x52\x5b\xdb\xb4\x76\x9c\xd9\x30\x98\
+\xcf\x2a\x92\x31\xcf\xbf\x56\x19\xea\x7a\xd3\x6f\x48\xfc\x2d\x6a\
+\xd6\xf2\x71\x17\x0e\x29\x36\x25\xf9\x6f\x20\x0b\x8f\x05\xcf\xe9\
+\xa8\xfd\x43\xf7\x7e\x1c\xf1\xfd\x62\x79\x89\x24\xf7\x35\xd0\x7d\
+\x16\xeb\xcb\x61\xab\x41\x0d\xf7\x2c\x9a\x6d\xdc\x6f\x69\x76\x8e\
+\x09\x1b\x29\x2a\xd8\xf8\x0e\x5f\x95\x62\xe1\xcf\xf5\x27\xbf\xfd\
+\x99\x8a\x55\xf6\x51\xce\x88\xde\xbc\xe9\x57\x5f\x4a\x7c\x26\xbc\
+\x31\xae\x2b\xd8\xe1\xb4\xab\xc1\xe2\x5b\x15\x25\x82\x0d\xb2\xa4\
+\x9e\xa7\xb8\xdf\xa1\xaa\x56\xff\x00\x2a\x7e\x3a\x57\x2a\xa4\x45\
+\xcb\x8a\xe9\x67\x95\x95\x87\x15\x94\xdd\x01\xb3\xea\x29\x68\x59\
+\x28\xd9\x31\xbd\x43\x14\x06\xe6\xe6\x38\x93\xab\x9c\x57\xcc\xa2\
+\x1b\x7a\x47\xd1\x1d\x69\x6d\x91\x22\x72\x42\x4e\x70\xf2\x8c\x0f\
+\x72\xff\x00\xd6\x7e\x95\xa9\x88\xcd\x24\x67\x18\x4f\x0f\x60\x3a\
+\x9e\xd8\x1e\xfc\x60\x53\x9b\xf1\x0b\x99\x12\x14\x25\xd3\x96\x3c\
+\x63\xd5\xe9\xd3\xe3\xd7\x26\xb5\x8e\x34\xb7\xb3\xb8\xbc\x8b\x2f\
+\x34\x44\xf2\x02\x36\x1d\x31\x8f\x76\x6b\x61\x18\x74\xf4\x45\x59\
+\x76\xb7\xe4\x0b\x51\xb9\x10\x72\xe9\xb6\xa4\x26\x70\x93\x11\xbe\
+\x58\xf6\xf8\x0c\x01\x55\xe4\x2b\x71\x3c\x8c\x8b\xc9\x26\x72\x17\
+\xb1\x00\xe7\x6f\x23\xb5\x48\x19\xb9\x4c\x84\x92\xd9\x76\xc9\xf3\
+\xc0\x19\xfa\x9a\x8a\xdd\x39\xee\xd8\x01\xb3\x80\x40\xf8\xd3\x13\
+\xea\x60\xb5\xd2\x81\xee\xc9\x49\x3e\xcf\xdd\x10\x36\x07\xeb\x0d\
+\xff\x00\x0a\x86\x73\xe1\x5b\x33\x8d\xb9\x4b\x63\xe3\x92\x07\xe3\
+\x9f\x95\x6f\x71\x2f\x8f\x76\xef\x8f\xce\xab\x92\x31\xfa\x4a\x3b\
+\x7c\x71\x5e\x71\x18\xf0\x62\xb5\x88\x0c\x17\x53\x29\xf9\x93\x8f\
+\xdf\x54\xc2\x11\x4c\xaf\xc9\xbd\x6f\xa8\xea\x33\x5e\x5a\xda\x5b\
+\xcf\xca\x56\xd5\x0a\x21\x03\x72\x09\xce\xfe\x75\x1b\x9a\x12\x53\
+\xbd\x53\x8e\x49\xed\x83\xca\x68\x69\x37\xa9\xe4\x34\x34\x86\xac\
+\x89\x25\xba\x20\x93\xbd\x0e\xe2\xa6\x7f\x7d\x43\x27\x5a\xa2\x51\
+\x35\x32\x16\x35\x0b\xf4\xa9\x1a\xa2\x6f\xba\x9b\x28\x4d\x32\x36\
+\x35\x13\x56\xed\x5a\x35\x35\x21\x4d\x91\x9a\xd0\xd6\xed\xd2\xb4\
+\x22\x98\x90\xb6\xcd\x1a\x9b\xf0\xa8\x79\x75\x1f\x02\x1c\x99\x18\
+\x78\x91\x81\xdd\x94\x13\xf8\x16\xa5\x0d\x4e\x78\x33\x50\x8f\x4b\
+\xe2\x5b\x2b\xb9\xaf\x65\xb2\x85\x18\xf8\x93\x47\x1f\x88\xc1\x48\
+\x39\x18\xf7\xf4\xcf\x6c\xd6\x6f\xf1\x7a\x3d\x3f\x92\x3b\x35\x85\
+\xa4\x3c\x65\xc1\x97\xdc\x37\x3d\xc1\x8a\xf6\xd1\x94\x46\xec\x73\
+\xca\xa0\x9f\x08\xb0\x1f\x02\xb8\xeb\xd2\xbe\x7f\xb8\x89\xa0\xb8\
+\x96\x17\xc8\x78\xdc\xa1\xc8\xc6\xe0\xe2\xbb\x17\x07\xea\xf2\x69\
+\x1c\x5d\xe3\x6b\x39\x95\x75\x32\x22\x87\x94\x80\xa0\x33\x02\xac\
+\xcb\xd9\x76\xc0\xce\xf9\x3f\x1a\x45\xe9\xef\x46\xb5\xd1\xb5\xfb\
+\x7d\x4a\x05\x68\xe2\xd4\x83\x3c\x84\xf4\x32\x82\x32\x00\xeb\x92\
+\x08\x38\xf8\xd4\x98\x2b\xe3\xc9\xd0\xfb\x3e\x7f\xf4\xa7\x34\xfc\
+\x90\xad\x77\x47\x35\x3b\x56\x50\xc6\x59\xa4\x3f\x99\x87\x91\x7f\
+\x5e\x5d\xbf\xdd\xeb\xf5\xc5\x65\x6c\x36\x47\xaf\x67\xd5\xd2\x0a\
+\x9f\x4e\x46\x54\x9e\x65\xd9\xb1\xe1\xa1\xc7\x42\x7a\x9f\xa5\x45\
+\x28\xda\x99\x46\x82\xda\xd6\x0d\xc7\x31\xdd\x88\x3d\x33\xe5\xef\
+\xc7\xe1\x5f\x3b\xc1\x1b\xad\xfa\x3b\xac\xf7\xa9\xd7\xb2\x3b\xe8\
+\x64\xbb\x65\x86\xdb\xd4\x42\xd8\x72\x76\x19\x18\xdf\xde\x0e\xff\
+\x00\x4a\x55\xaf\xb2\xc5\x2c\x76\x10\x9f\x52\x24\xf5\x88\xee\xe4\
+\x67\xf8\x7d\x69\xc5\xb0\xf0\xa6\x67\x72\x04\x6a\x99\x72\x4e\xdb\
+\x9c\x12\x4f\xd7\xe9\x55\xbd\x46\x44\xfb\x74\xb2\xa0\x32\x06\x72\
+\xca\xe5\xb6\x23\x3b\x55\x77\xdb\xf6\xc9\xf1\xf7\xd7\x84\x07\xce\
+\x24\xb3\x70\xe7\x0c\x72\x03\xfc\xd7\xaf\xf1\xac\xd2\x54\xf8\xed\
+\xce\x30\xd1\x23\x1c\x7b\x80\xe6\x1f\x81\xa9\xfc\x11\x25\xa5\xc9\
+\x58\x94\x47\x1f\xaf\x92\xfc\xb9\x1b\x74\xcf\x53\x50\x69\x72\xc1\
+\xe2\xc8\xad\x28\x8f\x30\xc8\xaa\x65\xe8\x32\xa7\x6c\xd1\xc4\xf6\
+\x3d\x75\xc3\x2b\xce\x48\x20\x83\xbf\x50\x6b\x7d\x6e\xf5\x6f\xa7\
+\x8a\x44\x46\x4e\x48\x52\x32\x09\xce\x4a\x8c\x64\x51\x9a\x46\x97\
+\x36\xb1\x7b\xf6\x5b\x77\x44\x93\x94\xb6\x5f\x38\xc0\xa7\x0f\xe8\
+\xf7\x53\x6f\xf1\x9b\x4f\xab\x7f\x0a\xa2\x17\x04\xf7\x48\xa2\x48\
+\x45\x09\x26\x33\x5d\x01\xfd\x1c\x6a\x8d\xd2\xe6\xcf\xf6\x9b\xf8\
+\x55\x39\x34\xa9\xa7\xd7\x06\x94\xaf\x18\xb8\x33\x18\x39\x89\x3c\
+\xbc\xc0\xe3\x3f\x0a\xaf\x1e\x89\xa9\x89\xa4\xea\x68\x69\x2b\xa3\
+\x3f\xa2\xfd\x60\xf4\xbb\xb1\xfd\xa6\xff\x00\x86\x83\xbc\xf4\x5f\
+\xaf\x46\x85\xa2\x7b\x39\xc8\xfd\x15\x90\x82\x7e\xa3\x15\x44\x5c\
+\xfb\x27\xa9\xaf\x47\x3c\x71\x50\x49\xb9\xa6\x5a\xc6\x99\x7b\xa5\
+\x5c\x9b\x7d\x46\xda\x5b\x79\x7a\xf2\xb8\xea\x3c\xc1\xe8\x47\xc2\
+\x82\xb5\xb7\x7b\xbb\xd8\x2d\xa3\x20\x3c\xd2\x2c\x6a\x4f\x40\x49\
+\xc6\xff\x00\x5a\xa6\x75\xdc\x96\xbd\x01\xbd\x42\xfd\xeb\xa7\xb7\
+\xa1\xdd\x70\xff\x00\x8e\xe9\xdf\xb4\xff\x00\xf0\xd6\x8d\xe8\x6f\
+\x5e\x3f\xe3\xba\x77\xed\x3f\xfc\x35\x95\x9f\x1f\xb3\x0f\x0e\x4f\
+\x47\x2f\x6a\x22\xdd\xb4\xf1\x63\x70\xb7\x71\x5c\xb5\xd9\x65\xf0\
+\x9e\x37\x01\x55\x77\xe6\x04\x11\xb9\xe9\x8a\x79\xc6\xbc\x1f\x7d\
+\xc2\x4f\x68\xb7\xf3\x5b\xca\x6e\x43\x14\xf0\x49\x38\xe5\xc6\x73\
+\x90\x3c\xea\xac\xd5\x44\xea\xd6\xe5\x93\xd2\x70\xf4\xc6\x76\xb0\
+\x68\x73\x10\x2e\x2f\xef\xed\x73\xd4\x9b\x55\x90\x0f\xa3\x83\xf7\
+\x55\x8a\xdb\x83\x74\x39\xec\xa2\xba\xfe\x53\x32\xc7\x33\x94\x89\
+\x9a\xc9\x90\x3e\x3a\xe3\x98\x8c\x90\x7c\xb3\x51\xf0\x8f\xa3\x8d\
+\x63\x8a\x74\xb3\xa8\x59\x4b\x6b\x05\xbf\x88\x63\x5f\x1c\xb0\x2d\
+\x8e\xa4\x60\x1d\xbb\x7c\xaa\xbf\x7f\x77\xc4\x7c\x2d\xac\xdc\x69\
+\x51\xdc\x49\x03\xd9\x48\x50\x87\x7e\x68\x8e\x77\xc8\x8c\xec\xc0\
+\xec\x77\xc5\x03\xae\xa7\xd3\x15\xca\xfe\xfd\x04\xa7\xa5\x6e\xe7\
+\x8f\xef\xf6\x5a\xbf\x91\x1a\x4a\x86\x36\xfa\xa9\xbe\x60\x71\xc8\
+\x3f\x32\x7e\x9c\xa4\xd2\xbb\x8b\x43\x64\x48\xd2\xe3\x0b\x20\x38\
+\xe7\xb4\xb7\x13\x4b\xfb\x6e\xe3\x1f\x15\x02\xbd\x87\x8b\x23\xbe\
+\x11\xae\xaf\x6b\x6c\xb3\x29\xcf\x89\x14\x21\x62\x63\xe6\x63\xe8\
+\x3e\x23\xee\xa6\x03\x55\x1c\xc5\xa4\x7e\x66\x71\xcc\x59\x99\xca\
+\xb0\xf3\x0c\xa4\xb0\xdb\x6c\xfa\xcb\xe6\x2b\x1a\xca\xbf\x20\xb7\
+\x8f\xfc\xa2\x7b\x58\x3e\xc7\x20\xfc\xaa\xfa\x9d\xbd\x9c\x8d\xce\
+\x27\x99\x04\x72\x24\x99\xf6\x97\xda\x24\x1e\x8d\xd8\x8e\xf9\x02\
+\xba\xa7\xa4\x1b\x64\xe2\x4e\x01\xb8\xbe\x92\x32\x2e\xd6\xdd\x2f\
+\x23\x88\x37\x30\x47\x8c\x95\x93\x94\xf7\x1c\xa7\xe7\xb1\xae\x6e\
+\xc8\x23\x80\x5d\x59\x99\xed\x91\xd4\x1f\x11\x67\x67\x8b\xe2\xc1\
+\x0f\x4c\xed\x9e\xdd\xf1\x5d\x4b\xd1\x6d\xdd\xce\xb7\xc3\xb7\x7a\
+\x7e\xb6\x23\x12\x5a\xab\x45\x14\x91\x81\xca\xf0\xc8\xa4\x02\x08\
+\xd9\xbb\x8f\xa5\x2b\x3a\xe9\xd6\x45\xe1\x8c\xc3\xce\xf1\xbf\x27\
+\xce\x55\x94\x46\xa5\x68\xf6\x1a\x8d\xd5\x9c\x80\x87\xb7\x95\xe2\
+\x39\xfe\x89\x23\xf7\x56\x56\xd9\x72\xb6\x8d\x73\xe1\xf2\x7d\x43\
+\x2e\xf4\x75\xea\xe2\xd7\x0b\x9f\x51\xb0\x3e\x3c\xbf\xff\x00\x68\
+\x17\xea\x29\xb2\x28\x8a\x49\xc4\xa7\x31\xaf\xac\x72\x3f\x4b\x3b\
+\x57\xcf\xb0\xce\xf6\x77\x19\xab\xb3\x17\xea\x4c\x53\x4d\x82\xdb\
+\x9b\xf3\x8c\x70\xc0\x6e\x70\x3a\x03\xf5\xcd\x24\x91\x16\x25\xc3\
+\x62\x55\x3d\xc6\xea\xa7\xce\x8a\xbb\x90\xbb\xbb\x16\xe6\x77\x39\
+\x66\xf3\xff\x00\x95\x2f\x62\x51\x89\x53\x83\x4c\xde\xd9\x84\xb4\
+\x8c\x60\xf2\x41\x3a\xb1\xcb\x04\xf9\x10\x37\x04\x7c\xb3\xf4\xa4\
+\xb2\x0f\x21\x56\x0b\x17\x8e\x4b\x85\x8d\xb0\x85\xbd\x4c\x76\x20\
+\xf9\x52\x69\x2d\xe4\x13\xb4\x38\x3c\xe1\x8a\x9c\xf6\xed\xbd\x3a\
+\x64\x55\x50\xd7\xd1\xf7\xf7\xc8\x3f\xa9\x7f\xdd\x52\xf1\xce\xb7\
+\xa9\xd8\x71\x04\xb0\x59\xde\xcb\x0c\x21\x10\x85\x5c\x60\x6d\x5e\
+\xf0\x4c\x26\xdf\x8a\xde\x26\x64\x62\x91\x38\x2c\x87\x2a\x7a\x74\
+\x35\x62\xd7\x64\xe1\x95\xd4\x18\x6b\x0b\x6e\x6e\xf9\x46\x79\xd5\
+\x89\xc7\x6e\x95\x54\xa2\x5a\x7c\x9c\xd6\x4e\x2b\xd7\x47\x4d\x4e\
+\xe0\x7d\x3f\x85\x0d\xc2\xb2\xbc\xdc\x65\xa6\xcb\x2b\x16\x91\xee\
+\x83\x33\x1e\xa4\x9e\xf5\x79\xd4\x66\xe0\xaf\xb0\xdc\x78\x0b\x69\
+\xe3\x78\x6d\xc9\x84\x6c\xf3\x63\x6f\xbe\xa8\x7c\x1f\xb7\x15\xe9\
+\x3f\xfd\xc2\xd5\x10\xb8\x62\x29\x97\x3f\x4b\x1a\xde\xa7\xa4\xde\
+\xe9\xe9\xa6\xde\x4b\x6c\xb2\x46\xe5\x82\x63\x72\x08\xc5\x51\xed\
+\x38\xff\x00\x88\xec\xe5\x0e\x6f\xcc\xeb\x9d\xd2\x64\x56\x07\xee\
+\xcf\xdf\x56\x6f\x4d\xff\x00\xf7\x8e\x97\xfd\x4b\xff\x00\xee\x15\
+\xcb\xa4\x34\xfc\x31\x35\x0b\x68\x46\x5b\x6a\xb8\x3b\xa4\x2f\x63\
+\xe9\x23\x83\xa4\x12\x44\xb1\x5d\x2e\x57\xcc\xc3\x28\x1b\x10\x7c\
+\x8e\xdf\x2a\xe1\xfa\x34\x6d\x0f\x13\x69\xf1\x4a\x39\x64\x4b\xc8\
+\xd5\x87\x91\x0e\x01\xae\xa7\xe8\x21\x5f\xc0\xd6\x5b\x7f\x0c\xbc\
+\x60\x79\x73\x60\xe7\xf7\x57\x38\xbf\xb8\x81\x3d\x24\x13\xe2\x22\
+\xab\xea\xbe\xa0\x27\xda\xfc\xef\x61\x45\x89\x74\x55\xc7\x80\x32\
+\xbe\xa5\x35\xe4\xea\x7e\x9a\xb5\xdd\x4f\x44\xb5\xd2\x9b\x49\xbc\
+\x92\xd5\xa5\x92\x40\xe5\x31\xeb\x00\x06\x3a\x8a\xe5\x0d\xc7\xfc\
+\x53\xff\x00\x9d\xdd\x7d\x17\xf8\x57\x77\xe3\xcb\xfe\x1b\xb1\x86\
+\xd0\xf1\x54\x11\xcd\x1b\xb3\x08\x43\xc2\x64\xc1\xc0\xcf\x4e\x9d\
+\xaa\x95\x36\xb7\xe8\xb2\x65\x0b\x2e\x9b\x6c\xeb\x9c\xe0\xd8\xb1\
+\x1f\x85\x0e\x0a\x4a\x3f\x0d\x99\xcd\x2d\xd7\xe7\xa3\x8e\x6b\xbc\
+\x57\xa8\xeb\xcd\x17\xdb\xef\x27\xd4\x9e\x1c\x84\xc0\x18\x4c\xf5\
+\xf5\xb6\x1d\xa9\x7d\x8d\x8d\xf6\xab\x7d\x6f\x69\x13\x08\xe5\xb8\
+\x91\x63\x48\xe2\xdd\x89\x27\x1b\xb1\xfd\xc3\xe7\x56\x5e\x3b\xb8\
+\xd1\xee\xb8\x8a\x69\x38\x6e\x24\x87\x4d\xf0\xd0\x22\x24\x7e\x18\
+\x07\x1b\xfa\xbf\x1a\xb7\xfa\x06\xd0\x3e\xdd\xae\xcf\xab\xce\x99\
+\x86\xc4\x72\x45\x9e\xf2\xb0\xfd\xcb\x9f\xa8\xab\x9d\x2c\x78\xba\
+\xdf\x1f\xa2\x35\x2e\xf2\x74\xae\x7f\x67\x46\xd4\x75\x4d\x3b\xd1\
+\xc7\x0f\xe8\x1a\x6f\xb5\x11\x91\x2d\x77\x62\x4f\x2f\xe9\xc8\x73\
+\xb9\xdc\xe7\xe7\x54\x6f\xfb\x41\xe8\x00\x49\x65\xaf\xdb\xae\x55\
+\xc0\xb7\xb8\x23\xcf\xaa\x37\xe2\x3e\x94\xb7\xd2\xed\xa7\x10\x71\
+\x17\x15\xca\x6d\x74\x7d\x4a\x4b\x1b\x45\xf0\x21\x65\xb7\x72\xad\
+\xdd\x98\x6d\xdc\xfd\xc0\x57\x41\xe1\xcb\x3b\xbe\x29\xf4\x60\xfa\
+\x46\xbd\x69\x71\x6b\x78\xb1\x1b\x63\xf6\x88\xca\x92\x57\xf9\xb7\
+\x19\xff\x00\x57\xe8\x6a\x38\x5f\x0f\x4e\x5d\xf3\xe7\xf9\x2b\xa7\
+\xf2\xf5\x62\xd7\x1e\x3f\x83\xe6\x8a\x9e\xda\xed\xe0\xf5\x08\xf1\
+\x21\xce\x4a\x13\x8c\x1f\x30\x7b\x1f\x78\xad\x6e\xed\xe5\xb4\xb9\
+\x9a\xde\xe1\x0a\x4d\x0b\x98\xdd\x4f\x50\xc0\xe0\x8a\x84\xe0\x56\
+\xe5\x24\xd1\xaa\xec\x3c\x82\xf9\xad\x98\x5c\x23\xb3\xc2\xcc\x33\
+\x2a\x8c\x3a\xb7\x93\x81\xd4\xf9\x30\xc1\x3e\x7d\x45\x76\x7f\x46\
+\x01\x6d\xf4\x0b\x8b\x8f\xb4\x31\x4b\xf7\xcc\x6a\x00\x21\x37\xe5\
+\xe6\x07\x1d\x79\xbc\xfc\x8f\xc2\xb8\x3e\x8f\x2c\x11\xea\x50\x0b\
+\xd9\x5e\x2b\x27\x60\x97\x05\x13\x9c\x94\x3d\x7d\x5e\xff\x00\xf4\
+\x6b\xb0\xda\xeb\xf6\x62\xe9\x1a\x37\x5b\x3e\x18\x4b\x29\x22\x05\
+\x49\x5f\x0d\x00\xcf\x30\x00\x6e\xdd\xf6\xdf\x35\x17\xd6\x4f\xdb\
+\xa4\x57\xf4\xb5\xce\xce\x6d\xe9\x3e\xcc\xd8\x71\xde\xad\x11\x6e\
+\x6e\x69\x04\x9c\xde\x7c\xca\x0e\x7e\xf3\x59\x44\x7a\x6e\x92\xe1\
+\xbd\x23\x6a\x02\x18\xc3\x29\x8e\x12\x25\x90\xe1\x48\xf0\xc6\xe0\
+\x0d\xcf\xdd\x59\x55\x60\xbd\xe3\x97\xfa\x44\xd9\x63\x57\x5c\xf9\
+\x3b\xd4\x64\x78\xc9\x91\x91\xcc\x36\xf3\xde\x98\xeb\xf2\x14\x54\
+\x55\xff\x00\x09\xb9\xf8\x0e\xd4\xb0\x90\xae\xa7\xc8\xe6\x8b\xd7\
+\xdb\xc4\x90\x11\x83\xcb\x90\x3e\x15\xc4\xe3\x5a\x86\x76\x37\xcd\
+\xa1\x2c\xb8\xa1\x64\x1e\x74\x4b\x64\xe0\x00\x4e\x7c\xab\x47\x2b\
+\x17\x91\x93\xea\x17\xfe\x75\x99\x93\xd5\x40\x6f\x10\x5f\x5a\x52\
+\x40\xec\x07\x53\xfc\x2a\x0d\x46\xee\x6b\xa9\x5a\x49\x5b\xae\x33\
+\x8e\xf8\xf3\xf3\xa9\x66\x24\x92\x58\xe4\x9e\xe6\x83\x97\xbd\x51\
+\x08\x45\x31\xd7\x01\x7f\x7c\x63\xfa\x97\xfd\xd4\xbf\xd2\x2f\xf7\
+\xcd\x3f\xf5\x69\xf8\x50\xb6\x57\xf7\x1a\x6d\xcf\xda\x2d\x1c\x24\
+\xbc\xa5\x72\x54\x1d\x8f\xc6\xa3\xb9\x37\x5a\xf5\xf3\xcb\x75\x2c\
+\x4a\xdc\xbe\xbc\xcf\xea\x22\x80\x36\xce\x3e\x95\x4c\x2d\x13\xd3\
+\x2b\xd2\x75\xe9\x46\x70\x89\xff\x00\xe6\xdd\x27\x1f\xf8\x85\xa5\
+\xb7\xf7\x56\xf6\xa0\x1b\x89\x15\x09\xd9\x57\xab\x37\xc0\x75\x3f\
+\x2a\x5d\x6f\xa9\xdf\xc1\x7d\x0d\xd6\x9b\x08\xb7\x92\x26\x0e\x92\
+\xdc\x0e\x87\xcc\x27\x53\xf3\xc5\x56\x96\xd6\x89\xa9\xf3\xb3\xaf\
+\xfa\x4d\xe1\x7d\x53\x88\x2f\x2c\x64\xd3\x63\x89\x96\x28\xd9\x5f\
+\x9e\x40\xbb\x92\x2a\xa1\x67\xe8\xb3\x5b\x9e\x60\x2e\xa5\xb4\xb6\
+\x8f\x3b\xb7\x39\x73\xf2\x00\x7e\xfa\x0a\x3f\x48\x1c\x4f\x12\x11\
+\x26\xa2\x92\xb9\xdc\x93\x6e\x83\xe8\x00\xa1\xaf\x78\xff\x00\x89\
+\x67\x42\xa7\x52\x68\xc7\xfe\x94\x6a\xa7\xea\x05\x16\x38\xcc\x96\
+\x96\x85\xdd\xe3\x6f\x6c\xe9\x1a\xb5\xee\x99\xe8\xe7\x84\xcd\x95\
+\x9b\x87\xbe\x90\x1f\x0d\x49\x1c\xf2\x48\x7a\xbb\x79\x01\xfb\xb1\
+\x5c\x33\x86\xe0\x8e\x3e\x23\xd3\xa4\x55\x1e\x2b\xdd\xc6\x5a\x43\
+\xbb\x31\xe7\x1d\x49\xdc\xd7\x97\x73\xcd\x73\x3b\xcd\x71\x2c\x92\
+\xca\xde\xd3\xbb\x16\x27\xe6\x6a\x08\x67\x92\xd6\xe6\x19\xe1\x20\
+\x4b\x13\x89\x10\x91\x9c\x10\x72\x2a\x8c\x58\x7a\x13\xf2\xd9\x3e\
+\x4c\xbd\x4d\x7a\x47\x78\xf4\xb9\xc2\xfa\x9f\x13\x5b\x69\xa9\xa4\
+\xa4\x4e\xd0\x3b\xb3\xf8\x92\x05\xc0\x20\x63\xf0\xae\x68\xde\x8a\
+\x38\xa4\xff\x00\x8b\xda\x7f\xb4\x0a\xd5\xbd\x27\xf1\x5f\xfe\x3a\
+\x2f\xf6\x74\xfe\x15\x1b\x7a\x52\xe2\xb1\xd2\xfe\x2f\xf6\x74\xfe\
+\x14\x38\xb1\x67\xc7\x3d\x33\xa3\x39\x32\x61\xb7\xb7\xb1\x37\x14\
+\xf0\x6e\xb1\xc3\x51\xdb\x3e\xa9\x14\x4a\x2e\x18\xa4\x62\x29\x03\
+\x92\x47\x6a\xec\xf0\xcb\x17\xa3\x4f\x46\x50\xc9\x24\x6b\x25\xe0\
+\x00\x98\xc9\xc7\x89\x3b\xee\x47\xcb\xf0\x5a\xe3\x7a\xcf\x1b\xeb\
+\x9a\xc4\xf6\x33\x6a\x17\x11\x4c\xf6\x52\xf8\xd0\xe6\x15\x00\x37\
+\x99\x18\xdf\xa7\x7a\x17\x89\xf8\xbb\x5a\xe2\x58\xa0\x8b\x57\xba\
+\x13\x47\x0b\x16\x45\x58\xc2\x00\x48\xc6\x4e\x3a\xd3\x6b\x0e\x4c\
+\xaa\x56\x4d\x6b\xc8\xa9\xcb\x8f\x13\xa7\x1f\xc1\x7b\x3e\x9b\xf5\
+\x11\xfe\x46\xb4\xfe\xd9\xbf\x85\x36\xe1\x1f\x4b\xf2\xeb\x1c\x45\
+\x67\xa7\xea\x1a\x75\xbd\xac\x37\x2f\xe1\x89\x52\x42\x79\x58\xfb\
+\x3d\x47\x42\x76\xf9\xd7\x08\xb9\x9e\x28\x14\x34\xd2\x2a\x03\xd3\
+\x27\xaf\xc0\x77\xa1\xd6\xea\xe1\x9d\x5e\xd2\x23\x19\x52\x19\x65\
+\x97\x2b\x82\x3b\x85\xeb\xf5\xc5\x1d\x7d\x1e\x16\x9a\x4b\x93\x13\
+\xf5\x59\x93\x4d\xbe\x0e\xab\xe9\xe7\x87\xff\x00\x26\xf1\x34\x7a\
+\xa4\x09\x8b\x7d\x45\x72\xf8\xe8\x25\x5e\xbf\x51\x83\xf5\xaa\x2c\
+\x3a\x14\xf3\x69\xf6\xf7\xc2\xe2\xd3\xec\xd3\x29\x65\xe4\x98\x3b\
+\x80\x09\x07\x2a\x37\x1b\x8e\xf8\xa2\x78\x8b\x8c\x35\xde\x26\xd2\
+\xc5\x87\x10\xde\x45\x7b\x6e\x24\x12\x81\xf6\x74\x4c\x30\xd8\x63\
+\x1b\xf7\x3d\x49\xa4\x11\x0f\x04\xa9\x8b\xf3\x65\x7a\x72\x6d\x8f\
+\xa5\x3b\x04\x65\x9c\x6a\x69\xf6\x15\x96\xf1\xbb\x75\x3e\x43\x04\
+\x56\xea\x76\x9e\x01\xe6\xcc\x1a\x43\xf2\x50\x31\xf5\x26\xae\xfe\
+\x8a\x93\x4f\xbe\xd4\x6f\xac\x2f\xa6\x9a\xe5\x4d\xbb\x3a\x07\x1c\
+\x85\xb7\x1c\xca\xad\x93\x80\x47\x6d\x86\xd5\x48\x4b\x97\xb8\x75\
+\x8e\xe2\x11\x72\xcc\x70\x08\xda\x4f\x93\x0e\xbf\x3c\xd5\xb7\x40\
+\x89\x34\x4b\x45\xd4\xad\x39\xe4\x66\xb8\x45\x8c\x95\xc3\x3b\x29\
+\xcb\x05\x3d\x19\x57\x23\x24\x75\x26\xbd\x9a\x37\x3a\x7d\xcc\x62\
+\xbf\xbb\x6b\xb0\x0f\xa5\x0b\x99\x6f\xb5\xfb\x3b\xa9\xe3\x31\x4b\
+\x35\x84\x0c\xc8\x4e\x79\x4e\x0e\xd5\x95\xaf\xa4\xf7\x8d\xf8\xa9\
+\xc4\x0c\x19\x16\xde\x2d\xc7\x9b\x2f\x39\xfb\xda\xb2\x9d\x81\x6b\
+\x1c\x89\xcd\xfe\x23\x3b\xcb\xf7\xc7\xdf\x47\x6a\xe6\x33\x14\x13\
+\xc5\x92\xae\xa0\xb2\xe3\xb7\x43\x40\x48\xdf\x5a\x61\x63\xff\x00\
+\xc4\xd8\x14\x00\x19\x61\xe6\xe5\x07\xb8\x3b\xe3\xf7\xfc\xab\x89\
+\xc6\xbc\x1d\x96\x47\xad\x31\x35\xc0\xf0\x3d\x5c\xfa\xc7\xbf\x90\
+\xf2\xa5\xf2\x1d\xce\x28\xf6\xe5\x70\x54\x9c\x0f\x7f\x50\x7f\x7d\
+\x2a\xd4\xe7\x8f\x4f\x55\x6b\xb6\xf0\x83\x1c\x26\xc4\x97\x3e\x4a\
+\x06\xe4\xfc\x29\xb2\x80\x74\x69\x21\xed\x43\x48\x46\x09\x3d\xb7\
+\xa1\xde\xe2\xf6\xeb\x6b\x4b\x5f\x05\x0f\xf8\x5b\x9e\xbf\x28\xc6\
+\xff\x00\x52\xb5\x1c\xba\x5c\x4a\x73\xa8\xc8\xf7\xd3\xf5\xe4\x97\
+\x1e\x12\x7f\xa8\x36\x27\xe3\x9f\x8d\x3e\x64\x55\x3f\x64\x6f\x70\
+\x84\xa7\x83\x14\xb7\x6e\xfe\xc2\x41\x8c\x37\xc5\xcf\xaa\xa3\xe7\
+\x9f\x21\x43\x6a\x3f\x6c\xb9\x51\x0b\x5c\xad\xb5\xba\xe0\x98\xed\
+\x86\xe5\xbb\xfa\xe7\xb7\xc0\x03\xef\xa6\x72\xb1\x82\x3d\x8f\xe7\
+\x24\x1f\xb2\xbf\xf3\xfc\x3e\x34\x0b\x82\xc8\xe5\x15\x99\x50\x65\
+\x88\x1b\x01\xef\xf2\xaa\x62\x7d\x93\xd5\x0a\x05\xa5\xbd\xa6\x4c\
+\x31\x85\x66\x1e\xb3\x92\x59\xdb\xe2\xc7\x73\x41\xcd\xd6\x98\x5d\
+\x11\x8c\xfd\x28\x38\x6d\xde\xee\xe5\x62\x88\x6e\xc7\x73\xd9\x47\
+\x72\x7d\xc2\xaa\x85\xa4\x49\x6f\x60\x32\x56\xf7\x70\x5b\xc5\xa7\
+\xc4\xe6\x59\x3e\xdc\xee\x4b\x43\xcb\xea\xac\x78\xd8\xe7\xcc\xf9\
+\x79\x51\x77\x56\xf0\x5a\xdc\xcc\xf1\xcc\xb7\x56\xf1\xbf\x2c\x4e\
+\x14\xa8\x94\xf9\xe0\xef\x81\xdf\xfe\x74\xa6\x77\x69\x1d\x9e\x46\
+\x2c\xcc\x72\x49\xee\x69\xf2\xb7\xd8\x45\x70\x0c\xfd\xea\x06\xef\
+\x53\xbd\x09\x75\x73\x0d\xba\x83\x34\x8a\x99\xe8\x09\xdc\xfc\x07\
+\x53\x4f\x5a\x42\x1f\x27\x8f\x50\x39\xa8\x5e\x7b\x89\xbf\xfa\x68\
+\x39\x17\xfc\xe4\xfb\x7d\x14\x6f\xf5\xc5\x44\xd6\x42\x4d\xef\x25\
+\x7b\x83\xfa\xad\xea\xa7\xec\x8d\x8f\xcf\x34\x69\xfa\x01\xaf\x66\
+\x92\x5f\x44\x58\xad\xb8\x7b\x87\x1b\x11\x10\xc8\x1f\x16\xe8\x3e\
+\xb5\x19\x4b\xa9\xbf\x9c\x91\x6d\xd3\xf5\x62\xf5\x9b\xf6\x8e\xdf\
+\x41\xf3\xa7\x36\x36\x51\x5c\x41\x73\x9b\xbb\x6b\x5f\x02\x30\xc8\
+\x92\x64\x78\x87\x38\xe5\x5c\x0c\x67\xbd\x6d\x67\xa6\x19\x6f\x21\
+\x4b\xa9\x3c\x2b\x46\x60\x24\xb9\x8d\x7c\x61\x1a\xfe\xb6\x16\x89\
+\x7e\xd8\x3f\xec\x84\xd0\xda\xc5\x0b\x16\x44\x1c\xe7\xab\xb1\xe6\
+\x63\xf3\x3b\xd4\x87\xad\x1b\x35\x83\x78\xb2\x0b\x59\x12\xe9\x15\
+\x88\x0d\x1f\xb4\x47\x9f\x29\xf5\x87\xd2\x82\x20\x82\x41\xd8\x8d\
+\x88\xa6\xca\x5a\xe0\x5d\x37\xe4\xd7\x14\x5d\x96\x97\x7b\x7a\x39\
+\xa0\x81\xcc\x3b\x93\x33\x0e\x58\xd4\x0e\xa4\xb1\xda\x85\x34\xc6\
+\xdb\x50\xbd\x97\x4e\xfc\x9e\x2e\xa7\x11\x42\x4c\xd0\x46\xae\x40\
+\x53\xd5\x80\x1e\xf1\xbf\xc4\x7b\xe8\xab\x7e\x0c\x4e\xb7\xc9\x21\
+\x58\x2c\x11\xa3\xb4\x47\xbb\xb8\x61\x86\x94\x21\x09\xef\x03\xbe\
+\x3e\x1d\x7c\xfb\x51\xfa\x42\x6a\xda\x83\x5b\x59\x48\x64\x2b\xf6\
+\x88\xda\x08\xe7\x3c\xa8\xbc\xc7\x94\xf2\x0d\xb9\x7f\x47\xd9\xf2\
+\xaa\xe3\xdc\x4e\xe3\xd6\x9a\x56\xf8\xb9\x35\x6c\xe0\x08\x3e\xcd\
+\x1e\xab\xae\xdc\x67\xc3\xb1\xb6\x67\x8c\x91\xed\x49\x90\x17\xfd\
+\xe2\x3e\xff\x00\x2a\x0c\x8b\xa6\x76\xc3\xc6\xfa\xab\x5e\x04\xfc\
+\x6f\x75\x6f\x7b\xc5\x9a\xa4\xd6\x48\xc9\x6e\x66\x28\x81\x88\x3b\
+\x28\x0b\xdb\xb6\xdb\x56\x52\x42\x49\x24\xb1\xc9\x3d\x7d\xf5\x94\
+\xe8\x8e\x99\x4b\xd0\x9b\x7d\x4d\xb2\xfa\xdc\x73\xaf\xe3\x26\xee\
+\x31\xff\x00\xe1\x5f\xe1\x4d\x78\x27\xd2\x06\xa5\x79\xac\xfe\x4e\
+\x7b\x88\x9d\xef\x07\x87\x0c\xfe\x10\xe5\x8a\x51\x92\x99\x23\x62\
+\x09\xf5\x4f\x5e\xb5\xce\xcd\xaa\xb1\xcd\xc3\x34\xcd\xe4\xfe\xcf\
+\xec\x8d\xaa\x45\x76\x8d\xd5\xa3\x25\x19\x08\x2a\x57\x6c\x11\xd3\
+\x15\xc5\x24\x76\x14\xce\xb7\xc6\x93\x71\x04\x36\xf1\x6a\x51\x5d\
+\x0b\x68\x65\x52\xad\x69\x12\xa7\x31\x94\x7b\x43\x9f\x19\x00\x7c\
+\x89\xed\x8a\xa1\xff\x00\x2d\x38\x8c\xa2\x59\xad\xd1\x21\x5b\x0b\
+\x11\x88\x12\x1b\xa7\x7d\xf3\xf1\xae\x86\x9a\xcc\x1a\xbe\x9d\xa7\
+\x6b\x32\xca\xf0\x41\x28\x10\xdd\xac\x44\x60\xdc\x8e\xab\xca\x76\
+\xf5\x87\xad\x9f\x2c\xef\x90\x29\x57\x14\xd9\x6a\x5a\xa5\x91\xba\
+\x09\xa7\x2d\x9c\x28\x79\x07\x86\x60\xe5\x0d\x80\x63\x89\x97\xdb\
+\x3b\x6f\xdf\xb7\x9d\x35\x21\x7d\x4c\xac\x5f\x71\x95\xed\xb5\x8d\
+\xbc\x76\x97\x6c\xfa\x8f\xad\xf6\x99\x0c\x49\xe1\xaf\x90\x8c\x8e\
+\xbb\x75\x3e\xed\xa9\x7d\xb7\x16\x6a\xee\xcf\x24\xf7\x08\x60\x84\
+\x73\x38\xf0\x97\xd6\xf2\x5e\x9d\xcf\xdd\x9a\x30\xe8\x5a\x2c\x1a\
+\x06\xa1\x35\xfd\xd4\xab\xa8\x84\xcd\xac\x50\x1e\x71\x91\x93\xeb\
+\x02\x06\xc4\x03\xbf\x6c\x55\x56\xf8\xf8\x36\xf0\xdb\x0f\x6b\x02\
+\x59\x7f\xd2\x23\x61\xf2\x1f\x79\x34\x72\x2d\xb0\xfb\x8e\x31\xd6\
+\xdd\xd9\xda\xe5\x09\x27\x3f\xcd\x2f\xf0\xad\xb4\xde\x35\xd6\x22\
+\xb8\x78\x24\xbd\x11\xdb\x5d\x2f\x83\x31\x11\xae\x30\x7a\x1e\x9d\
+\x8e\x0f\xca\xab\x52\x1a\xf2\x38\x03\xc6\x66\xb8\x63\x1d\xb0\x38\
+\xe6\xc6\xee\x7f\x55\x47\x73\xf7\x0a\x72\x14\xc6\xed\xad\x6b\x9f\
+\x69\x9e\x19\xe7\x48\x84\x0c\x56\x67\x68\xc7\x2a\x60\xe3\xcb\x7f\
+\x70\x1d\x68\xbf\xe5\x1e\xa1\xe0\x2c\x10\x4e\x21\x59\x57\x9d\xe4\
+\x78\xc7\x32\xc4\x3a\xbb\x7b\xdb\xb0\xf2\xc7\x5e\x6c\xd0\x1a\x9c\
+\xf1\x6a\x3a\x7d\xbe\xa5\x29\xf0\xed\xad\x71\x0d\xd4\x20\xe5\x8b\
+\x01\xf9\xb3\xe6\xcc\xe0\x05\xcf\x9a\x9a\x47\xab\x5d\x5c\x65\xed\
+\xd1\x15\x65\x90\x87\xb8\x77\xd8\x06\xed\x18\x03\xb2\x8f\x86\xff\
+\x00\x01\x4c\x54\xfb\x00\xd2\x18\xde\xf1\x56\xa3\x34\xa4\xc7\x22\
+\xa4\x2a\x39\x63\x42\x80\xf2\x8f\x7f\xbf\xb9\xf7\xd2\xe7\xe2\xad\
+\x41\x89\x11\x4a\x25\x6f\xe8\x46\xb8\xfa\xf4\xa5\x26\xdc\x36\xf3\
+\x33\x4b\xee\x6d\x97\xe9\xd3\xeb\x4e\xf4\xc8\x12\xda\x58\x9e\x61\
+\x89\x4a\xf8\x81\x40\xfe\x6a\x30\x32\x5c\xfb\xc8\xf6\x47\xcf\xca\
+\x98\xaa\x97\x91\x6e\x64\x27\x5e\xba\xd4\x6c\xa1\xb1\x56\xd5\x14\
+\xdd\xcd\x0f\x89\x73\x6f\x1c\x00\x35\xb3\x13\xea\xa9\x73\xb1\x25\
+\x70\x76\x03\x19\xc5\x27\x83\x54\xba\xb7\x25\xa2\x64\x0e\x7a\xbb\
+\x28\x66\x3f\x16\x3b\x9a\x63\xa3\xe9\x53\x71\x36\xa5\x79\x8b\xdb\
+\x0b\x36\x58\xda\xe1\x9e\xf2\x71\x12\x10\x3a\x2a\x93\xd4\xee\x00\
+\x14\x1d\xce\x83\xaa\xdb\xa7\x88\xf6\x13\x34\x67\xa4\x91\x0f\x11\
+\x7e\xab\x91\x44\xa9\xf9\x7c\x82\xe5\x6b\x84\x68\xfa\xf6\xa0\x47\
+\xf3\xab\xfb\x02\x9a\x6a\x3a\xdd\x94\x93\xaf\xe4\xfb\x9b\xf8\x22\
+\xf0\x93\x9b\xed\x10\xc7\x21\xf1\x31\xeb\x7b\x24\x7a\xb9\xce\x2a\
+\xb2\xfe\xa9\x20\xec\x7c\x8d\x5b\x38\x5e\xcf\x87\xff\x00\x92\xfa\
+\xc6\xa1\xad\x5b\x5e\xcd\x77\x6e\x0c\x70\x85\x70\xb1\x16\x70\x15\
+\x08\x03\x04\xb2\x92\x58\xef\x8c\x01\xe7\x47\xf2\x52\xe7\x6c\x05\
+\x8e\x5f\x81\x61\xd4\x2e\xdd\x73\x16\xa5\x68\xc7\xf5\x59\x7c\x33\
+\xfe\xf0\xc7\xdf\x56\x2d\x15\xf5\xdd\x12\x4b\x5d\x59\x6d\xac\xf5\
+\x63\x24\x0e\xf1\x47\x6b\x72\xac\xf6\xce\x0e\x15\xd8\x26\xf9\x04\
+\x67\x1b\x83\xde\xa9\x4d\x6f\x6a\xc4\x78\x57\xca\x33\xd7\xc5\x89\
+\x97\x1f\x4e\x6a\xf0\x59\x48\xb2\x03\x05\xcd\xab\x37\x62\x93\x85\
+\x3f\x7e\x0d\x13\xba\x6b\x5b\x30\xa2\x57\x3a\x2d\x97\x9c\x5f\x77\
+\x25\xcb\xb6\xb7\x07\x34\xac\x79\xcf\xda\xed\x80\x62\x49\xea\x1d\
+\x02\xb0\xfa\x1a\x6b\xab\x98\x0d\xda\x41\x69\xab\x47\x74\x4c\x51\
+\xc9\x89\x63\x32\x2a\x97\x40\xdc\xa1\xd4\x09\x06\x33\xdd\x08\xad\
+\xf8\x52\x0d\x46\xcf\x40\xfb\x79\x6b\x9b\xeb\xaf\x06\xe5\x7e\xcb\
+\x74\x8b\x71\x6c\x14\xf2\x47\x1b\x2e\xe7\x2d\xcf\x27\xc3\xd5\x34\
+\xaf\x8e\xda\xde\x0e\x2e\xd4\xad\xa3\xd0\xfe\xd9\x6d\x6f\x2f\x84\
+\x27\xf0\x5e\x09\x09\x50\x15\xb0\x50\xe0\x8c\x82\x01\xc7\x4c\x52\
+\xd6\x4a\xde\x93\x09\xc4\xeb\x6d\x0b\xf5\x1b\x4d\x5a\x08\xfc\x7b\
+\x77\x56\x84\x9c\x03\xea\x3a\x93\xe4\x24\x5f\x54\x9f\x71\xe5\x6f\
+\x75\x24\x4d\x6f\x51\xb5\xba\x0c\xcd\xcb\x2c\x4c\x09\x56\x8c\x02\
+\x08\xec\x45\x3e\xd3\x35\x34\x82\x5c\xdb\x7e\x5c\xb4\x62\x39\x48\
+\x78\x85\xd2\xe3\xcb\xf4\x1b\x1e\xea\xb5\xe9\x5c\x37\x69\xc6\x8f\
+\xf6\x79\xad\xa5\xb7\x93\x94\x94\xbd\x8a\xd6\x58\xc0\xf7\x72\x32\
+\xe0\xff\x00\xa2\xac\x69\x8f\x3d\xcf\x76\x02\xc3\x0f\xb2\x28\xf6\
+\x87\x52\xd4\x35\xa7\xb3\xb4\x72\xd1\xf3\xe7\x98\x46\x32\x14\xfb\
+\x3f\x33\x91\x81\x57\xaf\x49\x7a\x83\x70\xbf\x09\xe9\xdc\x3f\x6b\
+\x22\x9b\xeb\xc7\x17\x37\x4c\x06\x40\x8d\x32\x11\x07\xbb\x98\xb6\
+\xfd\xf9\x73\xde\x9a\x1d\x2e\x0e\x0e\xd5\x92\xc8\x4b\x0c\xd2\xc7\
+\x00\x73\x72\x87\x99\x22\x45\xca\x34\xae\x7f\xce\x7a\x85\x55\x07\
+\xb3\x82\x49\x27\x15\xc7\x78\xc3\x5f\x6d\x73\x5f\xba\xd4\x2e\x1c\
+\xa8\x90\x84\x85\x0f\x55\x8d\x46\x14\x63\xe1\xf7\x93\x58\x59\x6a\
+\xda\x6d\xf0\x82\xf8\xe6\x16\x92\xe5\x91\x7e\x58\xbd\xff\x00\x38\
+\xbf\xb2\x2b\x29\x4f\x3c\xaf\xfc\xdc\x7c\xa3\xf5\x9f\xf8\x56\x53\
+\xbe\x6b\xf6\xc5\x7c\x53\xe9\x1d\x65\x81\x6f\x8d\x40\xc2\x88\x2c\
+\x39\x48\xef\x50\x48\xa4\x75\xad\x02\x46\xe9\xb2\xcd\xe8\xf3\x5e\
+\x4d\x23\x5b\x8a\xde\xf6\x15\xb9\xd3\xae\xe4\x45\x96\x17\x19\x01\
+\xc1\xf5\x1c\x7b\xc1\x3f\x7d\x35\xf4\x94\x6f\xb4\xdd\x55\xad\xaf\
+\x09\x4b\x38\x79\x8d\xbc\x0a\xc7\x95\xcb\x13\x81\x9e\xb8\x00\x0c\
+\x8f\x80\xef\x5c\xfd\xb6\x35\x72\xd2\x35\xbb\x3d\x7f\x43\xb7\xe1\
+\xad\x7e\xf6\x08\x27\x8a\x4c\xd8\x4f\x39\x00\xb7\x36\xde\x19\x6e\
+\xa3\xdc\x7a\x76\x3d\xa9\x88\x02\xb1\x61\x2b\x3c\xf1\xcf\x3b\x17\
+\x02\x6f\x12\x5c\xfe\x92\x2a\x12\xc3\xe9\x91\x40\xdd\xc2\xd3\xea\
+\x53\x07\x93\x11\x9c\xcc\xd2\x9e\x81\x0e\xfc\xdf\x42\x3e\x7b\x53\
+\xbd\x57\x86\xb5\xed\x26\x3b\xdb\x39\x34\xe9\x11\xcb\xac\x70\xcc\
+\xc3\x99\x64\x0c\x7a\xae\x0f\x92\x9e\xa4\x52\xbb\x85\xb7\xb7\xd2\
+\x8d\xa8\x90\x5e\xea\x16\xe7\x9e\x69\x1c\x03\x18\x19\x3b\x28\x1b\
+\x37\x21\x3d\x4e\x46\xe4\xef\x80\x69\x8b\xf4\x03\x34\xd4\x6f\xb4\
+\x79\xae\xee\x6e\x6e\x2c\x25\xb7\x06\xdc\x0b\x4b\x3b\x3e\x8c\xe0\
+\x00\x1a\x56\x63\xea\xab\x6e\x4e\x0e\x4e\x76\x1d\xea\xb1\x77\x2d\
+\xdd\xe4\x9c\xf7\x32\x88\xc0\x18\x54\x84\x60\x28\xf2\x07\xb0\xf8\
+\x0a\x2a\x67\x67\x66\x66\x25\x98\xee\x49\x39\xcd\x4f\xa3\x41\xe3\
+\x5d\xf8\xa7\x1c\x90\xfa\xde\xb7\xb3\xcd\xdb\x3e\xe1\x82\xc7\xdc\
+\xa6\x98\x90\xb6\xcb\x0f\x0d\x5a\x59\xe8\xba\x73\xc9\x7f\x72\x96\
+\xb0\x5c\x48\xb6\xf2\xac\x91\xb3\x34\x8e\x48\xfc\xe8\x6c\x1c\xf8\
+\x3b\x1c\x79\xe4\x77\xaa\xa6\xbb\x60\xfa\x5e\xad\x77\x65\x24\x82\
+\x53\x0c\x85\x44\xaa\x08\x12\x8e\xa1\xc6\x7b\x11\x82\x3d\xc6\x9f\
+\xe9\xfc\x41\x23\x4f\x14\x52\x43\x1d\xed\xad\x97\x88\xf6\xb6\xb7\
+\x4b\xce\x84\x30\x22\x4d\xbf\x5d\xbd\xbc\xfe\xb0\xa9\xe7\xb0\x59\
+\xf4\xe5\x8e\x70\xb7\x1a\x9d\x8c\x3e\x2d\x9a\x1f\xf1\xab\x4e\xa0\
+\xb0\xf3\x41\x92\x17\xa9\x19\x1d\x17\x72\x5c\x30\x1f\x28\x41\xa7\
+\x69\x57\x2d\x63\x75\xa8\x2d\xab\x4e\xb6\xb1\x89\x99\x31\xb2\x21\
+\x38\x12\x38\xfd\x5c\xf4\x1d\xfe\x14\x13\xc8\xcb\x61\x2c\xd2\x31\
+\x69\xee\xdf\x97\x98\x9d\xf9\x41\xcb\x1f\x99\xe5\xfa\x1a\xf2\x2b\
+\xcb\x91\x76\x66\x8e\x56\x69\xa4\x38\x60\x77\x12\x67\xf4\x48\xe8\
+\x47\x6c\x74\xa6\xf7\x3a\x3b\xea\x92\x5c\xc9\xa5\xc9\x6e\xb6\xd6\
+\x16\xec\x5e\x39\x25\x0a\x54\xaf\xb4\xab\x9f\x68\x92\x58\xaf\x72\
+\x33\xe5\x4d\x5c\x77\x00\xac\xb0\xad\xed\xae\x2e\x2d\xe4\x0d\x69\
+\x2c\xd1\x3f\x5c\xc4\xc5\x4f\xdd\x51\x93\xf3\xa3\x34\x7d\x4a\xfb\
+\x49\xd4\x63\xbb\xd2\xa6\x68\x6f\x14\x32\x23\xa2\x86\x3e\xb0\x2a\
+\x46\x08\x3d\x41\x22\x8c\x01\xbe\x83\x7d\xae\xeb\xda\xa5\xbe\x99\
+\x6f\x24\x17\xb3\xdc\x12\xaa\xb7\xa8\x8e\xbd\x32\x49\x66\x1b\x60\
+\x03\xbe\x6a\xd9\xc7\x49\x67\xa6\x69\xb6\x5a\x6d\xb7\x0f\x09\x00\
+\x86\x13\x70\xf1\xb3\xa8\x79\x48\x66\x25\x79\x76\xc7\xb3\xf5\xa4\
+\xba\x54\x89\xa7\x33\xc3\x75\x05\xb4\xb7\x0b\x19\x9a\xf5\xc4\x61\
+\x7c\x28\xc6\x31\x10\x2b\x8f\x59\x8f\x28\x3f\x1a\x1b\x8e\xf5\x2b\
+\x7b\x8d\x4a\x23\x35\xb3\x34\x8d\x18\x76\x31\xcc\x57\x1e\xaa\xaf\
+\x7c\xfe\xa5\x06\xb7\x41\x6f\x48\x4d\x2f\xe4\x72\x3f\x3b\xa5\xea\
+\x96\xcf\xfd\x09\xc3\x0f\xa3\x20\x3f\x7d\x31\x75\xe0\xa9\xf4\xeb\
+\x14\x8e\x1e\x22\x8b\x50\x01\x96\x72\x8b\x1c\x8b\x21\xcf\xaa\x40\
+\x24\x63\x6d\xb0\x29\x28\xd4\x51\x46\x15\xb5\x05\x5e\xc0\x5e\x7f\
+\xfa\xd3\xde\x0a\xc6\xa7\xaf\x5a\xc2\x0d\xe0\x1e\x22\xaf\x34\x97\
+\x64\xa8\x24\xf9\x05\xec\x01\x6f\xf5\x68\xda\xe3\x60\x27\xb3\xb0\
+\xe8\x3a\x16\x93\x61\x65\xa7\x45\x1a\x6a\x2d\x0d\xac\x50\x4b\x21\
+\x78\x13\xd9\x8d\xde\xe0\xf3\x10\x7b\xb6\x33\x8c\xf6\xae\x47\x2a\
+\xe8\xd7\x17\xd2\xdc\x34\x3c\x44\xf3\xdc\xc8\xd2\x95\x7b\xb8\x6d\
+\xf2\x58\x92\x76\x01\x9b\xbf\x95\x75\xce\x29\x37\xd6\xbc\x1d\xac\
+\xc3\xa7\x5a\x89\xaf\x6f\x15\xc4\x51\xb3\x73\x37\x82\x01\xe6\x62\
+\x18\xf6\x8a\x32\x71\xfd\x21\xe7\x5f\x3b\x45\x3e\xa7\x79\x07\x32\
+\x38\xb3\xb2\xe8\x64\x70\x22\x43\xf0\x55\xc7\x31\xf7\x75\xa5\x63\
+\xe7\x6c\x65\xf8\x45\xbd\xae\xf4\x7b\x2e\x5e\x7b\x30\xaf\xd0\x47\
+\x2d\xd4\xd7\x32\x37\x90\xe5\xca\x0f\xaa\xe2\x8e\x8f\x8c\xf5\x6d\
+\x44\xc3\xc3\xda\x3d\xf4\x1a\x6a\x04\x93\x90\x49\x32\xc5\x15\xba\
+\xe0\xb3\x73\x38\xc2\x86\x38\x3e\xaa\xf7\xeb\x93\xd3\x9e\xf3\xc5\
+\x6c\x0a\xda\x17\x79\x0e\xcd\x71\x20\xc3\x7f\xaa\xa3\x65\x1f\x53\
+\xef\xed\x4c\x6c\xb4\xb7\xb3\xd2\xe1\xd6\xef\xe1\x02\xc1\x9d\x92\
+\xd5\x4e\x08\xb8\x95\x7a\xae\x3b\x2a\xec\x49\x3f\x01\xd7\x66\xf4\
+\x7b\x01\x57\xa2\xdb\xe9\x4c\x8d\x13\x49\xd0\xb8\x7a\xce\x79\x49\
+\x3a\x74\x53\x5c\x39\x50\x1c\xf3\x92\xe4\x13\x93\xd4\x9e\xdd\x87\
+\x5d\xeb\x99\xc5\x0a\x47\x92\x8a\x01\x3d\x4f\x52\x7e\x74\x4d\xd5\
+\xc4\xd7\x77\x32\xdc\x5c\xc8\xd2\xcd\x23\x16\x77\x63\x92\x49\xa8\
+\xa9\x91\x0a\x50\xba\xbd\x9e\x1a\xca\xf6\xb2\x8c\x03\xa8\xcc\xc0\
+\x02\x4e\x06\x37\x24\xd2\xf7\xbe\x49\x32\x2d\x51\xee\x18\x75\x31\
+\xfb\x23\xfd\x63\xb7\xd3\x35\xe8\xb3\x47\xc3\x5d\xb3\x5c\x38\xec\
+\xe7\xd5\x07\xdc\xa3\x6f\xba\xa7\x3b\x0c\x6d\x5a\x44\x8d\xc3\x60\
+\x0d\x15\xcc\xa3\xf3\xf3\x08\x97\xf5\x21\xeb\xf3\x63\xfb\x80\xaf\
+\x12\xde\x18\x01\xf0\xa3\x0a\x4f\x56\xea\x4f\xc4\x9d\xcd\x18\xe6\
+\x86\x91\x87\x6a\x62\x40\x36\x74\xcf\x46\xbc\x5d\x6d\x71\x6e\xdc\
+\x31\xc4\x49\x25\xcd\xbd\xe3\x2c\x50\x4a\xce\x7d\x53\xd1\x53\xcc\
+\x75\xd8\xe6\xb4\xd7\x78\x4f\x51\x02\xdb\x4c\xe1\xcb\x5b\x57\xb7\
+\x8e\xf9\x8c\x8e\xf1\x04\x96\x26\x2a\x17\x12\x13\xbf\x87\x8e\x60\
+\x71\xb5\x72\xd6\x62\x0e\x41\xc1\x1b\x82\x3b\x55\xd7\x85\xb8\xca\
+\x41\x6d\x0e\x9d\xaa\x4e\xc7\xc1\x20\xdb\x4e\xee\x41\x5d\xfd\x82\
+\xd9\xdb\xdc\x4e\xdd\x8e\x36\x21\x9d\x2d\x72\x80\xdf\xb2\x91\xab\
+\xda\x8b\x5b\x87\xf0\x88\x68\x4b\x32\xa9\x56\xe6\x00\x83\x82\xb9\
+\xef\x8f\xbc\x60\xf7\xa7\x3a\xd9\xf0\x34\x0d\x16\xc2\xda\xce\x38\
+\xaf\x2e\x2d\xcb\xcc\x61\x53\xcf\x20\x2c\x70\x5b\xcd\x88\xe5\xf8\
+\x0f\x8d\x74\x3b\x8d\x33\x40\xd4\xe5\x12\xea\x71\x2c\xb6\xf3\x30\
+\x69\x1e\xc8\x32\x4f\xcd\xd7\xd6\x8c\x8c\x36\x06\x7d\x61\xbe\xf8\
+\xdf\xad\x22\xe3\x3e\x1c\x63\xa7\xbe\xa3\x67\xa8\x3c\xda\x6c\xb3\
+\x3b\x35\xcc\x16\xc5\xc6\x18\x02\x03\x95\x24\xa8\x18\xc6\x08\x03\
+\xa6\xdd\xe8\xd3\x40\x34\x73\xb4\x74\xd3\x9c\x3a\x32\xcb\x7a\xa7\
+\x20\x8d\xd2\x23\xe7\xe4\xcd\xf7\x0f\x7d\x3a\xb0\xb8\x6d\x46\x28\
+\xda\x09\x8c\x3a\x84\x52\xf8\xd6\xb3\x73\x60\xc5\x31\x39\x31\x92\
+\x7f\x41\xce\xea\x7a\x06\xc8\xef\x4a\x05\x85\x89\x3f\xf7\x92\xb0\
+\xfe\x8a\x01\xff\x00\xb9\x85\x49\x6d\x1d\xbd\x9c\xc6\x44\x75\x94\
+\x60\xa9\x56\xb9\x8d\x55\xc7\x91\x03\x3b\x53\x34\x2f\x63\x98\x34\
+\x45\xd5\x85\xfe\xb9\xa7\x78\x16\xb2\xd8\x44\xd2\xdd\x69\xef\xea\
+\xba\x4f\xd0\x08\xd7\x1b\xa9\x3e\xb0\x1d\xb0\x57\xcb\x28\x38\x53\
+\x50\xd4\x74\x7d\x5e\x0d\x4f\x4d\x8d\x5c\xc2\x7d\x63\x2a\x83\x19\
+\x07\xa8\x62\xdb\x7c\x0f\x63\xbd\x5e\xf4\xbb\xd7\x64\xb6\xbd\xd1\
+\xa4\xb3\x8b\x56\x38\x79\x16\x52\x64\x33\xc4\x3d\x50\xaf\xd7\x3f\
+\xa5\xeb\x01\xe4\x4e\xe3\x34\xcb\x8e\xb8\x06\x2d\x6a\xde\x2e\x22\
+\xe1\x79\x9a\xea\xcd\x94\x1b\xbb\x05\x6c\x18\x1f\xf4\x8a\x73\x60\
+\x04\xce\x72\x7a\x0e\xa3\x23\xa6\x3a\xb5\xc3\x3c\xd6\xf9\x40\x9a\
+\x8e\x93\x63\xaf\xae\x9b\xad\x0e\x5b\xd8\x20\x55\x8a\x28\x21\x45\
+\x45\x91\x53\x73\x0b\x72\x8d\xd8\x6e\x76\x1e\xb0\xce\xf9\xc0\x35\
+\x0e\x26\x5b\x5e\x1c\xd7\xb5\x27\x82\x28\x57\x50\x92\x66\x6b\x78\
+\x63\x1f\x9b\xb2\x8d\xb7\x5d\x8f\xe9\xe0\x8c\x0e\xd4\xe7\x84\x78\
+\x9e\xcf\x86\xe6\xb8\x8b\xc6\x6b\x8b\x79\x42\xc5\x34\xd0\x92\xb1\
+\x5b\x92\x48\x1e\x08\x3b\x92\x07\x31\x2e\x77\x38\xd8\x77\x24\x7a\
+\x46\xe1\xe8\xf4\x9d\x54\x6b\xba\x91\x13\x43\x1c\x28\xf2\x44\xa3\
+\x3f\x69\x93\x03\x93\x18\xce\x41\xca\x96\x23\x60\x01\xf3\xac\xae\
+\x1e\x99\xe7\xca\xda\x29\xd8\x36\x51\xd9\x59\x3f\xad\x75\x70\xeb\
+\x7b\x79\xcd\xb9\x0a\x07\x32\x21\xf9\x65\x8f\xfa\x43\xca\x96\xf1\
+\x53\xc9\xf9\x62\x54\xb8\xe5\x0f\x04\x71\xc4\xd8\x3b\x02\xa8\xa0\
+\xfd\xf9\x35\xee\x91\x35\xc5\xfe\xa5\x7b\x7f\x76\xa4\x10\x8d\x24\
+\x8f\x2f\x56\x24\xef\xb0\xf3\x1c\xdb\x66\x82\xd7\xe3\x5b\x8d\x72\
+\xf6\x69\x89\x95\xcc\xcd\x9e\x63\xb0\x23\x6d\x87\x4a\x6a\xef\xc0\
+\xb7\xdb\x91\x70\x9b\xc5\x60\x96\xd1\xbc\xce\x4e\x07\x20\xd8\x9f\
+\x8d\x76\xbe\x02\xe1\x59\x34\xbb\x7b\x3b\xff\x00\xb6\x5a\x4d\x30\
+\x44\xb8\x3f\x67\x0d\x20\x81\x8e\x76\x7c\x81\xb8\x20\x13\xee\x8c\
+\xfe\xb5\x54\x78\x33\x85\xe5\x9e\x3f\xb7\xdd\x94\x81\x79\x39\xa0\
+\x12\x02\x4b\x03\xb0\x65\x51\xbb\x67\xa0\xfc\x47\x51\xf4\x26\x83\
+\xa5\x1b\x4d\x1e\x3b\x44\x44\xb3\x9b\xc3\x1e\x33\xb3\x73\x08\xce\
+\x37\x2d\x9e\xa4\x7b\x47\xa0\xc8\xed\xbe\x15\x96\xfc\x6c\x66\x39\
+\xf2\x50\xbd\x31\xeb\x76\xfa\x27\x0a\xfe\x4d\xb4\x8d\x5a\xf2\xfe\
+\x6e\x52\xf3\x0e\x76\x11\x2f\x29\x6e\xbe\xf1\x1a\xef\xd4\xab\x57\
+\x02\xb8\x9a\x5b\x87\xe7\x9e\x46\x76\xe8\x0b\x1e\x83\xc8\x79\x0a\
+\xb8\xfa\x49\xd5\xed\xf8\xa7\x8b\x55\x34\x1b\x79\xe5\x86\x08\xc5\
+\xa4\x44\x31\x76\xb8\xe5\x63\xf9\xc0\xbd\xb3\x9e\x9f\x33\xbd\x68\
+\xfa\x2e\x9b\xc2\xb1\x78\xbc\x4c\x52\xf7\x58\x23\x31\xe8\xf1\x3e\
+\x56\x23\xd8\xdc\x38\xe9\xfd\x5a\xee\x7b\x91\x4d\xc6\x94\x4a\xf6\
+\x2e\xdb\xaa\xfd\x08\xf4\xfd\x1e\x32\xb3\x4b\xad\x4f\x2e\x99\x6e\
+\x20\x67\x85\xde\x02\xc6\x69\x39\x72\x88\xab\xb1\xc1\xdb\xd6\xe8\
+\x07\xc6\x94\x64\xf2\x80\x49\xc0\xed\xe5\x4c\x75\xbd\x5e\xfb\x5c\
+\xbe\x37\x7a\x9d\xc3\x4d\x37\x28\x45\xce\xcb\x1a\x0e\x88\xa3\xa0\
+\x51\xd8\x0a\x5c\x45\x39\x27\xe4\x53\x6b\xc1\xe1\xaf\x0d\x7b\xd0\
+\x57\x87\xdd\x44\x09\xa9\xac\xaf\x0f\x5a\xca\xc9\xe3\xed\x3f\xe4\
+\xce\x8c\x3f\xc9\x76\x78\xfe\xa8\x54\x52\x70\xc6\x8f\x83\xfd\xca\
+\xb3\xfe\xc8\x55\x9b\xc3\xad\x5e\x3d\xba\x57\x31\xd6\xcd\xee\xd1\
+\x53\x6e\x18\xd1\xfb\xe9\x76\x7f\xd9\x0a\x1a\x6e\x19\xd1\x87\xf9\
+\x2a\xcf\xfb\x21\x56\xc9\x53\x1d\x05\x03\x3c\x79\xcf\x35\x65\x65\
+\x7b\xee\x12\x49\xf8\x2a\x17\x1c\x3b\xa3\xee\x17\x4b\xb3\xfe\xc8\
+\x50\x12\xf0\xde\x95\xcc\x3f\xb9\xb6\x80\x67\x7f\xcd\x0a\xb6\xdc\
+\x00\xa0\xf2\x8a\x53\x71\x9e\x71\xf1\xaa\xf0\xdb\x6d\x03\x92\x27\
+\xa5\xf0\x6f\xa5\x18\xb4\xc8\x8c\x16\xf6\xd0\xfd\x98\x82\xa6\x22\
+\xbb\x60\xf5\x03\xca\x9f\xe9\x6d\x60\xce\xe6\xdb\x91\x64\x9f\x67\
+\x8a\x40\x01\x38\xe8\x0b\x0f\x6b\xe3\xd6\xab\xe0\x56\x56\xea\xf0\
+\xcd\x1a\x89\xc8\xd0\xde\xef\x81\x74\x2b\xa6\x92\x49\xf4\x1b\x66\
+\x97\x3e\xb1\x8e\x35\x0e\x0f\xe0\x7e\x7f\x5a\x54\x7d\x1c\xe9\x4e\
+\x01\x8f\x4d\xb1\x40\x4e\x31\x3c\x22\x32\x3f\x75\x19\x6b\xaa\x5d\
+\x41\x1f\x20\x75\x75\xe6\x0d\xf9\xc1\xcc\x47\xce\x98\x43\xac\xc3\
+\x33\x20\xbf\x8e\x47\x40\xd9\x20\x10\xcb\xf4\x23\x6f\xad\x23\xa3\
+\x24\x76\x0f\x71\x5d\xc4\xf3\xf0\xb6\x8d\xa4\xdd\x09\x06\x9b\x6c\
+\x2e\x14\x05\x47\x58\xc2\x00\x00\xc0\x01\xbc\xbe\x14\xdb\x48\xbc\
+\x82\xd9\xcb\xa4\x56\xb0\x63\xda\x58\xd7\x01\xc1\xf3\xc7\x96\x7e\
+\x1b\xf6\xa6\x56\x97\xfa\x66\x19\x16\xed\xa2\x89\x86\x39\x24\x88\
+\x95\xfd\xf5\x28\xb1\xd2\x2e\x0f\x3c\x52\xda\x96\xf7\x4b\xe1\xe7\
+\xdd\x8f\xf9\x50\x3a\x5a\xd5\xa0\x92\xff\x00\x4b\x11\xdf\xfa\x3e\
+\xe1\xad\x4d\x04\xb6\xfa\x75\x82\x09\x5f\x9e\x65\x11\x0c\x12\x7f\
+\x4b\xf1\xa3\x53\x86\x74\xd9\x34\xe8\x34\x49\xb4\xab\x6e\x4b\x2e\
+\x63\x62\x24\x4e\x65\xe5\xc6\x08\xc9\xec\x41\x3b\x7f\x0a\xb0\x5a\
+\xda\x5a\xc4\x8a\xd6\xf3\x25\xbb\xf4\xe5\xf1\x43\x28\xfb\xf7\xa3\
+\x92\x48\xa2\x0c\x6e\x6e\x62\x1c\x98\xc9\xe6\x00\x0f\x2f\x85\x4f\
+\x59\x1f\x65\xe0\x6a\x84\x73\xee\x20\xe1\x9d\x2a\xee\xee\x4b\x89\
+\x34\xcb\x70\xf7\xcc\xab\x27\x8b\x10\xe6\xf5\x00\x5c\x10\x06\xfd\
+\x3e\x86\x84\xb5\xe0\x5e\x1f\xfb\x4f\x8b\x3e\x87\x64\xd2\xbb\x96\
+\x55\x92\x10\x58\x9c\xe7\x25\x7b\x0f\x8d\x5f\xee\xb5\x3d\x1c\x9f\
+\x5a\xea\x12\xe0\xe5\x5b\x05\xb9\x4f\x9d\x57\x35\x6e\x34\xd3\xf4\
+\x99\xfe\xc9\xa5\xda\x3e\xa5\xa9\xc8\xb9\x0a\xa4\x20\x61\xfa\xcc\
+\x71\xea\xaf\xbf\xe9\x9a\x6c\xe4\xbe\x9d\x29\x01\xc4\xef\x7b\x1a\
+\x69\x7c\x33\x65\x04\xe2\xed\x2d\x20\x37\x20\xe1\x64\x29\xd0\x01\
+\x8c\x0f\x21\x8d\xa8\x2e\x28\xb0\xb6\xb8\xb7\x68\xb5\x19\xa2\x8e\
+\x16\x1c\x8f\x00\x19\x69\x17\xbe\x71\xe7\xe5\xe5\xde\x80\xbc\xe2\
+\x5d\x4a\xe9\x4a\xf3\xad\xba\x9e\xa9\x0f\x6f\x77\x37\x5f\xc2\x94\
+\x12\x59\x8b\x31\x25\x8f\x52\x4e\x49\xa6\x63\xfa\x7a\x6f\xaa\xd8\
+\x35\x96\x52\xd4\x90\xda\xe9\xda\x3e\x99\xcc\xba\x2e\x93\x6b\x66\
+\x58\x61\xa6\x48\xc0\x91\x87\xc7\xb7\xca\x94\x37\x09\xf0\xfb\x31\
+\x2d\xa3\xd8\x92\x4e\x49\x31\x0c\x9a\x79\x8a\xce\xd5\x5a\x94\x89\
+\xdb\xd8\x88\xf0\x97\x0f\x7f\xe4\xd6\x3f\xd9\x0a\xd5\xf8\x4b\x87\
+\xf9\x0e\x34\x5b\x1c\xff\x00\x54\x29\xfe\x37\xae\x67\x7f\xe9\x3e\
+\xda\x2e\x28\x9f\x4b\x84\xc0\x62\x59\x85\xb4\x72\x67\xd6\x69\x33\
+\x86\xcf\x60\xb9\xdb\x27\xe5\x9e\xc1\x97\x24\xe3\x5b\xa3\x31\x8d\
+\xdf\x62\xe7\x63\xc1\xfc\x31\x24\xcf\x2c\xfa\x25\xa8\x85\x21\x3f\
+\xe0\x89\x05\xf0\x77\xc0\x15\x4b\xe0\xdd\x03\x43\xbe\xd4\xb5\x4f\
+\x1b\x4f\x86\x71\x0c\xc4\x05\x68\xfd\x5e\x4e\xc4\x02\x06\x37\xab\
+\x2c\x9c\x67\xf9\x16\xcb\xf2\x82\xc0\xd7\xb3\x67\xc1\x44\x47\x11\
+\xa0\x90\xf4\x1c\xc4\x6f\x8f\x20\x09\x27\xb5\x50\x61\xe3\x4d\x5c\
+\x6a\x97\x56\x7a\x3d\x94\xad\xab\x4e\xe5\xa4\x67\x88\xb3\x29\x3d\
+\x95\x7c\x87\x9b\x7d\x05\x6b\xab\x33\x55\xb1\xf3\x89\xb9\xd1\xd0\
+\x35\x4e\x1f\xe1\x1d\x32\xdb\xed\x3a\x96\x9b\xa5\xda\x41\x8f\x6a\
+\x48\xc0\xc9\xf2\x51\xd4\xfc\x05\x65\x55\xb4\xce\x00\xd4\x35\x9b\
+\x91\x7f\xc5\xd7\xf3\x3c\x8d\xfe\x09\x5f\x99\xc8\xf2\x2d\xd0\x0f\
+\x70\xac\xaa\x55\x7d\x45\x2d\xca\x49\x7e\xc1\xe9\xc3\x3c\x37\xb3\
+\xe8\xc1\xea\xf4\x35\xbf\x38\x03\x71\x59\x59\x5c\x92\xcb\x50\xf8\
+\x66\xde\xe5\x03\x4a\x41\xce\x31\x40\xcf\x59\x59\x54\xe3\xae\xae\
+\x59\x99\x42\xab\xc3\xb1\xeb\x49\x2e\x0f\xe7\x17\xaf\x51\x59\x59\
+\x57\xfd\x3f\x74\x7b\x22\xfb\x59\x2d\x65\x65\x65\x74\x66\x80\xf7\
+\x15\xbc\x31\x49\x34\x81\x22\x46\x77\x3d\x15\x46\x49\xac\xac\xa1\
+\xb7\xa4\xd9\x95\xcb\xd0\xda\xdf\x86\xb5\x39\x97\x3e\x00\x8c\x7f\
+\xea\x30\x06\xbd\xb8\xe1\xbd\x4a\x15\xc9\x85\x1c\x7f\x45\xc1\x35\
+\x95\x95\xac\x7f\x59\x93\x7e\x0a\xfe\x09\xd0\xa2\x58\x9a\x27\x29\
+\x2a\x14\x71\xd5\x58\x60\xd6\xbb\xd6\x56\x56\xca\x5e\xd2\x64\x8f\
+\xbe\x85\x17\x37\xf3\xde\x4f\x25\x9e\x8e\x54\xba\x1e\x59\xae\xd8\
+\x66\x38\x4f\x70\x07\xe9\x3f\xbb\xa0\xef\xe4\x4c\xd3\x74\xf8\x34\
+\xf8\x99\x61\x0c\xd2\x48\x79\xa5\x96\x43\xcc\xf2\xb7\x9b\x1e\xff\
+\x00\x80\xed\x59\x59\x58\x8e\x7e\xe6\x15\x71\xc2\x0c\xac\xac\xac\
+\xa3\x00\xca\xca\xca\xca\xf1\xe0\x5d\x42\xfa\x0d\x3e\xdf\xc6\xb9\
+\x7e\x55\xc8\x55\x50\x32\xce\xc7\xa2\xa8\x1b\x92\x7c\x85\x52\x6f\
+\x7d\x1d\xe9\x5c\x43\xa9\xa6\xa9\xab\xd8\x47\x64\x43\x73\x2d\xad\
+\xb6\x10\xb8\xce\x49\x99\x87\x56\x3e\xee\x9e\x66\xb2\xb2\x95\x52\
+\xad\xea\x86\x26\xe5\x6d\x17\x0b\xad\x2a\xd2\xe3\x4f\x7b\x26\x89\
+\x52\xd9\x97\x97\x91\x40\xc0\xf7\x8f\x23\xef\xeb\x4b\x38\x33\x85\
+\x2c\xf8\x56\xda\xee\x3b\x57\x69\xa5\xb9\x93\x9e\x49\x64\x1b\xe3\
+\xb2\xfc\x3f\x1c\xd6\x56\x51\x3c\x73\xbd\xe8\x1e\xa6\x96\xb6\x58\
+\x80\xac\xac\xac\xa3\x04\xff\xd9\
 "
 
 qt_resource_name = b"\
@@ -11380,39 +2291,29 @@ qt_resource_name = b"\
 \x07\x03\x7d\xc3\
 \x00\x69\
 \x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
-\x00\x0a\
-\x0c\xf7\x1b\xc7\
-\x00\x63\
-\x00\x6f\x00\x6e\x00\x66\x00\x69\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0a\x61\x5a\xa7\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x0f\
 \x00\x6d\xeb\xa7\
 \x00\x6c\
 \x00\x6f\x00\x67\x00\x6f\x00\x5f\x00\x6d\x00\x65\x00\x67\x00\x65\x00\x76\x00\x65\x00\x2e\x00\x6a\x00\x70\x00\x67\
-\x00\x0d\
-\x0c\x10\xfb\x27\
-\x00\x6c\
-\x00\x6f\x00\x67\x00\x6f\x00\x5f\x00\x66\x00\x64\x00\x65\x00\x61\x00\x2e\x00\x6a\x00\x70\x00\x67\
 \x00\x11\
 \x07\xd5\x6e\x87\
 \x00\x6c\
 \x00\x6f\x00\x67\x00\x6f\x00\x5f\x00\x6f\x00\x73\x00\x6c\x00\x61\x00\x6e\x00\x64\x00\x69\x00\x61\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \
+\x00\x0d\
+\x0c\x10\xfb\x27\
+\x00\x6c\
+\x00\x6f\x00\x67\x00\x6f\x00\x5f\x00\x66\x00\x64\x00\x65\x00\x61\x00\x2e\x00\x6a\x00\x70\x00\x67\
 "
 
 qt_resource_struct_v1 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x03\x00\x00\x00\x03\
-\x00\x00\x00\x22\x00\x02\x00\x00\x00\x03\x00\x00\x00\x06\
-\x00\x00\x00\x4e\x00\x00\x00\x00\x00\x01\x00\x01\x1a\xf1\
+\x00\x00\x00\x14\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
+\x00\x00\x00\x22\x00\x02\x00\x00\x00\x03\x00\x00\x00\x04\
 \x00\x00\x00\x34\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x64\x00\x00\x00\x00\x00\x01\x00\x02\x37\xc9\
-\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x02\xa7\x14\
-\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x02\x79\xa7\
+\x00\x00\x00\x58\x00\x00\x00\x00\x00\x01\x00\x00\x41\xde\
+\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x5f\xda\
 "
 
 qt_resource_struct_v2 = b"\
@@ -11420,20 +2321,16 @@ qt_resource_struct_v2 = b"\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x03\x00\x00\x00\x03\
+\x00\x00\x00\x14\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x22\x00\x02\x00\x00\x00\x03\x00\x00\x00\x06\
+\x00\x00\x00\x22\x00\x02\x00\x00\x00\x03\x00\x00\x00\x04\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x4e\x00\x00\x00\x00\x00\x01\x00\x01\x1a\xf1\
-\x00\x00\x01\x70\xbf\x85\xb2\xe5\
 \x00\x00\x00\x34\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x70\xbf\x85\xb2\xd0\
-\x00\x00\x00\x64\x00\x00\x00\x00\x00\x01\x00\x02\x37\xc9\
-\x00\x00\x01\x70\xbf\x85\xb2\xe6\
-\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x02\xa7\x14\
-\x00\x00\x01\x70\xbf\x85\xb2\xe6\
-\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x02\x79\xa7\
-\x00\x00\x01\x70\xbf\x85\xb2\xe5\
+\x00\x00\x01\x70\xce\x1a\x0a\x50\
+\x00\x00\x00\x58\x00\x00\x00\x00\x00\x01\x00\x00\x41\xde\
+\x00\x00\x01\x70\xce\x1a\x0a\x50\
+\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x5f\xda\
+\x00\x00\x01\x70\xce\x1a\x0a\x50\
 "
 
 qt_version = [int(v) for v in QtCore.qVersion().split('.')]
@@ -0,0 +1,450 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+ Mesures de performance du plugin DICT.
+
+ Usage : python scripts/benchmark.py [xml]
+
+ Les mesures qui n'ont besoin que de Python sont lancées sans QGIS. Les
+ classes des .ui ne sont mesurées que si PyQt5 est installé, le chargement
+ du plugin que si les modules qgis sont trouvés.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from xml.dom import minidom
+
+PLUGIN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def module(nom):
+    """Charge un module du plugin sans importer le paquet (ni QGIS)."""
+    spec = importlib.util.spec_from_file_location(
+        nom, os.path.join(PLUGIN, nom + '.py'))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def mesure(fonction, *args, repetitions=3):
+    """Meilleur temps (s) et pic mémoire (Mo) de fonction(*args)."""
+    temps = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction(*args)
+        temps.append(time.perf_counter() - debut)
+
+    tracemalloc.start()
+    fonction(*args)
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(temps), pic / 1024. / 1024.
+
+
+def affiche(titre, resultats):
+    print(titre)
+    reference = resultats[0][1]
+    for nom, (duree, memoire) in resultats:
+        print("  {:<28} {:9.1f} ms {:9.1f} Mo  x{:.1f}".format(
+            nom, duree * 1000., memoire, reference[0] / duree))
+
+
+#
+# Lecture des XML
+#
+def xmlSynthetique(nbSommets, nbPolygones=1, tailleAnnexe=0):
+    """Écrit une DICT du téléservice 2.2 avec une grande emprise."""
+    fd, chemin = tempfile.mkstemp(suffix='.xml')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<rc:dossierConsultation '
+                'xmlns:rc="http://www.reseaux-et-canalisations.gouv.fr/'
+                'schema-teleservice/2.2" '
+                'xmlns:gml="http://www.opengis.net/gml/3.2">\n'
+                ' <rc:DICT>\n'
+                '  <rc:noConsultationDuTeleservice>2020031200001T'
+                '</rc:noConsultationDuTeleservice>\n'
+                '  <rc:noAffaireDeLexecutantDesTravaux>AFF-1'
+                '</rc:noAffaireDeLexecutantDesTravaux>\n'
+                '  <rc:nomDeLaPersonneAContacter>Jean Dupont'
+                '</rc:nomDeLaPersonneAContacter>\n'
+                '  <rc:dateDeLaDeclaration>2020-03-12T10:00:00'
+                '</rc:dateDeLaDeclaration>\n'
+                '  <rc:communePrincipale>Megève</rc:communePrincipale>\n'
+                '  <rc:adresse>Route nationale</rc:adresse>\n'
+                '  <rc:executantDesTravaux>\n'
+                '   <rc:denomination>Entreprise</rc:denomination>\n'
+                '   <rc:numero>1</rc:numero><rc:voie>rue Haute</rc:voie>\n'
+                '   <rc:codePostal>74120</rc:codePostal>\n'
+                '   <rc:commune>Megève</rc:commune>\n'
+                '   <rc:pays>France</rc:pays>\n'
+                '  </rc:executantDesTravaux>\n'
+                '  <rc:modeReceptionElectronique>\n'
+                '   <rc:tailleDesPlans>A3</rc:tailleDesPlans>\n'
+                '  </rc:modeReceptionElectronique>\n'
+                '  <rc:emprise>\n'
+                '   <rc:geometrie srsName="urn:ogc:def:crs:EPSG::2154">\n')
+        for p in range(nbPolygones):
+            f.write('    <gml:Polygon><gml:exterior><gml:LinearRing>'
+                    '<gml:posList>')
+            x0 = 950000. + p * 1000.
+            f.write(' '.join('{:.2f} {:.2f}'.format(x0 + i * 0.01,
+                                                    6540000. + (i % 7))
+                             for i in range(nbSommets)))
+            f.write('</gml:posList></gml:LinearRing></gml:exterior>'
+                    '</gml:Polygon>\n')
+        f.write('   </rc:geometrie>\n  </rc:emprise>\n')
+        if tailleAnnexe:
+            f.write('  <rc:pieceJointe>' + 'QUJD' * (tailleAnnexe // 4) +
+                    '</rc:pieceJointe>\n')
+        f.write(' </rc:DICT>\n</rc:dossierConsultation>\n')
+    return chemin
+
+
+def lectureMinidom(chemin):
+    """Lecture historique : DOM complet puis getElementsByTagName."""
+    doc = minidom.parse(chemin)
+
+    def premier(noeud, nom):
+        try:
+            return noeud[0].getElementsByTagName(
+                'rc:' + nom)[0].firstChild.nodeValue
+        except Exception:
+            return ""
+
+    recep = doc.getElementsByTagName('rc:modeReceptionElectronique')
+    premier(recep, 'tailleDesPlans')
+    for typed in ('dtDictConjointes', 'DT', 'DICT'):
+        if doc.getElementsByTagName('rc:' + typed):
+            break
+    dest = doc.getElementsByTagName('rc:' + typed)
+    for nom in ('noConsultationDuTeleservice', 'noAffaireDeLexecutantDesTravaux',
+                'nomDeLaPersonneAContacter', 'dateDeLaDeclaration',
+                'communePrincipale', 'adresse'):
+        premier(dest, nom)
+    dest = doc.getElementsByTagName('rc:executantDesTravaux')
+    for nom in ('denomination', 'complementService', 'numero', 'voie',
+                'lieuDitBP', 'codePostal', 'commune', 'pays'):
+        premier(dest, nom)
+    doc.getElementsByTagName('rc:geometrie')[0].attributes['srsName']
+    if not doc.getElementsByTagName('gml:coordinates'):
+        doc.getElementsByTagName('gml:posList')[0].firstChild.nodeValue
+    doc.unlink()
+
+
+def benchLecture(chemins):
+    lecture = module('DICT_lecture')
+    for chemin in chemins:
+        taille = os.path.getsize(chemin) / 1024. / 1024.
+        affiche("Lecture XML {} ({:.1f} Mo)".format(
+                    os.path.basename(chemin), taille),
+                [('minidom', mesure(lectureMinidom, chemin)),
+                 ('iterparse (DICT_lecture)',
+                  mesure(lecture.DICT_lecture, chemin))])
+
+
+#
+# Coordonnées de l'emprise
+#
+def ancienneConversion(texte):
+    """Conversion historique d'un posList en WKT (boucle par caractère)."""
+    s = ""
+    count = 0
+    for i in texte:
+        if i == ' ':
+            if count % 2 == 0:
+                s += ','
+            else:
+                s += ' '
+            count += 1
+        else:
+            s += i
+    s = s.replace(' ', '*')
+    s = s.replace(',', ' ')
+    s = s.replace('*', ',')
+    return "POLYGON ((" + s + "))"
+
+
+def benchCoordonnees():
+    lecture = module('DICT_lecture')
+    try:
+        from qgis.core import QgsGeometry, QgsLineString, QgsPolygon
+        qgis = True
+    except ImportError:
+        qgis = False
+
+    def geometrieWkt(texte):
+        return QgsGeometry.fromWkt(ancienneConversion(texte))
+
+    def geometrieDirecte(texte):
+        polygone = QgsPolygon()
+        polygone.setExteriorRing(QgsLineString(*lecture.coordonnees(texte)))
+        return QgsGeometry(polygone)
+
+    for nb in (10000, 100000):
+        texte = ' '.join('{:.2f} {:.2f}'.format(950000. + i * 0.01,
+                                                6540000. + (i % 7))
+                         for i in range(nb))
+        resultats = [('boucle + WKT (texte)', mesure(ancienneConversion,
+                                                     texte)),
+                     ('découpage ({})'.format(
+                         'NumPy' if lecture.NUMPY else 'Python'),
+                      mesure(lecture.coordonnees, texte))]
+        if qgis:
+            resultats += [('boucle + WKT (QgsGeometry)',
+                           mesure(geometrieWkt, texte)),
+                          ('découpage + QgsLineString',
+                           mesure(geometrieDirecte, texte))]
+        affiche("Coordonnées posList ({} sommets)".format(nb), resultats)
+
+
+#
+# Remplissage du modèle QPT du récépissé
+#
+def remplacementsEnChaine(texte, remplacements):
+    """Remplissage historique : un str.replace par champ du formulaire."""
+    for ancien, nouveau in remplacements:
+        texte = texte.replace(ancien, nouveau)
+    return texte
+
+
+def benchSubstitution():
+    substitution = module('DICT_substitution')
+    with open(os.path.join(PLUGIN, 'formulaire_pdf', 'Formulaire_DICT.qpt'),
+              encoding='utf-8') as f:
+        modele = f.read()
+    noms = substitution.JETON.findall(modele)
+    # Champs du formulaire : ceux du modèle et les widgets sans label
+    remplacements = [(nom, 'valeur ' + nom) for nom in noms]
+    remplacements += [('Widget{}'.format(i), '') for i in range(60)]
+    valeurs = dict(remplacements)
+    ancien = substitution.JETON.sub(r'\1', modele)
+
+    def compilation():
+        return substitution.Gabarit(modele)
+
+    gabarit = compilation()
+    affiche("Modèle QPT ({} champs, {} remplacements)".format(
+                len(noms), len(remplacements)),
+            [('str.replace en chaîne',
+              mesure(remplacementsEnChaine, ancien, remplacements)),
+             ('Gabarit.rend', mesure(gabarit.rend, valeurs)),
+             ('compilation du Gabarit', mesure(compilation))])
+
+
+#
+# Remplissage direct du CERFA (DICT_pdf)
+#
+def benchFormulaire():
+    pdf = module('DICT_pdf')
+    modele = os.path.join(PLUGIN, 'formulaire_pdf', 'cerfa_14435-04.pdf')
+    formulaire = pdf.FormulairePDF(modele)
+    valeurs = [(nom, 0, '12') for nom in formulaire.champs
+               if formulaire.champs[nom][1]][:60]
+    fd, sortie = tempfile.mkstemp(suffix='.pdf')
+    os.close(fd)
+    try:
+        affiche("Remplissage du CERFA ({} champs)".format(len(valeurs)),
+                [('analyse du modèle', mesure(pdf.FormulairePDF, modele)),
+                 ('remplissage', mesure(formulaire.remplit, valeurs,
+                                        sortie))])
+    finally:
+        os.remove(sortie)
+
+
+#
+# Fusion des PDF (DICT_pdf)
+#
+def planSynthetique(pdf, tailleImage):
+    """Écrit un plan A0 d'une page portant une image de tailleImage."""
+    fd, chemin = tempfile.mkstemp(suffix='.pdf')
+    with os.fdopen(fd, 'wb') as f:
+        ecrivain = pdf.EcrivainPDF(f)
+        ecrivain.brut(b'%PDF-1.6\n')
+        image = pdf.Flux({'Type': pdf.Nom('XObject'),
+                          'Subtype': pdf.Nom('Image'),
+                          'Width': 1024, 'Height': tailleImage // 3072,
+                          'ColorSpace': pdf.Nom('DeviceRGB'),
+                          'BitsPerComponent': 8}, os.urandom(tailleImage))
+        ecrivain.objet(4, image)
+        ecrivain.objet(5, pdf.Flux({}, b'q 3370 0 0 2384 0 0 cm /Im Do Q'))
+        ecrivain.objet(3, {'Type': pdf.Nom('Page'),
+                           'Parent': pdf.Reference(2, 0),
+                           'MediaBox': [0, 0, 3370, 2384],
+                           'Resources': {'XObject': {
+                               'Im': pdf.Reference(4, 0)}},
+                           'Contents': pdf.Reference(5, 0)})
+        ecrivain.objet(2, {'Type': pdf.Nom('Pages'),
+                           'Kids': [pdf.Reference(3, 0)], 'Count': 1})
+        ecrivain.objet(1, {'Type': pdf.Nom('Catalog'),
+                           'Pages': pdf.Reference(2, 0)})
+        ecrivain.references(6, {'Root': pdf.Reference(1, 0)})
+    return chemin
+
+
+def benchFusion():
+    pdf = module('DICT_pdf')
+    recepisse = os.path.join(PLUGIN, 'formulaire_pdf', 'cerfa_14435-04.pdf')
+    plans = [planSynthetique(pdf, 20 * 1024 * 1024) for _ in range(12)]
+    fd, sortie = tempfile.mkstemp(suffix='.pdf')
+    os.close(fd)
+    try:
+        total = sum(os.path.getsize(p) for p in plans) / 1024. / 1024.
+        affiche("Fusion du récépissé et de {} plans A0 ({:.0f} Mo)".format(
+                    len(plans), total),
+                [('DICT_pdf.fusionne', mesure(pdf.fusionne,
+                                              [recepisse] + plans, sortie,
+                                              repetitions=1))])
+    finally:
+        for p in plans + [sortie]:
+            os.remove(p)
+
+
+#
+# Classes des .ui (DICT_ui)
+#
+def benchUi():
+    try:
+        from PyQt5 import uic
+    except ImportError:
+        print("Classes des .ui : PyQt5 absent, mesure ignorée")
+        return
+
+    ui = module('DICT_ui')
+    wizard = os.path.join(PLUGIN, 'DICT_dialog_wizard.ui')
+    ui.loadUiType(wizard)  # écrit le cache s'il manque
+    affiche("Classe de l'assistant ({:.0f} ko)".format(
+                os.path.getsize(wizard) / 1024.),
+            [('uic.loadUiType', mesure(uic.loadUiType, wizard)),
+             ('DICT_ui.loadUiType (cache)', mesure(ui.loadUiType, wizard))])
+
+
+#
+# Ressources Qt (resources.py)
+#
+MESURE_RESSOURCES = """
+import sys, time
+sys.path.insert(0, {plugin!r})
+from PyQt5 import QtCore, QtGui
+
+def rss():
+    with open('/proc/self/status') as f:
+        for ligne in f:
+            if ligne.startswith('VmRSS:'):
+                return int(ligne.split()[1]) / 1024.
+
+avant = rss()
+debut = time.perf_counter()
+{code}
+print(time.perf_counter() - debut, rss() - avant)
+"""
+
+
+def mesureProcessus(code, bytecode=True):
+    """Temps (s) et mémoire résidente ajoutée (Mo) de code, dans un
+    processus neuf."""
+    commande = [sys.executable] + ([] if bytecode else ['-B']) + \
+        ['-c', MESURE_RESSOURCES.format(plugin=PLUGIN, code=code)]
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    if not bytecode:
+        env['PYTHONPYCACHEPREFIX'] = tempfile.mkdtemp()
+    sortie = subprocess.check_output(commande, env=env)
+    duree, memoire = sortie.split()[-2:]
+    return float(duree), float(memoire)
+
+
+def benchRessources():
+    try:
+        import PyQt5.QtGui
+    except ImportError:
+        print("Ressources Qt : PyQt5 absent, mesure ignorée")
+        return
+    if not os.path.exists('/proc/self/status'):
+        print("Ressources Qt : mémoire résidente non mesurable, ignoré")
+        return
+
+    # Les icônes lues dans les fichiers ne coûtent rien au chargement :
+    # QIcon ne décode l'image qu'à l'affichage, comme avec resources.py
+    mesureProcessus("import resources")  # écrit le bytecode
+    print("Ressources Qt évitées au chargement (processus neuf)")
+    for nom, bytecode in (('import de resources.py', True),
+                          ('... sans bytecode', False)):
+        duree, memoire = mesureProcessus("import resources", bytecode)
+        print("  {:<28} {:9.1f} ms {:9.1f} Mo".format(
+            nom, duree * 1000., memoire))
+
+
+#
+# Chargement du plugin dans QGIS
+#
+def benchDemarrage():
+    """Chargement du plugin (classFactory et initGui), puis coût des
+    dialogues qui étaient construits au chargement.
+
+    Les modules ne sont importés qu'une fois par processus : chaque
+    étape n'est mesurée qu'une fois.
+    """
+    try:
+        from qgis.testing import start_app
+        from qgis.testing.mocked import get_iface
+    except ImportError:
+        print("Chargement du plugin : QGIS absent, mesure ignorée")
+        return
+
+    from PyQt5.QtCore import QSettings
+    start_app()
+    QSettings().setValue("DICT/isFirstUse", 0)
+    sys.path.insert(0, os.path.dirname(PLUGIN))
+    nom = os.path.basename(PLUGIN)
+
+    debut = time.perf_counter()
+    paquet = importlib.import_module(nom)
+    plugin = paquet.classFactory(get_iface())
+    plugin.initGui()
+    chargement = time.perf_counter() - debut
+    modules = sorted(m for m in sys.modules if m.startswith(nom + '.'))
+
+    debut = time.perf_counter()
+    importlib.import_module(nom + '.DICT_dialog').DICTDialog()
+    importlib.import_module(nom + '.DICT_dialog_config').DICTDialogConfig()
+    dialogues = time.perf_counter() - debut
+
+    print("Chargement du plugin")
+    print("  {:<28} {:9.1f} ms".format('classFactory et initGui',
+                                       chargement * 1000.))
+    print("  {:<28} {:9.1f} ms".format('dialogues (à l\'usage)',
+                                       dialogues * 1000.))
+    print("  modules chargés : " + ", ".join(modules))
+
+
+def main(argv):
+    if argv:
+        benchLecture(argv)
+        return 0
+
+    chemins = [xmlSynthetique(1000),
+               xmlSynthetique(100000, 10),
+               xmlSynthetique(10000, 1, 20 * 1024 * 1024)]
+    try:
+        benchLecture(chemins)
+    finally:
+        for chemin in chemins:
+            os.remove(chemin)
+    benchCoordonnees()
+    benchSubstitution()
+    benchFormulaire()
+    benchFusion()
+    benchUi()
+    benchRessources()
+    benchDemarrage()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Tests de DICT_archive : écriture et relecture du GeoPackage.
+
+Nécessite QGIS (qgis.testing), le test est ignoré sinon.
+"""
+
+import datetime
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from qgis.core import QgsGeometry, QgsVectorLayer
+    from qgis.testing import start_app
+    QGIS = True
+except ImportError:
+    QGIS = False
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def module(nom):
+    spec = importlib.util.spec_from_file_location(
+        nom, os.path.join(RACINE, nom + '.py'))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@unittest.skipUnless(QGIS, "QGIS n'est pas installé")
+class TestArchive(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        start_app()
+        cls.DICT_archive = module('DICT_archive').DICT_archive
+
+    def setUp(self):
+        self.dossier = tempfile.mkdtemp()
+        self.chemin = os.path.join(self.dossier, 'archive.gpkg')
+
+    def tearDown(self):
+        shutil.rmtree(self.dossier)
+
+    def ajoute(self, archive, noGu, x):
+        geom = QgsGeometry.fromWkt(
+            "MultiPolygon((({0} 6800000, {1} 6800000, {1} 6800100, "
+            "{0} 6800100, {0} 6800000)))".format(x, x + 100))
+        attributs = {'NoGu': noGu, 'Recepisse_DT': True,
+                     'communePrincipale': 'Dijon',
+                     'dateRecep': datetime.datetime(2026, 10, 18)}
+        archive.ajoute(attributs, geom, '2154', noGu + '.xml',
+                       [noGu + '.pdf'])
+
+    def test_deux_declarations(self):
+        archive = self.DICT_archive(self.chemin)
+        self.ajoute(archive, '2026101800001', 850000)
+        self.assertTrue(archive.enregistre())
+
+        # Deuxième session : la couche existe déjà
+        archive = self.DICT_archive(self.chemin)
+        self.ajoute(archive, '2026101800002', 851000)
+        self.assertTrue(archive.enregistre())
+
+        couche = QgsVectorLayer(
+            self.chemin + "|layername=" + self.DICT_archive.COUCHE,
+            'archive', 'ogr')
+        self.assertTrue(couche.isValid())
+        self.assertEqual(couche.crs().authid(), 'EPSG:2154')
+        features = sorted(couche.getFeatures(), key=lambda f: f['NoGu'])
+        self.assertEqual([f['NoGu'] for f in features],
+                         ['2026101800001', '2026101800002'])
+        self.assertEqual(features[1]['sorties'], '2026101800002.pdf')
+        self.assertFalse(features[0].geometry().isEmpty())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Tests du filtre des réseaux sur l'emprise (DICT_geometrie.filtreEmprise).
+
+Nécessite QGIS (qgis.testing), le test est ignoré sinon.
+"""
+
+import importlib
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+try:
+    from qgis.core import (QgsDataSourceUri, QgsFeature, QgsGeometry,
+                           QgsProject, QgsRectangle, QgsVectorFileWriter,
+                           QgsVectorLayer)
+    from qgis.testing import start_app
+    QGIS = True
+except ImportError:
+    QGIS = False
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def module(nom):
+    # DICT_geometrie utilise des imports relatifs : charge l'extension
+    # comme un paquet
+    if 'DICT' not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            'DICT', os.path.join(RACINE, '__init__.py'),
+            submodule_search_locations=[RACINE])
+        paquet = importlib.util.module_from_spec(spec)
+        sys.modules['DICT'] = paquet
+        spec.loader.exec_module(paquet)
+    return importlib.import_module('DICT.' + nom)
+
+
+@unittest.skipUnless(QGIS, "QGIS n'est pas installé")
+class TestFiltre(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        start_app()
+        cls.filtreEmprise = staticmethod(module('DICT_geometrie').filtreEmprise)
+
+    def setUp(self):
+        self.dossier = tempfile.mkdtemp()
+        self.chemin = os.path.join(self.dossier, 'reseaux.sqlite')
+
+        # Une conduite près de l'emprise, une autre à 5 km
+        memoire = QgsVectorLayer("LineString?crs=EPSG:2154", "reseau",
+                                 "memory")
+        for wkt in ("LineString(700000 6800000, 700050 6800000)",
+                    "LineString(705000 6800000, 705050 6800000)"):
+            f = QgsFeature()
+            f.setGeometry(QgsGeometry.fromWkt(wkt))
+            memoire.dataProvider().addFeature(f)
+
+        options = QgsVectorFileWriter.SaveVectorOptions()
+        options.driverName = "SQLite"
+        options.layerName = "reseau"
+        options.datasourceOptions = ["SPATIALITE=YES"]
+        options.layerOptions = ["SPATIAL_INDEX=YES"]
+        erreur = QgsVectorFileWriter.writeAsVectorFormatV2(
+            memoire, self.chemin, QgsProject.instance().transformContext(),
+            options)[0]
+        self.assertEqual(erreur, QgsVectorFileWriter.NoError)
+
+        uri = QgsDataSourceUri()
+        uri.setDatabase(self.chemin)
+        uri.setDataSource('', 'reseau', 'GEOMETRY')
+        self.couche = QgsVectorLayer(uri.uri(), "reseau", "spatialite")
+        self.assertTrue(self.couche.isValid())
+
+    def tearDown(self):
+        del self.couche
+        shutil.rmtree(self.dossier)
+
+    def test_entites_ecartees(self):
+        rect = QgsRectangle(699900, 6799900, 700100, 6800100)
+        filtre = self.filtreEmprise(self.couche, rect)
+        self.assertIsNotNone(filtre)
+
+        copie = self.couche.clone()
+        self.assertTrue(copie.setSubsetString(filtre))
+        self.assertEqual(self.couche.featureCount(), 2)
+        self.assertEqual(copie.featureCount(), 1)
+        # La couche du projet n'est pas modifiée
+        self.assertEqual(self.couche.subsetString(), "")
+
+    def test_fournisseur_fichier(self):
+        couche = QgsVectorLayer("Point?crs=EPSG:2154", "point", "memory")
+        self.assertIsNone(self.filtreEmprise(
+            couche, QgsRectangle(0, 0, 1, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
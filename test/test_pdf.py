@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Tests de DICT_pdf : fusion des PDF relue avec pypdf.
+
+Le module est chargé seul, sans le plugin (QGIS n'est pas nécessaire).
+"""
+
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from pypdf import PdfReader, PdfWriter
+    PYPDF = True
+except ImportError:
+    PYPDF = False
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CERFA = os.path.join(RACINE, 'formulaire_pdf', 'cerfa_14435-04.pdf')
+
+
+def module(nom):
+    spec = importlib.util.spec_from_file_location(
+        nom, os.path.join(RACINE, nom + '.py'))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+DICT_pdf = module('DICT_pdf')
+
+
+@unittest.skipUnless(PYPDF, "pypdf n'est pas installé")
+class TestFusion(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dossier)
+
+    def chemin(self, nom):
+        return os.path.join(self.dossier, nom)
+
+    def plan(self, nbPages):
+        writer = PdfWriter()
+        for _ in range(nbPages):
+            writer.add_blank_page(595, 842)
+        with open(self.chemin('plan.pdf'), 'wb') as f:
+            writer.write(f)
+        return self.chemin('plan.pdf')
+
+    def verifie(self, sortie, nbPages):
+        reader = PdfReader(sortie)
+        racine = reader.trailer['/Root']
+        arbre = racine['/Pages']
+        self.assertEqual(len(reader.pages), nbPages)
+        self.assertEqual(arbre['/Count'], nbPages)
+        for page in reader.pages:
+            self.assertEqual(page.raw_get('/Parent').idnum,
+                             racine.raw_get('/Pages').idnum)
+            self.assertEqual(page['/Parent'].get_object()['/Type'],
+                             '/Pages')
+        return reader
+
+    def test_fusion_recepisse_plan(self):
+        recepisse = DICT_pdf.remplitFormulaire(
+            CERFA, [('NoGU', 0, '2026101801234'), ('Recepisse_DT', 0, True)],
+            self.chemin('recepisse.pdf'))
+        nbRecepisse = len(PdfReader(recepisse).pages)
+
+        sortie = DICT_pdf.fusionne([recepisse, self.plan(2)],
+                                   self.chemin('fusion.pdf'))
+
+        reader = self.verifie(sortie, nbRecepisse + 2)
+        self.assertIn('/AcroForm', reader.trailer['/Root'])
+        champs = reader.get_fields()
+        self.assertEqual(champs['NoGU'].get('/V'), '2026101801234')
+
+    def test_fusion_sans_formulaire(self):
+        plan = self.plan(1)
+        sortie = DICT_pdf.fusionne([plan, plan], self.chemin('fusion.pdf'))
+
+        reader = self.verifie(sortie, 2)
+        self.assertNotIn('/AcroForm', reader.trailer['/Root'])
+
+
+if __name__ == '__main__':
+    unittest.main()